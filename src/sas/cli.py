@@ -28,6 +28,14 @@ sasview [flags] -m module [args...]
 sasview [flags] -c "python statements" [args...]
     *Execute python statements using the installed SasView libraries*
 
+sasview [flags] fit page_file data [data ...] --output file [options]
+    *Fit each data file with the model of a saved fit page (.fitv, .svs or
+    .json project), without the GUI. Data can be given as glob patterns.
+    A result record is written for each dataset as its fit completes, as
+    JSON lines or as CSV if the output name ends with .csv. Use --resume to
+    carry on from the records of an interrupted run, and see "sasview fit -h"
+    for the other options.*
+
 sasview -V
     *Print sasview version and exit.*
 
@@ -79,9 +87,15 @@ def parse_cli(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("args", nargs="*",
         help="script followed by args")
 
-    # Special case: abort argument processing after -m or -c.
+    # Special case: abort argument processing after -m or -c, or after
+    # the fit command so that its options are parsed by the command.
     have_trigger = False
     collect_rest = False
+    fit_command = False
+    # The fit command is the first positional argument, so skip the values
+    # of options that take one
+    have_positional = False
+    expect_value = False
     keep = []
     rest = []
     for arg in argv[1:]:
@@ -103,9 +117,16 @@ def parse_cli(argv: list[str]) -> argparse.Namespace:
         elif arg.startswith('-c') or arg.startswith('--command'):
             have_trigger = True
             collect_rest = arg not in ('-c', '--command')
+        elif arg == "fit" and not (collect_rest or have_positional or expect_value):
+            fit_command = collect_rest = True
+        elif not (expect_value or arg.startswith('-')):
+            have_positional = True
+        expect_value = arg in ('-l', '--loglevel')
 
     opts = parser.parse_args(keep)
-    if collect_rest:
+    if fit_command:
+        opts.args = ["fit", *rest]
+    elif collect_rest:
         opts.args = rest
     return opts
 
@@ -178,6 +199,9 @@ def main(dev_mode: bool|None=None) -> int:
     elif opts.command: # -c "command"
         sys.argv = ["-c", *opts.args]
         exec(opts.command, context)
+    elif opts.args and opts.args[0] == "fit": # fit page_file data... [option...]
+        from sas.sascalc.fit.headless import main as fit_main
+        return fit_main(opts.args[1:])
     elif opts.args and is_script(opts.args[0]): # script [arg...]
         import runpy
         sys.argv = opts.args
@@ -20,6 +20,7 @@ from sasdata.dataloader.data_info import Detector, Source
 
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
 import sas.sascalc.calculator.gsc_model as gsc_model
+from sas import config
 from sas.qtgui.Plotting.Arrow3D import Arrow3D
 from sas.qtgui.Plotting.PlotterBase import PlotterBase
 from sas.qtgui.Plotting.PlotterData import Data1D, Data2D
@@ -28,7 +29,8 @@ from sas.qtgui.Utilities.GenericReader import GenReader
 from sas.qtgui.Utilities.ModelEditors.TabbedEditor.TabbedModelEditor import TabbedModelEditor
 from sas.sascalc.calculator import sas_gen
 from sas.sascalc.calculator.geni import create_beta_plot, f_of_q, radius_of_gyration
-from sas.sascalc.calculator.sas_gen import ComputationType
+from sas.sascalc.calculator.result_cache import ResultCache
+from sas.sascalc.calculator.sas_gen import ComputationType, DebyeEngine
 from sas.system.user import find_plugins_dir
 
 # Local UI
@@ -51,6 +53,9 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
         self.manager = parent
         self.communicator = GuiUtils.communicator
         self.model = sas_gen.GenSAS()
+        if config.GENSAS_CACHE_SIZE > 0:
+            # Reuse intensities computed before for the same sample, orientation and q
+            self.model.cache = ResultCache("gensas", max_bytes=config.GENSAS_CACHE_SIZE*2**20)
         self.omf_reader = sas_gen.OMFReader()
         self.sld_reader = sas_gen.SLDReader()
         self.pdb_reader = sas_gen.PDBReader()
@@ -92,6 +97,11 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
         sizePolicy = self.cbOptionsCalc.sizePolicy()
         sizePolicy.setRetainSizeWhenHidden(True)
         self.cbOptionsCalc.setSizePolicy(sizePolicy)
+        self.cbDebyeEngine.currentIndexChanged.connect(self.change_debye_engine)
+        sizePolicy = self.cbDebyeEngine.sizePolicy()
+        sizePolicy.setRetainSizeWhenHidden(True)
+        self.cbDebyeEngine.setSizePolicy(sizePolicy)
+        self.cbDebyeEngine.setVisible(False)
 
         # code to highlight incompleted values in the GUI and prevent calculation
         # list of lineEdits to be checked
@@ -622,6 +632,7 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
         else:
             # If magnetic data present then no averaging is allowed
             self.is_avg = False
+            self.cbDebyeEngine.setVisible(False)
             self.txtMx.setEnabled(not self.is_mag)
             self.txtMy.setEnabled(not self.is_mag)
             self.txtMz.setEnabled(not self.is_mag)
@@ -654,6 +665,8 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
         self.checkboxLogSpace.setChecked(self.is_avg)
         self.checkboxLogSpace.setEnabled(self.is_avg)
         self.checkboxPluginModel.setEnabled(self.is_avg)
+        # the engine only applies to the Debye full average
+        self.cbDebyeEngine.setVisible(self.is_avg)
 
         # set the type of calculation
         self.model.set_computation_type(ComputationType(self.cbOptionsCalc.currentIndex()))
@@ -683,6 +696,10 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
             self.checkboxPluginModel.setChecked(False)
             self.txtFileName.setEnabled(False)
 
+    def change_debye_engine(self):
+        """Set the engine used for the Debye full average from the combobox"""
+        self.model.set_debye_engine(DebyeEngine(self.cbDebyeEngine.currentIndex()))
+
     def check_for_magnetic_controls(self):
         if self.txtMx.hasAcceptableInput() and self.txtMy.hasAcceptableInput() and self.txtMz.hasAcceptableInput():
             if (not self.is_mag) and float(self.txtMx.text()) == 0 and float(self.txtMy.text()) == 0 and float(self.txtMy.text()) == 0:
@@ -1115,6 +1132,7 @@ class GenericScatteringCalculator(QtWidgets.QDialog, Ui_GenericScatteringCalcula
             self.toggle_error_functionality()
             # reset option for calculation
             self.cbOptionsCalc.setCurrentIndex(0)
+            self.cbDebyeEngine.setCurrentIndex(0)
             # reset shape button
             self.cbShape.setCurrentIndex(0)
             self.cbShape.setEnabled(True)
@@ -93,6 +93,23 @@ class GenericScatteringCalculatorTest:
         assert widget.cmdDraw.isEnabled()
         assert widget.cmdDrawpoints.isEnabled()
 
+    def testDebyeEngine(self, widget):
+        """Test the Debye engine selector, shown only for the full average"""
+        assert widget.cbDebyeEngine.isHidden()
+        assert [widget.cbDebyeEngine.itemText(i) for i in
+                                range(widget.cbDebyeEngine.count())] == ['Exact', 'Histogram']
+        assert widget.model.debye_engine == sas_gen.DebyeEngine.EXACT
+
+        widget.cbOptionsCalc.setCurrentIndex(1)
+        assert not widget.cbDebyeEngine.isHidden()
+        widget.cbDebyeEngine.setCurrentIndex(1)
+        assert widget.model.debye_engine == sas_gen.DebyeEngine.HISTOGRAM
+
+        widget.cbOptionsCalc.setCurrentIndex(0)
+        assert widget.cbDebyeEngine.isHidden()
+        widget.onReset()
+        assert widget.model.debye_engine == sas_gen.DebyeEngine.EXACT
+
     def testHelpButton(self, widget, mocker):
         """ Assure help file is shown """
         mocker.patch.object(widget.manager, 'showHelp', create=True)
@@ -31,7 +31,7 @@ from sas.qtgui.Plotting.Plotter import (
     PlotterWidget,
 )
 from sas.qtgui.Plotting.Plotter2D import Plotter2D, Plotter2DWidget
-from sas.qtgui.Plotting.PlotterData import Data1D, Data2D, DataRole
+from sas.qtgui.Plotting.PlotterData import ArraySource, Data1D, Data2D, DataRole, array_cache
 
 logger = logging.getLogger(__name__)
 
@@ -290,7 +290,7 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         kwargs = {
             'parent'    : self,
             'caption'   : 'Open Project',
-            'filter'    : 'Project Files (*.json);;Old Project Files (*.svs);;All files (*.*)'
+            'filter'    : 'Project Files (*.json *.zip);;Old Project Files (*.svs);;All files (*.*)'
         }
         filename = QtWidgets.QFileDialog.getOpenFileName(**kwargs)[0]
         if filename:
@@ -336,6 +336,8 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                 case ".json":
                     # Matches analysis files and project files
                     self.readProject(abs_path)
+                case ".zip" if GuiUtils.isProjectArchive(abs_path):
+                    self.readProject(abs_path)
                 case _:
                     # All other cases fall through here
                     if file.is_dir():
@@ -354,16 +356,15 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         """
         parent = self
         caption = 'Save Project'
-        filter = 'Project (*.json)'
+        filter = 'Project (*.json);;Project archive (*.zip)'
         directory = self.default_project_location
-        name_tuple = QtWidgets.QFileDialog.getSaveFileName(parent, caption, directory, filter, "")
-        filename = name_tuple[0]
+        filename, selected_filter = QtWidgets.QFileDialog.getSaveFileName(parent, caption, directory, filter, "")
         if not filename:
             return
         self.default_project_location = os.path.dirname(filename)
         _, extension = os.path.splitext(filename)
         if not extension:
-            filename = '.'.join((filename, 'json'))
+            filename += '.zip' if '*.zip' in selected_filter else '.json'
         self.communicator.statusBarUpdateSignal.emit("Saving Project... %s\n" % os.path.basename(filename))
 
         return filename
@@ -543,12 +544,11 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                 logger.error(msg)
                 pass
         else:
-            with open(filename) as infile:
-                try:
-                    all_data = GuiUtils.readDataFromFile(infile)
-                except Exception as ex:
-                    logger.error("Project load failed with " + str(ex))
-                    return
+            try:
+                all_data = GuiUtils.readProjectFile(filename)
+            except Exception as ex:
+                logger.error("Project load failed with " + str(ex))
+                return
         cs_keys = []
         visible_perspective = config.DEFAULT_PERSPECTIVE
         for key, value in all_data.items():
@@ -1471,6 +1471,10 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         number_of_files = len(path)
         self.communicator.progressBarUpdateSignal.emit(0)
 
+        # Only the arrays of the data used most recently are kept in memory,
+        # the others are read back from their file when next used
+        array_cache.max_bytes = config.DATA_ARRAY_CACHE_SIZE*2**20
+
         for index, p_file in enumerate(path):
             basename = os.path.basename(p_file)
             _, extension = os.path.splitext(basename)
@@ -1496,11 +1500,14 @@ class DataExplorerWindow(DroppableDataLoadWidget):
 
                 output_objects = self.loader.load(p_file)
 
-                for item in output_objects:
+                for item_index, item in enumerate(output_objects):
                     # cast sasdata.dataloader.data_info.Data1D into
                     # sasgui.guiframe.dataFitting.Data1D
                     # TODO : Fix it
-                    new_data = self.manager.create_gui_data(item, p_file)
+                    # The loaded object is dropped, so its arrays need not be copied
+                    new_data = self.manager.create_gui_data(item, p_file, copy_arrays=False)
+                    if config.DATA_ARRAY_CACHE_SIZE > 0:
+                        array_cache.add(new_data, ArraySource(p_file, item_index))
                     output[new_data.id] = new_data
 
                     # Model update should be protected
@@ -2114,10 +2121,9 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         # Caption for the theories
         checkbox_item.setChild(2, QtGui.QStandardItem("FIT RESULTS"))
 
-        # New row in the model
-        self.model.beginResetModel()
+        # New row in the model. appendRow notifies the views of the new row,
+        # so they need not rebuild every row as after a model reset.
         self.model.appendRow(checkbox_item)
-        self.model.endResetModel()
 
     def updateModelFromPerspective(self, model_item):
         """
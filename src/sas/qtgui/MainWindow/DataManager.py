@@ -33,7 +33,7 @@ from sasdata.dataloader.data_info import Sample, Source, Vector
 
 from sas.qtgui.MainWindow.DataState import DataState
 from sas.qtgui.Plotting.Plottables import Chisq, PlottableFit1D, PlottableTheory1D, Text, View
-from sas.qtgui.Plotting.PlotterData import Data1D, Data2D, DataRole
+from sas.qtgui.Plotting.PlotterData import Data1D, Data2D, DataRole, savedState
 from sas.qtgui.Utilities import GuiUtils
 from sas.system.version import __version__ as SASVIEW_VERSION
 
@@ -69,9 +69,12 @@ class DataManager:
             _str += str(value) + "\n"
         return _str
 
-    def create_gui_data(self, data, path=None):
+    def create_gui_data(self, data, path=None, copy_arrays=True):
         """
         Receive data from loader and create a data to use for guiframe
+
+        With copy_arrays=False the new data shares the arrays of *data*,
+        for data which is not used elsewhere.
         """
 
         if issubclass(Data2D, data.__class__):
@@ -84,7 +87,7 @@ class DataManager:
             data.notes = [data.notes]
         data.notes.append(f'Data file generated by SasView v{SASVIEW_VERSION}')
 
-        new_plot.copy_from_datainfo(data)
+        new_plot.copy_from_datainfo(data, deep=copy_arrays)
         data.clone_without_data(clone=new_plot)
         #creating a name for data
         title = ""
@@ -385,7 +388,7 @@ class DataManager:
             if isinstance(o, (Sample, Source, Vector)):
                 return add_type(o.__dict__, type(o))
             if isinstance(o, (Plottable, View)):
-                return add_type(o.__dict__, type(o))
+                return add_type(savedState(o), type(o))
 
             # DataState
             if isinstance(o, DataState):
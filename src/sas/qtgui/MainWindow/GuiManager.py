@@ -810,8 +810,7 @@ class GuiManager:
         final_data['batch_grid'] = self.grid_window.data_dict
         final_data['visible_perspective'] = self._current_perspective.name
 
-        with open(filename, 'w') as outfile:
-            GuiUtils.saveData(outfile, final_data)
+        GuiUtils.saveProjectFile(filename, final_data)
         return True
 
     def actionSave_Analysis(self):
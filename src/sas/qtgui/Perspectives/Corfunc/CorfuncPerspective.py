@@ -312,13 +312,20 @@ class CorfuncWindow(QtWidgets.QDialog, Ui_CorfuncDialog, Perspective):
         self.cmdExtract.setText("Calculating...")
         self.cmdExtract.repaint()
 
-        # Set up calculator
-
-        calculator = CorfuncCalculator(
-            data=self.data,
-            extrapolation_parameters=self.extrapolation_parameters,
-            tangent_method=self._tangent_method,
-            long_period_method=self._long_period_method)
+        # Set up calculator, keeping the one for the current data so that only
+        # the calculation steps whose inputs have changed are repeated
+
+        if self._calculator is not None and self.data is not None and self._calculator.data is self.data:
+            calculator = self._calculator
+            calculator.extrapolation_parameters = self.extrapolation_parameters
+            calculator.tangent_method = self._tangent_method
+            calculator.long_period_method = self._long_period_method
+        else:
+            calculator = CorfuncCalculator(
+                data=self.data,
+                extrapolation_parameters=self.extrapolation_parameters,
+                tangent_method=self._tangent_method,
+                long_period_method=self._long_period_method)
 
         calculator.fit_background = self.fitBackground.isChecked()
         calculator.fit_guinier = self.fitGuinier.isChecked()
@@ -840,6 +847,12 @@ class CorfuncWindow(QtWidgets.QDialog, Ui_CorfuncDialog, Perspective):
         self.model.setItem(WIDGETS.W_QCUTOFF,
                            QtGui.QStandardItem(format_string%state.point_3))
 
+        # Update the transforms when the slider is released, if they have been
+        # calculated; only the steps that depend on the moved point are repeated
+        if (self._calculator is not None and self._calculator.transformed is not None
+                and self.cmdExtract.isEnabled()):
+            self._run()
+
     def on_extrapolation_slider_changing(self, state: ExtrapolationInteractionState):
         """ Slider is being moved about"""
         self._q_space_plot.update_lines(state)
@@ -0,0 +1,809 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'CorfuncPanel.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QCheckBox, QDialog,
+    QFrame, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLayout, QLineEdit, QPushButton,
+    QRadioButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QTabWidget, QVBoxLayout, QWidget)
+
+class Ui_CorfuncDialog(object):
+    def setupUi(self, CorfuncDialog):
+        if not CorfuncDialog.objectName():
+            CorfuncDialog.setObjectName(u"CorfuncDialog")
+        CorfuncDialog.resize(1080, 640)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(CorfuncDialog.sizePolicy().hasHeightForWidth())
+        CorfuncDialog.setSizePolicy(sizePolicy)
+        CorfuncDialog.setMinimumSize(QSize(1080, 640))
+        self.horizontalLayout_3 = QHBoxLayout(CorfuncDialog)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.scrollArea = QScrollArea(CorfuncDialog)
+        self.scrollArea.setObjectName(u"scrollArea")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.scrollArea.sizePolicy().hasHeightForWidth())
+        self.scrollArea.setSizePolicy(sizePolicy1)
+        self.scrollArea.setFrameShape(QFrame.Shape.NoFrame)
+        self.scrollArea.setFrameShadow(QFrame.Shadow.Plain)
+        self.scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 576, 622))
+        self.verticalLayout = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.controlWidget = QWidget(self.scrollAreaWidgetContents)
+        self.controlWidget.setObjectName(u"controlWidget")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.controlWidget.sizePolicy().hasHeightForWidth())
+        self.controlWidget.setSizePolicy(sizePolicy2)
+        self.controlWidget.setMinimumSize(QSize(576, 0))
+        self.verticalLayout_2 = QVBoxLayout(self.controlWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
+        self.verticalLayout_3.setContentsMargins(-1, -1, -1, 0)
+        self.groupBox = QGroupBox(self.controlWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy3)
+        self.groupBox.setMinimumSize(QSize(0, 277))
+        self.gridLayout_6 = QGridLayout(self.groupBox)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.gridLayout_6.setContentsMargins(-1, 0, -1, -1)
+        self.methods = QGroupBox(self.groupBox)
+        self.methods.setObjectName(u"methods")
+        self.methods.setMinimumSize(QSize(0, 0))
+        self.gridLayout_2 = QGridLayout(self.methods)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.gridLayout_2.setVerticalSpacing(0)
+        self.gridLayout_2.setContentsMargins(-1, 0, 9, 0)
+        self.gridLayout_11 = QGridLayout()
+        self.gridLayout_11.setObjectName(u"gridLayout_11")
+        self.label_20 = QLabel(self.methods)
+        self.label_20.setObjectName(u"label_20")
+        self.label_20.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_11.addWidget(self.label_20, 0, 0, 1, 1)
+
+        self.radTangentMidpoint = QRadioButton(self.methods)
+        self.buttonGroup_2 = QButtonGroup(CorfuncDialog)
+        self.buttonGroup_2.setObjectName(u"buttonGroup_2")
+        self.buttonGroup_2.addButton(self.radTangentMidpoint)
+        self.radTangentMidpoint.setObjectName(u"radTangentMidpoint")
+
+        self.gridLayout_11.addWidget(self.radTangentMidpoint, 0, 2, 1, 1)
+
+        self.radTangentInflection = QRadioButton(self.methods)
+        self.buttonGroup_2.addButton(self.radTangentInflection)
+        self.radTangentInflection.setObjectName(u"radTangentInflection")
+        sizePolicy2.setHeightForWidth(self.radTangentInflection.sizePolicy().hasHeightForWidth())
+        self.radTangentInflection.setSizePolicy(sizePolicy2)
+
+        self.gridLayout_11.addWidget(self.radTangentInflection, 0, 1, 1, 1)
+
+        self.radTangentAuto = QRadioButton(self.methods)
+        self.buttonGroup_2.addButton(self.radTangentAuto)
+        self.radTangentAuto.setObjectName(u"radTangentAuto")
+        self.radTangentAuto.setChecked(True)
+
+        self.gridLayout_11.addWidget(self.radTangentAuto, 0, 3, 1, 1)
+
+        self.label_21 = QLabel(self.methods)
+        self.label_21.setObjectName(u"label_21")
+        self.label_21.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_11.addWidget(self.label_21, 1, 0, 1, 1)
+
+        self.radLongPeriodMax = QRadioButton(self.methods)
+        self.buttonGroup = QButtonGroup(CorfuncDialog)
+        self.buttonGroup.setObjectName(u"buttonGroup")
+        self.buttonGroup.addButton(self.radLongPeriodMax)
+        self.radLongPeriodMax.setObjectName(u"radLongPeriodMax")
+
+        self.gridLayout_11.addWidget(self.radLongPeriodMax, 1, 1, 1, 1)
+
+        self.radLongPeriodDouble = QRadioButton(self.methods)
+        self.buttonGroup.addButton(self.radLongPeriodDouble)
+        self.radLongPeriodDouble.setObjectName(u"radLongPeriodDouble")
+
+        self.gridLayout_11.addWidget(self.radLongPeriodDouble, 1, 2, 1, 1)
+
+        self.radLongPeriodAuto = QRadioButton(self.methods)
+        self.buttonGroup.addButton(self.radLongPeriodAuto)
+        self.radLongPeriodAuto.setObjectName(u"radLongPeriodAuto")
+        self.radLongPeriodAuto.setChecked(True)
+
+        self.gridLayout_11.addWidget(self.radLongPeriodAuto, 1, 3, 1, 1)
+
+
+        self.gridLayout_2.addLayout(self.gridLayout_11, 0, 0, 1, 1)
+
+
+        self.gridLayout_6.addWidget(self.methods, 5, 0, 2, 1)
+
+        self.gridLayout_10 = QGridLayout()
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.label_18 = QLabel(self.groupBox)
+        self.label_18.setObjectName(u"label_18")
+        self.label_18.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_10.addWidget(self.label_18, 0, 0, 1, 1)
+
+        self.fitBackground = QCheckBox(self.groupBox)
+        self.fitBackground.setObjectName(u"fitBackground")
+        self.fitBackground.setChecked(True)
+
+        self.gridLayout_10.addWidget(self.fitBackground, 0, 1, 1, 1)
+
+        self.fitGuinier = QCheckBox(self.groupBox)
+        self.fitGuinier.setObjectName(u"fitGuinier")
+        self.fitGuinier.setChecked(True)
+
+        self.gridLayout_10.addWidget(self.fitGuinier, 0, 2, 1, 1)
+
+        self.fitPorod = QCheckBox(self.groupBox)
+        self.fitPorod.setObjectName(u"fitPorod")
+        self.fitPorod.setChecked(True)
+
+        self.gridLayout_10.addWidget(self.fitPorod, 0, 3, 1, 1)
+
+
+        self.gridLayout_6.addLayout(self.gridLayout_10, 4, 0, 1, 1)
+
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(-1, -1, -1, 0)
+        self.lblTotalQUnits_2 = QLabel(self.groupBox)
+        self.lblTotalQUnits_2.setObjectName(u"lblTotalQUnits_2")
+
+        self.gridLayout.addWidget(self.lblTotalQUnits_2, 0, 6, 1, 1)
+
+        self.txtUpperQMin = QLineEdit(self.groupBox)
+        self.txtUpperQMin.setObjectName(u"txtUpperQMin")
+        self.txtUpperQMin.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtUpperQMin.sizePolicy().hasHeightForWidth())
+        self.txtUpperQMin.setSizePolicy(sizePolicy3)
+
+        self.gridLayout.addWidget(self.txtUpperQMin, 0, 3, 1, 1)
+
+        self.lblTotalQMin_2 = QLabel(self.groupBox)
+        self.lblTotalQMin_2.setObjectName(u"lblTotalQMin_2")
+        self.lblTotalQMin_2.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.lblTotalQMin_2, 0, 2, 1, 1)
+
+        self.lblTotalQMax_2 = QLabel(self.groupBox)
+        self.lblTotalQMax_2.setObjectName(u"lblTotalQMax_2")
+        self.lblTotalQMax_2.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.lblTotalQMax_2, 0, 4, 1, 1)
+
+        self.txtUpperQMax = QLineEdit(self.groupBox)
+        self.txtUpperQMax.setObjectName(u"txtUpperQMax")
+        self.txtUpperQMax.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtUpperQMax.sizePolicy().hasHeightForWidth())
+        self.txtUpperQMax.setSizePolicy(sizePolicy3)
+
+        self.gridLayout.addWidget(self.txtUpperQMax, 0, 5, 1, 1)
+
+        self.lblTotalQMax = QLabel(self.groupBox)
+        self.lblTotalQMax.setObjectName(u"lblTotalQMax")
+        self.lblTotalQMax.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.lblTotalQMax, 0, 0, 1, 1)
+
+        self.txtLowerQMax = QLineEdit(self.groupBox)
+        self.txtLowerQMax.setObjectName(u"txtLowerQMax")
+        self.txtLowerQMax.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtLowerQMax.sizePolicy().hasHeightForWidth())
+        self.txtLowerQMax.setSizePolicy(sizePolicy3)
+
+        self.gridLayout.addWidget(self.txtLowerQMax, 0, 1, 1, 1)
+
+
+        self.gridLayout_6.addLayout(self.gridLayout, 2, 0, 1, 1)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.lblName = QLabel(self.groupBox)
+        self.lblName.setObjectName(u"lblName")
+
+        self.horizontalLayout_4.addWidget(self.lblName)
+
+        self.txtFilename = QLineEdit(self.groupBox)
+        self.txtFilename.setObjectName(u"txtFilename")
+        self.txtFilename.setEnabled(False)
+        sizePolicy3.setHeightForWidth(self.txtFilename.sizePolicy().hasHeightForWidth())
+        self.txtFilename.setSizePolicy(sizePolicy3)
+        self.txtFilename.setFrame(False)
+        self.txtFilename.setReadOnly(False)
+
+        self.horizontalLayout_4.addWidget(self.txtFilename)
+
+
+        self.gridLayout_6.addLayout(self.horizontalLayout_4, 0, 0, 1, 1)
+
+        self.sliderLayout = QHBoxLayout()
+        self.sliderLayout.setObjectName(u"sliderLayout")
+        self.sliderLayout.setContentsMargins(5, 10, 5, 10)
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.sliderLayout.addWidget(self.label_3)
+
+
+        self.gridLayout_6.addLayout(self.sliderLayout, 1, 0, 1, 1)
+
+        self.verticalLayout_6 = QVBoxLayout()
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.cmdExtract = QPushButton(self.groupBox)
+        self.cmdExtract.setObjectName(u"cmdExtract")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.cmdExtract.sizePolicy().hasHeightForWidth())
+        self.cmdExtract.setSizePolicy(sizePolicy4)
+        self.cmdExtract.setMinimumSize(QSize(120, 26))
+
+        self.verticalLayout_6.addWidget(self.cmdExtract, 0, Qt.AlignmentFlag.AlignHCenter)
+
+
+        self.gridLayout_6.addLayout(self.verticalLayout_6, 7, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.groupBox_4 = QGroupBox(self.controlWidget)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        sizePolicy3.setHeightForWidth(self.groupBox_4.sizePolicy().hasHeightForWidth())
+        self.groupBox_4.setSizePolicy(sizePolicy3)
+        self.backgroundLayout = QVBoxLayout(self.groupBox_4)
+        self.backgroundLayout.setObjectName(u"backgroundLayout")
+        self.gridLayout_4 = QGridLayout()
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.gridLayout_5 = QGridLayout()
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.gridLayout_5.setContentsMargins(-1, -1, -1, 0)
+        self.label_8 = QLabel(self.groupBox_4)
+        self.label_8.setObjectName(u"label_8")
+        self.label_8.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_5.addWidget(self.label_8, 0, 0, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_5.addWidget(self.label_6, 0, 1, 1, 1)
+
+        self.label_9 = QLabel(self.groupBox_4)
+        self.label_9.setObjectName(u"label_9")
+        self.label_9.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_5.addWidget(self.label_9, 1, 0, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox_4)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_5.addWidget(self.label_10, 1, 1, 1, 1)
+
+        self.txtPorodK = QLineEdit(self.groupBox_4)
+        self.txtPorodK.setObjectName(u"txtPorodK")
+        self.txtPorodK.setReadOnly(False)
+
+        self.gridLayout_5.addWidget(self.txtPorodK, 1, 2, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+        self.label_7.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_5.addWidget(self.label_7, 0, 3, 1, 1)
+
+        self.txtGuinierA = QLineEdit(self.groupBox_4)
+        self.txtGuinierA.setObjectName(u"txtGuinierA")
+        self.txtGuinierA.setReadOnly(False)
+
+        self.gridLayout_5.addWidget(self.txtGuinierA, 0, 2, 1, 1)
+
+        self.txtPorodSigma = QLineEdit(self.groupBox_4)
+        self.txtPorodSigma.setObjectName(u"txtPorodSigma")
+        self.txtPorodSigma.setReadOnly(False)
+
+        self.gridLayout_5.addWidget(self.txtPorodSigma, 1, 4, 1, 1)
+
+        self.label_11 = QLabel(self.groupBox_4)
+        self.label_11.setObjectName(u"label_11")
+        self.label_11.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_5.addWidget(self.label_11, 1, 3, 1, 1)
+
+        self.txtGuinierB = QLineEdit(self.groupBox_4)
+        self.txtGuinierB.setObjectName(u"txtGuinierB")
+        self.txtGuinierB.setReadOnly(False)
+
+        self.gridLayout_5.addWidget(self.txtGuinierB, 0, 4, 1, 1)
+
+
+        self.gridLayout_4.addLayout(self.gridLayout_5, 1, 0, 1, 3)
+
+        self.txtBackground = QLineEdit(self.groupBox_4)
+        self.txtBackground.setObjectName(u"txtBackground")
+        sizePolicy3.setHeightForWidth(self.txtBackground.sizePolicy().hasHeightForWidth())
+        self.txtBackground.setSizePolicy(sizePolicy3)
+
+        self.gridLayout_4.addWidget(self.txtBackground, 0, 1, 1, 1)
+
+        self.label = QLabel(self.groupBox_4)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout_4.addWidget(self.label, 0, 0, 1, 1)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_4.addItem(self.horizontalSpacer_4, 0, 2, 1, 1)
+
+
+        self.backgroundLayout.addLayout(self.gridLayout_4)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_4)
+
+        self.groupBox_3 = QGroupBox(self.controlWidget)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        sizePolicy3.setHeightForWidth(self.groupBox_3.sizePolicy().hasHeightForWidth())
+        self.groupBox_3.setSizePolicy(sizePolicy3)
+        self.gridLayout_3 = QGridLayout(self.groupBox_3)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_8 = QGridLayout()
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.gridLayout_8.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
+        self.gridLayout_8.setVerticalSpacing(10)
+        self.gridLayout_8.setContentsMargins(-1, -1, -1, 0)
+        self.label_13 = QLabel(self.groupBox_3)
+        self.label_13.setObjectName(u"label_13")
+        sizePolicy2.setHeightForWidth(self.label_13.sizePolicy().hasHeightForWidth())
+        self.label_13.setSizePolicy(sizePolicy2)
+        self.label_13.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_13, 2, 3, 1, 1)
+
+        self.txtPolyRyan = QLineEdit(self.groupBox_3)
+        self.txtPolyRyan.setObjectName(u"txtPolyRyan")
+        self.txtPolyRyan.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtPolyRyan, 2, 2, 1, 1)
+
+        self.txtAvgHardBlock = QLineEdit(self.groupBox_3)
+        self.txtAvgHardBlock.setObjectName(u"txtAvgHardBlock")
+        sizePolicy3.setHeightForWidth(self.txtAvgHardBlock.sizePolicy().hasHeightForWidth())
+        self.txtAvgHardBlock.setSizePolicy(sizePolicy3)
+        self.txtAvgHardBlock.setMinimumSize(QSize(20, 20))
+        self.txtAvgHardBlock.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtAvgHardBlock, 0, 2, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox_3)
+        self.label_12.setObjectName(u"label_12")
+        sizePolicy2.setHeightForWidth(self.label_12.sizePolicy().hasHeightForWidth())
+        self.label_12.setSizePolicy(sizePolicy2)
+        self.label_12.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_12, 2, 1, 1, 1)
+
+        self.txtPolyStribeck = QLineEdit(self.groupBox_3)
+        self.txtPolyStribeck.setObjectName(u"txtPolyStribeck")
+        self.txtPolyStribeck.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtPolyStribeck, 2, 4, 1, 1)
+
+        self.label_16 = QLabel(self.groupBox_3)
+        self.label_16.setObjectName(u"label_16")
+        sizePolicy2.setHeightForWidth(self.label_16.sizePolicy().hasHeightForWidth())
+        self.label_16.setSizePolicy(sizePolicy2)
+        self.label_16.setMinimumSize(QSize(20, 20))
+        self.label_16.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_16, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy2.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy2)
+        self.label_4.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_4, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy3.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy3)
+        self.label_2.setMinimumSize(QSize(20, 20))
+        self.label_2.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_2, 0, 3, 1, 1)
+
+        self.txtAvgSoftBlock = QLineEdit(self.groupBox_3)
+        self.txtAvgSoftBlock.setObjectName(u"txtAvgSoftBlock")
+        sizePolicy3.setHeightForWidth(self.txtAvgSoftBlock.sizePolicy().hasHeightForWidth())
+        self.txtAvgSoftBlock.setSizePolicy(sizePolicy3)
+        self.txtAvgSoftBlock.setMinimumSize(QSize(20, 20))
+        self.txtAvgSoftBlock.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtAvgSoftBlock, 0, 4, 1, 1)
+
+        self.label_5 = QLabel(self.groupBox_3)
+        self.label_5.setObjectName(u"label_5")
+        sizePolicy2.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy2)
+        self.label_5.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_5, 2, 0, 1, 1)
+
+        self.label_15 = QLabel(self.groupBox_3)
+        self.label_15.setObjectName(u"label_15")
+        sizePolicy2.setHeightForWidth(self.label_15.sizePolicy().hasHeightForWidth())
+        self.label_15.setSizePolicy(sizePolicy2)
+        self.label_15.setMinimumSize(QSize(20, 20))
+        self.label_15.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_15, 1, 1, 1, 1)
+
+        self.label_17 = QLabel(self.groupBox_3)
+        self.label_17.setObjectName(u"label_17")
+        sizePolicy3.setHeightForWidth(self.label_17.sizePolicy().hasHeightForWidth())
+        self.label_17.setSizePolicy(sizePolicy3)
+        self.label_17.setMinimumSize(QSize(20, 20))
+        self.label_17.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_8.addWidget(self.label_17, 1, 3, 1, 1)
+
+        self.txtAvgIntThick = QLineEdit(self.groupBox_3)
+        self.txtAvgIntThick.setObjectName(u"txtAvgIntThick")
+        sizePolicy3.setHeightForWidth(self.txtAvgIntThick.sizePolicy().hasHeightForWidth())
+        self.txtAvgIntThick.setSizePolicy(sizePolicy3)
+        self.txtAvgIntThick.setMinimumSize(QSize(20, 20))
+        self.txtAvgIntThick.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtAvgIntThick, 1, 2, 1, 1)
+
+        self.txtAvgCoreThick = QLineEdit(self.groupBox_3)
+        self.txtAvgCoreThick.setObjectName(u"txtAvgCoreThick")
+        sizePolicy3.setHeightForWidth(self.txtAvgCoreThick.sizePolicy().hasHeightForWidth())
+        self.txtAvgCoreThick.setSizePolicy(sizePolicy3)
+        self.txtAvgCoreThick.setMinimumSize(QSize(20, 20))
+        self.txtAvgCoreThick.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtAvgCoreThick, 1, 4, 1, 1)
+
+
+        self.gridLayout_3.addLayout(self.gridLayout_8, 1, 0, 1, 1)
+
+        self.gridLayout_9 = QGridLayout()
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.gridLayout_9.setContentsMargins(-1, -1, -1, 0)
+        self.label_14 = QLabel(self.groupBox_3)
+        self.label_14.setObjectName(u"label_14")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.label_14.sizePolicy().hasHeightForWidth())
+        self.label_14.setSizePolicy(sizePolicy5)
+        self.label_14.setMinimumSize(QSize(20, 20))
+        self.label_14.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_9.addWidget(self.label_14, 0, 0, 1, 1)
+
+        self.txtLongPeriod = QLineEdit(self.groupBox_3)
+        self.txtLongPeriod.setObjectName(u"txtLongPeriod")
+        sizePolicy3.setHeightForWidth(self.txtLongPeriod.sizePolicy().hasHeightForWidth())
+        self.txtLongPeriod.setSizePolicy(sizePolicy3)
+        self.txtLongPeriod.setMinimumSize(QSize(150, 20))
+        self.txtLongPeriod.setReadOnly(True)
+
+        self.gridLayout_9.addWidget(self.txtLongPeriod, 0, 1, 1, 1)
+
+        self.label_19 = QLabel(self.groupBox_3)
+        self.label_19.setObjectName(u"label_19")
+        sizePolicy5.setHeightForWidth(self.label_19.sizePolicy().hasHeightForWidth())
+        self.label_19.setSizePolicy(sizePolicy5)
+        self.label_19.setMinimumSize(QSize(20, 20))
+        self.label_19.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_9.addWidget(self.label_19, 0, 2, 1, 1)
+
+        self.txtLocalCrystal = QLineEdit(self.groupBox_3)
+        self.txtLocalCrystal.setObjectName(u"txtLocalCrystal")
+        sizePolicy3.setHeightForWidth(self.txtLocalCrystal.sizePolicy().hasHeightForWidth())
+        self.txtLocalCrystal.setSizePolicy(sizePolicy3)
+        self.txtLocalCrystal.setMinimumSize(QSize(150, 20))
+        self.txtLocalCrystal.setReadOnly(True)
+
+        self.gridLayout_9.addWidget(self.txtLocalCrystal, 0, 3, 1, 1)
+
+
+        self.gridLayout_3.addLayout(self.gridLayout_9, 2, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.cmdSaveExtrapolation = QPushButton(self.controlWidget)
+        self.cmdSaveExtrapolation.setObjectName(u"cmdSaveExtrapolation")
+
+        self.horizontalLayout_6.addWidget(self.cmdSaveExtrapolation)
+
+        self.cmdSave = QPushButton(self.controlWidget)
+        self.cmdSave.setObjectName(u"cmdSave")
+        sizePolicy2.setHeightForWidth(self.cmdSave.sizePolicy().hasHeightForWidth())
+        self.cmdSave.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_6.addWidget(self.cmdSave)
+
+        self.cmdHelp = QPushButton(self.controlWidget)
+        self.cmdHelp.setObjectName(u"cmdHelp")
+
+        self.horizontalLayout_6.addWidget(self.cmdHelp)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_6)
+
+
+        self.verticalLayout_2.addLayout(self.verticalLayout_3)
+
+
+        self.verticalLayout.addWidget(self.controlWidget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.horizontalLayout_3.addWidget(self.scrollArea)
+
+        self.tabWidget = QTabWidget(CorfuncDialog)
+        self.tabWidget.setObjectName(u"tabWidget")
+        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.tabWidget.sizePolicy().hasHeightForWidth())
+        self.tabWidget.setSizePolicy(sizePolicy6)
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.verticalLayout_5 = QVBoxLayout(self.tab)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.qSpaceLayout = QVBoxLayout()
+        self.qSpaceLayout.setObjectName(u"qSpaceLayout")
+
+        self.verticalLayout_5.addLayout(self.qSpaceLayout)
+
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.verticalLayout_7 = QVBoxLayout(self.tab_2)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.realSpaceLayout = QVBoxLayout()
+        self.realSpaceLayout.setObjectName(u"realSpaceLayout")
+
+        self.verticalLayout_7.addLayout(self.realSpaceLayout)
+
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QWidget()
+        self.tab_3.setObjectName(u"tab_3")
+        self.verticalLayout_420 = QVBoxLayout(self.tab_3)
+        self.verticalLayout_420.setObjectName(u"verticalLayout_420")
+        self.diagramLayout = QVBoxLayout()
+        self.diagramLayout.setObjectName(u"diagramLayout")
+
+        self.verticalLayout_420.addLayout(self.diagramLayout)
+
+        self.tabWidget.addTab(self.tab_3, "")
+        self.tab_4 = QWidget()
+        self.tab_4.setObjectName(u"tab_4")
+        self.verticalLayout_4 = QVBoxLayout(self.tab_4)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.idfLayout = QVBoxLayout()
+        self.idfLayout.setObjectName(u"idfLayout")
+
+        self.verticalLayout_4.addLayout(self.idfLayout)
+
+        self.tabWidget.addTab(self.tab_4, "")
+
+        self.horizontalLayout_3.addWidget(self.tabWidget)
+
+        QWidget.setTabOrder(self.txtLowerQMax, self.txtUpperQMin)
+        QWidget.setTabOrder(self.txtUpperQMin, self.txtUpperQMax)
+        QWidget.setTabOrder(self.txtUpperQMax, self.txtBackground)
+        QWidget.setTabOrder(self.txtBackground, self.txtGuinierA)
+        QWidget.setTabOrder(self.txtGuinierA, self.txtGuinierB)
+        QWidget.setTabOrder(self.txtGuinierB, self.txtPorodK)
+        QWidget.setTabOrder(self.txtPorodK, self.txtPorodSigma)
+        QWidget.setTabOrder(self.txtPorodSigma, self.txtAvgHardBlock)
+        QWidget.setTabOrder(self.txtAvgHardBlock, self.txtAvgSoftBlock)
+        QWidget.setTabOrder(self.txtAvgSoftBlock, self.txtAvgIntThick)
+        QWidget.setTabOrder(self.txtAvgIntThick, self.txtAvgCoreThick)
+        QWidget.setTabOrder(self.txtAvgCoreThick, self.txtPolyRyan)
+        QWidget.setTabOrder(self.txtPolyRyan, self.txtPolyStribeck)
+        QWidget.setTabOrder(self.txtPolyStribeck, self.txtLongPeriod)
+        QWidget.setTabOrder(self.txtLongPeriod, self.txtLocalCrystal)
+        QWidget.setTabOrder(self.txtLocalCrystal, self.tabWidget)
+        QWidget.setTabOrder(self.tabWidget, self.scrollArea)
+        QWidget.setTabOrder(self.scrollArea, self.txtFilename)
+
+        self.retranslateUi(CorfuncDialog)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(CorfuncDialog)
+    # setupUi
+
+    def retranslateUi(self, CorfuncDialog):
+        CorfuncDialog.setWindowTitle(QCoreApplication.translate("CorfuncDialog", u"Corfunc", None))
+        self.groupBox.setTitle(QCoreApplication.translate("CorfuncDialog", u"Input", None))
+        self.methods.setTitle(QCoreApplication.translate("CorfuncDialog", u"Method", None))
+        self.label_20.setText(QCoreApplication.translate("CorfuncDialog", u"Tangent:  ", None))
+        self.radTangentMidpoint.setText(QCoreApplication.translate("CorfuncDialog", u"Use Halfway Point", None))
+#if QT_CONFIG(tooltip)
+        self.radTangentMidpoint.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Use the halfway point of the correlation function for tangent line calculation", None))
+#endif // QT_CONFIG(tooltip)
+        self.radTangentInflection.setText(QCoreApplication.translate("CorfuncDialog", u"Use Inflection Point", None))
+#if QT_CONFIG(tooltip)
+        self.radTangentInflection.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Use the inflection point of the correlation function for tangent line calculation", None))
+#endif // QT_CONFIG(tooltip)
+        self.radTangentAuto.setText(QCoreApplication.translate("CorfuncDialog", u"Automatic", None))
+#if QT_CONFIG(tooltip)
+        self.radTangentAuto.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Automatically select the best tangent point method", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_21.setText(QCoreApplication.translate("CorfuncDialog", u"Long Period:  ", None))
+        self.radLongPeriodMax.setText(QCoreApplication.translate("CorfuncDialog", u"Use Maximum", None))
+#if QT_CONFIG(tooltip)
+        self.radLongPeriodMax.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Use the maximum value of the correlation function as the long period", None))
+#endif // QT_CONFIG(tooltip)
+        self.radLongPeriodDouble.setText(QCoreApplication.translate("CorfuncDialog", u"Use 2x Minimum", None))
+#if QT_CONFIG(tooltip)
+        self.radLongPeriodDouble.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Use twice the minimum value of the correlation function as the long period", None))
+#endif // QT_CONFIG(tooltip)
+        self.radLongPeriodAuto.setText(QCoreApplication.translate("CorfuncDialog", u"Automatic", None))
+#if QT_CONFIG(tooltip)
+        self.radLongPeriodAuto.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Automatically select the best long period calculation method", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_18.setText(QCoreApplication.translate("CorfuncDialog", u"Fitting:  ", None))
+        self.fitBackground.setText(QCoreApplication.translate("CorfuncDialog", u"Fit Background", None))
+#if QT_CONFIG(tooltip)
+        self.fitBackground.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Include background in the fitting process", None))
+#endif // QT_CONFIG(tooltip)
+        self.fitGuinier.setText(QCoreApplication.translate("CorfuncDialog", u"Fit Guinier", None))
+#if QT_CONFIG(tooltip)
+        self.fitGuinier.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Fit the Guinier region (low-Q) of the scattering data.", None))
+#endif // QT_CONFIG(tooltip)
+        self.fitPorod.setText(QCoreApplication.translate("CorfuncDialog", u"Fit Porod", None))
+#if QT_CONFIG(tooltip)
+        self.fitPorod.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Fit the Porod region (high-Q) of the scattering data.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblTotalQUnits_2.setText(QCoreApplication.translate("CorfuncDialog", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtUpperQMin.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Minimum Q value for Porod region fitting (1/Angstrom).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblTotalQMin_2.setText(QCoreApplication.translate("CorfuncDialog", u"Porod Start:", None))
+        self.lblTotalQMax_2.setText(QCoreApplication.translate("CorfuncDialog", u"Porod End:", None))
+#if QT_CONFIG(tooltip)
+        self.txtUpperQMax.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Maximum Q value for Porod region fitting (1/Angstrom).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblTotalQMax.setText(QCoreApplication.translate("CorfuncDialog", u"Guinier End:", None))
+#if QT_CONFIG(tooltip)
+        self.txtLowerQMax.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Maximum Q value for Guinier region fitting (1/Angstrom).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblName.setText(QCoreApplication.translate("CorfuncDialog", u"Name:", None))
+#if QT_CONFIG(tooltip)
+        self.txtFilename.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Name of the data file being analyzed", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_3.setText(QCoreApplication.translate("CorfuncDialog", u"Adjust:", None))
+#if QT_CONFIG(tooltip)
+        self.cmdExtract.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Extract model parameters from the real space transformed curve.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdExtract.setText(QCoreApplication.translate("CorfuncDialog", u"Go", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("CorfuncDialog", u"Extrapolation Parameters", None))
+        self.label_8.setText(QCoreApplication.translate("CorfuncDialog", u"Guinier", None))
+        self.label_6.setText(QCoreApplication.translate("CorfuncDialog", u"A:", None))
+        self.label_9.setText(QCoreApplication.translate("CorfuncDialog", u"Porod", None))
+        self.label_10.setText(QCoreApplication.translate("CorfuncDialog", u"K:", None))
+#if QT_CONFIG(tooltip)
+        self.txtPorodK.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Porod constant", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_7.setText(QCoreApplication.translate("CorfuncDialog", u"     B:", None))
+#if QT_CONFIG(tooltip)
+        self.txtGuinierA.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Constant of proportionality equal to the scattering intensity at q=0", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtPorodSigma.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Parameter describing the sharpness of the SLD profile at the interface. ", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_11.setText(QCoreApplication.translate("CorfuncDialog", u"\u03c3:", None))
+#if QT_CONFIG(tooltip)
+        self.txtGuinierB.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Parameter proportional to the radius of gyration", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtBackground.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Background level to be subtracted from the scattering data", None))
+#endif // QT_CONFIG(tooltip)
+        self.label.setText(QCoreApplication.translate("CorfuncDialog", u"Background:", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("CorfuncDialog", u"Lamellar Parameters", None))
+        self.label_13.setText(QCoreApplication.translate("CorfuncDialog", u"Stribeck:", None))
+#if QT_CONFIG(tooltip)
+        self.txtPolyRyan.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Polydispersity index according to Eeckhaut's method (see help documentation).", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtAvgHardBlock.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Average thickness of the hard block phase", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_12.setText(QCoreApplication.translate("CorfuncDialog", u"Eeckhaut:", None))
+#if QT_CONFIG(tooltip)
+        self.txtPolyStribeck.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Polydispersity index according to Stribeck's method", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_16.setText(QCoreApplication.translate("CorfuncDialog", u"    Hard Block:", None))
+        self.label_4.setText(QCoreApplication.translate("CorfuncDialog", u"Avg. Thicknesses:", None))
+        self.label_2.setText(QCoreApplication.translate("CorfuncDialog", u"         Soft Block:", None))
+#if QT_CONFIG(tooltip)
+        self.txtAvgSoftBlock.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Average thickness of the soft block phase", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_5.setText(QCoreApplication.translate("CorfuncDialog", u"Polydispersity:", None))
+        self.label_15.setText(QCoreApplication.translate("CorfuncDialog", u"Interface:", None))
+        self.label_17.setText(QCoreApplication.translate("CorfuncDialog", u"Core:", None))
+#if QT_CONFIG(tooltip)
+        self.txtAvgIntThick.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Average thickness of the interface between hard and soft blocks", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtAvgCoreThick.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Average thickness of the core", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_14.setText(QCoreApplication.translate("CorfuncDialog", u"Long Period:", None))
+#if QT_CONFIG(tooltip)
+        self.txtLongPeriod.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Distance between one face of a lamella to the same face of the adjacent lamellae", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_19.setText(QCoreApplication.translate("CorfuncDialog", u"Local Crystallinity:", None))
+#if QT_CONFIG(tooltip)
+        self.txtLocalCrystal.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Local crystallinity index of the lamellar structure (Hard block volume fraction)", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.cmdSaveExtrapolation.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Save the extrapolated data (non-transformed).", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdSaveExtrapolation.setText(QCoreApplication.translate("CorfuncDialog", u"Export Extrapolated", None))
+#if QT_CONFIG(tooltip)
+        self.cmdSave.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Export the calculated real-space correlation function to a file.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdSave.setText(QCoreApplication.translate("CorfuncDialog", u"Export Transformed", None))
+        self.cmdHelp.setText(QCoreApplication.translate("CorfuncDialog", u"Help", None))
+#if QT_CONFIG(tooltip)
+        self.cmdHelp.setToolTip(QCoreApplication.translate("CorfuncDialog", u"Open the Corfunc perspective help documentation.", None))
+#endif // QT_CONFIG(tooltip)
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), QCoreApplication.translate("CorfuncDialog", u"Q Space", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("CorfuncDialog", u"Real Space", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("CorfuncDialog", u"Extraction Diagram", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), QCoreApplication.translate("CorfuncDialog", u"IDF", None))
+    # retranslateUi
+
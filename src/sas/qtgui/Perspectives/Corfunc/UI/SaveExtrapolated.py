@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'SaveExtrapolated.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QDoubleSpinBox, QLabel,
+    QPushButton, QSizePolicy, QWidget)
+
+class Ui_SaveExtrapolatedPanel(object):
+    def setupUi(self, SaveExtrapolatedPanel):
+        if not SaveExtrapolatedPanel.objectName():
+            SaveExtrapolatedPanel.setObjectName(u"SaveExtrapolatedPanel")
+        SaveExtrapolatedPanel.resize(312, 235)
+        SaveExtrapolatedPanel.setMinimumSize(QSize(0, 0))
+        self.spnLow = QDoubleSpinBox(SaveExtrapolatedPanel)
+        self.spnLow.setObjectName(u"spnLow")
+        self.spnLow.setGeometry(QRect(130, 20, 121, 22))
+        self.spnLow.setDecimals(6)
+        self.spnLow.setMinimum(0.000001000000000)
+        self.spnLow.setMaximum(100.000000000000000)
+        self.spnHigh = QDoubleSpinBox(SaveExtrapolatedPanel)
+        self.spnHigh.setObjectName(u"spnHigh")
+        self.spnHigh.setGeometry(QRect(130, 60, 121, 22))
+        self.spnHigh.setDecimals(6)
+        self.spnHigh.setMinimum(0.000001000000000)
+        self.spnHigh.setMaximum(100.000000000000000)
+        self.spnHigh.setValue(1.000000000000000)
+        self.spnDelta = QDoubleSpinBox(SaveExtrapolatedPanel)
+        self.spnDelta.setObjectName(u"spnDelta")
+        self.spnDelta.setGeometry(QRect(130, 100, 121, 22))
+        self.spnDelta.setDecimals(6)
+        self.spnDelta.setMinimum(0.000001000000000)
+        self.spnDelta.setMaximum(100.000000000000000)
+        self.lblLow = QLabel(SaveExtrapolatedPanel)
+        self.lblLow.setObjectName(u"lblLow")
+        self.lblLow.setGeometry(QRect(60, 20, 61, 20))
+        self.lblLow.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.lblHigh = QLabel(SaveExtrapolatedPanel)
+        self.lblHigh.setObjectName(u"lblHigh")
+        self.lblHigh.setGeometry(QRect(50, 60, 71, 20))
+        self.lblHigh.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.lblDelta = QLabel(SaveExtrapolatedPanel)
+        self.lblDelta.setObjectName(u"lblDelta")
+        self.lblDelta.setGeometry(QRect(60, 100, 51, 20))
+        self.lblDelta.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.units1 = QLabel(SaveExtrapolatedPanel)
+        self.units1.setObjectName(u"units1")
+        self.units1.setGeometry(QRect(250, 20, 15, 22))
+        self.units2 = QLabel(SaveExtrapolatedPanel)
+        self.units2.setObjectName(u"units2")
+        self.units2.setGeometry(QRect(250, 60, 15, 22))
+        self.units3 = QLabel(SaveExtrapolatedPanel)
+        self.units3.setObjectName(u"units3")
+        self.units3.setGeometry(QRect(250, 100, 15, 22))
+        self.cmdOK = QPushButton(SaveExtrapolatedPanel)
+        self.cmdOK.setObjectName(u"cmdOK")
+        self.cmdOK.setGeometry(QRect(60, 140, 93, 28))
+        self.cmdCancel = QPushButton(SaveExtrapolatedPanel)
+        self.cmdCancel.setObjectName(u"cmdCancel")
+        self.cmdCancel.setGeometry(QRect(180, 140, 93, 28))
+
+        self.retranslateUi(SaveExtrapolatedPanel)
+
+        QMetaObject.connectSlotsByName(SaveExtrapolatedPanel)
+    # setupUi
+
+    def retranslateUi(self, SaveExtrapolatedPanel):
+        SaveExtrapolatedPanel.setWindowTitle(QCoreApplication.translate("SaveExtrapolatedPanel", u"Dialog", None))
+        self.lblLow.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"Lowest Q", None))
+#if QT_CONFIG(tooltip)
+        self.lblLow.setToolTip(QCoreApplication.translate("SaveExtrapolatedPanel", u"Lower bound for extrapolation", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblHigh.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"Highest Q", None))
+#if QT_CONFIG(tooltip)
+        self.lblHigh.setToolTip(QCoreApplication.translate("SaveExtrapolatedPanel", u"Upper bound for extrapolation", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblDelta.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"Delta Q", None))
+#if QT_CONFIG(tooltip)
+        self.lblDelta.setToolTip(QCoreApplication.translate("SaveExtrapolatedPanel", u"Bin size for extrapolation", None))
+#endif // QT_CONFIG(tooltip)
+        self.units1.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"<html><head/><body><p><span style=\" font-size:8pt;\">\u00c5</span><span style=\" font-size:8pt; vertical-align:super;\">-1</span></p></body></html>", None))
+        self.units2.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"<html><head/><body><p><span style=\" font-size:8pt;\">\u00c5</span><span style=\" font-size:8pt; vertical-align:super;\">-1</span></p></body></html>", None))
+        self.units3.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"<html><head/><body><p><span style=\" font-size:8pt;\">\u00c5</span><span style=\" font-size:8pt; vertical-align:super;\">-1</span></p></body></html>", None))
+        self.cmdOK.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"OK", None))
+#if QT_CONFIG(tooltip)
+        self.cmdOK.setToolTip(QCoreApplication.translate("SaveExtrapolatedPanel", u"Save the extrapolated data to a file.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdCancel.setText(QCoreApplication.translate("SaveExtrapolatedPanel", u"Cancel", None))
+#if QT_CONFIG(tooltip)
+        self.cmdCancel.setToolTip(QCoreApplication.translate("SaveExtrapolatedPanel", u"Cancel and close the dialog.", None))
+#endif // QT_CONFIG(tooltip)
+    # retranslateUi
+
@@ -1,8 +1,11 @@
 import logging
+import os
 import time
 import traceback
 
+from sas import config
 from sas.sascalc.data_util.calcthread import CalcThread
+from sas.sascalc.fit.batch import fit_batch
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +43,10 @@ class FitThread(CalcThread):
                  updatefn=None,
                  yieldtime=0.03,
                  worktime=0.03,
-                 reset_flag=False):
+                 reset_flag=False,
+                 max_workers=None,
+                 jacobian_workers=None,
+                 model_workers=None):
         CalcThread.__init__(self,
                             completefn,
                             updatefn,
@@ -56,6 +62,18 @@ class FitThread(CalcThread):
         self.updatefn = updatefn
         #Relative error desired in the sum of squares.
         self.reset_flag = reset_flag
+        # Worker processes for batch fits, from the config if not given
+        if max_workers is None:
+            max_workers = config.FITTING_BATCH_WORKERS
+        self.max_workers = max_workers if max_workers > 0 else os.cpu_count() or 1
+        # Worker processes for the Jacobian of single fits
+        if jacobian_workers is None:
+            jacobian_workers = config.FITTING_JACOBIAN_WORKERS
+        self.jacobian_workers = jacobian_workers if jacobian_workers > 0 else os.cpu_count() or 1
+        # Worker processes for the datasets of simultaneous fits
+        if model_workers is None:
+            model_workers = config.FITTING_MODEL_WORKERS
+        self.model_workers = model_workers if model_workers > 0 else os.cpu_count() or 1
 
     def isquit(self):
         """
@@ -67,6 +85,17 @@ class FitThread(CalcThread):
             msg = "Fitting: terminated by the user."
             raise KeyboardInterrupt(msg)
 
+    def batch_progress(self, index, result):
+        """
+        Report a completed fit of a parallel batch to the handler
+        """
+        self.completed += 1
+        if self.handler is not None:
+            if result:
+                self.handler.set_result(result[0])
+            self.handler.progress(self.completed, len(self.fitter))
+            self.handler.update_fit()
+
     def compute(self):
         """
         Perform a fit
@@ -83,7 +112,19 @@ class FitThread(CalcThread):
             inputs = list(zip(list_map_get_attr, self.fitter, list_fit_function,
                          list_q, list_q, list_handler, list_curr_thread,
                          list_reset_flag))
-            result = list(map(map_apply, inputs))
+            # Chain fits start each fit from the result of the one before,
+            # so only independent batch fits are spread over processes
+            if fitter_size > 1 and self.max_workers > 1 and not self.reset_flag:
+                self.completed = 0
+                result = fit_batch(self.fitter, self.max_workers,
+                                   reset_flag=self.reset_flag,
+                                   isquit=self.isquit,
+                                   completefn=self.batch_progress)
+            else:
+                for fitter in self.fitter:
+                    fitter.jacobian_workers = self.jacobian_workers
+                    fitter.model_workers = self.model_workers
+                result = list(map(map_apply, inputs))
             results = (result, time.time()-self.starttime)
             if self.handler:
                 self.completefn(results)
@@ -40,7 +40,7 @@ class FittingOptions(PreferencesWidget, Ui_FittingOptions):
         self.setupUi(self)
 
         self.config = config
-        self.config_params = ['FITTING_DEFAULT_OPTIMIZER']
+        self.config_params = ['FITTING_DEFAULT_OPTIMIZER', 'FITTING_JACOBIAN_WORKERS']
 
         # Fill up the algorithm combo, based on what BUMPS says is available
         self.active_fitters = [n.name for n in fitters.FITTERS if n.id in fitters.FIT_ACTIVE_IDS and 'least' not in n.id]
@@ -60,6 +60,14 @@ class FittingOptions(PreferencesWidget, Ui_FittingOptions):
         # Assign appropriate validators
         self.assignValidators()
 
+        # Processes for the Jacobian of Levenberg-Marquardt fits
+        jacobian_validator = QtGui.QIntValidator()
+        jacobian_validator.setBottom(0)
+        self.txtJacobianWorkers.setValidator(jacobian_validator)
+        self.txtJacobianWorkers.setText(str(sasview_config.FITTING_JACOBIAN_WORKERS))
+        self.txtJacobianWorkers.textChanged.connect(self.check_state)
+        self.txtJacobianWorkers.editingFinished.connect(self.onJacobianWorkersChange)
+
         # Assign signals
         self.addSignals()
         self.cmdHelp.setText(f'Help: {self.cbAlgorithm.currentText()}')
@@ -77,6 +85,7 @@ class FittingOptions(PreferencesWidget, Ui_FittingOptions):
     def _toggleBlockAllSignaling(self, toggle: bool):
         self.cbAlgorithm.blockSignals(toggle)
         self.cbAlgorithmDefault.blockSignals(toggle)
+        self.txtJacobianWorkers.blockSignals(toggle)
 
     def _restoreFromConfig(self):
         optimizer_key = sasview_config.FITTING_DEFAULT_OPTIMIZER
@@ -85,6 +94,7 @@ class FittingOptions(PreferencesWidget, Ui_FittingOptions):
         name = [n.name for n in fitters.FITTERS if n.id == self.current_fitter_id][0]
         self.cbAlgorithm.setCurrentIndex(self.cbAlgorithm.findText(name))
         self._algorithm_change(self.cbAlgorithm.currentIndex())
+        self.txtJacobianWorkers.setText(str(sasview_config.FITTING_JACOBIAN_WORKERS))
 
     def addSignals(self):
         self.cmdHelp.clicked.connect(self.onHelp)
@@ -125,6 +135,10 @@ class FittingOptions(PreferencesWidget, Ui_FittingOptions):
         id = dict((new_val, new_k) for new_k, new_val in bumps.options.FIT_CONFIG.names.items()).get(text)
         self._stageChange('FITTING_DEFAULT_OPTIMIZER', id)
 
+    def onJacobianWorkersChange(self):
+        if self.txtJacobianWorkers.hasAcceptableInput():
+            self._stageChange('FITTING_JACOBIAN_WORKERS', int(self.txtJacobianWorkers.text()))
+
     def onAlgorithmChange(self, index):
         """Triggered method when the index of the combo box changes."""
         self._algorithm_change(index)
@@ -0,0 +1,824 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'TabbedInvariantUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFrame,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLayout, QLineEdit, QProgressBar, QPushButton,
+    QRadioButton, QSizePolicy, QSpacerItem, QTabWidget,
+    QVBoxLayout, QWidget)
+
+class Ui_tabbedInvariantUI(object):
+    def setupUi(self, tabbedInvariantUI):
+        if not tabbedInvariantUI.objectName():
+            tabbedInvariantUI.setObjectName(u"tabbedInvariantUI")
+        tabbedInvariantUI.resize(650, 600)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(tabbedInvariantUI.sizePolicy().hasHeightForWidth())
+        tabbedInvariantUI.setSizePolicy(sizePolicy)
+        tabbedInvariantUI.setMinimumSize(QSize(650, 600))
+        self.tabWidget = QTabWidget(tabbedInvariantUI)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.tabWidget.setGeometry(QRect(10, 10, 631, 551))
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.tabWidget.sizePolicy().hasHeightForWidth())
+        self.tabWidget.setSizePolicy(sizePolicy1)
+        self.tabWidget.setMinimumSize(QSize(500, 500))
+        self.tabMain = QWidget()
+        self.tabMain.setObjectName(u"tabMain")
+        self.verticalLayout_3 = QVBoxLayout(self.tabMain)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setSizeConstraint(QLayout.SetNoConstraint)
+        self.groupBox = QGroupBox(self.tabMain)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout = QGridLayout(self.groupBox_2)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.lblTotalQMin = QLabel(self.groupBox_2)
+        self.lblTotalQMin.setObjectName(u"lblTotalQMin")
+
+        self.horizontalLayout.addWidget(self.lblTotalQMin)
+
+        self.txtTotalQMin = QLineEdit(self.groupBox_2)
+        self.txtTotalQMin.setObjectName(u"txtTotalQMin")
+        self.txtTotalQMin.setEnabled(False)
+        self.txtTotalQMin.setReadOnly(True)
+
+        self.horizontalLayout.addWidget(self.txtTotalQMin)
+
+        self.lblTotalQMax = QLabel(self.groupBox_2)
+        self.lblTotalQMax.setObjectName(u"lblTotalQMax")
+
+        self.horizontalLayout.addWidget(self.lblTotalQMax)
+
+        self.txtTotalQMax = QLineEdit(self.groupBox_2)
+        self.txtTotalQMax.setObjectName(u"txtTotalQMax")
+        self.txtTotalQMax.setEnabled(False)
+        self.txtTotalQMax.setReadOnly(True)
+
+        self.horizontalLayout.addWidget(self.txtTotalQMax)
+
+        self.lblTotalQUnits = QLabel(self.groupBox_2)
+        self.lblTotalQUnits.setObjectName(u"lblTotalQUnits")
+
+        self.horizontalLayout.addWidget(self.lblTotalQUnits)
+
+
+        self.gridLayout.addLayout(self.horizontalLayout, 0, 0, 1, 1)
+
+
+        self.gridLayout_2.addWidget(self.groupBox_2, 1, 0, 1, 1)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.lblName = QLabel(self.groupBox)
+        self.lblName.setObjectName(u"lblName")
+
+        self.horizontalLayout_4.addWidget(self.lblName)
+
+        self.txtName = QLineEdit(self.groupBox)
+        self.txtName.setObjectName(u"txtName")
+        self.txtName.setEnabled(False)
+        self.txtName.setFrame(False)
+        self.txtName.setReadOnly(True)
+
+        self.horizontalLayout_4.addWidget(self.txtName)
+
+
+        self.gridLayout_2.addLayout(self.horizontalLayout_4, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.groupBox_3 = QGroupBox(self.tabMain)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.lblBackground = QLabel(self.groupBox_3)
+        self.lblBackground.setObjectName(u"lblBackground")
+
+        self.horizontalLayout_2.addWidget(self.lblBackground)
+
+        self.txtBackgd = QLineEdit(self.groupBox_3)
+        self.txtBackgd.setObjectName(u"txtBackgd")
+
+        self.horizontalLayout_2.addWidget(self.txtBackgd)
+
+        self.lblScale = QLabel(self.groupBox_3)
+        self.lblScale.setObjectName(u"lblScale")
+
+        self.horizontalLayout_2.addWidget(self.lblScale)
+
+        self.txtScale = QLineEdit(self.groupBox_3)
+        self.txtScale.setObjectName(u"txtScale")
+
+        self.horizontalLayout_2.addWidget(self.txtScale)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_2)
+
+        self.gridLayout_10 = QGridLayout()
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.txtVolFrac1 = QLineEdit(self.groupBox_3)
+        self.txtVolFrac1.setObjectName(u"txtVolFrac1")
+
+        self.gridLayout_10.addWidget(self.txtVolFrac1, 2, 1, 1, 1)
+
+        self.lblPM_5 = QLabel(self.groupBox_3)
+        self.lblPM_5.setObjectName(u"lblPM_5")
+
+        self.gridLayout_10.addWidget(self.lblPM_5, 1, 2, 1, 1)
+
+        self.txtContrast = QLineEdit(self.groupBox_3)
+        self.txtContrast.setObjectName(u"txtContrast")
+
+        self.gridLayout_10.addWidget(self.txtContrast, 1, 1, 1, 1)
+
+        self.lblContrastUnits_in = QLabel(self.groupBox_3)
+        self.lblContrastUnits_in.setObjectName(u"lblContrastUnits_in")
+
+        self.gridLayout_10.addWidget(self.lblContrastUnits_in, 1, 4, 1, 1)
+
+        self.txtVolFrac1Err = QLineEdit(self.groupBox_3)
+        self.txtVolFrac1Err.setObjectName(u"txtVolFrac1Err")
+
+        self.gridLayout_10.addWidget(self.txtVolFrac1Err, 2, 3, 1, 1)
+
+        self.lblPM_7 = QLabel(self.groupBox_3)
+        self.lblPM_7.setObjectName(u"lblPM_7")
+
+        self.gridLayout_10.addWidget(self.lblPM_7, 2, 2, 1, 1)
+
+        self.txtContrastErr = QLineEdit(self.groupBox_3)
+        self.txtContrastErr.setObjectName(u"txtContrastErr")
+
+        self.gridLayout_10.addWidget(self.txtContrastErr, 1, 3, 1, 1)
+
+        self.lblPM_6 = QLabel(self.groupBox_3)
+        self.lblPM_6.setObjectName(u"lblPM_6")
+
+        self.gridLayout_10.addWidget(self.lblPM_6, 0, 2, 1, 1)
+
+        self.txtPorodCstErr = QLineEdit(self.groupBox_3)
+        self.txtPorodCstErr.setObjectName(u"txtPorodCstErr")
+
+        self.gridLayout_10.addWidget(self.txtPorodCstErr, 0, 3, 1, 1)
+
+        self.lblPorodCst = QLabel(self.groupBox_3)
+        self.lblPorodCst.setObjectName(u"lblPorodCst")
+
+        self.gridLayout_10.addWidget(self.lblPorodCst, 0, 0, 1, 1)
+
+        self.txtPorodCst = QLineEdit(self.groupBox_3)
+        self.txtPorodCst.setObjectName(u"txtPorodCst")
+
+        self.gridLayout_10.addWidget(self.txtPorodCst, 0, 1, 1, 1)
+
+        self.lblPorodCstUnits = QLabel(self.groupBox_3)
+        self.lblPorodCstUnits.setObjectName(u"lblPorodCstUnits")
+
+        self.gridLayout_10.addWidget(self.lblPorodCstUnits, 0, 4, 1, 1)
+
+        self.rbContrast = QRadioButton(self.groupBox_3)
+        self.rbContrast.setObjectName(u"rbContrast")
+
+        self.gridLayout_10.addWidget(self.rbContrast, 1, 0, 1, 1)
+
+        self.rbVolFrac = QRadioButton(self.groupBox_3)
+        self.rbVolFrac.setObjectName(u"rbVolFrac")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.rbVolFrac.sizePolicy().hasHeightForWidth())
+        self.rbVolFrac.setSizePolicy(sizePolicy2)
+
+        self.gridLayout_10.addWidget(self.rbVolFrac, 2, 0, 1, 1)
+
+
+        self.verticalLayout_5.addLayout(self.gridLayout_10)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+        self.groupBox_7 = QGroupBox(self.tabMain)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.gridLayout_5 = QGridLayout(self.groupBox_7)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.lblInvariantTotalQUnits = QLabel(self.groupBox_7)
+        self.lblInvariantTotalQUnits.setObjectName(u"lblInvariantTotalQUnits")
+
+        self.gridLayout_5.addWidget(self.lblInvariantTotalQUnits, 5, 4, 1, 1)
+
+        self.txtVolFract = QLineEdit(self.groupBox_7)
+        self.txtVolFract.setObjectName(u"txtVolFract")
+        self.txtVolFract.setEnabled(True)
+        self.txtVolFract.setFocusPolicy(Qt.ClickFocus)
+        self.txtVolFract.setAutoFillBackground(True)
+        self.txtVolFract.setStyleSheet(u"")
+        self.txtVolFract.setFrame(True)
+        self.txtVolFract.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtVolFract.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtVolFract, 1, 1, 1, 1)
+
+        self.lblSpSurface = QLabel(self.groupBox_7)
+        self.lblSpSurface.setObjectName(u"lblSpSurface")
+
+        self.gridLayout_5.addWidget(self.lblSpSurface, 3, 0, 1, 1)
+
+        self.lblPM = QLabel(self.groupBox_7)
+        self.lblPM.setObjectName(u"lblPM")
+
+        self.gridLayout_5.addWidget(self.lblPM, 1, 2, 1, 1)
+
+        self.line = QFrame(self.groupBox_7)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.Shape.HLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.gridLayout_5.addWidget(self.line, 4, 0, 1, 5)
+
+        self.lblPM_4 = QLabel(self.groupBox_7)
+        self.lblPM_4.setObjectName(u"lblPM_4")
+
+        self.gridLayout_5.addWidget(self.lblPM_4, 5, 2, 1, 1)
+
+        self.lblVFOut = QLabel(self.groupBox_7)
+        self.lblVFOut.setObjectName(u"lblVFOut")
+
+        self.gridLayout_5.addWidget(self.lblVFOut, 1, 0, 1, 1)
+
+        self.lblPM_3 = QLabel(self.groupBox_7)
+        self.lblPM_3.setObjectName(u"lblPM_3")
+
+        self.gridLayout_5.addWidget(self.lblPM_3, 3, 2, 1, 1)
+
+        self.lblSpecificSurfaceUnits = QLabel(self.groupBox_7)
+        self.lblSpecificSurfaceUnits.setObjectName(u"lblSpecificSurfaceUnits")
+
+        self.gridLayout_5.addWidget(self.lblSpecificSurfaceUnits, 3, 4, 1, 1)
+
+        self.txtVolFractErr = QLineEdit(self.groupBox_7)
+        self.txtVolFractErr.setObjectName(u"txtVolFractErr")
+        self.txtVolFractErr.setEnabled(True)
+        self.txtVolFractErr.setFocusPolicy(Qt.ClickFocus)
+        self.txtVolFractErr.setFrame(True)
+        self.txtVolFractErr.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtVolFractErr.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtVolFractErr, 1, 3, 1, 1)
+
+        self.txtSpecSurf = QLineEdit(self.groupBox_7)
+        self.txtSpecSurf.setObjectName(u"txtSpecSurf")
+        self.txtSpecSurf.setEnabled(True)
+        self.txtSpecSurf.setFocusPolicy(Qt.ClickFocus)
+        self.txtSpecSurf.setFrame(True)
+        self.txtSpecSurf.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtSpecSurf.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtSpecSurf, 3, 1, 1, 1)
+
+        self.txtInvariantTot = QLineEdit(self.groupBox_7)
+        self.txtInvariantTot.setObjectName(u"txtInvariantTot")
+        self.txtInvariantTot.setEnabled(True)
+        self.txtInvariantTot.setFocusPolicy(Qt.ClickFocus)
+        self.txtInvariantTot.setFrame(True)
+        self.txtInvariantTot.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtInvariantTot.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtInvariantTot, 5, 1, 1, 1)
+
+        self.lblInvariantTotalQ = QLabel(self.groupBox_7)
+        self.lblInvariantTotalQ.setObjectName(u"lblInvariantTotalQ")
+
+        self.gridLayout_5.addWidget(self.lblInvariantTotalQ, 5, 0, 1, 1)
+
+        self.txtInvariantTotErr = QLineEdit(self.groupBox_7)
+        self.txtInvariantTotErr.setObjectName(u"txtInvariantTotErr")
+        self.txtInvariantTotErr.setEnabled(True)
+        self.txtInvariantTotErr.setFocusPolicy(Qt.ClickFocus)
+        self.txtInvariantTotErr.setFrame(True)
+        self.txtInvariantTotErr.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtInvariantTotErr.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtInvariantTotErr, 5, 3, 1, 1)
+
+        self.txtSpecSurfErr = QLineEdit(self.groupBox_7)
+        self.txtSpecSurfErr.setObjectName(u"txtSpecSurfErr")
+        self.txtSpecSurfErr.setEnabled(True)
+        self.txtSpecSurfErr.setFocusPolicy(Qt.ClickFocus)
+        self.txtSpecSurfErr.setFrame(True)
+        self.txtSpecSurfErr.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtSpecSurfErr.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtSpecSurfErr, 3, 3, 1, 1)
+
+        self.lblContrastOut = QLabel(self.groupBox_7)
+        self.lblContrastOut.setObjectName(u"lblContrastOut")
+
+        self.gridLayout_5.addWidget(self.lblContrastOut, 2, 0, 1, 1)
+
+        self.txtContrastOut = QLineEdit(self.groupBox_7)
+        self.txtContrastOut.setObjectName(u"txtContrastOut")
+        self.txtContrastOut.setEnabled(True)
+        self.txtContrastOut.setFocusPolicy(Qt.ClickFocus)
+        self.txtContrastOut.setAutoFillBackground(True)
+        self.txtContrastOut.setStyleSheet(u"")
+        self.txtContrastOut.setFrame(True)
+        self.txtContrastOut.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtContrastOut.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtContrastOut, 2, 1, 1, 1)
+
+        self.lblPM_2 = QLabel(self.groupBox_7)
+        self.lblPM_2.setObjectName(u"lblPM_2")
+
+        self.gridLayout_5.addWidget(self.lblPM_2, 2, 2, 1, 1)
+
+        self.txtContrastOutErr = QLineEdit(self.groupBox_7)
+        self.txtContrastOutErr.setObjectName(u"txtContrastOutErr")
+        self.txtContrastOutErr.setEnabled(True)
+        self.txtContrastOutErr.setFocusPolicy(Qt.ClickFocus)
+        self.txtContrastOutErr.setFrame(True)
+        self.txtContrastOutErr.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+        self.txtContrastOutErr.setReadOnly(True)
+
+        self.gridLayout_5.addWidget(self.txtContrastOutErr, 2, 3, 1, 1)
+
+        self.lblContrastUnits_out = QLabel(self.groupBox_7)
+        self.lblContrastUnits_out.setObjectName(u"lblContrastUnits_out")
+
+        self.gridLayout_5.addWidget(self.lblContrastUnits_out, 2, 4, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_7)
+
+        self.tabWidget.addTab(self.tabMain, "")
+        self.tabExtrapolation = QWidget()
+        self.tabExtrapolation.setObjectName(u"tabExtrapolation")
+        self.verticalLayout_extrapolation = QVBoxLayout(self.tabExtrapolation)
+        self.verticalLayout_extrapolation.setObjectName(u"verticalLayout_extrapolation")
+        self.groupBox_5 = QGroupBox(self.tabExtrapolation)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_5)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.horizontalLayout_10 = QHBoxLayout()
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.labelName = QLabel(self.groupBox_5)
+        self.labelName.setObjectName(u"labelName")
+
+        self.horizontalLayout_10.addWidget(self.labelName)
+
+        self.txtFileName = QLineEdit(self.groupBox_5)
+        self.txtFileName.setObjectName(u"txtFileName")
+        self.txtFileName.setEnabled(False)
+        self.txtFileName.setFrame(False)
+        self.txtFileName.setReadOnly(True)
+
+        self.horizontalLayout_10.addWidget(self.txtFileName)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_10)
+
+        self.sliderLayout = QHBoxLayout()
+        self.sliderLayout.setObjectName(u"sliderLayout")
+        self.label_7 = QLabel(self.groupBox_5)
+        self.label_7.setObjectName(u"label_7")
+
+        self.sliderLayout.addWidget(self.label_7)
+
+
+        self.verticalLayout_6.addLayout(self.sliderLayout)
+
+
+        self.verticalLayout_extrapolation.addWidget(self.groupBox_5)
+
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.groupBox_6 = QGroupBox(self.tabExtrapolation)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.groupBox_6.setMinimumSize(QSize(200, 0))
+        self.gridLayout_7 = QGridLayout(self.groupBox_6)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.chkLowQ_ex = QCheckBox(self.groupBox_6)
+        self.chkLowQ_ex.setObjectName(u"chkLowQ_ex")
+
+        self.gridLayout_7.addWidget(self.chkLowQ_ex, 0, 0, 1, 3)
+
+        self.labelGuinierEnd = QLabel(self.groupBox_6)
+        self.labelGuinierEnd.setObjectName(u"labelGuinierEnd")
+
+        self.gridLayout_7.addWidget(self.labelGuinierEnd, 1, 0, 1, 1)
+
+        self.txtGuinierEnd_ex = QLineEdit(self.groupBox_6)
+        self.txtGuinierEnd_ex.setObjectName(u"txtGuinierEnd_ex")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.txtGuinierEnd_ex.sizePolicy().hasHeightForWidth())
+        self.txtGuinierEnd_ex.setSizePolicy(sizePolicy3)
+
+        self.gridLayout_7.addWidget(self.txtGuinierEnd_ex, 1, 1, 1, 1)
+
+        self.lblGuinierEndUnits = QLabel(self.groupBox_6)
+        self.lblGuinierEndUnits.setObjectName(u"lblGuinierEndUnits")
+
+        self.gridLayout_7.addWidget(self.lblGuinierEndUnits, 1, 2, 1, 1)
+
+        self.rbLowQGuinier_ex = QRadioButton(self.groupBox_6)
+        self.rbLowQGuinier_ex.setObjectName(u"rbLowQGuinier_ex")
+
+        self.gridLayout_7.addWidget(self.rbLowQGuinier_ex, 2, 0, 1, 1)
+
+        self.rbLowQPower_ex = QRadioButton(self.groupBox_6)
+        self.rbLowQPower_ex.setObjectName(u"rbLowQPower_ex")
+
+        self.gridLayout_7.addWidget(self.rbLowQPower_ex, 3, 0, 1, 1)
+
+        self.txtLowQPower_ex = QLineEdit(self.groupBox_6)
+        self.txtLowQPower_ex.setObjectName(u"txtLowQPower_ex")
+        self.txtLowQPower_ex.setEnabled(False)
+
+        self.gridLayout_7.addWidget(self.txtLowQPower_ex, 3, 1, 1, 1)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.rbLowQFit_ex = QRadioButton(self.groupBox_6)
+        self.rbLowQFit_ex.setObjectName(u"rbLowQFit_ex")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Maximum)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.rbLowQFit_ex.sizePolicy().hasHeightForWidth())
+        self.rbLowQFit_ex.setSizePolicy(sizePolicy4)
+
+        self.horizontalLayout_3.addWidget(self.rbLowQFit_ex)
+
+        self.rbLowQFix_ex = QRadioButton(self.groupBox_6)
+        self.rbLowQFix_ex.setObjectName(u"rbLowQFix_ex")
+        sizePolicy4.setHeightForWidth(self.rbLowQFix_ex.sizePolicy().hasHeightForWidth())
+        self.rbLowQFix_ex.setSizePolicy(sizePolicy4)
+
+        self.horizontalLayout_3.addWidget(self.rbLowQFix_ex)
+
+
+        self.gridLayout_7.addLayout(self.horizontalLayout_3, 5, 1, 1, 1)
+
+
+        self.horizontalLayout_6.addWidget(self.groupBox_6)
+
+        self.groupBox_8 = QGroupBox(self.tabExtrapolation)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.gridLayout_8 = QGridLayout(self.groupBox_8)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.labelPorodEnd = QLabel(self.groupBox_8)
+        self.labelPorodEnd.setObjectName(u"labelPorodEnd")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.labelPorodEnd.sizePolicy().hasHeightForWidth())
+        self.labelPorodEnd.setSizePolicy(sizePolicy5)
+
+        self.gridLayout_8.addWidget(self.labelPorodEnd, 2, 1, 1, 1)
+
+        self.txtPorodEnd_ex = QLineEdit(self.groupBox_8)
+        self.txtPorodEnd_ex.setObjectName(u"txtPorodEnd_ex")
+        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.txtPorodEnd_ex.sizePolicy().hasHeightForWidth())
+        self.txtPorodEnd_ex.setSizePolicy(sizePolicy6)
+
+        self.gridLayout_8.addWidget(self.txtPorodEnd_ex, 2, 2, 1, 1)
+
+        self.label = QLabel(self.groupBox_8)
+        self.label.setObjectName(u"label")
+        sizePolicy5.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy5)
+
+        self.gridLayout_8.addWidget(self.label, 3, 1, 1, 1)
+
+        self.lblPorodStartUnits = QLabel(self.groupBox_8)
+        self.lblPorodStartUnits.setObjectName(u"lblPorodStartUnits")
+        sizePolicy5.setHeightForWidth(self.lblPorodStartUnits.sizePolicy().hasHeightForWidth())
+        self.lblPorodStartUnits.setSizePolicy(sizePolicy5)
+
+        self.gridLayout_8.addWidget(self.lblPorodStartUnits, 1, 3, 1, 1)
+
+        self.txtHighQPower_ex = QLineEdit(self.groupBox_8)
+        self.txtHighQPower_ex.setObjectName(u"txtHighQPower_ex")
+        self.txtHighQPower_ex.setEnabled(False)
+        sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy7.setHorizontalStretch(0)
+        sizePolicy7.setVerticalStretch(0)
+        sizePolicy7.setHeightForWidth(self.txtHighQPower_ex.sizePolicy().hasHeightForWidth())
+        self.txtHighQPower_ex.setSizePolicy(sizePolicy7)
+
+        self.gridLayout_8.addWidget(self.txtHighQPower_ex, 3, 2, 1, 1)
+
+        self.txtPorodStart_ex = QLineEdit(self.groupBox_8)
+        self.txtPorodStart_ex.setObjectName(u"txtPorodStart_ex")
+        sizePolicy6.setHeightForWidth(self.txtPorodStart_ex.sizePolicy().hasHeightForWidth())
+        self.txtPorodStart_ex.setSizePolicy(sizePolicy6)
+
+        self.gridLayout_8.addWidget(self.txtPorodStart_ex, 1, 2, 1, 1)
+
+        self.labelPorodStart = QLabel(self.groupBox_8)
+        self.labelPorodStart.setObjectName(u"labelPorodStart")
+        sizePolicy5.setHeightForWidth(self.labelPorodStart.sizePolicy().hasHeightForWidth())
+        self.labelPorodStart.setSizePolicy(sizePolicy5)
+
+        self.gridLayout_8.addWidget(self.labelPorodStart, 1, 1, 1, 1)
+
+        self.chkHighQ_ex = QCheckBox(self.groupBox_8)
+        self.chkHighQ_ex.setObjectName(u"chkHighQ_ex")
+        sizePolicy2.setHeightForWidth(self.chkHighQ_ex.sizePolicy().hasHeightForWidth())
+        self.chkHighQ_ex.setSizePolicy(sizePolicy2)
+
+        self.gridLayout_8.addWidget(self.chkHighQ_ex, 0, 1, 1, 5)
+
+        self.lblPorodEndUnits = QLabel(self.groupBox_8)
+        self.lblPorodEndUnits.setObjectName(u"lblPorodEndUnits")
+        sizePolicy5.setHeightForWidth(self.lblPorodEndUnits.sizePolicy().hasHeightForWidth())
+        self.lblPorodEndUnits.setSizePolicy(sizePolicy5)
+
+        self.gridLayout_8.addWidget(self.lblPorodEndUnits, 2, 3, 1, 1)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.rbHighQFit_ex = QRadioButton(self.groupBox_8)
+        self.rbHighQFit_ex.setObjectName(u"rbHighQFit_ex")
+
+        self.horizontalLayout_5.addWidget(self.rbHighQFit_ex)
+
+        self.rbHighQFix_ex = QRadioButton(self.groupBox_8)
+        self.rbHighQFix_ex.setObjectName(u"rbHighQFix_ex")
+
+        self.horizontalLayout_5.addWidget(self.rbHighQFix_ex)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_5, 4, 2, 1, 1)
+
+
+        self.horizontalLayout_6.addWidget(self.groupBox_8)
+
+
+        self.verticalLayout_extrapolation.addLayout(self.horizontalLayout_6)
+
+        self.groupBox_4 = QGroupBox(self.tabExtrapolation)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_6 = QGridLayout(self.groupBox_4)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.label_12 = QLabel(self.groupBox_4)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_6.addWidget(self.label_12, 0, 0, 1, 1)
+
+        self.progressBarLowQ = QProgressBar(self.groupBox_4)
+        self.progressBarLowQ.setObjectName(u"progressBarLowQ")
+        self.progressBarLowQ.setValue(100)
+
+        self.gridLayout_6.addWidget(self.progressBarLowQ, 0, 1, 1, 1)
+
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_6.addWidget(self.label_13, 1, 0, 1, 1)
+
+        self.progressBarData = QProgressBar(self.groupBox_4)
+        self.progressBarData.setObjectName(u"progressBarData")
+        self.progressBarData.setValue(100)
+
+        self.gridLayout_6.addWidget(self.progressBarData, 1, 1, 1, 1)
+
+        self.label_14 = QLabel(self.groupBox_4)
+        self.label_14.setObjectName(u"label_14")
+
+        self.gridLayout_6.addWidget(self.label_14, 2, 0, 1, 1)
+
+        self.progressBarHighQ = QProgressBar(self.groupBox_4)
+        self.progressBarHighQ.setObjectName(u"progressBarHighQ")
+        self.progressBarHighQ.setValue(100)
+
+        self.gridLayout_6.addWidget(self.progressBarHighQ, 2, 1, 1, 1)
+
+
+        self.verticalLayout_extrapolation.addWidget(self.groupBox_4)
+
+        self.tabWidget.addTab(self.tabExtrapolation, "")
+        self.layoutWidget = QWidget(tabbedInvariantUI)
+        self.layoutWidget.setObjectName(u"layoutWidget")
+        self.layoutWidget.setGeometry(QRect(10, 560, 611, 31))
+        self.horizontalLayout_8 = QHBoxLayout(self.layoutWidget)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.cmdCalculate = QPushButton(self.layoutWidget)
+        self.cmdCalculate.setObjectName(u"cmdCalculate")
+
+        self.horizontalLayout_8.addWidget(self.cmdCalculate)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer)
+
+        self.cmdStatus = QPushButton(self.layoutWidget)
+        self.cmdStatus.setObjectName(u"cmdStatus")
+        self.cmdStatus.setEnabled(False)
+
+        self.horizontalLayout_8.addWidget(self.cmdStatus)
+
+        self.cmdHelp = QPushButton(self.layoutWidget)
+        self.cmdHelp.setObjectName(u"cmdHelp")
+
+        self.horizontalLayout_8.addWidget(self.cmdHelp)
+
+        QWidget.setTabOrder(self.tabWidget, self.txtName)
+        QWidget.setTabOrder(self.txtName, self.txtTotalQMin)
+        QWidget.setTabOrder(self.txtTotalQMin, self.txtTotalQMax)
+        QWidget.setTabOrder(self.txtTotalQMax, self.txtBackgd)
+        QWidget.setTabOrder(self.txtBackgd, self.txtScale)
+        QWidget.setTabOrder(self.txtScale, self.txtPorodCst)
+        QWidget.setTabOrder(self.txtPorodCst, self.txtPorodCstErr)
+        QWidget.setTabOrder(self.txtPorodCstErr, self.txtContrast)
+        QWidget.setTabOrder(self.txtContrast, self.txtContrastErr)
+        QWidget.setTabOrder(self.txtContrastErr, self.txtVolFrac1)
+        QWidget.setTabOrder(self.txtVolFrac1, self.txtVolFrac1Err)
+        QWidget.setTabOrder(self.txtVolFrac1Err, self.chkLowQ_ex)
+        QWidget.setTabOrder(self.chkLowQ_ex, self.rbLowQGuinier_ex)
+        QWidget.setTabOrder(self.rbLowQGuinier_ex, self.rbLowQPower_ex)
+        QWidget.setTabOrder(self.rbLowQPower_ex, self.rbLowQFit_ex)
+        QWidget.setTabOrder(self.rbLowQFit_ex, self.rbLowQFix_ex)
+        QWidget.setTabOrder(self.rbLowQFix_ex, self.txtLowQPower_ex)
+        QWidget.setTabOrder(self.txtLowQPower_ex, self.chkHighQ_ex)
+        QWidget.setTabOrder(self.chkHighQ_ex, self.rbHighQFit_ex)
+        QWidget.setTabOrder(self.rbHighQFit_ex, self.rbHighQFix_ex)
+        QWidget.setTabOrder(self.rbHighQFix_ex, self.txtHighQPower_ex)
+        QWidget.setTabOrder(self.txtHighQPower_ex, self.cmdCalculate)
+        QWidget.setTabOrder(self.cmdCalculate, self.cmdStatus)
+        QWidget.setTabOrder(self.cmdStatus, self.cmdHelp)
+
+        self.retranslateUi(tabbedInvariantUI)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(tabbedInvariantUI)
+    # setupUi
+
+    def retranslateUi(self, tabbedInvariantUI):
+        tabbedInvariantUI.setWindowTitle(QCoreApplication.translate("tabbedInvariantUI", u"Dialog", None))
+        self.groupBox.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"I(q) data source", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"Total Q range", None))
+        self.lblTotalQMin.setText(QCoreApplication.translate("tabbedInvariantUI", u"Min:", None))
+#if QT_CONFIG(tooltip)
+        self.txtTotalQMin.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Minimum Q used for total invariant calculation (1/Angstrom).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblTotalQMax.setText(QCoreApplication.translate("tabbedInvariantUI", u"Max:", None))
+#if QT_CONFIG(tooltip)
+        self.txtTotalQMax.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Maximum Q used for total invariant calculation (1/Angstrom).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblTotalQUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.lblName.setText(QCoreApplication.translate("tabbedInvariantUI", u"Name:", None))
+#if QT_CONFIG(tooltip)
+        self.txtName.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Data file being analyzed.", None))
+#endif // QT_CONFIG(tooltip)
+        self.groupBox_3.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"Customized input", None))
+        self.lblBackground.setText(QCoreApplication.translate("tabbedInvariantUI", u"Background:", None))
+#if QT_CONFIG(tooltip)
+        self.txtBackgd.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Background to subtract from the scattering data.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblScale.setText(QCoreApplication.translate("tabbedInvariantUI", u"Scale:", None))
+#if QT_CONFIG(tooltip)
+        self.txtScale.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Scale factor used for the invariant and extrapolation calculations.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtVolFrac1.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Volume fraction of the minority phase.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPM_5.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+#if QT_CONFIG(tooltip)
+        self.txtContrast.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Scattering length density contrast.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblContrastUnits_in.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p align=\"center\">\u00c5<span style=\" vertical-align:super;\">-2</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtVolFrac1Err.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the volume fraction of the minority phase.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPM_7.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+#if QT_CONFIG(tooltip)
+        self.txtContrastErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the scattering length density contrast.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPM_6.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+#if QT_CONFIG(tooltip)
+        self.txtPorodCstErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the Porod constant.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPorodCst.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>Porod constant:</p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtPorodCst.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Optional Porod constant.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPorodCstUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>(cm \u00c5<span style=\" vertical-align:super;\">4</span>)<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.rbContrast.setText(QCoreApplication.translate("tabbedInvariantUI", u"Contrast:", None))
+#if QT_CONFIG(tooltip)
+        self.rbContrast.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Use contrast to calculate the volume fraction.", None))
+#endif // QT_CONFIG(tooltip)
+        self.rbVolFrac.setText(QCoreApplication.translate("tabbedInvariantUI", u"Volume Fraction:", None))
+#if QT_CONFIG(tooltip)
+        self.rbVolFrac.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Use volume fraction to calculate the contrast.", None))
+#endif // QT_CONFIG(tooltip)
+        self.groupBox_7.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"Output", None))
+        self.lblInvariantTotalQUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>(cm \u00c5<span style=\" vertical-align:super;\">3</span>)<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtVolFract.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Calculated volume fraction of the minority phase.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblSpSurface.setText(QCoreApplication.translate("tabbedInvariantUI", u"Specific Surface:", None))
+        self.lblPM.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+        self.lblPM_4.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+        self.lblVFOut.setText(QCoreApplication.translate("tabbedInvariantUI", u"Volume fraction:", None))
+        self.lblPM_3.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+        self.lblSpecificSurfaceUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p align=\"center\">\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtVolFractErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the calculated volume fraction.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtSpecSurf.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Specific surface area (surface per unit volume).", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtInvariantTot.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Total invariant [Q*], including extrapolated regions.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblInvariantTotalQ.setText(QCoreApplication.translate("tabbedInvariantUI", u"Invariant Total [Q*]:", None))
+#if QT_CONFIG(tooltip)
+        self.txtInvariantTotErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the total invariant.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtSpecSurfErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the specific surface area.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblContrastOut.setText(QCoreApplication.translate("tabbedInvariantUI", u"Contrast:", None))
+#if QT_CONFIG(tooltip)
+        self.txtContrastOut.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Calculated scattering length density contrast.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPM_2.setText(QCoreApplication.translate("tabbedInvariantUI", u"+/-", None))
+#if QT_CONFIG(tooltip)
+        self.txtContrastOutErr.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Uncertainty in the calculated scattering length density contrast.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblContrastUnits_out.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p align=\"center\">\u00c5<span style=\" vertical-align:super;\">-2</span></p></body></html>", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabMain), QCoreApplication.translate("tabbedInvariantUI", u"Invariant", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"Extrapolation", None))
+        self.labelName.setText(QCoreApplication.translate("tabbedInvariantUI", u"Name:", None))
+        self.label_7.setText(QCoreApplication.translate("tabbedInvariantUI", u"Adjust:", None))
+        self.groupBox_6.setTitle("")
+        self.chkLowQ_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Low-Q", None))
+        self.labelGuinierEnd.setText(QCoreApplication.translate("tabbedInvariantUI", u"End:", None))
+        self.lblGuinierEndUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.rbLowQGuinier_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Guinier", None))
+        self.rbLowQPower_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Power:", None))
+        self.rbLowQFit_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Fit", None))
+        self.rbLowQFix_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Fix", None))
+        self.groupBox_8.setTitle("")
+        self.labelPorodEnd.setText(QCoreApplication.translate("tabbedInvariantUI", u" End:", None))
+        self.label.setText(QCoreApplication.translate("tabbedInvariantUI", u"Power:", None))
+        self.lblPorodStartUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.labelPorodStart.setText(QCoreApplication.translate("tabbedInvariantUI", u"Start:", None))
+        self.chkHighQ_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"High-Q", None))
+        self.lblPorodEndUnits.setText(QCoreApplication.translate("tabbedInvariantUI", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.rbHighQFit_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Fit", None))
+        self.rbHighQFix_ex.setText(QCoreApplication.translate("tabbedInvariantUI", u"Fix", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("tabbedInvariantUI", u"Invariant chart", None))
+        self.label_12.setText(QCoreApplication.translate("tabbedInvariantUI", u"Q* from Low-Q", None))
+        self.label_13.setText(QCoreApplication.translate("tabbedInvariantUI", u"Q* from Data", None))
+        self.label_14.setText(QCoreApplication.translate("tabbedInvariantUI", u"Q* from High-Q", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabExtrapolation), QCoreApplication.translate("tabbedInvariantUI", u"Extrapolation", None))
+#if QT_CONFIG(tooltip)
+        self.cmdCalculate.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Run the invariant calculation.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdCalculate.setText(QCoreApplication.translate("tabbedInvariantUI", u"Calculate", None))
+#if QT_CONFIG(tooltip)
+        self.cmdStatus.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Show more calculation details, including extrapolation fractions and Q* values.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdStatus.setText(QCoreApplication.translate("tabbedInvariantUI", u"Status", None))
+#if QT_CONFIG(tooltip)
+        self.cmdHelp.setToolTip(QCoreApplication.translate("tabbedInvariantUI", u"Open the Invariant perspective help documentation.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdHelp.setText(QCoreApplication.translate("tabbedInvariantUI", u"Help", None))
+    # retranslateUi
+
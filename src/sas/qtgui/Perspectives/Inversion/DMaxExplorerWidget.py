@@ -8,9 +8,8 @@ their distribution as a function of D_max.
 # global
 import logging
 
-import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, Signal
 from PySide6.QtGui import QIcon
 
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
@@ -20,8 +19,10 @@ from sas.qtgui.Plotting.Plotter import PlotterWidget
 # sas-global
 from sas.qtgui.Plotting.PlotterData import Data1D
 from sas.qtgui.Utilities.GuiUtils import enum
+from sas.sascalc.pr.distance_explorer import Results
 
 # local
+from .Thread import ExploreDmax
 from .UI.DMaxExplorer import Ui_DmaxExplorer
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,10 @@ class DmaxWindow(QtWidgets.QDialog, Ui_DmaxExplorer):
 
     name = "Dmax Explorer"  # For displaying in the combo box
 
+    # Results of the D_max scan, emitted from the calculation thread
+    resultsUpdated = Signal(object)
+    scanComplete = Signal(object)
+
     def __init__(self, pr_state: "Invertor", nfunc: int, parent=None):
         super().__init__()
         self.setupUi(self)
@@ -63,6 +68,10 @@ class DmaxWindow(QtWidgets.QDialog, Ui_DmaxExplorer):
         self.plot.showLegend = False
         self.verticalLayout.insertWidget(0, self.plot)
 
+        self.calcThread: ExploreDmax | None = None
+        # Results of the last scan, replotted when the output is changed
+        self.results: Results | None = None
+
         # Let's choose the Standard Item Model.
         self.model = QtGui.QStandardItemModel(self)
         self.mapper = QtWidgets.QDataWidgetMapper(self)
@@ -90,7 +99,9 @@ class DmaxWindow(QtWidgets.QDialog, Ui_DmaxExplorer):
         """Connect UI signals to their corresponding slots."""
         self.closeButton.clicked.connect(self.close)
         self.model.itemChanged.connect(self.modelChanged)
-        self.dependentVariable.currentIndexChanged.connect(lambda: self.modelChanged(None))
+        self.dependentVariable.currentIndexChanged.connect(self.variableChanged)
+        self.resultsUpdated.connect(self.plotResults)
+        self.scanComplete.connect(self.scanCompleted)
 
     def setupModel(self) -> None:
         """Populate the model with initial values derived from the current P(r) state."""
@@ -124,91 +135,95 @@ class DmaxWindow(QtWidgets.QDialog, Ui_DmaxExplorer):
         if not self.mapper:
             return
 
-        iq0: list[float] = []
-        rg: list[float] = []
-        pos: list[float] = []
-        pos_err: list[float] = []
-        osc: list[float] = []
-        bck: list[float] = []
-        chi2: list[float] = []
-        # Introducing this to make sure size of x and y for plotting is the same.
-        plotable_xs: list[float] = []
-
         try:
             dmin = float(self.model.item(W.DMIN).text())
             dmax = float(self.model.item(W.DMAX).text())
             npts = int(self.model.item(W.NPTS).text())
-            xs = np.linspace(dmin, dmax, npts)
         except ValueError as e:
             msg = f"An input value is not correctly formatted. Please check {e}"
             logger.error(msg)
+            return
 
-        original = self.pr_state.dmax
-
-        for x in xs:
-            self.pr_state.dmax = x
-            try:
-                out, cov = self.pr_state.invert(self.pr_state.nfunc)
-
-                iq0.append(self.pr_state.iq0(out))
-                rg.append(self.pr_state.rg(out))
-                pos.append(self.pr_state.get_positive(out))
-                pos_err.append(self.pr_state.get_pos_err(out, cov))
-                osc.append(self.pr_state.oscillations(out))
-                bck.append(self.pr_state.background)
-                chi2.append(self.pr_state.chi2)
-                plotable_xs.append(x)
-            except Exception as ex:
-                # This inversion failed, skip this D_max value
-                msg = (
-                    f"ExploreDialog: inversion failed for D_max={x}\n"
-                    f"{ex}\n"
-                    f"Please adapt Inversion parameters"
-                )
-                logger.error(msg)
-
-        # Return the invertor to its original state
-        self.pr_state.d_max = original
-        try:
-            self.pr_state.invert(self.nfunc)
-        except RuntimeError as ex:
-            msg = "ExploreDialog: inversion failed "
-            msg += "for D_max=%s\n%s" % (str(x), ex)
-            logger.error(msg)
+        # The inputs are disabled while a scan runs; scans must not overlap
+        # since they report to the same plot
+        if self.calcThread is not None and self.calcThread.isrunning():
+            return
+
+        self.enableInputs(False)
+        self.calcThread = ExploreDmax(
+            self.pr_state, dmin, dmax, npts,
+            error_func=self.threadError,
+            completefn=lambda results: self.scanComplete.emit(results),
+            updatefn=lambda results: self.resultsUpdated.emit(results),
+        )
+        self.calcThread.queue()
+
+    def variableChanged(self) -> None:
+        """Plot a different output of the last scan."""
+        if self.results is not None:
+            self.plotResults(self.results)
+
+    def enableInputs(self, enabled: bool) -> None:
+        """Enable the scan range inputs, which are disabled while a scan runs."""
+        self.Npts.setEnabled(enabled)
+        self.minDist.setEnabled(enabled)
+        self.maxDist.setEnabled(enabled)
+
+    def stopThread(self) -> None:
+        """Stop the running scan, if any."""
+        if self.calcThread is not None and self.calcThread.isrunning():
+            self.calcThread.stop()
+
+    def threadError(self, msg: str) -> None:
+        """Report a failed scan, emitted from the calculation thread."""
+        logger.error(msg)
+        self.scanComplete.emit(None)
+
+    def scanCompleted(self, results: Results | None) -> None:
+        """Plot the final results of the scan and report failed inversions."""
+        self.enableInputs(True)
+        if results is None:
+            return
+        self.plotResults(results)
+        for msg in results.errors:
+            logger.error(f"{msg}\nPlease adapt Inversion parameters")
 
+    def plotResults(self, results: Results) -> None:
+        """Plot the selected inversion output against D_max."""
+        self.results = results
         plotter = self.dependentVariable.currentText()
         x_label = "D_{max}"
         x_unit = "A"
         if plotter == "χ²/dof":
-            ys = chi2
+            ys = results.chi2
             y_label = "\\chi^2/dof"
             y_unit = "a.u."
         elif plotter == "I(Q=0)":
-            ys = iq0
+            ys = results.iq0
             y_label = "I(q=0)"
             y_unit = "cm^{-1}"
         elif plotter == "Rg":
-            ys = rg
+            ys = results.rg
             y_label = "R_g"
             y_unit = "\\AA"
         elif plotter == "Oscillation parameter":
-            ys = osc
+            ys = results.osc
             y_label = "Osc"
             y_unit = "a.u."
         elif plotter == "Background":
-            ys = bck
+            ys = results.bck
             y_label = "Bckg"
             y_unit = "cm^{-1}"
         elif plotter == "Positive Fraction":
-            ys = pos
+            ys = results.pos
             y_label = "P^+"
             y_unit = "a.u."
         else:
-            ys = pos_err
+            ys = results.pos_err
             y_label = "P^{+}_{1\\sigma}"
             y_unit = "a.u."
 
-        data = Data1D(plotable_xs, ys)
+        data = Data1D(list(results.d_max), list(ys))
         # Store the line symbol so re-renders (e.g. 'Reset original view') keep the line style
         data.symbol = list(PlotUtilities.SHAPES.keys()).index('Line')
         if self.hasPlot:
@@ -222,6 +237,7 @@ class DmaxWindow(QtWidgets.QDialog, Ui_DmaxExplorer):
         self.plot.plot(data=data, marker="-")
 
     def closeEvent(self, event: QtCore.QEvent) -> None:
-        """Override close event to clear the parent's reference to this window."""
+        """Override close event to stop the scan and clear the parent's reference to this window."""
+        self.stopThread()
         self.parent.dmaxWindow = None
         event.accept()
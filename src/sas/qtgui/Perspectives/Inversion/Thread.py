@@ -1,8 +1,10 @@
+import copy
 import sys
 import time
 from collections.abc import Callable
 
 from sas.sascalc.data_util.calcthread import CalcThread
+from sas.sascalc.pr.distance_explorer import DistExplorer
 from sas.sascalc.pr.invertor import Invertor
 
 
@@ -155,3 +157,45 @@ class EstimateNT(CalcThread):
         except Exception:
             if self.error_func is not None:
                 self.error_func("EstimatePr2.compute: %s" % sys.exc_info()[1])
+
+
+class ExploreDmax(CalcThread):
+    """Compute P(r) inversion outputs over a range of D_max in a background thread."""
+
+    def __init__(
+        self,
+        pr: Invertor,
+        dmin: float,
+        dmax: float,
+        npts: int,
+        error_func: Callable | None = None,
+        completefn: Callable | None = None,
+        updatefn: Callable | None = None,
+        yieldtime: float = 0.01,
+        worktime: float = 0.01,
+    ):
+        CalcThread.__init__(self, completefn, updatefn, yieldtime, worktime)
+        self.pr: Invertor = pr
+        self.dmin: float = dmin
+        self.dmax: float = dmax
+        self.npts: int = npts
+        self.error_func: Callable | None = error_func
+
+    def _update(self, results) -> None:
+        # The explorer keeps adding to results, so pass on a snapshot
+        if self.updatefn is not None:
+            self.updatefn(results=copy.deepcopy(results))
+
+    def compute(self) -> None:
+        """Invert the P(r) state at each D_max, reporting results as they arrive."""
+        try:
+            explorer = DistExplorer(self.pr)
+            results = explorer(self.dmin, self.dmax, self.npts,
+                               updatefn=self._update, isquit=self.isquit)
+            self.complete(results=results)
+        except KeyboardInterrupt:
+            # Thread was interrupted, just proceed
+            pass
+        except Exception:
+            if self.error_func is not None:
+                self.error_func("ExploreDmax.compute: %s" % sys.exc_info()[1])
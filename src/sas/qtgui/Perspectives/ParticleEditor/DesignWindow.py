@@ -8,6 +8,7 @@ from PySide6.QtWidgets import QSizePolicy, QSpacerItem
 
 from sas.qtgui.Perspectives.ParticleEditor.AngularSamplingMethodSelector import AngularSamplingMethodSelector
 from sas.qtgui.Perspectives.ParticleEditor.calculations.calculate import calculate_scattering
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import CalculationCancelled
 from sas.qtgui.Perspectives.ParticleEditor.CodeToolBar import CodeToolBar
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
     AngularDistribution,
@@ -345,8 +346,20 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
 
         if build_success:
             calc = self.scatteringCalculation()
+
+            progressDialog = QtWidgets.QProgressDialog("Calculating scattering...", "Cancel", 0, 100, self)
+            progressDialog.setWindowModality(Qt.WindowModal)
+            progressDialog.setMinimumDuration(500)
+
+            def progress(fraction):
+                progressDialog.setValue(int(100*fraction))
+                QtWidgets.QApplication.processEvents()
+
             try:
-                scattering_result = calculate_scattering(calc)
+                scattering_result = calculate_scattering(
+                    calc,
+                    progress=progress,
+                    cancelled=progressDialog.wasCanceled)
 
                 # Time estimates
                 self.last_calculation_time = scattering_result.calculation_time
@@ -358,9 +371,15 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
                 self.codeText("Scattering calculation complete after %g seconds."%scattering_result.calculation_time)
                 self.display_calculation_result(scattering_result)
 
+            except CalculationCancelled:
+                self.codeWarning("Scattering calculation cancelled")
+
             except Exception:
                 self.codeError(traceback.format_exc())
 
+            finally:
+                progressDialog.close()
+
 
         else:
             self.codeError("Build failed, scattering cancelled")
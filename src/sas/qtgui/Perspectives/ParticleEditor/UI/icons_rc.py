@@ -0,0 +1,1955 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00A\xcb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x03\xe8\x00\x00\x03\xe8\x08\x03\x00\x00\x00z}$\xd6\
+\x00\x00\x00\xb1PLTE\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00$\xdb\x02\xd2\x00\x00\x00\
+:tRNS\x00\x04\x07\x09\x0d\x11\x16\x1a\x1e!%\
+(,15;AGLRW]afkos\
+vz\x80\x83\x87\x8c\x92\x98\x9d\xa2\xa6\xac\xb2\xb7\xba\xbc\
+\xc0\xc5\xca\xd1\xd6\xda\xde\xe1\xe5\xe8\xeb\xef\xf3\xf7\xfb\xc5\
+\xe8`&\x00\x00@\x8fIDATx\x01\xec\xc1\x87\
+z\xf2H\xda-\xd0-D\xb2\x01\x93m0\x88\x1cM\
+4Q\xda\xf7\x7fa\xe7\x99\xd3\xfd\xf7\xf4t\x7f\xc1\xa6\
+JR\x95\xf4\xae\x05\x916N\xe5m\xbc:\x5c\xfc\xc0\
+\xbf\x1e7\xd3\xf7\xaa\x0b!D\xb2d_\x177\xfe/\
+\x7f\xd3-@\x08\x91\x18\x95\xd9\x9d?\x12\xac\x1a\x10B\
+$Bu\xcd\x9f;\xb4 \x84\xb0^a\xce_\xdb\xbd\
+@\x08a\xb7\xb7\x1b\x7f'\x18\xb9\x10B\xd8+\xb7\xe4\
+W\xec\x9f!\x84\xb0U\xe9\xc8\xaf\xb9\xd5!\x84\xb0\xd3\
+\xcb\x95_\x15\xbcB\x08a\xa3\xea\x9d\xdf\xd0\x81\x10\xc2\
+>\x95\x1b\xbf#hC\x08a\x9b\xc2\x99\xdf\xe3\xd7 \
+\x84\xb0Kf\xcb\xef\xba\x14!\x84\xb0\xca\x88\xdf\xb7q\
+ \x84\xb0H\x95\x8f\xe8A\x08a\x8f\xcc\x81\x8f\xb8?\
+A\x08a\x8dw>f\x01!\x84-\xb2W>\xe8\x05\
+B\x08K\xf4\xf9\xa8%\x84\x10v\xc8\x9c\xf9\xb0\x12\x84\
+\x10Vh\xf2q#\x08!\xac\xb0\xe4\xe3.\x0e\x84\x10\
+\x16\xc8\xfaTP\x83\x10\xc2\x02M\xaa\x18A\x08a\x81\
+\x09U\xec!\x84\xb0\xc0\x9e*\x82,\x84\x10\xc6\xcb\x04\
+TR\x85\x10\xc2xe\xaay\x83\x10\xc2x\x0d\xaa\x19\
+@\x08a\xbcW\xaa\x99B\x08a\xbc\x1e\xd5, \x84\
+0^\x9fjV\x10B\x18\xcf\xa3\x9a5\x84\x10\xc6\xf3\
+\xa8f\x0d!\x84\xf1<\xaaYC\x08a<\x8fj\xd6\
+\x10B\x18\xcf\xa3\x9a5\x84\x10\xc6\xf3\xa8f\x0d!\x84\
+\xf1<\xaaYC\x08a<\x8fj\xd6\x10B\x18\xcf\xa3\
+\x9a5\x84\x10\xc6\xf3\xa8f\x0d!\x84\xf1<\xaaYC\
+\x08a<\x8fj\xd6\x10B\x18\xcf\xa3\x9a5\x84\x10\xc6\
+\xf3\xa8f\x0d!\x84\xf1<\xaaYC\x08a<\x8fj\
+\xd6\x10B\x18\xcf\xa3\x9a5\x84\x10\xc6\xf3\xa8f\x0d!\
+\x84\xf1<\xaaYC\x08a<\x8fj\xd6\x10B\x18\xcf\
+\xa3\x9a5\x84\x10\xc6\xf3\xa8f\x0d!\x84\xf1<\xaaY\
+C\x08a<\x8fj\xd6\x10B\x18\xcf\xa3\x9a5\x84\x10\
+\xc6\xf3\xa8f\x0d!\x84\xf1<\xaaYC\x88\x04*\xd4\
+\xda\xbd\xc1p\xd8\xef4\xcb.\x12\xc0\xa3\x9a5\x84H\
+\x98rou\xe5\x7f\x05\xfbI+\x0b\xcbyT\xb3\x86\
+\x10IR\xe8\x1f\xf9o\xfe\xb2\xe9\xc0f\x1e\xd5\xac!\
+Dr\x94\xe7\x01\x7f\xe2\xdc\xcb\xc2^\x1e\xd5\xac!D\
+R<\xcd\xf9+\x97\x8e\x03[yT\xb3\x86\x10\xc9\xe0\
+\xf4}\xfe\xc6\xfe\x05\x96\xf2\xa8f\x0d!\x12\xe1y\xc7\
+\xdf\x0b<\x07V\xf2\xa8f\x0d!\x92\xa0y\xe3\x97|\
+\xe4a#\x8fj\xd6\xb0]\xb6\xd6\x9d\xacv\x87\xe3q\
+\xbf\x99y\xcd'\x88Tz\x0f\xf8E\x9f%X\xc8\xa3\
+\x9a5\xac\xf62\xd8\x05\xfc\x1f\xe7Y\xd3\x85H\x9b!\
+\xbf\xeeR\x86}<\xaaY\xc3^\xb9\xf7#\x7f\xe46\
+\xa9@\xa4\xca\x80\xdfq-\xc1:\x1e\xd5\xaca\xab\xfc\
+\xe8\xce\x9fZ\xbd@\xa4G\x87\xdfs*\xc06\x1e\xd5\
+\xaca'\xb7\x7f\xe7/-\x8a\x10)Q\x0b\xf8M\xbb\
+\x0c,\xe3Q\xcd\x1aV\xaa\x1e\xf8;\xf7\x0eD*\x14\
+\xae\xfc\xb61,\xe3Q\xcd\x1a6\xea\x07\xfc\x82u\x1e\
+\x22\x05V|@\x1dv\xf1\xa8f\x0d\xfbd\x97\xfc\x9a\
+S\x05\x22\xf1^\xf9\x88S\x16V\xf1\xa8f\x0d\xeb\xe4\
+\xf7\xfc\xaa{\x1d\x22\xe1\xb2\x17>d\x04\xabxT\xb3\
+\x86m\x0a\x07~\x9d\xdf\x80H\xb6!\x1f\xe3?\xc3&\
+\x1e\xd5\xaca\x99\xdc\x9e\xdf\xe1\xd7!\x92,\x7f\xe7\x83\
+\x96\xb0\x89G5k\xd8%\xb3\xe1\xf7\xdc\xca\x10\x09\xe6\
+\xf1auX\xc4\xa3\x9a5\xec2\xe6w\x1ds\x10\x89\
+\xe5\x9c\xf9\xb0\x83\x03{xT\xb3\x86UZ\xfc\xbe\x05\
+Db5\xa8\xa0\x0b{xT\xb3\x86M\xf2W>\xa0\
+\x0d\x91Ts*\xb8\xe5a\x0d\x8fj\xd6\xb0\xc9\x9c\x8f\
+\xb8\xe6 \x92\xc9\xb9Q\xc5\x04\xd6\xf0\xa8f\x0d\x8b\xd4\
+\xf8\x981D2U\xa9$(\xc3\x16\x1e\xd5\xaca\x0f\
+g\xcf\xc7\xf8O\x10\x89\xd4\xa7\x9a\x0f\xd8\xc2\xa3\x9a5\
+\xec\xf1\xc6GM \x12iAEMX\xc2\xa3\x9a5\
+\xac\x91\xbb\xf2Q~\x1e\x22\x89\x8eT\xf4\x99\x81\x1d<\
+\xaaY\xc3\x1a#>\xae\x07\x91@N@U}\xd8\xc1\
+\xa3\x9a5lQ\x0a\xf8\xb8=D\x02\x15\xa8\xec^\x80\
+\x15<\xaaY\xc3\x16+\xaa(A$O\x85\xeaf\xb0\
+\x82G5kX\xa2N%=\x88\xe4\xa9R\x83\x17\xd8\
+\xc0\xa3\x9a5\xec\xe0\x1c\xa8d\x05\x91<5j\xb0\x85\
+\x0d<\xaaY\xc3\x0e]\xaa\xb9A$O\x95:\xb4a\
+\x01\x8fj\xd6\xb0B\xfeFE\xcf\x10\x89S\xa1\x0eg\
+\x17\xe6\xf3\xa8f\x0d+L\xa8\xaa\x01\x918Ej1\
+\x80\xf9<\xaaY\xc3\x06\x95\x80\xaa\xba\x10\x89\xe3\x04\xd4\
+\xc1\x7f\x82\xf1<\xaaY\xc3\x06\x1b*\x1bB$\xcf\x91\
+Z,`<\x8fj\xd6\xb0@\x93\xea&\x10\xc9\xb3\xa0\
+\x1e5\x98\xce\xa3\x9a5\xcc\xe7~R\xdd\x0c\x22y\xfa\
+\xd4c\xef\xc0p\x1e\xd5\xaca\xbe>5\x98A$O\
+\x95\x9a\xbc\xc1p\x1e\xd5\xaca\xbc\xc2\x9d\x1aL!\x92\
+'s\xa3\x1e\xd7\x1c\xcc\xe6Q\xcd\x1a\xc6\x9bQ\x87\x11\
+D\x02\xcd\xa9\xc9\x08f\xf3\xa8f\x0d\xd3\xbdP\x8b\x1e\
+D\x025\xa8IP\x82\xd1<\xaaY\xc3t;j\xd1\
+\x82H \xe7LMV0\x9aG5k\x18\xaeM=\
+*\x10I\xe4Q\x97\x06L\xe6Q\xcd\x1af\xcb\x9e\xa9\
+\x85\x9f\x81H\xa2\xdc\x9d\x9a\x1c\x1c\x18\xcc\xa3\x9a5\xcc\
+6\xa4\x1e[\x88d\x1aP\x97.\x0c\xe6Q\xcd\x1aF\
+{\xf2\xa9\xc7\x10\x22\x99\xb2\x17jr\xcb\xc3\x5c\x1e\xd5\
+\xaca\xb4\x055\xa9B$\xd4+u\x99\xc0\x5c\x1e\xd5\
+\xaca\xb2\x1a59C$\xd6\x8e\x9a\x04\x15\x18\xcb\xa3\
+\x9a5\x0c\xe6\xec\xa9\xc9\x08\x22\xb1\xaa\xd4e\x03cy\
+T\xb3\x86\xc1:\xd4$x\x86H\xae9ui\xc2T\
+\x1e\xd5\xaca\xae\xdc\x95\x9a,!\x12\xacx\xa7&\x9f\
+.\x0c\xe5Q\xcd\x1a\xe6\x1aS\x97\x17\x88$\xf3\xa8K\
+\x1f\x86\xf2\xa8f\x0dc\x95\x02j\xb2\x80H4\xf7D\
+M\xee\x05\x98\xc9\xa3\x9a5\x8c\xb5\xa2&\xfe3D\xb2\
+\xb5\xa8\xcb\x0cf\xeaS\xcd\x12\xa6jP\x97\x11D\xd2\
+m\xa9\xcb\x0b\x8c\xd4\xa1\x9a9\x0c\x959R\x93K\x16\
+\x22\xe9*\x015\xd9\xc1H-\xaa\x19\xc3P\xef\xd4\xe5\
+\x0d\x22\xf9\xa6\xd4\xa5\x0d\x13U\xa9\xa6\x073\xe5o\xd4\
+d\x07\x91\x02\xf9\x1b59ga\xa0<\xd54a\xa6\
+)u\xa9B\xa4A\x8f\xba\x0ca\xa2+\x95<\xc3H\
+\x95\x80\x9a\xcc!R!s\xa4&\xfe\x13\x0c\xb4\xa2\x8a\
++\xcc\xb4\xa1&~\x11\x22\x1d\x1a\xd4e\x01\x03\xf5\xa8\
+b\x09#\xb5\xa8\x8b\x07\x91\x16k\xeaR\x83y*T\
+\xd1\x81\x89\xdc\x1359\xb9\x10iQ\x0e\xa8\xc9\xde\x81\
+y>\xf9\xb8\xa0\x00\x13y\xd4\xa5\x05\x91\x1ec\xea\xd2\
+\x81y\x86|\xdc\x06&*\xde\xa9\xc9\x16\x22ErW\
+jr\xcd\xc18\xcf|\x5c\x1b&\x9aS\x93\xe0\x05\x22\
+M:\xd4e\x0c\xf3\xac\xf8\xa8K\x06\x06\xaaR\x97)\
+D\xaa8{j\x12\x94`\x9c\x1a\x1f\xd5\x83\x89v\xd4\
+\xe4\x9e\x87H\x97\x1auY\xc1<\x1f|\xcc%\x0b\x03\
+\xbdR\x97\x1eD\xda,\xa8K\x03\xc6\xa9\x04|\xc8\x1b\
+\x0c\x94\xbdP\x93c\x06\x22m\x9e|jr\xcc\xc08\
+c>b\xe7\xc0@C\xea\xd2\x80H\x9f!uy\x87\
+q\xb2\x9f\xfc>\xbf\x0c\x03=\xfb\xd4d\x0d\x91B\xd9\
+35\xb9\xe5a\x9cj\xc0o\xeb\xc2DKj\x12\x94\
+!\xd2\xe8\x95\xbaLa\x9e.\xbfk\x0e\x13\xd5\xa9\xcb\
+\x18\x22\x9dv\xd4$\xa8\xc0<\x13~\xcf\xce\x85\x81\x9c\
+\x035\xb9\xe6 \xd2\xa9J]\xb60\x8f\xb3\xe0w\x1c\
+\xf20Q\x87\xbat \xd2jN]Z0Of\xc1\
+\xaf;\x14`\xa2\xdc\x95\x9a\x1c\x1c\x88\xb4*\xdc\xa9\xc9\
+\xc9\x85y\x9c\x09\xbfj\x9b\x83\x91\xc6\xd4\xa5\x0e\x91^\
+}\xea\xe2\xc1D\xdd\x80_2\xcd\xc0H\xe5\x80\x9a,\
+!R\xcc=Q\x93{\x11&\xaa~\xf2\xf7\xeem\x18\
+jMM\xfcg\x884kQ\x979\x8c\x94\x1d\x07\xfc\
+\x8d\xd5\x13\x0c\xd5\xa0.C\x88t\xdbP\x97*\xccT\
+\xd9\xf0W\x8eM\x98*s\xa4&\x97,D\xbaU\x02\
+j\xb2\x83\xa9jk\xfe\xcc\xbe\xed\xc0X=\xea\xf2\x0a\
+\x91v\x13\xea\xf2\x0ac\x95F'\xfe\xdbmV\x85\xc1\
+\xf2wj\xb2\x83H\xbd\xfc\x8d\x9a\x5c\xb20\xd8K\x7f\
+}\xe3\x7f\xf9\xdbQ-\x03\xa3M\xa9K\x15B\xbcS\
+\x97!\x0cW\xac\xb5\xdf\xbd\x81\xd7{\xad?;0\xdd\
+K@M\xe6\x10\x02\x99#5\xf1\x8b\x10\xdal\xa9\xc9\
+\xbd\x08!\x80\x06u\x99B\xe8\xd2\xa2.\x1e\x84\xf8\x8f\
+\x155\xf1\x8b\x10z\xb8'jrr!\xc4\x7f\x94\x02\
+j2\x84\xd0\xc3\xa3.-\x08\xf1\x87\x115\xb98\x10\
+:\x14}j\xb2\x81\x10\x7f\xca]\xa9I\x1dB\x879\
+5\x09*\x10\xe2\xff\xbcQ\x93\x09\x84\x06U\xea2\x85\
+\x10\x7fq\xf6\xd4\xe3\x04\xa1\xc1\x96\x9a\xdc\xf2\x10\xe2\xbf\
+j\xd4\xe4\x09BY\x9d\xba\xbcC\x88\xbf[P\x8f\x16\
+\x84\xb2\x0fjr\xcc@\x88\xbf{\xf2\xa9\xc5\x10BU\
+\x99\xba4 \xc4\xff\x1aP\x8b\x05\x84\xaa\x115YA\
+\x88\x7f\xc8\x9e\xa9\xc3\x0eB\xd5\x89z\x04%\x08\xf1O\
+m\xeap\x82PT\xa1&c\x08\xf1o;jp\x83\
+P\xd4\xa3\x1e\xd7\x1c\x84\xf8\xb7\x17j\xe0C(ZQ\
+\x8f\x0e\x84\xf8\x91\x19\xd5\xdd!\x14]\xa8\xc5\xde\x81\x10\
+?R\xb8S\xd9\x15BM\x9ez\xd4 \xc4\x8f\xf5\xa9\
+\xec\x00\xa1\xa6J-\x16\x10\xe2'\xdcO\xaa\xda@\xa8\
+iR\x07\xff\x09B\xfcL\x93\xaa\xa6\x10j\xde\xa8\xc3\
+\x10B\xfc\xdc\x07\x15u!\xd4t\xa9\xc19\x0b!~\
+\xae\x12PM\x0dB\xcd;5hC\x88_\x99P\x89\
+\xefB\xa8\xe9R\xdd\x0eB\xfcR\xfeF\x15\x1b\x08E\
+\xafTW\x85\x10\xbf\xd6\xa5\x8aw\x08E\x0d*\x9bA\
+\x88\xdfp\x0e|\x5cP\x84PT\xa1\xaa{\x01B\xfc\
+N\x9d\x8f[C\xa8r\x03*\xeaC\x88\xdf[\xf2a\
+M\x08eG\xaa\xf9t!\xc4\xef=\xfb|\xd0\xd1\x81\
+P6\xa3\x9a\x16\x84\xf8\x8a\x11\x1f\xd4\x86P\xf7F%\
+\x1b\x08\xf1%\xd9\x0b\x1f\xb2w \xd4\x15\xa9\x22\xa8@\
+\x88\xafi\xf3!5\x08\x1dvT0\x81\x10_\xb5\xe6\
+\x03\xa6\x10Z\xbc\xf3q\xb7<\x84\xf8\xaa\xe2\x8d\xdf\xf6\
+\x99\x85\xd0\x22\xef\xf3a\xef\x10\xe2\xeb\x1a\xfc.\xff\x05\
+B\x93\x19\x1fu\xcc@\x88o\xe8\xf3\x9b\xda\x10\xba\x94\
+\x03>\xa8\x01!\xbee\xc2o\xe9A\xe83\xe7cV\
+\x10\xe2{\x9c\x19\xbf\xc1\x83\xd0\xa8\xe8\xf3\x11~\x09B\
+|\xd7\x98_\xf6\x0e\xa1U\x9f\x8f\x18@\x88\xef\xeb\x06\
+\xfc\x92{\x13B/g\xc7\xef;\xb8\x10\xe2\x01\xb5\x13\
+\xbf\xe0P\x82\xd0\xadt\xe7w\xf9e\x08\xf1\x90\xdc\x8c\
+\xbf\x13\x8c\x5c\x08\xfd\x9a\xfc\xae6\x84xT\xed\xc0_\
+\xdaT B\xd1\xe7\xf7\x0c!\xc4\xe3\x9c\xf6\x81?\xb5\
+m@\x84e\xc4\xef\x98@\x085\xf5\x85\xcf\x1f\xb8\xcf\
+\xaa\x10!\x1a\xf1\xeb&\x10BY\xeeuq\xe1\xff8\
+\xcf\x9aY\x88p\xf5\x02~\x91\x07!\xf4xjy\xd3\
+\xd5v\xb7\xdb,'\xfdf\x11\x22\x02\xcd\x1b\xbf\xe2\xde\
+\x82\x10\xc2^O[\xfe\xde\xae\x04!\x84\xcd\x9c\xee\x8d\
+\xbfv\xef9\x10BX.?\x09\xf8s\xc1\xb4\x00!\
+D\x02<\x8d\xef\xfc\xb1\xfb\xe4\x19B\x88\x84\xc8\xbe~\
+\x04\xfc\xa7`\xf3\x96\x85\x10\x22Ir\xcd\xf1\xf6\xce\xff\
+s\xdf\x8e[9\x08!\x92\xa8\xf0\xd2h\xb5Z\xf5\x97\
+\x02\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\
+\x84\x10B\x08!\x84\x10B\x08!\x84\x10BX\xc7-\
+\x94\xab\x8dv\xe7\xdd\x1b\x8e\xa7\xf3\xc5r\xb5\xfe\xd8l\
+\xb6\xdb\xcd\xe6c\xbdZ.\xe6\xd3\xf1\xd0{\xef\xb4\x1b\
+\xd5r\xc1\x85\x10\xc2*\xd9R\xbd\xfd>\x9a\xad\xf6g\
+\x9f_\xe6\x9f\xf7\xab\xd9\xe8\xbd]/e!\x840W\
+\xb6\xd2\xea\x8d\x97\xfb+\x15]\xf7\xcbq\xafU\xc9B\
+\x08a\x10\xa7\xd4\xf2f\xdb\x0b5\xbblg^\xab\xe4\
+@\x08\x11/\xa7\xd4\xf2\x16\x87\x80!\x0a\x0e\x0b\xafU\
+r \x84\x88\x81\xfb\xf26\xde\xde\x19\x91\xfbv\xfc\xf6\
+\xe2B\x08\x11\x9d\xe7\xf6x\x170r\xc1n\xdc~\x86\
+\x10\x22tn\xcd[]\x19\xa3\xeb\xca\xab\xb9\x10B\x84\
+%[\x1fl}\x1a\xc0\xdf\x0e\xeaY\x08!t\xcb\xd4\
+\x06\xbb\x80\x06\x09v\x83Z\x06B\x08mJ\xdd\xd5\x9d\
+\x06\xba\xaf\xba%\x08!\xd4\xb9\x8d\xc9\x89\x06;M\x1a\
+.\x84\x10\x0a\x0ao\xcb;\x8dw_\xbe\x15 \x84x\
+H\xa9\xbf\xa35v\xfd\x12\x84\x10\xdfT\xf6\xf6\xb4\xcc\
+\xde+C\xa4\xd0s\xa3;\x9c\xccf\xd3Q\xafU\xc9\
+@|]yp\xa4\x95\x8e\x832D\x9a\x94\xdeW7\
+\xfe\x8d\xbf\x1bV\x1d\x88/(\xf6\xf6\xb4\xd8\xbeW\x84\
+H\x87|o\xcf\x1f8\x8f\x9e!~-\xf7\xb6\xa5\xf5\
+\xb6o9\x88\xc4{\x9a\xf8\xfc\x89`\xf9\x02\xf1s\xf5\
+\xb9\xcfD\xf0\xe7u\x88D\xcb\x8d}\xfe\xca\xe2\x19\xe2\
+\x87\x9e\x07'&\xc8i\xf0\x0c\x91X\xed+\x7f\xc3\x1f\
+e!\xfe\xc9im\x988\x9b\x96\x03\x91D\xb9\x05\xbf\
+\xe0\xf2\xe6@\xfc]qpa\x22]\x06E\x88\xc4)\
+\x1f\xf95\xfb*\xc4_\xea\xcb\x80\x89\x15,\xeb\x10\xc9\
+R\xbb\xf1\xcb\xe6E\x88\xffp\xdf\x0eL\xb8\xc3\x9b\x0b\
+\x91\x1c\x0d\x9f\xdf\xe0{.Dqxe\x0a\x5c\x87E\
+\x88\x84\xa8\xfb\xfc\x9eS\x0b)\xf72\x0f\x98\x12\xc1\xfc\
+\x05\x22\x09*w~\xdb\xf6\x05)V\xdf0U6u\
+\x88\x9fq\x8a\x95j\xadZ)80\x5c\xfe\xc4\x07\x04\
+\xd3<\xd2\xc9i\xed\x99:\xfb\x96\x03\xf1ON\xb5\xbf\
+<\x06\xfcCp\x5c\xf4\xab\x0e\xcc\xb5\xe6cn\xbd\x0c\
+\xd2'\xd3\xf9d*}v2\x10\x7f\xe34\xe67\xfe\
+\xd3m\xdep`\xa6\x0e\x1fvl e\xdc\xce\x89\xa9\
+u\xea\xb8\x10\x7f\xca\xf5\xcf\xfc\xb1\xb3\x97\x87\x81\x8aw\
+*X\x97\x91\x22n\xe7\xccT;w\x5c\x08\x00\xd9\xc1\
+\x9d?w\x1ffa\x9c\x05\x95\x04\xe3\x1cR\x22\xd3=\
+3\xf5\xce\xdd\x0c\xc4\xdb\x85\xbfvi\xc30/Tu\
+\xed:H\x01\xe7\xf5DA\xf2\xf4\xea \xdd\xaa{\xfe\
+\xde\xaa\x00\xa3\xac\xa8\xeePG\xe25\x0f\x14\x7f:4\
+\x91b\xc59\xbf\xe4R\x83A\xca\xd4b\xf9\x8cD\xab\
+m)\xfef[CJ\xb9\x9e\xcf/\x0a:0\xc7\x84\
+z\xf8\xc3,\x12\xab\xb4\xa4\xf8\x87e\x09i\xd4:\xf1\
+\x1b\x060\x85{\xa3.\x97W$S~\x12P\xfcK\
+0\xc9#m^\xb6\xfc\x9e!\x0c\xd1\xa4F\xbb*\x92\
+\xc7\xed\xdf(~\xe8\xd6s\x91&\xf9i\xc0\xefz\x87\
+\x19f\xd4j^D\xc24O\x14?uj\x2252\
+\xbd\x1b\xbf/h\xc0\x08g\xeau\xf7\x5c$H\xe9\x83\
+\xe2\x97>JH\x87\xc6\x91\x0f\xb9=\xc3\x00O\xd4\xee\
+\xd4BRdG\x01\xc5o\x04\xa3,\x92\xaf\xbc\xe6\xa3\
+v\x0e\xe2\xd7b\x08\xb6\x15$B\xfbB\xf1\x05\x976\
+\x12.7\x0e\xf8\xb8\x1e\xe2\xe71\x0c\xc14\x0f\xeb\x95\
+6\x14_\xb4)!\xc1\x9c\xce\x95*\xeeO\x88\xdd\x8c\
+\xe1\xb8\xf52\xb0Z\xc6\xf3)\xbe\xcc\xf72H\xaa\xfa\
+\x81\x8a\xe6\x88\xdd\x07\xc3rl\xc0b\xb5#\xc5\xb7\x1c\
+kH\xa4\xe7%\xd5U\x10\xb7=\xc3\xb3.\xc1R\xb9\
+\x19\xc5\xb7\xcdrH\x9c\xec\xd0\xa7\x06s\xc4\xed\xc8\x10\
+\x05\xe3\x1cl\xd4\xbcP<\xe0\xd2D\xc2\xbc^\xa8E\
+P@\xcc>\x19\xaak\xc7\x81m\xf2s\x8a\x07\xcd\xf3\
+H\x90\xea\x8e\xba\xf4\x11\xb3\x03C\xb6\xaf\xc1.\xad+\
+\xc5\xc3\xae-$EqN}\x0e\x88\xd9\x8e\xa1[<\
+\xc1\x1e\xf9\x05\x85\x92E\x1eI\xe0zw\xeaTF\xbc\
+\x96\x0c\x9f?\xc8\xc2\x12\x8d\x0b\x85\xa2K\x03\xf6k\x9d\
+\xa8W\x0f\xf1\x9a0\x0a\xe7W\xd8 ;\xa1\xd0`\x92\
+\x85\xdd*\x1b\xea\xb6B\xbc\xba\x8c\xc6\xae\x0a\xe3U\x8f\
+\x14Z\x1c\xab\xb0X~\x12P\xbb+\xe2UcT\xe6\
+\x05\x18\xcd\xf1\x02\x0aM\x02\xcf\x81\xa52\xbd\x1b\xc3P\
+@\xac\xb2\x01\xa3r\xf7\x5c\x98\xab\xb8\xa1\xd0hS\x84\
+\x95\x1aG\x86\xa3\x86x\xed\x18\x9dS\x0b\xa6j^)\
+\xb4\xba6a\x9f\xd2\x9aayE\xbc\x06\x8c\xd2\xa6\x02\
+\x13\xb9c\x0a\xed\xc6.\xec\x92\x1b\x07\x0cM\x0f\xf1z\
+a\xa4\x82I\x1e\xc6y\xdeS\x84`\xff\x0c\x8b8\x9d\
++C4@\xcc\x8e\x8c\xd6\xed\xdd\x81Y\x9a7\x8aP\
+\xdc\x9a\xb0Fm\xcfP\x8d\x10\xb3wF\xed\xd0\x80A\
+\x9c\x11EhF\x0e\xac\xf0\xb4`\xc8\x86\x88Y\xee\xce\
+\xc8\xadJ0EaK\x11\xa2m\x01\xe6\xcb\x0e|\x86\
+\xcdC\xdcF\x8c\x9e?\xc8\xc0\x08\xb5+M\x17\x5c\x8f\
+\xbb\xcdj1\x9b\x8cG\xa3\xe1\xc0\xf3\x06\xc3\xd1h<\
+\x99-V\x9b\xdd\xf1\x1a\xd0t\xd7\x1aL\xd7>3|\
+\x1d\xc4-\x7fg\x0c\xf6e\x18\xa0\x1b\xd0L\xf7\xc3j\
+:\xec\xb6j\xe5B\x16\xbf\x94-\x94k\xad\xeep\xba\
+:\xdci\xa6\xa0\x0b\xa3\xbd\xec\x18\x85&b\xd7g\x1c\
+\xeem\xc4\xcd\x9d\xd14\xfea9\xea4\xca9< \
+WntF\xcb\x83O\xd3\xcc\x5c\x18\xab0c4*\
+\x88]\xe6\xc0X\x0c\x10\xaf\xc2\x8e\x06\xb9\xef\xa6\xbdF\
+\x11\x1a\x14\x1b\xbd\xe9\xeeN\x83\xec\x0a0\x93\xeb\xdd\x19\
+\x8d\xc0E\xfc\xaa\x01c1A\x9c\xaa\x17\x1a\xe2\xbc\x1c\
+4\x9f\xa1\xd9ss\xb0<\xd3\x10\x97*L\xd4:1\
+*{\x98\xa0\xcfxL\x10\x9f\xb6O\x03\xdc7\xc3f\
+\x1e\xa1\xc97\x87\x9b;\x0d\xe0\xb7a\x9c\xca\x86\xd1\x99\
+\xc0\x08K\xc6c\x80\xb8\x0c\x18\xbb\xcb\xbcSq\x10:\
+\xa7\xd2\x99_\x18\xbb\x01\xcc\x92\x9f\x04\x8cP\x13F\xc8\
+\xee\x19\x8f\x16b\xe1.\x18\xaf\xcb\xfc\xad\x84\x08\x95\xde\
+\xe6\x17\xc6k\xe1\xc2\x1c\xce\xfb\x8dQ\xf2\xb30C\xfe\
+\xc0X\xdcK\x88Aa\xc7\x18\xf9\xeb^\x051\xa8\xf4\
+\xd6>c\xb4+\xc0\x14\x8d\x03\xa3\xb5\x84)\x0a{\xc6\
+b\xe7 r\xe5\x13cs\x1a7\x5c\xc4\xc6m\x8cO\
+\x8c\xcd\xa9\x0c#\x94V\x8cZ\x13\xc6\xc8m\x18\x8b>\
+\xa2V\xbb1&\xdb~\x19\xb1+\xf7\xb7\x8c\xc9\xad\x86\
+\xf8\xe5F\x01\xa3vr`\x8e\xcc\x84q\xb8\x17\x11\xad\
+\x96\xcf8\x04\x9bn\x01\x86(t7\x01\xe3\xe0\xb7\x10\
+\xb7\xd7+\xa3\xf7\x0e\xa34\xaf\x8c\xc1\x14\x91z\x0f\x18\
+\x83\xcd[\x1eF\xc9\xbfm\x18\x83\xe0\x1d\xb1*|0\
+\x06\x97,\xcc\x92\x9f3z\xc13\x224f\xf4\xf6\xbd\
+\x22\x0cT\xec\xed\x19\xbd1b\xd4\xb82\x0e\x1d\x18\xa7\
+\xb6g\xe4&\x88\x8c3c\xd4.\xa32\x8cU\x1e]\
+\x18\xb5\x99\x83\xb8\xf4\x19\x8b\xbd\x03\xf38oWF\xec\
+\x9eED\xdc%\xa3\x15,\x9a\x0e\x8c\xe64\x17\x01\xa3\
+\xb5t\x11\x0bg\xc2X\x04/0Rn\x140Zo\
+\x88F\xf6\x83\x91\xfa\xec\xe5a\x81|\xef\x93\x91\xfa\xc8\
+\x22\x0e3\xc6\xc3\x83\xa9J+Fj\x83H\xe4v\x8c\
+P\xb0l\xc0\x1a\x8de\xc0\x08\xedr\x88\xde\x98\xf1\xd8\
+80W\xe3\xc0\x08\x059D\xa0p`t\xae\xc3\x22\
+\xacR\x1c^\x19\x9dC\x01Q\xeb2\x1e\x9fy\x98\xcc\
+y\xbf1:-\x84\xafpdd\x0eo.\xac\xe3\xbe\
+\x1d\x18\x99c\x01\xd1\xaa\x05\x8c\xc5\xe5\x19\x86\xcbO\x02\
+Fe\x8c\xd0\x15?\x19\x95M\x1d\x96\xaao\x18\x95c\
+\x11Q\xca\x9d\x19\x8bk\x19\xe6\xabl\x18\x91-\xc2\xf6\
+tb4\x82\xc5\x0b,\xf6\xb2\x08\x18\x8d\xd3\x13\x224\
+c,N%X\xa1ub$\xee\x08Y\xe9\xccH\xf8\
+\xd3\x12,W\x9a\xfa\x8c\xc4\xb9\x84\xc8\xd4\x18\x8b]\x01\
+\x96p\xbd;\xa3P@\xa8JgF\xc1\x9f\x14\x91\x00\
+\xc5\x89\xcf(\x9c\x9f\x11\x11g\xcf8\x8c3\xb0Ga\
+\xce\x08\xbc LOgF\xc0\x9f\x14\x91\x10\xc5\x89\xcf\
+\x08\x9c\x9f\x10\x8d6cp\xaa\xc3./;\x86\xae\x8e\
+\x10=\x9d\x18\xbe`ZD\x82\x14\xa7\x01\xc3wzB\
+$\x0e\x8c\x5c0\xca\xc2:\xed3C\xd6Bx\x8a\x9f\
+\x0c\xdf\xa2\x84\x84)-\x18\xbe\xcf\x22\x22Pg\xe4V\
+%\xd8(;\xf0\x19\xaa\x16BS82t\xeb\x0a\x12\
+\xa8\xb2f\xe8\x8e\x05\x84o\xc1\x88\x1d\xea\xb0\xd5\xd3\x82\
+aj!,\xf9\x03\xc3\xb6\xaf#\xa1\xea{\x86\xed\x90\
+G\xd8r>#u{w`\xb1\xda\x9e\xe1\xa9#$\
+\xd9\x1dCvys\x90X\xce\xdb\x85!\xdbe\x11\xb2\
+WF)\x18\xe7a7\xa7seX^\x10\x0ew\xc3\
+p\xf9\x83,\x12-;\xf0\x19\xae\x8d\x8bp\xcd\x19\xa1\
+\x8f2\xec\x97\x1b\x07\x0cG\x01\xa1p\x96\x0c\xd7\xf2\x19\
+\x89\xf7\xbcd\xb8\x96\x0eBued>\x9bH\x86\xd2\
+\x9aa\xb8#\x1c3\x86\xea\xd8@*4\x8e\x0c\xd5\x0c\
+azfT\xee}\x17\x89\xd18R\xbf-B1b\
+\x98|/\x83\x94\xc8x>\xc34B\x88Z\x8c\xc8\xac\
+\x80$\xc9\xf4n\xd4m\x8c0t\x19\xa6\x8f\x12R\xa4\
+\xf4\xc10u\x11\x9e>#\xb1{A\xd2\xe4\xa7\x01\xf5\
+j\x22\x04\xad\x80\xe1\xb9\xbe\x22e^\xaf\x0cO\xd0B\
+h\xa6\x8c\xc0\xb9\x8d$\xaal\xa8S\x90\x83~5\x9f\
+\xe1\x99\xe7\x91:\xf99\xc3\xe3\xd7\x10\x96%C\xe7\x0f\
+\xb2H\xa8\xd6\x89\xfa|@\xbf\xf2\x8d\xa197\x91J\
+\xcd3Cs+#$[\x86m\xf1\x84\xe4r\xbd;\
+uy\x85v\x85\x13C3\xcb!\xa5r3\x86\xe6T\
+@8v\x0c\xd7\xbe\x86d+\xce\xa9\xc7=\x0b\xdd\xdc\
+\x1d\xc3ri \xc5\x1a\x17\x86e\xe7\x22\x14;\x86\xe9\
+\xdaq\x90x\xd5\x1du\x18C\xbb\x05\xc3\xb2\xcc#\xd5\
+\xf2K\x86e\x81Pl\x18\x9e`\x94C*\xbc^\xa8\
+,x\x82n\x03\x86\xe4\xfe\x86\xd4{\xbb3$\x03\x84\
+a\xc9\xd0\xacJH\x8b\xec\xd0\xa7\xa2\x09tk3$\
+\xbb'\x08<\xed\x18\x926B0aH\x0e\x0d\xa4\xc9\
+\xf3\x92JnyhV\xf5\x19\x8a`\xe8@\x00p\x86\
+\x01C\xe1W\xa1_\x9f\xa1\xb8\xbd;H\x99\xfa\x81\x0a\
+\xba\xd0\xacxa(\xce5\x88?\xd5\xcf\x0c\xc5\xa5\x00\
+\xed\x9a\x0cA0\xc9#}\x9c\xee\x95\x8f\xda:\xd0\xcb\
+\xdd1\x14\xeb<\xc4_\xf2k\x86b\xe7B\xb7\x22\xf5\
+\xdbT\x90N\xb9q\xc0\x87\xdc\x9e\xa0\xd9\x8ca\x08<\
+\x07\xe2o\x1c/`\x18f\xd0\xeeL\xcdN-\xa4W\
+y\xcd\x07\x04Mh\xd6e\x18\xaeu\x88\x7f\xa8_\x19\
+\x86.t\x9bQ\xab\xbb\xe7\x22\xd5\x1aG~[\x0f\x9a\
+\xd5\x02\x86`W\x84\xf8\x97\xe2\x8e!\x08j\xd0\xacE\
+\x9d\xe6\x05\xa4]\xa6w\xe3\xf7\x8c\xa1Y\xe1\xca\x10L\
+]\x88\x1fp\xa7\x0c\xc1\xb5\x00\xbd\xb2wj\xb3\xabB\
+\x00\xf9i\xc0o\x18A3gK\xfd\x82.\xc4Ot\
+\x03\xea\xb7u\xa0\xd7\x8c\x9a\x9c_!\xfe\xf0\xb2\xe5\x97\
+\xf5\xa1\xdb\x88\xfa]k\x10?U\xbbR\xbf\x11\xf4\xaa\
+R\x0b\x7f\x90\x85\xf8K\xeb\xc4/\xb97\xa1[\x93\xfa\
+\x1d\x9e ~\xe1\xe9@\xfd\x9a\xd0kK\x0d\x16O\x10\
+\x7f\xe7z>\x7foW\x82n\xcf7j\xb7\xcaB\xfc\
+RvE\xedn\xcf\xd0\xaaAe\xfb\x1a\xc4?\x15\xe7\
+\xfc\x0d\xbf\xef@7wO\xed\xc6\x0e\xc4o8cj\
+\xb7w\xa1\xd5\x86j\xae\x1d\x07\xe2\x07\xaa[\xfeB0\
+/B\xbf\x09u\x0b:\x10_\xd0\x09\xa8\xdb\x04ZU\
+\x02*\x08\xc69\x88\x9f\xa8\x7f\xf0'\xfci\x09!h\
+R7\xbf\x09\xf1%M\x9f\xba5\xa1\xd5\x88\x8f[\x97\
+ ~\xa1<<\xf1\xdfv\xefy\x84\xa1x\xa5f\xd7\
+*\xc4\x17U\xaf\xd4\xecZ\x84N\xee\x9e\x0f:6 \
+~\xa7\xd2[^\xf8\x97\xe08\x7f+\x22\x1c\xce\x96\x9a\
+}\x96 \xbe\xac\xf4I\xcd\xb6\x0et*\xdd\xf9\x88[\
+/\x03\xf1%\xf9\x97\xe6[\xf7\xbd\xfb\xda\xa8\xb8\x08\xcf\
+\x80\x9a\xed\x0b\x10\xdfP\xd8S\xb3\x01\xb4j\x06\xfc\xb6\
+`\x9a\x870I5\xa0^\xdb\x1c\xc4\xb7\xe4\xb6\xd4+\
+\xa8B\xabw~\xd7\xb6\x02a\x94\xec'\xf5Zg!\
+\xbe)\xbb\xa6^\x9fYh\xe5\xf1[N-\x08\xc3L\
+\xa9\xd7\x22\x03\xf1m\x99\x05\xf5\x9aB\xaf\x1e\xbf\xee\xee\
+\xb9\x10\x86iP\xaf\xb9\x03\xf1\x00gN\xbd\x1a\xd0\xab\
+\xed\xf3\x8b\xe6E\x08\xd3\xe4/\xd4j\xe6@<\xc4\x99\
+Q\xabK\x1ezU\x8e\xfc\x8a]\x15\xc2<\x0bj5\
+\x85x\xd8\x94Z-\xa0Yv\xca\xdf\xba\xbcB\x18\xa8\
+E\xad&\x10\x0a&\xd4\xaa\x05\xddj{\xfe\x92?\xcc\
+B\x18(\x7f\xa5NS\x08%S\xeat\xcdC7\xe7\
+\xf5\xc8\x9f\x0a\xa6O\x10FZP\xa7\x19\x84\xa2\x19u\
+Z@?\xa7\xb9\x0e\xf8#\x97A\x11\xc2LM\xea4\
+w \x149s\xea\xd4D\x18\x8a\xdd\x0f\x9f\xff\xeb4\
+\xa9;\x10\x86\xca]\xa8\xd1\xc2\x81P\xe6,\xa8\xd1%\
+\x87p\xb8\xb5\xf7\xe9\xc7\xf1z\xf7\xef\xe7\xfdr\xd4z\
+\x860\xd8\x8c\x1a}d 4\xc8|P\xa3\x19D\xea\
+\xd5\xa8\xd16\x0b\xa1EvK\x8dj\x10)\xe7\x1e\xa9\
+\xcf>\x07\xa1InO}\x8e.D\xba\x0d\xa8\xcfg\
+\x01B\x9b\xc2'\xf5\x19@\xa4Z\xc9\xa76\xd7\x12\x84\
+F\xa5+\xb5\xf1K\x10i\xb6\xa16~\x15B\xab\xaa\
+Om6\x10)\xf6Jm\x82&\x84f\xcd\x80\xda\xbc\
+B\xa4V\xf6Bm:\x10\xdau\xa8\xcd%\x0b\x91V\
+#j3\x86\x08\xc1\x98\xda\x8c R\xaa\x14P\x97\x95\
+\x03\x11\x02gE]\x82\x12D:}P\x97C\x16\x22\
+\x14\xd9\x03u\xf9\x80H\xa5&u\xb9>A\x84\xe4\xe9\
+J]\x9a\x10)\xe4\x9e\xa8IP\x83\x08M-\xa0&\
+'\x17\x22}z\xd4\xa5\x0b\x11\xa2.u\xe9A\xa4N\
+\xfeFM\xa6\x10\xa1\x9aR\x93[\x1e\x22m&\xd4d\
+\xe7B\x84\xca\xddQ\x93\x09D\xca\x94\x02\xeaq-B\
+\x84\xacx\xa5\x1eA\x09\x22]V\xd4#\xa8C\x84\xae\
+\x1eP\x8f\x15D\xaa\xd4\xa8\xc9\x00\x22\x02\x03jR\x83\
+H\x93\x1d\xf5X;\x10\x11p\xd6\xd4c\x07\x91\x22M\
+\xeaq\xceCD\x22\x7f\xa6\x1eM\x88\xd4p\x0e\xd4\x22\
+\xa8CD\xa4\x1eP\x8b\x83\x03\x91\x16m\xea1\x84\x88\
+\xcc\x90z\xb4!R\x22\xf3I-\xb6\x0eDd\x9c\x1d\
+\xb5\xf8\xcc@\xa4C\x87Z\xdc\x9e \x22\xf4t\xa3\x16\
+\x1d\x88Tp\xcf\xd4\xe2\x15\x22R\xaf\xd4\xe2\xecB\xa4\
+A\x87Z, \x22\xb6\xa0\x16\x1d\x88\x14\xc8\x9c\xa8\xc3\
+%\x0f\x11\xb1\xfc\x85:\x9c2\x10\xc9\xd7\xa1\x16\x0d\x88\
+\xc85\xa8E\x07\x22\xf12'\xea0\x83\x88\xc1\x8c:\
+\x9c2\x10I\xf7F\x1d\xce9\x88\x18\xe4\xce\xd4\xe1\x0d\
+\x22\xe1\x9cO\xea\xd0\x80\x88E\x83:|:\x10\xc9\xd6\
+\xa2\x0es\x88\x98\xcc\xa9C\x0b\x22\xd9\xf6\xd4\xe0\x9a\x87\
+\x88I\xfeJ\x0d\xf6\x10\x89V\xa7\x0em\x88\xd8\xb4\xa9\
+C\x1d\x22\xc96\xd4\xe0\x03\x22F\x1f\xd4`\x03\x91`\
+/\xd4\xc0/A\xc4\xa8\xe4S\x83\x17\x88\xe4ZP\x03\
+\x0f\x22V\x1e5X@$V1\xa0\xbac\x06\x22V\
+\x99#\xd5\x05E\x88\xa4\x1aQ\x83\x06D\xcc\x1a\xd4`\
+\x04\x91P\xd9\x1b\xd5-!b\xb7\xa4\xba[\x16\x22\x99\
+:T\xe7?C\xc4\xee\xd9\xa7\xba\x0eD2\x1d\xa9n\
+\x08a\x80!\xd5\x1d!\x12\xa9Au\x97,\x84\x01\xb2\
+\x17\xaa\xabC$\xd1\x92\xea\xde \x8c\xf0FuK\x88\
+\x04*\x06Tvp \x8c\xe0\x1c\xa8,(B$\xcf\
+\x80\xea\xea\x10\x86\xa8S\xdd\x00\x22q\x9c\x0b\x95\xad!\
+\x8c\xb1\xa6\xb2\x8b\x03\x914-\xaa{\x810\xc6\x0b\xd5\
+\xb5 \x92\xe6\x83\xca\x16\x10\x06YP\xd9\x07D\xc2<\
+QYP\x820H)\xa0\xb2'\x88d\x19P\xd9\x14\
+\xc2(S*\x1b@$\xcb\x89\xaa\xfc\x22\x84Q\x8a>\
+U\x9d \x12\xa5Ne\x13\x08\xc3L\xa8\xac\x0e\x91$\
+s\xaa\xf2\x8b\x10\x86)\xfaT5\x87H\x90\x9cOU\
+\x13\x08\xe3L\xa8\xca\xcfA$\xc7\x1bU\x05O\x10\xc6\
+y\x0a\xa8\xea\x0d\x2296T5\x850\xd0\x94\xaa6\
+\x10\x89Q\x0c\xa8((A\x18\xa8\x14PQP\x84H\
+\x8a\x1eU- \x8c\xb4\xa0\xaa\x1eDR\xec\xa9\xea\x05\
+\xc2H/T\xb5\x87H\x882Um \x0c\xb5\xa1\xaa\
+2D2\x0c\xa8\xaa\x01a\xa8\x06U\x0d \x92\xe1H\
+E\x07\x08c\x1d\xa8\xe8\x08\x91\x08\x15\xaa\xea@\x18\xab\
+CU\x15\x88$\x18P\xd1\xcd\x850\x96{\xa3\xa2\x01\
+D\x12\x1c\xa8h\x08a\xb0!\x15\x1d \x12\xa0DE\
+A\x11\xc2`\xc5\x80\x8aJ\x10\xf6\xebS\xd1\x12\xc2h\
+K*\xeaC\xd8oOE\x0d\x08\xa35\xa8h\x0fa\
+\xbd\x22\x15}B\x18\xee\x93\x8a\x8a\x10\xb6\xebPQ\x1f\
+\xc2p}*\xea@\xd8nE5A\x1e\xc2p\xf9\x80\
+jV\x10\x96s}\xaaYB\x18oI5\xbe\x0ba\
+\xb7\x06\x155!\x8c\xd7\xa4\xa2\x06\x84\xdd&Tsq\
+ \x8c\xe7\x5c\xa8f\x02a\xb7\x13\xd5\x8c ,0\xa2\
+\x9a\x13\x84\xd5\xcaTT\x86\xb0@\x99\x8a\xca\x106\xeb\
+R\xcd\x1e\xc2\x0a{\xaa\xe9B\xd8lE5=\x08+\
+\xf4\xa8f\x05a\xb1\xcc\x9dj\x8a\x10V(R\xcd=\
+\x03a\xaf\x1a\xd5l!,\xb1\xa5\x9a\x1a\x84\xbd\x06T\
+\xd3\x81\xb0D\x87j\x06\x10\xf6\xdaQI\x90\x87\xb0D\
+>\xa0\x92\x1d\x84\xb5\xb2\x01\x95l \xac\xb1\xa1\x92 \
+\x0ba\xab:\xd5t!\xac\xd1\xa5\x9a:\x84\xad\x06T\
+S\x80\xb0F\x81j\x06\x10\xb6\xdaR\xc9\x0e\xc2\x22;\
+*\xd9BX\xca\xf5\xa9\xa4\x0fa\x91>\x95\xf8.\x84\
+\x9djTS\x86\xb0H\x99jj\x10v\xeaS\xc9\x09\
+\xc2*'*\xe9C\xd8iE%c\x08\xab\x8c\xa9d\
+\x09a\xa7+\x95\xd4!\xacR\xa7\x92+\x84\x95\x9e\xa9\
+\xe4\xeeBX\xc5\xf5\xa9\xe4\x19\xc2Fm*YAX\
+fE%m\x08\x1b\x8d\xa9\xe4\x1d\xc22\xefT2\x86\
+\xb0\xd1\x8eJ\xca\x10\x96)S\xc9\x0e\xc2B\x99\x80*\
+.\x10\xd6\xb9PE\x90\x81\xb0O\x85Jf\x10\xd6\x99\
+QI\x05\xc2>\xafT\xf2\x06a\x9d7*y\x85\xb0\
+\xcf\x98J\x9e!\xac\xf3L%c\x08\xfbl\xa9\xe2\x0c\
+a\xa13Ul!\xecs\xa7\x8a9\x84\x85\xe6Tq\
+\x87\xb0N\x89J:\x10\x16\xeaPI\x09\xc26-*\
+\xa9@X\xa8B%-\x08\xdbxTqw ,\xe4\
+\xdc\xa9\xc2\x83\xb0\xcd\x82*6\x10V\xdaP\xc5\x02\xc2\
+6\x07\xaa\x18BXiH\x15\x07\x08\xcbd\x02\xaah\
+BX\xa9I\x15A\x06\xc2.e*)@X\xa9@\
+%e\x08\xbb\xb4\xa8\xe2\x0ca\xa93U\xb4 \xec\xe2\
+Q\xc5\x0a\xc2R+\xaa\xf0 \xec2\xa3\x8a\x01\x84\xa5\
+\x06T1\x83\xb0\xcb\x96*\x9a\x10\x96jR\xc5\x16\xc2\
+.\x17\xaax\x82\xb0\xd4\x13U\x5c \xac\x92\xa5\x8a;\
+\x84\xb5\xeeT\x91E\xdad\xabo\x83\xe9b\xb5\xd6o\
+9\x1f\xf7\x9a\xcf\x08U\x85*v\x10\xd6\xdaQE\x05\
+i\xe2\xd4F\xfb\x80\xe1\xba.;\x05\x84\xa6E\x15S\
+\x08kM\xa9\xa2\x85\xf4(\x8d.\x8cD\xb0ig\x10\
+\x8e\x1eU\xf4 \xac\xd5\xa3\x8a\x1e\xd2\xe2e\x190:\
+\x97~\x16a\x98PE\x03\xc2Z\x0d\xaa\x98 \x1d\x9e\
+\x16\x8c\xd8\xf5\xcd\x81~K\xaax\x82\xb0\xd6\x13U,\
+\x91\x06N\xcfg\xf4veh\xb7\xa7\x02\xdf\x81\xb0\x96\
+\xe3S\xc1\x1e)P\xdc2\x16~\x17\xba\xdd\xa8\xe0\x00\
+a\xb1\x03\x15\x5c\x91|\xb5+\xe32w\xa1U\x96*\
+\x96\x10\x16[RE\x16I\xd7\xf6\x19\x9f]\x1e:\x95\
+\xa8b\x0ca\xb11U\x94\x90p\x9d\x80q:\x14\xa0\
+Q\x9d*:\x10\x16\xebPE\x1d\xc9\xf6\xca\x98\xeds\
+\xd0\xa7M\x15\x0d\x08\x8b5\xa8\xa2\x8dD\xab\x07\x8c\xdb\
+\xd6\x856=\xaa(CX\xacL\x15\xefH\xb2\xd2\x8d\
+\xf1\x9bB\x9b\x11Ud!,\x96\xa5\x8a\x11\x12\xcc\xdd\
+\xd3\x04\xaf\xd0eF\x057\x08\xab\xdd\xa8`\x86P\x15\
+\xaa\xedn\xdf\x0bA\xef\xadQ\xce\xe07F4\xc2\xfd\
+\x09\x9a\xac\xa9\xe0\x00a\xb5\x03\x15\xac\x10\x9aJ\x7fy\
+a\x98\xfc\xfd\xa4\x99\xc5\xcf\xbd\x044\xc3\x0a\x9a\xec\xa9\
+`\x05a\xb5\x15\x15\xec\x11\x8e\xe7\xc1'\xa3\xe0/\x9b\
+\x0e~bGS4\xa1\xc7\x99\x0a\xa6\x10V\x9bR\xc1\
+\x19a\xa8\xad\x18\x9ds?\x8b\x1fi\xd1\x18G\x07Z\
+\xf8T0\x84\xb0\xda\x90\x0a|\xe8W\xf9`\xb4\xae\xef\
+\x19\xfc\xdb\x81\xe6hC\x07\x97*\xba\x10V\xebR\x85\
+\x0b\xcd\xb2\xe3\x80\x91;T\xf1O\x0d\x1ad\x0f\x1d\x0a\
+T\xd1\x82\xb0Z\x8b*\x0a\xd0\xab\xfa\xc98\x04\xa3\x0c\
+\xfe\xd7\x8a&\xa9B\x83\x12U\xd4 \xacV\xa3\x8a\x12\
+\xb4\xea\x06\x8c\xc9\xae\x80\xbf+\x044\xc9\x0c\x1aT\xa9\
+\xa2\x0ca\xb52UT\xa1\x913a|\xce\x15\xfcM\
+\x97F\xb9e\xa0\xaeA\x15\x05\x08\xab\x15\xa8\xa2\x01}\
+2\x0b\xc6\xe9V\xc5\x7f}\xd0,u\xa8kS\x85\x0b\
+a5\x97*\xda\xd0\xc6Y0^\xf7\x17\xfc\x1f\xd7\xa7\
+YFP\xd7\xa1\x02\x1f\xc2r\x01\x15t\xa0\xcd\x84q\
+\xbb>\xe3O5\x1af\x0bu\xefTp\x85\xb0\xdc\x95\
+\x0a\xde\xa1K\x97\xf1;f\xf1\x87w\x1a\xc6w\xa0\xac\
+O\x05G\x08\xcb\x1d\xa9\xa0\x0fM\xaa\x01\x0d\xb0\xc4\x1f\
+\xa64\xcd3\x94\x0d\xa9`\x07a\xb9\x1d\x15\x0c\xa1G\
+\xf6\x93Fx\xc3\xff\xb7\xa1i\xeaP6\xa6\x82\x0d\x84\
+\xe56T0\x86\x1ec\x9a\xe1V\xc4\x7f\x1ci\x9aW\
+(\x9bP\xc1\x0a\xc2r+*\x98@\x8bJ@C,\
+\xf0\x1f7\x9a\xa6\x07e3*X@XnA\x053\
+h\xb1\xa11\xaa\x00\xe0\xd34\x1e\x94-\xa8`\x06a\
+\xb9\x19\x15,\xa0C\x8d\xe6X\x03\x00\x8d3\x80\xb2%\
+\x15L ,7\xa1\x82%tX\xd3 \x15\x00>M\
+\xe3A\xd9\x92\x0a\xc6\x10\x96\x1bS\xc1\x12\x1a\x94h\x92\
+\x19\x80+M\xf3\x0ee+*\x18AXnD\x05+\
+h0\xa2I\xeeY\xe0@\xd3\xb4\xa1lM\x05#\x08\
+\xcb\x8d\xa8`\x0d\x0dN4J\x1bX\xd345(\xfb\
+\xa0\x82!\x84\xe5\x86T\xf0\x01u/4\xcb\x02\x98\xd0\
+4E(\xdbP\xc1\x00\xc2r\x03*\xd8@]\x9ff\
+\xb99\xe8\xd007\xa8\xdbR\xc1\x00\xc2r\x03*\xd8\
+B\xdd\x9a\x86\xa9\xa0B\xc3\xac\xa1nK\x05\x03\x08\xcb\
+\x0d\xa8`\x0bu7\x1a\xa6\x03\xe7F\xb3\xf4\xa1nC\
+\x05\x03\x08\xcb\x0d\xa8`\x03eE\x9af\x02,h\x96\
+\x17\xa8\xfb\xa0\x82!\x84\xe5\x86T\xf0\x01e5\x9af\
+\x0d\xb4i\x94\x134XS\xc1\x08\xc2r#*XC\
+Y\x9b\xa69\x00\xd9;M2\x82\x06+*\x18AX\
+nD\x05+({\xa7i\xae\x00f4I\x09\x1a,\
+\xa9`\x0ca\xb91\x15,\xa1\xcc\xa3i|\x00\x15\x1a\
+d\x0d\x1d\x96T0\x81\xb0\xdc\x84\x0a\x96P6\xa0i\
+\x02\x00X\xd3\x1c5\xe8\xb0\xa0\x82\x19\x84\xe5fT\xb0\
+\x802\x8f\xa6\xf1\x01\xa0Jcl\xa0\xc5\x8c\x0a\x16\x10\
+\x96[P\xc1\x0c\xcaz4\xcd\x0d\xff\xb1\xa0!\x82\x0a\
+\xb4\x98P\xc1\x0a\xc2r+*\x98@\xd9+Ms\xc4\
+\x7f\x14o4\xc3\x18z\x8c\xa9`\x03a\xb9\x0d\x15\x8c\
+\xa1\xacN\xd3l\xf0\xff\xbd\xd1\x08\x9fY\xe81\xa4\x82\
+\x1d\x84\xe5vT0\x84\xb2g\x9af\x8a?,i\x80\
+\xa0\x0aM\xfaTp\x84\xb0\xdc\x91\x0a\xfaP\xe6\xf84\
+\xcc;\xfe\x90=2~]\xe8\xf2N\x05W\x08\xcb]\
+\xa9\xe0\x1d\xea\xb64L\x0d\x7fz\xbe2n\x13h\xd3\
+\xa1\x02\x1f\xc2r\x01\x15t\xa0nD\xb3\xf8.\xfe\xcf\
+\xcb\x9d\xf1Z8\xd0\xa6M\x15.\x84\xd5\x5c\xaahC\
+]\x9df\xf9\xc0\x7fUo\x8c\xd3\x22\x03}\x1aTQ\
+\x80\xb0Z\x81*\x1aP\x97\xb9\xd1(]\xfcM\xe5\xcc\
+\xf8L\x1chT\xa5\x8a2\x84\xd5\xcaTQ\x85\x063\
+\x9a$(\xe0\xef\x0a;\xc6$\xe8B\xab\x12U\xd4 \
+\xacV\xa3\x8a\x124\xa8\xd2$+\xfc\xaf\xcc(`\x1c\
+>\xab\xd0\xab@\x15-\x08\xab\xb5\xa8\xa2\x00\x1d\xf64\
+H\x03\xffT=0r\xc18\x0b\xcd\x5c\xaa\xe8BX\
+\xadK\x15.th\xd3\x1c\x07\xfc[\xe6\xfd\xcah}\
+T\xa0\x9fO\x05C\x08\xab\x0d\xa9\xc0\x87\x16\xce\x91\xc6\
+h\xe1G\xb2\xfd3\xa3\xb3\xaa!\x0cg*\x98BX\
+mJ\x05g\xe8\xd1\xa4)v\xf8\x89Lk\xe93\x0a\
+\xa7\xe13\xc2\xb1\xa7\x82\x15\x84\xd5VT\xb0\x87&+\
+\x9a!x\xc1\xcfe\x9b\x93\xbd\xcf0]\x96\xfd\x0aB\
+\xb3\xa6\x82\x03\x84\xd5\x0eT\xb0\x86&Ow\x1aa\x84\
+\xdf\xc8\x94\x1bo=/\x04\xfdn\xbbZ@\xa8fT\
+p\x83\xb0\xda\x8d\x0af\xd0\xe5\x95&\xd8\xbbH\xb0\x11\
+Ud!,\x96\xa5\x8a\x11\xb4\x992~\xb7\x12\x92\xac\
+G\x15e\x08\x8b\x95\xa9\xa2\x07m\xdc-\xe3\x16\xd4\x91\
+hm\xaah@X\xacA\x15m\xe8\x93\xdb3f\xaf\
+H\xb6:Ut ,\xd6\xa1\x8a:4*\x1c\x18\xa7\
+\xa0\x83\x84+Q\xc5\x18\xc2bc\xaa(A\xa7\xfc\x8e\
+\xf1\xf1\xdbH\xba,U,!,\xb6\xa4\x8a,\xb4r\
+\xe7\x8c\xcb\xb5\x86\xe4\xbbQ\xc1\x01\xc2b\x07*\xb8A\
+\xb7\xae\xcfXl\x8bH\x81=\x15\xf8\x0e\x84\xb5\x1c\x9f\
+\x0a\xf6\xd0\xae\xbcc\xf4\xfc\x9e\x834XR\xc5\x13\x84\
+\xb5\x9e\xa8b\x09\xfd\x9c\xb7+#\xb6xB:L\xa8\
+\xa2\x01a\xad\x06UL\x10\x86l\xff\xc2\xe8\x04\xcb\x17\
+\xa4E\x9f*z\x10\xd6\xeaQE\x1f\xe1\xc8\xb47\x01\
+#q\x19\x95\x90\x1e-\xaa\x98BXkJ\x15-\x84\
+\xa6\xd0Y^\x19\xae`?\xaa9H\x93\x0aU\xec \
+\xac\xb5\xa3\x8a\x0aB\xf5\xdc\xec\x8d\xe7\xcb\xb5~\xab\xc5\
+t\xf0V\xcd\x22m\xb2Tq\x87\xb0\xd6\x9d*\xb2\x10\
+V\xb9R\xc5\x13\x84\xa5\x9e\xa8\xe2\x0aa\x97-U4\
+!,\xd5\xa4\x8a-\x84]fT1\x80\xb0\xd4\x80*\
+f\x10v\xf1\xa8b\x05a\xa9\x15Ux\x10viQ\
+\xc5\x19\xc2Rg\xaahA\xd8\xa5L%\x05\x08+\x15\
+\xa8\xa4\x0ca\x97L@\x15M\x08+5\xa9\x22\xc8@\
+X\xe6@\x15C\x08+\x0d\xa9\xe2\x00a\x9b\x05Ul\
+ \xac\xb4\xa1\x8a\x05\x84m<\xaa\xb8;\x10\x16r\xee\
+T\xe1A\xd8\xa6E%\x15\x08\x0bU\xa8\xa4\x05a\x9b\
+\x12\x95t ,\xd4\xa1\x92\x12\x84u\xeeT1\x87\xb0\
+\xd0\x9c*\xee\x10\xf6\xd9R\xc5\x19\xc2Bg\xaa\xd8B\
+\xd8gL%\xcf\x10\xd6y\xa6\x921\x84}^\xa9\xe4\
+\x0d\xc2:oT\xf2\x0aa\x9f\x0a\x95\xcc \xac3\xa3\
+\x92\x0a\x84}2\x01U\x5c \xacs\xa1\x8a \x03a\
+\xa1\x1d\x95\x94!,S\xa6\x92\x1d\x84\x8d\xc6T\xf2\x0e\
+a\x99w*\x19C\xd8\xa8M%+\x08\xcb\xac\xa8\xa4\
+\x0da\xa3g*\xb9\xbb\x10Vq}*y\x86\xb0\xd2\
+\x95J\xea\x10V\xa9S\xc9\x15\xc2N+*\x19CX\
+eL%K\x08;\xf5\xa9\xe4\x04a\x95\x13\x95\xf4!\
+\xecT\xa3\x9a2\x84E\xcaTS\x83\xb0\x93\xebSI\
+\x1f\xc2\x22}*\xf1]\x08Km\xa9d\x07a\x91\x1d\
+\x95l!l5\xa0\x9a\x02\x845\x0aT3\x80\xb0U\
+\x9dj\xba\x10\xd6\xe8RM\x1d\xc2V\xd9\x80J6\x10\
+\xd6\xd8PI\x90\x85\xb0\xd6\x8eJ\x82<\x84%\xf2\x01\
+\x95\xec \xec5\xa0\x9a\x0e\x84%:T3\x80\xb0W\
+\x8dj\xb6\x10\x96\xd8RM\x0d\xc2^\x99;\xd5\x14!\
+\xacP\xa4\x9a{\x06\xc2b+\xaa\xe9AX\xa1G5\
++\x08\x9bu\xa9f\x0fa\x85=\xd5t!lV\xa6\
+\xa22\x84\x05\xcaTT\x86\xb0\xda\x89jF\x10\x16\x18\
+Q\xcd\x09\xc2n\x13\xaa\xb98\x10\xc6s.T3\x81\
+\xb0[\x83\x8a\x9a\x10\xc6kRQ\x03\xc2n\xaeO5\
+K\x08\xe3-\xa9\xc6w!,\xb7\xa2\x9a \x0fa\xb8\
+|@5+\x08\xdbu\xa8\xa8\x0fa\xb8>\x15u \
+lW\xa4\xa2O\x08\xc3}RQ\x11\xc2z{*j\
+@\x18\xadAE{\x08\xfb\xf5\xa9h\x09a\xb4%\x15\
+\xf5!\xecW\xa2\xa2\xa0\x08a\xb0b@E%\x88\x04\
+8P\xd1\x10\xc2`C*:@$\xc1\x80\x8a\xae.\
+\x84\xb1\xdc+\x15\x0d \x92\xa0BU\x1d\x08cu\xa8\
+\xaa\x02\x91\x08G*:@\x18\xeb@EG\x88d\x18\
+PU\x1d\xc2Pu\xaa\x1a@$C\x99\xaa> \x0c\
+\xf5AUe\x88\x84\xd8S\xd5\x0b\x84\x91^\xa8j\x0f\
+\x91\x14=\xaaZ@\x18iAU=\x88\xa4(\x06T\
+\x14\x94 \x0cT\x0a\xa8((B$\xc6\x86\xaa\xa6\x10\
+\x06\x9aR\xd5\x06\x229\xde\xa8*x\x820\xceS@\
+Uo\x10\xc9\x91\xf3\xa9j\x02a\x9c\x09U\xf99\x88\
+\x04\x99S\x95_\x840L\xd1\xa7\xaa9D\x92\xd4\xa9\
+l\x02a\x98\x09\x95\xd5!\x12\xe5DU~\x11\xc2(\
+E\x9f\xaaN\x10\xc92\xa0\xb2)\x84Q\xa6T6\x80\
+H\x96'*\x0bJ\x10\x06)\x05T\xf6\x04\x910\x1f\
+T\xb6\x800\xc8\x82\xca> \x92\xa6Eu/\x10\xc6\
+x\xa1\xba\x16D\xd28\x17*[C\x18cMe\x17\
+\x07\x22q\x06TW\x870D\x9d\xea\x06\x10\xc9S\x0c\
+\xa8\xec\xe0@\x18\xc19PYP\x84H\xa0%\xd5\xbd\
+A\x18\xe1\x8d\xea\x96\x10I\xd4\xa0\xbaK\x16\xc2\x00\xd9\
+\x0b\xd5\xd5!\x12\xe9HuC\x08\x03\x0c\xa9\xee\x08\x91\
+L\x1d\xaa\xf3\x9f!b\xf7\xecS]\x07\x22\x99\xb27\
+\xaa[B\xc4nIu\xb7,DB\x8d\xa8A\x03\x22\
+f\x0dj0\x82H\xaab@u\xc7\x0cD\xac2G\
+\xaa\x0b\x8a\x10\x89\xb5\xa0\x06\x1eD\xac<j\xb0\x80H\
+\xae\x17j\xe0\x97 bT\xf2\xa9\xc1\x0bD\x82m\xa8\
+\xc1\x07D\x8c>\xa8\xc1\x06\x22\xc9\xea\xd4\xa1\x0d\x11\x9b\
+6u\xa8C$\xda\x9e\x1a\x5c\xf3\x101\xc9_\xa9\xc1\
+\x1e\x22\xd9Z\xd4a\x0e\x11\x939uhA$\x9b\xf3\
+I\x1d\x1a\x10\xb1hP\x87O\x07\x22\xe1\xde\xa8\xc39\
+\x07\x11\x83\xdc\x99:\xbcA$]\xe6D\x1df\x101\
+\x98Q\x87S\x06\x22\xf1:\xd4\xa2\x01\x11\xb9\x06\xb5\xe8\
+@$_\xe6D\x1d.y\x88\x88\xe5/\xd4\xe1\x94\x81\
+H\x81\x0e\xb5X@DlA-:\x10i\xe0\x9e\xa9\
+\xc5+D\xa4^\xa9\xc5\xd9\x85H\x85\x0e\xb5\xb8=A\
+D\xe8\xe9F-:\x10\xe9\x90\xf9\xa4\x16[\x07\x222\
+\xce\x8eZ|f R\xa2M=\x86\x10\x91\x19R\x8f\
+6DZ8\x07j\x11\xd4!\x22R\x0f\xa8\xc5\xc1\x81\
+H\x8d&\xf58\xe7!\x22\x91?S\x8f&D\x8a\xec\
+\xa8\xc7\xda\x81\x88\x80\xb3\xa6\x1e;\x884\xa9Q\x93\x01\
+D\x04\x06\xd4\xa4\x06\x91*+\xea\x11\xd4!BW\x0f\
+\xa8\xc7\x0a\x22]J\x01\xf5\xb8\x16!BV\xbcR\x8f\
+\xa0\x04\x912\x13j\xb2s!B\xe5\xee\xa8\xc9\x04\x22\
+m\xf27j2\x85\x08\xd5\x94\x9a\xdc\xf2\x10\xa9\xd3\xa7\
+.]\x88\x10u\xa9K\x1f\x22}\xdc\x135\x09j\x10\
+\xa1\xa9\x05\xd4\xe4\xe4B\xa4P\x8b\xba\x5c\x9f B\xf2\
+t\xa5.-\x88T\xfa\xa0.\x87,D(\xb2\x07\xea\
+\xf2\x01\x91N\xe5\x80\xba\xac\x1c\x88\x108+\xea\x12\x94\
+!RjDm\xc6\x10!\x18S\x9b\x11DZe/\
+\xd4\xa6\x03\xa1]\x87\xda\x5c\xb2\x10\xa9\xf5Jm\x82&\
+\x84f\xcd\x80\xda\xbcB\xa4\xd8\x86\xda\xf8U\x08\xad\xaa\
+>\xb5\xd9@\xa4Y\xc9\xa76\xd7\x12\x84F\xa5+\xb5\
+\xf1K\x10\xa96\xa0>\x9f\x05\x08m\x0a\x9f\xd4g\x00\
+\x91n\xee\x91\xfa\xecs\x10\x9a\xe4\xf6\xd4\xe7\xe8B\xa4\
+\x5c\x8d\x1am\xb3\x10Zd\xb7\xd4\xa8\x06\x91z3j\
+\xf4\x91\x81\xd0 \xf3A\x8df\x10\x06{n\x8d\x96\xfb\
+\xf3\xdd\xbf_\x8f\x1f\xd3\xf7\x9a\x8bp\xe4.\xd4h\xe1\
+@(s\x16\xd4\xe8\x92\x830\x94S\x9f\x9c\xf8\xbf\xfc\
+\x8fn\x11ahR\xa7\xb9\x03\xa1\xc8\x99S\xa7&\x84\
+\x99\x8a\x83\x0b\x7f$X7\x1d\xe8\xb7\xa0N3\x08E\
+3\xea\xb4\x800\xd2\xd34\xe0O\x1d_\x1d\xe8\x96\xbf\
+R\xa7)\x84\x92)u\xba\xe6!\x0c\x94\x1d\xfa\xfc\xa5\
+}\x0d\xba\xb5\xa8\xd5\x04B\xc1\x84Z\xb5 \x0c\xf4z\
+\xe1oM\xb3\xd0lA\xad\xa6\x10\x0f\x9bR\xab\x05\x84\
+y\xaa;~\xc5\xb1\x02\xbd\xf2\x17j5s \x1e\xe2\
+\xcc\xa8\xd5%\x0fa\x9a\xe2\x9c_\xe4\xb7\xa1W\x83z\
+\xcd\x1d\x88\x078s\xea\xd5\x800\x8c\xeb\xdd\xf9u=\
+\xe85\xa5^\x8b\x0c\xc4\xb7e\x16\xd4k\x0aa\x98\xd6\
+\x89\xdf\xe2A\xab\xec'\xf5Zg!\xbe)\xbb\xa6^\
+\x9fY\x08\xa3T\xb6\xfc\xaewhU\x0d\xa8\xd76\x07\
+\xf1-\xb9-\xf5\x0a\xaa\x10&\xc9O\x03~[\xd0\x84\
+V\x03j\xb6/@|CaO\xcd\x06\x08\x8f[i\
+\xbcv\xdf\xbbo\xcd\x97<\xc4\x97dz7>\xe2^\
+\x82N\xce\x96\x9a}\x96 \xbe\xac\xf4I\xcd\xb6\x0e\xc2\
+Q|\x9b\x1f\x03\xfe\xe5\xb2\xecU ~\xa7q\xe4\x83\
+\xf6.t*^\xa9\xd9\xb5\x0a\xf1E\xd5+5\xbb\x16\
+\x11\x86\xfc\xfb\x8e\xffv\x1a\x96!~\xa1\xb4\xe6\xe3F\
+\xd0\xaaI\xdd\xfc&\xc4\x974}\xea\xd6D\x08JS\
+\x9f?\xf1Q\x87\xf8\x89\xdc8\xa0\x82\xa0\x02\xad&\xd4\
+-\xe8@|A'\xa0n\x13\xe8W\x9c\x07\xfc\x85m\
+\x15\xe2\x07\x9c\xce\x95j6\xd0\xca\xddS\xbb\xb1\x03\xf1\
+\x1b\xce\x98\xda\xed]\xe8\xe6\xf4}\xfe\xc6\xbc\x08\xf1O\
+\xb5=\x955\xa0\xd5\xf3\x8d\xda\xad\xb2\x10\xbf\x94]Q\
+\xbb\xdb3t+\xed\xf8{\xbe\xe7B\xfc\xdd\xd3\x82\x1a\
+l\xa1W\x93\xfa\x1d\x9e ~\xe1\xe9@\xfd\x9a\xd0\xad\
+y\xe7\x97\x9cZ\x10\x7f\xc9\x0e|jQ\x85^#\xea\
+w\xadA\xfcT\xedJ\xfdF\xd0\xad\xcf/\xdb\xbe@\
+\xfc\xe1\xf5LMf\xd0\xcb\xd9R\xbf\xa0\x0b\xf1\x13\xdd\
+\x80\xfam\x1dh6\xe67\x04\xd3<\x04P\xddQ\x9b\
+{\x16z\x15\xae\x0c\xc1\xd4\x85\xf8\x01w\xca\x10\x5c\x0b\
+\xd0l\xcc\xef\xb9\xf52H\xbb\xc2\x9c:\xb5\xa0Y-\
+`\x08vE\x88\x7f)\xee\x18\x82\xa0\x06\xcdz\xfc\xb6\
+c\x03\xa9\xe6zwj5\x83n]\x86\xe1Z\x87\xf8\
+\x87\xfa\x95a\xe8B\xb3f\xc0\x07\xac\xcbH\xaf\xd6\x89\
+\x9a\x9d\xa1\xdd\x8ca\x08<\x07\xe2o\x1c/`\x18f\
+\xd0\xec\xe9\xc6\x87\x04\xe3\x1c\xd2\xa9\xb2\xa1~E\xe8\xe6\
+\xee\x18\x8au\x1e\xe2/\xf95C\xb1s\xa1\x97\xb3\xe5\
+\xa3\xae\x1d\x07\xe9\x93\x9f\x04\x0cA\x13\xda\x15/\x0c\xc5\
+\xb9\x06\xf1\xa7\xfa\x99\xa1\xb8\x14\xa0Y\x97\x0a\x0eu\xa4\
+\x8c\xf3~c(\xfa\xd0\xaf\xea3\x14\xc1\xd0\x81\x00\xe0\
+\x0c\x03\x86\xc2\xafB\xb3\xfc\x8dJ\x96\xcfH\x93\xc6\x81\
+!\x99 \x04m\x86d\xf7\x04\x81\xa7\x1dC\xd2\x86n\
+\x13*\xf2\x87Y\xa4Ei\xc5\xd0,\x11\x86\x01Cr\
+\x7fC\xea\xbd\xdd\x19\x92\x01t{\x0a\xa8\xec\xf2\x8aT\
+\xc8\x8d\x02\x86g\x83P,\x18\x96e\x1e\xa9\x96_2\
+,\x0bh7\xa6\x0e\xbb*\x12\xcf\xe9\x5c\x19\xa6\x1dB\
+\xe1\xee\x18\x96K\x03)\xd6\xb80,;\x17\xbae\xef\
+\xd4c^D\xb2\xd5\xf6\x0c\xd7\x0e\xe1(\x9c\x18\x9aY\
+\x0e)\x95\x9b14\xa7\x02\xb4{\xa5.w\xcfEr\
+=-\x18\xb6-BR\xbe14\xe7&R\xa9yf\
+hne\xe8\xf7A}N-$Tv\xe03tK\
+\x84\xa5\xe63<\xf3<R'?gx\xfc\x1a\xf4\xcb\
+\x05\xd4iSA\x12\xb5\xcf\x8c\xc0\x14\xa1i\x05\x0c\xcf\
+\xf5\x15)\xf3zex\x82\x16B\xd0\xa4^\xc1$\x8f\
+\xa4y\xd91\x12}\x84\xa7\xcb0}\x94\x90\x22\xa5\x0f\
+\x86\xa9\x8b0\x8c\xa9\xdb\xad\x97A\x92\x14f\x8cH\x0b\
+!\x1a1L\xbe\x97AJd<\x9fa\x1a!\x14[\
+\xeawl 1\xdc\xfe\x9dQyF\x98f\x0c\xd5\xb1\
+\x81Th\x1c\x19\xaa\x19\xc2qg\x18\xd6%$C\xf3\
+\x93\x91\xb9 T\xce\x92\xe1Z>#\xf1\x9e\x97\x0c\xd7\
+\xd2A(\x0a\x0cG0\xce\xc1~\xe5\x0fFh\x8ep\
+\xb9\x1b\x86\xcb\x1fd\x91h\xd9\x81\xcfpm\x5c\x84\xe3\
+\x85a\xb9v\x1c\xd8-?\x09\x18\xa5W\x84,\xbbc\
+\xc8.o\x0e\x12\xcby\xbb0d\xbb,BRgx\
+\xf65X\xccy\xbf1R~\x0ea\xcb\x1f\x18\xb6}\
+\x1d\x09U\xdf3l\x87<\xc2\xd2b\x98\x16O\xb0U\
+\xfd\xc0\x88-\x10\xbe\xc2\x91\xa1[W\x90@\x955C\
+w, 4-\x86\xca\x1fda\xa3\xd2\x8a\x91\xab#\
+\x02\xc5O\x86oQB\xc2\x94\x16\x0c\xdfg\x11\xe1i\
+1d\xe76\xac\x93\x1d\x05\x8c\xdc\x01\x91x:1|\
+\xc1\xb4\x88\x04)N\x03\x86\xef\xf4\x84\x10\xd5\x19\xba\xdd\
+\x0b\xecR?1\x06mD\xe3\xe9\xcc\x08\xf8\x93\x22\x12\
+\xa28\xf1\x19\x81\xf3\x13\xc2\xf4\xc2\x08\xcc\x0a\xb0Gf\
+\xcc8\xec\x1dD\xa4tf\x14\xfcI\x11\x09P\x9c\xf8\
+\x8c\xc2\xf9\x19\xa1*0\x0aw\xcf\x85%\x0a;\xc6\xa2\
+\x86\xc8\x94\xce\x8c\x84?-\xc1r\xa5\xa9\xcfH\x9cK\
+\x08\xd9\x9d\x918\xb5`\x85\xd2\x89\xb1\x98!BO'\
+F#X\xbc\xc0b/\x8b\x80\xd18=!l[F\
+dS\x81\xf9\xcaW\xc6\xe2\x9cC\x94\x8a\x9f\x8c\xca\xa6\
+\x0eK\xd57\x8c\xca\xb1\x88\xd0\x8d\x19\x95`\x92\x87\xe1\
+\x9e/\x8cEPC\xb4\x0aGF\xe6\xf0\xe6\xc2:\xee\
+\xdb\x81\x919\x16\x10\xbe\x16\xa3s{w`\xb2\xfc'\
+\xe3\xd1E\xd4\x0a\x07F\xe7:,\xc2*\xc5\xe1\x95\xd1\
+9\x14\x10\x81\x5c\xc0\x08\x1d\x1a0\x97\xb3a<\xc6\x88\
+^n\xc7\x08\x05\xcb\x06\xac\xd1X\x06\x8c\xd0.\x87H\
+l\x18\xa9U\x09\xa6\x1a0\x1e3\xc4!\xfb\xc1H}\
+\xf6\xf2\xb0@\xbe\xf7\xc9H}d\x11\x8d7F+\x18\
+\xe5`\xa4\x97\x80\xb1\x988\x88\x85\xbbd\xb4\x82E\xd3\
+\x81\xd1\x9c\xe6\x22`\xb4\x96.\x22\x92\xbd3b\xd77\
+\x07\xe6q\xf6\x8cE\x1fqqf\x8c\xdaeT\x86\xb1\
+\xca\xa3\x0b\xa36s\x10\x99\x09#\xb7\xaf\xc18\x1d\xc6\
+\xe1\xd6@\x8c\xc6\x8c\xde\xbeW\x84\x81\x8a\xbd=\xa37\
+F\x84\x9e\x03Fo\x9e\x87Y\xb2\x17\xc6\xe0\xa3\x88X\
+\xbd\x07\x8c\xc1\xe6-\x0f\xa3\xe4\xdf6\x8cA\xf0\x8eH\
+M\x19\x83k\x13Fyg\xf4\xae\xaf\x88[\xcbg\x1c\
+\x82M\xb7\x00C\x14\xba\x9b\x80q\xf0[\x88V\xf1\xce\
+8L20\x87sb\xd4\x82Q\x0e\xf1\xab\xdd\x18\x93\
+m\xbf\x8c\xd8\x95\xfb[\xc6\xe4VC\xd4\xfa\x8c\xc5&\
+\x07c4\x19\xb5U\x09F(\x9f\x18\x9b\xd3\xb8\xe1\x22\
+6nc|blNeD\xce\xd91\x16\xfb\x02L\
+\xb1d\xb4\x0e\x0d\x98\xa2\xb0c\x8c\xfcu\xaf\x82\x18T\
+zk\x9f1\xda\x15\x10\x83\xd2\x9d\xb18\xe4a\x86\xac\
+\xcf(\xdd\xde\x1d\x98\xc3]0^\x97\xf9[\x09\x11*\
+\xbd\xcd/\x8c\xd7\xc2E,Z\x8c\xc7>\x0b#4\x19\
+\xa1`\x92\x87Y\x06\x8c\xdde\xde\xa98\x08\x9dS\xe9\
+\xcc/\x8c\xdd\x00q\x190\x1eK\x18a\xc2\xe8l*\
+0N\xdb\xa7\x01\xee\x9ba3\x8f\xd0\xe4\x9b\xc3\xcd\x9d\
+\x06\xf0\xdb\x88\xcf\x84\xf1\xe8\xc3\x04{F\xe5\xd4\x82\x89\
+\xaa\x17\x1a\xe2\xbc\x1c4\x9f\xa1\xd9ss\xb0<\xd3\x10\
+\x97*\xe24a,\x82*\xe2\xe7\x06\x8c\xc6\xddsa\
+\xa6\xc2\x8e\x06\xb9\xef\xa6\xbdF\x11\x1a\x14\x1b\xbd\xe9\xee\
+N\x83\xec\x0a\x88\xd7\x80\xb18d\x10\xbb\x0a\xa31+\
+\xc0X\xee\x8c\xa6\xf1\x0f\xcbQ\xa7Q\xce\xe1\x01\xb9r\
+\xa33Z\x1e|\x9af\xe6\x22nm\x9fq\xe8#v\
+MFa\xf7\x02\xa3u\x03\x9a\xe9~XM\x87\xddV\
+\xad\x5c\xc8\xe2\x97\xb2\x85r\xad\xd5\x1dNW\x87;\xcd\
+\x14ta\x80\xf2\x9e1\xb8\xe7\x11\xb7\x0e\xc3wn\xc3\
+t\xb5+M\x17\x5c\x8f\xbb\xcdj1\x9b\x8cG\xa3\xe1\
+\xc0\xf3\x06\xc3\xd1h<\x99-V\x9b\xdd\xf1\x1a\xd0t\
+\xd7\x1a\x8c\x90\x19\xf8\x8c\xde\x08q\xf3\x186\x7f\x90\x85\
+\xf9\x0a[\x8a\x10m\x0b0Ei\xc5\xc8\xdds\x88\xd9\
+\x90![<\xc1\x0a\xce\x88\x224#\x07\x06i\x1c\x18\
+\xb5w\xc4l\xc4P\xedk\xb0F\xf3F\x11\x8a[\x13\
+fq\xdeo\x8c\xd6\x011\x1b0D\xd7\x8e\x03\x8b<\
+\xef)B\xb0\x7f\x86q\xf2\x93\x80\x91zA\xbcz\x0c\
+M0\xce\xc1.\xee\x98B\xbb\xb1\x0b\x13U6\x8c\xd2\
+\x00\xf1zeX\xd6%\xd8\xa7y\xa5\xd0\xea\xda\x84\xa9\
+Z'Fg\x87x\xd5\x18\x8ec\x03V*n(4\
+\xda\x14a.\xd7\xbb3*A\x16\xb1*0\x0c\xb7^\
+\x06\x96r\xbc\x80B\x93\xc0s`\xb4\xc2\x9cQ\xa9!\
+^Wj\x17L\xf2\xb0X\xf5H\xa1\xc5\xb1\x0a\xe3U\
+w\x8cF\x17\xf1ZQ\xb7M\x05v\xcbN(4\x98\
+da\x83\xd73\xa30A\xbcz\xd4\xeb\xd4\x82\xfd\x1a\
+\x17\x0aE\x97\x06,\x91\x1d\xf8\x0c\xdf\x12\xf1*S\xa7\
+\xbb\xe7\x22\x09\xf2\x0b\x0a%\x8b<\xec\xf1\xb4`\xe8v\
+\x88\xd9\x81\xfa\xcc\x8bH\x8a\xd6\x95\xe2a\xd7\x16\xecR\
+\xdb3d\x07\xc4\xacO]vU$H~N\xf1\xa0\
+y\x1e\xb6q:W\x86\xea\x131+\x04\xd4\xe2\xf2\x8a\
+\x84i^(\x1epi\xc2F\xb9q\xc0\x10\x1d\x11\xb7\
+95\xf0\x87Y$NnF\xf1m\xb3\x1c,UZ\
+3<{\xc4\xadBu\xcbg$R\xedH\xf1-\xc7\
+\x1a,\xd682,\x1f\x88\xdd\x9c\x8a\x0eu$U\xc6\
+\xf3)\xbe\xcc\xf72\xb0Z\xa6wc8f\x88\xdd\xd3\
+\x9d*\xae\x1d\x07\x09V\xdaP|\xd1\xa6\x04\xeb\xe5\xa7\
+\x01\xc3\xe0!~=>.\x18\xe7\x90p\xed\x0b\xc5\x17\
+\x5c\xdaH\x84\xca\x96!h!~\xce\x8e\x8fZ\x97\x91\
+|\xd9Q@\xf1\x1b\xc1(\x8b\xa4h\x9d\xa8\xdd\x13\x0c\
+\xf0|\xe3C\x8e\x0d\xa4C\xe9\x83\xe2\x97>JH\x10\
+\xd7\xbbS\xaf3\x8c\xd0\x08\xf8}\xb7^\x06\xa9\xd1<\
+Q\xfc\xd4\xa9\x89\x84)\xce\xa9\xd5\x0cfx\xe7w\x05\
+\xd3<\xd2\xc4\xed\xdf(~\xe8\xd6s\x91<\xd5\x1d5\
+j\xc2\x10C~\xcf\xf6\x05i\x93\x9f\x04\x14\xff\x12L\
+\xf2H\xa6\xd7\x0bu\xb9\xb90\xc5\x80\xdfpj!\x8d\
+JK\x8a\x7fX\x96\x90X\xd9\xa1O=&0G'\
+\xe0\x17\xf9\x9e\x8b\x94\xaam)\xfef[C\xa2=/\
+\xa9E\x19\x06\xa9]\xf8%\xf3\x22R\xacy\xa0\xf8\xd3\
+\xa1\x89\xc4\xab\x1f\xa8n\x05\xa3\x14V\xfc\xbd}\x15\xe9\
+\xe6\xbc\x9e(H\x9e^\x1d\xa4\x80\xd3\xbdR\xd5\x0b\x0c\
+\xd3\xbe\xf0\xd7.\xaf\x10\x99\xee\x99\xa9w\xeef\x90\x12\
+\xb9q@%s\x18';\xbc\xf3\xe7\xee\x83,\x04\x00\
+\xb7sf\xaa\x9d;.R\xa4\xbc\xa6\x82{\x11\x06\xca\
+{g\xfe\xd8\xb9\x9f\x83\xf8\x93\xdb91\xb5N\x1d\x17\
+)\xd38\xf2a\x1d\x98\xc9i\xcco\xfc\xa7\xdb\xbc\xe1\
+@\xfcM\xa6\xf3\xc9T\xfa\xecd\x90>\x99\xde\x8d\x8f\
+Y\xc3\x5cN\xb5\xbf8\x06\xfcCp\x5c\xf6\xab\x0e\xc4\
+?9\xad=Sg\xdfr\x90N\xf9i\xc0\x07\x9c\xf2\
+0\x9cS\xa8Tk\xd5J\xd1\x81\xf8\x99\xfa\x86\xa9\xb2\
+\xa9#\xc5^\xb6\xfc\xb6{\x05\x22\x09^\xe6\x01S\x22\
+\x98\xbf \xe5Z'~\x8f_\x87H\x88\xe2\xf0\xca\x14\
+\xb8\x0e\x8b\x10\xae\xe7\xf3\x1b\xfc\x06Dr\xb8o\x07&\
+\xdc\xe1\xcd\x85\xf8\x8f\xe2\x9c_v\xabA$K}\x19\
+0\xb1\x82e\x1d\xe2/\xd5=\xbf\xe6X\x86H\x9c\xe2\
+\xe0\xc2D\xba\x0c\x8a\x10\x7f\xe7\xbc]\xf8\x05\x8b\x1cD\
+\x129\xad\x0d\x13g\xd3r \xfe);\xf2\xf9\x1b\xd7\
+6Db=\x0fNL\x90\xd3\xe0\x19\xe2\x87\x9e\x17\xfc\
+\x15\x7f\x9c\x83H\xb4\xfa\xdcg\x22\xf8\xf3:\xc4\xcf\xbd\
+,\x03\xfe\x84?y\x82H\xbc\xdc\xdb\x96\xd6\xdb\xbe\xe5\
+ ~\xedyt\xe6\x0f\xec{y\x88t(\xf6\xf6\xb4\
+\xd8\xbeW\x84\xf8\x02\xa7:\xdc\xf9\xfc\x9b\xdb\xea\xbd\x04\
+\x91&\xe5\xc1\x91V:\x0e\xca\x10_\x97\xa9\xb4z\xa3\
+\xe9l6\x19v\x1b\xcf\x10)T\xf6\x0e\xb4\xcc\xc1+\
+C\x08\xf1M%oOk\xec\xbd\x12\x84\x10\x0f)v\
+V>\x8d\xe7\xaf:E\x08!\x14\xb8\x8d\xc9\x89\x06;\
+M\x1a.\x84\x10\xeaJ\xdd\xd5\x9d\x06\xba\xaf\xba%\x08\
+!\xb4\xc9\xd4\x06\xbb\x80\x06\x09v\x83Z\x06B\x08\xdd\
+\xb2\xf5\xc1\xd6\xa7\x01\xfc\xed\xa0\x9e\x85\x10\x22,n\xcd\
+[]\x19\xa3\xeb\xca\xab\xb9\x10B\x84\xee\xb9=\xde\x05\
+\x8c\x5c\xb0\x1b\xb7\x9f!\x84\x88\x8e\xfb\xf26\xde\xde\x19\
+\x91\xfbv\xfc\xf6\xe2B\x08\x11\x03\xa7\xd4\xf2\x16\x87\x80\
+!\x0a\x0e\x0b\xafUr \x84\x88\x97Sjy\xb3\xed\
+\x85\x9a]\xb63\xafUr \x840H\xb6\xd2\xea\x8d\
+\x97\xfb+\x15]\xf7\xcbq\xafU\xc9B\x08a\xael\
+\xa9\xde~\x1f\xcdV\xfb\xb3\xcf/\xf3\xcf\xfb\xd5l\xf4\
+\xde\xae\x97\xb2\x10BX\xc5-\x94\xab\x8dv\xe7\xdd\x1b\
+\x8e\xa7\xf3\xc5r\xb5\xfe\xd8l\xb6\xdb\xcd\xe6c\xbdZ\
+.\xe6\xd3\xf1\xd0{\xef\xb4\x1b\xd5r\xc1\x85\x10B\x88\
+\xff\xd7\x1e\x9ch%\x92m[\x00]!\x08v\x08\x0a\
+\xf6\x9c\x14\xb1=\xa9(v@\xac\xff\xff\xb07\xeex\
+\xef\xde\xbaU\x95\xa6\x10{\xd7\x1b\xe7\x04kN\x11\x11\
+\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
+\x11\x91\xec\xb4\xf7\x0f\x06\x83\xc1\xe1~\x1b\x22RG\x9b\
+\x83\xab\xa79\xffm\xfet\xd5\xdf\x84\x88\xd4I\xf3\xe4\
+\xb1\xe4_\x95?\x8f\x9b\x10\x91\x9a\xd8\x19\xcf\xf9k\xf3\
+\xabm\x88H\x0d\xb4\xafK~\xad\x1c\xb7 \x22\x99+\
+.\xe6\xfc\xbd\xd9Y\x01\x11\xc9\xd9\xee\x84\xdf{\xda\x86\
+\x88\xe4k0\xe72f}\xc8\xff\x83\xad\xfep|\xff\
+8\x99<=\x5c\x87\xc16D|\x04.\xa9\xbc\x80\xfc\
+\xb3\x9a\xfd\x9bw\xfe\xc9\xc7\xdd\xf1&D\xcc\xc6\x5c\xde\
+\x08\xf2\x0f\xea\xde\xcc\xf9\x0b\x8b\xbb\x03\x88\xd8\x8c\xb9\x8a\
+\x11\xe4\x9fr\xf8\xc4/\xbd\x1c\x15\x10\xa9\xee\x92\xab\x19\
+B\xfe\x11\x9dG\xfe\xd6K\x0f\x22U\x1dqU}\x88\
+\xbf\xc6\xa8\xe4wn6!R\xc9\xde\x82\xab\x9a\xef@\
+\xbc\xed\xbep\x09o=\x88T\xd0x\xe1\xea&\x05\xc4\
+W\x7f\xce\xa5\x94g\x10Y\xdd\x0fV1\x84\xb8:\xe7\
+\xd2\xae \xb2\xaa\xdd\x05\xabXlA\x1c\x05\xae\xe0\xa6\
+\x80\xc8j\x1eX\xcd-\xc4\xcf\x05W2\x86\xc8J\x0e\
+YQ\xb9\x07\xf1r\xc4\x15\x0d!\xb2\x82\x8d)\xab\xba\
+\x818\xd9_pU\x87\x10Y\xde9+[\xb4 .\
+\x9a\xaf\x5c\xd9l\x0b\x22\xcbj\xcdX\xdd9\xc4\xc55\
++\x88\x10Y\xd6\x98\x06\x13\x88\x87\x1e+9\x82\xc8r\
+:%-\xb6 v\xc53+\xf9hBd)\x8f4\
+9\x81\xd8\x1d\xb1\xa2\x11D\x961\xa0\xcd\x0d\xc4\xac\x98\
+\xb2\xa2\xc5\x0eD\xbe\xd7x\xa5\xcd\x14b\xd6ge\xf7\
+\x10\xf9\xde\x90Fe\x03b\x15Y\xdd\x01D\xbe\xd3\x9e\
+\xd3\xaa\x031\xda*Y\xddK\x01\x91o\xdc\xd0\xec\x10\
+btN\x8b3\x88\xfc^\x97v\xc7\x10\xa3GZ\xcc\
+Z\x10\xf9\xad\x09\xed\xce 6\x8d\x05M\xc6\x10\xf9\x9d\
+c:8\x87\xd8\xf4hSv \xf2\xb5\xe6;\x1d\x9c\
+Al\xceh\xf4\x13\x22_\xbb\xa4\x87\x13\x88\xcd5\xad\
+\xfa\x10\xf9\xca\xf6\x82\x1e\xfa\x10\x9bGZ\xbd6 \xf2\
+\x85;\xba\xd8\x87\xd8\xbc\xd0l\x08\x91_\xeb\xd1G\x0b\
+b\xf3I\xb3y\x1b\x22\xbfR<\xd3\xc5\x07\xc4hN\
+\xbb\x1b\x88\xfc\xca)}<@\x8c\x16t\xb0\x0f\x91\xbf\
+\xdb\xfc\xa4\x8f\x0b\x88\xd1\x8c\x0e&\x10\xf9\xbb+:\xe9\
+@\x8c\xde\xe8\xe1\x08\x22\x7f\xb5[\xd2\xc7\x1b\xc4jB\
+\x0f\xefM\x88\xfc\xc5\x03\x9d\x8c V\xf7t\xf1\x03\x22\
+\x7fvH/\xbb\x10\xabK\xbaXlC\xe4\xbfmL\
+\xe9\xe4'\xc4l@\x1fw\x10\xf9o\xe7\xf4r\x001\
+\xdb\xa6\x93\x1eD\xfe\xd0\x9a\xd1\xc9\x13\xc4\xc1\x1b}<\
+\x17\x10\xf9\x8fkz\xe9B\x1c\x8c\xe9\xe4\x04\x22\xff\xd6\
+)\xe9\xe4\x16\xe2\xe1\x80N>7!\xf2\x7f\x9e\xe8d\
+\xb1\x05\xf1P|\xd0\xc9\x08\x22\xffk@/\x01\xe2\xe3\
+\x92N\xca]\x88\xfcK\xe3\x8dN\xde\x1a\x10\x1f[\x0b\
+:y\x80\xc8\xbf\x04z\x19@\xbc\x5c\xd3\xcb!D\x80\
+\xad9\x9d<A\xdcl-\xe8d\xba\x01\x11\xdc\xd2I\
+\xb9\x8f\xd4\x15;\x07\xc7\x17\xe1G8?\xeam!q\
+\x97\xf4r\x0e\x91.\xbd\x5c#i\x1b\xbd\xd1\xd3\x82\x7f\
+\x98\xc5\xe1>\x12\xd6\xfc\xa0\x93Y\x0b\xb2\xf6&t2\
+o!a\xdd\x9b\x19\xff\xeem\xb4\x8bd\x1d\xd3\xcb\x18\
+\xb2\xee\x8e\xe9\xe5\x02\xc9*\x8e\x9e\xf9\x95\xd8C\xaa&\
+tRv \xeb\xad\xf9A'\xd3\x0d\xa4\xaa?\xe5\xef\
+<v\x90\xa6.\xbd<B\xd6\xdb%\xbd\x1c\x22Q\xdb\
+\x0f\xfcFy\xd5D\x92n\xe9e\x00Yg;\x0b:\
+\x89H\xd4\xd1\x9c\xdf{\xed\x22E[s:yk@\
+\xd6\xd8=\x9d\x94{H\xd2\xc65\x97R\x9e!E\x81\
+^\x86\x90\xf5u@/WH\xd2\xe6\x13\x975.\x90\
+\x9e\xc6\x1b\x9d\xcc\xdb\x90uU\xbc\xd0\xc9\xe7&R\xd4\
+~\xe1\xf2\xee6\x90\x9e\x01\xbd\xdcB\xd6\xd5)\xbd\x9c\
+\x22E\xad\x17\xae\xe2\xae@z\x9e\xe8\xa5\x0bYO\x9b\
+\x9ft\xf2R A\x8d\x09W3Fz:%\x9dL\
+ \xeb\xe9\x8a^\x0e\x90\xa2[\xae\xea\x0c\xe9\xb9\xa6\x97\
+c\xc8:\xda+\xe9\xe4\x1e):\xe3\xca\xca.\x92\xd3\
+\x9a\xd1\xc9{\x13\xb2\x86\x22\x9d,v\x90\xa0\xbd\x05W\
+\xf7\xdaDr\xce\xe9\xe5\x12\xb2~\x0e\xe9\xe5\x12\x09*\
+&\xac\xe2\x0a\xc9\xd9\x98\xd2\xc9b\x1b\xb2n6\xa6t\
+\xf2\xd1D\x82NXI\xd9Ar\x0e\xe9\xe5\x0e\xb2n\
+.\xe8\xe5\x18\x09j~\xb0\x9a\x9fH\xcf\x03\xbd\xf4 \
+\xeb\xa55\xa7\x93\x09Rt\xc1\xaa\xbaH\xcenI'\
+\xcf\x05d\xad\x5c\xd3K\x17\x09\xda\xf8`U\x0fH\xcf\
+\x15\xbd\x9cB\xd6\xc9~I'\xb7H\xd1\x11\xab\xdbA\
+r6?\xe9\xe4s\x13\xb2F\x9e\xe8d\xbe\x85\x14=\
+\xb2\xbaK\xa4\xe7\x94^\xae \xebc@/\x01)j\
+\x97\xac\xee\x15\xe9)\x9e\xe9\xa4\xdc\x83\xac\x8b\xc6\x1b\x9d\
+\xbc5\x90\xa2SZt\x90\x9e\x1e\xbdD\xc8\xba\x08\xf4\
+2@\x92\xeeiq\x81\x04\xdd\xd1\xcb!d=l-\
+\xe8\xe4\x11i\xfa\xa4\xc5=\x12\xb4\xbd\xa0\x93\xe9\x06d\
+-\xdc\xd2I\xd9A\x92vh\xf2\x89\x14]\xd2\xcb\x05\
+d\x1dt\xe9\xe5\x1ai\xea\xd3\xa6\x85\x045\xdf\xe9d\
+\xd6\x82\xac\x81\x09\x9d\xccZH\xd3\x05m\xbaH\xd1\x11\
+\xbd\x5cC\xea\xef\x84^\xce\x91\xa8+\xda\x0c\x90\xa4\x09\
+\x9d\x94\x1dH\xdd5?\xe8d\xba\x81D\xdd\xd2\xe6\x14\
+I\xea\xd2\xcb\x13\xa4\xeeF\xf4r\x88T\xdd\xd3f\x88\
+4\xdd\xd0\xcb\x00Ro;\x0b:y@\xb2\x22m\x02\
+\xd2\xd4\x9e\xd3\xc9[\x03RkwtR\xee\x22Y\x91\
+6\x01\x89\x1a\xd2K\x80\xd4\xd9>\xbd\x5c!]\x916\
+\x01\x89j\xbc\xd2\xc9|\x0bRc\xf7t\xf2\xb9\x89t\
+E\xda\x04\xa4\xaaO/\xb7\x90\xfa\xda)\xe9\xe4\x14\x09\
+\x8b\xb4\x09H\xd6#\xbdt!\xb55\xa2\x93\xe7\x02\x09\
+\x8b\xb4\x09HV\xa7\xa4\x93\x09\xa4\xb6\xde\xe9\xa4\x87\x94\
+E\xda\x04\xa4kL/\xc7\x90\x9a\xea\xd2\xc9\x1d\x92\x16\
+i\x13\x90\xae\xd6\x8cN>\x9a\x90z\xba\xa4\x8f\xc56\
+\x92\x16i\x13\x90\xb03z\xf9\x01\xa9\xa7'\xfa\xb8D\
+\xda\x22m\x02\x12V\xbc\xd0\xc9|\x13RG\x1b\x0b\xba\
+xo\x22m\x916\x01);\xa4\x97\x00\xa9\xa3\x0e}\
+\x1c!q\x916\x01I{\xa0\x93\xf7\x02RC\x03\xba\
+\x98 u\x916\x01I\xdb-\xe9\xe4\x10RC\x17t\
+\xb1\x8f\xd4E\xda\x04\xa4mD'\xb7\x90\x1a\x1a\xd1\xc3\
+\x0d\x92\x17i\x13\x90\xb6\xcdO\xfa\x98\x15\x90\xfa\xb9\xa6\
+\x83y\x1b\xc9\x8b\xb4\x09H\xdc\x09\x9dt!\xf5sC\
+\x07C\xa4/\xd2& q\xc53}\x0c!\xf5sC\
+\xbb\xd7\x06\xd2\x17i\x13\x90\xba\x1e}\xdcA\xeagL\
+\xbb>2\x10i\x13\x90\xbc;\xba\x98B\xea\xe7\x92f\
+\x8f\xc8A\xa4M@\xf2\xb6\x17\xf4P\x16\x90\xda9\xa3\
+U\xd9A\x0e\x22m\x02\xd2\xf7\x83.\xb6 \xb5sH\
+\xab1\xb2\x10i\x13\x90\xbe\xc6;=t \xb5\xb3C\
+\xa3Y\x0bY\x88\xb4\x09\xc8\xc0\x11=t!\xf53\xa3\
+\xcd\x19\xf2\x10i\x13\x90\x83':\xe8A\xea\xe7\x81&\
+/\x05\xf2\x10i\x13\x90\x83}:\xe8B\xea\xe7\x82&\
+\x07\xc8D\xa4M@\x16nh\xd7\x81\xd4\xcf.-\x1e\
+\x90\x8bH\x9b\x80,\xb4\xe74kCj\xe8\x99\xd5\x95\
+\xbb\xc8E\xa4M@\x1e\x86\xb4*\x0bH\x0d]\xb0\xba\
+\x11\xb2\x11i\x13\x90\x87\xc6+\x8d\xa6\x90:j-X\
+\xd5G\x13\xd9\x88\xb4\x09\xc8D\x9fFw\x90Z\x1a\xb3\
+\xaa\x13\xe4#\xd2& \x17?i3\x84\xd4\xd2\xf6\x82\
+\xd5<\x17\xc8G\xa4M@.\xf6J\x9at!\xf5t\
+\xc5jz\xc8H\xa4M@6\xc6\xb4\x98\x15\x90z\xda\
+\xfcd\x15\xb7\xc8I\xa4M@6Z3\x1a\xdcB\xea\
+\xea\x88\x15|\xb6\x90\x93H\x9b\x80|\x9c\xd1\xe0\x10R\
+[w\x5c]\x1fY\x89\xb4\x09\xc8G\xf1\xc2\xca\xde\x0b\
+HmmN\xb9\xaa+\xe4%\xd2& #\x07\xac,\
+@jlo\xc6\xd5<n /\x916\x019\xb9g\
+E\xf3\x16\xa4\xce\x0e\x16\x5c\xc5\xf3&2\x13i\x13\x90\
+\x93\x9d\x05\xab\xb9\x84\xd4\xdb\xe1\x82\xcb{i#7\x91\
+6\x01Y\x19\xb1\x92\x8f&\xa4\xe6\x0e\xe6\x5c\xd6s\x0b\
+\xd9\x89\xb4\x09\xc8J\xf3\x8dU\x1cCj\xaf\xf3\xc6\xe5\
+\xdc7\x91\x9fH\x9b\x80\xbc\x1c\xb0\x82\x07\xc8\x1ahE\
+.\xa1\x1c\x22G\x916\x01\x99\xb9\xe2\xca>\xdb\x90\xb5\
+p:\xe7w^\xba\xc8R\xa4M@f6&\x5cQ\
+\xd9\x83\xac\x89\xad;\xfe\xd6|\xd8@\x9e\x22m\x02r\
+\xd3~\xe3jN!\xebc\xff\x81_\x9a\x8fZ\xc8U\
+\xa4M@vv?\xb9\x8a\x00Y+\x9d\xf1\x8c\xbf2\
+=\xdfD\xbe\x22m\x02\xf2\xb3\xf7\xc1\xe5]B\xd6M\
+\xa3\x7f\xf3\xce?)'?\xf6\x91\xb5H\x9b\x80\x0c\xed\
+\xberI\xe59d-m\x0f\xc2\xcd\xe3\xf3t\xfa2\
+y\x18\x9f\xf5\x9a\xc8]\xa4M@\x8eZ?\xb9\x94Y\
+\x1f\x22u\x10i\x13\x90\xa5\x22\x94\xfc\xded\x07\x22\xb5\
+\x10i\x13\x90\xa9\xfdg~c1, R\x0f\x916\
+\x01\xb9*N?\xf8;\xb7\xdb\x10\xa9\x8bH\x9b\x80|\
+5/\xde\xf9\x85\xf2v\x0f\x22\xf5\x11i\x13\x90\xb3\xa2\
+\x7f\xbf\xe0\xdfM\x87m\x88\xd4I\xa4M@\xe6\x9a\x83\
+\xf1s\xc9?|>\x5c\xecA\xa4f\x22m\x02j\xa0\
+\xb1\xd7?\x1d^^\xfe\xb88\xea\xb5!RC\x916\
+\x01\x22\x92\xbcH\x9b\x00\x11I^\xa4M\x80\x88$/\
+\xd2&@D\x92\x17i\x13 \x22\xc9\x8b\xb4\x09\x10\x91\
+\xe4E\xda\x04\x88H\xf2\x22m\x02D$y\x916\x01\
+\x22\x92\xbcH\x9b\x00\x11I^\xa4M\x80\x88$/\xd2\
+&@D\x92\x17i\x13 \x22\xc9\x8b\xb4\x09\x10\x91\xe4\
+E\xda\x04\x88H\xf2\x22m\x02D$y\x916\x01\x22\
+\x92\xbcH\x9b\x00\x11I^\xa4M\x80\x88$/\xd2&\
+@D\x92\x17i\x13 \x22\xc9\x8b\xb4\x09\x10\x91\xe4E\
+\xda\x04\x88H\xf2\x22m\x02D$y\x916\x01\x22\x92\
+\xbcH\x9b\x00\x11I^\xa4M\x80\x88$\xef\x816C\
+\x88H\xf2\xeehs\x0e\x11I\xde5m\x8e!\x22\xc9\
+\xfbA\x9bC\x88H\xf2Nh\xb3\x07\x11I^\x97&\
+\xe5\x06D$y\xcd\x92\x16\xcf\x10\x91\x0c<\xd3\xe2\x0a\
+\x22\x92\x81\x11-\xfa\x10\x91\x0c\xf4h\xb0hBD2\
+P|\xb0\xba{\x88H\x16F\xac\xae\x0f\x11\xc9\xc2.\
++{\xdf\x80\x88\xe4\xe1\x9eU\x0d!\x22\x99\xd8gE\
+\x9fM\x88H.\xeeX\xcd9D$\x1b\xdbsV\xf1\
+\xb2\x01\x11\xc9\xc7\x05\xab\xe8BD2R<ru#\
+\x88HV\xb6>\xb8\xaa\xa7\x0d\x88H^z\x0b\xae\xe6\
+\xbd\x0d\x11\xc9\xcdQ\xc9U\xcc:\x10\x91\xfc\x9cr\x05\
+\xf3.D$G\xc7%\x97\xf5\xb9\x0f\x11\xc9\xd3\xc1\x8c\
+\xcb\x99\xeeBDr\xb5\xfb\xcce\xdcoBD\xf2\xd5\
+\x18\x95\xfc\xce\xec\x04\x22\x92\xb7\xfd\x09\x7f\xef\xb6\x0d\x11\
+\xc9\xde\xe0\x85_\x8b]\x88H-\x1c>\x94\xfc\x95\xf9\
+\xcd>D\xa46\xdag\x8f\x0b\xfe\xd9\xec\xee\xb8\x09\x11\
+\xa9\x97F\xf7\xfc\xfaq\xfa\xb9(\x17\x1f/\x0fW'\
+\x9d\x02\xb2f\xfe\x07\xf3P\x95\x09\x01\x8aG\xea\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0b\xa4\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x01\xd0\x08\x03\x00\x00\x00\xe0p\x22z\
+\x00\x00\x00\xa5PLTE\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00T\xfeI\
+\xe1\x00\x00\x006tRNS\x00\x08\x83\x04<4`\
+ \xa5\x0e\xfa\xbdqj\xf6N\x99%\xc4E\x1a\xab\x8b\
+7\xe9\x9eX-\x93w@\xdfd\x5c\x14\xd8\xb4\xaf}\
+\xf1\xed\xb8\xc8\x0c\xe4I\xd2\x86\xceT\xa2\x8f\x11R\x01\
+t\xdf4\x00\x00\x0axIDATx\xda\xec\xdc\xed\
+:\xa2Q\x1c\x85\xf1\x9d\xe4\xa5RJ\x14!\xf2RS\
+\x891Y\xe7\x7fh\xc3\x8ck.\x86\xea\xa96\xed\xff\
+\xde\xf7\xef\x14\xd6\xfa|; a\xb9\xeb\x13\x87t\x0d\
+K*^:\xa4j\xb7\xaeg\x17\x0ei\x9a\x0c\xf4\xc7\
+\x9eC\x8a\xba\x0fzUvHOw\xac\x7f\xce\x1cR\
+\xd3\xb8\xd2\x1b\xb7\x0eiy\xbf\xbf\xb4\xe1\x90\x92\xed\x8e\
+\xfes\xe4\x90\x8e\xdaH\x1f\x9c:\xa4\xe2\xb3\xfd\xa5}\
+\x874\xb4[\xfa\xd4q\xde!\x01\x85\x96\xa6\xd8\xe1\x01\
+\x09h\xf65\xd5!\x0f\x88\xdefO3\xdc\xf0\x80\xc8\
+\x9d\xf74\xd3u\xce!b\x07\x15\xcdQ\xe2\x01\x11\xbb\
+\xabh\xae\xd2\xd0!R\xd5\xa22\xa8\xef:D\xe9\xa4\
+\xa8L\x06\x13\x87\x08]\x16\x95\xd1C\xd7!:\x17\xca\
+n\xcc\x03\xa2\xb3\xa7E\x5c5\x1c\xa2R\x96x@\xc2\
+\xce\xb4\xa8\xce\xb6C46\xb4\xb8N\xcd!\x12\xf7Z\
+\xc6\x88\x07D\xe2H\xcbi\xb5\x1d\x22p*\xf1\x80\x84\
+\xedky\xfd\x82\x83m\xf9G\xad\xa2\xdft\xb0,\xbf\
+\xa3\xd5\xf46\x1d\xec\xca\x1fjU\x95s\x07\xabr\xd7\
+Z]\xe5\xc0\xc1\xa6\xdc\x0f\xf9P\xa9:X4,\xc9\
+\x8f\xe2\x93\x83=\xbbu\xf9R$$d\xcfd o\
+\x08\x09\xd9\xd3}\x907\x84\x84\xec\xe9\x8e\xe5\x0d!!\
+{\x1a\x1e\xf7'$dO\xe3J\xde\x10\x12\xb2g\xbb\
+#o\x08\x09\xd9S\xf3\xb8?!!{j#yC\
+H\xc8\x9evK\xde\x10\x12\xb2\xc7\xe7\xfe\x84\x84\xec)\
+\xf4\xe5\x0d!!{\x9a=yCH\xc8\x9eM\x8f\xfb\
+\x13\x12\xb2\xe7\xa0\x22o\x08\x09\xd9s\xe7q\x7fBB\
+\xf6T\x8b\xf2\x86\x90\x90=?=\xeeOH\xc8\x9e\x13\
+\x8f\xfb\x13\x12\xb2g\xcb\xe3\xfe\x84\x84\xec\xd9\x93?\x84\
+\x84\xec)\xcb\x1bBB\x06y\xdb\x9f\x8c\x8cI\xb7\xca\
+\x88\x07DiC\xde\x10\x122\xe8H\xde\x10\x122\xe8\
+T\xde\x10\x122h_\x9e\x90\x91\xb1(\x7f\xac\xf5\xe3\
+\x01\x0b\x0b&\xff\xf1\x06!!{\xf2\x87\x0a\x03!\xa1\
+\xb5\xc8\xdd(\x14\x84\x84\x16\x12P\xfe\xe5\x15!!{\
+\x86%\x85\x84\x90\xd07\x1b\xd6\x15\x16BB\x19\x05\x97\
+\x7fyFH\xc8\x9a\xc9@\xe1!$4W\xa8\xf9\x17\
+\x11\x122\xa51V\xa0\x08\x09\xcd\x10x\xfe\x83\x90\x90\
+\x15\xdb\x1d\x05\x8c\x90\xd04\xe1\xe7?DH\xc8\x80\xda\
+H\x81#$\xf4\x95\xda\xc1\xefOH\xe83V\xf2\x1f\
+\x22$\x14\xb4B_&\x10\x12\xfa\x1aM#\xfb\x13\x12\
+\xfa\xc8N\xfe\x83\x90P\xa8\xce+2\x84\x90\xd0_\xf6\
+\xf2/\x12!\xa1\x10U\x8d\xedOH\xc8\xaf\xa7\xa2\xcc\
+!$\xe4\xcc\xe6?\x08\x09\x85e\xcb\xe4\xfe\x84\x84|\
+\xb9\x90U\x84\x84\xac\xe6_\x9e\x11\x12\x0aDY\x96\x11\
+\x12\xb2\x9b\xff $\x14\x82\x0dYGFf\x15\xf7\xb2\
+\x8f\x07,\xef\x97b@H\xc8n\xfe\x83\x90\xd0:\x85\
+\x90\xff $\xb46\xf9G\xc5\x83\x8c\x8c\xdd\xfc\x07\x0f\
+X\x8b|8\xf9\x0fBB\xd9\xc5\x99\xff $\xf4\xed\
+ra\xe5?\x08\x09e\x14i\xfe\xe5\x05!\xa1L\xa2\
+\xcd\x7f\x88\x90\xd0\x1c\xb1\xe7?\x08\x09\xcd\x11}\xfeC\
+\x84\x84\xbeG7\xd8\xfc\x07!\xa1\x99\x12\xc8\x7f\x10\x12\
+\xfa\x80\xfd\x09\x09\xbdJ!\xff\x22BBS\xa5\x92\xff\
+ $\xf4\x06\xfb\x13\x12z\x91X\xfe\x83\x90\xd0W)\
+$\xb4?!!\xcb\xf9\x0f\x11\x12z/\xb9\xfc\x07!\
+\xa1\xdf\xec\xdcIJ,Q\x14EQ1\xf9\x1fm\x89\
+`\x81\xa2\xa2\x1dADA\x90;\xff\xa1\x99\x1dkL\
+\x22\xd2\x22\x22\xefY{\x0a\xf74\xdf[?\xdfE\xdc\
+\xfdAB\x9b\xcc\x7f\x80\x84\x9eK\xe5?@B\xcb\xa2\
+\xf9\x0f\x90\xd0V8\xff\x01\x12\xfa\xa9\xae\x82\xef\x0f\x12\
+\xdad\xfe\x03$\x94\xce\x7f\x80\x84\xd2\xf9\x0f\x90\xd0w\
+;/%CB\x9b\xcf\x7f\x80\x84\xd2\xf9\x0f\x90\xd0\xfa\
+\x1d\x95\x92\x19\x99\xb3R\xf2\x02\xba\xf0/\x05\x12\x8a\xe7\
+?@B\xa3[\xec\x94\x82!\xa1v\xfc\x07F&\x9d\
+\xff\xb0\x801\xf7\xbf)\x05CBM\xf9\x0f\x90P:\
+\xff\x01\x12J\xe7?\xaa@B\xd9\xfcG\x81\x84\xc2\xf9\
+\x0f\x90\x10\xfe\x01$\xe4\xfe \xa1h\xfe\x03$\x84\x7f\
+\x00\x09\xb9?H(\x99\xff\x00\x09\xa5\xf3\x1f\x05\x12\x0a\
+\xe7?@B\xe9\xfc\x07H(\x9d\xff(\x90P8\xff\
+\x01\x12z\xee\xce\xfd\xa3!\xa1\xbd\xe8\xef\xff \xa1\x07\
+\xf7\x8f\x86\x84\xb2\xf9\x0f\x90\xd0\x7f\xf7\x8f\x86\x84\xf0\x1f\
+\xd9\x90\x10\xfe#\x1b\x12\xc2\x7fT4$t]Z\x16\
+\x0b\x09\xe1_^\x8a\x84\x84\xf0\x1f\xaf%BB\xf8\x8f\
+\xb7\xe5AB\xf8\x8fw\xa512\x8b\x93\xd2\xb2\xd4\x05\
+\xe0?>\x97\x04\x09-\x0eK\x1f\x0b\x82\x84\xf0\x1f_\
+\x14\x02\x09\xe1?\xbe(\x84\x91\xc1\x7f|,k\x01\xb7\
+\xf8\x8fU\xb5\x87\x84\xf0\x1f\xab\xeb\x0e\x09=\xe2?V\
+\xd7\x1c\x12\xc2\xbf\x0c\xaa-$t\x80\x7f\x19TWH\
+\x08\xff1\xb0\xa6\x90\x10\xfecx\x1d!\xa1}\xf7\x1f\
+^CH\x08\xff1\xaav\x90\x10\xfecl\xbd !\
+\xf7\x1f]+H\xe8\x1f\xfect\x9d \xa1c\xfc\xc3\
+z5\x81\x84\xf0/k\xd6\x04\x12\xc2\x7f\xac_\x07H\
+\xc8\xfd\xa7oJHh\xcf\xfdg\xd0xH\x08\xff\xd1\
+\xab\xa9 \xa1S\xf7\x9fI#!!\xfcG\xbb\xa6\x80\
+\x84.K\xf3i8$\x84\x7f\xe9\xd9_CB\x07\xdb\
+\x936\xb7\xdf\xe7\xf7\xdb\x937\xc7Wb\xbf\xd7n\xcd\
+\xab\x9d-\xad\xca\x00d\x002\x00\x19\x80\x0c@\x06 \
+\x03\x90\x01\xc8\x00d\x002\x00\x19\x80\x0c@\x06 \x03\
+\x90\x01\xc8\x00d\x002\x00\x19\x80\x0c@\x06 \x03\x90\
+\x01\xc8\x00d\x002\x00\x19@x\x06\x10\x9e\x01\x84g\
+\x00\xe1\x19@x\x06\x10\x9e\x01\x84g\x00\xe1\x19@x\
+\x06\x10\x9e\x01\x84g\x00\xe1\x19@xO\xec\xda\xdbR\
+\xe2@\x14\x85\xe1=\x84\x80\xa0@EP\x08\x87p\x1a\
+T@\x18\x1df\xfa\xfd\x1f\xcd[/\xb4\x03\x98\xae\xda\
+]\xfb\xff\x9e\xe1\xafu\xb5\x08\xc08\x020\x8e\x00\x8c\
+#\x00\xe3\x08\xc08\x020\x8e\x00\x8c#\x00\xe3\x08\xc0\
+8\x020.i\xe8R\x17\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00?\xd0\xd4e%\xf0\xe3\x13\x08\x02\x00\
+\x01\x80\x00@\x00 \x00\x10\x00\x08\x00\x04\x00\x02\x00\x01\
+\x80\x00@\x00 \x00\x10\x00\x08\x00\x04\x00\x02\x00\x01\x80\
+\x00@\x00 \x00\x10\x00\x08\x00\x04\x00\x02\x00\x01XG\
+\x00\xc6\x11\x80q\x04`\x1c\x01\x18G\x00\xc6\x11\x80q\
+\x04`\x1c\x01\x18G\x00\xc6\x11\x80q\x04`\x1c\x01\x18\
+\x97\xa4\xba4\x05\x00\x00\x00\x00\x00\x00\x00\x80\x18%\xfb\
+\xd5 \x9b\xa4\xf5~o\xdch\x09\xa2\xd2j\x8c{\xfd\
+z:\xc9\x06\xab}\x22\x1e\xcdl2,\x0e\xef\xcbE\
+\xe7\xee\xa9\xf68\xcdo6\xdb\xdb\xdd\xdbz>zn\
+\xbbO\x0e\x82\xa8\x1c\xdc'\xed\xe7\xd1|\xfd\xb6\xbb\xdd\
+nn\xf2\xe9c\xed\xe9\xae\xb3X\xbe\x1f\x8a\xe1$k\
+\x8a;OM\x10\x95\x9a;\xcf\xb9\x01l\x05Q\xf9]\
+q\x00/\x82\xa8\x8c*\x0e\xc0e\x82\x884]\xd5\x01\
+\x8c\x05\x11\x19W\x1e\xc0I\x14I\xea\xba\xe8\x9b\xc7S\
+\xe5\x01\xdc\x8b\x22\x9cB\xcb\xdcW\x1e@7\x11=\x08\
+\xa0D\xd2\xad<\x00\x97\x8a\x1e\x04P\x22u\xd5\x07\xd0\
+\x11=\x08\xa0\xc4\x22@\x00\xb9\xe8A\x00%\xf2\x00\x01\
+\x1cE\x0f\x02(q\x0c\x10@{/j\x10\x80\xdf\xbe\
+\x1d \x00W\x88\x1a\x04\xe0W\xb8\x10\x01\xccD\x0d\x02\
+\xf0\x9b\x05\x09\xe0A\xd4 \x00\xbf\x87 \x01\xbc\x8a\x1a\
+\x04\xe07\x0f\x12\x80\x1b\x88\x16\x04\xe05pa\x02\xe8\
+\x89\x16\x04\xe0\xd5\x0b\x14\xc0\x1f\xd1\x82\x00\xbcj\x97\x06\
+\x10\xdd-\x8c\x00\xbc\xb6\x97\x06\x10\xdd-\x8c\x00\xbc^\
+.\x0d \xba[\x18\x01\xf8d.T\x00KQ\x82\x00\
+|\x96\xc1\x02\x98\x8a\x12\x04\xe0s\x0a\x16\xc0N\xb4H\
+\x94\x11Mv\xc1\x02\xe8\xfe\x12\xa8\x97t\x83\x05\xe0\x86\
+\x02\xf5Rwq\x00Q\xde\xc2\xf0\x8dN\xc0\x00\xfe\x0a\
+\xd4\xcb\x03\x06\xb0\x16\xa8w\x0c\x18\x80\xfb'P\xae\xe5\
+B\x06\xd0\x17(W\x5c\x11@\x94\xb70|m\x164\
+\x80\x8d@\xb9\xcd\x15\x01Dy\x0b\xc3\xd7^\xaf\x08 \
+\xca[\x18<w\xb0p\x01\xfc\x17|\xb0ww\xbbi\
+\x03A\x18\x86\xa7\x84\x18\x84MqA\x98\xdf\x04\x92\x82\
+Q\x5c\x11\x024{\xff\x97\xd6\xce8\x18U\xeaIw\
+\xf1v\xd6\xf9\x9e\xe3=|\x0f?\xed\xa86\xb0\x09 \
+\xc8Y\x18\xfc\xd5\xa1\xe6\x00b\x02\xd5\xe2\x9a\x03\xd8\x11\
+\xa8\xb6\xab1\x00\xb1 P\xec\x9b\xa9;\x80\x88@\xb1\
+\xa8\xf6\x00R\x02\xc5\x96\xb5\x07\xf0F\xa0XQ{\x00\
+=\xcc\xc2\x14\xfb\xd2\xb3\x0a\x00\xb3\xb0\xa6\x98\x98\xfa\x03\
+H\x08\xd4\xea\xff{\x00\x81o\xe0\xe1\x0f'\xbb\x000\
+\x0bk\x8a\xefv\x01`\x16\xd6\x10?\x8d]\x00\x98\x85\
+5\xc4\xc8K\x009\x81R\xb9\x97\x006\x04Jm\xbd\
+\x040%Pj\xea%\x00\xd3!P\xa9c\xfc\x04p\
+$P\xe9\xe8)\x80\x8c@\xa5\xcc1\x80 \xcf\x07\xc1\
+U\xec\x18@\x90\xe7\x83\xa0r\xb7\xb3\x0d\x00\xb3\xb0F\
+X\x18_\x01\xac\x09\x14\x8a\xac\x03\xc0,\xac\x11R\xeb\
+\x000\x0bk\x847\xd7\x00\x82<\x1f\x04\xd6s0A\
+\xc6F\x9b@\x9d\xb6\xb1\x0e\x00\xb3\xb0&H\xec\x02h\
+\xc0\xd7\xa8 \xba\x1e\x03X\x11\xa8\xb3\xf2\x14\x80x&\
+P\xe6\xd9\xf8\x0c`O\xa0\xcc\xdek\x00-\x02er\
+\xf7\x00\x82<\x1f\x04\x1f6\xee\x01\x04y>\x08>L\
+\xdd\x03\x08\xf2|\x10\x94:\xc6o\x00s\x02U\xe6\x9e\
+\x038\x13\xa8\x92\xb9\x04\x80YX\xf8\x86.\x01`\x16\
+\x16\xbc\xbb\xaf\x1e\x03\x10\xf7\x04\x8a,\xcc\x0d\x02\xc0\xf9\
+\xa0p\xad\xbd\x070#P$\xf5\x1e\xc0+\x81\x22\xaf\
+N\x01`\x16\x16\xba\x1f=\xaf\x01\x88G\x025\xda\xe6\
+\x16\x01\xe0|P\xb0\x92\xff\x10\xc0\x98@\x8d\xf1M\x02\
+\xc0\xf9\xa0`\xad<\x07 \x8abX\x8a/^\xc4\x86\
+m\xd9\xb8\xd4e'6\x13\xe9\xc5R\x9cY&\x0e\xa2\
+U\xc9\xd9\x83H\xae\xfa\x955\x8b\xd8\x93\x98\xb3#{\
+\x1fT\xf6l$\x1eY[L\xc4\xfdo\x13\xd1\x16\xf2\
+`$\xf6lPy?\xb29{\x12\x11[\xb3~%\
+\xb9z\x109kU\x0e\x22\x13g\xb6\x14\xe9\xc5L\x9c\
+X\x97\x8dK[\xb6a/\x22\xbe\x18\x96\x8a\xc28\x04\
+\x00\x9f\x1a\x02\xf8\xe4~\xb5K\x07\x04\x00\x00 \x0c\x83\
+\xb4\x7f\xe9\x07\x19d@\x808\x01\xe2\x04\x88\x13 N\
+\x808\x01\xe2\x04\x88\x13 N\x808\x01\xe2\x04\x88\x13\
+ N\x808\x01\xe2\x04\x88\x13 N\x808\x01\xe2\x04\
+\x88\x13 N\x808\x01\xe2\x04\x88\x13 N\x808\x01\
+\xe2\x04\x88\x13 N\x808\x01\xe2\x04\x88\x13 N\x80\
+8\x01\xe2\x04\x88\x13 N\x808\x01\xe2\x04\x88\x13 \
+N\x808\x01\xe2\x04\x88\x13 N\x808\x01\xe2\x04\x88\
+\x13 N\x808\x01\xe2\x04\x88\x13 \xee\x9e\xb4\x01\x1d\
+\x9bg.\xb6\x02y\xe8\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x0b\x9a\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x01\xd0\x08\x03\x00\x00\x00\xe0p\x22z\
+\x00\x00\x00\xa8PLTE\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+,\xdfH\x86\x00\x00\x007tRNS\x00\x0c8\x83\
+d\x1c\xa5\x0e\x87\xfa?\xef\xb0\x8d~\x05\x99\x9f\x02\xf5\
+\x93X\xe9\xb6\xabC\xc4\xc0K\x08\x5c!\xc9\xbb\xdfx\
+pSG\xcf4\x14lh&\xd5tO`\xe4/+\
+\xd9\x11\x18sK{p\x00\x00\x0ajIDATx\
+\xda\xec\xda\xbb\x09BQ\x14\x00\xc1\xa3\xf8\x01\x13\xc1\xdc\
+\x0eL\xc5\xfe;\xb3\x83'\x18\xc8\x95\x9d\xa9a\xc3\x9d\
+\xff\xb4[\xcb}\xf8\xa9\xf3k-\xa7a\x8b\x00\x10\x00\
+\x02@\x00\x08\x00\x01 \x00\x04\x80\x00\x10\x00\x02@\x00\
+\x08\x00\x01 \x00\x04\x80\x00\x10\x00\x1bn\xfb\xb5<\x06\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00K\x18\xa6P\x04\x80\x00\
+\x10\x00\x02@\x00\x08\x00\x01 \x00\x04\x80\x00\x10\x00\x02\
+@\x00\x08\x00\x01 \x00\x04P'\x808\x01\xc4\x09 \
+N\x00q\x02\x88\x13@\x9c\x00\xe2\x04\x10'\x808\x01\
+\xc4\x09 N\x00q\x02\x88\x13@\x9c\x00\xe2\x04\x10'\
+\x808\x01\xc4\x09 N\x00q\x02\xa8;\xae\xe59\x00\
+\x00\x00\x00\x00\x00\x00\x00\xc0\xf7\xae\x87\xb5\x5c\x86\x0f<\
+\x81\x08\x00\x01 \x00\x04\x80\x00\x10\x00\x02@\x00\x08\x00\
+\x01 \x00\x04\x80\x00\x10\x00\x02@\x00\x08\x00\x01 \x00\
+\x04\xf0f\xe7\xce\x92\xd2\x8c\xa2(\x0aoETDE\
+\xb1EAlQ\x88T\xa2\xa8g\xfe3\x0bP\xa9\xca\
+\x8b\x95\x80^\xfe\xdb\x9c\xf5Ma\xef\xe7\x05\x0e\x00\x0e\
+\x00\x0e\x00\x0e\x00\x0e\x00\x0e\xe0\x1c\x07p\x8e\x038\xc7\
+\x01\x9c\xe3\x00\xceq\x00\xe78\x80s\x1c\xc09\x0e\xe0\
+\x1c\x07p\x8e\x038\xc7\x01\x9c\xe3\x00\xceq\x00\xe78\
+\x80s\x1c\xc09\x0e\xe0\x1c\x07p\x8e\x038\xc7\x01\x9c\
+\xe3\x00\xceq\x00\xe78\x80s\x1c\xc09\x0e\x10[\xbd\
+\x16\xd5\xb6\xa5e\xbc\xfd]\xb5\xef\xea\xa8Z#CJ\
+v[\xaa\xd8\x0fC:\xce[\xaa\xdc\xaf\x86!\x11\x9b\
+-Ep\xc2\x03\x12q\xd8V\x14\x0f< \x09\x07m\
+E\xd2\xe5\x01\x098V<\x83#Cd{\x8a\xa9\xc3\
+\x03\x22\xab)\xae\x9d\xa6!\xa2}\xc5\xb6\xce\x03\x22\xba\
+S|O< \x9a{\xa5\xe0\xf5\xd4\x10\xc5Hi\x98\
+\xf0\x80(6\x94\x8a\xe7\x17C\xd5\x1aWJG\xff\xd6\
+P\xad\xc6\x89R\xd2\x7f3T\xa9\xf1\xa0\xb4\xd4y@\
+\x95\x1a]\xa5\xe6cl\xa8\xca\xd1@\xe9\x19>\x1a\xaa\
+q\xd4Q\x8a\xde\xaf\x0dUh\xee(M<\xa0\x12\xcd\
+u\xa5j\xed\xd2\xb0j\xcd'\xa5k\xed\xc6\xb0Z\xa7\
+\xafJY\xef\xcc\xb0J\xa7\x13\xa5\xad\xb7kX\x9d\x97\
+g\xa5\xaeunX\x95\xdb\xbe\xd2\xd7\xda4\xcc\xf9\xdc\
+_j\x1f\x1aV\xe1\xad\xae<\xb4\x0f\x0c\xe1\x8d?\x94\
+\x8dcCh\x8fCed\xcf\xe0y\x7f\xa9f\x08\xe9\
+\xfa]\x99\xd97\x84s\xb1\xa5\xec\xdc\x19B\xb9\x5cS\
+\x86\xee\x0da\xdc\xf4\x94%\x22\x22a\x9ce\xba?\x11\
+\x91\x5c\xf3?\xe1\x5c\xf1\x80,\xf3?\x22#\x93\x8c\xcd\
+\xac\xf7\x97~\xf2\x80,\xf3?\xe1tIHd\x99\xff\
+\x11\x11\x91\x04\x1c\xab\x04DD\xf2\xcc\xff\x88\x88\xc8W\
+\x15\x92\xff\x99\x22\x22\xf2\x05\xe5\xe4\x7f\xa6\x88\x88,\xaf\
+\xa0\xfc\x8fDDdYe\xe5\x7fDDd9\xc5\xe5\
+\x7fx\xc0\x92\x8a\xcb\xff\xcc\x91\x91Y\x5cq\xf9\x1f\x89\
+\x88\xc8\xc2\x8a\xcc\xff\x88\x88\xc8\xc2\xca\xcc\xff\x88\x88\xc8\
+b\x8a\xcd\xff\x843$!\x91e\xfe\x87\x88\xc8\x22J\
+\xce\xff\x84\xb3ua\xc80\xffCF\xe6?\x8a\xcf\xff\
+\x84\xd3##\x93e\xfeG\x22\x22\xf2O\xc5\xe7\x7f\xc2\
+i\xf1\x80,\xf3?3DD>\xe3%\xff3ED\
+\xe4\x13\x9e\xf2/\x22\x222\xc7\xfeDD\xfep\x96\xff\
+\x99!\x22\xf2\x97\xc3\xfcO8\xdb\x86<\xf3/DD\
+\xd8\x9f\x88\xc8\x9c\xd3\xfc\xcf\x14\x11\x91\x19\xb7\xf9\x9fp\
+F\xe6]\x9e\xf9\x9fp6\xcc\xb7\x5c\xf3?\x12\x11\x11\
+\xdf\xf9\x1f\x22\x22\xde\xf3?\x12\x11\x11\xdf\xf9\x9fp\xba\
+N\x1f\x90{\xfe'\x9c\x81\xcb\x88H\xfe\xf9\x1f22\
+\xde\xf3?\x12\x11\x11\xdf\xf9\x1f\x89\x88\x88\xef\xfc\x8f\x88\
+\x888\xcf\xff\xf0\x00\xef\xf9\x9fp&n\x12\x12e\xe5\
+\x7fDD\xc4y\xfeg\x86\x88\x88\xe7\xfc\xcf\x0c\x11\x11\
+\xcf\xf9\x9fp\xea\xa5GD\x0a\xcd\xff\x88\x8c\x8c\xf3\xfc\
+\x8fDF\xe67{w\xba\x948\x10Eq\xfc\x22\x88\
+\x15VY\x83\xca&\xea\x00\xb2\x89\xd4x\xdf\xff\xcd\xa6\
+\xd0)\x07Q!\xa1\xd2c\xfa\x9e\xf3\x7f\x85>\x1f\xa8\
+\xa4\xf3\x03\x9b\xff!\x22\x82\xce\xffl#\x22\x82\xcc\xff\
+\x10\x11A\xe7\x7fD\x88\x88`\xf3?\xc9\xd5\x0b\xd5Z\
+\x10\xfc\xcf6\x22\x22\xc8\xfcOrU;j)\x18\xfe\
+G\x84\x88\x086\xff\xc3\x05\xa0\xf3?\x22dd\xe0\xf9\
+\x17\x11\x22\x22<\x7f\x22\x22\xb8\xfcOre\xd5\xf70\
+\xf9\x9f\xbf\x11\x11\x01\xe6_\x92j\xa9>\xc7\xf3\xc7F\
+D\x90\xf9\x9fm\xe8\x88\x086\xff\x93\x5cO\x9e~>\
+\x8e\xce\xfflCFD\xc8\xff$\xd7\x83\x87\x0b \xff\
+\xf3\x1a,\x22B\xfe\xe7=HD\x84\xfc\xcf{\x90\x88\
+\x08\xf9\x9f\xe4+xDH\x90\xff\xf9\x10\x1c#C\xfe\
+g?,F\x86\xfc\xcf~X\x88\x08\xf9\x9f\xcf!!\
+\x22\xe4\x7f\xbe\x0a\x07\x11!\xff\xf3}\x08\x88\x08\xf9\x1f\
+\xd7\x0dR\x8d\x88\x90\xff9\x94}F\x86\xfc\xcf\x81\x00\
+\x10\x11\xf2?\x873\x8e\x88\x90\xff9\x96mD\x84\xfc\
+O\x84\x0c#\x22\xe4\x7f\xa2d\x17\x11!\xff\xf3\x9f\xcb\
+\xa4\x0b\x11!\xff\x13#\x83\x88\x08\xf9\x9f\x1f\xa8\x97\x1e\
+D\x84\xfcO\xbc\xac!\x22\xe4\x7f~\xa8j^\xd3\x10\
+\xf9\x9f\xd8\x99BD\xc8\xff\x9c\x90!D\x84\xfc\xcf\xcf\
+\xd6\xd4\x93#\xffc\xa2\xb2\x9e\x18\xf9\x17#e5r\
+<\x7f\x93U4~\xe4\x7f,\xb5\xd4\x98\x91\xff1\xd6\
+\xbd\xc6\x89\xfc\x8b\xbdfz4\x9e\xbf\xe9b!\x22\xe4\
+\x7f\x0c\x16\x03\x11!\xffc\xb2\xc8\x88\x08\xf9\x1f\xa3\xad\
+\xa2-\x80\xfc\x8f\xd9\xa2!\x22\xe4\x7f\xecv\x1c\x11!\
+\xffc\xbb\xa3\x88\x08\xf9\x1f\xe3\x1dFD\xc8\xff\xd8\xef\
+\x10\x22B\xfe\x07\xa1o\x11\x11\xf2? m\xbeY\x00\
+\xf9\x1f\x94\xbeDD\xc8\xff\x00\xf5\x05\x22B\xfe\x07\xaa\
+\xfd\x05\x90\xffAk\x0f\x11!\xff\x03\xd7.\x22B\xfe\
+\x07\xb1\xe4\x11\x91\x990\x9f\x9a\x0e\xf5-\xf2?\xa0\xbd\
+32\xe4\x7f@{ed\xc8\xff\x00\xb7ed\xc8\xff\
+ \xd7\x0b\xc9\xff`\xd7+\x91\xff\xc1\xae\xda!\xff\x83\
+]5O\xfe\x07\xbbz\x8d\xfc\x0fv\xf5K\xf2?\xe0\
+5\xc9\xff\x80W&\xffsZ\xf5\xcc\xf4|\xbe\x99\x14\
+\xaeV\xad'\xaf?\x85\xcb\x02\xf2?\x17O\xad\xd5U\
+a\xb2\x99\x9fO3u9\xd0`\xfe|V\xe8>\xf4\
+s\x8f\xcbJ\xb6\xdc\xac\xe5K\xe1\xcdp\xbc\x18\xb5\x8b\
+\x81\xee\xe4\xf7\xc3\x90\x0a\x1e\xff\xd2\xd5\x9d\x82b{\xb4\
+\x18\x0fo\xc2R\xbe\xd6,g+\xcb\xc7\x5c\xff\xa1[\
+8{\x9e\x0f\x04\xe36\xd4\x1d\xda\xf9G\xde\xbch\xb4\
+B\xf1\xbb{4\xfe'Lx\x00m\xf1\xbc\x19\x18\xff\
+\xd3Nx\x00\xea\xf5/\xa2m9(\xfee\xa0I\x0f\
+\xc0\xffW\xe2\xfd\x00\xe7\xfc\xa5\xa5\x11\x13\xa0o\x22Z\
+\x01\x0e\xffSN|\x00\xd7\xe2\x7f\xab\x00\x86\xff\xb9N\
+|\x00\x0d\x0b_Ew\x1b \xfcO\xb5\x91\xf8\x00\xd4\
+\xc4{\x91_\x0d\x0c\xfe\xe7Y\xa3&`\x17\xe3\x0b\x0d\
+\x08\xfe'\xe7`\x0051\xd1Y\x11\x81\xff\xb9t0\
+\x80\x85\xd8hR\x04\xe0\x7f\xc6\x0e\x06\x10X\xf8q\xf4\
+\x86\x88\x98\xe7\x7f2\x81\x83\x01\xa8\x99\xdbq\x9b\xb6u\
+\xfe\xa7\xa0.\x06\xb0\x14+m\xd6\xc6\xf9\x9f\xa5\x93\x01\
+t\xc4L\xf3\xb5m\xfe\xa7\xe3d\x00k\xb1\xd3`d\
+\xf0Q\xf7\xbfFN\x06\xa0\xde\xbf\x22\xfd\x80\x88\x98\xba\
+\xf0\xf2\xb1\x17u3\x80\x95\x18\xeaea\x97\xff\xe9j\
+\xf4\x04\x16\xc9zY\x98\xe5\x7f\xb2\x8e\x06p+\xa6\x9a\
+\x8e\xad\xf2?\xb7\x8e\x06P\x14[\xfd\x1eZz\xcb\xb1\
+S1\xee\x00`\xae\x85}BDL\xf2?su5\
+\x00sRN\xe6\xc6\x22\xff\xd3\xd7\x18\x096\x95\xdc\x0b\
+\xfd\xbf\xeb\xf8\xa9\xa6\xb3\x01\x0c\x85y\xd0\xd0\xd9\x00\x02\
++o\xcbLWm\xc4\x1e\x00\xd6\xb50\xebM\xd4\xdd\
+\x00\x1e\x85\xa5\xbeY\xfc\x01\xa0]\x0b\xb3]-\xfe\x00\
+\xe0\xae\x85\x99n\xe1p\x00j\xe1\x9b\x09\xe3]\xa8\xcb\
+\x01\x10\xcdK}W\x1a+\xe1\xbff\x18\xeb\xce\xe9\x00\
+J\xc2R^\xe9\x84\x01`^\x0b3\xda\xda\xe9\x00\xd4\
+w9\xe5\x0f{w\xb7\x948\x10\x84axDL%\
+\x08l\x14\x10\x04u\x83\xfc\xadX\x05\xa9\x95\xad\xb9\xff\
+;\xdb\x9aN\x8d\xe7f\x9c\xb6\xa7\xf3=\xe79{\x0f\
+\xbfL\xabwc\xe3\x06\x80\xa7\xf3\x85;G\x0e 7\
+ Z\x1e9\x80\x95\x01\xd1\xd6\x91\x03\xb8\xd5\xf3\xfb\x8c\
+J\xf7\xb7\x11\x03 ]\x7f?W\xb8\x0f\x1b;\x80\xda\
+\x80`\xf5\x97\x03\xc0\x05}U\xa6\xad\x02\xc0,L\x8d\
+*z\x00\x85\x8eGt\x94z.\xa2\x06@pEG\
+\xb0\x9e\xfd*\x833\xea\x9a\x1c\x19\x02\xc8\x0c\x88\x951\
+\x04p1 \xd6\x85!\x00\xab\xe0)e\xad\xfeY\x8e\
+\x00pKW\xac}\xb4\x00\xf4\xbe\xa6\xa1\xca\xa6e\x00\
+\x98\x85)1\x0c\x0b\xa0+\xe7\x83\xf4z`\x09\xc0&\
+~PM\xaf\x1b\xdb2\x00\xcc\xc2t\xd8\x05\x06\xd0\xa1\
+\xf3A:\xe5m\x03\xc0,L\x87\x15S\x00\x13\xcc\xc2\
+D\xba\x9f0\x04@pV_\xa4\x0f\xcb\x11\x80\xca\x87\
+\xd5t\xa8\xd9\x02(\x0d\x08T\xb2\x05p0 \xd0\xa1\
+u\x00\x98\x85i\xf0\x5c\x84\x06\xd0\xc1\xf3A\x9a\xf4l\
+\xeb\x000\x0b\xd3`\xdb>\x00\xcc\xc24\xc8\x18\x03x\
+5 \xce\x85)\x00\xf2f@\x987\xcb\x19\xc0\x93\x01\
+a\xf6\x01\x01`\x16\xa6\xc0\x985\x80\xb9\x01a\xe6\x01\
+\x01`\x16\xa6\xc0C@\x00\x98\x85\xa5\xef\xb7\xe5\x0d@\
+\xe1\xa5\x95\xb4\xcdB\x02\xc0,,}#\xe6\x00\x96\x06\
+DY2\x070\xc1\xf9 Q~MB\x02\xc0,,\
+y\x7f-_\x00J\xef\xad\xa6\xad\xff\x1d\x01\xe0|P\
+\xba\xca\xef\x08\x00\xe7\x83\xd2u`\x0f\xa0\xb82 \xc6\
+U\x11\x14\x00fa\xa9\x1bX\xfe\x00N\x06\xc48\xfd\
+@\x00\x0b\x03b,\xc2\x02\xc0,,u\xaf\xcc\x01\x90\
+\xaaZ\x92\x95\xb3&s2\xf4\x16\x8d\xcc\xbbk\x94\xde\
+\xb41\xf2rrM\xc6\x9f6\xce\x89l\x9d\xa3\xf3N\
+\xfaN\xed\xbc\x90\x19\xd99g\xf2\xe4\xec\x9dG2\xf0\
+z\xe4\x0f\xe9\x91\x81\xf7H\xf6\x0e}~&;gF\
+^H\xed\xf4\x9dwrt\xb6\xce\x89l\x9c\xf1\xa7k\
+\x92\x93\x917m\x94\xde]#\xf3\x16\x8d\xa17'k\
+\xb2r\x96\xa4\xaal@\x00\xd0i\x08\xe0\x7f\xbbt@\
+\x00\x00\x00\xc20H\xfb\x97~\x10F\x06p\x05\xc0\x15\
+\x00W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\x01p\x05\
+\xc0\x15\x00W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\x01\
+p\x05\xc0\x15\x00W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\
+\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\x01p\x05\xc0\x15\x00\
+W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\x01p\x05\xc0\
+\x15\x00W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\x01p\
+\x05\xc0\x15\x00W\x00\x5c\x01p\x05\xc0\x15\x00W\x00\x5c\
+\x01p\xf7\xa1\x0d\x1e\x96\xcb>\xb3\x17\xf9I\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x0f\x1f\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x01\xde\x08\x03\x00\x00\x00\xdazC\x0a\
+\x00\x00\x00\xa5PLTE\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00T\xfeI\
+\xe1\x00\x00\x006tRNS\x00\xf7\xed\xfb\xe9|\x15\
+\x19\x05\xdc\x13\xd3\xd652\xf0\x1c.\x08G*\xd0\xe5\
+\xd8$\x0cE\xf4\xcd;tSL\x10\x9cZA\xc1\xb5\
+m0\x1f\xa8\x95f\xc8\xbb\xaf\xa2\x87\xe0\x8e`\x80c\
+\x96\xef\xba\x00\x00\x0d\xf3IDATx\xda\xec\xdd\x8b\
+R\xe20\x14\xc6\xf1S\x03J\xb9\x88\xb0PT\xaer\
+)\x0a\x8ae\xd1\xf3\xfe\x8f\xb6ug\xc7qV\xc1\x22\
+\x84\x9e\xe4|\xbfW\xf8ghh\xd2\x84<\xf30}\
+\x19\xac\x97\xe3\xc5\xf3\x22\x19o^\xe7\xc3\xfe\x05\x81\x0e\
+\xa5\xfe<\xa9\x04\xfcI\xbd\x97\x0c\xa67\x04^k\x15\
+W]\xde\xc1\xb4\x97\xa3;\x02?5\xd6!g`f\
+\x83k\x02\xdf\x94\x07m\xce\xae7\xc0\x9c\xc0+\x8dq\
+\x97\xf7c\xe2a\x89\xc0\x0f\xb5\x98\x7f\x22*\x9e\x13\xb8\
+\xef>\xe6\x9f\x0a\x96\x98\x0d\xb8\xee*1|\x00\x93`\
+\x08\xb8\xacT\x0c\xf8@f\xfc@\xe0\xa8i\x95\x8f \
+X\xe3\xd5\x80\x93n\x96|$\x85G\x02\xe7\xf4C>\
+\x9e\xa7\x1a\x81SJ\xaf\x86\x8f\xc9l\xb0N\xe0\x92\x8b\
+\x15\x1f[8%pE?b\x0b\x96\xf8\x11p\xc4K\
+\xc0V\x84\x98\x09\xb8\xa0\xb4a[L\x91@\xba\xe63\
+[\xb4\xc2\xfa\x80p\xe5'\xb6*\xea\x13\x08vUe\
+\xcb\xcc\x80@\xac\xeb\x90\xedK\x9a\x042\xb5\x22>\x85\
+\xde\x15\x81D\xad\x02\x9fFtI O\xda\xffT\xba\
+#\x02i\xd2\xfe\xa7c\xb0@(M\xda\xff\xa4^\x09\
+$I\xfb\x9f\xd8\x18\xdb\x86\x05I\xfb\x9f\xdc\x02#@\
+\x8c\xb4\x7f\x0eb\xbc\x10\x10\x22\xed\x9f\x8b\x15\x16\x88E\
+H\xfb\xe7d\x86\x11 \xc0\x1e\xfd1\x02<\x94\xf6\xcf\
+\xd1\x0c\xf3\x80\xfdx\xd6\x9fy\x85\x11\xb0\x0f\xef\xfa3\
+\xc7\xf87\x98\x9d\x87\xfd\x99\x17\x04\x19y\xd9\x9fyI\
+\x90\x89\xa7\xfd\xb1.\x90\x91\xb7\xfd\x99\xb16\x98\x81\xc7\
+\xfd\xd9\x0c\x09\xbe\xe1s\x7f\xe6\x00\x9b\x85O\xad!\xa9\
+?s\x01G\x89\xec\xe4{\x7f\xe6N\x99`+\xff\xfb\
+3\xcf\xf0Bh+\x0d\xfd\x99\xc7\x04_\xd3\xd1\x9f\x19\
+\xdf\x0c}MK\x7f6\xbf\x08>S\xd3\x9f\xf9\x0c\x7f\
+\x05>\xf3\xa4\x7f\x10u\xaa\xed\xa7^\xbb\x1aFu\xde\
+\xaa\x82\xfd!\xffs\xbc\xbf\x09\xe3\xcd\xe3\xa8v\xd1\xa4\
+\x0fJ\xe5\xeb\xdap\xbey\xeeu\xb12\xf8\x1d\x97\xfb\
+W\xc7\xf3Z\x93vz\x18\x0d\x92*&\x82;\xb8\xda\
+\xbf\x90L.(\xa3\xbb\xdbb\xdc\xe5\x7f\x0c\x0e\x13\xfb\
+\xc8\xcd\xfe\xd1\xba_\xda\xfb*\xa2\xe2,\xe07\x05\xdc\
+5\xf1\xce\xc9\xfeA2\xa5\x9f\xb9\x9b,\xbax#\xf8\
+\x91\x83\xfd\xc3A\x99\x0e\xd0\x1c%]^\x13\xfc\xe5^\
+\xff\xca\xa4D\x87\xbay\x89o\x09R\xce\xf5\xef\x0c\xe9\
+8\xb0Q\xfc\x8dk\xfd\x0bs<\xbb%\xb3\xdc\xdf,\
+q+\x84h\x96\xfbWp\x0a\xb0lv\xfb\x9b5\x9e\
+\xda\xb2\xd9\xed\xff\x1b\x1b:\x85\xb3\xdb?\xc6f>\xe1\
+\xb6\xf5\xc7W=:X\xed\x1fL\x08d\xb3\xda\xff\x0c\
+\x8f\x7f\xe9\xac\xf6\x8fZ\x04\xb2Y\xed\x1fb\x0b\x9ft\
+\x8d3\xb6'\xc4\xad\xc0\xd2\xa1\xbfnv\xfb\xe3\xd6\x07\
+\xe9\xee\xd1_5\xf4\xd7\x0d\xfduC\x7f\xdd\xd0_7\
+\xf4\xd7\x0d\xfduC\x7f\xdd\xd0_7\xf4\xd7\x0d\xfdu\
+C\x7f\xdd\xd0_\xb7K\xf4W\x0d\xfdu\xb3\xda\xbf\x83\
+\xfe\xd2\xa1\xbfn\xe8\xaf\x9b\xdd\xfe8\xb9I:\xf4\xd7\
+\x0d\xfduC\x7f\xdd\xd0_7\xf4\xd7\x0d\xfduC\x7f\
+\xdd\xd0_7\xf4\xd7\xad\x86\xfe\xaa\xa1\xbfn\xe8\xaf\x1b\
+\xfa\xebf\xb5\x7f\x15\xfd\xa5C\x7f\xdd\xd0_7\xf4\xd7\
+\x0d\xfduC\x7f\xddju~\x87\xfe\xfa\xe4\xd5\xff\x9c\
+@\x82\xbc\xfa\x17\xcfp3\x90\x04\xb9\xf5g\xae\xe3t\
+\xf8\xfc\xe5\xd7?\xd5\xc5\xdd\xde{\xf2\xab?s0\x22\
+\xd8\x83o\xfd\x99\x83!Af\xfe\xf5g6\xb8%(\
+3\x1f\xfb3\x9bG\x82?\xec\x9d\xdbR\x1aA\x14E\
+\x8fJ \x03\x94\x85DnJ\x8c\x90\x88\xe2\x05\xbce\
+\xff\xff\xa7\x05-Ry\x88:\x07\xe8\x1e\xf7L\xef\xf5\
+\x05)\xd7\xae\xd2\xe0\xea\xa3\x8bj\xfa_qi\xc2A\
+\xc9\xfc\xd7\xdd\xfe\x813\x13\xb1\xb8\x9a\x8d\xe8\xfd\xeb\xaf\
+E\xc6\xe3j\x1fw\x13z\xff\xc0\x93\x89\x151\xfc\x03\
+\xe3&\xbd\x7f\xe0\xc6\x84\xc5\xf1\x0f\xf4\xea\xf4\xfe\x81\xe9\
+W\x13q\xfc\x03\xad:\xbd\x7f\xe0Z\x0b\x88\xe5\x1f\x18\
+t\x8a\xf3\xdf\xda\xce?\xb0\xec\x9a\x88\xe0\x7f\xbd\x00z\
+\xff\xc0L\x0b\x88\xe5\x1f\xc8\xe6\xf4\xfe\x81\xc5\xc8D\x1c\
+\xff\xc0\xe3\x90\xde?p71\x11\xc7?\xd0\x1f\xd2\xfb\
+\x07\xc6M\x13q\xfc\x03\xfdcz\xff@K\x09i\xbc\
++\x0f\xb5#z\xff:\x22\x1b\xd1?P{\xa6\xf7\x0f\
+dC\x13\xbcW^\x22\xfb_\x7f\xab\x12\x09\xfb\x7f\xfd\
+V%\x12\xf6\x0f\xe8\xc1@\xda\xfe\xf5` u\xffz\
+0\x90\xba\x7f=\x18H\xdd\xbf\x1e\x0c\xa4\xee_\x0f\x06\
+R\xf7\xaf\x07\x03\xa9\xfb\xd7\x83\x81\xe4\xfd\x03_L\xa4\
+\xec_\x0f\x06R\xf7\xaf\x07\x03\xa9\xfb\x07\xa6&R\xf6\
+\x0f\xdc+\x17O\xda\xbf\x1e\x0c\xa4\xee_\xb9x\xea\xfe\
+\x95\x8b3\xfa\xef\x15\xe8\x1f\xb8\xd0\x02\xd8\xfc7\x83\xf9\
+W..\xff\x0ez\xba+\x9b\xb4\x7f\xa0\xad\x5c<i\
+\xff@67\x91\xb0\x7f\xe0Q\x0f\x06\x92\xf6\x0f\xf4\x95\
+\x8b'\xed_\xb9x\xea\xfe\x95\x8b\xa7\xee_\xb9x\xea\
+\xfe\x95\x8b\xffe\x01\x17\xc5\xf9\xb7\xdf\xd8\x08\xe5\xe2\xbb\
+\xd1\x1c\xc3I|\xffk\x9e\xb0\x01\xca\xc5K\xb8\x80\x95\
+\xff\x0f\xb9\x81\x1b\xe5\xe2%\x5c\xc0\xca\x7f\x0e\xf7\x88\x83\
+\xae\x8b3, \xdf\xbf}\xbd\x86\x0b\xe5\xe2%\x5c\x80\
+\xc3\xffj\x013\x14\xc4\x83\x09\xb3f\x0f\x0e\x8a\xfc}\
+|w\x81\x5c\x94\x8b\x97p\x01\xee\x1ect\x01\x07\xca\
+\xc5K\xb6\x80\x0dz\x9c\xc9\x18\xf9(\x17/\xd7\x026\
+\xea\xb1\x9a-\x14\xc4R\x0bp,\xa0\xf8\x1e\xaf>@\
+>\xca\xc5\xcb\xb3\x80\x8d{\xccN\x86|\x94\x8b\x97e\
+\x01[\xf4\xb8\xc3>B\xa0\xeb\xe2\x0c\x0b\xd8\xaa\xc7>\
+\xae\xe1m8\xfey\x95\xe3\xdf\x02X\xbe\xc0G\xfb\xd8\
+\x15]\x17gX\xc0\xb8\xc9\xf8WIu]\xfc?\xea\
+-\xbc\xc2\xe2\xdf\xec\xfb)\x1c(\x16\xe6^\xc0.\xfd\
+\xd5\xc9\x1e\xb6G\xd7\xc59\x16\xb0\xbfK\x87}~\x80\
+m\xd1uq\x96\x05\xec\xf4\xa5\xfd\x91\xbf\x00\xe5\xe2\x95\
+^\xc0s\xfe\x02\x94\x8b\xd3/\xe0\xd8\xb6\xe7\x16Eq\
+zb\x82p\x01g\xc8C\xb98\xfd\x02\x1c?d\x7f\
+~,\x0e\x1c(\x17\xa7\x5c\xc0\x03\x8a\xe2\xe0\xd9D\xa4\
+\x05\x0c\xed#8bq\xe0@\xb7\xa5)\x170\xc5&\
+(\x17\xaf\xdc\x02<\xb1\xb8r\xf1J/`\x09\x17\xca\
+\xc5\x89\x17\xf0\xde'-d\xb18pc\x22\xc2\x02N\
+\xdf\xf1O\x17\x8b\x03S\xa5\xa2/\x0b\xa0\xf2o6\xba\
+\x83\x07\xdd\x96\x0eE\xbd\x8d5$g9&=\x14\xc6\
+R\xb1\xf0\xcb\x02\xa8\xfc\x07\x9ed\x0e\x0b-\xc0\xac\xde\
+\xa6\xf2\xef\x8f\xc5u[\x9al\x01\x0e\xff>\xe6\x8f\xc8\
+E\xb98\xdd\x02\xf6N,\x14\xc3\x1a\x1c\xe8\xb6t0\
+\x1am*\xff\xeeX\x5c\xb7\xa5y\x16\xb0\xf7\xcd\xde\x84\
+>\x16\xd7m\xe9\xf5\x02\xa8\xfc\xfbcq\xe5\xe2\x14\x0b\
+x\xaf\xb2)E,\xae\xdb\xd2\xeb\x05P\xf97;w\
+-@\xb10\xc1\x02>\xf2_\x8aX\x5c\xb1\xf0z\x01\
+T\xfe]\xb18\xd7\x87\x98e\xa7\xd1&k,o\xe1\
+A\xb1p\xc0\x05P\xf9w\xc7\xe2\xba-\x1dn\x01T\
+\xfe}\xa7\xe5\x15\x0b\x07\xa41\xa0\xf2\xef\x8b\xc5u[\
+:\xe8\x02\xa8\xfc{cq\xc5\xc2\x01\x17@v\x90\x7f\
+\x8a|\x14\x0b\x07]\x00\x95\x7fo,\xaeX8\xe0\x02\
+\x98\xfc;cq\xc5\xc2A\x17\xc0\xe4\xdf\xac;\x83\x03\
+\xc5\xc2!\x17\xc0\xe4\xdf\xac\xeb\x89\xc5\x15\x0b\x07]\x00\
+\xd7\x7f\x9a}\xb1\xb8b\xe1\x90\x0b`\xf2\xef\x8d\xc5u\
+[:\x1c\x9d\x01\x93\x7fg\xb7\xa8X8 \x9d\x8c\xeb\
+#\xb3F\x86\x5c\x14\x0b\x17\xb4\x80\xcd\xfc\x970\x16\x07\
+\xc6\x8a\x85W\x0b`\xf2\xef\xb8-\x1f\x94\xb6nK\xaf\
+\x16\xc0\xe4\xdfy[^\xb1p\xec\x05\x5c\xda\xa7q\xe8\
+\x8b\xc5\x15\x0b\x07\x5c\x00\x93\x7fw,\xcep\xf4\xac\x22\
+t2&\xfff\xbf\xf6P \xb5CK\x9eN\xc6\xe4\
+\xdf\x19\x8b+\x16\x0e\xba\x00&\xff\xceX\x5c\xb1p\xd0\
+\x05p\x053?=\x0bP,\x1ct\x01L\xfe\x9d\xb1\
+\xb8b\xe1\xa0\x0b`\xf2\x1f&\x16'\xeb\xde\xc8\x99g\
+L\xfe}\xb1\xb8b\xe1\xb0\x0b\xe0\xca%\x1f\xe0C\xb1\
+p(\xe6\x04?\xffo\x1a\x8b+\x16\xae2S\xb8P\
+,\x5cU\x9c\xb1\xb8b\xe1\xca\xe2\x8d\xc5\x15\x0b\xffa\
+\xe7\xde\x92\xd2\x8c\x82(\x0a\xff(\xde/\x90\x90\x80\x8a\
+e)j0\xa5%(q\xcf\x7fh\x99@\x1e\xba\x1f\
+rN\xd7\xae\xf5\x8d\xa1\x1fWoW\xc1X\x9cX\xd8\
+V0\x16'\x16\xb6\x15\x8c\xc5Y\x16\xb6\x15\x8c\xc5\x89\
+\x85m\xc5bqba_\x89eq\x96\x85-Ec\
+q\x96\x85]E\x97\xc5\x89\x85]\x85\x97\xc5IEM\
+]L\xd4\xd4\x98e\xe1b\xc2\xb18\xcb\xc2\xa6\xa2\xcb\
+\xe2\xc4\xc2\xae\xee\xf7\xd5\xd4\xf2f@)\xd1X\x9cX\
+\xd8UlY\x9cT\xd4\xd7Z!,\x0b\xdb\xba\xd3\xff\
+T\xebM\x1a\xff\xf2\xa5\x10ba[;5\xf65\xa0\
+\x94W5\xb6\x1bP\xcaJ!\xc4\xc2\xaeZ\xc7\xe2\xd2\
+\x96T\xb4\x94h,N,\xec\xea\xfb\xbbb\xd8\x955\
+u\xfd\xac\xc6\xdeIEKy\xb8U\x04\xa9\xa8\xad\xd3\
+35v{:\xa0\x90\xc3\x85\x1a;cW\xb6\x94\xe9\
+\xa7\x1a[\x90\x8a\x96\x92\xd9\x95fW\xd6QxW\x9a\
+X\xd8\xd4\xcb\x9e\x1a\x1b\xbf\x0c($\x1c\x8b\x93\x8a\x9a\
+zZ\xaa\xb1\x09\xbb\xb2\xa5\xccFjl4\x1bPH\
+\x22\x15fW\xd6RxW\x9aX\xd8\xd4\x9b\x82\xd8\x95\
+5\xb5V\x0a\xb1\xb0\x9d\x03\xc5\xb1+\xeb\xe8C\x09\xec\
+\xca\x1a\xda)\x8aX\xd8\xd3J\xcd\xad\x06\x14\xb2U\x1c\
+\xb1\xb0\xa1\xe3\x8d\x9a\xdbp\x01\x85\x1c\xffR\x02\xb1\xb0\
+\x9f\xdc\xae4\xbb\xb2~R\xbb\xd2\xc4\xc2\x862\xb18\
+\xbb\xb2\x8eN\xcf\xd4\xdc9\xb1p!G'\x8acW\
+\xd6PfW\x9aX\xd8\xd1\xd5\x5c\xcd\xcd\xd9\x95-$\
+\x13\x8b\xb3+\xeb\xe8r\xa2 baO\xb9]iv\
+e\xfd<\x8d\x14\xc6\xae\xac\xa3\xfb\x91\x9a\xdb'\x16.\
+$\x13\x8b\xb3+\xeb\xe8\xb1\xc7\x05\x90\x8a\x16\xf2\xa6\x14\
+ve\xed\xdc)\x81]YC\x07\x0a#\x15\xb5\xf4\xa1\
+\x1cve\xdd\xbc*\x8cT\xd4\xd2J9\xec\xca\x9aI\
+\xedJ\x93\x8a\x1aJ\xc6\xe2\xec\xca\xda\xc9\xecJ\x93\x8a\
+:J\xc6\xe2\xec\xca\xdaI\xc7\xe2\xec\xca\x9ay\xf8\xa9\
+\x0cRQ;\x87\xe7\x8a#\x1554=Q\x02\xbb\xb2\
+~~\xcf\xd5\xc1\xf8r@\x11Wc%\x90\x8a\xfa\xf9\
+\xb6\xa7\x0e\x96\xec\xca\x96\x91\xda\x95&\x155\x94\x8a\xc5\
+\xd9\x955t3R\x1c\xa9\xa8\xa1\xfb}\xc5\xb1+k\
+(\x99\x0a\x93\x8a\xda\xf9\xa3\x1cve\xdd\xac\x95\xc2\xae\
+\xac\x9d;e\x90\x8a\xfa\xf9R\x17+B\xc1*v\xca\
+ \x15\xf5\xf3\xaa.6\xa4\xa2Ul\x95@*\xea'\
+\x1b\x8b\xb3+\xeb&\xb9+M*j'\x1b\x8b\x93\x8a\
+\xba\xb9~V\x17\x8b\xe9\x80\x12\xf2\xbb\xd2\xa4\xa2^r\
+\xbb\xd2\xa4\xa2~\x8e\x16\xeab\xcc\xael\x11\xd3O\xa5\
+\xb0+\xeb\xe6j\xae.&\xa4\xa2E\xfc\x18\xab\x8b\xd1\
+l@\x09/{J!\x15us1Q\x17\xfb\x8f\x03\
+JxZ*\x83X\xd8\xcel\xa4>\xd8\x95-\x22\xb9\
++M*j'\x1f\x8b\x8bT\xd4\xca\x9b\xd2\xd8\x95\xb5\
+\xb2V'\xab\x01%\x1c(\x8d]Y+\x1f\xead\xc3\
+\x05\xd4\xb0\x93\xf2\xd8\x955\xb2R\x16\xa9\xa8\x97\xad\xf2\
+\xd8\x955r\xbcQ'\xb7\x87\x03\x0a\xe8\x15\x8bK\xe7\
+\xc4\xc2%\xa4cqve\xcd\xe4w\xa5\x89\x85\xbd\xa4\
+cqba3\xe9X\x9c]Y3G'\xcaaW\
+\xf6/{\xf7\xb6\x94F\x14EQ\x94\x0e*MB\xc4\
+\xa0xM\x8c\xa2\xc4R\x11\x04\xe3\xfe\xffOK\xe5!\
+\xb1J\xcb\xcb\xd9/\x87Zk\x8e_X\xfd8{\x1f\
+1\xd7\xab(\xc6]Y%\xe5\xb18we\xb5\x94\xc6\
+\xe2\xc4\xc2j\xb6\x87Q\x84XXM\xf1]i\xee\xca\
+\x8a\xb9l\xa2\x1cwe\x85\x9c5Q\x84XXM&\
+\x16'\x16V\x92\x8b\xc5\xb9+\xabc\x16\xe5\xb8+\xab\
+\xe4*2\xb8+\xabc3\x12\xb8++d\x19\xd5\xcc\
+\xf9\x02\xd6\xc1C\x94\x22\x16\xd62\x89B\xc4\xc2b\xee\
+\xa3\x9a1\xb1\xf0\x1ah\x17Q\xcd\x80\xbb\xb2k`\x94\
+\x88\xc5\x89\x85\x95\x8c\xa6Q\xcd>\xb1\xf0\x1a\xc8\xc4\xe2\
+\xdc\x95U\x92\x8a\xc5\xb9++$\x13\x8b\x13\x0b+\xe9\
+\xf5\xa3\x9a\x93\xe3\x0e\xaa\xcb\xc4\xe2\xc4\xc2J\xcacq\
+RQ-\x89X\x9c\xbb\xb2R\xb6\x87QM\x97\xbb\xb2\
+k \x15\x8b\x13\x0b\x0b\xb9l\xa2\x9e\xc7\x0e\xaaK\xc6\
+\xe2\xdc\x95\x95\x91\x88\xc5\x89\x85\xa5\xa4bq\xee\xca\x0a\
+\x99E1ba)\xa7Q\x8e\xbb\xb2J6\xa3\xa29\
+\xa9h}\xcb\xa8hJ*Z\xdfmT\xf4\xfds\x07\
+Y\x02\xb1x\xc4\x17\xee\xcaV\xd7\xdeDE\x07\xc4\xc2\
+\xd5\xb5\x8b\xa8\xa8O*Z]2\x16\xe7\xae\xac\x8cl\
+,N,\xac\x22\x1d\x8b\x13\x0b\x8b8\x1fGEC\xee\
+\xcaV\xb75\x88r\xc4\xc2Bv\xfa\x91B,\xac\x22\
+\x19\x8b\x13\x0b\xcbH\xc6\xe2\xc4\xc22\xf66\xa2&b\
+\xe1\xea2\xb18\xb1\xb0\x92d,N,,#\x17\x8b\
+\x13\x0b\xebH\xc6\xe2\xc4\xc22R\xb18\xb1\xb0\x90d\
+,N,,c\x16U-:H\x91\xb8,\x1e\xd1\xec\
+v\x90%\x10\x8b\xb3\xffZX\xc6\xc7\xb0\xbf\xaa\x87\xf8\
+\x08\xf6\xd75\x89\xf7\xb1\xbf\xb2\xfbx\x0f\xfbK{7\
+\x16g\x7fq\xed\xafx\x0b\xfb\xcb\x1b\xcd\xe3u\xeco\
+\xe0\x8dX\x9c\xfd-\xbczY\x9c\xfdM\xbcrY\x9c\
+\xfdm\xf4\x0e\xe2%\xf67\xb2\xb3\x8a\xe7\xd8\xdf\xca\x8b\
+X\x9c\xfd\xcd<\x8b\xc5\xd9\xdf\xce\xb7O\xf1\x84\xfd\x0d\
+}\x1d\xc6?\xeco\xe9\xff\xef\x02\xeco\xea\xb8\x89\xbf\
+\xd8\xdf\xd6Y7\x22\xd8\xdf\xd8E\x97\xfd\xbd\xfdf\x7f\
+sW\xeco\xee\x94\xfd\xcd=\xb2\xbf\xb9%\xfb\x9b\xbb\
+e\x7fs\x13\xf6\xf7\xd6\xde\xb0\xbf\xb7v\xc1\xfe\xdeF\
+s\xf6\xf76\x9a\xb2\xbf\xb7\xa3;\xf6\xf7v>f\x7f\
+o[\x03\xf6\xf7\xd6\xeb\xb3\xbf\xb7\xeb\x15\xfb{;\xdc\
+g\x7fo{\x1b\xec\xef\xad\xf0\xb6|\xc3\xb3@j~\
+\x9c\xb0\xbf\xb7\xcb\x86\xfd\xbd\xed6\xec\xef\xedg\x97\xfd\
+\xbd]t\xd9\xdf\xdb\x8c\xfd\xcd]\xb1\xbf\xb9S\xf67\
+\xf7\xc8\xfe\xe6\x1e\xd8\xdf\xdc-\xfb\x9b\x9b\xb0\xbf\xb7\xf6\
+\x86\xfd\xbd\xb5\x0b\xf6\xf76\x9a\xb3\xbf\xb7\xd1\x94\xfd\xbd\
+\x1d\xdd\xb1\xbf\xb7\xf31\xfb{\xdb\x1a\xb0\xbf\xb7^\x9f\
+\xfd\xbd]\xaf\xd8\xdf\xdb\xe1>\xfb\xff\xd9\xc8\x06\x22,\
+\xa3\xf1?\xb2\x01\x1f\xc5\xf1\x0f\x00\x22|\xc4\xad[\xfd\
+\xfa\x9f\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0db\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6$\xc8\
+\x00\x00\x00\x9cPLTE\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\xf8\x8dL\xde\x00\x00\x003tRNS\
+\x00\xaf>\x5c\x1cP\x9f\xdc8\x11'\xfbL=ea\
+D\xe2\x1em\x07\xbd\x15\xcd\x03\xf4\xd7\xc5V\xf8\xe7\xb7\
+\x97\x85\x0d\x8b!\xd2q\xeb\xa9\x91z,\xef\x80\xa3i\
+2u%p\x87\xd0-\x00\x00\x0cBIDATx\
+\xda\xec\xda\x81V\xa2@\x18\x86\xe1\x8fM(\x16CY\
+A\xd0\xd0RT\xd2\xcc\xb4\xff\xfe\xefm\x01wO\xbb\
+\x9dJ\xa6\x03\x91\xcc\xf7\x5c\xc2\xcc;3\xe7\xcc\x0cN\
+\xb0\xfb\x83\xb5\x11z\xdb\x89\xd0\xb9q&\xd3q`\xad\
+\xfas|\x92\x1d[c\xa1\xb3\xe7\x84\xb3+(\xb3\xdd\
+\xc0\x11j\x0bo\xb6\x80\x8a\xbd\xc5=\xbfe\x1c\xe3\x0a\
+e\xf5\x03\xa1\x162~\xa2\x8c=\xa7\xbf\xad\x9cd\x8e\
+S\xec;\x1e\xfd-vy\x8d\x8f\x99S\xa16s\x1e\
+#\xbc\xcf\xbf\x13j;c\x8e\xf7tn\x84\xda/\x1c\
+\xe2m\x0f\x9e\x90\x0e\xc6o\x17p\x95\x0a\xe9a\xf9V\
+\x01\xfb\xad\x90.n|\xbc\xf6\xcc\xf5\xaf\x93\x1d^\xb1\
+\xf9\xec\xa3\x97'\xfc'\xba\x15\xd2\xca\xe4\x01\xff:\x08\
+i&\x8c\xf0\xe2\x81o\x7f\xfaY\xe1\x05/\x804\xb4\
+\x1d\xe2\xaf\x0b!\x0d%\xf8\xc3\xbf\x14\xd2\xd0h\x88\xa3\
+\x9e\x90\x96f8\xe2\x15\x80\xa6R\x1f\xb9\xbe\x90\xa6b\
+\xe4vB\x9a2\x90\xf1GB\x9a\x9a\xcc\x01t\x85\xb4\
+e\x02X\x0bik\x0d \x14\xd2V\x08\xf8\xfc\x05\xae\
+1\xc7\xc7^Hc{\xc4B\x1a\x8b\xf9\x13@o\x07\
+$B\x1aK`\x09i\xcc\xc2\xbd\x90\xc6\xeea\x08i\
+\xcc`\x00z\xfbL\x00K\xeb\xd1\x8d\xbb_\xea0\x95\
+\x126\xdd\xaei\x9aq\xe1\x22\xd7\xeb\xf5\x5c\xd7}\xca\
+\x0c\x06\x83U\xe6p8l\x0a\x8f\xb9Y!\xc9\xac\x0b\
+wGVn\xb7\xdb\xdd\x17\x8c\xa3\xdb\x5cpts\x14\
+\x16\x96\xcb\xe58wY\xf0<o\x9aK\xd3t\x9b\x19\
+\x8dF\x93\x8c\xe38R\x89\xe9\xa6\xfb\xae\xb8\xb7\xb1B\
+\xa7\xf6\x00\x96\xee\x10\x0d\xe8\xa4rZ\x1f\xdfZ\x14E\
+~f\x9e\xb13\xc3B\xa7\xd3\xf9\xb5\xc8<\x97I<\
+]\xe0\x04\xdb\x0dk\x0d\xc03\xd1\x90\xd9\xf9\x07\xf01\
+ON\x9b\xa1\x04\xd3\xab/\x80[\x1bM\xe91\x00\x11\
+\x17e\xd8A]\x01\x04\x11\xcac\x00M\x05\x00?\xa8\
+'\x80\xb1\x0d\x15\x0c\xa0\xa9\x00`O\xd5\x03\xf8\xee\xe3\
+\xcb\x00\x14\x02@\x5cG\x00\x01\xd40\x80\xe6\x02\x88\xc6\
+5\x04`B\x0d\x03h.\x00\xac\xaa\x0f`\xe4C\x0d\
+\x03h0\x80\x85B\x00gq\x020\x00\xb5\x00\xe0U\
+\x1e@\x02E\x0c\xa0\xc9\x00\x8c\xca\x03p\xa1\x86\x014\
+\x1a@Ry\x00](b\x00M\x06\xb0\xaa<\x80\x1f\
+P\xc4\x00\x9a\x0c\xc0\xad<\x80k\xa8a\x00\x8d\x06p\
+\xc1\x1d\xe0\xcc0\x00\x06\xc0\x00\x18\x00\x03`\x00\x0c\x80\
+\x010\x00\x06\xf0\x9b]: \x01\x00\x00\x00\x10\xf4\xff\
+u;\x02\xdd\xa0\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\
+\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\
+\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08\
+ \x80\x00_\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08\
+ \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \
+\x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\
+\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \xc0\x97\
+\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\
+\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\x08 \x80\x00\x02\
+\x08 \x80\x00\x02\x08 @\xec\xda\xebR\xe2@\x10\x86\
+\xe1^\xce\x11\x04]\x02$jd\x05\x02j\x00\x81\xbe\
+\xff{\xdb\x89\xd6n\xedY\xab\xe0\xc7\x86\xef}/a\
+\xea\xa9\x9a\xea\x9e\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd5\x0d\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00o\xf5\xac\xc2\x01\xe0x\x00}\xabpk\
+\x00\x1c\x0d\xe0\xc9\xaa\xdb\xcc\x01p4\x80\x89U\xb7\x1d\
+\x00\x8e\x07\xe0\x85U\xb6!\x00N\x00`k\x95\xed\x16\
+\x00\xef\x028\xe79\xa0\xe3\x008\x05\x80\xb4\xa2\xab\x80\
+x\x02\x80\x93\x00\xf0\xeeS\xc3\xaaW\xfc\xc9\x01p\x12\
+\x00\xa1l\xba\xef\x15\x8b\xf1x\x1cE\xd1l6\x8b\xe3\
+8I\xec\xff\xee\xea\xc6\x01\xf0>\x80\xa3\xeav\xb3,\
+K\xd3\xf5z\xbdZ\xdd\x87\xae\xaf\xdb\xa1\x9bP\x9eO\
+B\xb7e\xa3\xb2i\xe8S\xd9ch\xbbm\x85\xbe\x94\
+=\x85\xe6\xf3\xf9Ch\x13z\x0e\xed\xf7\xcb\xe5r8\
+|yy\xe9\xf7\x07\x83A\xbd^\xbf\x0b5\x9b\xcd^\
+\xafwUV\xab\xd5.;\xa1]\xa8(\x8a\x8b\x8b\xc3\
+a\xb1\xf8\xdch4\xc6\xa1W\x9f\x8d\xa29\xbfq\x07\
+\xc0\x07\x00\x10\x00\xd4\x03\x80x\xca\x00\xeaN>\x10\x06\
+p\xe7\xe4ua\x00='o\x0a\x03\xe88\xf9\xa50\
+\x80\x86\x93/\x84\x01X\xea\xf2e\x892\x80\x89\xcb\x97\
+\x9b2\x80\x96\xcb\xd7\x92\x060t\xf9\xea\xd2\x00v\xae\
+^w,\x0d \xb9v\xf1\xa6&\x0d\xc0\x96.^S\
+\x1c@|\xef\xd2\xa5\xb18\x00{v\xe9\xb6\xa6\x0e`\
+\xb6r\xe1\xba\x85<\x00\xedI\xf0\xc1\x00\x90\xe4.[\
+\x1e\x03\xc0\xac\xd3u\xd1\xb2\xc2\x00\x10\xda\xb8hC\x03\
+@Y2r\xc9\xb6\x06\x80\xb7\xa2\xb6\x0b6\x8a\x01\xf0\
+\xad\x85\xe0:h\x12\x19\x00\xbew!\xb7\x0d\xc8\xc7\x06\
+\x80\x1f\xda\x89\xfd\x0d\xba\x8d\x0c\x00?u)%\xa0\x15\
+\x1b\x00~\xa9\xa6s\x0b\xa4}3\x00\xfc\xd6b\xea\x1a\
+\x8d\x0e\x06\x80?Vl\xd6~\xf6\xb5\xebf\x00\xf8[\
+\xd1\xf3\x99\x0f\x84\xf9 6\x00\xfc\xab\xf8n\x9a\xf9\x99\
+\xb6j\x95\xe7\x0d\x80\xf7\x9a57\xd3\xf6\x99\xbd\x10\xa5\
+\xf9\xe3\xbe\x93\x98\x01\xe0\xa3%\x8d\xa2s.\xed\x0e\x91\
+\xbd\x06\x00\x02\x00\x01\x80\x00@\x00 \x00\x10\x00\x08\x00\
+\x04\x00\x02\x00\x01\x80\x00@\x00 \x00\x10\x00\x08\x00\x04\
+\x00\x02\x00\x01\x80\x00@\x00 \x00\xa8\x07\x00\xf1\x00 \
+\x1e\x00\xc4\x03\x80x\x00\x10\x0f\x00\xe2\x01@<\x00\x88\
+\x07\x00\xf1\x00 \x1e\x00\xc4\x03\x80x\x00\x10\x0f\x00\xe2\
+\x01@<\x00\x88\x07\x00\xf1\x00 \x1e\x00\xc4\x03\x80x\
+\x00\x10\x0f\x00\xe2\x01@\xbc\xaf\xec\xdc\xcdNZQ\x14\
+\x86a\xab\x08*\xd4\xd0\x86\xa2h\xa5P\x88?\xa5\x95\
+\x86}\xff\xf7\xd6tf\x1a=\xa4\x93\xc3q\x7f\xcf{\
+\x05{\xf0\xec\xc1Z\x83\x05@x\x00\x84\x07@x\x00\
+\x84\x07@x\x00\x84\x07@x\x00\x84\x07@x\x00\x84\
+\x07@x\x00\x84\x07@x\x00\x84\x07@x\x00\x84\x07\
+@x\x00\x84\x07@x\x00\x84\x07@x\x00\x84\x07@\
+x\x00\x84\x07@x\x00\x84\x07@x\x00\x84\x07@x\
+\x00\x84\x07@x\x00\x84\x07@x\x00\x84\x07@x\xef\
+\x1b\xc0\xe7\xd3\xfb\xd5\xa2\xaf\xc5\xd3r;\x9e\xa6\x01\xd8\
+\xac\x06E/\xbaY\xae\x83\x00\xf4\x1e\x8b\xfem\xd8\xef\
+\xa5\x00\x18\xfd,z\xa5\x87q\x06\x80\xd3a\xd1\xab\x0d\
+\xbf&\x00\xd8\xcc\x8a\xde\xe8\xee\xac~\x00\xd7WEo\
+v3\xa9\x1e\xc0IQC\xdb\xea\x01\xdc\x1654\xa8\
+\x1d\xc0\xae\xa8\xb1\xb3\xca\x01l\x8b\x1a\xfbU9\x80\xe7\
+\xa2\xc6\xbeU\x0e\xc0\x0c\xb0\xa7y\xe5\x00\xe6E\xcdM\
+\xea\x06`\x0b\xb8\xafi\xd5\x00&E{ZW\x0d\xe0\
+\xbchO;\x00\xb2\xbb\x00 ;\x00\xc2\x03 <\x00\
+\xc2\x03 <\x00\xc2\x03 <\x00\xc2\x03 <\x00\xc2\
+\x03 <\x00\xc2\x03 <\x00\xc2\x03\xe0i\xd3\xab\xb9\
+\xdf\x0b\x00\x1a\xeb\x1f\xd5^\x1f\x80\xa6\xc6G\xb57\x06\
+\xe0o\x07\xbfRr\xb0\x8e\x01\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\xa8=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00 \x0d\xc0G\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00j\
+\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xff7\xac\x7f|\x99\xdf\
+\x95\x837\x1b<^\x9e\x03\xd0:\x80\x8b\x0f\xa5;\xcd\
+V\xdf\x01h\x17\xc0}\x07\xfe\xfe\xcb\xe6\xc7\x00\xb4\x08\
+\xe0zQ\xba\xd6\xf0\x04\x80\xf6\x00\xacJ\xf7\x1a\x8e\x00\
+h\x0b\xc0\xa8t\xb1\x87\x1e\x00\xed\x00\x98|*\x9d\xec\
+\x19\x80v\x00\x5c\x96n6\xdc\x01\xd0\x0a\x80\xdb\xd2\xd1\
+\x96\x00\xb4\x01`Z\xba\xda\x15\x00m\x00\x18\x97\xae\xf6\
+\x87\xbd\xbb]J\x1b\x08\xc30\xbc\x14(*\xd6\x88\x09\
+\x18\x04\x07A\xc0/\xaa\xd5\xf7\xfc\xcf\xad\xf8\xc3Qp\
+\xaaa\x92n\x9e]\xee\xfb\x082\xce5\xce&\xfb.\
+\xdb\xcd\x00P\x06@\xe0K\x80us\x00x\x00\xb04\
+\xd9\x1e\x00\xc0\x7f\x00\x00\xb0\x06\x00\xc0\xff}\x0b\xe8\x9a\
+h\xbc\x05\xec\xf9w\x80\xdf\x00\xf0\x02 1\xcd\xbas\
+\x00x\x01\x90uL\xb2\x9f\xec\x05\xec\xf7n\xe0\x00\x00\
+\x9e\x00\xb8\xa9\xe9\xd5=e\x1e\xc0\x1b\x00wgj]\
+\x8e\x99\x08\xf2\x08\xc0\xa5b3\x81\xbd_\xcc\x04z\x05\
+\xe0^n\x85>\x07\x0c\xa7L\x05\xfb?\x17p\xf6<\
+\xe9\x0c\xbb\xb5\xb7Z<&3\xce\x05p2\x08\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \xf0\x0c\xb5\x07\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00p\xb1\x07\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00p\xb1\x07\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xdc3\xcc\xc6\
+W\xfd\x8bN\xed-&\xd3\xd3\x1c\x00\xde\x01\x0c\xae\x87\
+&S/\xcd\x01\xe0\x17@\xfb\xc6\xa4Z\x1c\x01\xc0'\
+\x80{Sk\xf5\x03\x00\xfe\x00\xa4\xa6\xd7\xf0\x0f\x00|\
+\x018\x10\xfa\xa1\xf0\xf7:3\x00\xf8\x01\x90/L\xb2\
+;\x00\xf8\x0106\xcd.[\x00\xf0\x02\xa0o\xa2=\
+\x03\xc0\x07\x80\x99\xe4\x0a\xe0\xb5Q\xb8\x00\x8e\xddf\xca\
+\x00t\xef\x0e\xbe\xcc\x83\x05\xf0\xd3m\xa6\x0c@\xf8\xf6\
+\xf0\xb3`\x01\xd8\x93\xdbH\x19\xc0\xd2d{\x08\x17\x80\
+\xa5\xeec\xca\x00\x9eL\xb6y\xc0\x006\x05(\x03\xd0\
+\xbc8\xf6\xb5n\x162\x80\x0d\x01\xca\x00Z\xa6\xdaE\
+\xb8o\x01\xdb\x02\x94\x018\xd1\x0f\x81f\xd7\x81\x03\xf8\
+ @\x1a\x80\xec*\xf0!t\x00\xef\x02\xa4\x01\xcc\xc4\
+f\x01\xdej\x04\xbc\x17\xb0-@\x1a\x80KL\xb1\xe1\
+K\x04\x00\xde\x04h\x03p\x8f&X\x12\xf2<\xc0\xb6\
+\x00q\x00Y\xc3\xe4z\x0ez\x22h[\x808\x00\x97\
+\xdd\x99V\xc3f\xd83\x81\x9f\x04\x88\x03p\xee\xf4\xdc\
+t\xea\xde\xce\x03\x9f\x0a\xfe$@\x1e\xc0\x9a\xc0\xd5\x85\
+\xc4\xc6\xf0p4=\x0a\xfe\x5c\xc0'\x01\x01\x00X\x97\
+\x0dZ\xb5w\x98\xc7p2h\xab4\x10\x00\x81\x15\x0e\
+\x00K\x01\xe0\xdc>\x03\xb0\x14\x00n\xaf\x01X\x0a\x80\
+\xfd\x06`)\x00\x22\x000^\x89\x08\x00@=\x00\x5c\
+k\xa2!\x00\x00\xf5\x00X\x97\xac\x14\x04\x00\xa06\x00\
+\xee\xac# \x00\x00\xf5\x00\x90\x11\x00\x80z\x00\xc8\x08\
+\x00@=\x00d\x04\x00\xa0\x1e\x002\x02\x00P\x0f\x00\
+\x19\x01\x00\xa8\x07\x80\x8c\x00\x00\xd4\x03@F\x00\x00j\
+\x07PJ\x00\x00\x22\x00PJ\x00\x00\x22\x00PJ\x00\
+\x00\x22\x00PJ\x00\x00\x22\x00PJ\x00\x00\x22\x00P\
+J\x00\x00\x22\x00PJ\x00\x00\x22\x00PJ\x00\x004\
+\x00\x9c\x14\x06 #\x00\x00U\x02X\x16\x06 #\x00\
+\x00U\x02\xb8.\x0c@F\x00\x00\xaa\x04\xd0(\x0c@\
+F\x00\x00\xaa\x04\xd0+\x0c@F\x00\x00*\x04\xf0b\
+\x85\x01\xc8\x08\x00@\x85\x00\x96\xc5\x01\xc8\x08\x00@u\
+\x00\xf2Nq\x002\x02\x00P\x1d\x80\xa6\x15\x07 #\
+\x00\x00\x95\x01\x18\xdc\xec\x00@F\x00\x00\xaa\x02\x90\xf5\
+m\x07\x002\x02\x06\x00\xa8\x06\xc0a\xdfv\x01 #\
+\xe0\xc0\xbe\xad\xedb\xaf]\xfe\xda\x9e\xe3\x9e\x95\x00P\
+\xa9\x80\xa5\xdb\xa1lb\xdf\xd6\xcf]\xdc\xe5_\xff\x11\
+F\x99\xfb\xa6\xc3\xe4\xdc\xac\x04\x80\x8a\x05\xdc6\xdbE\
+;)\xf4\xe0\xa3\xa4\x1ds\xcd\xbe}\xdd\xe2\xa9\xfd\xcf\
+\xc6\xc9\xfd\xd5y\xd7\xac\x12\x00\xdb\x02(\xd6\x1a\x0e\x01\
+\x7f\xdb\xa5\xdb\x94\x04\xc2\x00\x8c\xa27\x88\xc1\x9a\x22\xa3\
+\x97\x98\x19kf\x22\x15\x11\xbf\xf7\xbf8A\x10\xc4\x1f\
+n\xe0>g\x0dGmE\x06\xa8\xed\xc8\x00\xb5\x91\x0c\
+P\xfb#\x03\xd4\xf6d\x80\xda\x1b\x19\xa06'\x03\xcc\
+6\x90\x01f\x03\x19\xa0\xb6&\x03\xd4&d\x80Y\xdf\
+\x90\x01f#d\x80\xd9\x84\x0c0[@\x06\x98}\x90\
+\x01f\x9f\x85\x0c0\xdbC\x06\x88u\x85\x0c0\x9bB\
+\x06\x88\xed \x03\xc4\xfa\x172@\xac\x9eB\x06\x88\x1d\
+!\x03\xc4*\xc8\x00\xb1\xa7B\x06\x88\x0d\x052\xc0k\
+U \x03\xbc\xfe\x1b\xc8\x00\xad\xf6\x07\xc8\x00\xad\xd9\x09\
+2@\xab]6@\x06H\xd5\xd53\x17\x19`\xf4[\
+\xbdr\x95\x01:\xdd\xfa\x9b\x1b\x19`R\xcf\xb6\x07\xee\
+d\x80@\xdd\xf6\xdd0~\xbd\x17\x1e8\x03b\x91\xce\
+\x1f\xaf\x0b\x15R\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+"
+
+qt_resource_name = b"\
+\x00\x0f\
+\x06\xe4\x14\x22\
+\x00p\
+\x00a\x00r\x00t\x00i\x00c\x00l\x00e\x00_\x00e\x00d\x00i\x00t\x00o\x00r\
+\x00\x10\
+\x01'\x96\xa7\
+\x00s\
+\x00c\x00a\x00t\x00t\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x01\x0eA\x07\
+\x00u\
+\x00p\x00l\x00o\x00a\x00d\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x01b\x09\x87\
+\x00d\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\
+\x00\x0f\
+\x02XJ\xa7\
+\x00h\
+\x00a\x00m\x00m\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0dxQG\
+\x00s\
+\x00a\x00v\x00e\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00J\x00\x00\x00\x00\x00\x01\x00\x00A\xcf\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00$\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00n\x00\x00\x00\x00\x00\x01\x00\x00Mw\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00Y\x15\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x00h8\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
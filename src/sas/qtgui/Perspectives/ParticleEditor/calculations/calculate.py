@@ -1,15 +1,18 @@
 import time
+from collections.abc import Callable
 
 from sas.qtgui.Perspectives.ParticleEditor.calculations.boundary_check import (
     check_mag_zero_at_boundary,
     check_sld_continuity_at_boundary,
 )
+from sas.qtgui.Perspectives.ParticleEditor.calculations.debye import debye
 from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
     QSpaceScattering,
     ScatteringCalculation,
     ScatteringOutput,
 )
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import DebyeSum
 
 
 class SLDBoundaryMismatch(Exception):
@@ -19,7 +22,10 @@ class MagBoundaryNonZero(Exception):
     pass
 
 
-def calculate_scattering(calculation: ScatteringCalculation) -> ScatteringOutput:
+def calculate_scattering(
+        calculation: ScatteringCalculation,
+        progress: Callable[[float], None] | None = None,
+        cancelled: Callable[[], bool] | None = None) -> ScatteringOutput:
 
     start_time = time.time()
 
@@ -39,13 +45,30 @@ def calculate_scattering(calculation: ScatteringCalculation) -> ScatteringOutput
     q_dist = calculation.q_sampling
     angular_dist = calculation.angular_sampling
 
-    scattering = scattering_via_fq(
-        sld_definition=sld_def,
-        magnetism_definition=mag_def,
-        parameters=params,
-        point_generator=spatial_dist,
-        q_sample=q_dist,
-        angular_distribution=angular_dist)
+    if isinstance(angular_dist, DebyeSum):
+        # The pair tiles are sized from the memory budget, the chunk size hint is for single points
+        scattering = debye(
+            sld_definition=sld_def,
+            magnetism_definition=mag_def,
+            parameters=params,
+            point_generator=spatial_dist,
+            q_sample=q_dist,
+            memory_budget=calculation.memory_budget,
+            progress=progress,
+            cancelled=cancelled)
+
+    else:
+        scattering = scattering_via_fq(
+            sld_definition=sld_def,
+            magnetism_definition=mag_def,
+            parameters=params,
+            point_generator=spatial_dist,
+            q_sample=q_dist,
+            angular_distribution=angular_dist,
+            chunk_size=calculation.sample_chunk_size_hint,
+            memory_budget=calculation.memory_budget,
+            progress=progress,
+            cancelled=cancelled)
 
     q_data = QSpaceScattering(q_dist, scattering)
 
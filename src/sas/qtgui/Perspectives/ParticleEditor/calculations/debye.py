@@ -1,6 +1,12 @@
+import math
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 import numpy as np
 
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import CalculationCancelled
 from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
     CalculationParameters,
@@ -8,111 +14,149 @@ from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
     QSample,
     SLDDefinition,
 )
-from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import SingleChunk, pairwise_chunk_iterator
+from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import Chunks
 from sas.qtgui.Perspectives.ParticleEditor.sampling.points import SpatialDistribution
 
+# Working memory for each pair of points in a tile: the distances, the SLD products and the sinc terms
+_BYTES_PER_PAIR = 32
 
-def debye(
-        sld_definition: SLDDefinition,
-        magnetism_definition: MagnetismDefinition | None,
-        parameters: CalculationParameters,
-        point_generator: SpatialDistribution,
-        q_sample: QSample,
-        minor_chunk_size=1000,
-        preallocate=True):
 
-    q = q_sample()
+def _contributing_points(sld_definition, parameters, points):
+    """ Points of a chunk with non-zero SLD, and their SLD"""
+    sld = run_sld(sld_definition, parameters, *points)
+    contrast = sld != 0
+    return tuple(component[contrast] for component in points), sld[contrast]
 
-    output = np.zeros_like(q)
 
+def _tiles(sld_definition, parameters, point_generator, q, chunk_size):
+    """ Arguments of _pair_sum for each tile, evaluating the SLD of the first chunk once for each row of tiles"""
 
-    # First chunking layer, chunks for dealing with VERY large sample densities
-    # Uses less memory at the cost of using more processing power
-    for (x1_large, y1_large, z1_large), (x2_large, y2_large, z2_large) in SingleChunk(point_generator):
-        sld1 = run_sld(sld_definition, parameters, x1_large, y1_large, z1_large)
-        sld2 = run_sld(sld_definition, parameters, x2_large, y2_large, z2_large)
+    last_points = None
 
-        if magnetism_definition is None:
+    for points_1, points_2, weight in Chunks(point_generator, chunk_size):
 
-            sld1_total_large = sld1
-            sld2_total_large = sld2
+        if points_1 is not last_points:
+            last_points = points_1
+            xyz_1, sld_1 = _contributing_points(sld_definition, parameters, points_1)
 
+        if points_2 is points_1:
+            xyz_2, sld_2 = xyz_1, sld_1
         else:
-            raise NotImplementedError("Magnetism not implemented yet")
-            # TODO: implement magnetism
-
-
+            xyz_2, sld_2 = _contributing_points(sld_definition, parameters, points_2)
 
-        # TODO: Preallocation, do we want it
-        if preallocate:
-            r_data_1 = np.zeros((minor_chunk_size, minor_chunk_size))
-            r_data_2 = np.zeros((minor_chunk_size, minor_chunk_size))
-            rq_data = np.zeros((minor_chunk_size**2, q_sample.n_points))
+        yield xyz_1, sld_1, xyz_2, sld_2, q, weight
 
-        for one, two in pairwise_chunk_iterator(
-                left_data=(x1_large, y1_large, z1_large, sld1_total_large),
-                right_data=(x2_large, y2_large, z2_large, sld2_total_large),
-                chunk_size=minor_chunk_size):
 
-            (x1, y1, z1, sld_total_1) = one
-            (x2, y2, z2, sld_total_2) = two
+def _pair_sum(xyz_1, sld_1, xyz_2, sld_2, q, weight) -> np.ndarray:
+    """ Sum over the pairs of points of one tile, one q value at a time so that memory scales with the tile size"""
 
-            # Optimised calculation of euclidean distance, use pre-allocated memory
+    (x1, y1, z1), (x2, y2, z2) = xyz_1, xyz_2
 
-            if preallocate:
-                n1 = len(x1)
-                n2 = len(x2)
+    r_squared = np.subtract.outer(x1, x2)**2
+    r_squared += np.subtract.outer(y1, y2)**2
+    r_squared += np.subtract.outer(z1, z2)**2
 
-                r_data_1[:n1, :n2] = np.subtract.outer(x1, x2)
-                r_data_1 **= 2
+    correl = np.multiply.outer(sld_1, sld_2)
+    correl *= weight
+    correl = correl.reshape(-1)
 
-                r_data_2[:n1, :n2] = np.subtract.outer(y1, y2)
-                r_data_1[:n1, :n2] += r_data_2[:n1, :n2] ** 2
+    # np.sinc(x) is sin(pi x)/(pi x), so r q/pi gives sin(q r)/(q r)
+    r = np.sqrt(r_squared, out=r_squared).reshape(-1)
+    r /= np.pi
 
-                r_data_2[:n1, :n2] = np.subtract.outer(z1, z2)
-                r_data_1[:n1, :n2] += r_data_2[:n1, :n2] ** 2
+    output = np.empty_like(q)
+    for q_index, q_value in enumerate(q):
+        output[q_index] = correl @ np.sinc(r*q_value)
 
-                np.sqrt(r_data_1, out=r_data_1) # in place sqrt
+    return output
 
-                r_data_2[:n1, :n2] = np.multiply.outer(sld_total_1, sld_total_2)
 
-                # Build a table of r times q values
+def debye(
+        sld_definition: SLDDefinition,
+        magnetism_definition: MagnetismDefinition | None,
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        q_sample: QSample,
+        chunk_size: int | None = None,
+        memory_budget=256_000_000,
+        n_workers: int | None = None,
+        progress: Callable[[float], None] | None = None,
+        cancelled: Callable[[], bool] | None = None) -> np.ndarray:
+    """ Orientation averaged intensity from the Debye sum over all pairs of points,
+    4 pi sum_ij sld_i sld_j sin(q r_ij)/(q r_ij)
+
+    The factor of 4 pi is the total weight of the directions sampled by the Uniform angular
+    distribution, so that the result can be compared with that of scattering_via_fq.
+
+    The pairs are taken in chunk_size x chunk_size tiles, visiting only the tiles on and above the
+    diagonal, and the tiles are summed by a pool of n_workers processes (one per CPU by default,
+    1 sums them in this process). Points are generated for each tile, so peak memory is set by
+    chunk_size and not by the number of points. If chunk_size is not given, it is chosen so that
+    the tiles being summed use about memory_budget bytes of working memory.
+
+    progress is called with the fraction of the tiles done, and cancelled is checked as they
+    complete; if it returns True, CalculationCancelled is raised.
+    """
+
+    if magnetism_definition is not None:
+        raise NotImplementedError("Magnetism not implemented yet")
+        # TODO: implement magnetism
 
-                rq_data[:(n1 * n2), :] = np.multiply.outer(r_data_1[:n1, :n2].reshape(-1), q)
+    q = q_sample()
 
-                # Calculate sinc part
-                rq_data[:(n1 * n2), :] = np.sinc(rq_data[:(n1 * n2), :])
+    output = np.zeros_like(q)
 
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
 
-                # Multiply by paired density
-                rq_data[:(n1 * n2), :] *= r_data_2[:n1, :n2].reshape(-1, 1)
+    if chunk_size is None:
+        chunk_size = max(1, math.isqrt(memory_budget // (n_workers * _BYTES_PER_PAIR)))
 
+    tiles = _tiles(sld_definition, parameters, point_generator, q, chunk_size)
 
-                # Multiply by r squared
-                np.multiply(r_data_1, r_data_1, out=r_data_1)
-                rq_data[:(n1 * n2), :] *= r_data_1[:n1, :n2].reshape(-1, 1)
+    n_chunks = math.ceil(point_generator.n_points / chunk_size)
+    n_tiles = n_chunks * (n_chunks + 1) // 2
+    n_done = 0
 
-                # Add to q data
-                output += np.sum(rq_data, axis=0)
+    def tile_done():
+        nonlocal n_done
+        n_done += 1
 
-            else:
+        if cancelled is not None and cancelled():
+            raise CalculationCancelled("Scattering calculation cancelled")
 
-                # Non optimised
-                r_squared = np.subtract.outer(x1, x2) ** 2 + \
-                                np.subtract.outer(y1, y2) ** 2 + \
-                                np.subtract.outer(z1, z2) ** 2
+        if progress is not None:
+            progress(n_done / n_tiles)
 
-                # print(r_squared.shape)
+    if n_workers == 1:
+        for tile in tiles:
+            output += _pair_sum(*tile)
+            tile_done()
 
-                correl = sld_total_1.reshape(1, -1) * sld_total_2.reshape(-1, 1)
-                correl = correl.reshape(-1, 1)
+        return 4*np.pi*output
 
-                rq = np.sqrt(r_squared.reshape(-1, 1)) * q.reshape(1,-1)
+    # Spawn rather than fork, since the calling process is threaded
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
 
-                # print(rq.shape)
+        # Only a few tiles per worker are generated ahead of the running ones
+        pending = set()
+        try:
+            for tile in tiles:
+                pending.add(pool.submit(_pair_sum, *tile))
+                if len(pending) >= 2*n_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        output += future.result()
+                        tile_done()
 
-                output += np.sum(r_squared.reshape(-1, 1) * correl * np.sinc(rq), axis=0)
-                # output += np.sum(r_squared.reshape(-1, 1) * correl * np.sinc(rq), axis=0)
+            for future in pending:
+                output += future.result()
+                tile_done()
 
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
 
-    return output
+    return 4*np.pi*output
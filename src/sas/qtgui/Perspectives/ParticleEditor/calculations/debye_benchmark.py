@@ -22,37 +22,40 @@ def sld(x, y, z):
 def transform(x,y,z):
     return x,y,z
 
-sld_def = SLDDefinition(sld_function=sld, to_cartesian_conversion=transform)
+# The worker pool spawns processes that import this module, so the benchmark only runs as a script
+if __name__ == '__main__':
 
-calc_params = CalculationParameters(
-                solvent_sld=0.0,
-                background=0.0,
-                scale=1.0,
-                sld_parameters={},
-                magnetism_parameters={})
+    sld_def = SLDDefinition(sld_function=sld, to_cartesian_conversion=transform)
 
-point_generator = Grid(100, 10_000)
+    calc_params = CalculationParameters(
+                    solvent_sld=0.0,
+                    background=0.0,
+                    scale=1.0,
+                    sld_parameters={},
+                    magnetism_parameters={})
 
-q = QSample(1e-3, 1, 101, True)
+    point_generator = Grid(100, 10_000)
 
-for chunk_size in [1000]:
-    for preallocate in [False, True]:
+    q = QSample(1e-3, 1, 101, True)
 
-        print("Chunk size %i%s"%(chunk_size, ", preallocate" if preallocate else ""))
+    for chunk_size in [1000]:
+        for n_workers in [1, None]:
 
-        start_time = time.time()
+            print("Chunk size %i%s"%(chunk_size, ", in a worker pool" if n_workers is None else ""))
 
-        output = debye(
-            sld_definition=sld_def,
-            magnetism_definition=None,
-            parameters=calc_params,
-            point_generator=point_generator,
-            q_sample=q,
-            minor_chunk_size=chunk_size,
-            preallocate=preallocate)
+            start_time = time.time()
 
-        print(time.time() - start_time)
+            output = debye(
+                sld_definition=sld_def,
+                magnetism_definition=None,
+                parameters=calc_params,
+                point_generator=point_generator,
+                q_sample=q,
+                chunk_size=chunk_size,
+                n_workers=n_workers)
 
-        plt.loglog(q(), output)
+            print(time.time() - start_time)
 
-plt.show()
+            plt.loglog(q(), output)
+
+    plt.show()
@@ -1,3 +1,9 @@
+""" Orientation averaged scattering from the amplitude F(q) in each direction """
+import math
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 
@@ -11,6 +17,59 @@ from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
 )
 from sas.qtgui.Perspectives.ParticleEditor.sampling.points import PointGeneratorStepper, SpatialDistribution
 
+# Working memory for each element of a points x q tile: the phases, their cosines and their sines
+_BYTES_PER_TILE_ELEMENT = 24
+
+
+class CalculationCancelled(Exception):
+    pass
+
+
+def _tile_sizes(n_points: int, n_q: int, max_elements: int) -> tuple[int, int]:
+    """ Number of points and of q values in each tile, so that a tile has at most max_elements elements"""
+    q_tile = max(1, min(n_q, max_elements))
+    point_tile = max(1, min(n_points, max_elements // q_tile))
+    return point_tile, q_tile
+
+
+def _add_amplitude(
+        fq_real: np.ndarray,
+        fq_imag: np.ndarray,
+        x: np.ndarray, y: np.ndarray, z: np.ndarray,
+        sld: np.ndarray,
+        q: np.ndarray,
+        direction_vector: np.ndarray,
+        point_tile: int,
+        q_tile: int,
+        stop: threading.Event):
+    """ Add sum(sld * exp(i q r.direction)) over the points to the amplitude in fq_real and fq_imag,
+    one points x q tile at a time"""
+
+    phase = np.empty(point_tile * q_tile)
+    cos_phase = np.empty_like(phase)
+    sin_phase = np.empty_like(phase)
+
+    for point_start in range(0, len(sld), point_tile):
+        if stop.is_set():
+            return
+
+        point_slice = slice(point_start, point_start + point_tile)
+        projected_distance = x[point_slice]*direction_vector[0] \
+                             + y[point_slice]*direction_vector[1] \
+                             + z[point_slice]*direction_vector[2]
+        sld_part = sld[point_slice]
+
+        for q_start in range(0, len(q), q_tile):
+            q_slice = slice(q_start, q_start + q_tile)
+            q_part = q[q_slice]
+            shape = (len(projected_distance), len(q_part))
+            n = shape[0] * shape[1]
+
+            r_dot_q = np.multiply.outer(projected_distance, q_part, out=phase[:n].reshape(shape))
+
+            fq_real[q_slice] += sld_part @ np.cos(r_dot_q, out=cos_phase[:n].reshape(shape))
+            fq_imag[q_slice] += sld_part @ np.sin(r_dot_q, out=sin_phase[:n].reshape(shape))
+
 
 def scattering_via_fq(
         sld_definition: SLDDefinition,
@@ -19,34 +78,81 @@ def scattering_via_fq(
         point_generator: SpatialDistribution,
         q_sample: QSample,
         angular_distribution: AngularDistribution,
-        chunk_size=1_000_000) -> np.ndarray:
+        chunk_size=1_000_000,
+        memory_budget=256_000_000,
+        n_workers: int | None = None,
+        progress: Callable[[float], None] | None = None,
+        cancelled: Callable[[], bool] | None = None) -> np.ndarray:
+    """ Orientation averaged intensity, from the amplitude F(q) in each sampled direction
+
+    The SLD is evaluated for chunk_size points at a time, and the amplitudes of the chunk are
+    added to those of each direction by a pool of n_workers threads (one per CPU by default).
+    Each thread works through the points x q values in tiles, so that together they use about
+    memory_budget bytes of working memory.
+
+    progress is called with the fraction of the calculation done, and cancelled is checked
+    as the directions complete; if it returns True, CalculationCancelled is raised.
+    """
 
     q_magnitudes = q_sample()
 
     direction_vectors, direction_weights = angular_distribution.sample_points_and_weights()
-    fq = np.zeros((angular_distribution.n_points, q_sample.n_points), dtype=complex)  # Dictionary for fq for all angles
+    n_directions = len(direction_vectors)
 
-    for x, y, z in PointGeneratorStepper(point_generator, chunk_size):
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, n_directions))
 
-        sld = run_sld(sld_definition, parameters, x, y, z).reshape(-1, 1)
+    max_tile_elements = memory_budget // (n_workers * _BYTES_PER_TILE_ELEMENT)
 
-        # TODO: Magnetism
+    # Amplitudes for each direction, summed over all the point chunks
+    fq_real = np.zeros((n_directions, q_sample.n_points))
+    fq_imag = np.zeros((n_directions, q_sample.n_points))
 
-        for direction_index, direction_vector in enumerate(direction_vectors):
+    n_tasks = math.ceil(point_generator.n_points / chunk_size) * n_directions
+    n_done = 0
 
-            projected_distance = x*direction_vector[0] + y*direction_vector[1] + z*direction_vector[2]
+    stop = threading.Event()
 
-            i_r_dot_q = np.multiply.outer(projected_distance, 1j*q_magnitudes)
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        for x, y, z in PointGeneratorStepper(point_generator, chunk_size):
 
-            if direction_index in fq:
-                fq[direction_index, :] = np.sum(sld*np.exp(i_r_dot_q), axis=0)
-            else:
-                fq[direction_index, :] += np.sum(sld*np.exp(i_r_dot_q), axis=0)
+            sld = run_sld(sld_definition, parameters, x, y, z)
 
-    f_squared = fq.real**2 + fq.imag**2
-    f_squared *= direction_weights.reshape(-1,1)
+            # TODO: Magnetism
 
-    return np.sum(f_squared, axis=0)
+            # Points with the solvent SLD do not contribute
+            contrast = sld != 0
+            x, y, z, sld = x[contrast], y[contrast], z[contrast], sld[contrast]
+
+            point_tile, q_tile = _tile_sizes(len(sld), q_sample.n_points, max_tile_elements)
 
+            # Each direction is added to by one task at a time, as the chunks are done in turn
+            futures = [
+                pool.submit(_add_amplitude,
+                            fq_real[direction_index], fq_imag[direction_index],
+                            x, y, z, sld, q_magnitudes, direction_vector,
+                            point_tile, q_tile, stop)
+                for direction_index, direction_vector in enumerate(direction_vectors)]
 
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    n_done += 1
 
+                    if cancelled is not None and cancelled():
+                        raise CalculationCancelled("Scattering calculation cancelled")
+
+                    if progress is not None:
+                        progress(n_done / n_tasks)
+
+            except BaseException:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    f_squared = fq_real**2 + fq_imag**2
+    f_squared *= direction_weights.reshape(-1, 1)
+
+    return np.sum(f_squared, axis=0)
@@ -125,6 +125,7 @@ class ScatteringCalculation:
     bounding_surface_sld_check: bool
     bin_count = 1_000
     sample_chunk_size_hint: int = 100_000
+    memory_budget: int = 256_000_000 # Bytes of working memory for the scattering calculation
 
 
 @dataclass
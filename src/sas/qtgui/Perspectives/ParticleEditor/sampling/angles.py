@@ -62,5 +62,31 @@ class Uniform(AngularDistribution):
         return f"Uniform({self.divisions})"
 
 
-angular_sampling_methods = [ZDelta, Uniform]
+class DebyeSum(AngularDistribution):
+    """ Spherically averaged sample, averaged exactly by summing over pairs of points (Debye)
+
+    No directions are sampled, the calculation uses the Debye formula instead. This is exact
+    in the orientation average, but scales with the square of the number of sample points.
+    """
+
+    @staticmethod
+    def name():
+        return "Unoriented (Debye sum)"
+
+    def sample_points_and_weights(self) -> tuple[np.ndarray, np.ndarray]:
+        return np.zeros((0, 3)), np.zeros((0, ))
+
+    @property
+    def n_points(self) -> int:
+        return 0
+
+    @staticmethod
+    def parameters() -> list[tuple[str, str, type]]:
+        return []
+
+    def __repr__(self):
+        return "DebyeSum()"
+
+
+angular_sampling_methods = [ZDelta, Uniform, DebyeSum]
 
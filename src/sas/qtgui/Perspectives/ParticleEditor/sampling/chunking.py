@@ -47,17 +47,36 @@ class Chunker(ABC):
         return self._iterator()
 
     @abstractmethod
-    def _iterator(self) -> tuple[VectorComponents3, VectorComponents3]:
-        """ Python generator function that yields chunks """
+    def _iterator(self) -> tuple[VectorComponents3, VectorComponents3, int]:
+        """ Python generator function that yields chunks, and the number of times each is to be counted """
 
 
 class Chunks(Chunker):
     """ Class that takes a point generator, and produces all pairwise combinations in chunks
 
-    This trades off speed for space.
+    This trades off speed for space. Pairs are symmetric, so only the chunks on and above the
+    diagonal are produced (chunks 1, 2, 3, 4, 6, 7, 8, 11, 12 and 16 above), and those off the
+    diagonal are to be counted twice. Points are generated as they are needed, so the memory
+    used is set by chunk_size and not by the number of points.
     """
 
-    # TODO
+    def __init__(self, point_generator: SpatialDistribution, chunk_size: int):
+        super().__init__(point_generator)
+        self.chunk_size = chunk_size
+
+    def _generate(self, start_index: int) -> VectorComponents3:
+        end_index = min(start_index + self.chunk_size, self.point_generator.n_points)
+        return self.point_generator.generate(start_index, end_index)
+
+    def _iterator(self):
+        start_indices = range(0, self.point_generator.n_points, self.chunk_size)
+
+        for i, start_index in enumerate(start_indices):
+            first_points = self._generate(start_index)
+            yield first_points, first_points, 1
+
+            for second_start_index in start_indices[i+1:]:
+                yield first_points, self._generate(second_start_index), 2
 
 
 class SingleChunk(Chunker):
@@ -65,7 +84,7 @@ class SingleChunk(Chunker):
 
     def _iterator(self):
         points = self.point_generator.generate(0, self.point_generator.n_points)
-        yield points, points
+        yield points, points, 1
 
 
 class InputLengthMismatch(Exception):
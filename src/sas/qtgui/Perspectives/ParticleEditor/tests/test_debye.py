@@ -0,0 +1,114 @@
+import numpy as np
+from pytest import mark
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.calculate import calculate_scattering
+from sas.qtgui.Perspectives.ParticleEditor.calculations.debye import debye
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
+    ParticleDefinition,
+    QSample,
+    ScatteringCalculation,
+    SLDDefinition,
+)
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import DebyeSum, Uniform
+from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import Chunks
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid, RandomCube
+
+
+def cylinder_sld(x, y, z):
+    return np.where((x**2 + y**2 < 40**2) & (np.abs(z) < 30), 1.0, 0.0)
+
+
+@mark.parametrize("chunk_size", [1, 42, 100, 381, 1000])
+@mark.parametrize("npoints", [100, 1000])
+def test_chunks_cover_all_pairs(npoints, chunk_size):
+    """ Each ordered pair of points is counted once, with off-diagonal chunks standing for both orders"""
+    point_generator = Grid(100, npoints)
+    counts = np.zeros((point_generator.n_points, point_generator.n_points), dtype=int)
+    index_of = {point: index for index, point in enumerate(zip(*point_generator.generate(0, point_generator.n_points)))}
+
+    for points_1, points_2, weight in Chunks(point_generator, chunk_size):
+        assert len(points_1[0]) <= chunk_size and len(points_2[0]) <= chunk_size
+        indices_1 = [index_of[point] for point in zip(*points_1)]
+        indices_2 = [index_of[point] for point in zip(*points_2)]
+        counts[np.ix_(indices_1, indices_2)] += weight
+        if weight == 2:
+            assert indices_1[0] < indices_2[0]
+
+    assert np.all(counts + counts.T == 2)
+
+
+def direct_calculation(point_generator, chunk_size, q):
+    """ Debye sum over the full square of pairs, all at once, 4 pi sum_ij sld_i sld_j sin(q r_ij)/(q r_ij)"""
+    # Random points depend on the chunks they are generated in
+    chunks = [point_generator.generate(start, min(start + chunk_size, point_generator.n_points))
+              for start in range(0, point_generator.n_points, chunk_size)]
+    x, y, z = (np.concatenate(component) for component in zip(*chunks))
+    sld = cylinder_sld(x, y, z)
+    r = np.sqrt(np.subtract.outer(x, x)**2 + np.subtract.outer(y, y)**2 + np.subtract.outer(z, z)**2)
+    qr = np.multiply.outer(r.reshape(-1), q)
+    sin_qr_over_qr = np.divide(np.sin(qr), qr, out=np.ones_like(qr), where=qr != 0)
+    return 4*np.pi*np.multiply.outer(sld, sld).reshape(-1) @ sin_qr_over_qr
+
+
+@mark.parametrize("chunk_size, n_workers", [(1000, 1), (97, 1), (250, 2)])
+@mark.parametrize("point_generator", [Grid(100, 1200), RandomCube(100, 1200, seed=3)])
+def test_matches_direct_calculation(point_generator, chunk_size, n_workers):
+    """ Upper triangle tiles give the sum over all the pairs of points"""
+    q_sample = QSample(0.001, 0.3, 23, True)
+    expected = direct_calculation(point_generator, chunk_size, q_sample())
+
+    output = debye(
+        sld_definition=SLDDefinition(cylinder_sld, lambda x, y, z: (x, y, z)),
+        magnetism_definition=None,
+        parameters=CalculationParameters(solvent_sld=0.0, background=0.0, scale=1.0,
+                                         sld_parameters={}, magnetism_parameters={}),
+        point_generator=point_generator,
+        q_sample=q_sample,
+        chunk_size=chunk_size,
+        n_workers=n_workers)
+
+    np.testing.assert_allclose(output, expected, rtol=1e-9)
+
+
+def test_matches_orientation_average():
+    """ The Debye sum is the exact orientation average that the Uniform directions approximate,
+    closely at q small enough for the directions to resolve the particle"""
+    point_generator = Grid(100, 500)
+    q_sample = QSample(0.001, 0.05, 11, True)
+    sld_definition = SLDDefinition(cylinder_sld, lambda x, y, z: (x, y, z))
+    parameters = CalculationParameters(solvent_sld=0.0, background=0.0, scale=1.0,
+                                       sld_parameters={}, magnetism_parameters={})
+
+    output = debye(sld_definition, None, parameters, point_generator, q_sample, n_workers=1)
+    expected = scattering_via_fq(sld_definition, None, parameters, point_generator, q_sample, Uniform(10))
+
+    np.testing.assert_allclose(output, expected, rtol=1e-6)
+
+
+def test_selected_by_angular_sampling():
+    """ Choosing the Debye sum as the angular sampling runs the Debye calculation"""
+    point_generator = Grid(100, 500)
+    q_sample = QSample(0.001, 0.3, 23, True)
+    sld_definition = SLDDefinition(cylinder_sld, lambda x, y, z: (x, y, z))
+    parameters = CalculationParameters(solvent_sld=0.0, background=0.0, scale=1.0,
+                                       sld_parameters={}, magnetism_parameters={})
+
+    fractions = []
+    result = calculate_scattering(
+        ScatteringCalculation(
+            q_sampling=q_sample,
+            angular_sampling=DebyeSum(),
+            spatial_sampling_method=point_generator,
+            particle_definition=ParticleDefinition(sld_definition, None),
+            parameter_settings=parameters,
+            polarisation_vector=None,
+            seed=None,
+            bounding_surface_sld_check=False,
+            memory_budget=32*100**2),
+        progress=fractions.append)
+
+    np.testing.assert_allclose(result.q_space.ordinate, direct_calculation(point_generator, 100, q_sample()),
+                               rtol=1e-9)
+    assert fractions[-1] == 1
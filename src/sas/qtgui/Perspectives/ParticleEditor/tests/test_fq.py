@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from pytest import mark
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import CalculationCancelled, scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import QSample, SLDDefinition
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform, ZDelta
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid
+
+
+def ellipsoid_sld(x, y, z):
+    return ((x/50)**2 + (y/30)**2 + (z/20)**2 < 1).astype(float)
+
+
+def calculate(angular_distribution, **kwargs):
+    return scattering_via_fq(
+        sld_definition=SLDDefinition(ellipsoid_sld, lambda x, y, z: (x, y, z)),
+        magnetism_definition=None,
+        parameters=CalculationParameters(solvent_sld=0.0, background=0.0, scale=1.0,
+                                         sld_parameters={}, magnetism_parameters={}),
+        point_generator=Grid(100, 2000),
+        q_sample=QSample(0.001, 0.2, 37, True),
+        angular_distribution=angular_distribution,
+        **kwargs)
+
+
+def direct_calculation(angular_distribution):
+    """ Sum of |F(q)|^2 over the directions, with all points and q values at once"""
+    x, y, z = Grid(100, 2000).generate(0, Grid(100, 2000).n_points)
+    q = QSample(0.001, 0.2, 37, True)()
+    sld = ellipsoid_sld(x, y, z)
+    directions, weights = angular_distribution.sample_points_and_weights()
+    intensity = np.zeros_like(q)
+    for direction, weight in zip(directions, weights):
+        fq = np.sum(sld.reshape(-1, 1) * np.exp(1j*np.multiply.outer(np.dot(direction, [x, y, z]), q)), axis=0)
+        intensity += weight * np.abs(fq)**2
+    return intensity
+
+
+@mark.parametrize("angular_distribution", [ZDelta(), Uniform(2)])
+@mark.parametrize("chunk_size, memory_budget, n_workers", [
+    (1_000_000, 256_000_000, 1),
+    (300, 24*50, 3),
+    (999, 24*1000, 2)])
+def test_matches_direct_calculation(angular_distribution, chunk_size, memory_budget, n_workers):
+    """ Amplitudes are summed correctly over point chunks and tiles"""
+    expected = direct_calculation(angular_distribution)
+
+    intensity = calculate(angular_distribution, chunk_size=chunk_size, memory_budget=memory_budget, n_workers=n_workers)
+
+    np.testing.assert_allclose(intensity, expected, rtol=1e-10)
+
+
+def test_progress_and_cancel():
+    """ Progress reaches one, and the calculation stops when cancelled"""
+    fractions = []
+    calculate(Uniform(2), chunk_size=500, n_workers=2, progress=fractions.append)
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == pytest.approx(1.0)
+
+    fractions = []
+    with pytest.raises(CalculationCancelled):
+        calculate(Uniform(2), chunk_size=500, n_workers=2, progress=fractions.append,
+                  cancelled=lambda: len(fractions) >= 5)
+    assert len(fractions) == 5
@@ -0,0 +1,921 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'SizeDistributionUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDialog,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLayout, QLineEdit, QPushButton, QRadioButton,
+    QSizePolicy, QSpacerItem, QTabWidget, QVBoxLayout,
+    QWidget)
+
+class Ui_SizeDistribution(object):
+    def setupUi(self, SizeDistribution):
+        if not SizeDistribution.objectName():
+            SizeDistribution.setObjectName(u"SizeDistribution")
+        SizeDistribution.resize(577, 586)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(SizeDistribution.sizePolicy().hasHeightForWidth())
+        SizeDistribution.setSizePolicy(sizePolicy)
+        SizeDistribution.setMinimumSize(QSize(0, 0))
+        SizeDistribution.setMaximumSize(QSize(16777215, 16777215))
+        self.gridLayout_7 = QGridLayout(SizeDistribution)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
+        self.quickFitButton = QPushButton(SizeDistribution)
+        self.quickFitButton.setObjectName(u"quickFitButton")
+
+        self.horizontalLayout_8.addWidget(self.quickFitButton)
+
+        self.fullFitButton = QPushButton(SizeDistribution)
+        self.fullFitButton.setObjectName(u"fullFitButton")
+
+        self.horizontalLayout_8.addWidget(self.fullFitButton)
+
+        self.horizontalSpacer = QSpacerItem(50, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer)
+
+        self.helpButton = QPushButton(SizeDistribution)
+        self.helpButton.setObjectName(u"helpButton")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.helpButton.sizePolicy().hasHeightForWidth())
+        self.helpButton.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_8.addWidget(self.helpButton)
+
+
+        self.gridLayout_7.addLayout(self.horizontalLayout_8, 1, 0, 1, 1)
+
+        self.SizeDistributionTabWidget = QTabWidget(SizeDistribution)
+        self.SizeDistributionTabWidget.setObjectName(u"SizeDistributionTabWidget")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.SizeDistributionTabWidget.sizePolicy().hasHeightForWidth())
+        self.SizeDistributionTabWidget.setSizePolicy(sizePolicy2)
+        self.SizeDistributionTabWidget.setMinimumSize(QSize(0, 0))
+        self.tabMain = QWidget()
+        self.tabMain.setObjectName(u"tabMain")
+        self.gridLayout_6 = QGridLayout(self.tabMain)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.boxModel = QGroupBox(self.tabMain)
+        self.boxModel.setObjectName(u"boxModel")
+        self.gridLayout_5 = QGridLayout(self.boxModel)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.lblAspectRatio = QLabel(self.boxModel)
+        self.lblAspectRatio.setObjectName(u"lblAspectRatio")
+
+        self.gridLayout_5.addWidget(self.lblAspectRatio, 0, 3, 1, 1)
+
+        self.cbModel = QComboBox(self.boxModel)
+        self.cbModel.addItem("")
+        self.cbModel.setObjectName(u"cbModel")
+
+        self.gridLayout_5.addWidget(self.cbModel, 0, 1, 1, 1)
+
+        self.lblModel = QLabel(self.boxModel)
+        self.lblModel.setObjectName(u"lblModel")
+
+        self.gridLayout_5.addWidget(self.lblModel, 0, 0, 1, 1)
+
+        self.txtAspectRatio = QLineEdit(self.boxModel)
+        self.txtAspectRatio.setObjectName(u"txtAspectRatio")
+        self.txtAspectRatio.setEnabled(True)
+
+        self.gridLayout_5.addWidget(self.txtAspectRatio, 0, 4, 1, 1)
+
+
+        self.gridLayout_6.addWidget(self.boxModel, 1, 0, 1, 1)
+
+        self.boxParameters = QGroupBox(self.tabMain)
+        self.boxParameters.setObjectName(u"boxParameters")
+        self.gridLayout_9 = QGridLayout(self.boxParameters)
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.txtMinDiameter = QLineEdit(self.boxParameters)
+        self.txtMinDiameter.setObjectName(u"txtMinDiameter")
+        self.txtMinDiameter.setEnabled(True)
+
+        self.gridLayout_9.addWidget(self.txtMinDiameter, 0, 1, 1, 1)
+
+        self.chkLogBinning = QCheckBox(self.boxParameters)
+        self.chkLogBinning.setObjectName(u"chkLogBinning")
+        self.chkLogBinning.setEnabled(True)
+        self.chkLogBinning.setCheckable(True)
+
+        self.gridLayout_9.addWidget(self.chkLogBinning, 1, 3, 1, 2)
+
+        self.txtBinsDiameter = QLineEdit(self.boxParameters)
+        self.txtBinsDiameter.setObjectName(u"txtBinsDiameter")
+        self.txtBinsDiameter.setEnabled(True)
+
+        self.gridLayout_9.addWidget(self.txtBinsDiameter, 1, 1, 1, 1)
+
+        self.lblMaxDiameter = QLabel(self.boxParameters)
+        self.lblMaxDiameter.setObjectName(u"lblMaxDiameter")
+
+        self.gridLayout_9.addWidget(self.lblMaxDiameter, 0, 3, 1, 1)
+
+        self.label_2 = QLabel(self.boxParameters)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout_9.addWidget(self.label_2, 0, 2, 1, 1)
+
+        self.lblBinsDiameter = QLabel(self.boxParameters)
+        self.lblBinsDiameter.setObjectName(u"lblBinsDiameter")
+
+        self.gridLayout_9.addWidget(self.lblBinsDiameter, 1, 0, 1, 1)
+
+        self.lblContrast = QLabel(self.boxParameters)
+        self.lblContrast.setObjectName(u"lblContrast")
+
+        self.gridLayout_9.addWidget(self.lblContrast, 2, 0, 1, 1)
+
+        self.lblMinDiameter = QLabel(self.boxParameters)
+        self.lblMinDiameter.setObjectName(u"lblMinDiameter")
+
+        self.gridLayout_9.addWidget(self.lblMinDiameter, 0, 0, 1, 1)
+
+        self.label_4 = QLabel(self.boxParameters)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout_9.addWidget(self.label_4, 2, 2, 1, 2)
+
+        self.txtMaxDiameter = QLineEdit(self.boxParameters)
+        self.txtMaxDiameter.setObjectName(u"txtMaxDiameter")
+        self.txtMaxDiameter.setEnabled(True)
+
+        self.gridLayout_9.addWidget(self.txtMaxDiameter, 0, 4, 1, 1)
+
+        self.txtContrast = QLineEdit(self.boxParameters)
+        self.txtContrast.setObjectName(u"txtContrast")
+        self.txtContrast.setEnabled(True)
+
+        self.gridLayout_9.addWidget(self.txtContrast, 2, 1, 1, 1)
+
+        self.label_3 = QLabel(self.boxParameters)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout_9.addWidget(self.label_3, 0, 5, 1, 1)
+
+
+        self.gridLayout_6.addWidget(self.boxParameters, 2, 0, 1, 1)
+
+        self.boxOutput = QGroupBox(self.tabMain)
+        self.boxOutput.setObjectName(u"boxOutput")
+        self.gridLayout_8 = QGridLayout(self.boxOutput)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.txtDiameterMean = QLineEdit(self.boxOutput)
+        self.txtDiameterMean.setObjectName(u"txtDiameterMean")
+        self.txtDiameterMean.setEnabled(True)
+        self.txtDiameterMean.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtDiameterMean, 3, 1, 1, 1)
+
+        self.lblVolume = QLabel(self.boxOutput)
+        self.lblVolume.setObjectName(u"lblVolume")
+
+        self.gridLayout_8.addWidget(self.lblVolume, 2, 0, 1, 1)
+
+        self.label_6 = QLabel(self.boxOutput)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_8.addWidget(self.label_6, 3, 2, 1, 1)
+
+        self.txtDiameterMode = QLineEdit(self.boxOutput)
+        self.txtDiameterMode.setObjectName(u"txtDiameterMode")
+        self.txtDiameterMode.setEnabled(True)
+        self.txtDiameterMode.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtDiameterMode, 5, 1, 1, 1)
+
+        self.txtChiSq = QLineEdit(self.boxOutput)
+        self.txtChiSq.setObjectName(u"txtChiSq")
+        self.txtChiSq.setEnabled(True)
+        self.txtChiSq.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtChiSq, 1, 1, 1, 1)
+
+        self.label_20 = QLabel(self.boxOutput)
+        self.label_20.setObjectName(u"label_20")
+
+        self.gridLayout_8.addWidget(self.label_20, 5, 2, 1, 1)
+
+        self.txtDiameterMedian = QLineEdit(self.boxOutput)
+        self.txtDiameterMedian.setObjectName(u"txtDiameterMedian")
+        self.txtDiameterMedian.setEnabled(True)
+        self.txtDiameterMedian.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtDiameterMedian, 4, 1, 1, 1)
+
+        self.lblConvergence = QLabel(self.boxOutput)
+        self.lblConvergence.setObjectName(u"lblConvergence")
+
+        self.gridLayout_8.addWidget(self.lblConvergence, 0, 0, 1, 4)
+
+        self.lblChiSq = QLabel(self.boxOutput)
+        self.lblChiSq.setObjectName(u"lblChiSq")
+
+        self.gridLayout_8.addWidget(self.lblChiSq, 1, 0, 1, 1)
+
+        self.label_19 = QLabel(self.boxOutput)
+        self.label_19.setObjectName(u"label_19")
+
+        self.gridLayout_8.addWidget(self.label_19, 4, 2, 1, 1)
+
+        self.lblDiameterMode = QLabel(self.boxOutput)
+        self.lblDiameterMode.setObjectName(u"lblDiameterMode")
+
+        self.gridLayout_8.addWidget(self.lblDiameterMode, 5, 0, 1, 1)
+
+        self.label_5 = QLabel(self.boxOutput)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_8.addWidget(self.label_5, 2, 2, 1, 1)
+
+        self.lblDiameterMedian = QLabel(self.boxOutput)
+        self.lblDiameterMedian.setObjectName(u"lblDiameterMedian")
+
+        self.gridLayout_8.addWidget(self.lblDiameterMedian, 4, 0, 1, 1)
+
+        self.txtVolume = QLineEdit(self.boxOutput)
+        self.txtVolume.setObjectName(u"txtVolume")
+        self.txtVolume.setEnabled(True)
+        self.txtVolume.setReadOnly(True)
+
+        self.gridLayout_8.addWidget(self.txtVolume, 2, 1, 1, 1)
+
+        self.lblDiameterMean = QLabel(self.boxOutput)
+        self.lblDiameterMean.setObjectName(u"lblDiameterMean")
+
+        self.gridLayout_8.addWidget(self.lblDiameterMean, 3, 0, 1, 1)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_8.addItem(self.horizontalSpacer_3, 3, 3, 1, 1)
+
+
+        self.gridLayout_6.addWidget(self.boxOutput, 3, 0, 1, 1, Qt.AlignmentFlag.AlignTop)
+
+        self.boxData = QGroupBox(self.tabMain)
+        self.boxData.setObjectName(u"boxData")
+        self.gridLayout_2 = QGridLayout(self.boxData)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.lblName = QLabel(self.boxData)
+        self.lblName.setObjectName(u"lblName")
+
+        self.horizontalLayout_4.addWidget(self.lblName)
+
+        self.txtName = QLineEdit(self.boxData)
+        self.txtName.setObjectName(u"txtName")
+        self.txtName.setEnabled(False)
+        self.txtName.setFrame(False)
+        self.txtName.setReadOnly(False)
+
+        self.horizontalLayout_4.addWidget(self.txtName)
+
+
+        self.gridLayout_2.addLayout(self.horizontalLayout_4, 0, 0, 1, 1)
+
+
+        self.gridLayout_6.addWidget(self.boxData, 0, 0, 1, 1)
+
+        self.SizeDistributionTabWidget.addTab(self.tabMain, "")
+        self.tabBackground = QWidget()
+        self.tabBackground.setObjectName(u"tabBackground")
+        self.verticalLayout_5 = QVBoxLayout(self.tabBackground)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.boxBackground = QGroupBox(self.tabBackground)
+        self.boxBackground.setObjectName(u"boxBackground")
+        self.verticalLayout_4 = QVBoxLayout(self.boxBackground)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.lblBackgd = QLabel(self.boxBackground)
+        self.lblBackgd.setObjectName(u"lblBackgd")
+
+        self.horizontalLayout_7.addWidget(self.lblBackgd)
+
+        self.txtBackgd = QLineEdit(self.boxBackground)
+        self.txtBackgd.setObjectName(u"txtBackgd")
+
+        self.horizontalLayout_7.addWidget(self.txtBackgd)
+
+        self.label_8 = QLabel(self.boxBackground)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_7.addWidget(self.label_8)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_7)
+
+        self.qRangeGroupBox = QGroupBox(self.boxBackground)
+        self.qRangeGroupBox.setObjectName(u"qRangeGroupBox")
+        self.gridLayout_3 = QGridLayout(self.qRangeGroupBox)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label_18 = QLabel(self.qRangeGroupBox)
+        self.label_18.setObjectName(u"label_18")
+
+        self.horizontalLayout_2.addWidget(self.label_18)
+
+        self.txtBackgdQMin = QLineEdit(self.qRangeGroupBox)
+        self.txtBackgdQMin.setObjectName(u"txtBackgdQMin")
+        self.txtBackgdQMin.setEnabled(True)
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.txtBackgdQMin.sizePolicy().hasHeightForWidth())
+        self.txtBackgdQMin.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_2.addWidget(self.txtBackgdQMin)
+
+        self.label_11 = QLabel(self.qRangeGroupBox)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_2.addWidget(self.label_11)
+
+        self.label_10 = QLabel(self.qRangeGroupBox)
+        self.label_10.setObjectName(u"label_10")
+
+        self.horizontalLayout_2.addWidget(self.label_10)
+
+        self.txtBackgdQMax = QLineEdit(self.qRangeGroupBox)
+        self.txtBackgdQMax.setObjectName(u"txtBackgdQMax")
+        self.txtBackgdQMax.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtBackgdQMax.sizePolicy().hasHeightForWidth())
+        self.txtBackgdQMax.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_2.addWidget(self.txtBackgdQMax)
+
+        self.label_16 = QLabel(self.qRangeGroupBox)
+        self.label_16.setObjectName(u"label_16")
+
+        self.horizontalLayout_2.addWidget(self.label_16)
+
+
+        self.gridLayout_3.addLayout(self.horizontalLayout_2, 0, 0, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.qRangeGroupBox)
+
+        self.horizontalLayout_12 = QHBoxLayout()
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_12.addItem(self.horizontalSpacer_2)
+
+        self.cmdFitFlatBackground = QPushButton(self.boxBackground)
+        self.cmdFitFlatBackground.setObjectName(u"cmdFitFlatBackground")
+
+        self.horizontalLayout_12.addWidget(self.cmdFitFlatBackground)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_12.addItem(self.horizontalSpacer_4)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_12)
+
+
+        self.verticalLayout_5.addWidget(self.boxBackground)
+
+        self.chkLowQ = QCheckBox(self.tabBackground)
+        self.chkLowQ.setObjectName(u"chkLowQ")
+
+        self.verticalLayout_5.addWidget(self.chkLowQ)
+
+        self.groupBox = QGroupBox(self.tabBackground)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.powerLawQRangeGroupBox = QGroupBox(self.groupBox)
+        self.powerLawQRangeGroupBox.setObjectName(u"powerLawQRangeGroupBox")
+        self.gridLayout_4 = QGridLayout(self.powerLawQRangeGroupBox)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.label_7 = QLabel(self.powerLawQRangeGroupBox)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_3.addWidget(self.label_7)
+
+        self.txtPowerLawQMin = QLineEdit(self.powerLawQRangeGroupBox)
+        self.txtPowerLawQMin.setObjectName(u"txtPowerLawQMin")
+        self.txtPowerLawQMin.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtPowerLawQMin.sizePolicy().hasHeightForWidth())
+        self.txtPowerLawQMin.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_3.addWidget(self.txtPowerLawQMin)
+
+        self.label_12 = QLabel(self.powerLawQRangeGroupBox)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_3.addWidget(self.label_12)
+
+        self.label_14 = QLabel(self.powerLawQRangeGroupBox)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_3.addWidget(self.label_14)
+
+        self.txtPowerLawQMax = QLineEdit(self.powerLawQRangeGroupBox)
+        self.txtPowerLawQMax.setObjectName(u"txtPowerLawQMax")
+        self.txtPowerLawQMax.setEnabled(True)
+        sizePolicy3.setHeightForWidth(self.txtPowerLawQMax.sizePolicy().hasHeightForWidth())
+        self.txtPowerLawQMax.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_3.addWidget(self.txtPowerLawQMax)
+
+        self.label_17 = QLabel(self.powerLawQRangeGroupBox)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout_3.addWidget(self.label_17)
+
+
+        self.gridLayout_4.addLayout(self.horizontalLayout_3, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.powerLawQRangeGroupBox, 0, Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout_14 = QGridLayout()
+        self.gridLayout_14.setObjectName(u"gridLayout_14")
+        self.txtPowerLowQ = QLineEdit(self.groupBox)
+        self.txtPowerLowQ.setObjectName(u"txtPowerLowQ")
+        sizePolicy3.setHeightForWidth(self.txtPowerLowQ.sizePolicy().hasHeightForWidth())
+        self.txtPowerLowQ.setSizePolicy(sizePolicy3)
+
+        self.gridLayout_14.addWidget(self.txtPowerLowQ, 0, 1, 1, 1)
+
+        self.lblPowerLowQ = QLabel(self.groupBox)
+        self.lblPowerLowQ.setObjectName(u"lblPowerLowQ")
+
+        self.gridLayout_14.addWidget(self.lblPowerLowQ, 0, 0, 1, 1)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.rbFixPower = QRadioButton(self.groupBox)
+        self.rbFixPower.setObjectName(u"rbFixPower")
+        self.rbFixPower.setChecked(True)
+
+        self.horizontalLayout.addWidget(self.rbFixPower)
+
+        self.rbFitPower = QRadioButton(self.groupBox)
+        self.rbFitPower.setObjectName(u"rbFitPower")
+
+        self.horizontalLayout.addWidget(self.rbFitPower)
+
+
+        self.gridLayout_14.addLayout(self.horizontalLayout, 0, 2, 1, 1)
+
+        self.lblScaleLowQ = QLabel(self.groupBox)
+        self.lblScaleLowQ.setObjectName(u"lblScaleLowQ")
+
+        self.gridLayout_14.addWidget(self.lblScaleLowQ, 1, 0, 1, 1)
+
+        self.txtScaleLowQ = QLineEdit(self.groupBox)
+        self.txtScaleLowQ.setObjectName(u"txtScaleLowQ")
+        sizePolicy3.setHeightForWidth(self.txtScaleLowQ.sizePolicy().hasHeightForWidth())
+        self.txtScaleLowQ.setSizePolicy(sizePolicy3)
+
+        self.gridLayout_14.addWidget(self.txtScaleLowQ, 1, 1, 1, 1)
+
+
+        self.verticalLayout_3.addLayout(self.gridLayout_14)
+
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_11.addItem(self.horizontalSpacer_5)
+
+        self.cmdFitPowerLaw = QPushButton(self.groupBox)
+        self.cmdFitPowerLaw.setObjectName(u"cmdFitPowerLaw")
+
+        self.horizontalLayout_11.addWidget(self.cmdFitPowerLaw)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_11.addItem(self.horizontalSpacer_6)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_11)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_5.addItem(self.verticalSpacer_2)
+
+        self.SizeDistributionTabWidget.addTab(self.tabBackground, "")
+        self.tabOptions = QWidget()
+        self.tabOptions.setObjectName(u"tabOptions")
+        self.verticalLayout_2 = QVBoxLayout(self.tabOptions)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.boxFittingRange = QGroupBox(self.tabOptions)
+        self.boxFittingRange.setObjectName(u"boxFittingRange")
+        self.horizontalLayout_9 = QHBoxLayout(self.boxFittingRange)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.gridLayout_13 = QGridLayout()
+        self.gridLayout_13.setObjectName(u"gridLayout_13")
+        self.txtMinRange = QLineEdit(self.boxFittingRange)
+        self.txtMinRange.setObjectName(u"txtMinRange")
+        self.txtMinRange.setMinimumSize(QSize(80, 0))
+
+        self.gridLayout_13.addWidget(self.txtMinRange, 0, 1, 1, 1)
+
+        self.lblMinRange = QLabel(self.boxFittingRange)
+        self.lblMinRange.setObjectName(u"lblMinRange")
+
+        self.gridLayout_13.addWidget(self.lblMinRange, 0, 0, 1, 1)
+
+        self.lblMaxRange = QLabel(self.boxFittingRange)
+        self.lblMaxRange.setObjectName(u"lblMaxRange")
+
+        self.gridLayout_13.addWidget(self.lblMaxRange, 0, 3, 1, 1)
+
+        self.txtMaxRange = QLineEdit(self.boxFittingRange)
+        self.txtMaxRange.setObjectName(u"txtMaxRange")
+        self.txtMaxRange.setMinimumSize(QSize(80, 0))
+
+        self.gridLayout_13.addWidget(self.txtMaxRange, 0, 4, 1, 1)
+
+        self.label_15 = QLabel(self.boxFittingRange)
+        self.label_15.setObjectName(u"label_15")
+
+        self.gridLayout_13.addWidget(self.label_15, 0, 5, 1, 1)
+
+        self.label_13 = QLabel(self.boxFittingRange)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_13.addWidget(self.label_13, 0, 2, 1, 1)
+
+        self.cmdReset = QPushButton(self.boxFittingRange)
+        self.cmdReset.setObjectName(u"cmdReset")
+
+        self.gridLayout_13.addWidget(self.cmdReset, 0, 6, 1, 1)
+
+
+        self.horizontalLayout_9.addLayout(self.gridLayout_13)
+
+
+        self.verticalLayout_2.addWidget(self.boxFittingRange)
+
+        self.boxAdvancedParameters = QGroupBox(self.tabOptions)
+        self.boxAdvancedParameters.setObjectName(u"boxAdvancedParameters")
+        self.verticalLayout_6 = QVBoxLayout(self.boxAdvancedParameters)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.txtSkyBackgd = QLineEdit(self.boxAdvancedParameters)
+        self.txtSkyBackgd.setObjectName(u"txtSkyBackgd")
+
+        self.gridLayout.addWidget(self.txtSkyBackgd, 0, 1, 1, 1)
+
+        self.lblSkyBackgd = QLabel(self.boxAdvancedParameters)
+        self.lblSkyBackgd.setObjectName(u"lblSkyBackgd")
+
+        self.gridLayout.addWidget(self.lblSkyBackgd, 0, 0, 1, 1)
+
+        self.lblIterations = QLabel(self.boxAdvancedParameters)
+        self.lblIterations.setObjectName(u"lblIterations")
+
+        self.gridLayout.addWidget(self.lblIterations, 1, 0, 1, 1)
+
+        self.txtIterations = QLineEdit(self.boxAdvancedParameters)
+        self.txtIterations.setObjectName(u"txtIterations")
+
+        self.gridLayout.addWidget(self.txtIterations, 1, 1, 1, 1)
+
+
+        self.verticalLayout_6.addLayout(self.gridLayout)
+
+
+        self.verticalLayout_2.addWidget(self.boxAdvancedParameters)
+
+        self.boxWeighting = QGroupBox(self.tabOptions)
+        self.boxWeighting.setObjectName(u"boxWeighting")
+        self.gridLayout_20 = QGridLayout(self.boxWeighting)
+        self.gridLayout_20.setObjectName(u"gridLayout_20")
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+
+        self.gridLayout_20.addLayout(self.horizontalLayout_5, 1, 0, 1, 1)
+
+        self.verticalLayout = QGridLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.txtWgtPercent = QLineEdit(self.boxWeighting)
+        self.txtWgtPercent.setObjectName(u"txtWgtPercent")
+
+        self.verticalLayout.addWidget(self.txtWgtPercent, 3, 1, 1, 1)
+
+        self.rbWeighting1 = QRadioButton(self.boxWeighting)
+        self.rbWeighting1.setObjectName(u"rbWeighting1")
+        self.rbWeighting1.setChecked(True)
+
+        self.verticalLayout.addWidget(self.rbWeighting1, 0, 0, 1, 1)
+
+        self.rbWeighting2 = QRadioButton(self.boxWeighting)
+        self.rbWeighting2.setObjectName(u"rbWeighting2")
+
+        self.verticalLayout.addWidget(self.rbWeighting2, 1, 0, 1, 1)
+
+        self.rbWeighting3 = QRadioButton(self.boxWeighting)
+        self.rbWeighting3.setObjectName(u"rbWeighting3")
+
+        self.verticalLayout.addWidget(self.rbWeighting3, 2, 0, 1, 1)
+
+        self.txtWgtFactor = QLineEdit(self.boxWeighting)
+        self.txtWgtFactor.setObjectName(u"txtWgtFactor")
+
+        self.verticalLayout.addWidget(self.txtWgtFactor, 2, 3, 1, 1)
+
+        self.rbWeighting4 = QRadioButton(self.boxWeighting)
+        self.rbWeighting4.setObjectName(u"rbWeighting4")
+
+        self.verticalLayout.addWidget(self.rbWeighting4, 3, 0, 1, 1)
+
+        self.lblWgtFactor = QLabel(self.boxWeighting)
+        self.lblWgtFactor.setObjectName(u"lblWgtFactor")
+
+        self.verticalLayout.addWidget(self.lblWgtFactor, 2, 2, 1, 1)
+
+
+        self.gridLayout_20.addLayout(self.verticalLayout, 0, 0, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.boxWeighting)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.SizeDistributionTabWidget.addTab(self.tabOptions, "")
+
+        self.gridLayout_7.addWidget(self.SizeDistributionTabWidget, 0, 0, 1, 1)
+
+        QWidget.setTabOrder(self.SizeDistributionTabWidget, self.txtName)
+        QWidget.setTabOrder(self.txtName, self.cbModel)
+        QWidget.setTabOrder(self.cbModel, self.txtAspectRatio)
+        QWidget.setTabOrder(self.txtAspectRatio, self.txtMinDiameter)
+        QWidget.setTabOrder(self.txtMinDiameter, self.txtMaxDiameter)
+        QWidget.setTabOrder(self.txtMaxDiameter, self.txtBinsDiameter)
+        QWidget.setTabOrder(self.txtBinsDiameter, self.chkLogBinning)
+        QWidget.setTabOrder(self.chkLogBinning, self.txtContrast)
+        QWidget.setTabOrder(self.txtContrast, self.txtMinRange)
+        QWidget.setTabOrder(self.txtMinRange, self.txtMaxRange)
+        QWidget.setTabOrder(self.txtMaxRange, self.cmdReset)
+        QWidget.setTabOrder(self.cmdReset, self.txtSkyBackgd)
+        QWidget.setTabOrder(self.txtSkyBackgd, self.txtIterations)
+        QWidget.setTabOrder(self.txtIterations, self.rbWeighting1)
+        QWidget.setTabOrder(self.rbWeighting1, self.rbWeighting2)
+        QWidget.setTabOrder(self.rbWeighting2, self.rbWeighting3)
+        QWidget.setTabOrder(self.rbWeighting3, self.txtWgtFactor)
+        QWidget.setTabOrder(self.txtWgtFactor, self.rbWeighting4)
+        QWidget.setTabOrder(self.rbWeighting4, self.txtWgtPercent)
+        QWidget.setTabOrder(self.txtWgtPercent, self.txtBackgd)
+        QWidget.setTabOrder(self.txtBackgd, self.txtBackgdQMin)
+        QWidget.setTabOrder(self.txtBackgdQMin, self.txtBackgdQMax)
+        QWidget.setTabOrder(self.txtBackgdQMax, self.cmdFitFlatBackground)
+        QWidget.setTabOrder(self.cmdFitFlatBackground, self.chkLowQ)
+        QWidget.setTabOrder(self.chkLowQ, self.txtPowerLawQMin)
+        QWidget.setTabOrder(self.txtPowerLawQMin, self.txtPowerLawQMax)
+        QWidget.setTabOrder(self.txtPowerLawQMax, self.txtPowerLowQ)
+        QWidget.setTabOrder(self.txtPowerLowQ, self.rbFixPower)
+        QWidget.setTabOrder(self.rbFixPower, self.rbFitPower)
+        QWidget.setTabOrder(self.rbFitPower, self.txtScaleLowQ)
+        QWidget.setTabOrder(self.txtScaleLowQ, self.cmdFitPowerLaw)
+        QWidget.setTabOrder(self.cmdFitPowerLaw, self.quickFitButton)
+        QWidget.setTabOrder(self.quickFitButton, self.fullFitButton)
+        QWidget.setTabOrder(self.fullFitButton, self.helpButton)
+
+        self.retranslateUi(SizeDistribution)
+
+        self.SizeDistributionTabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(SizeDistribution)
+    # setupUi
+
+    def retranslateUi(self, SizeDistribution):
+        SizeDistribution.setWindowTitle(QCoreApplication.translate("SizeDistribution", u"Size Distribution", None))
+#if QT_CONFIG(tooltip)
+        self.quickFitButton.setToolTip(QCoreApplication.translate("SizeDistribution", u"Perform a quick fit using fixed iteration parameters.", None))
+#endif // QT_CONFIG(tooltip)
+        self.quickFitButton.setText(QCoreApplication.translate("SizeDistribution", u"Quick fit", None))
+#if QT_CONFIG(tooltip)
+        self.fullFitButton.setToolTip(QCoreApplication.translate("SizeDistribution", u"Perform a full fit with all parameters optimized.", None))
+#endif // QT_CONFIG(tooltip)
+        self.fullFitButton.setText(QCoreApplication.translate("SizeDistribution", u"Full fit", None))
+#if QT_CONFIG(tooltip)
+        self.helpButton.setToolTip(QCoreApplication.translate("SizeDistribution", u"Open the Size Distribution perspective help documentation.", None))
+#endif // QT_CONFIG(tooltip)
+        self.helpButton.setText(QCoreApplication.translate("SizeDistribution", u"Help", None))
+        self.boxModel.setTitle(QCoreApplication.translate("SizeDistribution", u"Model", None))
+        self.lblAspectRatio.setText(QCoreApplication.translate("SizeDistribution", u"Aspect ratio:", None))
+        self.cbModel.setItemText(0, QCoreApplication.translate("SizeDistribution", u"Ellipsoid", None))
+
+#if QT_CONFIG(tooltip)
+        self.cbModel.setToolTip(QCoreApplication.translate("SizeDistribution", u"Select a model.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblModel.setText(QCoreApplication.translate("SizeDistribution", u"Model name", None))
+#if QT_CONFIG(tooltip)
+        self.txtAspectRatio.setToolTip(QCoreApplication.translate("SizeDistribution", u"Aspect ratio of the ellipsoid model (ratio of semi-axes).", None))
+#endif // QT_CONFIG(tooltip)
+        self.boxParameters.setTitle(QCoreApplication.translate("SizeDistribution", u"Distribution parameters", None))
+#if QT_CONFIG(tooltip)
+        self.txtMinDiameter.setToolTip(QCoreApplication.translate("SizeDistribution", u"Minimum diameter of particles in the size distribution (in Angstroms).", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.chkLogBinning.setToolTip(QCoreApplication.translate("SizeDistribution", u"Use logarithmic binning for the diameter distribution.", None))
+#endif // QT_CONFIG(tooltip)
+        self.chkLogBinning.setText(QCoreApplication.translate("SizeDistribution", u"Logarithmic binning", None))
+#if QT_CONFIG(tooltip)
+        self.txtBinsDiameter.setToolTip(QCoreApplication.translate("SizeDistribution", u"Number of bins to use in the diameter distribution.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblMaxDiameter.setText(QCoreApplication.translate("SizeDistribution", u"Max Diameter:", None))
+        self.label_2.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5</p></body></html>\n"
+"             ", None))
+        self.lblBinsDiameter.setText(QCoreApplication.translate("SizeDistribution", u"Bins in diameter:", None))
+        self.lblContrast.setText(QCoreApplication.translate("SizeDistribution", u"Contrast:", None))
+        self.lblMinDiameter.setText(QCoreApplication.translate("SizeDistribution", u"Min Diameter:", None))
+        self.label_4.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>10<span\n"
+"              style=\" vertical-align:super;\">-6</span>/\u00c5<span\n"
+"              style=\" vertical-align:super;\">2</span></p></body></html>\n"
+"             ", None))
+#if QT_CONFIG(tooltip)
+        self.txtMaxDiameter.setToolTip(QCoreApplication.translate("SizeDistribution", u"Maximum diameter of particles in the size distribution (in Angstroms).", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtContrast.setToolTip(QCoreApplication.translate("SizeDistribution", u"Scattering length density contrast between particles and solvent (10^-6 / \u00c5^2).", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_3.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5</p></body></html>\n"
+"             ", None))
+        self.boxOutput.setTitle(QCoreApplication.translate("SizeDistribution", u"Output", None))
+#if QT_CONFIG(tooltip)
+        self.txtDiameterMean.setToolTip(QCoreApplication.translate("SizeDistribution", u"Mean diameter of the size distribution.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblVolume.setText(QCoreApplication.translate("SizeDistribution", u"Total volume fraction: ", None))
+        self.label_6.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5</p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtDiameterMode.setToolTip(QCoreApplication.translate("SizeDistribution", u"Mode diameter of the size distribution (most frequently occurring size).", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.txtChiSq.setToolTip(QCoreApplication.translate("SizeDistribution", u"Chi-squared value indicating fit quality (lower is better).", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_20.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5</p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtDiameterMedian.setToolTip(QCoreApplication.translate("SizeDistribution", u"Median diameter of the size distribution (50th percentile).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblConvergence.setText("")
+        self.lblChiSq.setText(QCoreApplication.translate("SizeDistribution", u"ChiSq: ", None))
+        self.label_19.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5</p></body></html>", None))
+        self.lblDiameterMode.setText(QCoreApplication.translate("SizeDistribution", u"Mode diameter:", None))
+        self.label_5.setText(QCoreApplication.translate("SizeDistribution", u"%", None))
+        self.lblDiameterMedian.setText(QCoreApplication.translate("SizeDistribution", u"Median diameter:", None))
+#if QT_CONFIG(tooltip)
+        self.txtVolume.setToolTip(QCoreApplication.translate("SizeDistribution", u"Total particle volume fraction in the sample (%).", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblDiameterMean.setText(QCoreApplication.translate("SizeDistribution", u"Mean diameter:", None))
+        self.boxData.setTitle(QCoreApplication.translate("SizeDistribution", u"I(q) data source", None))
+        self.lblName.setText(QCoreApplication.translate("SizeDistribution", u"Name:", None))
+        self.SizeDistributionTabWidget.setTabText(self.SizeDistributionTabWidget.indexOf(self.tabMain), QCoreApplication.translate("SizeDistribution", u"Parameters", None))
+#if QT_CONFIG(whatsthis)
+        self.tabBackground.setWhatsThis(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p><br/></p></body></html>", None))
+#endif // QT_CONFIG(whatsthis)
+        self.boxBackground.setTitle(QCoreApplication.translate("SizeDistribution", u"Flat Background", None))
+        self.lblBackgd.setText(QCoreApplication.translate("SizeDistribution", u"Flat background:", None))
+#if QT_CONFIG(tooltip)
+        self.txtBackgd.setToolTip(QCoreApplication.translate("SizeDistribution", u"Flat background value (constant background in cm^-1).", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_8.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>cm<span style=\"\n"
+"              vertical-align:super;\">-1</span></p></body></html>\n"
+"             ", None))
+        self.qRangeGroupBox.setTitle(QCoreApplication.translate("SizeDistribution", u"Q range", None))
+        self.label_18.setText(QCoreApplication.translate("SizeDistribution", u"Min:", None))
+#if QT_CONFIG(tooltip)
+        self.txtBackgdQMin.setToolTip(QCoreApplication.translate("SizeDistribution", u"Minimum Q value for fitting the flat background.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_11.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.label_10.setText(QCoreApplication.translate("SizeDistribution", u"Max:", None))
+#if QT_CONFIG(tooltip)
+        self.txtBackgdQMax.setToolTip(QCoreApplication.translate("SizeDistribution", u"Maximum Q value for fitting the flat background.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_16.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.cmdFitFlatBackground.setToolTip(QCoreApplication.translate("SizeDistribution", u"Fit the flat background component to the data in the specified Q range.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdFitFlatBackground.setText(QCoreApplication.translate("SizeDistribution", u"Fit Flat Background", None))
+#if QT_CONFIG(tooltip)
+        self.chkLowQ.setToolTip(QCoreApplication.translate("SizeDistribution", u"Subtract the low-Q power law.", None))
+#endif // QT_CONFIG(tooltip)
+        self.chkLowQ.setText(QCoreApplication.translate("SizeDistribution", u"Subtract Low-Q Power Law", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SizeDistribution", u"Power Law", None))
+        self.powerLawQRangeGroupBox.setTitle(QCoreApplication.translate("SizeDistribution", u"Q range", None))
+        self.label_7.setText(QCoreApplication.translate("SizeDistribution", u"Min:", None))
+#if QT_CONFIG(tooltip)
+        self.txtPowerLawQMin.setToolTip(QCoreApplication.translate("SizeDistribution", u"Minimum Q value for fitting the power-law background.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_12.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+        self.label_14.setText(QCoreApplication.translate("SizeDistribution", u"Max:", None))
+#if QT_CONFIG(tooltip)
+        self.txtPowerLawQMax.setToolTip(QCoreApplication.translate("SizeDistribution", u"Maximum Q value for fitting the power-law background.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_17.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span style=\" vertical-align:super;\">-1</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.txtPowerLowQ.setToolTip(QCoreApplication.translate("SizeDistribution", u"Exponent applied to the power-law function.", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblPowerLowQ.setText(QCoreApplication.translate("SizeDistribution", u"Power:", None))
+        self.rbFixPower.setText(QCoreApplication.translate("SizeDistribution", u"Fix", None))
+        self.rbFitPower.setText(QCoreApplication.translate("SizeDistribution", u"Fit", None))
+        self.lblScaleLowQ.setText(QCoreApplication.translate("SizeDistribution", u"Scale:", None))
+#if QT_CONFIG(tooltip)
+        self.txtScaleLowQ.setToolTip(QCoreApplication.translate("SizeDistribution", u"Scale applied to the power-law function.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.cmdFitPowerLaw.setToolTip(QCoreApplication.translate("SizeDistribution", u"Fit the power-law component to the data in the specified Q range.", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdFitPowerLaw.setText(QCoreApplication.translate("SizeDistribution", u"Fit Power Law", None))
+        self.SizeDistributionTabWidget.setTabText(self.SizeDistributionTabWidget.indexOf(self.tabBackground), QCoreApplication.translate("SizeDistribution", u"Background", None))
+        self.boxFittingRange.setTitle(QCoreApplication.translate("SizeDistribution", u"Fitting range", None))
+#if QT_CONFIG(tooltip)
+        self.txtMinRange.setToolTip(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>Minimum\n"
+"                value of Q.</p></body></html>\n"
+"               ", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblMinRange.setText(QCoreApplication.translate("SizeDistribution", u"Min", None))
+        self.lblMaxRange.setText(QCoreApplication.translate("SizeDistribution", u"Max", None))
+#if QT_CONFIG(tooltip)
+        self.txtMaxRange.setToolTip(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>Maximum\n"
+"                value of Q.</p></body></html>\n"
+"               ", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_15.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span\n"
+"                style=\" vertical-align:super;\">-1</span></p></body></html>\n"
+"               ", None))
+        self.label_13.setText(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>\u00c5<span\n"
+"                style=\" vertical-align:super;\">-1</span></p></body></html>\n"
+"               ", None))
+#if QT_CONFIG(tooltip)
+        self.cmdReset.setToolTip(QCoreApplication.translate("SizeDistribution", u"<html><head/><body><p>Reset\n"
+"              the Q range to the default.</p></body></html>\n"
+"             ", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdReset.setText(QCoreApplication.translate("SizeDistribution", u"Reset", None))
+        self.boxAdvancedParameters.setTitle(QCoreApplication.translate("SizeDistribution", u"Method parameters", None))
+#if QT_CONFIG(tooltip)
+        self.txtSkyBackgd.setToolTip(QCoreApplication.translate("SizeDistribution", u"Sky background parameter for the Maximum Entropy method (suggested: 1e-6)", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblSkyBackgd.setText(QCoreApplication.translate("SizeDistribution", u"MaxEnt Sky Background:", None))
+        self.lblIterations.setText(QCoreApplication.translate("SizeDistribution", u"Iterations:", None))
+#if QT_CONFIG(tooltip)
+        self.txtIterations.setToolTip(QCoreApplication.translate("SizeDistribution", u"Number of iterations for the Maximum Entropy method.", None))
+#endif // QT_CONFIG(tooltip)
+        self.boxWeighting.setTitle(QCoreApplication.translate("SizeDistribution", u"Weighting", None))
+#if QT_CONFIG(tooltip)
+        self.txtWgtPercent.setToolTip(QCoreApplication.translate("SizeDistribution", u"Percentage value for percentage-based weighting.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.rbWeighting1.setToolTip(QCoreApplication.translate("SizeDistribution", u"No weighting applied to the data.", None))
+#endif // QT_CONFIG(tooltip)
+        self.rbWeighting1.setText(QCoreApplication.translate("SizeDistribution", u"None", None))
+#if QT_CONFIG(tooltip)
+        self.rbWeighting2.setToolTip(QCoreApplication.translate("SizeDistribution", u"Weight data by its error values (dI).", None))
+#endif // QT_CONFIG(tooltip)
+        self.rbWeighting2.setText(QCoreApplication.translate("SizeDistribution", u"Use dI Data", None))
+#if QT_CONFIG(tooltip)
+        self.rbWeighting3.setToolTip(QCoreApplication.translate("SizeDistribution", u"Weight data by the square root of intensity values.", None))
+#endif // QT_CONFIG(tooltip)
+        self.rbWeighting3.setText(QCoreApplication.translate("SizeDistribution", u"Use |sqrt(I Data)|", None))
+#if QT_CONFIG(tooltip)
+        self.txtWgtFactor.setToolTip(QCoreApplication.translate("SizeDistribution", u"Overall weighting factor to apply to the data.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.rbWeighting4.setToolTip(QCoreApplication.translate("SizeDistribution", u"Weight data as a percentage of intensity values.", None))
+#endif // QT_CONFIG(tooltip)
+        self.rbWeighting4.setText(QCoreApplication.translate("SizeDistribution", u"Use % |I Data|:", None))
+        self.lblWgtFactor.setText(QCoreApplication.translate("SizeDistribution", u"Weight factor:", None))
+        self.SizeDistributionTabWidget.setTabText(self.SizeDistributionTabWidget.indexOf(self.tabOptions), QCoreApplication.translate("SizeDistribution", u"Options", None))
+    # retranslateUi
+
@@ -2,6 +2,7 @@ import string
 from collections import OrderedDict
 
 import numpy
+from scipy import ndimage
 
 # MPL shapes dictionary with some extra styles rendered internally.
 # Ordered for consistent display in combo boxes
@@ -59,7 +60,7 @@ WEIGHTS = ['light', 'normal', 'bold']
 FONTS = ['sans-serif', 'serif', 'cursive', 'fantasy', 'monospace']
 
 
-def build_matrix(data, qx_data, qy_data):
+def build_matrix(data, qx_data, qy_data, geometry=None):
     """
     Build a matrix for 2d plot from a vector
     Returns a matrix (image) with ~ square binning
@@ -67,6 +68,8 @@ def build_matrix(data, qx_data, qy_data):
     data, qx_data, and qy_data
     where each one corresponds to z, x, or y axis values
 
+    A BinGeometry for qx_data and qy_data may be given as *geometry*, so
+    that the binning of the points is not found again.
     """
     # No qx or qy given in a vector format
     if qx_data is None or qy_data is None \
@@ -76,26 +79,17 @@ def build_matrix(data, qx_data, qy_data):
     # maximum # of loops to fillup_pixels
     # otherwise, loop could never stop depending on data
     max_loop = 1
-    # get the x and y_bin arrays.
-    x_bins, y_bins = get_bins(qx_data, qy_data)
-    # set zero to None
+    # get the x and y_bin arrays, and the bin of each point
+    if geometry is None or not geometry.matches(qx_data, qy_data):
+        geometry = BinGeometry(qx_data, qy_data)
 
     #Note: Can not use scipy.interpolate.Rbf:
     # 'cause too many data points (>10000)<=JHC.
-    # 1d array to use for weighting the data point averaging
-    #when they fall into a same bin.
-    weights_data = numpy.ones([data.size])
-    # get histogram of ones w/len(data); this will provide
-    #the weights of data on each bins
-    weights, xedges, yedges = numpy.histogram2d(x=qy_data,
-                                                y=qx_data,
-                                                bins=[y_bins, x_bins],
-                                                weights=weights_data)
+    # the number of data points on each bin provides the weights of
+    # data when they fall into a same bin.
+    weights = geometry.weights
     # get histogram of data, all points into a bin in a way of summing
-    image, xedges, yedges = numpy.histogram2d(x=qy_data,
-                                              y=qx_data,
-                                              bins=[y_bins, x_bins],
-                                              weights=data)
+    image = geometry.histogram(data)
     # Now, normalize the image by weights only for weights>1:
     # If weight == 1, there is only one data point in the bin so
     # that no normalization is required.
@@ -118,6 +112,53 @@ def build_matrix(data, qx_data, qy_data):
 
     return image
 
+class BinGeometry:
+    """
+    Binning of the points *qx_data*, *qy_data* into the pixels of the image
+    made by :func:`build_matrix`, with the bins from :func:`get_bins`.
+
+    The binning does not depend on the data values, so it can be kept to
+    make images of new values at the same points with one pass over them.
+    """
+    def __init__(self, qx_data, qy_data):
+        self.qx_data = qx_data
+        self.qy_data = qy_data
+        self.x_bins, self.y_bins = get_bins(qx_data, qy_data)
+        # Image rows are along qy, as x=qy_data in numpy.histogram2d
+        self.shape = (len(self.y_bins) - 1, len(self.x_bins) - 1)
+        row = _bin_index(qy_data, self.y_bins)
+        column = _bin_index(qx_data, self.x_bins)
+        self.inside = (row >= 0) & (column >= 0)
+        self.pixels = numpy.ravel_multi_index((row[self.inside], column[self.inside]), self.shape)
+        # number of points in each pixel
+        self.weights = self.histogram(None)
+
+    def matches(self, qx_data, qy_data):
+        """
+        Return True if this is the binning of the arrays *qx_data*, *qy_data*
+        """
+        return qx_data is self.qx_data and qy_data is self.qy_data
+
+    def histogram(self, data):
+        """
+        Sum of *data* over the points in each pixel, or the number of points
+        in each pixel if *data* is None
+        """
+        values = None if data is None else data[self.inside]
+        counts = numpy.bincount(self.pixels, weights=values, minlength=self.shape[0]*self.shape[1])
+        return counts.reshape(self.shape).astype(float)
+
+def _bin_index(values, edges):
+    """
+    Index of the bin of each of *values* between *edges*, found as
+    numpy.histogram2d does with the last bin closed on the right, or -1
+    for values outside the bins
+    """
+    index = numpy.searchsorted(edges, values, side='right') - 1
+    index[values == edges[-1]] = len(edges) - 2
+    index[index >= len(edges) - 1] = -1
+    return index
+
 def get_bins(qx_data, qy_data):
     """
     get bins
@@ -172,62 +213,22 @@ def fillupPixels(image=None, weights=None):
     :param image: (2d matrix with some zi = None)
 
     :return: image (2d array )
-
-    :TODO: Find better way to do for-loop below
-
     """
     # No image matrix given
     if image is None or numpy.ndim(image) != 2 \
             or numpy.isfinite(image).all() \
             or weights is None:
         return image
-    # Get bin size in y and x directions
-    len_y = len(image)
-    len_x = len(image[1])
-    temp_image = numpy.zeros([len_y, len_x])
-    weit = numpy.zeros([len_y, len_x])
-    # do for-loop for all pixels
-    for n_y in range(len(image)):
-        for n_x in range(len(image[1])):
-            # find only null pixels
-            if weights[n_y][n_x] > 0 or numpy.isfinite(image[n_y][n_x]):
-                continue
-            else:
-                # find 4 nearest neighbors
-                # check where or not it is at the corner
-                if n_y != 0 and numpy.isfinite(image[n_y - 1][n_x]):
-                    temp_image[n_y][n_x] += image[n_y - 1][n_x]
-                    weit[n_y][n_x] += 1
-                if n_x != 0 and numpy.isfinite(image[n_y][n_x - 1]):
-                    temp_image[n_y][n_x] += image[n_y][n_x - 1]
-                    weit[n_y][n_x] += 1
-                if n_y != len_y - 1 and numpy.isfinite(image[n_y + 1][n_x]):
-                    temp_image[n_y][n_x] += image[n_y + 1][n_x]
-                    weit[n_y][n_x] += 1
-                if n_x != len_x - 1 and numpy.isfinite(image[n_y][n_x + 1]):
-                    temp_image[n_y][n_x] += image[n_y][n_x + 1]
-                    weit[n_y][n_x] += 1
-                # go 4 next nearest neighbors when no non-zero
-                # neighbor exists
-                if n_y != 0 and n_x != 0 and\
-                        numpy.isfinite(image[n_y - 1][n_x - 1]):
-                    temp_image[n_y][n_x] += image[n_y - 1][n_x - 1]
-                    weit[n_y][n_x] += 1
-                if n_y != len_y - 1 and n_x != 0 and \
-                    numpy.isfinite(image[n_y + 1][n_x - 1]):
-                    temp_image[n_y][n_x] += image[n_y + 1][n_x - 1]
-                    weit[n_y][n_x] += 1
-                if n_y != len_y and n_x != len_x - 1 and \
-                    numpy.isfinite(image[n_y - 1][n_x + 1]):
-                    temp_image[n_y][n_x] += image[n_y - 1][n_x + 1]
-                    weit[n_y][n_x] += 1
-                if n_y != len_y - 1 and n_x != len_x - 1 and \
-                    numpy.isfinite(image[n_y + 1][n_x + 1]):
-                    temp_image[n_y][n_x] += image[n_y + 1][n_x + 1]
-                    weit[n_y][n_x] += 1
-
-    # get it normalized
-    ind = (weit > 0)
+    # Sum and number of the finite values among the 8 neighbours of each
+    # pixel, leaving out the pixels beyond the edges
+    finite = numpy.isfinite(image)
+    neighbours = numpy.ones((3, 3))
+    neighbours[1, 1] = 0
+    temp_image = ndimage.convolve(numpy.where(finite, image, 0.0), neighbours, mode='constant')
+    weit = ndimage.convolve(finite.astype(float), neighbours, mode='constant')
+
+    # get it normalized, for the null pixels only
+    ind = (weit > 0) & (weights <= 0) & ~finite
     image[ind] = temp_image[ind] / weit[ind]
 
     return image
@@ -87,6 +87,9 @@ class Plotter2DWidget(PlotterBase):
         # Track color index for slicer color cycling
         self._slicer_color_index = 0
 
+        # Binning of the data points into image pixels
+        self._bin_geometry = None
+
     @property
     def data(self):
         return self._data
@@ -823,6 +826,19 @@ class Plotter2DWidget(PlotterBase):
         # Redraw the chart with new cmap
         self.plot()
 
+    def binGeometry(self):
+        """
+        Binning of the current qx and qy points into image pixels, which is
+        kept while the points stay the same so that redrawing the plot only
+        bins the data values
+        """
+        if self.qx_data is None or self.qy_data is None \
+                or numpy.ndim(self.qx_data) != 1 or numpy.ndim(self.qy_data) != 1:
+            return None
+        if self._bin_geometry is None or not self._bin_geometry.matches(self.qx_data, self.qy_data):
+            self._bin_geometry = PlotUtilities.BinGeometry(self.qx_data, self.qy_data)
+        return self._bin_geometry
+
     def showPlot(self, data, qx_data, qy_data, xmin, xmax, ymin, ymax,
                  zmin, zmax, label='data2D', cmap=DEFAULT_CMAP, show_colorbar=True,
                  update=False):
@@ -842,13 +858,17 @@ class Plotter2DWidget(PlotterBase):
             return
         if data.ndim == 0:
             return
-        elif data.ndim == 1:
-            output = PlotUtilities.build_matrix(data, self.qx_data, self.qy_data)
+        geometry = self.binGeometry()
+        if data.ndim == 1:
+            output = PlotUtilities.build_matrix(data, self.qx_data, self.qy_data, geometry)
         else:
             output = copy.deepcopy(data)
 
         # get the x and y_bin arrays.
-        x_bins, y_bins = PlotUtilities.get_bins(self.qx_data, self.qy_data)
+        if geometry is not None:
+            x_bins, y_bins = geometry.x_bins, geometry.y_bins
+        else:
+            x_bins, y_bins = PlotUtilities.get_bins(self.qx_data, self.qy_data)
         self.data0.x_bins = x_bins
         self.data0.y_bins = y_bins
 
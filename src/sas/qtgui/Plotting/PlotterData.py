@@ -2,8 +2,12 @@
 Adapters for fitting module
 """
 import copy
+import functools
 import math
+import os
+import threading
 import weakref
+from collections import OrderedDict
 from enum import Enum, auto
 
 import numpy
@@ -11,10 +15,168 @@ import numpy
 from sasdata.data_util.uncertainty import Uncertainty
 from sasdata.dataloader.data_info import Data1D as LoadData1D
 from sasdata.dataloader.data_info import Data2D as LoadData2D
+from sasdata.dataloader.loader import Loader
 
 from sas.qtgui.Plotting.Plottables import PlottableData1D, PlottableData2D
 
 
+def _no_copy(value):
+    return value
+
+
+class ArraySource:
+    """
+    The file that the arrays of loaded data are read back from: the
+    dataset at *index* of those loaded from *path*, with the size and
+    modification time of the file when it was loaded.
+    """
+    def __init__(self, path, index=0):
+        self.path = path
+        self.index = index
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+
+    def read(self):
+        """
+        Load the dataset from the file again
+        """
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime) != (self.size, self.mtime):
+            raise OSError("%s has changed since the data was loaded" % self.path)
+        return Loader().load(self.path)[self.index]
+
+
+@functools.cache
+def _lazyArrayNames(cls):
+    """
+    Names of the array attributes of *cls* that are read back from file
+    """
+    return tuple(name for klass in cls.__mro__ for name, value in vars(klass).items()
+                 if isinstance(value, _LazyArray))
+
+
+class _LazyArray:
+    """
+    Array attribute of data, which is read back from the data file when
+    its arrays have been released by the array cache. Until it is set, it
+    has the value of the class attribute that it overrides.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.default = getattr(super(owner, owner), name)
+
+    def __get__(self, data, owner=None):
+        if data is None:
+            return self
+        state = data.__dict__
+        if state.get('_array_source') is not None:
+            array_cache.use(data, self.name)
+        return state.get(self.name, self.default)
+
+    def __set__(self, data, value):
+        data.__dict__[self.name] = value
+        if data.__dict__.get('_array_source') is not None:
+            # Changed arrays no longer match the file, so are always kept
+            array_cache.discard(data)
+
+
+class ArrayCache:
+    """
+    Keep the arrays of the most recently used data loaded from files, up to
+    *max_bytes* in total. The arrays of the other data are released, and
+    read back from their file when next used.
+    """
+    def __init__(self, max_bytes=0):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # id(data) -> (weak reference, bytes)
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def add(self, data, source):
+        """
+        Manage the arrays of *data*, which are read back from *source*
+        """
+        with self._lock:
+            data.__dict__['_array_source'] = source
+            self._use(data)
+
+    def discard(self, data):
+        """
+        Keep the arrays of *data* in memory from now on
+        """
+        with self._lock:
+            data.__dict__['_array_source'] = None
+            self._remove(id(data))
+
+    def use(self, data, name):
+        """
+        Mark *data* as the most recently used, reading its arrays back if
+        they were released
+        """
+        with self._lock:
+            if id(data) not in self._entries and name not in data.__dict__:
+                loaded = data._array_source.read()
+                for array_name in _lazyArrayNames(type(data)):
+                    if hasattr(loaded, array_name):
+                        data.__dict__[array_name] = getattr(loaded, array_name)
+            self._use(data)
+
+    def __contains__(self, data):
+        """
+        Whether the arrays of *data* are managed and in memory
+        """
+        return id(data) in self._entries
+
+    def _use(self, data):
+        key = id(data)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+
+        n_bytes = sum(getattr(data.__dict__.get(name), 'nbytes', 0)
+                      for name in _lazyArrayNames(type(data)))
+        self._entries[key] = (weakref.ref(data, functools.partial(self._collected, key)), n_bytes)
+        self._total_bytes += n_bytes
+
+        # The data just used is kept even if it is larger than the cache
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, (reference, _) = next(iter(self._entries.items()))
+            released = reference()
+            if released is not None:
+                for name in _lazyArrayNames(type(released)):
+                    released.__dict__.pop(name, None)
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _collected(self, key, reference):
+        with self._lock:
+            if key in self._entries and self._entries[key][0] is reference:
+                self._remove(key)
+
+
+# Arrays of the data loaded in the data explorer
+array_cache = ArrayCache()
+
+
+def savedState(data):
+    """
+    The attributes of *data* to save, with any arrays released by the
+    array cache read back
+    """
+    names = _lazyArrayNames(type(data))
+    if data.__dict__.get('_array_source') is None or not names:
+        return data.__dict__
+    getattr(data, names[0])
+    state = data.__dict__.copy()
+    del state['_array_source']
+    return state
+
+
 class DataRole(Enum):
     """Labels to apply to different plot types."""
     # Data is for imported data
@@ -99,20 +261,23 @@ class Data1D(PlottableData1D, LoadData1D):
         owner_ref = getattr(self, "_slicer_owner_ref", None)
         return owner_ref() if owner_ref is not None else None
 
-    def copy_from_datainfo(self, data1d):
+    def copy_from_datainfo(self, data1d, deep=True):
         """
         copy values of Data1D of type DataLaoder.Data_info
+
+        With deep=False the arrays are shared rather than copied.
         """
-        self.x  = copy.deepcopy(data1d.x)
-        self.y  = copy.deepcopy(data1d.y)
-        self.dy = copy.deepcopy(data1d.dy)
+        copy_array = copy.deepcopy if deep else _no_copy
+        self.x  = copy_array(data1d.x)
+        self.y  = copy_array(data1d.y)
+        self.dy = copy_array(data1d.dy)
 
         if hasattr(data1d, "dx"):
-            self.dx = copy.deepcopy(data1d.dx)
+            self.dx = copy_array(data1d.dx)
         if hasattr(data1d, "dxl"):
-            self.dxl = copy.deepcopy(data1d.dxl)
+            self.dxl = copy_array(data1d.dxl)
         if hasattr(data1d, "dxw"):
-            self.dxw = copy.deepcopy(data1d.dxw)
+            self.dxw = copy_array(data1d.dxw)
 
         self.xaxis(data1d._xaxis, data1d._xunit)
         self.yaxis(data1d._yaxis, data1d._yunit)
@@ -222,6 +387,17 @@ class Data1D(PlottableData1D, LoadData1D):
 class Data2D(PlottableData2D, LoadData2D):
     """
     """
+    data = _LazyArray()
+    err_data = _LazyArray()
+    qx_data = _LazyArray()
+    qy_data = _LazyArray()
+    q_data = _LazyArray()
+    mask = _LazyArray()
+    dqx_data = _LazyArray()
+    dqy_data = _LazyArray()
+    x_bins = _LazyArray()
+    y_bins = _LazyArray()
+
     def __init__(self, image=None, err_image=None,
                  qx_data=None, qy_data=None, q_data=None,
                  mask=None, dqx_data=None, dqy_data=None,
@@ -250,22 +426,25 @@ class Data2D(PlottableData2D, LoadData2D):
         # Always default
         self.plot_role = DataRole.ROLE_DEFAULT
 
-    def copy_from_datainfo(self, data2d):
+    def copy_from_datainfo(self, data2d, deep=True):
         """
         copy value of Data2D of type DataLoader.data_info
+
+        With deep=False the arrays are shared rather than copied.
         """
-        self.data = copy.deepcopy(data2d.data)
-        self.qx_data = copy.deepcopy(data2d.qx_data)
-        self.qy_data = copy.deepcopy(data2d.qy_data)
-        self.q_data = copy.deepcopy(data2d.q_data)
-        self.mask = copy.deepcopy(data2d.mask)
-        self.err_data = copy.deepcopy(data2d.err_data)
-        self.x_bins = copy.deepcopy(data2d.x_bins)
-        self.y_bins = copy.deepcopy(data2d.y_bins)
+        copy_array = copy.deepcopy if deep else _no_copy
+        self.data = copy_array(data2d.data)
+        self.qx_data = copy_array(data2d.qx_data)
+        self.qy_data = copy_array(data2d.qy_data)
+        self.q_data = copy_array(data2d.q_data)
+        self.mask = copy_array(data2d.mask)
+        self.err_data = copy_array(data2d.err_data)
+        self.x_bins = copy_array(data2d.x_bins)
+        self.y_bins = copy_array(data2d.y_bins)
         if data2d.dqx_data is not None:
-            self.dqx_data = copy.deepcopy(data2d.dqx_data)
+            self.dqx_data = copy_array(data2d.dqx_data)
         if data2d.dqy_data is not None:
-            self.dqy_data = copy.deepcopy(data2d.dqy_data)
+            self.dqy_data = copy_array(data2d.dqy_data)
         self.xmin = data2d.xmin
         self.xmax = data2d.xmax
         self.ymin = data2d.ymin
@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'SlicerParametersUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QDialog, QGridLayout, QGroupBox, QHBoxLayout,
+    QHeaderView, QLabel, QLineEdit, QListWidget,
+    QListWidgetItem, QPushButton, QSizePolicy, QSpacerItem,
+    QTabWidget, QTableView, QVBoxLayout, QWidget)
+
+class Ui_SlicerParametersUI(object):
+    def setupUi(self, SlicerParametersUI):
+        if not SlicerParametersUI.objectName():
+            SlicerParametersUI.setObjectName(u"SlicerParametersUI")
+        SlicerParametersUI.resize(600, 671)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(SlicerParametersUI.sizePolicy().hasHeightForWidth())
+        SlicerParametersUI.setSizePolicy(sizePolicy)
+        SlicerParametersUI.setMinimumSize(QSize(600, 671))
+        icon = QIcon()
+        icon.addFile(u":/res/ball.ico", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        SlicerParametersUI.setWindowIcon(icon)
+        self.gridLayout_5 = QGridLayout(SlicerParametersUI)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.cmdApply = QPushButton(SlicerParametersUI)
+        self.cmdApply.setObjectName(u"cmdApply")
+
+        self.horizontalLayout.addWidget(self.cmdApply)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.cmdClose = QPushButton(SlicerParametersUI)
+        self.cmdClose.setObjectName(u"cmdClose")
+
+        self.horizontalLayout.addWidget(self.cmdClose)
+
+        self.cmdHelp = QPushButton(SlicerParametersUI)
+        self.cmdHelp.setObjectName(u"cmdHelp")
+
+        self.horizontalLayout.addWidget(self.cmdHelp)
+
+
+        self.gridLayout_5.addLayout(self.horizontalLayout, 1, 0, 1, 1)
+
+        self.tabWidget = QTabWidget(SlicerParametersUI)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.gridLayout_2 = QGridLayout(self.tab)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.groupBox_5 = QGroupBox(self.tab)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupBox_5.sizePolicy().hasHeightForWidth())
+        self.groupBox_5.setSizePolicy(sizePolicy1)
+        self.groupBox_5.setMinimumSize(QSize(544, 80))
+        self.horizontalLayoutWidget = QWidget(self.groupBox_5)
+        self.horizontalLayoutWidget.setObjectName(u"horizontalLayoutWidget")
+        self.horizontalLayoutWidget.setGeometry(QRect(10, 20, 521, 31))
+        self.horizontalLayout_7 = QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.horizontalSpacer_8 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_8)
+
+        self.lblSlicerType = QLabel(self.horizontalLayoutWidget)
+        self.lblSlicerType.setObjectName(u"lblSlicerType")
+
+        self.horizontalLayout_7.addWidget(self.lblSlicerType)
+
+        self.cbSlicerType = QComboBox(self.horizontalLayoutWidget)
+        self.cbSlicerType.addItem("")
+        self.cbSlicerType.addItem("")
+        self.cbSlicerType.addItem("")
+        self.cbSlicerType.addItem("")
+        self.cbSlicerType.setObjectName(u"cbSlicerType")
+
+        self.horizontalLayout_7.addWidget(self.cbSlicerType)
+
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_7)
+
+        self.lblSlicerCount = QLabel(self.horizontalLayoutWidget)
+        self.lblSlicerCount.setObjectName(u"lblSlicerCount")
+
+        self.horizontalLayout_7.addWidget(self.lblSlicerCount)
+
+        self.txtSlicerCount = QLineEdit(self.horizontalLayoutWidget)
+        self.txtSlicerCount.setObjectName(u"txtSlicerCount")
+
+        self.horizontalLayout_7.addWidget(self.txtSlicerCount)
+
+        self.horizontalSpacer_9 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_9)
+
+        self.cmdApplySym = QPushButton(self.horizontalLayoutWidget)
+        self.cmdApplySym.setObjectName(u"cmdApplySym")
+
+        self.horizontalLayout_7.addWidget(self.cmdApplySym)
+
+        self.horizontalSpacer_10 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_10)
+
+
+        self.gridLayout_2.addWidget(self.groupBox_5, 2, 0, 1, 1)
+
+        self.groupBox = QGroupBox(self.tab)
+        self.groupBox.setObjectName(u"groupBox")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy2)
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.lstParams = QTableView(self.groupBox)
+        self.lstParams.setObjectName(u"lstParams")
+        sizePolicy.setHeightForWidth(self.lstParams.sizePolicy().hasHeightForWidth())
+        self.lstParams.setSizePolicy(sizePolicy)
+
+        self.gridLayout.addWidget(self.lstParams, 2, 0, 1, 1)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.cbSlicerReplace = QComboBox(self.groupBox)
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.addItem("")
+        self.cbSlicerReplace.setObjectName(u"cbSlicerReplace")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.cbSlicerReplace.sizePolicy().hasHeightForWidth())
+        self.cbSlicerReplace.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_2.addWidget(self.cbSlicerReplace)
+
+
+        self.gridLayout.addLayout(self.horizontalLayout_2, 3, 0, 1, 1)
+
+
+        self.gridLayout_2.addWidget(self.groupBox, 1, 0, 1, 1)
+
+        self.groupBox_3 = QGroupBox(self.tab)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        sizePolicy2.setHeightForWidth(self.groupBox_3.sizePolicy().hasHeightForWidth())
+        self.groupBox_3.setSizePolicy(sizePolicy2)
+        self.verticalLayout_slicers = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_slicers.setObjectName(u"verticalLayout_slicers")
+        self.lstSlicers = QListWidget(self.groupBox_3)
+        self.lstSlicers.setObjectName(u"lstSlicers")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Expanding)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.lstSlicers.sizePolicy().hasHeightForWidth())
+        self.lstSlicers.setSizePolicy(sizePolicy4)
+
+        self.verticalLayout_slicers.addWidget(self.lstSlicers)
+
+        self.horizontalLayout_create = QHBoxLayout()
+        self.horizontalLayout_create.setObjectName(u"horizontalLayout_create")
+        self.lblSlicerCreate = QLabel(self.groupBox_3)
+        self.lblSlicerCreate.setObjectName(u"lblSlicerCreate")
+
+        self.horizontalLayout_create.addWidget(self.lblSlicerCreate)
+
+        self.horizontalSpacer_create = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_create.addItem(self.horizontalSpacer_create)
+
+        self.cbSlicer = QComboBox(self.groupBox_3)
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.addItem("")
+        self.cbSlicer.setObjectName(u"cbSlicer")
+        sizePolicy3.setHeightForWidth(self.cbSlicer.sizePolicy().hasHeightForWidth())
+        self.cbSlicer.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_create.addWidget(self.cbSlicer)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_create.addItem(self.horizontalSpacer_3)
+
+        self.cmdDelete = QPushButton(self.groupBox_3)
+        self.cmdDelete.setObjectName(u"cmdDelete")
+
+        self.horizontalLayout_create.addWidget(self.cmdDelete)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_create.addItem(self.horizontalSpacer_4)
+
+        self.cbStackPlots = QCheckBox(self.groupBox_3)
+        self.cbStackPlots.setObjectName(u"cbStackPlots")
+
+        self.horizontalLayout_create.addWidget(self.cbStackPlots)
+
+
+        self.verticalLayout_slicers.addLayout(self.horizontalLayout_create)
+
+
+        self.gridLayout_2.addWidget(self.groupBox_3, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.gridLayout_4 = QGridLayout(self.tab_2)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.groupBox_2 = QGroupBox(self.tab_2)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        sizePolicy2.setHeightForWidth(self.groupBox_2.sizePolicy().hasHeightForWidth())
+        self.groupBox_2.setSizePolicy(sizePolicy2)
+        self.gridLayout_6 = QGridLayout(self.groupBox_2)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.lstPlots = QListWidget(self.groupBox_2)
+        self.lstPlots.setObjectName(u"lstPlots")
+        sizePolicy1.setHeightForWidth(self.lstPlots.sizePolicy().hasHeightForWidth())
+        self.lstPlots.setSizePolicy(sizePolicy1)
+        self.lstPlots.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.lstPlots.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.lstPlots.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        self.gridLayout_6.addWidget(self.lstPlots, 0, 0, 1, 1)
+
+        self.cbSave1DPlots = QCheckBox(self.groupBox_2)
+        self.cbSave1DPlots.setObjectName(u"cbSave1DPlots")
+
+        self.gridLayout_6.addWidget(self.cbSave1DPlots, 1, 0, 1, 1)
+
+        self.gridLayout_3 = QGridLayout()
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.label_2 = QLabel(self.groupBox_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_3.addWidget(self.label_2)
+
+        self.txtLocation = QLineEdit(self.groupBox_2)
+        self.txtLocation.setObjectName(u"txtLocation")
+
+        self.horizontalLayout_3.addWidget(self.txtLocation)
+
+        self.cmdFiles = QPushButton(self.groupBox_2)
+        self.cmdFiles.setObjectName(u"cmdFiles")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.cmdFiles.sizePolicy().hasHeightForWidth())
+        self.cmdFiles.setSizePolicy(sizePolicy5)
+        self.cmdFiles.setMaximumSize(QSize(20, 21))
+
+        self.horizontalLayout_3.addWidget(self.cmdFiles)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_3.addWidget(self.label_4)
+
+        self.cbSaveExt = QComboBox(self.groupBox_2)
+        self.cbSaveExt.addItem("")
+        self.cbSaveExt.addItem("")
+        self.cbSaveExt.addItem("")
+        self.cbSaveExt.setObjectName(u"cbSaveExt")
+
+        self.horizontalLayout_3.addWidget(self.cbSaveExt)
+
+
+        self.gridLayout_3.addLayout(self.horizontalLayout_3, 0, 0, 1, 1)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.lblExtension = QLabel(self.groupBox_2)
+        self.lblExtension.setObjectName(u"lblExtension")
+
+        self.horizontalLayout_5.addWidget(self.lblExtension)
+
+        self.txtExtension = QLineEdit(self.groupBox_2)
+        self.txtExtension.setObjectName(u"txtExtension")
+
+        self.horizontalLayout_5.addWidget(self.txtExtension)
+
+
+        self.gridLayout_3.addLayout(self.horizontalLayout_5, 1, 0, 1, 1)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_4.addWidget(self.label_3)
+
+        self.cbFitOptions = QComboBox(self.groupBox_2)
+        self.cbFitOptions.addItem("")
+        self.cbFitOptions.addItem("")
+        self.cbFitOptions.addItem("")
+        self.cbFitOptions.addItem("")
+        self.cbFitOptions.addItem("")
+        self.cbFitOptions.setObjectName(u"cbFitOptions")
+
+        self.horizontalLayout_4.addWidget(self.cbFitOptions)
+
+
+        self.gridLayout_3.addLayout(self.horizontalLayout_4, 2, 0, 1, 1)
+
+
+        self.gridLayout_6.addLayout(self.gridLayout_3, 2, 0, 1, 1)
+
+
+        self.gridLayout_4.addWidget(self.groupBox_2, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QWidget()
+        self.tab_3.setObjectName(u"tab_3")
+        self.gridLayout_7 = QGridLayout(self.tab_3)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.groupBox_4 = QGroupBox(self.tab_3)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        sizePolicy2.setHeightForWidth(self.groupBox_4.sizePolicy().hasHeightForWidth())
+        self.groupBox_4.setSizePolicy(sizePolicy2)
+        self.gridLayout_8 = QGridLayout(self.groupBox_4)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.lstSlicerPlots = QListWidget(self.groupBox_4)
+        self.lstSlicerPlots.setObjectName(u"lstSlicerPlots")
+        sizePolicy1.setHeightForWidth(self.lstSlicerPlots.sizePolicy().hasHeightForWidth())
+        self.lstSlicerPlots.setSizePolicy(sizePolicy1)
+
+        self.gridLayout_8.addWidget(self.lstSlicerPlots, 0, 1, 1, 1)
+
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer_5)
+
+        self.cmdDelSlicerPlots = QPushButton(self.groupBox_4)
+        self.cmdDelSlicerPlots.setObjectName(u"cmdDelSlicerPlots")
+
+        self.horizontalLayout_6.addWidget(self.cmdDelSlicerPlots)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer_6)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_6, 2, 1, 1, 1)
+
+
+        self.gridLayout_7.addWidget(self.groupBox_4, 0, 0, 2, 1)
+
+        self.tabWidget.addTab(self.tab_3, "")
+
+        self.gridLayout_5.addWidget(self.tabWidget, 0, 0, 1, 1)
+
+        QWidget.setTabOrder(self.tabWidget, self.lstParams)
+        QWidget.setTabOrder(self.lstParams, self.cbSlicerReplace)
+        QWidget.setTabOrder(self.cbSlicerReplace, self.cmdApply)
+        QWidget.setTabOrder(self.cmdApply, self.cmdClose)
+        QWidget.setTabOrder(self.cmdClose, self.cmdHelp)
+        QWidget.setTabOrder(self.cmdHelp, self.lstPlots)
+        QWidget.setTabOrder(self.lstPlots, self.cbSave1DPlots)
+        QWidget.setTabOrder(self.cbSave1DPlots, self.txtLocation)
+        QWidget.setTabOrder(self.txtLocation, self.cmdFiles)
+        QWidget.setTabOrder(self.cmdFiles, self.cbSaveExt)
+        QWidget.setTabOrder(self.cbSaveExt, self.txtExtension)
+        QWidget.setTabOrder(self.txtExtension, self.cbFitOptions)
+
+        self.retranslateUi(SlicerParametersUI)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(SlicerParametersUI)
+    # setupUi
+
+    def retranslateUi(self, SlicerParametersUI):
+        SlicerParametersUI.setWindowTitle(QCoreApplication.translate("SlicerParametersUI", u"Slicer Parameters", None))
+#if QT_CONFIG(tooltip)
+        self.cmdApply.setToolTip(QCoreApplication.translate("SlicerParametersUI", u"Apply Slicer to Selected Plots", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdApply.setText(QCoreApplication.translate("SlicerParametersUI", u"Apply", None))
+#if QT_CONFIG(tooltip)
+        self.cmdClose.setToolTip(QCoreApplication.translate("SlicerParametersUI", u"Close the dialog", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdClose.setText(QCoreApplication.translate("SlicerParametersUI", u"Close", None))
+        self.cmdHelp.setText(QCoreApplication.translate("SlicerParametersUI", u"Help", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("SlicerParametersUI", u"Symmetric Slicers", None))
+        self.lblSlicerType.setText(QCoreApplication.translate("SlicerParametersUI", u"Slicer Type:", None))
+        self.cbSlicerType.setItemText(0, QCoreApplication.translate("SlicerParametersUI", u"None", None))
+        self.cbSlicerType.setItemText(1, QCoreApplication.translate("SlicerParametersUI", u"Sector Interactor", None))
+        self.cbSlicerType.setItemText(2, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Q", None))
+        self.cbSlicerType.setItemText(3, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Phi", None))
+
+        self.lblSlicerCount.setText(QCoreApplication.translate("SlicerParametersUI", u"Slicer Count:", None))
+        self.cmdApplySym.setText(QCoreApplication.translate("SlicerParametersUI", u"Apply", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SlicerParametersUI", u"Slicer Parameters ", None))
+        self.label.setText(QCoreApplication.translate("SlicerParametersUI", u"Change slicer:", None))
+        self.cbSlicerReplace.setItemText(0, QCoreApplication.translate("SlicerParametersUI", u"None", None))
+        self.cbSlicerReplace.setItemText(1, QCoreApplication.translate("SlicerParametersUI", u"Sector Interactor", None))
+        self.cbSlicerReplace.setItemText(2, QCoreApplication.translate("SlicerParametersUI", u"Annulus Interactor", None))
+        self.cbSlicerReplace.setItemText(3, QCoreApplication.translate("SlicerParametersUI", u"Box Interactor X", None))
+        self.cbSlicerReplace.setItemText(4, QCoreApplication.translate("SlicerParametersUI", u"Box Interactor Y", None))
+        self.cbSlicerReplace.setItemText(5, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Q", None))
+        self.cbSlicerReplace.setItemText(6, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Phi", None))
+
+        self.groupBox_3.setTitle(QCoreApplication.translate("SlicerParametersUI", u"Slicers", None))
+        self.lblSlicerCreate.setText(QCoreApplication.translate("SlicerParametersUI", u"Create new slicer:", None))
+        self.cbSlicer.setItemText(0, QCoreApplication.translate("SlicerParametersUI", u"None", None))
+        self.cbSlicer.setItemText(1, QCoreApplication.translate("SlicerParametersUI", u"Sector Interactor", None))
+        self.cbSlicer.setItemText(2, QCoreApplication.translate("SlicerParametersUI", u"Annulus Interactor", None))
+        self.cbSlicer.setItemText(3, QCoreApplication.translate("SlicerParametersUI", u"Box Interactor X", None))
+        self.cbSlicer.setItemText(4, QCoreApplication.translate("SlicerParametersUI", u"Box Interactor Y", None))
+        self.cbSlicer.setItemText(5, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Q", None))
+        self.cbSlicer.setItemText(6, QCoreApplication.translate("SlicerParametersUI", u"Wedge Interactor Phi", None))
+
+        self.cmdDelete.setText(QCoreApplication.translate("SlicerParametersUI", u"Delete", None))
+#if QT_CONFIG(tooltip)
+        self.cbStackPlots.setToolTip(QCoreApplication.translate("SlicerParametersUI", u"When checked, slicers of the same type will append to the same plot instead of creating separate plots", None))
+#endif // QT_CONFIG(tooltip)
+        self.cbStackPlots.setText(QCoreApplication.translate("SlicerParametersUI", u"Stack Plots", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), QCoreApplication.translate("SlicerParametersUI", u"Slicer", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("SlicerParametersUI", u"Batch Slicing Options ", None))
+        self.cbSave1DPlots.setText(QCoreApplication.translate("SlicerParametersUI", u"Auto save generated 1D plots", None))
+        self.label_2.setText(QCoreApplication.translate("SlicerParametersUI", u"Files saved in:", None))
+#if QT_CONFIG(tooltip)
+        self.txtLocation.setToolTip(QCoreApplication.translate("SlicerParametersUI", u"<html><head/><body><p><br/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.cmdFiles.setText(QCoreApplication.translate("SlicerParametersUI", u"...", None))
+        self.label_4.setText(QCoreApplication.translate("SlicerParametersUI", u"as ", None))
+        self.cbSaveExt.setItemText(0, QCoreApplication.translate("SlicerParametersUI", u".txt", None))
+        self.cbSaveExt.setItemText(1, QCoreApplication.translate("SlicerParametersUI", u".xml", None))
+        self.cbSaveExt.setItemText(2, QCoreApplication.translate("SlicerParametersUI", u".h5", None))
+
+        self.lblExtension.setText(QCoreApplication.translate("SlicerParametersUI", u"Append text:", None))
+#if QT_CONFIG(tooltip)
+        self.txtExtension.setToolTip(QCoreApplication.translate("SlicerParametersUI", u"<html><head/><body><p>Files will be saved as &lt;SlicerType&gt;&lt;FileName&gt;&lt;AppendText&gt;.txt</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_3.setText(QCoreApplication.translate("SlicerParametersUI", u"Fitting Options:", None))
+        self.cbFitOptions.setItemText(0, QCoreApplication.translate("SlicerParametersUI", u"No fitting", None))
+        self.cbFitOptions.setItemText(1, QCoreApplication.translate("SlicerParametersUI", u"Fitting", None))
+        self.cbFitOptions.setItemText(2, QCoreApplication.translate("SlicerParametersUI", u"Batch fitting", None))
+        self.cbFitOptions.setItemText(3, QCoreApplication.translate("SlicerParametersUI", u"Inversion", None))
+        self.cbFitOptions.setItemText(4, QCoreApplication.translate("SlicerParametersUI", u"Batch inversion", None))
+
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("SlicerParametersUI", u"Batch Slicing", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("SlicerParametersUI", u"Slicer Plots", None))
+        self.cmdDelSlicerPlots.setText(QCoreApplication.translate("SlicerParametersUI", u"Delete", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("SlicerParametersUI", u"Slicer Plots", None))
+    # retranslateUi
+
@@ -1,5 +1,7 @@
 from collections import OrderedDict
 
+import numpy
+
 # Tested module
 import sas.qtgui.Plotting.PlotUtilities as PlotUtilities
 from sas.qtgui.UnitTesting.TestUtils import WarningTestNotImplemented
@@ -14,7 +16,25 @@ class PlotUtilitiesTest:
 
     def testBuildMatrix(self):
         """ build matrix for 2d plot from a vector """
-        WarningTestNotImplemented()
+        qx, qy = numpy.meshgrid(numpy.linspace(-0.1, 0.1, 20), numpy.linspace(-0.05, 0.15, 20))
+        # leave out a few points, so that some pixels are filled from their neighbours
+        keep = numpy.arange(qx.size) % 7 != 3
+        qx, qy = qx.ravel()[keep], qy.ravel()[keep]
+        data = numpy.random.default_rng(1).random(qx.size)
+        x_bins, y_bins = PlotUtilities.get_bins(qx, qy)
+        weights, _, _ = numpy.histogram2d(qy, qx, bins=[y_bins, x_bins])
+        expected, _, _ = numpy.histogram2d(qy, qx, bins=[y_bins, x_bins], weights=data)
+        expected[weights > 0] /= weights[weights > 0]
+
+        geometry = PlotUtilities.BinGeometry(qx, qy)
+        numpy.testing.assert_array_equal(geometry.weights, weights)
+        image = PlotUtilities.build_matrix(data, qx, qy, geometry)
+        assert image.shape == expected.shape
+        numpy.testing.assert_allclose(image[weights > 0], expected[weights > 0])
+        assert numpy.isfinite(image).all()
+        # The geometry is only used for the points it was made from
+        assert geometry.matches(qx, qy) and not geometry.matches(qx.copy(), qy)
+        numpy.testing.assert_array_equal(PlotUtilities.build_matrix(data, qx, qy), image)
 
     def testGetBins(self):
         """ test 1d arrays of the index with square binning """
@@ -22,7 +42,15 @@ class PlotUtilitiesTest:
 
     def testFillupPixels(self):
         """ test filling z values of the empty cells of 2d image matrix """
-        WarningTestNotImplemented()
+        image = numpy.array([[numpy.nan, 2.0, 4.0],
+                             [1.0, numpy.nan, 3.0],
+                             [5.0, 6.0, numpy.nan]])
+        weights = numpy.isfinite(image).astype(float)
+        image = PlotUtilities.fillupPixels(image=image, weights=weights)
+        # Each empty pixel is the mean of its finite neighbours, before filling
+        numpy.testing.assert_allclose(image, [[1.5, 2.0, 4.0],
+                                              [1.0, 21/6, 3.0],
+                                              [5.0, 6.0, 4.5]])
 
     def testRescale(sef):
         """ test the helper function for step based zooming """
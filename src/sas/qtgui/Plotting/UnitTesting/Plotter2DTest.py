@@ -284,3 +284,9 @@ class Plotter2DTest:
                               cmap=None, zmin=0.0,
                               zmax=None)
         FigureCanvas.draw_idle.assert_called()
+        # The binning of the points is kept for redrawing
+        geometry = plotter.binGeometry()
+        assert geometry.matches(plotter.data0.qx_data, plotter.data0.qy_data)
+        plotter.scale = 'linear'
+        plotter.plot()
+        assert plotter.binGeometry() is geometry
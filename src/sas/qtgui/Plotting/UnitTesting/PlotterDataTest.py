@@ -0,0 +1,83 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from sasdata.dataloader.loader import Loader
+
+# Local
+from sas.qtgui.MainWindow.DataManager import DataManager
+from sas.qtgui.Plotting.PlotterData import ArraySource, array_cache, savedState
+from sas.qtgui.UnitTesting import base_path
+
+DATA_2D = str(base_path / "P123_D2O_10_percent.dat")
+
+
+class ArrayCacheTest:
+    '''Test the release and reading back of the arrays of loaded data'''
+
+    @pytest.fixture
+    def datasets(self, tmp_path):
+        '''Three 2D datasets loaded from files, with room in the cache for two'''
+        manager = DataManager()
+        datasets = []
+        for index in range(3):
+            path = str(tmp_path / ("data%d.dat" % index))
+            shutil.copy(DATA_2D, path)
+            data = manager.create_gui_data(Loader().load(path)[0], path, copy_arrays=False)
+            datasets.append(data)
+
+        n_bytes = sum(array.nbytes for array in (datasets[0].data, datasets[0].err_data,
+                                                 datasets[0].qx_data, datasets[0].qy_data,
+                                                 datasets[0].q_data, datasets[0].mask))
+        max_bytes = array_cache.max_bytes
+        array_cache.max_bytes = 2.5*n_bytes
+        for data in datasets:
+            array_cache.add(data, ArraySource(data.path))
+
+        yield datasets
+
+        array_cache.max_bytes = max_bytes
+        for data in datasets:
+            array_cache.discard(data)
+
+    def testLeastRecentlyUsedReleased(self, datasets):
+        '''The arrays of the least recently used data are released'''
+        first, second, third = datasets
+        assert first not in array_cache
+        assert 'data' not in first.__dict__
+        assert second in array_cache and third in array_cache
+
+        # Using the second leaves the third as the least recently used
+        assert second.qx_data is not None
+        expected = Loader().load(DATA_2D)[0]
+        np.testing.assert_array_equal(first.data, expected.data)
+        np.testing.assert_array_equal(first.mask, expected.mask)
+        assert first in array_cache and second in array_cache
+        assert third not in array_cache
+        assert 'err_data' not in third.__dict__
+
+    def testChangedArraysKept(self, datasets):
+        '''Data whose arrays are set no longer has them released'''
+        first, second, third = datasets
+        second.mask = np.zeros_like(second.mask)
+        assert second not in array_cache
+
+        for data in (first, third, first, third):
+            assert data.data is not None
+        assert not np.any(second.__dict__['mask'])
+
+    def testChangedFile(self, datasets):
+        '''Released arrays are not read back from a file that has changed'''
+        first = datasets[0]
+        with open(first.path, 'a') as fp:
+            fp.write("\n")
+        with pytest.raises(OSError):
+            first.data
+
+    def testSavedState(self, datasets):
+        '''Released arrays are saved with the rest of the data'''
+        first = datasets[0]
+        state = savedState(first)
+        assert '_array_source' not in state
+        np.testing.assert_array_equal(state['qy_data'], Loader().load(DATA_2D)[0].qy_data)
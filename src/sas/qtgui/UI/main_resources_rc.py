@@ -0,0 +1,15196 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x06\xde\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00 \x00\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x05\xe2\
+IDATX\xc3\xed\x97}l]e\x1d\xc7?\xe7\
+\xe5\x9e\xfb\xd6\xf5m\x1d]\x07-\xa3\xbc\xad\xd1 d\
+\x89\xbc\xb8\x22\x8e\xc4\x81\x7f\xa8\xe9\x1cj\x18\x09\x22\x7f\
+h\xc8\x8c.f\x80\x81d\xe2\x82DI\x0c\x7f\xa8\x03\
+\x87\x91\xc8x+\x92\x15e\xce\x82\xdb\xc8\x5c7'[\
+\xd5UX7\xb0k;\xb6\xbbuk{\xb7\xdb\xdes\
+\xees\xce\xf3\xf3\x8f\xf3\xdcz\x8b]\x85d\xa6\xff\xf8\
+$'\xf7\x9c{\x9e\xf3\xfb~\x7fo\xdf\xf3;\x96\x88\
+0\x97\xcb\x9eS\xf4\xff\x13\x00\xdc\x0f\xb3\xc9\xb2,\x0b\
+\xb0\x00\xc7\x1cv\x05y\x014\x10\x02\x11 \xf2\x11\x0a\
+\xcb\x9am\xaf\x01v\x80\x04\x90\xfc\xe2\x0bo}\xf9\xa2\
+\x85M+\x1c\xc7\xae\xf3\xbcd\xab\xc4`J\x07\xfe\xa1\
+\xb3\xf9\xf1\xdd\xc3[\x7f\xfd\xdc\xce\x8d\x8f\x8d\x00%@\
+\x7f\x18\x223\x120\xc06\xe0\xcd_\xb9f\xe1\xad\xf7\
+\xae]\xdf\xb4\xa0ae\xca\xb5\xb3ewE \x12A\
+$\xbe\x8e\x04D\xf4Da\xf4t\xe7\xfe\x9f\xac{\xe8\
+\xedm/\x9f1Df\x8d\xc8\x7f\x100\xe0.\x90\xb9\
+\xfe\x97{\xef\xba\xee\xe3m\x8fU{n\xf6\xfc\xa0\xf1\
+\x7f\xe5k-\xa0\x02\x95;\xbe\x7f\xfb=;\xd7~\xe9\
+M \x98-\x1a\xd3\x08T\x80W\xdd\xdc\xf9\xce\xe3\xd7\
+\xb66\xdf\x93\xb0-\x22\x1d\x03h\x81\x94\x03)\x1b<\
+\xdbB#\x14\x940\x1ah\x02\x1d\xdf\x8f\x10\x22\x0d*\
+\x0c\x0b\xa7\xf7\xbd\xf1\xd5\x9e\x07\xbe\xb2\x03(\x8a\x88\x9e\
+\x95@%x\xeb\x93o=\xfc\xb1\xab\xaf\xfc\x8ecA\
+UB@\xe0\xa2\x94Cm\xc2ft\xe4\xe4\xa9\xdc\xd1\
+\xf7\x06G\x86\x07NZ\x96e-\xbabIKS\xeb\
+\xd5W\x04n*=X\x08Q\x86l\xa4!,\x05'\
+\x87\x9f~x\xf9\xe1W\x9e\x1e\x00\xfc\x99\xa2PI\xc0\
+\x01\xb2\xcd\xeb_Z\xe5\x5cs\xcb&L\xc8A\x98\x9f\
+\xb4Y\xa2rC\xfb\x7f\xf1\xe8\x0b\xfd[\x9f?\x08L\
+\x9a\xfcZ@\xca\xab\xaa\xae\xbb\xf9\xdb?\xfc\x5c\xdbm\
+\xabn?2iy\xbe\xd2q[h\xf0\xcf\xe4\xfep\
+\xe0\xeeO\xac\x06\xf2\x22\xa2f$`\xbcO-\xb8a\
+\xc5\xa5\xc95O\xee\xb2\x12\xc9\x06\x83N\x8dg\xd3\x16\
+\x1c{\xb7\xeb\xde[7\x94\x0a\xf9c\xc0\xa8!\xa0\x0c\
+\x01\x0f\xa8\x06\x1aZ?\xf3\x85\xa5\xed\xf7?\xb1\xeeP\
+1\x91\x0d5h\x11\xb4\xd6Zuo\xba\xfd\xedM\x8f\
+\xf4\x00\x13\x1f\x8cBY\x07l \x93\xeeX\xfb\x8d\x10\
+\xa7\x01\x15\x22\x08\x96\xc0eztx\xdb\xda\x8e\x1f\x94\
+\x0a\xf9~ \x07\x9c-\xb7Y\x85\x8d\x140\xf6\xcf\x1d\
+]\xc5LCS\xba\xf1\xce\xef\xad;\x11h[k!\
+Dl\xef\xaa\x1b;\x80^\xc0\xb7,+\xaa$`\x1b\
+\xef\xbdT\xdd\x82\x1a\xbf\xf6\x92U\x91\x0a\x09\x95\x22*\
+\x85\xd4;Z\xf7?\xfb\xe3\x8d\xe7N\x0c\xf5\x03\xc3\xc0\
+) \x0fL\x8aHQD\x8a@\x01\x18\x03N\x00\x83\
+}\x9d\x1b\xff\xe8\x1c?\xdc;\xe9+&\x03\x85\xef+\
+\xc6\xbd\xfav`\x1e\x90\xcdd2\xd9\x86\xf5\xaf\xb5\xd7\
+\xd5\xd5e\x00\xd7.\x87\xf1\x92\x8e\xfb\x96F\x96\xb7(\
+T!Q)$R!\xd9\xd1\xc1C\x87_\xdb\xbc\xc7\
+\x18\x1f\x03\x02\x11\x99\xd6R\xe6<2i9\x03\xe4r\
+\xbb~\xdbU\x0c\x14\xc5 \xc4\xf7C|;s\x95\x9d\
+\xaej\xacZ\xf3\xab\xbb\xdcGv\xf5\x96j[\xde\xfc\
+\xd4\x13\xdb\x7f\x04x\xae!\x90\xb4/n\xbb!Ra\
+,\xac\x08\x02DG\xfbv\x03\xa7M\xd8\x83\x99Z\xa9\
+B\xa6mb9.\xf6ww\xfe5\xfd\xc9\xafk-\
+\xd8\x1a\x01\x8d\x9bzp\xebs:]\xb3X\x8b\xd0\x9c\
+\xb4\xf5@\xd7S]@\xd2%\x96\xda\xa4JT]\x1e\
+\x95\x22\x0c\x03D\xe0\xec\xe1\xde\xbf\x99\x10\xfbS7\xa6\
+\x83\xdb\x80\x9b\xbdie\x9dn\xbf\xbb\x03\xcb^$\xe7\
+FE\x17\xce\xd4\x05\x93\x81\xc2q\x93\xb11 1o\
+\xb1\x84\x11\x084\x15\xdf\xdf\xbd\xf37?\xcf\x01R&\
+\x90\xd0V\xa2!R\x86\x80\x81\xca\x1f=4l\xc0\xc3\
+\xf3(\x99\x0d\xa4\xdbV?\xf4\xfb\xbe1\xb9\x0e\x80y\
+M\xd8\x12w\x00\xaa\x22`\xe6\xe9\x85\xd9\x04\xefo{\
+\xa6\x93X!\xc3r\x0d8.vB\x87\x11Zit\
+\xa8\xd1J\x13\x85\x91o\xc2:\xa3\x8a\x19\x02\xa9\xfa\xfc\
+\xc0\x8e\xa5\x0b\xd2\x88\x8a\x9f\xd3J#Jf<..\
+\xe5\x0e\x1e\xe9\xde\xdc[N\xeb\xd4<\xe0)\xbf J\
+\xb0B\xa1>\xe1peu\x92\x9a\x96%\xd9Y\xc0\xcb\
+~\xe9\xee\x07;\x9eW\x07^\xfd\xd9\xf5\x0b3\xda\x9a\
+\x09\xb8$h\x15\xdb\x1d\xffs\xd7\x8bFK&\x80\xd0\
+5F\xc2z]\x18n^\x5cE\xadgE\x93\xa3\xb9\
+!\x7f\xec\xd4\xc1\x01\x15\xe4M\x85\x9foi\x93\xa2\xf1\
+}\x1b\xef\x7f\xe5\x9a;F\xf4\x8d\x9f\xfe\xda7\xf7\x0e\
+\x15\x9d0\x92i\xe9\x04h\xb1\xc6\xdf\xdd\xb7\xe5\xa7\x7f\
+2\xad\xec\x97k \x02\xfc\x5c\xcf\xab]\x89\xde\xed\xff\
+\xe8\xfe\xddS\xc7MK\x9d\x04\x8e\x11+\x9e\xfc\x17\x02\
+\xa7\x01\xeb\xef/=\xbe\xa5m\xa2\xe0\xdf\xf4\xd9\xfb\xbe\
+\xb5g\xd0\xf7*j\x9a\x9a\x94C\xa9\xef\xf5\x97M\xab\
+\x16\xcauU\x1e8\xb2@-PE\xacl\x81\xd9t\
+\x0e(\xceR\x84\x95CK\x16h\x00\x9a/\xbf\xe5\xce\
+\xe5\x97}~\xddw\xf7\x0c\xaat\xb1\x14g\xf0\xda\xf9\
+\xc1\xf1\x03\x1b\xdaW\x03G\x80\x11\xa0$\x22\xe2\x1a/\
+\x8a&\x12g\x8d\xdd\xc8x\x1e\x02\xd1l\x03\x85\x88\x88\
+\x91\xd7\x09cK\xde\xdb\xb9\xf9\x0d5\x91/.[\xf5\
+\xfd\x07z\x86\xecj\xd7\xb6\xb0\x87z\xb6Tx\xaf\xa6\
+l\x9a\xdf\xb2\x90\x94\xbb\xc2\x12\x11>\xca\xc1\xbfg\xc6\
+y\xc0\xa5\xc0\xb2\xc6\xb6ekn{\xf4/\xa7Vl\
+\xd8;\xe8&3\xcb\x81\x16\xe2\xf7\xc6\x94}\xebB~\
+\x98T\x8cri\xa0\x1ehl\x5c\xb2\xac\xd5v\x13\xa5\
+\x13};\xde!~\x99\x9d\x13\x91\xa9\xc2\xbe\xa0\x04>\
+@\x22i\xa2\x916\xa9)\x984\x95*Sz\xc1\x09\
+T\x10\xb1\x89\x0b\xba\xdc\xea\x11q1O\xd3\x95\xff\x19\
+\x81\x8ahL\xadYG\xb2\xb9Zs\xfei6\xe7\x04\
+\xfe\x05\xaay|\x08\xd9\xb1\xc8\xdb\x00\x00\x00%tE\
+Xtdate:create\x0020\
+13-12-17T10:20:1\
+7-05:00\x05d\x89\x86\x00\x00\x00%t\
+EXtdate:modify\x002\
+013-12-17T10:20:\
+17-05:00t91:\x00\x00\x00\x19\
+tEXtSoftware\x00Ado\
+be ImageReadyq\xc9e\
+<\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x08M\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00 \x00\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x07v\
+IDATX\xc3\xb5\x96k\x8c\x9ce\x15\xc7\x7f\xcf\
+{\x9d\xcb\xce\xcc^gg[\xba\xdbr[\x0a\x11\x89\
+\x09%\x06\x881\x8d6\x80\xa2\x1f\xb8\x98\x80\x12\xa3U\
+C0h\x88\x1f\xe4\x03!\x18c\xe2\x07\x0cJ\x02A\
+c\x88F@\xd4h\x88\x94\xa2\xe2\xd2\x04\xbc\x94\x18$\
+P\x90\xdeVh\xcb\xb6\xdd\xddvwgg\xe6\xbd<\
+\xcf9~\x98m\xd9\xda-\xb0\x10\xde\xe4$\x93\xbc\xe7\
+\x9d\xff\xef9\xff\xe7\x9c\xe71\xaa\xca\x87\xf5LLL\
+\xf8\x95J\xa5\x9a$I\xbd\xb7Vk\x88\xb8\xb1b\xb9\
+g\xfd|+\xdf04\xb6\xfe\xcfc\xbd\xc5G\xcc\x07\
+\x01\x98\x98\x98\xf0\xab\xd5j5I\x92z\xb5ZmX\
+k\xd7U\xab\xd5\xf5\xc6\x98\xd1r\xb9<\x16\x04\xc1H\
+\xa1\x107\xe2(\xaa\x09^\xb4\x98)\x89U\xe2\xd0\xb0\
+s\xd7\x9e\xdf^u\xe9\x85\xd7\x07\xab\x11\xdc\xb1c\xc7\
+\xdaF\xa3\xf1\xa5(\x8a\xce.\x95J\xa3\x17_|\xf1\
+H\xa1Ph\x04AP\x0b\x82 \xf2}\xff\xb4o\x14\
+8\xde\xcaig\x8e \xf2)\x97BT\x1c\xa0\x02\xb0\
+*\x80\x81\x81\x81\xdb\xc7\xc7\xc7\xbf\xf3^\xf3g\x173\
+\x163!\x0c\x03J\xe5\x18\x0cX\x01u\x8a\x13\x14\xc0\
+[\x0d\x80\xef\xfb1\xc0r\xdb\xceda+\xb5L5\
+sJ\xe5\x02A\x14\x90\x0bX\x07N\xdf\x8eU\x03\x88\
+\x88,\x17>!~\xe2\xf7\x89p\xd6\xb2\xd0\x5cd\xe6\
+\xe8\x22\xb9\x9e.\xec\x14\xdc\xd2?\xad\xca\x82e\xfag\
+|\xd24%M\x12\xb24E\x14<\x85L\xc0\x98\x93\
+\xe8\xa8(V?\x04\x00\x11!I\x12D\x1c\xc6\x18\x94\
+\xae\x90\x150\x00\x06T\x01y\xbb\x02\xab\xb5\xa0\xbb\x06\
+\xd7D;\xaf\x9c\xf2\xce\x18s\xd2\x02\xb3\xb4RY*\
+u\xae\xddp\x02\xd6I\xd7\x12\xf7\x01\x00\xec\xd1\x7f3\
+\xbf\xfd\x06\x90\xe4\x9d\xf3U\xbb~;\xc5\x89bE\xc9\
+\xac\xe0\xb4\x1b\xab\x06pK\xd8\xc9\xfe\xdf@4\x8ca\
+\xff\x19s\x0d\xddr\x8b\x80\x93.@\xee\x1c\xd6\x09N\
+@D\xdf_\x05\xd4\xb6\xb1\x87\x9f\xa1x\xee\x16`\x01\
+d\xba[\xf0e]\xb1<\xdf\x8a`u\x09 w]\
+\x18\xa7'\x01V\xb5\x09\x9ds\xe4G&\xf0\x8ae\xe2\
+\xb1+AJ\x18\xa6\x10S\xc3\x98\xe8$\x08\xda]\xbd\
+\x8a\xe2\x9c\xe0\x1cX\x11D\xe4\xe4f\xcc\xec\xfb\xb0@\
+D\xc8\xde\xf85Qc\x0c#\xaf\x80)\x83\xa9\xe0\xe9\
+aP\xb7,si\xab\xa3\xa8:\xc4%\xe4yzr\
+/\xa4Vhen\xf5\x15\xe8\xb1/\x0fI\xebE\x0a\
+\x17lB\x16w\xe0\xe9\x00\x946\x83v\xc0\xee\xc3K\
+_\xe2\xfb\x8f=\xca\xab\x93o\xd1\xea\xb4h\xb5B\xfa\
+*C\x9cw\xce\x05l\xfd\xdcm\xa4R\xc1y\x15\xda\
+\x99\xd2\xc9\xdf\x87\x05\xfd\xf2\xfcy~\xb5\x81\x17\xb5\xc0\
+\xb6\x90\xc5?\xe2\xf9\xfdP\xb8\x0c\xd3y\x16O\x0e1\
+5\xd7\xe2\xd6\xaf\x7f\x17q\x16\xa3\x1eQ\x18s\xff\x83\
+\x0f\xd0N#2\xbf\x84\xaf\xc2l[\x90\xa5Ap\x0a\
+\x801\xcb\xe6\xd5\xb2\x1d%G\xbex!n\xee\xc6z\
+\x7f\xe7\xa3~\xb1\x81\xb1GQ<\xd0\x19d\xe1Q\x8c\
+\x9b\x81\xces\x98\xf25\xa8\xbf\x8d\xbf\x1dz\x8e\xb2_\
+$Jb\xf2L\x19\xa9\x9cC\x8b>|\x81v.\xcc\
+wrt\xa56\xd4e\xcfH\xa3Tx\xfe\xa9\xcfn\
+e\xe1+\xffD\xcc\xcb\xb8\xa1\xbb\xe2\xde\xfe8\x88\xa6\
+Q\x9b\x83\xb3\xe0rH\x0f\xa2\xc7\x7f\x0e\xfe(j\xaa\
+\xecy\xe3 A\x8fOVK\x98\xd79\x92\xbc\xc3\xae\
+c{qN\xc8\xadp\xa4\x99c\xad\xac\xdc\x05\xf5>\
+?\xfe\xd4'\x86\xae\xbc\xee\xda\xb3>\xbf\x7f\xe7g\xae\
++\x16\x0a\xc32\xbd\x00\xb6\x09\xae\x09\xc6\x82\x1f\x82\xe7\
+/\xcdV\x05#`\x14\xd2}\xe0\x8f\xb0a\xfc\x22\xe2\
+j\x8c\xfa\x96Ny\x01\xd3\x015\xdd\xd6\x9bm[\x16\
+S\xc13\xa0\xb2\x82\x05\x835\x13\xdf\xf1\x85\xda\xb7?\
+\xb6\xb9q53\xd3\xc8\xcc<\x90\x83\x1ft\xc3\xf3\xbb\
+\xf3T\xe9\x8a\xaa\x80\xf1\xc0\x18\xb4\xb3\x17$\xc3\x0f\x03\
+\x82\x92\x8fSG\x16d` \x08B\x8e,d,\xa6\
+\x821\xe0\xb4\xdb\x9e\x00+^\xc9\xee\xb8\xa1|\xcb=\
+\xb7\xd6\x7fT\xae\xf7\xf4i\xeau\xfd\xf6\x96\x85\xf1\xf8\
+\xf4\x8f{\x98\xcf\x8e\x93h\x07\x22\x85\x10Lh\xb0=\
+9_\xbd\xed\xcb\xcce3L\x1d\x98b0Y\xcb\x13\
+\x8f<E\xbb\xa9\x14\x8a\xfdD^\x09\xcd\xc1\xa5\xcd\xb7\
+F\xfa\xcbkN\x01\xd8x\xfe\xf9\xa1\xb56\x08\x82\xc0\
+O\xda\xb3\xf5;o\xf2\xef\xdaz\xd3\xe0-\x98\x10\xc9\
+\x0d\xf8]q<\x8fK\xee\xcb\xd9\xfc\xb5\xcb\x18\xab\x9c\
+M\xbdZ\xa7\xd6Sc\x9f\xec\xc13\xd0\xb1)\x93G\
+\xf62sp\x96\x91l\x94\xf1\x0d\xe7\xe3\xac\xc3\x18\x0f\
+O\x0d\xbe\x17\xe0\x12\xc7\x83\x0f=|Z\x1b\x96=\xdf\
+/9\x91 .\xf6\xcb\xbd\xbf7\xf7<\xfe\xcc\x81\xbf\
+<tg\xfd\xde\x0d\xe7V\x86\xc4\xba\xee\x01\xafJ\x9a\
+dd\xd39\xdf\xdb{'\x1bF7\xb0~x\x03\xf5\
+J\x9d\xd0\xc5\xb4\xe6[\x1c?v\x9c\xce\xd1\x8c\xfds\
+{88\xf3_\x0a=\x05\xa2 \x22\x22\xa6\xe8\x95h\
+\xf4\x8e\x90&\xd9i\x00\x1d\x03=\xce\xb9^+\x12\x88\
+j\xb8?\x1b\xf8\xd7\xdd?Y|\xfa\xe1\xdb\x17o6\
+\xeb\xea\xa8\xeb\xfa\xaeN\xd0\x0c\x92\xd7\x1c\x93\xc9$\xd3\
+\xb3\xd3\x14\x8b\x05<\xe7\xe3\xb7\x03*\xf3\xbd\x14:%\
+\xa2F@\xd4\xef\x11\x94<B\xdf\xc7S\xc5j\x8a\xe0\
+P'\xa7\x02\xfcg\xcf\x9e\xacQ\xaf\x1f\x8b\xe3\xb8j\
+\x8c\xe93\x10\x8a\x88V\xbc\xbc\xde>\x9cP:k\xa0\
+;a\x8d\x12y1\x95Z\x0f\xc5\xc1\x22&S:\xcd\
+\x944\xcd(\x16\x8b\xf8y\x897^\xdb\xc5\xc0E\xbd\
+lZ\xf7q\xea\xd1\x1a\xf0 4\x018\x83X(\xc4\
+E\x22/>\x15`i\xf8\xb4\x07\xfb\xfb\xa7J\xa5R\
+\x9f\xe7y\xfd\xaa\xaa\xfdE[\xf3b\x1f#\xae{\x99\
+6\xc2Y#\xe7\xf0\xa7_\xfe\x83a\x19\xc7\xf8\xdd\x89\
+\xe2\x10\x86\x06\xfa(]Qb\xaa~\x10\xdb\x97\xd2\xf6\
+\xe6\xd9\xf6\xf8.JT9\xf8\xd6a\xad\xf5\x8f\xcf\xb5\
+\xdbyj\xdb\xdb\xf7m\x1a\xb9\xe8\xf2\x15Gqo\xad\
+&\xb9\xb5\xbd\xa8VTU\x06\xfbL\xcdD\x1e\xea\x1c\
+\xea\x14\xe3yl\xbf~7Y\x07\xb6\xbdy3\xb9\x14\
+(\xa4/\xf1\x91\xc1\x17\xb9\xfa\xe99\xaaiBa\xc8\
+g\xb0o\x880\x0e\x09\xb5H\x18=\xf0\xb3\xc1aY\
+H\xc5\x98bY\xfe\x1a\xd4\xcc\x93\xdb\x7fx\xb9\xae\x08\
+\x10\x86a\xd39\xf7\xaasn\x93\xaaV\x87\x06\xa2\xb2\
+W\x04u\x16\xd4\xa0\x02\x225f\xd6\xde\xc7'/\xb9\
+\x00\xe7\x1c\x9dN\xc7\x1d8p`\xd2\xe4\xdf8\xd7x\
+\x86\xa0\x18P,\x16)DE\x0c0=\x9f\xcd\x99 \
+\x8c\xfdt~\xdb\xe4\xfdWm?\xa1\xb5\x22\xc0k\xbb\
+w\x0b0Y\x1f\x1c\xb4\xbe\xef_:2\x1c\x84^\xbc\
+t\xbfV%\xef\xb9\x96\xe9\xa1o1\xbf\x98\xed9\xf8\
+\xfa\xeb/4\x9b\xcdg\xad\xb5\x7f\xaf\xd7\xeb\xbb}\x0d\
+R\x1cx\x9e\xc1\xf3<\x0c\x86\xc0\x0bp&\x8a\xe2}\
+O\xffn\xf2\x0fw\xefX\xae\xf5\x8e\xa7\xe1\xd1\x99\x99\
+\x03\xb5J\xb1\xb4\xa61\x1c\x1a?A\xb3\xc4\x1ev\x9b\
+_\x5ch|\xf3\x17o\xbe>\xf9<\xf0\xea\x96-[\
+\xd2\xe5\xdf\xa4\x9d\x94\x92\x84\xe4\xe4\xa4\x92\x90\xdb\x8c\xb4\
+\x95\x11\xee}\xe2W\x93O\xfe`\xe7\xffk\xbc\xebq\
+\xdc\x13%\x93\xbdq\xfb\x10Y\xa6t\x16\xaeY{\xe3\
+c;\xd7\x02\x1b7n\x5c9\xbfPbt\xb4\x9f!\
+w\x05\xbe\xfa\xf86\xa0\x16\xd7xa\x05\xf1\xf7\x04p\
+hV\xb3c\x0f\xfb[\xfd\x94^n\x94\x9d\xef\x96\xbf\
+f\xcd:\xf6\xfe\xf4M\x9ai\x13\x13C\xa5Rft\
+\xe8\xec3\xe6\xff\x0f\xa5\xd1->\xb8xg\xd3\x00\x00\
+\x00%tEXtdate:creat\
+e\x002013-12-17T10:\
+20:17-05:00\x05d\x89\x86\x00\
+\x00\x00%tEXtdate:modi\
+fy\x002013-12-17T10\
+:20:17-05:00t91:\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0b\xa4\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x005\x00\x00\x005\x08\x06\x00\x00\x00\xe1\xe6\xa3p\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00\xc6\x00\x00\
+\x00\xc6\x01\xb0t\x9b\xc5\x00\x00\x00\x09vpAg\x00\
+\x00\x005\x00\x00\x005\x00\xe3T\xe9\xa1\x00\x00\x09p\
+IDATh\xde\xed\x9a\xebo\x14\xd7\x15\xc0\x7f\xf7\
+\xdc\xd9\x87\xd7\xeb\xf5\x13\x83)\x01?\x08.NM\xc2\
+\xc3%\x11J\xd4\x88\xa4%*\xe4Q\xa1Ti>T\
+\x8aJ\x95\xa8\xfd\xd6\xbf$j\x95oU\xaa\xa8\xdf\xa2\
+\x04\x15\xb5\xa8\xa8\xed\x87\xa4@B@!\xa4M\x08\x06\
+7Jb\x13\x8cy\xd8\x86}\xce\xcc\xbd\xfd03\xbb\
+\xeb\xf5k\xd7q\x00U=\xd6\xecx\xe7\xde\x999\xbf\
+s\xce=\xf7\xcc\x9d\x85\xffAQ\x8b5\xf4\xf4\xf4t\
+\x19\xe3>!\xa2_\x88\xc5\x12\x1d\xe5\x06\x0d\x08\xe0\x01\
+6:\xe8\xe1S\xa4\xe0\x03\x85\xe0\x88\xc5\xe2[\x1f\x17\
+\x17\xebZ\xf0\xc0D\x7f\xc6`=\x8b\xc1\x80\xdf\xb0\xce\
+E\xe00\xf0'`|\xa1\x0e\xcebg\xfa\x8e\xbf\xe7\
+\xf1\xc7\xf7\xfe\xe6\xd7/\xffj\xeb\x9a\x8e\xeeJ\xbf\xc8\
+\x0c\xb6\xba\xb7\x05,\x06\x08>\xaa[\xec\x9c\xbe6\xfa\
+b\xe7\xb7\xd5#\x22b\x0e\x1d:4p\xf2\xe4\xc9I\
+\xe0\x08P\xaa\x1b\x0a\xe3v\xb7\xa4\xd2[v\xed\x18i\
+N\xc4\xe3\x94\xfc\x1c\xda\x11\xdc\x92G\x22\x96BT\xa4\
+\x8d\x0a]'\x0d\x9b|\xa5\x92H$\xd6\x01\xeb\x81\xe6\
+\x86\xa0|\x8bVJ\xc5\x12\xf18E/\xcb\xed\xdc,\
+\x22\x8a|.GWG\x0fX\x1f\xcfwA\x04\xa54\
+\x0aA\xa1\x10M\x19P\x04\x94\x12@!DNV\xac\
+\xdc\x00>\x10\x8b\xbe\xc4\x16\xd3\x7fQ(c\xc2\xf0P\
+\x16\x83K\xc9s\xd1@\xbeX\xc4\x18\x8b1\x06\xd7\xf3\
+P\x22(1\x88(\x14\x82\xb5\x0a\x91@q\xab@a\
+\xe7 \x85Wo\x10\xce\x86\xe7\xd4\x17\xab\xce\xb2\xd7\x02\
+D4\x22\x0aQ\x82(\x09\xbc\xa2\x04\xa55\x22\x82(\
+\x85h\x85R\x0a\xa54\x22 aHV\xfcT\x0b\xd6\
+(\x14u\xf7_\x1c\xca\xf5\xb1\xbe\x0dU\x12\xb4\x12\x94\
+h\xb4\x08\x0aP\xa2\x02 Q\xdc\xbcy\x93\x89\xf1q\
+DUn\xac\xcb\x9f\x11H-\xd4\xf2\x92\xc9d\xe8\xdd\
+\xd8\x8b\xe3$\xcaW\xfcfP\x06\xb0\x16\x05\x15 \xa5\
+@kP\x0a\xb4 6\x80\x9a\x9c\x9a\xe4\x9f\xc7\xdf\xc1\
+z\x81E\x95\x0a=\xa1@\xa9\xb9 \xe5\xb6:\xa4\xaf\
+\xb7\x8f\x0d\xeb\xd7\x85P\xf5\xcb\xe2\x89\x02\x17k\xa3\xd8\
+\x8f\x80b\xc1\x1e\xd0H\xe8)\xa1\xff\xbe>Z\xf7?\
+[N\xd7Z\x03\xc4\xd0\xce\x5c\x0f\x89\x80\xd6\xf5\x87]\
+2\x9e\x22\x91hi\x08hI(\xd7\x07\xbf\x9c\xb5\x15\
+h\x07\x8d\xc6\xd1\x0eJ\x09Z\x1b\x0c\x82 \x8c\x8e\x9e\
+\xe7\xcd\xc3ob\xdc\x9a\x81\xac*\xf9n%24\xf4\
+\x00/\xfe\xec\xe7$\x9d\xf4\xea@Ui\x86\xc2A\x03\
+N\x0cP\x91\x95\x05\x8dE\x10\xb6=\xb0\x83\xde\xde~\
+\x8c\x8a<\x11\x5cV\x1c\x1d\xd8\x03\xe6g\xc0(\x94\x97\
+RNb$\x9dT\xc3\xc6X\x22QP.a\x14\xa0\
+\x1d\x0d\xe8\xca\x90\x02\x82O\xcd\xf9\x0b\xe78\xf2\xd7\xb7\
+\xf0\x8d\x0d\x93Z\x18ns0T\xcd\x9ee]8\xb8\
+\xf9\xbb<\xff\xf4\xf3h\xdd\x18X\x1d\x9e\x0a\xee\xae\x94\
+\xc6q@\x94C%\x1d\x07\xfb\xde\x8d\x9b9\xf8\xf4\x0b\
+\x18m\x10\xadA\x05c\x8e\x08M\x82\xa4\xb1T\xdd\xa1\
+\xd1\xa8\x902\xaa\x11\xd3\xa9\x16D\x92\xab\xe8\xa9\xb9L\
+h\x1d\x80iQ\xe1P\xd1\xe5\xc6kSW8\xf5\xc1\
+\xbb\x94\x94E\xca\xe3H\x85\xd0\xaav\xb7\x98\xd9\xca\xad\
+6\xac%{\xef\xeb\xa5\xe7\xb1\x1e\x1a\xad@\x16\xaf(\
+0\x95\xe2\x93`N\xd2\xa8r\xd9S\xad^:\x93\xa1\
+\xaf\x7f\x0bF\xc2\xa3Z\x22\x1fU\xcdRR\xf6D\xbd\
+\x13oWGg\xc3@KB\xf9\x80\x09\xa1\xac5\xe4\
+\xf2\x05ZS\xe9\x10\xaa\xa6\xaf1\x14\x8b%\x14\xd1\x98\
+\xaa\x81\x0ak@\x99\xe3\xa7\xe5'c\xcf\xf3id\xd2\
+]\x16\xca\x18\x1fc\x83\xe7\x88B\xa1\xc0\xb9s\x1f\xb3\
+\xeb\xa1\x9da)4\xb7\xaf[*23{\xa3\x5c\xcd\
+\xa8r\xa2\x08<\xaa$\xdc\x96\x0c\xc0\xf9\x92jjn\
+\x18hi(\xdf\xc3\x1aS\xb6\xd8\xc4\xf8\x04\xdf\x1b\x1a\
+&\x16\x8f\xcdS,\x93i\xe5\xfe-\x83D\x03Gk\
+\x01\x09\x92\x85\x0a\xcb,\x85\xd0\x92\xce\xd0\xd5\xb9\x96d\
+be\xca~c(<\xca)=\xdd\xdc\xccS\xfb\x9e\
+\xa25\xddI\xc1\xcf\xce+}&\xaf^\xe1\xc4\x89w\
+\xc2\xfea\xa2\x88U\x12F\xf4_\xdf\xa6^Fv>\
+|\x17\xa1\xaaDD\xd3\xd6\xd2EE\xe5\xb92\xb8e\
++\xfd\xf7\xf7\xa1\xb4\x84\xd348\xe5\xe7\x1e\xcd\xcak\
+\x8ao\x11j\xce\x09\xce|\x15\x1d\x89\xe3\x10\xbf\xa3\x8a\
+/%+x\x04\xbd\xf3\x96\xbf\x03P\xf7\xbe4\x1c~\
+\x1a\xa7j\x12]FnO\xf3\xd1\xef^c\xec\xfdS\
+\x5c\xcf\xe6\xc8QY\x11s\x80\x8cRt\xb5\xb7\xf3\xc4\
+s\xcf\xd0\xb4\xef)hk\xbf;P\xcb\x01\xd9|\x9e\
+\xfc\xd1\xa3\x1c;z\x14\xf7\xf6,\xebN\x9fa`|\
+\x82>\xd7\xc5\xa5f\x95A)n&\x93\xbc}\xf1\x02\
+\xc5\xb7\xde\xe6\xc1\xcd\x9b\x19|\xfe\xa7\xa4\xb7o\xbf\xb3\
+PKIar\x92\xcf_\x7f\x9d\xb1#G\xe88s\
+\x06q]\xfa\x81n\xaa\xd6\x80\x22x\xa0`-S\xf9\
+<\x9f\x9d=\xc7\x8d\xb3\xe7\xf8\xa4\xab\x93/.\x8c\xb2\
+\xed\x95W\xd8\xfc\xe4\x93w\x12j\xe1ax\xfb\xab\xaf\
+\x18{\xe3\x0d>\x7f\xed5\x9a/_\xe6\x11X0\x1f\
+F\xebB\xd1\x9ag+\xb0\x03\xb8\x05\x9c\xbfv\x9d\x0b\
+\x87\x0f3\x93\xcb\xe1\x8b0\xb8w\xef]\x84rK\xdc\
+\xf8\xe8C>~\xf5U\xee\x9f\x9a\xe2\xe1E\xce\xb4\x04\
+s\xbaG\xf0\xb8\xe6\x12\xacDz!\xe4\x00A^=\
+{\xec\x18\xef\xc7b\xf4tt\x90YA(\xd6\x95\xfd\
+<\xcfc\xe2\xf28\xae[\xc4\xda\xf9ko\x85\xcb\xe3\
+\xcc\x9c:Iz\x11 K\x90 J\x04K\xed\xf9\xaa\
+}\x1e\xc8U\xed\xbb\x81\x8d\xc0\xcc\xf1\xe3|\xf6\xfa\xef\
+\x1b\xb7y\xbdP\xd9\xecm\xfe\xf6\x8fc\xdc\xca\xcd.\
+\x085\xfe\xc1\x19\xc6\xff\xf0G\xf6,\x00cBOD\
+J_Gq\x11\xcd(\x0ech.\xa1\x19C\x18E\
+\xb8\x88b\x0c\x85\x8bpcz\x96\x0f'\xbe^\x11T\
+]\xe1\x97H$\x18\x1a\x1c\xa2\xad\xa5\x03\x91\xf9v\xb8\
+<=\xc3\xe8\xc4e\xf6\xd5\x00U\x87Y\x14j'U\
+\x82\xdfJ;%\x92\x04\xefDJx\xd6\xc7\xc5\xc7\xd8\
+\x12\xc1Jc\x9c4.\x07V\x84T'T2\xd9\xc4\
+\xc8\xc8\xc3\xf3\x0a\xd9H\xdc\xd0\x0bE Q\x05\x13\x85\
+\x9c[\xb5\xbf\x91\xd9\xc8\xe8\x86g\xc8\xe9u\x14K\xd3\
+P\xba\x01^\x16J9(\xe4\xc2\xf5\x0dCg\xfe?\
+\x14W\x08UwE\xb1\x18Pd\x99,p\x96`\xa0\
+;\x04c&\x1b\xc2V\x8f\x99\xa25\x18S\xa4d\x0a\
+X\xbf\x88\xf5K\xc1Vr\xb1\xda\xc16\xa5\xb0\xc6#\
+Q\xc8\xd2\xf8\x8a_\x83PKIGW\x17\xc9\x81\x01\
+\xfe\x0e|\x12\x82e\x08\xe6\xa6R\x15P\x0e(\x1a\x17\
+\xe3\xdd\xc2xY09\xf0\x8aA\xac\xa6\xd3\xc4\xda:\
+\xd1\x85<\xdc\x1a\xa3\x95Izde\xea\xad\x0aT\xf7\
+\x83\xdb\xd8x\xf0'\x8c\x02'\x81\xd3\x04\xf3N3\xd0\
+\x09\xb4\x00M\x04\xa1\x19W\xd0$\x90J4\x91jj\
+%\xd3\xb6\x81\xf6\xceM8q\xc1\x9f\x1e\xc7\xcc^\xa2\
+\xdd\x9fd\xe7\x86nv\x0d\x0f\xafH\x9fU\xa9(\xda\
+7l`\xf8\x87?\xe2\xfc\xbb\xc79\xf5\xde{\xe4\x80\
++@\x1b\xd0A0\x09;!d\xabVd\xe2\x16\xb1\
+\xd7)\x94f\xc9\x17\x0aH1\x87)La\xb2_\xd3\
+\xeeM\xb1\xbb3\xc9\xbe}\xfb\x18<x\xf0\xeeA\xc5\
+\xe3\x09\xfa\x87\x87\xd9\xfb\xf2/9*\x8a\xb3'N2\
+\x06\xac#\x98s2\xe1\x8d40Q\x98e\xe6\xeay\
+\x8a\xa6\x89\x92\x9b\xa7P(@\xf1*\xcd\xb6H;y\
+\x1e\xean\xe5\xd9\x03?\xe6\xb1\x97^\xa2eh\xe8\xee\
+A\x01\xb4tu\xb1k\xff~\xa4)\xc5\xd1\xb6V\xae\
+}\xf2)\xd9\x89\xcbL\xba.\xb1\x10\xc8\x01>-L\
+s\xb5\xf0/\x84&\x9aBO\xa6\x98ack3#\
+#{x\xf4\x91G\xd8}\xe0\x00\x1bFFV\xac\xcb\
+\xaaA\x89\x12\xda:\xbax\xf4\xd9\xe7h\x19\xe8\xe5\xd3\
+?\x1f\xe5\xdf'Np}\xea:\xc5\xe9i\xfc\xd9Y\
+(\x14\x98u]\xbe\x83G\x22\xe9\xb2\xb6\xb9\x99\xb5\xdd\
+\xddlj\x1ff\xeb\xe0 {^|\x91\x81\x9d;i\
+J5\xbe~\xfe\xad@E\x12\x8b\xc5\x18\xd9\xf1}\xb6\
+n\x19d\xdb\x81\xfd\x8c\x7f9\xce\xd5\xcf.p\xf5\xd2\
+%f\xae\x5ca\xfd\xed[\xec\x14MK\xf7\x1a\xd6\xde\
+\xb7\x91\xf5\xbbw3\xb0u+}\xfd\xfd$\x93\x8d/\
+17\x02\xd5\xd8\x02\xdd\x02\x92N\xb7\xb2}\xfb.\xb6\
+o\xdf\x85\xbf\xdf'\x9b\xcd\x92\xcd\xde\xc2\xf7=\x1c'\
+FS\xba\x99\xd6t\xeb7\xb9E\xf4\x8b\x0eE\xcdc\
+\xdaBP\x02$\x09\xb2\xf0\xaa\x88\xd6\x9aL&C&\
+\x93Y\xadK\x12\xea\x98\x0a\x19\xdcZ\x80jQa\xe7\
+f a\xad\xbd\x97WX\x22=\x93\xd48\xa7\x16J\
+\x13\x14\x02\x89\xb0\xe3=\x09\x15\x1a[\x87z\xce{\xcb\
+]\x0b%U\xdb\xbcX\xbd\x87\xa4\xf6M\xc3\x1c\x8e\xda\
+1\xe5Wm\xd7N\x9f>\xf3\xe5K\xbf8\xd4\xb7\xb6\
+{\x8dR\x22j\xf9\xfb\xd4t\x91\x85z\xa8\x85O\xad\
+\x95\x1as\x1a\x13<\xc8\xe5r\xb7\xed\xc5K\x97\xf2\xc0\
+5\x82j,xA\xb3\xc4\xe5\xaa\xc7\xd4\x16\x90\x1f$\
+R\xc9\x87\xba\xd7\xacI)\xa54K\x8e1\xa9\xe3\xd0\
+\x22kQ\x8b]\xd5\x96\x9b\xad\x09~*@.\x9bs\
+gf\xa7\xc7\xdcb\xf1/\xc0\xf9\x10,O\xd5\xef\xd1\
+\x16\xba\x5c\x14\xab)`\x0dA\xa5\xd3L%\x85\xde-\
+\xf1C\xcc\x12\xf0\x05\x15O\x15\xa8\xf9\xa1\xdeb6\x8a\
+\xaa\x9a8\x95zT\xf8\x16&\xeb\x06\xc4P\x19\x1a\xd1\
+sg\xa9\x0a\xb6,\xcbe\xb7(\xcbD^j\xfc\xb5\
+\xde\xeaBE[\xe4\x99{5\x91\xfd_\xea\x92\xff\x02\
+?V!\xc1\x91\x91-\xa8\x00\x00\x00\x13tEXt\
+Author\x00Beate Kas\
+par\x0e\xc3GD\x00\x00\x00RtEXtC\
+opyright\x00CC Attr\
+ibution-ShareAli\
+ke http://creati\
+vecommons.org/li\
+censes/by-sa/3.0\
+/^\x83Z\xbc\x00\x00\x00%tEXtdat\
+e:create\x002013-12\
+-17T10:20:17-05:\
+00\x05d\x89\x86\x00\x00\x00%tEXtda\
+te:modify\x002013-1\
+2-17T10:20:17-05\
+:00t91:\x00\x00\x00\x87zTXtD\
+escription\x00\x00x\xda\xa5\xcd\
+\xb1\x11\xc20\x0c\x05\xd0>S\xb0\x80\xad\x9e\xe3\xb2\x8b\
+b\xff8>b\xc9g)\x06\xb6\xa7`\x04\x9a\xd7\xbe\
+\xcb`\xb7\xc7\xe1\xde\xefD/liZ\xdc\x07\x90a\
+O\xd7\x1eu\x14r\x96\xa2?CM*\xc1\x0f4\x90\
+%>y;A\x9c\xbc\xaa\x18eMW\x83x\xe8C\
+;\x86WX\xb4Y\xd6\x85%/\x7f\x1e\xad6\xf8\xa7\
+\xc3\xe8\x1dt\xdfkB\xe8\x03\x06q\xf6\xaa\x12m\x96\
+\xf5\x0b\xc4\xfbM1>D\x85\xcb\x00\x00\x00\x19tE\
+XtSoftware\x00www.i\
+nkscape.org\x9b\xee<\x1a\x00\
+\x00\x00\x0ctEXtTitle\x00rep\
+ort\xccxT\xe0\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x08:\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00 \x00\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x07c\
+IDATX\xc3\xc5\x97ml\x14\xc7\x19\xc7\x7f3\
+\xbbwg\xdf\xf9|\xf8b0\xf1\x0b\x9885\xc6\xa6\
+\x94\xc6\x8d!\xbc\x95@xI\x14C\x1bp\x9a\x22\x92\
+\x08A\xa9\xd2/\xa9\xd4T\xd0\xa6/\xb4BM\xa3 \
+\xa4|h\xa5\xd2H\xfd\x80Z5Q\xd2(mZ\x9a\
+Tq\xd2\xd0\x92D\x84\x06L\xa8\x00Cb\x881\xee\
+\x91\xd8\xe7\xf3\xed\xfanwg\xa6\x1f\xcc]m\xf3\xd6\
+\x08\xaa>\xd2\xa3\x9d\xb7\x9d\xf9\xe9\x99g\xfe\xb3\x0b\xff\
+g\x13\xd7\x1a0\xe3\xde'\xdb\xb4\x11\x1b\xa50K@\
+\x84\x118F\xe9\xfd\x18\xf1\x5c\xcf\xbemo\xff\xcf\x00\
+jW\xedN\xda\xb6\xf7\x9bX4\xb2`nK}l\
+\xda\xd4\x0a9\xa9\xbc\x94 P\xf4\xf6\x0f\xeaw\x8f\xf6\
+\xe4R\x83\xd9\xc3\x0a\xff\xfe\xde\x97\xbfw\xee\x86\x02\xd4\
+\xdc\xfddmH\x9a7[gO\xcf\xcc\x9b\xd3P!\
+\xa4\x98\x16\xb2-,\x09\x96\x94H)\x10\x02\x8e\x9e<\
+\xa7\xf6\xbdy4\x9b\x0f\xcc\xe2\xde?m?zC\x00\
+Z:v\x84\xb3\xd9\xc8\x1b\x8bZ\x1b\xce\x83\xa8\xedK\
+\x0dM\xb5Bv\xf9\xb4\xa9\xc9\xf29M5\xd2\x92\x92\
+\xbc\xa7\xd0\xc6\x10\x8d\xd8\xf4\x7f\x9c\xe1\xd7/\xbf\x93\xd2\
+\x9e?\xf7\xcc+\x8f\x9f\xff\xb4\x00\xd6\xc4\x86h\xfd\xca\
+Go\xaa\x88-<\x9f\xca4u\xf7\xa6\xde\x1cL\xbb\
+;\x07\x87\x9c\x17{\xce](=q\xfa\xfc\x8c[\xeb\
+\xabBv\xc8\x22\xef)\xb29\x9fd\x22J<VR\
+\xfaA\xef\xe0-\xe9\xee\xbf<w]\x11\xa8\xed\xd8]\
+je\xf3\x9d\x96%f\xfbF\xdf\xf3\xd1\x1f\xbf\xbb\x7f\
+l\x7f\xfd\xea\x9f>\x90\xac\x8c\xfd\xf2\xa1\xb5\x0b\xca\x06\
+\x87\xf3\x04Jc\x8c\xa1*\x19\xe3W/\xec\xcf|<\
+4\xb2\xe8\xd3n\x85\x1c\x17\x8e\xe1\xdc\x5c#\xcc\xd9@\
+\xab\xfb&.\x0e\xd0\xf3\xe7\xed\xbf\x1d\x18\x18\xf9\xfd\xc9\
+\x9e\x94\xb2-\x89\x1fh\xf2\xbe\xc6\x19\xf1\xf9|s}\
+\xcc\xc2l\xba\xae\x08L\xbfg\xe7:mD\xd3\xfc\xb2\
+\xc3\xcf\x1ac~\x11\x0a\x85\x96Z\x965\x0er\xc8\x8f\
+22\xe96V,i\xa5\x7f K\xa0Fs\xa1$\
+,y\xf6\xa5\xd7\xf9B\xf9\x09\x8c1\xc5\xf1J)\xe5\
+\xfb\xfe\x0b\xae\xeb>\xb4o\xdf\xbe\xfcD\x00{lE\
+k\xeb\xac\xd4\xc1?\xb4\xd6?\xdb\xb8q\xe3\xb2\xf6\xf6\
+v\xa4\x94\xc5\x09\x8d1d\xdd<wn}\x06)\xc1\
+\x0b4Z\x1b\x86G|\xaa\x92\x09\xa4\x1de\xcf\x9e=\
+\x18c\xc6\xba\xb5w\xef\xde\xfb;;;\xdf\x05\x9e\xba\
+*@\xde\xd7g\xe75|4,\x06\xc4\xbc\x95+W\
+\xf2\x877\xba\xf8\xe6\xeeW.\x09\x9bmK\x84\x10x\
+\xbeBk\x836\x86H\xc8\xc2\xc9y\xccZ\xff\xf4\xb8\
+\xb1_\xfab#\x8fv\xdcMgg\xe7\x16`\x17`\
+\xae\x08\x90z\xed\xf1\x7f\x85'\xad\xfb\xea\xf2\xbb\xeeJ\
+Z\x96E\xdb\xac*\xbe\xbfy\x11\xcf\xbc\xd4\xc5\xb2\x85\
+\x9f\xa5\xb4$\x8c%\x05\xb6%\x11\x80\xe7k\xb41h\
+m0\x02\xb6o\xbd\x1b)\x05\xc6\xc0;G>\xe4|\
+\xff\x05\xbe\xf1\xe59$\x12\x09ZZZ\x1a\x85\x10\xcb\
+\x9e\x7f\xfe\xf9\xd7\xae\x08p\xd16\xaf^\xbd\x9al6\
+\x8b\xef\xfb\xacj\xab'5\xe0\xf2\xf2\x81\x7fr\xe7\x1d\
+-\xa4\xd2#\xb8\xb9\x00\x83\xc1\x98\xd1mq\xf3\x01/\
+\xfe\xf5\x14n>\xa0\xb5\xb1\x8a\xc0\xcbq\xf4x\x0f?\
+\xff\xd62\xb4\x0ap\x1c\x87\x15+Vp\xec\xd8\xb1\xaf\
+\x03\xe3\x00\xc6%\xd8\xbau\xebn\x992e\xca\xb2\x9a\
+\x9a\x1a\x1c\xc7\xc1\xb6ml\xdbf\xd3\xbds\xb8\xad\xb1\
+\x92\xb7\xde;\xc1\x94\x8aR\x941\xa4\xb3y\xfa?q\
+\xf8\xa0o\x88s\x17\xb2\xa4\xb3y\x1a\xaa\x13\x94\xd8\xf0\
+\xf7C'x\xe2\x91%$\x13Q\xa4\x94\x8c\x8c\x8c\xd0\
+\xd8\xd8HYY\xd9\xda5k\xd6T]\x11@\x08\xb1\
+e\xfd\xfa\xf5\xc2u\xddB\x1d\xad5J)\x1e\xdb\xd0\
+\xc6\xd4D\x84\xb7\xde;E2^Bz8O\xc6\xf5\
+PztK\xab+\xcb\x98qs9\xaf\x1dx\x9fo\
+ohe\xc6\xcd\xe5\x18c\x10B`\x8c\xc1\xf7}\x96\
+/_\x1e\x0e\x85B\x9b.\x0b\xb0t\xe9R[\x08\xf1\
+pkk+\xd9l\x16\xdb\xb61\xc6\xa0\x94\x22\x08\x02\
+T\xe0\xf3\x83M\xf3\x08\xe3s\xba\xe7\x1c\xb7\xcf\x9aJ\
+84*\xa4\xe5\xb10\xb77U\xf1\xfa\x81\xf7i_\
+0\x9d\xb6\xa6)(\xa5\x8a\xa7GJ\x89\xeb\xba\xb4\xb5\
+\xb5\x01l\xdd\xb1c\x87\xbc\x04 \x99L\xde\xb3h\xd1\
+\xa2\xeaP(D.\x97CJI\x10\x04x\x9eG>\
+\x9f'\x9f\xcf\xa3U\xc0\xce-\xf3\xc9\xa4\x87\xe8\xeb\xff\
+\x84y\xb3\xa6\x12-\x09\xb1xN-o\x1f\xee\xa6\xb6\
+2\xc2}\x8b\xa7\x17\xc7{\x9eG\x10\x04\xd8\xb6\x8d\xe7\
+y\xc4\xe3qf\xcf\x9e=\xe3\xc8\x91#+/\x01\x10\
+B|m\xd5\xaaUd2\x19\x00\x82 \xc0\x18S\x9c\
+\xc4\x18\x83\xd6\x9a\x90e\xf8\xd1\xa6VN\x9e>\xcb@\
+:\xc3\xbdw\xcc\xa0\xfb\xc3\xf3d\xd2C<\xd2\xde\x88\
+\xe7y\xf8\xbe\x8f\xef\xfb\x04A\x80\x94\x12\xa5\x14Zk\
+\x5c\xd7e\xc9\x92%X\x96\xb5u\x1c\xc0\x9a5k\xaa\
++++W\xd7\xd5\xd5\xe18\x0eJ)\xb2\xd9,\x00\
+\xa5\xa5\xa5E1RJ\xa1\x94\xa2\xbcT\xf2\xc3\x07?\
+\xc7\xa1#\xdd\xfc\xed\xd0)\xba\x8e\xf7\xf0XG\x13\x96\
+0\x04A\x80\xd6\x1a\x80\x92\x92\x12\x84\x10d2\x19\xb4\
+\xd6\xe4r9\x1a\x1a\x1a(//o\xef\xe8\xe8\xa8)\
+\x02\xd8\xb6\xfd\xf0\xda\xb5km\xd7u\x11B\x14}d\
+d\x04\xdf\xf7\x89\xc5bD\xa3Q\xc2\xe10B\x08,\
+\xcb\xa2\xba2\xc6\xb6\x07f\xd3u\xfc\x0c\xdb\xbe\xd2\xc2\
+\x94\x8a\x18\xe1p\x98h4J<\x1e'\x1e\x8f\xe3y\
+\x1e\x8e\xe3 \xa5DJI(\x14B)\xc5\xc2\x85\x0b\
+m\xad\xf5\xe6\xa2\x0e\x08!6\xb4\xb6\xb6\xe2\xba.\xd5\
+\xd5\xd5\xa4\xd3i\x86\x87\x87\x11B\x10\x04A\xb1lY\
+\x16\xf1x\xbc(\xcb\xf3\x93I~\xf7\x93:\xcaJm\
+\xa4\x94h\xad\xd1Z\x8f\xe6\x8b\xd6\xc5w\xa4\x94$\x12\
+\x09*++\xe9\xed\xed\xa5\xad\xad\x8dW_}\xf5A\
+\xe0\xc7\x05!\xfaL<\x1egxx\x98\xbe\xbe>\xb4\
+\xd6H9\x9a\x1e\x96e\x15\x17\xd4Z\x17\xf3\xa1P\x8f\
+\xd8\xe0\xfb\xfe\xb8\xc8E\x22\x11\x84\xf8\xcf=g\x8c!\
+\x9b\xcd\xe28\x0eZk&O\x9e\x8c\xd6\xfa\xd6\xb1J\
+\x18\xf1<\x0f\xdb\xb6\x8b/\x8e\xbd\x80\x0a\xcf\x02\xd4\x95\
+\xfa\xc7\xf6\x15|l_!7\xfa\xfb\xfb\x8b\xe5\xa2\x14\
+\x07A\xc0\xc9\x93'/\x99@k=\xf1v\xbbl\xdb\
+\x7f;\x16\xa0\xba\xba\xfaR!*\x10\x01\x1c<x\x90\
+\xae\xae.\xba\xbb\xbb\xe9\xed\xed%\x95J\x91N\xa7q\
+\x1c\x87|>_\x14\x99\x82\xca\x19c\x18\x18\x18\xa0\xae\
+\xae\x8et:M]]\x1d\x83\x83\x83L\x9b6\x8dt\
+:M}}}\xf19q-96l\x85ga\xdf\
+\xafd\x97\x0b\xfb\xc4\xbe+m\x07\x80R\xea\xea\x11\x88\
+D\x22\xe3\xf6\xfbj \x13'\x9f\xd8w9\x1b\xbbV\
+1\x07\x0aT\xc6\x18\x9a\x9b\x9bQJ\x15%\xb4\x10r\
+\xa5\x14B\x88q:\x7f-\x98\x89m\x85\xa3\x0d\xe8\x22\
+\x801\xa6\xe7\xcc\x993\xf53g\xce,&N!y\
+\x0a\xe5kyMM\x0dZk\x9a\x9b\x9b\xf1<\x8f\xa6\
+\xa6&r\xb9\x1c\x8d\x8d\x8d8\x8eCCC\x03\x99L\
+\x86D\x22Q8\xea'\x80\x12\x1b\xc0u\xdd\xef\xec\xda\
+\xb5\xeb))e\xed5\xe3~\x03L)\xd5\x9bJ\xa5\
+\x9e\x00\xc2\x05\xb5(\x01n\x02*\x80r \x0c\x84n\
+\xf0\xba\x1e\xa3?B9 \x03\x5c\x00.\x8c\xfd,\x17\
+@\xec\xa2\x97p\x99\xbf\xa6\xeb\xb4\xe0\xa2\xe7\x80\xecE\
+ \xfe\x0dX\x9e]\x7f\xb21'\xfa\x00\x00\x00%t\
+EXtdate:create\x002\
+013-12-17T10:20:\
+17-05:00\x05d\x89\x86\x00\x00\x00%\
+tEXtdate:modify\x00\
+2013-12-17T10:20\
+:17-05:00t91:\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x1f\x10\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+ cHRM\x00\x00z&\x00\x00\x80\x84\x00\x00\xfa\
+\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\x00\x00:\
+\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x06bKG\
+D\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09p\
+HYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\xa8d\
+\x00\x00\x00\x09vpAg\x00\x00\x00\x80\x00\x00\x00\x80\
+\x000\xe11\x9a\x00\x00\x1d\xdeIDATx\xda\xed\
+\x9dkl\x1c\xd9\x95\xdf\x7f\xe7VU?I\xf1\xfd\xd2\
+\x93\x94\xc6\x1e\x0d){\xe3\xb5\xd7\xcez6N\xd6\x9e\
+\x05\xf2)\xc0\xee\xacm\xc0@>f7\xd9 \x8e\x03\
+d\x9dx\xb3\xd9 06\xc8\x06p\x02\x07\x1b`\x17\
+H\x16A\xe2\x1d`<\xa4\x1e\xf3\xd2\xcch\x1e\x9e\xf1\
+<5/\xcf\x8cDj\xa4\x91F\x92%\x92\x12%\x8a\
+\x14\xbb\xc9\xeefw\xdd|\xa8\xae\xee\xeafuw5\
+\xd9-\x96\x1c\x1d\xa2\xd8\xd5\xf7VW\xdf{\xcf\xff\x9e\
+\xf3\xbf\xe7\xde\xba\x0d\xf7\xe4\x9e\xdc\x93{rO\xee\xc9\
+=\xb9'\xf7\xe4\x9e\xdc\x93\xff\xbfD\xb6\xbb\x00\xed\x96\
+/\x0e\xff\x13\xf2\xab\x19z~k\x89DG\x06\xd3\xb6\
+0\xc5\x02\x11\xd1\x1aD\x0b\x22\xc5f\xd0\x80h\xb7U\
+\xc49\xd1\x80 \xbax\x89x\x1b\xae\xf8N\xc4\xb9\xac\
+B\xc4\xc9woQN\xd6ZS\x00\x98\xfa\xe9\xe1\xed\
+n\x9ep\x01\xe0\x9b\xdfz\x18\x0d\x96\x08\xff\x08\xf8M\
+\xc0\xf0\x94Q~E\xce\x0b\xc0\xb3\xc0\xdf\x00\xb9\xc7\x1e\
+\x9d\xda\xd667\xb7\xf5\xdb\xab\xc5\xe9s_\x02\xfe\x1a\
+\xe8\xdb\xee\xe2\xb4Q\x1e\x04\xde\x04~\xb1\xdd\x05\x09\x17\
+\x00\x1c\xd9\x05\xf4\xb8o\xb4\xd6[\xb8U=\x11\xa4\xc5\
+\xf6O\x1a\xdc\xd0S\x97\x0e\xa0\xb7M\x15kJ\xc2\x08\
+\x00\xc0i\xac\xbe\xbe>\x0e\xde\x7f\x10Q%\xa7\x8c\xab\
+\xb5\x0a7]\x95W>\x95\x8d\xe7\xd5\xf7\xf0~\xa6\xe2\
+~R\xe1 \x1b\xe6\x95\xbf\xa2\xe2\xbd{m6\x9b\xe5\
+\xed\xb7Or\xfb\xf6\x8a\x0b\x94P\xb8\xdf0\x02@\x83\
+\x03\x80\xee\xeen\xbe\xf2\x95/\xa3\x94\xe1\xc9\x0a\xdan\
+\xed\xb2\x1c\x9b\x11!\x9dN\xf3\xe1\x87\x1f\x02+\xdb]\
+\x98\x0a\x09#\x00\xc0\xd5\x9e\x06\xdb\xd6\x80\x0d\xb8&\xb6\
+\xf5\x8au,s\xfb\x00#\xb2\xc1\x95y\xc9\xe1\xb6J\
+\x18\x01\xe03\xa0\x12\xb2\xb9,\xb7n\xdd\xf2\xe5\x04\xf5\
+xB\x10\x0eQ\xf7\xf3\xe8\x9a\xd8\xd0\xe5\x1b\xf8\xde\xd3\
+\xb2,\x06\x07\x071M\x13\x11i\xc8\x11\xb6C\xc2\x08\
+\x80\x928\xcd* B6\x9bcnn\x0e\xdb\xb6\xb7\
+\xbbX\x81%\x1a\x8d\xd2\xdf?@\x8d\x0e\x1f\x0a4\x84\
+\x11\x00\xba\xe2\xd4\xd1\x7f\xf1\x08g/\xaa%\x15.K\
+\x1a\x8f\x12\xb6C\xc2\x0a\x802\x08te\x18-$\x1d\
+'P5\xdc\xa2\x8b\x80\x12\xa9.y(*\x12F\x00\
+\xd4\x96v\xea\xbf\xe5\x1c\xd0\xa7\xa0\xf7,@ \xa9R\
+\x85\xa3u)\xf6\xa0\xb65a\x8bo\xac\x8b\xf7t+\
+S\xe5\xbeBc\xca\xd4v\x17\xa0\xa1\x84\xa6\xa9\x9a/\
+6Z\x97\x91\x10\xd2J\x84\x11\x00\xda{Vj\xba\x10\
+\x9a\xcf@R\xac\x80l$\x81\xa1\xa8P\x18]\x00\xb8\
+\xd1@\x0f\x16\xca\xc1\xdbP\xb4[\xd0*\x80\xd6N\xa9\
+C\x0a\xe00\x02\xa0&\x1ds\x87\x83-\xbba[k\
+\xb1\xb1\xa0\x22\xceb\x80{s\x01M\x89\xb0\xd5\x9e\xbf\
+--\xed\x13\xf7\x91p\xe8\xbcB\xc2\xcd\x01\xa0\x15\xfa\
+\x0fAe\x8a#\x00\xef\xc4cHj\x14F\x0bP\x11\
+\x08\xaa\xd4\xbfwqM\x90\xdblsE\x5c\x12\xebO\
+\x02C!a\x04@Yt%\x11,\xb5f \x09x\
+]\x9bq\xe2\x0dd\xde\x1b\x05\x04\x93\xf2$\x1b\xda\xb3\
+\x0a\xb3M\x81\xa06\xa9\xa14\xfcw\x9d\x80\x84\x91\x01\
+\x84\x93\x03TJ\xb1\xd7\x87\x8777Q\xec\x8awT\
+[\xafP\xd4&\xd4\x16\x00\xbc\x81\xa0\xe2\xbfP4[\
+\x93\x95\xd98\x93\x19\x9aZ\x84\x11\x00PcQ\x88{\
+\xb6\xfd\x12\x8c8\x94\xe6\x01\x00\xd341\x0c\xc3\x9b\x1d\
+\x86\x8a\x84\x12\x00\xda\xe7\x0c\x08I\x8b5[\x92b\xe0\
+\xc74\xcc{\xa3\x80\x80\xe2;\x1b\xe8\x9d\x11\xbc[\xc4\
+-\xabi\x98\x88R\xf7F\x01\xcd\x8a\xf6\xce\x06\xb5\xcb\
+\x03\xb4y\x18(\xa20-\x0b\xdb\xb6\xefY\x80\x80R\
+3\x10$\xed\xe0\x80-\xb8a\xed\xc9\x0b\xb0,\x0be\
+(\xb4\xb6\xefY\x80\xcd\x88&\xfcK\xc2\xfcK\xa4\x89\
+F\x22D\x22V)\x8a\xe9q`\xa1\xa9D\x18\xe3\x00\
+\xda\xff]h\xda,\x90\x18\x86I\x22\x9e,\xf5z\xd9\
+8\x95\x19\x8a\x0a\x85\x11\x00%\xd1\x9ab\xa3\xb5\xfe9\
+\xbe\xb6\x8a\x08\xf1x\x02\xd34\x8b\xa1`\xef#j\xe1\
+\x920\xba\x80\x8ae\xe1\xa5 \xd0]4+\x18\x8bE\
+\x89\xc5\xa2\x15\xe5\xf5Y\xd2\x1e\x8a\x9a\x84\x15\x00>\xd1\
+\xc06/\x0am\x91X\x96E2\x91\xacPviA\
+k\x08M@\x18\x01PG\xc2\x0d\x01\xc3P$\x13\x1d\
+(e\x14G,\x15\xcb\x82QR\xf2\xb8\xa1\xa9D\x18\
+9@\xcdH`\x98ED\x91Ht`Z\x9e>%\
+\x95\xa7\xf7\x5c@\x93\xe2}6\xb0\xe2h\xdd\xcd[r\
+#\x11!\x91L\x10\x8dF(\x13\xd6\xcae,Z\xa4\
+\xb4\xcfA\x98$\x8c\x00\xf0p\x00]\x9a\x00l9\x07\
+\x94\xf2\x97m\xe96\xa2H\xc4\xe3\xc4b1\xbcK\xbf\
+*6\x91(>#x\xcf\x02lF\xda\xb6E\x8c#\
+[\xd2\x82\x08\xf1X\x9cx,\x8ew\xa8Z\xbd\x84\xcd\
+%\xb1\x1e\x0e\x10\x1a\x09#\x00\xee\x0a\xcf/\x22\xc4\xe3\
+qb\xb1\xb8g\x99\x82\x94U^\xfd$\xe8\xaf\xc2\x83\
+!\xbf\xff\xad\x87\x01m\x88\xc8\x04\xb0\x07\xffi\x9a\xad\
+\xa4i\xe0\x10\xce\xf6p\xc5\x1dajF\xd2\xb6M\xca\
+\xca\x8fmTx\x15\xf1+=\xde\xa4\x05Q%\x0b\xa0\
+\x80o\x03\x13\xdf\xfc\xf6\xc3\xee3\xe46e\xf7\xe7\xf7\
+\xbe\x99k>\x06^\x03\xd6\x1bmC\x17\x18\x00\x0f\x7f\
+\xebw]r\xf3\x10\xce\x1ew\x03\x8d\xdai\x0b\xe9\xca\
+i:\xcf\xf3\xd5%\xfb\xba\xbd PJ\x11\x8f\xc7\x89\
+F\xa2U\xab\x94\xfc\xfc\x7f%*\xaaV\x04\xfd~\xf1\
+h\x87,\x02\xdf\x01\x9e\xfd\xcew\xbe\xc3#\x8f<R\
+\xf3\xc2\xc0\x00\xf0\x14\xfe3\xc0No\x9e\xd6\xba\xe5\xdb\
+\xb9i\xad\x89D\x22\x18J\x85\x22\x10\xa8\x01\xd30\x88\
+\xc7\x13X\x96\xe5\xb4\x89\x87\xf1\x97\xfd\x7f\xa53(\xbe\
+qF\x0a\x898Z\xeb\x96\xefr\xe2\x13e\xdcA\xc0\
+m\xe8\x02\x03 b\xc4X/d\x01\x9e\x06\xfe1\xf0\
+e7\xaf\xbb\xbb\x9b\xae\xae\xae\x12\x08*\xa2`NB\
+\xcd\xf7\xfe\xd7\x83iZ|\xf6\xfe\xcf\xa2T8\x88S\
+\xc4\xb2\x88\xc7\xe3\xa5e]\xb2\xc1\xd4\xcb\x06#U\xed\
+\x15>\xff\xb9\xcf\x13\xb1\x22\xe4\xd6\xd7\xab\xe6\x05\xbd\xf3\
+\x84\x95s\x86\xe5-\xe7\xfc\xafQJq\xe9\xf2%>\
+\xfe\xf8coq\x9fD\xf3,B\xdd\xde\x0fM\x00\xe0\
+\x91G\x1e\xe1\xe1o\xfd\x1eJ\xe4\x02\xf0=\xe0\xff\x02\
+\x07\xb4\xd6\xc4b1~\xe7\xa1\xdf\xa1\xb7\xb7\x17[\xdb\
+T\xe1\xdf_\xaa+^\x9d]\x1c7o7s\x16\x11\
+\xa2\xd1(\xd1h\x14\xa9*\x8b\x1f\xe1\xab\xe8\xff\xaew\
+\xc7\xb1h\xbbv\xeeb\xd7\xae\xdd\xde\xea{\xef\xe2\xdb\
+Q*\xf7'\xac\xfc>%\xc2\xfc\xb5yNOO{\
+\x9f9<\x09|\x1faQ\xe7\x1b\xdbK\xa3\xe1\x15\x1e\
+\x999=\xc3\xc4\xa1\x07\x10\xd4\x15\xe0\x12\xf0\x0d\x11I\
+\xa6R)R\xe94\x07\xee\xbb\xaf\xd4K\xdc\xc34M\
+\x0c\xbf\xc30+\xae\xab>\x942\x9cmU\x8a\xfe\x7f\
+=\x9fgqq\xd1\xb12\xd5\x81\xa1\xa0G\x93b\x9a\
+&\xf1x\x9cH$Zl\xdc\xe2\xb2\xb4\x0a\xb3/\xe5\
+\xb0\xafO^\xb2#I<\x9e(/g\xf3\xe9\xf1\xd5\
+J\xaf|_.\x8f\xc3\xf2\x1cw+\xc0\xf2\xed\xdbL\
+MMq\xfe\xc2y\xd7R^\x00\xfe\x10\xf8@k\x98\
+\x9cl\xbc\x0f\xf1\xa6\x5c\xea7\xbf\xfd0Zk\x11\x91\
+?\x00~\x04$\x01\xbe\xf0\x85/\xf0\xd07\x1e\xc2\x8a\
+D@;\x14n=\x97\xdb\xe0\xf3*\xd8B\xdd-\xda\
+\xca\x85\xccd2\x5c\xfe\xe5/)\x14\x0am\x7f0L\
+\x89`E\x22D\x22\x11\x94R\xa5^X\xf9\xeaU|\
+\xe5\xabw\x0d@\xe7\x8eN:::**\xe3\xb7[\
+\x90\xaf-\xf4\xech\xeap\x88\x04\x86i\x22@.\x97\
+\xe3\xd8\xe3\xc7x\xeb\xad7\xdd\xef[\x04\xfe\x10\x91I\
+l\x9b\xc7\x02\xeeD\xbeiN\xe5\x80\x00K\x84?\x05\
+~\x00XJ)\x1e|\xf0A\x1e\xfc\xea\x83%\xdf}\
+\xf3\xe6M\xe6\xe6\xe66I\x12u\x05>\x0a\x85\xc2\x16\
+\xd4\x1aLL\xd3$\x12\x89`\x9a&\x95\xbd\xbb\xccU\
+\xfcz{)\x0d\xaa\xf2\xfc,F\xe5\xa8 \xc8\xeb\x8e\
+\x1d;\xe8\xed\xe9A\x94\xc2\xd6\x9a\x17_x\x9e\x13\xcf\
+\x9fp;W\x06\xf8\x13\xdb\xe6\xc7\x22\xd8\x93?\x0d\xbe\
+\x03yS.\xc0+\xd3\xa7g\x9884n\x03\xef\x00\
+C\xc0\xaf\xdb\xb6-sss$\x93IF\x86G\x00\
+\x88\xc5b\xe4r9R\xa9\x14\xb6m7y\xe8\xd2\x08\
+\xa3}\x9bF;\xa2\x94\x22\x1a\x8d\x16{\xbd\xe1\xa3\x5c\
+<n\xc0G\xf1>J\xf6\x05\x83\x9bV\xfdZ\xfdy\
+O~2\x99\xa4\xaf\xb7\x17e\x18\x88\x08\xef\xbe\xf36\
+\xc7\x9f9\xce\xfa\xfa:\x22b\x03\xffC\xa3\xff\xb3\x08\
+\xeb\x93M\xfe\x06\xc1\xa6\x01\x00\xd0wp\x9c\x0eE\x0e\
+\x87x\x1c\x14\x91\xfb\x0b\x85\x02\xb3\xb3\xb3\xf4\xf5\xf5\xd1\
+?0\x80\x88\xd0\x91L\x92\xcde\xc9d2\xce\x07\xc3\
+\x11\xcfq\x8a\x22B$\x12!\x12\x89b\x14\x1bx\xb3\
+\x8a\xafk\x05\xdc\xb4\xeaW\x1f\xab\xe0\xe5\x02\xb1X\x8c\
+\xfe\xfe~\x0c\xd3D)\xc5\xd9\xb3\x1fs\xf4\xd8Q\xd2\
+\xe9\xb4\xfb\x99)\xe0\x8f\x05Y\x99|\xb4\xf9\x1f\xa0\xd8\
+\x12\x00.\xcf\xccpp\xfc\x10Jt\x1a\xc7\x12\xfc\x86\
+\x88\xec\xce\xe5r\xcc\xcd\xcf12\xb2\x93\xee\xeen\x94\
+\x08\x89d\x92\xb5\xb55r\xb9\xdc\xe6I\x5c\x0b\x0fQ\
+\x0a\xd34\x89F\xa2\x98\x96\xe9\x8c6<\xac\xbbd\xba\
++\x94U\xd5S\x8b\xd7\xfb\x9a\xf8\x12\x1f\xf0\xc9\x03j\
+\x91I\xef5\x96e10\xd0O$\x12E)\xc5\xec\
+\xecU&\xa7&YXXp]\xec\xeb\xc0\x1f\x01\xb3\
+\x9b\xfd\xe1\x89-\x01\x00`fz\x9a\xf1C\xe3\x88C\
+BN\x01\x7f_D\xfaV\xd7VY\xb8~\x9d}{\
+\xf7\x92H8\xeb\xe3\x12\xf18\xe9t\x9a\xbcc\xba6\
+\x04x\xee\xc8!\xe2\xf8y+\x82e\x99\x88\xa8\x0ae\
+\xfa)N\xaa\xf2*\xc8\xde\x86\xeb=\xfe\xbb\x0e9\xac\
+ \x93\x9eW\xf7\x1a\xc30\xe8\xeb\xef'\x1e\x8f#\x22\
+,//395\xc5\xc5\x8b\x17]\xe5\x9f\xc3a\xfc\
+\xa7@\x98>=\xbd=\x00\x00\x97\x0fL\x00\xfa*\xc8\
+\xa78\xc3\xc3\x8e\x95\x95\x15\x96\x96n1::F$\
+\x12\xc1\xb2,\xa2\xd1h\x89\x0f\xdcI\x11\x11\x0c\xc3\xc0\
+2-,\xb3\xac\xf8\xbaf\xbe\xca\x1d\x88G\x91\xc1L\
+\xbf\xe7\xfa\x0dy\xe5eb\xa5\xd7\xa2\xf2\x95R\xf4\xf6\
+\xf6\xd2\xd9\xd1\x81\x88\x90\xcddx\xe2\xc9'\xf8\xe8\xd4\
+G\xae\xf2\x17\x80\x7f!\x22/j\xadi\x86\xf4\xb5\x05\
+\x00\x0e\x08\xa6\x9984\x8e\xb6\xeds\x22\xb2\x04\xfc\xb6\
+\x88Do..\x92\xc9d\x18\xdd7Zb\xd8\x96e\
+\xb1\xb2\xb2\xd2vbW\xaa\xa4a`\x1af\xd5\xae\xdd\
+\x8d|9\xf8\xf2\x81\x0dC\xc0\xa0\x04\xd0'\xaftM\
+eZWW\x17]]](\xa5(\x14\x0a\xbc\xf0\xe2\
+\x0b\xbc\xf6\xfaknuV\x81\x7f\xaf\xb5\xfd\x13\x80f\
+I\xdf\x86\xb6ieCO\x9f\x9ea\xe2s\x13\x80\xfe\
+\x08D\x01\x0f\x8a\x88q\xfd\xfau\x10\xd8\xbbw/\xa2\
+\x14\xf1x\x0cQB*\x95\x86\xea\xc7\xbfZq8m\
+\x8d2T\xe9\xa9\xdc\x92\xe2==\x0e\xaaz~E^\
+\x00\x22\xe8\x93\xe67\xf4k\x86\x1cv$\x93\xf4\xf6\xf5\
+\x15\xe3\x0fp\xf2\xe4[<\xf7\xdcs\xe4\xf3yD\xa4\
+\x00\xfc\x18\xf8\x91\x88\xe4\x1f\xdb\x04\xe9k+\x00\x5c\x10\
+\x8cO\x8c\xdb\xc0\xbb\x22\x0c\x00_\xd4Z\xcb\xdc\xdc\x1c\
+\x89D\x82];w\x22\x08\x89D\x12m\xdb\xac\xa6W\
+[\xac}A)\xe5D\x1b\x95\xe1<\x94Y\xea\xa9^\
+\xa6]N\xab\xe4\x00\x1e\xdf^\x01\x9a*\x9f\xbe!M\
+<\xd7W\xfb~*\xef\xeb\x97\x07\xc4\xe2q\xfa\x07\xfa\
+1\x0c\x87\xf1\xcf\x9c\x99\xe1\xd8\xb1\xa3\xac\xae\xad\xbae\
+\x7fT\xa3\x7f H\xbaU\xbf6\xd6\x96@\xfb\xed\xe5\
+,\x22\xa4\x81?\x03\x8e\x89\x08\xeb\xeb\xeb\xbc\xfc\xf2\xcb\
+\x9c9s\x06\x11A\x890<<LOOO\xcbT\
+\xafD0\xddP\xb2\xdb;\xa1\xd8\xd8\xeeQ\xb9\xd3@\
+\x11\x12\x1b\xd26\x5cW\xcd\x03Jy\x95d\xd6{\xb7\
+\x0ar\xe8M\xa3\x0c\x02\xf7SV$B__\x1f\xa6\
+i\xa1\x94\xe2\xca\x95+<\xf1\xc4\xe3\xdc\xbe}\xdbU\
+\xfe+\xc0\x0f\x04YB\xb7\x8e?\xb5\xdc\x02\x00\x9c?\
+\x7f\x96\x89C\xe3\xe0\xf8\xabw\x80/\x89\xc8\x9e\xf5\xf5\
+ufgg\x19\x19\x19\xa1\xa7\xbb\x07\x11!Y\x1c\x1e\
+f\xb3\xd9R\x0f\xdd\x8c\x88(\xc7ln\xe8\xe54L\
+\x0b\xe4\xfb[\x19\x0b\xa8\x8a\xf4\x99\xa6I\x7f\x91\xf1+\
+\x11n\xdd\xba\xc5\xe4\xd4c\x5c\xbe|\xd9%}g\x80\
+?\x00\xceh\xbdu\xbf\xdfv\x00@\xd1\x15\x8c?\x80\
+\x88\xdc\x02>\x04\xbe&\x22\xfdk\x99\x0c\xd7\xaf_c\
+\xcf\xde=$;\x92\x18\x86A\x22\x91 \x9dN\xb3\x9e\
+_\xf7\xf4\xad\xa0\x8awL\xbe\xa8\x8d\xbe\xbdi\x00\xd4\
+T\xb2\x1f(\xfc\xc7\xf1\xbe$\xd1U\xbc\x0f\x00\x94\x12\
+z{\xfb\xe8(2\xfe\xb5\xb55\x1e\x7f\xfc\x18\xd3\xd3\
+\xd3\xae\xf2\xaf\x01\xff\x5cD^q\x18\x7fk\x7fm\xb4\
+m\x00\x00\x98\x9e\x9ea|b\x1c\xa5\x98\xc5\x99\xa9\xfa\
+\xba\x88t\xae\xac\xacp\xeb\xd6-\xc6\xc6\xc6\x88Fc\
+X\x96I,\x16'\x95J9\xf1\xfe\x0d\x81\x1bj\x1c\
+\xd5\x84\xcb\xebo=\xe3m\x91\xaa\xb4\xca\x1e\xbaq\x5c\
+^u\xef*%n\xb8\x075\xc0\xb0\x01P\x1b-C\
+wW7]\xdd\xdd(%\xe4\xf3\x05\x9e\x7f\xfe\x04o\
+\xbe\xf5\xa6\xdb\x84i\xe0\xdf\x16\xe0Qhm\xcf\xbf#\
+\x00\x00\x97\x14>\x80]\xc8~\x22\xca\x5c\xa48<\x5c\
+\x5c\x5cduu\x95\xb1\xd11,\xd3\x22\x12\x8d\x10\xb1\
+\x22\xac\xac\xac`\xbb\x1b,\x97\x8e\x1a\x7fUch\x7f\
+%mTV\x99\xc4QuM5!\xa4\xf4=\xb5\xef\
+\xe1G\xec\x5c\xc5\xd7\xc8+\x1a\xb9\xce\xceN\xfa\x8a\x8c\
+\x1f\xe0\xcd\xb7\xde\xe4\xf9\x17\x9ew\x19\x7f\x1e\xf8\x11\xe8\
+\x1f+\xa40\xd9\xa6\x9f\x98m;\x00\x5c\x10\x1c:\xf4\
+y4\xfaT\xd1\xfc\xfd=\x111\x16\x16\x16\xd0Z\xb3\
+w\xdf^\x0ce\x10\x8b\xc7P\x86\x22\x9dJ\x05\x8a\x11\
+\xd46\xe9\x1e\x06_\x95\xe67\xd4\x0b\xe4\xd3\x1b\x0c\xf5\
+j__\x19\xf0)f\x90H\xc4\x19\xe8\x1f(\xae}\
+\x10N\x9f>\xcd\xe3O<\xce\xda\xda\x9a[\xde\x9f\x00\
+\x7f\x0a\xb2\xda\xce\xdf\x17\xbe#\x00\x00\xcf\xec\xa1\xd6\xef\
+\x22\xd2\x0b|Ik-\xf3\xf3\xf3D\xa3Qv\xed\xde\
+Ul\x98\x04ZkR\xa9T\xc3{n\x06\x00\xbe\xe3\
+\xff\x86\x1c\xa0U\xe4\xcfI\x8bD\x22\x0c\x0c\x0c\x96\xd6\
+\x1b\x5c\xbe|\x99\xc9\xa9I\x96\x96\x96\xdc\xf2\xbd\x00|\
+\x17X\xc8\xe7\x0b\x9c\x999\xd36\xbd\xdc1\x00@\x09\
+\x04\xeb8\xb3\x87\xf7\x89\xc8\xb8;{\xd8\xd3\xd3\xcd\xe0\
+\xe0\x10\xe0L\x7f\xe6\xd7\xf3\xac\xad\xad\x155]u\x14\
+\xd3\xca\xe6\xb6\xd2\x8f\xfb+\xbe\xac\x90j\x00\x04\x0d\x0a\
+5\x0b\x00?\x12h\x98&\x83\x83\x03N0L\x14\x8b\
+\x8b7\x99\x9c\x9a\xe4\xca\x95+\xae+8\x85\x13\xe3?\
+\x07\x8a\xa9\xc7\xda\xfb\x13\xf3w\x14\x00\x00\x13\xe3\x07A\
+d\x0dx\x1b\xf8u\x11\xd9\xb7\xbe\xbe\xce\xd5\xab\xb3\x0c\
+\x0f\x0f\xd3\xdb\xd3\xeb\x0c\x0f;\x92d2Y\xb2\xd9l\
+\xd1lz\x0e\x8f\x8fm\xd8\xe3J\xfc\xa0\x16\xf9\xf3\xbf\
+\xbe\x04\x1c\x8f\xf2\xfc\x03G\x9e\xf1~U^\x85\x8b(\
+\x8eV\xfa\xfa\x1d\xc6\xafDX]]\xe3\xe8\xb1c\x9c\
+9s\xc6U\xfe,\xf0G\x88\xbc\xbe\xd5\x18\x7fh\x01\
+0=}\xa68q\xc4\x12\xf0\x01\x0e\x1f\x18\xc8d2\
+\xcc\xcf\xcf\xb3w\xef^::\x9dG\xac\x93\x89\x04\xab\
+\xab\xab\xac\xe7re_\xea=\xaaz\xf1\x86\x1e[\xa7\
+\x17\xd7R\x92?\xb3\x17\xff\xeb\xab\x88\x9e_\x9a\xd7*\
+\xf5\xf4\xf4\xd0\xdd\xdd\x8d(E~=\xcfs'\x9e\xe5\
+\xe4\xc9\x93.\xe0V\x80\xefG\xcd\xecT\xc16\xda\xc2\
+\xf8C\x01\x00p&\x8e\xc6\x0f\x8d\xa3`\x0e\xf8\x04g\
+\xf6\xb03\x95Jq\xf3\xe6M\xc6\xc6\xc6\x88\xc5b\x98\
+\x96I,\x1e#\x9dJ\xbb\xcc\xb8\xe2>\x8d\xcc\xf8\xe6\
+\x82=~\xec\xbeFl\xa0\x06\xe1\xf3#\x8d;vT\
+2\xfe\xd7^\x7f\x8d\x17_|\xd1Y\xe3(\xb2\x0e\xfc\
+\x85F\xffe\xde6\xedv1~?\xd9\x16\x00@q\
+xxh\x9cW\xdf\x1f8\xbfwdu\x01'F\x10\
+\xbbu\xeb\x16\xe9t\x9a\xfdccX\x96E$b\x11\
+\x8dDXY\xd98\x85\xbc\xbd\x00\xf0W\xf6\x86\xeb\x81\
+D2\xc1\xc0\xc0@qRJ\xf1\xd1\xa9\x8fx\xf2\xc9\
+'\xc8d2\xeew\xfeo\xad\xf9\x0f\x22\x92\xb9\x93\xca\
+\x87m\x04\x008 \xf8\x87\x0f\xed\x058-H\x01'\
+Zh^\xbf~\x9dB\xa1\xc0\xbe\xd1Q\x0ce\x10\x8d\
+F1L\x93\x95\xd4\x8ag\xf3\xc8\x00A\x1f|\xd2|\
+\x82>\x8d\x89d\xe3\xd1B-w\x13\x8dF\x18\x1c\x1c\
+\x22\x12qb\xfc\x97.^\xe4\xf0\xe1)\x96\x97\x97\xdd\
+\xefx\x16\xf8\x97\x22,\xb6s\xb8WK\xb6\x15\x00P\
+\x1a\x19h\xd0\xef\x81t\xe3<q$sssD\x22\
+\x11v\xef\xda\x8d\x88\xf30&\x08\xe9t\x1a\xa7i\xdd\
+Fw\x95+uz\xa6\x7f\xd0\xa7f@\xc8/\xe8\xe3\
+y\xefG\x027\x90A\x9c\xa7\x9b\x86\x06\x07K\x8c\xff\
+\xc6\x8d\x05&\xa7&\x99\x9d\x9du]\xc1\x078\x8c\xff\
+\xc2\x9a\xd8\x9c=\xd5\xbe\xe1^-\xd9v\x00@\xc9\x1d\
+\xe4\x81\x93\x02\xfb\x81\x09\xdb\xb6\xb9z\xf5*\xdd]]\
+\x0c\x8f\x0c\x83@2\x99\xa0\x90\xcf\xb3\xb6\xba\x8a\xa3\x8f\
+\xc6\xe6\xbe\xde\xf8\xbe\x99\x87<\xa4N\x9e\x9f\xffW\xca\
+\xa0\xbf\xbf\xdfY\xd5\xa3\x1c\xe0\x1e=v\x94\xb3g\xcf\
+\xba\xca\xbf\x02\xfcS\xe0$\xb6\xe6\xe8O\x8flK\xdb\
+\x87\xe3\xc1;J\xcc~\x11\xf8>\xf03\x11!\x93\xc9\
+p\xe2\xf9\xe79\x7f\xfe<J\x04C)Fv\x8e\xd0\
+\xdd\xdd\xb5\x89o\x08\x10Yl\xf2z\xff\xcf9)=\
+=\xdd\xec\xd8\xb1\x03\x943\x15~\xe2\xc4\x09N\x9d:\
+\xe5\x02u\x19\xf8\x81\x18\xc6K\x00\x8f\xb5y\xac_O\
+Ba\x01\xa0b\xf6p\x19\xf8\x05\xf0[\x222\x98\xcd\
+f\x99\x9b\x9bc\xcf\x9e=t\xee\xe8D)\xe5\xac0\
+^]#\xb7\xee\x19\x1e\xd6\x0c\xf7\xd6\xcb\xab\xc1\xee\xeb\
+\x91\xc7\x00\xa4\xb0\xabk\x07\xfd\xfd\xfd(\xe5\xfcN\xe0\
+\xab\xaf\xbe\xcaK?{\xc9\x0do\xe7\x80?\xd7\xe8\xbf\
+\xd6\xda\xd6\x9bY\xca\xddJ\x09\x0d\x00\xc0\x99=\x9c8\
+\xf4\x00 \xd7\x80\xb38#\x83\x1d\xa9T\x8a\x1b7o\
+2::F<\x96\xc04\x0d\xe2\x89\xb83<,\xe4\
+\xcb!\xde\xc0\xc3\xb5\x1a\x91;\x1f\x82X\x01\x18\xbf\xe0\
+\x11\xe54\x80dG\x92\xa1\x81\x01\xe7\x11.\x11>\xf8\
+\xe0\x03\x9ez\xfa)w\xbd\x83\x06\xfe'\xe8\x1f\x0a\x92\
+\xddn\xe5C\xc8\x00\x00\xe5\xd9C3j}\xaa\x0b\xf6\
+5\x9c\x18Alii\x89\x95\x95\x15\xf6\x8f\xed\xc7\xb2\
+\x22D,\x8bh4V\x5ca\xac\xfd\xa3v%6\xef\
+\x1f\xe8\xf1#n\xbe\xe4\xce\x8f<V\x7f\x1e!\x16\x8b\
+2<4D\xc4\x8a\xa0\x94p\xe1\xc2\x05\x0e\x1f9\xec\
+]\xd5\xf3\x14\xf0\xaf@\x96\xb6\x83\xf1\xfbI\xe8\x00\x00\
+\x0e\x08\x0e>p?\x1a\xa6\x05\xc9Q\x1c\x1e.,,\
+\x90\xcf\xaf3:6\x86a\x18D\xa2Q,\xcbtf\
+\x0f\x8b\xfb\xf1\x07\x1d\xfb\x075\xfb\xf5I\xa1\x0b\x1a\xe7\
+!\x8e\xa1\xa1!b\xf18J\x09\xd7\xaf_grj\
+\x92\xf9\xf9y\x97\xf4\xbd\x8bC\xfa.\xbbu\x0c\x83\x84\
+\x12\x00\xe0N!\x8fk\xe0}\x9c\x1d/\xbe\x0c\xa8\xf9\
+\xf9y,\xd3b\xcf\x9e\xbd\xa8\xe2\xf0P\xc43<l\
+\x08\x80M\xe4\xd5q!\xe0\xec\x10:88HGG\
+gq\xb5\xf3\x0aG\x8f\x1c\xe5\x93\xf3\x9f\xb8\xca\xbf\x84\
+3\xdc{\xaf\x1d\xabz\xb6\x22\xa1\x05\x00\x94b\x04y\
+\x9c\x89\xa3Q\xe0s\xb6m3;;\xcb\x8e\xceNF\
+Fv\xe2\xae+,\x14\x0a\xce\xeaY?\xf3\xed\x13\x9b\
+\xf7\x0d\xf8\xd4\x0b\x10U\x07~JCLE__\x1f\
+=\xc5I\xac\xf5\xf5\x1c\xc7\x8f\x1f\xe7\xfd\xf7\xdfw?\
+\x7f\x0b\xf8\x9e\xa1\xe4i\xdbn\xcf\xaa\x9e\xadH\xa8\x01\
+\x00\xf0\xc0\xc1\x09D\x91\xc1\x99B\xfe5\x11\x19\xcb\xe7\
+\xf3\x5c\xb9z\x95\xc1\xc1A\xfa\xfb\xfb\x01g\x0a9\x97\
+[/\x85W\x83\x8e\xef\x83\xf4\xf6\x8d\xc1\xa4\xf2kw\
+w\x17\xfd\xfd\x03(q\x18\xff\xcb?\x7f\x85W^y\
+\xc5e\xfcY\xe0?j\xad\xff\xc6\x06}'f\xf7\x9a\
+\x95\xd0\x03`ff\x9a\x89C\x07\x01\xb9\x8d\xe3\x0e\x1e\
+\x14\x91\xa1l6\xcb\xec\xdc,{v\xef\xa1\xab\xab\x0b\
+QB2\x91$\x93\xc9\x90\xcbV\x0e\x0f7\x0c\xfbj\
+\xe6U_S&~\xd5\x80\x00\xe8\xe8\xe8`hh\x10\
+\xa3\xf8\x8b`\xef\xbf\xff\x1e\xc7\x9f9N\xce\x99\xbd\xb4\
+\x81\xbf\x02\xfd\x9fD$w\xa7c\xfcA%\xf4\x00\x00\
+\x98>}\x86\xf1\x89qD\xb8\x8e\xb3D\xfa\xeb\x22\xd2\
+\x95J\xa5X\xb8q\x9d\xd1\xb1\xb1\xe2\xee\x19\xce.^\
+\xab\xe9\xf2\xeca\xe3\x98~=\x13\xefo-\x00b\xb1\
+8\xc3#\xc3D,'\xc6\x7f\xfe\xfc'\x1c=v\x94\
+\x95\x95\x15\xf7\xbeG\x81\x7f\x0dr;,\x8c\xdfO\xee\
+\x0a\x00@\x89\x0f\xa0\x85\x8b\xe2L#\x7f]D\xe2K\
+K\xcb,//\xb3\x7f\xff~\xa2\x91(\x96e\x11\x8b\
+\xc5J\x0f\xa0n\x0d\x00>#\x08\xc0\x8aX\x0c\x8f\x0c\
+\x13\x8f\xc5Q\xa2\x98\xbf6\xcf\xe4\xd4$\xd7\xae]s\
+I\xdf[\xc0?\x03\xae\x88msz\xfa\xce\xc7\xf8\x83\
+\xca]\x03\x00(\x82`b\x1c\xad\xf5\x8c\x88dq\x1e\
+E\xb7n\xdc\xb8A6\x9be\xff\xd8~gxX|\
+\x005\x95N9+\x8c\xbdA\x1e\xbf\xd9\xc2j\xff\x0f\
+\xfe\xc1!\x9c\x07M\x87\x86\x86\xe8\xec\xecDDq{\
+\xe56G\x8f\x1c\xe1\xc2\xa7\x17\x5c\xe5\x9f\xc7a\xfc\x1f\
+\xda\xa2\x99\xdc\xa6\x18\x7fP\xb9\xab\x00\x00%\x10h\x0d\
+\xef\x8b\x90\x04\xfe.\xc5\xe1\xa1a(\xf6\xed\xdb\x87\x88\
+\x10\x8b\xc5PJy\x86\x87P\xf6\xf3\xd4$u\x95\x00\
+(\x9f\x83\xf3\xe8Y\x7f\xff@q\xaf\x1e!\x9b\xcdq\
+\xfc\xe9\xa7\xf9\xe0\xc3\x0f\xdc\xfb\xde\x04\xbe\x8b\xc8\x09\xd0\
+\x84!\xd2\xd7H\xee:\x00@\xc9\x1d\x14\xd0\xbc\x8d\xb0\
+\x07\xf85\xdb\xb6\xb9:;KGg\x07;w\xed\x04\
+\x81x\x22\x8e\xb65\xab\xab\xce\x03\xa8\x1b\xe7\xed\x1b\x0d\
+\xf1\xbc1\x01\xe8\xe9\xe9e``\xc0\xd9\xa8\xc9.\xf0\
+\xf2\xcb/\xf3\xf3W\x7f\xee2\xfe5\xe0\xcf\xb4\xcd\xff\
+\x11\xd0Aw\xe9\xdan\xb9+\x01\x000~\xe8\x01\x8a\
+n\xe0$\xf09\x119\x90\xcf\xe7\xb9r\xe5\x0a\x03\x03\
+\x03\x0c\x0c\x0c\x02\xce\x0f9\xe4\xd7\xf3d2k\x04\x8d\
+\x0eV_\x03Bgg\x07\xc3#C\xa5\x8d\x9a\xde{\
+\xef=\x9ey\xf6\x19\xefFM\x7f\xa9\xd1\xff\x05\x91\xf5\
+0\x0e\xf7j\xc9]\x0b\x00w\xce@DVp\xc2\xac\
+_\x15\x91\x91\x5c.\xc7\xec\xec,\xbbw\xef\xa6\xbb\xbb\
+\x07A\x91L&\xc8d\xb3dsY\xff\xd9\xc3\xea\xd7\
+\xaak\xe2\xf18##;\x1d\xc6/\x8as\xe7\xceU\
+o\xd44\x09\xfc\x1bAV\xc2:\xdc\xab%w-\x00\
+\xa0\xb4\x17\x01\x22,\x003\xc0o\x8bHw:\x9d\xe6\
+\xda\xb5k\x8c\x8d\x8e\x92Lv`\x18\x8aD\x22\xc1\xea\
+\xda\xaa\xb3?\x91\xaa3'P\x11\x08\x82\x88\x15ad\
+dg\xf1\xc9]\xc5\xdc\xdc,\x87\xa7\xa6\xbc\x1b5\xbd\
+\x86\xb3Q\xd3\x5c\x98\x87{\xb5\xe4\xae\x06\x00\xb8|\xe0\
+\x01\xc0\xb8\xe4\xecQ\xc47D$\xb1\xbc\xbc\xcc\xd2\xad\
+[\xec?\xb0\x9fh4\xe6l\xfb\x1a\x8b\x91J\xa7\xb1\
+\x9d\x95\xb85\x08\xa0\x0b\x040L\x83\x91\xe1\x11::\
+;Q\x08\xcb\xb7\x979|\xe4\x08\x9f^\xfc\xd4U\xfe\
+Y\x1c\xc6\x7f\xda\xd6\xceV\xbaw\x9b\xdc\xf5\x00\x00w\
+I\xd9A\xb4\xad\xcf\x88H\x1a\xf8\x07\x22b\xdd\xb8y\
+\x93L&\xc3\xfe\xfd\xfb\xb1L\x13+b\x11\x89DH\
+\xa7\xd3\xc5\xfdv\xeb\x0c\xff\x94bp`\x90\x9e\xde\x1e\
+D\x84l6\xcbSO?\xc5G\x1f}X\xbdQ\xd3\
+KZk\xa6\xee\x12\xd2W-\xbf\x12\x00\x80\xe2\xec\xe1\
+\xe7&4\xcej\xa28\xf0\x9b\x14\x87\x87\x22\xc2\xe8\xe8\
+hi7P\xc30\x8a \xa0\xa6\xf9\xef\xedu\x18\xbf\
+\x12E\xc1.\xf0\xd2\xcf~\xc6\xeb\xaf\xbf\xee~\xdd*\
+\xf0\xef\xb4\xd6\x7f\x0b\xe1\x9a\xddkV~e\x00\x00\x9e\
+\xe1\xa13{\xb8\x0b\xf8;\xee\xe2\xd2d2\xc9\xee\xdd\
+\xbb\x11\x9c\x1fz\xd2\xc0\xea\xaa\xbb\xc2\xb82\xd8\xb3\xa3\
+s\x07#\xc3\xc3\x18\xca\x00\x81w\xdfy\x97\xe7\x9e{\
+\xd6e\xfc\x05\xe0\xbf\x01\xffUD\x0a\xad\xd8\xa8i;\
+\xe5n\x04\x80\xf8\x1c\xca=\x9f>=#\xd3\xa7g2\
+\x9f\xbd\xff3\xef(\xa5&D\xe4\xbeB\xa1\xc0\x95+\
+\xbf\xa4\xaf\xaf\x9f\xa1!\xe7\x01\xd4D<A\xbeP \
+\x93Y\xc3\x1b\xe3w6\xb2\xda\x85eEP\x22||\
+\xf6,\xc7\x1e?\xc6\xea\xaa\xb3Q\x93\xd6\xfa\xd1|>\
+\xff'\x87'\x8f\xa6\xa7O\xcf\xf8\x95\xe5\xae\x920\x01\
+\xa0\x96RU\xf10|\xce\x0d\x9ft\x030\xcf\xcc|\
+\x9c\x1a\x1d\xdb\xf7\x0b\xcb\xb2\xbe\xe2\x0e\x0f\xaf^\xbd\xca\
+\xae];K~=\x99H\x90\xcb\xe5\xc8fs\x88@\
+$\x12e\xd7\xce]\x0e\xe3W\xc2\xd5\xd9Y\x0e\x1f\x9e\
+\xe2\xc6\x8d\x1b(\xa5\xd0Z\xbf\x92N\xa5\xbf\xf7\xe4\xe3\
+O/\xe0\xfc\xd8\x86\xf7\xbb\xab\xcb[\x01L\x9f:\x86\
+B\xee4\x00j)\xd8h\xe2\xd5{\xf8\xa5\x95@p\
+\xee\xec'7\xf6\x8d\xee\xfd\xd8\xb2\xac\xaf\xb9\xc3\xc3\xf9\
+k\xd7\x18\x1b\x1b\xa5\xa3\xa3\xb8\xc28\x91`mm\x0d\
+\xadmv\xee\x1c)\xc6\xf8\x85\xa5\xa5%\x8e\x1c9\xc2\
+\xa5K\x97\x5c\xe5\x7f\xbc\xb2\x92\xfa\xee3\xc7\x9f;\x07\
+X5\xca\x10\xa4\x0e\xca\xa7\x0d\xbc\x00\xb9\xa3\xd2N\x00\
+\xd4\xea\xc9\xd5J\xab\xd5\xa3\x8d\x80\xd7\xd6;\xccO\xce\
+\x9d\xbf::\xbao\xd6\xb2\xac\xaf)\xa5\x12\xb7o\xdf\
+fqq\x91\x03\x07\x0e\x10\x8b\xc51\x0dgg\x92D\
+<AW\x97\xb3\xb1u&\x93\xe1\xc9\xa7\x9e\xe4\xd4\xe9\
+S\xae\xf2\xaf\xa7S\xe9?~\xe6\xf8so\xb05\xe5\
+\xfbY1?\x0b\xe2g5B\x0f\x00\xaf\xc2k\x99\xea\
+F\xef7\xdb\xa0\xb5\xeem\x02\xc6\xc5\x8b\x97.\xec\x1b\
+\xdd\xbbjY\xd6W\xdd\xd9\xc3\xb5\xb5U\x0e\x1c8\x80\
+iZ\xa5)dA\xb0\xed\x02/\xbe\xf4\x22o\xbc\xf1\
+\x86[\xaf\xd5\xb5\xb5\xb5\x1f>s\xfc\xb9\xc7\xb5\xd6&\
+\xf5\x01\xb9\x19\xe5\xfb\x01!\x08(\xb6\x1d\x00\xb5\x14n\
+P\xbb\xb7o\x16\x10\x8dz\xbc\xaa\x93n\xda\xb6\xad\xae\
+_[\x98\xd9\xb5kg\xd4\xb4\xcc/\x8a\x88\x9a\x9f\x9f\
+G\xa3\x19+\x0e\x0f]9\xf9\xf6I\x9e?Q\xde\xa8\
+)\x93\xc9\xfc\xd5+/\xbf\xfa\xbf2\x99\x8c\x14\x01\xd5\
+\xc8b\xd5Rz#\x05\xd7z\xefU~-\xd7q\xc7\
+\x00\xe0\xa7t\xbf\xc3O\x11\xf5\xcc\x7f3\x16aS\xbc\
+ \x9b\xcd\xb2\xb2\x92\xfahhxp\xd04\xcd\x09\xad\
+5\xb3\xb3\xb3\xc4\x13q\xf6\xec\xd9\x83\xa1\x0cf\xce\xcc\
+\xf0\xc4\x13O\x94\xb6f\xcd\xe5rG\xde}\xfb\xbd\x1f\
+\xddX\xb8\xb1\xbeE\xe5\x07\xed\xe5\xf5\x14^/\x7f\xd3\
+`\x08\x0a\x80 J\x0f\x02\x88 @\x09\xf2\xbe\x11\x18\
+|\xcfS+\xa9|>\x9f\xff\xa8\x7f\xa0\xff>\xc30\
+F\x9d\xe1\xe1\x15\xfa\xfazY__\xe7\xc8\x91#,\
+.\xdeDD\xb1\xbe\x9e\x7f}fz\xe6\x87\x17?\xbd\
+\xb4T\xa5\xfcf\xfdz\x10\x85\xd7Rj#\x85\xd7;\
+\x02+\xb6Q~\xadc\xb3\x05\xab.d3y48\
+\xf7{\xad>\xb7'\x0e\x8d\x8f}\xf6\xfe\xcf\xfc\x85i\
+\x9a\x87\xb4\xd6tww\x13\x8b\xc5p\xa3\x86\x85B\xe1\
+\xdc\x85\xf3\x9f~\xff\x17\xef\x7fp\x86\xf2\x03\xb4\xba\xce\
+k\xf5y\x90\xf7\xf5\x8e\xa0\xd7\xdaM\xdes\x83\xd4\xb2\
+\x00\xf5z|P\x94\xd7\xfa\xac\x04\xbcO\x10\xd3\x1e\x84\
+4n\x18\x19,\x5c_XN&\x93\x17vt\xed\xf8\
+\x92R\xaa+\x93\xc9\x90J\xa5\x10\x11l\xdb^\x98\xbd\
+:\xf7\xe7\xef\xbc\xfd\xee\x87\x94\x19\x7f#R\xb7\x19\xb3\
+\xde\x8e\x83\x06y\x81\x00\xd0\xc8\xdc\x07u\x07[\x01\xca\
+f\x00\xd1\x0c\x18\xcc\xb9\xd9\xb9\xeb\xdd=\xdd\xd7::\
+:~C)\x15/F\xf9\xd27\x16n\xfc\xf7\xd7^\
+}\xfd%*\x03=A\x94\xde\x8c\xafn\x95R\xb7\xa4\
+\xfcj\x00\xd4\xf39\xf5*\xb6]@\x09j\x1dj\x82\
+\xe0\xea\x95\xabW\xfa\x07\xfaS\x89D\xfc\xf3\x80\xbdt\
+k\xe9'\xaf\xbd\xfa\xc6\x91B\xa1\x10D\xe9~\xf5o\
+\xb5R\x9bQl\xd0\xbc\x0d\x19\xd5\x00h\xc6\xd77s\
+}\xa3\x06\x0a\xd2\x80A\x1b\x99\x1a\xef\xab_\xb5\x15\xb1\
+\x8c\x83\x07\xef?h\x98F\xe4\xec\x99s\xa7VWW\
+s\xc5\xfcf\xfdv3\x87\xdd\xc2\xbc\xad\x5c_\x13a\
+A\x15\xdb\x0a\x00\xb4\x02t\x9b1\xab%\x10x\x1a\xc5\
+K\xf8\xee\x84R\x9bIoF\xf9\x81\xaf\xad\xfe\xf5\xf0\
+z\xe6\x03\x9f\xf4\xa0\xd7\x051I\xcd\x98\xb6V\x00\xc9\
+=\xea\xf5\xf4z\x0d\xdc\xa8=\xf0\xdcW|\xd2\xaa?\
+\xa3}\xee\xe5\x97\xb6\xd5\xcfW\x8c\x08\x14\xad\x93;\xf3\
+\x13`\xcd\x97I7\xc8\xf7+{\xa3\xcfm\xa5M\x82\
+\xa6\xdd\x91\xef1k\x5c\xd0\x08mnz+\x91]]\
+\xb8Z\xe9\xe0\xf4@\xe5\x93V\xaf\x97W[\x8fZ\x8d\
+\xd3\xac\xef\xafg\xfa\xa9\x91F\x8d\xb4f\xd3k\x015\
+0\xc8L\x9fL\xc1_\x19\xcd \xb7\x99t\xaf\xe2T\
+\x8d\xf4zJ\x0dJ\x08\xfd^k\x95\xafQ\x90\xa7\x1d\
+\x04\xb0\x99\xa0N\xa3r\x114\xcdk\x01j\x99CW\
+\x19\xaaF\xbaP\xbf76\xa3T\x08\xa6\xd4z\xd7\xc2\
+\xe6\x94_]\xf7z\x16\xa1\x11 \xbc\xf9\x9bQl\xa3\
+\xcflv\x14\xb1\xc1\x8a\xf8\xb9\x80 JmF\xb1\xcd\
+(\xb5Q\xaf&@Z#\xa5\xd7\x03@P\x10\xd4:\
+o\x06$[\x01\xc0V\xc1R\x92j\x00x+\xdb\xaa\
+\xde\x1a\xd4To\xb5\x97\x07\xed\xf1\xcd\x00\xa0\x16\x08\xea\
+\x01\xa0\x1d\x80h\x15X6X\xf7F\x8d\xb1\xd5\xf1v\
+\xab\x94\x0e\x8d\x01PK\xe9\xcd\xf4\xfez\x00\x08\x0a\x82\
+ \x80h\x17\x18\x02+\xbe\x99\x06\xf1S\xc8Vz\xef\
+f\x94\xde\xe8\xdc\xef\xd5\xaf~A\xeb\xdb\xc8\x0aT\xa7\
+m\xc5:\xf8\xa5\xb5J\xe15\x15\xdfl\x83T\x7ff\
+\xab\x8a'@\x1a\xd4V\xf4f{\xfcV\x01\xe0=o\
+\x16\x0c\xed\x00\x04u\xd2\x03\xc9f\x00P\xfd\xf9 J\
+'@\x1alN\xf9\x10\xac\xf77S_\xdd \xad\x16\
+/p\xcf[\xe5*\x82\x00\xa2Vy\x03\xc9V\x01\xe0\
+w\xaf\xa0\x0a\xdf\x8cioF\xe9\x9b\xed\xfd\xae\x04\xb1\
+\x02\xde\xf3 \xaf\xad\xe4\x0e-\x91V\x02\xa0\xde\xfd[\
+\xe5\xd7[\xe1\xef\x9b\x1d\x05\xd4Jo\x05\x08\xfc\xd24\
+\xf5-LK\xa5\xdd\x00h\xf4\x9d[Q~\xad\xb4z\
+\xf5\xda\x8a\x0b\xa8N\xdf\x8aEh\xe4B\xee\x98l\x07\
+\x00\x9a)\xcff\xfd\xfdV\x00\xa0\x9b\xc8k\x86\x1c\x06\
+\xfd\x8e;*a\x03\xc0V\xcb\xbdU\xbf\xef'\x8d\x08\
+a\x90\xf4\xd0\xca\xff\x03\xc7\x95Sjsz~\xc8\x00\
+\x00\x00.zTXtcreate-da\
+te\x00\x00x\xda3204\xd454\xd252\
+\x0c14\xb026\xb524\xd06\xb0\xb020\x00\
+\x00@\xd6\x05\x04#7\xdf0\x00\x00\x00.zTX\
+tmodify-date\x00\x00x\xda\
+3204\xd454\xd252\x0c14\xb522\
+\xb225\xd66\xb0\xb020\x00\x00A#\x05\x0c\xdd\
+\x06(\xbc\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\xf1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\xa6IDATH\x89\xe5\x95?K\
+\x03A\x10\xc5\x7fQS\x88\xc6\xc62\xa6\x10\x8c\x90\x10\
+\x226\xd1\xc6\xc2o\x10\x9bX\xa6\xb7\x10?\x85\xe9\x8d\
+\x08\xa2\x88m\x10\xd3\x88((H\x10L\xe9\x07\xb0\xb0\
+\xd3F\xc5\x04\x13\x94\xa8g\xb1/\xe4r\x97?\x1bK\
+\x1d\x18\xf6\xf6\xdd\x9b\xd9\x9b\xb7\xbbs\xf0_l\x03p\
+<\xben\x138d\xb9\xc0\xbc%\xf6+\x8b\x03\xf7\x98\
+\xaf^\x90;\xc2\xe2\x83&\x0b\x00%\xa0\x08d\x80m\
+\xe0[\x09\x1b\xc0\xa8\xbc!\xecK\x9c\x8cbJ\xf4Q\
+%\x8b_\xebw`\x0b\x88\xb9x1 \xafw^~\
+\xb6[\xf2q\xe0A\xa4=\xa0\x0c\xdc\x01\xc9\x1e\x1f\x94\
+\x14\xa7\xac\x18G9B\x9d\xc8\x9b.BP\xd8\xb0\xc6\
+Y\x8c\x04U\xf91\x10\xd5\xbb\xa6$A\xe0Q9r\
+\x9d\x16X\x01j\x22\x9c\xa9\xa2f\xf2\x17\xfcR<\x01\
+aW\xf5\xe7\xc2k@\xba[\xc9)\xa0.bBX\
+Q\xf3\x13%\x9c\x02N\x85\x15\xc4Ih^W\x8e\x9e\
+\xf6&\xf2\x98\xe6U\xcd\xc3.ND\xd8\xab\xab\x02G\
+\xb1mfs\xd1\x1c\x8d\x01\x0b\xae\xcf\xbc\x0b\xa4\x5c\xd8\
+\xb4\xc6K\x8d\xbb\x18y\x22z\x06\xb8\xf0p\x87\xe8!\
+Q\x9a\xce\x9b\x1c\xc5l\xa8w\x93\x9f\x81\x19q\xac6\
+9\x87\xff\x986\xab\x09c6\xb4\x22?r%\xb7>\
+\xa6!\x06\xbfhs\xe2\xdc\x00\xfb\xf4\xb9h\xd0\xbdU\
+\xe4io\x15qL\x0f\xfa\xe8\xc0ok\x15\xde\x93\x11\
+\x00\xae0\xfa\x16\x80%`\x0d#\xc3'0!N\x05\
+\x18\xc14\xc2\x1d\xe0\x1aX\x05&\x81eZ'\xcf\xca\
+b\xb4\xb7\xebEZ\xed:\xd6#n ;\xc4/\xc5\
+\x81M\xa0\xed\x1f\xed\xd6\x12\xfb\x83\xf6\x03\xd9B\x91\xed\
+\xb5\xb0\x99\xa2\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x07\xa2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
+\x00\x00\x01\x9ePLTE\x00\x00\x00DD@DD\
+@DD@DD@DD@DD@DD@\
+DD@DD@DD@DD@DD@D\
+D@DD@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x02\x02\x00\
+\x00\x00\x00\x00\x00\x07\x07\x06==9\x00\x00\x00\x06\x06\
+\x06<<8\x00\x00\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x04\x04\x00\x00\
+\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x0b\x0b\x0a\x00\x00\x00\
+''%\x00\x00\x00\x1d\x1d\x1b\x05\x05\x05996\x06\
+\x06\x06\x00\x00\x00\x00\x00\x00\x10\x10\x0f\x09\x09\x09\x00\x00\
+\x00\x06\x06\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x05\x04\
+\x00\x00\x00\x00\x00\x00\x04\x04\x04\x00\x00\x00\x00\x00\x00\x0f\
+\x0f\x0e\x06\x06\x06\x04\x04\x04\x11\x11\x10\x07\x07\x06\x04\x04\
+\x04\x01\x01\x01\x15\x15\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x06\x06\x00\x00\x00\x00\
+\x00\x00\x1e\x1e\x1c\x05\x05\x05\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x01\x01\x01\x00\x00\x00\x01\x01\x01\x1d\x1d\x1c\
+\x00\x00\x00\x01\x01\x01\x04\x04\x03\x04\x04\x04\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x01\x01\x01\x00\x00\x00\x06\x06\x05\x1d\x1d\x1b\
+\x00\x00\x00\x04\x04\x04\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x02\x02\x07\x07\x06\x00\x00\x00\x07\x07\
+\x06\x02\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\
+\x04\x04\x03\x04\x04\x04\x92\xa3\xeb\xaf\x00\x00\x00\x86tR\
+NS\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0e\
+\x0f\x04Q\xa1\xd5\xf7\xfb\xe2\xaf_\x08N\xdd\xe6Z\x01\
+\x8e\x9c\x11\x91\xa7\x10U\xa2\x02\x07\xe4\x5c\xad\xe1\xfa\x14\
+\x0bM\xd7\xd4\x0f\xd7\x93\xa8W\x03\x1b\xf9\x05\xad\x12\xad\
+\x95W\x09e\xd9\xb2\x97\xd8\x96\xe2/\xfe\xfa\x98\xc0\x0a\
+\x9e\xfe;\x9b\xd9\xf8\x07\xa0\x15\xae\xd2\xfc\xbf\x17\x13\xd1\
+#\xd5R\xeb\xb4\xf5\xb1\xe9\xd0 \xe5\xfc\xfc\xfc\xfd\x16\
+\xd4\xd3\xc2\x9c\xab\x9a\xbb\x17\xb5$\xb2\xf9\xde\xac\xaaY\
+\x06V\x99\x8f\x98TZ\xdf\xf8\x82\xe7\x10\x00\x00\x05-\
+IDATx\xda\xed\x9b\xe9C\xd4F\x18\xc6\x93\xec\
+fI6\xc9r\x14\xaaV\xb1\x1e\x15\x11X\x10-(\
+^\xadZ\xafz\xf5\xb0\xdb\xddR\xe8\x81\xad\x15\xec\xe5\
+-\x22\xd6+\xb0\xffu\x97$s,\x9b\x99Lf&\
+\x13>\x98O\xf0\xcc\xf0>\xefd\xc3;\xbf\xcc\xech\
+\xdaV\xbbt\xc30\xf4\x1c4p\x156\xae\x1c4\x90\
+Z\xd14\xcd\xa2\xae\x5c\x83mf\xa9T2u\xe5\x1a\
+l\xeb\xb2,\xabKW\xae\xc16\xcb\xb6mKW\xae\
+\x81\xcb(;\x8eS6\x94k\xb0\xcdq]\xd71\x94\
+k\xa8\xcd\xf3<wS\x7f7{\x0d~6e\xd7\xab\
+xQ[wOo\xdf\x07\xbe\xbf\xb6\xdel6\xd7\xd7\
+|\xfcj\xd7\xfa\x07>\xdc\xb6]3\xbcJ\x05\xfe-\
+\xf0b\xd44\x1d<\x1bN+\xbb\xa8m\xc7G1^\
+>I\xdb\xb9K\xc0_/\x18\xd1\xff\x86\xdd\xfat\xc2\
+\x9f\x07w\xfbi\xfc[\xda\xc7{\xb8\xfd\x8ba\x02\xba\
+i\xd9\x0ex6\xf6\xa6\xf5o6\xf7\xed\xe7\xf47\xcd\
+0\x81b\xc9\xb2\xc1\xff\xc6'\xe9\xfd\x9b\xeb\x07\x86\xb8\
+\xfc\xbbJfa\xe3\x19(\x98%\xcb\x8a\xda\x0e\x0es\
+\xf8\xaf\xf9\xbdC\xe9\xfd\x0d\xcbj%\x10<\x08f\x09\
+\xd6\xc6C\x5c\xfe>\x96\x01\xb3\x7f\xd9\xb6J\xc5\xe0\xa7\
+\x82\x89\xe6\x86\x11>\x7f\x94\x01\xb3\xbf\xe3\xd8V\xe8k\
+\x14\xb0\xb9q\x94\xd3\x1fd\xc0\xec\xdf\xaa\x88vt\xdf\
+\x8d\x0267\x8c\xf1\xfa\x87\x19\xb0\xd7$\xcfu\xc0\x9c\
+\xd465\xa1\xb8#Ur\x8c\xf1\x89\xc3a\xbfI<\
+\xa7\xde\xa1\x145\xd1s\xcb\xb1s\x22\x1aW\x95\x1a\xe3\
+\xc8\xd1\xa0\xdf\xa7S\xf8=9\xb0\x9f\xbd&z\x849\
+\x09\xdd\xd7\x84\x18\xd3A\xbf\xbecS\xf8g\xb2\x8f\xbd\
+&\x12\xe6$\x03}\xae\x091\x8e\x07\xfdf4\x94\x81\
+HMDm\xe8\xb9J\x8a\x01\xee\x13\xc8@\xa4&b\
+m\xe8\xb9N\x8a\x01\xefS\x98\x81HM\xec\x1c\x17J\
+\x80\x1c\x03\xdd\xa7\x8d\x0cDjb\xcc\xb8`\x02\x94\x18\
+X\xafcS\x225\x11\xd5&4.\x10\x9a\x16\x03\xbf\
+O'N\xf2\xd7D\x8c\x09\xd1\xb8\xa2\xd0\xd4\x18m\xf7\
+\xe9\xd4i\xbc&\x9e\xe1\xf0\x07L\x88'@\x8f\x11\xf6\
+\x1a\x8f\xb4S'\xf1\x9a\xf8\x19?\x13b\x09$\xc4\x08\
+{M\x00\xed\x04^\x13\x87?\xe7fB\x14$i\x0c\
+3A\xaf\xc3G\x80\xd6V\x13\xcfr3!\x8a\x914\
+\x86sa\xbf\xa3\xd3\xc7#\x0d\xaf\x89\xe7\xb9\x99\x10\xc5\
+H\x1a\xc3\x17\x9b\xe6\xe4\xb1\x0b\x17\xfb`M\xbc\xc4\xcd\
+\x84\xa8\xae'\x8d\xe1\xf2\x15\x0a'|\xc9\xcd\x84(F\
+\xe2\x18\xae\xd28\x85\x9b\x09Q\x8c\xc41l\xbfF\xe1\
+$n&L3\x86\xeb7n\x129\x8d\x9b\x09\xd3\x8c\
+\xc1\xab|\xf5\xf57\xdf\xc6s\xa2\x04&L;\xafC\
+Nd\xe1)\x16&L\xcf\x15\x11'\xb2\xf0\x94\x04&\
+$s\x22\x13O\x893!\x99\x13\x99xJ\x02\x13\x92\
+9\x91\x85\xa7$0!\x99\x13YxJ\x02\x13\x929\
+\xb1\x9d\xa7n}\xd7\x7f\xad\x96\x05\x13\x929\xb1\x8d\xa7\
+n}\xdf\xfa\xad^\xcb\x80\x09\xc9\x9c\x88\xf3T\xe0\x0f\
+3\x90\xca\x84dN\xc4y\xaa7\xfa=\xc8@.\x13\
+2i\x83\x0d\x1fe \x99\x09\xd9\xb4\x1f`\xbc\xfa\xac\
+d&d\xd3~\x9c\x83\xf3\xd4\xe4\xbc\x5c&d\xd4@\
+\x06\xad\x1a\xff\xd3\xbcT&d\xd5\xaasp\x9e\x9e\x9c\
+\x95\xc9\x84\xccZ\xb5\x0e\xe7\xf8zM&\x132k\xd5\
+:\x9cc\xb1\x0c\xc4\x99\x90]\x9b\x9d\x84s\x1c\xaa\x89\
+\x9cL\xf8\xf3/\xe9\xd6\xee:4P\x13y\x99P\xd4\
+\x1f\xd6D^&\x14\xf6\xf7\xfd_\x85\x98P\xdc\xdf_\
+\x10bBq\x7f\x7fA\x88\x09\xc5\xfd\xfd\xdbBL\xf8\
+\x9b\xb0\xff\xefw\x84\x98p\xe2\x8fF\xa3qwqi\
+ii\xf1n\x03\xbf\xa8\xda=f\x7fA&$h\x7f\
+\xf61\xfb\x0b2\xa1\x98\xbf\x04&\x8c\xf7\xff\x8b\xcd_\
+\x06\x13\x0a\xf8g\xc4\x84\x9aVK\xf0\xcf\x9a\x09k\x7f\
+S\xfd\xb3g\xc2\x7f\xe8\xfe\x993\xe1`?\xd5_:\
+\x13v\xf2\xd4\xbf4\x7f\xf9L\xd8\xc9S\xdd\xf7\x89\xfe\
+Y0a\x0cO\x05\x19\xc4\xfag\xc1\x84q<\xd5\xfd\
+`\xe1\xe1\x9dl\xd6\x09;5\xe5\xeb\x84\x9b\xb5\x5c\xd7\
+\x09S\xae\xb1e\xb1N\x98j\x8d-\x93uB/\xef\
+u\xc2\xca\xfbu\xc2-\xb9N\x98\xd9\xde1\xe3:a\
+v{\xc7l\xeb\x84\x19\xee\x1d\xb3\xad\x13f\xb8wL\
+\x7fwV\xb0wL\x7fwV\xb0wL\x7fwV\xb0\
+wL\x7fw\x96\xb0w<\x9f\xde\xffQ:\x9eJ`\
+\xc2\xc7OR\xfb?M\xc7S\xb1L8&\xfc\xfe\x1f\
+h\xcf\xb8\xf7\x8eG\xa5\xf8\xaf/s\xef\x1d?\x97\xe2\
+\xbf\xb6\xc2\xcd\x84\x87\xa4\xf8\xfb/\xb8\x99\xf0\xe0\xb0\x0c\
+\xff\xd1Un&\xd4^J\xf0\xf7{\xf8\xbfOhx\
+\xff\x89\xfb\xbf\x12\xf8>\xa1W\xd9\xf3Z\xd8\x7fP\xe8\
+\xfbt\x15\xef\xcd\x80\xd0\xe7\xdf\xa3\x09\xfa\x1b\xda\xea\xdb\
+\xfb\xeff\xb8\xea\xcf\xf2\xca\x8bUq\x7f\xd5\xda\x96\xf1\
+ws\xf6\x0f\x9907\xff\xb63&*\xfd\xe3\xce\x98\
+(\xf4\x8f;c\xa2\xd4?\xee\x8c\x89J\xff\xb83&\
+*\xfd\xe3\x98PeM\x88eB\x85\xfe\xf1L\xa8\xce\
+\x9f\xc0\x84\xca\xfcIL\xa8\xa99c\xd7\xd2\x08L\xa8\
+\xf0\xdcayk\x9e\xbb\xcc\xfb\xdci\xee\xe7n\xf3>\
+w\x9c\xf3\xb9\xeb\xbc\xcf\x9d\xe7t\xee\xfe\x7f\xd0\xf6\xb8\
+\xeb\xd0H\x036\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x1e8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+ cHRM\x00\x00z&\x00\x00\x80\x84\x00\x00\xfa\
+\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\x00\x00:\
+\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x06bKG\
+D\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09p\
+HYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\xa8d\
+\x00\x00\x00\x09vpAg\x00\x00\x00\x80\x00\x00\x00\x80\
+\x000\xe11\x9a\x00\x00\x1d\x06IDATx\xda\xed\
+\x9dy\x94\x1c\xd7u\xde\x7f\xaf\xba{\xa6g\x050;\
+\x88\x99\xc1\x0chB\x22\x01\x8a\x9b\x18q\x17\x09B\x14\
+AP$\xb1\x11\xb6\x8f}\x9c\x9c\xe4\xf8\xe4\xd8\x92\xbc\
+Hq,[\x96e\xc7\x89\x12\xe9(\xb6\x14[\xb6,\
++Z\x13\x1f\x12\xa0E-\x91\xa8\xcd\x04\x06\x1b\xb1\x11\
+\xdc\x00\x10$\xb1pv\xcc\x82\xd9\xbb\xa7\xbb\xab\xea\xe6\
+\x8f\xea\xea\xae\xee\xae\xde{0\x83\x06.PSU\xf7\
+UUW\xd5\xf7\xbd\xfb\xee}[)\xcaLv\xec\xdc\
+\x86\x80O\xc1{\x81\x80 \xe7\x14\xc8\xaeg\xfee\xb1\
+omI\x8a\xb6\xd87PJ\xd9\xfa\xab[\x01P\xb0\
+\x05\xf81\xf0C\x85zZ\x04\xcf\xf6\x9d\xdb\x16\xfb\xf6\
+\x96\xa4\x94\x15\x014QDLS\x01\x9b\x80v\xe0F\
+\xe0+J\xa9\xdfUP\xb9\xe3\x1a\x09R\xa4\xac\x08\xa0\
+\x00\xaf\xd2\x14P\xe9P7\x00\x9f\x03\xfeL\xa0\xee\x9a\
+%H\x94\xb2\x22\x80HlS\xc5u\x02P\x0d\xfc\x91\
+\x82/*h\xd9\xb1s\x1b\xdb\x9e\xde\xba\xd8\xb7\xbb$\
+\xa4\xac\x08\xa0\x94\x80\x12e?\x97\xa6i444\xa0\
+\x94\x02\xf0\x01\xff\x01\xf8G\xa0[S\x8a\xa7w\x5c#\
+AY\x11@P`Y\x01\x05\x16\x01\x1ezp\x03\xb7\
+\xdf~\x07J)DD\x01O\x02\xdf\x06n\x15M\xb1\
+\xe3\xe9\xab\xbbH(+\x02(\x01P1\x0b\x00PW\
+W\xc7\xe6M\x9b\xb9\xef\xde\xfb\xf0\xf9|v\x91p\x1f\
+\xf0]`\xc3\xaeg5\xb6_\xc5$(+\x02\x88\x22\
+\xc6\x02Ka\xf9\x00\x95~?\x1b6ld\xe3\xc3\x1f\
+\xc2\xef\xaf\xb2I\xb0\x0e\xf8\xe6\x8e\x9d\xe6\xd3(\xb4\xab\
+\xd59,+\x02\xd8\xf6\xdf~.\xb1\x18\x80\x88\x89\xc7\
+\xe3\xe1\x9e\xbb\xef\xe1\xf1\xcd\x8fS__o\x93\xa0\x03\
+\xf8\x8a\x82\xdfQPq5\x86\x89eF\x00\x15u\x04\
+\x1cQ\x80\xf3\x8fR\xdcz\xebmlyj+\xcdM\
+\xcd\x98\xa6\x09\xd0\x08\xfc\x0f\xe0\xd3\x02\xb5W\x1b\x09\xca\
+\x8b\x00q\xeb\xaf\xa5\xa8\xa3\x7fD\x84\x1bnX\xcb\xb6\
+m;\xe8\xec\xe8t\x86\x89\x7f\xac\xe0\x8b@\xf3\xd5\x14\
+&\x96\x17\x01\x80\xa8'\x90\xf2\x5c\x02\xcc\x07\xe71M\
+\x03\x11\x93\x8e\x8ev\xb6m\xdb\xc1\xda\xb5\xef\xb1I`\
+\x87\x89_\x05\xba4\xa5\xd8\xbam\xcbb?\xcc\x82K\
+y\x11@\x89m\xfccE\x80U;d-\x93S\x93\
+\x8c\x8d\x8eb\x18\x06\xa6i\xd2\xd4\xd4\xc4\x96\xa7\xb6p\
+\xdbm\xb7\xd9a\xa2\x86\xd5\x8e\xf0-\xe0\x16\x8fWc\
+{\x99[\x82\xf2\x22\x00\x0a$1\x0c\x8c\x99\x7f\x01\x11\
+\x93\x89\xc9\x09FF.\xa2GtDL+L|\xec\
+q\xee\xb9\xe7^\xbc^\xafm\x0d\x1e\x00\xbe\x03<\xe8\
+\xad\xf7\xb3\xa3\x8cIP^\x04p\xa9\x0a\xb6\xd5\x12\xdb\
+\x16\xa6g\xa6\x19\xba8D(\x14BL\xc1_\xe9g\
+\xe3\x86\x8dl|x#~\xbf\xdf&\xc1\xcd\xc0\xb7\x8c\
+\x99\xd0vS\xa1m\xdfY\x9e$(+\x02$W\x05\
+\xc7\xc5\x82\xdfQ\x1a\x10\x98\x9bchx\x88@0\x88\
+)\x82\xc7\xeb\xe5\x9e\xbb\xefe\xf3c\x9b\xa9\xab\xab\xb3\
+I\xd0\x09\xfc\x83\x86\xfa\x8fJTY\x86\x89eE\x80\
+\xb8\x01H\xf6\x01\xecTI\xf87?\x1fdxx\x90\
+\xd9\xd9\x19\x0bp\xa5\xb8\xf5\xd6\xdby\xea\xc9-45\
+59\xc3\xc4\xcf\xa3\xf8\x13\xca0L,+\x02D}\
+\x80\x84\xe7\x12\x1c9?\xa6\x88\xef\x87#a.^\x1c\
+fjj\x22Zi$\xac]\xfb\x1e\xb6n\xd9NG\
+G\x87m\x09j\x80?\x01\xbe\x00\xd2TN$(/\
+\x02\xc4\x1b\x82\x94[\x92D\xab\x86E$ZKh%\
+\xe8\xba\xce\xc8\xc8\x08\xe3\x97\xc6\x11\xd3D\xc4\xa4\xb3\xa3\
+\x83\xad[\xb6q\xc3\x0d78\xc3\xc4\xdf\x06\xf5\x0f\xc0\
+\xea\x1d;\xb7\xb1\xa5\x0cZ\x13\xcb\x8b\x00\x96\x0f\xe0\xf2\
+\x5c\xf1lo\xff\xb3\xdb\x09$\xca\x1a\xd34\x19\x1f\x1f\
+cdt\x04C\xb7\xc2\xc4\xe6\xa6f\x9ezb\x0b\xb7\
+\xdcr\xab\xdd\xa4\xac\x01\xdb\xb0\xc2\xc4\xf7\xf9<\xea\x8a\
+oH*+\x02\xa8\xf8*\xb1C\x88\x1d\x06\x82#$\
+L\x22\x82\x08\xa6i299\xc1\xc5\x91a\x22z\x04\
+S\x84\xba\xfaz6?\xb6\x99\xbb\xee\xba\x1b\x8f\xc7c\
+[\x83\x0f\x02\xdf\x11\xe1\x83^\xdf\x95\xdd\x9aXV\x04\
+\x00\x85JS\x15l\x81\x9f\xe8\x04\x92\x5c$`\xedO\
+OO344H(4\x8f\x88\xe0\xf7\xfbyx\xc3\
+F6<\xb4\xc1\x19&\xbe\x0f\xf8\xa6\xa1\x9b[\x95\x12\
+\xedJ\xf5\x0b\xca\x8c\x00\x80\xab\x0f`\x9b\xff8\xe0N\
++\x90B\x06\x11\xe6\xe6\xe6\x18\x1a\x1a$\x18\x98CD\
+\xf0E\xc3\xc4M\x8fnr\x86\x89]\xc0WA\xfd\xb6\
+\x80\xefJ$\xc1\xd5A\x00I]b\xd0\xbb\x91!*\
+\xc1\xf9 \x83C\x83\xcc\xcc\xcc`\x8a\xa0\x94\xe2\xd6[\
+n\xe3\x89\x8f<Icc#\xa6\x98\x00M\xc0\x17\x14\
+|\x0a\xa8\xb9\xd2H\xe0-\xe4\xa4\x1dV\xadX%\xa8\
+6\xa0\x82\x84\x10<AT\xce\x17\xcd_\xdc\xae-X\
+![u\x5c!\x8e\xa8\xcf\x01\xb0`\x17\x17\x88J\xd4\
+\xc5\x8eQ\x10\x0e\x87\x19\x1a\x1e\xa2\xb9Ig\xf9\xb2\xe5\
+\xa0\x14k\xd7\xbe\x87\xaa\xaa*~\xf2\xc2\x8f\x19\x18\x18\
+@)U\x0b\xfc)\xd0\x0a|f\xc7\xcem\xe3\xbb\x9e\
+yn\x01\x1f}a_bF\x892\xbc\x12\xf8,\xf0\
+k\x14H\xa2b\xef#\x83hX]\xc1+<\x1e\x0f\
+O\xef\xd8\xc9\xda\xb5k1M\x93\xa1\xe1!&'.\
+E=z\x87\xcb\x18\xddpl\xa6^T\xd3hlh\
+\xa2\xa1\xa1\x11MS(\xa5\x18\x1d\x1d\xe5\x85\x9f\xfe\x84\
+w\xdey\xc7\x8e\x12L\xe09\xe0\x93@\xafn\x18|\
+o\xf7\xf3%|\xb4\xd2K\xa1\xe0u\x00\xbf\x815\xf8\
+\xa2\xa4\x22\x22\xc5_\xc4q-\xa5\x94\xa3\x12H\xe2\x15\
+\x83\xd1\x5c\x1f\xefA&86cb\xd3\xc24L\xc6\
+\xc6F\xd1u\x9d\xa6\xa6f\xbc\x1e\x0f\xcdM\xcd<\xf1\
+\x91'\xf9\xc5/~\xce\x1b'\xdf\xb0[\x13w`\x15\
+\x0b\x1f\xf7z<ol\xdf\xb9\x95\xddKxXZ\xa1\
+\x04\xa8\x88.(\xa5\xf0x<v\x0ep\x95ti\xc9\
+z{?Q\xafp\xee&\x1f\xa3\x94J\xbb]_W\
+Omm\x0d\xa6\x03\xf8\xc4\x22 \xda\x81\xc8&CT\
+\x9fP\x93l\x1f\x88E\xa8K\x13\xe3\xe8z\x84\x96\x96\
+V|\xbe\x0a\xea\xeb\xeb\xd9\xb4\xe91jjj8z\
+\xec(\xba\xae\xa3\x94z\x08\xab\xd3\xe9\xc7<\xca\xb3o\
+)\x93\xa0\x18\xf3-\x22BUU\x15\xf7\xdd{\x1f\xd5\
+55\xf1\x97\xa8\x94\xeb:fzU\x9a\xe3Ph\x9a\
+FEE\x05^\x8f\xc7\xd2'\x81k\xed\xaa\xd8\xb5l\
+]r\x9aR\x0a\x9f\xd7G\xa5\xbf\x12\xb1\x9c\xb5\xa8\xc3\
+\x173\x01\xd1ZcI$\x03\xc4\x08\x11{\x1eI\xd8\
+czz\x0a]\xd7ik]I\xa5\xbf\x92*\x7f\x15\
+\x1b\x1ez\x98\x9a\x9a\x1a\xf6\xed\xdfO(4\x8fR\xea\
+\x16\xe0[\xa6\x98\x9f\x10\xe1\xfb\xdbwn5\x97\x22\x09\
+\x8a.\xbf\xbd^/\xabV\xb5;;Z\x16-Ji\
+\xf8|^*|\x15h\x9aF\x1c2\x5c\xca\xe7\xcce\
+w\xcc\x03\x8c\x12)\xa1\x08\x88g\xee\x04K\x90\xa2\xc7\
+qNT\xe6\xe6f\x19\x18\xec\xa7\xb5u%\xd5\xd5\xd5\
+x}^\xee\xbe\xfb\x1e\xaakj\xf8\xd7\x7f\xfd%\xb3\
+\xb3\xb3(\xa5\xba\x81\xafjJ5\x0b|c\xfb\xcem\
+\x91\xddK\xcc9\xf4\xe4{\xc2\xba\xf57\x014\x03\xbf\
+\x05\xd4VVVr\xe3{o\xa4\xb2\xb22/\x028\
+c\xee\xe4\xc5\x14\x03=\xa2\x13\x89D\x10SP\x8a\xa8\
+\xde\xc44\xf3Y\x0c\x0c\xc3\xc00\x0d\x0c\xc3dvv\
+\x96\xf9P0\xc9\xffKv\x06\xd3\xeb\x93E\x8f\xe8\x04\
+\x02s\xf8|>***PJ\xa3\xad\xad\x8d\xc6\xc6\
+&\x06\x87\x86\x08\x06\x03(\xa5j\x80\x87\xa2\xb6\xef\xd8\
+\xba\xf57EN\x9d<\xbd(`\xbbI)<\xf8\x98\
+\x98\xa6\xc1\xf0\xf00\xa1p(\x16k\xc7\xd7\xe2\xa8\x8d\
+\x8b\xafm\xd2H\xb4\xc9N\x9c\x0e[4\xef\xfb|\x15\
+\xd4T\xd7\xe0\xf5y\xd3\x07\x9c\x08\x12\x0f\xec\x00\xe5\xf8\
+\x0b\xa0\xd0\x0d=vm\xeb(\xb7\x5c\x1f=\xc3\xa1'\
+v\x85T\x09\x85C\x0c\x0e\x0e\xd0\xd2\xd2\xc2\xf2\xe5+\
+P\xc4\xc3\xc4\x9f\xfe\xec\x05\x06\x07\x07\xed0\xf1\xcf\x80\
+V\x11\xfe|\xfb\xcem\x97\x96\x8a%(\x94\x00\xe2\xb6\
+k\x9a&#\xa3#\xcc\xcd\xcdft\x0a\x0b\x91\x09\xaf\
+\x97\xda\xdaZ\xfc\xfe\xaa\xb8_\x001\xd3\x1e\xfb\xab\x12\
+\xb7S\xd3\x94\xc3\xcf\x13\xa7UO!D\xfc\x5cG\xba\
+S\xa2\xbb\xba\x1eaxx\x98\x88\xae\xd3\xd4\xd8\x84B\
+\xd1\xd1\xd1\xc9\x93O<\xc5\xcf~\xfeS\xce\x9e=\x8b\
+R\xaa\x02\xf8\x1d\xa5h\x01>\xb9c\xe7\xb6>\xd34\
+xn\xd7\xf3%}O\xf9J\xc9k\x02\xe3\xceZi\
+\x17\xc30\x98\x9e\x9e\xb6j\xe5L3%7\x8a\xdb_\
+!e?\xb1\x06\xd0\xb28\xce\xb6B$qI\xd8M\
+\xfe\x17kG\x00\xc30\x18\x1d\x19axx\x08\xc3\xb0\
+z\x1e777\xf3\xf8\xe6'\xb8y\xfd\xcd\xce\xd6\xc4\
+\xa7\x81o\x02\xeb4\xcd\xb3\xe8c\x13\xaf\xa8\xaa`\x11\
+!\x10\x98cjj\xd2\xf2\x0fH\xf4\xec\x9d\xfb1\xc0\
+\xd2\xec\xe3\x04\xd5\x0dp\xe2\xa4\x88\xb7\x17dX\xb0F\
+ ]\xba4\xce\xe0\xe0\x00\xe1\xb0\xe5\xbf\xd4\xd7\xd7\xf3\
+\xe1\x0f?\xca\x9dw\xde\xe9lM\xdc\x80\xd5\xe9\xf4>\
+|\x8b;@\xb50\x02\x94\xae\xae\xa6 \x09\x85BL\
+NM\x12\x0a\x85\x12}\x09\x1bD2\x83/\xe9,A\
+\x92^2Y\x83\x04\xcb\x90\xb8?55\xc9\xc0@\x9f\
+\xe5pFC\xe5\x87\x1e\xdc\xc0\x03\xf7?\xe0t\x96o\
+\x03\xbe\x85.O\x0a\xa2\x16\xab\xd3ia\x04X\xc8\x1a\
+\xfe\x1cE\xd7u\xa6\xa7\xa6\x08\xce\xcf;@\x8c;\x98\
+\x09V!\xa3%\x90\x8c\xc0g,\x02\x9c\xe7$\xda\x0a\
+fgg\xe8\xeb\xebcvn\x16\x11\xc1\xeb\xf5r\xd7\
+]w\xf3\xa1\x8d\x8fP[[k\x93`\x0d\xf0\x8fJ\
+\xa9\x7f\x8f,Nkb\xf1E@\x825\xb8\xbc\xcc0\
+L\x83\x99\x99i\x82\xc1@\x02\xf8\xe2b\x15\xec[M\
+\x9b\xeb\xd3\x01\xefV\xe6\xe7\xb2\x00\xc1`\x80\xfe\xfe>\
+\xa6\xa6\xa6b\xd5\xd2\xb7\xdcr\x0b\x8fm\xdaLCC\
+\x83M\x82\x16\xe0\x7f*\xa5\xfe\x13P}\xb9IP4\
+\x01\x9c\xfd-\x17CL\xd3dff\x86`0\xe8\x0a\
+\xbe+\x19\x9c\xc5\x04Y\x80\x97Tr\xe4\xbc`\x15W\
+\x03\x03\xfd\x5c\xba4\x1e\x0by\xd7\xde\xb0\x96\x8f<\xfe\
+\x04+W^g\xeb\xea\x80\xcf`\xcde\xb4\xe2r\x92\
+\xa0\x98\x8a\xa0\x7f\x8b]\x11t\xe3\x8d\xf8+\xfd\x98\xa6\
+\xc9\xe8\xe8\x08\x91H\xb8\xe4a`6\x09G\xc2(M\
+\xc3\xeb\xf3%\xda\xa1\x8401\xbe\x9f\xa0K\xd2'\xa8\
+s\xd0\xa4\x17\x0bp\xc34\x99\x9d\x9b\x05\x81\xea\xaaj\
+P\x8ae\xcb\xeai\xefhgbb\x82\x89\x89\x09\x94\
+R^\xe0\xfd@7px\xdd\xfa\x9b\xa6\xd7\xddx\x13\
+\xa7N-l\xa5\xd1\x15\x15\x05d\x12\xab\x17\xcf,\xa1\
+\xf9\xf9\x84>\x00\x99,AL\x07isyj_\x92\
+|\xfe\xc5\xad\xa3i\x18\x8c\x8c\x0c34<\x88a\xe8\
+\x88\x08\xcdM\xcdl\xde\xf48\xeb\xd6\xad\xb73\x8c\x07\
+\xf8U\xe0\x1b\xc0Mx`\xdb\x02\xf7<.\x1b\x02@\
+\xb48\x98\x9d!\x1c\x0a'\x86g\xb8\x90\xc1A\x88\x14\
+R\xb8\x10\xa3\xa0\x22 \xe9z\xa6\x08c\xe3c\xf4\xf7\
+\xf7\x11\x0e\x87\x11\x11\xea\xea\xebx\xe4C\x8f\xf0\xfe;\
+\xde\xef\x0c\x137b\x85\x89\xf7h\x9eX\x1f\x8c\x05\x91\
+\x12\x10 ^\xe1\xb2\x14\xc4\x8c\x9a\xdb\x88\xae;\xc23\
+g\x8eN%D&\xe0]\xc1\xcccq;\x7frr\
+\x82\xbe\xbe\xde\xa8\xdf\x02UUU|\xf0\x81\x07\xb9\xef\
+\xde\xfb\x9da\xe2\xed\xc0\xb7\x11\xf5\x111D-T\xcf\
+\xe3B\x09\x90\xd6\xf7[\x02\x11\x22\xba\xae377\x8b\
+i\x18I\xc0K\x1aB\xa4\x07>\x9d\x87\x9fu\x91\xf8\
+o\xa5\x5c\x13\x98\x99\x99\xa6\xb7\xf7]kX\x9a)x\
+}^>\xf0\x81\x0f\xf0\xf0\xc3\x1b\x9da\xe2\xf5\xc0\xd7\
+\x94G\xfd;\x94xw,@]AY\x15\x01N\x09\
+\x87\xc3\x04b\xe1a\xdc\xbbw'Dr\xc8\xe8B\x0c\
+p-\x16$#I\x92\xcfO\xf4\x0c\x02\xc19\xde\xed\
+{\x97\xc9\xa9\xc9X\x98\xf8\xbe\x9b\xdf\xc7\xa3\x1f\xdeD\
+\xc3\x8aX\x98\xd8\x0a\xfc\xb5B}\x12TU\xa9\x8b\x83\
+B\xa3\x80&\x12\xa2\x80\x9b\xf0\xfb\xe3Q@x\x11\xa2\
+\x0071\x0c\x03M\xf3\xe0\xf58\xda\xbc\x5c:\x0f\xb8\
+\xf7'\xc8\xd0\xc3)\x87\xdf\x96\x1cSu\xdd`vv\
+\x06\x8f\xc7CU\x95\xd5\xd0\xd5\xd0\xd0Hkk+\xa3\
+c\xa3\xcc\xcc\xcc\xa0\x94\xaa\x04\xee\x07\x96\x01G\xd6\xad\
+\xbfi~\xd9\xf57\xd3\x7f\xe6d\xd1\xef\xa8l-\x00\
+X95\x18\x0c\xa0\xdb\xfe\x00\xa4X\x02wk\x90&\
+*\xc8#\x0e\x88\xe5{\xd7\xe2\xc4YU \xe8\x91\x08\
+\x03\x03\xfd\x5c\xbc8\x1ckHjoog\xf3c\x8f\
+\xd3\xdd\xddm[\x82J\xe0c\xc0\xdf\x0a\xacj\xaf2\
+J\xe2\x1c\x965\x01\xc0\xb2\x02\x81`\x00\xd343\x84\
+\x80\xa9\xa4H\xf5\x112\xb4\x05dZ\xb24&I\xd4\
+\x876\x0c\x83\xe1\xe1!\x06\x07\x07babSS\x13\
+\x9b\x1e}\x8cu7\xads\x86\x89\xbf\xae\xe0\x7f\x03\xef\
+UP\xf4dVeO\x00\xb0\xfc\x81p8Dr)\
+\x9c5\x04\x84\x14\xab\x90\x7f\x08\x98\xd4h\x94\xee\xb7\xb1\
+\xc2\xc4\xd1\xb1Qz{{\xe3ab]\x1d\x0f?\xbc\
+\x91;n\xbf\xc3\x19&>\x02|W\xe0.\xcd\xa3\x15\
+\xd5\x9axU\x10\x00`~~\x1eC7\x5c\xcd{\xb6\
+H\xa0\xd0P0[\xbd@\x82c\xe8H\x9f\x98\xbc\xc4\
+\x85w\xcf\x13\x0c\x06\xac0\xd1_\xc5\xfd\xf7=\xc0\xbd\
+\xf7\xdc\xeb\x0c\x13\xef\x00\xbe\x83)\x9b\x05T\xa1\xc5A\
+\xe9\x09\xb0\xf8\xbe\x9f\xab\x18\x86\xc1|h\xde\x1d\xf84\
+\xe5~j+_\x8e! \x89\xe0\xba\xb79$Y\x88\
+\x04\x22Xa\xe2\xf9\x0b\xe7\x99\x99\x9dF\xc4\x0a\x13\xef\
+\xbc\xf3\xdf\xf0\xd0C\x1b\xa8\xad\x89\x85\x89\xbf\x02\xfc\x93\
+R\xfc\x96\x08\xdeBHp\xd5X\x00\xb0\x8a\x82XG\
+\x92t!`\xd6r?\x1f+\x90\xdd\x1fHO\x04\x08\
+\x04\xe68\x7f\xe1<\x13\x93\x13\xb10\xf1\xe6\xf57\xf3\
+\xc8#\x1ff\xc5\x8a\x156\x09\xda\x80/)\xc5\x1f\x0a\
+\xe4\x1d&^U\x04\x10\x11B\xa1\xf9\xa8C\x98\xaeB\
+H\xd2\x02^\x88\x17\x98\x96\x10.\x8ea2\x11\xc0j\
+M\xec\xed\xbd\xc0\xe8\xe8(bZ\xc4\xb8\xfe\xfa\xeb\xd9\
+\xf4\xe8c\xb4\xb5\xad\xb4IP\x0f\xfc\xa5\x82\xbf\x02\x96\
+\xe7C\x82bj\x02\xafH\xd1u\xab\xbby\x8a\x91\xce\
+\x01t\xf7\x22!\xc3\xbf\x5c\xc8\xe0\xb8\x0b\x12,C<\
+L\x8cD\x22\xf4\x0f\xf4Z\x0dI\xa6\x15!\xacZ\xb5\
+\x8aM\x8fn\xa2\xbb{\x8d\x1d!T\x02\xbf\x0f\xfc\x85\
+ 9w.\xb9\xaa,\x80-\xe1p(\x16\x16\xba\x86\
+\x80\xe9Kqw\xd3\xee\xbad\xf1\x1e$\x15\xec\xc4\xf9\
+\x0a\x12\xc3D]\xd7\x19\x1f\x1fc~>\x04\x80iZ\
+a\xe2\xcd\xeb\xd7\xe3\xf3\xf9\xecG\xd3\x80G\x144\xe6\
+\x9aGK:.\xe0J\x11\xc30\x88D\x22T\xf8\xe2\
+#\xdb%\xb1\xff\xb7C\x92\xc6/\xa6\x1e\x90V$\x07\
+\x8dS-n\xc7E\x8b\x03\xbf\xbf\x8a\x8e\xf6N\xaa\xaa\
+b\xdf;\xe0\xec\xb9s\x1c8x\x80p8l\x1f\xad\
+\x03?D\x18#\xc7\x9a\xd8\xab\x92\x00`9\x84\x1e\x8f\
+\x17M\xb3G~:S\x9d\xd5\xc4\x89\xa0Ibrz\
+\x91l\xaa\xf4\x07\x88\xf3\xaf@MM\x0d\x9d\x1d\xabc\
+\x8dD\x22\xc2\x993o\xd2\xb3\xaf\xc7\xae*\x06\x08\x02\
+\x7f\x83\xf09Pz\xae\xf3\x13\x5c\xb5\x040M\x13]\
+\x8f8\xcc\xa7;\xe8\xe2\x06v\xa1\x1e\x90\xa4\xbb\x84\xa4\
+\x1cg\x93\xa0\xben\x19\x9d\x9d\xab\xa3_:\xb1\xac\xd7\
+k\xaf\xbf\xc6\xa1C\x07\x09\x06\x836\xf8S\xc0_\x8a\
+\xc8\xdf\x81\x0a\xed~6\xf7QGE\x8d\x0e.\xe2\xdc\
+%!\x91H$:\xb4]K\x0f\xba\xebS\xe6Z\xd9\
+!9%I\x9a\xe3W,o\xa0\xa3\xa3\x93\x8a\x0a\xab\
+\xa8\x0a\x87\xc3\x1c?~\x8cc\xc7\x8f\x11\x0e\xc7\x1a\xdc\
+\x86\x81?\x16\x91\xef*\xa5\x8c|g&\xb9j-\x00\
+\xd8V@\xb7>&\xe5L\xc8\xe0\x03\xd8\x07d\xa2\x80\
+\x14\x90\x02q\xaf_)ESS3\xab\xaek\xc7\xeb\
+\xb5,T0\x18\xe4\xd0K\x87x\xed\xb5W1\x0c\xc3\
+\x06\xff\x1c\xf0\xfb\xa6i\xfeH)%\x85LKsU\
+\x13\x00,\xef:u\x82\x0bGq\xa0\xdcA+\xc4\xfc\
+\x89d\xb9\x82\x80\xd2\x14m\xad+Y\xb9\xf2:4M\
+C)\x98\x99\x99a\xdf\xfe\x1e\xce\x9c9\x13\xab\x10\x02\
+^\xc1\x9a\x80b\xbfhR\xf0\x04\x14\xc5\x13\xe0\x0a/\
+\x08L\xd3\xc4\xd0\x0d\xbc^g\x9f\x01\x87Q^\xa8\xe7\
+K)\x02\x04\x8f\xc7\xc3u+\xdbimm\x8d\x8d\x89\
+\xbct\xe9\x12{\xf6\xee\xe1\xc2\x85\xf3\xce\xb3\xf7b5\
+\x0d\xbfn\x88Q\xd4\xec#W\xbd\x05\x00\xd0\x0d\x1d\xcd\
+\xa3\xc5\xad@\xd6\x22\xc0=5;W\xd2X\x13\x11|\
+\xbe\x0a\xda\xdb;hjl\x8a\xe9\x87\x87\x87xq\xcf\
+\x8b\xf6\x10s\xfb\x02\xdf\x07\xfe\x00\xb8`\x1a\xc2s\xbb\
+\x8b\x9bu\xe4\x1a\x01\x88Z\x01\xc3\xc0\xe3\xb1;H\xa5\
+\x0f\x03\x93\x92\xd3\x83\x9ec\x18(\x02\xfe\xcaJ:;\
+W\xb3|\xf9\x0a\xeb\xf2J\xd1\xdb\xdb\xcb\x9e\xbd/2\
+66f\x83\xafc}\xf1\xf4S\xc0\x88\x09E\x83\x0f\
+%\x9e\x1f\xe0J\x16\xab\xfb\x98\x16\x9db\xe2r\x85\x81\
+BuU5\xabWwSWW\x17K{\xfb\xed\xb7\
+\xe8\xd9\xd7\xc3\xd4\xd4\x94\x0d\xfe<\xf0e\x90\xff\x0aj\
+:D\x88\x1f<\xf3\xa3\x92<\xf75\x0b\x10\x95T+\
+\x10\x95\x05\xe2\xb6\xd5\xd9\xa3\x9e\xd5\xab\xbb\xa8\xa9\xae\x89\
+\xdd\xc3\xc9S'9x\xf0\x00\x81@\xc0\x06\x7f\x1a\xab\
+\x91\xe7\x7f\x81\x9a/\xf5\x04\x94E\x13\xe0\xca\xcf\xfbq\
+\xb1\xad@\xa2\xa4\x9b\xe2.\xfdu$\x87ra\xf9\xf2\
+\x15\xac\xee\xec\xc2\xef\xf7\x03V4r\xe2\x95\x979z\
+\xf4(\xa1P\xc8\x06\x7f\x04\xf8\x94 \xdf\x06\xa5/\xc4\
+\xb42\x0b`\x01\x96h\x8f\x90\x1cDD0\x0c3\x89\
+\x04\xe2\x0av\xbe\xd1\x81}\xbcR\xd0\xd8\xd8Dg\xc7\
+j|\xbe\x0a\xc0j\xf2=r\xe40\xaf\xbc\xfa\x8a=\
+\xcf \xc0y\xe0\x0f\x04\xf9\x81\x82\x82b\xfc\x5c\xe4Z\
+\x11\x90$\xa6i\xc4\xe6\x1d\xb4\xa5$\xa1`4\xc6o\
+mic\xd5\xaa\xf6h\xd8)\xcc\xcd\x058p\xf0\x00\
+\xa7O\x9fr\xc6\xf8\xaf\x03\x1f\xf5\xfa|=\x91p\x98\
+]\xcf.\xdc\xfc\x82%!@9\x15\x03\x22\xd6\x87#\
+R\x8b\x02wq\xccR\x18\xeb\xc4\xe1&\x9a\xe6a\xd5\
+u\xabhk[\x19\xbb\xf6\xd4\xd4\x14\xfb\xf6\xf5p\xf6\
+\xdcY\xe7\xa1\xfb\x81\x8f*x5\x12\x89\xb0{\x01\xc1\
+\x87k\x16\xc0Ub\x9dA\xa2\x92i\x90\x8bd\xad\xde\
+\x15\xbc^\x1f\x1d\x1d\x9d\xb44\xb7\xc4*x\xc6\xc6F\
+\xd9\xb3w\x0f\xfd\xfd\xfd\xce\x18\xffGX\x9d:\xce\x89\
+@>\x8d:\x85J\x09\x08 \xe5e\x02H\xb5\x02\x85\
+\xce\x80*\x22TVV\xb2\xba\xb3\x8b\x86\x86Fl\xff\
+h``\x80\xbd={\x18\x19\x19\xb1\xc17\xb0\xe6\x16\
+\xfe\xcf\xc0ED\x16\xd4\xec;\xe5\x9a\x05H#6\x09\
+\x0a\x1d\xe2&\x22TWW\xd3\xb5\xba\x9be\xcb\x96\xdb\
+Z\xce\x9f?O\xcf\xbe\x1e&''\xedk\x87\x80\xbf\
+\x05\xfe\x0b0u\xb9\xbf3pU7\x07g}\xc0\x22\
+\xbc\xbf\xda\xdaZ\xba\xbb\xae\xa7\xb6\xb6\x0e\xa2]\xc9\xce\
+\xbcu\x86\x03\x07\xf6377g\x83?\x03\xfc7\x81\
+/)\x08.\xc6G&JT\x13X\xbe\xe2\xf0\xccs\
+>~\xf9\xf2\xe5tu\xad\xb1\xa6\x83A0\x0c\x83\xd7\
+_\x7f\x8d#G\x0e3\x1f\x8f\xf1G\x81?\x15\xe1\x1b\
+J\x91s\x0f\x9eR\xcb\xb5\x22 \x07\xc9\xc7\x1246\
+6\xd1\xb5\xba\x9b\xca\xcaJ\xc0\x9a\xbb\xe8\xe5\xe3\xc79\
+\xf1\xca\x09\x22\x91\x88\x0d\xfe\xbb\xc0\x1f\x9a\xc2\xf3\x0a\xcc\
+\xc5\xfc\xbc\xcc5\x02\x94H\x94R\xb4\xb4\xb4F+x\
+\xe2\x9d8^:\xfc\x12\xa7N\xbd\x81a\xc4\xfc\x89\x93\
+\xc0\xc7|u\x15/\x86\xa7B\xec\xde\xb5\xb8\xdf\x10X\
+\x00\x02\xc4G\xb6,5Y\xa89\x0b4Mc\xe5\xca\
+\xebh_\xd5\x11\x8b\x1cfff8p`?o\xbf\
+\xf3\xb6\xf3\xb7\x0f\x02\x1f\x059\x11\x9e\x09/:\xf8P\
+b\x02h\x9aFKK+\xcb\x97\xad\xc8\xabF8\xcd\
+\xc4m\xd9\x0e\xceK\x14\x8a\xa9\xe9)\xa6\xa7\xa7J\xf8\
+\xc4\x82\xc7\xe3\xa5\xa3\xbd\x93\xb6\xb6\x95\x09\x9d8z\xf6\
+\xed\xa5\xb7\xb7\xd7\x19\xe3\xff\x04\xf8=\x14\xef\x98z\xf1\
+\xed\xf8\xa5\x92\x92\x13\xa0\xad\xf5\xba\x5c\xbb\xa4_~\xe9\
+\xebejj\xb2$\x96@D\xa8\xa8\xa8`ug\x17\
+\xcd\xcd-\x80\x95\xcb\x87/\x0e\xb3w\xef^.^\x1c\
+v\xc6\xf8\xff\x17+\xc6\x1f\x9a\x13\x9d\x1f\xef\xfe\xfeb\
+\xbf\x89\x98\x94\x84\x00\x9af}\xeb\xa7\x94_\xfc*\x85\
+8k\xf4\x94RYk\xed\xf2\xb9\xae\xdf_EwW\
+7+V4\xc4\xae\xdf\xdb\xfb.===\x5c\x8a}\
+\x9a\x8e\x10\xf0\xf7\x02\x7f\xa1`r)~K\xb0(\x02\
+(\xa5\xd0u\x9dw\xce\x9e\xa5\xa6\xba\xda\x95\x00\xd9[\
+F\x0b\xe8t\x99\x81hv\x8a\x02\xfcUU\xb4\xb6\xb4\
+R]]M\xa9DD\xa8\xa9\xa9eM\xf7\x1a\xea\xeb\
+\x97\xc5\x9e\xf9\xad\xb7\xdf\xe2\xc0\xfe\xfd\xcc\xcc\xc6\x06j\
+\xcc\x02\xff\x1d\xf8k\x05\x81\xa5\x08>\x94\xc0\x02\x84B\
+!\x0e\x1c\xd8\x1f}\xe8h\x1e[\x22\x86\xc0\xef\xafd\
+\xe3\xc6\x0f\xd1\xdd\xb5\xa6$\xd7\x13\x11\x96\xd5/\xa3\xbb\
+{\x0d55\xb5\x00\x98br\xf2\xe4I\x0e\xbf\xf4\x12\
+\xc1\xf9\xd8@\x8dq\xe0\xd3\x02_\x07\x96\xdc\x87\xa2\x9c\
+R(\x01f\x81I\xe0:\xe7\xcbYj2?\x1fb\
+>8o\x99\xff\x12\xdc_CC#\xdd]\xdd\xf8\xfd\
+U\x805\xb0\xe4\xc4+'8~\xfc\x983\xc6\xef\x03\
+>\x01\xe6s\x0ae\xeeZ\x82\x9f\x8asJ\xfe\x04\xb0\
+\xb2\xf80J\xfd\x15\xf0\x9b\x80\x9f\xf4y>_}\xa1\
+iN\xbd\x865}JCrB1\xae_ss\x0b\
+\xab;\xbb\xa2\xa3t`>4\xcf\x91#\x87y\xfd\xf5\
+\xd7\x9d\x035N\x03\x1f\xab\xf3\xfa~9\xa3GX\xaa\
+f\xdf)y\x13`\xd7\xb3\xcf\xb1c\xe7V\x01\xf9g\
+\x81\xe7\x10<\xa0\xc4\xfa\x1f\xff\xe2V\xce\xdb\xd1\xef\xf7\
+\x11-B\x94\x80X\xdbbo\xabh\xbd\x82$\x1f#\
+\xd6\x08\x1d\x89~\xeb\xc9\xba\x9c\xaaB\xf1<\xf0`\xea\
+\xdd\xe7O\x01\xa5\x14mm+\xe9h\xef\x8c\xf5\x17\x9c\
+\x9b\x9b\xe3\xc0\xc1\xfd\x9c9s&v\x0cp\x18\xf8]\
+A\x1d\x9f\xd1C\xecz\xe6{\x8b\x89k\xceRP\x11\
+\xe00k\xe1B\xce_(\xd9\xfe\xf46\x044e}\
+\xc4\xb9h\xd14\x0f\xed\xab\xda\x1d\xa3t\x14\x93\x93\x93\
+\xf4\xec\xeb\xe1\xc2\x85\xf3\xcep\xf2\x05\xe0\xf7\x80\xb7\xac\
+\xa6\xdc+\x03|(\xb7\xaa`\xe5\x8c\x01\x0a\x17k\xa0\
+\x86\x8f\xce\x8e\xd5\xb4\xb4\xc4G\xe9\x8c\x8c\x8e\xb0w\xef\
+^\x86\x86\x06\x9d1\xfe3\xc0\x1f\x01\x03\x86i\xf0/\
+\x8b\xfc\x19\xb8|\xa5\xac\x08\xe0\xc0\xbf\xe0\xb1]v'\
+\x8e\xae\xd5\xdd4FG\xe9(\xa5\xe8\xef\xefgo\xcf\
+\x1e\xc6\xc7\xc7m\xf0\xc3\xc0W\x81?\x07&\x22A/\
+\xcf\xff`\xe9\x97\xf9\xc9RV\x04\x90\xe4\xaf\x83\xe4{\
+~\xb4\x13Gw\xd7\x1aG'\x0e8{\xf6\x1d\xf6\xed\
+\xdf\xc7\xf4\xf4\xb4\x0d\xfe\x1c\xf0yA\xbe\xa8`n\xa9\
+{\xfa\x99\xa4\xac\x08\x90X\x0d\x94\xe7\x99\xd1Y9\xbb\
+\xbb\xaf\xa7\xae\xb6.V\x8bx\xfa\xf4)\x0e\xbdt\xc8\
+9P\xe3\x12\xf0\x19\x90\xaf)T\xf8J\xf0\xf43I\
+Y\x11\xa0\x18\x17`\xc5\xf2\x15tu\xdb\x9d8\xacA\
+\x22\xaf\xbe\xfa\x0aG\x8f\x1duN\xc60\x00|RD\
+\x9e\x05e^\x8eN\x9b\x0b-eE\x80B\x8b\x80\x94\
+N\x1c\xe1\x10G\x8f\x1e\xe5\xd5\xd7^u\x0e\xd48\x03\
+|\x5c\x17\xfdg\x1e\xe5a)\xd7\xee\xe5#eE\x80\
+|\x8b\x00\xb7N\x1c\x81@\x80C\x87\x0er\xfa\xcd\xd3\
+\xce\xee`G\xb1\xfa\xea\x1f\xf1(o\xd9\x80\x0feF\
+\x80\xacE\x80C\xafi\x1a\xd7\xad\x5c\xc5\xaaU\xed\xb1\
+N\x1c\xd3\xd3S\xec\xdb\xb7\x8fs\xe7\xcf9\xcf\xfa9\
+\xf0q\xe0M\x03\xe1\xb9+\xd8\xe1s\x93\xb2\x22@g\
+W'\x17\xce\xbf\x8b\x96n^\x97\xa8x<\x9e\x94N\
+\x1cc\xe3c\xf4\xec\xddK\xff@l\xa0\x86\x09\xec\x16\
+\x91O\xf8*|\xfd\xff\xfc\xddg\x16\xfb\xf1\x16D\xae\
+$\x02\xa8l\xfb_\xfc\xfc\xdf\xc8\xfd\x1f\xbc\xcf\xd3\xd6\
+\xd6\xean\x03D\xa8\xf0U\xb0\xba\xab\x8b\xe6\xa6x'\
+\x8e\xc1\xc1A\xf6\xf6\xecatt\xd4\x06?\x22\x22_\
+\x0f\x06\x83\x9f\xf9\x7f?\xfc\xc9X\xf4=%\x93*\xdf\
+\xfd%)K\x85\x00n34\xa9\x1c\xd2\x92\xb7\xb94\
+~\xc9\xd7\xda\xda\xa2\x92{\xfd\x88\x08\x95\xfe*\xd6\x5c\
+\xff+48:q\x9c\xbfp\x9e}==L\xc6{\
+\x0a\x05\x0c\xc3\xf8r_o\xdf\x17\x8e\x1e9>\x875\
+\x07o\xb2H\x96m\xc9!-y{Q\xe4r\x13\xc0\
+\x0d\x5c\x95G\x1aYt\x04\x02A\xaf\xb3+\xbf\xf3\x0d\
+766\xa2\xa9\xf8\xa0\xcf7\xdf<\xcd\x81\x83\x07\x9c\
+\x035&\xc3\xe1\xf0\xe7^>\xfe\xca?\xf5\xf5\xf6\x85\
+\xb1\xc0\xcf\x94\xb3s\x01?\xd3:\xdb1\x0b.\x0bI\
+\x80t@\xaa,i\x14\xb0\x8em\x87\xc3!_\xb4}\
+0\xe5\x864e5\xe8\xd8\x035\x0e\x1f9\x1c\x9b\x8c\
+AD\x86\x03\x81\xe0g{\xf6\xec\xdb=;;\x0bP\
+\xe1\xf2L\xa5\x00?\x9d.\xdd1\x0bJ\x8aR\x12 \
+\x1d\xd0\xd9\xc0/\x15\x19\x00\xd0#\xbaWD\x5c\xc7v\
++\xa5\x88D\xc2\x1c;~\x9c\x13'^\x8e\xc5\xf8\x22\
+r~jr\xea\xd3\xbf\xfc\xc5\x8b\xbf0M3\xdd;\
+)\x06\xfcl\xbat\xfb\xd9tEK1\x04H\x07\xb6\
+\xca\x92F\x1e\xfbn\xdb\x99\xd6\x18\x86\xe1\xc3%\xfb+\
+\xa5\xa2\x035\x0eq\xf2\xe4\xc9X\x8co\x1a\xe6\xeb#\
+##\x9f\xde\xd7s\xe0\x18\xee\xb9>\xf9e\xe7R\xbe\
+\x17\x9a\xd33\xe9\xb2\xa5\x15$\xf9\x12 \x1b\xe8\xf9\x10\
+!\x17k\x91m\xdb\xb9\x06\xc00M\xafH\xe2\xdc^\
+J)\xa6\xa7\xa7\xd9\x7f`?\xefD\x07j\x00\xe8\xba\
+~\xa8\xf7\xdd\xbe\xcf\x1e?\xf6\xf2\x19\xb2;{\xce\xfd\
+BM~\xa1\xa0\xe7\x92^\x10\x19r%@>\x80\xe7\
+K\x82b,C\xca:j\xc2c\x04\x88\xcf\xb6\xf9b\
+\xc2@\x8dp8\xfc\xb33o\xbe\xf5\xb97O\x9f\x19\
+\xc8\x01\xfc\x5cM~\xae\xb9>_P\xf3\x01\xdft\xb9\
+\x8f\x82\x09P,\xf0\xa5\x22L\xaed@L\xf1\xd9\x16\
+@)\xc5\xc5\x8b\xc3\x9c<\xf9\x06CCC\xb1\x09\x17\
+\x83\xc1\xe0\xf7^=\xf1\xda\x97\xfa\xfa\xfa/\xe5\x00~\
+6\xd0\xdd\xc0\xcf\xc5\x5c\xe7\x0ah\xbe\x8b\xca\xf0\x9b9\
+\x13 W\xa0\xb4\xcbL\x84\xacE\x83)q\x0b \x22\
+\x9c:u*\xd6iSD\xe6ggg\xff\xcf\xd1\xc3\
+\xc7\xbe>>~\xc9-\xc6\xcf%\xe4+\x14\xf4\x85\x00\
+\xde\xcc\xe38\xb7\xe7s%@>\x00\xe7C\x80b\xc8\
+\x92\x0b\x11\xac}\x91\x04\x1f\xc0\x9e\xe5CDf'&\
+&\xbfv\xe8\xe0K\xcf\x06\xe6\x02\x91\x02\xc0\xcf\xd7\xbc\
+g3\xe9\xb9\x82\x97\x09T-G\xe05\x97\xfbw%\
+@6\xb02\x81XJ\xb2\x14L\x12\x11\x12|\x80(\
+\x09\xc6GFF\xbf\xf2\xd2\xc1\xc3/X_\x0c\xa3\x22\
+\xe9\x98|L~\xa9rs:S\x9d\x8d\x18\xc9\xa0\xa6\
+KO>\xc6\xa9\x8f=\xaf\x93\x00\x85\x82_\x08Y\x8a\
+%SZ\x12\xe8\xba\xae\x89)\x11\xfb\xa1\x0c\xc3\x18\xe8\
+\xef\x1b\xf8\xf2\xd1#\xc7\x0e\x8a\x88\x87\xec~O&\xd0\
+\x0b\x05>WP\xd3\x01\xeb\x96\x9e\xae\xe7\xb3\x96&M\
+%\xed\x0bX_\xa3v\x82\x9f\x0d\x84|\xc0\xcet\xac\
+\x96A\x9f-\xcdm\xf1\xd8k\xc30\xcc\xe6\xd6\xe6\xca\
+\xea\xea\xaa\x1bt]?w\xee\xec\xf9/\xbf|\xfc\xc4\
+\xf1(\xf0\x1e\xc7\xf1n\x8b\xf3Z\xc5Z\xac\xe4\x97\x9f\
+.\x8d\x0c\xfaB$\xaf00\xb9\x1c]\x08\xd0\x8b\xd1\
+\x15\xf2\xfb\xf8|>\xef\xca\x95m-\x81@ 86\
+6>\x1d\x055\x1bH\xc5\xe4\xe4|\xf4\xb9\xea\x8a=\
+?']\xa1\x04XjDq\xd3A\xe6\x9c\x9c8!\
+pi@_,ps\xfd\x8d\x94\xe3\x92\xcbC\xdb9\
+)\x95.\xd3\xb1$\xe93\xe9\x9c\xfad\x13\xa7\x5ct\
+N\xbd\x99\x86\x1c\xc9\xe5d)\x1c;\x5c\xaeA\x16}\
+\xb6c\xdd\xdeg.\x92\xd3q\xde,'\xaa\x1cu\xce\
+\x17N\x91z;\xbcq\xd3\xbb\xe5b7}\xb2eK\
+\xde\xcf\xf6\xd2JA\x86|\x1d\xc1b\x9cM\xd2\xe8\xc8\
+\xa2\x8b\x11 \x1f\x80\xd21+\x1bpZ\x1a\xbd\x9bI\
+N\x07j\xf2\x22d\x06\xdd\xa9s\xae\x93\xb7\xddr_\
+\xc2\x8b*\x12\xa0|I\x90\xaf\xafQ\xa8\xa5J\xb0\x00\
+\xc9/!\x17\xe0J\x09\xaa\x90\x1b\xe8\xd9r\xbb\xdbv\
+2\xe0n\xfb\x99H\x90\x89\x0c\x85\x10\xa1T\x84)&\
+=\x85\x00n/\xa1XP\xa1pP\xb3\x9dO\x9a\xfd\
+L\xebt\xe0\xe7C\x82R\x90!\xd3q\x85\xe6\xf2\x5c\
+\xc9\x90\xd3\x8b\xc8\xf4\xe2\x17\xbaF/\x13\xf0\xe4\xb1M\
+\x96\xedL\x22\x19\xb6KA\x86\x5c\x89R\xea\xe2\xc5\x15\
+\xe4l\x92+h\x1a\x99\xc1+\x14\xf8|A/\x16\xfc\
+t\xc0'o\x17K\x067\xddB-\x19\xc1\xcdU\x16\
+\xc2\x8c\xe7\x02\xba\x1b\xc0\xb9\x98\xfa\x5c\xc0O\x17\xd1\xe0\
+\xa2OG\x82\xe4\xf5B\x93!\xdfc\xb3\x82Z\x88\x94\
+\xba\xfc\xce\x94\xbbs-\xdf\xf3-\xef\x9di\x99^V\
+!$\xb0\xd7\x0bA\x86\x5c\xd2s\x96B\x09\x90|\x8d\
+R\x83\x9em;\xf9\xde\xb3Y\x80|\x9fWr\xdc\xcf\
+g]j2$_\xab )\x05\x01\xdc\xaeW\xaa\x9c\
+\x9e\x8f\xa9/\x15\xf8\xb6\xe4K\x027]\xae~\x82s\
+;\x1b\x19\xdc\xee\xa5`)5\x012\xfdF\xb19\xbd\
+\x98\xf2\xbe\x90\xe7\x94\x1ct\xb9\x92\xc0^\xe7K\x86t\
+\xf7Q2\xb9\x1c\x04\xc8\xf4\xbb\xc5\xae3m\x97\xea\x19\
+\xb3\x11!_\xbf\xc0^K\x96k]\x16Y,\x02\xe4\
+zO\xf9\x98\xfa\x85\x00\xdf\x96b\x8a\x83L\xdb\x8b.\
+K\x91\x00\xc5\xdc\xfbbX\x80L\xba%/\xff\x1f\xb3\
+\xeb\xf5\x97''x\xa1\x00\x00\x00.zTXtc\
+reate-date\x00\x00x\xda32\
+04\xd454\xd252\x0c14\xb021\xb22\
+5\xd76\xb0\xb020\x00\x00A\x14\x05\x0d\xbf\x8a\x85\
+\xba\x00\x00\x00.zTXtmodify-\
+date\x00\x00x\xda3204\xd454\xd2\
+52\x0c14\xb522\xb225\xd16\xb0\xb02\
+0\x00\x00A*\x05\x0d\xd1H\xca*\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x0a\x9e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00@\x00\x00\x00@\x00\xea\xf3\xf8`\x00\x00\x09\xa2\
+IDATx\xda\xed\x9b\xcfo\xdb\xc8\x15\xc7\xbfo\
+F?\xa2\xc8v-)\xf2\x0f%\xaew\x9bnw\xd7\
+A\x8an\xd3\xaba\xf4\x1fh\x93\x83\x83\x5cr-\x92\
+\x1e\x03\xb4\x87\x5cL\xa3\xd8c/{h\xe1c\xcfB\
+/m\xeeu\x108?\x90\x18\xce\x22\x80\x83\x0d6n\
+\x1d\xa7\x8a\xd3\xd4\x91bG\xb6~p\xe6\xf5@R\xa2\
+(R\xa6,\xc5N\x91\x8cA\x0c\x873\xe4\xcc\xfb\xcc\
+\xf7\xbd!E\x9a\x98\x19\x1fr\x12G=\x80\xa3N\x1f\
+\x01\x1c\xf5\x00\x8e:}\xf0\x00\x22\xfd\xb8\xc8\x8a1}\
+\xd0S\x9d\x08L\xbd\xf4\xff\x95q\xeb\xc0\xe7\x1e\xa5\x02\
+8\xf3\xa3S\xc8\x9c\x9ep\x838\xf4\xd4\x17\x05\x1c\xc8\
+\xf8ON!\xf7E\x16dO\xc1\xd6\xd3\x0dF\x8fJ\
+8\x12\x00\xb3\xb3\xb3\x7f\x02\xc6\xae\x06T\xff\xf9\xfa\x99\
+\xcd\xdf\xb6\x19\xff\xc3\x93\xc8\x9dNC\xbf\x5c\x06\x22\x84\
+\x93_\xfe\xfc\xc8 \xf4C\x01W\xbf\xbe\xf2k\x805\
+\x88\x08B\x10\x08\x04\x11\x89\xe2w\xdf\xe4\xaf\x02p\x03\
+\xe0\xcc\xa9\x93\x18\x9fLC\xbdX\x06\xe9m BP\
+\xbc\x8c\xdc\x17\xe7\x000\xb6\x9e>?T\x08}q\x01\
+\xad5\x0a\x0f\xff\x01!%\xa4\x10 !p\xf2g\xbf\
+\xf46\xe3\xf4x\x0ec\xb9\x14\xf4\xf3\x07\x80\xda\x06G\
+\x08\xc4\x00\xca%\xe8\x06\x04\x1c*\x84\xbe\x010\x95\x82\
+\x04\x03,  \xa1uK\x5c\xe3\xf4h\x0e\xe3#\xc3\
+\xe0g\xf7\xc1j\x1b\x14!\x80\xad\xe8\xd7\x80\xf0r\x19\
+\xb9\xcf\xcf\x01\x0cl\xad\x1d\x0e\x84\xfe\x00P\x1a\xca4\
+\x01\x16\x80\x94`\x00\xcc\xbai|v\x1c\xe3\xe9!\xe8\
+\xf5\xfb@\xfd\x0d\x10%0\x13\x88\x09\x80\x003\x00\x06\
+\xc8\x81\xe0(\xe1\x10 \xf4\x05\x80\xd2\x0a\xa6R`\xfb\
+O\xb2\xa5\x8a\xebg6\x91\xce\x8calh\x08z\xed\
+>\xd8|\x03H[\xf6\x0c\xdbpm\x81`\x1bJ\xb9\
+\xd8T\xc2!@\xe8\xa3\x0b\x98`\x16`\x96`I(\
+\xdfZ@jx\x0cc\x89A\xe8\xef\xef\x81ko,\
+\xd9G\xad\x19'X\x10\x1c\x10n(\x16\x84\x07\xc8\xfd\
+\xe4\xddC\xe8\x13\x00\x05\xd34\xc1B\x00\xcc\xc8\xa9\x7f\
+#54\x8a\xb1X\x12\xea\xc9=\xa0\xf6\x06\x88Ps\
+\xc6m\x17\x00\x8b\xa6\xe1\xf0@`\xdb\x1d\xde1\x84>\
+\xc5\x00\xb6b\x80\x10\xf84\xf2_\xa4\x06F1&\x92\
+\xd0\x8f\xef\x81\xab\x96\xf1\x8eq\xad\xc6\xeaf,`\x02\
+{\x81\x94K\xd0\x9b\xcb\xc8}f\x07\xc6\x7f\xf6\x1fB\
+\xffb\x80i\xe2\xf3\xa1]\xa4\x12#\x18S\x09\xa8\xef\
+\xee\x82+%;\xda\xfb\xcc\xb8#{\xb8\xf7u{p\
+tC@\xff!\xf4-\x06\x9c\x19\xdaE*\x9e\xc5h\
+\xed\x18\xcc'w\x81\xbd\x92K\xf6\xc1\x06\xb6A\xf0\x0b\
+\x8e\xe5\x22\xf4\xe6\x03\xe4>\xfbE\xdf!\xf4\x05@\xe2\
+\xf1_\x91\x8af1\xb2w\x0c\xea\xf1]\xb0m|\x8b\
+\xec]\x81\xcf2V7#?\x87\x08\x8e\xe5\x92\x0d\xa1\
+\xbfJ\xe8\x19\xc0\xf53\x9bH\xc9,F\xb6\xe3P\xab\
+w\xc0\xbb\xa5\xe6M\x8e\xcb\x00\xdfh\xef\x02\x12*8\
+\xbe-A\xbfXF\xee\xc7\xfd\x83\xd0\x13\x80\x15c\x9a\
+\x87\xe9\x04F\x8aQ\xa8G\xb7\xc1\xbb%@\xc2\x13\xd8\
+\xac\xbcQ\x86O\x1c\xe8&8\x96m\x08\xa7\xfb\x03\x81\
+\x0e\xfa\xab\xf0\x8a1\xcd\xc3\x9c\xc1\xe8\xeb\x18\xcco\xef\
+\x80\xcb\x96\xf1\x14!\xc0\xdeH6\xf7\x1b\xe5\xa8\xbd\xef\
+:\x8e\xa8h\x96\xa3\xadu\x14\xf1\x9c\x13\x15V\xdd\xf1\
+a\xc8\xf1s(|\xbf\x85\xad\x7f=\xc7W\xc6\xad\x03\
+A8\x10\x80\x15c\x9a\x87u\x06#/\xa30\x1f\xde\
+\x06\xdeZ\xc6\xfb\x19N\x11\x02\xa4\xcb8/\x94\x00\x03\
+\x1b\xc7ek\x1bD\x08\xe4\xec;\x10\x9e\xbe>0\x84\
+\xae\x01\xac\x18\xd3<lf0\xb2)a.\xdf\x01\xef\
+\x14\xadA:\x00d\xc0\xecwRFt\x1f \xb2\xb5\
+M\xcb9\xc9\xde t\x05`\xc5\x98\xe6\xe1z\x1a\xd9\
+\xe7\x12\xe6\x83\xdb\xc0N\x11\x10\xb6\xd1\x8e\xfc\xa5\x0b\x82\
+{\xf6\xbb\x81\xe0g\xac\xec\xe0*\x0e\x84\xb5\xee!\x84\
+\x06\xb0bL\xf3p5\x8d\xec3\x01\xf3\xfem\xf0v\
+\x11\x10\xb0\x0c\x11\xd4p\x01r\x01h\xc87\xe2\xaaw\
+\xfb\xbe\xbb\xdem\x9c\x17B\xd4\x053\x1ap\xce\x80K\
+\x09\xeb\xe1!\x84\x02\xb0bL\xf3p%\x8d\x91\xddq\
+\x10\xc12\xd8\xba\x97\xb1\xf6\xbder\x81\x11\xd6qr\
+ \x09\xd7qI\xae\xba\xd6c\x8e\xb2\xc8u\x9cZ\xea\
+\x9c\xb6\xb6\xfb5\xfa#\x14V\xbf\x0b\x0da_\x00+\
+\xc6\xf4\xff\xf5\xcb\xc3\xfd t\x1d\x04gggya\
+a\x01\xe5r\xd9\xba\x00Qc\xeb\xa5\xdc\xcd\xbe\xdf1\
+!\x04.]\xba\x84|>\xdfU\x10<\xd0\x8d\x103\
+\x83\x99ADp\x03\xdc\xaf\xdcq&\x5cm\xf7\xdb\xef\
+\xe6\xba\xef\x04\x80\x03\xa1\xdb\xd4\x0d\xa0 \x08\xdez'\
+?(\x90\x9e\x14\xb0\x9f\x11\xbd\x02\x0a\x0b\xc6q\x85C\
+\x03\xe0@\x08cD/n\x12\xc6-zM}\x01\xf0\
+\xaebA\x98\xba#s\x01/\x84nR7\xc0\x82\x80\
+x\xdb\x1c4\xf5\x1c\x03\x0ebT'\xc3\xf6\x03\xd6o\
+W\xe8\xc9\x05\xc2\x0e\xe0\xc6\x8d\x1bXZZB\xa5R\
+\x09u\xedD\x22\x81\x99\x99\x19\x5c\xb8p!4\x90#\
+[\x05\x82\x06\xe6./--\xe17\xd7\xff\x80c\x89\
+D\xcb\x8dP\xf3FF\x80\xa8)\xe5Z\xa5\x82o\xe6\
+~\x8f\xf3\xe7\xcf\x07^\xdboL\x87\x06\xc0\xddaX\
+\x150k<}U\x02\x83 \x88@BX9\x09\xeb\
+\x8d\xb2\xbd/\xa5\xc0h\x9c\xda\xfa\xe9\x04\xfb\xc8\x97\xc1\
+N~\xe9\x0c\x8e\x99\xc1Z\x83A\xd0D\x10\x004\x91\
+\xf5\x81\x84v@h\xb0\x06\x98\x85\xaf\xf1\xfd\x5c\xfe:\
+\x02p\x0d\x9a\xe6\xe7\xe7155E\x00\x90\xcdf[\
+\x06\xd6\xcdr\xa5\xed\xf7\x85\x0c\xcbX@[FC[\
+@\x04\xa0\xb5\xf5m\x81\x1br\xd8\x15\xc2\xc9\x17\x17\x17\
+\xc5\xcd\x9b7155\x85\xd5\xd5U\x9e\x9b\x9b\x03\x91\
+\xf5\xe3\xbb\xdfx\x03\xbf\x11bf\xca\xe7\xf3\x94N\xa7\
+\xa5\x0d*V(\x14\xe2\x8d\xd9tu\xec\xdd\xf7nv\
+%\xb4fh\xad}6n\xe4\xcc\x1a\xda~\xb3\x1ct\
+=\xef\xb5\xdd\x86\x15\x0a\x85\xf8\xe4\xe4dlgg'\
+:99)\x17\x17\x17\xc90\x8c@\x1f\x09r\x01\xca\
+\xe7\xf3\x94\xcdf\xc5\xde\xde^L)\x15\x93RFa\
+=\x85w\x9c\xfd \x150\xb3\xad\x00X\xbf)\xc0%\
+\x7fW\xae5\xc0,[\xfa\x08\xb3\x84:e!\xc4p\
+\x22\x91P\xf5z\xdd\x94R\xd6j\xb5Zmff\xc6\
+\xb4\xeb\xdb\x06\xed\xab\x00fF\xb1X\xa4B\xa1\x10\x15\
+B\x1c\x07\x90\xd6Z\x8fJ)s\xee6aU\x00\x00\
+\xec\x9eqnU\x00{stVT'\x15\x10Q\x8e\
+\x99\xc7c\xb1XF\x081\xb0\xb5\xb5\x15\x03 \xe6\xe7\
+\xe7}'\xca\x17\xc0\xfc\xfc<b\xb1\x18\x09!\x22R\
+\xca\xe3\xcc\x9ca\xe6\x93\xcc\xfc\x89\xbb\xb3\xfd x\xdb\
+z\x0d\xf7s\x83/\xc7R`\xdd\xee\x02a\xca\x00\xa0\
+\xb5\xfe\x14\xc0)\xa5\xd4\x08\x80A!DlmmM\
+:q,\xac\x0b \x99L\x92RJ\x00pT\x90\x02\
+0\xe4V@\xd8[\xd6\x16\x17p\xde\x085V\x02'\
+ \x02?=5\x02\x06c\x22\xf3\x836iw\x91\xb2\
+\x00\xde\x0a!\x14\x80\x92\x10B\xc4\xe3\xf1\xc0\xc6\xbe\x0a\
+\x98\x9b\x9bC\xb9\x5cf\xa5\x14K)\x99\x99\x89\x99\xa3\
+\xcc\x9cp\x0f,H\xf6\x81\xb3e\xcf2\x07\xa8\xe0\xe1\
+\xb3\x97\x003\xd6_\x15;J}\x1f\x15\x1c\x07\x10'\
+k\xa9\x81\xd6\x9ac\xb1\x18\xaf\xae\xae\xfa\x92\x0c\x5c\x05\
+\x92\xc9$\x0b!\xb4R\xca\x04`\x12\x91ffr\xcf\
+J\xa7\x01\xb6\xed\x83\xdb\x22\xbe\xf6\x89\x0b\xdfn\xfc\xc7\
+\xd7}\xc2\xc4\x19\xc7&\xb6\x92\x09\xa0\xce\xcc\xaaX,\
+\x06\xca\xc8\x17\x00\x11q6\x9b\xe5H$\xa2\x84\x10u\
+!D\x05@\x8d\x88\x94W\x9aa\x02\xa1s\xac%\x00\
+\xb2\x7f@\xb4\xdc$|\x10\xf4\xf6MD\x8a\x88\xea\x00\
+\xaav\xae&&&xnn\xce\x17@`\x0cx\xf5\
+\xea\x15\xe2\xf1\xb8\xde\xdb\xdb3\xb5\xd6U\x22\xaa\x020\
+}:\x0c|0\xf2\xde\xa8hm}D\xa5\x89\x1aq\
+\xc0\x9b\xb3&\xd81\xb0+\xffw\xf5\xa3\x84\x105f\
+\xae(\xa5jD\xa4666\x98\x88\xb8\xab\x1b\xa1\xd5\
+\xd5U\xde\xdc\xdc\xd4\xcc\x5cg\xe6\x1a\x80\x0a\x80\x9a\xb7\
+\xd3\xa0\xe5\xc8+M\xab\xec\xcc:\xdbq\x80\xdb\x96@\
+?\x05x\xfb\xf2+\xbbR\x8d\x99+\xcc\x5cUJ\xd5\
+wvvt*\x95\xea\xce\x05\x00+\x10V\xabU\x8e\
+\xc5b\x0a@\x15\xc0\xae\xbd\xb5\x19\xda\x09\x86W\x01M\
+\xe3\xdd\xf2o\x8d\x0ba\x8d\xf6\xeb\x93\x88\xf6\x88h\x97\
+\x99+R\xcaz\x22\x91\xd0A\x01\x10\xe8\xe0\x02D\xc4\
+\x0b\x0b\x0b\xac\x942\x99\xb9\xa2\xb5~KDo\x9c\x8e\
+3\x99\x8c\xb7}K\xee=\xc6\xcc\x98\x9a\x18\xf1\x7f?\
+`\xbb\x00\x09\x01\x02P\xafVAD\x18\x18\x18hi\
+\xeb\xbd\xae_\x1d\x80\x92\xd6z\x9b\x88v\x95R\xe6\x89\
+\x13'\xf4\xe5\xcb\x97a\x18Fw\x00\x00 \x95Jq\
+\xa5RQR\xca\x0a\x11\x95\x989288\xf8\xb7k\
+\xd7\xae\xfd\x0a]\xa6\xbf\xfc\xf1\xebnO\xc1\x95+W\
+\xbaj?88\xf8wf\xde\x14B\xbc\x16B\xecV\
+\xab\xd5\xba\xed\xff\x81\xe7\xf8\xbe\x19r?\x0d\xe6\xf3y\
+Q.\x97\xa3\xc9d2\xa1\x94J\x12Q\x9c\x99#x\
+\xcf\xfe\xdd\xc6~\xe2SZ\xeb\x86\xbbV\xab\xd5\xda\xfa\
+\xfa\xba2\x0c#\xf0i\xb0#\x00\x000\x0c\x83\xa6\xa6\
+\xa6D\xadV\x8b\x08!\xa2D$\xa5\x94\xa2^\xaf\x1f\
+\xb5\xcd-)\x1a\x8d\x02\x80\xaeV\xabz``\xa0^\
+*\x95\xccd2\xa9/^\xbc\xe8|\x84s0\x00\x00\
+\xc80\x0c\xcc\xcc\xcc\xd0\xa3G\x8f\xc4\xd9\xb3g\xf1\xe4\
+\xc9\x13\x02\x80\x5c.\x87\xf7!\x15\x0a\x05\x00@*\x95\
+\xc2\xc0\xc0\x00oll\xf0\x8b\x17/\xb4\xfb\xb7\x80^\
+\x00\xb4\xb5\x0dz\xb2:\xea\xe4\xdc\xec\xd8\xe3o3,\
+4\x80\x0f)\xbdW\x81\xec#\x80\x8f\x00>\x028\xf4\
+\xf4?\xdd\x03\x98\x19\xf8\xa1mz\x00\x00\x00%tE\
+Xtdate:create\x0020\
+13-12-17T10:20:1\
+7-05:00\x05d\x89\x86\x00\x00\x00%t\
+EXtdate:modify\x002\
+013-12-17T10:20:\
+17-05:00t91:\x00\x00\x00\x19\
+tEXtSoftware\x00Ado\
+be ImageReadyq\xc9e\
+<\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00&\x12\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x01\x10\x90\x00\x01\x10\x90\
+\x01\x89\xac\xd2\xb8\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
+ATx\x9c\xed\xddy\xb4eUy\xae\xf1\x07(z\
+i\x04\x01\x11\xb0\xef\x88$1\xe6\xb3#\xa2\x82(\x8d\
+\x80(\x8a\x0d7\x8a7J\x22J\x14o4\xf6\x8a\x80\
+\xc6$\xc3\x16e\xa8I$&\xc4\x16Q\x1a\x15\x83M\
+\xd4h\xd4\xefru\x88}\x08\xb1\x01\xa24*\xadZ\
+@\xdd?\xd6F\x0a\xa8\xe64{\xefo\xad5\x9f\xdf\
+\x18{\x1c\xaa\xa8:\xe7U\xf6\x99\xf3=s\xcd5\xd7\
+\x06\xabV\xadB\xed\x89\x88\x9d\x80\xfb\x00\xf7\x9e|\xdc\
+\x01\xd8j\x1d\xaf\x155I\xd5\xb0\x95\xc0O\x80\x1f\x03\
+?\x9a\xbc~\xbc\xda\xc7\xff\xcc\xcc\xeb\xea\xe2I\xc3\xb6\
+\x81\x05`\xdc\x22b\x0b\xe0a\xc0\x03\xe9&\xfa\x9b^\
+\xdbT\xe6\x92\xa6\xe0Z\xe0,\xe0\x83\xc0\xc7-\x03\xd2\
+\xe2X\x00F&\x226\x06\x1e\x0c\xec\x03<\x0ax\x08\
+\xb0Ii(i\xf6\xae\x01\xce\xa4+\x03\x9f\xc8\xcc_\
+\x15\xe7\x91z\xcf\x020\x02\x11\xb1\x0bp8\xf0h\xe0\
+\xe1\xc0\x96\xb5\x89\xa4RW\x03g\x00'g\xe6\x17\xab\
+\xc3H}e\x01\x18\xa8\x88\xb8\x1d\xf0\x04\xe0\x8f\xe9~\
+\xda\xdf\xb06\x91\xd4Kg\x02/\xcd\xccoU\x07\x91\
+\xfa\xc6\x020 \x11\xb1\x11\xb0/\xdd\xa4\xffx`\x8b\
+\xdaD\xd2 \xdc\x08\xbc\x17xUf\xfe\xb8:\x8c\xd4\
+\x17\x16\x80\x01\x98\xfc\xb4\x7f4\xf0\x02`\xe7\xe28\xd2\
+P\xfd\x0a8\x09x}f^Q\x1dF\xaaf\x01\xe8\
+\xb1\x88\xd8\x168\x86n\xe2\xdf\xae8\x8e4\x16\xbf\x00\
+\xfe\x0ax\xabw\x0e\xa8e\x16\x80\x1e\x8a\x88\xed\x81c\
+\x81\xe7\xe1\xedz\xd2\xac\xfc\x00\xf8_\x99\xf9\xd5\xea \
+R\x05\x0b@\x8fD\xc4\xd6\xc0\xcb\x81\xe7\xe2N~i\
+\x1e\xae\x07\x8e\x07N\xcc\xcc\x1b\xaa\xc3H\xf3d\x01\xe8\
+\x89\x88x\x1a\xf0\xb7x\x8d_\xaa\xf0e\xe0\x8f3\xf3\
+\x82\xea \xd2\xbcX\x00\x8aE\xc4\xee\xc0\xdb\x81\xbd\xab\
+\xb3H\x8d\xbb\x1ax~f\xfeCu\x10i\x1e,\x00\
+E\x22bK\xe0\x95\xc0\x0b\x81\x8d\x8b\xe3H\xba\xd9\xe9\
+\xc0\xb33\xf3\xf2\xea \xd2,Y\x00\x0aD\xc4~\xc0\
+\xbb\x81\xdd\xaa\xb3HZ\xa3K\x80gf\xe69\xd5A\
+\xa4Y\xb1\x00\xccQD\xac\x00^\x0b\xbc\x04\xd8\xa08\
+\x8e\xa4u[E\xf7\xfdz\x5cf:Pjt,\x00\
+s\x12\x11\xbb\x02\xef\xa3{2\x9f\xa4\xe1\xf8\x10pd\
+f^[\x1dD\x9a&\x0b\xc0\x1cD\xc4\x81tG\x91\
+n_\x9dE\xd2\x92\x9c\x07\x1c\x92\x99\x17U\x07\x91\xa6\
+\xc5\x020C\x93%\xff\x13\x81\x17\xe1\x92\xbf4t\x97\
+\x00\x87zp\x90\xc6\xc2\x020#\x93]\xfe\xa7\x01\xfb\
+Ug\x9145\xbf\x02\xfe$3\xff\xa5:\x88\xb4\x5c\
+\x16\x80\x19\x88\x88;\x00g\x03\x0f\xaa\xce\x22i&N\
+\x04^\xe9\xe6@\x0d\x99\x05`\xca\x22\xe2\xce\xc0\xa7\x80\
+\xfbTg\x914S\xa7\xd3\x9d\x1exMu\x10i)\
+,\x00S\x14\x11\xf7\x03\xce\x01v\xa9\xce\x22i.\xbe\
+\x01\x1c\x94\x99?\xa9\x0e\x22-\xd6\x86\xd5\x01\xc6\x22\x22\
+\xf6\x04\xbe\x80\x93\xbf\xd4\x92\xdf\x07\xfe=\x22\x5c\xf1\xd3\
+\xe0\xb8\x020\x05\x11\xf1P\xe0\x5c`\x8b\xea,\x92J\
+\x5c\x0a\xec\x9f\x99\xe7U\x07\x91\x16\xca\x15\x80e\x8a\x88\
+\xdf\x01\xce\xc2\xc9_j\xd9\x0e\xc0\xe7\x22\xe2\x91\xd5A\
+\xa4\x85\xb2\x00,CD\xecFw\xcd\x7f\xbb\xea,\x92\
+\xcam\x05|\x22\x22\x1eW\x1dDZ\x08\x0b\xc0\x12E\
+\xc4\xf6t\x93\xff\xae\xd5Y$\xf5\xc6f\xc0i\x11\xf1\
+\x8c\xea \xd2\xfaX\x00\x96`r\xc8\xcf\xd9\xc0\xee\xd5\
+Y$\xf5\xceF\xc0{\x22\xe2\xd8\xea \xd2\xbaX\x00\
+\x16)\x226\xa2{8\xc8\x83\xab\xb3H\xea\xad\x0d\x80\
+7F\xc4\x09\xd5A\xa4\xb5\xb1\x00,\xdek\x80\x03\xaa\
+CH\x1a\x84\x97G\xc4\xc9\x11\xe1X\xab\xde\xf16\xc0\
+E\x88\x88}\xe9\xae\xfb\xfb\xcd,i1>@wj\
+\xe0\xca\xea \xd2M,\x00\x0b\x14\x11;\x03_\x07v\
+\xac\xce\x22i\x90\xce\x00\x9e\x94\x99\xbf\xa9\x0e\x22\x81?\
+\xc9.\xc8d\xf9\xeeT\x9c\xfc%-\xdd!\xc0\x87#\
+b\x93\xea \x12X\x00\x16\xeaU\xc0\xde\xd5!$\x0d\
+\xde\xc1X\x02\xd4\x13^\x02X\x8f\x88\xd8\x9b\xee\x98_\
+\xcb\x92\xa4i9\x13x\xa2\x97\x03T\xc9\x02\xb0\x0e\x11\
+\xb1\x19p>p\x8f\xea,\x92F\xe7,\xe00K\x80\
+\xaa\xf8S\xed\xba\xbd\x14'\x7fI\xb3q\x10\xdd\xa9\x81\
+^\x0eP\x09W\x00\xd6\x22\x22\xee\x05|\x13\xd8\xb4:\
+\x8b\xa4Qs%@%\x5c\x01X\xbb\x93p\xf2\x974\
+{\xae\x04\xa8\x84+\x00k\x10\x11\x87\xd3\x1d\xdc\xd1\xa2\
+\xcb\x81\x8b\x80\x8bo\xf5\xbav\x01\x7fw!o&\xff\
+L?\xfe\xcc<\xb3\xec\x00\xfc\x09\x1e\x9f\xbd>g\x03\
+Op%@\xf3b\x01\xb8\x95\x88\xd8\x0a\xf8.p\xa7\
+\xea,sp\x19\xdd\xf2\xe3\xc7\xe8\x0e9\xba$3\x7f\
+]\x1bIc\x15\x11\x01<\x0fx2\xddS\xf3t[\
+\x96\x00\xcd\x8d\x05\xe0V\x22\xe2D\xe0e\xd59f\xe8\
+\x02\xe0\xa3t\x93\xfe\x972\xf3\x86\xe2<j\xcc\xe4Q\
+\xda'\x03O\xaa\xce\xd2S\x96\x00\xcd\x85\x05`5\x11\
+\xb1-\xf0C`\xeb\xea,Sv\x15\xf0\x16\xe0\xfd\x99\
+\xf9\xad\xea0\xd2\xe4t\xcd7\x02\xcf\xaf\xce\xd2Sg\
+\xd3m\x0ctEN3c\x01XMD\xbc\x028\xbe\
+:\xc7\x14\xad\x04\xde\x05\x1c\x97\x99\x97V\x87\x91n-\
+\x22^\x04\xbc\x81\xee\xf1\xb9\xba\xa5\x8f\xd3\xad\x04X\x02\
+4\x13\x16\x80\x89\x88\xd8\x12\xf8o\xe0\x0e\xc5Q\xa6\xe5\
+4\xe0\xa5\x99\xf9\x83\xea \xd2\xbaD\xc4\xf3\x80\xb7U\
+\xe7\xe8)K\x80f\xc6\xdb\x00ov\x14\xe3\x98\xfc\xbf\
+\x08<43\x9f\xe8\xe4\xaf\x81x;\xdd\xfbV\xb7u\
+ \xf0\x91\x88\xf0\x96dM\x9d+\x00\xc0\xe4\x9b\xeb\xbf\
+\x18\xf6\xce\xff\x95\xc0\xf33\xf3\xe4\xea \xd2bE\xc4\
+\xef\x02\xe7\x01+\xaa\xb3\xf4\xd4'\x80\xc7\xbb\x12\xa0i\
+r\x05\xa0s$\xc3\x9e\xfc/\x07\x1e\xe3\xe4\xaf\xa1\xca\
+\xcco\xd2mT\xd5\x9a\x1d\x00\x9c\xeeJ\x80\xa6\xc9\x02\
+\xd0yAu\x80e8\x1fx`f~\xae:\x88\xb4\
+L\xaf\xa1+\xb3Z3K\x80\xa6\xaa\xf9\x02\x10\x11\x0f\
+\x02\xee[\x9dc\x89\xce\x00\xf6\xcc\xcc\x0b\xab\x83H\xcb\
+\x95\x99W\xd3m^\xd5\xdaY\x0245\xcd\x17\x00\xe0\
+\xe9\xd5\x01\x96\xe8\xf5t\xd7\x04\xaf\xaa\x0e\x22MQ\xab\
+Gp/\xc6\x01\xc0G-\x01Z\xae\xa67\x01N\x1e\
+\xbeq1\xb0}u\x96EzCf\xbe\xa4:\x844\
+m\x93\x03\x82.\x06v\xaa\xce2\x00\x9f\x04\x0euc\
+\xa0\x96\xaa\xf5\x15\x80\xc72\xbc\xc9\xffL\xc6}T\xb1\
+\x1a\x96\x997\x02\x1f\xae\xce1\x10\xfb\xe3J\x80\x96\xa1\
+\xf5\x020\xb4\xe5\xff\xf3\x81#&\x83\xa44V\x1f\xab\
+\x0e0 \x96\x00-Y\xb3\x05`\xf2@\x92\xc7V\xe7\
+X\x84\xcb\x80C\xbc\xe6\xaf\x06|\xbd:\xc0\xc0\xec\x8f\
+\x1b\x03\xb5\x04\xcd\x16\x00\xe00`\xe3\xea\x10\x0b\xb4\x92\
+\xee\xc1 \xee\xf6\xd7\xe8M\x9e[\xf1\xb3\xea\x1c\x03s\
+\x00p\xdad_\x93\xb4 -\x17\x80}\xab\x03,\xc2\
+1\x99\xf9\xf9\xea\x10\xd2\x1c}\xb3:\xc0\x00=\x16\xf8\
+PD\x0c\xe5\x07\x1b\x15k\xb2\x00D\xc4\x06\xc0#\xab\
+s,\xd0\x7fd\xe6;\xabCHsv~u\x80\x81\
+:\x04\xf8\x80%@\x0b\xd1d\x01\x00\xf6\x00v\xa8\x0e\
+\xb1@/\xae\x0e \x15p\x05`\xe9\x1e\x0f\xbc/\x22\
+|\xae\x82\xd6\xa9\xd5\x02\xb0Ou\x80\x05:33\xbf\
+P\x1dB*\xf0\xc3\xea\x00\x03w\x18pjDlT\
+\x1dD\xfde\x01\xe8\xaf\x1b\x00\x0f\xfbQ\xab\xdc\x04\xb8\
+|\x87\x03\xffd\x09\xd0\xda4W\x00&\xdf\x0c\x8f\xa8\
+\xce\xb1\x00\xa7d\xe6\xb7\xabCHE.\xad\x0e0\x12\
+O\x05\xfeqr\xc2\xa2t\x0b-\xbe)\x1e\x00lS\
+\x1db=\xae\x03^]\x1dB*tYu\x80\x119\
+\x02x\x8f%@\xb7\xd6\xe2\x1b\xe2\x01\xd5\x01\x16\xe0]\
+\x99yQu\x08\xa9Jf\xae\x04~Q\x9dcD\x9e\
+\x0e\xfc\xdd\xe4\x0e(\x09h\xb3\x00\xdc\xa7:\xc0\x02|\
+\xa8:\x80\xd4\x03\xee\x03\x98\xaeg\x02\xef\xb2\x04\xe8&\
+-\x16\x80{W\x07X\x8f\x9f\x02_\xae\x0e!\xf5\xc0\
+5\xd5\x01F\xe8Y\xc0\xc9\x96\x00A\x9b\x05\xa0\xef+\
+\x00g\xfa\xb0\x1f\x09\x80\xeb\xab\x03\x8c\xd4\x9f\x02'U\
+\x87P\xbd\xa6\x0a\xc0\xe4\x9c\xec\xbbU\xe7X\x8f\x8fV\
+\x07\x90z\xc2\x020;GG\xc4[\xabC\xa8VS\
+\x05\x00\xb8\x07\xd0\xe7{b\xaf\x06\xce\xad\x0e!\xf5\x84\
+\x05`\xb6\x8e\x89\x887W\x87P\x9d\xd6\x0a@\xdf\x97\
+\xff?\x99\x99\xbf\xae\x0e!\xf5\xc4\x0d\xd5\x01\x1a\xf0|\
+W\x02\xda\xd5Z\x01\xe8\xfb\x06\xc0\x8fU\x07\x90z\xc4\
+\x15\x80\xf98&\x22\xde\xee\xc6\xc0\xf6\xb4V\x00\xeeP\
+\x1d`=|\x00\x8at3\x0b\xc0\xfc\x1c\x8dw\x074\
+\xa7\xb5\x02\xb0uu\x80\xf5\xb8\xa4:\x80\xd4#\x16\x80\
+\xf9\xfaS<'\xa0)\x16\x80\xfe\xb8\x1e\xcf?\x97V\
+\xe7\x1e\x80\xf9{\x16\xf0\xf7\x1e\x1b\xdc\x86\xd6\xfe#\xf7\
+\xb9\x00\xfcOf\xae\xaa\x0e!\xf5\x88+\x005\x9e\x89\
+\xcf\x0ehBk\xff\x81\xfb\x5c\x00\x5c\xfe\x97n\xc9\x02\
+P\xe7\xe9\xc0{}\x94\xf0\xb8Y\x00\xfa\xc3\x02 \xdd\
+\x92\x97\x00j\x1d\x01\xfc\xb3%`\xbc,\x00\xfda\x01\
+\x90n\xc9\x15\x80zO\x01\xfe%\x22VT\x07\xd1\xf4\
+\xb5V\x00\xb6\xaa\x0e\xb0\x0e\x16\x00\xe9\x96\xdc\x13\xd3\x0f\
+\x87\x03\xef\x8f\x88\x8d\xab\x83h\xbaZ+\x00}~\x03\
+{\x02\xa0\xa4\xbe:\x0c\xf8\xa0%`\x5cZ+\x00\x92\
+\xa4\xa59\x14\xf8\xf0\xe4\xa1j\x1a\x01\x0b\x80$i\xa1\
+\x0e\x01>\x12\x11\x9bV\x07\xd1\xf2Y\x00$I\x8b\xf1\
+X\xe0tK\xc0\xf0Y\x00$I\x8bu\x00\xf0QK\
+\xc0\xb0Y\x00$IK\xb1?\x96\x80A\xb3\x00H\x92\
+\x96\xca\x120`\x16\x00I\xd2rX\x02\x06\xca\x02 \
+IZ\xae\xfdqc\xe0\xe0X\x00$I\xd3p\x00\x96\
+\x80A\xb1\x00H\x92\xa6\xc5\x120 \x16\x00I\xd24\
+Y\x02\x06\xc2\x02 I\x9a\xb6\x03\xf0\xc4\xc0\xde\xb3\x00\
+H\x92f\xe1@,\x01\xbdf\x01\x90$\xcd\x8a%\xa0\
+\xc7,\x00\x92\xa4Y:\x108\xcd\xa7\x08\xf6\x8f\x05@\
+\x924k\x8f\xa5[\x09\xb0\x04\xf4\x88\x05@\x924\x0f\
+\x96\x80\x9e\xb1\x00H\x92\xe6\xc5\x12\xd0#\x16\x00I\xd2\
+<=\x16\xf7\x04\xf4\x82\x05@\x924o\x07a\x09(\
+g\x01\x90$U\xb0\x04\x14\xb3\x00H\x92\xaaX\x02\x0a\
+Y\x00$I\x95\x0e\x02>l\x09\x98?\x0b\x80$\xa9\
+\xda\xc1X\x02\xe6\xce\x02 I\xea\x03K\xc0\x9cY\x00\
+$I}q0\xf0\xa1\x88\xd8\xb8:H\x0b,\x00\x92\
+\xa4>9\x04xoD8?\xcd\x98\xff\x07K\x92\xfa\
+\xe6)\xc0\xdb\xaaC\x8c\x9d\x05@\x92\xd4GGG\xc4\
+q\xd5!\xc6\xcc\x02 I\xea\xabWE\xc41\xd5!\
+\xc6\xca\x02 I\xea\xb3\xb7D\xc4\x11\xd5!\xc6\xc8\x02\
+ I\xea\xb3\x0d\x80S\x22\xe2\xc0\xea cc\x01\x90\
+$\xf5\xdd\x0a\xba3\x02\xfe\xa8:\xc8\x98X\x00$I\
+C\xb09pVD\xfc^u\x90\xb1\xb0\x00H\x92\x86\
+b[\xe0\x9c\x88\xb8{u\x901\xb0\x00H\x92\x86\xe4\
+\x8e\xc0\xbfF\xc4\x1d\xab\x83\x0c\x9d\x05@\x9244w\
+\x07>\x1a\x11\x9bU\x07\x192\x0b\x80$i\x88\x1e\x0c\
+\xfcCu\x88!\xb3\x00H\x92\x86\xea\xa9\x11\xf1\x8a\xea\
+\x10Ce\x01\x90$\x0d\xd9k#\xe2\xb0\xea\x10Cd\
+\x01\x90$\x0d\xd9\x06tO\x0f\xfc\x83\xea Cc\x01\
+\x90$\x0d\xdd\x16\xc0\x19\x11\xb1su\x90!\xb1\x00H\
+\x92\xc6`W\xbc3`Q,\x00\x92\xa4\xb1x\x10\xde\
+\x19\xb0`\x16\x00I\xd2\x98<5\x22^Y\x1db\x08\
+,\x00\x92\xa4\xb19.\x22\x1eU\x1d\xa2\xef,\x00\x92\
+\xa4\xb1\xd9\x00\xf8\xc7\x88\xd8\xae:H\x9fY\x00$I\
+c\xb4\x0b\xf0\xce\xea\x10}f\x01\x90$\x8d\xd5\x13#\
+\xe2\xc8\xea\x10}e\x01\x90$\x8d\xd9[}|\xf0\x9a\
+Y\x00$Ic\xb6\x15\xf0O\x11\xb1Qu\x90\xbe\xb1\
+\x00H\x92\xc6nO\xe0e\xd5!\xfa\xc6\x02 Ij\
+\xc1\xab\x22\xe2A\xd5!\xfa\xc4\x02 Ij\xc1\x0a\xe0\
+T\x8f\x0a\xbe\x99\x05@\x92\xd4\x8a{\x02\xcf\xad\x0e\xd1\
+\x17\x16\x00IRK^\x16\x11\xdbT\x87\xe8\x03\x0b\x80\
+$\xa9%\xdb\x01/\xae\x0e\xd1\x07\x16\x00I}\xb5\xaa\
+:\x80F\xeb\x05\x11\xb1su\x88j\x16\x00I}\xf5\
+\xf3\xea\x00\x1a\xad-\x80WU\x87\xa8f\x01\x90\xd4W\
+\x17W\x07\xd0\xa8=+\x22\xeeY\x1d\xa2\x92\x05@R\
+_Y\x004K+\x80\x13\xaaCT\xb2\x00H\xea\xab\
+\x8b\xaa\x03h\xf4\x0e\x8f\x88?\xa8\x0eQ\xc5\x02 \xa9\
+\xaf\xbe\x06\x5cW\x1dB\xa3\xb6\x01\xf0\xec\xea\x10U,\
+\x00\x92z)3\xaf\x05>U\x9dC\xa3wX\xab\x0f\
+\x0a\xb2\x00H\xea\xb3\x8fV\x07\xd0\xe8\xed\x08<\xb2:\
+D\x05\x0b\x80\xa4>;\x03\xb8\xb6:\x84F\xef\xc9\xd5\
+\x01*X\x00$\xf5Vf^\x01\xbc\xb9:\x87F\xef\
+\x09\x11\xb1\xa2:\xc4\xbcY\x00$\xf5\xdd\x1b\x80\xcb\xaa\
+Ch\xd4\xb6\x07\x1eU\x1db\xde,\x00\x92z-3\
+\xaf\x04\x8e\xaf\xce\xa1\xd1k\xee2\x80\x05@\xd2\x10\x9c\
+\x04\x9cY\x1dB\xa3vhkw\x03X\x00$\xf5^\
+f\xde\x08\x1c\x01\x9c_\x9dE\xa3u{`\xd7\xea\x10\
+\xf3d\x01\x904\x08\x99y\x15p\x08\xf0\xd3\xea,\x1a\
+\xad\xdd\xaa\x03\xcc\x93\x05@\xd2`d\xe6\x85\xc0\x83\x81\
+oTg\xd1(\xdd\xb9:\xc0<Y\x00$\x0dJf\
+\xfe\x10\xf8#<$H\xd3g\x01\x90\xa4>\xcb\xcck\
+\x80'\x00G\x01\x97\x14\xc7\xd1xx\x09@\x92\xfa.\
+3We\xe6\xbb\x81{\x02\xaf\x04\xae*\x8e\xa4\xe1s\
+\x05@\x92\x86\x223\xaf\xcd\xcc\x13\x80;\x01\x87\x01\xef\
+\x05.\xafM\xa5\x81j\xaa\x004w\xf4\xa1\xa4q\xca\
+\xcc\xab\x81\x8f\x00\x1f\x99\xdc\xcf}o`\x17\xbab\xb0\
+\x0b\xb05\xdd\xe3_[\xb0!\xb0\xc9\x02^\x9b\xde\xea\
+\xd7\x9b\x01;M~\xbfEw\xaa\x0e0O\x16\x00I\
+\xa3\x93\x997\x00\xdf\x99\xbc\xb4H\x11q\x07\xba{\xe2\
+w\x99|\xdc\x15\xb8\x17\xf0\xb0\xc9\xef\x8d\xd5\xc6\xd5\x01\
+\xe6\xc9\x02 I\xba\x85\xcc\xbc\x8c\xee\xf9\x0b_\xbf\xf5\
+\xbf\x8b\x88\xbb\x03\x0f\x9f\xbc\xf6\xa2\xdb\x83\xa1\x01\xb2\x00\
+H\x92\x16,3\xff\x0b\xf8/\xe0\x14\x80\x88\xb8\x1f\xf0\
+\x22\xe0i4\xf6\x13\xf4\xd0\xb9\x09P\x92\xb4d\x99\xf9\
+\xad\xcc<\x12\xb8\x07\xdd\xa3\x9b\xaf\xa9M\xa4\x85\xb2\x00\
+H\x92\x96-3\x7f\x9c\x99\xc7\xd2\xed\xa4\xff\xfb\xea<\
+Z?\x0b\x80$ij2\xf3\x8a\xcc|\x16\xf0\xea\xea\
+,Z7\x0b\x80$i\xea2\xf3\xb5\xc0\xb3\x81\x1b\xaa\
+\xb3h\xcd,\x00\x92\xa4\x99\xc8\xcc\xbf\x03\x1e\x0f\x5cW\
+\x9dE\xb7e\x01\x90$\xcdLf\x9e\x09\xbc\xbc:\x87\
+n\xcb\x02 I\x9a\xb5\xb7\x02Y\x1dB\xb7d\x01\x90\
+$\xcd\xd4\xe4d\xc6\x17W\xe7\xd0-Y\x00$I3\
+\x97\x99\x9f\x05\xbeW\x9dC7\xb3\x00H\x92\xe6\xe5\xef\
+\xaa\x03\xe8f\x16\x00I\xd2\xbc|\xb5:\x80nf\x01\
+\x90$\xcd\xcb\x05\xd5\x01t3\x0b\x80$i^.\x06\
+~U\x1dB\x1d\x0b\x80$i.2s\x15pau\
+\x0eu,\x00\x92\xa4y\xf22@OX\x00$I\xf3\
+d\x01\xe8\x09\x0b\x80$i\x9e\xfe\xa7:\x80:\x16\x00\
+I\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\
+\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9A\x16\
+\x00I\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1ad\
+\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9A\
+\x16\x00I\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1a\
+d\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9\
+A\x16\x00I\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\
+\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90$\
+\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9A\x16\x00I\
+\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90\
+$\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9A\x16\x00\
+I\x92\x1ad\x01\x90$\xa9A\x16\x00I\x92\x1ad\x01\
+\x90$\xa9A\x16\x00I\x92\x1ad\x01\x90$\xa9A+\
+\xaa\x03H\xea\xa7\x88\xd8\x08x\x10\xb0\x0bpG\xe0*\
+\xe0\xeb\xc0\xb73see6I\xcbg\x01\x90t\x0b\
+\x11q\x0f\xe0\xb9\xc0\xd3\x80\x9d\xd6\xf0G\xae\x8d\x88w\
+\x02\x7f\x93\x99\x97\xcc5\x9c\xa4\xa9\xf1\x12\x80\xa4\xdf\x8a\
+\x88\xff\x0d|\x038\x965O\xfe\x00[L\xfe\xfd\x85\
+\x11\xf1\x8a\x88p\x1c\x91\x06\xc8o\x5cI\x00D\xc4;\
+\x80\xbf\x07\xb6\x5c\xe0_\xd9\x148\x1e\xf8LD\xec:\
+\xb3`\x92f\xc2\x02 \x89\x88x\x0e\xf0\x9c%\xfe\xf5\
+G\x00\xdf\x88\x88C\xa7\x18I\xd2\x8cY\x00\xa4\xc6E\
+\xc4\xfd\x80\xb7,\xf3\xd3l\x07\x9c\x1e\x11\xef\x88\x88\xcd\
+\xa6\x10K\xd2\x8cY\x00$\xbd\x10\xd8xJ\x9f\xeb9\
+\xc0\xd7&\xa5BR\x8fY\x00\xa4\x86E\xc4\xf6t\xbb\
+\xfd\xa7i\x0f\xba\x12\xb0\xd4K\x0a\x92\xe6\xc0\x02 \xb5\
+mO`\x16K\xf6\x9b\x03\xef\x88\x88\xd3#b\xbb\x19\
+|~I\xcbd\x01\x90\xdav\x8f\x19\x7f\xfeC\xe96\
+\x08>b\xc6_G\xd2\x22Y\x00\xa4\xb6\xddm\x0e_\
+cW\xba[\x05_;9]PR\x0fX\x00\xa4\xb6\
+m:\xa7\xaf\xb3!\xf0J\xe0\xf3\x11q\x979}M\
+I\xeb`\x01\x904O{\x02_\x8f\x88'U\x07\x91\
+Zg\x01\x904o\xdb\x02\x1f\x8c\x88\xbf\xf5\x92\x80T\
+\xc7\x02 \xa9\xca\xff\x01\xce\x8a\x88m\xaa\x83H-\xb2\
+\x00H\xaa\xb4?\xf0\x95\x88\xb8wu\x10\xa95\x16\x00\
+I\xd5\xeeCW\x02\xf6\xab\x0e\x22\xb5\xc4\x02 \xa9\x0f\
+\xb6\x05\xce\x8e\x88c\xab\x83H\xad\xb0\x00H\xea\x8b\x8d\
+\x807F\xc4{\x22b^\xb7'J\xcd\xb2\x00H\xea\
+\x9b#\x81\xcfF\xc4N\xd5A\xa41\xb3\x00H\xea\xa3\
+\x87\x02\x19\x11\x0f\xa8\x0e\x22\x8d\x95\x05@R_\xed\x0a\
+|1\x22\x9e\x5c\x1dD\x1a#\x0b\x80\xa4>\xdb\x1cx\
+\x7fD\x9c\x10\x11\x1bT\x87\x91\xc6\xc4\x02 i\x08^\
+\x0e\x9c\x1e\x11\xb7\xab\x0e\x22\x8d\x85\x05@\xd2P<\x0e\
+\xf8rD\xecV\x1dD\x1a\x03\x0b\x80\xa4!\xd9\x83\xae\
+\x04\xecQ\x1dD\x1a:\x0b\x80\xa4\xa1\xd9\x05\xf8BD\
+<\xbc:\x884d\x16\x00IC\xb4-\xf0\xa9\x888\
+\xac:\x884T\x16\x00IC\xb5)\xddc\x85\x9fW\
+\x1dD\x1a\x22\x0b\x80\xa4!\xdb\x10x[D\xbc\xae:\
+\x8844\x16\x00Ic\xf0\xd2\x888%\x22VT\x07\
+\x91\x86\xc2\x02 i,\x9e\x01\x9c\x19\x11[V\x07\x91\
+\x86\xc0\x02 iL\xf6\xa7{\x90\xd0\x0e\xd5A\xa4\xbe\
+\xb3\x00H\x1a\x9b\x07\x02_\x8a\x88\xbbW\x07\x91\xfa\xcc\
+\x02 i\x8c\xeeIw`\xd0\x1fV\x07\x91\xfa\xca\x02\
+ i\xacv\x04>\x17\x11\x8f\xa9\x0e\x22\xf5\x91\x05@\
+\xd2\x98\xdd\x0e8+\x22\x9eP\x1dD\xea\x1b\x0b\x80\xa4\
+\xb1\xdb\x18\xf8@D<\xb5:\x88\xd4'\x16\x00I-\
+X\x01\xfcsD\x1cY\x1dD\xea\x0b\x0b\x80\xa4Vl\
+\x08\xfcCD\xfcYu\x10\xa9\x0f,\x00\x92Z\xb2\x01\
+prD\xbc\xa0:\x88T\xcd\x02 \xa9Eo\x8a\x88\
+\x97T\x87\x90*Y\x00$\xb5\xea\xf5\x11\xf1\x9a\xea\x10\
+R\x15\x0b\x80\xa4\x96\xbd:\x22\xdeP\x1dB\xaa`\x01\
+\x90\xd4\xba\x17G\xc4[\xaaCH\xf3f\x01\x90\x1a\x15\
+\x11[\x01[U\xe7\xe8\x89?\x8f\x88wF\xc4\x06\xd5\
+A\xa4y\xf1\xd9\xd9\xd2\x08E\xc4\xa6\xc0\xae\xc0n\x93\
+\xd7\x9dW\xfb\xe7\x9b~\xbdMY\xc0~:\x0a\xd84\
+\x22\xfe$3o\xa8\x0e#\xcd\x9a\x05@\x1a\x98\x88\xd8\
+\x10\xd8\x995O\xea7\xfd\xf3\x8et\xb7\xbciq\x9e\
+\x01\x10\x11\xcf\xcc\xccU\xd5a\xa4Y\xb2\x00H=0\
+Yz\xbe=\xb0\x03p\x875|\xdc\x99\x9b'\xf9;\
+\xe1\xf7\xee,=\x03\xb8\x06xnu\x10i\x96\x1cD\
+\xa4\x19\x88\x88\xcdX\xf3D\xbe\xb6\x8f\xdb\x03\x1b\x95\x84\
+\xd5\x9a\x1c\x1d\x11Wg\xe6_V\x07\x91f\xc5\x02 \
+-@DlC7Y\xef@\xb7\xbc\xbe\xbe\x09\xfdv\
+5I5E/\x9e\x94\x80\xe3\xab\x83H\xb3`\x01P\
+\x93\x22bkn;\xa1\xef\xb8\x8e\xdf\xdb\xa4&\xa9\x8a\
+\xbdvR\x02\xdeT\x1dD\x9a6\x0b\x80F#\x22\xb6\
+\x03\xeeB\xb7\xfb}}\x13\xfb\xa6E15<o\x8c\
+\x88k2\xf3]\xd5A\xa4i\xb2\x00h0&\x1b\xe5\
+\xf6\x00\xeeO\xb7\x19\xee\xcet\x13\xfeM\xff\xbce]\
+:\x8d\xdc\xc9\x93\x12pju\x10iZ,\x00\xea\xb5\
+\x88\xd8\x048\x1a\xd8\x1bx\x18\xb0]m\x225jC\
+\xe0\x94\x88\xb863O\xaf\x0e#M\x83'\x01\xaa\xb7\
+&'\xd5\x9d\x0d\xbc\x098\x04'\x7f\xd5Z\x01\xbc?\
+\x22\xf6\xaf\x0e\x22M\x83\x05@\xbd4\xb9\x8d\xee\x5c`\
+\xdf\xea,\xd2j6\x01>\x12\x11\x8f\xa8\x0e\x22-\x97\
+\x05@}\xf56\xe0A\xd5!\xa45\xd8\x1c83\x22\
+|\x7fj\xd0,\x00\xea\x9d\x88x\x1a\xf0\xac\xea\x1c\xd2\
+:l\x05|2\x22~\xaf:\x88\xb4T\x16\x00\xf5J\
+D\xac\x00N\xa8\xce!-\xc0\xed\x81\x7f\x8d\x88\xfbT\
+\x07\x91\x96\xc2\x02\xa0\xbey\x0ap\xb7\xea\x10\xd2\x02\xed\
+\x08|:\x22|\xcfjp,\x00\xea\x8d\xc9}\xfe/\
+\xa9\xce!-\xd2.\xc0\xb9\x11\xb1Ku\x10i1,\
+\x00\xea\x93\xc7\x01\xf7\xab\x0e!-\xc1\xdd\xe9J\xc0\x0e\
+\xd5A\xa4\x85\xb2\x00\xa8O^V\x1d@Z\x86\xfb\xd2\
+\xed\x09\xd8\xb6:\x88\xb4\x10\x16\x00\xf5BD\xec\x05<\
+\xb0:\x87\xb4L\xbfOww\x80O\x83T\xefY\x00\
+\xd4\x17\x07V\x07\x90\xa6\xe4\xc1\xc0\x87'w\xb4H\xbd\
+e\x01P_\xec]\x1d@\x9a\xa2\xfd\x80\x93\xabCH\
+\xebb\x01P\xb9\x88\xd8\x1a\x88\xea\x1c\xd2\x94=+\x22\
+\xdc\xd7\xa2\xde\xb2\x00\xa8\x0f\xf6\x026\xaa\x0e!\xcd\xc0\
+\x09\x93\x93-\xa5\xde\xb1\x00\xa8\x0f\xf6\xa9\x0e \xcd\xc8\
+\x06\xc0{|x\x90\xfa\xc8\x02\xa0>\xf0\xfa\xbf\xc6l\
+\x13\xe0\xf4\x88\xd8\xbd:\x88\xb4:\x0b\x80JM\xae\xff\
+\xff~u\x0ei\xc6n\x0f|<\x22v\xaa\x0e\x22\xdd\
+\xc4\x02\xa0j\xbb\xe1\xfbPm\xb8+pVDlQ\
+\x1dD\x02\x07^\xd5\xdb\xb1:\x804G\x01\xbc\xa2:\
+\x84\x04\x16\x00\xd5\xb3\x00\xa85/\x88\x88]\xabCH\
+\x16\x00U\xb3\x00\xa85\x9b\x03\xaf\xad\x0e!Y\x00T\
+\xcd\x02\xa0\x16=\xa1:\x80d\x01P5\x0b\x80Z\xb4\
+MD\xdc\xa9:\x84\xdaf\x01P5o\x8bR\xab<\
+\x17@\xa5,\x00\xaa\xb6Yu\x00\xa9\xc8\xd6\xd5\x01\xd4\
+6\x0b\x80\xaa]V\x1d@*\xf2\xdd\xea\x00j\x9b\x05\
+@\xd5~V\x1d@*\xb0\x12\xf8\xcf\xea\x10j\x9b\x05\
+@\xd5.\xad\x0e \x158/3WV\x87P\xdb,\
+\x00\xaa\xe6\x0a\x80Z\xf4\xea\xea\x00\x92\x05@\xd5\x5c\x01\
+Pk\xce\xcd\xccs\xaaCH\x16\x00Us\x05@-\
+\xb9\x168\xb6:\x84\x04\x16\x00\xd5s\x05@\xad\xb8\x01\
+xJf\x9e_\x1dD\x02\x0b\x80\xea\xfd\x88\xee\xa7\x22\
+i\xec\xfe<3\xcf\xac\x0e!\xdd\xc4\x02\xa0R\x93\x9d\
+\xd0_\xa9\xce!\xcd\xd8\xdfd\xe6;\xaaCH\xab\xb3\
+\x00\xa8\x0f\xbeP\x1d@\x9a\xa1\x0f\x00\x7fY\x1dB\xba\
+5\x0b\x80\xfa\xc0\x02\xa0\xb1\xfa\x02\xf0\x8c\xcc\x5cU\x1d\
+D\xba5\x0b\x80\xfa\xe0\xcb\xc0\xf5\xd5!\xa4)\xfb.\
+phf\xfe\xba:\x88\xb4&\x16\x00\x95\xcb\xcck\x80\
+\xf3\xaasHS\xf4S\xe0\xc0\xcc\xbc\xa2:\x88\xb46\
+\x16\x00\xf5\x85\x97\x014\x16W\x01\x07e\xe6\x85\xd5A\
+\xa4u\xb1\x00\xa8/>W\x1d@\x9a\x82\xeb\xe8&\xff\
+\xac\x0e\x22\xad\x8f\x05@}\xf1\x09\xba3\x01\xa4\xa1\xfa\
+\x0d\xf0\xf8\xcc\xfc|u\x10i!,\x00\xea\x85\xcc\xbc\
+\x018\xa9:\x87\xb4D\xd7\xd3\x9d\xf2\xe7\x19\xff\x1a\x0c\
+\x0b\x80\xfa\xe4\xdd\xc05\xd5!\xa4E\xba\x11823\
+O\xaf\x0e\x22-\x86\x05@\xbd\x91\x99\xbf\x00N\xa9\xce\
+!-\xd2\x9fe\xe6\xa9\xd5!\xa4\xc5\xb2\x00\xa8o\xde\
+\x02xh\x8a\x86\xe2\x85\x99\xf9\xee\xea\x10\xd2RX\x00\
+\xd4+\x99\xf9\x03\xe0\xec\xea\x1c\xd2\x02\xbc*3\xdfT\
+\x1dBZ*\x0b\x80\xfa\xe8/\xe9n\xa7\x92\xfa\xea\xaf\
+3\xf3\xf8\xea\x10\xd2rX\x00\xd4;\x99\xf9m\xe0/\
+\xaasHk\xf1\xf6\xcc\xf4\xe1>\x1a<\x0b\x80zi\
+\xf2\xe8T7V\xa9oN\x01\x8e\xa9\x0e!M\x83\x05\
+@}\xf6t\xba[\x03\xa5>\xf8\x10\xf0,\x9f\xec\xa7\
+\xb1XQ\x1d@Z\x9b\xcc\xbc\x118*\x22\xce\x02\xf6\
+\x02\xf6\x04\xfe\x10\xd8\xb44\x98Zt6p\xc4\xe4\xc0\
+*i\x14,\x00\xea\xbd\xcc<\x038\x03 \x226\x01\
+\xee\x05\xec\x0c\xdci-\x1fw\x02\xb6,\x09\xab1\xfa\
+\x0c\xf0\xc4\xcc\x5cY\x1dD\x9a&\x0b\x80\x06%3\x7f\
+\x03|k\xf2Z\xab\x88\xd8\x18\xd8v\x0d\xaf\xdb\xaf\xe7\
+\xd77\xfd\x9e\xab\x0c\x02\xf8\x12pHf\xfe\xaa:\x88\
+4m\x16\x00\x8d\xd2\xe4\xa7\xb5K'\xafE\x8b\x88\xcd\
+XwIX\xdfk\x93\xe5\xfd/P\x0f\x9c\x07\x1c\x98\
+\x99\x1eO\xadQ\xb2\x00Hk0\xf9\x89\xef\x7f&\xaf\
+E\x8b\x88\xcdYs1\xd8f-\xbf\x7f\xeb\x97+\x10\
+\xb5\xbe\x0d\xec\x97\x99\xbf\xac\x0e\x22\xcd\x8a\x05@\x9a\x81\
+\xcc\xbc\x8e\xee0\xa3K\x96\xf2\xf7o\xb5\x02\xb1-\xb0\
+\x1d\xb0\xe3j\xaf\x1d\xd6\xf0kK\xc3t\x5c\x00\xec\x9b\
+\x99\x97U\x07\x91f\xc9\x02 \xf5\xd0RV \x22b\
+kn.\x04;\x01w\x05\xee\xb6\xda\xeb\xae\xb89r\
+}.\x04\x1e\x95\x99K*n\xd2\x90X\x00\xa4\x91\xc8\
+\xcc+\x81+\x81\xff\x5c\xdb\x9f\x89\x88\x1d\xb9e)x\
+\x1a\xb0\xc7\x5c\x02\xf6\xdf\xf7\xe9&\xff\x9fT\x07\x91\xe6\
+\xc1\x02 5$3\x7f\x06\xfc\x0c\xf8\x0a@D\xdc\x05\
+\x0b\x00tw\x95\xec\x9b\x99K\xda\xf3!\x0d\x91'\x01\
+Jj\xdd\xd7\x81G:\xf9\xab5\x16\x00I-\xfb\x1a\
+\xb0\x8f\x1b\xfe\xd4\x22\x0b\x80\xa4V\xfd;\xdd\xb2\xff\xcf\
+\xab\x83H\x15,\x00\x92Z\xf4Y\xba\xfb\xfc\xaf\xac\x0e\
+\x22U\xb1\x00Hj\xcd9\xc0c=\xe1O\xad\xb3\x00\
+Hj\xc9\x99\xc0\xe3&\x075IM\xb3\x00Hj\xc5\
+\x87\x81\xc32\xf3\xd7\xd5A\xa4>\xb0\x00Hj\xc1\xa9\
+\xc0S|\xa4\xaft3\x0b\x80\xa4\xb1{\x17\xf0\xf4\xcc\
+\xbc\xa1:\x88\xd4'\x9e\x04(i\xcc\x8e\xcb\xcc\xd7T\
+\x87\x90\xfa\xc8\x02 i\x8cn\x00\x8e\xce\xccwU\x07\
+\x91\xfa\xca\x02 il\xae\x03\x9e\x9a\x99\x1f\xab\x0e\x22\
+\xf5\x99\x05@\xd2\x98\x5c\x01\x1c\x92\x99\xff^\x1dD\xea\
+;\x0b\x80\xa4\xb1\xf81\xdd\xe9~\xdf\xa9\x0e\x22\x0d\x81\
+w\x01H\x1a\x83\xf3\x81\x87:\xf9K\x0bg\x01\x904\
+t\x9f\x07\xf6\xca\xcc\x8b\xaa\x83HCb\x01\x904d\
+\xa7\x01\x8f\xc9\xcc_T\x07\x91\x86\xc6\x02 i\xa8\xde\
+\x01\x1c\xee\xd1\xbe\xd2\xd2\xb8\x09P\xd2\x10\xbd\x223O\
+\xac\x0e!\x0d\x99\x05@\xd2\x90\x5c\x0f\x1c\x95\x99\xef\xa9\
+\x0e\x22\x0d\x9d\x05@\xd2P\x5cA\xb7\xe4\xff\xe9\xea \
+\xd2\x18X\x00$\x0d\xc1\xb7\x80\xc7e\xe6\x05\xd5A\xa4\
+\xb1p\x13\xa0\xa4\xbe;\x83\xee\x1e\x7f'\x7fi\x8a,\
+\x00\x92\xfa\xecD\xe0\xd0\xcc\xbc\xaa:\x8846^\x02\
+\x90\xd4G\xd7\x02\xcf\xcc\xcc\x0fV\x07\x91\xc6\xca\x02 \
+\xa9o~D\xf7S\xff\xff\xab\x0e\x22\x8d\x99\x97\x00$\
+\xf5\xc9\x17\x81\x07:\xf9K\xb3g\x01\x90\xd4\x17\xef\x06\
+\xf6\xc9\xcc\x9fU\x07\x91Z\xe0%\x00I\xd5\xae\x07^\
+\x90\x99o\xaf\x0e\x22\xb5\xc4\x02 \xa9\xd2\xe5\xc0\x932\
+\xf3\xb3\xd5A\xa4\xd6X\x00$U\xf9&\xdd\xe1>\x17\
+V\x07\x91Z\xe4\x1e\x00I\x15\xde\x0f\xec\xe9\xe4/\xd5\
+q\x05@\xd2<]\x03\x1c\xe3\xc3|\xa4z\x16\x00\xa9\
+m7\xce\xf1k\x9d\x07<53\xbf?\xc7\xaf)i\
+-\xbc\x04 \xb5\xed\xe29|\x8dU\xc0\x1b\xe9\xce\xf3\
+w\xf2\x97z\xc2\x15\x00\xa9m\xb3~\xc0\xce\xcf\x80g\
+d\xe6'g\xfcu$-\x92+\x00R\xdb\xbe1\xc3\
+\xcf}\x0e\xf0{N\xfeR?Y\x00\xa4\x86e\xe6\xb7\
+\x81/L\xf9\xd3\xfe\x06\xf8\x0b\xe0\x80\xcc\xfc\xe9\x94?\
+\xb7\xa4)\xf1\x12\x80\xa4\xb7\x02{M\xe9s\xfd\x80n\
+\xa3\xdf\xff\x9d\xd2\xe7\x934#\xae\x00H:m\xf2Z\
+\xae\x7f\x04\x1e\xe0\xe4/\x0d\x83\x05@j\x5cf\xae\x02\
+\x9e\x01\x9c\xbf\xc4Oq%\xf0\xb4\xcc<23\xaf\x9e\
+^2I\xb3d\x01\x90Df^\x03\xec\x0d\x9c\xbd\xc8\
+\xbf\xfa\x15\xe0\xfe\x99\xf9\xbe\xe9\xa7\x924K\x16\x00I\
+\x00d\xe6e\xc0\xc1\xc0\xf3\x81\x9f\xac\xe7\x8f_\x08<\
+\x1bx\x98\xc7\xf9J\xc3\xe4&@I\xbf5\xb9\x1c\xf0\
+\xd6\x888\x89nE\xe0`\xe0\x8e\xc0\x0e\xc0\xd5t\x0f\
+\xf09\x0f833W\x96\x05\x95\xb4l\x16\x00I\xb7\
+\x91\x997\x02\x9f\x9e\xbc$\x8d\x90\x97\x00$Ij\x90\
+\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06\
+Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\
+\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\
+\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$I\
+j\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\
+\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$\
+Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\
+\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00\
+$Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05\
+@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\
+\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\
+\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06\
+Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\
+\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\
+\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$I\
+j\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\
+\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00$\
+Ij\x90\x05@\x92\xa4\x06Y\x00$Ij\x90\x05@\
+\x92\xa4\x06Y\x00$Ij\x90\x05@\x92\xa4\x06Y\x00\
+$Ij\x90\x05@\x92\xa4\x06\xb5V\x00VV\x07X\
+\x87M\xab\x03H\xd2\x1c\xf4y\xac\xeb\xf3\x1c1u\xad\
+\x15\x80\xab\xaa\x03\xac\xc3\xce\xd5\x01$i\x0e\xfa<\xd6\
+\xf5y\x8e\x98\xba\xd6\x0a\xc0\x95\xd5\x01\xd6\xa1\xcf\xdf\x14\
+\x924-}\x1e\xeb\xfa<GL\x9d\x05\xa0?\xfa\xfc\
+M!I\xd3\xd2\xe7\xb1\xae\xcfs\xc4\xd4Y\x00\xfa\xa3\
+\xcf\xdf\x14\x924-}\x1e\xeb\xfa<GL\x9d\x05\xa0\
+?\xee\x18\x11\x1bT\x87\x90\xa4Y\x99\x8cqw\xac\xce\
+\xb1\x0e}\x9e#\xa6\xce\x02\xd0\x1f+\x80\x1d\xaaCH\
+\xd2\x0c\xed@7\xd6\xf5U\x9f\xe7\x88\xa9\xb3\x00\xf4K\
+\x9f\x97\xc6$i\xb9\xfa>\xc6\xf5}\x8e\x98\xaa\xd6\x0a\
+\xc0e\xd5\x01\xd6\xe3w\xab\x03H\xd2\x0c\xf5}\x8c\xeb\
+\xfb\x1c1U\xad\x15\x80\xefW\x07X\x8f\xc7U\x07\x90\
+\xa4\x19\xea\xfb\x18\xd7\xf79b\xaaZ+\x00\xdf\xab\x0e\
+\xb0\x1e\xfbGD\x9fO\xc9\x92\xa4%\x99\x8cm\xfbW\
+\xe7X\x8f\xbe\xcf\x11S\xd5Z\x01\xb8\x00\xb8\xa1:\xc4\
+:\xdc\x0e\xd8\xb7:\x84$\xcd\xc0\xbetc\x5c_\xdd\
+@7G4\xa3\xa9\x02\x90\x99\xbf\x01.\xac\xce\xb1\x1e\
+\x87V\x07\x90\xa4\x19\xe8\xfb\xd8v\xe1d\x8ehFS\
+\x05`\xa2\xefK<\x07GD\x8b\xff]$\x8d\xd4d\
+L;\xb8:\xc7z\xf4}n\x98\xba\x16'\x9a\xbeo\
+\xf2\xd8\x09xhu\x08I\x9a\xa2\x87\xd2\x8dm}\xd6\
+\xf7\xb9a\xeaZ,\x00ChyO\xaa\x0e IS\
+4\x841m\x08s\xc3T\xb5X\x00\xce\xab\x0e\xb0\x00\
+GE\xc4.\xd5!$i\xb9&c\xd9Q\xd59\x16\
+`\x08s\xc3T\xb5Z\x00~Y\x1db=6\x07\x8e\
+\xab\x0e!ISp\x1c\xdd\x98\xd6g\xbf\xc4\x020~\
+\x99y\x03\xf0o\xd59\x16\xe0\xc8\x88\xf8\x9d\xea\x10\x92\
+\xb4T\x931\xec\xc8\xea\x1c\x0b\xf0o\x93\xb9\xa1)\xcd\
+\x15\x80\x89\xcfT\x07X\x80\x8d\x80\xbf\xaa\x0e!I\xcb\
+\xf0WtcY\xdf\x0daN\x98:\x0b@\xbf\x1d\x1c\
+\x11{U\x87\x90\xa4\xc5\x9a\x8c]}\xbf\xf5\xef&C\
+\x99\x13\xa6\xaa\xd5\x02p>piu\x88\x05\xfa\xeb\xea\
+\x00\x92\xb4\x04C\x19\xbb.\xa5\x9b\x13\x9a\xd3d\x01\xc8\
+\xccU\xc0\xe7\xaas,\xd0C\x22\xe2O\xabCH\xd2\
+BM\xc6\xac\x87T\xe7X\xa0\xcfM\xe6\x84\xe64Y\
+\x00&\xce\xad\x0e\xb0\x08o\x8b\x88\x87W\x87\x90\xa4\xf5\
+\x99\x8cUo\xab\xce\xb1\x08C\x9a\x0b\xa6\xaa\xe5\x02p\
+\x1a\xb0\xb2:\xc4\x02m\x0c\x9c\x16\x11w\xab\x0e\x22I\
+k3\x19\xa3N\xa3\x1b\xb3\x86`%]\xde&5[\
+\x002\xf3r\xe0\xec\xea\x1c\x8bp\x07\xe0\x8c\x88\xd8\xaa\
+:\x88$\xdd\xdadl:\x83n\xac\x1a\x8a\xb3's\
+A\x93\x9a-\x00\x13\xef\xad\x0e\xb0H{\x00\xa7\xfa\xb0\
+ I}2\x19\x93N\xa5\x1b\xa3\x86dhs\xc0T\
+\xb5>\x91\x9c\x0d\x0c\xad\xfd\x1d\x0c\xbc\xae:\x84$\xad\
+\xe6u\x0c\xe7\x96\xbf\x9b\x0cm\x15x\xea6X\xb5\xaa\
+\xc9\xcd\x8f\xbf\x15\x11'\x01\xcf\xad\xce\xb1\x04\xaf\x07^\
+\x91\x997V\x07\x91\xd4\xa6\xc9O\xfe'\x00/\xad\xce\
+\xb2\x04o\xcf\xcc\xe7U\x87\xa8\xd4\xfa\x0a\x00\x0cw\x09\
+\xe8\xa5\xc0\xe9\xee\x09\x90Ta2\xf6\x9c\xce0'\x7f\
+\x18\xee\xd8?5\xcd\xaf\x00\x00D\xc4w\x80\xfbV\xe7\
+X\xa2\xd0\x9fY\x04\x00\x00\x05\x83IDAT\xf3\x81\
+C2\xf3\xc2\xea \x92\xda0\xd9\xed\x7f\x06\xc3\xbb\xe6\
+\x7f\x93\xeff\xe6\xee\xd5!\xaa\xb9\x02\xd0ysu\x80\
+e\xd8\x03\xf8ZD<\xb2:\x88\xa4\xf1\x9b\x8c5_\
+c\xb8\x93?\x0c{\xcc\x9f\x1a\x0b@\xe7\x14\xe0\xe2\xea\
+\x10\xcb\xb0=\xf0\xa9\x88xNu\x10I\xe35\x19c\
+>E7\xe6\x0c\xd5\xc5tc~\xf3\xbc\x040\x11\x11\
+\xc7\x02o\xac\xce1\x05_\x04^\x94\x99\xffQ\x1dD\
+\xd28D\xc4C\x80\xbf\x01\x1eV\x9de\x0a^\x98\x99\
+o\xaa\x0e\xd1\x07\x16\x80\x89\x88\xd8\x12\xf8o\x86u\x88\
+\xc5\xba\x9c\x06\xbc43\x7fP\x1dD\xd20E\xc4\xbd\
+\xe8\xee8:\xac:\xcb\x94\x5c\x06\xdc53\xaf\xa9\x0e\
+\xd2\x07\x16\x80\xd5D\xc4+\x80\xe3\xabsL\xd1J\xe0\
+]\xc0q\x999\x94\xa7\x1fJ*\x16\x11;\x00\xaf\x06\
+\x8eb8\xc7\xfa.\xc4+3\xf3\x84\xea\x10}a\x01\
+XMDl\x0b\xfc\x10\xd8\xba:\xcb\x94]\x05\xbc\x05\
+x\x7ff~\xab:\x8c\xa4~\x8a\x88\xfb\x01O\x01\x9e\
+\x0f\x8c\xed\x16\xe3+\x81\xbbd\xe6/\xaa\x83\xf4\x85\x05\
+\xe0V\x22\xe2D\xe0e\xd59f\xe8\x02\xe0\xa3\xc0\xc7\
+\x80/e\xe6\x0d\xc5y$\x15\x89\x88\x8d\x80=\x81\xc7\
+\x01\x87\x02\xf7\xa8M4S\xaf\xcb\xcc\x97W\x87\xe8\x13\
+\x0b\xc0\xadL\x0e\xb7\xf8.p\xa7\xea,sp\x19p\
+\x16]\x19\xf8:pIf\xfe\xba6\x92\xa4Y\x89\x88\
+M\x81\x9d\x81\xfb\xd3M\xfa\x071\x9e}O\xebr1\
+p\xdf\xcc\xbc\xaa:H\x9fX\x00\xd6 \x22\x0e\x07>\
+P\x9d\xa3\xc8\xe5\xc0Et\xdf0\xab\xbf\xae\xab\x0c%\
+iQ6\xa7\xfb!f\xf5\xd7.\x0c\xfb\xf6\xbd\xe5x\
+rf~\xb0:D\xdfX\x00\xd6\x22\x22\xce\x01\x1eS\
+\x9dC\x92\xb4,\x9f\xca\xcc\xfd\xaaC\xf4\x91\x07\x01\xad\
+\xdd\xf3\x00\x97\xc3%i\xb8~M7\x96k\x0d,\x00\
+k1\xb9\x7f\xfe\x0d\xd59$IK\xf6\x06\xcfBY\
+;\x0b\xc0\xba\xbd\x9en\xd7\xbc$iX.\xa0\x1b\xc3\
+\xb5\x16\x16\x80u\xc8\xcc_\x01\xcf\x06n\xac\xce\x22I\
+Z\xb0\x1b\x81gO\xc6p\xad\x85\x05`=2\xf3\xb3\
+\x8c\xebt@I\x1a\xbb\xe3'c\xb7\xd6\xc1\x02\xb00\
+\xaf\x05|3IR\xff}\x96n\xcc\xd6zx\x1b\xe0\
+\x02E\xc4\xcet\x87\xe5\xecX\x9dE\x92\xb4F?\x03\
+\xee\x9f\x99\x97T\x07\x19\x02W\x00\x16h\xf2\x86:\x02\
+\xf7\x03HR\x1f\xdd\x08\x1c\xe1\xe4\xbfp\x16\x80E\xc8\
+\xccs\x81\xd7U\xe7\x90$\xdd\xc6\xeb&c\xb4\x16\xc8\
+\x02\xb0x\xaf\x01>Q\x1dB\x92\xf4[\x9f\xa0\x1b\x9b\
+\xb5\x08\xee\x01X\x82\x88\xd8\x12\xf84\xf0\xe0\xea,\x92\
+\xd4\xb8\xaf\x00\x8f\xca\xcck\xaa\x83\x0c\x8d\x05`\x89\x22\
+b{\xe0\x0b\xc0\xee\xd5Y$\xa9Q\xdf\x01\xf6\xca\xcc\
+\xcb\xab\x83\x0c\x91\x05`\x19\x22b7\xe0K\xc0\xae\xd5\
+Y$\xa91?\x01\xf6\xcc\xcc\x1fW\x07\x19*\xf7\x00\
+,\xc3\xe4\x8d\xb7\x1fpEu\x16Ij\xc8\x15\xc0~\
+N\xfe\xcbc\x01X\xa6\xcc\xfc6p\x10pmu\x16\
+Ij\xc0\xb5\xc0A\x93\xb1W\xcb`\x01\x98\x82\xcc\xfc\
+2\xf0h\xe0\xe7\xd5Y$i\xc4~\x0e<z2\xe6\
+j\x99\xdc\x030E\x11q?\xe0\x1c`\x97\xea,\x92\
+42\x17\xd1-\xfb\x7f\xab:\xc8X\xb8\x020E\x93\
+7\xe6\x9e\xc0\xf7\xaa\xb3H\xd2\x88|\x8fn\xc3\x9f\x93\
+\xff\x14Y\x00\xa6,3\x7f\x04<\x0c\xf8ju\x16I\
+\x1a\x81\xaf\x02\x0f\x9b\x8c\xad\x9a\x22\x0b\xc0\x0cd\xe6e\
+\xc0>t\x97\x03$IKs\x0e\xb0\xcfdL\xd5\x94\
+Y\x00fdr*\xd5A\xc0_\x03n\xb4\x90\xa4\x85\
+[E7v\x1e\xe4\x09\x7f\xb3\xe3&\xc09\x88\x88\x03\
+\x81\xf7\x02\xdbWg\x91\xa4\x9e\xbb\x1cxzf~\xbc\
+:\xc8\xd8Y\x00\xe6$\x22v\x05\xdeG\xb7?@\x92\
+t[_\x04\x9e\x9a\x99?\xa9\x0e\xd2\x02/\x01\xcc\xc9\
+\xe4\x0d\xbd7\xf0z\xbc$ I\xab[E76\xee\
+\xed\xe4??\xae\x00\x14\x88\x88\xfd\x80w\x03\xbbUg\
+\x91\xa4b?\x06\x9e\x9d\x99n\x9a\x9e3W\x00\x0aL\
+\xde\xe8\xbb\x03o\x00V\x16\xc7\x91\xa4\x0a+\xe9\xc6\xc0\
+\xdd\x9d\xfck\xb8\x02P,\x22v\x07\xdeNwy@\
+\x92Z\xf0Y\xe0\xb9\x99\xf9\x9d\xea -\xb3\x00\xf4D\
+D<\x0d\xf8[`\xe7\xea,\x924#\x97\x00\x7f\x91\
+\x99\xffR\x1dD\x16\x80^\x89\x88\xad\x81\x97\x03\xcf\x05\
+\xb6,\x8e#I\xd3r\x0d\xddJ\xe7\x89\x99yeu\
+\x18u,\x00=\x14\x11\xdb\x03\xc7\x02\xcf\x03\xb6)\x8e\
+#IK\xf5K\xe0$\xe0M\x99yyu\x18\xdd\x92\
+\x05\xa0\xc7\x22b[\xe0\x18\xe0\x05\xc0v\xc5q$i\
+\xa1\xae\x00\xde\x0c\xbc-3\x7fQ\x1dFkf\x01\x18\
+\x80\x88\xb8\x1dp4]\x11p\x8f\x80\xa4\xbe\xba\x84n\
+\xe2\x7fGf^]\x1dF\xebf\x01\x18\x90\x88\xd8\x08\
+\xd8\x17\xf8c\xe0\xf1\xc0\x16\xb5\x89$\x89k\x81\xd3\x81\
+\x7f\x02\xce\xcd\xcc\x1b\x8a\xf3h\x81,\x00\x035Y\x15\
+x\x02]\x19\xd8\x07\xcft\x904?7\x02\x9f\xa1\x9b\
+\xf4?\xe2O\xfb\xc3d\x01\x18\x81\x88\xd8\x058\x1cx\
+4\xf0p\xbc\x83@\xd2\xf4]\x03|\x1e\xf8W\xe0\x83\
+\x99yQq\x1e-\x93\x05`d\x22bc\xe0\xc1t\
+\xab\x02\x8f\x02\x1e\x02lR\x1aJ\xd2\x10\xfd\x06\xf8\x0f\
+\xe0\xd3t?\xed\x7f%3=\xb9tD,\x00#\x17\
+\x11[\xd0=\x81\xf0\x81\xc0}V{y{\xa1\xa4\x9b\
+\xfc\x12\xf8\xdej\xaf\xaf\x01_\xcc\xcckKSi\xa6\
+,\x00\x8d\x8a\x88\x9d\xe8\x8a\xc0\xbd'\x1fw\x00\xb6Z\
+\xc7kEMRIKp=p\xd5:^\x97\xd2M\
+\xf4\xdf\x07\xbe\x97\x99?-\xca\xa9B\xff\x1f/\x03u\
+\xb6@\x14[\x1a\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x072\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00 \x00\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x066\
+IDATX\xc3\xe5\x97k\x8c]U\x15\xc7\x7f\xfb\
+\xdcs\xdf\xf3\xe8\x9dG\xcbP\x0b\x88\xd3Z*\x0c\x9d\
+BtPPh\x0a\x83\xc1\xc6(1J1\x91\x0f\x12\
+\x15\xad\x18L\xf0K\xe5\xf5\xa1\xc6jS\xd2\x886L\
+[cZi\x90\xb6\xc2\xd8\x88\xad\x8cT\x1a\x1f\x95\x1a\
+\xa73\x1d;C\x99\xdbig\xc6y\xdd\xce\x9d\xfb8\
+\xf7\xde\xf3\xda\xdb\x0fw\xdf\xe9\x00}A\xc4\x9a\xb8\x93\
+\x9d\x93s\xef9\xeb\xff_k\xfd\xd7\xda\xeb\x08\xa5\x14\
+\x97s\x19\x97\x15\xfd\x7fa\x89\xff\xfb\x14\x98\xef\xe6a\
+!\x84\x00\x04\x10\xd0\xef\x9as\x9cP\x80\x04<\xc0\xd7\
+[\xa9\x8b\x84\xf8\x92R\xa0\x81\x0d t\xc5\xf57W\
+}\xea\xc9mkj\xea\x1b?\x13\x8eF\x16\x87\x82\xa1\
+E\x12\x0c\xc7\xf5\xa6<_Z\xf9|\xfe\xc8\x99So\
+\xee\xda\xff\xe0\xca.\xc0\x06\x5c@\x9e\x8f\xc8E\x09h\
+\xf0 \x10\xbb\x7f\xdf\xc0\xba\x86+\x9a\xbej\x06\x02\xb5\
+\xbeR(Uv\xd9W\xa0\x14\xf8J\xcd\xde\xdb\xb6;\
+:=2\xb4\xf1wkVl\x07\x8a\x80{.\x12\x17\
+$ \x840\x80\xd0\xf25k?\xf0\xd1o\xac\xfbU\
+,\x1eo\xbd\x10\xa8\xd4\xdbG_%X\xb9\x99C\x03\
+\x1dO}epo\xc7\x18\xe0(\xa5\xe4%\x11\xd0\xe0\
+\xe1;\x9e\xec\xb8y\xc9\x9d\x9f\x7f>\x18\x0a7I\xa5\
+\x90\xfa\xf1DHP\x1b4\x08\x07\xca\xb9\x91@\xc6\x91\
+\xa4l\xc5XQ\xe2\xce\x12R\xd8\xa5\xc2\xe0\xc9\xadO\
+\xadN\xee\xd9r\xf2\xed$\xceI@\x87=\xdc\xfa\xe5\
+o7\xaf\xf8\xda\xf7_1\x83\xa1\x05\x15\x0f\xab\x83\x82\
+\xab\x22\xd2\x1d\xee?\xd6w\xf4\xc0\x8b\x7f=~\xe8@\
+r\xbc\xbfg&\x18\x89\x9a\xb7>\xf0pk\xf3-\xab\
+\x967\x5cw\xd3\x8a\x81\x82\x0a\xcc8\x8a\x0ai\xbb\x90\
+\xeb\xeb\xfb\xe6\xed\xed\xf9\xb1S)MB\xa1\x15ml\
+\xdd\xba\xb5\xfa\xd6\x95\xab>r\xea\xc4\xc0H{{\xfb\
+\xb8\x16\x5c\xf5\x17\xf6\x0d\xee\x89'\xean\x93\x12|\xa9\
+\xa8\x8f\x18\xc4\xd2\xa3C\xdb\x1f\xba\xf7\xe9\xc9d\xffi\
+ \x03\x14\xb4\xe2\x03@\x0c\x98\xb7\xec\xae{[\xee\xfa\
+\xee\xfa\x07\x93\x81\xfa+'\x8a\xbeN\x87\xc4\x19?\xbd\
+\xed\xd8\xd7?\xf6(\x90UJy\x15\x02\xa1\xc7\xb6\xef\
+\xbe~\xea\xc3w\xbc.\xa4\x9c\x8c\x8d\xf4~\xeb\xc7\xf7\
+\xad\xfc\xd3\xaa\xf5;W7\xdcr\xf7\xb3R*| \
+b\x08\x12\x93\x03\xdd\xcf>p\xe7\x06\xa7X\x18\x06R\
+@^+]j\xd2a\xa0\x1ah\x0c\x84\xc2\x8bVo\
+9\xf0\xe8\xb1\xd8\xb5-EOb 0\x94\xef\xc8\xce\
+M\xb7\x0f\xbf\xb0\xb9\x07((\xa5\x94\x00\xe2mmm\
+\x8bn\xfcagO\xceSA)\xa5\x93\xea>\xb4\xc1\
+X\xb8\xf4\x9eh]c\xab\xaf\xc5\xd4lZ\xa9m_\
+j[[H\xa7\xde\x00\xc6\x81\x9c\x06\xf7t\x0f\x10\x94\
+\xfbB\x18\xa8\x05\x9ab\xf5\x0b\x96|\xe2\x99W\x9f\xee\
+.\x84\x1b*\xe95\xa7N\xee\x1c\xfb\xde\xaaG\x80\xb4\
+R\xca3\x80@oo\xaf\xa1J\xc5\x8ce{\xe4\x1d\
+\x19\x0a.\xfd\xf8:\x11O\xdc\x98/y\xe4m\x8fl\
+\xd1\xe5/\xbf\xd8\xf4\xb3B:5\x08\x8c\x02g\x00K\
+)\xe5(\xa5\xa4*/\xa9\x94r\x00KGg\xb4p\
+fb0\xdd\xb5kgP\xf9\xf8\xae\x87\xefx\x14\xa3\
+\x0d\xed@\x95.\xedr\x17\xb3,\xcb(\xe5g\xd2V\
+\xc9#_t)\x94<,\xc73\xa6\xf2\x0e\xc7'\x0b\
+\xf4%\x87\xc7\x8e<\xf7\xcc\xdf\x80,P\xd2!?g\
+\xf9h\x85\xdb@\x1a\x98\xe8\xde\xb1q\x7f\xadke|\
+\xc7\xc3s=\xa4\x086^\xf3\xb9\x87\x96\x01!!\x84\
+0\xb51\xcf\xcdeSV(\xbe\xd8W\xe0\xfb0^\
+p\xc99~\xd9j\xa4\xb6\xa9z\xc3\xe1-\xaa\x98;\
+\xa2|\xaf\x9b\x7f\xfe\xf1\x97\xd6\xee\x1f\x0c\x0b!\xdeQ\
+\xd7\x9a\x84\x12B8@\xd6+\x15R\x225z\xdc\x8f\
+]\xd5V\xfe\x0f\xa2\xd7\xb4\xb4\x00\x87\x01c\x96\x80\x93\
+I\x8f\x14\xab\xe7\xe3H\xc9x\xde\xc3\xf6\xe7\xd8U\x80\
+\x11YH<\xb2\x10\xf8l\xe2\x93\xf7\xadm\xae\x0d\xdf\
+vt\xdb\x13o\x0a!\xdc\xf3\xb4Y\x098\x80\xe5\xe4\
+f\xfe\xe5\x07\x17\x9e\xb5\x15\x08\xd5\x03\xa1\xb7\x12\x98I\
+\x8df\x83\xd72\x95\xf7\xf0\xe4\xdb\xec\xe9\xdb\xba\xa8\xc9\
+\xb2\x86\x085*?\xf6F>]\xa5E\xe7\x9e'\x15\
+J\x08\xe1\x03\x9e\xed\x05\x0c\xe5*@\x95\xf1\xd5\xec!\
+&L]\xc3\xee\xccP\x7fr\xc2\x5c\x8e\xa7\xd4;\xb2\
+[\x175YZ\x1f\xa1\xc6\x9e\x1a\x1a|\xa9\xe3\xb9\xdf\
+\xbf\xb0\xf9e`\x8cK\x5c\xd3~\xa4N\xbag#\x1a\
+,\xccdf\xab\xa2\x12\x81\xde\xae\x97\x8e\x8b\x0f~\x11\
+\xe5\x9f%\x90\x88\x06\xb8\xae1J\x8d\x9d\x1a\x19\xfcM\
+\xc7\x8b\xaf\xee\xfd\xc9k\xc0\x040\xa9{\x80w>P\
+\xddM\x03f\xac&\xe2\x84\xe7/\xc7-\x1b\x8d\x99\x06\
+\xf9\xc1\x7f\x9c\xa8\x08\xd9\xd4\x01\xf6fN\x0fd\x9a\x94\
+g\xa5\x1c#\x9e\x88\x06X\xda\x18e\x9e?=\x9a|\
+\xf9\xe7\x9d\x07\xf7l>\x08L\xe9\xf2JS\xee\x01E\
+\xc0\xbb\xc0yo\x00\xe1\xf0=O\xdcm\xcbPM\xa5\
+n\x9a\x22\xeet\xff\x81\x1d't\xea\xe4,\x01\xa0\xd8\
+\x1cvN}\xa8\xaeaY\x9d<3z\xf2\x95\x1d\xfb\
+^\xdb\xb3\xe9\x0f\x1atJ\x03\xe75\xb0\xcb\x05\x86\x0d\
+\xed}(\xba\xa8\xa5\xb14\xff\xa6\xef\xe0\x96\xa3j\x1a\
+\x82\xfa\xfc\xd0\x9f)\xb7o\x07\x90\xa6\x16\x8b\x0bX\x99\
+#\x9d?\x0dF\xab\xae\xee\xdc\xf1\xf8a\x0d8\xd7\xe3\
+\x92~\xe9\xa2S\x8e\xf6>\xb2\xe4\xfe\x8d\x8f\xf5\xe6\xa2\
+W\xe2\x94\x7fl\x9eo\xda\xc9\xbd[\x9e\xd7\x8e8J\
+)U\x19\xc9< \xdb\xb3\xfbG\xfb\x81\xa8\x16f\xee\
+=\x00\xbf%\xfc5\x85\xe1d\xdcH`\xd9\x92\xc6*\
+\x93\xba\xe9\xee\xdf\xf6\xf5\x1c\x1c\xd0\x04\x5c\xd0\xc7qe\
+\xf0\xd0;\xa0\x098\xef\x01\xb8\x92\x02\x13\xa87#\xf1\
+\xc57<\xd2\xf5\xeb\xf1B\xa8\xe1\x86y\xd9\x13]\xeb\
+?\xfd\xb0\xef\x14\x07\xb4\x90\x0bJ)5w\xa0\xb45\
+\xb3\x8c\xbe\xda\x95>\xffn\xc0\xf5\x92\x80\xe3\x95\xacL\
+d\xe2\xef\xbbZ\xe7e\x8f\xbe\xbe}\xed\xe3\xbeS\x1c\
+\xd1)\xb5g\xe7\x81\xf7\xe3\xbb@\x8b0\x02$\x82\xd1\
+\x9a\x05J\xfa\x11\xcf\xb6\xb2\x94\xc5\x9ca\xee@\xf2~\
+}\x98\x08!\x02\x94\x8f\xe6\x18\xe5\xb4:\x94+\xe8\xe2\
+#\xd9\x7f0\x0a\x86\xde\x82rZ\xe4%\x0f\xa5\xff\xad\
+u\xd9?\xcd\xfe\x0d\xd5\xd1\x95Q7\x94\xd6\xdb\x00\x00\
+\x00%tEXtdate:creat\
+e\x002013-12-17T10:\
+20:17-05:00\x05d\x89\x86\x00\
+\x00\x00%tEXtdate:modi\
+fy\x002013-12-17T10\
+:20:17-05:00t91:\
+\x00\x00\x00\x19tEXtSoftware\
+\x00Adobe ImageRead\
+yq\xc9e<\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x06\x9b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00 cHRM\x00\x00z%\x00\x00\x80\x83\
+\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17o\x92_\xc5F\x00\x00\x00\x06\
+bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\
+\x9a\x9c\x18\x00\x00\x00\x09vpAg\x00\x00\x00 \x00\
+\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x05\x98IDAT\
+X\xc3\xc5\x97\x7f\x8c\x5cU\x15\xc7?\xe7\xde\xf7\xde\xcc\
+\x9b\x1f;\xb3Lw\xb7\xdd\x22\xdb\xa2\xa5j+\x0a-\
+A06\xa8AM\xe3O$\x91\x18\x13\x13#\x12\x11\
+\x7f4\xc4\x22b\xd2\xc6\x08)m$\x84\x88\xa6!F\
+\x13\x7f \xfa\x97\x11\xf0\xc7_\x06c(\x18A#H\
+%4\xa6\x11\xb6\xdb-\xbb;\xb3\xf3{\xde{\xf7\xf8\
+\xc7\xec\xec\xce4\xb3\xdbE\xd7p\x92\x97yo\xee}\
+\xf7|\xee9\xdfs\xdf\xbd\xa2\xaa\xbc\x9e\xe6\x01\xdc\x7f\
+\xff\xb1/\xb4:\xd1\xc4F\x0e\x1c\x04\xfe\xb9\xdb\x0f\x1c\
+|p\xad>\xaa\xda\x05hu\xa2\x89\xaf\x1f\xfc\xc6\x86\
+\xce\xec\xc8\xd1{\xc6\xd6\x1d\x81\x9e\x95\xcb\xe5\x0dq^\
+,\x16\xd7\xdd\xd7l\xe8\xb4\xff\x0b\xf3\xfe\xf7!V\xcc\
+9\xf7\xff\x01x\xf8\x17?\xbdu\xb1RYWN{\
+&\x02G\x8e\xde}h\xb5v\xdf\xf7\xff\x0e\x5c>\x14\
+`\xd7\xa3\x99\xcf_\xec\xb7\xa6o*M?\xfdXy\
+|\xd7\xf5\x95\xca\xd8\x1d_\xdbX\x91\xde{\xec\x9e\xb7\
+\xad\x1a\x81\x9f\xbc\xab\xfd\xc8\xc9E\xafp\xcd\xa6\xc9j\
+v\xce{i\xe1_\xec\x83\x8d\x11\xa9\x88P(\x14\x96\
+\x9f\x87\x02\x5c1\x9aT\xae\x18M*\x00\xdb\xb2\x9d\x7f\
+\x1f\xdf\xd0\xb9\x0f\xdaP\x80\xfd\xbf\x97\xfd\x0aL\x05\xcd\
+\xd9'\xaa\x17\xed\xf9\xca\x069\x1b\xb6\xea\x0e\x05\xd8^\
+\x0a+\x1f\xdf\x1a\xbd\xf8\x86l\xb61yZ#f\xf8\
+X\x7f{\xc7\x0a)O\x10\xc0\xf7 N\xa0\xd6VR\
+\x16\x02 \x8euU\xc7\xe7C\x0c\x05xpO\xe3O\
+\xd0-\xabo\xbe5\xfa\xdbCO\x0e\x02\xbc\xff\x06\x9f\
+My\xc3\xcc+\xc2\xae7\xc33\x7f\xf6\x18\xdf\xd1f\
+[Q\x98;#,\xccu\xd82\xd9\xa6\xd9\xb0\x9c\x9d\
+\x09\xb0V\xb1\x9e\xf2\xd8\xef\xdax\x9ewa\x80}\xbf\
+\xf1ol\xa9\x04{3\x95\x93OT/\xda\xfb\xa5\xf3\
+\xda\x7f\xfe@H\xa9$\xd4\x1b06\x06\xaa \x92\xa1\
+\xd3\xe9\x96\x9f!\x05\xe4\xa9\xd7adD\x88\xe3nT\
+\xb2\xb9\x90F\xb3\xba6\x80s\x8e\xeb\xb6\xda\x97\xde3\
+\x11\xbd\x9c\xb1\xd9\xf8M\xaf\xba\x063|\xb2\xbf\xcf\x8e\
+\xcb\x14#BI\x151\x02\x0a\x08\x84i\xc5X\xc1%\
+\x82K\x94L\x06@\x09R\x8a 8'\xebK\xc1\xe1\
+\xdd\x8d\xbf\xf6`\xf6\x14;\xe5\x1f\xfcq\xb0\xfd\xd37\
+\xcdr\xe2\xc9\x22\xdb\xb65\x89c\xa1\x13\x19\xf2\xb9\x98\
+V\xdb\xe0\x9c0?\xe7\x93J;\xa6\xa6\x1a\x14G#\
+&6\xb7\xb9\xe3\xce\x91\xa1\xc2\x1c\x00\xe8-\xa5W>\
+\x9e\xf9\xec{\xf3\xe7\x9e~\xa6Q\xdcqi\xaa>}\
+\xf5y/}\xf9\xab\x9b\xb8\xf3.\x8b\x1f\x04h\xa2\x84\
+\x19C\x10@&\x04c\x84N\xa4\x04\x01\xd4ji\x8a\
+EK\xad\xe6\xc8e\x12\xaa\xf5\x0a\x22r\xe1\x14\xfc\xe8\
+\x9a\xd6/gZ\x85\xf0\xf2\x96\xd4\xde7\x11\x9cy\xfc\
+\x14\x1f\xec\xef\xf3\xf6wD\x18\x93 bq.\xc1\x1a\
+\x0b\x22\x98\xa5\xc1\xb3(\x88\x90J;<k16F\
+\xc4\xac\xbf\x0av\x17\xe2\xea\xee\x02\xd5\xd5>.\xb7\xde\
+\xb2\xc0S'\x8a@\xc2%SMf\xcf\x06\x00\xa4\xd3\
+\x09g\xa6\xd3\x18\xab\x14\x0a1\xed\xb6\xe1\xaa\xabg\xf9\
+\xc4\x8dE\xf6]\xe7\x96\x9d\xf7C,\x038\xe7\x96S\
+\xf0\xc2\xb3\xb9k\x9bu;\x1ef\x93\xd9L6\x9e\xeb\
+w\xae\xaa|\xeb\xdb\x9b\x19\xc9\x1b\x16\xab\x8aK\xd2\xf8\
+\x81\x10G\xe0\x07P\xafA.\x07\xf5z\xd7\x89H\x88\
+\xef+\xd64QUDd\xe0\xab9\x00\xd0\xfb\xad-\
+zS\xed\x86\xdd\xdc\xa8z\xdb\xe7M\x10\xf5;\x07\x98\
+\xd8\x9c`\x8d\x90\xcb/\x17\x00\xaa\x0e\xa7\xca\xf8\xb8E\
+\xa4\xabv\xed\xd6'(4\x9a+\x11X\x13\x00`\xcf\
+\xbb\xe7\x1f\xee\xff\xef\xe4\x8f9\xd4\x0fp\xcb\xcd\xb3\xbc\
+\xf0|\x8e\x99\x994\xa5R\x1bca|\xbcM\xa3a\
+\xa9\xd5<\x8a\xc5\x0e\x95\xb2\xcf\xe4\xd6&\xcf\xfe\xa5\xc8\
+\xc4\x966a\x18s\xec>\xcb\xf6K\xf5\xc2)Xk\
+c\xa1\xaa|\xf1\xb6q\xc2\xb4\xc7H\x01\x9c\x0b\xc8\xe5\
+\xa0\xd9\xcc\xd3h(\xa9T7\x0d\xea\x04\xd5<\xa9P\
+\xa8V\x03Pe\xeb\xc5m|\xbf=\x5c\x84\xebu\x0e\
+\xb0\xf3-m\xd2\x81\xc1\x98\x95\x1d]w\x1b(Kc\
+$\xcb\xa1\x17\xd1\xa5\xdc\x1b\x94\x80N\xe4\x06\xde\x1b\x00\
+H\xa7\xd3\x03\x10\xfd\x1d\x97s\x0a4O\xb7i\x97\x9a\
+\xe03T\xd9\xbd{\x11\xc1Z\x8b\xb5\x16\xcf\xf3\xb0\xd6\
+\xe2\xfb>\xd3g\xa6Qt\x05 \x08\xfc\xb3\xdf\xfd\xde\
+\x03\xab\x9e\x0bDV\xa0T\x95\xe6\x81\x11\xcc\xce\x18\xc9\
+*\xf1oS\x98+#\xcc\x1bc\xc89\xecU\x11\xee\
+\x9f\x1e\xa9\x8fD\x88\x08\x0f\xfd\xf08A\xd0-\xd3\xc0\
+\x0f\xe8D\x1d\xc2t\xd8\x1d\xb4\x07p\xfb\x81\x83\xdfg\
+\x0d;r\xf4\xeeC\xce\xad\xa8\xb8t\x5cI\xa5B\xe2\
+(\xc6\xdcf1\x81\xc5\xd9\x04\xb7 h&\xc6\xa5\x0c\
+6\x13\xe34\x01\xe0\xc3[>\x8a\x9e\xc81\xbf\xb7\x8a\
+?\x93p\xea\xf9ST/y\xeeg\x03)\xb8\x90\xf5\
+\x03\xe8\xa6\x08MY\xac\x821K\x9aI\x1c^\xde \
+\xc6G\xc7\x1c\xe0\xa3\x18\xac\xb58uT~5\xca\xdc\
+\xa3\xa3\xe8\xb5OQ-Tj\xadz\xe7fx\x0d\xe7\
+\x82\x81\x14\xb4\xea,\x94_e\xa12\xc7\xdc\xc29\xca\
+\x8b\xf34Z5Z\x9d\x06\x9d\xa8\x89\xd3\x181J\x10\
+\x048\xe7xeZy\xd9\x19Z\x0b)\xce\xe6OW\
+'\xf6\x17\xdey\xf8\xf0\xe1\xc6k\x8a@\x92$\x84a\
+8 F\x11AD0\xc6\x0c\x5c\xd6ZT\x95z\xbd\
+\x06@\xfb\x1fe\xca\xd7\xffZ\xe7v\x9e\xfaCPJ\
+\xdd\xf0\xb9\x0f|\xa6\xbc\xac\xaf\xde\xf2\xb8\x96}\xe7\xbe\
+{\x9f\x8b\xe2x\xd7za{\xa6KZ\x9f|\xf1\xb2\
+\x05\x7f1\xbc\xebS\x8f|hYk\xbd\xd5R^\xef\
+\xe3\xf9\x7f\x00\xf8V\xb4\x02[\xcd\xa7:\x00\x00\x00%\
+tEXtdate:create\x00\
+2013-12-17T10:20\
+:17-05:00\x05d\x89\x86\x00\x00\x00\
+%tEXtdate:modify\
+\x002013-12-17T10:2\
+0:17-05:00t91:\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00e\xd1\
+\x00\
+\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00 \x00\xbbe\x00\
+\x00\x16\x00\x00\x00\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0dIHDR\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
+\x00\x00\x5cr\xa8f\x00\x00e\x82IDATx\xda\
+\xed\xbdy\x90$\xd7y\x1f\xf8{G\x1eU}Mw\
+\xcf\x09\x0c88\x07\xc7\xe0 \xc0\x0b\x22\xc1\xa5\xcc\xc3\
+\x94\xb8\x22\xa9\xa5v\xc3\x0a-%\x85A\x85W\xdeU\
+\x84\xac]KZ\xdb\x1b\xd6\x866\xb4\xb2\x15\xb4iY\
+\x87\x15\xb2L\xc9\x94,\xd1\x8a\x10M\x126eK\xb0\
+\xbc\x12 \x0a\xa4H\x08 0Cp\x00\x90\x18\x00\xc2\
+\x10s\xf4L_U\x95\xc7{o\xff\xc8zY/\xb3\
+\xf2\xae\xac\xee\x9e\x99\xfaEdwUVVfVf\
+\xfe~\xef\xfb\xbe\xf7\xbd\xef\x917>\xfc\xcf1\xc3\x0c\
+3\x5c\x9b\xa0\xbb}\x023\xcc0\xc3\xeea&\x003\
+\xccp\x0dc&\x003\xccp\x0dc&\x003\xccp\
+\x0dc&\x003\xccp\x0dc&\x003\xccp\x0dc\
+&\x003\xccp\x0dc&\x003\xccp\x0d\x83\xef\xf6\
+\x09\xcc09\x1cgen\xbdw\xae\xfb\xfa\xb9\x8d\x83\
+[\x97N\xdd\x0a\x00\xd2\xdf8\xa2?\xa7\xee\xe2\x9b\x8b\
+\xbe/6\xb6\xde\xa6_\xb3\xc5\xf9/u\xf7\xbds\xfd\
+\xc1\x13\xb7=\xf5'\x8f}r\xe3\x96\xdb\x1f\xfc\xa2\xcb\
+\xf8\xf9\xdd\xfe\x8d3L\x07d\x96\x09x\xe5\xc0qV\
+\xe6N\xbf\xf4\xc2\x8d[\x97N\xdd*\xfd\x8d#\x9a\xd8\
+&\x81\xc9\x12?Q\xb6\x9f.\xb9\x8e(wY\xf9\xaa\
+C\xb8\xed\xe4n'\xc2\x00\xac\xff\xd2\xd7\xac\xc5\xfb\x1e\
+\xa5\xea\xe2'\x8f\x1dY9\xb9\xdb\xd7`\x86v1\x13\
+\x80=\x8a\x81\x08\x0f\xbc\xf8\x8d'\xden\x12\xdd\xa2\x8b\
+oQbp\xc4\xa7\x1b\xfb\xf5vl~\x9f\x02\x00\xb1\
+u\x99\x14\xed\xcf\x0e\x96a\xcd-\x93\x01]A\x11\xe9\
+\xd3\x10a0<Np\xd6\xf2\xf6\xff\xde\x91\x03\xc1?\
+\x99Y\x04W\x0ff\x02\xb0G\x90&\xbcE\x17\xdf\x12\
+\xce\xf9w\xb7\xb1o\xd7_\xa1\xa1{\xa4\xd6w\xa4\x10\
+\x00\x00\xa5$\x08\x19\x85\x8ah\xef\x9b_\x0b\xc2\x8d\x7f\
+|\xe2\xae\x87>\xb7\xdb\xd7l\x86\xc91\x8b\x01\xec\x12\
+\xb49\xbf\xf1\xfa\x13\xef\xa4\xee\xe2\x9b\xb9\xb2?D\x96\
+\xdcU\x06\x17\xdc\x99\xa3\x00\xc0aM|\x9c9y\x00\
+\xdbt\x0e\x8c[qk^\x07&\xf9\x01@tn\xbc\
+\xd7\x9a\x0f\xfe\xd53O}\xe1\xc8=o\xfc\xc0\xaf\xed\
+\xf6u\x9ca2\xcc,\x80\x1d\x84n\xe5A\xf1A\xdd\
+\xc2k\xb2\x03\x00\xb5]\xd5\xd6\xb1:\x83\x052 \xfb\
+\xe2\xf7u\xc9\xaf-\x804\xb4E\xc0\xe5\xa6\xf2z/\
+~\xf2\xc4\x1d\x0f\xfd\xc8N_\xc7\x19\xda\xc3\xcc\x02\x98\
+2\xd2\xa4\xb7\x0e\xae\xde\x0bDd\xb7\xa3M\x14\xb5]\
+\xed\xbf\x93\x86\x87I\xc0\xd9\xb0`\x92\xbfMh\x8b \
+ s\xc4\xe9\xde\xf2\xf0\xc9o\x9c:u\xe2\xf6\xbbf\
+\xad\xc8\x15\x8a\x99\x00L\x01\x8e\xb32\xf7\xe4_}\xfe\
+\xbd&\xe9\xa9\xed\x9aD\x07\x0c\xb2sj\xb7vl\xb1\
+\xedb@\xaa\x07\xf9\x9a\x82\x10\x8a\x00s\xc4\xe9\xe0\xe3\
+\xcf<\xf5\x85\xde\xcc\x1d\xb821\x13\x80\x16q\xe6\xec\
+\xda\x89\x8d\xd7\x9fx\xa7\xd3=\xfaw\xad\x83\xab\xf7\xf2\
+\xf9}\xf1g\x9c\xda1\xe1\x99\xc5\x94\x08\x04a\x16\x1b\
+3\xf9mf\x13\xb2i\xa1gm\x14\x1e\xab\x1b,\x8e\
+m#\xb6]\xc80\x9b\xfcMc\x00YPJ\xc6\xaf\
+\x032G\xec}o\xfe\xf9\x93\xa7\x1e?;\x0b\x0c^\
+y\x98\x09\xc0\x84H\xb4\xf6\x87\xee\xfc\xc0\xdc\x1d\xf7\x1f\
+\x89\xd6w2\xc9=|I\xc0\x86\xff3\xa0\x16\x02t\
+\xd0)<\xaer\x03t7\x17\xa1\x16\x02\x90M\x0b\x9b\
+\xbe\x9fK\xfe\xb6A\x08M\x88\x80d\xee>\x8b/\xfe\
+\xec@\x84\xb3\xa4\xa1+\x0c3\x01h\x88\x81\x08\x0f<\
+\xff\xcc\x1f}\x9f\xd3=\xfaw\x9d\xa3\xd7\xdfc\xbb\x8b\
+\xc3\x16\xbd\xa3\x86D/\xf5\xe7)a\x90J\xc4\xff\xf3\
+\xb6\x01\x90\xf9\xb9Z\x88Z\xf4\xed\xc0\x82\x0c\xcb\xc3\x07\
+mZ\x01i\x88\xce\x8d\xf7\x9e=o\xfd\x9f7\x1dV\
+\xff\xc7T\x0e0\xc3T0\x13\x80\x9a0\x89?w\xc7\
+\xfd\xf7\xea\x96\xdef6\x00\x10MX\x0d\xa9\x04l\x87\
+\xc9\xfc=\xb2\xd4\xff\x08\xa1\x1f\x8d\xd3\xe06\xa4\xf9\xb9\
+^\xaf\xb1u\xd1A\x18\x84\x95\xcf\xbf\x0d\x110[\x7f\
+\x13\xc2\x7f\xed'N\x9ez\xf1\xcff\xae\xc0\x95\x83\x99\
+\x00T\xc4\x99\xb3k'\xb6\xd6O\xfd\x84u\xe8\xce\x0f\
+\xac\xdc\xf7\xf6\xc3\xc08\xe9\xb9\x0d\x19\xfa\xa0\xb6mA\
+\x22\x88\x89Ka\xd5\x1ete\x8f\xe2\x824g=\xbc\
+\x0b\xa2\x16\xf9\xdb\x82\xee\x09H\x0bA@\xe6\xc8\xcc\x15\
+\xb8\xb20\x13\x80\x12\x98\xc4\xdfw\xf8\xee\xc36\xb3\x13\
+\x84\xd7\xdb\x0dIN5A5\xe9)u \xa5\x07\xfd\
+\xba\x09\xa4\xf4\x12\xfb\x01\x22\xf2oz\x1c\x80\xa8\xb5\xaf\
+i\x04\x02M\x84\xce\x1b\xee}\xfe\x99?\xfa\xbeY\xaf\
+\xc0\x95\x81\x99\x00\xe4@\x9b\xfa\x87\xee\xfb\x8e\x9f\xe8^\
+\xff\xc0\xf1\x02\xd2'\x90E\xf2\xa6\xc4O\x7f_\xff\x1f\
+\x0c\xb6\xb0\x1d8\x00\xea\xe7\x0d1\x1ee\x17N\x22\x04\
+y\xe4\xd7p\xbaG\xff\xee@\x84\x7f0\xb3\x02\xf6>\
+\xd8\xe1\xfb\xdf\xbf\xdb\xe7\xb0\xa7\xe08+sO}\xf5\
+\x0f>\xb6\xbd\xe5\xfd\xd2\x81{\x1e\xf8\x18c\xce\xaa\xe3\
+8`\x8c\x811\x06\x02F\xf4B\xa9\x03Bxb\x99\
+6\xc8\xb6\xc2\xe5K\x14RF\xe4'\x94B\xa9\x91\x10\
+P\xc6\x12\xef\xb3P\x85\xfc\xe9\xfd&>#\x04Y\xe2\
+\xa3d$\x0c\x92/\x1dZ;\xf7\xd2\xb7\x0f\xee?\xf0\
+\x17S\xbf 3L\x84\x99\x05`\xe0\xe4\xa9\xc7?l\
+\xf1\xc5\x9f=\xfc\xc0w\xdek;LR#\x17\xdfl\
+\xc5\xed\xfa.}\x02\x22\x15\xf0\x03\x00\x11Tk\x91/\
+m\xaa\x98\xfc\xf1\xb91\x96\x9b\xba\x9b\x85*\x81\xc0:\
+\xfb\xcb\x82E\xc2\x1f\x1e\x88\xf0\xb7gV\xc0\xde\xc6L\
+\x00\x10\xf9\xf9\x92\xac>\xbc\xef\xce\xbb\x7fb\xbe\xdbQ\
+C\xe2\xc7><P\x8d\xf4Y\xc4\xae\x0af\x15\x0f\xfc\
+\x11A\x80\xdeE\x0a?\xf0\x0b\xb7\x9b\x94\xb8m\x80P\
+:\x8b\x05\x5c!\xb8\xa6\x05\xc0qV\xe6\xbe\xf2\xa5\xdf\
+\xf9\xc1C\xf7}\xc7O8\xdd\xc1\xad\x14\x8b\x04\x00\xa1\
+\xd4\x19'\xbc\xb6\x00t .\xc3\xaf\xcf\xa3\xbf\x90\xed\
+D\xea{\x03/\xf7\xb3\xbaV\xc0\xb4@(\x8d\xff\xcf\
+b\x01{\x1f\xd7\xac\x00\x9c9\xbbv\xc2\xdb\xfc\xda\xef\
+\xbe\xe1;\xdes7\x85E]\xa7 \xf3\xce${\x83\
+\x80\x1e\xa3\x93]f!C\x5c\xfev\xe4_S:J\
+\xf8\x99\xd4\x15h\x8a\xb2 \xa0F\xe8\xbc\xe1\xde\x17\xbf\
+\xf1\xc4\xdbgy\x01{\x17\xd7\x5cQP\xc7Y\x99c\
+\xd6\xd1\x1f\xef\x1c&\x9f9r\xdf\xdd\xf7v\x9d\xc5|\
+\xf2S\xa7\x11\xe1\xdb\xc6\xd6&AX\x91\xd8\x94Us\
+Cto@\x13\xa4k\x04\xe8\xe0\x9fn\xfd\xe3\xed(\
+\x05(>\xb8\x93\xd7j\x86z\xb8\xa6z\x01\xce\x9c]\
+;\xf1\xda+_\xfb\x02\xbb\x8e\xfe\xa0\xeb,\xefw\x8c\
+\xac\x9a\x8ec\xcbPq\x02\xc2\xd1\xb1\x99\xb48S\x16\
+\x83\xb28%\x16U\xd2\xe2\x94X\x8c \xac\xc0\xc3\x8e\
+\x1dm\xd7\xb1\x09|eC\x11\x96X\x88\xca\xdf\x89\xa4\
+6\x88\x12\x904\xfa\x9ewQb\xe3\xd2f\xe6\xb6\x84\
+\x10d\x05\xea\x8b\x22\xf8&4q3?+\xfd\xfe\xe8\
+\xf3\xa8W\xc0\xd8\xa7R\xf1:\xc6\x96n\xde\xee{\xff\
+q\xdfBg\xe6\x06\xecA\x5c\x13.\x80\xe3\xac\xcc\xed\
+\x9b\xdf\xff\x91s\xeaK\xff\xd7uw\xbe\xe5\xb8\xf9Y\
+\xc7\xb1c\x16t,U\xd0\x94\x0d\xb7\x19\x8e\xe7\x19 \
+\xdf2\x18\x00 v\xf4\x9fq@\x84I\xa2\xc9\x92\xe1\
+\xbf\xfas\x15\xf6\xb0\xb1\xe9\x15n\xab]\x82\xb6\xdd\x81\
+I\xbf\xaf\xc5E\x10{\xdf\xd6\xc6k\xef\xc7\xac\xa0\xe8\
+\x9e\xc4U\xef\x02\x9c9\xbbv\xe2\xc9\xa7?\xff\x8b/\
+\xf4\x9e\xfb\xd4\xf2\xf2\xe1\x98\xfc\x1d\xc7\x96&\xf9A(\
+\x8d\x97\x1c(fC1\x1b\x038p\x98\x82\xc3Z+\
+\xe0\x93\x89Z\xa6?m\xa5\x96H\x8c\x22\xf2\xe7\xc5\x00\
+\xb2,\x0aB),\x12\xfe\xb0\xe3\xac\xccM\xf1R\xcd\
+\xd0\x10W\xb5\x00\x9c<\xf5\xf8\x87;\x87\xc9g\x8e?\
+\xf8\x9e\x8f\xb9N'&}&\xf1\x0dh\xa2\xa7\x17\x13\
+\x9e\xa8N8\xc6\xeb_f\x15\xf6\xe0]\x1e\xd4\xfaN\
+Z\x04\xaa\xc6\x032\xf7\xd5\xe0\xbbY\xda\xa9\xa4\x84\xb2\
+\x0f\xbf\xe1\xc9\xbf\xfa\xfc{\x1b\x9f\xcc\x0cS\xc3U\xe9\
+\x028\xce\xca\x5c(\xbb?r\xf4Mo\xf9\xe7]g\
+\x91&\x08\x0fd>\xa9i\x82g\xc1\x13$n\xf5\xf7\
+R\xebo\x82R2\xe6\x0e\xe4\xa1(!\xa8\xcd\xde\x04\
+A\xec}\xdd\x95w\xfew\x80\x9a\xf5\x06\xec1\x5cu\
+\x16\xc0@\x84\x07\x9e|\xfa\xf3\xbf\xa8\xf6]\xf8\xd9\xd5\
+\xc5\xfd\x91\x8fo\x9a\xf7\x06\xf9\xf3Z\xf7<\x10n\xc3\
+'\x0e\x08\x1fm\xef0\x05\xc2\xed\xb1\xc5\xfc\x0e\xe16\
+\x18\xa7\x95-\x01\x15\xf6\xb0}q\x1b|\x82\x16|\x9a\
+H\xf7\x02\xc4\xe7]\x10T\x0c6\x9e~\xef\xcc\x0d\xd8\
+{\xb8\xaa\x04\xe0\xcc\xd9\xb5\x13t\x95\x7f\xfc\xf8\x83\xef\
+\xf9\x18\xa5\xd6<\x00\xe4\xf9\xf4UI\x9f\x86\xad<\xd8\
+\xca\x83o\xd4\xdd\xb3\xd5x\xa0.K\x08\x00\x80\xbbn\
+\xbc\xe4a\xf3\xdbQ\xeb\xdb\xc4\x02\x00\x92\xae\xc0$n\
+@\x11\xf2D s[J\xa1\xec\xc3o8\xfd\xd2\x0b\
+7N\xe5dfh\x8c\xabF\x00\xb4\xbf\xdfu\x16>\
+\x1a\x9b\xfc\x84\xd2*\xfe|Uh\xe2k\xf2\xa7\xff\x97\
+\xc1\x14\x04 )\x06z\xd9\xbc\xd4Go\xe0\x8136\
+\xb6\x00\xd8\xb3V\x01\x80\xdc\x18\xaa\x92\x12\x82\xd8\xfb6\
+^\x7f\xe2\x9d\xbb}\x8e3$qU\xc4\x00\x9ey\xea\
+\x0b?\xfa\x86\xefx\xcf\xaf\xac.\x0eg\xcc*\x88\xe4\
+WEURW\xdd\xae\x0a\xc2\xc1\x00j;\xcc%y\
+\x1d\xf2\xd7\x89\x054A\x9d\x9e\x80\xf8\x9cJ&)\x9d\
+a\xe7q\xc5\x0b\x00\xb3\x8e\xfe\xf8}\xef\xfb\xc8\xcfR\
+:\xccl\x1b\x92?\xab\x95g,\xfa\xb9B\x84c\xeb\
+\x00@\x92Qv\x5c\x1e\xad=Q-\x0d\xb6\x096/\
+\xf5\xe1W\xa8\xf0\x93\x16\x82<WA\x8b\xc0^\x18'\
+ \x83@\xd9t\xf1-\x03\x11\x1e\x98\x8d\x0d\xd8;\xb8\
+b]\x00\xc7Y\x99;\xf9\xdc\xe3\xbf\xa1\xf6]\xf8Y\
+J\xady\xd3\xfe\xcc\x22\x7f\x87\x8f\xfcb\xc68\x18\xe3\
+ \xbc\x03I\xacx\xa9t\x5cF\x0b\x97\xa6\xd0\xad\x7f\
+\x13\xa4\xdd\x04\x0d\xd3\x02\xa8\x13\x0b\xa8\x22\x16Y1\x80\
+\xbc\xd6_\x06\x81\x02\x80 \xb4O\xbc\xf8\x8d'\xde\xde\
+\xf8\x22\xcd\xd0:\xaeH\x0b\xc0qV\xe6\x9e|\xfa\xf3\
+\xbf8\x0c\xf6\xc94\xf1M\xb2\x9b\xb0\x89\xc0\x00n\xf5\
+\x0359\xb7\x94\x08\x04Jg\xea\x15\x93\xaaj\xeb\x9f\
+F(D\x82\xf8\x9c\xb1\xd8\x22\xc8\xcb\x12,C\x15\x8b\
+\xa1\xca\x80 \x19\x04J\x84\xe1\xa8B2]bt\xf0\
+\xcdz\xb3\x94\xce0U\x5cq\x020\x10\xe1\x01\xbf\xb3\
+\xf6\xf1\xfb\xde\xf5\xdd\x1fE\xd4\x0aQ\xc5\xec\x5c\xd2\xa7\
+\xe1\x0c\xf9\xe9M\xcf\x92O\xc0\x22C\xf21\x8a@\x91\
+\xd1{\x8c\xc4\xc1\xefmO\xd4\xfag\xad3\xdd\x82i\
+\xc7\x03\x00\xa3\x1a\xd0\xb0\xb5O\x10\xdf\xc0,\x0e\xb0\xb7\
+pE\x09\xc0@\x84\x07\xe8*\xffx\xd7Y\xf8\xa8\x8e\
+\xf0\x17A\xd1\xfc\xd6\xde\x99\xd0\xf9\xd1\x02RGPL\
+\xf2\x9b\xef/6l\xfd\x8b\x90\x16\x01`:\xc3\x85s\
+\x88\x9f\x7f\x0dfq\x80=\x85+F\x00b\xf2\xbbK\
+?\xe4:\xd9!\xba\x22\xc2\xb7\x8d\xce0\xfa/\x11\xe5\
+\x00\x98\x82R\xc7\xba\xf0\x84l\xdc\xfa\x97!\xed\x0ed\
+Y\x01Y\xd9\x80U\xcc\xff\xba\xc4\xd7\x08B\xfb\xc4\xeb\
+\xe76\x0e\x1e;\xb22\x13\x80=\x80+\x22\x08X\x85\
+\xfc\x00@\xe4 ^v\x03T9\xa0\xcaA\x87\x8c/\
+y\xe8\xbd\xba\xd9z\xebo\xa2I\xde@^\xc0P)\
+\x09)B()!\x83@\x05\xfd>D\x18\x92\xaa\xe4\
+\x07\x80\x90.\xb1Y>\xc0\xde\xc1\x9e\xb7\x00L\xf2\xd7\
+\xf9\x9e)\x02u,\x03\x97\x01\x0a\x0e\xd2\x9c\x94dX\
+\xdb_9\xf1k\x0d\xaa\xcas\x01\xb2D\xe0r\xd8\xc7\
+`0}\xb1JX\x02\x15\xdc\x80\xf4\xe7\xba\xc5/\xf3\
+\xef\xabb\xfe\xf0\x7f\x7f[\x93\x92\xe63\xb4\x8f=-\
+\x00&\xf9\xeb\x04\xfa\xf2\x08\xef\xe64\x86\xca\xe8\xf5\xd7\
+\x8f\xa5e\x5c\x99 \x04\x1cf\x12\xd81>k\x9e\x08\
+\xe4\x9d\x1fL\xb5\xf57\xc1\x19\x03\x18j\x1d\xcf$\xfe\
+\xa4\xa47\xb1\xf9\xf2\x1f\xfeM\x1c\xfe\xae\x1d\xf9\xdd3\
+\x14c\xcf\x0a\x80\xe3\xac\xcc\xf9\x9d\xb5R\xb3_\xc3$\
+\xbd[b\xf5*\xd4#\xad\xc5\xeb}V\x85c\x81\xd7\
+\xc3\xf6\xfaf\xf9\x86S\x86\xe9\xff\xeb\x96_\x0e\x13\xa5\
+\xda&\xbe\x86\xbb\xef:9\x0b\x04\xee\x0d\xec\xd9\x18\xc0\
+\x93O\x7f\xfe\x17\xbb\xce\xc2G\xd3\xe4w\xac\xf1\xd6\xdd\
+\xb1\x5c\xb8\x0c\xf1\x92\x07\x05\xa76\xf9\x9b\xc0\x14\x05\x8b\
+g\x8b\xc4z\xe05j\xfd)\xb1s\x97J\xdf\xa7$\
+\xd3\xc7\x97B@\x8a\x10\x5cn*\x9b\xf4c\xfb\x9cq\
+\xae\x18\xe7\xad\xda\xeb:\x10\xd8\xe6>gh\x86=i\
+\x01\x1cZ=\xfe\x83\xfc]\x0b\x7f\xdbu;\xb1@\x99\
+\xc4\xcf\x12\x81\xbd\x06\x8b'-\x01-\x02z]\xef\x9c\
+_y_\xb6\xc5\x11\x86\xd1\xa5\xe0|\xbc\x8bA\x7f\x96\
+\x16\x01\xa9\xca\x8fa\xb9\x12\x8bL\xc1\x09\x00\x80\x83\xdb\
+\xab\xfa\xa34\xe9\xd5\xb6\xf2\x09\x00\x9c\xdf\x88\xac\x04\xc3\
+B\xa8\x858\x10x\xe4\x03\xb32a\xbb\x8c='\x00\
+\xcf<\xf5\x85\x1f\xa5\xefs\xffi\xd7]\xa4@=\xb2\
+S\xe6B\x8aAi+\xcfX\xf4\xcc\x0a\xa1\x12\xef\xcd\
+um \xab\xe5\xb78\xb0q\xc1Co{\x1b@D\
+\xee,K@\x93Y\x13>\x8b\xf8\x1a\xe6gZ\x0c\xcc\
+}\x98B\xc0\x19\x83/C\xb8\xae\x83\x9bV]\x1c<\
+\x10\x13\x1eDy\xeb\xe9}\xbf~akI\xbf\xee\x0c\
+\xb3\x19\xf7\xafD\xef\xfb^\x8f\x84\xca\xc2\xc0\x1b`m\
+#D\xe8{\x95Ea\x96\x10\xb47\xb0\xa7\x04\xe0\xe4\
+\xa9\xc7?|\xdf\xfb>\xf2O\xbb\xdd\xc5\xc5&\xad\xbc\
+\x14\x03PV\xfd{\x9a\xf8\x04\x0e\xd4\xb0?\xdf\x14\x03\
+`\x5c\x10\x18#\x13\x89D\x10\x02\x97.\xaf\xe7~n\
+\xc7\xaa\xd1,U1-\x14Y\xe2r\xf3\xc1\x0e\xbe\xe3\
+\xb6\x838\xbc\x12\x95L\xd8\x0ec\x97`\x09\x0067\
+F\xe7w\xc3\x92\x83\x977\xa2\xd7a\x18\xd5D\xb6\x98\
+\xd8\x02\x80\xd7/\xb0H\x1c\xba.\xae[\x8e\xb6\xd9\xe8\
+o\x92\xad\x81\xc0\xdaF\x08\x7f{\xab\x91\x850\xc3\xce\
+a\xcf\x08\xc0\x99\xb3k'\xbe\xebC\xdf\xff\x0f/\x05\
+\xfe\xa2c\xb9\xb0\x88R\x81\x22S\x7fx\x88a-\x98\
+B0Z\x1fu\xd31F\xe2u\x9c!\xde\x0e\xa8g\
+5\x04^/\xee\xfa\xd3d\xd7V\x80m\xb5\x7f;L\
+\xf7\x01\x00\xee\xbfeY\xbc\xfd\xd6}ly\xc1F\x7f\
+\x98\xb1\xe4\xa6\xc2\x07s|>\xf1~a1\x12\x88\xcd\
+\x8d\xf5\xa1R\xf0\xa5\x977\x80\x83\x07\x9cX\x14\x00`\
+\xed\xd2:[\xec,`\xb1\x83\xa1 \xec'k\xbd\x01\
+\xceon\xa0\xbf\x11 \xe8\xf7\xe3}Zt\xf1-\x8e\
+\xb32\xe7yk\xdb\xad\xff\xe8\x19*cO\x08\xc0@\
+\x84\x07\x8e\xdc\xb9\xf2S\x97\x02\xff\xad\xba\xe5\x0f\x14!\
+\x16\x89\x8a\xd3W\x11\x82:-\xbfF\x9a\xfc\x99\x17(\
+g\xbf\xe6\xf6\x8cy\x09\xf10\x91\x16\x87\xb5\xb5h\x9b\
+4\xd9\xa7A\xfe\xf87p\x09\xca9\xdev\xe7\x01\xf9\
+\xae[\xf6\xc5\xcd}''\x1f\xba\xe3\x8c\xc4\x01\x18\x09\
+\x84)\x0c\x0b\x8blh)p\x06\x00\xe7B*\x81\xa5\
+\xb1\x04\x83\x95\xe5%\xdc\x8aC8\xbf\xb1\xc5\xd67\xb7\
+q~s\x03\xdb\x17{\x0a\x12X\xef\x9d\xeb\xba\x8c\xcf\
+\x04`\x17\xb1'\x04\x80\xae\xf2\x8f\xaf,\x1d\xfc!\xdd\
+\xf2\x03\x11\xe9\xa7E| \x9f\xf0\xa4f/\x81&\xbd\
+i9\x98B`\xba\x19}o\x80\xfev\xbf\xd6\xfe\xdb\
+\x80eY\xf8\xc0\xdd+\xb8\xef\xd6\x03\x94e\x0cY\x16\
+F\x8d\x03\x7f8Kq\x968\x98\xc2\xe0\xda#A\xd8\
+\x0e\x19\x16\x00\xba\xc9#\xd7\xe1\x5cH\xe5\xa0'\xa9i\
+\x1d\x1cX\x9c\x17\x07\x16\xe7Gb\xf0jg6m\xd8\
+\x1e\xc0\xae\x0b\xc0\xa1\xd5\xe3?x\x91\x9f\xfd\xa8i\xf6\
+[D\xa9<\x17 \x8f\xf0\xce\xb0]\xf3ED\xc0\xb4\
+9?n\xda\xe7\xc3$pSA\xc8\xfa\xfe\xa5\xcb\x01\
+d8\xdd\xc4\x1f\xcay\xe2\x18\x9a\xfc\x0f\xdc~\x046\
+\xcb\xd6S\xdf\xe8\x0d\xee\xb0\xe4\xef\x15c\x05P\xccq\
+\x03\xd1\xe3cZ\x08I1\xe0\xec\x5cH\xe5\xd6\x86\x9f\
+0\x83\x0e,\xce\x8b\x03w\x1d\xc7\xe2\x1d\xfb?5\x08\
+\x06\x9f=\xfb\xf5\xb5_86\x9b8dW\xb0\xabS\
+\x83\x9d<\xf5\xf8\x87\xe7oZ\xfd\xd7\xfb\x16\xf7\xbb\xba\
+\xe5\xd7\xcfh\x1d\xf2\x03\x80.\xb8+\x14\x07\x19>\x98\
+\x04\xd9\xaf\xcb\xa0\xb7-\xdb>\xcb\xe4\x1f\x87\x00  \
+D\x88\x0b\xaf]D\xaf?\x00\x9b\xa0pH\x16(\xe7\
+\x89z|f\x01\xe4\xb7\xdey@\xbe\xe7\xee#\x84\x15\
+L\x1c\xc2(\xc9\x5c\x84\x1a\xe6\x0d\x98\x0b\xa1`\x8c\x81\
+1\x06\xd7\xe6`\xcc\x02g\x12\xa1P\xe0\x8c\xa2k\x11\
+t-\x02\xd7\xe6 V\x07+\x1d\x87\xcc\xd1\x80Rg\
+\x9e\x06\xa1\xa0\xd2\x18\x914G:\xf6\xaa\xbb|\xff\xb1\
+#\xcb\xff\xf3\x05\xb6}\xe7sO>\xaen8\xfa\xc6\
+W\x85\xe8\x07\xe5\xbfz\x866\xb0k\x02p\xe6\xec\xda\
+\x89w\xff\xcd\xf7|\x9c\xbb\xf37\x9bf?#I\xf2\
+\xbb\x9c@\x12\x17\xa4`\x86]\xc7\xc8k\x11*\xe5[\
+3\x0f\x8c\x8axI\x7f>\x09\x22\x81\xa86\xbcv{\
+\xab\x87\xb5\x0b\x1b\xad\x90\xdf$|Q\xf9\xc3\xfb\x8e\xad\
+\xe2{\xdex\x98\xccw]X\x9c\xc3\xe2\x1c\x12\x1c\xae\
+\xcd\x11\xa6&9\xa4\xdc\x01\xa1\x1cJ\x0a(b\x81@\
+V\x12\x04\x02U(\x06T\x09\x10\xab\x83E\x97\xa1\x03\
+\x0f\xcb\x1dJ7\x03\x1a\x0b\x01\xa5\x94\x82pw\xd9^\
+\xba\xef\x8e\x9b\x1ex\xffY\xbcv\xdbsO>\xae\x0e\
+\x1ex\xc37Z\xbbQ3\xe4b\xd7\x04\xa0{C\xe7\
+\xe3nw\xdf\x07\xd2\x81>\x9bS\xc2)A(#\xf2\
+\xfb\x05\x03m\x1c\x06\x085j\xfd\x81q\x01`4\xf9\
+\xa0\xe7\x09@\x9ePD\xad\xbc(X\xaa\xe1\xd2\xb7\xfb\
+\xe8O8\xf0G\x13\xbf\x0a\x8e\xee\x9f\xc3\xdfz\xf0z\
+,/$g>\xd6\xd7J\x0b\x82^8\x8d>\x8b\xde\
+\x13Hp\x10\x1a-RQ\x800p\x22\x0b\x05!K\
+\x0c\x002f\x15\x98B\x00D\xdd\x8b\x94R*\x89\xec\
+h!8\xc7/\xdd\xf5\xea\xb7\xd6\x9e\x9fM*:]\
+\xec\x8a\x00<\xf3\xd4\x17~\xf4\xf8}\xef\xf8G\x1d\xce\
+T\xa0\x08\x91\x18\xb5\xf8\xa1De\xf2\x03I\xf2\x03H\
+\x908M\xfe\xf4\xe7B\xf1\x98\xf8\x1a\xbep\x12\x22a\
+\xba\x03Y->\x81\x13\xaf\x8f\xfc\xfd\xf1c\x0e<\x85\
+s\xe7.7.\xc6Q\x87\xf86\xe7X\xe8v\xf1\xb7\
+\xder\x18\xd7\xed_l|\x8f\xb4 p\x0aH\x0c\x09\
+n\x08B\xdaB\xc8\x13\x03\xc6,X\x16G\x10\x86\xb1\
+U`\x0aA\xa7\xd3\x85\xe4\x0a\xa1.\x8f\x04@\x0b\x81\
+v\x0dfB0=\xec\xb8\x00\x9c9\xbbv\xe2=\xdf\
+\xfd\x81\xff\x9bs~\x1d\x00\x98\xe4w9\x01\xa7\x91\xc9\
+/\xc0\xe1\xb0\xd1C\xa8{\xd3\xf4\xbaV~|\x05\x81\
+H\xc3a\x22A\x0eF\x05\x18\xb1!\x95\xf6C\xc6\x05\
+b\xf3\xe266\xd6\xf3\x93\x7f\x8a@y\xb9\xcb\xc2\x08\
+\x81\xc59\x18\xa5`\xd4\xc2\xdf\xb8\xfb0\xee\xbfy\xa5\
+\x9d\x8b\x84\xa4\x18\x08\x89\x84\x18hA`td!\x98\
+b@\xa0\xc0(b\xab -\x04\x9csX\xcc!\x1d\
+\x8b!\xa4B\x9aB\xa0]\x83[o;\xfa.\x1b\x07\
+6C\xa9^\x9c\xc5\x07\xda\xc5\x8e\xf6\x028\xce\xca\xdc\
+\x91;\xf1S\x01!o\x01\x00\xc6(\x09B\x05\xd7\x18\
+\xe6\x9b\xd7\xea;\xd3\x98\x0fCu\x00\x92\xdf-g3\
+\xaf\xfc;*2\xb1mJ\xe1K9v\x9e\x9e\xf0\xb0\
+\xd1\xef\xd5:\xad*\xa4\x8f\xcf\xd1\xd8\x96Q\x0b\xc7\x8f\
+t\xf17\xeeZ\x81]A%u8.\xacQ\xea\xdc\
+1N\xcd\x1bv6\xe8\xb8\x86\x10Qee\x8b\x03D\
+\x05\xf0\x852>\x93\xb0\x98\xc2\xd2\xbc\x83@\x10\xf4\x02\
+\xc0\xc5`\xd8\x83\xa0\x00\xdb\x82\xed[t\x9d\x06X\xdf\
+J^/\x7f;<A\xf8\xe077;k\xef=\xfb\
+\xd2\xac\xc7\xa0M\xec\xa8\x05\xb0\x7f\xdf\x0d\xdf\xbfo\x7f\
+\xf7g\x80\x88\xfc\x00\xc0S\xd1iahR[-}\
+\x02\xaa\x03\xc0\x1a.\x00HX\xbe\x1d\x09\x8d\xf70\xbe\
+\x9f,%.\x94\x02#\xf6\xe8;\x00\xb6\x07\x0a\x17^\
+\xbfT8a\x86\x89\xba-~\xbc\x8eZXt)\xfe\
+\xc7\x07\x8f\xe2\xc0\xbe\xf9JU{\x09\x89\x96\xcc\x1e\x80\
+\x0aED\xb3,\x03\xbdh\xab\x80Q\x06)E\xbc^\
+)\x05\xa9\x08,\x86\xd85\x88\x83\x85\x84b\xd1\x8d\xbe\
+\x13\x80A\x18\xdd\x99\x94R\xaa\xad\x81\x8d\x8d9\xcb\xb6\
+\xf8\xb33k`r\xec\x98\x05p\xe6\xec\xda\x89\x1bn\
+\xed\xfdX\x903\xb4\x5c\xb7\xfcSi\xe9M\xa4[|\
+\xd5\xa9\xbem\xc9z\xdb<\xf7\xe1~\xfb\x97/\xb5\xda\
+\xf7\xcf\x08\x01K\x0d\xe7e\xc3IQ\xdez\xfb!\xdc\
+p`\x0eBL\xce\x0bmAHU\xcdB\xd0\x96\xc1\
+\xb8U a\x0d\xa7D\x0bB\x1f\x8cQ0\x16\xad\x0f\
+\x04A\xb7\xa3\xbbv#k`\xe0\x87\xc0\xbc\x05\xdb\x06\
+|\x97\xe2\xb2?\x90\x83\x9e\x8c\x95\xce\xdf\x0eO\x1cX\
+\x91\xff\xeceo\xed\x81\x99509v\xcc\x02\xe8\xde\
+\xd0\xf9\xf8\xc2\xdc\xd2w\x07\x8a\x10;\xd5\xecO\x85\xfc\
+\xba\xc5N\xb4\xdeYK\x11\xf2\xb6\xb3*,\x80'\xfb\
+8wa\x03\x81W>,\xb7J\xa0\xaf\x88\xfc\xc7\x8f\
+t\xf1\xbdo\xb9\x0e]\xd7\xc9\x99W\x90\x0e\xd3\x8d)\
+(e\xa5\x16\x02c\x16(e\x80\x92\x95-\x02 i\
+\x11\x00H\xb4\xfci\x8b\x80\xb3(F \x15\x81eq\
+Hj\x81A\xa2k\x11\x08\x09tm\x06%(I\xc7\
+\x06Lk\xe0\xf1\xc7\x1e\xf9\xebY\x97as\xec\x88\x00\
+\x9c<\xf5\xf8\x87o\xbb\xfb\xcd?o3\x8e,\xf2\xd7\
+\x0e\xec\xa9\xce\x98\xe9\xce\xb8\x03%\x22\xf3\x9bY\x0cJ\
+\xea\xc3D\x04a\x96\x04e*^\xf4\xe7y\xeb\xdb\xc0\
+\xf6 \x88\xcd\x7fM\xf0\xb4+P5\xc2\x9fE~\x00\
+\xa0\x84\xc1\xb1\x19>\xf4\xe6\xa3x\xc3\x81\x85\xdc\xef\xeb\
+IB4!\xd3\x82\x90^F\xdf\x1b\xae#\x0a\x8c\x12\
+\x10\x12\x11\xb7L\x10\xf2\xdc\x03-\x04\x9c\xc88X\xc8\
+\x19A(\x80\x8e\xa5\xa2@!8\xbaL\x80*\x11\x07\
+\x09A\x18D\xc0 1\xba\xef\x22\x90\x07\xef\xb8\xe9\x81\
+\xf7\xcf\x1f\x9a[\xf5z\xfc\x8b3\x97\xa0>\xa6\xee\x02\
+\xe8Q~\x01!*P\x84\xa4\x1f\xe1Z\xad\xbei\xae\
+\x8f\x99\xee\x12\xccj\x7f\xb6\x0fs\x9f\x22\xa8\x17\x940\
+S\x7fe\x18\xd6\x0a\xee%\xce!\x87\xfc\xba\xf5\xbf\xf7\
+\xd82\xee\xbaa_\xad}\xf2a\xca%g\xf9\x82\x17\
+\x1a\x03\x99\x18\xb3\xf4E\x00\x10\xb9\x08R\x01\xa6\x9c\xfb\
+a\xf6\xf57\xdd\x033`hq \x10\x00\x94\x0f\xd7\
+\x1e\x0d\xb3\xeeZ\x80G;p\xb9\x82\x1b\x0e\x00(,\
+\xd8\x16.\xf2\x00\x97\x06.<#\x9f\x22\xa4\xc1r\xb8\
+%\xff\xf7\xcd\xce\xda\xa1\x99KP\x1fS\x17\x80w<\
+t\xef\x0fK\xce\xde\xca\x00\x98\x8f0\xa15r\xecU\
+gHD9F\xc24\xe9\xcd\xcf\xb3\x04A\x04\x14\xcc\
+\x8a\xc4\xc2\xdc6o\xbfE\xeb\xf3\xb6\x01\x22\xf3\xbf\x7f\
+\xf9Rb\x9d\x19\x0b\xa8\x1a\xecc9%\xba5\xf9\x17\
+]\x8aw\xdc\xb1\x1f\x8eE+\x9b\xe9Ua\x8aC\x18\
+\x17O\x19\xb9C\x0c\x80\x10A,\x04|H\xee\xbc\x98\
+\x81\xc3\xc7c\x04Q\xdd\x03\x1b\x81\x00\x18\xf3\xc1\x180\
+\xf0\x15\x1c\xa6\x00\x06\xf4\xe0b\xb5;H\xc4\x06\xd69\
+\xc5 \x94\xf0\x06\x038\xae\x0b\x97\xfa\xe4.\xdc\xf8\xd1\
+\x1b\x82\x13\xb7\x7f\xf9\x85\xc7>6\x13\x81\xea\x98jM\
+\xc03g\xd7N\xd8\xcc\xfe@z}U\xf23\xce\xc0\
+\xb8S\xabe\xd7\xe4\xce\xfb\x8e\xb9>\xfd:\xeb\xbbu\
+\xf7\xa31\xf0\x14\xfc\x9c\xe0_[\xe4g\x14x\xe3M\
++\xb8\xf9\xe0\xdc\xf0\xfd\xf4ko\xa4-\x06\xc6,X\
+\xdc\x8a\xff[\xdc\x02\xe3v,\x06i8|\xb4D\xdf\
+\x8f\xb6\xb3\x18\x00b\x03\xc4\x86k\x13Xld\x0d0\
+\xbb\x03\xd7\xe6\x98\xe3\x02\x0b6\xb0\xd4\xb5\xe0r\x0a\xb7\
+K%\xa1\xbeT\xd2\xa6\x00\xb0p\xdd\xf6[\xfe\xc6\xbb\
+\xde\xfc\xefO\x9ez\xfc\xc3S\xbf\x10W\x09\xa6\x1a\x03\
+\xe8\xde\xd0\xf9\xf8\xc2\xc2\xe2\xfb\xccuuZ~%\x15\
+hj\x0c\x80\x92$\xe1\xb7\x17\xc1\xa2\x04RE\xff\x19\
+\x89\x96&\x8d\xa4\x19#(\xdbF\xc7\x10._\xd8\xc2\
+\xe6F\xb2\xeao\x9d\x8c>+G$4\xf9\x01`e\
+\x81\xe2\xfb\xde\xf6\x06,/t\xe3\xa0\x9e\x9aR\xb9\xfd\
+Q\xec\x00\xa5\xd70\xeaJdP$\x8a\x1f\xa8\x9c\x89\
+Q\xd3\x81B\x9d4$\x15\x03%2\x8e\x0d0n\xc1\
+\xe6\x14\x8a\xd9\xe82\x01!\x01B\x19,P\xd2\x0f\x86\
+'\xa5\x18\x81b\x84(z\xf0\xf8]\xf7\xdc3\x0b\x0e\
+V\xc3\xd4,\x80\x93\xa7\x1e\xff\xf0\xf1\xeb\x8e}\xb7\xb9\
+\xae\x96\xd9?D\x99\xc9oQ\x92X\xd2H\xaf3\xdf\
+g}'\xbd\xbf\xb2\xfd\xa7\xa1\xcf/]\xf6\xab\x8e\xff\
+\xcf2\xca 0j%Z~\xc7f\xb8\xff\xa6C\xb8\
+nu\x0eR\x86\xc6v$\xb6\x04\xcc\xd7Y\xef\xab \
+\x14*\x11\x0b\x00\x22+\xa0(v\xa0a3\x02\x9b\x11\
+0n\x83\xf1\xf1\xaa\xc5\xa6%\x00\xe4[\x03DFq\
+\x87\xae\x05\x80\xbbX\xed\x12,\xd8\x80m[Xv\xc7\
+\x1fa\x22\xf8\x89\xefz\xef\xf7\xfd\xdbC\xab\xc7\x7f\xb0\
+\xd6\x8f\xbd\x061\x15\x01p\x9c\x95\xb9\xdb\xde\xfe\xd0G\
+\x02\x89\x03U\xb6g<e\xea\xaaNd\xfa\xe7\x98\xff\
+&\x11\x03\xa9\x10\x0c\x9b$\xfd\xbf\x8c\xac\xe9\xcf\x8b\x08\
+N`\x83\xc0N\xec\xbf\x0c\xeb\xfd^\xc2\xfc\xafK~\
+V0\x9d\x97\xb6\xac\xe7]\x85\xb7\xdd\xb2\x0f\x94rP\
+\xca!\xa4J\xc4\x00,n\xc5\xd6S\x9e\x10\xe4-&\
+4\xd9\xb5\x10\x98\x82PG\x08\x18\xc2B\xb7 >7\
+C\x04\xb4\x10\xb86\x81kG\xc7\xa9\x22\x02\x84\xfa\xd2\
+\x99\xeb,tl\xf1\x8b3\x11(\xc6T\x82\x80\xfb\xe6\
+\xf7\x7fdye.q\xe1\xf3Z\xff\x04\xf9\x8d`_\
+\x19\xaa\xb4\xf6e \xb0\xa1\xe0\xc7\xaf\x01\xc4\xef\xab\x1e\
+\xd3D \x15,J\xd0\xbf\xec5\x8a\xfaW%?\xe7\
+\x0c\xf7\xdft\x10G\x0f\xc4\x05{a\xf1\xec\x9c\x06-\
+\x02\xa6\x95Pz\x1e\xe9\xecL\xa9b\xa2k\xf2g\x89\
+@4\x0c8\xb9]\xbcOfEQ~\x22\x015~\
+.\xd9=\x05\x12\x16\x03\x02a\xc3\x97\x0a\xae\x1d`\xe0\
++t\xad(8\xb8\xd0\x95\x00<\xc0\xb6\x00\x04\xb84\
+\x18\xbaA\xd2\xa6\x84\xfa\x92u\xd9r\x07\xe2\x17\x0f\xad\
+\x1e\xc7\xeb\x17O\xffv\xad\x9bq\x8d\xa0u\x0b` \
+\xc2\x03\xf6r\xef\xc7\x98\xf1\x14e\x91?\x0a\xf01\xe3\
+}\xb5`_]\x92\x9b\xd0\xad\xb9\xd9\xaaO\xfa}s\
+?6u0\xf0H\xed\xdc\x7f\xa0Z\xd0\x0f\x88\xc8\xaf\
+[\xff:\xd0\x96\x82\xb9T>7\xc32(j\xf5\xcd\
+\xf5Y\xdb\xd8\x8c\xa0c\xb3d\x90\x90$\xcf#\xcf\x1a\
+\xb0)\x89\xad\x01 \xb2\x04:6\xc3B7z\xb6V\
+\xe7-\x1cZ4\xa6x\x1b\x06\x06Y\x97-\x13\xbe\xf5\
+\x9b3K \x1b\xad\x0b\xc0\xb1\x83w}\x97\x1e\xec\x03\
+\xe4\x93_\x84\x02\x22.J\x91|\x08&\xf1\xc1'E\
+\x9eHd\x09\x86)\x02\xda\x9a\xe8\x05\xbd\xdau\xff\xaa\
+F\xfc\xf9P0O\x5c\xbf\x92h\xfd\x9b\xa2\xae \x98\
+n\x82\xe9\x1a\x980\xdd\x84<\xa1\xb0\x19\x89,\x16\xc2\
+#\x92W\x14\x81\xe8b\x8fD\xc0a\x0a\x1d\x9bau\
+\xb1\x13\xf7\x10\x98\x22\xa017?\xcff\xee@6Z\
+\x15\x80\xac\xd6?\x0b\x9a\xf8#\x0b\xc0\xa8a\xd7\x02\xc9\
+\xf3Z\xf9,\xf3\xbe\xa95\x90\xde\xaf\x82\x0f\x02\x1b\xbd\
+\xed^-\xf3\xbf*\xf95\x1c\xd7\xc1\x03\xb7\xee\xaf\xe4\
+{\xd7E\x131\x00\xc6\xdd\x02\x8d\x22\x11\x00\x22r\xdb\
+\x8cD\xe3\x03\xb8\x9d\x10\x82tW!c4!\x02\xd4\
+\x8a\xee\x99\xc3\xa2\x0cEjwc\x11\xc8\x0a\x0c\xb2.\
+[\xb6\x9d\xf5_\x9au\x11&\xd1\xaa\x00\xa4[\xff<\
+\xa4\xcd\x7fm\x01\xb4E\xfe\xbc\xf5U\x88\xae\xc9\x5c\xf7\
+\x98\xda\x02\xd8\xbeT\xcd\xd7\xd6\xdd\x92\xa5\xdb\x19~?\
+\x00\xdc~\xa8\x8b\xdb\x0e\xcf\x8f\x91\xadmT\x15\x03\xc7\
+\xa2p\xac\xe1\xb4e\x15\x5c\x03\x13\xbaH\xa9\xfe_\xc5\
+\x1a\xd0\x22`S\x12\x8b\x80mqtl\x06\xb7;\x8f\
+9.\xb0:\x9f\xdd;`w\x96\x96>\xf8\xbd?\xf4\
+s3\x11\x18\xa15\x01H\xb7\xfe\x84:\x15\xbb\xfd&\
+'\xbfI\xec4\x8159-\x1a\xc0\xa2\xc1\xf0XA\
+\xe1\xbe\x9aZ\x04\x1b}\x85\xde`P\xbd\xf5\x1f\x16\xd7\
+\xcc\xfc,\xe5\xf7\x03\x00g6\x1e\xb8q\x09\xb6e|\
+\x96\xe3\x93\xeb\xf5U#\xf5E(\x13\x02!\xd5\x98k\
+\xa0\x91\x0e\x16\x96\x89A,\x029\xd6\x00\x801\x11 \
+2\x80mq0JJE\x80\x08~\xe2\x83\xdf\xfbC\
+?w\xe6\xec\xda\x89\x89.\xcaU\x82\xd6\x04\xe0\xf9g\
+\xfe\xe8\xfb\xcaZ\x7f\xdd\xf2[\xf1\xc3\xcd\x1b\xf9\xf6\xb6\
+\xb1}\x91o\x0e A|\x8d@\x96\x8d\x02l\x86\xed\
+\xcd 7\xfb/q\x1d*Nx\x94\xee5\xbba\xdf\
+\x1cn\xbf>\xf2\xfd\xd3d\xca#^\x9b\xc8\x13\x82\xac\
+.\xc6t\xef@V\xefA\x1a\x09\x11\x002\xad\x81t\
+L\xc0\x14\x01\xd3\x1d\x00\x8a\xf3\x04\xde\xf5\xb6\x07?1\
+\x10a\xa5n\xea\xab\x19\xad\x08\x80\xe3\xac\xcc\xdd\xfe\x9d\
+\x1f\xf8\x0e\xdd\xfa;,;\xf0\x07\x006\x91\x08d\x00\
+\x8bZ\x8d[}_\xaa\xb1\x96=\xed\xf7\xeb\xf5\x81\xb4\
+\x12\xcb4\xd1[\xaf>\xc9Mqw\xdfx\xeb\x0f\x00\
+w\x1e\xb5\xe2\xa8w\x1e\xdaj\xf5\x8bP\xc550\x85\
+@\xc3\x14\xa5<\x81\xca\x14\x81\x94\x10\xe4\x89\x00\x10\xc5\
+\x04lN\xb1\xd0u\x0a\x93\x85\x98\x85\xf7\xd1U\xfe\xf1\
+\xa9]\xa4+\x04\xad\x08\xc0\x93\x7f\xf5\xf9\xf7\xdey\xf4\
+\xa6\xef\x01\x22\xf2\xb3a\x89\xaf\x8e5\xbc\x99\xa9D\x1f\
+\x8b6'b\x96\x89\x9eG\xeci\x13^\xc3f\x14}\
+/\xc0\xc6\xf6F\xe1v\xda\xef/\x22\x7f\xbcm\xea\xce\
+\xcc-s\xdcsc\xf3:\x7fm\xba\x04\x1aU\x85\xa0\
+j\xd7\xe1\xe8z\x92Qp\x90\xd1D\xde@\xe6\x18\x02\
+$E\xa0kaL\x04\xdc\x8c\xf1\xe6w\x1e\xbd\xe9{\
+\xae\xf5\x9e\x81V\x04\xe0\xb6\xb7?\xf4\x91A(W\x00\
+\x8c\x91\xbfc\x11\xd8$\xea\xdf\xb7\xa8\x05E\xea\xa7\x03\
+\x9b\xc82\xe9\xf5:s\xbd&\xbf\xcd(\xec\x0a\xb5\xf8\
+\xabl\x93\xf5\x1d\xfd\xbd^\xd0\xabf\xfe\x97\x90?J\
+\xf9\x8d^\x9b\xad\xff\xdd+\x0b8\xb2\xb2\x80\xb6P$\
+\x08u\x85\xa2L\x08\xf2\xe2\x03\xe5\xd7\x97D3\x13e\
+\xc4\x04\xa2kY]\x04\xf4\x00\xa2\x04\xfa\xd6\xca\xdcj\
+\xf8\xd3\xd7r<`b\x018sv\xed\xc4\x1d\x07o\
+~S\xd9vM[}\x9b\x92\xc4\x02d\xb7\xec\x848\
+c\xa47I\x9d%\x04\xe9\xed\xcc\xf7\xe9\xf5Y\xf0\x87\
+\xa3Y|!\xd1\xdb.N\xfe\xa9\x16\xf1\xcf6\xfd9\
+\xb3q\xe7\xd1%\xb8\xf6\xf4\xea\xa5\x99\xa4\xcf\xca\xfd\xcf\
+\x83\x94a\x9ceX\xc5\x1aH\xef\xaf,V\xd1\xb1Y\
+\xa6;\x90'\x02\x00rE\xa0\xc31&\x02D\xf0\x13\
+o\xbd\xf5\x9d\xff\xe6Z\x8d\x07L,\x00\xefx\xe8\xde\
+\x1f\xf6\xa88\x01D\x91\xff~\xa0\xd0\x0f\x14|E\xe1\
+\xab\xc9vog\xc4\x08\x02i\xc1f4\xe1\xe3\x13\xe2\
+\xc4d,\x22\xabo\x8cS\xd7\xdb\xe9\xf5\xe9\xcf\xcd\xed\
+\xfc\x9c\xf1\xed\xe6\xb1\xaav\xff\x95!\xeb\xf4\xcd\xe0\xdf\
+N /\xed\xb7\x08Z\x08\xaaX\x03u16\xa7a\
+\x86\x08\xe8.B\xddP(jAQ+q\xbc\xd5y\
+\x0b\x9d\x8cS\x9b?\x1c\xbc\xed\xd6\xe37\xfe\xe4\x8e]\
+\xe0=\x84\x89\x18:\x10\xe1\x01B\xf0. \x99\xf1g\
+\x06\xfc\x00\xd42\xfb\xd3\xad\xbd\x09M~ j\xf1\xc9\
+p\xbf&A\x8b\xc8Zd\x19\x14\xb9\x0ay\x96\x83F\
+\xdf\x0b\xd0\xab0\xebOY\xe0/\xcb\xf4W\xd4\xae\x14\
+\xfc\x9b\x06\x9a\xc4\x0c\xaa\x08A\x13w@\xb7\xf4\xe9\x1e\
+\x02'u\x08m\x090F\xe2\xeeA3e8/\x1e\
+\xc0{\xce\x8f\x5c\x8b\xf9\x01\x13\x09\xc0\x8b\xdfx\xe2\xed\
+\xb6k\xdd\x9a^o\x13Y\x9b\xfcy\xa4\x07\x10\x13\x1d\
+\xc8n\xc9\xab\x90xR\x14\xed\xbf\xc8\xff\xaf\x13\xf8\xcb\
+\x82k\x13\xdcv\xdd\xbe8w\x9eO\xe9\xf7\x95!/\
+\xd7 \x8f\xe8\xa6\x10d^\x97\x9aq\x01=\x8e\x00\xc8\
+\x17\x81\xf4\xd8\x01\xb3{\xb0,\x1e\xc0\xbal\xf9\x83\xdf\
+\xfbC?w\xad\xb9\x02\x13=M:\xf8g\xb6\xfe:\
+\xf8W\x15E\xc4\x07\x92\xe4\xd7A\xbei\x91\xbc)6\
+.\x14\xcf\x12\xdc4\xf0\xa7\xa8\x8dc\xab.\x8e\x0d+\
+\xfehpFs\x97i\x22/`\x08\xe4\xfb\xffe\xa3\
+\x10\xeb\xba\x04y\xee@\xbc\xbf\x0c\x11\x00\xb2\xe3\x01i\
+\x10\xc1O\x5ck\xae@\xe3'&+\xf8\x97&\x7fY\
+\xeboW\xb8\xf9\xba\xc5\xd7&\xff^#\xbf/$\xbc\
+A\xb6\x004\xed\xf23q\xfb\xe1\x05t\xddr+J\
+\xd7\xe1K\x8b\xc14D!\x1d#0E\xa0\xce(\xc3\
+\xd1\xef\xaf\xee\x0e\xf8Y\xf1\x08\xc2\xc7\x5c\x01\x13\xd4\xb2\
+\xc7\xe2\x01y\xae\x00\xe9\x07\x7f\xe7Z\xea\x15h\xfct\
+\xbc\xf5\xee\x07\x1f\xe8\xa9\xe0\xae\xbct\xdfI\xc8o\xfa\
+\xf7\xd34\xeb\xdb@\x9e\xff_5\xdb\xcfD\xba\xf5w\
+m\x82\xdb\x8ft\xab}7\xe3\x1a\x99\x22\xd0\xb6\x95P\
+d\xbaOS\x04\xcc\x1c\x81\x04\x0c\x11\x18\x1bF\xac\xbf\
+k\xf1LW\xc0\x14\x02\xbb\xb3\xb4t\xe4\xce\x95\x9fr\
+\x9c\x95\xb9\xd2\x93\xb9\x0a\xd0\xf8ixE\x9c~\xaf9\
+\xea/\xdd\xfa\x13\x95o\x16Wi\xf9\x95\xf2J\xb7\xd9\
+\x0b\xa8\xda\xff\x9f\x07V\xd0=zl\xd5\xc5u\xab\xed\
+?\x87\xd3p\x19\xd2e\xc6\x9bX\x03u,\x81D\xa2\
+\x90F\x81\x08\xe8\xa0`\x96+0\x08%\xa43*3\
+\x7f\xe7\xd1\x9b\xbe\xe7\xc9\xbf\xfa\xfc{[\xbf\xf0{\x10\
+\x8d\x9e\x80\xb4\xf9og\xdc\xb3<\x0b\xa0\x8c\xfc\xa6\xcf\
+O&L\x1a\xda\x09\x14\xf9\xffe\xe6\xbf\xcd\xadL\xf3\
+_Q\x1b\x16\xa9n\xfe\x03\x91\x0b\xa0\x97:\x98\x96\x18\
+\x94\xc5\x06r\xafYM\x11\x000&\x02\xf1\xbeR\xbf\
+\xa9\xc8\x15\xe8\x0a/\xb6\x06\xdc\xc0Yy\xf7[\xfe\x97\
+\x7fp-X\x01\x8d\xee\xfa[\xef~\xf0\x01\x8f\x8a\x13\
+]\xc7\x85MF\xd9\x7f@D\xfc:\xdd~fR\x0f\
+!\x0e\x94\xf2\xa0\x94wE\x90?\xcf\xff7\xcd\x7f!\
+D\xa5}\x99\xe6\xbfE\x00gQV6\xff\x81\xe6D\
+6\x85cR!\xa8\x12 \xac\x9a><\x09\xb2\x86\x10\
+\x9b\x0dO\xbaW@\x07\x04\x07\xa1\xc4`8\xb9\xc9\xc2\
+u\xdbo\xd97\xbf\xff#\x13\x9d\xc8\x15\x80Fw\xfb\
+\x15q\xfa\xbd]'\x9a\xd4\xd1$\x7f\x19\xb2Z\x7f\x9b\
+\xd1\x84\xcf\x0fL\xa7\xe5O?xM\xfcT\x13\x8c\x93\
+L\xff_\x93_\xb7\xfeU\x86\xfbf\xe1\xfa\xee\xdcT\
+\xcc\xff4\xb2H\xdf\x865\x90\xae&l^\xff*\xf5\
+\x09\x1d\x8bV\x8e\x09\x00\xc8u\x05\x12\xdb\x0e]\x01`\
+\xd4+\xc0\xb8\x8d\xd5\xf9\xe4\xbd\x18\x84\x12J\xdatn\
+5\xfc\xe9\xab\xbd[\xb0\xf6\x9d.K\xfd\xcd\xf2\xfd\x8b\
+\xba\xfa\xd2\xbe~[\xe4g\x9c$\x16B\x05\x08\x15\x89\
+\xf7Y\xdb\xe9u\x94\xf2\xf8\x7f^=\xbd<\xff\xbfn\
+\x9f\x7f:\xf8\x07\xd43\xff\x9b\xc2t\x17\xb2D`\x12\
+\x8b\xc0\x8c\x09\xa4\x89\x5cU|\xabZ\x02e\x22\x90U\
+HD\xbb\x02\xdd\xa1\xff\x9a\x95\x1b@\x04?q\xec\xe0\
+]\xdf\xd5\xd6\xf5\xde\x8b\xa8}w\xb7.\x9d\xbaU\xa7\
+\xfef!m\xfe\xdb\x94\xc0oy\xca*\x13i\x02\xd7\
+\xb1H\x8a\xa0\x05B\x0bGz\x1d\x90\xed\xffW%\x7f\
+\x1e\xaf,\x020\x8b\xe0\xe6\x83\xdd\x1d\xe8\xd7\xaf\xb6\xff\
+\xa6BPV$\xb4\x0at\xb5\xa12\x94\xc5\x03\x80\xe4\
+x\x01 \xdf\x15H``\xfdoWs,\xa0\xf6]\
+\xbd\xed\xed\x0f}D\x9b\xffi\xe4\x91\xbf,\xc3\xafn\
+\xc4\xdf$\xb9\x08\x15D\xa8r?\xaf\x02\xfd}\x11\xaa\
+\xdc\xef\x12* B\x15\x93_\x84j\xcc\xff\xaf^\xe8\
+#{\xd0\x8f\xc6us]\x1c^\xeeT\xda\xd7N\xa2\
+\xa9 eM.R\xc7\x05\xab*\x02\xd9\xdf\x1d\xce\x8d\
+\x90:w\xc6H\xa5\xdc\x80\x85\xeb\xb6\xdfr5\xf7\x08\
+\xd4\xba\xb2\x8e\xb32We\xe4_]T1\xfb\xdbn\
+\xe1\xf5>\xb3\xfe\x97m\x0f\x00\xbd\xbeW)\xff\xbf\x0e\
+\xb4\xf9\x7f\xf4\xa0\x85\xe5\x85N\xed\x88\xfeN`RK\
+\xa0\xf9q\x1b\xc6\x03\x801W\xa0J@PCI\x9b\
+\xde\xf6\xf6\x87>r\xb5Z\x01\xb5\xee\xe6\xe9\x97^\xb8\
+Qrq0\xeb\xb3\xac\xd6\xdf\xfc\x9fF\x1d_?\x8b\
+\x98m\x9b\xfd\x04\xf5\xfc\xf6\xcd\xbeL\xf8\xffu\xf2\xfd\
+\xb3\xd2~\x81\x91\xf9\x7fK\x81\xf9\xbfSi\xbf\x1aY\
+]\x8bM\x8e\x9fE\xe0\xbaU\x88)\xe3\xa5\xd6\x80\x9d\
+%\x14d|\xff: X\xc5\x0a\xb8\xa5{\xe8\xc3W\
+\xab\x15P\xeb.\xbe\xf5\xee\x07\x1f\xc8\x9a\xee\xabn\x91\
+\x8f\xaa\x11\xff\xb6[\xfc\xccs\x01\x03\x01\x83\x82\xc8\x5c\
+o.&\xb6\x06k\x8d\x8e\x97\x17\xfd\xd7\xad\xff\xa2\xed\
+\xaa7\x1c\x98\xaf\xbd\xdfi\x8bB\x9e\x10\xd4;\xc7\xc9\
+\xee\xa5E%\x02Y\xa5\xb8\xcb\xf8q\xb2\x02\x82\xf1\xf6\
+\xc3\x0cA\xc7u3\xad\x00\xbb\xb3\xb4t\xdb\xdb\x1f\xba\
+*\xbb\x04k\xdd\xc1W\xc4\xe9\xf7f\xd5\xfb\xab\x83\xaa\
+-\xff\xb4\x89?v^)\x92\xa7\x05Ao\x03\x0c\xfd\
+\xff\x8d\xd1\xa5k\xab\xf5\x07\x80#\xcb\x94\xac,D\xfe\
+\x7f\x16\xc1\xca\x12~\xdaO\xea)N#\xae{\xbc\x22\
+\x11\xa8b\x09HQ\xb1\xeczF\xaap\x1af\x86 \
+\xa3\x046U\xf1$\xa6\xda\x0a\xd0\xff\xef8x\xf3\x9b\
+\xae\xc61\x02\x95\xef\xdc@\x84\x07\xaa\xfa\xffUR}\
+\xb3P\xd5\x17\xaf\x8b\xac\x16\xbc.LA\xf0\x85\xc4v\
+\x18\xcd\xfecs^\x99\xfc6/\xee\xfbg\x16\xc1\xb1\
+\xfds\x98\xef\x98e\xbf\xeb\xe5\xf1\xa7\xc5a\xa7F\x0b\
+6\x15\x81\xba\x19\x83\x8csP\xd6,\x87\xc3\xb18\xc8\
+\xf08\xa6\x15\xa0\xa8\x15\xc7\x02\x00\x8c\xe5\x05\xb8\x9cF\
+\x95\x83\xee~\xf0\x81\xa9]\xc0]B\xe5\xbb\xf6\xfa\xb9\
+\x8d\x83\x92\x8b\x83e\xe4,#\x7fQ\xc4\xdf\x8c\xc6\xb7\
+\x85<\xe2\x9b\xa6\xbf\xb9\x98\xdf1\xd7\xe9\xf7\x04\x0c}\
+/\x80\xf0\xa2\xa1\xc9U3\xfd\x0a\xaf\x09\x1d\x159=\
+\xba\xbf8\xfa\x9fG\xe8<\xab\xa0IzpS\xecD\
+\x5c\x82\x13\x09BP*\x02\x99c\x05\x00(\x19\x16\xf6\
+\x08\xe8\xbc\x80\x0eGb|\x00\x00t\xe6\xf0\x83W[\
+0\xb0\xf2\x1d\xdb\xbat\xea\xd6\xaa\xd3}\xa7Q5\xca\
+\x9f\xf5z'\x91e)\xe8\xf7\xfa3J\xe5\xc4\x03\x80\
+\xf2\xcc\xffE\xdbU\x87\xf7\xd5\xeb\xfe\xabS\x17`'\
+\x84\xa0\xaa\xa5\x915\xa30P\xcd\x12\xa8#\x02i\x10\
+c\xff\xe9\x1e\x01`\x94\x1dh\xdb\x16\xbab\xd4X\xb9\
+\x9cB\x84\xebo=\xfd\xd2\x0b7N\xfd\x22\xee *\
+\x0b\xc0\xfb?\xf8\xfd\xefH\xfb\xffU\xf3\xfeun\x7f\
+:\xe57\xab\x1bn\x12\xf2g\x05\xed\xcc\x16\xbc\xca\xfa\
+\xa2u\x00 %M\x14\x00e\x8cU\xb2\x02\xaa\x98\xff\
+G\x96)Y]pK\xf7U\x05i\x12\xeeT\xcc\xa0\
+\x8e\xc5\x917\x95xU\x11\xa8\x0a\xb3\xc5\xb7\xd9\xf8\xba\
+\xe8=\x89g\x17\xea\xda$\x0e\x06\xf6\x98\x13\x8f\x11\xb0\
+;KKj!\xfc@k\x17k\x0f\xa0\xf2\x9d\xff\xe6\
+\xc5W\x0f\x95mS\xc7\xf7o\xdb\xdfO\x07\xf0\xd2\xa6\
+{\x1e\xe1\xeb\xc6\x06\xc20L\x14\x00\x15B@\xa8v\
+\x5c\x96c\xfb\xe7\xe0\xda\x93\x8dQ0Q\xb58\x88\x1e\
+\x08\xb4\x1b(+\x09V$\x06\x16mf\xd1\x94Y\x01\
+\x002\xad\x00\x00\xf8\xce\xbb\x1ez\xdf\xd5\xe4\x06T\xba\
+\xeb:\x00\x98&\xab\x99\xf7_\xb5\xacW\xdbH\xb7\xea\
+\xa6\x1f\x9f\xd7\x8dG\xa9\x8c\x97\xf4\xfb\xac\xc5\xfc\x9e/\
+d\x9c\x00ds\x0e\xa1\x14\xec\x8as\x01\x02\xe3\xe6?\
+g6\xd8\xd0\x078\xba\xbf\x03J\xa7C\xc4tq\x10\
+\x0d\xddZO\xea\x1e\x98#\x0a\xb3\x8eS\x17M\xab\x0b\
+UA\x9e\x15\x00\x8c\x12\x838\xcf>\xf7\xab\xcd\x0d\xa8\
+t\x87t\x000\xbd\xbe\xcc\xfc\xcf#~\x9b>~V\
+w\x1d\xa3$&\xaf\xc5(,F\xe3\xd74\xd5j\xd0\
+\x0a\xad\x88)\x04}/9)I\xddz\xffyh\xe2\
+\xffO\x82\xb6[\xfc\xb6\xca\x90\xd5\xcd\x15\xa8\x9a\x18\x94\
+&{\x96\x15`\x06\x03m\xaab7\xc0\x0c\x06\xda\x9d\
+\xa5\xa5\xab\xa97\xa0\xd2\x9d\xda\xbat\xeaV\xcbr\x0f\
+\x00\x11\xe9-\x96\xf4S'\x89\xfc\xb7\x01\x05\x01Je\
+b\xce\xfa4\xa4\xa4\x08\x84\x84\x1c&\x920\xd2\xacu\
+\xd1\x01@\xdd\xeaOZ\xf3O\xb7\xfe\xda\xff\x97r\xe7\
+\xd2\x7f\xcb\xca\x88\xb5u\x8c\xaaA\xc1,\xf2W\x19:\
+LYq\xd7`\x96\x08\x14Y\x01\x1a\xa6\x1b`f\x07\
+\xbe\x22N_5Y\x81\x95\xee\xf2\xfb?\xf8\xfd\xef\xd0\
+\xaf\x89\xf2\xe0KU9\xf87m\x14\x91\x1e\x00\x84\xd2\
+\xb3\xd6\xc8\xc4\x7f\xa1\xc2F\x22P6\x03P\x11\xb2\xcc\
+\x7f\x11D\xf1\x83\xa3\xfb\xacV\xfd\xff\xca\xe7\x94\x8a\x13\
+L+\x1e\xd04O\xa0\x8a\x1b\xd0F,\x00\x18Y\x01\
+:3\xb0kg?WWSRP\xa5\xbbR%\x00\
+X\x84\xac\xc8\x7f\xe3}\x0d\xfd\xf9,\xe2kBKI\
+\xe3\x96\x1e\x18\x17\x81\xf4\xfa\xaa\x10RA\xf4j\x8e\x5c\
+\xa4\xe5\xd1\x7f\x008\xb8\xafz\xf5\x9fic's\x07\
+\xc6\x8f\xad\x1aMm^\xe6\x89\xe5\xb9\x02z]:=\
+X?[\xfb\xbav\xdc\x1b\xa0\xad\x00\xaa\xe4\x9d[\x97\
+N\xdd\x8a\xab\x00\xa5\x02\x905\x020Qi\xb5A\xe4\
+\x7f\xa2\x13N\x05\xe6\xe2}\x13^\xba\xcd\xa4\x10\xa1\xc2\
+z\xcd\x01\x80U\x1a>\x97tpxe~x\xee\xbb\
+W\x019\xed\xc7O#\xad\xb8|\x9b\xecAC\xa5\xdf\
+#\xb2\xd4\x15H#k\xaa\xc5\xcc\xaaUv$\xe2\xbd\
+a7\xb8\x9265\xad\xe2+\x19\xa5w$+\xe2\xa9\
+\x0b|T)\xf0\xc9-\xb7\x95A=\xba\xc5\x17R\xc5\
+\x0b\x80\xb8\xa5\x17*\xccm\xd1\x19\xe1\x89\xa5\xe8\xf3\xdc\
+\xe3\x13\x8e^\xdf\x8b3\x00\xeb\x80s\x96i\xfek\xac\
+,+\x1c\x5c\xb4@)\xdd\xd1\x18@\x11\x9a\x16\x19-\
+\xbd\x16\x0d\x05\xa5L\x04\xc2\x86\xf3P\x9a\xe9\xc1\x80\xf1\
+l\x0f\xdd\x00\x0d\xdd\x1d(\x9d\x0e\x5cN'\xb6\x8a\xf7\
+\x0a*]5b\xab#\x89\xf7;\x5c\xb2;\xcb\xc7\xd7\
+\xebtK_D\xec\xbc\xf5Y\x9f\xa7?3\xb7\xd9\xec\
+K\x84R\x81\xd2vf\xe9\x8d\xcd\xff\x0e\x9dz\xf9\xaf\
+:\xd8\xc9\xe1\xc6\xd9\xc7\xaf?\xdf\x80\xce\x0e\x04\xf23\
+\x04\xb3\xdc\x00_D\xe9\xc1@\xb27\x00@\x22)(\
+\x8d;\x0e\xde\xfc\xa6\xab\xa1^`\xe9]\xde\xbat\xea\
+V\xe2\xa9}\xe6\xba\xaa\xc3\x7f\xdb\x08\x02V\xad\x0b\xa7\
+[\xff*\xadyS\xf4\xbd\x00R\x0a\xf0\x8a\xe7\xa4\xfd\
+\xff0,\xce\x14<\xb8o\x0e\xf6\xb0r\xcdn\xba\x00\
+iL\xab`\xe8\xb4\xf2\x03\xead\x07j\xd8l<\x18\
+\x98\x85\xa5\xee()\xa8\xc7\x1c\xc8Mr\xdd\xeb\xe76\
+\x0e\x96~q\x8f\xa3\xfcN\xb0\x95[H\xd7\xa9}\xc7\
+\xd2i\xbfM\x90\xd7\xf2\x9b\xeb\xcb\xcc\xfb\xb6 T\x08\
+\xaf\xd7\xbc\x07\xa0\x08G\x96\x93\xdd\xaa\x94\xd2=%\x04\
+&\xdar\x09\xcaD\xa0(\x1f\xa0\xa8kP\xf7\x08\x94\
+\xc5\x02\xc6S\x81\x8b\xbb\x03\xc7\xd6u\xd9\xf2\xd5\x90\x0f\
+P\xfa\x94\xdd\xf6\xb6\xbb\xee\xcbZ_\x96\xf97\xa9\xdf\
+_\xd4\xf2\xef\x04\xe1\xd3\x10rT\x030\xacX\xe44\
+o\xec\xbf\xe9\xffG\x09@\xe3\xf9\xffR\xca=#\x02\
+m\xd4\x01\xd0\xa8\x1b[hRD\xa4\xa8f\x80\x9d\xb3\
+?\xd3\x0aHw\x07\xa6\xb3\x02\xa9\x17\x0d\x05\xb7\xf6\xf5\
+\xeeip9\xf7\x14j\xdd\xc1t\x02\xd0\xb40\xe9\xc4\
+\x10\xd3@\xdf\x13q\x0ap\x15\x17\xa0J\xf6\x1f\x00\xcc\
+\xcf\x83\xec\x9b\xab\xb6\xedn\xa2\xea\xe0\xa2*\xfb\xa9^\
+\x8d\x98\x8c\x8d\x16\xac\x02V#5\x1b\x88\xdc\x003\x0e\
+\x90\xd8\x97\x91\x15\x98\xc6\xd5\x10\x08,\xbc\x13\x8e\xb32\
+w\xe3\xc2\x0ds\xd1\x85\xa9N\xfei\xb5\xfc@\xf3\x0c\
+\xbeI\x11\xfa\xf5\xa2\xffe\xcf\xb8\x0e\x00.X\xd9\x01\
+\xc0\xbd\xd2\xfa\x9bhK\x04\xf4\xbe\xaa\x0aA\xdd\xd1\x82\
+:\x16P\xa7K0+)\xc8\x04\xe3Q>@Wx\
+qj\xf0-\xfb\x8f\xdeq\xf2\xd4\xe3\x1f\xbe\x92\x83\x81\
+\xa5W\xc8\xedXw\xec\xd4\xc9\x94\x99\xfd\xbb\x89m\x11\
+\xf5\x00\xd4\x19\xf8S\x05\xc7\xf6\x8f\x02\x80y\xd0b\xb0\
+\x17\xba\x089\xa3\xadv\x0dV\xdd\x9f\xb6\x06\xda\x04c\
+\x14\xc28v\xfa}\x16t.\x80t:P\xeb\x83\xb7\
+\x8a\x0d\xf2\xd9\xd3_}\xf4Y\xb68\xff%H<r\
+\xcb\xed\x0f~\xd1e\xfc|\xab':E\x14>y\xeb\
+\xbds\xdd\xeb\xb1\x0f\x00\x10\x88\xc8\xfc\xadb\x09\x84\xc1\
+ \x8e\x03TEY\xcboF\xf9w\x03\xdb\x9bQ\x0f\
+\x00j\x8ePK\xfb\xfff\xf5\x1f\x00X\x9d\xafN\xfe\
+\xbc<\x81\xbd\x94?\xd064\xf1\xeb\x92\x9f\x10@\xa9\
+\xc8\x0a\xa8ZG0\x0d\xc6\x08lp\x08\xa9\xd0\xf3E\
+\x94\x104\xec\xd8\xd2q\x80\xce\xd2\x1c\xfa\xe7\xb7O\x88\
+A\xef\x04\x80\x87Oo=z\xf2J\x12\x83\xc2\xa7\xef\
+\xf5s\x1b\x07\xef\xb8G\x1cd\x88|\xd4\xaa\xdd\x7fW\
+\xc2\xc4\x9eu\xd1V\x0f\x809\x8b:\xef\x08,u\xed\
+J\xdf\xd3B\x90&\xbb\xe9*\xa4-\x05\xf3\xb3\xbd,\
+\x1ceV@V\xe1\x10\xd3\x0d\xa82`\xa8\x0c6\x03\
+|p@\xf8\xb0\x18\x10\xa4znu \xb0+\xbc\xd8\
+\x0a\xa0\x8e\x0b\xdb\xe9\xa0on8\xa0\x99b\xf0\xc0\xfd\
+\x1fz\xd4\xf3\xd6\xb6w\xf7Jg\x5c\xdb\xb2\x0d\x98\x91\
+\xf52\xad\xb4\xdf\xaa\xa6\x7f\xdd\xdc\xfd\xb6 T\x989\
+\x0bpSh\xff\xbf+\xe6\xd4\xe1\xe5N\xed\x80\x89&\
+n\x16\xf9M\x98\xdb\x98d\xd7\xaf\x9b\x92\xdf\x1c8\x94\
+\xf5\xbemh\xe2\xa7\xdd\x00)\xc3\xc2\x9c\x80`\x98\x1d\
+\x98\xb6\x02lF\xe0\xe7X\x14\xdc\xb2\x11\x06~b]\
+\x14\x08L\xfe6_\xb9 \x18\x80w\x17\xf3O\xdc\x10\
+\x83\xbf|\xecwO\x12[\xfe\xca\xe2\xa1\x07\x1f;v\
+d\xe5\xe4T.T\x03\x14Fa\xd2\x03\x1e\xb4\x1b\xd0\
+&\xeaD\xfcw-\x00\x18Rx\xaaz\xf1O]\xfe\
++k\xda/\x13\xcb\x0b \x1d\xa7\x9a\x05\x90FQ\x90\
+P\xe7\x11\xa4\xb71\xd7M\x9ak\x90&\x7f\xfau]\
+T\xc9\x0bh\xe2\x06\x94\x81\xd58g\xb3'\x80\xbb\x04\
+\x16\x01\xf8\xf0^+:\xdeU\x91X7\xa0'\xd4\x06\
+\xff\xd5\xf5\xe7\xbf\xf2\xcc\xc9\xe7\x1e\xff\x8d\x93\xa7\x1e\xff\
+\xf0^\xa8,T\xfa\xeb\xd3Y\x80E\xe0V\xbb\xdd\x84\
+\xbb\x1d\xf8\xd3\x18\x04~<\x06\xa0j\x0e@\x15,\xbb\
+\x14\xae\xddNZqS\xe4\x89E\x19\xccV\x7fZ\xe3\
+\x06F\xc7\xca&?\xa5\xbc\x92\xf9\x9f\x15\x03\xb0\x1b\xe4\
+\x17\xa4\x13\x82|\xe5&z\x1a\x14e\xc4\x5c\xf4\xba\xf4\
+~\xc4\xb9\xde\xc3\xe2B\xef?\xfc\xe5c\xbf\xfb\xc43\
+O}\xe1Gw\xb3\x17a*}MU\xcd\xff\xbd\xd8\
+\xdf\x9f\x05]\x05\xa8n\x0f@Y\x0a\xf0\xea\xbcU\xda\
+\x03\xb0\x93\xa8+\x06;9Z\xd0\x9cn\xbc\xf6\xefj\
+8\x8f@\x96\xcbk\xce\x1a\xc4]\x02\xd7u3I\xae\
+A\xa4PiA\x88\xb7\x1fZ\x05\xa7\xbf\xfa\xe8\x9f\x9c\
+|\xee\xf1\xdf\xd8\x8d\x1a\x03\x85wO\xfa\x1b\x89A@\
+u\xa7\x00+B\x9d\x1c\xff\xb6}\xff\xba\x0f\xadY\x06\
+\x9c\xa8\xe2V\xael\xe6_\x13\x0b]\xe7\x8a\x11\xc14\
+\xf2\x84b\x9a\x03\x89\xea\x92\x9f\x13\x09)\xc2\xc6\xbd\x00\
+U`\xd9\xc5.\x9c)\x0e\x8a2B\xa4PDF\xe6\
+L,\x06r\xe1nq\x99|\xcc\xdb|\xf5wO>\
+\xf7\xf8o\xec\xa4EPx\xa7\xde\xfb\x9e\xbf\xb7]w\
+\x1c@[=\x00\x8c\xf0\x04\xf1\xdb\x14\x81\xba\xa6\xaa\xd7\
+\x1b\x11\xb9\xea,@\xb9\xbf\xcb\xe8\x06XY\xdc\x99\xcc\
+\xca&(\x8b1hHEZ\x1b\x1d\x09\x14\x8b\xf3\xa4\
+\xd3\x8c\x97A{c\xdc\x1a\x91\x9a1\x92\x985hR\
+\xa4]\x04\xc2]8\xf3\xaer\xe6]\xa5\xfc\xe0\x1e\x1e\
+v\x1e~\xf9\xc5S\x8f\xee\x94\x10\x14\xfe\xaa?\xf9\xe2\
+g\xe3\x13\xb0\x98[\xda\x0b\x10\x06\xed\x04\x09\xb5\xef?\
+\xcd\x81>e\x93i\x98\xeb\xcc.\xc0Ib\x00\xe91\
+\x00K\xdd\xbd\xdf]\x9a\x16\x82PH\xf8A\x18/\x94\
+(P\xa2\x12\x9f\x87B\xb6*\x0a\xe5\xe7\x98=B0\
+T\xb4p*\xb1\xbc*Aa\xe0\x8fM\x1d\x16\x7fg\
+X\x1cD\xe7\x01\x10JAx}!'\xdc\x8d\xc9\x9f\
+\xfe\xcc\x14\x82i\xc7\x08Z\xb7\xd5\xaa\xf8\xff\xbb\x99\xf1\
+Wg\xd6\x1c\xbd\xce\xec\x02,\x1b\x07 d\x14/(\
+3\xff\xe7-J\x96:\xbb\x1b\x00,CV\x8fA\xd5\
+\xb2\xdfR6\x9f2m\x1a.D\xd38\x80F\xde3\
+\xab]\xbe:\x22\xa0\xb7\xcd\x22\xbf\x09\xe5\x07\xf7\xd8\xfc\
+\xd0\xaf\xbe\xfc\xe2\xa9GO\x9ez\xfc\xc3\xad_\x14\x94\
+\x08\xc0\xbb\xdf\xfe\xbd\x95\xb3\x98\xb8\xe5\xb6\xd2\x0b0\xed\
+\xbe~\x93\xe8E\xae\x80.\x8e\xe9\x8b\xbac\x00\x8a\xa7\
+\xff\xd6\xb0\x5c\x89\x8ec\xc7\x95\x8d\xca\x8a\x9b\xee%T\
+%h\x9bV@\x934\xe0t}\x80&\x22`Z\xbd\
+\xe6\xa8@_\xb9\x08\x07\xc9s\xd2\xad\xba^\xb2@\xb8\
+\x0b\xc5\x1c\xa5\xc9O\x19#\xe6\x92^\x07\x0c-\x02b\
+\xff\xebi\x04\x0a\xf7\xde\x88\x93\x1d\x829!F\x91\x10\
+\x88P\xc5\xa3\x00k\xed?\xd5\x03`\xa5\xb8\xed\xf2\xdd\
+\xef\x02l\x13\xd3\xae \xd4$\xfa\x0f4+\x12b\xc6\
+\x00\x0a\xb7sKJ\xe2\x19\x22`\x9a\xfcn\x87\x802\
+F\xb8\xdd!\x94\x8d\x1fK\x0a\xa1\xa4\x10I\x81\x80}\
+\x80\x87\x9d\x87\xbd\xcdW\x7f\xf7\x99\xa7\xbe\xf0\xa3m]\
+\xd7\xcaw-\x10\x83\xc2D\xa00\x18T\x9a\xd5\xb7\xca\
+h\xbfiD\xfe\x9b\xa2\xefEDn\xdb\xa7]\xea&\
+\xbb\x00\xcd:\x87{\x09\xe3A\xb7\xfcnB\xceh4\
+\x86~\xb8L\xe2\x06d\xef?\x7f\x1a\xb1&\xe9\xc0\xfe\
+\x04\x83\x8b4\xf9\xc3\xb08C\xd4\xb4\x06\x9cyWe\
+\x11?\xf9:\xd9\xfa\xc7\xbfo(\x08D\xc8{m~\
+\xe8W\xdb\x0a\x12\x96\x0a\x80\xeay\x95%\xb4\x8d\x12`\
+\xbb=\xe8'\x0d\x7fJ]H\xfbS=\x00{\xd5\x05\
+H\xd6\xe8/N=\x06\x9a\x99\xea\xd9\xc7M\x07\x1f\x9b\
+\xef\xb7JF\xe0\xd8\xf1+Z\x01B*(\xe6\x94\x9e\
+\x9c3\xef\xaa\xbc\x16\xbf\x0a\xd2.\x82\xad\xe6?\xf6\xf2\
+\x8b\xa7\x1e\x9d\xd4%(\x14\x80G\xff\xeb\xbf\xa8\x95\xaa\
+\xd8F\x17\xe0NT\xfa\xa9R\xf2Z\x7fVg*p\
+F\xad8\x08\x98\xf9\xb9\xe1\x07,\xb94A\xf8\xbdj\
+\x01\xe4\xa1h\x1c\x81\x94QO\xc1$H\xbbe\xa6\xbb\
+\xd4\xd4\x1d\x00\xaa\xc7\x01\xd2\xe3\x01\xb2\x10(@\x86\xd1\
+\xfd\xce\x13\x01\xc5\x1c\xc5\x16W\x05\xb7\x8b\xc7|Pf\
+\xc7K\xd6\xfb,\x10!\xef\xf56_\xfd\xddI\x02\x84\
+\x85\x02@\xed\xc5\xb3Mw\x9c\x85\xdd.\xf6Q\xd6\xdd\
+\x97%\x0cf\x0e@Y\x17\xa0\x90A\xe5J@UG\
+\x01\xeeU\xe4Y\x00R\x8a\x98\xbc\x93\xb8MM\xc7\x18\
+LkBQ\x8d\xbe\x9bl\x13E\x81\x10*\xe6\xa8\xf9\
+\xa5.q\xb9\xacu!\xd2\xa4\xcf\x12\x03\xfd\x9e\x08y\
+/'\xf6\xbfn*\x02\xe5.\x80C.\xeb\xd7E\xb5\
+\x00\x08qvd*\xb0&\xc8\xcb[7\x97\xac\x87,\
+\x142\xce\x01\xd0\xfel(\xd5\xc4\xe3\x01\x5c\xd2A\xc7\
+\xcd(4\xb9\x07]\x80\x22HU|\xbeR\x0aP\xca\
+\x12K\x13\x84Bb\xe0\x8b\xd8\x0dh\xe2\x0e\xe8\x8c\xc0\
+\xf4\xa8@\x8d\xaa\x83\x82:\x83hDo8P\xa0^\
+?Q@D1G\xe9\x85-\xae\x8a\xf9\xa5.\x01\xb3\
+\x006y\xc97)|H\xe1g\xbe\xa7\xb0\x0f4\x15\
+\x81\xc2_=\xbf|\xd7\x0bUw\xb4\xd7\xc9\x9f~\x9d\
+\xb7M\xe9\xfe(\xc9\xcd\x05\xa8\x9a\x06l[Ju\xec\
++\xbb\x03F\x930m\x09L+7 \xdaw\xfex\
+\x00\xb3\xe5\xcf\xb2\x02&\xcd\x03\x00\x00\x9b\x8e\x84\x87`\
+\x80\xbe\x05\x0c2z\x88\xf8\xdc\xbct\x1d\xc6\xda \xfe\
+\xe8\xfc\xed\xb1%\xf1yC\x11(}\x0aE\xc5\xbb\xd6\
+V\x1e@|\xdc\x96{\x02\x9a\xcc[\x9fU\x07\xa0I\
+\xeb\x9f\xce\x01\x98\xb7(\xe98%s\x06\xeeak\xc0\
+l\x81C\xa1 \x15\xc9\xedN\x95R\xc4K\xb5}\xe7\
+\x8f,4\x8f[\xd4\x1bP\xd4#PU\x08\xb2\x82\x80\
+\xbe4,\x06\xb7\x83N\x00\xf4\x07A\xe2\x81\x88\xc9\x9f\
+F\x8bb0\xfa-IA\xe0l\xfe\x80\xc5\x17\x7f\xb6\
+N`pO6C;\xd1\x05X%\x10(\xa4\x8a\xeb\
+\x00h\xf3\xb5(\x130/\x00Hd2\xa0d\xb9\x12\
+v\xc6q\xd3A\xc0\xbd(\x02y\xe6w\xdb\xd3\x89\x8f\
+\xc7jv\xf6ZT\x09\x02n\x19\x16\x01\x9f\x9b\x97\xf3\
++K\xa4\xd3\xb1\x19\xc9su\xa6 \x02c\x87\x00\xbf\
+wk\xfd\xd4OT\xdd\xbe\xf0\xae\x1d:\xb8x\x8e\x86\
+\xec\x9c~_\x96\x07\xd0\xda\x8fh1\xff\x7f\x92\xf1\xea\
+\x22Tq\x1d\x00\xb3\x05\xabb\x05\x98\x89@i\x0b@\
+'\x01\x15E\xfd\xcd\x0c\xc1\xbd\x04\xdd\x17\x9f^\xccx\
+@\x9bb\x90>\xb6\x1e\x10\x94W\x1f \x0ds\xce\xc0\
+:n@Y7`\xa0\x80\xcd\xf3\x97\xe0m\xadK\xdd\
+\xea+k>\x1a\xe5'\x05\x08e\xc8\x14\x82\x96b\x02\
+\x85\xe7\x1ev\x1e\xae\xea\x0a\x14\xde\xa9\xa5\xee\xc1Z\x85\
+\xf0\xaa$\x02\xed5\x14\x89\x82\x9f\xf3Y\xd5\xa9\xc1\xf2\
+\xd0\xe1\xd1\xc3\x9d\x98\xe1(=\xe3\xd1\x1e#~\x19\x22\
+!h\xbf4X\x1d\x97-\xcb\xf4\xcf\xca\x04l#\x1e\
+\x00\x00g_\x8b:\xc9\x9c\xf9%\xaa\xc9\x0f A\xfc\
+B!\x98\x12\xb8\xdd!\x16_\xfc\xd9*\x15\x87\x0a\xaf\
+\xac\xe7\xadm?w\xee\x9b_5\xd7M\xa3,X\xab\
+?>c\x84\x9f\xf9\x00\xa5\x1f\xce\xc2\xe1\xa7~0\xd6\
+\xda\xe7\xb5\xfe\x8cZ\x95\xbb\x00m;\x9a\x09\xb8\xcc\x02\
+\xb8\x92\xf2\x02\x80Q\x96 g4v\x99tV\xe0\xa4\
+\x98\xd4\xaa\xd0\xc9@u\xeb\x03\xf8\xc6=\x08C\x89\xcb\
+$:\x8f\xd7_\xfbk\x5c\xbexA9\xf3K\xd5&\
+\xd8\xcd\x12\x02m\x0dLA\x0c\x94\x1f\xdc\xf3\xe4_}\
+\xfe\xbde\xdb\xb5\x1a\x03\xd8\x8b=\x01\xe9^\x80:\x0f\
+\xd2\xb6\x90\x09\xd3\xdf\xec\x0aL\xa3(\x01(\x8d\xacY\
+f\xf2\xc8~\xa5\x89\x80\x942\x91\x070\xea-\x18=\
+\xfc\xfau\x9dn\xc1*VE\x9b\x93\x86\xa6\xa1\xef\x03\
+!\x0e\xd6/\xf4\xd5\xe9\x97\xce\x00\x00l\x1a\x12\x9b\x86\
+\x95\xcd5-\x04\x99b\xd0\x22\xb8\xdd!\xa0\xf8`\xe9\
+5+\xdb\xe0\xb5W\xcf=\xab_[\xcc\xcd\xcd\x05\x98\
+\xb4\x17@\xfb\xfb\x93F\xff\xdb4?eF\x1c\xa8(\
+\x9a\xadE\xa0\xec\x14\x1c\xd7\xcd4\xf9'!\xfbn\xba\
+\x0ci\x7f\x9c3\x9a\x88\xfc\xa7?\xd7\xf9\x01uz\x06\
+FV]\xf1\xefL\x8b@\xa8\xe8X\x1c`\x12\x17`\
+\xf3\xd2e\x9c\xfe\xd6I\x2267T\x16\xf1%\xebT\
+\xbe\x89\xb9b\xd0\x12,\xba\xf8\x9627\xa0T\x006\
+_\xf8\xcaf\x95\x83M\x1a\x04\xdc\x891\x00u\xc5A\
+n{Si~u\x7f\xf2\xa4Q\xff\xbd\x10'\xa82\
+X\x883\x92I\xf6i\x15\x0d1E\xa0j\xeb_4\
+#\x90\x1f\x84\xf0C\x89\xd3\xe7.\xca'\x9f9\x89\xcb\
+\x17/\x8c=\x17\xa6%PG\x044\x08e \x96\xdb\
+\xba%\xb0\xde;\xd7-\xbcVe;\xa0\xf6\xe2Y)\
+\xfc\xb5J\x17\xb1 \x08X'\x0d8]\x0e\xac.\xd2\
+Q\xff\xaa5\x00\xd2\xe8\xb1\xed\xa90\xac\x931\x0cX\
+\xe4\xc6\x16H\xee4\xe9U\xbe\xbfS0#\xf3U2\
+\xf5\x8ar\x03\x8a'\x09\x99\xcck5c\x00\xe6h\xc0\
+\xa2L\xc0\xbe/\xf0\xc4\xe9s\xf8\xd2W\x9f\xa5\xde\xf6\
+::\xaeE:62\x9f\x0d-\x04\xdcjFd\xce\
+\x19\xb8\xe3\x82X\xd12\x86\x9aq\x83\xb2@~is\
+;\xbf|\xd7\x0bBJ\x91\x16kn\xb9c\xad>\xe3\
+\x04\x22T\x99U\x81\x84TSo\xb1\xf2f\x981\xd7\
+\xd7y\x80\xc2\xfe\xc8WM\x9b\xad\xa1T\xa5\xbd\x01a\
+(\xc09\x8b\xf2\x00\x8c\xcc\xad\x8e\x9b}\xf3\xf45J\
+\x93y\xb7\xc9]\x17\xe9k5\xe9\xc0 \x13\x91;\x90\
+?G@\xba'\xc04\xff\xeb\xc2\x97\x0a\xcf\xbe\xbc\x8e\
+?{\xea9\xbc\xb2v\x19\x00\x81\x19\xbe\xd1\xb3\x10\x8b\
+\x9c\xc1bZ\x04\xc2 ;>\xa4\x1fE\xfd\xc8\x9a\x8f\
+f\xfc\x9a\xb3\xf89\x0a\xc3\xa8{\x91\xa9 \xf1Yr\
+\xa7\xc6\xb3U!\xd8Y*\x00\xc7o\xbc\xf5%\x1a\xb2\
+s\xb0p\xc0\x9c\x1f0\xcb\xe4\xd7s\x026\x81P\xe1\
+\x98\x15P\x17fN\xbf\xd9\xfa7\x9d\xc7^C?\xc8\
+uRY\x85L\xde\xd0@\x01ZC\xed\x92\x16\xdd\x14\
+\x81\xbd\x1e\x1c\xcc\xf2\xc9m\x8b\xc7\x04m\x92\xfe\x9b7\
+.CO\x15n\xfeO#=W\x00'rL\x04\xe2\
+\x18@N\xb5\xa7\xfe\xc0\xc7\xf3\xaf]\xc6\xd3/]\x14\
+\xcf~\xf3\x0c\xdb\xf4},2\x85\x0da\xfcVj\x01\
+\xc3\x98\x0f\xe3<W\x04\x80H\x08TAe\xa9\xa2\xc7\
+3:w\x11\xff\xd7\xe4\x8f\x89\xcf\xac\xe8w4t\x1d\
+JY\x16u\x05\xae}\xf5\xc4\xb1\xdb\xe3\xf4\xc2@\x0c\
+jM\x17\xbeSHG\xfcM\x127\x11\x81\xbc\xe9\xc0\
+t\x0b\x97e\x05\xd4\x19\x11x\xb5\xa3N\xa0\xaf\xdd\xe3\
+V\x9b0D\xc3f\x04}_\xe0\xfc\xa6\x87g_^\
+\xc7\x97\x9e;\x83\xf5\xcdm\x0c\xbc\x01\x03\x80E\x96\xe3\
+\x9e\x11\x0a1,\x13\xcf\x8c9#\xb2\xc4\x80\x0c\x09\xaa\
+j\x96\x98\xe3\x9c\x01\xc3q%\xd1^%\xc0,\x10\x12\
+\xed\x8f\xa9\x00p\xdc\xcc9(\x02\xb9\xf1\x97e\xf3\x11\
+Vjfo^=\xfaz\xad\xb3\xde\xa3\xa8c\x0dT\
+\x8dA\xe8.\xc1,w@\xc8\xe4\x05\x16\x81\x02\xb3H\
+\xe6H\xc0\xb2\x16][\x08y\x81\xc3\xdd\xb2\x08tk\
+\x9c\xf7\xdet\x9f\x80\xfa=\x00E\xc7\xcd\x83I\xfe\xdc\
+\xd6\x7f\x88\xbe/q\xea\xdb\xeb\xf8\xfak[x\xee\xe5\
+\xd7\xb0\xb1q\x09}?;\x06\xb1\xc8\x14\x06)\xfe\x9a\
+\x22\x10\xaf+p\x0d\x08\xb3j\x8b\x80F4\xc0,\xba\
+\x8e\xf1c,\x00\x88 \x9e\xa2L\x0b\x01\xe7\x0c\xf7\xde\
+\xf1\xfd\xcf\x88\xe0\xd5\xc2}Vb\xc3\x7fy\xe4\xd3\x7f\
+^5\xcbo7s\x01\xf2\x92|\x9a\xf8\xff\xe68\x80\
+,\xa4\x1f\xe0\xbc\x04!}C\x88\xf4\x114\xe4\xe8^\
+\xcf\x10,\x0b\xfae\xe5\x00\xd4\xc1$\xf3\x0fr\x22\xe3\
+\x9e\x00\x9d\x0cti\xcb\xc3\x93/\x9c\xc3\x1f<\xf1\x0a\
+~\xf9\x0f\x9f\xc1\xa7\xfe\xdbS\xf8\xd2\xc9\xe7\xf1\xfa\x85\
+\x8bc\xe4'\x22\xf9<\xfbV'~-\x08\x83 \x0c\
+\x8cd\x9f\x13\xcb\x99I\x8a\xb4\x19\xe9O\xf8\xfcA\x14\
+D$\x12\x01\xe9\xa8\xaf=\xfd\xe9\x97J\xafO\x95c\
+\xcc/\xdf\xf5\x82T\xdey\x06\xb7\xb0\x06\x99\xae\x09\x90\
+\x0e\x04\xee\xa5\x87\xb6\xaa\x15\xa0$\x8b\xc7\x01T\x81\xb6\
+\x00\xd2\xe6\xbf\x90\x80\xf0\x05\x9c\x8c\xc8\x7f\xd5H~\x95\
+1\x03\xbb\x0ds\x06\xdf<\x98\x96@\x13+\x803\x82\
+\x81_\xfe\x1d\xd3\x05\x08$\xc5v\xdf\xc3\xb7/\x0f\xf0\
+\xea\xf9\x0d\xbc\xb8\xb6)\xff\xfa|\x8fn\xae_\xc2 \
+\x18\x91\x9d(\x1f\x1d\x9b\xe6\xb6\xfe\x1a\x8bL!\x14@\
+hl&\x08\x83ywM\x8b />0\x89%0\
+\x06-\x02\xc3\xff\x01_T\x84\x1d\x22\xf3\xcbN\xe9p\
+\xfeJ\x02\x10\x0f\x0a\xb2P(\x00{=\x130\xeb}\
+\x1e*M:i<\xd0e\xbd\x02\x9e/\x00\xab\x0f2\
+`\xf8\xc2\x93\x7f\x8do\xbc\xb6\x81\x03\x0b6V\x16\x5c\
+,\xcf;\x98s\x18\xba\xae\x9d+\x96U\x89>iB\
+Q]\xd4\x9d\xb5W\x93>m\x09\x98.\xc2$\xf0B\
+\x89K[\x1e\xd66#\xc2\xbfz9\xc0\xc5\xcb\x1b\xe2\
+\xfc\xc6\x16\xdb\xec\xf7 3\xba\x05\x88\x8a2\xbeL\xf2\
+\xa7[\xfe2\x08\xc2\xc0\x94\x18s\x07\x80b\x11\x00\xea\
+\xc7\x05\xca@\xd8!\xd2\xb5\xde\xf0\xa5\xe5Uy\xael\
+\xdbJ\x02\xb0\xd4=\xd8\x93\x03\xfe\x1a\xeb\xa0Q\x01\xc2\
+\xaa]\x80\xe9\x9e\x80\xb6\xd0\xa4'\xc0\xaf\x98/\x90\x16\
+\x81p\x98>\xc8)\x19\xb7\x06\xbc\x00\xd2\x19\xe0\xb9\x97\
+\xfb\xf8\xc6+.,\x1bXr\xb8\xe0\x9c\xb3\xa5\xf9.\
+\x96\xba\x16\xf6/\xba\xb10tl\x8a\x05\x97\xa1\xeb:\
+\xc3\xfcz\x9ay\x1d\x8br\x08vB\x0c\xcc\xc8|\x11\
+L\xd2\x9bD\xaf\xe2\x16\x8c\xee_\xd4\x1b e\x08/\
+\x90X\xef\x8b\x98\xec\x17\xb7\x02|\xfbr\x0f\x17\xb7\x07\
+\xf0\xbd\x01\x06R\x22\xf0\x06\x00\x90y\x00M|\xa0\x1e\
+\xf9)\xe3\xe0\xc3\x90\x5c\x96%\x90'\x02@\xfbq\x81\
+4B~#\xc0\x960g\xaf\x9fZ\xea\x1e\xecy^\
+q\x0aO%\xb6y\xde\xda\xf6\xe9\x8d\xb5\xb3'\x96o\
+o|bU\x87\xb7N*\x02m\xce[_\xb5\xf8\x87\
+)\x02\xe6wC\xe9\xc3\xe1v\xd43\x80\xed\xe1S\xe8\
+b %\x5c:@\xe0\xbb\xb8\xe0\x87\x8cX>.n\
+'\xbbU\xb50\xb8]*\x1d\xea\xd2\x0e\x8ff\x13^\
+\xe8:XYt\xb1\xd4u\xb0\xd4a`\x9c\xc3f\xa3\
+9\x06\xf4\xc0\x1b\x16\xbb$\xd5\x05c\x12\xa4\xc9_f\
+\x19\x14\x91^w\xf9\x99$_\xefyX\xdb\x18`\xb3\
+\xe7\xe1\xe2V\x80K\x03\x09o0H\x90\xdd\x04\xf1=\
+\x04jt|\x99\x8aa\x99\xe4\x8f\x0a{\xb6\x93\x95(\
+\x08\x03\x0a&\x90\xcd\x13\x826\xac\x81>;\x08\x8b-\
+\xc1\xa2..\x0e.\x5cZ\xf4\xd4v\xd9w*3\xed\
+\x06v\xfcQ\x00?T\xb6\x9d\xce\x03\xd8\xcd\x84 `\
+\x5c\x08\xeaZ\x01\xa1\xdf\x92Y&/\x8f\xfa\xff\x09\x01\
+|\x0f\x16c\x18\x80\xc3\xa5\x11\xe9\x95\x0f\x04$\xeaV\
+%\x96\x04'\x14\xeb^\xc8\xe0\x85\xc06(0\x9e\xcc\
+e\x0a\x84\x926u9E\x87G#\x0d\x17\xech\xe6\
+\xe1\xa59\x07\x1d\x8b\xa2\xe3\xda\xb0Y\x94\xed\xe6\xda\x16\
+,\x1a]\x1b\xdb\xb2\xe2kB)k\xad\xe8F:\x07\
+\xc0$t )\xa4\x08\xe1\x0b\x85\xbe/\xd1\x1f\xf8\xe8\
+\x07\x12\xeb\xdb\x1ez\xbe\x82\x08}\x5c\xdc\x0a\xd0\x0f\x01\
+O\x0e\xe4\xa0'\xe9\xc5\xed\x01\x02\x1f\xf0$\x81M\xfa\
+\x18H\x09\xdbHr\xf1\x87\x91}\xe2G-\xb7?$\
+~\x16\xe9M\xabHW\xf4\x8d?/i\xf9\xb3F\x11\
+\x9as\x86jk \xabg \x8d\xb2$\xa2: \xcc\
+B@\xae\x87\xc5\x96\xa2\xf7\xd8\xf4{k\x8f\xfd\x19\x0e\
+?T\xfa\xdd\xca\x02\xf0\xe5g\x9fx\xf2\xddG\xde\xb4\
+F\x99\xbd2\xf1\x19W@\x9b\xee@\x93\x01B\x81\xaa\
+\xe7\x8f\xa6}[)\x05\x1c\x0c %@SB\x18\x08\
+\x01\x1b\x18\x8a@\xf4\x04)5\x12\x03\xdd6\x91\x94(\
+\x98(\x13\x08\x13K\x0e\x17\x00\xc0\x87\x85\x0a\xddn\xa4\
+\x00\xa6p\x00\xa3\x89/\x81\xe4\x88E\xc6\xa37<c\
+\x86\xdc0\x94\x10\xe1\xf8\xa8\xa9M\x1f\xf0\xfd\x88\xc8\x00\
+0\x08%\x08\xf5\xe5\xa0'i\xf4\xbdP\xac{!\x03\
+\x00]|G_\x03\x03\x89\x03\xf2\xd0\x87\x04\xe2l\xbc\
+@\x0c{X\xc4\xf8}J\x93\x9f\x93\x00BE\x0dP\
+\x9a\xf8m\x81\xd3H\x04\xca\xac\x00\x13E\x16A\x15k\
+@\x93\x1fC\xf2\x03\xc0\x96w\xce\xaeZ\xcf\xb32\xc3\
+\x0e\x1d\x5c<\xa7|r\x16\x1d\xac\x14%\x01)\xe5\xb5\
+V\x1bp\x12\x11\xc8J\x0aj\xd2\x1dX\x17\x9a\xf8\x89\
+u\xa1\x02\xe5\x04\xbeR\x91\x15\x80\xe8\xe1%B@2\
+\x06\x9aS}&K\x14\xd2\xd0\x22\xa1\x91\xb5+M4\
+x\xc3\x87l\x1b4,x@\xb5\xd8\x84\x15\x1eb\x15\
+T\xe8QQ\x03\x10\xe2B\xa9\x81\xb9\xf1\x98\xcd\x1d\xb9\
+F\xd1&2\xa3$\x97\xcfx\xdc\xca'\xd6\xe7\x98\xfa\
+\x9c\x8c\x08\x94\xd7\xeaG\x9fI\x90\x92\xb4\xd9:5\x04\
+&\x81\xd9EX\xe6\x16\xf0\xce\x22|\x1c\x01d\x8ao\
+\x92<}\xfc\xc6[_*\xf3\xff\x81\x1a\x02\xe02~\
+\xfe\xb9s\xdf\xfc\xea\x89c\xb7\x9f(\xcb\x04\xcc3\xff\
+\xe3\xcf+\xb8\x01\x93\xb6\xfeE&\x7f\x15w\xc0\x97\xcd\
+\x86\x15\xbbj#~\xadHy\xed\xff@\x08@DS\
+M[\x05b\x90\x87t\xab\xe9\x97\x04\xaf\x87DL\xfc\
+7\xf7C\x88\x8b \xde\xb7?\xf6yz?M\xcfS\
+C\xfb\xee\xb6\x08a\x030\x8d\xae \xd5\xb2\xa7[z\
+SP5\xf1\xd3\xa4/2\xf9=\xc9\xc0\x11\x14\x8e\x04\
+\xac\x0bm\x05\xe8\xdc\x802W@\xa3\xcc%0\x85\xc1\
+\xb6lx\xce!P\xde\x81\xdc\x1a\xe7\x89\xeb,\xfe\xd7\
+\xb2\x0c\xc0\xf8|\xeb\xfc\xb8\xe7\xbft\xea\xe9\x13\xc7\xaa\
+\x05\x02u\xe2P\x95\xe9\xc2\xa7\x81I[\xf9\xb0f\xe5\
+#\x19\x86\xe8\xb2\xa4)\xae\x03M\x8a\xd8\x09+\x00@\
+\xfc\xe0\x9aH\x8b\x81F]Q(BlU\xa4\xfe\xa7\
+?\xcf{_\xb6\xbe\xf4:\x0d[vMn{\xf8;\
+\x03Q\xaf\xfbO\xf7\xe1\x87\xc4\x07\x05\x90nO\xcc\xb1\
+\x14y&?G5W\xa0n\xeb\x1fyJ\x0c\xaa\xe6\
+o\xca\x82\x12AL~M|\xc5;\xb0\x01\xf4\xb6\xb2\
+\xe9\xbb\xf5\xed\xff\xf4<\x0e\x7f\xa0\xda\xb9\xd6:\x1b\xb1\
+\xf6\xa2\x14~i\x1c@\xbb\x01Wb\x8d@\x132\x0c\
+Ay\xf9%\xca\x22\xbf\x09\xa2\xfc\x84\x08TA\x82\x10\
+\xa2\x9f\x10\x04\x8d6\x85\xa1\xb5k\x962\xdd\xf5\xef\xb0\
+r\x88\xde\x84\xf8\x9c\x04\xc8\xba\x8cf\xefF\x99\x9fo\
+\xce\xe8\xc3\x18m\xd5\x0a0Q\xd7\x12\x00\x92y\x03\x84\
+Y`\x9c\xc3\xed.@\xda\xab\xe8\x06\xcb\x08\xb1\x1e]\
+S\xea\x22\x90#!\xb6\xa8\x8bm\xefE,\x1ez\xf0\
+\xb1\xaa\xc7\xaa%\x00\xb7\xdc\xfe\xe0\x17u\x1c@\xaf\xcb\
+s\x074\xf9\xcb\xdc\x81,\x98\xbe\x7f\xd3B!i3\
+_\xc7\x01\x9aX\x06YB \xf5\x0d\x12[\xe8V\x98\
+\xe4C\x9b\xa6ah\x8d\xc5\x03\xaa\xc0$\x8a&\x93\xac\
+P\xba\xda\x84)\x18\xfa\xbbi\x11\x91\x81\x0fj\xd9\x89\
+\xcf\xcb\x8eS\x85\xc4u\x89n\xc2\x9c\x817\xefQ\xaa\
+\xd3\xb5\xa9\xc9/\x84,\x9d\x11\xa8-\xdf\xbf\x8e\x10\x88\
+0\x04\xe3\x1c\x8cPX\x9d9H{\x15\x0e\xdd\x1f\xcf\
+T\xada\x92_\xe3\xfa\x85\xeb\x7fsq\xdf\xe6\xc9\xaa\
+\xe7U\x8bUu\xe2\x00\xa5?\xb2$\x0e\xd0F/@\
+S\xc2\xa7\x91E~\x22\xb6\xe0P\x01j\x97\xe7u\x9b\
+\xbf\x93\x93\x00ah\xc1b\x02B\xa1\xd1\xc8\xc1,1\
+H\x13,\xcbb\xc8\x22r\xde\xba\xb8\xe5\x86\x9f\xb9\xff\
+\x9d@\xd9\xd4\xdb\xe9\x16\x9f\x0e\x07\xc4\x14\xb5\xfe&\xf9\
+\xcb\xb0S\x81?\x13fkoY\x16\xb8X\xca\xdd6\
+m\x01\x00\xc0\xf2\x81\xa5\xa7EP\xa9\x88\x17\x80\xba.\
+\x00\xa2|\x00\x11\xaa\x1f2[\xf5I\x83\x82\x85\x17\xa4\
+\xc5\xcc\xc0\xac\xb2\xd5\xb9\x02\xb1A\x14\x90\xac\xfa\xa2[\
+}W\xad\x03\x14\xa0\xdc\x8a\x1f6\xfd\xf0U:\x0f\x12\
+\xc4\xbdD\xc2\xf0C'\x15\x83*\xeb\xdb\xda\x7f\x1b\xc8\
+*\xa4\xaa2\x82\xafe\xad\xbb&\x7f\x15\xe2\x8f\xad\xcf\
+\x11\x82I\xc9\xaf\x84\x00a\xa38\x80P2w\xd0\x10\
+\x00\x80Zp\xe6\x96\xe0:.\xa8\xbdl\x9cG\xf5c\
+\x12l\xfa\xdf|\xf9\x1b\x8f\x1e;R\xbd\xa7\xbev\xf3\
+\xf8\xe5g\x9fxR*\xef<P\x5c\x22\xbc\xca\xb8\x80\
+\xb2\x1bk\x0e\xc9mZ\x22\xac\xad\x22\xa1\xba\xd5\xef\xb2\
+^\xa5\x96\xa6*\xcc\x07^\xc8 ^\xaeF\x98\xbf\xcf\
+\xfc\x8dJ\xcax\x19\xffN9\xf9\xcd\xff\xd9\xc7\x9d\x8e\
+\x7f_\x063\x08\x98I~j\xc1\xed.\xc0\xdew#\
+\x16\x0f\xde\x82\xee\xc2\x91\x04\xf9M\xa4\xcd\x7f\x00c\xfe\
+\xffV\xff\xfc\xd7\x8f\xdfx\xebKu\xce\xb1v\xf3z\
+\xfc\xc6[_\xf27\xe5\x9fY+\xf8\xbe\xc4\xc9dX\
+\x01Z\x04\x08q&\xb2\x02\xa2\x0b8Yzp^\xb9\
+037\xc0t\x19<N\x09\xe5<\xe1\xeb\x9b\xa8#\
+\x02e\xee\x8e\x92\x12$UH3K\x04\xf6R\xa1\x11\
+}~\xe69U\x11.U\x81\x8c\xd3\x1e\xbfPf\xfe\
+Wi\xfd)\xe3\xb5\xad\x04A\x18l\xdb\x01\xb1\xe7\xe2\
+\x96\xde\xb1\x19\x14\xb5A\xa4\x1f\x0f\x1d7O\x8f\xba\x1e\
+\xe4`\xbc\xcaVo\xc2\xee?\x8d\xda\xac\xf2\xbc\xb5\xed\
+/~\xfd\xb9/\xbd\xef\x1d\xef\xfc\xbe\xba\xdf\xd5\xd8\x8d\
+\x22\x16i\xa2g^\x8c\x94;0\xe8\x0f\xe0\xd0\xe2\xee\
+.mz\x9a>h\xd6o\xd5\xbf7O\x08Lb\xa4\
+\xc5`\xf4\xfdb\x821j5\xaaHd\x92\xd9\xfc~\
+\x15BW\xb5V\xf2Z\xf7\xa6\x03\x96\xeaD\xf9\x13\xeb\
+[ \x7f\xd9vf\xcbO\x18\x03\xb7](\xe6`n\
+n?\x98c\xc1f\xa3\x9a\x02\xfa\x97K\xdf\x06h\x7f\
+\xfc8\x19\xe4\xe7j\x09\x16\x15\xb1\x05`Q\xb7V\xfa\
+ob_\xb5\xb6\xd6?j\x93\x7f!\x08\x06?iY\
+\xd5\xea\x03\xe8b\xa1\x1a\xe6\x0d\xaf\x12\x0c\x04\xda\x8b\x05\
+T-\x13v\xdd\xc1y8\xdd\x9b\xd1\xbf\xb0\x0e\xdf\x1b\
+\xc0\x1b\xf4!d\x800\x14\xb5L\xff\xa2\x02\x9fm\x8f\
+\x89\x18\xcdK\xd0\xcc\x85\x98\xf4\xfb@\xb5\x16\xde\xbc\x0e\
+U\xc9o\xc6Z\xa6\x95\xca\xdbF\xd0\x8f2\x0e:$\
+|w\xae\x038\xfb\x12\x84\xcf=6\xed\x97\xce'\x01\
+\x00!Y\x1f\xbe\x9aO\xac\xdf\xea\x9f\xff\xfa\x03\xf7\x7f\
+\xe8\xd1*\xd9\x7f&\x1a\xb1\xea\xf8\x8d\xb7\xbe\x84-\xe7\
+),\xe3}\xe6\xfa,7\xa0\x0d\xf3\x7f7\xb0\xba\xd0\
+\xc5\xeaB\x178r\x04\xa1\x90\xf0\x02\x89~\xb0\x85\x81\
+?@\xdf\x1f\xa0wa\x80\x0d:\x80\xef\xf5A\xb6\x15\
+\x14\x09\x00\xbf\x9e\xafY$\x06i\x22\xe5Y\x05\xbb\x8d\
+\xaa\x847\x7fo]\xe13\x09_\xcd\xe5\xca\xb06Z\
+j\xf9\xcdm\xf5$#\x9a\xec\x96\xe3\x22\x80\x0b\xbb3\
+?\xfe\xa5\x0a\x85L\x9a\xc0\xa2\x11\xdf\xee\xbe\xf5\xce\xdf\
+\xf4\xbcWk\x99\xff@C\x01\xf0\xbc\xb5\xed\xfe\xf6\xfe\
+\xdf\xa6\x0b\xea}&\xb1-\xe6&D \x1d\x03\xd0H\
+\x8bA\x95\xd4\xe0\xb6k\x05\x14\xb9\x02\xe9\xed\xf42\xe7\
+\xee\x8b\xd7\x87\x07%\x84\x0a\xe1\xfb\x12\xbd\xbe\x87u\xbf\
+\x87\xdev\x0f\xa2\xe7\xa1\xc7|`[\xc2\xe7\xdeH\x1c\
+\x00pc~\xf9d\xf0/9\x0f \xc3\xf8yUq\
+\x11\xdaF\x1dr\x9b\xc8\xba\x9fi\xab\xaf\x0a\x9a\xb4\xf4\
+U\x03~f\xf2\x8f\x14a%\x9f^\x93}\xde\xa6\xc0\
+>\x17$\x5c\x8a\xc9N\x86\xdd\xaev\xc3^\x13*;\
+\x10\xe8\xc3Bd-\x04\xe8g\x9a\xffYh\x12\xfd\xd7\
+h\xcc\xa8/?\xfb\xc4\x93\xef:t\x7f\xa2LX\xdd\
+\x89Cw\xbazM\xfc\xa3\x8dIC\xcbD /v\
+\xc0\x19\x05\x87\x0d\x87\x03\x0b]\x17\x87\x10\xf5\xd7z\xa1\
+\x8f0\xa4\xd1Xv1\xc0F_!\x14\x03\xf4\xb6\xa3\
+L\xc1Mo3\x16\x07\x00 \xdb\x0a\x84!S$\xd2\
+\xd0\x84,\x22&\xa1\xb4\x92X4%w\x19\xea\x9a\xf6\
+Yhj\xe2W!\xbf&\xbeI~\xf3\xbf.\x1aj\
+[<\x8a\xe9\xecsa\x87N\xa2e\xa7\xce(\xc6\xa2\
+\x8c\x8a \x93\xa6\xfej\xf2\xeb\xd7\x1e\xb2\x7fO\xd0K\
+Z\x18K\xb6\xf5\xef\x0e\x1c\xaa6\xf8'\x8d\xc6\x02p\
+\xec\xc8\xca\xc9\xd3\xaf\x9d\xf9\xc3\x13\xc7n/\xad\x11\xa0\
+\x94\x97\x98/@\xbb\x04ub\x01@{V@\x93\xae\
+\xc1\xf4w\xf2\x84\x81\x11\x0e\xc7\xa5\x008\x16\xe0b\xff\
+\xc2h{\xa1\xc2\xa8\xb5\x0f\x15|!\xd1\xf7\x02\xf4\x82\
+\x1e\x08<lo\x8b1\xeb\xc1\x04\xd9\x1eM,\xa0H\
+P(\x14\x89k\xbf\x03]`m\x88x\xdb\xa4\xcf3\
+\xf9\xf5z]8\x85v: \x96\x13\x9b\xefs\xbc\x83\
+\xc0bp;\xa3\xe7\xd5\x972\xb3\x5c\x88I\xfeI\x90\
+5\xac\xc2\x1b\x8c\xf6mv\x01r\xb5\x84\x00\xc3$\xad\
+\xa1\xf9\x7f\xdb-G\xfe\xdb\xeb\x17O\xd76\xff\x81\x09\
+\x04\x00\x00\xbe\xf1\xff}\xe1/\xee\xfa\x9fn\xfc(\xe9\
+:\x89f\xa6i\x96\xe0n\xb8\x02@uw\xa0*\xf2\
+\xf6\xc5\x08\x07\x1bVv^`\x14X\x00\x80\xa5X\x1c\
+\xa4\xa4\x08\xc3\x10\xbe\x90P\xf01\xf0\x08@\xfa\xe8\xf9\
+*\x16\x09\x00\x09\xa1\xd0\xd0\xeeFt\xa0\xe1\xbf\x92\xdc\
+\x09%e\xae_^\xb6^\x7f\xd6\x94\xfc\x93\x10\x9e\x0d\
+\xad\x9a4\xf9\x99a\xedX\xb6\x03F\x09$\xb3a9\
+\xd1\xb3H\xc9\x1c\x5cG@\x91.xG \x1c\x06\xd2\
+:\x8e\x84\xf4\x87\xc5Jm\x01\xe93x\xc3A[M\
+G\x85N\x8a\xbc\xee\xbf4V\xdd\x85\xe7\xbf\xfc\xec\x13\
+O61\xff\x81\x09\x05\xe0\xb6{\xfe\xe6\x1fHB\x7f\
+\x8c!Y+0\x8b\xfcf<\x00\x98\xacb\xd0\xa4\x22\
+Pe\xaa\xb0t^@Y\xc9\xf1\xf4\xfa\xac\xcfL\xe8\
+\xcf\xcc\x04'J%:\x8e=4\x04]\xa0\x0b\x08e\
+D\x90\x0f\x00R\x0e\x8f;\x14\x0a\x00\xe8{A\xa6P\
+\x00\x91X\x00\x88\x04\x03H\x88\x06\x00Ho8\x0c8\
+%\x16\x9cF%\xcd'\xa9H\xdc\x94\xe4fw*\xa3\
+\x04\x84R\x88\xe1\xfd\xee\x10\x02e\x0f\x891\x17]\x8b\
+\xae\x88\xc63hb3\x12\x99]\xd4\x16\xa0\xca\x82\x95\
+*?\x16H\x01I\x02X\x86\x89\xad\x89o\x92\x7f\xb7\
+\x10\xa0\x9f\xfbY\xbf\x9ft3\xce\xf5\xbe\xf5\xc8MG\
+V*\xe7\xfe\xa71\x91\x00\xb8\x8c\x9f\xff\x93'\x9f\xf8\
+\xb7\xef~\xdbC\xbfP'5Xc\x92\xde\x81I\xba\
+\x07\xcb\xe6\x0f4\xd7\xe5m\xdf\xe4\x18\xe9\xf3\xcf:\xf7\
+\xb2\x8cG\xaa\xcby\xd9\x14\xf60\x91s\xbe\xc3\x01\xc3\
+\x7f\x94\xab#\x11\x922Y\xe1X\x8bF\xe4\x86\x8c\xd6\
+{\xb2\x0fa\xd4\xf0\xd31\x8b,\x90\xfe\x88\xd8\xe9\xa2\
+!\xd2\x1f\x0e\x22\xb2G\x83\x8cxN\x0a\xac\xead\xe7\
++0\xb2\x00\xa7k\x14\x0d\x15\xa3g\x89\x96\x0c\x80\x94\
+>@l\xed>\x11\x00!\xd4\xb0u\x0f\xf4\x14o\xa4\
+\x85\x0c\xce\x0c\xf3\xdfL\xfd\x9d\x14U\x03\x80M\xfa\xfe\
+MLlK\x93M\xfe\x05\xa9\xbc\x9ft\xd9\xbe\xc4\xdc\
+\x81i\x11\xd09\x01y\xf1\x80\xddB\x1eQ\xab\x04\x07\
+u\xef@\xd1\xf7\x8a,\x822\xb2W\x9d%Y[\x05\
+Y\xa045]\xb6~\xe9\xc4\x7f\x86\x98\x1b\xeek\xf8\
+6\x95\x91\xaaE\xc4\x17\x126\xa3\x95\xab&\xa7\x91\x1e\
+\x22\x1eVlm\x07%\xd6\x84&\xbe\xae\xc1\xa2\xfc$\
+\x81\x82\x92\xa4z\xed\x02\x98\xad\x7fk\xe6\x7f\xcd.\xc0\
+\xa2\x00\xa0\x89\xed\xfe7\x9fn\xd2\xf7ob\xe2\xfe$\
+\x1d\x0c\xd4\x847Io\xf6\x0a\xa4]\x80\x22\xd4\x1a\xda\
+\xa9\xc2\x89\xa6\x12/B\xdd\xca\xc2E\xe4\xaf\x8bi\x94\
+G7\x11Y\x06\xd1\x12\x86a\xbcD\x9f\x85c\x8b\x89\
+&\xe4\x17\xa1J\x90?T*\x97\xfcR\x0a\x0c\xc2 \
+\xb1\x14\xfe\x96\x92Q\xd1e\xe4\xdfM\x94\xd5U\xc9\x1a\
+\x03\xa0\x11\xf5\xfd\xd7K\xfdM\xa3\x95\x0e\xe5\xe7\xbf\xf8\
+\xf8g\xa4\xf0\xd7\x021\x80i\x05\xa4\xa1\xad\x804\xb2\
+\x0a\x87\xd4\x0d.MC\x08\xccV\xbeh\x1cA\xfa5\
+\x90t)\xccz\x84i0\xc2s]\x81I[\xff*\
+H\x93\xbblB\x14\x9bQ\xd8S\xac\xa9\x08D\x85U\
+\xdd\x1a\xa3+\x8b\xdc\x82,\xf2S5\xbd1\x15\x84\xb1\
+8'\xa0\x0cu\x8b*\x99\xfe\xff\xaa\xbb\xf0\xfc7_\
+\xfe\xda\xa3\x93\x9eo+w\xf2\x81\xfb?\xf4\xe8\xd7_\
+\xfd\xd6\x7f4\xd7i!\xc8\xb2\x02\xaab\xefL{U\
+^L\xb4\x8c\xac\x9c\xd1\x98\xd4m\xa57\xd7%\xbf\xb6\
+h\x9bX\xb6MM\xfe,T5\xfb+\xfd\xa6a\xeb\
+o\x8a\x80i\xfe[5\xe7\x22tREZ\xecI\x92\
+\xae|Qh\xfe\x93\x9c0\x99\xd9\x05\x98\x87\x97^\xfb\
+\xd4\x9f\x1d\x9b \xf8\xa7\xd1\x8a\x00x\xde\xda\xb6\xb6\x02\
+D\xa8J\xad\x80,\xe4\x95\x0fkb\x09\xb4\x89\xa2\x9e\
+\x00\xbd\xce\x1b\x96\xc5\x16*\x1c\xdbVw\xf1ya\xb6\
+\x9d\x9a\x16\x84\xaa\xa2\xd0\xa4\xe5\xa742\xf7u+o\
+\xb6\xf6f\x9c \x0bf\xab_W\x0c\xf4\xbd-2\xfb\
+\xa3\xf3if\xaaK?\xe9\x06\x8c\x82\x80\x11\xb2D\x80\
+\xf8\x16\x88o\xc5\x91\xff\xcc\xdf<$\x7fZ\x04\xda\xe8\
+\xff\xb7j\x84\xbd\xc4\xc0\x12f\xebo\x13\xa7\x07\x89G\
+&>\x09\xb4$\x00@;V@\x9b\x22\xd0\xa6\x10\x94\
+\x05\x04M\xd2V\x09\xf4\x15\x99\xfdU\xd0\xd4\xec\x972\
+\x22\xbaI\xf6\xf4\xfb2\xb4i\x09L\x13E\x22\xa0\x02\
+\x80L\xe8\x05\xd8\x8a$\x96\xfc\x0d\x93\xe2b\x91\x11\xf9\
+\xab\xfa\xff\xcc\x0d\xe2\x9d\xd8\xc4\x15]k\xfd\xdf?p\
+\xff\x87&6\xff\x81\x16\x05@[\x01\x84\x04k\x9a\xc8\
+*\xa7\xb5\xd7\xbd\x01\xfa\xb5\x89\xb6D\x00\x98n\x80\xb0\
+*\xd2D\xd7\x91\xfd\xbcs\x9b\xe6\xf9\x9a-~]\xdf\
+\x7f\xa7a\x06\xfe\xea\xc4\x03\x80\xc8\x05H\xf7\x02$>\
+\xb7\xebw\x03\xda\x94&,\x01\x9f$\x9f\xc7\xb4 8\
+\x94\xc3q\x1d8\x94\xa3\xa3\xec\x04\xf1\x01\xc0\xcf\xe9\xea\
+\xcf3\xffm\xe2\x0eM\x00\xe5\xbd\xf2\xda\x1f~n\xd2\
+\xe0\x9fF\xab\xd1\x9c\x07\xee\xff\xd0\xa3b\xc3\xfa\xea\xe8\
+\xa2\x91X\x04\xb2\xc6\x09\xe4Y\x03m\x8a\x000}!\
+\xc8#r\xd6q'Ib\x92\x926\xf2\xfbu\xa4?\
+\xaf\xa5\x9f\x06\xf9u\xd4\xdf4\xff\x8b\xcf3\xdf\xfc/\
+\xeb\x05\x00\x92-~\xba\xf5\xd7\x81@\xd3\x0ah\x9a\x0b\
+`SZ\xde\xea\x0fA\xfb\xed\xc4:\xc4\xc0\x12@\xfb\
+\xad?\xd0\xb2\x00x\xde\xda\xf6#\x9f\xff\x17\x9f\xa1~\
+4.\xd6\x97\xc5\x96\x80FY\xcf\x00\xa3$^&\x81\
+I\xca6\x05\xc1$t\x13\x7f\xbe\x0a\x9a\x9a\xfd\xa6\xfb\
+*e\x18\xbf\xafj\xfa\xfbB\xc6f\xbf\xce\x01\xa8t\
+MR\xb9\x1d\x9c\x10\xf0\x0aU\x90\xab\x90\xbd\x09\x02)\
+\xc6z\x04D\x85\xbe\xf6I\xa1E\x80\xf6S\xc3\xe4K\
+\xf2\xe4\xcc\xee?_\x0d\x98\xaf\x06\xac\xed\xd6\x1fhY\
+\x00\x00\xe0\xcdo\xfb\xe8oKB\xbf\x0e\x00Dy \
+\xda\xd4'N\xed\xd1\x82qi\xf1\xd4p\xd9\x9dF]\
+\xc1(\xdb~'\xdc\x123\xe2\xdff\x0b?I\x0c\xa0\
+\xa8\xdf_\xc3\xe5V#\x11\xd0&\x7f\x96\xe9\x9f\x0e\x02\
+\x12\xbf\xd8\xa5p\x0a\x84Jy\xf5\x02\x95!\xf5\x11\xd2\
+av\xa4!\x02Y\xfe\xbf\xdcv\xc7.\x90\x18X\xc2\
+&\xae\xb0\x89+,\xc2\xfe\xa8\xcd\xd6\x1f\x98\x82\x00x\
+\xde\xda\xf6\xe7~\xff\x97\x7fY\xf5\xbc\xf8IiC\x04\
+\x80\xe4P\xd36\x04\xc1$j\xda:\xc8\xea\xaeKo\
+k\xee'o\xffm`\xd2\xee>\xb3\xb5\x1f}\x96\x9d\
+\xe4cB\x93}\x92\xcc\xbf\xf2s5Z:)\x1b[\
+\x00\xa6\xd9\x9f%\x02\xda\xe4\xb7(\x03\xb1\x90\x1b\xf9o\
+\x0bDF\xc4\xe72\xea\x9f\x94\x9d\x01d\xa7\xa4\xbc\xdc\
+\xdc \xa1<\xda\xf4\x1f\xfe*\xef\xdb\xe7\xfe\xddo\xb5\
+\xd9\xfa\x03S\x10\x00`d\x05\xa4\xb3\xbf\x80rw \
+\x0bE\xe5\xc4\xda\x12\x82&\xdbN;\xb6\xd0\xc4\xe7\xcf\
+\x83\x99\x12\x5c\xc5\x220\x09\xdf4\xf3\xcfD^\xebO\
+k\xf6\xd3\x97!\xed\xff\xc7\xc71\x92\x7f\xda\x18\x0bP\
+\xfa\xfb\x83\xfa\xcf\xa57\x90\xb0DWeE\xff\xdb\xf6\
+\xfd\xe3\xeb2\x8d\x1f\xaf\xad\x00B\x825 z\x18\x88\
+\xe1\xe7\xe7\x05\x04\x9bt\x11\x02\xd3M\x18\xda\xad\x9e\x84\
+\xa6\xc1>@\x93\x1d\x86\xbf?r\x05\xaa\xba\x03:\xe3\
+o\x9aY\x7f\xe6\x94\xeaM\x84 +\x058/\xfao\
+Q\x16\xbb\x02\xc4\xb7\xc0\x1a>\xfa\xc4\xa9v\x9e\x5c\xda\
+q\xeb\xaf\xffk\x88-\x1bL\xa4fdJ\x99\xffb\
+`\x09m\x01\x04\xea\xbc\xb8\xd4?\xf3\xcf\xdan\xfd\x81\
+)\x09\x00\x10Y\x01\xe9\xbc\x00\x8d\x22W\xa0H\x08\xca\
+D`\xafd\x0eN\x8a\xa6&\x7f\xfa5\x90$\x7f\x13\
+L\xab\xf5o\x9a\xf4\xd3\x16\xaa\x06\x00\x1dB\x0ac\x02\
+Yh#\xfao\xb6\xfe\x1bk\x8f\xfev\x1bY\x7f\x99\
+\xe7:\x8d\x9d\x02Fv\xe0p\x12\x91\xb4\x15\xd0\xc4\x15\
+\xd0\xfbQ\x92A\xc9l%\xbeZD\xa0\x0c\x0a\x02\x0a\
+\x223\xad\xd7\xb4\x06&\x0d\x02N\xcb\x02H\xb7\xfaM\
+\xfa\xfdu\xfa/\xb5\x01\x82\xea\xcf\x93]\xe1\xb1O\x13\
+\xbf\xae\x08\xa4aZ\x01V\xc65\x0dX\x8fX\xa2\xab\
+\x02\xd6#\xc0\xc8\xffWJ}e~\xe9\xaeOLt\
+\xf0\xa2k8\xad\x1d\x03\xc0\x89\xbb\x1e\xfa\xdc\xe9\xd7\xce\
+\xfc\xa1~\x9f\x16\x01\xbf\x80\xacE\xee@\xd9\x03}\xa5\
+Y\x03\xda\xd7\xaf\xe2\xf3+\x8cZ\xce\xb4\x08\xa6\xaf\x8b\
+\x99\xf6\xdb\x14M\xd3~\xe3s\xa8\x90\xf7?\xad\xae\xbf\
+\x22\xd4q\x01<\xa5\x12\xc3\x84\xab\xba\x01i\xd0\xbe\x1b\
+\xf7\x04\x086\xf2_L\xf3\xbf\xef\x89D\xf0\xef\x8dw\
+v\x7feZ\xad?0e\x01\x00\x80\xb3__\xfb\x05\
+\x04\xe1I\xc6\x09\x18\x1f%\x06\x11\xe5\xc1\xa6\x04\xe6\x08\
+B\x13e\xc3\x86\xa5\x0c\xc7\x86\x98\x9a\xf9\x02\xbb1\xf9\
+\xc8\xb4\xa1\xc9/%2-\xa0:)\xbdU0i\xe4\
+?\xcf\xf47\x97,\xd4\x11\x04j\x8f\xc6\x02\x14e\xff\
+\x01\x80d\x03\xf4\xbd\x00}\xd4\x17E\xd3\x02\xa8\xdb\x15\
+\x08\x00\xd2\x1bQ-\xa8x]7.\xfd\xa7\x93\x97\xb7\
+.|\xa6\xf6\xc1j`\xea\x02p\xec\xc8\xca\xc9G\x1e\
+\xf9\x8f\x9f4\xbb\x05\xed\x0a\x09=uF\x0e\xa6\xf3\x05\
+\xb2&\xe3\xd8KBP\xa7\xc5\x07F\xe6>\x80\x5c\xd7\
+g\xfc\x18\xf5\x1f\xf2\xb6#\xffU\x90&{\xdd\xb4\xdf\
+\xb2Z\x00&\xcc\xcaB@5+\xc0S\x0a\x0e!c\
+e\xc2:\x8a\xc5\xff\xf5k\xdaW\xb5\xfd\x7f\xb9\xed*\
+m\xfeo\x84\x9b\xc4\x0c\xfc\x05\xe1\xc6?\x9eF\xe0/\
+q\x0d\x0e\xdf\xff\xfei\xee\x1f\x00p\xc3\xf5\xb7\x7f\xed\
+\xaf\xfd\xb37\xac\xce\xaf\xde\xa7d\x08E\x04,\xe6F\
+.\x00\xe1 \x10`\xa9\xd6kT;@\x00\x10 %\
+Yu\x04\x1c\xc4\xc8\xcfV*ZL\xe8uz\xa1\x13\
+\xfaue\x90\x92\x82\x10\x05))\x94\x22\xf1R\x15\x11\
+\xe9\x87\xd9\x94\x92\x01\xaa\x9a^OB~\xa1\x14D\x83\
+\xe1\xbaU\x03\x7f\x942\xa8\x8c\x82\x9b.\xb7\xc0\x871\
+\x81\xb0\xc6xe\xc2\xa2E\x955\xca\x9e\x02\x04`\x81\
+\x22\x84\x04\x05\xa9\x14\x08\xd4\xd9\x8b\x9c\x90\x91\xf3%\x14\
+,PX\x86\x80\x84D\x81\x14\x5cv\xc2\x15\x94 q\
+\xeb\xaf\xe8P\xd0\x03\x0eI\x03\x22i@\xbcm\x1e\x1f\
+\xc2\x97\x97~\xe9\xf8Mo\xf8\x97\xb5oDM\xec\xc8\
+\x0c\x13\x9e\xb7\xb6}\xf6\xebk\xbf\x10\x5cZ_\x07\xa2\
+\x87e\xe0\xf5\x13\x09B\xbeT\x89\x98@\xbatX\x15\
+\xe8\xe0`\xd5VRH\xd5Z?{\x1e\x9a\xec\xdfl\
+\xf1\xf5\xef\xaav\xac\xfa>\xbf\x99\xea\xdb\x14MZ~\
+ \xd9\xdakK \xcb\xfcO\x0f\xc4\x89\x7f\xaf\x9f\xfc\
+\x9f\x0b\xaf]\xeb/+\x06\xa0\xad\x802X\x8c&\xfc\
+\x7f\x00\x89\xbe\x7f\x00\xb8\xd4;\xf5\xec\x91\x03\xc1?i\
+\xf5\xa4s\xb0c\xf3M\x1d;\xb2r\xf2\xb1\xd3\xcf\xfc\
+\x9c\x1e'\x00\x8c\x07\x05\x81\xe6\x05D\xd2\x0f\x7f\x15!\
+\xd0q\x02)i\xec&\xa4M\xf3,\xd7\xc1$u\xda\
+\x9c\xafc\xda\x9b\xd0\xa4O\x13\x7f\x9a&?\x90\xec\xef\
+\xdf\x89J?\xfa\x7f\x9d~\x7f_\xca\xb1\xfa|\x95\xc9\
+\x0f\x00\x0e\x89\x96\xe1km\xfaW\x0d\x04zJ\x81\x0c\
+M{w\x10-c\xdb\x0c\xf2\xaf\xbf\xf4h\x22\x06\xc0\
+D\x94\x07\x90\x95\xfa\x0b(On?\xfd3.\xe3\xe7\
+'\xba\xd8\x15\xb1\xa3\x13\xce\x1d\xee\xac\xfcVo \xfe\
+\x83\xb9.+S\xb0h\xe4`Yk\x95&B\x19\x81\
+\xd2\xa4K\xeek$\x02\xe6\xa2 \x1a\xc7\x15\x12\x04/\
+ \xfd4[\xfd<L\xea\xf7k\xb3\xbfi\xa1\xcf\xbc\
+\xd6?\x0b\xd4.\xaf\x10\x9c\x80\xb6\x02R\xd6@\x91\x08\
+\x98\xa47\xff\xd7\x05u\xc6\xafk0\xa0\xf1\x89\x98\xbe\
+\x7f_\xfc\xf5\xaf\x9d\xb8\xeb\xa1\xcf5;R\x83s\xdb\
+\xa9\x03\x01Q\x19\xf1\xbf\xf8\xf2\xd3?\x83 Ltk\
+\xc8 ye\xb5K\x90FU\x8b K\x04\xb2H\x95\
+E\xe0<A ` ('\xa5I\xea,\xb2g\x1d\
+\xa3.\xe9\xf5o\x9c\xc6 \x9f:V@\x1d\xf2\x9b\x91\
+\xff:Q\xfe\xbc\xca\xbc\xe9*@\xa50\xac\x80*y\
+\x00\x1a\xa4\x85\xa4\x9et\x0f@\xda\x05\xd0\xe4\xdfI\xd3\
+_c\xc7\xa7\x9c=vd\xe5\xe4\xf6E\xfeOu\x9a\
+p|\x91\x82qy\xcd\x12\x01\x8bV{x\xf2\x08\x92\
+&[\x1e\xe9L\x92\x9a\xc4\xaf\x22\x02UQ\x97\xf4E\
+\xbf\xab*\xb2|\xfeI\xa3\xffuj\xfciB\x17\x89\
+\x80\xd9\xeaOT\x93\xaf\x00e\x22\xd0\x06\xf1\xf3`\xa6\
+\x01o\x84\x9b\x04\x88\xa2\xfe;i\xfa\xc7\xe7\xb2\x13\xbd\
+\x00il\xf7/~\xedu\xff\xf2\x89\x85\xb9\xf9\xfbx\
+\xa2<\x95\x00R\xd1~\xa1\x006\x16\xad/\xef\x15\xd0\
+PJ&\x16bNR\xa1\xa3\xea\x8a\xc6\x0b!Y7\
+^\xa5\x96j\x9f)\xc9@\xc8PLt\x14\xdf\x5c\x1a\
+@\xa9\xc9\x02v\xe9\xba\x0aM\xcd~\xf34(!\xa0\
+\x84\xe4\xc6\xd4\xcd\x9c\x7fn,f\xb4\xdf\xa64\xee}\
+`\x84\x80\x11\x02\xa1T\xfc?\x8d:\x91\xff\xc4b\xfe\
+\x8e\xe1\xfd\xa2 P\xc6\xbdc\xa0\x90\x16\x0a\xa3\xfai\
+PA!3\xae\x80\xd9\xfa\x03\x80T*6\xff\x03\xd6\
+#\xa1PP!So\xb8\xbe\xfb\x93\xfbW\xf7\xfd\xdb\
+\xda7cBL\xb7\xf8|\x01\xe4\xc5\xf0\xef\xd3\xfd\xe2\
+\x0e0\xbcU\xaf\x13\xa1\x02\xcd\xe8\x06\xf6\xa5\x1a\xcb\x1d\
+0\xdd\x81\xba\xbd\x05Qa\x8c\xec\x9f^\xb7E.?\
+\x16\x80\x16\xac\x86\xb6\xab\xf6\xecFm?\xdd\x0d\x98\x86\
+Mil\x19d\xb5\xf8\xe6\xe7\xad\xfd\xfe\x82.\xc0\xba\
+\x85B\xe4\xf0Q\xb4\x08GP0p,\x102\xe1\xfb\
+\xeb\xac\xbf\xaeu\xf9S\x9cZ\xbf\xb1\x1b\xa3#v\xdc\
+\x05\xd0p\x19?\xff\x9f?\xff\xe9\xff\xd7\x8c\x070N\
+@\x94\x97p\x07\x84\x1f\x11?\xddMh\xa2no\x81\
+\xfe\xdf\xb6\x1f=\x0d\xb4q\x8eE&\x7f\x11\xd2\x01\xda\
+\xac\xe1\xdd\x1aU\x8a}\x00\x18\x9b\xe8\xc3\xac\xbc\x9b&\
+\xbf~\xef\xa7,\x05\xa0f\xf4\xdf\xa9\x9f\xefA\xfa\x0a\
+\xaaS\xff{\x96a\x99\xa6[\x7f\x13\x01\xeb\x111\xb0\
+\x84R\xea+\xd3\x1a\xe9W\x05\xbb&\x00@4V \
++\x1e\x00D\xc4\x17>\x01\xb3U,\x02\x00\x0aE\xa0\
+jO\xc1\x95\x80\xb6\xc4\xc9,\xe7U\xa7\xcf\xbfi\xdf\
+\xfeT\xae\x85_\xfc\xbe\x14\x15\xf2\x00\x9a\x0e\x0f\x96\x19\
+m\x8f\x95\xe1\x9ef\xb5\xfe\x80\xf2.\xbc\xf6\xeb\xbf5\
+\xcd\x5c\xff2\xec\xaa\x00\x00\xc0\xe5\xad\x0b\x9f\xd1\xc3\x86\
+\xcd\x16\x86\x90>\x08\xe9\xc7\xe4O\x8b@\x96\x10\x04\xd2\
+jD\xfe\xbdR!w\xdaVI\x9d\x08\xbf\x1e\xbb\xa1\
+\xd1T\x10t\x9f\xbf\xd9\xf7_7\xdd\xd7ui\x1c\xf5\
+'U\x92z*l\x93\x17\x04$\xfdQ\x9f\x7f\xd3@\
+\xa07\x90c\xad\xbfI~ \x8a\xfc_\xbc\xf8\xe9\xdf\
+\xbb\xe7\x8d\x1f\xf8\xb5F\x07i\x09\xbb.\x00\x9e\xb7\xb6\
+-/\x86\x7f?\xdd5\xa8AHT?\x99\xd9\xe37\
+#-\x02U{\x08\xf2`\x92o\xa7\xdc\x83\xb6Io\
+\xb6\xf4MM\xff4\xca\xc8_w\xb2\x8f*\xf3\xfd\x99\
+H\x93\xbeS%\x85\xdbS\xb53\x00\xebZ\x01\xb2\xa2\
+\xe7\x99\x1e\xfcsik \xbb\xd6\xe5O\xddr\xdb\x83\
+\xff\xa0\xd6\x01\xa7\x80]\x17\x00 \x8a\x07<\xf2\xd9O\
+\xfd#\x04\xe1I3SPC[\x02\xa6\x15\xa0aZ\
+\x03\x81\xb4`\xd1\x00\x16\x0dj\x9b\xbcy\x04l\x8b\xa0\
+Y\x13n\xee\xf5\xf8\x030\x99+\xa0\xc9\x9f.\xfa\x99\
+\x97\xda\x9b\x07e\xf8\xf0\xca!\xe8\x17u;\xa6I_\
+S\x04h\xa7\xfdZ\x81\xe9\xd6_\xfb\xfd;\xdd\xe5\x97\
+\xf9{w\xfb\x044N\xdc\xf5\xd0\xe7>\xf7\xfb\xbf\xfc\
+\xcb\xa1\xa5.\xe6\x89\x00\x80L\x11\x00\x22!P\x189\
+\x87\xa65\xd0F\xbe;\x90O\xe2*\xcb\x95\x88*\xe4\
+/\x0a\xfe\xe9\x14\xde\xa6\x11\xfcI\xbe[\x176(x\
+\x18*\x1e\x86\xca%\x16\xf4\x92\x87\xaa\xad\x7fo;\xd9\
+7\x1c\x06\xe2\x85\xb5\x0b\x9f\xfe\xf9\xdd\xf4\xfbM\xecJ\
+\x1e@\x1e\x0e\x1d\xbe\xed+\x7f\xfe\xf8_\x88\xa3\xc7o\
+~\xbf\xc5\xa2yT\x18'P\x12\xa0\x96\x0b\xca\x80t\
+/\x92\xf0Ib\x9d\x997\xc0\x88\x04#\x12r8P\
+C\x8ft\x13J5\x9ec\x80R\x0eBh\xbc\xa4\xfb\
+\xe5\xcb>o\x03\xbe\x90\x89\xdfb.m \xdd\xcf\x9f\
+\x87\x22\xd3\x9f\x10\x9a\xe8\xf3\x97R@)\x05O\x88\xf8\
+\x5c\xcb\xac\x80\xc0SP\x02\x90T\xc5}\xfea\x99(\
+q\x12-\x15\xfa\xd4\xd80\xbfS@\x81\x84\xa3*\x9e\
+\x8a\x8ax\xb1\x94M8aP\x92@\x0dsD\x8a\xc8\
+O\x03\x8e\xd0HP\x08\x0cO\xe7\xd2V\xbf\x7f\xe7m\
+\xceOu\xe7\xe7~\x7f\xd2{\xd4\x16\xf6\x94\x00\x00\xd1\
+\xd0\xe1\xf3\xfe\xeb7\x1ct\x17\xeeQ\x8c\x11\xfd \x12\
+6\xach\x1b\x0c \x85\x05%\x08\x94\x18\xf5\x12\xa4E\
+@/QRIR\x08\xa2m\xea\x8b\x81/$(Q\
+\x89\xa4\xa24\xc1\xd3\x89Gm\xc1$\xfd4Q\xd5\xe4\
+\xaf;\xc3\xaf\x1e\x02\xac\xcf\xbf\x8a\x0b`\x09 D\x85\
+\x84\x9f4j\x9a\xfd&\xf95\xfc\x80\x10K\xd9\xf1\x83\
+\x11\x18YAy\xe7\xe3\x0d$,\xcab\x010[\xff\
+K[\xfd\xfe\xf5\xd7\xe1\x1fnn}\xeb\xd7k\xfe\x9a\
+\xa9b\xcf\xb8\x00\x1a:(x\xea\xfcK\xbfC}_\
+R\xdf\x97d0$\xfe0?\xc0\x0c\x0c\xe6\xb9\x04\x1a\
+f\x8c /H\x98\x0e\x9cM\x1a7h\x0bu\xcfg\
+R\xb4\xd1\xf5\x97\xae\xf8\x93\xae\xfcS\xc5\xff'\x9e\x8a\
+\x03\x7f\x1dB\xaa\x05\xfdL\xd4\xe8\xf7\x97\xa1\x9f\xf9\xa3\
+\xb3b\x01L2\xb0\x8a\x89bf\xe0\xef\xd2\xd6@^\
+\xbc\xf8\xe9\xdf\xe3\xb4\xf7\x1b\x13^\xde\xd6\xb1\xe7\x04\x00\
+\x88\x82\x82Z\x04\x00\x80\xd0H\x04L\x98]\x84\x00J\
+\x85@C\x07\x09\xcb\x90'\x0aMIY\xe7;;I\
+\xfa\xf8\xfaM\xa1\xdf?\x9d\xf5W\xd7\x9f\xef+\x95\x08\
+\x00\xe6\x0a\xc1\x84\x81\xbf,\x90\xed\xf1\xe8\xbd\xa0\x02A\
+\x90\xdd\xfc\xd3 \xb2P\xfb\x22\x8aC\x99\x81\xbf\x8b\x17\
+\x7f\xef\xb7\x1e\xb8\xefC?\xbe[\xc9>E\xd8s.\
+\x80\x06\xa7\xb4\xf7\xea\xb7\xd6\x9e?|\xe8\xe0a\x8b\xd3\
+;\x95\xc3\xc6\xee>!!\x80Q\xa0F\x09\x92\x1b#\
+0\xdd\x02\xa1\x00@\xc0\xa6#\xb7\xc0\xa2\xc1\x98\x9bP\
+\x86<?\x5c\xbb\x15\xbe\x90\xa3\xda\x84\x86\x09\x5c\xb6\xec\
+$\xaa\xfa\xfb&\x8a\xcc\x7fe|\xa6\x94\x02\xa5,\x8e\
+\x87P\x0c\xbb\xf4x\xbeX\xfbRB0@\x0cs\xfd\
+9' CW\xc0\xb4\xb7:\x84D\xef5\xd9u\xae\
+\x7f\x91\xff?\xc0X\xf2\xbb\xca\xe8\xa6\xa4\xa1M\xe4\xf0\
+wH\xa5b\xf3?\xcf\xf7\xa7\x01\x8f\x89\x0f$M\xff\
+\xd7\xd6_\xf8\xc4=\xb7\xbf\xf1\xa7\xf7\x22\xf9\x81=j\
+\x01h\x1c;\xb2r\xf2/\xbe\xfc\xf4\xcfx*\xfc\x0a\
+\xf5}\xe9\x09\x0f\xda\x12\xd0\x86\x9bN\x18\xd2Hw\x17\
+f\xe5\x0fh\xf8R\xc5\x16A \xad\xc4\xfb\xb6\xb0\x1b\
+\xady\x15\x14\xa5\xf5\x16!T*s\x92\xcf\xa2\x22\x9f\
+\xfa\xf32\x98\xfd\xfd\xd2\x8fH^\x94\xf8\x93i\x11x\
+*\xdb\x05\x18\xe4\xbc\xce:W\xee+\xb3t7\x93l\
+\x94\xefo%\x1b\x08\xdd\xf2g\xe1\xb5\xf5\x17>q\xe4\
+@\xf0O\xf6*\xf9\x81=.\x00@$\x02\x8f?\xf6\
+\xb5\x87=\x15~\x05\x18\xb9\x036\x01L\xb7 O\x08\
+\xf2\xf2\x074t\x8c@\xc1\xafT\xac\xb4*v\x9b\xf4\
+y\x04oJ|\xa0z\xc1\x8ft\xe6\x9f^G\xbc\xa4\
+I\x9f\x86r\x08lJ\xe1\x04\xe3~\x7f\xfa}_)\
+\xa8\x01\xd0qS\x8f\xb0C\x8a]\x80\x81\xf1?G\x08\
+h\x18\x05\xff,F\xc7j\xf8g\xb9\x00Y\xad\xbf&\
+\xff^\xe8\xeb/\xc2\x9e\x17\x00`$\x024\x14_\x06\
+\x921\x81\xac\xd8@\x16L!(\xca%0\x05\xe1J\
+F:\x8dw\x12\xe2\x9bH\xb7\xfe\xe9\x96?\xed\xf7\xeb\
+\x8c?\xd5\x0f\x0b\xc9\xaf\x91\xd7\xe2\xeb\xe4\x1f\x1d\x14t\
+\xbdh_c\xb3\xecf}\xbfb%\x1fM\xfc,\xe8\
+\x96\x9f\x06<n\xf5\xf3L\x7f\xcf\xfb\xf6o]\x09\xe4\
+\x07\xae\x10\x01\x00F\x22\xb0\xf9\xda\xdc_\x02\x91\x08\x00\
+@\xa0\xaa\x8b\x80v\x07\xd2\xbd\x07y\x82\xa0\xe0\xc7\xcb\
+\x95\x8a\xb6\x82{y\xad\x7f:\xd7\xdf\x8c\xfc\xab~\x08\
+\x9b\xd2X \xca\xf2\xf8\xeb\x98\xfb\x03Ga\x00\x09\xe2\
+\xa2<\xea\xef\xa22L\x11\x08\x84\x84\xf2F\xfb6\xcd\
+\xff\xb4\xe9o\x92\xdf^\xb8\xf4\xd3W\x02\xf9\x81+H\
+\x00\x80H\x04\xbe\xfc\xc2c\x1f\xd3u\x05\x09\xf5\xa5\xb0\
+=\x04\x0a\x08\xfb\xa3\xb8\x000\xee\x12\x00\x18s\x09\xaa\
+X\x05\x1aU\x85`/\x88E[\xad\xbdF\xd1\x04\x1f\
+;\x85\xbeR\x09\x110_\xbb^s\xd7M\x13>\xab\
+\xf5\xe7a\xaa\x84\x5c/\xe5\x86\xe8\x88\xff\xd0\xdd{m\
+\xfd\x85O\x5cI\xe4\x07\xf6p/@\x1e\xf6-t\xce\
+?\xfb\x8d\x97N\x0e\xba\xde\xc2\x81\xb9}\xf7\x86\x14D\
+1\x01*8H\x08\xc8\xe1\x12r\x1d\x14\x8ez\x0a\x22\
+1(\x1e\x85\xa6\x93\x8b\xd2\x8bi\xd5\x9a%\xc1\x14\xfc\
+\xb1\x12am\x96\x0c\x03FQzZ\x12\x9f\xd0\xdb\xb5\
+\x99x\x18*\x95[\x1aCG\xfb\x95RPJ\xc5\x95\
+\x96\x94\x8a\xfa\xf0\xa9\xcd\xa1\x98!\x1c\xc3h>\xd1\x91\
+\xfa\x14\xca\xac\x03+\x1d\x03\x18Dg\xc6C\x82A\xc6\
+Y\xba\xa0\x08\x07j\x14\xf5/\xaa\xd9/\xc7{\x98\x94\
+G\x10r\x01*)$Uc\xe4\x8f\xae\x8f\x88\x87\xf9\
+\xbe\xb6\xfe\xc2'\xee8\xb6\xfc\x8f\x89\xf4.\xb7w\x07\
+\xa6\x8f+N\x00\x80H\x04\x82\xed\xf0\xcf/\xa8\x8d\xc3\
+\x8b\x9d\xc5{)%\xb1\x08h\x90\x10PC\x11\x90\x08\
+\xa3\xff\xca\x02k\xd0X\x98b \x85\x84\x14\x12\x84\xe9\
+\xd6/Ys\xaam\x01\xa0\x94d\x92\xdf$\xfc\x14\xb2\
+\x8d\x13\xad\xbe\x94\x02\x84\xd08\x9dWeX\x04\xfas\
+\xe2)\x90\x0e\x8f\xd7%\xb6\xd5i\xba\x19 5\x8d\x09\
+\x9d\x12\xcc\xa3)a\x10\x1a)\xf7\xee\xd0\xb0\xe5|\xb8\
+\xbe \x06\xe0\x80\xc6\xa5\xc14\xb4\xd9/\xa9\x02\x95\x14\
+\x19\xe5*\xe3\xd6\xdf\xeb\x93\x98\xfc{9\xda\x9f\x87+\
+\xca\x050\xa1\x93\x85^>\xff\xcao\x8bay_a\
+';j\xe9\x00p\xbc\xa8\xc7\x00\x00@\xfa\x08\x14\x12\
+K\x150[%\xe2\x07f\xd7bY/C\x9bh3\
+\x98W\x04\x93\xfc\x9c\x10\xd8\xc34\xectT\xdf|\x9f\
+&\xbf\x8e\x01dAg\xfa\x99K\x19\xd4`\x14\xf0\xd3\
+\xad\x7f\x16\x5cP\x0c\x062^\xca\x02\x80^\xcazP\
+\x15\xdc\x89\xbe\xf0\x11\x08\x09\xe2[\xbd\x17\xce\xfc\xe6'\
+\xafT\xf2\x03W\xa8\x05\xa0\xc1)\xedu\xd5\xca\x1f\x9f\
+\xf7_\xbf\xe1\xc8\xbe\x95\x1bB\xa9:iK@\x02`\
+\x02\x88W\x91pX\xed1r\x07\x18\x89\x84\xa0\xc82\
+\xd0\xad\xbf\xf9\x9a\xb2d\xdc \xb6\x12\x14\x85\x0cCP\
+6\xac:\x9c\xe1&\xe8\xf5\xdab\xc8\xda&\xdd\xc2O\
+\xa3\x95\xcf\x82&\xbfn\xed\xd90mW\x17\xfd4M\
+\x7f\xdd\xc2\x13O\xc5-8\xb1(T?\x04\xb59\x10\
+\xca1\x93\xbfRA\x8f\xf4\xb52\xbb{yd\xf6\xeb\
+\x16\x9f\x83\xc4\xff\xf5\xeb\xd2\x01CE\x10\xa3s\xd5\x16\
+\x80\x10\xa3\xfdi\xf2\x9f\xbb\xe0\xf5n\xba\x91\xfd\xe8\xf2\
+\xca\x0d\x9f\xb8R\xc9\x0f\x5c\xe1\x02\x00\x00B\xf4\x83\xae\
+Z\xf9c\xea/\x9c\xe1b\xfb\xdd.\xb7l\xdf\x0a\x89\
+#y\xac\xed\x12\x11\xe7\xed\xb4\x10\xc0\x82\xe5\xf7A\xb9\
+\x85@E\xdbI\xa0\x92\x9b\xa0D\xceFC\xa6jW\
+!\x12\x0a\x19\xbf\xd7\x02\x01eA\x86\x0aJ\xd1ay\
+\xf0\x9d'\xfb\xf8\xa9\x87P\x86/\x0f \x16\x00_\x84\
+\x09\xb2S{d\xe6\x13\x8b\x02at\xd2\xf1\xebp\xf4\
+#\x12\x220t\x03\xaa\x9a\xfc\x9a\xfc\x03H\x84P\xb0\
+8\x01\xc2$\xe1M\x0c \xe1r\xda\x5c\x04\x86\xf75\
+\xe4\x02\xa2G\xc0\x19I\x0a@\x18\xa0\xbf\xa9\x9e?\xfb\
+\xed\x7f\xf7\xa3\xdd\xf9\xb9\xdf\x17\xa2\xbf\xf3s\x9b\xb7\x88\
++^\x00\x80H\x04\xb6\xfb\x17\xbf\xf6\x17_\xfa/_\
+?~\xe7\x1b\xef\xb5%\xf6\x0fxHLK\x00\x18\x09\
+A\xbc\x88\x10\xb4\x03P/\x84`Vb\xbb\xaaBP\
+\x861\xa1\xd0\xec\x1e\xfeO\x94)\x9f\x22\x94\x0c\x81T\
+Yt%\xc3\xf8\xbd/\xc2\xb8\x85O\xa4\xf3\x12\x82\xd0\
+\x8c\xf6k\x02\xa7\xce;\x8b\xf8\x09\x0c\x05\xc0\xb4\x16\xaa\
+\x80p\xc4\x84\x0f\xa1\xc0\xc3\xe2\x9b\x12\x0eTc\xf2\x9b\
+\xe6\xbf\xf6\xfb\xd3\xad\xff\xf6\x86|\xfe\xc2\xf6W\xfe\x87\
+\xdbn\xbe\xfd\xb1\x89n\xc8\x1e\xc1U!\x00\x1a\x07\x0f\
+\xbc\xe1\x1bO=\xfb\xe2\x9f\x0e\xba\xde\xc2u\x9d\xe5{\
+(\x18a\x04\x85E\x9ee8\x14\x06\x11B\xa5j\xd5\
+\xb5%\x02i\x10\xa3f\x000\x22gzi\x22\x0e\x9a\
+\xd4\xe9}\x06\x0a\xe0\x8c'\xd7\x03\x08\xa4\x840L\x0e\
+s\xf6^ \x19\xd57\xeb\x1c$\x8e\xd9\x0f\x81PB\
+9\xf9-{\xdc\x03P\xf7\xf7\x18\xe6\x7fV\x8b\x9fF\
+\xc8\x87\x91\xff\x1a\x035\x95G\x12\xa6?0N|\xe1\
+\xd1\xde\x0b\xaf\x9f\xfe\xa5\xc5}\xe7\x1f\xde\xbf8\xf7R\
+\xfd_\xb27qU\x09\x000\xea!X\x5cY$\xa4\
+G\xef\xa2\x16\xed0\x12\x11Y\x02\xb0\x8c\xd7i\xe4\x89\
+@\xebB06A\x89\xcc\xdd\xae\xeeB\xf4|\x07\x9a\
+\xe0C\xd7F\x07\xf2\x02)\xe3\xb8G\xd6Q-\xca\xc0\
+(M\x88\x02\x11\xc3\x16\xde\xbc.R\x00\x03\x994\xff\
+[N\x0bP\x0d\xe6\xe2\xd3\xb1\x01'\xa4\xe0\xc3b\x1f\
+\x85\xc7\xc8\x09\xfai\x01\xe8\x0b\x1f\x1b\x97\xc5\xf3\xd7\x1f\
+\xc5O\xcdw\xd5\xaf^i\xdd|e\xb8\xea\x04\x00\x88\
+\x82\x83\x1b\x976\xfe\xd8q\x0e\xbcf\xcd\x85\xc7)\x09\
+\xf7C1b\x12\xb9\x8e\x08X\xd3\x08\xf2\xe78\xfc$\
+UQ(\xbd\xe4\x89\x85\xfe^\xb4\xebQ\xf3\xc7\x19\x8f\
+\xfd\xf8P\x07\xee\x8c\xfdY\x94%\xc8\xae\xb7e\x94B\
+\x11\x12Y\x00\x02Q@o\x18\xe0\x8b\x83{@\xbe\xc9\
+?\xe9\xe5\xa9I~\x1d#p\x064\xe1&\x14\x09@\
+\x1e\xf9=\xa3\x22\xdd\xda%\xff\xf9\x97^\xfd\xd4O^\
+\x0d\xfe~\x16\xaeJ\x01\xd0\xd8\xee_\xfc\xdaS\xcf\xbe\
+\xf8\xa7\x07\xac[\xdf\xec,\x0e\xaecT(\xa8Q[\
+\x9e\xf7\xe8\x9a\x22\x90&\xbfn9\xa7\xe1\x1a\x00\xc84\
+\xffM_\xbd\xc8Z\xd0\xdb\x98B\xa1\xd7\xe5e\xf3\xa5\
+[{S,T?L\xb4\xea\x8a\xd5\xf3\xdfk\xfd\xec\
+\x01\x80\xd0\x98\x19\xaef\xad\x95\xb8W \x15#\xd0\xc1\
+\xc2\xb45\x90E~\xcf\x97q\xcb?\xe8\xab\xde\xd7\xbf\
+\xfd\xf5_Z\xdcw\xfe\xe1\xeb\x0e\xdd\xf8\xe4t~\xf5\
+\xee\xe3\xaa\x16\x00 r\x09.\x0e\xce~\xee\x82\xda8\
+\xbc\xacV\x8fQ\x8bv\xf4gEm\x17\x11a$\x04\
+a\x14 \xd4f\xb3\xf9\xdd*]\x88\x8d\x91\xb2\x10\xd2\
+\x02\x90e)D\x1f\x87\x08\xa4\x8c]\x17\xa1\x22\x1f_\
+)\x05\x0e\x05F\x19\x88\x12\xb1\x15@\x09\x819\xab]\
+\x1c\xf4K\xf5\xb5\xeb\x81<\xd3\x10\x005\x00\x88\x9b\x9a\
+\x16\xb2\x86\x00\x98\x99\x80EA\xc2\x84\x08\xa4|~\xb3\
+\xd5\x7f\xfdb\xff\xaa5\xf9\xd3\xb8\xea\x05\x00\x88\x5c\x02\
+6\xc0g\xff\xfc\xcb\x8f<w\xfc\xae{\xee\xd1.A\
+Y\x80P\x83\x88\x10\x5c\x84\xa0\xdcJlov3N\
+\xcd\x22\xd0P2\xf6\xdf\xf5\xfb\xf4\xa2\x89\x9f\x07\x09\x80\
+\x0e\xb7\x10\xc3h\xbf~\xaf\x86\xd1y\xce\xd50(:\
+$}*{oj~\xfe\xb0\xe2\x07\xe1\xf5\xcd\xff\xd8\
+\xef\x1f\x94\x07M9\x08\xc2Ta\x8f4\xf9\xaff\x93\
+?\x8dkB\x004\xcc^\x82\xaet\xee\xb6m\x9bV\
+\xf5`%\x90)\x02\xe6\xe7S\x09\x18\xa6\x8eQ\xb4o\
+\xf3\xbc\xf2\x82\x9d\x8cD]e\x96E\xa0<\x15\x8f\x9d\
+\xd0\x10l\xd4\xd2\xeb\xfe{\xddu\xd7&\xf9\xb5\xc9?\
+\x86\x06e\x169\x08\xd8\xa0\xfc\xa2\x0f<\x850\xf5\x1b\
+4\xf9\x07}\xd5\xfb\xeas\xbf\xfe\xa9\xd5\xc3\x9d\x1f\xb8\
+\x9aM\xfe4\xae\xd8T\xe0\xa68vd\xe5\xe4B\x7f\
+\xe5\x7f\xfd\xe3\xff\xf2\x1b?\xa6Xx\xd2f~%\x0d\
+\xd0\xb1\x00\xea\xf5A\xbd~\xe1\xb6US\x8c\xeb\xa2i\
+02\x9dr\xcb\xdd\xea;j\x92\xb9W\x86&\xd1\xfd\
+I\xf77\xc8\xf8\x1d\x9a\xfc\xaf_\xec?\xff\xf4\xe9_\
+\xff\x81\x13w<\xf4#W\xd2H\xbe6@\xde\xf8\xf0\
+?\xdf\xeds\xd85\x0cDx\xe0\xd6\xe37\xfe$\xe9\
+\x07\x7f\xc7\x99\xeb,\xf8\xc2\xa6\x16\xa9G`\xe9t2\
+\xd7k\xb2\x06jJ\xbd\x08\x190\xcf\xdb<\xbe~o\
+\x9eK8\xd8\xdd\xc9?'\x15\x81:\xdf\x1fx\x0a6\
+\xa1\x02\x00\xfc\xe1\xfc\xef\x9e/\xf1\xfa\xc5\xfe\xf3\x8b\xab\
+\xfe\xafl\x0f^\xfa\xddk\x8d\xf8\x1a\xd7\x94\x0b\x90\x86\
+\xee.|\xe6\xf4+\x8f\x0c\xba\xde\xc2\xfc\xd0-`\x05\
+\xb9\x02i\xe8`a\xba\xfbP\x9b\xea\x12\xed\xba\x07f\
+\xca\xb2\xb9?M\xf48U\x97\xeb\xc9Q\x10\x9b\xfa\x96\
+E\x10\x0e\x14\xd2\xd5\xcc\xb9K\xb0\x93\x93\x17\xed4\xf9\
+\x01@O\xf5\x01\x00\xeb\xeb\xa2w\xee\xf2+\xbf\xb3\xd6\
+\xfb\xfa\x8f/v\x83G8\xa5\xbd\x9d\xfb\xf5{\x0b\xd7\
+\x9c\x0b\x90\x05\xed\x16\xa8p\xfeo+\x16\x9e\x14\xba\x00\
+dM\xb2j\xf7\x80x*JI5Z\xd9\xb4\xeb\xa0\
+\x09\xabG%\xeam\xcdV\x5c\xaf7G.\xe6\x8d\xa0\
+\xb3H\xf2|\xf5\xf1\xf5~\x95Cr-\x9b\x9d\xb4\x06\
+\xda6\xff\xf30\xf0T\xa6\xd9\xcf!\xbf\xf4\xf4\xe9_\
+\xff\x81\xc5}\x9b\x0f\xef\x95\xe9\xb9v\x13\xd7\xb4\x05`\
+B\x8f'x\xea\xd9\x17\xff\xf4\xe8\xcd+\xdb\xb2\xdf\xbb\
+\x9bY\xae[\xd5\x12\xd0P\xa9\xfaST\x0c@\x841\
+\xabL\x18B\x86\x1c\xe0$\xb1_\x22\xa2`\x1c\x11Q\
+ .\xb6B\xc2Q@.\xddJ\x9b-}V\xcb\x9e\
+\xdevZ}\xf8\x99\xd7A\x07\xf9\x8c\xe8~t\xa2-\
+\xec\xb7\x04Y\xc4\x7f\xf9\xec\xf6\xf3\xab\x07\xd4O\x9cY\
+{\xf6\xff\xb9\x96\x82|e\x98\x09@\x0a\xfb\x16:\xe7\
+c\xb7`\xae7\xbfD\xf8\x8d\xf6P\x08\xaa\x88\x01A\
+\x98X\xd2\xd0\x02\xa1\x09\xa9\x05\x22\xf1\x1d\xc1Ayd\
+\xaes\x97\x80\xf2\xd1\x92&\xb9\xden\xaf\x81\xa4\xf3\xf1\
+\xd3\x85\xfd+\x22-$e\x90>\x11\xda\xd4\x07\x22\xe2\
+?}\xfa\xdf|v\xf5p\xe7\x07\xbc\xc1\xa5\xbf\xb8\x96\
+\xcd\xfd,\x5c\xd3A\xc0*8sv\xed\xc4\x91;W\
+~\xea\x96\xee\xa1\x0f3\xba\xb4\xc4\x9cfQ~\x05\x17\
+\xc4\xa8N\x11\x0bAN\xc5\x0a\xfd9wGB\xb0\x17\
+\x89\x9ey\xee-\x9a\xf9\xb5S\x82\x87\xad\xff\xfa\xba\xe8\
+=\x7f\xe1\xeb\xbfF\xd5\xc5O\xceL\xfd|\xcc\x04\xa0\
+\x22\xb2\x84\x00\xa8.\x06y\x84/[\x7f%Ag\xf4\
+\xe9\xd7m\xec\xaf\x0e\xa4O\xc4\x0b\xafm~\xf3\x5c\xef\
+[\x8f\xcc\x88_\x0d3\x17\xa0\x22\xf6-t\xce\xb3\x01\
+>\xfb\xcc\xe9W\x1e\xf1\x97z\xf3\xfb\x17\x96\xb8\x1c\xd0\
+\x83\x9c\x03e\xeeA\x94\x94\x13B\x0cG\xb5\x9b\x88\xde\
+s \xf5\xd9h\xfd\xdeA:_?\xd3<oh\xea\
+g\x1d\xa7\x0c\xd2'B\x09\xa2\x94 J\x84\xe2/\xff\
+\xebW\xff\xd5\x1f\x854\xf8{7\x1e\xe9\xfc\xce\xbe\x85\
+\xce5\xd9\xadW\x173\x0b\xa0!\xce\x9c];\xf1\x8e\
+\x87\xee\xfda\x9b\xd9\x1f\x90=~\x829\x80\xf0\x00m\
+\x19h\xf8*j\x12m2\xa8m-\xd4\x81=\x9c\x1c\
+A\x1fO\x83`\xd0\xba51\x8dH~\x93}J\x9f\
+\x08\xa9\xc2\xaf\xc0\x0d~\xe5\xcc\xb9S\xff\xf9Z\xed\xcb\
+\x9f\x043\x01\x98\x10g\xce\xae\x9dx\xeb\xdd\x0f>\xd0\
+\x99\xc3\x0f\x22\x10o\x06c\xcbi\x110Q$\x02\xe9\
+$\xa4,\xe2jW!\xfdY\x9e\x00h\xe1Io\x9f\
+\xe7r$\xea\xef\xb5h\xcegA\xbb\x0cu\xf7\xaf|\
+\xf2\xcd\xaf~\xf3\xe2\xf9\xb5\x0b\x9f\xfe\xf9\x07\xee\xff\xd0\
+\xa3WrM\xbe\xdd\xc6L\x00Z\x82\xe3\xac\xcc=\xf9\
+W\x9f\x7f\xefmo\x7f\xe8#w\x1c\xbc\xf9M\xfev\
+x\x82\x13w\xcc\x22\x10\x1e \x15\x05\x9cq\x87\xa1j\
+\x16\xa2\xd9\xdf\xef\xab\xf1\xe0b\xba\xd5\xb7\xc9 !\x0c\
+\x9ap\x94\xf8\x89\xf3PpA<\x1fR\xd9S\xbbN\
+M\xe2\x04\xd2\x8f:0\xa5\x0a\xbf\xf2\xc4\x8b\xa7\xfe\xbc\
+\xb7\xf6\xd8\x9f\xcd\x88\xdf\x0ef\x020\x05h\xab\xe0\x15\
+q\xfa\xbd:h\x98\xb5\x9dT\x14\x96+\xc7\xd2\x85\xcb\
+\xac\x04\x13\x9a\xd8Y-\xba\x1a\x00\xd4M\xae\x97\x83\x91\
+\x10P2>\x8b\x91Tv\xbc~\x1aB\xd0\x84\xf4\xaf\
+X'\xbf\xf1\xfc\x17\x1f\xff\xcc-\xb7?\xf8\xc5\x99\x99\
+\xdf.f\x020E8\xce\xca\xdc\xe9\x97^\xb8\xb1\x8a\
+\x18\x00C\xcb`l'rl\x5c\x81\xaf\xdc\xd8\xe4O\
+\xbb\x0c\xc4\xf3S\xfbL\x928M\xfa2\x92\xb7!\x06\
+uL}\xe9\x13A\x803/\xf1\xa7\x1f\x9f\x91~\xfa\
+\x98\x09\xc0\x0e!-\x06w\x1c\xbc\xf9M\xe1\xb6}\x82\
+\x92\xa4+\x90)\x02)X\xee\xb0\xde_\x85\xf1\xefU\
+\x05 \x8f\xe8\xe6\xf6uD\xa0\x8e_\xaf\x83yO}\
+k\x1do\xbc\xb3\xfb+_~\xf6\x89'g]x;\
+\x83\x99\x00\xec\x12\xce\x9c];\xb1\xf1\xfa\x13\xef\xbc\xfd\
+;?\xf0\x1dw\x1c\xbc\xf9M\xc1\xd6\xf6QB\x96\x97\
+(\x91\x95D`\xa7QF\xfe\xba\x84'\xc0\x99\xaf~\
+\xf3\xe2\xf9\xb5\xb5O?\x0b\x89Gf-\xfd\xee`&\
+\x00{\x00i\xeb\xe0\x86\xe0\xc4\xed\xf6\xd2\x85;\x08Y\
+^\x9a|\xef\xedA\xf4\xed\xd8\x94\xaf\x13\xc8\xd3\x84\x17\
+*<\xaf\xfd\xf9\xf9\xe5\xbb^8~\xe3\xad/\xcd\x02\
+y\xbb\x8b\x99\x00\xecAhA\xd8\xbat\xea\xd6{\xef\
+\xfb\xfe\x1b\xfbs\xaf>pCp\xe2vF\xf8\x01{\
+akYRk\xb9l\x1f:\x98g\x06\xf5\xaaB\xf4\
+\xa3\xd6^\x93\x9c\x12?^W\x06\xcb\xd9\xbe\xe4o\xce\
+_\xd2d\xbf\x81\x1d\x7f\xf4O\x1e\xfb\xe4\xc6\x8c\xf0{\
+\x133\x01\xb8B`\x8a\xc2\xbb\xdf\xf9\xf0\xa2\xb5\xafw\
+\xcf7/\xbez\xe8\x86\xe0\xc4\xeds\xd7\xf7\xe7\x07\xaf\
+-tLq(\xf2\xe5E\xdf\x06\xeb\xf8\xf1\xeb:\x90\
+>\x11\xce\xc2\xd6\x86&\xf9S\xdfZ\xc7\xea\xf1W\xbf\
+\xf1\xfc\x13\x8f\x07\xef~\xc7\xc3\x7f\xfa'\x8f}r\xe3\
+\x96\xdb\x1f\xfc\xe2R\xf7`oF\xf6\xbd\x8f\x99\x00\x5c\
+\xe1p\x9c\x95\xb9\xf5\xde\xb9\xee\xeb\xe76\x0e\x02\x80\x16\
+\x88\x0b\x1b\xbd\x95\xaf=\xf3\xe9{n{\xf0\xa1\xb8J\
+\xc9\xc5\xd3Go\x7f\xe3M\xe5^\x85&5\x00<\xff\
+\xc4\xe3\x01\x00\xbc\xfb\x1d\x0f\xff)\x00\xe8\xd6\x1c\x00\x0e\
+\x1d\x5c<7#\xfa\x95\x8d\x99\x00\x5cCp\x9c\x95\xb9\
+*\xdb\xcd\x08}\xed`o\x8d6\x99a\xaa\x98\x11{\
+\x864\xf6^\x7f\xd3\x0c3\xcc\xb0c\x98\x09\xc0\x0c3\
+\x5c\xc3\x98\x09\xc0\x0c3\x5c\xc3\xf8\xff\x01\xd1\xc6K\x0c\
+Dn\x85\x9b\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x08\x02\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x07\xb4IDATx\x9c\xd5\
+\x9bm\x8c]E\x19\xc7\x7f=nH\xb3\x9aJ\xb4i\
+pcH\xd3T\x03\xb8\xb6\x81\x10\x83\xa8\xe4@\x1aP\
+Q\xa2e)\x02\x16\x01\xc1b\x8a\x81\x86\x0f\x1b\xd3\xd4\
+\xfc#!\x08Z\x89\x02)%\x22\x04\x0b-\xd0\xb4\xbc\
+\xca;\x9e\x90\xa2~0\xb8\xd6\xfa\x82\xd9\xd4\xb5n\xcc\
+\x86,\xb5Q\xd3\xdcl\x9a\x8d\x1f\x9e\xb9\xbbg\xe7\xcc\
+\xb9\xf7\x9c{\xceY\xaf\xbf\xe4~\xb8s\xe6\xcc\xcc\xf3\
+\x9c\x99g\x9e\x99yf\x09\x0d#i)0\x0c\x9c\x0d\
+|\x0cX\x05\x9c\x0a\x0c\x02\xb3\xc0\x0c\xd0\x02\xfe\x03\x1c\
+\x03&\x81\xdf\x03o\x01c\x92f\x9al\xdf\x92&\x0a\
+\x954\x04\x8c\x00\x9f\x03\xce\xc3\x84\xed\x85\xe3\xc0\x1b\xc0\
+\xb3\xc0S\x92\xfeQO\x0b\xe7\xa9M\x01\x92\x06\x80K\
+\x80M\xc0\x05\xc0@]e;N\x00\xaf\x03;\x81g\
+$\x9d\xa8\xa3\xd0\xca\x0ap\x82_\x03\x8c\x02\xab\xab\x96\
+W\x90q\xe0\x0e\xe0\x91\xaa\x8a\xa8\xa4\x00I\x9f\x07\xb6\
+\x03\xa7\x95x\xad\x05\xbc\x03Lc]<\xc2\x86\xc8r\
+`\x05pR\x89\xb2\xfe\x0cl\x91\xf4b\x89w\x16\xd0\
+\x93\x02$\xad\x00\xee\x06\xae\xec\x92u\x16k\xe4\xcb\xc0\
+\xaf0\xc36\x91\xf7\xd5$\x9d\x84\x19\xc85\xc0'\x81\
+\x0b1\x03\x1au\xa9g\x0f\xf0-I\xd3EehS\
+Z\x01\x92\xce\x03v\x03C\x1d\xb2\x1d\x01\x1e\x06\x1e\x95\
+\xf4\x97\xb2ux\xf5\xad\xc6\x14\xfduL9yL\x02\
+WIz\xa3L\xf9\xa5\x14 \xe9\x16\xe0\xfb\xe4\x1b\xb8\
+?\x02\xb7\x03{\xeb\x9e\xbe\x5c\xef\xd8\x00l%\x7f\xc8\
+\xcd\x00\xb7J\xba\xb7h\xb9\x85\x14 )\xc2\xc6\xfa-\
+9Y\xa6]\xc3~Z\x97u\xee\xd0\x96\x01\xe0zL\
+\xd1\x1f\xc8\xc9\xf6\x03`T\xd2l\xb7\xf2\xba*\xc0\x09\
+\xbf\x03\xf8FN\x96\xbd\xc0fI\xeft+\xabN$\
+\x9d\x02\xdc\x07\xac\xcf\xc9r/ps7%\x14\x99\xab\
+\xb7\x13\x16\xbe\x85Y\xe0\xfb\x0b\x94Q;\x92\xa6\x80K\
+%\xdd\x08\xfc\x88\xec\xecq\x13\xe6]~\xbbS9\x1d\
+{\x80\x1b\xf3w\x07\x1e\x1d\x05\xbe\x5c\xd6\xe04\x853\
+\xcc\xfb\x09\x0f\x89M\x92\x1e\xc8{7W\x01\x92\xd6\x01\
+/\x90\xed%S\xc0E\x92\x0e\xf6\xd0\xd6\xc6\x90\xb4\x06\
+x\x098\xc5{4\x03\x9c/\xe9\x97\xa1\xf7\x82\x0ap\
+\xf3\xfc\xef\x02\x85\x1du\x85\xf5\x95\xf0m$\x0d\x03\xbf\
+\xc0\x9c\xaa4G\x803%\x1d\xf5\xdf\xc9s0v\x90\
+\x15\xbe\x85u\xfb\xbe\x14\x1e@\xd2!\xe0R\xac\xadi\
+N%<\x94yO\xa0\x90K\x80\xef\x06\xf2n\x96\xb4\
+\xafj#\x9b&I\x92\xbf\xc5q\xfc.\xf0\x05\xef\xd1\
+\xda8\x8e\xdfL\x92\xe4p:q\xc1\x10p\xce\xc6\x1f\
+\xc8.j\xf6J\xba\xac\xf6\xd66\x88\xa4'\xb1%y\
+\x9aC\xd8P\x98\xf3U|\x03w=Y\xe1\xa7\x81o\
+\xd6\xd8\xb0\x08X\xda!K\xab\x88\x03S\x80\xcd@\xcc\
+B{0\x8c\xb9\xd5\x8f\xb4\x13\xe6l\x80\xfb\xfa\xa3\x81\
+\x82F{Ydt \x02\x1e\x02\xfe\x99\xf3\xdb\xed\xda\
+R\x09\xe7\x98m\x0b<\xda\xea>\xc2\x5cc\xda\x8c\x90\
+]l\x1c$\xa5\xad:p\xddo#\xf0s\xccy\xf1\
+\x7f\x1b\x80\x9f\xd5\xa1\x04\xe0'\xd8j4\xcdGI\xd9\
+\x87\xb4\x026\x05\x0a\xb8\xad\x09\xdf\xde-\x94.\x07\x9e\
+\xca\xc9\xb2\x01[IVR\x82k\xfb\xed\x81Gs\xb2\
+F.\xe3*\xe0\xd3^\xa6\xc3\x1d\x1aX\x99\x02J\x18\
+\xa1\x06%\x00O`K\xe54\x17\xba\xb5\xc4\x5c\x0fX\
+O\xd6'xh\x11Vv\x8d+\xc1\xd5\xf1\xb0\x97<\
+\x00|\x09\xe6\x85\xfe\xa2\x97a\x16\xd8\xd5k\xa5eX\
+\xa4\x9e\xb0;\x90v1\xc0\x12I\xef\x03\xdee\xe1j\
+\xea\xa0\xa4\xb5\x15*,\x8d\x13\xf0q\xdc\x97\x09\xb0\x17\
+\xdb\xf1\xe9i\xa3E\xd2\xdb\x98\x01l\xf3/\xe0\x83\x11\
+v`\xe1k\xf7\xe5^*\xa9\xc2\x22\xf4\x84W\xbd\xff\
+\xcb\x80\xe1\x088+\x90\xf9\xcd\x1e+\xa9DA%\xf4\
+:E\x86d:+\x02>\x1ex0\xd6C\x05\xb5\xd0\
+\xe0\x14\x19\x92\xe9\xf4\x01\xb2\xce\xcfql\xf9\xd8\x15I\
+\xdf\xc1\x8e\xbf\x9a\xa0\x93\x80#\xae\xfe26\xe10v\
+\xba\x94v\xffW\x0e\x00'{\x19\xa7J\xf8\xe2\x1f\x01\
+\xce)\x98\xb7nJ)AR\xcb\xb9\xc7\xe9\xed\xfc\xa1\
+\xf6\xa9L\x9a:\xfd\xfe\xa6i\x1b\xc6\xa2\xe7\x90\xc7\xbc\
+\xff\xcb\x22\xb2]\xcd\xdfL\xe8wF\xb0\x05T\x11%\
+\xf8=e0\xa2\xfb\xb1\xd3\xff\x03={\xac\x11Y\xad\
+tZ\xab\xf7#{\x80\x8d\x05\xddv\x7f\xb8\xcfDd\
+\xbb|\xdeiK?RFx\xc8n\x96\x1e\x1b\xc0v\
+z\xd3\x0cI\x8a\x0a\xce\x04\xd3\xc0D\xc1\xca\xcb\x12\xd1\
+\xf90\xb4\x94\xf0\xce\xe5\xcf\xccx\x03X\xb0A\x9cJ\
+\x1ct\x15O\x14(t\x0b\xb0\xa5H\x03\xca\xe0vl\
+\xee\x03n\xcc\xc9R\xf6\xcb\x03\xac$k\xef&\x22l\
+\xff\xdfg\xb8D\xc1\xb5\xd2\x90\xf0`1\x07>\x7f\x8a\
+\x08\xbb\x88\x9f)Yx-4(<\xc0\xa7\x02i\x07\
+#\xe07\x98\xfb\x9b&\xee\xa1\x82J4,<\xc0:\
+\xef\x7f\x0b\x18\x8b$\xb5\x00\xff\xdc\xeclI\x1f\xee\xb1\
+\xa2\xd24-\xbc\xa4\xd3X\xb8\x17\x00p@R\xabm\
+\x14^\xf0\x1eFt\x8f\xff\xa9\x85E\xf8\xf2\x00W\x04\
+\xd2\x9e\x87y\xab\xf8\x04\xb6\x0d\x96\xe6\x86\x12>vO\
+,\x86\xf0n\xd9|\xb5\x97<\x0b\xec\x83\xf9]\xe1I\
+\xe0\x80\x97i5\xf9\xdbS\x95Y\xa4/\x0f\xb6\xe1\xbb\
+\xd2K{]\xd2\x11X8/\xee\x08\xbc\xbc-}\x8a\
+R\x17\x8b%\xbc\xeb\xc1[\x03\x8f\xe6dM\x0b\xb7\x8f\
+\xecF\xc8\x1a\x9a\xb1\x05\xdb\xb1\xe8\xd2V\xe0\xf7\x18\xf5\
+|y\xb0\xae\xef\xfb4\xe3\xc03\xed?\xe9\xb3\xc1\x19\
+\xd70\x9f;%\xd5\xbd>\x18\x05\xde\x9f\xf3\xabEx\
+I\xcb\xb1pZ\x9f;:\x9d\x0e?\x80\xb9\xb6+S\
+iCXp\xc1\xd7\xaa6*\xd5\xb8FC\xe0\x1d\xf7\
+`\xa1\xb7i\x0e\xe1\x9du.\x08\x90H\x92\xe4D\x1c\
+\xc7\x7f\xc76%\xd3\xac\x8d\xe3\xf8\xafI\x92\x84\xdc\xe6\
+\xbeC\xd2u\x84\xc7\xfeU\x92\xc6\xd3\x09y1BO\
+c\xa1\xefi\x8ec\xc1Q\xfel\xd1WH:\x17x\
+\x8d\xec\xbe\xc6.I\x1b\xfd\xfcy\x16~\x13\x16\x0d\x96\
+f\x10\xd8\xef\xbc\xaa\xbeD\xd2\x19X\xb8\x9c/\xfc$\
+ps\xe8\x9d\xa0\x02dA\x88\x1b\xc9n5-\x07^\
+\xe9G%8\xe1_\x22;\xeeg\x80\xcb\x15\x88\x10\x83\
+@\x90T\x9b$I\x0e\xc7q\xfco\xe0\xb3\xde\xa3e\
+\xc0\x868\x8e\x0f$I\xe2\x1f;\xffO\x90t\x0e\xf0\
+\x22\xf0\xa1\xc0\xe3\x9b$\xed\xcf{7W\x01\x00I\x92\
+\xfc:\x8e\xe3\x93\xc9\xee\xfd\xbf\x17\xb82\x8e\xe3\xa9$\
+I~[\xb6\xc1u\x22\xe9\x1a\xe0Il\x0a\xf5\xb9K\
+\xd2\xf7:\xbd_\xc4\xd7\xbf\x15\x1b\xff~\xbc\xf0 \xf0\
+\xa0\xa4\xf3\xb1\xa0\xe4`\x17k\x0a\xe7\x9b\xdcC\xbe\xa3\
+v?]\xe2\x84\xa1\xbep\xf9)\xcc\xb9\xd9U\xe2T\
+\xa9'\x5c[\xbe\x8a\xdd[\xf0\xc7{\x9b\x1fc\x81\xdc\
+\xd5\xc3\xe5\xbd\xca\xbb]\x98\x18\x03n\xa3\xc6[]\xa9\
+\xba\xdbQ\x1d\xdb\x08oo\x81\x19\xedQI?,Z\
+n/Wf.\x00\x1e%\x1bJ\x9bf\x1cx\x10\xd8\
+#i\xa2l\x1d^}\xab\xb0n~-v\xe92\x8f\
+)\xcc\x8d\xf6\xe3\x00:R\xe5\xd2\xd4N\xba/\x97g\
+\xb1^\xf1*vij\x0c\x98\xcc\xeb\x1dn\xed\xbe\x8a\
+\xf9KS\xeb\x803\xe8~z\xd5\xf3\xa5\x8d\xaa\xd7\xe6\
+\xd6cC\xa2\xd3\x97\xf1i_\x9b;\xca\xfc\xa9T\xfb\
+\xda\xdcr\xca]\xb8\x1c\xc7\xc6\xfas%\xdeY@\x1d\
+\x17'\x97b3\xc4(\x9do\x92\xd5\xc9\x04p'v\
+G\xa9\xd2\xc2\xaa\xce\xab\xb3K\x81\xaf\x007\x00\xe7\xd6\
+Un\x8aY\xec\x1e\xf1N`_]+\xca\xa6.O\
+\xaf\xc6\x8e\xad/\x06>A\xb9\xdb\xa0i\xda;\xd6\xcf\
+cBO\xd4\xd2\xc0\x14\x8d( \x8d\xa4A,\x12m\
+\x0dp:v\xec\xb6\x02;\xa7k+\xa6\x85\x85\xadM\
+a\xdd\xfbm\xcc`\xbe\xe5\xb6\xed\x1b\xe3\xbfj\xb4\xb5\
+\x8d\x8da\xa4\x7f\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x08\x0c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x07\xbeIDATx\x9c\xd5\
+\x9b\x7f\xa8^u\x1d\xc7_;=\x5cF\x8c\xb1Ld\
+\x5cB\xc6\x08u#\xd6\xb0\x90\xe5\xfa\xe34L\x0c\xd3\
+J\xa7es\x96\xa6\xe5\xd2\xd5$B\xccF\xef(\xa9\
+\xd5\x86X\xa6K\xa8\x96\xb15\x87\x0c\xcbZ\xa4\x96G\
++0\xb1y+\xab1\xd4\xd6\x18\x971\xe4.$l\
+<\xdc\x1e\xfa\xe3\xf3}\xb6\xf3|\xcf\xf7<\xcf\xf9\xb9\
+\xfb\xec\x0d\x0f\xdc\xfb\xfd\x9e\xf3\xf9~>\x9fs\xbe\x9f\
+\xf3\xf9\xf5\x9dG\xcb\x904\x01\xbc\x03\xb8\x10X\x06\xbc\
+\x1d8\x17X\x08\xf4\x80.p\x02\xf8\x0f0\x03L\x03\
+\x7f\x03\xf6\x03S\x92N\xb4\xc9\xdf\xbc6\x88J:\x17\
+\xf80p\x05p1\xf0\xe6\x8a\xa4N\x00\xbf\x07~\x09\
+\xec\x95t\xb8\x19\x0eO\xa11\x05H\xea\x00W\x02\x1b\
+\x805@\xd4\x14m\x87\x1e\x90\x00\xdf\xc7\x941\xdb\x04\
+\xd1\xda\x0ap\x82\xdf\x00\xdc\x85\xbd\xde\xa7\x03\x87\x80o\
+\x00;$u\xeb\x10\xaa\xa5\x00I\x97\x02\xf7\x02\xcbK\
+\xdc\xd6\x05\x8e\x02\xffv\x7fG\xc0\x04\xb0\x08X\x0ct\
+J\xd0:\x08\xdc!i_\x89{\x06PI\x01\x92\xce\
+\x02\xee\x03\xae/p\xf9A\xe0\x09\xe0\x0f\x98a;\x94\
+\xf7\xd4$\xcd\x07\x96\x02+\x80\xd5\xc0%\xc0y\x8c\xde\
+N\xbb\x81\x8d\x92^+$@\x0a\xa5\x15 \xe9b\xe0\
+\xa7\x98%\xcf\xc34\xb0\x03\xd8)\xe9\xefe\xd7\xf0\xd6\
+;\x0fX\x07\xdc\x04\xbcm\xc4\x9a\xd7Iz\xb6\x0c\xfd\
+R\x0a\x90\xf4i\xe0\xbb\xd8+\x1b\xc2\x01\xe0\x1e`O\
+\xdd\xbd\x19X{\x02X\x0bl\x06.\xc8\xb9\xac\x0b|\
+^\xd2\xf6\xa2t\x0b)@R\x04|\x0d\xf8R\xce%\
+3\x8e\xb1\x87\x9a\xb2\xceCx\xe9\x00\x9f\xc4\x8c\xe0\xd9\
+9\x97}\x0b\xb8KRo\x14\xbd\x91\x0ap\xc2o\x03\
+6\xe5\x5c\xf2\x18\xb0A\xd2\xd1Q\xb4\x9a\x84\xa4\xc5\xd8\
+\xdb\xb86\xe7\x92\xfb\xb1\xb7a\xa8\x12\x8aX\xdc\xaf\x12\
+\x16\xbe\x0b|A\xd2\xfd\x05h4\x0e\xa7\xf0k$\xdd\
+\x8e= \x7f[\xde\x0e\xbc\x01\xdc9\x8c\xce\x9bF,\
+r3\xb0505\x03\x5c!iOa\x8e[B\x92\
+$\xcf\xc7q\xfc,\xf0\x11`\xbe7\xbd:\x8e\xe3\xe3\
+I\x92\xfc1\xef\xfe\xdc- i\x15\xf0t\x80\xe81\
+\xe0\xfd\x92\xfeR\x91\xe7V i%\xf0+\xcc\x97H\
+c\x16\xe37\x09\xdd\x17T\x80\xa4E\xc0\x8b\xc0\x12o\
+j\x06x\xdf\xb8\x09\xdf\x87S\xc2\xd3\x98S\x95\xc64\
+\xf0\xae\x90\x9d\xcas0\xee%+|\x17\xb8z\x5c\x85\
+\x07\x904\x05|\x08\x0b\xa2\xd2\x98\xc4\x0cf\x06\x19\x1b\
+ i\x0d\xa6\x00\x1f\x9b\xc6a\xcf\x8fB\x92$\xff\x8a\
+\xe3\xf88p\xb97\xb5<\x8e\xe3?'Ir =\
+8\xb0\x05\xdc7\xf6E,~Oc\xaf\xa4\xab\x1b\xe7\
+\xb6EHz\x04\xb8\xd6\x1b~\x15X\x96v\xd2\xfc\xcf\
+\xe0\xf5d\x85\x9f\x01nk\x88\xa9~\xe0\x93\x87n\x11\
+\xe7\xa5 6bay\xdaYZ\x0a\xdc\x0a|\xa7?\
+p\xd2\x06\xb8\xa7\x7fw\x80\xd0\xe6&\x9c\x1cG\x7f'\
+p<\xe7\xf7\x13\xcaE\x82\xa3\xd6;F\xd8\x07\xb8\xd3\
+\xb9\xd5\xc0\xa0\x11\xbc\x92l<\x7f\x10x\xa8\x01f:\
+\x98\x80\x1f\xc3>\xab\xfe\xef\x09`]\xd3\xf1\x03\xf00\
+\xf0\x9276Ijk\xa4\x15\xf0\x99\x00\x81{\xea\xfa\
+\xf6\x9e\xf0!\xfc\x1c\xf3\xe8\x9a\x16\x1e\xc7\xfbW\x02S\
+\x1b\xfa\x7fD\xee\xc2I,\xf6Nc\x1a\x8b\xb3\xeb0\
+0g\xc2{k\xbc\xec\x8d\xad\x92\xb4\x14N\xbd\x01W\
+\x91\xf5\x09j\xa5\x9b\xc6D\xf8\xfe[\xf0\x03o8\xc2\
+m\x83\xbe\xd0\x1f\x08\xdc\xbb\xb3\xc6\xa2c!|\x0a\xbb\
+\xb1\xa4j\x1a\x97\x03\xccs\x16\xf18\x83\xa9\xeb\x03\x92\
+\x96UYi\x0c\x85\x07@\xd2\x9f\xb0\xdaD\x1f]\xe0\
+\xad\x11\x96\xd0\xf4\xf3\xf6OU\x5cd,\x85w\xf0e\
+\x9a\x00VE\x0cj\xa5\x8f\xdf\x95\xa5>\xe6\xc2CX\
+\xa6\x95\x11p~`\xa2T\xc0s\x06\x08\x0f0\x15\x18\
+{g\x87lvw\x16+<\x14B\x01\xe1\x01\xce\x01\
+~-\xa9(\xd92\xf8\x8d\xa4\xaf\x17\xb8n\x1a\xab?\
+.H\x8d-\xe9`\x9eQ\x1a3*X\x90,(<\
+\xc0\xaa\x22\xf4*\xa2\x90\x9b.\xa9'\xe9\x08\x83\x19\xe5\
+\xb3\x22\x065\x02V\xb1)B\xb0\xa8\xf0\xe3\x04\xbfp\
+2?\xa4\x80\x91O\xff\x0c\x15\x1e,I\x9aF\x14\x91\
+u\x10\x8a\x86\xa3\x8dEns\x89\x083zi\xf8I\
+\xd0\x0c\x9c{y\x1d\xf0h\x1bL\xb5\x88L\x9fBD\
+v\xcf\xe7U[\x06\xe0\x94\xb0\x8e3K\x09~\xb2\xf4\
+D\x84\xa5\xb9\x07.\x92T\xa8\xa3\xc3}\xd7\x8b(a\
+\x1a8\xd2\xd2o\xa6\x08\xaf\x0e~q\xf5\xb5\x8ec.\
+\x8d\x0e\x96:\xf2\x13\x09AH\xeaJZ\xe7\xfe\xcd+\
+S\xed\xc1\xaaHM\xa5\xbbJ\xc3\x95\xd2\x16z\xc3\x87\
+#\xac!\xc9\xc7\x8a\x92\xc4\xfboB^\xd6x\x13\xb0\
+\xcd\xe5\x04\xe7\x0a+\xc8\x86\xfc\x7f\x8d\x80P\xfd\xfe=\
+e\xa9;%\xac'\x7f;\xcc\xb5\x12V\x07\xc6\xf6G\
+\xc0\xf3d\xbf\xfdk\xaa\xacP\xc0&\xcc\xa5\x12\xfc\x8c\
+\xd7,\xf0\x5c\xe4\xdc\xde\x17\xbc\xc9\x0bd\x9d\x19\xa51\
+\x8eJp\xfb\xff\x22oxJ\xd2\xeb}&\x1e\xf7&\
+O\xa6\x8c*.XH\x09U\xe9W\xc0\xb5d\x1d\xb7\
+\xc7\xe1\x94Qx\x94\xac\x07x\xa3sy+\xa1\x88\x12\
+$\x85Jp\x8d\xc2\xbdi\xb7\x04\xa6\x1e\x83SY\xe1\
+W\x01\xbf\xb9h)V+\xa8\xb3x!%\xb4\xbc\x1d\
+.![\xed\xda\xdf/\xf2\xa6\x17~0p\xf3\xe6\xba\
+\xcc\x8d\xc1'rs`\xec\xa4\xac\xe9E\xf7\x92M\x84\
+\xac\x04>^\x97\x83\xd4'r\x0f\x96\x8c\xf4\x7f\x9f\x05\
+\xb6\xd4]'\xb0\xeeU\xc0{\xbd\xe1\xa3\xc0\xae\xfe?\
+\xe9\xda\xe0,\xd6y\xe5c\x8b\xaca\xa2.3],\
+\x80zK\xce/T\xc1\xa9\xb3\xde\x02\xc2\x86v\x9b\xa4\
+\x93a\xb1o\xe4v\x00w0\x985\x99\xc4\xfa\x05n\
+l\x80\xa9\x1e\xd9\x98\xbc-|\x9bl\x93\xc7a`\xa0\
+\x87p\xa0A\x22I\x92\xff\xc5q\xfcOl\xcf\xa6\xb1\
+2\x8e\xe3W\x92$\x19\xdb\xee\x904\xdc\xab\xbf\x85l\
+\x0b\xd0\xad\x92\xf6\xa7\x072\x86G\xd6x\x1c\xb2\xda\x0f\
+Jzwc\x5c\xb6\x04I+\x80\x1f\x91\x95m\x1f\x01\
+C\x9cgyo#\x1b&/\x00~&\xe9t\xb5\xc4\
+\x97\x86\xa4%\xd8\xe1\x0a?\xea\x9b\x01n\x09E\xa3A\
+\x05\xc8\x9a\x0b\xd6\x93\xcd\x16M\x02OVu\x93\xdb\x84\
+\x13\xfeI\xb21\x7f\x0fX/\xc9\x0f\xfb\x81!\x8d\x92\
+I\x92\xbc\x12\xc7\xf1\x7f\x81K\xbd\xa9E\xc05q\x1c\
+?\x93$I\x90\xe8\xe9\x86{\xed\x9f\x22k\xf4\x00\xbe\
+,\xe9\x87y\xf7\x0eu>$m\x05\x1e\x08L-\x06\
+\x9e\x91tC\x09>[\x81\xa4\xb5X\xd9+\xd4J\xbf\
+\x1d\xf8\xe6\xb0\xfb\x8b4Kw\xb0s:7\xe5\x5c\xf2\
+0vj\xa3Lj\xaa6$-\xc4>u7\x13~\
+\x90\xbb\x80OhD\x87K\x99v\xf9\xfb\xb0\x06\xe4\x10\
+\xa6\x81/\x02\xbb\xdbN{9^\xd6b\xc2\xe7\x1d\xda\
+\xd8\x8e\x9d \x19\xd9\xdeS\xf6\xc0\xc4\xe70\xef*/\
+J|\x01;0\xf1\x8b\x22\x8b\x97\x5c;\x02.\xc3|\
+\xfb\xbcR\xdb,\xd6\xe9\xb6\xb5\xe8\x83\xa8rdf\x0d\
+\xf0c\x86\x1f_y\x19kK\xd9-\xe9P\xd95\xbc\
+\xf5&\xb1\x0a\xd4\xa7\x18~8\xeb\x18\x16\xc2\x97:@\
+U\xf5\xd0\xd4\xd9\xc0\xf7\x18\x9d4\xe9ae\xe9\xdfb\
+\x86\xea%\xec\xd0T\xf0\xe9\xb8\xa7\xbc\x18\x0b\xc2\xfa\x87\
+\xa6.dt\x15j\x1f\xf6\x9d/\xfdU\xaa{l\xee\
+2\xac\x09\xb9\x8cs\xf4\x06f3^\xc7r\x91=\x06\
+\x8f\xcd\xf9N\xcc0\x1c\xc1\xd2\xed\x95{\x98\x9b88\
+9\x81\x9d\xe1\xb9\x9b\xe1'\xc9\x9a\xc41\xcc\x08>\x90\
+\x8e\xec\xaa\xa0\xc9\xa3\xb3\xfdS]\x1bi\xaf\x1f`\x0a\
+\xdbz\xbb\xea\x0a\xdeG[\x87\xa7\x97\x03\x1f\x05>\x88\
+\x15$\xaa\xe6\x16g1\xa1\xf7\x01\x8f\xa8\xe6\x19\xc4\x10\
+ZQ@\x1a.\x99r\x11\xa6\x88\xf3\xb1mr\x0e\xb6\
+\xd7\xfb\x0eL\x0fk_9\x8a\xed\xeb\x7f`\x06\xf39\
+I\x85\x1a6\xaa\xe2\xff\xbd\x89\xc7\xd1\x1dD]\xba\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04\x86\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x00H\x00\x00\
+\x00H\x00F\xc9k>\x00\x00\x00\x09vpAg\x00\
+\x00\x00 \x00\x00\x00 \x00\x87\xfa\x9c\x9d\x00\x00\x03\xaf\
+IDATX\xc3\xad\x97\xddk\x1cU\x18\xc6\x7fg\
+>\xf6#\xdb\xc9\xe6\x03ZV\xbc\xd1F\xb2W\x05\xaf\
+\xa4\x81B\xc0\xe0\x85\x10\x15z%\x04\x09\xf8\x07h\xc4\
+Z\xf0\x0f\x104 \x0aR\x11\x14\x8a\xe4BoD\x11\
++\x94(H\xc5Vo\x94b\xd9@\xd5m%\x14\x91\
+\xb0\xe96\xfb\x91\x99\x9d9\xc7\x8b\xdd\xd9\x9d\xaf\xdd\xcc\
+\xc4\xbep\xe0\xcc\xcc9\xef\xf3\xbc\xef\xf3\x9e\x8f\x11d\
+\xb4\xb5\xb5\xb5\xdb\xc0\xc2\x98\xcf\x7flmm=\x91\xc5\
+\x9f\x91\x95\x00\xb0p\xee\xdc\x93h\x9a\x08\xbd\x94Rq\
+\xed\xda\xaf\x0bY\x9d\x894\x83\xd6\xd7_z\xc7u\xe5\
+k\x80\x0ep\xe6\xccc\xb4\xdb\xad\xd0\x98R\xe9\x047\
+o\xd6\xfdG\xcf0\xb4w/_\xfe\xf4\x8d\xd4\x04.\
+>\x7fr\xb3'\xd5\xabJ\x89XV\xf6f\x9fae\
+\xe5,\xba>\xfatp\xd0\x0c\x8d\xb1\xac\xf2\xb0\xefy\
+.\xdb\xdb\xd7\x99o\x5cE\x88(\xa0ru!\xde\xdb\
+\xfc\xfa\xdf\x0b!\x09z\x92\x8d\xf3Ks\xbaH\xc8\xc9\
+\xa5\xdf\xa1Ry\x94fs\x1f1\x18P(\x14\xfa\x0e\
+#\x13\x84\x10LO\xcf\xa0\xd4uV\x9f*S\xcci\
+\xa1\xef=W\x19_\xfd|\x7f\x03\x08\x13P\x8a!\xf8\
+o\xe6y\x1ex\xa5\xc0\xb4\x1a\xe5\xf2,J)@\xa1\
+\x14\x80\xf2\xe7\xc5\xdeMM\xf5\xe7\xfe(^$\xaf\xe5\
+\x01(\xd2b\xfe\x9f\xcfy\xfc\xa4\x89R})C\x04\
+\x82\xf6\xc0+q\xf1\xc2\x9b\x81\x1aX\xa7^\xbf\x8da\
+\x98\x01P\x9fx\xe0a@\xa0\xd1h\xa0\xeb:\x1b\xaf\
+\xbc\x8eeY\x00\xbc\xbd\xf9\x16R\xc5\xb1&\xae\x82f\
+\xf3>\x00++Os\xe5\xca6RJ\xd2\x98\xa6i\
+,-\x9d\xa5\xd5:@J\x8fry\xa6O/az\
+\x8c\x80Tq\x9a\xab\xab\xab,//\xd3nwR\x11\
+\x000\x0c}X'\x93|\xc7\x09H\x18)42\xcb\
+\xb2\x86\xe9LkJ\xa9\x90D\xa9$H \x99\xd9\x82\
+\xa0\xe1~\x0a\x02I,wvv\x8e\x05\x5c\xadVC\
+\xa0\xa92\x90\xa4S\xb5ZM\x0d>.\xfa\xd4\x04\xb2\
+J0\x02\x86I{C\x12\xa11\x19\x88\x83$I\x90\
+\x14i\x10\xb0Ry\x84\xe9i\xeb8\x12\xc4\x07E%\
+\x88\xa6{\x5c\xf4\xd1\x0c\xfco\x09&\xe9\x1cN{\xb4\
+?\xdew\xaa\x22\xac\xd5j\x13#\x0d\xbf\x83\xc5\xc5\xc5\
+\x10\x09\x7f\x07\xcd,\x81\x1f]\x7f9\x1d]lI\xd1\
++\xa5F\x04d\x8a\x22\x8c\xa7\xed(\xe0d\x12\xa1\x1d\
+p@ \x9d\x04\x81\x03\xc3w\x12\x95 \xea\xc8\xb2,\
+*\x95J,z!\x04\xba>\xda\xd73oD>\xe0\
+\xe2b5E\xf4\xe1\xa8u]\x1f6\xff\xd2\x92i\x15\
+D/\x1fi\x815M\x1b\x02\x1b\x86\x81\xeb\xba\xd4\xef\
+\xd6Q\xa8\xc4\x0b\xe8\xd8\x22\xf4O\xb2I:G\xd3m\
+\x18\x06\x1f}\xf2a\xc8_\xce\xcc\xe1\xf4\x9c\xd8\xd5\xed\
+H\x02R\xca\x09\x85\x15\xd79\x98\xee\xe7\x9e}a\x08\
+\xe886\xdf\xff\xf0\x1d\x8em\xa7#\xa0\x86\x04\xbcD\
+\xc0q:\xfbM)5\x04o\xec7\xb8\xf1\xcbOt\
+\xda\x1dr93m\x06\xfa\x00\x9e'S\xeb\xec\xf7\x1d\
+\xc7!\x9f\xcf#\xa5\xe4V\xed\x16\x7f\xdd\xf9\x13\xe7\xd0\
+\xc6*\x9d\xc0\xee\xd9\xd9j@JI\xb18\x15\xbb\xd5\
+\x08!\xd04-\xd4\xfc\xa5v\xf7\xef;\xd8\xb6\xcd\xb7\
+W\xbf\xa1\xdb\xed\x22{\x1e\xb3\xb33\xcc\xcd\xcd\xb3{\
+o7\xbd\x04\x05\xd5\xe2\x83K\xef\x93\xd5\x14\xfd?\x1d\
+\xcf\xed\x913M0M:\x87]:\xf7v1\xbd\x16\
+\xde\x04\x02\x1a\x02\xd9s\x95v\xfa\x94\xc9i\xf5E\xf0\
+\x10{8\xa6\x01\xd5\x02]G\x81@\x02\xa7\x80=\x9f\
+@\xfe\xd0\x96\x1f\x7fyc\xffe\x10\xfa\xf1QR\xe5\
+\xc9\xdbo\xcb\xcf\x80)@\x0f\xd6E\x11\x98\x07\xca@\
+n\xd0\x1e\xa69\x83<\x1c\x02{@\x03\xe8\xfd\x07o\
+\xedUE\xe4\xe0j\x18\x00\x00\x00%tEXtd\
+ate:create\x002013-\
+12-17T10:20:17-0\
+5:00\x05d\x89\x86\x00\x00\x00%tEXt\
+date:modify\x002013\
+-12-17T10:20:17-\
+05:00t91:\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x02\x87\x8a\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\xe6\x00\x00\x02\x12\x08\x06\x00\x00\x00\x80\x9a\x0a\x5c\
+\x00\x00\x01\x84iCCPICC prof\
+ile\x00\x00(\x91}\x91=H\xc3@\x1c\xc5_\
+[\xb5\x22\x15\x87v\x90\x22\x92\xa1:\xd9EE\x1dk\
+\x15\x8aP!\xd4\x0a\xad:\x98\x5c\xfa!4iHR\
+\x5c\x1c\x05\xd7\x82\x83\x1f\x8bU\x07\x17g]\x1d\x5c\x05\
+A\xf0\x03\xc4\xd9\xc1I\xd1EJ\xfc_Rh\x11\xe3\
+\xc1q?\xde\xdd{\xdc\xbd\x03\xfc\x8d\x0aS\xcd\xae\x04\
+\xa0j\x96\x91I%\x85\x5c~E\x08\xbe\xa2\x07\xc3\x08\
+#\x8ai\x89\x99\xfa\xac(\xa6\xe19\xbe\xee\xe1\xe3\xeb\
+]\x9cgy\x9f\xfbs\xf4+\x05\x93\x01>\x818\xc1\
+t\xc3\x22^'\x9e\xda\xb4t\xce\xfb\xc4\x11V\x96\x14\
+\xe2s\xe21\x83.H\xfc\xc8u\xd9\xe57\xce%\x87\
+\xfd<3bd3s\xc4\x11b\xa1\xd4\xc1r\x07\xb3\
+\xb2\xa1\x12O\x12\xc7\x14U\xa3|\x7f\xcee\x85\xf3\x16\
+g\xb5Rc\xad{\xf2\x17\x86\x0a\xda\xf2\x12\xd7i\x0e\
+!\x85\x05,B\x84\x00\x195l\xa0\x02\x0bqZ5\
+RLdh?\xe9\xe1\x8f:~\x91\x5c2\xb96\xc0\
+\xc81\x8f*TH\x8e\x1f\xfc\x0f~wk\x16'\xc6\
+\xdd\xa4P\x12\xe8~\xb1\xed\x8f\x11 \xb8\x0b4\xeb\xb6\
+\xfd}l\xdb\xcd\x13 \xf0\x0c\x5cim\x7f\xb5\x01\xcc\
+|\x92^ok\xb1#``\x1b\xb8\xb8nk\xf2\x1e\
+p\xb9\x03\x0c>\xe9\x92!9R\x80\xa6\xbfX\x04\xde\
+\xcf\xe8\x9b\xf2@\xf8\x16\xe8[u{k\xed\xe3\xf4\x01\
+\xc8RW\xe9\x1b\xe0\xe0\x10\x18-Q\xf6\x9a\xc7\xbb{\
+;{\xfb\xf7L\xab\xbf\x1f\xf1wr\xd9-\x0a\xe0\xe9\
+\x00\x00\x00\x06bKGD\x00Q\x00Q\x00Q\x8d\x22\
+x\xe1\x00\x00\x00\x09pHYs\x00\x00.#\x00\x00\
+.#\x01x\xa5?v\x00\x00\x00\x07tIME\x07\
+\xe8\x07\x01\x04+.\x91\xf0\xd0@\x00\x00\x00\x19tE\
+XtComment\x00Create\
+d with GIMPW\x81\x0e\x17\x00\
+\x00 \x00IDATx\xda\xec\xbdi\x8flYv\
+\x1d\xb6\xd6\x8d\xc8\xcc7\xd6\xabW\xf3\xdc\xad\x9eD\xb2\
+Iu[\x22H\x096!\xc0\x90\x04\xe8\x83m\xd0\x86\
+\x07\xf8\xf7\x0a\x10@\x7f\xb0(P\xb6DS\x14\xdd\xec\
+.vUw\xd5\x1bs\x8e\xb8[\x1f\xe2\x9es\xd6\xde\
+g\xdf|\xd5\xec\xa9^\xd5\xd9D\xb3\xaa23\x22n\
+\xdcq\xedu\xd6^\x8b\x7f\xfa\xa7\x7fj\x185j\xd4\
+\xa8Q\xa3F\x8dz\xd9\x8b\x00\x01\x98\x01$\xfd\xaf\x08\
+\xc0\x08[\xfe&\xbe\xf0\xf0{\xac\xfc>y?\x10\x06\
+[~nH\xdf\x95,\x1b\xb3l\x9c\x01e\xdb\xf2\x97\
+\xd4\xbfc\xf9w\x10\xa4\xf5\x7fS\xfe?yx+s\
+\xbfj\xdb\x07\xc0\xca\xf7[~]\xbf\xa3-\xdb\x04\xa6\
+\xefne\xbf\xe9/\xec\xf0\xde\xc8\xbe\xb6{\xdf\xf0\xb2\
+\xe5\x8d\xe2\xc7\x91\x87\xed\x84;fecm\xf9&\xc9\
+\xd7/\xbb\xb5\xdbH\xfd=\xb3\x1f\xd7\x0dev\x0cH\
+\xb0\x1e\xb3\xec\xbb\xe9\xe7\xc9;\xd6\x9f\xf97%\x93\xfd\
+\xe1\x0f\x82\xfb\xfbi\x5c\xc5\xa3F\x8d\x1a5j\xd4\xa8\
+\xaf\x04.7$ \xa9\xe1\xa7\x03\x16\xb2\xfa\xe3\x06\x01\
+\xad N\x85T\x0d\xa8\x15\x00e\xd6\x03\xbc\x04\x9dR\
+\xff&\x00\xb6\x02\x98\xddF\x94W\xb1\xc0h-[>\
+\x96\xeeg\xe5/\xcd\x0a@\xf7\x7f\xe2\x00\xa8|%\x93\
+w0\xd9v}\xb9\x010\x9a\xc3\xa6\xda\x7fX\xf8\xda\
+\xf5\x1d\x8c\x02\xf6\xa5A\xa0\xbc?\xc3\xfe-{\x85\xfe\
+\xfb\xb5\xe6$iI\x96\xfda\xd6\x1a\x93\xf2\xe6\x04@\
+\x93\xc6\xc1\xfc>\xa1\xee\x90\x0e{S\xbe\xac\xff\xcc\xd6\
+p\x84\xed,\xaf3C\xdb\x90\xb6c\xackR\xda\x19\
+\xb7|\x01\xf7Y\x03\x98\x8f\x1a5j\xd4\xa8Q\xa3^\
+~P^\x00c\x80\xaf\x5c\xd0\xa8\x91\x15\xcc*\xa0\xb4\
+\x02\xa4\x8c)\x0aT\xf6\xb8g\x87M\xe1\x7f\xdb\x0e\xb0\
+~\x9e\xdf \xab[\xd51\xca\xcb\xa7\xb0\xb0\xeb\xa0\xc3\
+x\xa6\xe0\xb7o\x1f\x92\x0d\xb7\xba-\x0eqWtn\
+\x0e\x0c\x1f\xc08\xa1\xff\xe7\x1b\x11V\xa6\x9f\xb5\x1b(\
+\x8cw\xc4\xb3\x81Q6t\x8dH\xa1\xab\xfb_\x1d\x1a\
+\xa1\xc3\xe2\xc2a\x1b\xccZ\x83er\xecz\x8cl\xe8\
+\xd8\xf0\xd8\x5c\xc0j[\xe27\xb5\xb5[\x90\xef\xa7\xaf\
+\xe8\xdf\xab5\x1bF\xca)\xb4\xb4\x00\xd6\xafv\x18\xad\
+\xe1\xf1\xe4\xe0\x0d`>j\xd4\xa8Q\xa3F\x8dz\xe9\
+\xeb\x80\xcb\x14`\x17V\xd9*8\x87\x19z\xbes\x01\
+i\x1d{Z\x80\xa3!\x22\xa9\x03\x80m\x12\x15\x0a\xb2\
+<\xc8[\xac\x91\xc6\xca\xce\x93\x1e \xeb\x96\xd2\x0e\xec\
+j\x0a\xb3\x1b\xcf\xee\x81\xba\x09\xf0\x8d-\x09\xd0}-\
+\x95NX\xc6\x0a//hK\x0f\xfe\xb3\x8a\xc4C\x01\
+}\xd9\xa7\x15pZh8\xb8\x80w\xf6\xb8\xbc\x1c#\
+\xfam/+\x04,r\x14\xddo\xe6e.\xb1\x0dh\
+\xab\x02rT\x96\xf70i\xd0\xf4x\x1e\x1a\x01k\xbf\
+#e\xb1\x85\x9d\xaa\xe5\xf0\xbd\xe9D6\x8c\xdb\xb1\xb0\
+\xfe\xdd\xb1\xb1r<\xe1\x8f\xf7\x82\xfb\x070\x1f5j\
+\xd4\xa8Q\xa3F\xbd\xe4\xa5\xf2\x01k \xbd`\xa1\x22\
+\xcb`\x0eyA\x06\xd2\xb6\xe8\xb6\x9b\xe8\x9c\x11\xf9\x19\
+\x0aT\x86R\xf0\x95\xe9U\xb9\x07\x1b\x885\x8f\xacE\
+\xaf\xbd\xb0\xab\x16\xb4\x17\xd6@(\x035M\x06\x00*\
+\xbb#2\xbc\xf2m\xdd&\xf7h\xdfV\x9b\x03\xf3B\
+\x0c\xb7-U\xc2b\x94\xefe\xa1\x89\x08m\x0f\xa5\x89\
+\x10\xe8NA\xef=\xfc\xb6\x8a\x9b\xad;\x07\xd0\x1a\x15\
+e\xaa\xad\xfdu\xf7^F\x98\xf5\x8d\x83\x83\xd8Fd\
+2\x7f\xa39\x10\xdf\xbf\xaei\xeb\xfb\x0e\x222\xfe\x87\
+}2\x80\xf9\xa8Q\xa3F\x8d\x1a5\xea%\x87\xe5\xb6\
+\xc8+\xac\x81Gz\xf5\xb4\x05$\xd7\xa0Y\x0f\xf1`\
+\x02\xe4\x15wU\xc0'C\x89\xaa\x88\xb0\x8a'\xa1t\
+5\xcd\xcbgT\xa9\xa2\x0a\x8c^\xc3\xdc^\xa0dq\
+a\xf0\xcd\x00\x8b\x90\xb2~@\x0f\x87\x1bP\x8c;\xc2\
+\xea{[\xa6\xff\xa8\xc3\xaa\xd6#\xcc\x22waT\xc1\
+[U\x84T\xdd7\x10\x80=\x91\xa1V\x13A\xba[\
+W\xa0\xc8\x8f*X\x16\x06\xbd\xac`t\xaf\xed\xda\x12\
+\x01\xd7\xd2\xdaIc\xd2HzKeR\x05\xd4g\x8d\
+\x8c\xa5\x9f\xbf4_\xaaGO\xc0\xfe\x00\xe6\xa3F\x8d\
+\x1a5j\xd4\xa8\x97\xba*\x10\xb2\x0aa\x97\x9fS0\
+[\xd0\xfaV\x04\xad \xaf\x814k\xf3\xa0\x02\xb1\xb8\
+\x80l6\xc0\xee\x09\xf0*KA\x07D\x15\x18\x0ah\
+VF=bfz KX\x00\x9d\xec\xf4\xeaX\xf6\
+\x01\x91\xe0\xfb\xa5\x81at\x0dAsx\xe9w\xee\x81\
+\xc5?\xf4\x16\x0c\x98\xde\x82\xd8\x9b\x8e\x0d\xa64\x08\x08\
+*\x9e\xaa\xfdW@\x0e\xd9v\xeb\xf7\x85-\xfb\xbea\
+pa\xc2\x8dn\xb1Aw \xe1\xcf\x0b\xb7\xafL>\
+L\xf7\xad\xe9\x16\xf9u\x89\x22I2\x86\xef\xac\x1d\x1a\
+\x13\x87\x9f:\x1fK\xf4:\xa3\x83\xfci\x00\xf3Q\xa3\
+F\x8d\x1a5j\xd4W\x06\x9c{\xb4\xdc4\xd3\x06a\
+\xa3\x9d\xbc\xc0\xe2<\xe5\x22\xb3\xe8\xb5/\x15\xdc\xab\x0c\
+%\xc2\xdf #\xf1\x12\x19s\xd6$^\x97l\xc1\xb5\
+\x04Ub\xe1\xe0a}\x0b\xef8\x03\x01\xbc\x96\x0c\x87\
+V\xa3\x12\xcap$\x9ar\xc6\xac\x07\xa0\x11\x88\x16\x80\
+\xee\x9a\x1bd\xba\x12VkJ\x90\x22\xcf\xa1c\xcf\xcd\
+9\xaf\xc8\xbf\x17Y\x0c}\x13\xd3\xfb\xd9H\xab\xb3\x80\
+t\xf3k\x04\x87WU\xc6\x9f~\xa7,\x03\x9b\xf5X\
+\xcb\xe1m\xae6\xbd\x5c\x09f\xbd\xb4E\x0f\xc3\xda\xf9\
+a\xb6\xac\xee\xb8\x8d\x80\xce.\x0c`>j\xd4\xa8Q\
+\xa3F\x8dzy\x8b\xe2\xdfG\xeb@)\x91ya\x0b\
+P\xac(,\x83{\xe8`\xdeA\xafn) \x8f`\
+\x1b\xdd;&[Qe\x0dL\xfe\x1e\xc2p\xc7\xd1B\
+*\xf6\x94\x7f\xb7\xf6\x9dL\xdf\xaf\xb8\x86X\x873\xa3\
+\xc6\xdb\xe4o\x8a\xcfxa\xd43\xf1I\xe7X\xe3\x8c\
+\x18\xfd_Zh\x14t\x0b3]\xbc.'X\xd2W\
+5\xe7\x1d&\x00\x1am\x063J\x92\xea\xbe\xb7\xd6\xd8\
+\x85}b\xe1\xdc)$\xbd\xd5}\xb1\xa2GA\xa6I\
+\x97A\x05\x9a\xc8\x99\x0c\xaa\xb3\x1f\xc0|\xd4\xa8Q\xa3\
+F\x8d\x1a\xf5\xf2\x96\x893\x89\xd1\xa9*,\x83\xd7E\
+\xae S\x90tT\xb5\x17\x7f\x13\x1d2\x0f(\x0f\xf5\
+\xf3sew\xc3\xfd\x96\x0c\x09VH\xe6d,E+\
+o\xe1{,\xc8p\x01\xdf>\xfc'\x0cv\xf6\xa2o\
+\xd18'-\x0a\xc3\xdf@\xf7\x81\xac@t\x0d\x87\x81\
+\x9d\xd4\xba\xac\x1c\x04K\xc2\xfa\xef\xd65*\x8d\x11\x8f\
+\xde\xf0\xde\xfb\xc4\xe9\xc0+\xc8_\x9cp\x12\x8brV\
+\xfd\xfcJP\x11;w\xc4\xc5\xee\x129\xc0\xee\xa1:\
+\xba/\xc9\xfe?K\x03f\x89\xfe\x89\xc5j\xd1\x06c\
+>j\xd4\xa8Q\xa3F\x8dzI\x8b1\xb8\x85\x02\xd8\
+\x16\x90n\x8a\xbe*@\xf5\xc07\x02M\x130\xd7#\
+9\x13\x99\x85\x07\xfb>\xb1\xb3\x7f=S\x80j\xc1\xf5\
+\xa5\xe0j\xab\xab\x01\x1dck=\x02\xad \xde\x98p\
+\xb8\xc1\xbb1\xdb\xf6*\xc6\x0e\xe1@\x96|\x01\xb2\xc2\
+\xe8* QB\xb8\x92\xc2\x1e\xb1\x87\xd8\xa7\xb0F\xd1\
+\x8e\x8967\xf4X\x1f5)\x0a\xc2rgF2\xf2\
+7+\x96\xe1\x07\x9f\xf1\xb5\xa8\xd7\xe2\x92\x13\xa5;\x84\
+4\x82]\xfb\xd5;$j\xc8+\xf3]o\x8b4f\
+\xd8%\x8e\x1a5j\xd4\xa8Q\xa3^\xda\xaa\xec#=\
+\xb2\xad\x83\x9d\xcbP\xa7\x05T|\xc0\x9fI\x14=\x83\
+7yj\x1a\xe2-:\xea\xac\x1f\xd1\xc1\xcd\xd4\x06F\
+\xa0(]2\xa7\xe7\xf7\xcd\x04\xd1\xd5\x9e\xa2Y\x16Z\
+\xb464\x1d\xacDg|\xd2t\xf3*HW\xd1\x86\
+E(\xec\xbb\x85\x0e\x84\x9a\x00pq\x87\xb4\x06\xd4\xa3\
+\xc5zs\xcc\xe9\x85=\xa6\x0dU\x02\xe3Y$?\xa4\
+\xfb\xc0*\xf5\x89\x83\x02\xcbA\xe1\xeaahM\x96\xfb\
+Y\xb0\xa2\xd4\xfd\xd0\xf6;\x90\x9b\xd7\xb0\xcb\x81\xd5\xd3\
+(\x13T\xb9y\x86\xe1\xca2j\xd4\xa8Q\xa3F\x8d\
+zy\x8b>\xccG\x7f\xb3\x00W\xa33\xca\xa8`\xb8\
+8\xb6X\xa07\xcd\xda\xb8e\x0f\xca\x0dj-\xb8\xe0\
+\xc8\x103\x1f\xa3\xe6\x0bZ\x0d\xc1;f~T\xd1\xbc\
+<\xc2\xb1\xb5\x02\xfa\x8b\xbe\x9dl\xfa\xe7&\xfeX\x92\
+2\x15\x0d\x8a\xaf\xba\xaa\x99\x0fr\x18\x13\x03\x19v\x9a\
+p\xf3\xa8\xd2K\x5cV\xbe\xb3\x1b\x08\xa5\x85\x98{\xeb\
+=\xc15\xf4\xa8\xaeF(4g>_j\xf0I\xae\
+q\xceR\x99m\xf6\xcdA]E0\x0d\x132Y\x0c\
+\x91\xa3\xb3|\x97\xe6f\xc9~\xf1\xa1\x04X\x85U\x1c\
+]\xb5\xb1\xd8\xe0Q;\x8c\xc3\x8f\x070\x1f5j\xd4\
+\xa8Q\xa3F\xbdlp\xbc\x01\xdcE\x0fl\x01D\x1b\
+\x1b\x083\xd1j[\xd0\x14\xbbABK#t\x9a\xf6\
+\xda\x127lS \xbb\x068{\x7f\xf2\x06\xa9\xbdS\
+H\xd1Jg\xf2\x0c\xaa\x9f\xb8\xb5\xcf,\x03\x90f\x16\
+\xf4\xf2\x05\xd86h\xa8\x89\xa4j\x19I\xe7gbm\
+\x1b\x05\x11;\xcd\xb8\xb1\x0b\xf2)\x8d\x0f\xa5qp@\
+\x9a\x02\xbe\xe3\xae\xaa\x83\xbb\xecw\xad\x1d\xd2C\x83\xa4\
+\xfe\x90\xd4\xd9\xa9\x8d\xe8\xec\x16\xbb\xc4\xd1\x06\xc1\x11\x0f\
+\x81-\x83\xae%\x85\xd55\x15&\x19\xaf\xc1\xe3\x9e\xa2\
+Iw\xcd\x17\xccii\xdc\xf6\x9b\xe6\x93\xb6\x13x\x00\
+\xf3Q\xa3F\x8d\x1a5j\xd4KU\xe6\xd4\xc9\xe6\x0d\
+\x02\xc5\x16\x8fl\xb05\x02\xa2<\xac\x91\xee}\x1d\x8c\
+\xae~\xdd\x89\x9d\xa0%\xaf\xb1<F\xa74\x0d\xe5\x8f\
+\x185\xd8\xa5sH\x84\xcf\xb6\xe8\xb0S\x17\x94b\x95\
+\x184\xe9\xcd\xab}y\xad\xd8\xffyK\xc8\x10\xccT\
+\x1a\x18\xa7\xb3nh\xf4\x06\xc3\xc7\xfc[\xd3\xa4\xf1a\
+\xb7\x9f\xa2l\xbf\x82\xdb\xda\x88\x04\xbd\xb79\x1bs\xf7\
+\x0b\x93f\x88\x8e5gm\xd2\x98\x1c\xe5\x83\x9d!\xfc\
+\x10\xb1\x9c,\x16u\xf3\xd6\xb8u\xae$\xad\x1e,!\
+\xad\xfbbu\xd8\xd5|c6\x80\xf9\xa8Q\xa3F\x8d\
+\x1a5\xea%,\xae\xc0\xdeEw\x1cc\xd6)!:\
+\xd5\xea.\x82\xaf\x5c@\xac|\xb8\x05\x86[!s\xba\
+y\x0a>\x1d27\xf79\xcd.\xb0Q\xdafy[\
+\x92 \xc0:\x13I\xf6_\x89P\x09G\xb4.\x0cR\
+\xa0\xf2>\xa6n5*\x9fY\x98\xef`HR\x01<\
+-\x9d\xc5\xe4\xc2z\x83ik\xe3R8\x03\x1e^O\
+D\xa5\xe5\xefGm\x13\x82\xcbN\xb0\xba\xd7\xb6\x84\xfa\
+\xbeaK(\x8d\x1e\xc2\xba\x0a\x93N\xaf:\xbb\xd8\x0d\
+\x87\xd0\xdayh\x831\x1f5j\xd4\xa8Q\xa3F\xbd\
+\xbc\xb8\xdc\x9a\x05F\x00\xd5\x1a\xcac\xc1\x02\xc4$\xd1\
+\xb1\xbe\x95\xb8\x8d\xd8j\x0f@ 2\xf3\x0e\xe8{4\
+^d/f\xe6\xb0a\x01x\x16\x9a\x03s[\xcd*\
+\xd3`\x88\xa7g\xb0\x0c\xacX\x92y8\x90\x02Ku\
+\x07)\x0d\x0crr>D\xf9P\xf6\xddA\xf2\xe3\x06\
+;UomD\xdaQ\xb0i\xea\x9d\x8c\x88\xa5\x09a\
+\xee\x9cB\xeb\x00{\xfb\xcc\x96\xec\xea\xbb\xaf\x855O\
+F\x05l\xc5\xbb\xde\x5c\xa3\x94\xc8_\xea\xb9\xa1\xa9\x9f\
+z\x0e\xa4\x1b\x08?\x1a\xebO_mF\xca\xf0\xe8\x00\
+\xe6\xa3F\x8d\x1a5j\xd4\xa8\x97\x07\x8fC\x18\xca\x9a\
+\x10)\xcc\xb3\xda\x07\x1a\xbb\xb0\xa0\xc2\xfa\xf6N\xe3\xf4\
+\xef\x0d8\xffn78)\x00\x8e\x96\x08V(P\x98\
+\x89ox\x19\x80\x0c\x8d\x80\xd5\x94L\x09\xfb)\xda\xf6\
+\xaa\x97\xf1\x9f\xa7`\xd8\xd0\x87\x14\x91\xac\xf6\x8a\xca\x9c\
+\xb7\xaf\xc0\xf0\x0a$\x0e':\xc8\x0a\x17u\xdf\x10\xaf\
+\xa4y&\x9a\x94\xa2\xd9v\x0b\x09vCS\x11\x9a\x19\
+\xb8\xd0\xa3~\x7f\xd7\x96L\xde\xd3\xe3u:P\x1d\x1d\
+h\xe8\xad\xdb\xfb\xb6\xc6\x0c\xdd\xd4/\x15\xd4\xaf\x9c\xa7\
+\xa1\x89\xd0\x977iL\xd9\x1f#`h\xd4\xa8Q\xa3\
+F\x8d\x1a\xf5\x12\x95\xcfI\xb4\x04\x10/\xbfab\x1a\
+-\x00\xd2\xb9\x1fZ\x93)\x98\x0c\xea\x19\x03\xc4\x12\x8a\
+\x98\x0bco\x89\xee\xbcz\xaa\x93:\xa7\x99\xe4_\xf6\
+y\x9e\x868\xd0h\x15\xcc\x9b\xf5\xe9\x985\xe4\x93\x0c\
+\x9ak\xab\xc9\xa2\x9dI_\x9d\xbf\xa4\xb3\xff\xab\x86\x89\
+\xec\x877\x8dV\xb3\x9c:W\x15S\xa1O\x12\xbac\
+\xe8\xf4\x1eT\xd0\x9b\xa9\xcb\x97\xc6\x85\xc9\x9e\xb2\xa5!\
+s\xfb\xd1\x81m\xea\xa8\x81\x97\x84\x9b\xefG\xcaj\x89\
+)\xd6f\xd7\xaa85\x0d\xdd\x96'\x1a\x1c\x96\xe9\x01\
+C\xd6Ch\xf3\x18\xcf\x9c\x01\xccG\x8d\x1a5j\xd4\
+\xa8Q/M\x91\x0d\x00\x92\x010\x8b\xa4\x82\xd9\xe4e\
+\xb1\xbd\xd3\x1f9\x80\xcan8\xb4\xb8kD\x93\x11\xf7\
+\x99\x9d\xaf\xf9\xa2q7s\xcc\xb25\xd4\xdb\xdb\xffU\
+\xf7\x91\xd8lxV\x97\xf15l\xbatGt3\xe4\
+\xcb\xd7\x8d\x13\xd9\x8e!n\x5c\xcbbJ\xf4#%\xa1\
+R]p\x1aCm\x9d\x03\x8a[c\x08\xacqwx\
+\xdc\xf7\xb4\x96\x96\xd9kQ\xdaj\x88\xb1;\x8e\x1a\xf4\
+\x13\x0e\xcaa\xf6 \xf6Q\xe6\xddd\x0c!Hhy\
+3\xc7l\x0b%\xdf\x9cm\xa4I\xb0\xf2\x1d\xd8i\xd9\
+\xdbdm\xb0\x84\x5c6f\x00\xf3Q\xa3F\x8d\x1a5\
+j\xd4\xcbS\xd6\xdc.\x80\xe0\xb5\xdd\xacD\xc4}$\
+\xe23\xa6Dz\x06\x84\x0f\xf8\xcfB\x10\x90\x803$\
+\x1a\xe8\xc2\x96\xd2\xb2\xa8\xcfEnQ\x82mL@2\
+\xa3\x8a\xbd}_\xf6\x0cq\x9d\x13\xb5\xfe;\x15\xa4\xda\
+<\xb4\x15\x0d\x9b\x04\xdbD\x09\x89y\xb4m\xf1\xb3\xac\
+\xb9\xe0h\x90ja\xa8-=\x5cA'\xe2\x84@5\
+\xaa\xde\xe9\xbdm%\xd5S\xbf~f\xe3\xa2\x1e\xf3\xc9\
+\xf0\xad\x150M\xdft\xd5&%\xf0\xf7\x91!\xd7\x83\
+\xcfE\xde\x04\xf6g\x91\xd5\xe5\x16s?\xd3\xe3\xcb\xa8\
+u\x19\x1a\xf3Q\xa3F\x8d\x1a5j\xd4\xcbT-P\
+\xc6\x87\xb9\x17\xa4C7\xe4\xd8\xcb#\x8cp\xacq\x93\
+\xabX\xf3\xecV\x80Nk:\xf6\x00\xe4\x0fJ\x16\xb6\
+aB\x01\x95\xcdY\x1ca\x06\x90BL\x8b.\xde\xd4\
+\x1f\xfc\x86\x86DXV\x9a\x0e\x93z,\xcaE\x88]\
+\x07*u8s\x01\x80\xf1\xa3\x8a\x1d$\x15\xe43\xee\
+w\xd9\x03T\xcd\xb79\xcd\xb5k\x1e\x00$\x96\xe6\xcd\
+S\x9eQ?\xd2\x86\x5cm\xe5=\x83A\xa6\xf7O\xaf\
+\x83\xaa\x81\x93g\xb0\x83\x84\x1f^\xed\xb2H\x9d#b\
+\x8c\xf9\x5c\xce\xb0$\xdb\x88K2\xac%M\x91\xe9?\
+E\x86U\x1aF\x1b\x8c\xf9\xa8Q\xa3F\x8d\x1a5\xea\
+e\xa9\xc6\x91\xb3\x07\xd2EW\x0e\x04\xd7\x922\xa4\xe9\
+\x01\x978\xe8U\xb0\xec\x18i\xb36Dh\x09\xa8T\
+\x16=HD\x1c\xc2\x0e6.L\x06+\xeb\xf7\xd2\xe4\
+\xc8\xe0\xd9\xad:\x16\xe7\xe2^\x98t\xf7qM\x89o\
+u\xc2\xb2\x0d\x9ez{GI@5/\xe0\xa9@X\
+\xd9\xf1\xfa\xe1S\xdd\xaf^\x17\xef\x99e\x9fv\xb9\x02\
+\xda\x93_w\xffM/\xf2f\x88C\xaa\x8c8\xd4\xd2\
+\xb15k\xab\x8e5z8\xe2\xd0\xa7e[\xd5Vl\
+\xba\xd5\x8d\x12D\xe4\x00{\xd4\xd5[\xdf\x04\xc8\xef\x07\
+0\x1f5j\xd4\xa8Q\xa3F\xbd\x1c\xc5\xc2\x8c\x1aV\
+0Sb(b\xd5ZQ\xf1s\xc3\xba\x94@\x22g\
+\xcc\x8d2\x9eG\x06\x0d9\xd1\xdb&\xba\xf8\xfa\xc4\x83\
+\xd0\xd0\xe4\x0f\xb6\x82\x0f\xd5\xa5\xc5\x0d\x9a\xf6\xce\x1f\xcd\
+\x83\x9cN\xcb\xecu\xeb~\xdb\xeb_\x18VF.\x17\
+\xc0\xa9\xda\xee\xe2\xa6Bqfq\x1dN\xccJm\x0d\
+K\xdb\xdf\xdez1\xca\xda\xdd;\xaa\x04\x88\xf2G\xb6\
+h\xc4\xc5V\xd2\xe3j\x1f\xfaS\x90u\x01\xec+\xb1\
+R\xcb\xee0\xd7,\xb8\xfe\x0a\xe8$Df\x8b\xfb\x8b\
+Em\xb9I\xcbc\x88]\xc9\xc1\x02\xb3\xef\x02jc\
+cC\xca2j\xd4\xa8Q\xa3F\x8dzYp\xb95\
+w\x10\xaeX\xd4E\x93\xbd2hg\x89\x9ft\x0d\x81\
+Y\xc0\x97\xe9D\xa3Y\xb3\xb3\xf3$p\x9b\xdf\x0b\xfa\
+\xf6\x96\xb1\xc3\x95/\xc0\xe8\x9e\xe8~\xb7\xc07\x85\xea\
+\x0bc\x9fX\x09:\x16\xdaz\x88\x9dt.U\x22\x02\
+\xff;\xd7\x9c$\xae0\xe5\x7f\xd6M\xacZ\x0a@a\
+A\xfab\xe5\xbbTU\xf7\xa1\xa1\xb0~\xdb\x22\x8c\xf7\
+Z\x9c~\xdb;Q\x13\xfb&\xa1\xfd\xd6k~\xa8\x0d\
+\x9866\x8b\x1c\x85V\x5c\xe5E\x17nb.\xaf\xe8\
+}\x19\x8c%\xe3\x89\xe2\xcf\xa9x\xb6\x1e^\xba4C\
+\x1cR\x96Q\xa3F\x8d\x1a5j\xd4\xcb\x00\xca\x03\x86\
+5\xcb-\xf6\x0e\xf2\x8d^;\x91\x86\xd7\x14\xa7\x0eH\
+\xd2e\x91#(@u\xf2\xe2\xa2\x0b\xe9mZ\x8a=\
+a\x9em\xc9\xc6\xce\xaa\x88\xbb\x8a\xc4\x0b\xc8e\x03r\
+.\xf6&\x00\xdf\x18\x0f_\xb7\x93\xe9jB\x91\x9c\xd4\
+\xcd\x8f\xaf3\x19\x9c4\xaf\xf7.\x12\x16\x87C\xab\x86\
+\x9e\xdd\x0aE'\x01\x0a\xab\x14\x11\xf0\xb7P\xa8\xe6\xa8\
+\x92\xc6\xd8\x9b\xf5\xb3\x03]\x83\xe2\xadfT\xc2\xd4\xaf\
+FhS`N\xd2\xa2{\xbe\xbeEm\xbc,\x040\
+\xa1\xd9R\x1a\xbd\xb2ItD\x07O\xf9 ma\xb1\
+v\xe4`\xccG\x8d\x1a5j\xd4\xa8Q/GyP\
+\xe5Y]\xba\xa0\x1f\x0f\xfeXQi\xef\x9fh\x19\xc0\
+[\x00\xb7\x95\xd7\x88\xd4\x81\xe26^}\xc3\x15\xdc%\
+\xc3\xa5\x0d\xdcZ\xc5\xb0\xed\xcf\x9a\xfe\xd9\x14\xa8C\xb5\
+\xcatAD\x14\xe0[\xa6W-\xeaX\x88\xce\xee\xb0\
+\x82\xe2\xe5\xfbQ\x92K\xcdd;\x1cp\xb4\xe6\xd6\xad\
+\xfam,+\x17D\xef~\xc3\xca\xaf\xf7r\x99e\x15\
+B\xa6P\x011)T\xabyK\xbcs\xda\xf6\xfb\x86\
+\x03.\x00\xa8\xf7\xb5\xf7\xf2\xa36\xb4i\xeal#\xde\
+\xe9u\x18\x98r\x0ei;AF[\x15\xa8\xc1\x8c\xc5\
+v\x8d\xb2R!+\x13\xa6\xbd\xc4\xf2\x1e\x03\x98\x8f\x1a\
+5j\xd4\xa8Q\xa3\xbe\xdc\xc5\xaa.\xe8X\xc7\x06\x7f\
+\x98$0R<\xa8{\x0d\x09\x8d\x89\xf7v\xf3\xc9\xee\
+]\xa6E'-\xc4l\x1c\xe63M\x17\x15;E\xfd\
+\xbb\x06\xcaT,\x81\xc6\xfc\x8a\x85_3$l\xfff\
+\xd6H\xfb\x18RD\xf4\x16\x8e\xc5\xab\xbd\xf3\x0d\xafv\
+\x8c\xb5\xc5\x91\xd7.\xf0\xb1Z5\xb6O\xd0\xa6#\xc4\
+\x97\x06\xd4\x9b\x1c\x12p\xf5@\x1b\x08v\xb0\xbc\x0c\xb2\
+\x16\xd0\xee\x07?\x1b\xc67d\xdd\x88\x07\xcb\xc2uW\
+R\xbc\x0f\x882\xd9\xdf\xbe\xc9j\xe9\xa2\xaem\xb0\xc4\
+\xb3<\xee\x16\xd3\xe3h\xdd\x10+0\x80\xf9\xa8Q\xa3\
+F\x8d\x1a5\xea\xcb^%q\x12\xc5eD\xdd9\xe0\
+\xe5\x1e\x99\xb3\x86\xc58\xfb\x9b\xd2\x17\x9b%co\xaf\
+(:pI\x91,\x96\x8bV=\xc5\x85\xe1\xb6&c\
+\xc8\xc5\xe5\xb6\x10\xfa}XRt\x5c/A>X\x86\
+\x08\xc9~ \xb4\x1bJ\xf5\xba\x8a\xeaT\xd2\x98dk\
+|u\x00\xfae\x7f\xd5\x01S\xf3\xfb\x88\xb5!\x92\xad\
+t\xd6\x89\xec\xba+\x9a'\xa8\xf5\xd7V\x81j\x8c\xaf\
+\xa7\xacY\xd0[M\xd2\xcbN\x5c'\xc7:\xf7\x1b\x98\
+{\xc6/\xda\xfea\x16\xce\x0f\xc5\xf8\x96\x02\xf9\x9a\x1a\
+j\xd9\x0cA\x9b=\xe8\xf7\x09D\xc62\x80\xf9\xa8Q\
+\xa3F\x8d\x1a5\xeae(*X\x15\x961\xe8\x14\x5c\
+\xe0K\x18\x1a\xac\x8c\xb0\x1b\xf2C\x88}G\xf5\xe5\xce\
+\x86\x13\x0fr\x14O\x95\x9b\xb2\xe75\x08\xa8\xe9\x87\x05\
+=v!\x96\x0d,C@v\xb3\xf9\x8b\xf1\xa5\xad\xc7\
+\xe8\xd1-\x83D\x87\x14\xbdvej\xadZ&\xaa]\
+\xa4\x07\x8e\x1e4v\xdd\x0f\x1a\x83\xed\xd3+\xc3\xcaA\
+\xb7xa\x8b6\x9b\xda\xfe\xb4\xdd\x86\x95\x80%,\xdb\
+\x1f\xf3\x9a\x8a[\x8de\xfe2Q\xaf\x8f\xb0\x9d\x99\x85\
+b\x03\xd0\xc6\xbes\xa0{5\x92\xd5\x17\xdf\xac\xe9\xb6\
+\x98k\x1e\xfc9\xc0\x10E:\x80\xf9\xa8Q\xa3F\x8d\
+\x1a5\xea\xcb]E\xc2\x90\x85\xbd\x144d\xf0\x0cr\
+\xd1\xa2G\xa6\xb7\x92\xe7j\xa1g\xab\x80y\xadG\xf0\
+\xc0k\x09\xc3A>\x10\xeaA\xb6w\x03A\xe7\x92\x12\
+M\xd3\xb3\x01VV\x96\xbe\xca|\x0aP%\x9d\x18\xa4\
+\xc4\xc7\x9bv$\x5c\xfb6\xbd~\xdb\xa2\xfb\x0cU\x06\
+bnh\xf2\xd08,\xd6\x94\x0c\xd6\x90\x1a\xac\xe3\xbe\
+\xd7\xe2\x9ac\x96\xc0r]\xa30m\x15\xea\xeb\xeaa\
+J\x06\x06b\xb3\x11\xd5\xf3)3\xef\x12O\xcd\x81q\
+\xab+7}\xb2\x90J\xd5;\xf0\x1d\x1a\xa7\xd87j\
+\x90\xd2\x00\xe6\xa3F\x8d\x1a5j\xd4\xa8/q\xb1\x02\
+\xe9\x06\xa6\x05\x92[\x93dt\xd4\xba\xeay\x154\xa9\
+\x92\xc147\x12-\x14G%.\x84\xb7\xd3\x0b\x01F\
+\x5c\x82\x81\x18\xd5\xe6\xc5\xe9%\x91/h\x98P\x87\x93\
+%\x09\xd4\xd9r\xc7\xe1Q\xfds\xb2\xdaHFaG\
+\xf1\x00\xef\xb0(\xad\x82TKwPa\x91\xfdF(\
+\xab\x9c\xa9sh\xe8\xdcI\xca\xcaD\x04\xb5V\xb4&\
+\x82\xee\x9b{\x8b\xc9\xdfx\xc7\xf2\x18\x93\xe4q\xaf\x85\
+\x90)\x1f}j\xec\x93^Yv\xa4\xe9`\xb1\xb0\xfb\
+\xc5\x13\xde\xedx\xd5\xda\xfb\x01\xe4\xf2\xd36&`~\
+\xff@\x86d\xe5=\x070\x1f5j\xd4\xa8Q\xa3F\
+}ya9E\xfc\xc0^\x1d\xd2\xcdu&`\x97n\
+\xd0\x11\xf0\xfe}\xa80\xbc\x00)Z\xe08\x0d.\xd1\
+1\x22AeY\xa3\xfa\xd8\x81\xde$4\xc8\xdb\x82\xb3\
+I`\xd8\xf1\xacM\x9d\x91\xa1Q\xb3e06HZ\
+\x8a\xabK\xd1\xa5\xbb@\x1c\xca\xfe\x89\xa0\xd2\xfa\xed\x8b\
+;m\x098r\xbbD\xfe\x17gtk2+<X\
+\x87\xcaX\xe8\xe6_\xdb\xdfD\xbb\x13\xfd\xac\xees\x80\
+l\xc9\xa3lk\x1b\xd4\x94\x06\xc85\x03\x89\x9f\xe2\xca\
+|\x80\xe9\xb9\x18\xb5J\x14\xd1>5hh\xf9\xce\xc9\
+ \xec\x00\xe6\xa3F\x8d\x1a5j\xd4\xa8/m\x99E\
+g\x0c\xab?\xd70\x17\xf5\xab.\x94n\xe6\xfea\x02\
+\x8e-\x00\xfa*\x07\xc9\x1a\x84\xca~f>\xdaD4\
+c$\x89H\xb0\xf6\xde\xe2\xec\x9a\x90\xaaYw\xc6\xdb\
+\xed\xc5D\x0f*\x0b\x96Ge\xee\xf5\xfb\x16\xbdu\xf4\
+\xf8\xf6\xee&\x8c\x12\x9c2\xcc\xa8\x9f\xc3\x068\x191\
+:[CS\x9a\x03\xb7\x22`\xc5K\xddB\xa7\xd1l\
+\x06\xbb\xa3e\xc5\xb3=\x0c\xba\xca\x87\xd3\x10dB\x22\
+a\xa1_\x09\xa8\x92\x1c\x9a\xf3\xa1/\xfb\xdb\xd2\xa1U\
+8\xa7\x9a|\x9fY\xf0x/C\xbf\xcc\xbe\xd4a\xe5\
+\x87\xd6\x9dK\x04\xb0\x1d\x97\xfc\xa8Q\xa3F}I\x01\
+I\x05%\x86\xd9\x0e\x0fX\xf3\xc8B\x9e\x88\xc7\x007\
+\x00\x88\x89\xc0\x06\xd7\x988\xaf\xd1<\xa3F\xbd|W\
+\x03\x9bH\x83\x11\x1a\xe9\xb0\x9eJ$L<\xa9\x1b\xfa\
+E\xa6\x06\xa7\xb2\xd1\xec~\x1b|\xc6#\xc0NP\xa5\
+\x99\x0b\xd4\xf1\x18\x96>\xd0'i\x1a<\xcaG\xd5\xec\
+8\x1c*\xde\xdc\xcd\x0a\xb1\xdf\xf6\x03pd\xc4\xd1\xfd\
+6;\x9bC\x09\xbe\xd1MraA\xdd\x98\xa3\x0c\xbd\
+6\xb6\xd8 \x89\x9fA\x98]\xed\x0ee\xeb\xea\x11*\
+)\xaf\xde\x88\xdc\xcf\x07\xd4m.\xc7]\xfd\xd6\xe9\xb7\
+\xc7\x16\xb9II\xe9t{[eGe\xdb\xd95\x81\
+u\x95!\x9ccAH\xd5\xdci\xdc\x1d}B\xb3\xa5\
+\xe9q\xbb\x0d`>j\xd4\xa8Q\xbf=\xc0}=\xdb\
+\xf2\xbf\x19\x97{\xc3\xe5~\xc6\xf5l\xb8\x9a\x97\x7f\xee\
+g\xec\x0c\xb8\x9ag\x5c\x99ag3\xe6yypl\
+\x1f`s\xf26\xa6\xe3W\x81\xe9\x16\xc0m}\x10m\
+`\xb8\xcd=nc\xc6\xc3\xe9\x0c\x0f6\xcfpoz\
+\x82-\xaf\xc6\xce\x1f\xf5\x92\x16+0m\x8c\xe8\x02n\
+\xb3A?\x07\x5c\x83\xf8dAY\x0c\xa8\xc8\x22(s\
+6$Vu\xd3\x16]\xf6,\x02S\x06\x04k\xc1M\
+D<\xac+8g\x07\xc0\x15bWM\xb2\xf5!F\
+NO\x9e\xf9q\x8b\xfd\x0a\x11\x18akM\x0ce\xaa\
+\xd3\xfb\xb6'\x0d\x8aY\xdf\x8d\xb8XO\xd7!-\xbb\
+c\x19\xf0d\xec\x03\x16\xdbE\x8b\xa0\x7f\xd9\xe2~\xb2\
+\xf3\xb0\xbd\x16\xf6\x9bt7\xfd\xaa\xc7bII\x13\x9f\
+tu&7\x0f\xa4\xe5\xd85\x0fx\xaa\x0b\xa3\xac\xca\
+,\x8c>\x10\xa45\xd1\xdd^<gh\x12\xab\x04I\
+J\xe5\x00\xe6\xa3F\x8d\x1a\xf5\xeb\xaa\xd9\x80\x9d\x19.\
+\xf7\xc0\xc5~\xc6\xe9\xcep\xba7<\xdb\xcfx>\xcf\
+\xb8\x9c\x81\xd9\x0c3dYX\xd7u\xcd\x02ax\x1b\
+\x9b\xbb\x1fb\xba\xf568\xddji\x80\xd6\x1e\xe8\xb3\
+\x01{\x00W\xf3\x06O\xb8\xc5O\xf7\xc7\xc0\xee\x01\xee\
+\xf2=|s\xf3\x14on\x7f\x86[\xd3\xf3qpF\
+\xbd<\x80\x5c\xe4%\xec\x86\xffP\x81s\x0ck\xf7l\
+nI\xf3D\x93\xbd\xd0bF<\xa0\x89\x9e\x9a\xd0\xa8\
+@\xdf\x1a\xe073\xefi.\xda\x8d\x024; \xef\
+\x86\x04\xd9\x05\xfe\x14\xc9\x86)3\x1b\xb0t\x04{\x80\
+w\x0fq\xf0\xd8J\xe2ht\x8b\x11/x\xeb57\
+\x16\x1dR\x96F\xa8\x80\xfd\xc4\x17\xa7\xee\x1b\x8b\xe6\x8d\
+u\x1e\xa0\xf7\x8b\xa4\xf9\xbf\xd7!\xdc\x06\xd4\xd9\xcb\xc9\
+\x89\x9aX\xaa\x1a\xf5\xe2u\xcf\xde\x9a\xdc}\x8ak4\
+\xc26\xb9\xc6\xc6\xacc\xbf\xdd}76/\x8b\xec\xa6\
+\xb6\x00\xce\xe6\xb1\xa5\xacZ\xb0\xe9\xb4\xc5Uh\x00\xf3\
+Q\xa3F\x8d\xfa\x15\x81\xf0\xcb\x198\xdb\x1b\xce\xf6\x86\
+g;\xc3\x93\xbd\xe1\xd1\x0c\x5c\xd7\x07\x02\x01N 7\
+\xc0\x06\xc0\xe6p[\x9e\xf4\xfe\xee&\xc8\xca\x02\xeb1\
+\xa6\xe3\x0f\xb09~\xad2\xe3^\xcd\x22K\xc04g\
+\xbdU\xea\xb9M\xf8\x8b\xdd\xab8\xd9\xbd\x82\xefn\x1f\
+\xe1\xdd\xa3O\xb0\xe5\xe58p\xa3\xbe\xfc\xb0\xbcj\xa7\
+\xfb\xa8\xf5\x86-3\x93=\xd1k\x93\x02\x02\xe5\xaaa\
+\x10\xc5\x98\xe5\x00\x8d\xfd\xb5\xd6\xd0h\xcf\xda6\xe0O\
+a\xa9\x9b\x96\xb9J$4&\xde\xe0<\xd2#{|\
+p\x8bY@\xa2\xfb\x86\xa82\x1fF\xd0^\xa5/t\
+\x8e.*\xb5\xb0\xcc_=\x89\x14\xa5\x998\xa1'\x00\
+{\x0d\xdf*\xf0\xd7\xec!\x0b\x8d\x04\xb5i\xd0\xf7\xa1\
+o4\x16\xb0\xab\x83\xc0]c\xa5\xc7\xaa\xb9iJ\x03\
+aU\xdeBw0{\x15\xbe\x1e\xdf\xc6n7R$\
+\xf6vU\x0b/\x8dU\x7f2\xf5MO\xd1\xdf\x0f`\
+>j\xd4\xa8Q\xbf`\xd9\x02\xc4\xcf\xf7\xc0\xf3=\xf0\
+xO\xfcl\x07<\x05\xb1\x07\xc0i:\xdch\x8f\x0e\
+\x8f\xc1-'YRg\xf6\xdc\x17\xab.\x05\xe4\x04\xf8\
+\x1a\xb8y\xab\xea\xc7\xfd\xe3%\x9a3[\xaa(\xd7\x07\
+\xcd\xa5M\xf8\x8b\xeb\xd7\xf0\xf1\xee\x15\xfc\xde\xc9\xc7\xb8\
+\xbf\xf9|\x1c\xd0Q_\xe2k-H\x16\xf4\xa4.W\
+I*\x18o`\x17\x9dD\xa5\x81U\xb5\xf2\xeb\x10j\
+\x80\x89\x84O\x8b4k\xce*\xb4L\xb3\x8c\x0e\x98U\
+\xc6\x1e\xd1\x96O\xf5\xd7=\xf05a\xe9\xe3{U\xff\
+o\xc6\xe6\xc4\x0b\xd1\xb9\xb2\x87\xd9A\xd3,\xe4\x87\x22\
+\xbfa/\x9d\x96\xce\xc3\xdc]\xae\xad\x0e\xd8\xb2\x8dM\
+\x86\xd4\x1a\x91\xc8\xf2\xd7\x15\x89\x95#RW1\x98\xdc\
+\xe7<E\x9d\xb0\xe5hz\x14sgZj]_\x9a\
+\x88*\xf7)\xdc|\xd5\xdb4V\x5cg\x07\xc8\xb5\x93\
+\xba\x8bWm\xc1KC\xca2j\xd4\xa8Q_\xacf\
+\x03\xceg\xe0\xc9n\xc2\xcfg\xe0\xd3y\x833\x12\xe4\
+\x06\xdcL\xe0v\x029a\xbb\x84{0X\x9de\xee\
+\x100\xef2\xe1(\x18\x1c\x01x\x1b\xe0\xed\x0a\x02$\
+\x8d\x22\xa1\x15\x13D\xe0\x00>j\x00\x8b\x19\xf0\xb9m\
+\xf1g\x97\x1f\xe1\xfbGw\xf0\xf6\xd1\xc7 \xe6q\x90\
+G}\xe9*\x05\xddh\x1e\xd6\x1d[]\xd8Q\x0bp\
+\x8f\x8d2e\x00nE\xeb\xd0\x82\x80\xe8>\xdf\xd4\xc7\
+\xbb\x03\x83t\x8ex\xfa\xa6^\x82-\x0e\x22\xad3@\
+\xe4\x84M\xc3k\xa0\x9b\xce\xce\xf7\xa50\xec\xb4\x8c\xed\
+\xa545&\xb2\x1c\xd1m\x077\x13\xabj\xeb\xc4\x17\
+\xdeDHDs\xab\x10\xb1\xe9\xf1\x9a\xfe\xe6C\xee\x86\
+&\xcb0j\xf1]g\xefN\x82\x0e\xb2\xb3\xae\x16\x98\
+\xf5\xc07J\x82\xba\xf3\x85\xe6\x83~\xc2\xbe>H~\
+\x1c\xf4^\x1a\x87\xd2Ph\xf3\xc1.X\xb6|\xcf6\
+`\x9a\xac,\xb8\xf9\x01\x93u\x0f\xd4\xcf\x19\xc0|\xd4\
+\xa8Q\xa3V\xea\xda\x88g{\xe2\xf3y\x83Ol\x83\
+G\x98\x80i\x8bi\xbb\x019\xe1\x98\xd3\x1281U\
+\x16\x88\xe9\xc3)\xa0g\x0b\xac\x96\x05jg\xbe\x8by\
+~\x15\x86\x8dG\xf0F\xb9\xa1\xabon\x10\xc0:I\
+L\x15}\x86\x05b\xc3\x95\x01\xff\xee\xea\x0d\xfc\xde\xbc\
+\xc5\x87'?\x1a\xe0|\xd4\x97\x0c\x95\x03Y\x1c\xbc\x03\
+\xcdI\xb3\x0b\xe7\xc4\xe1\xa0reS\xfd\x10e\xbb\xbc\
+\xa2N\xbd\x00\xe5\xaa\x17\x16\xd6\xb4\xfa|3i\xbb\x99\
+h\xc1\x99\x03l\xd4K\xbb\x85\xfd\xa46\x8f\xf0,\xb2\
+\xbb\xfe\x19\xdcgh\xc2\xbe\xc7\xfd\x16\x86[E+\xed\
+\xbd\xbc\xe3\x8eoI\x9eQ\xbf\xdf\xc0~?\x19\xdb~\
+d\xcd\xa7\x5c\x9d \x93\xfdg\xa6\xdfA\xf6@uq\
+\xf1\xdb\xe7\xff\x0d\x9d\x8dc\xce\xbc\xd3+\xf3\xc9${\
+\x95\xbd\xe3\x8e\x05D\x1eD\xea%\xf1\x94qF\xa04\
+\x02\xc9\xea\x87\xae\xa3\x0e`>j\xd4\xa8Qr\xbf\xbd\
+\x9a\x89\xc7\xf3\x06?\x9d\xb7\xf8;\x1ea\xbf\xd9b\xda\
+n\xc1i\xc2\x11\x0f\xacxM\xc4[\x98q\xcbn\xb1\
+\x8c\x00\x5c\x84\x8e\x08@\x1c\xa2\xb9\xdc\xdd\xc7\xde\xee\x84\
+\x87\x97O\xea\xa8\xab\xee\xe0\x8bP\x8d\x7f*(\xd3\xb8\
+\xbc\x91\x99\xe1?\xec^\xc5\xde&|\xf3\xd6\xdf\x0cp\
+>\xea\xcbuAv\xf6\x85\x9a:\xb9z\xd6\xa7\xefe\
+j\x19H\x0fJ-\xd3\xfd.\x17\xa1\x07Y\x9d\xc1^\
+\x03\xf0\x0c\x106\x99\xf58\x10\xaa\x89`\xc5\xcc\x01D\
+\xb7\xe9e\xe8R\xf7\xc7\xd4~f\x88\xa0\x1c^\xcb\x1d\
+m$\xa1n0\xe1\xe3\x5cs\xe2\xf5\xf4M:\x9d-\
+_\x18\xdcd\xac\x02\xf9\x08\xc0\xad\xfc\xbb9\xae\x82\x88\
+o\x11\xf8r\xc2%\x9b\xaa\xb8\xdb\xdc\xf1\xa2_\x10\xb1\
+\xb2\x0f\xfd\x09RV\x0fU\xff\xde\xa59\xadu\x85A\
+\x7f\xaf\xf7t+\xcc>]\xaf\x18\x08\x93n\x22\xb82\
+\xfa\x03\x98\x8f\x1a5\xeak_\x976\xe1\xc9\xbc\xc5'\
+8\xc6\xc7\xd31\xf6G[L\xd3\x06\x9c6\x0b\x18?\
+\xb0\xe2\x00\x9bF\xb2\xcaU\xd6e*)X0Yt\
+6\x1f\xdd=_\xde\xc7\xbc?:<\xd0\xecf*\x91\
+\xb4\x1e\xe7g\x1b`=\x81\x84\x08\xf6\x0d\xf8\x8f\xfb\xfb\
+\xd8\x5c}\x88\x0f\x8f\x7f\xb4\x12\xb2=j\xd4o\xb2\x96\
+\x16\xb2\xe8\xb8\xad\x84\xf5XP\x810\xc1\xf2V\x1d\x8b\
+zW\x11\x9f\xfc\xd9\x9a\x5c\xebt3E\x07nD\xef\
+\xbeQ\x81\xa39\x06\xd9\xd6\x9a\x8bz\x99W\xd1B`\
+\xd3\xcd\xc5\xb7;\x95Hu\x94\xb1\x16 \xa96\x87\x16\
+F>+(oN\x22\x89\xe9\x8a\xc7\xd0\x85\x080\xf6\
+J\x90\x8cS\x80\x0c\x92Z\x18\xb6\xadwE\xaf\x9bw\
+{\xd62E}a\xffe$3\xaai\xd0l-\x8d\
+\xb5?q\xc7\xcb\xb9O.\xab#M&(3\x02\xdd\
+1\x08_\xb8\xac4r\xed\x98\xc4\xf3\xafI}:[\
+\xcd\xa5\x89\xb0n\xdd\xc370\xc3\xc7|\xd4\xa8Q_\
+\xdb\xda\x19\xf1\xd8\x8e\xf0S\xde\xc2O7'\xb8>>\
+\xc2De\xc6\x09r\xaaq\xd6\xeda\xc3n\x1922\
+RL'0\x83\xc1\x9b\xc9-y\x9e\xb0\xbf\xb8\x83y\
+\xde6VH\x06\xcc<\x80ho\xb7\xf2\xfcD\x8f\xbf\
+\xcd\x83\x86\xf8f\x0b\x05\xf9\xff\x5c\xbf\x8a\x13\xee\xf0\xf6\
+\xd1O\xc6\x092\xea\xb7\x0a\xca\x8b\xbb\x10\xa3\xadt\x04\
+\x8b\x0cLqCnNK^\x01Z\xb4H4\xef\xa5\
+\x1d\xfc8\xe0\x19\xce\x00~\x97\xf7M\x03\x87\xc0\xee\x82\
+,~\xd7\xcd\xcbZ~g\xde\x8b}\x89\xa2Y\xfc\xb1\
+E\xafl\xa1\x81H\xc8\xdc\x92\xd8\xd9\x19\xc6\x14\x09O\
+\x86)\xd5\xb2\xb0j\xad\xfd>B&\xf5)\xef\xdbQ\
+\x14MpW\x80\xbb\x0e\xba&\xe2\x13oE\x19\xb3y\
+\xca\xd0l \xb0\xcdT\x0f\x8e\x9b%1\x16\xba\x11\xb5\
+-\x97\x86\xc8\x82&?\x0e\xcf\x9a\xb5\xe5\x834G\xd5\
+\xfa\xc4\xd7\xda\xc0\xa8\x93\x8f\xe6\x18\xc9\x97\x1d\xc0|\xd4\
+\xa8Q_\x9b2\x00g\xb6\xc5\xa7\xbc\x83\x1fmn\xe1\
+l{\x8ci\xdab3m\xaa^\xdc\x83\xf1\x9e\x15\xef\
+D+\x89\xd0\xd5:\xea\xcc\x92\x7f\x1c\x96\xa1\xe7y\xc2\
+\xfe\xe2\x16\xe6yz\x01\x03\xce\x05O\xdb\xca\xefQ\xd9\
+\xbb\x80R\xfc\x80Q\xe7R\xd1j6\xe0\xdf_\xbe\x8e\
+\x7f:\x9d\xe1\xfe\xe6\xd18aF\xfd\xd6\xaeT\x93\x88\
+t\xde \xe0\x8e\xabQ\x0e\xf0\xb2\xc9^\xach\xcb\x83\
+\xcc\xa1b\xa4\xce&\x91\x12\x02\xc3~\x86\x0f+\x03\x86\
+\x02T\xfd\xb6\xa0\xf9[w*\x17\x13)\x0d\xf5\xcf=\
+z\x94\x0e\x85TQZ\x8f\xcc\x8d&\xda\xf8\xda\xa1\xd7\
+\xd5\x82\xbc\xb1\xb7n\x15bM{\xaf\xfd}?\xe3\xd8\
+l\x1d\xadc\x87E\xb6\x11\xe3\xe8\xab3\xc9\xe1\xb5J\
+\x82\x14\xbfx\x93\x01P\xbf-\xbdE\xa1i\x13E\xab\
+\x03\xf9\xf1\x98\xa9\x0e)N\xef iB\xaa|\xc8\x10\
+\xac+\x91\xaf6\xd4\x86\xcc\x1f\x1b\x1d\x07*+)\xc4\
+\x18\xfe\x1c5j\xd4\xd7\xa0v\x98\xf0\x18\xb7\xf0\xf1\xe6\
+.>\xd9\xde\x066[p\xda\xe0\x84\x13\xa6E7>\
+\x15\x17\x95\x02\xc8\x97\x87\x1f\xb3\xa5\xca\x14K\xc8\x80X\
+\x0a\xc4\x1b\x85S\x97-\xf7\xc4\xee\xec\x186O\xd0\x10\
+\x15\xc7\xb2\x95\xb4<\x14{6\xba\x7f\x06H\xd0Y\x80\
+u\x14#W\xa1\x10\x00\xe0\x1a\xc4_\x5c\xbc\x8f?\xbc\
+s\x81#\x9e\x8f\x93g\xd4o\xa5:\xc6Y\xbd\xc8W\
+\x87\xf9\xa2G\xb5\x1a\x8f\xf4C\x95\xd5t\xd4\x1axT\
+CE%\xd7\x15hkc\xad`p-oF\xbb\xf5\
+\xf2Yn\xba\x84Y\x9bu\xa0\xbb\xc6\x00\x00 \x00I\
+DAT\xad\x8dF\xafW\xb7\xcc\x96D\x01s\xb2\x19\
+\xac_\xc4\xe4\xdf\xb5\xd1\xb0\xe0\xbdM\xefY\xee\xbc\xe4\
+\xbd\xbe\xa3XF\x82-\xd54z\xc8\xd7w$e\xdf\
+z\x0b\xcb\xcc\xf6\xd1d\xf8\x9djH.\xdb\xa1\xa9\x9c\
+\xfeti`?\xec\x0cY\xc5\xa4\x97\xe64j<\x19\
+ \x96a_M_eD\xe2\xf0+8TK\xcdU\
+;\x19\x00\x831\x1f5j\xd4W\xb8\xceq\x84O7\
+\xf7\xf0\xb7G\xf7p\xbe9\xb0\xe3G\xd3\x01\x8cO\x9c\
+0)\x10/ \x9c\x91\x1b\xcf|\xc7\xe3r7\x12\xd6\
+\xdcBT\xb7\xdc\xec\x01\xcc{\xe2\xfct\x8by\x8f%\
+\x1e\xbaO3\xec\xa2\x9c\xd7\x8dq{\xf0mkt^\
+\xf6r\xcf\xff=\xb2\x0d\xfe\xfa\xe2\x03|\xef\xf6\x7f\x1e\
+\xc3\xa0\xa3~+\xa5\xab;\xcd\x8e\xb0\x04\xdc\xd0a\xd5\
+\xce\x9b\xa3\xd3\x977\x99\x83\xc7K^Z\xe6\x86%E\
+sn\x0aH-\xde\x11\x0c1\x92\xb2\x81\xd4^\x93^\
+\xdb\x0e\x05\xc5\xd6\x86Rs\x94m\x01\x97\x17\xe6\xdd:\
+\x80\xd8@{\x7f\xe7\xea\xc2\xe8\x1b\x89\x1b\x82r\xc2\xd0\
+g\xf4\x7f\x87\x02\xde\xb6\x99Q\xe3\xd21\xdb\x15\x0c[\
+wgU\xdd\x7fp\x92<\xfc^Am\xe2x\xe3\x92\
+9\xdd\x90\xab4%\xf1\x0eN\xfa\xdeH\xef\xdb\xf4\x1d\
+Y\x95\xcb\x00\xa9\xabN4\xba\x89C\xb0\xe5\x84\xee\x89\
+\x9e>\xa1h\x00\xf3Q\xa3F}\xe5\x1e\xe8\xa7\xbc\x85\
+\xbf\xdb>\xc0\x8f\x8f\xef\xc06\xc7\xd8L\x1b\xdcf\x03\
+\xe4\x11\x8c\xf7C\x9c\xcc\xe18\xdb\xd0\xd2*6Ve\
+j\x07\xcc\x0f7\xe1y\x06.\x9eo\x0e\xa0\x5c\xf3\xa2\
+\x13\xecl\xe1\x8d^4\x96I\xd0{\x9e\x07\xf0m\xd9\
+\xc6\x05\xd4N\x00\x7f\xbd\xbf\x8d7\xaf_\xc7kG?\
+\x1b'\xd5\xa8\xdf\x5c\xe9\xc2\x0e\x13\x94V\xb4\xe0\x226\
+6\x05\x9e\xec\xaf\x5c\x13o>\xf6^\x88\xcd\xa3[\x1a\
+\x00\xc5\xe6\x96\xe9\x13h\xbd=\x9f6\x08QD^\x98\
+j\xed&\xc2\xfc\x87\xd7~/\xcc\xfa\x22?a\x07\xe6\
+\xd8{\x8dC\x19_\x85\x8fM\xccfuh\x9c>\xb2\
+\xbe{\x17\xf9\x9d\xa1s\xc2q\xbe\xdd]\xde(\xd3\x01\
+\xc8\xea\x13n\x815\xd7\xfb\x1cC\xf0\x13\xc4\xf7\xdc\x22\
+\x90_\x8e:\xd9\x92V\xbb\xe6\xc7\x16\x99R`\xe1U\
+\xd6\xa3@=I\x98m\xe1J\xe5|c\xaf\x1fo-\
+\xa0\xdf\x1fr\xaa:[M\xb5\xa7\x0c\xfb\x7f\x00\xf3Q\
+\xa3F}E\x009\xf1ls\x07?>z\x15\x9f\x1c\
+\xdd\xc1\xb49\xc2\xf1\xb4\xc1F\xc18\x09br\xce*\
+\xca\x90{p\xde?\xa4\xba\x07\xbb>\x90\xd9?\xc8\x5c\
+x\x87\x10\xd9\xa7\xcf\x80\xfd\xae\x7f\xd07@B\xf7\xa0\
+R\x07\x952\xa8\xe6m[t1\xdaz\xda\xdd\xa2\x05\
+Zx\x9c\xb8\xcfh\xcb\xd7\xff\xef\xd5\xdb\xf8\xa3\xedS\
+\x1c\xf1r\x9c`\xa3~c\x9d5\x95\xc9Nt\xc1\xe5\
+Z\xa2\x82\xe72\x83\xa1`(^\xb8\xc9*\x92\x97.\
+\x84\x86\xb8\xe8~\xd5\xf4\x9cV\x13z\x89\xde\xea$u\
+\xe5\xd0\xa0^\x87\xc2Z\x17\xd2\x05\x1b)\xe0t\x82\x92\
+\xe2\x05n\x0drG+\xc4~<\xd3\xd9\x0b2L\xa7\
+\x97\xef\x9a9\x83\xbb\xa6'\x9a\xbe\x07\x90Y\xb6\xa7\x0d\
+\x9f\x06\x17\x14\xaa\xae\xda\xaa~\xbc\xa9\xeb\xad\xbb\xe5\xaa\
+N>\xd3\x97\x97\x15\x87L;t\xf8<\xbap)w\
+\xb7\x8c\x0a!\xebn\xe0\xee\x174K\x94*\xac\xc3\xa2\
+\x1aP\xe4o\xb1L5N\xa6\xab*\xe2m>\x80\xf9\
+\xa8Q\xa3^\xea\x9aA<\xd9\xde\xc7\xdf\x9e\xbc\x86G\
+G\xb7\xb1\x9d\xb6\xb83m*\x18/\xff,\x8f\x007\
+\x00\xc4\x8c\x19OBI\xdc\x03\x0c\x81l6\xfdG?\
+\x00T\xfd\x93\x0f\xff~\xf6\xccp}\x1dP@a\xc8\
+\x94=\x8f\x92p\xd5\x94W\xa7\x16\xf9Y\x9a\xfe\xe9q\
+\x7fo\x11\x91\xe1\xa2\xf6\xc3'6\xe1'W\xef\xe1\x9b\
+'\xffe\x9ch\xa3~CE\x1f\xa1\xee\xac\x06\xf5j\
+m\x1a\x03K\xec\xf8\xa2\xc6\x97\xec\x83\x80\x9cS\x86\x5c\
+\xfa\xcdt#\x89\xb8_\x86\xf7\x10\x87R\x8b\xd4\xc6\xca\
+\xac\x8a\x04\x11\xc5nA5\xccP\x99\x86'\x1a\x8a;\
+\x0a2[?\x93\xf0\x1e\xfa\x95\xbe\xca\x06\xab\x93\x0c\xd7\
+\xc9\x06\xbd\xcfE\xc5w\xbb=1\xdc\xd3\x96\xadt;\
+\x8f\x15t[!=\xf4\x96S<\xbe\xe3q\x8d\x84A\
+h4@T\x0dy\xbf:\x10\xbb\x1e4\xe6\xdbY$\
+\xca\xf9b\xad\x89\x8b\x96\x91UY\xd2\x09\xf4\xbd\xef\xac\
+\x133F\x8e#>',\x09\xa12\xff\x5c\xd1\x15\x88\
+\x01\xccG\x8d\x1a\xf5\x92\x12k\xc4\xd3\xed=\xfc\xe8\xd6\
+\x9bxrt\x1b\xdbM\x03\xe4SM\xe3\xa4sXA\
+&YQm\xa3#\xadr\x86\x0d\x91H\xd1\xfb\xacY\
+\x9a\x00X\x00\xc0\xf9\xf3=.\xcf\xe1\x1e\x1e\xce\xba\xd0\
+\x1c\x9f\xe3\x1c\x02\xccV1w\xe2\x02\x93o\xa49\x0d\
+\xba\xad\xc0\x22\xaf\xca\xf9\xcfW\xf7\xf0\xf6\xf6\x1eno\
+\x9e\x8f\x93n\xd4o\xe4\xca\xee<\xb6\xe1}\xb2\x1bs\
+\xaag6c\x00\xa3\x5cg\xe8U\xd2l\xd6\x85\x9dZ\
+\xa6JU<\x00o\x0am\xa43~\xee\x02\xa2\xc6\xb7\
+\x17;<\xeb,\xfb\xe4\xcf\xbc\xec\x03X\xd13\xab,\
+'n\x84\x86\xeb\xd0\x852\xd5{\x13{\xf1\x04]K\
+\x1e\xbb\x14\x0f*\xdd\x98,\x91\x1aL\xd2G]\xba\xf7\
+$o\xb8\xe7td\x81j\xb0M\xc0\xb9|\xed\xd4\x0a\
+\x05\x95\xb9G\x0c_2\xf6\x8b\x16q#\x82Wc\x91\
+\x07zp\xadk\x13\xac\x8dc\xe6\xc4\xd3\xeb\xfd\xe5l\
+M\x0c\xe6\x070\x1f5j\xd4K\x07\xc8O\xb7\xf7\xf0\
+\xe3\xdbo\xe0\xd1\xf1=l\xa7-nO\x13&n\xaa\
+\xddauW\x11v\xbc\xb0W\xee\xe1\x1b\x9e\xe2\xec\xcc\
+\x85\x1d\xb1\xb5\xea\x02\x01w\x93\xb7\xf8\xfc\x04\x01\x5c]\
+\xecq~\x1a\x9f\x01\xbc\x01\x15\xfb\xdcj\xd2\xcba\xd0\
+\xf7\x06m\xc97C\xeb1\x06;\xbe\x93\xe5\x90\xfe\x12\
+\xc4\x8f\xae\xdeY\x06AG\xf0\xd0\xa8\xdfT\xf5\xd6+\
+&\xede\x18\xd3\x84\x05\xd0]\xdf%z\x9d+\xe3*\
+\xf2\x0d\xd5\x1f\x98H\xca\xba\xb8\x02\x139F\x90A\x18\
+\x13\xcb\xc1\xe2\x08C?\xa8\xc9\xe5g\xf5\xde\x12\xe2\xe7\
+\xab^>s_Q\x0fo\x22Df\x06\xbfsF\x97\
+\x1aq\x1c\x0f\x09\xa4\xec\xee\xb4\xe8\xbe\xa0\xff\x8e@\xee\
+d\xc94r\xbeZ8\xba\xc1P\xa2s\x04o\xa2\xf4\
+\xb6\x7fRkB\xb5}\x8c\x81=\x14\x0bL\x7fB\xf4\
+r\x1f\xf1}\xaf\x0e/}\x00\x92\xd9\x0aKSV6\
+\x12\xb7\x98z\x8e\xd5\xb4\xd3\xc3~h\x8b(\x81\xe9\xc7\
+`\xccG\x8d\x1a\xf5\x12\xd5\xd9\xf6\x1e>\xbe\xfd&>\
+;\xb9\x8f\xed\xe6\x08\xb7\x16\xabCN\xea=>U\x80\
+]YrCXrE\xf2\x90~A\xcc}\x86c)\
+>\xb8\xfeq\xe6\x22\xac\xf7\xd73N\x9f\xcc-\xb8\xe2\
+\xc6XO\xd5y\xb7\x0d3C`\xba,e\x89\xd6l\
+\xd7\xf4\xa1\x9c\xe2k\xf6\xcdD\xa9\xff\xb2\xbb\x83\x0f\xf6\
+\x0fpw\xf3x\x9c\x84\xa3~\xedx\x9c\x8a\xaa%\xb5\
+\xab\x0dG\xd2\xe7\xebP\xd3'\xe39\xdd\xae'\x9fI\
+\xd9\xdcK\x22\xeb\xdb$\x12\xd1']\x00\xa9%\xb3'\
+\xe6\xdd\x5c4\x98\xc6\xb2k\xd3\x82\xed\x9e\xe8\x8c-M\
+\x01\x0aI\x9b\x8eC0\xbf\x0f\x02\xc1\xee9rs\x80\
+\x92\x1d+\xeeA65\x10\xc71\xbd\xe6t\xda%@\
+\x89Q\xb4]v\x8b\xa6\xa8\x1a:qw\x04\xec^\xca\
+\x17og\xa1\x89\x11\xa9\x0bM\xd2U\x99\xaf1\xc6~\
+\xc7\xb4\xa9@\xdf\x0c\xae7!\xe2I\x1eL\xf5\x15\x8c\
+#\x06de\xfe\xfc\xcb\xaa\xc6\x00\xe6\xa3F\x8d\xfa\xd2\
+\xd7\xf5t\x82\x9f\xdey\x1b\x9f\xdc~\x15\xd3\xe6\x18'\
+\xdc\x1c\x00y\x09\x04\x12\x0frd.+S\x04\xe79\
+\x00o\xe1\x1b\xd6\x83v\xa0=t\xad\xbf\xd9\xa7\x8fQ\
+\x026\x1b\x9e=\xdea\x9e\x81,\x12\xc4|W\xd0\x1a\
+\x09\xc1\x02\xcd\x1e\x0d)\x18\xf7\x80\xfff&\xdc\xf2\x7f\
+\xe9\xfeFFM1\x03\xf8\xdb\xab7\xf0;\xb7\x9f\x00\
+\x835\x1f\xf5\xeb\xc4\xe5\xb6r\x8dZ\x00\x86\xce\xd3\x9b\
+\xcevP\xcf}\xe7Nn\x0dL\xb5\xb1CtL\xa7\
+\x93\xa5\xb9|\xf7\xfe\x0a\xe9=\x02\xfb6\xf9`k\xe8\
+\xc3\x8d\xca\xfd\xc44\xf5\xb1\xf0\x08f]rgh\x1b\
+\x12p\xdb;\x89\xd4\xad\x8d\x91\xf2Hl\x05\xd1\x83T\
+8[EKdA\xa8\x8c<+;_\xa1\xb2\xdb\xbf\
+m\x9f\x8a6>tc\xb4\x1c\x12\xe76\xb1\xd6\x7fg\
+\xeagI\xb3\xd4-\x82\xae\xc4r\x02\x0e\xe0\xb7\xa3\x1d\
+-\x1a\xab]\x8f;\x1f\x99r8\xc9vBG\xec{\
+_\xfd\x01\xccG\x8d\x1a\xf5\xa5\xad\x99\x13\x1e\xddz\x13\
+?\xb9\xfb\x16\xf6\xdb\x13\x1cM\x1bp\xda,C\x9c\x1e\
+\x90;-9\xbceY\x8c\x93\xd6\x1bbJ\x1e\xd7e\
+\xdf\x06v\xcb\x12d|\xe8\xba\x9b\xb2Y`E\x80\xe7\
+O\xae\xb0\xbb\xb2\xfe\x81\xa8.+\xc8@\xb2\x8f!\xd1\
+?q\xbdAF\x92[\x82m,\xa8[\xbe\x90\xce\xbc\
+\xfd\xfeG\xbb\xdb\xf8p\xff\x0a\xeen\x9e\x8c\x13s\xd4\
+\xaf\x0b\x967\xa9D@Ne\xa80\xf5\xa3\x0e\x0e&\
+\x05\xa5U\x1d\xf4\x0dV\x89\xd16\xd0\xa7\x8dF\xf7\x0f\
+\xe6\xc0\xae\x5cJ\xac\x5c<j:A\xf5(\x8f\xe1F\
+\xd6p\x1d#\x97M\x17\x0b\xef\xb6\x81=\xb0n\x00\xd6\
+JLg`hU\xdf\x1e\xbc\xb7\x13\xad8U\x7f\xaf\
+\x03\xf2\xdd}\xa5I0\xca\xd7(\x92\x1dG\xf8\xd3\x13\
+\x1cD\xaf\xd5\xee\xde\xb3\xd7\xde\xf9;7\x93}\xd46\
+\xc2g\xfb8\x9a\xc6d\x15@\xfb\xa9\xa4apo\xed\
+\xe5P\xb5\x01I\x9a\x06s\xa1C\x96D\xd4\xc9\xeb\xba\
+c5\x80\xf9\xa8Q\xa3\xbe\xa4uv\xfc\x00?\xbe\xff\
+\x1eN\x8f\xefb\x9a\xb6\xd8\x8a\x86\xdc\xfb\x8f\xcb?\x01\
+\x07\xce\xe3\xdd\xb5\xf7`a6\xc7\xa9\xcf\xed`aF\
+Xg\xbb\xa5,\x9e\x8f\xba\xbe8\xdb\xe1\xfc\xf9\xfe\xe6\
+\x94B$\x00[\xfc\x8d\xb3\x81(\xc7\xc7\xd8M\xc8Z\
+\x06\xb8\xe0\x9e\xba\x9e]7[o\x06\x96\x9f\xef\x00\xfc\
+\xf4\xeau|\xfb\xf6\x00\xe6\xa3~m\xb8\xbcIOT\
+s]d,I\xfa\x96o\xb2\xa9\xb0h\x01\xf3\xebi\
+\xbd\x16\xe4\x04&\xfe\xe1\xbd\xf8\x83\xb9>9ccc\
+\x93_=\xb3\xf5\xfa\xa6\xb0\xba\xd6\x83\xc0$\xde\xd4\xa8\
+Wh4\x15o\x1ap\xc5\xc3\x05\x00f\xd2\x9c\xf2\x9d\
+\xe2\x1d\x13\x22\x19\x8a\x91\xf5\xd4(T\xf4\xc7\xa2\xfd\xb9\
+\x0c\x97\x9a4\x08\x89\xdd\xa1\xa7\xca=\x93\xd0\xf0kf\
+\xf8\x9a\xa7l\x92\x1dg/\xb8}9\x8e\xcc\x8fc\x17\
+BerN\xd1\xef;.\x9a~\x13\xe3\xc4\xd2\x9c\x99\
+\x1c\x05\x9d\x05(\xab'\xcd%\xc6\x00L\x95q\xa1\x0d\
+\x8d\xf9\xa8Q\xa3\xbed\xb5\xdb\xdc\xc2O\xef\xbd\x8f\x9f\
+\xdfy\x88i:\xc2\xd1\xb4\xe8\xc8+ \x9f\xf2\x94\xce\
+8\xfd\x1f@\xb5Y\xf2$\xed\x00\xb2\xf0\xe9\xb4\xa09\
+7\xbf\xb4\x9c\x0e\x02\xb5g\xe4n\xb7\xc7\xf3\xc7W\xed\
+\xe1,\x0f\x9b\xfa\xd0\xb3D\xb4\xee\xb0\xf5\x8be#/\
+d\xcf\x05\xf0\xf8\xf7\x0c^\xd1\x16\x05,\xfd\xcf\xff\xff\
+\xfd]|8\xdf\xc6\xf1t>N\xd4Q\xbf\xfa\x0a>\
+\xfazm\x98z\x84w08\x82\x1d\xd4\xf8vCt\
+;\xa17\xdf\xd0O2\xaf\x0d\xef@\xf6\x12\x12\xd3y\
+\xa5\x9b\xfcA\x1ad\x13\xed\x1b}\x1b\xc1\x90\xf4SC\
+\xc2\x184\xe3Q\xc5#z\xb7:\xff\xd9\xe1\xeb<\x8c\
+\x88\xa2\xbbO\xa5,\xd2\x9cT\xd6\x5c\xf5\xea\x8c\x1c\x7f\
+l\x8c\xe8\x9b\xfdL\xb3\xcf\xf8\xd7\x99\xac\x8e\xcd\xba2\
+\xda\xd02\xb1r\xa4\x0f\x8b\xf2\xfb5\xd8O*\xadn\
+&\xf3HB\xc5\xd0\x90i\x8a\xe8\x1a\x87ec&f\
+\xf3\xc7er\xd5\x0d\x02C\xb5\xfb\xe2\x945\xa4,\xa3\
+F\x8d\xfaR\xd1eOo\xbf\x89\x9f\xbc\xf2>\xae\x8f\
+N\xb0\xe5\x16\xd3$:\xf2\x22_\xa9L\xce\x9a\x05\xa2\
+\x22d4\xd6l\xd2g?\x1dF\xf6\x0f$]JU\
+,\x9ds\xdek\x8c\xfb\xb3GW\x98\xf7&\xb2\x98\x8e\
+\x0fj~\xbbh\x1aL}*\xd1V\xa1t\xf30\x7f\
+!v\x970\x14a\xa8\x1c\xd3.k\xfd\xb4\xf5\x86\xe0\
+\xc2\x88\x9f_\xbf\x8e\xf7N~<N\xd7Q\xbf\xe2\xab\
+_\xac\x0b\xd9_\xcb~N\x90X\xb3\x03\xa5\x00l+\
+\x8e$\x9d\xdbI\xdf\x08\xc7k\xb3\xcf\x83\xb14\xf9\xf2\
+\xa6y\xee\x83#G\xaf&\xae\xcc/m\xfd\x9au\x06\
+\x90l\xce*\xd6\xfbf\x97{\x899\xd9D\xf3P\xb7\
+\xce\xb60\xd3@G\xfbD\xf4\x9f\x8dh\xa6\x18$8\
+:\x0c\xda\xd9\x8a\xf7\xd6\x89\x87\x95\x84\xc6.\x9b\x02f\
+qc\x89\xd8\x1blG\xbb\x0a\x97\xdc\xc4j\xe7\xf3\x22\
+\x0d]O\xc3\x1c\x8e\x05\xfb\xcf\xb9\x81\xcc\xe9Vl\x1c\
+\xbefK\x1cM\x02\xb2J\x93\xe0Wc\x87\x94e\xd4\
+\xa8Q_\xa2\xdamn\xe1\x93\x07\xdf\xc0\xe7w\x1e\x82\
+\xd3\x16[N\x07P\x0eM\xec\xa4\x0b\x0ajl\x92\x7f\
+ZZ\xc6\xbf\xc4i{F\x9b\xc18\x89\x1f,\xc7\x90\
+8\x9ap\xe5\x86m\x86\xb3\xe7\x97\xb8<\xdb\xa5\xecO\
+\x07{\xeb\xb0\xa7%\x89\x9e\xfa\xe2\x15\x99I\x10\xbb\x9b\
+{b[\xf7\xbd<\xa9\x1e\xa0\x88\xbd\x98\xa3\xff\xd1\xf5\
+\x03\xbcs\xfcw\x98\xb8\x1f'\xee\xa8_\x19,\xafx\
+\xba4\x8a}JW\xd32\xcb\x85h\x12b\x13\xd3\xe1\
+\x1d\xc8c\xc0m]\x80W\x064\xe3\xa5\xce|\xdb\xab\
+\xf6\xdd\xc2\x8fY\xc1\xb9\x97\xccHJf\x10\x19\xd7\x06\
+:8\xd2\xb8\x84I\xd5Bw\x80\x9b+\xbe\xe2\x89\x8c\
+\xc4\xbd\xbd\xbcJ&F\xd3\x90\xa7\xfa}3\xc0\xea\xb7\
+\xaf\x1e1\xae\xdf\xbbjZ(|\xb3\xd3\xc4\xef\x89o\
+f\x92\xd5\x14}\xeau%\x84nH\xb3\xb9\xc0\xd4\x1d\
+`1UT\x1b\xc5\xfc\x98\xd7s\x8f\xc8\x1b\x1bu\xe7\
+\x91!~\xc4&\xb4$\xc9.\xcf\x82\x01\xccG\x8d\x1a\
+\xf5[} ?\xbb\xf3\x16>~\xf0\x01vG\xb7\xb0\
+\x9d6\xe2GN\x07\xcc\xdd\xc8\x90HX\x9av1g\
+\xc0,\xea\x1c'\xa4\x0c\x91\x05\xf6\xce,\xa1i\xf4\x1e\
+\x1bm\x0b\x97\xff\xdc_\xcfx\xfe\xe8\xaa\xd9\x9eYp\
+\x0e/\xf6d\xf0+\xa9u\xe9]\xf5\x9b4?\xf9\x7f\
+3*\x17\xb9J\x82>lMQ\xef\xbf\xc7M\x9f\x06\
+\x00\x8fl\x83g\xfb\x07x\xb0\xfd|\x9c\xbe\xa3~E\
+w\x81\xa5e\xb4^\x82\xa6\xa7\xab\xad\x84\xc9\xd4\xa6\xb3\
+\x09y\xdb\xaa\x18\xe3K\xb8\xd2W7\xf9H\xe7`R\
+d\x06\xc1k\xbcn{L\x10f\x00\x97\xf1z\x95\xeb\
+\x9b\xab}J?\xd4\xa8W)\xb5\xf7f\xfb\xa2\x5c\xbb\
+=\xc8\xf0\xbbS\xa8u\x0e\x93\x5c\xe47\xe2\xffGJ\
+`O/\xcdi\xbf+\x1aj\xc0\xcf6Zb\xe5j\
+X\xc3\xde\xfdj\x05\x95\xc3\xa8\xact\x1f\xc8\xc4\x95\xd3\
+\xc3y\xf3t\xfb\x9a\x22/\xf1\x87`m\xe6\xc6B\xb2\
+\x9b\xa6\xb3R\x92cm\xc5C]\x82\xab\x0a\xbb/\x7f\
+6\x80\xf9\xa8Q\xa3~+\xb5\xdb\x9c\xe0\xd3W\xbf\x85\
+Gw\x1eb\xda\x1c\x86;'\x1d\xee\x5c\xe4+\xaa\x1f\
+g`\xc4=\xd4\x8c\x9e\xc1P\x87\xaf\xfe\xc1Lv\xf3\
+K\x9602\xe9\x7f#\xb8\xba\x08`\x7f\xfe\xe8\x1c6\
+\xf7\x0f\xf0\x9c#\x8c\x1b@\xef\xd6\x90\xb4\x18:`\xf5\
+E\xc1\xb4'\xfbob\xdd[ I7,\xba\xd4\x0c\
+\xc3\xa7\xd7\x0f\x070\x1f\xf5+.K\x80\xac\xa2's\
+\xd0J\xa5/m\xa8ONg\xf5\xe6v\x99\xe7\x0d \
+\xb9;\x88\xb5\x8b\xd8\x0d.\xd2r+T\x01oD\x88\
+\xed\xb4\xe6\x95\xedc\xeb-\x80\xb4^\x0b\xads\xa0\xd1\
+\xea\xdb\x12V\xbf\xfe\x0e\xde\xb4\xb5I\x9f\xd9\xdds\xcc\
+\xa4\x19\x82oB\xacK\xb8\x17P\x1b\x09e\xdd\x17\xcb\
+>f\xb0\x1al\xbb\xdf\x92\xfb\xea\xb2\x15T\x00\xab\xd2\
+\x9f4a\xca\xf5K\xed\xad\x94\x8c\xe8\x0f\x94Y\xf3\x97\
+w\x99\x9d\xee\x18\x85}\x1b\x93\xe5\x9c&=\xe9\x9fj\
+\xc6S\xb0\xc1\x84\x1f\x085\xc4\xc6Od9\x1c\xc0|\
+\xd4\xa8Q\xbf\x85:\xbf\xfd:~\xf2\xf0\x1f\xe0\xfa\xf8\
+\x0e\x8e\xa6\x0d&\x01\xe3j\x7f\xe8\x96K\xe9\x13<\x0d\
+9\x9b\xa2\x91\xcb\x9e\xacb\xc2\x8c\x87\xff\x0e\x89~\xd6\
+\xe3f\xf4\x1cXK\xae\xbb:\xbd\xc2\xe5\xe9\x0e\xcaB\
+\x17\xab4\xaf\x09\xa5\xb7.w\xbcL\x9c\xea\xb7\x0e\xa0\
+\xb4p\x8f \x8dq\x8e+Y_\x11\x03\x86\xcc\xed\x9f\
+\xc3kC\xbeg\x94\xd6\x18\xf0\x93\xfdm|\xd3n\xe1\
+\x88\x17\xe3d\x1e\xf5\xcbCr\xf6\x81=\x1d\x98t\x9a\
+\xebp}\x13\x01\xf0\x86\xcc\xc6\xc0Z\x96!N\x7f{\
+Pmr\xdfV\x93\x015\x8b\xa5\xa0\x8f]\x17\xa9\x04\
+\x97\xe0\x9b\xc8.k\x93\xed\xdc\x01)r\x1e\x87U\x9b\
+\x1c##\x09bx\x1a\xa5eO,&{\x0fti\
+\x8e,X \x866!W\x96\x984@\xfe\xb8\xf6\x03\
+\xb5z\x1bS&\xdb\x90F\xd6'\xb8\xdc\xd6V\x06\xdc\
+1\x0a\xe3\xfc\xec\xc9\x1c\xb0\xadhv:\xfa2\x87\x13\
+\xec\x18{yT\x00\xf4\x94\x99\x9e8\x9f\x90\x05&\xc9\
+\xcaD\xf9\xa8\x01\xccG\x8d\x1a\xf5\x1b|\x00Ox\xfc\
+\xe0\x1b\xf8\xf4\x95\xf7\x80\xcd\x11\xb6\xd3\xb4\x80r\xb5@\
+\x9c\xe4a\xe3\x81\xb9\xb2\xe5\x8e\x19\x0f\x0f\xa5\xf8\x14\x8a\
+.kI\x8eE\xce\x02\x01+\xf6\x88\xfe\xb5$0\xef\
+g<\xff\xec\xcc#\xf8\xe8\x80@zf\xcb}\x80y\
+F\xa6\x0cR}\x81\xfd\xeaVU!\x83\xa1\xf1!\x07\
+Y\xb6\xcd\xd4,\xe2\x1c\xb0\xb6\x88\x0b\x12\xa73\xf0\xf4\
+\xfa\x15\xbc~<\x80\xf9\xa8_\xbeXX\xecN\xe7\x0b\
+\xb1\x0e\x8d6\x84>:\xbdG\xec\x851\xf7\x17p\xe6\
+^R\xae\x97\xaau\xd6\xd9\x12\x05|`\xd7\xc4\xb3\xb0\
+\xbeUC,\xee$\x09\xf8\xadN(\xd1BQ\x80j\
+\xb6bW\xad\x1c\x19\xafkJ\xb0\x92\xd3\xda\xf9\xa1r\
+\xb6\xed\xf30\xdb\x93\x1b\xf5;\xc7e\x82\x82y\xf3h\
+\x85|hwE;B\x8bF6\x99\x8c\x04]8P\
+K\xf6\xc4\x8a\xd9\xb8es\x962\x0c\x9c\x19\xe9\xde\xf0\
+\xdc`\xd0\xfb\xac\xea\xdeu\x85\xb6\xd2\xe6\xd0\xd5YX\
+\x03\xe8u Y\x0f\x99\xb5\xf4\xd2\x01\xccG\x8d\x1a\xf5\
+\x1b\xa9\xdd\xf66>}\xfd\xbbxv\xe7UL\xd3\x16\
+\x13\xa7\x94)\xcf@\xb9\x91+\x10S\xf1q\xe7%\xf0\
+\x85\xe4\x1dt:\xc2\x00H-\x07\xeb@\xbfjz\xf6\
+\xf8\x02\xf3n\xc6J&\xd0\x9a4\x16\x9az\xd7\xe9\xdc\
+\x97\xe5\xfd\x0e\x1c\xd0* \xb0d\x09\xc0V\x90{\x0f\
+\xb7u\xfa+{`y\x7fsM\xd3\xfe\xd9\xee\x15\xbc\
+~\xfc3\x8c$\xd0Q\xbf$,\xf7\xe2\x82\xd4\xe6.\
+\x03a+\xf2\x88\x02\x7f\x83\xee\xbb\xb9\xb5\xa8\x1fxK\
+\x0c-\xd7\x01\x03\xc3\xaeI\x8f\xdd\x5c\x886\xf6d\x00\
+\xbc*\x9b@\x90\xdcYu\x5cB\x16?Cq\xd8\xeb\
+\xe6&C4\x8f\x86\x9b\xb1\xb7[\xa5cv\xe3\xe6\x86\
+\xef)\x01A\xd1\xe2\xdbT\xb3\x17\xfc\xbc3\xad<\x1d\
+\xbf\x10\xc5\xe3\xda$\xf5\x09D\xf5|`~\xcfVW\
+s\xa2\xd9\xda2\xbb{\x91UZ\xe2N/e3\x82\
+[\x8c??\xbc\xa5mq\x9f\xb1.-\x83\x0d`\xc7\
+\x81\x5c\x0b\xb1J\xf4R\xcb\xd8\x04\x0d`>j\xd4\xa8\
+_{\x9d\xdfy\x13\x7f\xf7\xfa\xb7\xb1?\xbe\xbdh\xc9\
+'\x17\x16\x84.,H\xd9pe\xa1z\xa6\xdc\xd64\
+\xa97B\x81\xa8\xd8\xd6\xbf\x9f\xc4b,a\x8e\xcd=\
+C@\x00W\x17\xd78\x7fr\xb1<\x1bU_*L\
+\x929\x81\x0b\xe2\xf0S\xaa\x14wK\xc1\xf1!)\xf7\
+\xf8\xe2\xd8bQ\xaa\xe2\xb7\xd9\x90\x81\xf3\xfc5\xb6\xe2\
+[S\xb6\xf5'\xbb[\xf8\xf6|\x8c\xa3\xe9r\x9c\xe0\
+\xa3~\x09\x5cn.57&S\xb6\xd9\x11Co\xf7\
+\xc7$\x84SXe\x91~W\x91\x8a\xb89\x05\xa5\x1b\
+\x12|\x0b\x1f`)n*&F\x88Q\x9f\x5co\x0e\
+LM\x1d#\xb8\xeb\xbf\x15\x1d1\x1b\x1b\x89zM\x8a\
+t#.\x1e4\x0bE$\xe1A\xad\xe9/_\xaee\
+\x08\xf9N\xc0\x11\xd7i\xba|\xb1\x84\xf4\xc7\xc8\x9cU\
+#\xbf\xd0\xfb\x95-\x03\xe1\xdcj\x18\x1ci\xd21\xf6\
+8\x07_\xcf\xa1\xe5\xc8\x870\xa9\x22\xd9+\x0d[u\
+\x91\x11\xc3v\x12]^\xeb\xda\x8c\x8e\x82\xefL\xee\xd3\
+g\x87&\xe7\xdb\xf2\x9a\x01\xccG\x8d\x1a\xf5k|\xe8\
+\x12O\x1e|\x13?{\xf8!X\xa5+\x9b\xe6C\x9e\
+\x80r\xaf\xebc\xb3:\xac\xab\xb4\x5c\x05\xe1\x1ep\xb3\
+#E\x1cWLj\xc4\x870\x1b\x08\x0c\xcaT\x93\xfb\
+\xcc2&\xc9p\xfa\xd9)\xe6\xd9k9\x19\xa9\xf2\xc2\
+\xdc(ec\x1e\x923\xe8\x14\x9bN}%\xe1\xf3\x86\
+\xce#:\xc2dp{\xbdV\x92\xf8\x84\x89\xbb\x04\xf1\
+t\xf7\x00\xaf\x1f\x7f:\xce\xf3Q\xbf\x92\x8a\xc3\x90V\
+\x81{o\xcd\xc7\x0em\xc6\x10/s\xeeM\xad\x01\xf5\
+\xd2\x856\x96\xc1\xd4\xeb\xda_\x03\xf4\xcd\xb6~\x1e\xe9\
+\xae\x0f$\xfe-\x0adUv\xd1\xa4/\xe9\x10\x8b4\
+*\x16B\xd3\x96}S\xa4,q\xa6F\xdciT\xfa\
+\x91:\xdf\x14\x10j\x9e\x15o\xcdA\x22\xed\x90\xf7\xb3\
+\xc0q0\xc4\xdb;\xef'[sPQ\x9bE\xef=\
+_\xef\x9f\xee\x9ch\x07\x90k7H\xae=\x9a\xf4\xb8\
+\x99\x1b\x02\xee\x8eoH\xf6\x8cg\x84Z\xcc\xd7\xd5\x90\
+(\xfb\xb7:3\xdaSBa\x9f\x0f`>j\xd4\xa8\
+_\xcfCv\xda\xe2\xb37\xbe\x87\xc7\xf7\xdf\xc6f\xda\
+`\x9a6\x07\xc9\xca\x0a(\xaf7\xa68\xc8\x14\xf4}\
+~h*\x0ct\xda\x9ae@\xe4;:\x1f\xb1\xb6\xec\
+\x19l\xd3 7i\xe7\xf0\xb2\xdcK/O/qu\
+~\xdd\x98\x16y\xac\x18#\xec@\xbf\x0c,\x0f\x0a\xb3\
+\xec)\xa6\xcb\xafl\xee\x02f)\x8c\xd6\x87K\xfce\
+u\xb2\xe8\xb4:\x16pM\xd1\xc4x\xbeP}}\xcd\
+\x80\xcfw\xf7\x060\x1f\xf5\xf7\xef\xdb\x01\xdf\xa8&>\
+\xd2\x85u\xed\x06\x1cK\x93iQ\xdb\xdc\xeb\xc2\xca\xb5\
+E\xf114\x05U\xe5\xdd\x82#K\x03\xc4\x0d\xe8\xd7\
+\xcf6\xc9R\xe8t\xd8\x89\xf6\xdd\xa9\xbaEjS\x5c\
+\x90\x98\x98\xfa)k.\x927\x1d$\xd5\xe1\xc1\xd8G\
+\xa7\xa19D\x98?\xd1\xdb\x809+X\xf5I\xef\x07\
+f\x8b\xc5\xe0\x01\x88f\xb3\x01\xaea\xc9\x9a\x83\xe4\x5c\
+\xa8+\x80q%\xc4\x12\x7fr4\xbb\xca4\x14J-\
+\x22\x13\xd2\x82\xc9\xf4\xb0!j\xc4\xe5X\x18\xdd\xec\xbd\
+\xe6a\x98\xe1\x86l\x0bFK\xfa\xf8\x0d\xdc\x8f\x060\
+\x1f5j\xd4\xaf\xbc\xf6Gw\xf0\xe9[\xbf\x8b\xf3\xdb\
+\xaf\x1e\xbc\xc9\xa7\x09\xd0\xf4N\x9d\x90\xaf\xcc\xb5\x07\xe5\
+1\xdc\xd9:t\xbd\x16n\xf1ET\xcf\xf4,z\x90\
+\xac0\x06\x9e\xac<@f3\x9c\xfd\xfcT\xf4\xdb7\
+\x88h\xec\x0b\x9b\x1b\xfa\xe1M\x8a\x15\x5c\xb1$\x13V\
+\xc7Y\x9f\xc5a\xd2J\xd5`\x05\xb8\xe4~\xd1N\xaf\
+\x03\xbai0\xddO?\xdd\xdf\xc6\xb7l\x8b\x0dw\xe3\
+\xa4\x1f\xf5\x8b7\xef\x01\x0cy~\xdb\x1a\x18\xcaO\xd2\
+.\xd5\xb3\xc8X*\xac\x94\x9c0\xbdGD\x9f\xf26\
+\xcb\x11ec\xac\xb2\x8a\xc8\xbdS\xc0\xb9\x02\xf8$s\
+Rn9\xcblH\x90/\xa48\x1e\xbe_v}\x89\
+\xfad\x03]8\x8f\x0b\xd1\x89\xc3\xaf\xa6C\xb1\xf1\xbe\
+\x90\xd0\x1a\x16\x80\xbaB\xd8\x22\xa1\xa3E\xd27,b\
+\x98\xbb7{Y\x8e\x1fC-\x92\x13\x22?f\x16\x9d\
+)cc\x11\x07<\xad\xdf?\x06\xef\x1d\xce\x0cHc\
+m\xf6\xb4\x0f]\xa2\x0e\xf7\xe8x\x94\xb5{uf\xaf\
+\xc8\x9a\xfc\xec\xdfo\x00\xf3Q\xa3F\xfdJ\xeb\xea\xd6\
+C|\xfa\xce\xefbw|\x07\x9b\xa2'\x9ft\xb8S\
+Xr\xb2\x07\xe1$2?\x11v\x89|1\x14\x9ay\
+t\xbd2\x1a\x08CA\x09P_\xbba[\xc4\xab\x00\
+.\x1e\x9f\xe1\xfar\xe7\x13\x02\xe3C\x95\xc2^YP\
+\xb6\xabe\x22\xa3\x9c\xa6-+\xaf\xa5y6\x17\xe7\x08\
+\xf7\x13\xc3_[\x99J]\x01K\xe8X\xf3\xfe\x8f\x9e\
+\xd9\x84\xb3\xfd]\xdc\xdf>\x19'\xfe\xa8\xbfG5\x7f\
+r[\xf9=S\xa0\x1b4\xd2\xe1\x8a\xa01\x19\xb8f\
+\xf3\x0e\xefNf\xa6\x81@\xb6X+2J;Db\
+\xd6Z\x8b&\x8d\xeb\xd8^\x08\xc3Z\x80]\x9c$e\
+\xd9~:0\xee\x06\x1bM\xfb\xea6D\xda\xa9R\x84\
+>ff\xb4\x1dvN\x91\xe4\x15\xc7\xa6\xb8\x8f\x8a&\
+\xde\xdf\xe5\x9a\x1d,\x5c\xcf\xb0\xbc\x87\xf5\x01O\x96\xdc\
+\x9d\x9cE\x22-\x1dN\xa7y\x00\x1eC\x92\x8a^\xbf\
+\x0bX\xb2\x8c\xado\x9f\x95\x8a\xe6\x95\x10\x89g\x0a{\
+\xb9\x11\xeb\xc0g\xe6\xf5\xee\x04\x8a\xad\xc9\xacV6\xc5\
+V\x13\x831\x1f5j\xd4\xaf\xa7\xce\xef\xbf\x87O\xdf\
+\xfa.\xb0=\x11\x1bDu^i\x8e+\xb6b\x83\x18\
+S<3\xd0\xbd\x0e\xc2\x89\xb8\xealaX\xd3\xbf\x87\
+\x09y\xcc\x1b\xa9\xbd\x18T4\xef\xf68\xfd\xfc\xb9_\
+FW*\xac\xbc\xb1\x05\x86Do\xd5b\x99f\xe1\x0b\
+y\x0b\xe0(p\x0f\x1azd\x0f4\x0bo\xfc\x85q\
+\xd2\xcd\xcd@}[\x83\x99\xe1\xc9\xf5\x00\xe6\xa3\xfe^\
+\x90\xbc\xe9\x8d\x994\xc1\x92^\xdb\xf9V#\xe8x\x05\
+\xc8\x22\x95\xbe\x84;\x84\x9b\x05\xa1f\x0b\xa1\x0b\xfcd\
+\xef\xb1\xdd\xc2\x81\x0a\x08o\x12\x15*\x00\xee\xec\xf4\xac\
+\xc7\xe2\xc2\xcawd\x80X0F\x84I&i\x96\xea\
+\xc5\x1e\x01;\x1b8\x8c#\xad\x85V\xcexq\x0fP\
+\xcd\xb5F5\x19S>\xabx\xd27\xec\x9fY]\xa2\
+\x13\xa5\x97\xfd\xc6D\x0dc\xc2r\xf4c\xa6\xec\xf6\x9b\
+\x13;1_\xc9,\xd6\x9c\xa6>\xefk6\x8cz;\
+O\xec\x0e\x9d\x8c\xdfIV\xe8\xc1\xb7\x0c\xbd&b\x99\
+\xfa\xb9\x03\x98\x8f\x1a5\xeaW\xf2\x98=}\xf8\x0d\xfc\
+\xfc\x8do\x83\x9b\xed2\xe0Y\x00y\xa6%\x17\x96\x9c\
+z\xbb\x8d\xac\x982\x1c\xc1\xf2\xbb<P\xa1\xd2\x8f^\
+\xdb\xdd\x03r%E<[a}\xa6\x85S|\xb4\xf7\
+2\x9c=:\xc5\xbc\x9b}\x02(\xe3\xb2zK\x90K\
+\xb2\xff\xc2w\x90;\xb60e\x8e\x07\xb7\xc4M\xc5?\
+\xc1:(\x92\xba\x15t\x1a\xf3\xc8\xb7\xf7N-\xe5{\
+\xd8\x12`t\xf8\xe7\x8c\xcf\xaen\xe1\xfd\xdb/4\xa7\
+\x1c5*\xb0\x8f\xa8\x819f\x99l`Y\x0f\xa2\x87\
+`\xd5m\xc4\xfa53s\xa0U@|\xd1U'K\
+a1\xa7\xa0\x011\x01\x97\xce\x1f\xbb0\x9f\xe6\x18Z\
+/\xb7\xeb\xf5\xe5\xea\xce\xe4\x95\x0b\xd6\xcd\xb2D`\xac\
+\xee!\x9cz\x9f\xf1\xf6{\xf3\xf6{\xdd\x1b\x99\xdck\
+T/\x8f:\xf8\x9a\xda\x00\x16\xe7\x17\x8d\x9d\xc72p\
+\x99\xb0\xf5\xb9\xffH\xd8ODX\x19h\x08\xb7\xce\xc6\
+\x87$U\x17\xe6\xa4\xd6\x85\xa6\xa4\x87~J\x1f\xb0\xd4\
+9a\xa5\xab\x0dLw\x1d\xd9\xdb\x1d\xf6\xab\x94rV\
+:F\x9c\xe2G/g9\xe1\x9e~\x06\x1b\xc0|\xd4\
+\xa8Q\xbf<(\x7f\xf6\xc6w\xf0\xe8\xf5o`\x9a\x8e\
+\x02C\xdeR<!\xf2\x151\x05\x0b\xb1\xd0\xc9\xb4\xbf\
+\xdenYnf\xe6\x81/T\x02\xd3\xf3;\x0c83\
+\xb2\xdf=\xd3\x92\xfc\xcc\xdackw\xbd\xc7\xf9\xe3\xb3\
+\xb6\xc4\xbd\x12\xa3]\xfb\x08\xf5\xad\x8d\xdcv\xf0\x1eo\
+\x0c\x9e$\x14\x9a\xdd\xacO\xbf\xc9\xea0\xfd\xa2L\xd4\
+-\xeci\xfb\xfa\xe0\x8e\x80\xbc\xfd\xfbO\xe7\x09\xbf7\
+oq4]\x8fKa\xd4/\x80\xcc\x15~\xf7\x00\xae\
+\xb9v\x98\xcb\xcd\xd1&<\xc6\xd2P\xf4\x0e^\xe2\xdc\
+\xdc\x8e:\x9f\x96\xea\xa2!\xdbA\xbf\xf8\x15\x87\x1eQ\
+\x87I\xbbL\xdd\xe4\xa2$\xd6Xo\xbd\x171\x99N\
+q\x8e\x1f\xee\xbe\xc5\xce\xf5\xa4\x02=\xd1sg7\xa3\
+<\xf4\x93N\xfe\xd2\xc8\x13\x93\xd5\x07\xf5\x8c7\xe8\xda\
+\x9f\xf5\xa2t\x19\xa6\xa5\xbf\xa3\xd3\xba\xf5O\x87\xefU\
+J\x13t\xd9\xf5\x9c\x90l\x07\x83\x9f\x98W\xd7\x96\x22\
+kR\xfe\xa1HlH\xbf\xd7+\xf4\x97\x86\xb1\xf7\xb3\
+\xf7\x84F\x83\xffI@\x92l\x11c@\x916\x8f\xf2\
+9\xe5\x9b\x0c`>j\xd4\xa8_\x02\x93Ox\xf2\xd6\
+\xef\xe0\xc9\xc3\xf71M[\x90\x9b$0HY\x06}\
+HE\x96\x9c-\xdd\x0e\xe8\xb4\xe5\x00r@o+\x88\
+\x1a\xfd\x10\xa7\xb3O\x0c\x09\xdb\xe6\x1e\x0a\xe6\x1e\x1a\xaa\
+\xa54\x00\x17\x8fNa{\xeb\xd7O\x0d\xce\x8a\x8c\xc1\
+\x0e\xb19\x1c\x98\x0f\xd3\xa82p\xb9i\x1b\xab\xc6\xb5\
+\x05,\x89\xa3\x8a\x8b\x10\x0f\xd1DDb\x95H\xd8\x8d\
+ztF?\xb3\xea\x8dn\xf3\xbc\xb0t3\xcc\xe6\x0a\
+\xcc\x01\xe0\xc2\x80\xd3\xeb\xdbx\xf5d\x00\xf3Q\xbf\xe8\
+\xfd\xc3<\x83l\x00&x1rMR\x9c\x16@\x1c\
+\xaf\xd0\xe0`\x22g{\xf3\x95V\x0dx\x03y\x0dl\
+\x9a\xb7jt\xc3\x84\x08\xf6w\xe6c\xe6E\xc3@\x9d\
+(w\xa0N\xf5\xc5\xcc\xbbw\xf4\xd2\x8e\xf6\xb1j\xe7\
+W\xae\xf8\xe2\xb0D\xa7uW\xfbB\xae\xd8H\xb2s\
+\xa9\xea\x03\x99t\xf9\xb0\xee\xc9\xceQ\xca46\xc7\x1d\
+\xb28\xb4K\x19~\xed\xe2C\xe3\xceP\xcb\xccl\xa0\
+_\xce\x8fj\x13\xd9=\x07\x84)\xa7g\xa4\xeb\x96w\
+\xfa\x13\xdd\x0c\xa1\x84\xac\xed\x08m\xee\xe2\xc0\xaa\x1fd\
+\xa5\x0f\x222\xf5ao\xf6\x9c\x99?\xcd\x00\xe6\xa3F\
+\x8d\xfa\xfb\x11^\xd3\x06\x8f\xdf\xf9>\x9e?x\x17S\
+7\xe49\x05\x96\x1c\xdd#\xb3\xd8&Z|\x18\x058\
+\xde1\xe61\xe5\xad\x9f\xe1\x0c\x0f</\xdf0\xf1\x1c\
+3*\xc3\xc3\x16\xdd\xec\x06\xc0\xfc\xb6__\xedp\xf6\
+\xf8\xccY\x96\x99L\xea\xaf\x8f\xb1\xc9\xbe\x0b,R\x05\
+\xcc\x91=\xcf\xc6\xe2:Q\xba\xe3{\xe4W\x0c4\x99\
+\xc9\xcc\x91\x05-\xe5\xa2\xe4\x94\x07\x9e\xd9\x0c\x9b\xad\x02\
+\xf1\xf2\xdf\xdd@\xa8\x19\x9e]\xdf\xc2\xab'O\xc7E\
+1\xea\x8b\xe1q\xc0\x9f\xa7\xe5|\xd4\xf9\x0a\x17\x8b\xe8\
+\x85\xc7\x96%\xb8X\xd4\x13\x8bkx\x95H\x08\x90\x95\
+{I\x95\x1d\xd4a\xf4e\x95(\xda!.\x0c\xace\
+`\xae\x06\xe3\xa0\x1bB\xec8]\x069F\xa2\x97\xaf\
+\x1avx\x09L\xbb\x0d\xf4\xfb\xa5\x8d\xb5\xc80\xa2\xeb\
+\xb7cj\xa7t\x00\x15\x13K\xa6f\x05\x8e^k\xe4\
+Z\x0e\x1d\xab\xa9w\x12]U\xa0[\x8c\x8b\x9a\xf4\xc6\
+W\x88L\x85\xdd\xc1N\xf6\x816V\xec\x83\x8f\x88\xce\
+\xf3\xdc@\xcf\x94\xb3\x9dcE{_\x13Y\x97m1\
+G\xb8\x84\x95\x0d]\xd1\xe9\xd4\xe2\xd2\xc0\x91\xceV\xa7\
+\xba\x00%\x83\x9f\xc0`\xccG\x8d\x1a\xf5\xf7\x02\xe5G\
+x\xfc\xfe?\xc2\xe9\xbd71M\x07P~\xa3\xa6\xbc\
+\x82QMr\x13\x80\x1d\x92=\xf3\x10\xee\xcc\xfa\xa4\x8f\
+\xeb\xab\x98q\x82\x0f\xb5d\x0f\xf4\xcd\xf4\x01\xde\xee\xe8\
+\xeaM;\xd1\x07j\x9e=z\x0e\xccqk\xc3r-\
+\xfc\xa4\xbe{:\xcb'\x98\x82{\xcb\x189\x88;K\
+sv\xe9\x80N\xaaI\xf7\xc3\x9b\xbd\x9a<\x01\xf3\x8b\
+<\xe5\xc0\x90\xcf\x07\x86|nz\xf2\xd8\xf0\x94\xfa\xfc\
+\xfa\x16>\x1c\x97\xc5\xa8/z\xff\x08\xc1Y\xcc\x1a\xd5\
+\x1a(C\x0f\xd4\xb0\x16\xf6E\x07\x04\xdd\xe7Y\x03U\
+d\xf7C\xb1\x10\x5c\xa0#\xe3\x90yt7\xe9\xb8\x86\
+\xc3\x0a\x97iVA\x10\xaf[p\xd4\xb6~`\xd0_\
+[\xe6E9L.x\x02\x99n\x8f\xea\x03nz\x9f\
+J.^\x0b\xbdE\x08N2&\xa4\xb2\x0c\x922\x84\
+\xe68I\xa1\x12\xd6\x10\xd9G\x98\xf3\xb7\x95a\xde\xf8\
+U\xfd\xed_\x13G\xfb\xe6\x84\x95\x11\x0f\x9d\x08\xbd\x93\
+W\x9dWZ\x12h-\x82oKV\x04\xdc\xfeZi\
+>e\xa8\xd8\xa7\xc2z\xabKv\xcd\xd5\xd0\x98\x8f\x1a\
+5\xea\xef\x01\xca?\xff\xe0\x87\xb8\xb8\xf7F\x0d\x0db\
+\xf5(ge\xc2\xab\xf3J\x18\xca1\xe6\x89z\x0c7\
+\xb5.\x22\xcd\xdf\xc9=E\xb38\xbeX\xb0\xef\xea\x5c\
+\xc9\xa2\x16<\xa4\xdb\x85@>YN=\xfc\xeb\xe5\xd5\
+5\xce\x1f\x9f\xe5\xe84\xb91\xa7\x0c\x8e\x22\xf2`N\
+\xe8n\xe1l\x0f\xfa\x5c\x0f\xcf\xf5!\xcd\xe4\x15^\xb2\
+\x13\xc6\xec\x0a\x18/\xff+\xa0\xdc,N\x8b&>p\
+\xc4'\xd7[\xec\xe7\x0d6\xd3~\x5c \xa3\xbe\x104\
+o\xd7\xa3upK/V?\x90Y\xc0X?\xd0W\
+\x99^\x97TS\x18K\x9f\xec\x08\xb2I+\x90$9\
+B\x86\xb6\x83C\x94iP\x981\x89\x14\xce\xaek\xd5\
+\xb8\x03\xde\x0d%\x01\xe8\xee>h\x01\xb8\xc9\xa0d\xdc\
+\xabm\xda\xdc5\x01^u\x9f\xa4\x9a2\xc9*\xa5z\
+\xc1{\x09P\x1d4E\x88\x94g\xd3\x96;\x86x\xf9\
+\x9e\x84\xf7\x19\xa7\xf9;Y\xcf\xb9\x14\xb6\xbc\x91\x14\xdd\
+D\x02\x93;#-\x0f\x1c\x0a\xf7\xfa\xfe\x9c\xcb\x8e\x83\
+O\x02\xed\xa7\xa0\xfcB\x04\x95@a>LZ\xc0\x7f\
+\x17\x99\xb5\xc8\x16\x070\x1f5j\xd4/\x00\xca\xb7x\
+\xf4\xc1\x0fqy\xff\xcdE\xba\xb2\x09\xa1A\x0c!A\
+\x146\xdc\xfb\x94g\x5c\xb3\xbf\xe1r\xf5\xc6\xbb\x16Y\
+m\xe8\xa6\xa4\x5c\xe0\x87\xc9\x93$2\xd9&O\x0b\x1f\
+>\xdfn\xf0\xa7\x9f??h\xcb\xc1U\xfb\xdb5@\
+\x8c\x8c\xdc\x0a\x9e\xc9\x91\xf5\xa6&}\x02+\xc3\x99\xfe\
+M)\x8c\xa4\x7fMlR\x0e\x9fg\xf3\x1e\xf3<\xc3\
+\xe6\xfd\xe1o\xe7\xb9\x82\x92\xf0\x0d\xfd\x7f\xdb\x5c\x9fb\
+\x17F\x9c\xefn\xe1\xde\xf1\xe9\xb8HF}\xa1*K\
+\xf91\x97\xc5\x9fn\xc1\xd9\x84*9\xf1\x83\x97d\x0f\
+\xba\xca\x80\xa4\xf3\x09\xaf\x83\xcf2@\xb9\xdc\x0f&\xa8\
+t\xa1Y\x01j\x83\x0e\x19\xc8\xee\xee\x01\xd4\x14G\xcf\
+\x90\x9a\xcc\x91\x90\xea:\x93\x06\x9e\x06\x10\xe7\x1bzr\
+\xa5\xf16\xefb\x03\x07\xf8{K\xc0r\x87\xabLv\
+@\xd9\xcd\x13\xf6\xda\xed\x00\x00 \x00IDAT\xe9\
+\xca\xdb4Z\xc5\xf3\x962\xd2\xdd\x0cK\xdd\xd7t\xaf\
+\xd1\xe1\xdb\x94y\xceP4\xfc\xb1p\x87\xc8\x82\xedd\
+\x0c\x01b\xb2O\x05\x90\x1f\xb6/\xdb\xb3\x96\xd8R6\
+\xa6?\xee^\xc7\x8636V\xd6\xcd\x19\xb8\x05\xd2\xe1\
+\xca2j\xd4\xa8_\x04\x94?~\xff\xbf\xc1\xc5\xfd7\
+A\x95\xaf\x80\xcb\xbf\x03\x1a\x1aT\x812c\x8ag\x10\
+~\xc4T\x1f\xe8s\x977\x10nq(\xb4_^\xee\
+\xf4\xa6\xc9\x04|\xe7_\xac\xb2\x124\x9d\xe6\xe5\xf5\x0e\
+\xa7\x8fO\x13\xd0\xcd\xeaG\x9e\xd976\xd6G\x07I\
+{-|L\xf7,\xe09>\x18\xcb\xc3\x0c\x96\x01f\
+K\x1a\x04j\xdbrx\x10\xcf\xb6\x80\xf1\x19\xb6\xdf\xb7\
+\x81N\xd8\xca\x94\x15z>QC\x9eH\x9c\x0e`>\
+\xea\x8bAr\xacE\xcc4\x80\xc5,8\xd3]\xbf\xf9\
+;\x87\xf3\xd2_\xc5}\x9f\xbf:\xd3Y\xf4\xc6\x02b\
+\xab\xb5\xa99p\xa9\x80<\xba\x90\x08.M|\xba[\
+\xe0\x98\xfb \xb5rM\xa2~\x0cD\x16\xbcT\xc7[\
+C\x9c\xbd\xa9\x8c\xc52Ox\x01\x8bMH\xdd\xe4s\
+=\xfb\xd1\x1c[\x12\xbb\xc8\xa6\x9b7?cd\xbe\x09\
+\xd3\xd7\xd8\x1a\xc8G\x1c\xd2\x8cM\x88\x1e[\x09<\xca\
+|o\xab\x8e<!U\xd0\xc2\x81<\xfb-\xb2\x9c\xb5\
+\xa5\xd7\xb53\xb1\x06g\xb1\x0f\x9a\xab3\x00\x126%\
+\xfa\xf7\x01\xccG\x8d\x1a\xf5\x05@\xf9\x06O>\xf8!\
+.^y+e\xcau\xd0\xb3\xf9\xc3z!acE\
+VX\xf2\xf8\xbbLKN\xf5\xd4\x0dlH|\x18\x02\
+\xa9[\x80\x121\x99Q[\xf7w\xcb\xcf\x9f?>\x85\
+\xcd\x16\xc8\x8e\xb6\x0a\xd0\x81\x0d\xf6\xaa\xc8.\xc9\xaf6\
+\x06\xca\xf2\xc4\x87\xbc\xd5\x09~u\x93\xc9\xe0s\x07\xca\
+\x83\xc4\xc5\xe6\xf9\x00\xc8\xf7\xbb\x05\x90\xdb\x0d\x01D\x96\
+\x02\xff\x1eN\x1d>\xf8\xe9\xf5\x09\xde\x1e\x97\xca\xa8\x17\
+\xdfM\xdcLIv\xdd&2\xf1\xc6V\x1b\x5cHP\
+\x17\x01\x9fj\x95\x83\xff\xa1\xbc 5\xe6\xa8\x89\x95\xd2\
+\xfc[\x1cS_.\x9d\x09i\xacz\x04\x91\x08\x9fa\
+\xb8a\xf5+\xfd\x1at\xcdu\xbc\x7f\xba9\xda\xb8\x04\
+\xa1z\xfad\x9fv\xfb\xc5\x82\xd7\xb8\xec$\xf5\xe7\xee\
+V+\xcb\xbfQM\x02\xad5=@K\xceD\x93\x0b\
+\x95\xa6 \x11\xd9\xa4\xa2<c\xb4+l;\xd9\x82\xfb\
+\x091-i\xa6B\x93\xb8\xee\x80a\xb83\x1e\x83r\
+\xff-\x9f15\xb2\xc5l\xd9\x96\xa8K\xb7\xb02\xdc\
+$-\xaa\xa7\xa74-\x0a\xe2\x070\x1f5j\xd4\x0b\
+A\xf9\xd3\x0f~\x88\xf3W\xde\xaeL\xb9\x02rV}\
+7;\xa7\x15\x05\xe21\xf5\x12H\xbc\xcb+\x1b#\xc4\
+\x04s~\x8d7\xc0I\xbd1C\xd8\x10\xe8\xb2-{\
+e\xa3\x06u\xe8\xf3\xf4z7\xe3\xf9\xa3\xe7\x158\xd3\
+\x0c=t\xe7\x8d\xe1\xa19`\x0f\xce\x05z\x13\x17\xb8\
+N\x9a\x0c\xf9\xe7\x8cc\xff\x98o\xce\x086\xef1\xef\
+\xf7\x98\xf7;\xd8~^\x069o\xdc\x83\xe8\xc7\xadV\
+\x00\xfc\xb2/\x1e\xef\x8e\xc4jr\xd4\xa8\x1b\xae\x01k\
+:\xf14\xbe^/~$\x97Z\x5c-#n\xf0\x94\
+N\x82n\xc4\x164\xb3\xab+\x89\xc0\xddePu'\
+\xe2\xeeb7_>E>\xc7\x5cD\x9e\xa3p\xc9\x19\
+\x88V\x88\x86\x98\xac\xa9\x9f\xc7\xbe\xf7(\xf7:S\x15\
+y\xb3T\xcd\xf6}\x93\xaa\x04\x80\xaf\xc2\xc0,\x10\xaa\
+\x04?\x99wV\xb1:\x90\x9a\x04\x12-\xdf\xc9\x129\
+\xcb\x9a\x92\x85V\xa4\x7f\xd1\xdd\xa5\xe9\xe5a\xdeu\x8b\
+\x22}/\xbb\x9b7\xdc\xd6\xda\xe7\xe8\xdaD\x08\xad\xe8\
+\xce7\xb5C\x0c\xfe\xf3\xda0\x05\xcb\xb0x\xce\x0e`\
+>j\xd4\xa8\x1b\xeeL\x13\x9e\xbd\xf7\x03\x9c\x17K\xc4\
+iZ\xd1\x94k\x92'\x9d~\x9c\x02\xd0\xd7au\xee\
+\xb8\xc2\xc4\x9e\xabZ\x1d\x06\xae\xc4\xb1!\xd9g8F\
+^<\xd4\x93,\x9e\xe8\x9d\xfb\xfc\xc9s\xcc\xd7{\xa8\
+}W\xba\xbb\x80\xe0/\x8e\x04\xdc\xfa\xa7y\xb6\xf2\xea\
+-\xd7,\xb0\xecV\xed\xc8\xca\xc3\xdb\x96\xffs\x8fN\
+\x03\xe6y\x8f\xfdn\x87y\xb7;\x80q\xcb\x93>\xd3\
+c\xb1\x8a6\xack\xa4`\x86G\xfb\x0dv#hh\
+\xd4\x17k\xf7]\xa2d\x1c\x027\xf3\x90G\xb5\xba\x96\
+\xd8':xDv\xb87I\xaaA\x95\xa0En\xa0\
+.N\xf5@\x91\xf4\xc0\xd4\x7f\xa3\x845'\x91M\x14\
+\xb6f\xc2\xf2\x14\xcc\xfanY\x94}\x18\x22\x95\xd0\x9c\
+\xb6]\xaa\x09_\x08\x00\xfaD\x08\xb7\xebU\x1b^\x18\
+\xdc\xdeR\x5c\x1a\x06\xeb@s\x01\xc1\x5ce\xbe\x93&\
+H\xddj\xe2<\xaa\x93\x14&\xc6\xeff]c\xd2\x86\
+\xd5\x11\xd8\xef\xb0\x8f\x93V\xac{\x0e\x95\xfdlLe\
+4m\xa5\x93a4X\xc8\x94:(+\xf3\x0c\xc9~\
+\x8d\xc3\xb9\x03\x98\x8f\x1a5j\xb5N\xdf\xfe]\x9c=\
+|\xaf\xba\xafLKp\xd0D\x8a\x13\x8a\x07\xe7E\xd6\
+B\xb1(\xeb\xd8\xab\xb5%\xe7\xeegA\x0f.S^\
+\x99 \xa6O\xa1\x03\x9c\x1d\xf2\xcd\xe4\x9b\xb7\xa5-)\
+\x9f\xf3\x8c\xc7\x9f=\x83\x0bF\x8a\x12F\x06\xfd+\xd7\
+X}\xf7\x14\x83j\xd8\xebP\xaa\x05\x9dd\xb7d\xbc\
+,\x0d[4lXr\xfa\xcc0\xef\xf7\xd8__\xc1\
+\xf6\xfb\xa6\x1dw.\x15\xf4!)7\xb2\xdc\xfa7k\
+;\x1187\xe2r\x7f<\x80\xf9\xa8\x17\xc3r\xd1p\
+G\xce\xb1%/2\xe4\xbd\xd0\x85\xbbD\xf64\xbb\xe2\
+4L\xac\x07\xf3\x01\x95\xd6\x17Y\x7f\x0f\x11\xea!c\
+v)\xdf\xa9\xf7\xb2F\xfe\xf7\xd6\x86\x0d\x8d\xfd6\xbb\
+\xa9\xf4.#\x88}\x98\x0eTN\xe2=\xb3S\x015\
+z\xfbB}\xef\xd6\x1a\xf8p\x1e\xa7\x93\xa7?pY\
+\xa2r#l\x9c\xa2\xa6\x1d;\x05\xa5\x061\xab\x89\xfa\
+y\x1f\x88\xe4\x07\x80\xe9\x86'\xfbg\x80\x85\xa5\x80\xf6\
+\xfd\xeb^c\xd2\x9d\x01\xc8\x04\xeeE\xf7N&n\xf5\
+m\x18\xa2\xbb\x87\xd2\xdd\xe3s\xcafh\xccG\x8d\x1a\
+\xb5Z\xe7o|\x07\xcf\xdf\xfcf\xf5)W[\xc4\x16\
+\x98\xa02\x8e\xc0\x94\x07\x90\xda\x81\xd3\x9b\x96vW\x1e\
+\x8akN-\x96\x81\xf0\xe2\x83\xbc\xb2\x92\xad@\xdf\xd9\
+\x12\xd2\xb3\xfaO\x9f\x9ea\x7f\xb5\xf7K\xa6\xa9EW\
+\x82V\x13\x86\xc6\x94\xfa\x82\xceq\x8ak\x8di\xd2h\
+K\xcbs\xb2\x17M#ZR9o\xcd{\x9c`\x87\
+\xe3-1\x9d\x1c\xc1x\x82\xd9\x0c\xbb\xd9p\xb53\x5c\
+\xedg\xec\xe6=\xae\xf6sK\x06}\x11._+\x9f\
+\x12\x03\x00\xb8\xd8\x1d\xe3\xde\xd1\x18\x00\x1d\xf5\x22d\xee\
+-D\x89\x80\xd4\x92\xe0\x15\x17\xc4\xe3\xdc?\x1a\xe2s\
+\xaf\x117\x94>\x88GY\xe4\x00\xa8\xe9\xe5Xun\
+q\x01SL\x5cO\x8c\xbd\x84\x8b\xec\x87\xcd\xdd\x9c\xbb\
+\xccZ3:\xa5\xe8\xb5\xad\xc3\xec\x95]\xf6S.5\
+\xe4>\xec\x1b\x87\xfaS\x1a\xdbR\xcd\xbe\xda\x07\x9a[\
+\xb9\xa4\x9f\x92\xed,+\xd7LT4\xf1\xd3\xcf\x0b\x91\
+Lx\x8b\x16\xae\xe4\x02\x82\xa2Q\x807koR\xc3\
+\x95\xe6\x80\xd9v\x05o\x9a\xb6\xbd\xf1^\xdd\xe6\x0a\xa2\
+\xd5f\xd7\xf0u\xfb\x85\xceY\xd3\xcd.\x00!\x09{\
+HYF\x8d\x1a\x95\xd4\xd5\xab\x1f\xe2\xd9\xbb\xdf\xc34\
+m\x0f\xbarHx\xd0\xc2\x94\xd7Ef:\xae<\xdc\
+\x183T\xbc\x02\xd4\xbb\xb5\xbd\xc0~Y\x00\xf4\x99\xb5\
+vpdq\xdbb\x19s\x87\x0a\x86{\xc0\x0e\xcc\xb3\
+\xe1\xc9\xe7\xcfr\xaf\x5c\xe4\x83IikA:B\xa5\
+q;\x9eA\xaa:P\xb6\xff\xd6\x87!\xbb\xb4l\xe2\
+\xb5\xe3\x09\x0f\x8f\x81\x83\xc2{\x03\xe3\xf1\xf2\xbe\x13f\
+\x1c\x8e\x17\xa7\xf2\xcf\x09\x06b6`\xb7\xdf\xe3\xfaz\
+\x8f\x8b\xabk\x5c\x5c^\xe1\xf9\xe55\xce\xaf\xae\x93a\
+\xd0$\xef:\x0eO-\x1bu\xba;\xc1\x1b\xe3\xf2\x19\
+\xf5\xc2\x9e\xce\xaav\xd7\xc5\xa2Wd\x17\x19\xf0\x85a\
+\xb4\xac1\xb7t Z\x1d0\xdc9,\xff\xe9 s\
+\xb9F\x83\x9d\x9d\x1b\x147$i\xa4I\x90MYU\
+\xa3\xa5\xcd\xf9\xe1Z\x0e\xa8\xbc\x10\x09\xd6\x22\xed\xab\x16\
+\xba\x86-Aif\xb9\xadI\x98\x19\xc36`\x0d\xcc\
+\xa3O\xb2Dkd\x18\xe7;\x9b\xc6\xa8\xcag\xe8\x9a\
+,C.|\xb7\xfc9`\x96\xd2\x18\x9a\xfa\xca\x15K\
+\xd8\x22\x03\x02W\xd9\x16\xff\xe349\xb5\xc9\x00\xe3L\
+\x12\xea\xcf\xb0\xa6[\xea~\xe6W,\xda\xbehsC\
+\xb6J\xea\xc4\xfd0\x80\xf9\xa8Q\xa3\x5c\xed\xee\xbd\x85\
+'\xef\x7f\x1f\xdc\x1ca\xe2F\x06=\x9b\xae\xbc\xde\xbc\
+\x03S\xee\xa9\x03\xde\x00[\xd9\x8b(\xd2\x9bl\xfb\x8f\
+5<\xef17\xd3\xa1\xae\xce\x12Y\x08:o\xaa\xe6\
+\xd1\xf3\xd9\xf9%\xae\xce.\x9dAY~\xfbG\xdex\
+\x98\xb9\xedW\xffre\xe9#\x93b\xc6\x88y\xdb\xc3\
+\x08\x04'\xe0\x9d[G\xf8\xe1Gw\xf1\xfa\x83\x13\x00\
+\xc0~o\xd8\xedg\xecf\xc3no\xb8\xbe\xde\x1fX\
+\xf2\xdd\x1e\xd7\xbb\x19\xd7\xbb\x03s>/\xcf\x8c\x93\xa3\
+#\xe0\xf6\x098M\xf5\x09\xbc\xdb\xcf\xb8\xbc\xbc\xc4\xe9\
+\xd9%\x9e>?\xc3\xd3\xf3K\xec\xf63\xba\x05W\xf5\
+\xe6\x15D\xf4l?\x1e)\xa3^\x5cM\xbe\x00\xc9\x8c\
+o\xd2\x8d&MQ\xdds\xaft\x0b\x01\xb9=\x1e\x84\
+!\x17\x98Dmp\xfb\xfcjcG\x22\xeb\xe9;U\
+q\x0d\xcf\x81gp\xeb=2H\xd2\xac\x017\x0b\xc1\
+G~\xdeD?\xc9\xc2\xf0ad\xf9\x97\xefjti\
+\x9a\x0e\x81\xc6!w\x0bj6\xf4\x84\x876\x0e&\xdf\
+1\xc5\xaa\x02D\xd7,)\xd3[eT\x12\xd5\xc5\x02\
+i\xc6:\xd9G2\xb4j\x09ffP\xf2\xf5g_\
+\x12od\xce\xb9\xfc\xe0\xdb\xde\xdf\xfd\xd9\x05/\xe9\xd0\
+2z\xa7\x1b\xca\xbe\x0b\xe7v\x5cm\x18w\xd1Q\xa3\
+F\xd5\x9ao=\xc0\x93\x8f~\x08\x1e\xdd\xaa\x9a\xf2\x02\
+\xcaU\xbe2\x85\x81Ne\xcb\xfd-t\x1dM\xb3\xda\
+D\xe1\xa6\x187\x8fo-ca2\x8b+\xe6\xf2\x96\
+H\xbe\x84en\x86\xb8\xecG\x9f=\xcd\xc9\x1f[\x07\
+\xe5\x9e\xf4\xef\x5c~\xe5O\x13\x95k\x10\xaf\x9b\xe8c\
+\x0f\x7f7\x014\xfc\xb7\x1f\xdc\xc3\x0f\xbe\xf3\x1a\x8e\x8e\
+\xa6\xaa57\x18\xe6\x19\x98\xcd0\x9ba\xbf7\xec\xe7\
+\x05\xac\xef\x0dW\xd7{\x5c\xedf\x5c^\xedqq\xbd\
+\xc7\xe5\xf5\x8c\xab\xeby\x01\xeb\x07\xed\xecf\xbb\xc1\xc9\
+\xd1]<x\xe5>\xde#\xb1\x9fg\x5c\x9c_\xe0\xe9\
+\xb33|\xfe\xe49\x9e\x9c_\xf4\xd4\xa4\xa0\x89G\xd7\
+G\x98\x8d\x988\x9cYFeL\xa86\xa6r\xbb0\
+=\x97\xfa\xfb\x00\xd5;\xdb\xbc\xc3\x93u\xe6\x81\x02\xd6\
+\x0d2\xf4H\x99\x9e\xecI\xd4\xc28[\x1c*t\xf7\
+\x09\x0bs%\x89\x1c\x03~V\xc5T\xe6f\x13\xbc\x12\
+<\xf9\xa0\xb0\x12\x15\xb8\x83>&\x94j\x05)\x8am\
+\xe9\xea\x13\xf1M\x03\xfaq\xf5\xa1:\x9b\xb0\xf3\x7f7\
+\xae\xf0&\xc6T\xca\xc2\xb5\xc4`'\xebH:\xae\x22\
+72\xef\xa0R\xbfW\xb7\x1a\xc1\xca|\xc7\x9b<\xab\
+\xbdb\xd9\x88J\xf9\x83\xf1\x98\xfa\xbd\x10\x8eRs\xb2\
+1\x97\x8a\xda\xbe\x9cg\xdfc~\x05W$\x98\xd6V\
+P\x96\xed\x1f\xc0|\xd4\xa8Q\x87\xdb\xc3\xe6\x18O\xbf\
+\xf1\x8fa\xc7w0q\xc24M\x00\x9a-\xa2\xb11\
+\xe4\x8e3b\x06\xc4\xd7\xb5\xe3\xec\xd2\xfax\xc3\xa3<\
+\xbc\x9c\xf1\xc6\xc9p\x83K\xdcmi\xe9M1\xc3\x8e\
+\xca\x98_]\xedp\xfa\xf4\xcc?@o`\xed\xe3c\
+6U\x9a'\xb3B\x8e\x09Z\xbe\xe8\xa4\xec\xbd<{\
+\xef\x1dm\xf0?\xfc\xf0\x0d|\xf4\xee}\xd7\xb4T\x12\
+\xce\x80y\x01/\xf3\x02\xb8\xcb?\xf7\xb3UV\xfdz\
+?\xe3z7\xe3\xf2z\xc6\xc5\xd5\x0e\xe7\x97{\x5c\x5c\
+\x1d\xc0\xfan>\xbc\x060L\x13q|\xff.^y\
+\xe5\x1e\xde\x7f\xff-\x5c]\xef\xf0\xfc\xd9)~\xf6\xd9\
+c|\xf6\xf4\x14\xf3<\xbbo\xf8d&\xf6v\x84\x89\
+W\xe3\x82\x1a\x95\x80\x90\x05\xae\xb1w\x8dS\xeb:C\
+dP[\xd2\xa6\xce\xae\x18l\x0d\xf79\x10i\xea\x02\
+\xa3\x0d\x00\xe3j\xd9\xcaJ_bD\xe4'K##\
+\xbd\x84\xfd\xd0\xfa\x8e>\xe8\xa5\x19\x18\x08v\xcd\x804\
+\x02\x0a\xb8\x9b\xf8\xbd\xf9c\xc7\x98\xf9\x95\x88\xf9\x8e\xe5\
+u\xa0_B\xcd4\xf54y\x15\xf5\xfe\x93\xb8\xd2(\
+P\xf7\x9e\xdeAv\xc3\x90\xddCm\x0e\x94HQ7\
+.v\xc7.z\xaeCZ\x10w\xbc\xd8R\x91c\xe0\
+\x12\xe9\xb3\xd6\x18\xba\xbd6\xdb\x19\xe4}\x0cV\xb5\x08\
+\x0bA\xe9yZ\x1a\x0a\x7f\xbe\x0d`>j\xd4(\x80\
+\x13N?\xfc!\xf6\xb7\x1f`\x9a\xa6E\xc2\x22L\xf9\
+\xe2\xc4\xe2\x96~e\xf8S\x99\xe1\x9c\xcb\xee\x11\xad\x9f\
+\xe3L\x22\x97\xad#d\xdb\x80\x92e\xf8\x98\xbd;\x8a\
+\xe5\xaao\x0b\xacM\x06\xad\x9f<z\xe6\x93\xfc\x0c\xb9\
+\xa5W\xea\x85\xec\xc1x\xca\xed\xbf\xc0\xf3\xfc\x10\xc8\xd4\
+\x1a\x8fw\xefl\xf0?\xfd\xf1\xbbx\xeb\xb5;n5\
+\xa0\xb0|\x15\xa4\x17\xfbD;\xfc|6\x1c\xe4+\x05\
+\xa4\xcf\x0bH\x176\xfdz7\xe3jw\x00\xe7\xe7W\
+{\x9c_\xeep~u\x90\xc2\xec\xad1\x8c\xb7\x8f\x8f\
+p\xfb\x8d\x87x\xf3\xcd\x87\xb8\xbc\xda\xe1\xd9\xd3g\xf8\
+\xd9\xcf\x1f\xe3gO\x9f\xc3\xcc\xb07\xe2j\x7f\x84\xa3\
+i\x00\xf3Q+\xbd\xb6)\x00S\x00\xce(\x9f\xae\xc8\
+\xdc\xd9\xf8\x85\xd0\x9c^F\xdex\xda\xe2`\xc40\x8c\
+\xd70']7@\xb1\x22u\xc0\x8f\x0dn\xd1|7\
+Ae\xabe\x09\xc0\xb8\xd6\xb2\x0b\x8c4?\xd0n5\
+\xb4\x86I\x8a@\x90\xc5\x98\xdf\xa9NJ\xe3$\xf5\xad\
+\xa9\xc9i\x84\xf2\x87\xc2\xa4\x87\x01\xdcn.&B\xfc\
+\x22\xd3pN\x5c\xe6\x88\x97.\xbf4\x90\x1a\xa6\xafY\
+\x8eY\x97\xd8\xba\xec\x1b\x8f\xc0M\x82\xd8\xf4X\x9b\xb8\
+\x85E\xd9\x94\xdfw\x9a.Zt\xf9}Bj\xb3\xf7\
+d\xec&\x98?\xc94O\x22\xbb\xe5\x9b\x84/q\xf8\
+\x98\x8f\x1a5J\xeb\xe2\xed\x7f\x88\xcb\x87\xef.\xd2\x95\
+\x8d\x84\x07\xb5\xd0 t\x01A\xcc\x12.V\x98t\xff\
+8\xb0u\xda\xb9\x03\xee@\xa6/\x8f\x93\xf2^\xcb\x1d\
+Y\xa6\x88\xca\xd7\x98\xed\x02\xb2w\xfb=\x1e\x7f\xfe\xdc\
+c\x09\xb9!\xbb\xd8f\xb2s\x1dT@\x9d}\xc7f\
+\xbb(\xee+qi_^\xf2\x8d\xfbG\xf8_\xfe\xbb\
+\x0f\xf1\xe0\xfeI\xf7}\xcb\x7fWf\xa6\x0c\x89\x19\x16\
+\x89J\xfb\x99c\xd2\x17\x16}\xbe\x09\xa4_\xeeq\xb6\
+\x00\xf5\xabE\x1aS\x9a\x9d\xdb\xc7G\xb8\xfd\xe6\xebx\
+\xf3\xad\xd7qqq\x89\xcf?{\x8c\x1f\x7f\xf2\x19.\
+v[\xdc=\x1a\xd7\xd4\xa8\xa4L\x5cM\xd8\xdb\x14\x06\
+\xcfD\xc5\xe6\x9d)\x93\xc9\xb9O\xea\xc0\x9ew\x14Q\
+\x10\xd7\x18Jk\x09\x94l\x06\xdeV}H)\x81=\
+\x0bX\xef(Oq}\xb2p\x1f\x00R\xfb@\xbd\xee\
+\xab\xe3I\x84jL8v\xe74\x85~\xd01&\xfe\
+XP\x94\x93isT\x06d\xa9!H\xa9\xa6\x1bb\
+S\x9bHFb\xc4\xbc6;\xba\xff\xe8i\xe9\xe2f\
+S7_\xd8\xf7\xcc\xc7=3\x16h\xfb\x98\x1d\xd8\x17\
+i\xb7#X\xeab\x83\xdaY\xb2\x0fj[\xc1\xe5\xc8\
+2Y\xd3n\xb3\xecWKl|\x95\xd8\x91\xf4S\xd8\
+\x00\xe6\xa3F}\xed\xeb\xfa\xc1{8{\xfb;\x87\x00\
+!\x19\xf6\x84\xcaV\x825\xa2c\x08J\xda\x1bo\x12\
+rD`\x9a!f\xf6!\x93\xa4\xb3\xf3\xf6\xaf\xe9\xf5\
+\xda\x0e\x0c+H6\x1f\x0c\xb2\xe6\xde]\x86\xa7\x9e=\
+;\xc3\xfez\xd7\xde\xc6\xb9 D@\xe1\x9f\xa0q/\
+\xf4:\xce\xf6\x1f\xd3\xd2\xf8\x98\x1dd#\x96\xdc\xdc\xbf\
+\xf1\xca1\xfe\xb7?9\x80\xf2\xc8\x94\xbb\xedC\x8b\xb8\
+. \xdc\x1ch_$.f\x95I7\xd5\xa4\xcf\x86\
+y>\x80\xf3\xdd\xde\xb0\xdf\xcf\xb8\xda\x1d\xfew~\xb5\
+\xc7\xd9\xe5\x0eg\x17\x07&\xfdzon\xa9\xfc\xce\xad\
+\x13\xdc\xf9\xe0\x1d\xbc\xfb\xfe\xdb\xe0\xd9;\x98\x9f\xfc'\
+L\xe7?]\x12FG\x8d\xf2\xd7\xb0c\x08%\xaa\xdd\
+\x12TD\x96H\xf48\xcc\xdd\xbc\xd0\xf5E\x85Y6\
+\xc6\xf8\xb1\xc6l\x16+>2\xb9\x88\xa8\xc1FVe\
+\x0b\xec\xe6`\x1a#\xdc\x8f\xc8\xf4\xe1hM\xd6\x10A\
+,|\x07\x92\xb0\xab\xcd\x86\xbb\xd7\xb3W\x86\xbac\xdf\
+\x05D\x1az\xa9\x85\x04\xe0\xb0\xde+\xe8\xec\x09\x95\x0c\
+vz\xf0H\xb5\x94}\x14\xb3@W\x9dqC\xf8\x0e\
+\xf5\x9e\xc6\xd4\xb9\xa4\x7fuxTt\xd3\xc1r\xcc\xb4\
+\xd9\xa0\x13\xa5$&\xf3mr\x81\x89\x17\xb9Y\xb0\xcc\
+\x14_\xf3\xb6bl\xd2\x18\xb4\xb4\xd85\x12*\xfah\
+\x0e`>j\xd4\xd7\xb8\xe6[\xaf\xe0\xf9\x87?\xc0\xb4\
+9j>\xe5\xcc\x00\xb90HI\xca^\x0e\xca\xa3l\
+\xe3\x8bx\x963y0c\xf5},A\xd8\xd1`\xa0\
+\xf9\x02\x07\xc3\x04\xc4\xf8\x22V\xaf\xe0G\x9f=[\xb9\
+w\xb6aU\xde\xb0\xcdXyX\x03a\x10\xd5\xed?\
+\x1d\x84=\x00\x91\xb7\xefl\xf1\xbf\xff\xf3\x8f\xf0\xf0\x95\
+\xdb\xeeKZ\x5c\x8a\x15`^\xc1\xb9H\x06\xaa\xb4\xa5\
+J\x5c\x9a\xcc\xc5\x0aP\x9f\x81\xd9f\xc7\xa2\xdf\x9a\x0d\
+\xd7\xfb\x19wv3^\xd9\x1dU\xa9\xcb\xe9\xc5\x0eg\
+W{\x5c]\x1f\xfe\xbe\xec\xe7\x89\x04\xee\xbf\x81\xb3W\
+\xde\xc0\xf6\xe21\x8e\x1e\xff56O\xff\x06\xb0\xfd\xb8\
+\xd8F\xf5A.\x91\xf4E\xc0}\xea\xcbm\x097\x10\
+\x9d@(l\xab%\x9e\xd1f\xe9}\x02i\x18Z\x12\
+M\xbfv\xabbt_\xea;\x0c\xd3x\x1cI\x1c\xa5\
+k\xfeW\xd21\xdd\xb0\xa2\xdf\xc2\x06HU\xbf\xe2\x99\
+\xe8\x90\xc1\x93\x0e!\xc65>\xd7\x04\xc5\xd5\x05ws\
+\x96o\xdbe\xf1X\xf3\x99\x0f\xc9\xab}R\xaa\x04\x1d\
+u\xfe\xe6\xb9\xfc\xa7\xba\xc4$\x07\xa8\x1b\x03\x08_\x8a\
+\x9dv^\xfb\xb3,\xfcNv\xb1\xc9\x80\xad\x99L\x04\
+\xf9,\x0f\xab\xbd\x16\xf3\x05\xe4\xe5{\xb6\xaftx\x97\
+\x01\xccG\x8d\xfa\x9a\x96m\x8ep\xfa\xcd\x7f\x02\x1e\xdf\
+>\x00\xf2i#\xf6\x87\xe2WN\x06\xf9J\x90\xb3t\
+\xac\xf0\xcd#\x90/b\xd3\x81x\xc3\x5c\x17cwN\
+`\x96\xbfs\xb2\xc2\xd9\xff`\xb9\x93^\x5c^\xe3\xe2\
+\xf4\x22\xc2\xeb>\xbc#\xd9\xb6\x14x\xe8\xe2g\x16\x90\
+\x14\x9c[\xca\xc0\xed+\xc7\x13\xfe\xcf?\xf9\x10o\xbc\
+z'm#\x94e3\x07\xd8\x1b\xb3\xd3\xf4\xe7\xec\xf5\
+\xe7hlz\x03\xe9\x93\x1b\x1a\xdd\xcf\x86\xe3\xd9\xb0;\
+\x9a\xb1\xdf\x1bn\x9f\x18\xee\xed\xf6\xb8\x7fg\x8f\x8b\xab\
+\x19\xa7\x17;\x9c^\xeepqu\x18\x1a-\xdb0\x01\
+\x98o=\xc4\xc5\xbb\xff\x04\x9b7~\x07\xdb\xc7\x7f\x83\
+\xed\xa3\xbf\x04\xe6\x91\x0a\xfau\x86\xe5\x86\x849d\x17\
+f\x1e:bK\x04\xe9@\xd3C[s\x88\xaa\xa4\xb7\
+\xb5\xf4a\xd7,\xe7\xce\x1d\x07\xec\xe7\x13/\x1b(\xa7\
+\xd8\xf3\xf9\xa0\x84Fp3\xba.6\xa2\xb6\xd2\xef\xbd\
+\x8bH\xbb\xa50\x98\xf8\x85\xdb\x8ee\x9d\x81\xb5\xf7q\
+r\x9d\x06r\xcb*\x04;\x99\xddJ\x0a(\xfb;L\
+\xb5\x84\xac\xb2\x0bvy\x13\x5c\xebv\xac\x85\xa1\xd1\x1d\
+\x03 \x8bW\xa5\xd8\x09\xf6\xae=\x0cn/\xac,~\
+\x0d/\xa2\x97\xb7\x10\xbdaf\xb5uL\x13Y\xd9\xc0\
+4\x90\x92\xdc\xc6\x96J[\xbeK\xd6\x00\xf8S/\x19\
+P29\xab\xe8\xcf\x8b\x01\xccG\x8d\xfa\x9a\xd6\xc5{\
+\xbf\x8f\xdd\x9d\x87\xcb\xb0gK\xf4$\x0f\xbe\xd6\xcd\x0e\
+\xd1\xa7{:\xb6<\x9a\xc6f\x80\x95y\x84D\xe2\xa3\
+\xd0\x03\xd9\x94\xd6\xa1<\xa8\xe4\xa1\x1c,\x08l\x1d\xe9\
+\xc7\x10p\x07\x98\x9f<~\xd6\xdc\x11\x98<o\xc2\xd6\
+\xd1\xff\xbf\x15\x90\xbe\xc2\x82\x05tr\xf0\x8a\x076\xd3\
+\x84\xff\xe3\x9f\xbe\x87\xf7\xdf\xbe\x1f\x98\x9c\x84\xdd\xa1w\
+L0\xf3+\x0a&2\x1e[\xfe_\x93\xba\x88\x06\xbd\
+\xc8\x5c&\x91\xbb, \xfdh\x9e\xb0\x9b\x0dG{\xc3\
+\xfeh\xc2\xc9\xf1\x06wN\x0cwom\x17\x99\xcb\x81\
+E\xaf2\x97e\x83&\x10\xf3\xd1=\x5c\xbd\xf5\x07\xd8\
+=\xfc\x16\x8e>\xfb\xff\xb0y\xfcW\x80\xed\xc6\x05\xf8\
+\xf5\xa3\x02*Z\x8d\x16\xcf\xc6\x9c\xa5T\xbf\x8d2\x94\
+H\xaa\x19\x09Sy\x9b\x09h\x92\xc9\x10\x07}{\x92\
+\xb5\x00.\x86\x14N\x04\x99B\xd6sx\xe1\x83\xef\xbf\
+\xfdEJ\xc9\x81\x10\xda\xb7\xbf\xeb\x15lk\x0dL[\
+B\x16\xd0\xfa\xfb\x89\xde\x1b\xd2t\xfa\x15\xbe\xc4\xcc{\
+kw\x8090\xe6\xea\xdb\xed%=\xe6-+e\xa7\
+X\xb6o\x10<V\x92\xc1O\xab\xde\xefL\x92\x94\xe1\
+\x1a\x06\xab\xc9\xaeXi\x04-\xeb\x0b\x84yO\xd3\x95\
+\x9a5&o\xde\xcfN2d+\xae`\xc9~.\xfb\
+i\x00\xf3Q\xa3\xbe\x86\xb5{\xf5\x03\x5c\xbd\xf1\x116\
+\xd3\xd4$,X@\xb9\x03\x93\xf4^\xdcq\xf8&L\
+\xa3\x97\x9bw\xf7\x00I\x80\xbbu7\xb2\x17\xb0\xeb\x0e\
+\xeb\x071\x8a\xad\x00\xe3\xd5\x1f0\xc8A\x96\xfd2\xcf\
+x\xfc\xf9\xb3.R9k(\x5cC\x90y\xa1w\xfb\
+)\xbc[\x98n-@~\x22\xf1?\xfe\xc1\x1b\xf8\xde\
+7^s\x03BH\x03=\x22Po\xac\x9f\x02\x1e\xd5\
+\x98\x97\xc6\xa6hJman\xcc\x80)2\xe8Sc\
+\xcf7f\x987\x86\xfd<\xe1h6\xec\xb6\x86\x93\xa3\
+\x0dn\x1d\xcf\xb8{\xb2\xc7\xbd[[\x9c^\xeepz\
+q\x90\xbb\x5c\xcf\xd6\x92Ka\xb0\xa3\xbb\xb8z\xf7\x87\
+\xd8\xbc\xfe\x1dl?\xfbKL\x8f\xffjh\xd0\xbfN\
+E5\xb0\xf3kn\x152[f\xb7'\xf6\xa7:\xe8\
+Wt\xc0\x0e\xe46\xf0\x8f\xc4\xba\xaf\x86\xf0\x84\x08z\
+\x0f\xce\xc2\x02\x9c\x99\x80ICn\x8a\x17\xee\x8bf:\
+?\x9a\xbc\xbf\x0e\xadx\xeb\xc04\xa98$\x02\xb7\xcf\
+A\x17\xeacY\xaa\xa9\xe3\x03\xack2\xe8\xd4&L\
+V\x18-Ibh\xee*\xaa\xbbv\xe1i\xce\xd5E\
+t\xd7i@\x12\x9c\xe7\xba\x9a\x22\xaa$\xa9\x03\xc0\x9d\
+uL{u\x1d$\x0d\xec{\x948u\x8dF\x18\xf0\
+w\x13\xa3z\xfe\xf2&\xd7\xaf2\xcb@\x1f$U\xb6\
+i%x\x896\x18\xf3Q\xa3\xbe~\xbc\xd5\xf1]\x9c\
+}\xf8\xfb\xa0\xea\xca\x05\x943h\xca+\xdc\xcc\xd8_\
+FIK\x06N\x13\xad\xf9\x0d\xa1\x1c\xf1\x91\xd2\x0dh\
+\x92\xa2\x15\xed\x9dX,Dj\xc3r\x9e+c\x8d\xce\
+\x9e\x9dc\x7f\xbdG\xd2n@\x03#\x10\xbem\x04\xdb\
+m\x89\xb9o\x00j`\x10\xfb\x81Xr\xc2\x1f\xbd\x7f\
+\x07\xff\xec\x0f\xde\xc1f3\x098\xe9\x9f\xf0\xca\x06\xa9\
+f\xb5\x82\x19\xd1\xba\xd6\xc6\xa5\xb2\xe4\xcd\xcd\xc6\xac\x05\
+\xabX\x95\xbc\xd8\x02\xd2\xe9X\xf4y6l\xe6\x83\x85\
+\xe2f2l7\xc4\xd1v\xc2\xf1v\xc2\xc9\xd1\x06\xb7\
+O\xb6\xb8{\xb2o\x00\xfdz\x8f\x9d0\xe8\x000\x1f\
+\xdf\xc7\xd5{\x7f\x88\xe9\xb5o\xe3\xe8\x93\x7f\x0f>\xff\
+\x18\x99\xb6u\xd4W\xed\xc6\xb3\x00\x94\x8e%\x14h\xae\
+\xa0U\xd9`C\xda\x95F0_g\x13;\x06\x9b\xb5\
+Y\xadz\xe5n\xd1n\x01\x8dm\xf2S\x00\xae\xbf\xb3\
+Y\xb5\xe7+\xc3\x92p/2\xc7\xe0\x86\xa6\xdd\xc2\xcc\
+\x8b6\x14\xee~\x13B\xdei\x9d\x840[|\xa4e\
+h\xbbr\xd1U\xf6\xe1\xb5\xf7\x0c\x7f.9\xa3%\xfc\
+&%;\x18\x9a\x80&\xf5\xf0\xf4\x8b\xff>\x1a\xe2$\
+Jy\xc0\xbd\xd6\xeb\xfcK\x93\x9f\xe1p\x06\xe4\x9d\xcd\
+AE~\xc5y\xafk\xdb\xc5\xfe\xe7\xac\xda\x1a\xfft\
+\xa3\xcc\xf8\xf8\xf6\x87\xd5V\x93\x22\xdb\xe1\xa4v\xbe\xe1\
+<\x14\xfd\xce\x00\xe6\xa3F}\xadX+\xe2\xfc\xa3\x1f\
+\x02'wk\xb2'*0'\xbc\x05\xa22\xe4\xb9#\
+\xcb\x1a@E\xc7\xbc\xf4\xbf\xf3\x91\xc8k\x049W\x16\
+\x90\xe9\xe3\xea\x91\xb0\xe9\xcc\x11\xb8\xdd\x80\x01\x1f}\xfe\
+4\xd9\xdal\xc05\xf9V\xdd\xc3\xb6\xecOs\xae6\
+n\xf3d\xf8\x93$\xde\xbc\xbd\xc5\xbf\xfe\xe3\x0fq\xb4\
+\xdd\x84^\x86\x0e\x84w\xce\xc8\xf4\x89\xa5\xe9\x92\xae\xb5\
+A\xa4\x02\xeaW\x01\xba5V}Z\x5c[&#f\
+\x1a\xe6\xe9\x00\xda7\x130\xcf\x13\xf6\xb3a\xbb\x99q\
+\xb45\x1c\xed\xf7\x0b@\xdf\xe0\xce\x02\xd0\x9f_\x1c\x92\
+F\xf7\xb3?\x08v\xeb!\xae\xbe\xf1'\xd8>\xfd\x09\
+\xa6O\xfe\x1c\xbcz:\xae\xcf\xaf8c^\xc1\xb9\xfb\
+qa\x15\x03\xc02:'\xc05\x97\x8c\x9e\xde\xed\x9b\
+~k\xcbGm\xb0\x90\x9e\xddt\xb77a\xacc\x02\
+f\xd1\xb5W\x97\x12\x07\xe3,\x80\xed\xd5\xbcM\xf73\
+Z\xc6\x18Xm\x02\x02n\x83\x87\x95\x11\x5cZM\xa8\
+\xcc\x5c\xa2\xfaf\xe1\x00\xa6\x1b\x00\xef8\xee\xfc\x1e.\
+\x04A!\x0et\x1b-fH\xc8q\xa7\xf5\xcb\x7f\x9d\
+r\xd21\xcf^\xaeW\x03\xef\xba\xc0(\xf4\xc71y\
+~d\x8c=mM\xa8d\xce\x05\xcb\xbb\xe5,\x88\x9c\
+\xb9<3\xaa\x8c\x1aA\xd2\x871\xa9\xc4k\x00\xf3Q\
+\xa3\xbeFu\xf5\xd6w\xb1{\xf5m\x90\x9b\xc5\xb3|\
+\x0a\xce+2\xe8\xc9$\xcd\xd31\x06\x9a\xe0\xb96\xf0\
+\xb9\x1e\xbc\xe3\x19\x8f\x1e\xeeF-{\xfa\xec\x02\xbdu\
+\x95\x80S\xae\xf0\xb0Ll\xbb\x00\xc3\xc5\xe55\x9e?\
+;O%0|\xc1\xf6\xe7zq\x1d\x94e\xd8fy\
+\x8fE\xbe\xb2\x99&\xfc\xaf\xff\xf4=\xbcz\xffV\xd8\
+\xf8\xb2\x90\x1c%4\x12\xc2\xe4q\x89{h\xaa!\x82\
+\x89\xdc\xd5=@\xe5u\x15\x94/Cofm\x88l\
+\xa2Uo\xf4y\x12\x06}fe\xd0\xb7\x1b\xc3\xd1f\
+\xc2\xf1v\x83[\xc7\x1b\xdc>>\xe8\xcf\x9f_\xeeq\
+\xb9\x9b1;\xeb\xb6\x09\xfb\x07\x1fa\xbe\xff\x0e6?\
+\xfbO\x98~\xfe\x1f\x86\x83\xcbW\x15\x93\xc3rms\
+\x5c\x81\xb3\x85Y\x0c\x1e\xddibBw\xe9[\x8e\x91\
+\x8a\xe3\xc9\xc2V\x07R<\x11\xd65\xc6\xd9\x05\xf7 \
+[\x15\xb4\xa6}G\x93\x8f\x1d\x9a\x0c\x05\xf4\xec\xb4\xcd\
+\x1d\x14\x8c\xd63\xa5\x89-\xe0<.V\x9a\xe5\xe9\x9d\
+\xc8$\x16\xea\x1b\xce.\x91\xb3\xc5\xd6\xafY\xd0\x08\x8b\
+\x1e\xfd\xe4]\x06\x1b\xb3\xa0Sq2\xc9\xc07t\xe7\
+\xc9\xc1\xa1s\xe5\x11\x83\xc7\x96\x04\x9b5h\x22\x96\xb7\
+@\x10\x1d,0-\xac\x00[h\xb8\x82\xd0\x8a\x92V\
+\x9a\xec\xebpV.\x8d\x0e\x5c\x83\xe9\x8f1\x90\xcdA\
+\x97\xff\x1c\xc0|\xd4\xa8\xafI\xcdw^\xc3\xe5\xbb\xbf\
+\xd3R=\xe9YrF\xb6<I\xf5\xec\x91\xea\x0d\xac\
+\xb8\xb2\x11`\xaf(\xb1\xa6G\xcf\xf0;\x0d\x0e9\xc6\
+e\xedU\xd7\x16\xaep\xf8\xf2\xfa\xfe\xb5\xc4\xb3'\xa7\
+\xb0y\xee\x03,\xd69r\x07\x18:}\xbd\xf3zG\
+\x18*\xa3\xd3\x95s\x9a\xf0/\xbe\xf7*\xbe\xf3\xe1\xc3\
+\x83\xe5 \x00L\x8da\xe9l\x1d\x01\xe7\x1d\x1f\x9b\x16\
+\x05\xec\xa6>\xee\xc2\xdcX\x04\xefd]b\xf6\xda\xf3\
+\x05\xd0,\x80|\x021\xcf\x87%\xf1\xa90\xe8\xf3\xe1\
+\x7f\x9b\x05\xa0\xef&b\xbb\x99\x1a@?\xda\xe0\xd6\xf1\
+\x0e\xcf.v8\xbf\x9aq\xb5\x9f\xab\xcc\xd7\x0c\xc0t\
+\x8c\xfd;\x7f\x00{\xe5}L\x1f\xff_\xe0\xf9\xcf\xc7\
+\x05\xfb\x15*C\x0b\x94\xe9X\xc7\xe2rQ\xbdL)\
+K\xfc\xe6\x07\xce\xa1>\xd4\xcby\xd91\xd0\xbd\x17w\
+{\x91u\xec7\x12OquB\xb14\x06\xa8xz\
+\xd7\x8b\xbb%\x86Zb\xd1Znh+`\xac\x80H\
+\x86\xf0 \x03\xd6\x9b\x99Tw\xde\x9ak\xae\x80l\x03\
+\xa3JQ\xbfTr\xff.@\x9e\xce\x81\xc4K?|\
+s\x94*\xaf\xd9\xf4\xfd\xb9\xf1#\xd0\xbb'\x9a4\x0f\
+\xb2JZ\xa45\xf2\x22/]1YP\xf1\xd2\xa8\xba\
+o\xea\x0b\xcc\x05\x5c\x90\xd6\xed\xad\xe5N\xe8\x9b\x0e\xf7\
+8\x0ak\x0b\xb6\xb2\xce\xcb&\x1b\xea1{\x9b\x0b\x1a\
+\xc0|\xd4\xa8\xaf\x05e\xb5\xc1\xe5G\x7f\x00\x1e\x9d,\
+,\xf9&\x0d\x0f\xba\x91-\x0f?w\x1c\x0a\xf1B\xc6\
+\xbc\xd3fs\x8dS_\x91\xa2\xc8\xcd,\x05\xdd\x1d\x18\
+@\xc7z8\x86>\x0c\x03}\xfe\xf9S\xdc`\x99\xde\
+\x8bjH\xd1u3Kg\xf6\x03Bd\xff\xdf\x04&\
+Nx\xfb\xee\x11\xfe\xe4\x07\xef6]\xf9\x02\xa4\xc9\x1b\
+\x9a\x02\x84\xef\x83~\xb9U\xa1E\x03\x1c\xc1\xd9B\xc0\
+\xbb\x89\x8dX\xb5W,\x9a\xfe\x05\xac\xcf\x8bv\xfe \
+q!8\x1bH\xc34\x1d\xec\x15\xa7\xf9\x10\x96\xb4\x99\
+\x0c\x9b\xcd\x84\xcdv\x8f\xa3-q|t\xd0\xa1\x17\xf6\
+\xfc\xe2z\x8f]\xd0f\xcew^\x87}\xeb_`\xf3\
+\xf3\xbf\x04?\xfd\xf3\xc1\x9e\x7f\xa5\xa09++\xe9\xa2\
+\xd1M\xcc\x02M\xdc\xa0\xd8\xa4\x02=\xf9\xcdl\xbe3\
+\x0d\xe8\x82\xc2p\x22H6 \xae\x22\xf9\x9d\xcbV\xdd\
+\xa3\x10\x06/}\x83\x91\x85\x07eC\xdc\xc1\xc8\xdc\xdf\
+\xb2\xd6.yf\x1ai\xd4\xf4N\xcbl\x9c\xd8t\xcf\
+N\xafnk\xb7\x15m\xa4\x12g\x93n?\xf7C\x97\
+\x9d\x8c\x90\xe8A;\x9b\xee:\x8c\xd7\xab\xa5K\xae\xa3\
+G\x1b\xa6\xa5\xae0\xb4\x93\xcb}O\x19\xb5YI\x80\
+\xb6\x06\xdc\x19\x013\x9d\xdc\xa6I\x02{\x9bK\x93\xf3\
+\x0d\x16\xb5\xfc\xd2(\xd4\xa6\x81.\xf5t\x00\xf3Q\xa3\
+\xbe\x06u\xfd\xe6\xb7\xb1\xbb\xf7\xa6\x93\xafD\x09\x8bG\
+\x959\x10\x8f\xcb\xce/d\xcbW\x00z\xbb\xa7\xb7\xe1\
+\xc8(\xab\xe8\xa5(\xf1!\xd1O\xf5\xab\x8f7\xfb\xc7\
+L\xde\x0d\x108?\xbb\xc0\xd5\xf9U{8\x84\xf5\xe1\
+\x8e\x81_\x0b\x13\x92}\xa6R\x96\xba{\xa9Q\xdf\x07\
+P>M\x13\xfe\xe7?z\x17\xf7\xef\x1e\xcb[x\x1b\
+\xb85Y|\xf4q\xf7\x0c\x8ew7\xc8f\xc2\xaa\xf6\
+\x5c\x16\xf4\x9b\x1e\x9d5|\x08$\xe6E\xd2R\x81\x8c\
+\x1d\xa2\xa4'\xb2\xda*\x92\x86\x99\x86i\x026\xd3\x8c\
+io\xd8L\xc4v\x9a\xb1\x99fl7\x87A\xd1\xe3\
+\xa3=\x9e]\xecpvypo\x99+\xa8 \xb0\xd9\
+b~\xe7\xfb\xe0\xbd\xb71\xfd\xf8\xdf\x02\x97\x8f\xc7\x05\
+\xfc\x15\x01\xe7\xee^\xe3R\x11#\x8ek\x00\xc9^\xc4\
+F\xaa\x90\x97.\xd31\x1a\x08\x0a\xc3\x1b8\xf6\xcc\x0d\
+\xa6\x00_z\x98nAz\xa7C\xe2E\xdb\xdd5\xd4\
+\x8b\x17{\x07c\xa9\xfb@uht\xa3\x9f\x11\x18[\
+\x5cEt\xb7\x9el\x22t\x91i,\xff\xf4\xdf\x97N\
+\xffmY\xaf`2|J\xb9\xaf\x84\x03Q\xbf\x7f\xf7\
+\xac\x10D\xcc\xac\xf9il;\xe5;\xeb\xb3\xa1\xfc\xdd\
+\xe4\x08\x08\xde\xc8T\xb0\xba\xc0\x94\xfb\x9aU@\x1d\xd5\
+*\xe5\xb8e\xc7\xa84\x03\xeao\xde\x08w\xebRi\
+\xd9\xa7\xd8-\xdf#\xd7\xf2\x97f\xa2\x1c\xbf\x01\xccG\
+\x8d\xfa\xaa?\x0eO\xee\xe1\xea\xbd\x7f\x88\xc9Y#\x02\
+\x9d\xa6\x1c>\xe5\x93\xabl\xf9\x0d\xac\xf8\x0b\xd3=\xcb\
+\x03\x8c\xe9\x9f8\x00\x9b=|->T\x03S\xcc\x1b\
+\x98e\xe3\xaa\xf0\xfc\xc9\xe3\xe7nhl\x8d\xdd\xef>\
+7l\xaf\xdb\x0f\x5c\x86:\xdd\x17C\x0bq\x220M\
+\xc4?\xfb\xf0\x1e\xbe\xfb\xd1\xc3t\xb8\xf4\x8b\xb0\x90\xd1\
+\xd1\x81\xa9\x15\xa5\x07\xed\xf5\xa1\xaf\xb6\x00\xb2\xb0\xa0!\
++&\x0fD%\xb1\x9a\xf6|y\xa0-\xecy\xd1\xa1\
+\xef9\x1d\x98\xf4\x85A?\xb0\xe8\xf4N.\xdb\xc3p\
+\xe8y\xd1\x9e\xa3\xd9\xe3\xd9\xbd7\xb0\xff\xce\xbf\xc4\xf4\
+\xf1\xbf\x03\x1f\xfd\x15\x86s\xcb\xcb[u\x09\xdf\xc5\xc6\
+/\xb3#*c\x11v\xb3\xc5\xdd{\x14\x5c\x069\xdd\
+5O\xf5\x09\x17VU\xf5\xcd\x0c\xe0J\xc3t\x22c\
+\xbd\xb0\xca\x95\xd1\xa7\xd71\x1b\xbd\xc6\xbc]h!\xec\
+\xa8\xb0\xe7\xe6%e\xed#\xe9\xd3E\xc3}\x95q\xbe\
+D\x80\xa7\x05\xce\xbc\x81i\xf3\xe9\xc2\x02\xf8s\x97\x12\
+kC\xb9\xd6\x87\xdd\xc0\xc2\x9d\xbd\xb2\xc7\xd6\xdd#\xcd\
+Z\x88S\xb4(t\x03\xbc\xd6$K\xf1\xb8u\xb7\xfc\
+n&\x80Nn\xd2\x9b\x13\x84\xc6\x83\x9a^j\xbdu\
+\xa1\x85\xc6+\xce\x1f\x1b|\xe8Pwc\xcd3;l\
+\xe5\x09\x99_ K\xe3\xb4\x5c\x0b\x03\x98\x8f\x1a\xf5\x15\
+\x7f\x22^~\xf8\x03\xe0\xf8V\xc7\x94g\x8cy\xaf3\
+\xefY`\x0b\xe03PQ\x88\xa8\x95\x1d\x87\xbd\xa6~\
+\xbc\xf9\xc6\xa5@8\xf2-\xd4\x94\x1d\xa1\xbc\xad\xf3\x1d\
+\x0f1x\x00\xf6\xb3\xe1\xc9\xa3g\x15D\xa7\xb7\xfc$\
+\xc4\xa3-\xb9'\xaatzYPd\xcf\xc9\x03P\xbd\
+{\xb4\xc1\x7f\xff\x8f\x17\x09\x8b\xad\xf7\x11^\xb6ca\
+\xd9W8$\x0d\x02Y\x01\xf2n7Q\x99\xc9\x1e\x94\
+\x17f\xdf\x0c\xce\xd9\xc5\xe4a5\xcf\x07\xdd9i\x98\
+\x08\xcc3\x974\xc6\xc2\x9e\x1b\xa6\xfd\x81Y\x9f\xa6\x09\
+\x9b\xdd\xc2\x9eOE\x83~\xd0\x9e\x9f\xd5\xf4\xd0\xe5l\
+1\x00\xdb[\xb0\x0f\xff\x18\xb8\xf7\x16\xf8\x93?\x1b\xc9\
+\xa1/+*G\x22\x171s\x89\xb5}\xb3\x9e0\xaf\
+&\xf7\x1d\xd5\xac\x9b\xf9\x8b\x06\x0eG\xcb`_6\x08\
+\x18P\xbc\x93\xd8,\xd7\x08\xe8\xec\x5c\xd53\x9cr\xa1\
+\x9a\xa09%\x17,6\xe8\x0a\xe4W\xe6oZ\x0c}\
+\xbbb\x9d\x17;\xfb\xef\xa8s;}\xc8p\xc2J8\
+9v2\xa4h\xea\xe7m\x89\x83V<6A6\x07\
+\xb5\x14\xb4.\x93\x8eJKg6\x92P\xf9\x8d\x97\x0c\
+\x95F\x021\xb0H\x87Z#\xa3\x8f$/\xa3\x82o\
+\xf3\xab6\x02\xbc\x99p\x02\x99\x8b\x0b\xa3\xec%\x09\xb1\
+\xaa+\xc5\xdal\x14Y\xcc\xf29\x03\x98\x8f\x1a\xf5\x15\
+\xae\xfd\xc3\x8f\xb0\x7f\xf5\x9dES.ly7\xf4\xb9\
+\x02\x8a\x99\x89B\x12\xea\x80X_\xbe\x8c<P\x192\
+\x0c7p}n\x99\xc6G\x1bn\x00\xf29\xabm\x94\
+ \x0b\xcb\xc0|k\x0e\xceN\xcfq}y\xad\xd4\xe7\
+\xf9\xb2\x15\x00\x00 \x00IDAT^\xfa\xdca\x14\
+\x8e\xeb\xdf\xeb g\xf2O\xd5\xcd\x92\xc4\xb4\xc8X\xfe\
+\xd5\xef\xbe\x867\x1f\xde\x05\x02\x83\xa7K\xb6\xfd\x00+\
+\x9b\x8dX\xf8^\xd9\xa8\x97\xca\x86:\xf0\xd21\xea\xde\
+\x1c\xce\x00\xc7\xe8\xa9Gqe\xf9\x96\x0d\x9d\xcb \xde\
+\xc6\xc0ya\xd0\x17\xc6\xbc2\xe7\x15\xa0\x1f\x9ch\xa6\
+\x0d\x17'\x97\x09G\x9b\x83\xf6\xfcj7\x1f$4u\
+\xa9~\x02^\xff6\xec\xe4\x15\xf0G\xff\x06\xb8z6\
+.\xec\x97\xaa\xac\x9bu\x88W\x951G\x8b)K\x89\
+\xb6\xec\xaf\xce\x22\x95uDH\x81\xd4{\x8c 5f\
+\xef\xef\x11.2\x99\x0b\x94\x11\xd6\xfb\x81\x1bb\xf5\xed\
+\xb0l5\x22\xa5j\x19\x8b\x0d\xb4\x04\xdf\x1bs\xd7<\
+\xf1`nXU\xc8\x89tX\xbf\xdd\x0b\x88t\xf1\xac\
+\xad\x14\xb8\xfb\x8e\x80RE\x9f\xba \xe0\x16\x18$\x12\
+\xca\x92t\xe62\x94+i\x9f\xba\xba\x175\xe4\x5c\xbb\
+\xcf9\x91K\x9c\xf5\xa1\xa4zv\xbdQ\x83\xd5\x5c\x09\
+x\x8a~\xf9UB\xe8\xf7u}\xf6\xc8>\xf0\xa2\x95\
+\xb8\x06\xa2\xef\xdf\x88\xaf\x01\xccG\x8d\xfa\xaa>\x0e\xb7\
+'\xb8\xfe\xf0\xfb\x986\xdbe\xd0\xd0\x83\xf0hqX\
+o\x8b+\x8c9o\xb2A\xa4\x1f$\x8aN\x0a\x91U\
+O\xc3\x85\xca\xbf%>\xc4\xaba#\xcc}\xc9{\xd7\
+\x01]\x96\xf5D\xde\x93\xc7\xcf\xe4ah)\xde_e\
+\x89\xf4\xbb\xb0\xd7\x9a\xb3\xfc~\xb1D,\x7f?M\x13\
+\xde\xbe\xbb\xc5\x1f}\xff\x9d|\xc0\xd3V\xbesJ\x84\
+[\x8c\xeek\x8f5\xcb\x5c\x1b\xac\xa7\xe5\x97\xf7Q\xb6\
+\xad>x\x16\xabDe\xf0\x9d\xc4e\xf9\xdb\xa9\xda,\
+\x1e\xb04\x17\xb7\xb8Y\x98N\xd2\x16\xb9\x0b*@\xdf\
+,\xfb\xa3\x00\xf4\xe7\x17;\x5c\x5c\xcf\x98\xe3&\xdf{\
+\x13\xf6\x9d\x7f\x05\xfe\xe8\xdf\x02\xcf?\x1e\x17\xf8\xcb\x83\
+\xcb\xf3\xeb\xa3\x5c\xbf\x1d\xf8\xb5\xc6\xa0[\xd0\xeaZs\
+\xc8P\x1b<F\xec\xd4\xe1\xff\x9e}\xb7\xfa\x9a\xa8\x95\
+n\x9ap\xe3\x8a\xebI\xd7\xb4\x8b\xd7\xb5\xc84\x22\x8b\
+\x9b\xd1\xd5\x91\x11g\xfc\xaf`\xd5\xed\xa7l\xd8\xc9\xd3\
+S\xafruTq\xbb3\xec\x17J3QV4\x18\
+\xfa\x06\xa3\x844Y\xb8\xf7\xf7\x81o\xbew!\x12\x05\
+Lp\xe2\xf1s..D\x8a\x1eH\xe7i\x9f\xd6y\
+\xe9\xa8\xfc\x89]o\xd4@{\x16:\x95\xcc\x12\xd7\xc6\
+\xd0\xdc\xca\x86$\xa0ZkTT\xf7\x9fM?Y\xe7\
+\xf5>4\xe6\xa3F}ek\xf7\xde\xefa>\xb9W\
+S=\x9b\x13H\x1c\xeel\xa0\xdb\x81\xf2b\xe1\xb5n\
+E^\x97a\x19\x01:\x90<\xec\xd6\xac\x07\xd3\x09\xa6\
+5\x92\xdb-\xf9A\x97\xc0W\xcc\xcbm\x95\xe9\x07\xf6\
+\xf3\x1e\x8f\x1f=\xcf\x81v}.\xae0Wd\xfcz\
+\xeeg\x0a\xca5\x81pZ~\xf6\xaf\x7f\xf0\x16\xee\xde\
+>j\xd8Zo\xddN(\x8b|\xeaT&\xa3R/\
+\xf98!\x17\xa2\xa85F;7\xd4m\x0f\x982\xd4\
+U\x1f\xe3\x94@\xa2\xfa\xbf\xe6\xeab\x8b\xde\x85\x05\x90\
+\xdbA{^B\x86\xc8\x09\xd3d`a\xce\x17\xfd\xf9\
+f\x01\xe8\xcf\xcew8\xbf.\xd2\x16\xe9?\x8e\xef\xc2\
+\xfe\xc1?\x07?\xfe\xbf\x81\xcf\xfe\xe3\xb8\xc8_\x92\xe2\
+\xea\xdc\x87\x0f\xfbQ\x90e\xd1 \xbb\xc0\x18\xc6\xfb\x8b\
+\xac\xf5X\x16:\xa4R\x19\x85F*\x15Il\xf0\x84\
+\xc1uN!\xc1r\xb1\xb2\xa4\xe6\x07E\xfbK6\xea\
++,\x01\xe3\x9e4h\x83\x84\x14!\x86&\x8e\xd2\xa7\
+\x94\xaa\xce[Ar\xb1V,\x03\xa0\x22Us\xc7\xc1\
+C\xcf\x15\xcb?\xb1*L\xf4\xeaiJq\xcakP\
+\x9a\x03k\xf7OR\xfc\xe8\xcd\xbb\xef\xa8C\x8b\xda\x1d\
+.ly\xb1Q\x5c'$\x12\xa0\xad\x1e\xe5\xa9\xfc>\
+q\xcb)\xab\xa4\x0c\xe7w\xb5\xcdD\xd5\xeb\xbbU\x83\
+4r\x16\xde\xc7}h\xccG\x8d\xfa\x8a\x92T\xb7\x1f\
+`\xff\xe67\x0f\x80|\x92dOzP\x8dTS\xee\
+-\xcb\xb2H\x8d\xe8\xd1\x9d>|W\x071\x13\x9d\xb6\
+\x12KT\x1f\xde~\xe4\xefEok\xc9L\xd6Z\x9d\
+>?\xc7\xfez\xd7o\x0b\x90\xcc\xbc\xae\xd8<\xca@\
+gd\xca\x9b\x9e\xbf\xfd\xf74M\xf8\xd6\xc3[\xf8\xbd\
+o\xbd\xde\xcd\x0f\xf1\x85\xee6J\x8c\xaf\x8c\x14Y\x00\
+\xf5/\xdc\x0b\x90AOs\x80'\xf3\xe9\xf5+\x08\x12\
+\xa1\xad\xdas}\xbcO\x87\xf7\x9c\xad\xec\x83e8t\
+\x01\x19\xd3\xd2\xac\x1c\x00:\x0e\x00\x9d\xc4\xe6b\x87\xd3\
+\xab\x19\xbb}\xb3\xcc#\x08l\x8e\x81\x0f\xff\x10\xd8\xde\
+\x02>\xf9s\x8c\xa1\xd0/;*go\xedGi\xaa\
+;\xa4d]\x90\xa3\x1b\xe4K\xec\xec\x8aL\xa5O\xe9\
+\xcc\x87\x11\xbb\x1c\x83\xa0\xad6\xf3\x16x\x5c\xf1Q\xad\
+2\x85\xc2.\xaf\xcac\x980\xd9\x0d\x5c[\x84\xf3f\
+\x89\x83\x8c\x05\xd9\x19;E\x8b%\xb30\xf5{\x07'\
+\x17\xaez\xcb\x97F\xc7\xd2\x84L\xa74\xcf\xdc\xabh\
+\x89\xfbJoyC\xe4\x00\xdf\xc2\x12(\x8d\x89$E\
+\xb7\x95\xca\xa2\x1cH\x83\x10\xd4\xc4\xb5\x87\x81\x864e\
+r\x22\x22\x97\x1f\x15{C\xf6\x8e\xec\xac\xcd\x04\xdb\xf9\
+\xa06\x9d+\x12%=l\x03\x98\x8f\x1a\xf5\x15\xe4\xa7\
+v\x1f\xfc>\xb0=^\x98\xf2\xa92\xb7kC\x9f\x9a\
+B\xa9w\x8d\x5c\x7f\xfe\x02\x17\x16y\x02\xb2\xcb$\xc6\
+\xca\x92\xae'\xba\xe24\x7f\xbc\xa9+\x88\xd7\xe1%\xa7\
+b]'\xe9\xea\xef\x9f<y.@\xd3{\xb9\xdb\x17\
+a\x00\xbb\x81Pv@\x9d\xe2\xceR\x06 \xff\xe5\x0f\
+\xde\xc2\xad\xe3\xad\xb7\xdc\xba\x01<+8ft\x93H\
+\x96\xb1\xab\xaa3\xf1\xfbu\x0f\xebjW\xe9\xd9\xbe\x10\
+\xc1\x12\xb4\xa8V\x9d*L\x00\xbd\x85\xa6f\xb2\xe6\x85\
+\xce\xc5\x91c\xb6\xf60&\x88=\x0d\xe0\xbc\xcc?`\
+\xb1\x90\xa4\xb8\xb8\x1ct\xe7\xd7\xfb\x90\xcd\xc2\x0d\xf0\xee\
+?:\x80\xf3\x8f\xff\x0c\xb0y\x5c\xf6_\xda\xbbQ\x85\
+\xce\xfed\xbc\xe1\x0a\xb3LV \xd7\xa8u)\x9c\xaa\
+\xc9\x8e)f\xe8\x07<\xf5\xf7\x16\xb4\xd2\xe6\xaf\x03\x9d\
+\x9f!\xda@$\xd2QRaE\xd5)\x86a85\
+\xb0\xe8\xad\x111\xbf{\x02\xf0\xadW\x19-\x99\xfd\xc9\
+\xf6h\x90\x82$\xb7b\xca\xd0eG\x85\xc4\xa6\xc9\xc4\
+\xcc\x90\x01\xcc\xd3\xba!\xde\xb6\xdd\xf0R9\xb9\xe7\x92\
+\x86\x8c\xc6\xb6\xc06{\xffu\xb1\xadd\xdb\xc7Vt\
+0\x81\xa9p\xcf\x0a\xdd\x15\xd6\xdek\xed\xc6\x9b5Z\
+eX\xb4\xf7\xaa\xcf\x08,\x84\x87\xd6\xda\x0d\xbe}\xcf\
+\x01\xccG\x8d\xfa\x8a\xd5\xfc\xca\xdb\xd8=|\xd7\xbb\xb0\
+T\x8dx\xfb\x9fc\x82;\xbdy|\xec%\x01;\xea\
+ik^k\x9dSM\x91}\xb6\x172\xb9}FG\
+\x0f\xe2\x15\x90r\xe5\x0ek\xc96\xec\xf63\x9e<>\
+\xed\xd8\x92\xb5e\xd7\xb8Q\xdeEB\x80\xb8\xee=R\
+\x00\xe7\x84\x89\xc4w_;\xc1\xf7>z\x18\xee\xdbI\
+\xb2`\xdc\x16\xf8\xa0\x0a\xd7\xd3\x10^c.H\xdd\xcf\
+\xb2\x05\x9d\xa5\xbc\xc6:\xa0\x13\xfc\xce\xf4\xfcX\xa4,\
+\x10\x10R\x1eV\x16l\x16\x0f\xce-\x86\xa9\x9c\x81\xd3\
+\xe2\xdaR\xa2\xae\x17[\xc5f#\xc9*\xf9)\xf2\x96\
+g\x17;\x5c\xee-<0\x09\xbe\xfd=\xe0\xe8\x16\xf0\
+\xa3\x7f\x03\xcc\xbbq\xf1\x7f\xc9\x00y/\xfeF\xc7\xfe\
+v\x00[\xd3}Ctz\x1d\xee\xcc\xfc\x9c\x92\x81H\
+/]\xe8\xefEV>\xc3\x98\x0e`\xfeW\xf6\xde\xb4\
+Y\xb2#;\x12;~syK\xad(\xec@\x03\xdd\
+h\x82\xec\x11)\xb6\x8d\x8cFQ&\x8d\xc9f\xa4?\
+\xado\x92\xcc\xf4A\xb2\xd9LC\xca4-Qjn\
+\xc3\x1e\x0eA4\x80Z\xdf\x96\xae\x0fy#\xe2lq\
+3_a\xe1+(\xa2\xad\xba\x0ao\xc9\xbcy\x97\x08\
+?\x1e~\xdc\x9d\x87\x91\xb3ets\x06\x5c\xcc\x18\xdb\
+\xb3h\xc2i*@\xa7R\x8b!\xe9/EV\xae\xcc\
+n$\x08\xea?\xed\xaed\x9d'\x0f%\x183\xdd\xa9\
+C\xa7v\x22Z\xa3\xe2\xa1\xf9\xda\xcaU2\x8a\xd8;\
+\xbf(\x90mn\x1b\x98\x22\x0fa\xd7\xc4\xea\xfbS\xb7\
+\xaf\x10V\x05\x95j*\xb9\x17\x22\xa4\xdf\x17\xd1-B\
+\x13/\xf4\xd2\xd8\x89\xc4:\x11\xad8*\xdf\x1b\xc0|\
+\x8c1~T\xab\xe1$\xd7\x9f\xfc\xe7\x82i\x1dA\xb9\
+wb\xa9\xab\x99c|\x0dM\xe4\xc0&\x90L\xe4\x08\
+.`\xcb\x80\x1b]J\x1bz\xc5t\x0bw\x17\xc6\xc3\
+\x11q\xc9\xfa\x9c\xd9]\xbdx\xfeR\xae\xaf\xae\x1d\xa0\
+f\xaa5\x5c\xfa\x086@H\x9f\xd6\xe6W^\x01\xe7\
+4\xc9\x7f\xff\xcb\xf7d\xb3^\xd9\xc5\xce$\xf6\xc5\x92\
+\xc8\xc6\x06%\x18\xc2\xb1^@\x96\x96\xc2 \xeb\xb7\xdb\
+\xe1\xb4kX\xd1zj$\xaf\x93\x89\x14kH\xad\xc5\
+D\xbcp\xd3$\x89\xf6\xbc\x1dR\xfdS\x99s\x7f\xee\
+D\x9e\xbe\xba\x91\x8b\xeb\x9d\xed\x19\xa0\x88<\xf9\xa9\xc8\
+j#\xf2\xeb\xffi\xd8)\xde5dN\xa5\x17N\xbe\
+\x8f\x10\xceR\x1e\x82\xe2\xbc\x02\x09|\xb1\x99\x0c\xe0\xa4\
+'HYq\x1a\xf1\x87\xdd##\x22\xe1\x00\xf5\x0c\xd4\
+4M\xb5\x19\xe8\x94\x12\xa1A\xbaO\x0e\xd8\xb8/v\
+\x5c\xaf\x88\x1e\xbb\xca\xb4W\xa66!\x06\x99\x1b\xf5t\
+j<O\xda\x5c\xab&\xdbIk\xe5\xb5\xc5%\x8c\x8c\
+$dt\xa2\xf5\x04\x98\xc2\xbf\xea\xd1[;\xa6\xee\x11\
+\xa0\x06\xe8\xa1\xed5j\xffu(U(\xd0h\x09\x05\
+\xb8:\xc8\xee\x02\xc2\x5c\x13\xffZ\xad@\x8c=\x0bP\
+r\xbd\xe8\x10\xac\xac{a\x8b6\xea9\x0b\xed\xda\x08\
+\xe3\x8a:\x80\xf9\x18c\xfc\x98\xd8\xf2w\x7f.\xbb\xfb\
+O\xaa5\xa2\xb5\xed\x83\x05\xe2@\x02\xa4\x11-\x12\xb5\
+\xe0\xb30XZ\xa7\xb8L\x99(\xc3\x90\x1e\xfd\xc0\xcc\
+\x9b\xb0\x13\x99,)\xb3\x9d\x9a\x96,\xfc2e\x96\xb1\
+(`\xc0j\xd9\x95!\x08\xcf\xcc\xc5TO\xedvS\
+Xr\xa8Em\xcf\x96\x9f\xca\xe7\x9f\xbc\x15\x19\x16\xe4\
+n\x06\x9e\xbb\x033VP\xbb+H,j\xf4V\xb8\
+&\xd5\xc5\x05\x91\xd4\xa6P\x06\x86\x91KlP\xc0\x0e\
+4\xd6m\xa5\xb5k7/g\x93@v\xb2\x07\xeb%\
+\x8e\x1d\xb3\x85K\xdd\xf2\x07\x1d`\xdf\x9f\xd7o^^\
+\xcb\xc5\xcd\xce8\xf1\x80\x10y\xf4\xb1\xf0\xb3\x7f>\xc0\
+\xf9]\x1a\xca\x06/\xbdg\xd3\xfb\x9dN\x0d\xe7\xf5\xe2\
+\xba\x87\x81f/\x8fI\xb0/\xbc\xf8Z[\x92R?\
+\xc7\x0a\x14+0U:\x0f\x09\xc7\xe6\xc3#/\xf5~\
+\xdac\x9c\xbe\xd1S\xb3\xff\xd2!\x01\xe8\xa4>\x1d[\
+\x98\xd0\xa8\x18\x9fP\xdf#\xa9\xe7\x19\xb2\xed\x02@\xdb\
+\x8a\xb87\xb0\xce&m\x091\x06\x86\xb4\xcfm\x95\xbe\
+\x15\xbfq8\x87\x19}\xbe\xfd\xee\x00(\xbd\xc9P\x03\
+\xf6l\xc7\x94\xaeh`\xb5\xbct\x06\xe5:\xac\xae\xe8\
+\xd2\x93\x19\x0f\xddX\x8dN\xda\x90\x91*\xb5\x1d\x96v\
+\x9e$\xe9\xdf\x8fo2\x80\xf9\x18c\xfcX\xc6j#\
+\xd7\x1f\xfe\xde\xde\xb3\x5ck\xc9\x0d(o \xacM\xbb\
+\x89#\x8b\x07\xee\xf0\xd2\x89\x1c\x90\xa3\x83\x8c\xb1\x94\x1b\
+\x84\xe5P!=\x89\x01J\xaf\xe8\x9a\xa2\xb2\x00n\x9f\
+\x82Y\x0b\x98\x9b\x9d|\xf5\xd53\xdb@\xd9\xf9L\xd1\
+}\xc5\xee\x22H\xf8\xef\x06\xc6[\xc3\xe7\x9e-\xff\xef\
+\xfe\xf0]\xc5\x963~LJ\x0a\x86\xf5\xe2\xa3!\x87\
+]\x94E\xb1p\xed\xa41)\x92\xcc\xf1\xea\xadYj\
+\x80.\x91U\x03\xaaS\x02\xb4pS\x81\x9a]\xe7\x13\
+L3\xc0\xd9\xb1\xe9\xcf\xb1\x93\xbd\xa1B\xf9[D\xd6\
+R\xa4-M\xb3/\x8a=\x7f\xaa\xec\x14\xcd\x02\xf9\xe8\
+c\xc1g\xffB\xf8\xeb\xffq\x80\xf3;\x81\xcbKB\
+#\x13\x14\x0e\x15\xf3\x9eR\xe9Vw\x8c\x16\xd1\xee\xbd\
+UP\x15\xec\xbd&F\xa7\xc8\xaa\x054\x03\xf8\xa5\xea\
+\xa90\xcd\xf2\x14u\xcfw\xcaT\x88\x8aUo\xbb\x05\
+:\x89\xd2Jv\xd8\xec\x03\x93\x0c\x06\x13^d\xf9\xf2\
+\xce{G\xacH\xda\xd03\xcf\xb0\x1b=\xbc>\x0f:\
+\x87\x0d\x96\xa01\xd28iL\xbdyC4\xc2\xa0\x86\
+\x01\x89$\xadF\xd9\x1b\xf5\xdcKZ#og!\xb1\
+\x07Wwd\x16\x08\x05E4A\x9a\x06^\xcc\xb5\x8e\
+\xc4U,\x99\xa8s\x92L\x86F\xbcK\xe18/\x06\
+\x22l\x00\xf31\xc6\xf8\x11\xb1\xe5<{8\x83\xc1i\
+\xdezDH\xf3\xb4\x00\x1c\xa9\x1b\x09\xba\x99\x9c\x1dG\
+\x95\xc8'\x1cF\xda\x07\x87\xdf.\xd5\x8b\x9a\x85\xc1Z\
+W\x09\x8dP;\xef\xfa\xe2\xc5+\xb9\xbc\xb826\x86\
+\xf6\xad\x0f\xb8\x98$\xd2\x15m\xf7\xe5\xb5\xd2\x13&\xf9\
+\xe4\xe1V>\xff\xe4-\x85e\xedv\xaa;\xf8\x06<\
+\xc8\xcey\x8c\x9e\xebz-I\x8b\x1eK\xbb+\x00\x8e\
+\x18\xd2\xa2\x9aCSY\x8b\xe4\x1e\xd4\x93K\x5c5\xab\
+-[N\xe9n\x8f\xd6e\xc5\xd6\x84\x06\x11\xb9\x01\x14\
+R\xdf\x89\xc8J\x1bz\xce/\xa6\xc09U\xf1\xf4\xf8\
+\xa3\x01\xce\xef\x104\xaf\x16\xfb\xc1\xc9\x88\x1d\x18]\xc2\
+\xc7\x1c\xaf\xea\xb4\xe5\xc1W\xbb\xa3\x07\xa6\x97\xcd9'\
+\x97\xc6\xee*\x19\x0c(]\xe1\x9cb~m\x9a\xa7-\
+N\x1b\xe84\xc6E\x81}\xf6\x13T\x05j\xb0L}\
+kmW\x1e\xd9\xf6\xe34\xe8g7\x06L\xcf!\xb1\
+/\x90#\xfav\xc5\xb4g\xad\xb5x\x9d\x89T.\xfa\
+\xc4\xe8\x00f\xf3Y\x95\xe9c \x83L\xca\xb0\x88\x02\
+\xe2j\x0b\xd5K\x86j=\xc0p\x5c\xbd=\x07\xea\xdd\
+\x05\xb3kj\xe7\xe5l\xcd\xcb\xfb\x88a\xdch\xa0\x8a\
+\x99\xfd5c\x0d\x97\x0b\xc5\xab0\xdcb\x03\x98\x8f1\
+\xc6\x8faLk\xb9~\xffs\x11%a\xf1L\xf92\
+@\xcf\x1dX`\x1cSr\x11\xc3A96rG\x96\
+\xe0\x7f\x9e:\x93`)I:\x10&\xbd\xff\x96\xb2\xe0\
+\xcf_\xfb\xea\xeb\xa7\x0b\xee-pPA}~xp\
+\x00\xf5\xb7b\xd9\xa0\xdcXf\xb6\xfc\x9f\xffgo\xcf\
+N,V\xeb\x8d\x18}hA;\x90JF@\x1d\x06\
+\xa4`\x8bb\xc0\xf5\xda\xcb\xe4:\xeas\x22\x8e1\x17\
+\x8a\xd3\x07+\xc9O\xb0ec\xf0\x8a.EE\xd1\xf0\
+\x96\x05\x97B\xd9\x89\x05\xe8\xd3d\x81\x84\xc8T\xe9t\
+\xc0\xa6B\xb5\xc3\xbd\x91WJs^A\xda\xe3\x8f\x04\
+?\xfdg\xc2\xbf\xf8\x9f\x87[\xcb\x9d\x80\xe7\x12l\x12\
+3\x12]wQ\x14\x0fq\xd6Fcmzg\x01`\
+\x89fg\x90q0I\x14\xb5\xcfOcwm\x93b\
+b\x88\x22\xfe\xa15\xbbR\xca~\x10@,\x1aR\xce\
+\xc1\x16\xbb\xc6\x0a1I\xb5\xa1\xfb\x19g\x14\x98\xb6p\
+\x8a\x9bZ\xb4C\x0e\xba\x9d;s\xa8\x98#9Z\xa8\
+ST\xac\x8ba\xc6\xbds\x8e\x0d\x5c\xa2:\x87t\xe7\
+\x8b!\x9f\x82\x96\x84H\x1aE\xc5\xbdnX\xa7\xd8\xbc\
+\xd2}?\x15IG\xf2(\xc2A'\x1d\x95B\xa9~\
+\x1e\xb1I\xa0\xb3\xb7|\xd6\xfbS\xaf-\x99&.\x9b\
+$\xe5\xf9\xbd\x070\x1fc\x8c\x1f\x03[\xfe\xde\xef\x88\
+\x9c?\xa8\xe15H\xad\x115P\xee\x83\xf2\xccu%\
+n)\xa6TO\xf4\xeaM\xad\xb4\xe7e\xc4\xf9\xe7\xb2\
+\xc7R3\xa1\xab\xc9n\x93)c\xbe\x9d)\x10v\xbb\
+\x9d|YB\x85\x90\x98\x8ey\xd6\x1ai\xb6\x90h\x7f\
+re\xb4]\xf5\xe4E\x7f\x0e\x81<>\x99\xe4\x0f~\
+\xfe\xb6-v\xea\x82E[\x7fx\xad,\x0f\xd4\x0f\x8e\
+\xf1'u\xf1P\xb4\x96\x0c\x0d\xb0\xac\x8b\x93g\xa7h\
+\x9b\xeb\x18Y\xef\x96\xd8\xe8\xb7\xdc\xb5\x9f\xb0\xfeU\xbb\
+\xfd?\xa9|>#\xcbQ\xb2\x16\xcc\xdc\xbb\xc8Nd\
+=\xe5}}\xaf$\x82s\x81\xc8\x93OE\xae\xffD\
+\xe4\xaf\xffW\x19>\xe7?\xfc\x80!\xb2\xad\xcft\xfb\
+~,\xd8\x9b\xf6Y=)\xf4\xcfutHa\xa6\xdf\
+\xd5\xa9\x98\x92I\x82\xa3\xaaX\xcb\xbb\xbd\x8b\x8a1T\
+1sa\x0b\xfc\xf1\xcfd\xc6\xbd\x07cB\xc5\xd6\xa2\
+\xca_\xe0\x88\xe6\x12\xe8E3\x7f\x9bg8F0\xa4\
+\xe7\xc5\xcfw\xc1\x8dI\x81s=\x09\xb1\xca\x5c\xd04\
+\xe3e\xba0ae\x96t\xa0\x09\xda\xc9H\x1b\xab\x0c\
+7/j\xd6\xad\x0e[MK`\x84O\xea\xc3\x22\xd4\
+\xdd\x84\xa4\xc7\xa95\x19\xfbf\xe2\xd6\xe8\xee\xdf\x8b\xd2\
+B\xd7\xe0\x13akQ\xe5\xbd\xf4\xe1&\xf7\x16\xfa4\
+\x80\xf9\x18c\xfc\x18\xd8\xf2\x0f>\x9fs\xd0}\x8a\xa7\
+b\xcc\xeb\x9e\xb2\xd3D{/\xf3\xe0+\x9e4\x89\xea\
+9\x05\xe8\xd1\xd4\x89\x22\xe4\x80#\x8b[Vr\xbf*\
+q\x81\x14\x0eWs\xb9!\xf5\xe5\xc5\xa5\x5c_\x5cv\
+\xe0\x84+?`5\x9aH\xc0y\x8bj\x82\xd3\xf6\xcf\
+_\x9b&\xf9\x17\xff\xe4\x89\xdc;\xdb*\x0d\xab\x03\xff\
+\x06\xd08FK\x05\xb4X\x8c\xa99\xc4\xfc\x9c\x93\xbe\
+\xf0R\x1aHIRE\xa9\xe2\xa6\x153^\x83@\x0b\
+\x83Y@\x04l\xecx\xd3\x15\xfb\xc2\xc8.\xc0;}\
+\xbd\xf6\xc9C2\xcd\x18\x1cNs\xae\xd9s\xed\xc3X\
+Yx\x11\xe3\xd6\xb2?e\x93\xc8\xbb\xbf'r}!\
+\xfc\xcd\xbf\x1d\xe0\xfc\x1f\x81%/7\xa3\xb7\x96\xabd\
+c\xc2Vj\x80g\xb4\xb7\xb5\x18o\xc0H\x18\xa7\x1d\
+\x1f\x83\x95\xc9\x11\x02u\xef\xbc\x8f\x905\xa3\xcfl\xb1\
+\xef\xd6D}D\xb5\x08]\xb1\xae\x89\x96\xa2\xb2\xeb`\
+\x98\xabl\xaf\x878\x0f\x99\xd8\x10[!f\xd2\xac\xdd\
+\x9a\xf5\xe3\xf7 \x9dp2\x88k\xb1E\xf0\x842~\
+'N\x92\x97\xee\xa9\xfa\x1e\x15i\xfa\xeb\xe2\xe4\x14{\
+ibBg\xc1\xe9\x86\xc4\xd6DOp\xc5a\x07\x94\
+\xeb\xb9\xce}\x22x)\x95;\xd7\xda\x8e1\x09Z\x8e\
+\xf6\xbe\xfa\x1c\xd3\xec\xae\xf6\xd7\xb7\xc1\x98\x8f1\xc6\x8f\
+\x80-\xff\xb9\xc8\xd9\xc3\x0a\x0c5cnd,b\x13\
+\xd4,C\x1e\xbd\xb9\x13S\xac\xe4\xf7\x97\xa1mO\xab\
+\x19\xe6Kf\xccwL\xffD\x87@\xef\x1d\x84\xebY\
+\x14\x11\x91\xa7\xdf\xbc\x88\xaa\x19 \x8d\x18\xd5:ms\
+\x0eLx\x90\x02\xf1\xe6\xcf^\xc6\xb2]O\xf2\xcb\xdf\
+y\xdb\x9cQ\xce\xe8\x041q<\xf3\x1b\xe8\x84z4\
+F\x0c\x8anOA:c\x13)\xe9!\x8c8\xa9\xe4\
+\xcc\x8c\x93\xd1\x83Y/z\xa2\x9b\xde\x14\xa3^@\x81\
+\xd6\xf0\xce\xdb\xfeE\x87\xbe#\x9a\x95\xe2\x8c\xc1w;\
+\x91\xd5\xe4\xa5\xf0\x93\xae\x04\xcdbX\x00\xfa\xe5\xcd\xce\
+|@`\x12\xf9\xf0\x0fE.\x9e\x0b\xbf\xfc\xd5\x98(\
+~pt\x8e\xfe\x03Z\x01\x8eb\x87\x0d\x1ed\x0a\x1e\
+\xe9\x922C\x7f\xa2+\x0dP\xe5\x12\xd96T\x04\xef\
+J\xac%=q\x19]O\x05\xdd\xee\x94\xfe\x8cT \
+4\x84_\xd6\xc2\xd6\x15\x07\xaa\x08\xb1E7{\x96\xf0\
+9\xd7A\xe9f\x14\x94\x1d/I\xfc\xd3mc\xb7M\
+I\xcd\x9a)+\xc3\xaf%=\xcd\xf52>\xb7\x0b\xe7\
+\xb8\xceq\x8cF\x02\xda\xdbF2\x17\x17F\xfbM\xa1\
+\xd3\xdb\xeb\x904(\xfbBS\x94\xf5:\xa4T\xe1\xe5\
+]^\xc8\x9c\xd27s\xbcZ\xcf\xc8~A\x89\x01\xcc\
+\xc7\x18\xe3\x0dg\xcbW\xb2\xfb\xe0wk\xc3\xa7\xb8\x18\
+\xf86\x1b)\x00\x8e\xdcUD\x92\x89\xb0r\xc28\xdc\
+\x0c*=h\x9dg\xd4\xccs\x1cz\x04\xba1?\xd0\
+Zt0\x8f\x9a\xf7\x81\xdc\x9e()Z\xec\xdf~\xf5\
+4u\x88\xf0`\xdc4V\x19=\xb9\xb5A\x84\xd8\xb4\
+\xcff\x8f8\x09\xa6I\xfe\xcb\x9f\xdc\x93'\x8f\xce$\
+\xd9\xb9L\x80G\xdc\xea\x86a\xb9\x93k\xe0\xe3\xca]\
+\xf5\xd2\xc2O\xec\xee\x82\xaeE\x0as\xd7\xb6\xd1\xa9\x8a\
+\x1a\xed\x84\xd3\xa4+Z\xdf\xde\xd6$\xe5\xc0\xa0\xb7\x89\
+Mrh\x03\x05\xd3\xec\xd2\xd2$.\x0d\x9c\x97\x7f\xdb\
+\xcf<\x09e'\xe4\xaa1\xe6\x14\xd9\x91\xc2\x0b\xca\xd5\
+\x8d\xbb7\xa6I\xf0\xe9\x1f\x09/\xbe\x16y\xfe\x1f\xc7\
+|\xf1\x03\x0d\x17\x00\x1cXa\x0f\x0ciJD\x84\xc4\
+_\x1a]\xb7\x06\xad\xc8M_\xf4s\x1d\xfaf\x92\xe7\
+Et?\x85e\x80\xcd=\xebzC\xab\x84A\xe0\xde\
+\xcf\x06|i\xd0^\xf5\xf0\xc8$\x81\xdab\xd1\xf0\xc1\
+\xaaw\xc4\x95#p\xf3\xa5D\x16\x03p>6U\xdb\
+m_\x87\xbd\xa0\x04(+H-[Q\x06:\xda\x93\
+\x1dt%\xbfg\xc0\xa9r\x9a\xd9\xc8\x0d\xaa\x9e\x1e_\
+6\x18\xdd7(eK\x0d\xba\x91\x06\x08.<t\xd6\
+\xf7T!l{+G\xefV\xa6\x8b\xaf\xea\xe0^\xdf\
+\x96\xbe\xc94\xd3\xb5K;\xefe^\xccw;\xe2\xf2\
+\x07\x0e)\xcb\x18c\xbc\xd9l\xf9\x93Oew\xf6P\
+y\x96[\xc7\x95\x00@\x13\xab?$ABmbI\
+\xe4\x1d\x09\xb2\xc3B\x93\x95G\x91X\xfc\xb1$|\xc3\
+[J);\xbfp\xac\x5c\x12\xcb\x88\x5c\x5c]\xcb\xb3\
+g\xaf\xdc\x02\xed6\xbc\xdd\xf6zt`\xf1V,\x86\
+Do\x0d\x9fs\xbc\xfc\x1f\xff\xe2\x1d\x990I\x8b\x07\
+\x87)\x14t\xe3+\x16\xf6\x0c\xaaKJ\xd5:2\x05\
+Df\x03\x82\xa6\x85\xd5\x91V\x8c\x18\x86Z\xbb\xaa\xc8\
+!\xbd\xb8*\xd6\xd1x\x10[\x93\xf4\x96\xaa\xa7\x96 \
+V\xd6\xad\xfd\xce\x04\xec\xc19\x1a\xf4\x96\x09\x8aq+\
+.\x0e;Y\x15\xf6\x9cM\xda\xb2\x07\xe7\xfbcyv\
+\xb1\x93\xeb\x1d\xcd\xce\x0e\xd7\xa72}\xf6\xcfd\xf7\xab\
+\xffA\xe4\xea\xd9\x984~(p.\x91\x955\x82&\
+\xdf]I\xcdJFM\x00\xb2\x8a\xd6\xcc%\x0e\xacV\
+K@\xfb\x9ad\xb3\xd2\x0bs_e}3\xbe\x94b\
+v\xad\xaaC\x08\xa2\x1c\xd9Km|T\x18:Ih\
+I\xb3\x89\xd6\x99g\xb4H}\xa6$\x9b\x83i*~\
+\xcd~\xdb9\xd5\xfd\x9ezFka\xc2\xfc\xf47\xf9\
+Z\xecl\xd4\xcd\xa2\x19\x17bZuK\x13\xaf\xb3a\
+\xd5sa+r\x14c\xc2\xb6\x0b\xd9,\xc4\x15\x98V\
+\xfb\x1a\xf5hHU$I\xd8\xb9lr*i\xc5\x85\
+\xd3\xfe\xdb{\x80\xa9\x0b\x16\x8dM\x8e%\xa2J\x0f\x04\
+\x9d&\x9d\x85\xa0\x18c\x8c1\xde\xcc\xa5o\xf7\xc1\xe7\
+\xd5\x1aQ\xcbXJ\xe2\xa7\xae\xf9\x05\xae\x09\x07\xcaQ\
+\xc4\xadyp\xd6N\x88\xa1\xd1\x15\x8cf[\x8e\xf1O\
+\xf6\x0a\x92\x14\x0d4\xbf\x91\x16\x04\xa2\x8fQl\x98\xcf\
+\x01\x8b\x98g\xcf_\x0aw;\xe9x%$2\x19o\
+\xe7\xa5\xfc\xc9\xc57\xbbz\xf6|\x92\x9f=\xda\xca\xa7\
+\x1f<2\x13\xb3>g\xf5u\x9c\x9bK`^\xb2\xa2\
+\xaa\x5c\xa3x\x11\xec\xb1!^\x0f\xfd\xfb\xba\x09\x17\xaa\
+\x81U\xef\xbch\xbc!\xe6g|\xc1\x02\xe3b\x03\xd8\
+\xf36\xa9$O\x9d\xea9M\xfa{\xdejr\xff\xbd\
+\xd5\x84\xfag\xbd\x9ed\xbd\x9ad\xb3\x9e\xe4d3\xc9\
+\xf9\xc9J\xee\x9f\xae\xe5l;\xc9jr\x0b#E\xe4\
+\xf4\x81\xe0\xb3\xffVd\x1a\x5c\xd4\x0f1/\xd5$X\
+\x22\xd10'\x8c\xae\x94Bn\xc1\xa6\x10\xf4-\x16\x0d\
+\xf4\xd1%\xe3\x168\xc6\xc4\xba\xb38t@\x8c\xfa\x9d\
+\xd9\x96\x94\x86\xc7\x8c\xd6\xa3\xad\xe8t\xc7\xa6mIi\
+5\xf7\xc6\xa5\xc3'^\xd25^\x1b\xd7\xa3\xd8\xfdL\
+_E\xeb\xef\x94\x1d\xae\xce\xe7\x8a\xf3\x9d&EbS\
+\xac(\x92$4\xac(\x9fn[\xfc\xf4\x08\x1a\x11/\
+-j\xc5\x0d\x82\xbc\xa7\xf8\xa9\xb6\xd7\x839\xb71\xa8\
+G\xb9\xb8\xd4\xb5\x04\xed\x12\xea>\xa0\xa0\x8a\x81\xb1\xda\
+\xf5aH\xe6\xaeq\xfd\x0eq},\xf7\xa1\xdf\xaaD\
+|\x1e\xd4\xb5\x1e\xb3\xd4\x18c\xbc\xa1\x83\x0f\xdf\x13\xde\
+\x7fb\xc0\x99\x05pv\xf2\x83\xf2-\xd7\xc1\x13\x06\xa8\
+;V\xca\xea\xcf\x17\xd8\xf0\x05\xef\xf2$\xa1=\x84\x84\
+\x08\xac\x9fv\x0f8\xf7\xd8\xf5\x8c5\x0e\xe7\x8b\xfb\xb4\
+O\xbb \xc5\x1d\x82,\x90\xc3|vx\x8d\xfe>@\
+(\x9c\xc3\x09\xf2\xdf\xfc\xe2\x89l\xd6\xd3\x22\xd3\x9f\x1d\
+Ij?\x1eHn\xb7\x11\x0e\x18\xad\xba\xceJ$2\
+@\xd1@\x0bt\xea\xa7D\xe7\x09\xea\xf8tj\xe7u\
+(G\x02\xa9\x89\x9f0\xccc\xbb\xe1\xaa\xa3\x83vq\
+Q\xdd\x5c\x93\xe2\xd6w\xe5\xb7'\xd93\xe5;\x88L\
+\xbb\xb6 \xafP\xf8\xf5\xbd\x9ce+r\xb3\xa3\xecv\
+\x22/\xafn\x22\xdf\xf6\xf0}\xe1G\x7f$\xf27\xff\
+\xdb\x98<\xbe\xdf\x99\xc9\x81S\xe7\x18\xa4e.JF\
+\xe2]<\xcc\x13N5\x97\xc0I\xbf\x140\x85y\x9f\
+\xd8@\xe8wt\xb2\xd0M$\x92\x88\xe2{\x0d\xe7\xba\
+Qe]y\x0f\x9f*RY\x0b\x96\xd2H\x1a\xd5\x22\
+T\xe0\x91N\xe4\x83\xd8\x13\x0fo9\x1b'\x10o\xd1\
+WS>\xdd;h\xabG\xf6\xfc\xd5\x99\xbc\x11\xf4\x5c\
+#J\x82\xd4\xa8h\x9d\xd6Y\xde?\xcaA\xa0<\xda\
+\xe7#r\x8e:d\x22\xfdQ\xd6\x85~W&\xeb\x22\
+0\xad1\x88~4\xd5f\x16\xae\xbfI\xf7\xda\x84\x9a\
+\x91\xe9y!\xddM`\x1e\x02\xfd\xa4\xb8\xd0(\x0c\x1f\
+\xf31\xc6xs\x97\xbf\xf7?\x17L\xab\x0a\xcc\xa1\x98\
+\x00m\xa9e\xff\xed\x01\xa8g\x86\x13\xed\xf9\x02(G\
+\xf23d\x5c\x07\x97_\xdd\x82\xd1\xfc\xfbj\x8bU\x90\
+,gr\x10\xd0\xef\xb8\x93\xdf~\xf5\x5c\x1d\x97\xe3*\
+\x80\x94\xd9\xd31\xd6\x1e\x9c{\xc6x\x82\x08\xa6\xbd\x97\
+\xfc\xe9j\x92_|\xfaV\x17\x82k\xff\xf1\xc8_!\
+/\x1f`\xc1G\x0f\xdc\x13\xda\xb3\xa5,\xc6\x9a\x0dc\
+\x95\x0e\xd0\xdd\x07\xa4\x0dHik\x1f\xd4\xcf\xd0\xf6:\
+\x99\xc6(Q)\x81~\xa1S\x8b\xaf\xd9\xb2\xf6\x9f\x17\
+\xb3\x9a|\xdf(\xba\x9bf\x08\xbeC\xed\x03\xe5\xec\xad\
+HNUg\xbe\xe3Jnv\x227\xa4\x5c\x5cS\xc4\
+XQB\xa6\xf7~!\xbb\xa7\x7f'\xf2\xf5_\x8c\x09\
+\xe4{f\xcd{e\xbcv\xee\xa1\x15\xd5\xed\xbf\x02F\
+\xd0X\xd2%U\x8afc\x1d\xa9\x9c\xf5lCs\x98\
+\xb7\x8c\x1fw\x22\xa7)\xdf\xd3N+\xe2\xacDED\
+\xdd\x84\xa1Q\xb5!@\xd8\xe4M\xdf0\xa3\xebS\x17\
+\x9a\xc9p*}\x07Mc\x89\xa9\xd9^59\x00H\
+<\xe4\xa3\xa4\xcc\x02j+\xe3@\xa8\x8e\x9c.=\x01\
+\xeb\xb5\xb1}\x86\xc7p\xa0\x941\x86U\xaaTO\xed\
+\x184i\x0a\xda\xf7\xd3\x15\xc8\xc4\xc1\x9aC\xf2\xc1s\
+\x94\xd6\x5c+\xceU\xca\x98\x22j\xac\xad\xe6\xf7\xe4\xce\
+l\xf3\xa2\x01\xebM/\x1f\xee\x0e}~\x82W\xfd\xfe\
+\xb8\x060\x1fc\x8c7q\x9c\xdc\x97\xdd\x93\x0fgo\
+9%c\x09\xe4PO\x0e!\xe2\x9dXR\x17X\xf4\
+X]$\xec.\x16\x19\xeb\xdb'\x7ff\x07\x10,\x01\
+\x1a\xf8\xd7zw\xc6e\xe4\xf9\x8bWruy\x95k\
+\x01\xf5\x1c\xac\xce#B\xc1\xe3e\x1dZ\xa8c\xa5)\
+\x7f\xfc\xc9}yt\xfft\x91\xd1\x0f\xac\x91\xb3\x01#\
+\x03\xa4Q\x0b\x99j\xaeb~\xd6L\xc8(\xa3\xc3\x8b\
+(K7\x06v\x0c\xce\xbeQlC(\xb5\x04A5\
+\x84\xea\x18t\xc5\x8c\xeb\x04Q\xa9\xcc\xb9\xbe`6\xb0\
+\xa34\x83V\xe7DH\xf59ga\xd1e\x12\xaev\
+\xc2\x999\xdfQ\xe4\x1eg\xe6\x9c7s3\xa8\xfa\xdc\
+\xd3Z\xa6\x9f\xfe\x89\xec\xfe\xfd?\x88\x5c>\x1d\xf3\xc8\
+\xf7\x02\xc8\xa9\xe2.\xf3\x00\x9bX\x94)\x96Qk\xb6\
+\x0b\x9f^\xee]\xe7\x88\xd2v\x89l\x89\xd9\x02\xb6\x9c\
+\xcd\xa9\xee(7\x12\x90\xa6\x93\xae\x8cn\xd59\xb0\xdd\
+\xeb\x15-\xd2z\xa8\xbb\x04\xdc\xd6\x14\x9d\x15\x9e\xd6\x8d\
+F\xcc\xcb9\xb1\xbaz4Ze\xae\xcf\x19\x8d\xad\xaa\
+\xa5l\xdd\x9c\xae\x18l?\xa70\xb1{\x89y\x16I\
+\xeag=\x95*\xf3\x81\xces^\xeb\xd5\x95\x14\xc6\x84\
+\x9b\x95\xc0\xa5j!\xd9\x04(f7%\xc0\x5c\xda\xdd\
+\x0b\x03\x8e\xe7\xb9+8_Q\xcd_\x0d\xb5\x1b\x8e\xc4\
+\xb1\xe9\x98\xe5(zn\xae\xbb\x18\x1d{\xcd\xda\xf3\x94\
+\xf9\xbbK\xee\xad_\x8a\x84\xa11\x1fc\x8c7p\xec\
+\xde\xff]\x91\xf5\x89\xd2\x08\x9b\xb8\xc9\x8e\xc6\xdc)\x95\
+\x91\x83r\x00f\xeb\xd4\xe8\xc35@\xed\xe8\xa1\xf5\xeb\
+)\xc8j\xe6r\x04\x00\x09\xf3\xb3\x8b\x8a\xf4\xbc\x9f5\
+\x04\xd0\x18\xc7H@\x9e~\xf3\x5cM\xd0L_\x22{\
+#&\x92\x11\xebX#M\xaf=\xbf\xe14A\xfe\xe8\
+\xf3'2Mp\x81N\x07`\x0d\x16\xbe\x06\xa4\xd0\xdb\
+h\xd4%k\xd8M$\xab\x1a\xaej\x1d\xb8\xb3\x81\xac\
+;\x03\xaa\xe8\xd2\x87\xe3-\xecka\x03\x84]\x90\xd6\
+\x07\x80zMt!\xa3\xbf_\xb4\xe5u\x17b>\xa7\
+S\xf9[\xfdYM\x93\xacW\x90\xcdj\xaf7?\xdb\
+\xac\xe4\xde\xe9J\xce\xb7+YM\xd1\xc7\x06\xdb{\x82\
+O\xff\xeb\xc3\x0d\x09c\xbc\x06.\xa7\x01\x90YK\xa2\
+\x95\x9e4$k\x1aEC\xe2\xfbly\x08_\x14K\
+B4H\xd3\xf1\xc26M\xd6\x00\x9f\xf0<\x15=\xfa\
+\xfck\xba\xa1\x99\x1dk>\x1d\x80\x14\xec\x94P\xc1g\
+\xd8= \x9b\xcc\xc1\x10\x03\x98Sr\xbd\x86Y\xcc\x8e\
+\x97?9Z_m\x15\xf3>3Al\xc0\x13!:\
+\xd4&\xd7j\xb7\xa2:\x89B\xddK{\x94&[\xbf\
+\x1d\x11\xf5\xfd\xe4\xfc;\xc9v_\x0dAC\xa4\x22\xa0\
+\xae\x9f\x01\xb2\x80*B\xec\x9dFs|\x1e\xfc\xba3\
+\xe6B\x83\xe8l/\xcb\xe4\xc9\xf09\xe7\x02\x22\xb5\xfb\
+\xb5\x84H\x00\xf4\x92\xe8\x15\xe7/\x0f`>\xc6\x18o\
+\xda\x98V\xc2w?\xb5\xa0\x17\xb6\xc92\xb0\xe4^N\
+\xe2\x9b>\x03\x08\x94.\x8b\x1e\x1dX\x96\x9bD\xf5O\
+A!\xbaV,\xe0 \xee\xce\x9a\x17s\xb8\x9b\xdb/\
+\x92\x94\xdf~\xfd\x5c}F\xbb\x88\xa7v\x90\x897\xa1\
+f\xd0k\x93\xa2\x01\xc7{\x9b\xc4\xf7\xce\xd7\xf2\xc9\x07\
+\x0f\xcdk\xb5\xa6\xc6[\xe0\x1cg\x00\xa3\x01s\x84\xd8\
+\xb6\xd9\xd2tjv\x00z\xfd\x09\xa0\x7f\xfe]\x81&\
+\xe13@\x9d\x17\x0b\xc0\xcd9\xf6E\x80\xd8\x82\xc0\x80\
+s\x91\xd0 Z\xfe]@\xbbn\x06]M\xa8\xe0|\
+\xbb\x99\xe4|\xbb\x96{\xdbIN7\x93LY\xd9\xf8\
+\xf8#\xc1;\x7f0\xe6\x92\xefzT\x02\x92\xe9\x13J\
+\xc7\x5cJ\x84\xa6\xaeY\xb20\xe8\xca\x8e0\xfc*R\
+\xd9\xb19 \x05W\x1b\xd1K\x07\x98hk\x8b\x8c\xa1\
+v\x92\x8d\x0a\x1c\x11Af}\x0e\x93\x1d)q\xb2\xb8\
+\x96\xa4k\xba\x19]\x09.!\x8c\x00s\xa5C\x17>\
+\xa6\x09\x83H#'.)Nbck-/x\xf3\
+'\x99\xa9+\x17D;\xe2\xb4\x0f\xca\x22U2>\xe0\
+\xf3o@+\xbd\xe7+\x06\x8b\xa6\xe9\x8a\x12\xaa\x93\x83\
+\xb0\x13`\xcf\x97\x12\x8c\xe7\xf7.\xfd\x9a\xd8v;\x00\
+&\xeb\x0a\x92`!T\xb9`\x94uR\xb2\x16g\xa8\
+\x9b\x8a24\xe6c\x8c\xf1\xe6\xad}o},rr\
+n,I\x1a\xe8A\xa8\xcc\xe1\x19V\x04\x8e\xbc#{\
+\x11\xdbY\x9f \xd54\xce\xbej\x17{i{q\xc5\
+\xe9k\xc3\xa3\xcca?\xbfY\x1f]\xfb\x021\x89\xee\
+\xf2\xfaZ\x9e\xbfx\x15y%z\xd6\x17\x0eTj\xe6\
+?\xff\xdcf\xe7a\xbe\x1e\x7f\xf2\xd9#9\xddn\x0c\
+\x18\xb0@Vm\xa5\x9bp\x8avPL-\xd0h\xd6\
+\x19\xbbt$\xa7W\xc7?SsI\x926\x84\x9ah\
+k\xb5%\x0dX/u\x9a\xcf\xa0v\x12H\xc5\x14\x89\
+\xd92\xd6\x8dz\xa4\x02.&\xfd\xc8\xeaQ\xcb\xf7'\
+\xc1^\xd2R<\xce\x8b\xa4e\x96\xb7p\xb6P\xe4j\
+\x92\x1dEvk\xca\xd9v%W7\x94\xeb\x1b\x15>\
+T\xdff\x12\xf9\xe8\x0f\x85\xdf\xfc\xb5\xc8\xc5\xd7cR\
+\xf9\xce\xc1\xb9\xeakP\xcfPi\xfa\xd3\x92\x84\xe6\xad\
+-\x1d\xd7\x0fq\xd6\x9b\x16H\xa7\xa9\x97\x8c\xa0\xdc\xcc\
+\x85\xf4;Q\xa9Cx\x05K-\x09\x17N\xc7\x1d\xcb\
+\xd9\xf6\x08\xc7\x88\xf6ZT\xa4$\xbc\x9b\xcf\xaaG\xb8\
+J\xd3u2\x96jq\x0a\x97\xe7\xc4\xf6\xc0\xd2If\
+Dz\xb1o\x92\xfa\xa07&[\xcdQh>\xe0B\
+\x09\x91O@2\x09\xe5\xad\x8eM\xcbO\xaa\xa02\xd1\
+B\x964 \xa9\xc7\x92\x9b\xc2\xcb\xbd\x7f\xd1\xb1S5\
+\xc1\xc6bC\xeb\xeb\xa1,)\xe3\xa6%\x98\x15\x80l\
+\xf7\x8c\x0fH5s\xbc\xa5\x9f\xb4\x9b\xd5`\xcc\xc7\x18\
+\xe3M[\xf7\xde\xfdL\xa44}*P\xdd,\x11\xad\
+m\x9f\x05\x90b'\x81*+\xf0\xac\xb6\x92-\x00N\
+\xbe\x91\xf0\xe2\x08\xa1\xca\x81\xcdu\x1c~\xc2\x80#\x91\
+\xc0\xe8bB\xb3A\xc8\xf40\xf9\x1a\x03\x91\xe7\xcf_\
+\xca\xcd\xcdM\xc2\xfe\xbbs\xd1\xa5\xae#\x10\xafg\xdf\
+XT\xeem\xfd\xfe\xe0goUP\xdee\xf6\x83A\
+\xba\x05\xa7:\xac\xa8\xbfO\x00\x03p\xb0\xa0\xfe\x81\xa3\
+\xcc!Y\x88\x88o4\xcd_\xdf|v\xf3}+{\
+\x09\xe7\x0b\x9e\x0d\xef\xfc\x0c\xc4\xc9\x5c\x8a\xb4Ed\x9a\
+\xfd\xe1\xb5\xace5\xff\xbd^\xcd\xcc\xf9z\x92\xd3\xed\
+J\xceOVr\xbe\x9dd5\xc10\xf1\x22\x22\xd8\x9e\
+\x09>\xf9\xaf\x86\xa4\xe5\xbb\x1ePV\x80\x88\xe9\xb2t\
+,7\x15X\xa5\xbe3U3b\x94\xf1\xce\xcd{D\
+b\xa1(\xb3\xf4\xc5\xd5\xebT,+\x18;,\xc9$\
+E\x94-$&y\x8a\x99\xa9E\x8cDPr2B\
+\x81H\x06\xe0\xc6v\xac\x86\x7f\x16KFPI(\x94\
+cHS\xdfD\x0fy\xf3`\xd2\x9e4T{E7\
+\xd7\xb1Hl\xc4&_\xd6\x9f\xb1\x12\x8f\xc5\x7f\xa1)\
+\x7f\xc4\x1dok;`\xdduhd@\xee]\xcf\x9e\
+\x03\x97Y\xb3h\xdfK\xbcY\x90\x9a\xf8\xe8\xd3\xd9\x0a\
+\x7f\xcfH\x1dU}\x0f\xcd\xe7\x97Zl\xb8\xcb\xae\x9a\
+P\xf7\xc5i[x\x09\xbb\x031\x80\xf9\x18c\xbcI\
+c{.|\xf4\x9e\xb2>\xb4\x8e,\x1eT5`\xeb\
+\x84.\x90.\x07\x9c\x01T\x03\xfe\xc5#\xeb\x080\xbd\
+\x87y\x84\x94\x1ehv\x8ee\x11\x92&\x7f2\xbd\x8b\
+\x88|\xf3\xcd\xf3<\x0a\xd4\xd0lb\x9d\x09\xbb\x03\x00\
+\x00 \x00IDATX\xf2\xf0\xdf\x88\xc5H\xf4\x85\
+\x9f\xe4\xb3\xc7[y\xff\x9d\xfb\xc99\xce>\xeda\x90\
+\xa3\x8b\xaav\xba!\xc1?M_\xbf\xe5\x8c'\xebE\
+\xae5\x8fY\xde\x08l9\x95\x9dc\x04G\x1b4\xd7\
+\x9a\x04\xfd\x07\xd9\x8d+*\x9b|\x052\x99\xc6Z\xf5\
+\xbdI\xfb\x9c\xef\xb5\xe6{I\xcb$\x9b\xd9\xe3\xfcl\
+\xbb\xd7\x9a\x9fm\xa6\xe0I_$-\xf2\xe4\x17c^\
+\xf9NQy\x01\x92\x0d\xce\xd0\xdc\xb2\xb3,@3\xde\
+\xb0s\x85\xd9\x9d!\xd2\xe2\xa9\x80\x19$\xe0\xbc\xf8W\
+\x1b\xbd\xb6h#\x17go\xa4%\x0e\xa0&\xfe\xf7\xef\
+\xcf\xc4zP\x9cw\xbf\xb4\xd7\xa6\xbe\xcf\x98\xec\xb0\x09\
+\xa3\xbc\xaa\xbe7R\x00\xefj\x92=c\x0e[\x00\x99\
+R\x1d\xa8\x92\x1a\x7f}\xe0\xa4(\xe5|\x05\x8fn6\
+\xce\x1aL\xc06\x93\x94V\xad\xabN\x0a\x8c\x9e\xc2&\
+\xf4\xd2\xa8\xe6rS\xc5h\xc2\x87\x926\xbf\xb7B\xc5\
+9\x92%\x92\x18\x94\xcf\xa6\x10;\xec\xed\xea\xba\x01\x94\
+\x03\x99N\xd9\xa6/\xd8\xd0\xdc\xdd\xf5}\xe7J-\xb3\
+\xbb1_\x81\x01\xcc\xc7\x18\xe3Mb\xcb\xdf\xfe\xa9\xc8\
+z\xabt\xd1\xbaaR\x1c\x14\xb6l\xb3\xe7Y\xd3\x9f\
+Fdc+k\x9e\xcbF\xd30\xa1\x8e\xf1W\x04\xe5\
+\xe8\x92\xec\x87\xd1j\xf7\xbb\x16\xc8\x91\x22\xbf\x9d\x1b?\
+3L.\x9a\x81G\xd2\x04+\xce\xb1\x050\xdal\x13\
+\x883A\xfe\xf8\xe7\x8fe]Rn\xb2\xc2\xc5\x9f7\
+`\x19\xacgNl\xbd\xf3\xe9\x8b1\xf4w\x12\xba\xbc\
+{&\xd3\xf7A\x1ci3\xa8\xd6\xdb\xab\x9f\xf3\x9as\
+Sp\xe8\xd7q\x11\xe3j\x17\xc2\xb2\xe9\xad)t*\
+\xe1D\x13d\x9a\xa4\xb2\xe7{\xbd9d\xbb\x9e\xe4\xec\
+d%g\x9b\x95lWP\xbe\xca\xa8!P\xd3G\xbf\
+\x14Y\x9f\x8e\xc9\xe5;\xc3\xe6\xad\xe9\xd2\xdc~T\xf3\
+\x95\x0f\xcb\xa1\xa5\x9f\xbd\xdc\x19\x86[V\x80W\xa5.\
+\xc2 .\x1a\xa65k\xd6\x16\xff\xda\xa0\xd1\x84C{\
+t#\x86\x8d\x05\xb7\x0f\xe3<N3_\xb2\xcb!;\
+\xab[f\x13a\xe8\xbcT\xc0\x17\xa1\x09\x96B\x15\x84\
+\xe3l\x0c\x91\xbcV=\x0cv+y\x88\xd7\x8aK\xf3\
+b\xf7Z\xf5\x0a\xce\x19\x1a9%kH\x85X\x8d|\
+G\xfemN=\xdd\x0f{\x89\x09\x10e\xe4lW\x89\
+\xd9\xd9\xd5\x0d\xbfA\x80\x08o\xbc/PAU\xf5\xa6\
+U;\x81\xc1,\xd2\xa1|:\x80N6\xed\xfb\x00\xe6\
+c\x8c\xf1\x06-x|\xf7S\x05\x18\x11R\x17}\x87\
+\x9f\xd5\x93\xc3\xb0\x9b\xfek\x90\x8cu\x91\x90\xf6\xd1\x93\
+\x9b\x84E+\x98\x98k\xa0\xa5\xa52v\xee\xf3I\x98\
+\xc1\x9b\x1d]\xbe<\x85\x9d\x97WW\xf2\xf2\xc5E(\
+:<HL!?\xac\xed\xa4\xd9\x0ev\xba\xf2\x22\xb7\
+\xf8\xddO\x1eG/\x1a$\x0dG\x80\xfb:\x16?\x91\
+\xaf\x82:\xa1\x9fI\x91b]z\xcc)_rjA\
+\xde\x1c\x8c,Q6;\xf3\x06\x9c+\xc0\x0e\xcb\xa6\x9b\
+\x84Qx\xb7 +}\x99\x00\xd7H\x8b\xfau\xdb\x14\
+:\xc9z\x9a\x93A\xd7\xfbd\xd0\xb3\xcdJV\xd9n\
+\xd0\xe9}\x91\x0f\xfe\xe9\x98_\xbe\x1b\xea\xa0\x01\x1b\xd8\
+\xc4K\xcd\x1238\xde)n;\xd9\xd4\xa2\xa1\xdc\xb5\
+&\x80\x16\xc4\xd39\xb7\xa8\xefA\x94\xf4E\xd9\x8cT\
+\xfcL\x04\xc6\xd6h\x84\x15r,\xc5E\xdeZZ\xe4\
+\x1f\xec\x9e\x22\xdf\xc1\xc8\x22\xff\xd1;\x09\x86\xa7\x85\x83\
+\x8a.\xa4K2\xa3\x0f7\x9f\xcf\x1a\x12\x22!L\x18\
+\x93E\xa1\xe5%\x92\xe4-\x90iaRU\x19\x80\xf2\
+\x97WP\x94b\xc0,T\x8b\x8d\xd6\xdf\xeb@M$\
+=D\xfbS\xd0\x91\x1f\xd21\xed\x8a\x99\x17\xe4\xf3<\
+]cm\x9b\xff[?\x03U\xedG&I\x13\xda%\
+\xc7\xdf\xe3\xca\xf5G$S\xde\xb7\xd0\xa5\x01\xcc\xc7\x18\
+\xe3M\x19\xe7o\x89\xdc\x7f\xb2\x7fl5c\x9emc\
+\x8a\x97.;\x0f\xee\xf0\xff\x91\xe5\x94\x05\xeb>\xa4\xb4\
+9\x12\xcbB+?\xc8\x9a\x8e\x10\x98{\x0b\xfc<\xe9\
+l\xa2\xe6\x0f\xb1\xeb\x10y\xf6\xec\xa5i\xa4\x8cAF\
+\x99e\xa4\xfd\xd0\xbe!\x14\x12\x9b>'L\xf2\xf9[\
+[y\xe7\xf1\x99\xa4v\x8c\xe8\xa0iSTy7\x15\
+k\x1f\x89N\x01\x02dr\x97\x8c\xfcB,,<\xe0\
+\xf7\xe0\xba'mJ\xd61\xcd\xb0\xf9\x9aN`u\xde\
+\xban3N9j\xc7c\x0a\x96\x8a\xd6B\xb1\xc9Y\
+\xc4h\xcdW\x93\xc8j\x05YO\xb3\xde|3\xc9\xd9\
+v\x92\x935\x92\x9d#\xc8\xf4\xee\xef\x8a\x9c\xbe=\xe6\
+\x98\xef\x84@0\x04\xa2\x05q\xa4c\xc0\xf5\x9c\x13u\
+\x09T\xd2\xa9\xe0\xbf\xcd\xb8\x85\x07e\x93\x98\x18\xf29\
+\xef|M\xa3\x22\xc8\x15(\xd15D3\xbc\x10J\xa6\
+\x14\x11\xe5\xbb\xc1\xf8\xadt\xe7\xcc\xa2BMn\xb0\x82\
+j+#\xb4!M\x9a\x16\xd7V\xb7T%C\xc3\x8b\
+q\x16F\x22\xc7\xa8\x15\x94#\x14*\xd9\xd3iP\xd7\
+\xa5\x05`\xdd\xd9\xc53\xef\xb5\xef3:VQ\x17\x14\
+Nz\x93n\xde:\xfb\xcb\xeacnv\x0c\xe0\x11\xb5\
+\xb5S\xf4.B\xf55\xd4\x5cIKf\xd1\xf9\xb6W\
+\xff\xf2\x84\xac\x80kn\x17\xc9\x97\xda\x01\xcc\xc7\x18\xe3\
+M\xe1\xa2\xde\xf9Ym\xfaDH\xf5\xb4\x9a]\xd38\
+h&<8\x1fs\x91\xa54N\x09\x92\x97\x8e\x8f\xac\
+\xf4$-}@w\xecwz?\xedY\xdf\xac\xa1P\
+D\xe4\xeb\xaf\x9f\xd9\x85\xdb\x81N\xb3\xe6\xc2\xeaF#\
+c\xac\xf5\xe6\xd6&\x11\x10\xf9\xa7?{(\xabi\xea\
+\x9e\xc9\xee\x9f\x1e\xf2\xcd\xa4(8\xf0\xea\x9e1\xcc\x1a\
+g]Q\x80\xee\x15\xb1\x9f\xd7^{O\x8d\xc3\x16M\
+\x12\xbd\xcc\xd3\x14X\xaf\xa3w\x8d\xb8\xe1\xbfUq4\
+\x89\xf58\x87j\x0a\xad6\x8a38/z\xf3\xcd*\
+\x01%\xeb\xad\xe0'\x7ft\xeb\xfbp\x8c\xa4p\xcf\xa2\
+\xd3\xabJ\xa3\xa7Y\xcb=Q@:0o1\xa3\xef\
+\xc9+:p\x10AH\xc7\xb9\xe1.\xf7\x8ab\x90y\
+\xd4@\x1dq\x1b[:\x09\xd7\xb3\xb2l\x0f(\x18w\
+\x8f2]a\x95Q$\x1f\x10\xce\x0e\xb0\xbe?UB\
+\xa5V\x87\x94\xba$\xb1\x03D\xd3W\xe4\x93\x92*:\
+\xda\xe6\x03\xb5\x04ZL\x0d\xa1\xbc\xbf\xa9\xe0?\x22\xfd\
+\x9c\xa9]l\xb1b[\x83-\xeb\xddI\x9dnM\xc6\
+\x16\xe8\x8ar\xa9A\x90\xff04\x8dV\xc6\x1a\x94\xec\
+NCRzT\xd7\xc9r\xbf)\x1b\x1d\x92i}S\
+\x8e\x11\xf4}\x01\xfb\xdd\x10\xa2\xe9\xff\x070\x1fc\x8c\
+7\x84\x86\xe2[\x1f\x88\xb3KI&\x0f\xe4\x13\x0bm\
+SP\x04\xea\xe2^[\x129\x86\xa4\xfa\x8a>P\xec\
+\xa1\xbdC-\x9d\xafsv\x90\xb2:B\x91\xaf\x9e\xbe\
+p\x12\x1e\x1c|\xc7`\x1f\x99\xf8l{`;M\x90\
+\xdf\xfb\xc9c\xe7\x18\x83[|\x86\xe8\x8c\xb3\xb4\x80\xfa\
+\xee\x82\x0c\xd5/\x15H\x09<M\xd9s_\x88e\xbe\
+\xf7\xe6\xde\xd2 \xdc\xed\xea\x04Y\x8bj\x125\x85&\
+D5\xd7\xaaF\xd0\xc4\xad\xc5\xfb\x9b\x17\x90\xbe\xaa.\
+-S\x0b\x1f\xda\xae\xe4t\xb3\x92\xc9\x01$\x88\x08\x1e\
+}$\xf2\xe0\xa31\xd5|\x1b\xf2@Y$\xd2\x05\xfb\
+\x80F\x81m\xe764\xabNS\xf8ik\x95D\xca\
+`\x98T-{A\x9c\x17[\xb8\x91X\x00\x06u|\
+\xd4.2I\x91\x1c\x0aL\xd8TN}H\xc8\xc0Y\
+\xa6_V\xfe)&\x08\xc7YD\xb2=\xd1U\xf8\x03\
+\x1a\xa6\x9bJ\xfbA\xd2%\x00\xcf\xa04\xd1\xaa\x93Z\
+\xc9\xae\x00\xe3l+\xd8\x9ae\x91h\xeb\xad\xcf\x13g\
+M\xbe>\x7f\xd4\xcc~\xc2\x8a7\xae=\xd1\x152\x97\
+\x016]\xb8\xb5\xcd\x84t\x006\xb4\xd4(\xdc\xb9{\
+\xd6>\xdc\x99\x10\xab\xc9*\xb6\x96\x08gK\xd0\xfa\x1a\
+\x10\x8a\x06uc\xc0m\xe7\x80U\xeaU>\xc3\x00\xe6\
+c\x8c\xf1&\x8c\xf3G\x22\xe7\x0f\xad\xbe\xbcV\xfa\x1e\
+\xec\x88c\xd4\xa3f7\x03\xa8iH\x91\xa2\xa33a\
+E\x9f\xe6\x95\xd4\xc1\xc0k\x8b\xbd\xba#\xb0\xde\x09\x00\
+G\x8aX\x99V\x0d\xaf.\xae\xe4\xd5\xcb\x8b\xb8E\x0b\
+/\x9e\x89\xb44R&\x0b.\x5ch\xff\xa5i\x9a\xe4\
+\xa7\x0f\xb7\xf2\xee[\xf7\x02\xab+\x87\x18\xf1c\x81\xfa\
+B\xed\x13$\x22Y#\xe5QuR\xc2\x8c\x8b$n\
+4\xb9\xec\x07\xc9\x87\xcd\x83K\xadS\x82\x05\xe7^\xfe\
+S\xees\x05\xd6\x83\xd6\x5c\xeb\xd0uC\xe8T-\x14\
+\xb7\xabY\xd2\xb2\x99d\xbbB\xd8\xc2\xc6\xb4\x12|\xf8\
+\xcba\x9f\xf8-\xc8\x03Q\xec\xb2\x07\xe2\x15H)\xc0\
+\xd8\x82a`\x03tfF\xb8$g\xda^\x08\xe6\x92\
+0\xaa\xfb\x84*\xf9R\x85\xf00\xf1\xbf\xaeR\x84\x10\
+\xdfn54&\x15\x92-)\xd3gA\x02J/O\
+\x0d.m\x92pZ\xd4h+l\xf5\x02\xac`\x94\xc6\
+h1W`\xd063\x1a\xaeWk\xc65\x98t\x0c\
+\xbf>\x08\xc0\x14\x15\xcd\xbd\xc4;\xde\xcc\xfe\xe0~\x17\
+\x8e\xf6Z\x93\x090\xcd\xd8t\x16G\x9eh \x8e\xc4\
+\xd8\x12T \x97\xf0\xbd\xaa3\xc3=w:\xa8\x00(\
+\x14\x7fs0\xacWZ\x13N\xe3\xa9\xcf:7\xd1\x1d\
+\xbb\xb6\xaa\x0c\x0d\xa4\x94\x9c4s\x8e7\x03\x98\x8f1\
+\xc6\x9b0\x9e|\x22\x986\xadyR\x10\xa2\xe1CP\
+A\x0a\xd23=u\x9e|\xa9\x8c\x85o\xb1(\xfb\xf4\
+F\xe4\xaf\x8f%v\x1d\x0e\x88Y\x9f\xf0\x9c\xc1v\xfa\
+\xe5\xf9\xdc\xbcx\xf12\x86\x08\x05\xc0\xe8&}8\x89\
+\x858'\x16\xfd{\xea\xd8\xfe\x8b\x9f=\x94\xd5*N\
+\xa9\x9a5\x06\x5c#\x13\xb3cX\x06\xea\xe6s$\xa8\
+\xdd\xea/\x11\x005:\xee0\x82N\x01\xd4+\x92`\
+}\xe6\xd1q\xeb\xd1\xec\xa2wq\x91n\xa1\x18S@\
+E\xbb\xed(p>i\xa7\x96`\xa1\xd8\xe4,\xab\xd9\
+\xa5\xe5t3'\x82N\xe2\xce\x14\x04\x0f>\x10y\xf0\
+\xc9\x98o^\x8f/O\x80\x18\x96+4\x96\xa6\xcc\xc4\
+]\x83M_m\xa5\xe7{kA8=z-\xd1)\
+\xc1AC\xa8\x12,\xc1t\xe6\xd1\x80\x11\x9a\xfaF\xe4\
+\xb7\x8b\x8bH,J-\x84/h\x17\x95)\x9f\x81 \
+\x1d\xcbK\xa6\xaeY\x96\x91\xb7\xc5On@K1\xe6\
++l\x80\xbc\xc8$\xe8\xc0la\x9d\x89l\x0e\xa6*\
+d\x90\x5cjw\xfeI[\x14\x19\x00J\xd33 \xa2\
+\x1bL]\x82&\x9c\xc6?\x14\x0c\x1e-;\x00\xee\xc1\
+\xbe\xd9\x81kgX\xa7\x8c\x16y\x90.bD\x9a,\
+\x08\xe6\xb2\xb6\xfb\x12\xb4kp\xf5}JM\xc7\xac\xce\
+p\x0f\xfc\xd1l/\x070\x1fc\x8c7\x87\x89\xe2[\
+\x1f*\x96\x17\x8e\x9dT>\xd0\x86\x84@\x0a\xe4z\x0d\
+3H\xb2\xdac?g\x14@\xf4\xf4\x7f\xc7\xcbR\xd8\
+\xe1\x86\x97\xe40GP\xcb\x10\xf9\xe6\xe9sS\x90\xb0\
+\xf3\xb2@\xce0I\xca\xf2\xc2j\xcd\xe7\x93\xf4\xf9\xc7\
+\x0f\x8f [\xe3NF\xdd\x8eE\xafhY6G4\
+k4\x8f;\xebY!\x80\x94\x89\xb7\xf7\x04\xd0\xd1\xdc\
+\xfb#VM\xacHn@]\xb8\x99\xdb\xd0\xcb\x5c2\
+\xabD\xc9Zcm\xb3\xa8\x96\xb44\x0b\xc5={~\
+\xb2\x99f\xfb\xc4I=>\xf3qM\xd3\x9e5\x1fZ\
+\xf3\xd7\xe2\xcbM\x80\xad\xe3j\xed\xd7\x98\x93\x88\xb4\x85\
+!\xeb\xd4\xe6|\xb7%(\x0cf\x90\xa3\x5cYLK\
+^\x87\xb5\xd4R)\x0d\xee\xca\xd7(6\xc4\xc8\xcc\xb7\
+\x16L\x15\xffnz\x0fme\xa0R\x9d\xc2UG+\
+\x92\xa0\x9cj\x01\xe9\xb5\xea\xe53)G\x18[\xe3\xcf\
+\xce3\xde\x88[\x1d$\x8ce\x9f\xd2\xe5\x8be\xb1\xab\
+\x87\xbc\xbb^m.\x80\xf5\x90\xafl\xb4\xd80_=\
+w\xd4S\xa6\xc3\xa6$\x90EV_\x1e\xe7(\xba\xd4\
+\xd6\x02\xc8K\x92(\xbd\xed\xabjH \xedk\xc0\xcd\
+K\xa2\x00y\xbb^q\xc5\xa2\xe4\x09\xcc\xbd\x83\xb6\x96\
+\x9fz\xad\xde'\xca\xea\x1ac\x00\xf31\xc6\xb8\xebc\
+{&r\xff\xad\xca\x92\x8b\x01>\x114{6\xdd\x80\
+J\x0d83y\x03\x9a\xa74\xa4\x0f\x10+\x90\x0d\xf2\
+\x93Cm\xa4N\xf7\x09\xab1\xee\x81\xcf\x03P=y\
+\xaf\xfd\x02\xf9\xf57/\x02pX\xf2G\x0c\x0c\x18}\
+\x93\xa6K\xb9\x9c\xff\xbc\x7f\xb6\x96\xf7\x9f\xdcs\x8c\xd6\
+q\xe0\xdc@\x11\xe3b\xd3c\xc7\xa2\x94\xc7\x04\x05\xf9\
+\xfa\x0a\x1d\x1d=r\xd0\x9f\x9e\x22\xf4\x1b\xa2\xccn\x8d\
+\xb7dL\xac\xef\xe0\x16:\xb8`*\x0f\xce\x9bu\xa3\
+\xb5\xf0\xb4\xf7\xa0\xd3\x9aWP.\xf5\xbf\xd7\x13d=\
+M\x955?\xdb\xb4DP\xb3\xab\xf0\xe0\x1d\x91\x07\x1f\
+\x8fy\xe7uIs 4\xf9V\xc9\x0a\x19\xc2w\xda\
+=@Or\x07\x5c\xa9a>zU\xb6rE1\x89\
+\x93\xb6\x93\xb2\x82\xb9\xca\x9aB3\xc0\xca\xc5D\x1b\x89\
+\xb0I@\xe0A+upP,\x0a\xa2$\xbe\xb5L\
+B\xdc\x87-\xc8\x9a\xcc\xbd\xfd\x1c\x9f\x8c\x05>\xc1\xff\
+*ugjm\x80O\xaa\x1c06\xedR\x03\xdd\x06\
+\xe0\xb5q\x0d\xcb\xfc\xe5-\xcb\x93\x9d\x14\xfb\xb9\x13'\
++-\x9f1`\x9aQw^\xcf\x8aM\xfcL<v\
+DWv\xe1\xf84_\x0e'H\xa9s\x92\xd5\xd1\xc3\
+\xdcyL\xba\x08b26\xcd\xdf\xb6-y\x00\xf31\
+\xc6\xb8\xeb\xe3\xad\x9f\xb4P!\x81a\xceC\xaa\xb0[\
+\x14\xb5\x05\x15\x02\x8c\x92\x14^\xc9\x829\x1e\x90\x03\xba\
+\x0czw\xdd\xc5\xe1\xac\xb1: \x12Y\x83\xa9\xb7.\
+\x14/\x85\xd0\xfe\xe57\xf2\xec\xc5\xab\x1a\x0f\xce\xf4H\
+;\xa6\x89\x0a\xf0\xa5\xa0\xd45\x86\xfe\xf2\xe3{r\xb2\
+\xddX\x00\x8a\xd7L\xfbL\x0a\x05\xedV\xd2\x03\xd5\xe2\
+?S\xc8$\xcf_\x1f\xda\xd6&\x13\xaegw\x0d\xd0\
+\xd9\x85a\xec\x11p6\x89\x1a\x9cg\xd7\xce\xf8\xc6G\
+k~\xd3\x0cj\xff\x8e\x7f4c>\x95f\xd0i\x92\
+\xed,g\xd9\xae\x92\xe2hZ\x0b\xde\xff\xfd1\xef\xdc\
+\x1a\x937-\x81\xb76d\xd1\x0b\xa7\xb3N\x1elc\
+=\xafm\xc4\xbd\x8bV\xb0s\xa0\xb7\xdd\xd0V\x88\xe6\
+[M.\xd7\x0eC;\xc2h .\xb6\x80\x10\x0bX\
+\x0d\x1ctNWt\x04\x8aa\xb8kr)b\xd1\x80\
+~\xe6N\xb4v\x94\xe6\x15\xcf^\x01\xadu\xe1\x10\xa7\
+\xea\x89\xac0!\x92\x15G\xce\x12R\x03\xf9\x10\xfcc\
+\xea\x19DYP\xe9E \x5c\xac=\xa4\x09\xbc\x95'\
+\xbcjr\xf5\xaePz\xf6g\xa0\xf7\xa5\xa9\xf3\xed\xb6\
+\xb2h-\xbd9\xb4\xda\xc0i\xef\x09\xe8\x9d\x11\xda\xf7\
+Cu\x04R\x85f)\xfe \xc1\x96\x13a\xe1\x1b\x01\
+Cc\x8c\xf1f,xo}h\xd9\xf2\x18s\xe6\xa2\
+~\xd0\x05\x9d\xe9,ls\xe5\x1366c\xc4s0\
+\xe82\x81\x9c\xbf\xf9\xc14\x1c\xc5\xb8%1j\x80\x89\
+\xce\xf6\xed\xa8\xe24\xf5/^\xbc\x14\xeev](\xde\
+E\xcaZ\xb7\x1e4\xedZ\xef\xde\xfe\xfd\x8bO\x1e\x1d\
+\x0d\xb4\x81\xa58\xa4\xe3^\x83=\xc6_\xb1/6,\
+h\xb9H\xf0\x01\x1e\xa6}+dF%\xae/\xe8\x97\
+|\x1e\xe5\xa7\xe0\xdc\x17\x1e\x1d\x16\xb0\xc9\x0e\xec]\xee\
+SG!Z\xd6\x22\xd6>qn\x04=\xd9Lr\xba\
+\xde\xb3\xe6\xe1h\x1f~(r\xf6\xce\x98|nUE\
+\xd2\xc4\x9c\xe7\x15\xa6\xdd\x89b\xb0}\xf2\xac\xb7eF\
+5\xf8o\xd8\xc7\xea\x89\xc9d\x9aIS@97\xa9\
+2\x09\x90D\x03w\xb4GU\x0b8Z\x06\x9f\xf3\xe7\
+\xd7M\xaf\xe5X\xc1\xa6%\x8e\xae\x88\x0c\xcc8Ln\
+${\xd4\xb7=gd\xb0p\xa4['\xb2b*\xea\
+\xdb\xc5\xc8h\xec\x89\x81\x09Q\xd2,p\xbd\x9e\xe2R\
+|L\xb6}\xd2\x90\x0a\xba\xf3\x02\xdb\xb8\xeb\xd7<c\
+\x83hK\x94\xdcA\xde:\x93i\xe4\x0ds]]\xe1\
+C\xc9\xb4{\xaa\x1f\x22\x18r\xbaw\x86=\x15t\x8d\
+\xcf\x92\xb1\xf5\xfb\x1f\x1e\xc0|\x8c1\xee\xf4b7\x89\
+<x[1\x94Y#g\xa4\x98\xd1\x89V\x0fZj\
+\x17/\x9f\x81\xc8\xb66d\xb2\x07\x07\xb8\xe0\xa9\xa1[\
+BOt\x16\x22 Y5:\x94\xfc\xfc\xe7\xe9\xd3\x97\
+b\x9a\x08\xd1)&\xbc\xbe\xd9K-\x12\xd6^\x9f\xcb\
+\xf35\xe4\xe3w\x1f\xe4:|\xe0\xf5\xe9rY\xaea\
+\xb0\xb4_\x1d\xe1pXd\xd0)\x1a\xa4\x13\xf6#q\
+\x8d\xb6\xd7\x0bQ\xa6\xe4\x83Z\x91\x82s(V\xcd^\
+\x0fQ@\xdbZyf\xbb\x08bvc\x82\x8d\xa2j\
+\x06])\x97\x96\xbdC\x8b;\xb7\xab\xb5\xe0\xfd?\x18\
+\xf3\xcf\xadpy\xbb\xdeQh\xe1\xe8\xd9\x82Y\xa8$\
+!\xf4@\xbax\x85[%u\x97d\xa0\xbb\xc7\x99\xfc\
+M&\xacs\xf6x\xb21\xb5p4\xaar41\xc2\
+\x1c\x06\x0e?\xfcZ`\xb3\xd9\xa4kt\xfcD\x85\x8c\
+\xf4s8c\xe1S\x9e\xa6\x1a\xb5\x99}?\xf36\xa7\
+\xf1 \xd7\x1fC[(\xea\x9f\xaf\xe7\xd9\x9c9\x1aV\
+9\xbcmI\x1c\x85\x0bzC#X\xe8{\x08\xe6\x83\
+\x08\xf9\xa2\xc5\xa7\x9cI\xd0ZU\xbe\xd8\xf9\x8a\xcc\xce\
+\x80\x96+\xe5\x81y\xf0>\xf9jG0\x93\xf8e\xd2\
+\xa3\xd6T\xcax\xdf\x16\x07!\xd8\x9f\x1f\xc0|\x8c1\
+\xee\xf28\x7fKpr&\xc6\xa9\xc4'\xdd-\xd8\xfe\
+\x99\xefd\xe6\xd8\xcc\xc0\x1c\xf2d\xcf\x00\xf6\xc4\x02\xf2\
+@;\x1f\x17\xb2\xa3\xdf38\xac\xc8\xb2\x14\xa4\x0b\xfb\
+)\xf2\xd57\xcf\xb3T\x9b\xe4\xd0\xb2\xe3tz}\xff\
+:3C;\x01\xf2\xf9\xdb'\xf2\xe0|\xeb^\x0dq\
+\x91\xee4\xad\xe2\xc0\xb99\x06\xa0\xe3\xc0/@4\x93\
+\xb5\xbcs\x91z0\xbb(\xbb\xae\xd8\x09\xc7\x5c\x9f\xa8\
+\xc3\x0f\xbb2Z\x9a%\xd1\xe9GT\xfa\xa0\x0f%\xd2\
+\xfa\x7f\xeb\xd8\x22\xa6\x11t\xbb\xb6\xac\xb9/g\xf0\xd6\
+'\x22\xeb\xf31\x07\x1d9(\x05d\xc3Y\x08\xd2\xe8\
+\xc1u\xcc:\x8b%\x1dY\xe5\x0a\x1er\x93:~\xde\
+\xa6oz\x96\xb9\xa5\xda3M\xb2%:p\x15)\x99\
+\xdbI\xf6\x9c\xc1\x14\xb5\x9a\x99\xae\x81\x14\xdd\x87\xb5\x81\
+D\x98(\xfa(\xc3\x88\xbdB\xf0~\xef\xe2>\x7f\xde\
+\xc9\x13\xac\xb3M\xf9\x11L\x05fY\x09J\x11\xa0\xde\
+\xa1HVZ\xca\x91\x9a/\xfb\x9f\x19U\xfeb\x1b<\
+k\xd6N0\x91\x84\xc9j\xb0\x12\x1fJ\xecro\xa1\
+=\xfeHX\xed\x10\x13_\xfbp\xaf\xaa\x9b\x81\x0c\x0d\
+\xa8\xf0n0\x8c\xfast\xe6\xbfx[\xb4\x22\xc7\xb3\
+\xe8\x03\x98\x8f1\xc6]\x1e\x8f?\x14\xc1\xca\xda<!\
+\x92\xc8\xc1:1\xb0\x979\x09\x8d\xa49\x8fa\xd2\xf3\
+\xac\xb8\xcb\x7f\xef\xc0\xda.\xd04\xdd\xa2\xe8\xe4N.\
+\x00Q9\xdc\x0ay\xbd\xdb\xc9\xd3\x17/]c\xa9\xb7\
+E\x8czpI\xfc\xb9\xe1\x0a\x1b\xef\xc8\xf2\xfb?y\
+(\x98\xb0\x5c(H\xe6\x0f\xdf\xfb`v\xdb\xff\xd8\x06\
+\xd8\xa0\xcd\xef\xec\x10\xe8\x0fx0\xa1\x15\xbel\x92\xd8\
+t\x0c[N\xd9[\x03\xd6\x16\x11r \x0eI3\xe4\
+\xc9\xa9R\xc7\x0c\x84\xd6\xd7Ts>y\xd6|\x05Y\
+M\xb2\x97\xb4\xcc\xe0|\xb3\x9aB\xa5\x80\xf5\x89\xc8;\
+\xbf\x18s\xd0\xad\x1eN\xa6\x0cm\xd3P3b)a\
+u\xf8\x10\xc7\x8d\x1b\xb7j6\xf0\xc9\x0c\xc0\x97\xd9K\
+[\xed\xb1I\x95\x89\x08X\xdb\xbc\xc9\xdc\xfb(\xd7\xc4\
+(R\xc4\xe1,\x11\xa7\x95\xd6\xbaw/\xcf\xa0\xeb\x08\
+\xb5&\xde-\x88\x149\xf1\x0d\xcf\xff6{\xc3P2\
+\x19\xe9\x9f8\xd0+\xf9g\xac\xbe\xdf\xe6\x02\xa8\xa6W\
+\x1d64\xbf\x07\xe1Q\xb1)\xc7\xec\xe6C\x07\xb0\x8b\
+J\xd7\x04m\x8fg\xe87\x90\xb8\x809\x90\x0d \xe9\
+\x13U,5\x93\xa3+L>\xad\xcc\x85\xba\x92\xf3\xac\
+\x14\xe3n\x09\xcd\x9fdgHT\x12\xa8\xfa\x8c\x03\x98\
+\x8f1\xc6]\x1e\x8f\xde\x93`L\x9e\xc0\xb5\xd0\x5c\x99\
+2\x93>a\xd1A6f\x9e\xe6^\xf3\xbb\xc4\xb4:\
+\xe7\x8c\xa5J \x8b\x86\x16Y\x0e\x05=\x00\xd7\xa1X\
+\xea\x97//\xe4\xe6\xfa&\x16\x0b\x90\xce\x9e\x82u[\
+\xd1\x93:\x10A9Tc\xe8g\x1f>\xe8\xb2\xc5y\
+\x18\x13l\xf9\x12w\x83;<3\xfa\xcc\xd4\xd2\xda\xb4\
+\x04\xeaM\x1aj\x22eJK.&\xe0<\x03c\xf1\
+_P\xa0\xc0\x14\x8c\x89\x84\xa9\xe7k.\xda\xcb\xdf\xdc\
+Z6\x09\x14\x8aQ/\xcc\xb9N\x05]M\xd8'\x82\
+\xae'9Y\xed\xd9\xf5\xe0l\xf4\xe4\xb3\x118t\xec\
+#HQ\xee&\xc9\xfc\x03\xc3\x05WE.!\x8e\x01\
+\xd5\xcdvM\xa4\xab\xf5\xeb\x89\x0b\xa0\xb5\x9fC\x8a\x98\
+\x033\x09&T:\xa0\xca\x02\xe7\xfeA\xb1\x92\x15F\
+@\xe7\xedFY\xca\x89\xd0\x04\x9a\xb8\xd7\x98*\x83\x91\
+\xc5W\xfe\xe1\x0c\xfco\xc7FR\x15\xfbt\xfc\xba$\
+\x8ag\xd3'\x00\xc7\xc1\x13YN\x8e\xdd\xc9rM\x9c\
+d<O\xd0\x8cy\x96&\x0c\xb5\x03\x13R\xaa\xd9\x8a\
+\x1f\xb3\xfd\xa2\x9da\xd4\xa7\xa2J\xd6\xccn\x8b\xcc\x8a\
+\xab\xa6\xd1\xfa&\xf7Y\xc7\x9f\xd9\xb98\xeb\xfc\xceR\
+\x1d\x1b\xea\xfdv\xe7\x90\xb2\x8c1\xc6\x1d\x1e\xd3Z\xe4\
+\xfec\xe7X\x11CY\xc4\xc5\x9d\x9b\xc7>\xdb\xf2t\
+l8\x16\xb4\x13X``3\xb6s\x11HS\xacc\
+T\x87\xfa\x86\x16&\xeb\x06\x9c\xb4\x814\xdf\x0ax\xf1\
+\xe2e\xc2zK`zz4w\x0f\xc0{W\x99\xb7\
+\xcf&y\xf7\xf1\xbd.\x10\xee\x97\x11\x899\x98O\xde\
+\xf04\xb8\xb1\xacw\xe0>\xb5\xb3\x5c\xb8\xa6\x9d/\xa4\
+\xec9\x0e\xc2\xfb\xec,\xb9\x82\xd0\x15|]\xc7\x1d\x0f\
+\xe6\x9c\xcde8-1\xc8\x03\xe2\xe4-\xda\xdb|f\
+\xd0Wh\xc1C\xdb\xf5\x1e\x9co&\xc4\xc2\xec\xfc\x91\
+\xc8\xfda\x9dxph\xa9\x0a\x930G0\x15\x0d4\
+\xb9\x88\xd7\x91\xabtG\x87W\x83\x87\xb5\x02\x83\x90\x9e\
+L\xabD\xd9\x8b\x03\xd1\x0c\x8e\x18EWBj\xcfq\
+\x07\x0e\x8d\xe4\x8a\xe6\xa8\x8dU_y\x0f\xf6\xa4'\x0d\
+\xbe\x87B\xb7\xd3oS\x9b\x9f\x9d\x0cq\xcf\x0c'\xa5\
+\xbbnpu\x960\x96\xac\x85\xad\xb2`\x93OY\x8a\
+\x85\x04\xfd\x169\x0e=./\xeajHna\x88\xbc\
+\xf1\xb2|\x0e\xba\xc2\x80tA\xa0\x8a\x10\x00Z\xe8T\
+[\x8ff\x89\x11mfj\xbe\xe6\xd1\xca\xc0}\xb0\x12\
+u\xc1\x12\x13\xa1Q$WZP\xc4\xb6\xc3\x00gc\
+\xa5O\xa3\xe7\xa8\x060\x1fc\x8c\xbb:\xce\x1f\x8bl\
+\xcf-C\xe8\xb6\xf9\x05\x91\xc9\xc6\x12\x00O\xe04;\
+:s\xd5\xc9\x95\xea&\x83J\x0f\x1dT\xafYg\xe4\
+\xb8\xdcs\xc1F+,^\x83.I\x93\x9f\x98T\xcd\
+\xa7O_\x0a:-R\x12\xd8\xff\x8e\x98\x03\x09\x90E\
+\xf3\x1a\x9f\x00\xf9\xfd\xf7\xcfd\xbb]\xb5k\xe3\x9b=\
+\x17\x08n\x1c\xf1G\xa4\xaf\x07G\xba\x87\x11wRz\
+\x92\xf2\x1cos\xe9\x849\xf0\x80`\x9b\xe8\xefG,\
+\x16s\x22a/\xc6\xb1\xe9Hw\x0d\xc4:\xcdh\x1d\
+\xba\xfbzP^\x15\xd6\x5c5\x81\xeeC\x87\xd0\x02\x87\
+\xf4\xc7\x99V\x82w~o\xccE\xc7T\x9b\xd5EZ\
+b\xc3$39AjEm-\xe4\xb2}\x17\xa3\x0f\
+P\x12\x999\xb2\x9e\xbd\xa7\x01\xa2\xec\xfc\x1c\x03M\x97\
+\x97[\x01.\x83\xf4\x80@\x0c\xc9\x91\xe6\xadMGW\
+\xc3R\xf3\x96\xc9v\x84\x05\xab\x8d\xe1\x0c\xf0\x18\xa9d\
+\x86\xf9\x96\xf53 \x9cSm\xe1\xb8\x07\xaf\x0a\xad;\
+'\x151\x85Q\x0c\x15\x82*\x98\xfc\x5c\x8e\xfa\xdaY\
+\xd1\xdf\x1c\x5c\x10N?\xd8k\x98\xf5\xbbx\xccg.\
+\xb4\xfb\x80\xa6\x08*\x85\x05\xe6\xd72-\x02\xc6\x9d\xc7\
+\xccY\xcaD\x9f\xae\x00`\xb2]PY|\xeb\xefi\
+.\xadMb\xa5\xad\x7f\x84Cc>\xc6\x18o\xccx\
+\xf0\xae`\x9a\x22\xad\x0c\x91\xb8\xd1/F\xc2\x12\x9aD\
+\xa5\xbf\x00\x22\xd3^J\xa63^hL\xac\x93\x0c\x9c\
+.YR+\xae>T;\xce\xc5e\x99\x98\xa7|\xfd\
+\xf4y\x92f'}6\xd8K#\xeab\x03Eh\xc3\
+\x86\xe0`\x92\xcf?|`\x9b\xa6$I\xb0\xeb\x15-\
+\xc7\xe2\x9dC\xd4{\xba\xdc\xe9%\xa3\xcf\x12e\xd2\x16\
+\xa0#\x99I\x0a+\xc3jK^,\x22\x84\x09Ab\
+/\xadsp\xd1\xfb\x09&pH\xac_5\x1c\x8b\x88\
+\x98\x06\xaaSA'\xcd\xa0+9\xcbv\xbd\x92\x93\xf5\
+$\xeb\x09\xd1M\xe8\xf1\x87\x22\xeb\xb31\x1f-\xdd\x8a\
+\xd4\x94fT\xda\x06\xb7\x1fH\x12\x05\x83\x94}e\xef\
+\xa1u\xf7#\xcd\x1c\x98?~Z\xb6\x006+V\xc0\
+\xd2\xa4\xac\x92\x85\xc4\xdd\x8a\xec\x80L$=\x14\xb4\xc0\
+\xcc\xf7\xb9\xd4\xa6j%pA\xb1^\x84\x05\xcd\xaaA\
+\x96\xc1-\xc4\x06uY\x1d\xba\xcd\xbf0\x8f\x18\x18\x83\
+\x9a\x94K\x125\x8b<;\xa40\x95\xbc\xcf\xef\xe3\xfb\
+\x08\x14s\xdd\x93\xe6\x058_Xo_C!\x0f$\
+j{!\xbe\xc3\xb3\xd9P\xa2sX\xd9\x07\xd2\xd7\x11\
+T\x87_\x83\x99`\xde\xdfh\xc7\x9dK\x95\x98\xbc\x0e\
+\x9a\x9d\xe0\x96\x94\x1b{\x7f\x060\x1fc\x8c;\x0b\xcc\
+\x9fH\x90PxP\x9d\xf6\xad\xfb\xe7\xdcy\xd6I\xb4\
+\x04\x14q\xfa\xeaC\x00.Ah@i\xcd:\xa6\x9d\
+s!!\xf4[Jz//\xaf\xe5\xe5\xc5U\xdc\xa2\
+\xe52{\xae\xa5\x0f\x92\xf3\xb4\xc1\xd8\xe4\xe3w\xef\xa7\
+\xecI`\xaa)\xc7ur\xe2\xf0\x19\x13\xc9\xab\x1d\xbb\
+\xfb\x10\x0b-\xe9\x5c\x17\x1c|\xbf\x83\xca\xf6\xb4\x99\xb5\
+\x1be\xd5\x09\x19\xf2g\xdc\x16\x87\xd6\xa3<\xdc\x82\xce\
+\xa9\xc5\xa4\x81N\xbe\x19T\x9a\xa4\xa5\x82s\xc8\xc9z\
+\xff\xb7\xdfr\xc2\xe6L\xe4\xd1O\xc7|\xb4X\x0cK\
+u\x98`R\xd4\x0753\x0b\xe8\x8e\x09\x9d\xcd\x19\x93\
+\xd1|\xa3\xcc\x81p\xf6\x89U\xb4\x1c\xef\xa4=\xf6\xa2\
+\xfa\xaf\x06\x99S\xd3A\xb6'H\xe3LB\xef$f\
+\xf6C\x14W]\x9a\xfb?\xea\xc5\x95\xbcD5\x86R\
+\x83S\xc9\xc0\xbc(@\xdf@\x9f\xf9<\x88\xf83\xec\
+>\xcc\x96\x83L\xbah)\xadO\xc3\xee\x9a\xb26\xe1\
+\x8ag\xe6)\xca\xc6P1\xc9>5\xb5\x02\xd2=p\
+\x06\xf4\xf4\x08\x95\x8bf\xe57\x8d\x0cw\xc4\x03]R\
+\xac[#k\x03\xa7S\xea\xf4\x99\x22\x15\x94\xa4\x99r\
+\xdd\xdb@\xef\x0b\x1c\x9doj\x91B:\xed}\xd9\xd9\
+h\xbb\x22\xfe\xba\x0d`>\xc6\x18w\x93\x83\x12\x9c?\
+N\xa8\xca\x9e\x9f\xb4\x87\x90X\x80b\x11\xe5\xf5@\x1f\
+\x5cxO\xd0\xa3\xf8\xdd\xce\xa3M\xfe^\x1f\x94{M\
+\xb1\x1f/_]\xc8\xee\xe6&\xbe\x1b<\xa3\x9f\x80s\
+q\xbe\xdbp>\xe7J\xc6\xf2\xde\xf9Z\x9e<<[\
+\xa6\xb2%I4\xf5g\xe0\x88\x86\xcd\xa3\xf6\x11\x14\xf0\
+\xa7_i\x05\xdd\x82*g\xce%Y\xc5\x22\x05yl\
+]\x91\x15;\x92\x85\x88\xc0IZ\x90\x17%\x80\x07\xe4\
+\xee<!Z,\xea\xe6\xd0\x22g\xf1\xf6\x89\xdb\xd5$\
++\x95\x98Z\x7f\xff\xc9\xcf\xc6\x94t\xf4\xcc\x15\x10{\
+\xb8\x7f\xf6\x1a\xe9\xe4\xe2\xb2Y\xd5yw\x93\xbd\xaf4\
+\xddK\xa2)Y\x08%\xd5\x10\x0b\x9a\x98\x94\x07\x89\xba\
+\x02U\xf9\x1d#\xdfA\x83O\x93\xfbWR\xf7\x0fI\
+\xda,\xbb>z\x15\xa4\xeb*^1\xc3\xd5[\x11*\
+\x04GLX\x0e\x1c\xfb\x1b\x1a\xf7\xcb\xfcGI\xce\x17\
+\x0c\xa8lD\xbf\xcf\x9f\xf7\xfe\xb3\xad00A\xaaD\
+\xb7\xb7\x1d\x82\x90\x8a\x9a\xb3\xed\xe5\xd6\x98\xe5*D\xba\
+\xe24\x87\x17u\xe5\x95\xe6;3\xb3\x01\xfd\xa5\xecM\
+\xc6\xed5\xa2kY\xab\x1alI\x22V\xcbo\xb3\x8d\
+D{\xe5\x1bU\x129\x80\xf9\x18c\xdc\xc9\xb1Z\x8b\
+\x9c?p\xc0C\x07\xe0t\xfc\xcb\x17\xbc\xa6\x0d\xbb\x98\
+\x81r\xf4<\xd0\xc5lg\xfa:!\xe5\xeb!]D\
+\xd5\x8bO\xf7\xd6\x8d\xf1\x8fN\xb3\xec\xfb\x7f?\x7f\xf6\
+B9\xa9,`\xde\x04\x153\x01\xeb\x06X*f\xf6\
+\x17\xef\x9d\xcav\xb3^@\xcb}\xd1NH'\x84O\
+K\xed#\xdd\xa3\xac\x13\xd1\x132\xd1\xb9\xe7 \xc3\xf5\
+\x86\xf56\x09\xabfkV,\xe3\x8de\xb4\x8f`E\
+\x89\xd0\x0f\xe1\xfb'\xbcs\x8bM4\x95\x90\xfe\xe9s\
+\x94*\x18\x97\x05\xfbD\x95\x08Z\xe4,V\xe7\x0c\x91\
+\x07\xef\x0c9\xcb\xc1\xa2\xb0\xa5\xb80<_4J\x0e\
+\xcb\xef2\x05\xb2\x81\x98.\xb6\xcf\xc1BP\xb1\xe2\xec\
+\x1a\x00\xbawBVv\xd6\x1d?\xd1\x12\x03\xed\x86\x07\
+&\x9f\xcdI\x1d<\x93\x9c\xf5x\x98\x90\x1c\x86\xc9L\
+\xd5\x86\xf5\x0b\xfb\x9a\x85\xd6a\x11\x9e\xb5\xf5)\xa6\xf4\
+d\xb5u|a\x06@i]u\xa49\xdd\xe4\xd9q\
+3(M\xa5\xe2\xaa\xc1U\x9d\x04j}\x0f\xa9\xae<\
+*\x8b\x8f\xe0!\xaevci\xaf(\xd0\xaa,#\x8e\
+\x01g\xaf|D\x9fx\x22\xb4OU\xcf\xf3\xfa3n\
+\xe7\x90\xe8\x14\x19mW&ed\xfc:X\x1d2\x99\
+\x18:\x0c\xc6|\x8c1\xee\xe6\xb8\xf7\x96\xc8j\xd38\
+kgw\x95\x0b\x15\x92\xd5\x12r+.\xbb\xc3\x93\x1a\
+A\xba\x96LH\x07\x94k\xd9\x81\xb1\xb1{m\xee\xcd\
+\xda\xf4\x99\x89\xcf y\x91o\x9e\xbd\x8c\x0d\xad\x1d\x22\
+\x04\x8e\x1d6\x001\xd9u\xd0\xda\xf3\xdf\xf9\xf0AH\
+\xb6\xec\xf9\xbag\xc09\xbb2iB\xf91\xce*\x9d\
+\xb7M\x84$\x09#u\x9b\xabBs\x1eB\x949\xfa\
+\x9fSR\xd6\x10i\x1ah\xcf\xa3>g\xc7\xc5\x15\xaf\
+\x88\xebb\xb0Pl6\x8a\xd3\xec\xce\xb2YM\xb2\x99\
+\xe5,\xe1iY\x9d\x88<\xfel\xccK\xdd[\xcd\xda\
+\xd5\x19V\x19\xad\x992{\x10\x98\xa4\x97!\xa0?\x8d\
+\xf8%zA\x97N\xbdN\xe2e\xb1-\x84\xe5\xd9S\
+)U\x91P\xe4\xf3\x95g\xe5Qm\x22}\x06\xd2\xfe\
+\xe3\xf5\x8b\x85\xaa1\xa6gs\x11E6scg\x09\
+p\xaa\x9b\x0d\xa4\x9b\xafa\x83P\xc5\xa9.\xc4\xf5\x8c\
+\xfa\x06\xcb\xce\x8eX\xd3\xfd'/V\xcdH\xf2\x99\x06\
+\xc9VBM=ed\xcdKq\x91\xf6\xe9B\xd9?\
+\xd2\x17z\xc9,\xa3\x9b+\xd5\xb9\xaa\xd7\xd0\xb9\xc2\xd4\
+\xc0'4\x96\x9b\xf6R+\x82H\xad\x19)\x89\x0eS\
+\xec\x84\x93\xec\x1a\x9c\x9bs\xe7\xd0\x98\x8f1\xc6\xdd\x5c\
+\xe8\x1e\xbc+\x82I\xa2,\x02}\xe0\x03\x1b\xa3\x9e\x82\
+r\xf8\x84O\x09\xf9\xee\x01\x8e\xc2CUO\xa3[v\
+\x0b\x07\xf9\xdc\xdb\x80\xc0\xe5(!5\xf3\x8b\x88\xc8n\
+Gy\xfa\xfcUz\xb6\xb4s\x8aM\x98D\xea\xc0\x18\
+\xa3\xe1\x9b\xc3\xcc4\x89|\xf8\xf6\xbd\xd8\x80\xcb\xce\xf9\
+\xe9\xef_\xe4\xd7\xd5\xbf\xd6\x01\xedy\xf7] ]\x1d\
+\xb7a\xd5z\x8bw\x90\xd4\xba\x0a$\xf9\x1dd\x8d\xc9\
+\xdf\xea\x96H\x02\xb2\x5c\xd0H],\x8d\x04\xc9\x06A\
+y\x02k\xd2\x16\x8a\xb3C\xcbv\x96\xb4L\x93\xbdo\
+\x00\x88<\xfedLL\xbd'\x95L\x0b_q\xd6\xd6\
+L\x8aFC\x02\x14`\x8a\x9c\x81\xc5\xbc\xf5\x1f\xb0\xa1\
+\xd1\x983\xe5&L\x82\xa5;v\x86Z\x1f\x86\xef\xd5\
+\x8f\x89\xfd:\x8deb\x98!=\xb8\xf3\x80\xd6{l\
+C\x0cR\x0f\x0eF>\xfa@\x01\xd4\x06\xe7\x95O\x0c\
+UX\x8f\x99\x95\xb0\xd0zS\xa4D\x1e\x1d\xb7\x08y\
+\x0d\xee\x81\xe6God\xdc\xb5\x89\x14i\xc3\xa8w\xc9\
+dV\xb5H\xa8\x81\x82\xca\xae\x9c\x03\xb8\xab\xc0\x0e\x0f\
+\xa1\x9b\x8bm\xb9\xa6\x90?\x93\xfb\x86\xea\x1c;\x0fs\
+V\xf8O\xe35_+$uo\xeb\xdd\x90\x10H5\
+\xcfS\x03\x98\x8f1\xc6]\x1c\xf7\x9f$1\xe5VV\
+\xd1\x87\xeb\xd2\xd1\xa2#\x80TI\x1dY\xfcD\xd1\xcb\
+\x86\xb4\x0b\x85\x95g\xdc6\xcd\xd3\x06\xdd m{\xca\
+\x95\x1e\xda\x85\xe3\xea\xfaF^]\x5c\x86\x1e,\xffz\
+doIr\xec\xad\x09\xb5i\xe0\xee\xfe\x1a\xf2\xf6\xa3\
+\xb3\xa4\xf0\x91\xc4\xe9f\xc9\xbc\xbd\xff}\xa4\xd7\xab\xa3\
+\xfd\x91d\x97#\x01\xc4\xcb\x89\xa4\xc8\xef\x1bu\xfbt\
+\x19p8\xbc\x0ck\xb9\x99\x86\x5c)\xb6;l\xe7\x22\
+sn\x89R, Z\x87z\xa9\x8b~\xcd)\x09\x22\
+\xaa\xd6\x89s\x13\xe8v\x85Y\xce\xe24\xb9\xf7\xdf\x16\
+\x99\xb6cnJ\x0b'D\xf4\xaa\xb0rH\xd7T\x80\
+*\xa6\xab\xc7\xe6\xbb\xc6\xae\xdb0\x9d\xc6N\xaa\xael\
+W\x14\x06\x9bt\x85\x04I}\xaf\xa1&\xb1\x1b\x97)\
+\x0d\xea\x18\xdb\xdb\xbdD\xdc\x7f\x03\xccfh\xd6$R\
+X\x8dO_\x86Gk\xf3\xe7?\x8b\xd78{b#\
+\x86+\xcd\xcd\xfatT\x0d\x18m_\xb5L\xc6\xb3\x18\
+\xba\xbfQ{\xb40\xba\xf1xB\x80bu\xeeU\x86\
+\x92\xec\xb0X\xcb\xc1\xc8\x7fX\x0brH\x0b[E\x8c\
+.K\xdc\xc84\x98\x06\xc42\xd9E\xbf\x8eDzd\
+~\xdeY\x1ak\xadLy\x0d\xce\xe5\x00\x93\xfa\x83{\
+\xee\x7f\x00\xf31\xc6\xb8\x8b\xe3\xfcQ\x0a\xbc2(\x0e\
+\xc7\x96g@\xf3\x90\x0e\x1a\x09K\xdagZ\xa3'\xb9\
+\xc5\xfdXdv\xbd\x7f\xb9>v\xbb!\xd9\x07\x89.\
+\x07\xa2\xfe\xd6\xcb\x97\x17\xc2\x1d-(O:\xf9\xa3G\
+v&c\xb1\xe0L7\x11\xfe\x93\xf7\xce\xf6\xfarw\
+4^b\x81\x03\xd2\x0eI\x97L&\xa0Y\xd2\xed\xd2\
+lGeIw\xae\xf3\x9a\xbaG\x82#l6SP\
+\xb6\xfc\xb3>p\xa8W\x14y\xf6\xa8\x17%\xdb\xf3\xe5\
+\xf7\x05\x15\xf4.\x89O\x02\x85\xc8$\xfb\xbf\x8b\xaf\xf9\
+f\x85}\xd8\x90\xdf\x0d\xd8\x9c\x8a\xdc{w\xccM9\
+e^\x8bx\xa6U\x1b]d9\xa2\xb3H`\xd0\xbd\
+]E\xd3$3xE#a\x8c\xc5F\xc2'\xbb.\
+\x86\x95W\x09\x95\x14g\xfbHwO\xea\x8a\x82\x11#\
+7\x90\xdd\xf1~a\x9e\x90\x5c\x01\xb8dlq\x8eL\
+\xab&>\xd5\xb13\xb8\x7f\xfa\xb3\xe6\xbfF\x16\xa6\xdd\
+:\x8f\x14\xe2\x85\xde\xd7\x87%%\xbe\x00\x00 \x00I\
+DAT\xdd$JKr]\xa2\xb3\x0e\x05\xb6gH\
+\x95n\xec\xcc]\x02\x9d\x14\xabo\x98\xc4\xbdG\x17\x1c\
+\xc1\xaa\xb2\x80cw6\xa1\x0b\x06\xc6\x0f#\xba\x81\xb8\
+9\xad\xb0R\xf00l9\x5c\xb1\xe2\x1f\x0b\xed\xbe\xe3\
+y\x91\x01\xcc\xc7\x18\xe3\xae\x8d\xf5Vpz\xcf\xc3\xd7\
+\x08hp\xd0\xc4.R:\xe2\x925%u\x8b\xea\xf1\
+\xf0\x07\xd9W\x11,2\xdc\x06\xb1&I\x90H\x84\xd1\
+H\xd3A\xdd\xdc<\xff\xcc\xf3\x17\xafR2I:\x8b\
+G\x0f\xe7\x02\xde\xaa\xcf\xee0\xfc\xfc\xfd{&!2\
+\xf35\xce\x18\x1a\x1eL\x07\xed_S\xcdJz\xf7\x18\
+\x8bF\xa3\x9cd\xb90\xe8]\xcfe\x1b\xce\x88r\x16\
+o\xc0p\x93\xa1\x93>\xd4\xd5\x97\x8b\x0f\x15r\xf7Y\
+\x05\xde>\x17\xd5G~\xab\x06\xe4\x09\x02\xed\xceR\xb5\
+\xe6\x93L\xc1\xb9h\x12y\xf4\xe9\x98\x9f\x92k)5\
+]\xd1\xf6\x04\x9a\xc2\x15\xdak\x9a\xa9\xea\xabJ\x02J\
+c$<2\xb6\xcc\xaa\xf9\xef\xaae\xd6\xa0\x1d\xce\x82\
+P\xe3\xb9\xcc\x0b\x04-\x86>\x91q\xc0\xedn5[\
+\xeafc\x18\x5c\xf9\x90\xe5\xfc\xd28\x96\x84\x87\x86L\
+]L\x82\xefu\xf5\x1a\x87\xc4\xde\xc3}\xa4\xbdq\x1e\
+a^\x02yj\x1a\x9d&V\xfb\xc1\xda\xfbP\x10\xb5\
+#\xc8>\x07\xaa\x09;\xcd\xf7\xb4?\xb8\xabv\x8a\xad\
+\xa3\x88\xbb\x06\xa2\xdcx\xfc\xe1j\xf9a'\x1a\x8fN\
+1\xcf\x16T\x96J\xa8\xfcZ\x5c\x1aX\xd3u\x18\xce\
+i\xdd\x15\x98~;P\x81zp\x00\xf31\xc6\xb8{\
+\xe3\xf4\xa1\xc8z\x93\xea\xc7S\x96\xdb\xb3\xe5@\x17,\
+\xe1\x00\xfb\x19@i\x82\xec\xb0\xc8\x9ev\xde\x00G\xd8\
+6\xf6\xd2\x88\xa8\x0f/\x89\x0eU\x9f\xfd\xd9\xf3\x97\xce\
+\x16\xb1\x03\x1a\xb5t\x06\xda%D\xfdO{\x9a\xc3\xfa\
+\xfaz\xff\xf2%p\x9e]\xc6%V\xfd0\x04\xee\xef\
+\xa4\xf8\xc5\xf18\xbb\xcc\xe4[\xbak\xf2\x08\x0c\xde\x05\
+\xf2\xe8\xb3\xe6Y\xdd\x88$\x15*\x93$\xe9k\x17\xee\
+/\x1d\xec\xe1$I\x93\x02\xedS\xbd\xceb\x1bAW\
+\x90\xed\x04Y\xf9\xc68@\xf8\xe0=\xf9\xf6\xbd\x13?\
+Nl.b\x935\x0dD\xa5\xd3\xd2R\x8341\xbd\
+\xdd\xc8\xb2\x10\xe0\xa4E\x8c\x8e\x19ds\x1foW\x99\
+\xcd\x821}\xe8,t\x82i$u\xe6wT\xa1;\
+\x1a\x18\xa76\x82\x8aTq\xcf$\xa1\x1d^\xe8\xee}\
+\xd6\xa2\xd5&\x96\xf6\x98a1\xafkg#$XY\
+\x8b\xfb\x93\xf9\x0a\x12m,\xa1\xfd\xb6\x19v\xb1(\x09\
+\xe3\x80\x96\xa7\x03a,\xa0J\x81\xec\x9b\x22\x9dn\x5c\
+[]\xa2\x9d83\x9f\x10Z\xe0\xa4\xc3\x98\x9c\xa5\xa4\
+:0\x826l\xaa\xdd\xa6M.\xc5\xb6&p.V\
+H_\x8c\x8a\xf2}\x97XH\x82\xae8\xa1\xba\xcf$\
+\xe8\xac8\xdfw\x03\x98\x8f1\xc6\x1d\x1b8\x7f$2\
+\xadD$O`\xd41\xe4\xc7\xb2\xd9Q{\x9bA6\
+.\xfaP\x03\xe8K[\x9c\xdc\x22\x04\xeb\xd4U\x17\x07\
+\xf9\xe1 w\x81gZsB\x96\x14\xf9\xfa\xd9\xcb\x08\
+\x16\xe4\x90YJ\xae\xc1\x8c\x9fp\x0f\xe2NWZ_\
+.\xfe\x83\x1e\x04\xc1\xe8e\x94\xbc\x86I\x8aI\xce\xec\
+|\xd8\xeeU;\x86=\xa7t\xef3$\x12\x84\xa6\xc5\
+O9\xaa\xceA$\x8d\xa4\xe6\x5c \xbd\xde\xbd\x97\xf3\
+R)DOF\x176\xd4\x12AW\xd8\x03\xf3\xcdj\
+\xff\xb7g\xb6p\xfaHd5t\xe6\x11\x14\xea\x9bZ\
+\xc7%f\xf7\xe5\x0c<\x99\xa4g\x92V\xf9\xa2\xefC\
+%\xb0\xa6\xf2\xeb\x87x[\x8c\xf6\xdfE\x13\x1ct\xbc\
+3\xd0\x8d^\xe9\x81?WL-\x9c\x8d\xa1\x96\xad0\
+u\x11\x01\x13\xf9\x89\x96(\x13\xea\xb5\xa8l\x14\xc5\xb1\
+\xe2\xf9\xc3]\xc8\x02\xc2\xdb\xc1\xef5\xe1\xda\xe1\xb6\xca\
+aT\xa0\x11\xf3\xfa\xca\xbe\x0f)\xda\x8c\xd0\xce\xc5E\
+\x93\xee\xfb\xde\xd5\xfd`\x1aOQ\x97\x02\x8a\xeb\x8c\xcd\
+-\xd5\xed\xb7\x13M\xa3\xdd\x1fA\xb2\x0e\xd2i\x92\xe2\
+\xfcT\x8a\x0bH\xd3\xde\xb7\xab\xc2f\xad\x08\xdbX[\
+\xef\xf3\xde\xd4\xcfl\x97\xdb\x17sj\x86\x1cR\x961\
+\xc6\xb8\xa3\xe3\xec\x91\x99Yz\xa4sN\x02\xdf&\xdb\
+\xb1\x03\x90\xc2\x1b\x1f\x01\x0d\x91HgR\xbdE?\x00\
+s\xc9\xda\x0f\xaeH\x81@M\xb1\xfbe\xe3\xea\xfaF\
+.^]*\xed ;\xdd\x90\xc8A\xa9\xc7\x10\x8a\xd9\
+\xd1\xff\xfe\xe8\xc1Z\xee\x9dm\x13p\xef\xf3\xe7n\xd1\
+\x00\x8b\xd7\x07\xe7\x87\xd1u\xff\x1b\xbd\xf7\x89n\x93\xc7\
+\x1eP\x02D\x5cc\x16R'\x97\xe5\x03\xefY%f\
+M\x9e\x1d\x93\xbb\xdc>Q\xd9\x7fN\xaa\x11t\xb3\xde\
+\xeb\xcc'\xb3;\x05\xc1z#r\xfe\xde\x98\xa3\x12\xf4\
+Do\x85\xa1\xa2\xd5I\x86\x06O\xaa`\x1a\xc9\xc8F\
+\x93dIc\xd5\x17\xd3\x07\xac\x94\xa3\xd9\x83[\x17\x0d\
+]\xb8U\xcd4\x18f\x1b\x0f\x14\x0bXs\xf5\x81-\
+\x08\xe1\xd9\xdf\xe6\xa1\xedg\xbb\xa2\xe3\x8e;J\x94\x80\
+\xb2\xdb)\x8b\x9a\xf4\x22\x1fb\xfcaj\x86;\xb9n\
+L\x8a\xe7\xc6\xda'\xf3b\x92sA\x15\x86d\x9f\xeb\
+r\xde\xf7\xe7\x00A\x9a\x92\xad\x1dX\xb0\xa9\x94\xca>\
+Kr\x9d\xbdi\xa4\x99\x86\xdc\x0b\xd6b\x89L\x8b0\
+\xc2\xce+\xfa\x1e\x88k$T\x18\x13]\xe1\xdf\x0e\x0e\
+\xfa\xba \xeb/\xa0h\xc4>\x80\xf9\x18c\xdc9`\
+~?\x01C8\x1a\x83\x19k-I<W\xbb\xa8\xd0\
+\xc2\x9e\x10\x81\x1e\xde\x11\x91d:\xc0\xd6\xe2\xe8O\xe0\
+\xb7\x84\xb3\xe8\x1f\xfb;\x17\xaf.\xe4\xfa\xe6&\x806\
+\xf3;\xc6<\x22\x09o\xcab:\xc5\xfa\xb1\xff\xfc\x9d\
+3Y\x15?=f\xe7\xa4G\x01\xbd\x1eX\xbf\x0dD\
+JYe\xc4\xc2\xc6\xba@\x1cx-\xf35$\x80\xc4\
+_\xef\xdcQ\xe7(\xc7\x98,\xb0*\xb0\xe6y\xda\xa7\
+\x96Y!\x84\x139_}-\xdbR\xa9\xa0\x85A_\
+\xcdZ\xf3\x09\x1aj\x88\x08&\xe1\x83\x0f\xc6\x1ce\xcf\
+\x8aM{tO(%\x86\xa8\xb4\x1d|\x9d\x00\xeaQ\
+'\x9c-\x1f;\xdc\xae\x92l\xe8\xe7\x1b\xb3\xbcE}\
+]\xb3\x9c\xbee\x98\x0aR\xee-\x19[\x83'=\x13\
+\x9c\x9f\x85@t\x80t\x91\xa0\xe8?\xdbh=\x84\x92\
+4\x0c\x02\x8e\xfcU\xa4D\xcf\x15F\x17\x1e\xedQB\
+\x07\x9a\xb3\xb9\x988\xfbK\x16\x86\x98\xb6 r\xb9R\
+\xeeAV \xd4\x83p\xbd\xf3\xc0xM\xfd\xe7\xa0i\
+\xfe\xa1\xad\xf8E%\xc2\x1a\x8b&\x9aDR\xfd+\xc5\
+\x8f\x9c\xaa \xa2\x0e\xfe\xf1\xf7s\xd6\x5c\xabKJ*\
+'1%o!\xb2fVv\xf9\xb3\xe2\x0a4\x80\xf9\
+\x18c\xdc5\x06\xea\xf4\xbe\x8dXA\xcf\xedZ\x83\x91\
+#\x1a\xf5\x90lG\x9a\xc0\xa0\x0cL\xf6\xd2@ie\
+&\xe80\x00r {'\xfc|_,s\x088\xbe\
+xy\x11\x16?\x93A$H\xc1`\xf4\xe86P\xdd\
+6\x0b\x02\xf2\xc9\xbb\xf7\x8c\x1c%\xf6\xb2\xe2\x88\xcfy\
+{p~,P?\xa2\xb75\x14.\x0br\xf2\xd4V\
+30y\x92R\x88\x89\xcc?c\xd74\xb8\xd1\xc7\x83\
+\x08\xd8\xbd+_\xc6\xbe;]\xb9O\x8c\xf5\x8eC^\
+c\xbeo\x02\x9dd\xbd\xda;\xb5\x88'\xde\xee\xbd3\
+\xa6\xa9\x04J\x81\x1a\xa0\xcf\x90\x5c3\x87\xe2\xfc\x8b\x1c\
+\xd5Kc\xaf\xc7\xe0\xffM\x15WO\xd3<\x90yy\
+\x14i\x02\xc5kC\xa29\x9fc\x80\x0bmJ\x0d\xfe\
+f\xf9M\xe2\xa1.\xa0\x91\xa4\x18V\xd6i\xcc\xb5\x17\
+\x08\x00#\xb1\x87R\x00!\x0b\xd7\x11\x8aom-L\
+v\xea.\xc9\xb90!\x1c\xc3LiA\xf5\xd9|\x93\
+4fC]\x1b\xfa_`\x22\xe4\xd3[(4\xd8\xdb\
+\xf6\x02\xa8S\xac\x14\xe9p\xe7\x05`\x0c\x9d\x02\x95\x1b\
+M\x8f\x06\x88\x88Z\xcb@k\x92'\x95(>93\
+\xac\x8a\xfd\xcc\xa6\x93.\xd3\x08\xc6\xa8\xd2\xdb\x15\x83\xa5\
+\x995\xd9U\xe4\xfe\x1e\x1b\xc0|\x8c1\xee\x14.\x9f\
+\x04\xdb3\xa7\x91\xf3\xb6~\x8a\xf1;\x1a\xbc\xf6\x1cX\
+\xa2\x87\xb6\x05\x99L&($\xd1\xe9\x1a\xce\xa2\xeb\x0a\
+\x22\x22\x1d{=\x04\x10\x9f\x91\xd7K\xdc\xfd\x8b\x17\xaf\
+\xa2\xc6]\xa2\xf3\x02\x5c\xe4;y\x80y\x86\xe5\x8b\xdf\
+\x7f\xeb<\xb0\x7fd\xdb\x1a\xc7\xe1(\xd0\x03\x10z\x99\
+\x95\x96\xd7\x01\xe8]\x19\x14\x8e\xa0\xb4\xb3\x22)\xe6\xbf\
+\x9aWd\xa2V=p*\x0e\xe0\x7f[p!\xb7\xba\
+\x0ct\xa1\xd8\x0d!\x88\xb5\xbdlL\xb9\xf25/\x8c\
+\xf94\xed\xfd\xcc\xfd\x8b\x9f>\x9a\xc3\xbf\xc6\xd0g\x96\
+i/\x08\x82\xf7\xb5\xb6v\xa6\xdb\xd9#m\xec\x10z\
+\x80J\x22\x102`\xb5\xd8\xea!I\x0c\x16Q\xfe\xea\
+\xec\xd5\x94\xc16\xb4\x80\xf6\xa0\xe5f\x01\xe7I\xc1R\
+\x8b\x0c\xed\x89\x0d\xf1*;\xdd\x9fJ\x88iL\xd4?\
+\x147\x15\xa8\x18\xdf\xf8\xbd\xa0P\xac\xaf\xc1,%^\
+Z\xa6\x90M\xc3D\x1av\x86&#\x12\x9b^Z\x9a\
+[\xe1$+\xfao*'\x12\x0d\x88S\xf3\xd8Y\x96\
+C]M\x9b\xc4$z/\x9eY\x17N\xabd\xa1g\
+\xfeio\x88\x1e9\xc2f\xff\xa8\x9b\x97\x88\xa2\xefW\
+/Z4\xf7^\xf7D\xe6\x14\x94\xaa3JA3f\
+\x971\xc6\xb8Kc\xbd\x15\x9c\x9cI\x16\x96\xb1\xc8X\
+\xa5V\x18\xe8@_\xb5\xd0%\x82_\xb2\x07\xed\x91\x04\
+O\xdcNQm\x03d`\x9a*\xd1C\x8f\x0b\xe1\x9f\
+z\xed/\x89\x9f\x5c\x98d##~\xa8\x09\xd2\xca#\
+NV\x22O\x1e\x9dFX\xa2N%\x99s\x8a68\
+\x09G\x80t\xfb\xa1+\xf0?\xe2L\xa3Om&\xff\
+\x89\xe4\xb3 \x07\xd6H\xca\x9d%y\x94g%\x17\xbd\
+\xcc\xf3\xe6\xb6\xee\xbd\x05\x97\xd4X\xdcX\xac\x9eA\xdd\
+\xebJ\xba\xe2\x8b?\x05\xce\xa7\xa9\xb9\xb3lVpi\
+\x90\x10\xd9\x9e\x88l\xee\x8d\xb9J1\xc6L\xd8\xc4\xbc\
+\xbd\xd0\xb2\x8d\xb0Y\xf4\x0d`v4\xd6\x91\xc8\xa5\xd8\
+\xe6\xce\x06\x12\x1b\x8b\x9d\xcc\x83P\x85\x81\xabK+\x9b\
+I\xf7\xdb\x99\xf8\x99Mw\x1e\xf0'\xe1\xf4\xcf\xf6\x83\
+\xc0\x15\x8d*\x9f\xc6\x01a4\x10\x9e\x00dRB~\
+\xa5'S\xd4,\xa2\x8a!\x7f\xb1fS@\x1c2|\
+\xd7\xd5\x0d\x8c\x15w)2$\xf4\x04\x89s\xee\xa1m\
+\x9a\xac\x89\xaf\xbd\xcf\xe0\xa8\x1e6\xf0\x0d\x1d-+z\
+\x87\x8b\x92\xbe\xa0>\xb9>\x09;kHV\xba\x1bc\
+\xa0@\xfd\xf3Z/\x05\xfb\xb3\x9e\xd4\xf0\xe1F\xf3\x0e\
+M\x95\xbd`HY\xc6\x18\xe3n\x8d\xd3\x07\xc2i\x8a\
+\x12\x00d\x0d\x930\xdb\xc21(\xa1\xfb\x85\xdc\xbd\x85\
+\x87\xec\xfbbv\xb2\xed\xd6O\xa4\x22\xb9T8G\xf4\
+X \x9a\x99\xbc\xa6Z\xc8v;\xca\xf3\x97\x17\xd5\xd6\
+\xd0\xday\xf5\x18cZ\xdd1r\xcf\xf4\xb6\x8b\x00y\
+\xff\xdeZ\xceN\xb6)h\xf0\xeb\xb7gf\xdb\x02\x89\
+$\x92h\xc9\x07\x9d\x811\xbc\xb5c\x1fz\xc0\xda-\
+\xbe*\xe1\xf0\xf0\xa0\xf44\xb3\x955\xbf\x15\xbbO\xc3\
+Fe\xc10V\xb6\x85\x85\xc2OB~l\xa6]7\
+r\xa7Y_\xbeO\x03\x15Y\xcf\xbe\xe6\x93s\xc9\xc0\
+\xb4\x16\x9e<\x1as\x95(\x97\x0d\xcf\x9a&\xcf\xad\xc1\
+B`\xd0\x84\x07A\x0a\xbd-l\x04\xfb\x95cM<\
+\xc9\x99FE\x22H\x0d\x1a\xf8\xa2c\x88\x0b F\x94\
+\xe0\xe8\xbb\xd0\xcdW\xb4\x19\xee\x89,D\x8c\x97w\xc3\
+\xea\x98w\x0c\x9c\x96\xa5\xf7,\x16\xc9\x0d\x187\xbc \
+\x0a\x86\xc3^\x0aJ\x0eX5#\xad\xcf'Y\x99q\
+\xbf\xc1\x8a\x858N\x923FM\x5cnh}\xe4\xf5\
+3\x9f\x1e^\xa7(\xc9\xee\xb1\xb2\x8fW\x9b{\x0d\x06\
+\xa7s\x85\x91\xc4\xe6\xd2\xdf\xc3>\xf1\x94\x8a\xc1o\xcd\
+\x9f\xfa\x0e+)\xb5{\xcd\xb8\xf6\xfbm\xc5h p\
+\x94\x95\xfb\x00\xe6c\x8cq\x97\x18\xa8\xb3\x07i\x1c}\
+\x86\xb1\xe9\xb7\x1bE\x5c\xe8\xcd\x12.?\xca\xe2\xc5\xe2\
+9\xe4\xa8.\xd3n\xeb&s\xf3\xfb<\x82(^\xa2\
+\x80\xfd\xc20\xff\xc7\xf5\xf5\xb5\xbc\xba\xbcr\x13\x1e\x03\
+[\xd3\xaf\x12\xdc\xa4\x9cT\x11\x10\xc8g\xef\x9c\xca4\
+M\xa1z\xe8\x92\xbf\x89\xd7W\x8b\xd0\xe0\x81*\xa5\x7f\
+\xa2 \x08\x8d\x8by\x9af\xff\x5c\xdev\xa7#l\xbd\
+\x1e\xfaM\xa06\xe1\xf5^\x0b\xf0\xb6C\x88\x89\xac\xe1\
+\x9a1\xf5/\x87\xef\x22\xed,\xb5\xb67B\xef\x9c\xb4\
+T\xd0\x95rhYM\xfe\x18&\x91\xb3\xb7\xc7de\
+\xfc\x97-\x9e\xa4*\xf4\x83\x8d`Ha\xd4\x90\x19\xd1\
+\x06U\x17\xb2:\x15SK\x08\x10Al\xe1X\xa9\xfd\
+]\xa0\xf4\xcaY\xf1\xab\xa47T\xaf\x89D~RA\
+\x98\xbf\xcb\xe6B\x85\xf0\x85\xb5!\x9a\xe3\xc4Q\xc5\xd5\
+\xd0\x8e\x86f~'\xfc7f}\xbb\x97\xe3\xcd\xda\x18\
+0sXb\x0bx\xa2}\x0e\x90\xb4\xfah)\x0b\xf4\
+\x05\xa6\xde\x8d\x82\xb3\xe4Fe\xa0\xd3\xb5\x06{op\
+\xad-\x07%\x14L\x9ay\xf7\xf6\x99\xe5L\x11\xdaL\
+\x9e\xb5(+d\x08\xa4\x03\x84M'(U\x93l\x22\
+9\x81\xae\x0d\x94\x84\x8f\x14\x1f\x8aD)\xfd\x12t;\
+\x10\xacR\xa6\xdaO\xa1\x16h\xa01M\x03\x98\x8f1\
+\xc6]\x1a\x9b\xb3\x14\xa4\xf9\x16M \x07\x22\x1e\x94\x1e\
+-N\xe6\xa1D\xcc\xa5\x5cHv\x18K\xc5@kP\
+O.\x12\xe5=\x1bE\x04&\xb4\xbd\xff\xcb\x8bK\xe1\
+\xcd\xae\x03\xe9\x10}\xc3\x17\xa4.P\xa8_K \x04\
+\x22\x1f\xbf}~\xe8\x05:\x14\xae\xc7\xabj\x9f\x01K\
+\xaf\xd7\x933\xb960\xce\xec[\xe7:a\x01\x9cg\
+\xb2\x16@\x8e\x02\xfa\xde\xe6\xacW\xfb\xf8\xe2\xad\xa3\xf6\
+Y\x08\x1a\x92\x10lr\xe8\x0c\xe9\x1b\xd1\xd8l\xab\x02\
+\xc0X'\x8au\xdfY\xcdr\x96\xd5\x14Ssw\xa7\
+\x8f\xc7\x5c\xa5\x04\x06\xf0~\xef\xe5:3oX\xd7\x85\
+\xaaw[\xa1\xf3\x04\xd7M\x87\xd0\xc0TI8\xaa\xf4\
+\xc4H\xa8h$\x0fm\x82D\xd0Q{\xac\x16\x14Z\
+3\xfb\xeb\xd9\xd9*#V\xa4\xb1Q\xe7\xe8\xa6S\x86\
+\xaa0>O\xaa\xe9\x14jG\xa7\xf6\xb0\xb89\x05\x84\
+c\xaem\xd1O\xad\x0f\xa7n\x94\x84\xcd\x17\xa2e\xe9\
+\x8d\x1bI\xb5od\xa4\xaa\x95\x5c\xc7Nc\xac\x8c\xb2\
+}~\xa1d\xf7:-\x95\xca%\xd2\xb2\xcf\xb5\xdd\x97\
+\x0b\xb3\x11BKl\xb4\xe8\x84\xed\x8fABR\xb0S\
+z\xc2\x9fK\xfd\xb3\xeezB\xf9\xb7\xf7#\xac\xed\xb9\
+2\xf6\xf2\x831\x1fc\x8c;6\xb6\xa7\x01\xf6\xc6\xb9\
+\xe7\x18\xeb\xc4\xbe\xabs\xe6G\x0b\x1c\xe2Y\xb9\x00\x84\
+\xb0\x80\x1b#\xd5\xad\x83\x8ap\x14\x1cE\x07@\xb7\x7f\
+_\xcc2\x96ev\x18\xd6\xb1\xc3[\xe9\xa1\xa3\xcaG\
+\xd3\xd6\xbf\xf7\xf8l\xf1\x98\x0e\x11\xc8\xfa\x1a\x98m\xd6\
+c\x5cu\x16_[\xfb{E\xbd\xa5\x1c\x00\xe7\xd9\xd9\
+'\x17\xb4Mp\x00\x1b\x0b\x92\x96\xc5\xbb\x93\xe9F\x0c\
+\xbb\xfb\xd6\x89\x1a\xca\xf9\xcc\x8b\xc4\xc6aW\xa6\xd9{\
+@\xbb\xb7\x98\xe0\xa1\xbd\x9ce\xa5\xc0T\xb9\xad\xbf\xc2\
+}\xf9\xd3\xbfx!\x7f\xf7\xdbK\xb9\xb8\xdc\xfd\xff\x96\
+1/\x0dyd^@!\x0b_\xd1\xa0\x98\xd6\x0f\x8a\
+\xde2\xc7[\xf7\x89w\x82\xd2`\x14\x09\xa8B\xb4Z\
+TF-\xbee\x925f\xdd\x05\xaa\xa3y\x86\x98\x9e\
+C\xa3\x87\xea\xdc\xbf\x84\xabH\xb3\xb6\xd3b/(\xcd\
+\xaf[\x9f\x93R(k\xf3s\xa2\xb2\xb3\xda\xae/\x9c\
+\x11o\xf0\x8e\x9e:\x06s\xe2\xa6e\x99\x8dM#-\
+\x81\xc1Z\xa0\xf9\x13\x0f\xf3\x13\xed\xb2+\x8d\xbb\x95d\
+/\x14\xd7\xda\xdb]\xf9\xa6\x17\xa9P\xb660\xff:\
+u\xd1`.<\xd2MT\xce\xd7\x96\x92\xa4\x94\xd6k\
+\xean\xfe\x22WI\x1a}0\xcb\x82\xe0\xbd\xd5U\x91\
+%\x10Y\x0f$4\xc6\x18wh\xa9\xdb\x9e\xba\x87\xb6\
+\x1f\xb9\x93\xb2.\x07\xdc7b\xda$\x9c\x14\xb8\xd3\xf4\
+\xb7 \x5c(\xebE\x0c\xc7A\xde\xb1u\x14\xcd\xcc>\
+\xe5\x9c\x1c\xeb\xb3\x17\xaf\x8e\x90f\xcc\x0b\x18t3%\
+\x22d\x83bv\xb4\x8f9)o?:_d\x10\x17\
+\xbf\x95X\x0eh<\x8d\x9c\xc2^,\xbf\x0cD\xa8\x11\
+\xd4VC\xf0m\xc0\xbe\x01\xe7\xc9j\x1e\x83\xcd\xb9\xc0\
+\xae\xbam\xf5\xfc?\xcc\xb6q\xbb\xb7\x14@S\xeci\
+\x060\xda\x96\x7f<\xc6\xca\x80\xb94x\x13<$E\
+g\xde\xa4,\x13Dn\x14e\xba>9\x93_?\x83\
+\xfc\xbfO\xafd\x83+\xf9\xe8\x1c\xf2\xc1\xe3\xb5<\xbe\
+\xbf\x96\x93\xcd\xf4\xdd\x04D\xdd\xf9\xd1\x10\xae\x96~Q\
+\x09\x89\xe9\x8b~\x95\xec\xd3\x92\x14a\xcbH\xc0^-\
+\x1dI\xaf\xaf(m\xa3\x1f|\xd2\xe8\x0c\xa6\xe8\x89\x80\
+\x0a\x9cB\x86}m>\xa5m!n\xfd,\xc9k\xe9\
+\x04-\xc3\xac\xc2#N\xab\xf3\x01\xa26\xa3\xc5\xa6Q\
+\xcd\x11VS\x0f\xfd\x1aiu\xadu/\x09\xc8\x15\xc9\
+\xbdF\xab]%\xb2iS\x85\x0f\xb5\x07\x14\x05\xcc\x97\
+cQ\xac7\xb3\xa4hHk\x98t\x0f&e\x96\xe5\
+x\x9bU\xc2>\xb85\xa4\x08\x12\xda^\xe7\x07\x9bz\
+\x17\xc7\xcdA\xbd{\x99\xb3U\xa1g\xb5\x11=_\xeb\
+\xfb\xd4\xc6\xd3rOk]\xbb\x02\xfb\xe5H\x19lC\
+uA\xd8\xdes\x00\xf31\xc6\xb8Kcs\xda\x07S\
+a\x92\x8fL\xf7-\xd5(\xfd\x80\x193\x11\xf6\xdd\xc5\
+\x97^\xc3\xbd\xd0\x91\x00\x11\x0ep1-N\xe8\xfe\xfd\
+\xec\xc5+\xb1\xdd\xa1\xecS\xc4\x09\xa4\x94L\x9f\xac\x83\
+y \xf2\xee\xf9J\xceN7\x0b\xa0r\x01\x98\x1e \
+\xd8]\xbfX\x8b%?\xba\x90\xd1\xa0\x14\xfd\xc4S\xe1\
+b\xecQ\xf7\xfd\x12\xab/&\x84Q\xbd~\xfe\xe0\x01\
+\xc7\x94\xfa\x82\xb1m=Sd\xb1\x10`\xa7$\xe82\
+\x81\x80*\x0cT\xf4\xb6\xaa(-(g\x0d\x1a*\xac\
+9\xdc\xb5\xdd\x9e\x9c\xca\xb4^\xcb\xcd\xd5\xa5\x5cQ\xe4\
+/\x9fQ\xfe\xf2\xd9\x95\xacp%\x1f\xdf\x9b\xe4\x83G\
+\x93<y\xb0\x91\x93\xed\x8f}S\x9ay\xbf\x86n\x8a\
+\xd3&\xf0T\x0e\x82p\xd7\xdf4\xe6E<\x1b\x9f/\
+\x1a\xd0\x03\x072i\xe6D\xd8\xc6C\x1d\xfd\xa9\xf0\xf5\
+\xfe\xdfH\x12}\x13U:l\xd3k\x10\xf5\x91\x09\x89\
+\xc2V\xa2z\x0c\x08q\xaf&\x95\xa3\xaf\x96\x8cI1\
+\x91T>m\x1e\x90h\x17\x13\xd9\xdf\x02\xbe\xf5\xee\x02\
+\x0c\xfb\x0f\xb7\x03ZIl\xef>B\x0f\x813\x87\x97\
+\x84\xad \xdd\xae\x9fD\xfd\x88\xde*a\x84\xb9\xc5\xd2\
+\x125Q\xd6\xb5\x8a\x97\x94\xd4\xde\x06/\xd4\xf9v=\
+\x10\xf0l\xbd\x0ab\xf2\x05\x00K\xe2\xacj\x1anu\
+%\x94'\xba\x17d\xb2\xee\x00\x0e`>\xc6\x18w\x0a\
+\x98\x9f\xa8G\x15\xdd\xb9-\xcd\xfa\xc4\x11@|\x110\
+:k\xab#z\xfbz\xf0\xef0*=\xc0j\x8b\x0d\
+vI\x0ca\xea\xd8\xedv\xf2\xcd\xf3W\xa2\x15\xa7\x10\
+\xdfx\x88\x80\x80\x9b\xcb\x89\x0f\x16\xb2\x9f\xb1h\x90?\
+z\xb8\x95\xcdz\x95\x1c\xc4\x91\xe0\xfc\xe8\xeb`\x17\x0b\
+\xf25^*\xfd=\x1eD\xe4y\xc6\xaa8?\x99\xa5\
+\x9fYvti)\x8d\x14\xdf\xc7\x16\xf1\x9e\x0f\xe1\xb0\
+\xbb\x00<\xe2t#\x89\xec\x86f\xdb\xd0\xd2\x19a\x92\
+@\xf7\xff\xd6\x8c\xb9~\xaf\xd5f#\x9b\x93S\xb9\xb9\
+\xba2'\xe1FD\xfe\xea\x05\xe5\xaf\x9e\xdf\xc8v\xba\
+\x96O\x1f\xac\xe4\x83\xc7kyto%\xeb\xd5\x8f\x8f\
+F\xaf\x8ca\xe8\xdf\xd0\x08;\x01m\xce^\xdc\x1b\xf8\
+\x84\x9e\x04\xc6\x02\xbf\xb1\x90>X\xa7\x91\xc5\xfa\xbb\x0d\
+[*I\x88>\xccZ@8\xfa\xb2Hr|\x01P\
+\xee\xab\xdah\xa8{\xbe\xd94\xcd\xf5\x1bT\xad?\x19\
+\xe0w9\xa9\xcaE\xa4\xc6\xda\x1b\x9c\x8d\xe6}\xae\xe6\
+\xbez>\x91?\x18H\xd0ib\xc6\xe2\xd8w{\xb4\
+m\x17!\xb1\x17,\xac8\x93x\xdeY>\x04\xc0\xca\
+S\xfc\xa2\x13\xaa2\x98\x0fPO%!zs\xa2\xf5\
+\x16\xe89B\xe9\xed\xeb\x87d*Q\xa7Z3\x8c\xfd\
+m8g\xad\xa0'\x11\xb21$\x9c\x1a\xcc\xcd\xa5I\
+\x87Ta\xdfY\xb7\x08\x060\x1fc\x8c;\xb4\xcc\xcd\
+\xc0<\x02m\xe4b\xba\xfe\xebxg\x0a\x1cG\xe2\xf6\
+\xc1\xffq\xbf\x8d[\x0a'*\x87\xa4\x16o\xeamQ\
+\xe6@K\x13ZW7;\xb9\xbc\xbcJ\xb5\xd4v\xc1\
+JBNz\x9f\x0a\x12\x1an?z\xebT\xa6\x09^\
+)\xf2Z\xe0\xf9h\xd0\xf3-^_'\x02\xea3\xb2\
+\xc4\x8es\xe9\x84,\x94#\x19\x81G.\xfd\x82\xfdm\
+\xcd\x92w\xb1va\xb7u#\x1e\xed\xe2\xd6\xc0\x10\xab\
+\xfb\x01\x1d\xef\xc9\x19h\xc1\x15$\xfa\xc8\x9a\xaf\xf9\x1e\
+\x94\xc3Uk\xebi%'\xf7\x1e\xc8\xab\xe7\xcf\xe2\x87\
+\x9d\xffy\xb9\x83\xfc\xf9\xd7;\xf9\xf3\xaf/\xe5\xe1Z\
+\xe4\xa7\x8fW\xf2\xde\xe3\xb5\x9c\x9f\xaed\xc2\x8fc\xbe\
+\x22)\xe2\xb8I}\xb9<8\xae\xbb\x14\x84r\xc1\xb0\
+\x9e\xf7p\xd6\xa8\x15\x12\xd3\x82fjD\xaf\x8a\x03V\
+\xd6[\xb1\xa6\xba\xb1S\xcd\x91\xf9\xbd\x86\xe4\x96E\xce\
+cT\x0fjuh\xea\x1e\xd7\xcf\x83\x99\x85*\xd8\xd6\
+\xef\xa8\x92B]\xe5\x89\x16b\xe0K\xf7\xe0|\x045\
+Q\x1a\x90_\xdcf\xa4\xe3F\xcbR` \x89e\xf3\
+\xcd\xf4t`\xdd\x06\x0d\x05\x09\x13\x93s\x98\x9dL\xd7\
+\x17R\xf7\x17\x0c\xa3\x0e\x85\xad\x19\x003T\xf1\x07&\
+lv\x22\xf3\xc9NoS\xdc\xc0\xc9\xa8\x8a\xaddK\
+\xbf6E\x99\x96j\x85\xbb\x8a\x06\xfcW\xcd;\xec\xf9\
+\x1d\xc0|\x8c1\xee\x10\xfd\x84\xd5:\x81\xae\xb8\x05\xf4\
+E\x0e\x96\x99\x80m$\xaf{\x00\xc0C\xe9\xe8\xf2\x9f\
+;L\xb5\x9b\xc4La\x98\x09!\x88\xe8y\xc1\x5c\xe6\
+\xe2\xf2\xb2\xca \x8cf;\x15\xdf\xc3\x9c\x13`\x01\x94\
+\xbbh\xf7\xf7\x1e\x9f\x06\xa0\xdc\xfe\xfd\x1d\xb0\xe6\x09\x0e\
+\xd5\xac\xfd\xeb\x82\xff\xf6\xbb\x96\xf3\x0a8Y\x9c\xdd\x9d\
+>_\xeesB\x0e\x81n\x91\x9e\xf2\x5c\xbbF(<\
+\x1d}\x98\xdd9\x86\x02\xda\x09\x89\xde\xad6\x10?\xad\
+\xb9\xbd\xb4cKe\xcb\xa55\x81\xae&\xc8\xca\x07\xac\
+\x00rrv.\xdd]-ZM\xc677\x22\x7f\xfa\
+\xc5\x8d\xe0\x8b\x1b\xf9\xe0\x0c\xf2\xe9\x93\xb5\xbc\xfdp-\
+\x9b\xf5\x9b\x89\xd0+\xec\x03\x8c\xc75t\x7f\x861\xab\
++\xa7\x85\xee^R%t\xdd\xbd\x80{\x06\x10\xfa\x04\
+\x0c\xff\x10\x98[\x9bH\xe9\x88_\x11\xa1\xea\xc7\x10'\
+\x87\xa1\x05\xf9P`J\xb2\x9d\x81\xd8\x8bSA:\xdb\
+\xef\xeb\xf2\xa4$E\xc6]\x01\x09\xeeQ0~\x87t\
+\xcfc\xd1\x92\xd8\xb3S\xd9u\xc7\xee\x97\x13\x1aM\x04\
+P\xcf\xbf-\xa4t\xe2\x82\xb2\xb5\xac[\x12\x9a\x15\x87\
+\x9dU@\x05\x91\xdb3B\xb5q`fd\xf5\x5cW\
+\xb0\xad\xc0\x7fR\xd5\xcc\x8f\x97\xa7]P\xc3\xae\xea5\
+3\xe4\x96\xb7\x90Q\xe73\x09W\x02\x935M\xf7\x5c\
+y\xb9\xbc\xd6\xcb\x1bM\x16\xeb\xf5\x82k,\xcaD\x95\
+\x03\x98\x8f1\xc6\x9dY\xed&\x1b\xf5\xedf\xaf8\x05\
+a\x91\x89\x96\xe4\x81\xef3\xe8\xb6\x89\xa9\xcf\x91\xf6@\
+\xb9\xd7\xe6-\x91\xf0NS\x18\x98~\xbf\x988\xf0\xe8\
+\xbetuq\xd5A\xb6\x09\x93d\xbaT\x97\xf9\x7f\xe3\
+V\x03\x91wT\xe2g\x0f\x9c\x1b\xc0rk$\xedT\
+\xaa\xc8A:y\x0b\xa0\xde\xed\x0c\xee\xf3\xe6\x5c\x02\xf8\
+\xea\x07\xb8t\xf2J\x11W\xc0\x80xMz\xee\xe4\xee\
+\xc19\x18\xe5,`\x1aYb\xafER\x1b\xf9\x22\xa0\
+5\x89j\xcf~V\xe0\xa6\x1b@'\xc4\xfbnsz\
+\xe6l\xd1t\xc3\xa2\xabt\xe6\x03 )\xbfyI\xf9\
+\xcd\xdf^\xcb\xfd\xbf\xbb\x96\xdfy\xb2g\xd1\xcfN&\
+y\x93 :\x1d;h\xe7\x10\xb6\xf3\x8a\xe4&\x92^\
+\xbf\x0b\x13\x96qv~)\xfbW\xea5A\xdd\x05,\
+V\xa6fa\xb8Uys\xefY\x8d\x10\xe2\xce\xe5\x9d\
+4\xf4\xe9\x11\xc3\x1c+\xd7\x17h\x08\xaew\x09\xbc\xcc\
+\xc14\xb9:\xcd:\xa2&\x9c\xa6!\xd2\x1dU\x87\xb1\
+\xedO\xde\xb34\xa4\xea\xb3CW\xa65E\xd1g\x01\
+\x89\x85\xa26\xd2\x0d\x96\x8c\xb1\x98\xd9[jj \x9b\
+\xec\xf4\x86\x89b\xbe'\x8a\xf6^|Q\x91%x:\
+\x83\x17\x13\x1d\xddo\x94\x0aM\xacn\xf7%\x9bb\xeb\
+\x8e\x8dide\xba\xe84\xe5W;\xb8\x01\xcc\xc7\x18\
+\xe3\xae\x8ci\x12 I\xfd4\xf3].\xc7@\xbf\xfb\
+2\xf7\x7f\xa6\xb7kB\x1e\x1d\xe7\xe7\xf4d\x02\xc3\x02\
+\x97o\x1c[4Kv\x8c\xb6\xa6\xd3?D\xd3\x0b\x04\
+y\xf1\xea\x22\xb7\x88Dc\xc7r`\xa0\xbd\xca\xb5_\
+\xa2\x83\x06\xd8'@>\xbcw\xea\xa8\x5c{<\x96\xfe\
+z\x1d\xee<[\xb4\xf3\x05\xea6\xe0\x9c\x0b\xdf\xd1\xdc\
+\xa6a\x16\xb9\xf4b\x96\x9b:\x5cjt\xc0\xf3-\xce\
+O\xf6s\x91\x89\xd7G\xa49P*\xbc\xdc\xb6\xc7\xc1\
+VJY\x1b\xcd\x96\xa6X\x9b@\xa7xA\xb6''\
+\x96\xb6\xad\xcf\xd4\xa4\x84\xa9\xe1A\xad/\xf1\xfcF\xe4\
+\x7f\xff\xfb\x1bY\xfd\xfd\xb5|\xf6p\x92\x8f\x9fl\xe4\
+\xe1\xbd7I\xe6RX\xd3Yb\x04\x1c\xbc\xa8U\x86\
+\xe4g\x0c\xaf9\xaf\x85\x13\x1d\xdb\xbe\x87^SV\xc4\
+\x99\xe9B\xb1\xf5\x06HQK\xb7U\x8d\xceN\xd3t\
+c\xf1\xe9\x9e\x97&\x11A\xb2a\xd2t\xe9f\xc6\xce\
+\xdc\x99\x96H\x11\xba\x10#\x88)!\xb2\x02\xa11\xe3\
+\x08k\x04\xe9]o\xac\x03\x92\xff\xec\x95\x94\xa7\x07\x97\
+\xf6<\x16p\x5c\xd9o t\x04\xa0\xb2\xc6\xf9\x94\xa7\
+\x83\x9c\xbc3\x93(=}=(\xb2\xb3&\xaa\x17\xa8\
+\xf6\x9b\xac\xbd$^,\x0fP\xcd\x14\x08\xd9p\x12(\
+\xa7\xd6$K_\x0096\xde|\x97H\xa47P\x8d\
+\xf5\x8d\x08\x1a>\xe6c\x8cqg\xd6\xb9UtAI\
+\x01\x1a\xc2\xbf\xfb\xa4\xc8a\x97\x10t\xcb\x7f\xbf\xd8\xdc\
+\xce\xfa\xd0nU\xca\x82\xf8x\xf9wC\x8b&\xecL\
+\xf8\xf2\xe5\xc5\xe2+\xb1\x03\xf4\x91\x14\x13\xf0\xfa\x95y\
+\xdc_\x8b\xdc;\xdbJ/L\xa9\xfe\x8d\xa5#\xc1\xed\
+N\xdc\xc2\xb7q\xdb\x97\xea\x1e\x1b\xfb\xef\xd1a\xcd\xfb\
+\xd5\xc3\xf2A\xe4.\x1b\x1dFu\xf1\xa5\x10.@j\
+\x0c\xb2@\x12\x9aW\x83}\xb6L8\x96\xa0z\x9a\xfb\
+\x0b|\xb2=\x9dw\xb8\x10\xabh}\xb3vn\x8c\x02\
+\xdbn\x04\xf2\xff<\x15\xf9_\xfef'\xff\xe6\xaf)\
+_<\x13\xd9\xf1\xeeOW\x16\x9c&\xb7\x94N\xe6t\
+\x9f\x19\xe2\x9c\xbc\xd9`L\xa6\xcd\x8d\x8e\x83Z\xfd\xcd\
+Pnj?n\x84\xf9`\x96{xG+&\x97J\
+\x01\xd9\x8c1\x16ft\xee\x0c\xda\x98\x89\xb8\x90\x06\xb3\
+\xa5\xf7\xa9Kkcxb\x99$\x81\x8ah\x8fqk\
+\xdf^$G\x1d\x97\x19\x13R\xd7:>i\xe6\xc3\xf6\
+7\xa5\xf9|\x87\xdd\x87\x80\x99i\xbb[\x8cW)[\
+Alq\xac\x01\xe2\xf0\x92\x1e\xe4\x06\x88A%e\x8a\
+fd\xf6\xe2U\xc2d\xf6\x0aJ\x7f*\x93\xf2\x07\xed\
+\xe7\x03ME\x17\x92\xa1\x97>\xc4\x87%\x9b\xbb\x060\
+\x1fc\x8c;\xc3\x98\xaf\xea\xca@g?\xb5\x84\xa3\x80\
+\x03?s$~\xd2\x002M\x98\xc7\xe1\xb8\x98\xf40\
+*\xa8\x89i\xa4\x90~\xf2\xe7R{\xa9\x9e@\x9f\xbd\
+\xb8\x88G\x8f\xdc\x1d\x06\x0b\x009\xa4\x96\xaa\xd8\xfb'\
+g+\xd9lV\xfd\xa32\xf3-]\xf3\xa8XV\xfa\
+u\x11\xb9X9\x08y\x08x\x1e\xf3\xaa}\xcf\xf8^\
+\x93X\x94\x0c\xf4\xdf\x8bY!\x86~x\x14\xd2\xe2\x0c\
+>sf\xa1\xe5\x00v\xe3\x03\xf1>E\xf2\x22^'\
+\x5c\xdew\xaa\x81C\x08\xe2\x9f\xd5J\xdd\x0f\x98\xe6\xe5\
+T\x01\xf5\xf2\xef\xba\x1b3\x85;}\xff\xadI\xb0\xde\
+\x88\xac7\xf2\x9fn\xd6\xf2\xaf\xbe\xdc\xca\xbf\xfdO\xa7\
+\xf2\xe5\x8b\x95\xecx\xb7\xe9s\xaa\xe7-\xcc!,n\
+*\xfev\xa3\xd9\xf9)\xf7p\x9e\xb89\x03m\xaa\x14\
+\xde\x02\x0b\xe1\x1a\xf9\xa8\x8b\x01\x8b\xc9L\x01\xe6\xc1\xfc\
+\x0c\x0eY=\xcc;\x86\xa2\xceF\x91\xd2<\xcf\xf5\xb3\
+\xdf\xfa,)>G\xbei\xc6\x93\xa7\xabD?2\xb1\
+\xa0\xa2=\xe6\xa6\x94b\xb0\xad\xea\x05\xe1\xb4:\x11\xdd\
+g\x9au\xf7\xa8\xb9\xd1\x14owKK\xb72!d\
+7\x81\xc6\x87\xdd~\xfe\xe4\x01VEA\x1a\xf0S\xa3\
+\xec\xed\x9c\x05\xe3\xe9\xaeg\xff,n\x99\xb5\xcfF\xef\
+\xc2\x18{Vw\xe5It\xe4X\xed5}\xddUS\
+L}\xc1F7\xab\x86u}\xde\x99\x99\xc7\x90\xb2\x8c\
+1\xc6\x9d\x01\xe6\xebE\xf0\x90\xb2\x8fn\x8e\xd7:Z\
+\x91,\xe5\xf30(\xef#\xcf\xa3\xc9\xd1\xc4\x07\x98\x01\
+\xc6\xbf\x1e)hA\xe4n\xb7\x93\x97\xaf.\x8d\xc6\xd3\
+\xfa\x03\xe0\x08/\x16I\xed\xae\xf4\x19\xf9\xf8\xf1\x89L\
+8\xe4\xcd\xe7\xe7b\xcd\xd8\x95\xc4=\xeb\xae\xac7Q\
+\xd3\xc8k\xf7\xc2P\x09\x97\xe4\xb7\xb0et\xba\xe8\x5c\
+\xdf\xddsGiH*\x80\x18\xf7{\xc61\xa5wH\
+\xfe\xb3\xd4\x90\x10\xb3r\xb6\xf7b\xf7\x94G/i\xb1\
+[\xef\x81\xbf\x8c\xd9F*\x05\x94\xa6!4p\xa3\xd3\
+\xca2\xe2\xe80\x82\xe1\xa0M\xe3\x88`\xb5\x96i\xbd\
+\x96i\xbd\x92i\xb5\x92\x09\x93|y#\xf2\xe5oO\
+\xe4\x9dg\x94\x9f\xde\xbf\x92\xc7g\xd7wP\xe2\x12\xef\
+b\x91\xc9\xd8\xf4\xf9\x82\xc8\xcc\x02^\x9e.\xec\x14\xff\
+q\xa7\x8e\xda\x93\x1b\xcd\xc5\xc949V)\x86\x0a\x7f\
+\x11\xe7e.bYbd\xa1=Ts\xaakl\x86\
+C\xff\xd2X\xd6\xc02h\xf5E\x96\xcd\xe0<\xd9\xeb\
+\x0e\x02\xd5\xe7\xd3b\x8dY\xb3nw\x91`\xc4\xd4E\
+\xe3\x0c\xed\xc7\x9dX\xdf \xd1\xddgsv\xc6\xbaP\
+\x93\xe9T\x96\x83N\x9aS\xe6\x01\xe3@B\x0b\x9cu\
+\x88\x11Tw6z'\xcb\x1d\x5ck\xbaT\x9d\x95j\
+N\x8a\x9f\x10*\xf3\x0a1\x90\xcf5\x03[<\x9e|\
+\x1d\x08\x1e\xfdbzm\xe2\x02\x9e\xd5\xde\x831\x1fc\
+\x8c\xbb2VkY\xc2\xc5H\xd1\xac\xf3\x0et\x0d\x8f\
+\x87\xd0/\x04\x87(\xea\xa3<VbXi'\xc0\xe7\
+V\xfc\xf0\xa1\xd8{\xca\xf5\xf5\x8d\xbc\xba\xbaN\xc1#\
+\xfd\xf2\x92\xec$\xc0\xef]Z\x9dK\x05f\xef<:\
+9\xaefP\xd1\xd9H\x12\xf4J\xd2(U\x01\xc1\x83\
+\xc6\x85\x19\xa3\xdd@\xe3\xb1\xf8\x1c\x0b\x15T\x00\xb3\xcc\
+\xaf@\xb6\x07\x81\xceyw\xa8'\x94}\xddfdv\
+\xee\x17D\x09\x17\x8f*\xe2\x02/\x97<\x03\xcd\xbb\xdc\
+\x7fw\xc2\xde\x95\x05p\xf7v\x91\x9e\x95\x86ms\xff\
+(\xa6\x5c\xb3\xe4\xaa\xb9\x1b\xd3$X\xafe\xda\xace\
+\xdald\xb5\xde\xec\xc1~\xd95\x03\xe4\x8b\xebI\xfe\
+\xf5W'\xf2\xef\xbe8\x97\xaf^\xad\xe5N)\x5c\x0a\
+\x93Z\x00/\xd1\xd8B\xea\xe0sj\xec\x1d\xa4\x19\xe6\
+\xf1\xcb\xeeF&\x81U\xc1\xa9\x84\x0e(\xa2\x01\x1e \
+/\x90\xfc\x14\x0aw\x7f\x94\xac\xf8Y\xb2@\xaf\x0d\xd6\
+\xd7\x16\xb2<\xe7\xbad\xd0\xf8\xed\xe2$\xe2D!\xa9\
+]_i\x8a\x16{^\x0b\x83n>6\xd3'\x82\xfe\
+\xf9\xd4\xfc\x89\x96\x93H\x16\x16f\x0b3M \x9bI\
+\xd5/C,\xce/\xc9,R\x12\x99\x15\xa3\xce\xd2\xa8\
++\xb4\x85;YEOL\x16J-\xb1\xd1sR\xdd\
+)q6N\xad!\x97F&\x04\xe4]\xe4\x95\xcap\
+^\xbe\xd5\x0d\x07\xee,S\xfb\xba\xf6\xbc\xe5-)3\
+\x80\xf9\x18c\xdc\x95u\x0e\xd3a\x923c\xdd\x98O\
+\xbbH&\xd1\x88>x\x90\x04\xee\xb3\xe56\xd0\x82)\
+C\x18\x03\x15n\xcf\x8e\xf7Q\xf0\xd5\xd5\xb5\xecnn\
+\x8eC\xa5\x88'\x93\x9d\xf7k[\xa2\xfb\x89\xfe\x9d\x87\
+\xa7\xc9\x8b,\x5c(\xdd\xf5\x9aX\x0b 4D\xa2s\
+\xc0}HL\xbf\x8d\x0a\xdc\xaa\xc4\xd1\xd5J\xb8\xc2\x0b\
+Bv\xa4\xde\x86I\xb1\x13\xeeUv?\x1ey\xab\x8a\
+-=\xa8\xb4\xc9Y\xbf\xaf\x12\x8f\x03\xbd\x22\x05i\xd0\
+P\xd6\xb7\x01-Q\xd1\xe0\xdcKV\xea\xcf(p>\
+\xad\x04\xeb\xb5\xac\xb6[Ym\xb6\xb2Z\xafE\xa6\xa9\
+\xbe\x19K3\xe5\xfc\xc6\x7f\x7f\x05\xf9W_\x9e\xc8\xff\
+\xfd\xe5\xa9\xbc\xba\xbe\x1b\xcbvq\xc4\xa0\xba\xcc\xac\x8d\
+z\x0c9\x00\xd5\xf3\x99\x8c\xc5\x98a\xbb\x9d\xa3\x14r\
+q\x1d4\x904(\x0c\xcd\x92\xd0\xc8BJ\xb3wl\
+\x08\xa7\xc1qv\x1e\xdd+\x1a\xdc,\x06&?\x9f\xdd\
+u\xcc\x8b\x09\xc6\xe4M\xd0\xde\x97\xda\xe3::\x8c\xd0\
+6\x97\x82Nb\x01\xd1\x0e\xf3\xde\x1d\x04\xb4\xce^\x94\
+\x16z\xa4\x13=\x91\x05\xbb*\xdbD\x0d\x98Y\x13\x7f\
+\x998<\xaa{\x80q\xf7(\x82oUH3\x91\xdf\
+\xcc7\x1b\xc2K\xb1\xbd\x87\xdfY\xeb\xc8h\xaa\xf5\xa2\
+c\xe6i\xfcT\xfd:\x9a\x0b\xfd\xb4\x1d\xa4\x96\xc4\xa1\
+kG\x8c\xba\xb3\xa1O\xee\x00\xe6c\x8cqW\x06w\
+\x87\xc8\xd8\x1c\xa5\x03\x8e\xfd\xce@{\xd4\xfb\xa6\x8dt\
+\xfee\x17\xf5\xe94\xac\x09\x16\x9a\x0bq+\xbc\x85\x04\
+\xac\xc2\xc9S\xf6\x93\xe9\xcb\xcb\xcb\xda8\xe6\xa6N\xa3\
+5\xaf[\xd5\xc1z\xb11\xa1H\x1cc\xcad\xff\xf0\
+\xde\xc9\x91\x05\x83\xb8\xbczq\x86\xd9\x1a\xfbZOu\
+\xcdQ-\x03t\xbb\x8d\x0e`\x11 \xf8{\x08\x1df\
+:J~\x0eUl\x9a\x89Fd Cq\x87n\xdd\
+\x85h\x13\x9cJ\x0aBy\x03\x87\xec\xd3\x82\xe1vr\
+.\xfftTi\x8b\x02\x9a\xf4\xdar8\xddB\x05\xe2\
+\x12@:\xa6I\xa6\xcd\x0c\xc87[\x99*(\x9fT\
+\xb6\xaa\x07\xf6\x90\x1d \x7f\xf9j%\xff\xf2\x8b3\xf9\
+\xcd\xb3\xad\xdc\xfcc\xea\xcf\xd1\x92\x17\xe3\x0e\x1d-x\
+\x97\xcc\xd9\xbeC\x00\x90\x81\x89\x84\xa1r\x0d4U \
+\xc9\xdd\x8f\xb3\x9d\x9e'!\xf6\xd2\x10\xaf9k\xf2\x10\
+=\x7f\xd4yU\xd0\xfc\x00\x00 \x00IDAT\xf9\
+\x81\x8d\xbf0?I6\x99\x89\x9f\xa7\x5c\xb8\x8dM\x0f\
+@`\xdf\x1b\x03k'(*\xcd8\x93\x9a\x1an\xae\
+/`\xdc\xca\xe8DIHJ\xe1\xe4\xe8\x13\xda\x02\x97\
+\x92-!>+\x02a\x8e\xaek\x11\xdd4R\x0b\x19\
+\xd6\x8d\x08\xcd&\x97]+&\xeb\x0f\xdc:\x06\x15F\
+\xe4\x0b\x86\x96\xbaj\x19mv\xbb\x97P\x8b\xc5h\xef\
+\x8e\xbc\xa8\x12\xd3&a\x7f\x86\xee\x1e\x91\xb6\xe3\xc0d\
+'\xb0\x16W\xb5\x98\xc1\x00\xe6c\x8c\xf1\xa6\x00\xf3\xd7\
+\xb2\xdd\x8bdf\xd7\xa6\x10\x06\xf8v0\xe2q<\xac\
+c\x09^+r\xb4N\xda\x05\x10\xf5,\x19\xaf.\xae\
+\xe2\xe2\xd0a\xbe2v4\x93\xdaD\x0cMypo\
+\x1bc\xa3o\xc3\xd0gx\x1e\xe2 \x07$\x8aC\x18\
+g\xfe\xcc\xf3\xabKm\xc7{\x88\x07\xafC\xb4\x84\x5c\
+\xfc\x8cI\xf5v\xec\xbd\xda\xb5Yg\x0f&;s\x88\
+\x8a\x07\x10\xb0\xf8AG\x1aD\x00.\xd2\xb4\xa6&x\
+H\x22k\xbe#g\x00.b\x9b<\xb3V\xe6\xd9R\
+p\xb5\x92i\xb3\x95\xf5\xf6DV\xdb\xed>P\x0c+\
+[\x84\xd4\xd7\xb4\xf7[y~_\x11\xf2gO7\xf2\
+\xef\xbe8\x93o.\xfe\x11\xdb\xc4\x80\xbc\xd1\x0d:\x01\
+R\xff\x7f\x01\xf2LA\x0dgIE\xc8\x9ad\xbeS\
+U@\x0d3ep\xf0\xbb\x17\x1d.)!h\x8d\xec\
+\xdf(\xa5\xd7@\xf7)\xd0\xb4\x1f\x8a\xdd\xad\xf4\xfd\x11\
+-\x89R\x94U\xa7\x81\x99\xe1\xe1TT5\xb5G\xb7\
+\xba\xa3\xa0\x83\x7fb\x93gx\x8c\x8c\xfe>\xde_\xfe\
+\xa2\xb0\x00V\xb7+Q3\x1bB=D\xe3Phw\
+k\xb5g\xb8s\xdd\x02\x92\x92\x0d\x0dL\xfb\xdd\xb5\xd0\
+T\x1b.W\x98\xa7\xf59\xa7/\xf0\xbcKM\xfd|\
+JF\x9367\xb3\xb3\x96f\x14V\xde?A\x15\xee\
+\xa4\xbf;\x80\xf9\x18c\xdc\x19`\xceE\x08\x03\x07L\
+\xfap\x1c\xb7S\x03\xb8\x89\xbd\x87\x9c\xbc\x97J\xc0 \
+\xfd\xf2\xe0\xa8o@\xb3\xc0\xe5E\x13y\xb5\xfe\xfc/\
+/.sL\xef\xcf\x1d\x0e\xa2\xcbD\xf3\xbag\x846\
+\x13\xe4\xfct\xfbz\xdd\xaaYz)z\xf8\x9d\x07\x94\
+\xf8\x19\xd2\x87\xbb;\x14H%\x17>\xed\xa1\xcb\xad\x9c\
+C\x96\x005;LsF\xa2\xc6\x94\x96T'\xab\xdf\
+\x1e\xf2\xfa\xac0\xfbOO\xfe\x94D\x97\xb3\xf6[\x89\
+D\x8b\xbb\x9d\xfaE/_\x11+a\xc1$\x98\xd62\
+m\xb7\xb2:9\x95i\xb3\x91i\xb5\xda\xcb\xd7j\x83\
+\x1b\xcc\xf5l \x1d\x81\x91\xa7L\xf2\xc5\xf5$\xff\xf2\
+\xcbS\xf9\xaboN\x7fp\xf7\x96\x0ar2 \xc2\x06\
+\x16\x81\xbc\xc0\x02#'\x0e\xa5\x9f\xd6\xacx\xed(\x14\
+W/\x12\x81\x9d,R\x15!C\x1d\xae\xd5\x1e\xe6\xde\
+\xf0\x9ac\x05\xd8Y\x0b\x03\xfb\x00#\xec\xd6X\xbb@\
+(]qe\xf5M\x8e\x83}\xbf\xea\xb1\x8d\x98LL\
+\xd04\x1b\xd2\xa3g\xb7\x95\xcaNA\xeb\xbd\xd2-\xd5\
+\x8cT\x01\xe6\xe7w\x1a\xdfw\x1a\xbb~\xf5i\xa2\x8e\
+[$oo\xaf\x9d\x97q\xe3\x03z\x9bB?\xb5\xba\
+\x96\xa0\x03\xb9J\xc2c[\xe7\xb3\xd5\x11\x0e\xb5w\xdc\
+\xa34\x93\x8fb\xb7\xc9t>\x84I{\x8d\xf7\xb8$\
+KA;\xf5\x1c\xc0|\x8c1\xee$0_Lv\x89\
+z\xc5N\xbcD\xee\x98\x88CL%\xbb?\x9f\xb2\xa9\
+\x92\x11\xd2\x19\x8b\x94\x83:\xeb\xea\xeb\x01\x13s@k\
+\x89\xa9\xd9\x91\x85}P^,\xb2\xb8\xc0\xd4\x8aW\xc2\
+\xda\xe3y\xfbl\x92\xedz\xd59)\xaf\xe9U\xc8\x0c\
+\xa4\xa3\xd7\xf7\xb8\xf0\xc2ek\xd5\xfb\xd2\xdc\x02\xb9.\
+\xf6\x0a/x\xd7w\xbbj\xf3\xc5gY\x19\x83Nq\
+\xc7\xc3\xe7\x93\xfd2\x16\xc0A\xd2\xff\xf8smo\xbf\
+\x9b\x9b\x1b\xb1\xae,:\xb9\xd7\x9a\xdbc\xbd\x96\xe9d\
+\x0f\xcaW\xeb=(/\x80\xbb\xa4CZ\x80\x9eT\x0a\
+\xb3\xf6\x5c\x03\x86\x9d@~\xf5b#\xff\xe7o\xcf\xe5\
+\xe2\x87\xd2\x9e\xeb\xf9\x82}\xebQ\xb0\x81\xa5\x12\xd4E\
+\xcd\x06S\xf9\x90\x1b\xdfw\xfd>\xb4Vz\xba)q\
+f\xb2\x8d%#K\xb8O\xffQM\x1dh\xd5{e\
+\xe1>\x11T-\xf9\x95rn\x5ct\xf2\xae\x8e\xbbO\
+hxQ\x1aez/vZ\xa0\x98\xba\xf9%\x00\xb7\
+\x14\x07D\x84\xeb\xbe\xe1;\xab\x9ci\x8agT\xf7\x17\
+\x80a1\x81rmj\xf7\x02\x8d\x5c\xa6\x12\x08\xecY\
+%\xaa\x90 0=W\xa1(\x93f\xf7\x98\xb4\x13%\
+\x0c\x00M\x91\x18^\x89\x1d2\xa3\x16\x8f\x08\x19b\xf5\
+~gr\xbfH\xd2|\xcbv\x9d\xf5o\x0c`>\xc6\
+\x18w\x06\x97\xefn\x0d\x1a\xb8\x04/q`EZ\x82\
+)>\xa93{\xc7\x0e\xc9~\x0c0\x84\x99\xe3\xed6\
+g\xf87{\x0b,\xe5\xe2\xe2*[9\x16\x9c;\x90\
+O\x90]JY\xe4\xfd\xfb\x1b\x99\xa6)\xa1u\x8f:\
+\xa9\x07N@\xc2\xd0t\x08\xac\x0e\xfc\xa9\xa0\xa7.v\
+\x07~\xd3\x90\xd7<\xfe\xce\xea\xdf.H?\x14\xbb\xec\
+\xf5\x02\xe6\xef5\x1aCB\xc1\x14\xae\xe7\xad\xc2\xaf\xe0\
+X\xb1\xce\x99\x85\xbf\x16-\xcb\xef\xfa\xe6f\xef\xcc\x22\
+S\xa2)o\x00\x06\xeb\xb5\xacNNe}r6;\
+\xaf\x14v\xbd5\x8c\x1aA\x8d~c\x11#\x91\x818\
+\xb9\xcc\xfc#\x7f{\xb9\x92\x7f\xf3\xe5=\xf9\xfab\xf3\
+\x03LT\xf6Q`\x06k\x8c\xcfv\x01:4\x1cD\
+m\xfc\xab} y\xc1\x8f\x8e\xf5\xb3\x01\xe1\xea(*\
+\x98V\xce%\x05G\x13y\xd7\x06\xe6F\xc2\xcc)(\
+\x0b\xab,\x16\xd7\x84m.\x85\xc4\x86\xe1,\xf0&\x8a\
+\xefl\x10\x1a2{\x14u\xf2\x004i\x8d\x93\xe7x\
+\xd6\xba\xba\x94\xd0\x15\xf3\x0a\xc9\xdb\xc0&\x85\xf0\xd1\xe8\
+\x138\xee\xb7\xce5Z\x9f\x0e&\x9a\xffv\xce<\x93\
+^_/\xe9\x0d!\xf3\xc2\x8fPg\x0c\xee\xc9,\x85\
+Z \xae\xd0\x91\xde\xe9\x0cU,\xceE\xfa^\x8c\x86\
+\xfbn7\x00\x08W\x1bY!a\x9a0\xda\xf5\x19\xc0\
+|\x8c1\xee\xc8@\xa61_p\xbf\x88\xecs\x0f(\
+\xb2\x0f\xecp\x04\xde\x92N\xfb\xdcA\xb2\x18\xe9<\xd7\
+\xe6q\xc4\xd4\xba\xac\xcf1\x91\x90\x03\x22;R\xbey\
+u\x99\x7fR.\xc0J\xf408\x5c\xb0\xd0\x1c.t\
+\x7f\xab\xe6\xd9o!\x19\xe0\x12\xa5\xdc\xff\xac\xdf\x07\xe1\
+\xc9N\x81\xd0\xf3\xcf\xc9Zx\x83{\xe0B\x11\x88\x1c\
+eg\xd5\xe9\xe2q\xa4\xd7\x11\x0b\xd6\x8b\xdf\xeaD%\
+\xcd\x9e\xea}\xafv;g\xd9\xe2t\xe6sp\xd0\xea\
+\xf4L\xd6'\xa72\xad\xd7\xb3t\x056I\xd1\x81\xef\
+E}\x18\x90\xbe\x8f\x08\xe5\xd9N\xe4_\xff\xf6D\xfe\
+\xf6\xd9\xa9\xf0\x87\xf0U,\xbak\xe7\x01h4\xd0>\
+\x01\xd1\xfb\xf1W\xd4V u\xd2\x1e\xaaR\x16MQ\
+\x09M\xccb\xf1\xf96\xfb``\x02\x1a\xe9\x1a2\xf7\
+\xc00\x93%`N\xa14Zq]\x1c0\x09\xe34\
+>\xfc\xb6\xb9\xbc\xb1\xff\x96\x81\xd5\x01J\x84\xd3\x97\x93\
+*x\xa9h\xda\x1b\x83\x0f\xba\x93\x5c\xe5\x22t\xa1O\
+j\xf2\x01\xec\xb3N\xa8\x1e\x01\xaa\xe9\xc2\x09\xe2\xd1X\
+\xf1L\x15I\xf5A\xadw<\x92\xfbD\x93+HA\
+~\xd3\xcfX\xabY\x869\x89\xae\x13\x87\xf9\xac\x82\xde\
+\xea\xc5\x03d\x03;\xbd+1Y\x01\x22I\xe2ji\
+,fH\xdf\x1e\xc0|\x8c1\xee\xc8\xe0\xeeF\x0ej\
+.:\xdf<\xa4N?\x8c\xa7\xb3\x14\xba\x1c\xac\xe5~\
+\xcf\x92\xa8xS\xcc\xd5l\xe0\xb8 \x93\xc0\xe1\xcf\xbf\
+\xbb\xa1\x5c_^\x99I\xf7pQ\xb1\x5c\xa7\xd8O\xb3\
+\xffDo\xdd\xdbt\xf2\xb2o\x89\x00q\x8b\xef\xf3\xb8\
+_Y|\x19,\xcbn\xb0\x5c\xb7H\x84\xdbQ\x87\xc9\
+\xa5\x9a/\x93\xc8 \xb9'4\x1b\x0e_^&\xa2\xd8\
+\x85\xcf\x05\xdf\xd4\xe7~\x0f\xb78\x7f$\xc5\x1b\x9fi\
+\xc6\xf8\xfa\xfaf\x96\xa0L\xae[x\x06\xe5\x9b\x8dl\
+\xce\xcedsr:\xeb\xc9}$i\x06\xc2\x13\xe0\xdd\
+\xcd\xc6u\xe7\x08\x90\x1bL\xf2\x7f<\xdb\xca\xdf<;\
+\xfb\x9e=\xcfmx\x0a\x95\x1c\x85\xd0\xc0F\x1dc\xf9\
+\xbe\xb3C\xac\xd1\xe7\xcd\xdc\xaf\x9d\x89\x82Wf\x8d\xb6\
+\xe6uA\xb4\xe6D\x05\xc8\xc8H:\xd4\xfeQ\x22\xee\
+|e\xd6{\xe9$\xa4\x1d9P\x01\xa7\xf9\x94\xe5\xb3\
+\xc3J.\x8a\x8d\x07\x9d\xeb\x0cC\x18M2i\x82\x8e\
+v\x81\xd3\xccC\x9db\xddqJ7[%[q\xd8\
+;\xd8 \xbd\xa7\xb4.\x1e\xea\xf314\x83V\xa8\xac\
+\x19e\xf3l\xb3I\xb6\xdc}\xdb\x88t\x86\xc2\xa8Q\
+\xed\xf9sl$\x90j\x17\x89n\xd6B\xb1\x88\xa4'\
+\x87\xe6\xc2\x87&n\xa1\x16\x0ea\xdf\xb0\xf6/\xc05\
+\x9f\xb7\xeb\x0f\xa3\xb1o\xd1[\xf0\xd6S\xf3N\x05\x11\
+M\xfd\x070\x1fc\x8c\xbb2n\xaeDv\xbb\x83\xf8\
+\x91\xb7\x01{G\x00R3\xe5'\xd4\xa3\x0d]@\xd8\
+\x8d\x8cl\xfd\x82\xee\xd4,\x18\x87K\x84\xa5\xd6\xc7\x8b\
+\xebk\xd9\xe9\x06<\xf5\xd2\xfa-n\x05P\x10\x11\xfd\
+\xfd\xf3\xed\xd1f,\xdfI\x81\xa6\x00\x06_\x93\x01\x8e\
+)v1\x13\xf3\xa8\xa2\xa1\xab\xa35\x84P\xfeb<\
+\xf26\xe5\xd2=\x8a\xfe1\xf9b\x81\xbd\x17\x83a\x0d\
+%\x91\xcf <\x09\xf9\xbd\xa0\xc7\xf5\xd5\xb5\xca\x1e\x80\
+\xb2N\x9cd:9\x95\xcd\xf9\xb9\xac\xb6'\x82\xd5\xe4\
+,<\x1b@7\xd9\x02&`\xc5u;#\x93\xd5(\
+\x91\x01,\xd8\xff\xd5\x8b\x8d\xfc\x87\xa7\xdf38/l\
+\x1f\x15\xdbk\xf4\xb5\xa1]\xbczF\x9b\xcb\xc6Xx\
+h\x0f\xee\x8a\xaa\x93\xf4E\xb8\x10\x99\xda0\x99\x90\x98\
+EVC\x17$VCa\x12\x0f\xf1\xd0\x88j\xee\xa7\
+\xc2\x86\xea\xe7\x8as\x8a%\x12kZ1NL\xb6\x04\
+H\xfa`\xd8!a\x85\xad\xc9\x10\xf1\x97P\x98n\xd8\
+B\x92t\xe9\xa7\xe5{\xc8\x8bn ![LGe\
+\x5c3\x08m%\xca\xa0\x19L\x09\xf0\xda$\x1cwX\
+\x99\xfa\x8e\xf7\x9d\xe3K Q\xf00g\xbf\xa6m\x9b\
+P\xae\x89X\x92\xb4W\xdd\x10[?\x13\x9a4+\x99\
+/\x995\xf5S\xdd?.\xb9{0\xe6c\x8cq\x97\
+\x06o\x84\xbbk\xcb\xd2\xf54\x07\xd4\xab\xd12\xfaa\
+\x97i\x8cT\xa6\x0fU\x08> \xa4]Xq\xd8\xa9\
+\x1ca\xb6?>\x08\x87\x09gU\xfe}yqy\xd4\
+\x0b@\xe4\xb5\x98\xd32\xee\x9fn\xec\xa2\xf8\x03\x01t\
+/3\xbe\xf5\xedd<\xdb\xe26\xea!\x0c\xec\xed5\
+\xa3-%\x96\x9b\x84\x0f\x1e32R;9\x14.\x5c\
+?\x1c\xbeyz@\xbb\xb3\x9f\x8dP\xd1\xb1\xa5OV\
+<Jy\xf5\xe2\xe5\xfc\x0b\xca2q\x9aduz&\
+\x9b\xb3sYo\xb6\xfbt\xcf\x9a,\x9aXr\xc2{\
+\xb1@\xd93*\xefs\xc7ZB\x05\x10\xc1=S\xe5\
+_\xbfz\xb1\x95\xbf\xfd\x9e\x98\xf3\xaa\xe7\x0d\xe7\x9d9\
+\xfe\x81\x92\x86\xd05{\xaa\xaczzFq\xb6W\x8c\
+[34E\xac\x09\xe0\xa4\xf5\xef.`\x9c\x92\xb8\xb8\
+\xb0h\x92\x13\x8d\xbbzMz/\x0f\xb6\xa4N\x13\x88\
+Du_#\xea\x9a\xe1\xf4\xda\x955\x0d;\x0c\xba\xc6\
+\x09\xd5\x98\xfa\x1cp\xeco#P\xe2E+s7\x83\
+[\x0d{\x94\x08bv@\xf9\x9c\x84u>\x91\xfa\xda\
+\xf4O\x92\xaa\xafr\x99G'\x90\xb5\xcf'\xa1#\x99\
+\xc3~'%w\xc2\x8a\xce>\x94\xa4\x90,\xc5\x0bx\
+D[\xbbj8\x9d\x1b|\xe9\x09\xab\xf9^\xf0\x0e6\
+P\x01V\xd5\xdf}\x06\xec\x03\x98\x8f1\xc6\x9d\x01\xe6\
+\xdc\xb3\xe6)^\x88\x8e)H\x03[\xa2~\x00)\xd3\
+\xd8\x7f}\xbd\xc0r\x09A\x87.\xfa>%\xafu\x7f\
+\xa6\xdd\xfd\x10\x96\x92>\x83~uu\xad\x00\x94\x9bt\
+\x17,\x0a\xf3zFM\xf4\xd5=a\xcf<\xdd?\xdf\
+\x1a\x7fZ\x1e\xc3\xea~K@.G\x9e\xda\x03\xe8i\
+\xb1bAf\xc7\x82\x0e\x11\xce\xacD\xeaQ\xe2\xec\xde\
+n\x96\xe9eXcy\x84\x94kY\x86\x7fL\xcbl\
+\xaf\x19\x9aIA\xa1[\xb6\x1a\x7fxM\xca\xc5\xab\x0b\
+\xcbT\xafV\xb2:;\x93\xed\xf9\xf9>\xc9\xb3\xb8N\
+8\x0d:\x10\x19nIw8\x14k\xa9*4$\x92\
+\x96\x0a\xfbJr\xa8@v\x22\xf2\xef\x9fo\xe5?>\
+?\xfb\x1e\xc8r4g\x8a\xe0\xef\x917rZ\xffm\
+{\xaf\x84\x16\x8b\x19\xa0T\xf0\xa4m}\x8a;\x8d\x87\
+nl)\x9d~\xcb\x0c\xb3$\x04\xcc\x9e5&\x85\xa7\
+X\xdfoF\xda\xb7\xfao\x1b)V:\x95\xaa\x86\xcc\
+\xec\xd6\xa3u'\xd18\x12\x88\x8f\x9a\x0bK\xb3O\xa4\
+k\xc8L>\x0f\xe1\x1er >\xaf\xaa\xe3\xd62\xbe\
+\xed\x19\x81\xe3\x89\xc0\xa4\xf9\xbc\xb3C`\xeb\x8d\xe4y\
+\xd46\x93a\x9e\x81Y\xeeLx\x13]\xb3nM\xd5\
+D3\x8b/@Y\x11\x0b\xa0\xa5\x97(\xba\x87 \x89\
+\x9ebF\x82P\xddk.u\x22\xd9\xad3$>a\
+\xce\xf1\x00\xe6c\x8cq\x97\xc6\xf5\xd5\x91\x5cr\xcf\xfd\
+\x84}\x04\x13R\xda\x0e\xbd~\xe68\x86\x85\xf0\x97\x0e\
+L\xa2\xa7\xa0\x0e\xbb\x86\x1c\x03\xb1..\xaf\xa4y\x05\
+\xe3\x00k\x8a\xe5\xf7KRk\x0a\xbbtv\xba\x91\xe5\
+\xde\xcf\xefW\xcd\x1b\xb2@\x8f\x90\xb7\xd3\xb15\x0b\xf0\
+\xca.\xd2=\xac\x0d\x1c\xfe\xac\xee$\x01\xc7i\xda\xed\
+\x9a\x1b\x13\x00\xfb\x8d\xa8\xe2\x9c,<\xdb\x07\xb9\xdd\xd5\
+\xd2\x81-\xf6\xdc\x93\x94]9c\xd8;\xb2\x5c__\
+\xb7\x1f\x9cV\xb2>;\x93\xed\xd9\xb9`Z57\x8b\
+\xccI%\xf7\x05\xb1Z\x15$\xcf\x94sb\xf1?c\
+e\xee\xb3=! \xff\xd7\xf3\xad<\xbfZ\x7f/w\
+%2\x06\xdb\x15\xb0\x16\xec\xb0;\x7f \x01\xac\x0cT\
+A\xb1\xdeS~\xf2\x89\xb8\xc7[\x8fG\x07\x12\x0d\xa8\
+`\x82\x83<h\xa7\xb3\xee)\xbap\xba\xa8x\x0a\x1d\
+\xc0\x92P\xcc\x12\x11\xe0\x15\xf3\x13-\xa5\xa0:iD\
+\x12pS\xad\x0f5\x96^Nq\x06,S\xab\xa5\xe8\
+\x85e\xf6\x01\xc4\xacv\x9e\xf6\x91\x02\x93[\xd1<0\
+\xd1\x92\x06\x0e\xfd\xeb\x9c z7\x97y'\x22\xb8\xa5\
+\x94\x14Qf\xeb\x14\x13\x87 \xadqR\xcd\x9c\x0a(\
+\xeb&\xcef\xee5\xef\x92\x81\xc9\xf5\xcbj\x8c\xae\xa3\
+\x80\xadP\x5c\xe9MW\xdc\xd5\xe9d \xa11\xc6\xb8\
+\x8b\xc0\xfc\x16\xb6|\xc7\xf4\x8bv\xf5\xb7\x07\xd8Z\xbf\
+\xe4EB\xa4\xfb\x9a\xe8\x16\x05}L\x079\xa6\xadr\
+\xff\xdd\xcb\xcb\xeb\xa4W\x16\x81\xe0e\xe7\x841L\x9a\
+qC\xf7d%r\xb2Y\x9bb\x01X*]\xbec\
+\xf8\xc3\xa8\xfe\xe1-\x19t,\xf0\xcd\x5c\x10\x823\xbd\
+?\xb0x\x1f\xe2\x98{\x96\xb78f\xc6{3\xf6D\
+d\x0d\xa3\xaf{v\xb4\xdfvE\xe5J9\xb6\xff\xf7\
+\xf5\xe5\x95\xecv7\xfb\xdfY\xadds\xff\xbelO\
+\xcff\xe9\x8a\xc6\xd1\xe8\x17/\x1a\x84#y\x0a\xd0{\
+v\x9c]\xa2\xb7Wt\xe3J \x7f\xfe\xf4\xfc\xbb\x0d\
+!\x02BJg;t\x1a\xa0\x197\x98lS\xad\x0f\
+\xbc\xb4\xdc\x01\x1b\xa0\xa3\xb7\xf9\xf3F\x83\x98\x01\x95s\
+\xb9\xb0]\xa9\xc9\x84\xc99MR\x5cc&BR)\
+<8\x0fw\x0f[\x8a\xa7+\x80\x91q\x05:d\xcb\
+\xfb\x9e/\xd8\xa6&a\x94\xb9\x96y>O\xd4M\xa8\
+\x12\x9b\x10\x05\x8c{\x1f\xb3\x84H\xbfWa\x86\xe9&\
+V\x93`\x9c\x15\x12\x92\xf5qz\x93\xf4h\xbb\x9a\xef\
+\xba\xc1Z\xaf+\xf9Hw\xbe3\x92\xa3V\xe05Y\
+O\xe66\x85\xd0xZ\xeeE\xa6$\x99\xcbf\xed\xd8\
+3\xd6\x22\x13\xe8\xae!\x03\x98\x8f1\xc6\x1d\x1a\xbc\xbe\
+t\x0c\xcc\x11`<\xf1Y\xce\x17\xe9\xcc=\xb7\x0ff\
+\x8en\x10<\x04w\x18`\xf0-@x\x7f\x5c\x5c\x5c\
+J7\xb8!L\xcc\x07`[\xe7 \xeeo&\xd9\xac\
+\xa7\xda@Df\x9a}\xdc\x0e\xc0\xde\x12\xff\xe8\xc3\x07\
+\x8e\xbb\x166:\xdc\x7f\xf2F\xc7!\xdb[\xfd\xee\xd0\
+\xdb\xeb\x9d\x07k\xd5\x92\xae\xe3\xafs,\xbd\xb7\xf0\xb7\
+\xaa\xf1\xdb\x96=S\xbe\xa3\xc8\xae,\xbe\x14\xf9\xea\x1f\
+\xbe\x10\xde\xdc\x08\xd6\x1b\xd9>x \x9b\x93S\x91I\
+5y\xa2\xe7\xbc\x02\x87\xc9\xb5\x17\xbd(?zm\xde\
+\xe9\xf4\xe6\xc8Z\xa23\x1b\xc5\x06\xd6\xff\xfez\x92\xdf\
+\xbc\xf8.%-\xb33\x05\x98\x16\x1d\x0c\xb3\x0b\x0c\xd8\
+\x8d\xed\xe2I\xf39\xa1Z+\xe1\xd8i\x0d\xda-\xe4\
+\x05\xb4\x83\x88\xaa\x18\xa1 \xb2\xdb\x16A\xd5fD\x8f\
+k\xcd\xa8\xf3\x80\xbf\x7f4\xf1\xf3L\xac\xc2\xfe\x05\xa9\
+\x02\x09)\x02\xa1,XA\xa2#Y\x01\x9b\xf3\x0b\x13\
+\x14\x0f\xc4@8'\xa3\xa9\x0d\xb1Z/\xef\x8a\xcdl\
+\xd7n\xff-o\xc7\xe8\xd6\x9b\x10\x83\x81D\x96I[\
+\x7f\xba\xea\x1c\xca\xff\xbc\x00\xe5\xd6\xaf\x11\xaf\xe1\xbeP\
+t.9\x8ae\x09\xd7\x0aJ\xc8\x99\x9a\x95!\x04\xa6\
+\x15kG\xbf\xee\x81\xad/\xcb\x9ez\xd6\x1d\x96l\x0c\
+`>\xc6\x18wi\x5c\xbdJ\x99\xdbn\x18M\xd0\x07\
+X[\x92C\xb6\xd8\xa1q\x93~q\xd5`&6a\
+\xf5\x96)F\xfa!\x07\x8e\xb7\xc2\xfd\xf63>\xbf\xbc\
+\x92Lcn\xa4\x0e<\xa2\xe0p\xf6_m\xce\x86\x9c\
+o \xeb\xf5\xca6\x99e\x8d\xb7\xd9\xb9z]\xc8\xc3\
+\x0eAi]\xb8\x8e;[\x87\x0d{\xfb2\xa0\xc5c\
+\xc3\xd1\xc5M\x8f5\xee\xb6\xe0\x22\xbf;\xd2{\xed\xe8\
+\x9b\xc8Y\xc7\x1dl\xa0\xb0\xdf\xde)\xf0\xb2\xdbQ\xfe\
+\xc3\xaf\x7f-\xd3v+'\x0f\xee\xcbj\xb3Q\xa10\
+\x92w\xec\xc2\xc6\xb9\x8b\xb2Y\x84\xd3\xdaZ\x10.\x06\
+tk\xeb5t\xfd\x97}\xe48\x04\x98\xe4\xcf_\x9e\
+\xc8\xcb\xeb\xefH\xd2\xc2f\x1b\x98\xa1O\x8d\x0b\xe1\x8a\
+\xd5\xe8\x0f\x84\xe0!^\xe1<\x98\xb5)\xdb]\x0d\x9f\
+\x8bf\x9d\xfa\xe6\xf3\xcb\xea\xb5\xed\xafM-\xa6\x98\xc7\
+\xfeh\xadp\xcd9(\xec\xbcH\x08)f&g)\
+>\xe5\xc1\x19\x93\xaa\xed\x86\x87\xd8\x0d\x95\xa6*]{\
+.x\xb6\x06\x05\x80\xef?M`\xada\xbd\xbe\xa1\xc4\
+\xdbv\xb7@\xaa\xdbLv\xb8\xc5\xf9\x05Y\xc0P\xf2\
+\xbc5\x9br\xe6lS\xb6\x12joF#IB\x1a\
+Dk\xa6l7\xcd\xb5\xfb\x04\xc9\x1a\xc0\x1a:\x15\x9e\
+\xae\xb2\xe3\xa3\xe61&%\x99\xb6\xf6,\xd6\x8f\xc6\xe5\
+\x86H\x9ake\xb8\xb2\x8c1\xc6\x9d\x1b\xaf\x9e\x1d\x8d\
+\xde\xec\xe4\xd8\xb3\xc2\xc3\x22X\x0c\x10\x04\x9e\xe3Z\x06\
+Y\x8bN\xea\xaf\x99V\xbf\x84\x06\xa0,\x1c/.\xae\
+#\x02\xedu\xe7\x14\xbfe.\x09z\xa2n\xe2|3\
+\xc94y'\x05\x91\x90\xfb\xfc]\xf2\xcc\xc7\xc6\xce\xdf\
+\xe6\xbd\x93c\xe5\x81\xeb\x06\xe9\x15\x08\xb8\x15o\xdd\xf3\
+\x91\xe7\xe2{Z\x87\x04\xed\x86\xb3\xb8i\x90\xa5\xd5\x1e\
+!\xd1Y*Dv\xbb=0/\xaf\xf5\xe5?|!\
+\xbf\xfd\xe6\xa9\x9c\xdc\x7f \xd3z\xad\x98@h\xbb\x15\
+\x03\x22\x8bD&w\xeb\xf0\xbf\x97\xf4\x82 s\xac\x81\
+ug\x09\xf0\xdcj\xc0\xaf)\xf2\xd5\xe5\xf6;\xb8A\
+\xad\xa9a\xaf9\xcf\xdaY\xb3I-L\x11S\xc0w\
+R\xe6C\x87\xd0\xf8\xeb\xc9\xd0\xef\x02\xf7\xfc\x1b\xb8\xe7\
+\x11\xb4/\xf8\x9c\x8cE:\xce\x22\x15|\xcd:\x13c\
+\x8d.JG\x8f\x18\x05Og\xadh\x0a\x99\x0c\xc8\x1b\
+\x8e\x05jV\xe6\x1c\x88$\x8e~\xb7P\x94\xf5\x1c\xa1\
+=\x16\x84+\x22\xec\x07\x80\xc0E\x0a5\xe5\x91\xceV\
+\xed4 u\x92,X\x8b,\xc3P\x13\x8d\x9dF<\
+\xcb\xf5l\xd3\x16\x18\x92\xd9D\x16o\x9bd~\xa7+\
+B\xe22a\x05\xf3\xb5\xef5\xd9\x90h\xc4Ht\x13\
+\xa8\xe7\xdb9\x06\xd5\x10\xael\x22\x9c\xaf\x0d\x5c:\xd2\
+\x00\xe6c\x8cq\x87\x06_>m\x0b\xcb\xc1\xde\xce\x84\
+\x81\x0a,\x06\x0f\x910bl\xabz\xf0\xbe\x00\xb2n\
+\xf0P\xa6\xc5\xcb\x0f\xfe\x16\xa4ow\xecv\x94\xeb\xab\
+k3Yr\x11`\xbd\x9e\xee\xf8\xc1\xd9J-V:\
+\xa9P\x9c\x03\xcc\x91\x1a\x93o\x01\x86\x82\xab\xd7\x11]\
+\xb2\xf0\xc7,\xf1\xfe\xe1-\xae\x84\xdd^?\xa62\xe1\
+\x01\xa7\x95\xbeC\x0a\x5c\x8cv\x9a\xd8\x0e\xf7i:.\
+<\x87\xcaA\x9f\xe8G\xb2\xa6+\xeeD\xe4f\xb7\x7f\
+\x1e\x9f?\x7f)\x7f\xf6\xa7\x7f&\xdb\xf33+\xadH\
+\xecE\xad\x04\xc5\xbf\x7f\xe7\xeb\x86\xe6\x8d\xb9\xbeFO\
+\xee-\x12\xb5\xe3\x8b\x02\xfdPr\x9a\xbf{\xb5\xe9H\
+\x0dnU\x1fk5\x8a,\xee\x9e\xa0\xc7\x9cZ\x8f\xed\
+\xac\xa0b\xa7\xef\xa3\xa9\x12,UM)\xc03J\xb4\
+X\xed\xea|\xc0\x10g\x89\x01\x0d\xadkdE\x8c\xe0\
+.\x1e\x9bj\x91Dc\x9e\xcdN\x08{\xcfg\x04\xa6\
+V\xe2\xe2Z`\xe1g\x7fw\xce\xd4\xb5\xaf\xc5@\xcf\
+\x08\x0b\x09\xce\x94\x16\xbc#L\xc2\xe9\xe6]\x8c\x90\xa4\
+\xc9~\xe9\x0b\x22i\xea\xd7M\xbc\x8e\x14i\xb64m\
+~e\xbbN!\xbd\x14Mon\xa38\x9a\xbf>%\
+&\xab6\x93w\xbfb\x22*\x9bL(\x90\x9d\xa9z\
+7=D\xd2\xdd \xc2\xf2;\x85</E\xd0\x00\xe6\
+c\x8cq\x97\xc6\xaboj\xc8\x10R\xe67\xe7\xaa5\
+\xf9\xc6\x85 \x19va\x09\x0e\x00[1\xfb\xb9K\x19\
+\x9f\xe8V\x018\xccx\x1e\xc1`\x8a\x88\x5c\xdf\xec\xe4\
+\xea\xe6\xa6\xf5\xe1\xebd!\xd2\xcc\xb5\xd9z\x91d\xe2\
+\xa5\xec\xed\xa3\xb3\x8d\xe8\xc6y&\xbe\xf14\xde\xc1\xdf\
+\x8fC\x8b\xb3\x97\xcf\x12\xac\xff?\xf6\xde\xac[\x92\xe4\
+<\x0e4\x8b\xbcKU\xf5\x8a\x1d\xa0(\xf0\x1c\xbd\xe8\
+e\xce\x1c=\xcd\xcf\x9d\xdf1\xaf3\xdafH\x8a\x92\
+@R\x12A\x82\xd8\x176zAw\xd7v\x97\x0c\x9b\
+\x87\x8cp\xff6\x8f\xbc\xd5\xdd\x00\xaa\x1b\x118\x85\xbe\
+K\xde\xccX<<\xec3\xb7\xcfl\xf3o\xc75\x94\
+_\xa0?_\xe1\xa0\xf0\xb5\xdb\x22\xa8y\xae\xf6\x19\xbc\
+&+u\xb3u\xf1\x03G\xd0H\x136\x5cr0A\
+7\x12\xe6Y8\xe2\x94\xcc\xfb\xbf\xfe\xfe\xef1c^\
+\x98j5\xf0\x1d{4\x1d3\xde\xc0\x83\xffWI<\
+\xba\xe6\xd6\x00\xfb&w\xf1V\x89\x8c\x00\xde\xbd/\xcb\
+\xda\xe9\xa3\xf9\x80\x97\xc7\xc3\x17Q'\x1a\xbd\xb6!#\
+WvU\x05+\x0d\xf6\xd8\xf6`\x0eX\x05r\xae\xc7\
+\xad\x0dW\x9eH\x86\xca\xc4\x83zvzD\xad\x87\xd0\
+ ;\xeb\x1a\xe6\xb45\x9e\xae\xd1\xf2i\x8c\xcaH\x8d\
+z\x91(Sd\xae\xb6}\x0a\xe7\xb0\xeeyQ\x9fs\
+\x07>\x00\x95k\xabu>\xa9\xdcpT\x16I\xf9\xde\
+\xd0\xc0eD\xc6b\x91f\x15\xa25a\xb2h.\xad\
+\x0a\x0fS\xd0\xa6g\x89\xe9\xe5\x91\x94\x9e\x1f\xd9\xa5S\
+\xc3s\x22\x93\x86Z]vb\xb0\xc8&\x95NO\x5c\
+\xa4<,\x9a{\xfb\xa0\x91\xb3\xd6\xa5L\x7f\x82a\xdc\
+\xcb\x06\xda\xe5\x03w`\xbeo\xfb\xf6\x1am\xba}\x01\
+\xccG\xe3};BYB)\xf2\x83\xd7\xee\xaa\xe4H\
+?/_\xbd!\x83\xf0O\xee\x879\xc6<\x0cQ\xb5\
+G!A\xdc\xdf\xdf\xe38g\xb0\x9f\x97\x8f\xed\x83l\
+eB=x\xd0\x00\xfd\x0b\xc0\xe3\xabC\xc3<:\xc3\
+\xc4fV\xbe\xda\x7f\xe2|\xbc\xd1\x86\xe1ZH\xee\xe3\
++\xd9&&.\xdb\x15\x80\x82\xce^\xa4\x87\xb8&\xbe\
+\xc2\x00\xf2\xcc\xd6\xe8m\xb5Qfj\xf0\x96I\x95P\
+\x80\xbbb\x00\x08a\xac,?{\xf1\xf2\x16?\xf8\xdb\
+\xbf\xc3\xef>\xf9\x9dc\xba|\xa2\x8d\xed\xea\x8cM\x9d\
+e\x09\xd4\x1b<\x9b\xde\x9c\xde\xb7\xdc\x01v:|\xef\
+\x8b`:\x0b62\xa7i\x82'\xf6\xff\x93/@\xce\
+\xd2\x93\xe5\x85l\x9d-GFv\xd0\xeak:Y\x10\
+T\xd5jR\xa9K\xf6(\xd1\x83\xbc\x0ez\x84\xb8:\
+\x11#|\x1a\xa7\xbc4\xe7\xb9\x16\x1a\x9d@\xa6\x04\xcf\
+\xc0\xcb\xb7\x99\xd8\xeb\xd8\x9a.\xabU\xcaB\x22\xa8r\
+&\x95\xa3TW\xf9\x87}3\xd9P*so\xd0V\
+\xef\xf2E\x8ch\x136\xcd\xb0\xe5r\xae\x14\x04\xda\xa3\
+Fp!\xf8\x9f\xd33\xd3\xc8\xc9\xd0\xa6\xd6H\x17\x93\
+\xc3\x08\x1f\xdb\xf4\x1c\xfc\xe3\x85$Y\x01c\xdaql\
+\x1ce\xf9l\xd2\xdaT\x1c\x06\x86RS\xa8=p\xd4\
+\xb2\x146A\x8d+>\xd7\xb1\xd8\x83\x8f\xd8\xc7\xc9@\
+Z\xb3\x03\xf3}\xdb\xb7\xd7i\xbb\xbf\xc5|wS\xfa\
+\xf9*\x00*U\xf8D[+\x8a\xdb\xec\xfb\x03\x82\x1a\
+\x1f\x06\xa5\xb9\xf5\x83\xcf\x81\xde\xccN\x1c\xef\x8f\x9eu\
+#7\xca\x05%\xd9\x87\x90\x0b\x9c\xea\xd3\x1e]]\x8c\
+\xc1\xa9-\x86X\x03G&@\xa8\x81t\xe4!\x148\
+\xbb\x7frA\x04>\xf8\x925I%\xc3\xfelk\xb3\
+\xeb\x97= E\x95\xb5\xd4!&\xca\xe6\x8f\xe4\xc6n\
+\xe9\xb3\x0cO7\xd6\x95\xc0\xb8\xd9\x97\x05xH\xc0\x07\
+\xbf\xfb\x14\x7f\xf9\xd7\x7f\x83\xf7?\xfc\xf0\xd4o@\x1f\
+9\x14\x13\xfe\xac|\xc5\x8d\x8b\xa8-o\xd2\x13\xd4\xcb\
+!\x85\xbb\x8a\x97\xb5X_\x17&\xdc\x01\x93\x0cj\x01\
+\xd9\xfc\xb9\xe5Vl+s*\x9br\xd9\x98f\x17n\
+\xb6\xfa~\x87\x9e\x10-\xe0\xdc\xd9\xe9\xc9h\xeb\xadK\
+\x8e\xcc5*\xc0Q\xc8\xccq\xf7\xb8Bjo\x5cU\
+#\xe5\xadP-&\xb6Znk\xb4\x13\xd2\x1f\xe1\x82\
+\x97\xcc\xe7\xac,k\x90`\x90q\xcd\x8e\xcd\xdd\xa4\xa4\
+\x1c\xa2}\xa7\x95\xf2\xd8%\x0b\xe6\x026\xd54\xc6\x8b\
+\xfd\xe4yo\xef\xe9UfR\xa4\xee.\xba\x0bE\xe3\
+\x975\xf9\xd3 p_\xc8\x87\xc6\xc8N\x8b\xa7\xcf\x11\
+\x95C\x0aB\xad\xe5\x8bR\xe6\x15\x01\x19\xa9^e|\
+\xbe\x16>\xf1}\x8b\xe0&S\xc9 \xe3\xfd\x95\xfdV\
+^\x7f]o_\x99\xa6[{m\x07\xf2\xa6\x1d\x98\xef\
+\xdb\xbe\xbdV\x94\xb9\xc0\xbb\x17\x1e:n\x14\xe9\xe9\x17\
+\xe4\x03\x91\xca\x18\x08VQ\x1f\x1c\xe2Ef\x0c^\xea\
+H>\x1f\x18\x88L\xf3\xfd\xf1\xb8\xed\x10\xa3\x8a--\
+t\xca\x8d=\x97\xc5\x0f\xed\x97\xd7\x97S\xcd\xcaG\xf6\
+\xd9\x06g\xc4\xd0\x91\xe1y\x7f\xd5s\xa2\xfe\x00|P\
+\xe4=R\x01\x17Q)G~\x84\xaf`\x9b\xa3\xf0\xc0\
+\x1b\xc7X\x8f\x83\x8e\xaaF\xb2\xf3\x00\x9b\xeeZ9\x00\
+\xc0\x87\x8d\xa9\xfaV8=h\xef\x8f3~\xf4\xb3\xdf\
+\xe0\xff\xfa\x8f\xff\x15\x1f?\x7f\x81i\x010\x13q\xfa\
+zZ@\xef45pc\x138\xad\xbbJ\xe2\x02-\
+\xc3n\x05*\xc6\x89%\xf9\xabDi\x0c\x82P\xb5p\
+\x15\x8a\x8d\xa2\xf8\x02l<i\xb4\xbf\xf9\xaaj,p\
+c\xd6\x13\xd3\xf5\x12\x86\xc0\x22\xd9\xc6\xc0\xaa\xd6S\xba\
+\xd7\x85\xe8t\xe1\xc5?U\x0a%\x07\x83\x9e\x11\xc5\x0d\
+\xe6\x8c\x8e\xb1\x18[N\xf3\xf0O\x80ya\xb3\xe5\xad\
+%[\xc1\x13\x18\x05\x9a\xf1\x22\x0e\xa4:\xcas2\x1b\
+\x0b\xacp\xcb\x99\xc6E\xa7\xb3\xeec\xd3\xae\xce\x9d\x0a\
+(\xb5\xe2\x87\xf6\x9e\x93\x06\xcf\x9f\xb5Q\xd5\x90'+\
+\xa0e\xb1\xcf4\xfd%n\x8a`=\xd9\x1b\x998U\
+\xeb\xf1\xa1\x90\xdfi\xd9\xfd\xda\xa9\xb1\xad$\xd0\xaeb\
+\x84\xa5\x04*\x82my\x19\x10V=<S\xb0Se\
+\x86\xb6\xaex}\xd1q`\xfb\xb6o\xfb\xf6\xf9\x909\
+\xf4\xf2)\xf8\xf6\xb7\xf3\xcf#;fhS:j\x82\
+\xe1K\xd5\xf4\xe7\xda\x11\xce \xd7c\xc5\xf4\xd6\x0c\xb0\
+\xcf]\xb3\x13U\xe2\xef\x1e\xc2\xad\x8e\xc1Sc\xa5N\
+\x93\xea\xed\xfd\xd1=\x07\xe4\xaa\x17zmg\xb9\xdf\xc5\
+\x11\xd8`\xb8\xe5\xbd\x1e]_\x9c%\x82%\xfb \xe0\
+\x99F\xd3\xee\xb5\xac\xa1\xf6\x82%P\x10\xc2\xf1\xf2\x95\
+O\xe6\x19\x8b@K\xff\xeb\xd5\xdf\x86\xe7__\xbbM\
+\x12\x18D\xb8\xc7\xa6\xcct\xa6\xd6?%\xfb\x00\x8cA\
+2\xac0\x9c\xff\xa1\xb7F\x14\xde\xfb\xe0c\xfc?\xff\
+\xe5\x87\xf8\x1f\xbfz\x1f\x9a\x8f\x98\xd8\xc7\x910-\xae\
+\x19\xeaZ`\x9aD\xc1\x05\xb9I4\x0e\x22\x13\xac~\
+\x8a\x06@\x92\x99=K\xf8\xc6\x06\xa1\x981@\x17O\
+^\xdc\xe7v\x89\xa5\xf0\xa5\xfel3\x14\x8d\xed`\xbe\
+\xceZ\xae\x01i\xa5f\xea\x7fG&\x8e\xbbp\xd5\xf7\
+l\xab\xb3\xad\x90\xd3\x80{\xb6S\xe6\xd3\xfc\xeaAT\
+\x1dEf\xe3\xf41\xeb*\x83\x9a$\x86\xc5jA\x95\
+\x01\xd0`o*\x92h\xeeW/\xbfS\xf0^\xb7s\
+sww\x91\x0f6Z\x7f\x1f\x1d\xb2\xd4\x99\x7f\x98$\
+O\xca7'\xbbQ\xd2\xe6+\xa6|\x1f\xb9\xf2\xb77\
+\x5cr\xd4.\xce\xd00)\xd3\xc3\xaa\xce8\xdbco\
+\x00\xdc\xec\x83\xef\xd9A\xb3\x07\xed6\x9cr\xc7n\xf5\
+\xf3b Q\x16v\x9f\x0a\xcf\x11s\xffH\xc6\xca\x12\
+&\x14\xd4M\xb8K\xd0\x94\xe0\xc6u{\xce\xc8\x99#\
+\xc2\xd9\xf8\x92\xc5\x13\x98\xe6\x98{\x00\xd5\xfa';0\
+\xdf\xb7}{\xdd\xa0\xf9\xb3\x8f\x8d\x88\xd3\x02mm:\
+!h\x9d R2\xe5 \xa2|()4\x93U\xc1\
+-\x01\x95b\x97\x1b\x88\x97[\xaf:W\xa6\x94\xf4\xec\
+\xfd\xdd\xbd\xb3\xef\xca\x9cvf\xa6\xd7cj\x91\xcb\xe1\
+a\xe5\x00\xe3\xf2\x83GW\x07\xc0(V\x1d\xb0d8\
+F=\xdc\xfd\xa5\xf4-~\x00\xae\xf6O\xbds`\xbb\
+n\x10\x8b\xbf\xb0>\xbc\x89\xe1\x1c\xb59\x8c>\xb7\x02\
+\xd4\xaau\x9eq\xb5\xba\xacM\x06\xab7g\x9d}\xce\
+]\x87\xd0 \xbcb\xe6\xdf=}\x81\xbf\xfc\xc1\x8f\xf1\
+\xef\xff\xe1\x97\xa7U\x19\xe2\xc4\x8c\xcflLf\xbd\xab\
+rc!>\xc0\xbb~(\x86\xdb\xc40%\x85B\x85\
+\x0e\xd0\xb8\x84ZF\x8en2\x0c\xa8m\x86\xa4\xc3\x94\
+\xd3\xe7\x96\xb2\xd8\xd8K\x0f\x02\x9b%\x1f\x8bU\x14\xd9\
+f?\x0f\xaa\xca\xb2]}\xff{\x04|O\xd6$\x07\
+\xcd\x84\x06\xfc\xcb\xe8\xdd\xe1b\xef\xe9\xfbr\x83\xd3\x8c\
+\xc4\x01\xfb/\x03\xf8|4\xbdh\xd8\xd8h\xb0b\xe6\
+\x1f\xff\xf3\xdaz\x90\xa6!\x9f\x03\x82\xa6<\xf6`\xfd\
+\xe7@;}9a\x0b\xa5l\x85(\xaf\x89\x0e\xc4\x0c\
+=\xb4n\x00\x9f\xcc\xdd\xa2\xcd6PL\xc3\xbe\x15\x1a\
+\xe7\xdc\x99\xa4\xf0>\xca\xcf\x15\xd6\x92L\xda\xcfb\x9c\
+\xc3\xcc5qi\xd1J\xab\x89\x12\x5c\xd1W=\xa7\xec\
+\xf3\x97\x0e\xb8\xdb\xfd\x0b;c\xac0\xd7\xafv`\xbe\
+o\xfb\xf6\xba\x01\xf3\xa7\x1f\x9c\x05u=\xcdw4\x81\
+\x17\x089.5\xe6o\xfbT\xc7\x0d\xe8-\xab\x1f=\
+\xa3K\x86*\xd1\xe7g`\xcd\xfd\x03\xe7\xfe\xfe\xbe\xde\
+1\xe4\xc9\x9f\x0b\x08\xef\xa7L\x00\xa7\xce\x988w.\
+\xb9\x89\xf8\xf2\xe2P\x9e\x07\x87\xc7K\xfaN\x9b\xf0\xfa\
+\xd5\xbb'G\x19\xd7\xdb\x5c\xf6&\xbb\xbde#\xa8*\
+@\xe3\x0c\xe2\x97\x06\x12\x98\x07\xb8\xbd8\xfe\x10\xc17\
+y\xf0\x9a\xad\x22\x8e\x86\x91\x1a\x99\xc0/\xe0\xf78\x0b\
+\xef}\xf8)~\xf0\xc3_\xe2?\xfd\xf0Wxvs\
+\xbb\x8c\x8d\xd9\x83\xb7\xf5'\xb6:\x8b\xabSa\xc5\xa9\
+\xb1\xdaD\xd9L\xd6\xdfJ\xa6\x09-\xb0\xca*P\x86\
+\xf9\x05\x8b\xb1\xe1\x9aK\x83\x95\xd0\xf5\xe5\x13\x00O\xf1\
+9n\xc8~\xef\x18\x17\x99\xe63Bst\x1c3\xd4\
+\x16L\x16\x842\xdcB\x04\x8b\xa6K\x15\xb7\x14\xd3\x1d\
+\xda\x92\x1aeF3,\xec^\x8a\xa8\x08\xaa\xb2\xc6\x81\
+\xee:X\xb9\x85\x9a\xe3\x8c\x10\xdb\x5c;!\xec\xe7\xe9\
+\x15`\xaa\x00\x942\xec\x7fy\xe32\xaf\x8c\x04x\xdd\
+!\xfe\xf2^,\xeeq?\xdcX\x0f\xa2\xaa0Y\xf6\
+\x9fv\xd56\x15\x1f\xf42\x90H*\xad\x89\x9d\x05\x98\
+\xed\x0b`L=-2\xfd1\x11<\x97\xd7m]\xed\
+2\x12@\xcaF*e\xc6\x9aD\xb9\xda\xbc\x06\x03\xc5\
+\xc3\xf1\x09\xb4\xa1\xf0*\xe7)\x16EVo\xc7\xdf\x81\
+\xf9\xbe\xed\xdbk\xc7\x98\xff\x0e\x98\xef\x81\xe9\x9c\xad\x99\
+\x95\xb7T\xf0\x91\x1e\x14s\x9b\xb5~\x90\xfay\xe3\x0d\
+\x18\x88\xdc\xb2Q\xe7\x81\x104.2\xaf0`\x9d\x11\
+\xef\xee\x8e\x0e\xf4\x8d\xe5\xd0\xf9Qi\x1f_2\x92\x9e\
+\x15PY\xab\xae\x8bi\xaaY\xda\x14\x94\xcaN$\xc6\
+\x14QF\xdb\xaf\xeah\xb9\xf1\xf3\x81_\x9a\xad\x0c\xce\
+\x80\xdf\xe4u\x7f.!\x93\x16\x92o\x83\xfd\x06\xdcG\
+\x18\xd8\xac\x10h\x0b\xdb\x97Dy\x90\x06\x91m9;\
+\x16\x0d\x1c-\xb2\xab&\xd1o\xef\x8e\xf8\xc9/?\xc0\
+_\xfe\xcf\x9f\xe3\x07\xbf\xfc\x10\xf3,\xcc\xf3\xd1\x1d3\
+\x83_\xf1\xd4\xd8p\x133\xef \xd8\x1c\xf0\x12}c\
+k+^\x0c\x93\x18\xc7\x91\xdb\xef.\x8fb\xd0\x22\x87\
+\xee\xd9\xc1\x9d+\xe7\xd2\xc1\xc3;\xb8>|\xf4\xb9\xe7\
+(+\xc5\xca\xbapSd\xd0J_\x02\xa0i\xe0\x90\
+yL\xc3\x83\xf3(\x03\x10\xbb\xa4\xc3\x0f\x9e\x15\x88\xfa\
+U\x88&i\xc0\x9aN\x09k\x88\x8e\xb4c.B\x94\
+\xfeB\xa9'\x8fFP\xd5]D\xaabIAE\xaf\
+\xf2n\x8f\x80o\x1do\x0d\xca1\xac\x8e\xd2\x9e\xc7(\
+\x83r4\xb0C\x9d\xb4\xbd\x18\x83\x85\x9bDv\xa0;\
+\xb08r\xa6\x85\xf3\x14\xe23\x1b\xdc\x93\x8aK\xff9\
+Z\x81\xbasbi]\xc0\xee\x19\x10'#\xe6\x0b\xe8\
+\xef\x0d2\xad\xe2\xd8>\x8c\xb5\x98L+\xa1\x89~\x0f\
+\x19\x22m\xb5EI\x0b\xaff\xbb\x18W\x0bmRh\
+\xbegw`\xbeo\xfb\xf6\xbam\xb7\xcf\xa0\xbb\x1b\xf0\
+p\xb5L\xc4#$\xc5\x82\x7f\x0b\x93\xac]\x96\xd3\x16\
+q\xbd\xcd\xb9s\x13]\x1b]'S\x0c\xde\xab\x17&\
+\x89)\xcf\xb2\xe7\x97\xf7\xc7\xceH\x16\xb4\x7f\xe2\x22\x14\
+4\x8bi\xcfO\x0f\xec\x16,#\x00\x9cq8L\x89\
+)\x1f\x9e\xb6\x92\xa4Uk\xfe)\xbb/3\xe5W\xfc\
+\x9cE\xc1%\x1fF#m\x9e\xcbMr|\x83\x99\x7f\
+\xe5|O\xef\x93\xe7\x0b\x19\x19\xf0\xac\x07\x0e\x02s|\
+\x16\xe0W\x17C\x0f\xd8\xc5\xfb\xbb#\xfe\xe5\x83\xa7*\
+\x84\xe1\xed\x00\x00 \x00IDAT\xf8\xa7\x9f\xfd\x16\
+\x7f\xfd\xa3\x7f\xc1/?~\x8ey>B\xf3\xbc\xec\xf7\
+\x8c\xe6.m\x10\x92\x82fzu\xb3\xe8\xd7\xa1?d\
+\x9d\x88B\xe1\x9ep_v=\x14m\xc3\x82\xd5\xcb\x87\
+\xfb\xd6\x85\xcdX\xd6\x8f!s0j\x84\x96\x97^_\
+}\x1dW\xfc\xf9\xe7!\xcb\xbb\x91\x86E\x8di5\xc2\
+\x0e\x095\xd6\xbaN\x13\xf6\x1a`\x84U\x8a\xaa\xca\xe3\
+h\x19\xa8j\x1ctc2\xcbl2\xfeR\xf7\xbf\xb6\
+A7\xc1\xa34\xc8\xde\x1b(O\xdc\xb4\xf5@G8\
+g\xecE\x0b-\xfb\x8e.\xf3`0\xc8o\xa0<\xd6\
+\xd2\x8c\xfa:\x9a\x06\xd1\x9a\xc2\xa9\xaa\x81U\xe4\xe5\xd2\
+l-\x1c\x8ds\xee\x9aRZd$\xd0\x14k\xce\x02\
+\x94\x0a\xa1>4\x81\x9e\x16|\x07\xe9\x1e\xfa\xef\xe9\xda\
+D\xe2\xf3\xcd\x86=\xe5\xf9UU\x82\xe9:\x8d\xc6\x15\
+\xd6\x00\xfb%\x19\xfd\xff\xb4\xac\xf80\xf5y\xdb\xd5\xd8\
+\xa40]\x0b\xfcx~\x97\x0b\xbf\x03\xf3}\xdb\xb7\xd7\
+m\x9b\x8f\xd0\x8bO\xa1Go\xfa\xc9\x80\x1bv|\xf6\
+AN\x0f\x0a\xf9\x00{\xda\x14\xf0@\xf9\xc9\xc8\x86(\
+\x0c\x83\x83hqJ\x02g\x9fU_\xce\xc0\xfcK\xc2\
+\xed\xed]]<\x84\x0fs \x5c5\x8e\xf5\xde\xd5\xa7\
+\xf7\x9f\x97`\x99\x130\xcf\x5c\xec\xc8DDf\xa5Y\
+\xc2\x06 \xb7Z\x94\x0a\x80\x0f\x00\xf9&[z\x86)\
+G\xf1\xf6\xda\x96\xa97vld\xb59\xcc\xac\x8eX\
+*\x08SF\x92\x17\xa9`\xc2\xe2\xdfY\x08\xaa\x0d`\
+\x7fz\xdd\xcd\xdd\x11\xef}\xf0)~\xf8\xf3\xf7\xf1_\
+\xff\xf9\xb7\xf8\xe5\xc7/0\xcf\xc7\x13\x08\xd7l\x9a5\
+gh\xfd^\xd6\x8dX]R\x01\xdf\x94\xd8\xd8\xd9 \
+\x98oR\x042\x94\x7ft\x9aW\xff\x8d\xa9@mC\
+(\x9dN\xc60\xe1i\xe4\x1bfZ\x9er\x06\x00]\
+\xe0\x9d\xc3c\x10\xb7\x9fyjj\xcd\x84U\xd3\xe2 \
+\xbb\xa0\x9d\x8b\x04\xf4zq\xa3\xe4\xcbn\xce\xeb@\xe9\
+]9w\xf4fW\xafsnp3bv\xa3\x91i\
+\x9f4E\x0d5\xdd\xbd\xdd\xe6\xde\xb4J%\x03\xd8\x03\
+\x05-\x06kW\x1a@\xcbA\x00\x83\xd7\xe4\xcb\xac\xb8\
+\xac\xcd\xbe^\x08A\xdfx\x18{D\x8a\xd8O\xa5\x92\
+R\xae]?E\xaeV\x92\x1c\x03\x8c\xfd\x9f\xf4\x82,\
+\x09\xb9la\xebkP\xcf*\xd3\xfb\x18v\x00\x9e\xe7\
+MF\x19\x13\xfd\x80\xec\xcfBvk\x1d\x0b\xfe\xe5\xca\
+\xa2\xf4\xect&\x06\x8c#1~\xf6\x0a\xe0\x91\x5c\x99\
+\xb0\xd87\xd2\xcdS\x86a\xdf\xa5,\xfb\xb6o\xaf\xe9\
+\xf6\xfcc\xe0k\xdf+*}\xb8\xe5\xbc>w\x19\xa6\
+\xe6\xacT\x81\x03\x18L7\xdf\xc4\xea?\x0b\xac7\xde\
+9\xbd\xf6\xe1\xd0<\xca\x13*Py\x5c\x18s[\xb4\
+d o\x1f>\xd5\xdb\xc8a\xc9\xb9\xc57\x0b8\xce\
+\x98x\xc4\xc5\x81\xf5\xe1x\xf2\x0c\x117z\xe6\x9c\x18\
+x[\x16\x85\xc2\xf8u\x09\x86\xda\xa5iU{yF\
+\xd7r.\xea\xd59\xcc\x14>\xf1\xd5\xc7d\xab\x9a:\
+\xa9qX5\xe4\x1f\xca2y\x8a\xaf\x8c\xce5\xc4\xfd\
+\xf1\x88\x8f\x9f\xbe\xc4o\xde\xff\x04?\xfe\xf5\xef\xf0\xb7\
+?\xfb\x00\xbf\xf9\xf4\x06\xf3\x0a\xbc\xe7\x13\xf8^WG\
+N\xf2\x13\xb9wc\xe9\x01\x13q_\x07@\xf6g\xbe\
+\x09[-\xac\x86\xa6jS(\xaaU\xba\x97*\x14\x22\
+\xfe=Q%7\xbadJ\x0f\x10u\xf5}\xbcq\xb8\
+\x03\x83\xdc\xe631\xe7\xb1\x88j\xb8\x8dY\xe7\xed\xd1\
+V\x01DB\x1b_\xd0\x95[\x06\xd3\x03\x99\xa2\x80U\
+\xd5h.\xc7F\xf6\xa8{8)\x01\x139K\xb0\xbc\
+\x9d\x94t\xc6N\x0b\x9f\x8e\x91\xbe\x99s\x01\x96R\xf7\
+\xeb\x8eZ\xeb\xd1\x02e[\xf5c\x15{/\x97:\xda\
+\xd3a\x95\x0b\x1a(\x0b\xf8m\xddkR+\x11\x16\xfc\
+\x14\xf1\xaca\xec\x05\x16\xb2\x18\xf9\xf3\xb8\xd6\xb1\x82\x93\
+<\xa59\xa4\xb0\x96\x04\x91\x92\x8a\xd6\x86\xe0v\x9eC\
+\x0aZ/\xf0\x90\x8bZ\xe5bm\xbd\x7f\x93\xab\x10{\
+\x91g\xffH&\xf8\xa8\xd0\xa6\x99\xbe&\x22J\xcb2\
+\xd7rz\xcd\x0e\xcc\xf7m\xdf^\xc3MO?\xea\xce\
+,\xea\x81\x1e\xb4_o\x84\x9f{+A\x80\xac\xd1s\
+f\x05j\xc4\xe9\xdc\x0d@lH\xfd\x0a\x80\xf1\xeaQ\
+\xf56\xfc&.*J\xc0\xdd\xfd1k\xab]\xd3\x18\
+\x07\xf6\x8d\xe6\x98\x97\x07\xf0\xbc\xf2b\xf3\xcaF\xcd\x90\
+\x80y\xbe\xc5?\xff\xe2\x03\xcc\x02\xdezr\x8d\xeb\xab\
+\x8b&mIl<rS(,9\xc3\xc2i\xc3\x04\
+\x06m\xd0Z\xd5\x9a@\xadON\xcc\xfb\xe6[e\x03\
+\x90\xe2\xfa\xe7\x962\xa1\xb0\x1e\xaeF\xca\x06\xde\xce\x90\
+\xda\xd70gt\xf5\xb6\xd8\x11pw?\xe3\x93g/\
+\xf1\xeb\xf7?\xc1O\x7f\xfd;\xfc\xfd/?\xc6o>\
+}\x89\xbb\xe3=4\xafL\xf8\xc2\x82\x9b\xaf\xa1\x19\x9a\
+\xe7\xceD\xda\x0ct\x02\x98\xad\xfd\x99Y\x0d\x81e3\
+\xd5\x00\x86\x9c\x9b\x85\xba\x1e\x9cJ\x12\x1e\x1a[\x9a\xee\
+\xce\xd1YsY\xb4\x9e\x1a>\xe9\x12G\x89\xd4\xdf\x19\
+V\x0d\x80\xf9\xe2;\xe0\xe57\xf0\xe4s\xc8X\xecx\
+^\x03SXU\xe4\xea\xe0.\x85\xda\xc82\xa8S\x0d\
+\xb0e,\x06\x13H\xa5\xb1e4\xad~i0yk\
+\xbe\xd6$o\x19hs\x13q\xb3\xd1\x91I5\xd6\xfb\
+F<AB\xaf\xea\xf6\xab\x06f_\x1bV\xacz\x06\
+\x82\x85ar\xcbB\xd1\xac\xc9\x8a\x03\x09d\x0d:\x89\
+\xd3V\xb1\xe8\x0b\x8c\xde\x0f\xa0\x96~\xe9,\xe3#@\
+\xa7!\x86\x9av\xdf\xae\x1c\x19CL\x86\x95E\xa8,\
+\xd6Z\x18\x8f\xbc\x1f\xb8_\x91\xf0}S\x8e1\x1f\xb8\
+\xe2\xc4e\x9c5U\x95\xa9\x92(\x98\xec\x18\x14\x96n\
+\x08\x22\xe1\x7f\x87\xfc\xe9\x1e\xce\x95\x91o\xeb\x1f\xd8\xed\
+\x12\xf7m\xdf^W`\xfe\xfe\xb2\xcc~\x08\x13\xcb\x98\
+y\x96>\xa3\xf9I\xf9\x96#[.F\xd9\xaa{\xb4\
+z\x8f\xdc\x87\x02\xceH\xe4\xca\x087\x98'\xc0Y\xb8\
+5\x8cy\xc5\x90Y\x0c\xec\xc0\xa5\x95\x1d\x98\xa7\xac4\
+c\xc2t\xe2\x12ga\xd6\x1d.x\x87\xff\xf3\xdf\xff\
+\x18W\x97\xbf\xc0\x9b\xd7\x17\xf8\xde\xdb\xd7\xf8\xce;\x8f\
+\xf0\xbdw\x9f\xe0\x1b\xef<\xc2\xd7\xdf~\x8c\xb7\xde\xb8\
+\xc6\x93\xebKL\x87\xa9<JO\x84W\x16\x8e\x9f\xa9\
+n\xf1MG\x09\x05\x8c\x00n2(>+eQ\x99\
+\xa3\xba\x81\x97\xb1\xed\x86\xe2\xdc~5n\xd4\x1c!\xc2\
+\xdb\xfb#>}v\x83\x0f?y\x8e\xf7>|\x8a_\
+\xbe\xff\x14?\xfd\xe0)~\xf1\xf1K\xcc\xf3\x89\x11\xd7\
+\xbc\x94t\x12\xe6y\x91\xab\xac\x0f\xc4\x05\x98\xcf\xb2\x9e\
+\xe22\xd9\xbaj1\xed\xd9e\x1b\x09\xa0\xcb1\xb1h\
+\xe3K\xc6\xf7\xb8\xbb\x95\xe4%\xeb\xae1\x96\xd3 [\
+\x9f\xf3\xf5\x03\x95V$\xbc\x87\xb9\x03\xb3\x06\x08\x1d\xf9\
+\x16t\xf9g8p\xc2c~\xfc9'&3\xc4\xc4\
+:$\x85U\xfb\xb6'i\xd7/\xac\xda\xc0;]\xa8\
+N\xf22\xe16\x8074\x5c\x9bd\xe3\x0a\x8d\xd2\x0e\
+D\xa0g\x008\xe1]t\xa2\x14p\xbd\xae\xd5\xed\xac\
+(\xa9\xb0Eh\xf6\x8f\x94\xd1\xbe\xc7f\xc2za\xb2\
+\xbb\x98D\xf0\xbfz\x95G\x8fo\xcb\xee#\xf8\xde\xbb\
+qk\x96=\x1a\xab_=\x1c\x94\x19\xfd\xae\x95\xf6Z\
+\xaf\xb5hm\xde\xea\x11I\xb7\xa2\xc6\xb0\xfcM\xe9\xc1\
+`\xe6%\x97Y\x10\x0b\x06\xf6%\x90b.T\x8d\xce\
+\x85\x94\x06;\xb6k\xa4\xe5\xa4\xfc\xe8b\x07\xd9\xad)\
+\xb9i\xfcG\x1dDJ\x85\xabmH\xdd\x81\xf9\xbe\xed\
+\xdb\xeb\x08\xcc\x9f\xff\x0e:\xde\x81\xd3\xc5\xe0\xc95\x82\
+\xa5E\x94\x01\x1f\x80\xc3\xe34\x5c\xbe\x88\x837\x10\x06\
+\xe6\x89g\x8b\x89\x11&+\x8c\xd5\xdc>\xde\xces^\
+\x824Q\xf3\x91\xf3Z5\x9e2\x9eX\x82\xb7\xdd:\
+B\xa0\x8e\x98t\x87\x89G\xf0p\xc0\xf1x\xc4\x1d\x80\
+O\x8e\xf7xzs\x87\x1f}\xf0\x0c\xc4)\x9a}\x22\
+\xf1\xe8b\xc2;\x8f.\xf1\xe7_{\x84o\xbe\xf5\x08\
+_{\xeb\x0ao\xbf\xf1\x08o=\xb9\xc2\x9b\x8f\xafp\
+}u\x81\x8b\x8b\x03&z\xb0\xf4\x19l\xcc1\xb8d\
+gN&\xb3\x10\x86\x0f\xc4\xc2\xa8\x82\x906}b\x86\
+\x7f\xf3*\xb8o\x9eg\xdc\x1fg\xbc\xb8\xb9\xc3\xa7\xcf\
+n\xf0\xd1'/\xf0\xeb\x0f\x9f\xe2\xe7\xbf}\x8a\x9f\x7f\
+\xf4\x1c\x9f\xde\xdc\x9f\xae\x7f\x90\xa4H3f+QQ\
+\x0c\xfc\xb1\xbf\x9b}b\xa1\x81s~\x81C\x0b\x10\x93\
+!\xf8\xe8\x10\x94\x84b%$K\xc3:\xc6V\xd0\xd3\
+\xd3\x03\xc4\xe4\xab\xdc\x9b\xdd\x14\xb5\xe8\x0a\x11>n\xa5\
+H\x98y\x8d\xf9\xf2\xfb\x98x\xc0\x15\x84k~~G\
+\x96\xd4\xb4Q\xb8a\xa4\x95\xb8\xd2\x0a\xb23\xc0)\xd4\
+\xcc\x1c\xbb\xaa\x04T\x08Q\xcam\xefho0\x0eg\
+'\x98*J\xc0\xed\xaf\x0c\xcb\xa1\xe4\xe7m\xdcOB\
+\x02dsu\x8a\x9ac']\x0a\x9a\x11V\xb8\xd7D\
+\xbf[b\x99\xd6?\xdd\x14r\xb6\xed\x80\xe3>\x9b&\
+3\x99\xd0\xf5v\x1cO\x06U\x96E\x97\xc4\x17F\x7f\
+k\x01\xb9\x0e\xef\xd0\xf0\xcd\x81S\x15\x93\xce\xbbX)\
+\x0a\xc4S\xae\x89L\xe8\x15\x98\x17\x9a\x12O\xa4\xb4\xb8\
+\x92\xdf\xc7^k\x95\xcf\xc0$\xb5\xb2\x9f\xefB\xc6j\
+\xb5N-\xff\xdc\xa5,\xfb\xb6o\xaf\xe7v\xbc\x87^\
+>\x85.\x1f'p\xaa\xd0}^\xcbQ\xe4\x1e\x92\xa9\
+Yi\xf0z\x9e\x83M\xdc\xe2\xee\xcfel\xbe\x22#\
+\x5c\xc1\xc6\xa59\xf3\xfe\xf8\xc0O\x92\xf7\xc5E\x08\x19\
+\xb2,'\xe7;L\xbaY\x96g'@3\xe6\x198\
+B\x80&\xcc\xf3\xdcb\xd8\xd7x\xf6\xbb{\xe2\xd3\x97\
+\xb7\xf8\xd5\xc7\xcf\x97\xc4\xc0\xaeW%\x88\xb7\xae/\xf0\
+\x9d7/\xf1\xb57\xae\xf1\xcd\xb7\xaf\xf1\xce\x1b\xd7x\
+\xfb\x8d+\xbc\xf1\xf8\x0a\x8f./puu\x81\xab\xcb\
+\x03.\x0e\x13\x0e\xd3\xf4\x07\x1a\x5c\x95\xf7\xef /H\
+\xdb\x7f;\x06\xf4\x08I\x81lZ\xec\xd3\xf5\x9bq{\
+w\xc4\x8b\x97\xb7\xf8\xf4\xf9\x0d~\xf7\xf4\x06\x1f?}\
+\x89\xdf~\xfc\x02\xbf\xfd\xf4%~\xf3\xc9\x0d>~y\
+\xdfY\xf0\xd5)g\x91\x19I]\x82\xa2\xe2\xdf\x0a\xb8\
+\xb9\xfel=\x18\xdb\xeci\x1d#\x12\x88\x8f\xbd\xa8}\
+\xff\xcb\xb1\xca\xd0\xc0\xa6\xe0s\xefHd:\xcd\xa9\xe4\
+N\x9a[qR@^d!i\x09\x16\x8ck\x03\xa3\
+\xf0\x08\xf7\x17\x7f\x01NW\x00\x80\xb7y\x8b\x0b|\xfa\
+\x05\xb0\x06^c\xbf\x02\xd2\xa6\x7f6}/\x015\x16\
+n-\xf0 \xb4\xadJ\xb0\xd9\x15\x86>\xce\xfe\x05;\
+\x00gK\xe9\xac\x0b\x22ne)\x04=\xb1e\xd2\xe5\
+\xf2\xd9\xd4{\x06\xcb>x\xa6\xb0\x1b\x7f\x13\x15AQ\
+b]d\xdb\xeb\xeb\xb4\xdc\xbdx\xa3U\x82\x18\xc7\x94\
+\x91\xfd\x8dU\x84\xd8\x22\xc5\x86a1,\x87z\x955\
+Z\x81[\xd9B2\x18\x06\xac\xd7\xa4\x0a/\x93r\xdb\
+i\x1f\xc3J\xe4\x90\x8f\x0e\x08\xab1\xbej\xf3-\x01\
+\xca^4}\xfe\xb7\xfb\xed\x0b2\x14\xeb\x1c0\xb6\x9f\
+~\x95('\xda:c\xa5\x00\xe4W\xb7\xa6\xd2\xa1s\
+\xf9\xfd\x0e\xcc\xf7m\xdf^O\xce\x1cx\xf61\xf0\xe6\
+7\xbbO-\xed\xb2h\xd7\xb6\x8e\xc0\x97\xfd=9f\
+\xb0\xb7\xf9\xf6\xf0W\xdabk\x07\xec\xcb+6\x7fV\
+\xec\xb9k}=\x09\xc0aZa\xfby\xa9\xcd\x1fB\
+\xac\xb5\x7f@\x12Gp\xbe\xc1\x84\xe3\xf2L\x9b\xd0\x5c\
+:\xe6\x93\x06\x1d\x9aAN\x98V\xe6}\x9a\x1a\x10'\
+\x80\x99p\xa9w+p\xf9\xf0x\x8f\x8f\x9e\xdf\x80x\
+zz \x18k\xb5\x89\xc0\xf5a\xc2\xa3\xcb\x09O.\
+/\xf0\xd6\xa3\x03\xde}r\x85\xb7\x1e_\xe2\xcdG\x97\
+x\xeb\xc9\x15\x9e<\xba\xc4\xf5\xe5\x01\x17\x17\x07\x5c]\
+L\xb8\xba\xbc\xc0\xc5\xc5\x84\x8b\xc3\x84\x89\x13\xa6iy\
+\xf0X*i3U\xa8@X\x06m\x92^bR9\
+1\xae\x80v^\x80\xd3\x8c\x93\x83\xcdq\x9eq\x7f\x14\
+\xee\xee\x8exqs\xb7\xfc\xbb\xc7\xa7\xcfo\xf1\xf4\xc5\
+\xe9\xdfG\xcfn\xf1\xf1\x8b;<\xbb9\xe2\xd9\xed=\
+\x9e\xdd\x1dOr\x93\xe5\xbaX`\xdd\xbc\xcf\x8b\x9f\xaf\
+\x8c\xb8\xe0\x19r\xab\x17_\x01\xb7\x05\xe6\x16\xb47\x94\
+\xd5\xdc\x18\x8c\x7fyh\xfe<\xf5w(\xb1\xad\xab\x84\
+\xa0;\x950x]\xf8\xac#\x22X,Z\x87\x09s\
+\x8f\xc74L9+<\xa4\x06\x92\x9e\x8ax\xfa\xfe\xc8\
+\xb7q\x7f\xf83\x80\x97\x98\x16\xc0\xf5\x0e?\xfdB\x1a\
+?\x91@\x13\x1d\xfe\xf4\xa6\x81\xf6x2p\xa2i\x88\
+\xb4\xe6K+#,\x05\x88d\x0d7\x22ck\x1b\x00\
+\xc3\xcd k\xc9H?/\x9d\xd8\xce\xe04\xc2\x5c\xae\
+\xca\xb0\xad\x0a\xa1<N*\xc2\x10.dn\xa6\xe0\x94\
+\x08\x93%\x9ft\xd1\xf9\x8e\xf5\xef\xed\xbb>T\xae\x8e\
+\xda\xc286\xbf\xae\xa3\xd4\x1f\x87<\xfb\x1e5#\xee\
+3\xbc\xe6:\x9f\xf5\x11\xf9\xdd\xcf\x93k\x8c\x8c\xaeF\
+\xe1\xdc\xfb\x86k\x04\xc6\xdb\x9e\x0d\x93t\xbb\xea\xb9\x83\
+\xd5\xa9\xeb\x1fp~\xf0f\x1f\xa3\x87}\x9d\x8f\xdc\x0a\
+\x99\xe8\x00\x162\x00\xbb\xc0\xc5\xf6\x9f\x14E\x22\xb8k\
+\xcc\xf7m\xdf^_h\xfe\xc9o\x81\xef\xfc\x9bb\xc9\
+q\xc4n[\xf6<Z\xb5\x8de&dt\xf5\x1e-\
+\xd1U\xfe\xe0gt\xed\xcc\x0f\xe4\xcf\xc6\xef\xf6\x07\xd7\
+<\x9f$\x0b\x1c\x0a\xda\x8d\xae\xd2X\xd4Y#\x8b\xf6\
+\xb7\xf3\xed\xc2\x92\xdb\xb87cW\x86\x19\x12\xb1*\xd0\
+\xe7y\xe1\x95\x0c\xf3N\xae\x0dd}\x12\xb7\xc2\x1e\x16\
+\xfb\xc8\xa5\x83\xeb\xee\x1exz\xb3\xb2\x86t\xcb\xc50\
+q\xd7\x9d\x85\x07&\x12\x17\x13q}\x98\xf0\xe4j\xc2\
+\x1bW\x17xr}\xc0\xa3\x8b\x03\xae.\x0e8\x1c\x88\
+\xc3\xc4\x05\xbc\x9f^{q \x0e\xcb\xf7\xd3t\xfa\xfd\
+\xb4\xec\xff\xaa\xb9>\xd5;\xdd*r\xfd\xefq\xf9w\
+{?\xe3\xe6\xee\x88\x97\xe6\xdf\xf3\x9b{<\xbd\x9dq\
+s\x7f\xc4\xcdqn\x7f\xa3\x15\xb8\xaf\x80\xbb\x81at\
+\x80\xbd\x8e\xb1\x00\xc2\xd1@4\x02\xf0\xee\xdf#\xbd7\
+<\xe06\xecz\x97\xab\xc03\xd4qY%\xad\xd2(\
+5\xf4R\xd9\xad\x85F\xf7\x1c$\xde\xc6\x95-\xe8\xc4\
+\x15W\x16\x8cVUQ\xf2\xb4&\xd4\x1a\x1dy\xf0P\
+oE\x03'\x1c\xa7o\xe1\xfe\xf0M\x08S\x93PM\
+$\xde\xfc\x22d,m<\x0a\x81<\xf4M\xb2\xa6<\
+q\xab_ES\xb9\xbd\xd3\x9d\xe5x\x15\xf1\x0e\x13b\
+\x13\x9a\xf0\xd6\xe4M?k(\x14\x12\x064\xbb\xe6g\
+3\x0f\x92f\xee\x0bnT\xc9\x92\xd0\xd4\xb8\xc8\xe1F\
+\xb6\xa1Y\x85g\xf6:w\xf8_\xad\x9f_\xb8,\xc9\
+\xacr\xd16\x17WLl`\xb5\x85\x00\xca\x91\xc9\x1d\
+\x8d\xfb\x99\x18x]G\xe5\xdb\xf4K\xfa(z\xb1P\
+aR\x83\x95\x0c\xafE\xb7*\xa2V\xee2]\xddT\
+(u\xf3\x22\xa6\x86\xccn\x9d\xc9\xa4\xc8\xf4\x96\xbft\
+ \xbd'y\xca\x15dT(\xb0\xe3\x9a5\xd7\x9e)\
+n\x19\x14\xb9;e\x07\xe6\xfb\xb6o\xaf+0\xff\xf8\
+7\x90\x8e \x0f\xc9\xebB\xc2F\xa2\xa6J\xa0\x8a\x14\
+\x90\xe2\xab{p\x83\x0c\x8f\x0c\x81\x22\xe8Tx<\x8f\
+\xa2j\xf8\x99=\xcdWfc\x9eO\x8cy\xd2\x9e\xc2\
+\x83+\xca64\xb11\xaa\xa7\x07\xd1\x8c\xc3\xf1\x05&\
+\xdd7P\xec\xc2\x92\x0d\xc97\xcf\xc0\xc4\xb9\xb1\xe2l\
+\xcb\xc8\xe6\xeb\x06\xd0\xd9\xb4\x8a\x0en0\x83\x9b\x94\x9a\
+7\x00A#\xfb\xc8\xa7\x00\xde\x7ff%\x13\x969\xcb\
+\xc9tI-\x1a]YBoho\xa4\xebt\xe8\x0a\
+\xe4\xed TH\xd8k@\xd9\xfc\xbdd\xfd\x84\xe5\x1a\
+\xf2\x5c*\xa8:8\xb7\xff\x95\xd5\x89\xdb\xcf2 \xdd\
+\x81o\x98\xa0(\x046=\x00y\xf6\xbf0\xd7>\xfe\
+\x0dPJ\xf4\x83\xc6\x9cV\xee\xd2\xc0Z\x17\x98G\x87\
+\x17\x186O\xea\xfatK2\xd3j\x94CPV\xf7\
+\x9f\x03\x80\x03t\xf5\xaf0\xe3\xad\xd6\xef\xca\x85)\x9d\
+@<\xe1o\xbf\x18\x5c\x0e\xa4\xc0%\x7f\x873\xads\
+U\xc4B?\x99,\x1d7;\xe0\xc9\xe7\x9b,$}\
+\x0e\xa4yG\x15\xb9\xf6J\xb3\xbf\x19\xf9\x01q\xc5-\
+zy\x87\x1b\x96\x961W\xf6iW\x0b\xac\xe2F\x81\
+c\xc0\xbc\x22\xf1\x12\x22\xee\xadc\x09\xec=\x9b\x95\xdf\
+\xad\xc96\x02`\x0e\x02\xe7BRk&V\x06\x1dJ\
+\x85\xf9H\x07\xa0\xc5\xf9j\xf2\x8fX\xf8\xa2\xbb\x12%\
+\x9d\xfdjE\x8a\xf2\x5c*\xb4\x158\x99W5\xecl\
+\xe3\x07\xbb\xee\x9d\x03az/\xc9\x18\xea\x8b\xba\x80t\
+\xc7\x9f2\x07\xfcg\xbbbe\x07\xe6\xfb\xb6o\xaf1\
+0\x7f\xf11p\xf3\x1cx|\xd9\x9eHmI26\
+\xf9\xdb\x07\xb6z\xc7\xbd\xc0\x079\xb5TKn\x15%\
+\x1eI\xea\xb3\x99\xa4\x11\xf4\xf1\xb3\xb0\xe6t\x05\xc1q\
+\x9e\x03\x18`a\x19\x98r?\xdaaL\xf3-\x0ez\
+\x09\x1a\x9e\xa2\xb3n\x9d6j\xce\x19 f\x19P\xce\
+\xcedO\xa4aK\x0d\xb3\xddb\xaf\x07q\xebd\x91\
+\xaf\xc3\xb3\xe7\xa1xZ\x9c1uq\xf1x\x89\xd9U\
+`\xbeF\xb1\xf6R\x10KZ0\x0d\x85`>\xcb\x86\
+{Po\x19r\xba\x9f\xd9\xf7\xb1\xcc\xb9\xfd\xde\x80\xed\
+\xc4\x80+\x17\x02\x96}G\x0d\xe0\xfb\x7f\x0dXGn\
+\x06\xad[\x93\x9dl\xdcyr\x0f\xed\xb6\x15@\x9b9\
+N\x1bj\x83\x169_]{S|\xad'\xf2\xf0.\
+p\xf5\x1d\x08W\xd0\xfdl@\xe8\xa9\xb0{\x93\xf7\xb8\
+\xe4\xef\xbe\x98yi 4\xeb=-\xd1\x19\xa4\x83\xb0\
+\x048U$o\xbas\x14zh\xd6&\xd8\xaaBr\
+\x0e\x1b\xb4\xd8\x17\xc0X\x83\x97\xf4\xcc\xea=\x11\xcc&\
+\xd7\xd9\xfd\xce\xab\x8f\xdc\xa7\xc8\xf6\x12 \xb8\xa8\x84\xac\
+X\x8b\xa5U\xaca\xc6lY(\xbb\xcc0&o\xca\
+k\xd2\xd7}o\x12\x8fA\x03\xa8L\x10\x96\xd9\xe1\xcd\
+\xb4W\x16\xcf\x07D\x05\x96\xbd\xe7\x09\x13\xdf\xd4\xc1\xbd\
+-\xa7`W\x8f\xd6UJ*I|\xbc_{\xd5\x00\
+Kg\x09i\xe7\xb1\xd8k\xad\xe2\xba\xaf\xe7\x8fnY\
+a\xea>\xf41}\xac\xad\x92\xc4\x06\xda\x90\x8al]\
+\x5c\xcc\xea\xc5\x0e\xcc\xf7m\xdf^\xd7m>BO?\
+\x82\x1e\xbd\x9d\x98!\xefg>\xe6\xb9GD\xd5\xab=\
+\x88Q\xb07\xdb\xc0\xb14n\xf9\x9c@`\xd5<\x1e\
+\x8f\xf3\xc6\x01\x8d\x03\x94 \xe1B'\x96<k\xef\x95\
+2DFI\x94Z\x023\x08bN`\xdc\xda\x871\
+:\x91\xa1\x0a\xa0\xf0\xde\xbe|\xd8\xc5\xf2x;\x1d\xbd\
+*7\x16+\xa7\x08L\xf8\xfa\xbb9\xbf\x91\xff\x0bE\
+xh\xc1t\x00\xad\xedo\x05O\xaa\x9f\xbe\x99\x03S\
+\xee\xd9\xf4\x0c\xd6]\xa3\xe6\xa8\x00\xb0\xb1\xdaQ\xe2b\
+K\x09\x07\xec\x95\x06)m49\xfd~g\xe1=\xfd\
+\xeb\xcc\xb2~\xb3\xaf\xb3\x1e\xe5\x86\x95\xebN\x1br\x94\
+\xb0\xb5b\x94\xac\x17tw\x18\x02\x01^\xbc\x89\xe9\xd1\
+w\x81\xe9\x09\x8eGAG\x9f\xc4\xbbB\xf3\xaf\xf3)\
+\x88\xe3\x17\xc3\x98\x8b\xe6>\x08\x8d\xc4\x83\xc4\xd2\xbcb\
+c\xc1I\xc54\x8f\x88\x05y\x0f\xa8\xa0\x81\x8e\xd2\x0c\
+m\x92\x08F\x0d\x1f4KM\x07\x5c$\x8fR\xe1o\
+\x1a0U\xdbgoZ.\xc4\x06A\xa5\x15*\x13\xfd\
+\xa3X\xdcY\x8b\xc3BjA\x7f\xbf8\xce\xdc\xc81\
+bH\x13Y0\xed&\xa8\xcc9\xe5\xc8\x9e#\x05\x9a\
+\xbb\xefs\x94\xa5\xb7\xcf\x8c^\xe5\xccR\xa0\xees\xaf\
+\x94\xec\xaa \x19\xaaV1\xdc\x91\x9bU\x97V\xe4\xc6\
+UL\xc0\xc8\x85:\xdeV\x08\x8f\xca\x91w\xeb\xdd\xa8\
+6\xd7+4\x04og\xcbE\xf9\x12\xd3 \xdd\x81\xf9\
+\xbe\xed\xdb\xeb\xcc\x9a\x7f\xf2>\xf0\xcd\xef\xc3\xc7\xb0m\
+1@9Y\x8f\xac\xd3\xf0\xba\x7f\xec9\x1dz\xf5`\
+\xac\xd2\xcb\x06M\xa5\x81)|\x95\xfa \x83H\xe2\xde\
+0\xe6.\xf1\x92\x03\x16\x8f\xc2a\xbe\xc5A7K\xb3\
+SH%d\x88:O\x10\xc0;`40\xe54\xf8\
+\xc6\xfam\x9d\x9c\xc9\xc5]\xc2\x9c\xa6\x98\xcc\x08$\xdd\
+q=\x9f\x0fb\xc99>gs5\x5c\xdci\x93\x0f\
+\x0d-k\x99\x1e\xf2\xa4\x82A\xaf\xa5*a\xbc(\x7f\
+mAs\xfc\x99\xfb\xaf}C\xf7_\x19\xe0o\xc6\x81\
+\x90d+\x92\xdfG)\xfcMy\xf6\x06\x01Hn\x05\
+@\xdb>\xf0L\x94z\x09\xec#\xce\xa7i\x00\xcd\xb9\
+A\x0b\xa0\x9a\xaep\xf9\xe4{\x98.\xde\xc1\xbc\xf4\x06\
+\xb4c5\xd2*r\x029\xe1\x1d\xfe\x16\x9f\xdf\x9f3\
+\xb0\xc4\xb1\x0d.\xcd#\xb1\xf8@\xf2\x87#Y\xce^\
+\x0d\xe8\x0d&\x8c\xc4\xe8\xa2k\xbc\xeb\xcbi\x9a\x0d\x11\
+>\x7f\xbd\x8f\x8d\xedbcr\x8b\x84O\xc9;\xcd\xd8\
+~\x1c\x9b\xfd\xe4\xb8\xda\x12\xe0\xe7s\xe9vw0!\
+\xb2\xea\xe1\x86\xd5S\xaf\xc7\xa3\xf2\x18\xdc\xfcO\xe69\
+f\x05\xde\xca\x80\xda:\x9d\x00\xdeYG\xa6\x9f\xc7\x1b\
+\xd4\x07\xb0\x8c\x14\x1a\xeb\x9dz4(\xa6\x06&6\x14\
+\x91j\xa8\xd6E\x9c\x8b5\x17\x99\x96\xacQ\xac3R\
+Lo\xb5@\xde\xb7\xa6\x92\x81\x0c1\xcb(\xd1\xcb\xbc\
+\x1a\x9e\xbd\x86;\xbd\xcb\x0e\xcc\xf7m\xdf^g`\xfe\
+\xf1o \xdd\x83\x9c\xba\x1d\xd8 \xad\xd33X\xb6v\
+7\xdf\xc7e\xc8\xf4e\x0d\xd2\x87M\x9e\xac\xa2D\xce\
+\x19ew\xcd7\xf9\xaaN-\x82\xe6\xca\xb3\xae\xd6\xc9\
+\x10\xc7\x93\x96\x1c\xf7\x85O\x82\x1c#\xd2\xa6\xed\x96\xe0\
+8\x08\xa1\x8c\x94\xf2\x0a\xca\xd9\x851\xed,\xca3\xe2\
+t\xcdQ\x86m\x15\xc7\x93uq\xb1\xdac\xaf\xd0=\
+\xeb\xccJ\x85\x0d\xa1\xb1\x0e,BZ2@\xe7\xbc\x9d\
+V%\xbd\xd6KcR\x05\xe0\xb4\xe92\x0f`\x05\x99\
+\x8b\xdf\xbf\xce\x16;\xe0n\xd1gl\x1a\xb5\xb4\xbe\x93\
+\xb9\xe4\x93!(\x9f\x13\xd5 =,\x08yyT\xd2\
+\xa03\xac\xf2(\x03l\xc2\x87\x0f\xa5\xbd3Zs'\
+\xc7\xbe\xc0\xe5\xe3o\xe3\xe2\xd1\xa9\xb9s>v\xf0S\
+[9\x12\x97\x10\xde\xe0\xaf??SN\xab\xbf7\xe9\
+\xba+8Y\xef\x9b\x22\x91\x12\x86]t\xe7!0\xde\
+4\x99\xed\xed\x1e\xaal\xe8\x8a\xb2u\x98%\x13\xdd\xac\
+\x8c\x80\xc2\x8e\xaf<\x97\x1a\x8b{\xfa@0\xc6dH\
+\x04\x15vt~\x09\xf3\x9d\xcdTp\xb2uc\xeb\xd1\
+\x17\xd8\x98\xc6,\xd3\xaa\x83\x95Y\xd8&Z\xb6\xb9,\
+:\xba\xb8\x10'{\x0d\x96\xd7z\x0d\xbeL\xf3*S\
+\x12\xa8\xd5\xd9\xbb\xe5\x07s\xc2\xbc\xcc\xa5^\xe9\x15\xe0\
+\xfe>[\xe1\x87\xd5\x15nU,v\xa5\xab:_\xdd\
+\xfd\xa5\x15uI\xcbn*\x1f\x8c\x9e\x7f\x83#a'\
+\xb0N\xab\x0f\x13\xfc\xd2!\xd38\xd9\x93?\xf7m\xdf\
+\xbe\x0c\xc0\xfc\xe9\x07\xd0\xed\x0d\xf0\xe8\xca<\x01\xd4\xc2\
+\x22\xc8\x820\xc6\xc8K8\xfe\xb2\x83|n@Oo\
+'\xe0Y\xa5\x12q\x9c\xe5\xc4\xb3\xcd\xd6C\xe0\xf9\x0a\
+xbb\xa4\x0dT\x91\xba\x84\xe4\xa0\x93\x96\xdc\xea\xc8\
+\xcb\x9ad\xd5;\x16]\xf24\xeb\xca\x0a>\xf2)P\
+\xd9\xdaSZ\xdf_\xf8\x09\xda\xc5\xb2\xb7f\xc0\xe0\x00\
+\x02\x16X2\x80h\xa6\xc5\x04\x87K\xe3\x95P*(\
+\x02\x8e\x8dW~\xf5\x0a\x8f\x9f^\x9c\x7f\xa8\x00\xb9\xb1\
+\xa02\xcc\xb5\xb3\x22\x94\xc2C4T\x09r\x14\xbe\xd9\
+g\x0d\xd8z\xf3wK\x17d\xb5\xef\x0c\xcc\xbd\xfb0\
+\xd7\xf8Zs]4\x88!F\xd4\xb38/\xde\x8a\xb2\
+\x03\xa6U\x87\xcc\xf8\xb9m\xbcN\xe0t\x8d\xcb\xc7\xdf\
+\xc0\xd5\xa3\xaf\x03\xbc8\xb9\xe6\x84\x02\xd5\xca\xeaW\x8f\
+\x1f\x92\xf8\xfa\xf4\x12\x17\x9f7\xf1\x13\x18z\xb8\x97\x15\
+\x07\x0b{\xc3*D\x92\x16\x00\xf9\x01\xccj\x05l\x19\
+\xf8^\xe7\xbd4\xd8*\xae\xed\x98\xe0&\x06\x13G\xaa\
+,x#\x98\x8f\xc0\xd8\x8f\x07/Ki\x84\x899~\
+\xae\x19\x09R>\xf6\x04\x8a\xd93'\x0a\xf0\xddX\xf1\
+4i\x96z\x09\xcf~\x17\xefUTG\xce\x7f\x9b\xcc\
+\x8d\xac\xeb\x5c\xd9\x1c\x06\xa3\xe9\x0d\x8b{\xa4d\xddG\
+\xab\x02^km\x19\xf6\xc6\xcc\xb3\x0e\xf7\x8c\x8d\xa4\x83\
+<57?\xbbL_\xc1\x99,8w\x1b\xa9\x97\xcf\
+#\x16\x84\xf9<\xf6B\xc9\x13B\x8c+\xa42\xeb\x0f\
+\xbb\x94e\xdf\xf6\xed5\xdf\xe6{\xe8\xe3\xdfB\xd7o\
+8\xcb4\x9b\x80\x22F]\xf181\xad\x9c\xbe\xad\x95\
+\xa0rPD\xf1x\x1c\x86\x82\x0e \xde\x90z\x97\x97\
+\xd6n6\xaa&i\x83_\x946\x0f\x8f{\x5c\xe8\x06\
+\x13\xee*n\xa9\x84\x15\xac\x10\xadcD\xd4\x1a\xb6\xba\
+#\x04\xbb\x969\xe8\x11,\xabh\x19\x14\xebO\xadt\
+\xae\x18\xfc\xea\xc7%\x8a\x5c\xea\xe3\x188\xa9\xaa\xab|\
+\xe7\xe5 XH5\xb7<\xf04\xcfL\xba2\xa66\
+_(\x02\xe9\x08~\x95\x9b/\xedkU\x08\xec\xdd>\
+K\xa6\x85\xb3\xf8\xbb\xc0\x88W\xd7\x83\xe1=\xc7M\xb6\
+j\xee\x0b\xe9=\xc8\x9a\x95\xb5\xaf\x0fM\xc1\x1dXN\
+8\x5c\xbd\x8d\xab'\xdf\xc4\xe5\xd5[\xa7\xeb>w\x1b\
+J\x07r\x14\xd9\xf6%\x04\x0b\xc4\xd7\xf9\xc1\x17\xe7_\
+\xeed\x17\xde\x17\xe9\xc42\xd7V\x82@\xd7;\xd3&\
+Y\x0ed\x1e\xa3\x09A\xe6\x0d,\x88\xea\xb2\x10\xdf \
+I\x1b\xf9n=\xe6s\x0fu\xc0\xb3*\x83\x8f\xd6w\
+\x88\xf1fU{\xbc-\xfc\xaa\x5c\xc8\xd3N\xc7\xb9L\
+\xdd\xef\xbc\x98uW\xb7\x14\x0fN\xc33\xc1\x8e1\xe3\
+9\x14\x13\x91\xe9z\x1b\x8a9\xa4\x04\xcf[O\x9a~\
+M\xdc\xcf$/\x87\x0f\xcd\x99\x91\xe0\x88}\x0b9\xe8\
+\xc7\xfdqs\xe0I\x8f!\xe3n\x94#\xd5d\xf4\xe7\
+\xfe\x06o\xc5[[tV\xd3\x91\x97\xcd\x0ak~\x80\
+9Y\xde\xbe14\xb1\xae\x8c|p\xbc\xb1o\xbc\x03\
+\xf3}\xdb\xb7\xd7\x9d5\xff\xf0\x17\xd0\xb7\xff\xc2\xba\xb6\
+\x22\xc6x\xd4\xee,\xd9\xa9\x85\x99\xf0q\x13\xa0}(\
+z\x9f\xd7\xa4\xce\xdc\x00\xee\xdc\x06\xe7\xc9m\xe2U\x99\
+;\xc3\x94\x9a\x19\xff\xc4\x92\xdf\x80\xf3\x8b\xc5\xbf9\x87\
+h\x0f2\x90\xdd\x83\x91\xb1PA\xb0\xaeS\x11|!\
+\xe31]\x9dU\xc7\x90\xd4n\x0c\x88\xb6\x83\x89\x11\xdb\
+\x08=\x01\x8a\xb1\x81\xe2\xc1\xb4<(\xb5\xf1\xb7\xca`\
+]\xd2\xe6\xf5\xd0\x88I\xb7\xc7S}/\x0d+\x0b9\
+\x7f\xf1\xd0\x5c\xba\xf1\x1eB\x00\xfbQf\x13\xf4\xeb\x8a\
+c\xd25\x8a*\x95D\xb1\xc0Mjt\x86\xa2\xc9\x15\
+p\x08\xae#A_\x0e\x00\xd35\xae\xde\xf8\x06\xae\x9e\
+|\x1d\x87\xc3\xf5i\xd7\xe6\xe0T#\x0f\x86Z\x01\x16\
+\x00\xfa\x04\xe2-\xfe\xe6\x0b\x9c\x8c0\x94!\xc4\xa6\xcf\
+\xdc4\x1e\xc1!k-\x96\xf9\xebl\x97h|\xa9c\
+\x93'\xf3^E3!D\xab\xbb\x14l`\xc8y\xd3\
+O\xd2\x88\x0dzy\x9a\xbd\xa7\x1cC,B\x93Oz\
+\xb4l\x7fo\xa0,\xf2(l\x22q\x90\xb1p\xd0\x0b\
+\xd4-\x16\x95\xae\x85\x02;[\xf2(\xf4\x05cl\xd8\
+\xb5n$\x15\xd5\xc1\x186UP\xd6i\x163ak\
+\xf9\xbc3\xf9\xae\xaf\x05\x93\x82\xb7o\x15(gY\xe8\
+\xd4O\x9fB-\x06%G\xc1f\xd1<\x17\xfb\xd0Q\
+\xd9\xefc\xd7@\x19\xbc\xfde\x1b\xc3\x8bq\xbf\x03\xf3\
+}\xdb\xb7\xd7\x1d\x98\x7f\xf4K\xe0\xfe\x16\xba|\xec\x18\
+\x13\x18v\xdb\xf5\xa5\x17\xa0\x9b\xf4\x10u\xd4\xb0\xe9\x1e\
+\x0c\xd8\xa0\xcc\x93u\x97}Xf\xc0[;\xbb\xc8\xe7\
+f<\xd0A\xa6\x01A#\xd0\x9b0\xe30?\xc7\x84\
+c\xbd\x9c\x0a\xabW\xad9\x98\x84\x91\xe3\x03\xda4x\
+Vz\xe3\xc4\x88\xc6\x1a$\xf1NJM\x9f\x89\x9e5\
+q\xab,?\xb0\xb27\xac\xd8d\xb8\xae+\x05N\xbb\
+;=\x14\x92\x90MV~[_\x1e\x1d]r\xc0O\
+\xb0\x0f\x0b\xec\xb9\x8a\xa2\xa5\x92\xa5T\xce*\x1aX\x1c\
+\x02#\xdbDk\x00\xb9\xdd(Y%\xa2\xba\xf7*^\
+P\xc5\x9d\xb7b\x0f\xc4\xc5\xf5\x9b\xb8~\xe3[\xb8|\
+\xfc\xf6I\x8f\xba6\xdf\x8evE'\xb9\x11\x9c\xe4\xfe\
+\xf4)\x13&\x10\x13\xde\xe0=\x1e\xf1\xbd/t>\xa2\
+k&\x0c\x1e=Df\x22\x11\xa4ZFG\xddm\xf1\
+\xbc\xf5\x9f27\xea\xe6\xa6\x8a\xb3]A[Y6\xd0\
+^Uo\xed'\xb7B\x18\x5cS\x02\xe0\xa2L\x03`\
+\x08-r\xfd?\xae\x0f\xc1X\x16\xae\xe0ZEP\x8f\
+\xbb\xf7\xe3\x0435\xd0\xcd\x82\xb2\xa51_tR\xf0\
+f/Y4\xe6S\x99`Y\xf5\xd0*@\xa6i\x16\
+g5\x97\xb9\xeb\xae\xa2`\xb3\xdf\xaa\xa7\xe6\x86\x0b\x1d\
+0y\x9e\xebFM\xedQ2\xb3\xd6\xc8\xeb\xeaG\xf0\
+\x9d\x0f\xbcNZu\xb2mZM\xdbnV&d\x0a\
+qW\x12\xb5\xcf\x8d\x0d\xc9\xeb\xdc\xcav\xee\xedg\xd0\
+H\xfdv`\xbeo\xfb\xf6\xbao\xb7/\xa0\xa7\x1f\x81\
+\xef>Z\xf4\xe5\x0a\xccHgX\xc4\x9aq\xca\xe1\xa1\
+\xd6\xba\xcb7\xd4\x18\xe3\xae\xf4\x90\xf3\x93Y\xf1@\x81\
+\xce\xa7\x81\xaah\xd3\x0f\xef/KZDmjp\xb4\
+\x98t\x83\xc3|c\xce\x83\x0aj\xc8\x06g$\xba,\
+=HX\xd2Ir\xd1\xea\xed\xe1\x82\x1e$\x92\xf1\x19\
+\xc7\x8c\xf3\x18\xdd%\x1cY\xfbio@\xc8J\xb3$\
+\xd42\x13\xd8\xa6\xbe\x9c\xf4\xbay\x09\x0bp\x9e\xac\xa3\
+K\xa6:\x1fKZmPX\xe0\xb5@Z\xd5\x1ej\
+\xc8\xc2+\x15\x9cJ,\xba}hS\xd6-G\x03\xfa\
+\xb5J\x01-\xac\xc7\xdd\xd7\x86E;L\xb8\xb8~\x1b\
+\x97\x8f\xdf\xc1\xe5\xa3\xb7p8\x5c\xf6\xfc#\xa9\xf0~\
+\xe6p\xb5\xe4\xa4/\xb7\xcdv'9\xcb\xb7\xa7\x8f@\
+\xdc~\xb1\xf3\x91k\x22dL\xb8\xaf;0\x1b;,\
+\x1f\xf6Cc\xffZP\xd95\xd1\x10\x84!\x1ee;\
+ j\xdd.R\xb3\x9d<H\xb7g\x95[!\x0d]\
+\x84\x1dnR\x96\x92%\xdf\x86\xefI\x89\x8a\x1fqS\
+\x93\x9d\x9fl\x03*|#eK7\xb6\xf8W4R\
+\xb6*\x90G\x1d\xc6\x07\x8dbL\xc5\x5c\x137\xeb\xd9\
+\x80!\xfd\xd3h\xec\xa3\xbf\xb7\xbd\xcf\x19\x9ax\x9b\x1b\
+h,\xbaV\xfbJ\xa5l%\x92)\xad75\x04W\
+.6Tb\xe3\x13\xafT0\xed\xf2\xce\xeb\x9d\xa0\x0a\
+jF\xd9\x86\xd9\xb0\x13\xcdy\x86\xdd\xcb\x1d\xf2\xee\x5c\
+;0\xdf\xb7}{\xfd9s\xe8\xc3_\x01\xef~7\
+'\x80\x16\xf8\xcb7\xf3\x18\x10\xb1&\x0f\x92c\x06\xbb\
+y\xe9\xaah\xe6\x89@WY\x8e1\xd0\x9a\x0f\xd1g\
+L\xe5\x08\xaer\xc5\xc1A\xf3\xda\xe1~\xc4\xc5\xfc\x12\
+\xd4\xbdI\xc43\x0f\xd7r\x990\xa3&&1e\x0d\
+\xc8\x19\x1fD\x1bGi\x19\xf6\xcc\xde\x19!\xe2(I\
+o\x03\xa7\x8fX\xfa\xc4$\xaf\x15N\xf0\xd0FA8\
+\xb5\x9f\x13\xa5-b\x09\xcc\x19\x81o\x01\xe5\x95\x99O\
+mHVb\x13\xa7W\x97(\x01\xa8\xbc\x7f\x03\x89K\
+Z\x0e\x19\xdcg\x9b\x80\x14\xc1\x06\xaf\x92\x85\x19O\x16\
+\x07\xac\x17Px\xb8\xc4\xe5\x93wq\xf9\xe4]\x5c\x5c\
+=\xc14\x1d\xfa5R\xe7\x8a\x1b\xb6\x9dC\xd4\x912\
+\xf7\xbf.\x8bw-\xf3I\xc22q\xc2\xd7\xf8\xf3/\
+~62]\xaeI\xec6\x90\x16\xd8\xa4\xce(\xceH\
+|\xae\xac\x0d\x1f\x92\xcc\x22Z\xca#\xb9\x9a\xc87\x03\
+Z\xfb\xbe\x18\x1cc2\x09,\xd5\xaa\xb2\xcf\x86\x8di\
+F\x95f\xb9\x06\xe0\xa00\x0bI\xde\xeaA\x8a\xc8\x80\
+q\x13\xa2db~=\xfaTc\xe4\xe3\xaa\x03Qw\
+\xde\xd2V\xa1\xc6C\xbdbrtf\x1e\xef\xeeD\x0c\
+\x7f\xd7\xdd\x85\x90\x18k\x9a&z\xd8.Z\x93\xd0\x0c\
+\xf4\xa6~\x04\xb7\x14\x84\x95\xda\x0c\xaaS@U\x9a\x0a\
+\xac\x9c$d\xa7\xc6b\xa9\xf0\xd4\xef\xbf\x0b\xfb\x1c\xad\
+\xb5lI\xb9j\xd2\x8b.\x85\xf5T\xed\xc0|\xdf\xf6\
+\xed\xcb\x00\xcd?\xfc\x05\xf0\x17\xff;pq\xd5\xfd\x99\
+\xc32\xa0\xd8\x9b\x96\xd6&N;)\xb1d~\x0c\xc4\
+\xb6\xa1\x8e\x05\xb3\xbe~oC?RS\x91\xea?\x1b\
+\x17\x11fG\x8ah\xf8\xca\x05k\x960\xe1\xe6\xe4\xb8\
+\xa29<\xd0\xbd\xee\xbb'\xd2E]\xb7\xf2\xc3\xc3,\
+\xd7\xba\x95\x88\xb88\xdb\x1a4;8\xb1\xc0\xb6\x81\x17\
+\xdb\xe1\x8fh\x85f-\xc1\xb26\xdbY\x01\xbb\x09^\
+\xbe\xc9\xb00\xda\xb6\xfbY\xf9oW\x80\xbc\x02\xe2V\
+?9\xac\xabJ\x9bB\xa4@\xa6s\x9f\x9b=\xd0\xeb\
+\xc0\xa2\xe4\xe4\x82\x90\xb2X,7h\x80\xcd5t\x80\
+\xd1\x86\x8a\xbf(4\x18\x02\x86\xec6M\x98.\x1e\xe1\
+\xf2\x8dwq\xf9\xf8\x1d\x1c\xae\x1e\x9f\xacO\x17\x9d?\
+\xc3\xb9\xa9\x0cb\x90w\xef\x04\xc6%\x17;i\xa51\
+\xe0\x84\xb7y\x83'\xfc\xd5\x17K\x96\xa3\xaf\xacd\x00\
+\xceb\xac\xd0\x8d\xc5\x9cZk\xfd\x07sG\x8b\xbbk\
+e\xa1\xbc\xb9g]\x8d?\x88lO\xf3\x88\xb9?+\
+{\x90r\xd5/\x09\x92K\x16\xbfV\xe4\xe5b\x9f\x85\
+_\xb7M\xbf\xf4\xa2\x15\xd3\xeco\xc1|\x9b\xb6\x18d\
+\x8d\x06\x00\xc7\x12c\x0d$\x0a\xcf\x08mf\x9b\xd9\x06\
+x\xb3Pal?Y7\xae\xb8\xe7Eg\xbc\xb3%\
+bW\xf0\xd4@\xba\xdb\xab\x9b&\xde\xb5\x9f#\x1a\x9c\
+\xcb4X\x06\xb7\x96u\x85&\x16L\xb0\xe3:\xd7E\
+\xde\x89\x8c\x80\xd3\x9f\x14\xbe\xfa\xfey\x12\xe2\xdd\xe2\xea\
+\x8a\xb1\xe7\xa5v\x8d\xf9\xbe\xed\xdb\x97\x03\x98?\xff\x10\
+\xf3\xf3\xdfaz\xeb[\x0b\x9b#\xb3L\xb8\xc5\xb5z\
+&'\xf0\xc0\x99\xf1J\x91\xef\x83\xc7LvD\xabY\
+UX\xe6}\xcb\x1eq\xec\x7f\xae\xc0\x8e}\xeb\x9b\xef\
+\xe2\xff\xf8w\xff\x16\xcf\x9f=\xc7'\xcf\x9e\xe2\x93\xa7\
+O\xf1\xec\xf9s\xe8x\x7fb\xd3\xe3\x1f\x84\xe3\xce\x80\
+W\x869\x0a\xe7\xc1t\xf7\xdbsh\xcfh=\x14\x00\
+\x00 \x00IDAT\xd7\x93\xad\xe0GNW\xca\xc4\
+\xce\x18\xea\xcfT\x1e\xc5q:\xb6=;\xbeX6L\
+\x15\x8d\xba\x09)Q\xbe\xb8\x22\xa2\x22\x0c-\x19\xf4\xdc\
+a\xe7\x82\x82\x86\xe9E\x83\xf1\xa2\x82\xd9\x96j\xed8\
+\x9d_\xf2\x06\x9aM\xab!JMh%\xe0J_\xd3\
+q\x9e\xb1\xf8\xc2DL\x97\x8fq\xb8~\x13\x17\x8f\xdf\
+\xc4\xe1\xfa\x09\x0e\x17\xd7\xa7\xb13\xf7\x13\xcd\xaa\x12\x93\
+uv\xc9\xcc\xbb\x05:\x8a\x09\xabj\x88\xa7Y%~\
+\x9b\xef\x83\xb8\xfbb\xe7!\x13\x7f\xae\xe45\xa2\x02T\
+\xc9\x87\xdfX\xd2\xda\x98`Wm\x8db\xd5bZ]\
+\xac.g\xc9f\x89\xc5\xca^\xb8\x7f7\x17GTy\
+\x92{\xb5N'\x98\xab\xf6L\xdb\x88\xed\xcf\xcd\x9a\x10\
+\x1a\x1dCh\xe2c3A\x9b\xd9o\xaa\xf6\x9ar\x12\
+\xa1R\x11D\xbf`i\x8b\x9b\xea\xca\xcb\xfb\xa5\x9f\xf6\
+\xd5\xac`\xb0R\xbf\xfb<R\x99\x15\x11\x84\xa2\xa1\xcf\
+\x91U\x85\x10\xcd\x08\x82\xb3\x8b\xc2\xb3\xcb\xe9\x81\x0a\x16\
+|t\xdd\xa9:\x91\xd3\x1e\x8b\xd5\xd1[\xf9h\xa9\x9d\
+\xa9\xf3)Z3\xbb\x0d\xa8c\x9f\x9bv`\xbeo\xfb\
+\xf6\xa5@\xe6\x82\xde\xff9\xf4\xd67L\xc3T\xd0\xdb\
+9\x96\x1b\xe3\xf8\xb8\x12U\xa7\xb5\xdf\xc6\x98\x82\x8c\xfc\
+r\xcd\xb8\x97\x13]d\x9f\xb7\x1f\xfb\x99\xb2\xcf\x18\xe9\
+\xea\xf2\x02\xdf\xfc\xda\xd7\x81\xaf}\xbd\x81\xb6\xbb\xe3\x11\
+/on\xf0\xfc\xf9s|\xf2\xfc\x19>}\xf6\x0cO\
+\x9f?\xc3\xdd\xdd-4\xcf\xa7\x18L\x09\x98-\xa8\x85\
+\x03XV\x1c,k\xc3\xa5\x92\x223\xa8\xae7S\xf5\
+S\xcc\xa6\xcb\x8cY\x1b\x11\x9cI\x01F\xc8\x9f\xe7y\
+\xb1\xba\xab\xea/\x956\x80\x01\xf3Yp\xe1@{\xed\
+O\xef\x18K\xa7\x9d\x0c\xb6\x1f\xaa\xd1\xab\x0aY\x0aY\
+\xb3\xe4\x12\xce\x00}\xa4\xf7+\xbas\x93\xde:\xa3\xd9\
+\x22\xc8\xa8X\xda\x19\xad0\x98\xbcnK\xf7\x02<\xe0\
+\xf0\xf8\x0d\x5c<z\x13\x87Go\xe2\xe2\xfa18]\
+\xf4\x1e\x0d'S\x19\xb7\x14D7\x17!HX\xe0W\
+\x91Z\xa8b\xf8z\x05\xe5\x07\x12\xef\xfe\x1ed,\xa0\
+m\xa1\x1cU3ql1\x05%y\xc9\x94\xb2\xfe\x85\
+&\xe8\xc6\xad\xfa\xc95\xbd\xa3\x98\x8b\x88\x22\xdcA\xf6\
+\x1e\xf5H\xca\x03\xed\x5cx\xf9\xc8\xf6\x05@\x99 %\
+\x99\xc6[\x0fP\x8d\x5cEq\xd8\xb2\x01\xe0\xd8z\xaa\
+\xa2\xc8ia8\x8b\x9d\x9f\xec\xe77\xa3\xef\xfc0\xf0\
+\xb9\x09\xfdZ0\xce\xda=\xae\xb8\xcb\xa9Z\x15E7\
+\xd7\xd8g\x8b\xca\xde\x9c<Qm\x89\x0a\x91\x08\x93\xa8\
+\xe5\xb6\x12\x91\xca\xdf\x90\x01\xe8\xbb\x0a\xc0\xb1\xdc\xcc\xed\
+Da\xbfLi\xe5\x03\x9f\xfb-_<\x95\xd8l!\
+}\xe1X\x19\x8b\xb6\xe6O\xd2|\x86\x91\xeb\xec>\xe6\
+\xfb\xb6o_\x9em~\xefG\x98\xbe\xff\xbf\x01\x87\xa9\
+M\xba.\x1f\x22t\xb9[`\x8d\x0d \x96\x1a?C\
+\x9e\x07]3\x8f\x01=\xac\xda\x04Y\x07\x1d\xb1v\x13\
+\xcf\x0b\x9ac\xc1\x8bk\x06u\x13:quq\x81\xab\
+\x8b\x0b\xbc\xfd\xc6\x1b\xf8.\xbe\x05\x008\xce3n\xee\
+\xee\xf0\xe2\xe5K<{\xf1\x1c\x9f>\x7f\x8e\xa7/\x9e\
+\xe1\xe9\xcb\x97\xd0\xf1xz\xc8\xcd3\xe6y\xee\xab\x0f\
+s_\x89\x90]n\x0eV\x82di\x0b\xe0\x1a\x15\x15\
+BF\x89\x88k\xe9\xd0yozUj&=a\xaf\
+9\xbb\xe0xJ\xde\x83F\xc4\xf0\x9e\x1a\xba\xabd\xde\
+\x8c\xfeW#\x10\x9eWfjh\x16\xc1:\xd3\xcf*\
+\xb7\x97\x08\xb2\xc7\x8e0\x1br\x93\x81?z]\x08T\
+L\x9f\x016\xd3\x04\x5c^\xe1\xe2\xd1\x1b8<~\x13\
+\x97\x8f\xde\xc0t\xf9\x08\xd34\xf5\xb7\xb1)\xa0Bi\
+S7\x1a\xe16\x09\xbd}\xaf\x5c\x08\xca\x189\xael\
+y\x03\xe5\x8b\x8c\xe5k|\x89G_\xa4M\xa29W\
+\xdd\x8by`A^\x1d\x1d+\x9f\xe7\x15\x8cD\xdb8\
+s\x9f\x05\xdaX\xa3\xa6P\xa3\x97\xb6\xa0\xd5I/\x22\
+\x9b\xa9\xce\xca7\xa0m\xe6\xd1f\xe5g\xdd94\x80\
+\x9a\xf4\xc0\x98\xb0*o\xd5\xcd\x94\x0a\xefd\x8b\x9e0\
+g[P\xcf@,G\x7f\x97v\x9a\x8dBH\xc9\xb3\
+\x9cp}\x99\x0c\xed\xd0N\x1a\x22o\x14SN\xcf,\
+\x81n_\x85\x0ck\xb3V\xb2b\xf9\x98\x85\x05\x88\xf5\
+\x93TI@\xd4\xedk\xd7\xeb\x05\xfb\xac\xb2\xa4\x89\xb9\
+\xd5\x19J\x033.\x9d\x1f<\xc3\x93\xad\x92\xb9Xp\
+]0'k\xb1\x17e+J\xd6\x9cp\x85\xf9\x0e\xcc\
+\xf7m\xdf\xbe,\xdb\xcb\xa7\xd0'\xef\x81_\xfbWn\
+*\xf6\x93v\x0ed\xe8\x0dw\xdd\xa6\x89R\x99\xbc\xf9\
+pW\xf1\xc2cx\xf0\xd7R\xf6k\x8d\x10*\xe7\xf0\
+\x0d\xdaZ\xf5\xf0\xd3u\x98&<\xb9\xbe\xc6\x93\xebk\
+|\xe3\x9dwZ,\xfc\xfd\xf1\x88\x9b\xdb[\xbc\xb8\xb9\
+\xc1\xcd\xcd\x0d\x9e\xdf\xbc\xc4\x8b\x9b\x97\xf8\xf4\xe5K\x1c\
+\xef\xefN\xa0`\x9e\x17\xab:\x19\x0f\xe2\x85q\x9fg\
+\x0f\xb6MT<\x11\x1e\xe2\x8c\xf6Z\x01\xfc\xa9\xc6\xbc\
+\xc3\xa6\xcbWj\xaa\xadY\xe4\xe8\xc5>\x86\xdc\x1a\x9e\
+\xf4ase\x90_\xa8\xd8/\xc5\xab\xae\xf3\x80Z\x0f\
+\x94\xc4d\xedy\xa1o\x8f\xc0\xc9\xa1\x8e\xa5/\xe1p\
+\x09^^\xe3p\xfd\x04\x17\xd7\x8f1]=\xc2\xe1\xea\
+\x1a\xd3\xe1\xd2\xafX!0\xe2ea\xe2\x8b,\x06\xc0\
+>\x22\xf1\x5c2\xa1\xebK\xf0\xa0_\xf2\xa6\xa0\x04\xf1\
+-\xbe\x07\xe2\xf8\xfb\x9b\x8b\xd6{:\xa8\xdeT\x1cI\
+\x13\xe60\xc4\xa9\xb7\xe6\xbf\xb0rA\xdbT\xd7\xcb]\
+\xc61SX\xdd\xa5\x96\x18+\x09\xf2\xe6&av\xf1\
+\xbe\xad\xac&\xc5\xe8\x92R\xf1\xea\x11h\xdaB\x83\x8c\
+\x0a\xf0\x855\xf5\xc0\x9d\xe1\xda\xdbO\xd0b1\xc9\x98\
+\xfak4\xf7t\x80S\x83\x99\xd9\x80\xda\xd0y\xea\x0c\
+\x84\xda[\xf5\x93\x97\x95\xec5\xe9c\xc7*\x8b\x94\xd2\
+\xd6\xf8I\xba\xcf\x8e\x82J9U\x8a\x97\xf9\xc8f\x0e\
+\x90I\x9aY\xf6\x0a\xc8\x8eI\x9f0{Z\xe9\xac<\
+!M\x11%\xdb\xf7`\xa5X\xac\x16\xc0\xc2\x9c\xe3\xad\
+icc\xeaz\x9f\xec\xc0|\xdf\xf6\xedK\xb3\x09\xf3\
+{?\x05\xdf\xfd3t\xa5\xa9iV,AK\xe0\xa4\
+\x8b`>K\x95\xcbM8\xd9\xc70\x02\x9e\xc6\xfa\x18\
+:\xb8\x0c\x1f\xaaH\xf6\x82I\xf4{\xab\x1a\xa0\x13\x0f\
+3}\x89\x13\xfb\xf2\xbe\x97\x87\x0b\x5c>\xbe\xc0\x9b\x8f\
+\x9f889K8\x1eO,\xfb\xdd\xed-^\xdc\xde\
+\xe0\xe5\xcb\x17xv{\x02\xf0/\xefnq<\xdec\
+\xb2 |\x9d\xe5-x_\xbd\xa7W\xd9\x8cR\xc0\x9e\
+\x87\x8c\x1aXw\x8da\xb7O\x15dpS(\xcei\
+*\x94\xb0\xa19\xd7\xf6H*\xbd\xc7\xd3j\x80]\xea\
+\x8f\x8d\x91\x03\x89\xca\xe0g\xd8r\x86\xb1{%\xcf\x1f\
+\xca\xad\xe3\xa0\x07=5\xdd\xc7\x04^^\xe2p\xf5\x08\
+\x87\xab\xc78\x5c?\xc2\xc5\xd5#L\x97\xd7\xe0\xe1\x22\
+\xf4\x14\xf4\xfd\xd8\x0a[bt\xe2)Nt[q\x91\
+\x92Y_\x03\x99\x0b\x03>\xc7\xe0#u\xd4\xd4\x19\xf3\
+\xde\x03AL\xb8$\xf1.\x7f\xf2\xfb\x9d\x8a\x8a\x06\x93\
+\xe8\x03-\xe3v\x22e\x97$\xb7\x22\xe4\x80\x0f\x0a8\
+\x13\xfb\xa0\xe5X\xc9~\xee\xac\x14\x85\x0d\xfc\xc0q\xa8\
+~\x10uF\xd5:Y\xd5\xba\xf7\xce\x9a\xd395z\
+v\xa4p@q\x1a\x9d\xe8\x8e\x94\x1bG9\xb2m\xb4\
+\xbal7\xaf\xa9%\x9c\xcaJ.\x5c\x93n&9\xfc\
+e4~\xebBxn(\xb0\xcft\xd7B\xe2f$\
+\x86obE0\xe4RZ6\xca=\x01F\xe4C\xbb\
+nB\xb7\x02\x93\xaa\xb5a\xf3kH\xa1=CPq\
+}/3\x8e\x95\xae\x9fZal\x8d\x07\x10\xc2\xfd\xac\
+sOj`^Vnv`\xbeo\xfb\xf6e\x82\xe6\
+\x1f\xfc\x0c\xb8\xfbw\xc0\xd5\x1b(\xc3T\x9c\xdc\x83\x03\
+t\x96C\x8a\xa3+\x0bK0\x8eAL3*7\xae\
+$\x9a\xe1\x06\x1f\xaf\x00\xa2csc\x0a\xc18\xf3~\
+\x19\xfc:\xa2*'0\xe2\x14a>]L\xb8\xbc8\
+@\x8f\x1e\xe1k\xc6\x83\x5c\x02\xee\xe7#\xee\xef\xefq\
+ww\x87\x97\xb77xq\xf3\x12\xcf_\xde\xe0x\x7f\
+\x87\x9b\xfb;\xbc\xbc\xbb\x83\x8e\xf7\x80\xb3\xff\x8a\xc0J\
+^\x83\x80\x93\x9c\x86\xaa\xe2\xed\xe99?+\x9bUv\
+C\x84|#b\xdd\xc0Yp\xb2[\x8c\xb8YkV\
+\x02\xe4\xfe\xf8\xe4\xbc\x8c\xe1\xd8:m\x84\x06)\xd1b\
+y_\xe2\xcaO\x06\xf4JE\x81\x00p:\x80\x17\x97\
+\xe0\xc5\x15../q\xb8\xbc\xc2\xc5\xd5\x09\x80\x1f.\
+\xaf0\x1d.\x5cQ4k-\xd2\xea\xa2 \xd6\x0dL\
++\x1e\xf2Z\xf2\xd6\xd4\x99\xfb\x8d-&\xf1\x8dq\xc6\
+\xeaN\x08\xad\xaej+?>\x80\xe8\x04\xcaI\xe2[\
+\xfc\x14W\xfc\xe0\xf7\x85\xc8\xfdxb\x8cud\x02\xd0\
+>\x03\xa1(\xb0\x87\xabi1\x0c\xac\xf7mD\xe6\xfd\
+\xc4>{\x92\x22.\xb20\xd5\xf7\x1a$\x18w\x1d6\
+\x0a\x89\x8du\xe8p|4\xabU>\xe6FYY7\
+\x9f\xc0\xb230\xe5\x01-\xd2X9\x8a\xc0d\x8f$\
+4\x9fv\xa5\xb6\x82\x97yw,Y\xc1|}^X\
+\xaez\xb9\x15\xd9f\x85\x98g|+\xc7\xb3\x0d\xadq\
+\xde\x8d`9#\xe3E\xee\xa4\xee\x0c\xe328\xd6\x15\
+\x04+I\x89\xcd\xa8\xa1/tMp\xf5\xd7\xb1_\x9c\
+8.\x9c\x93\x8b\xadM\x9d\x8b\x93\xd5\xe7\x9b\x95\x05\x86\
+\xfb\xa6\xeb;\xd3\xca\xcf\xdaL\xba\x03\xf3}\xdb\xb7/\
+\xd3v\xf7\x02\xf3G\xbf\xc1\xf4\x9d\x7f\xd3Y\xf3\xa8\x85\
+\xac\xba\xe7Q\x04\xc1\xcb#=?\xa9W=\xa1U\x92\
+g\x14\xa4\x03c\xdf\x15\xf9\x08\xe6\xc1sl\xfc\x18(\
+\x80WYf\x14t|\xfc\x85\x0c\xd8\x1cP\xf8.\x08\
+\x83\xc0\x05\x0f\xb88\x1c\xf0\xe8\xfa\x1ao\xe1\xcd\xc4\xba\
+\xad\x8c\xfb\xfd\xf1\x1e\xb7ww8\xde\xdf\xe1\xf6\xfe\x1e\
+7\xcb\xd7/o\xef\xf0\xe2\xee\x06\xba\xbf\xc7q>\xe2\
+8\xcf'P\x1e\xd9\xea\x95\xd1\xd6\xca\xbe\xfb5\xd1\xac\
+}Wa\xf3\xc7\x0d\x06\xdc\x8bIX\x00\xf22\xd4'\
+\xfeMd\xcd\x09'UQ\x0e\xfd,\xd6\x04\x94\x9b=\
+1\xb2@\xb4\xa8\x7f\x828a:\x5c\xe0py\x89\xe9\
+\xea\x1aW\x17W'\xb0}y\x85\xcb\x8bK\xf0pq\
+\xfa\xfd45fkVg\xd2\xe7v\xba{\xa4\xfd\xac\
+Q\x18\x92\xddc\x1f7\xee\xec+7\x16u\xa8|\x9b\
+0@!%\x18\xd4\x13%O \x9cf\x98\xc8\xd4w\
+\xeb;M\xf8&\x7f\x05,\x0d\xc3_,$G\x0b\x04\
+\x8a\xa5\xf6\xda\x94\xc8\x22\x12@NBb=\x02\xd7\xbb\
+8\xa7*\xb8\x86F\x9b\xc5Pr\x0d\xbd\x18\x12c4\
+\x9a\x1f6\xa9i\xd2X\xe4\xb1*8bY\xd64\xc5\
+L,o\xf3?\xb7\x00\xae\x90\x92\xb4\xa6\xf0@\x88\xf4\
+\x97\xb3\xcepXmZ\xd7\xfd\xb5\x9e\xf1b\xe9\xaa\xb5\
+2\xb4\x94\xca\xf5/\x16\xce7I\xa2h\x1a\xf8\x93]\
+\xb82\xa9\xe2%(EBjs\x9dJ\x13\x8f)\xde\
+|\x01N\xc5\x8b\xe9\xc9\xf4\xb4\x8abGh\xb5b\xd5\
+RJ\xd3\x95\xe9!k\xaef\xa0\xeb\xfd\xb0L\xbc\x10\
+\xc7)P64\xdb\x1ak\x95/\xb1.}w`\xbe\
+o\xfb\xf6ec\xcd\x7f\xf5\x0f\xc0\xb7\xbe\x0fL\x97\x91\
+\x22\xef\x93\xa3\xeb\x04\x0a\x13\x9eh\x1aP\xc6!A\x85\
+\x93\xeeP\x0e\xa3\x00>\xaa\x86\xa7\x8a\xdd\x1c&\xec\xb9\
+\xfdPbX\xe2\xe3G\xaf\xa0\x8ew\x93\xf0Y\xaa\xbd\
+`5\xd3[\x9d>{\x020]\x1cpyq\xc0\xe3\
+\xeb\xeb\xcc\xd6/_\x1fuj8\xbd?\x1e1\x1f\x8f\
+\xb8\xbd\xbb\xc7\xed\xfd-\x8e\xf7\xf78\x1e\x8f8\x1e\x8f\
+\xb8\x9b\x8f\xb8?\xdec>\xce8\xce\xa7\xd7\xdd\x1dg\
+\xdc\x1d\xef\x81y^\xa2\xd8\x03p\xef\xbey\x8d]\xb2\
+D4K\xc9\x88O\xc5\x94\xfc\x95\xaf\x00=\xb5\xc2>\
+9\xbdu\xeaD\xc6\xc8\xe1$\x9c;N\xe0t\x80\xa6\
+\x09\x9c&\x5c\x1d.p\xb8\xb88\xc9I\x0e\x07L\x87\
+\x0b\x5cL'\x10\xbe\x82\xed\x8b\xc3\x05\xa6\xc3\x01\x9c\x0e\
+\x98\x92\x87\xbb\xdc*Bk\x0f0\xedmj\xbd\xbe\xfd\
+\xbeq94\xa9\xbc\xd9\x1a+\xda\xa8\x0a#Z\xa7\x97\
+)\xa0\xfb0\xaf\xfa\xe1\x15\xa4\xcf\xeaw\xa8\xc2\xbe\xaf\
+\xf5\x8c\xe6\xf5=\x09r\xc2#\x0aoM?\xfd\xfd\xcc\
+;\x168:\xca\x7f\x95\xad\x08U,O\x0f\x8e\xf1\xa0\
+\xdd6\xeaU\xc1\x07,\xd1\xe9@2aL\xb5e\xb4\
+\xc6\xb4\x85f\xd0 [\xc9\x04\xc3\x9b\xd1yZf\xef\
+\xf2\xd2\x81\xb3\x88\xb2\xef\xc0\xd0\xc8\xd5\xac\xc6\xbe\xa49\
+\x14D\xeb\xb9\xb8\xf3\xfe\xd9\x1a\x9e\x17:\xf9E\xe8\x1e\
+m\xce*\x18H|\xe8Xa\x9a\x9b\xc3s+\x1bK\
+\xa5\xd1\xf5\xc8\xf6VVv\xbb\x8c\xf3I\xbc\x07\xd9V\
+\x17\xfb\xf5,B\x84h\x92\x9aX\x81\xf3b\xad\xa4\x15\
+U~\x99B\xcb\xcd\xd6V(I\xb7*Hq\xb8b\
+\x10Ww\xabE\x01k\xea\xb8\x16\x0b;0\xdf\xb7}\
+\xfb\xb2\x01\xf3O\xfe\x05\xfa\xf4C\xf0\x9do/7}\
+\xb7Z\xca\xcc\xb1i\xb8\xda\xd2\x97;*\xa0\xd6\x97{\
+\x08\xcc![M\xd3\xa8S{\x11\x17\xecG$R9\
+\x02\x07\x91\xeb\x156[VS\x82]\xe4\xd9\x1f\xd2\x04\
+\xb9\x81\xb7\xf4\x80v\xcc\xf01\x13'L\x87\x09\x97\x87\
+\x0b\x08\xc2\x93\xc7u\xaac\xc7|jl\xee\x89%\x9d\
+;;?\x1f1\xcf3\xe6\xe3\xfd\x09\xec\xdf\x9f\x00\xfd\
+\xfd\xc2\xc6\xaf\xaf\xd7|BqZ\x1a[\xe7\x05\xc4\xcf\
+s\xff\xfe(a^^\xdb\xd9\xfa\xb9\xe9\xb1A\x82\x13\
+q\xe0\x84\xc3tJ\x96\x5c\x1f\x82l\xff\xd6\xd7M}\
+\xa9\x81\xc44M\x98H\x1c\xa6\x03\xa6\xc3\x018\x5c\x80\
+\xd3\x01\x87i\xc2a\x9a\xda\xebX\xc1\xe1\x10T\xa4\x00\
+\xb8\xe5\xfd$2(\x87\x05\xe5y\x98Y\xd7\x0e\x85e\
+\xf6\xa4'O./\x91Gg\x05W\x8a\xf1\x9b\x87\x86\
+m\x0cK\xfdn\xc6\xab<\x81s\x00\xd3\x22e\xf9\x0e\
+?\xc0\x05>\xfd\xbd\xcc;V\xd4\xe4-\x01\xe1\x80d\
+e\x96\x02{l\x0e+\xc9k\xff\x03\xc8KJ\x17U\
+>\xd3F\xf2F\x96r;\x0e\x1cE,\x83^\xcc\x9c\
+\xeeZ\xae\x12\x88R{\x9e\xe4,~%\x04\xd6\xc5f\
+\xab\x7f\xa6\x014\xe5#\xb4F\xf0\xe6\xb7\x82]~\x19\
+%\xf30\xa2\xe9\x12\xd0Z\x80\x9c\xa4>\xaa\xc9\x9c\xee\
+\xfd\xcd\xb0k\x85\xab\xb9\xcc}\xb0\x80`w-s\xa8\
+\xaa\xb1\x9c\xb5 \x9c\xed\xfa\xf5\xe7\x1a\x93e\xb0U\x8d\
+\xb81L\x98\x22nP\x84\xba\xd2\x83y!e\x1d\xef\
+\x81y'\xbc\xbbV\xca\x8f]V7\xc4\x90\x8a`V\
+Qv`\xbeo\xfb\xf6\xe5\x83\xe6\x98\x7f\xfdC\xf0\xed\
+o\xf5\xa5`\x1a_\xf3\x06\xd2\x95\xf9\x86\xb04\xdcc\
+\xa61\xe2n\xdc\x1ck\xbdp5\x9a\x80\x0b\xcc\xbb\x1d\
+B\xe4\x88\xe7\x01\x15\x9f\xe1\x81\xf7F\xaf\xbb\xd0\xda\x04\
+\xe9\x18r\x0d\xe1\xb6\xce\xb1\x9e\x16\xec{\x93\xef1\x90\
+\x17\xce@\xb4-P\xde\x1f\xca\x07N\xcb_-\x80\xf8\
+b\xf4Y\xaa\xd4+\xd1\xa1<<$\xc3\x99Q`\xd7\
+]\x1a\xab\xb7\x82T\x00\xc1\x91\xb5v.\x82\x0a\x9e,\
+\xc5{(\xd8\xba\xa4\x1cNi \x8d\x19\xacl,\xc3\
+d..{\x0ch\x22\xcd\xeb\xec:\xcc*WY\xf5\
+\xcd\x01\xe8\xc7\xa6=\xff\xd7=\x1d\x96\xa2\xd3\xa2\xa7\xfd\
+%\x80\xd9\x98\xde\x9bb\xa4\xb5{\xcb\xda$ri\x22\
+\x9bp \xf1\xcd\xe9\x9f\xf1J\x9d\xd1\xaf\xca\x98\x13\xf5\
+J\xdb\x00f\xba\xebD\x03nlE$yF\xb9\xb9\
+F)\x05\xcat\x17\x17z\xc6>\x88\x88i\xd8\xe0&\
+Y(\xd2:O\xe346\xd03[\xeaa\xc3\xe5c\
+y\xbdsej\xa4H\xa80V\xfbAf;\xfe8\
+\x92\x18\x9a\x12|\x101#/ob\xc7\x94\x9bn\x99\
+\xef\x91\x9aI\xee\xdapV\xae[T\xa2dl\xc3v\
+$\x81X\xad\x84\xb8E\x14\x16\xd6\x88\xc6\xd2\xc4\xaa\xc6\
+\x5cQ\xe6W7R\xf3\xa7\x19\xb0RQ\x93\xb8\xd4\xce\
+`\xa3\xe3*\x83uu\xb9\x88\xd3\x92\xddg\xb9\xa6\xd0\
+\x0e\xe6}\x9fN\x97;\x95w\xca\xd2C\xd0f\xf8}\
+\xdb\xb7}\xfbRA\xf3\xf7\x7f\x02\xbd\xfc\xf4\xc4\x86\xae\
+N \xee&\xd7\x90\xa5k\xc0\xcb\xd0qV\xc7\x5c\x92\
+\x82\x06<*\xfcR\x82qV\x0e&%\x9b\xccr\xd8\
+O\x85\xbf\x8b\x00\xdd\xbeq\xc5d\xda\x86\xca!T\xe6\
+\xf07*\xf2sT\xbd\xd7\xe2\xaa \xe0\xbc\xed\xa0\xce\
+ \x1dmX@r\xe3\x9d\x85B\x9d\x0b\xa7\x01\xcee\
+@\x94rh(\xd1h\x9e\xd8(\xd2\xcd\x93t$\x9f\
++\x0f\xca\x85\xfci\x03\xb0mG\x9c^\xa5\xb8\x19\x9f\
+\xabx\x94*\x0a\x9fz\xdc\x16Tb\x9194Z\xee\
+a\x90\x0f\xb9\x07\xbb\xe8@\x80-x#{jC\x84\
+\xecx\xe9-\x10\xa7\xcf\xfc\x1a_\xe0\xc9\xef#T\xc8\
+\xdd\xc6m=?\x1f\xb7=^ef\x91\xc5yd\x19\
+<&S\x0c\xb1\x94\xa9\x89\x18\x95\x01\x8eqN7\xb3\
+\xc7\xdeM\x06\xe4oo\xd5\xc3.\xca7B\x9f\x07\xbd\
+!x\xbf~+\x03m\xc2\xa9|.eH\xb2\xa5\xd7\
+1\xfb\xd1\xc3r\x92P\x1bo\x91\xbd\xd5\x908P9\
+~\xe1X~\xd75O\xb9\xf6\xc60%\x16X\x93\xae\
+\xb8t2 W\xb0 \x9d\x7fV\x0e\x03\xcb\xaa\x9c\x22\
+kM\x0e=G\x09\xa5\xf9\xcb\xadB\xb4\xca\xcd\x17~\
+\xcc\x8c\x86\x9b\xe1\xc4\xea\xda\x17\x93\x05}\x830\x9b\x86\
+\xdd\xb7\x9c\xc6\xc5\xdf\x1d\x98\xef\xdb\xbe}\x19\xb7\xe3\x1d\
+\xf4\xdeO\xdb\x93Z\xe6\xa9\xed\x96\xf4C\xc0\xcc\xa6\xf0\
+\xc2\x86IT\xe0i\x0b\x12i\x84\x9d<;0v\x0b\
+Q\xc9\x16k\xf4\xbe\xceB7\xcf\xc8\xf1!\xa6\x0d\x84\
+W\xf9\xf6~\x1eVq\xf4Q\xda8\x86\xad\xdc\xc4\xac\
+\xd7\xae\x8a,c\xd3\x18O\xff@\x02\x1d\xc3\x8a\xa2\xbb\
+\x88\x0b'\x0a\xc5\x97\x1d\x03)X\xc8\xb1\xbc\x91G6\
+?W1\x16\x5cF\xb89\x13\xac\x8e\x81\x99U\x17\xce\
+\x9cto\x15Y\x95qD\xa1\xa6\x92\xffyd\xcf\xa8\
+\x81\xd5\x9a\x88)\xbe\xd6\xdc0\xb4\xf6\xe9n\x01\xa8\x06\
+x\xf6\xbe\x98W}9'\x90\x13\xbe\xc7\x9f\xff~\xbd\
+\xcb\x01c.^\x88\xd8\x9cf \xf8\xb6\xb3\xbe>2\
+A-\xf1\x22\xac\xc4i\x94,\xaf\x05\x80\x8a\xe0Q\xb9\
+\xa5<\x1b24\x98\xaf\x98\x19\xe8N4T\x9ats\
+o$\x91\xb0\xdc\xc0!\xac\x8e>43\xc2\x04\xea\x14\
+\xde\xdbm\x0f\xe8\x01{\xab\x8b,(\x1c\xf9\xb1\x86\x19\
+\xae\xb6b-@\xb6B\x01\x12\xba\x1cb\xc1\x95\xcbN\
+s\x9e\x98\xc5\xe2=Y\x93\xae\x08\xea\x87\xce2\xc0H\
+\xb6\x98s%\x8e\x92w\x17\x95\xa0o~n\xc4\x89\xb2\
+ud\xcbk\xc1\x9bD\x8b\xee\xa1\xd4\xa0\xb6\xbf(\xf0\
+1\xa3\xc9\xc7hI\xfd\x1c\xcfS\xdc\x81\xf9\xbe\xed\xdb\
+\x97w\x9b\x7f\xf3\x0f\xc0\xfd\xad\xcd\x014V\xda\xfe{\
+\x0b`3p2.\x1b\x89 \x08@l\xa3\xcf\x8d\x05\
+`\xb7\x8e\xd2g\x9b(\xa1!8M\xec\xb5\x02\xc3\xcd\
+\xfeY*\x98\xa83\xa4\xf50\xa5\xb1\x9a\xc0\xc7\xe1?\
+#r;\xc6()?\x0f\xaas\xa91\xbaW\xa4\xab\
+\xce\x1f\xe1\xf08\x1f\x84g\x13\xa8\xd9\xd6\xf6+#\x8d\
+q!'\xd5\xac\xa4\xf2j\x8d\xb5\x84\xc4\xe6\x1a\x0c\xc7\
+\xa3t\x94ZX\x14<\xaci\xdav\xcf0<\xedY\
+\x80\xf8X]\xd2B>\x15\x90F\xfek\xa7'\x97\x05\
+\xe5\xfd\xbd\xde\xc0\x11oO\xff\xf4\x87\x99xh\xe6\x91\
+\x18\x85(E\xca\xb2\xcb\x15\x22`_\x00T9&W\
+p\xca|\xed\xd8R#\xfd\xcd\xb0\x9eS\x1b\x18\xe3`\
+cA6\xd3\xe5\x0f\x0c\x8aVs=Z\xb1\x10<\xee\
+\xb9\x007\x05I\x97h\xc2\xa186.\x0d\x10\x14\x0a\
+\x5c\xb6\xe2\x8aD\xe9d3\xb2\x9d\x8c\xa6\x80\xe6<r\
+\xb0\x82\xa8\x82\xfc\x16\x9c+P\xb0\xdb\xf1p\x9f\x1d \
+\x97\x8c\xbc5\x22pCk\xb4N\xa9.\xd7a(\xa2\
+\x16f\xde\x83\xfc\x10\xc0g\x87\x9f\xccu\x8a\x0b.\xe2\
+\x02\xea\x03\x98^{\xa6\x8cV\xdf=;\xe3Xe\x0f\
+S\xabDo\x14\x8aN\xd0>\xe6v`\xbeo\xfb\xf6\
+e\xdd^~\x8a\xf9\xfd\x9f5\x87\x0e+\x19\xf0xG\
+\x03\x80\xa7\xc4J+\xc0\xe9m\xa0\xaa\xec@8\x00\xc4\
+2\xc0\xbedO\x07\xb0P\x9bP\xd3+\x5c\xbe\x18\x9a\
+{ aq\xd6\x89|\xf0\xfb)i`\xb5\x0d\xb2\x03\
+\xeb\x8c\xc8\xb9p\xf0\x81|5e\xf1\x96\x8c\xc5\xda\x88\
+%yI\xe6\xc4\x02\x808\x0f\xfa\xb7\x9a#Q}\xca\
+\x03B\x87\x18!\xb2R\xb4\xd0`$\xab\x0c\x99\x89\xe0\
+\xcc\xbd\x8b2\x18g\xe0W)\xff>5\xd3\xce\xed\xe2\
+@Yf\xb5\x02\x91\xb5\x11\x94'/ |wz\x0f\
+\x07<\xfd\xc3\xcc;2\xe0\x94\xe6\x22\xad\x16\xa4\xaa\x0a\
+3\xd6W}\x91^\x89\xbe\xd9D`\xa8\x9a#\x14\xd2\
+P\xeb^\xd1\xa4B^M\xe2b\xaf\xd8#\xeb\xcdu\
+\x91\xaf1\x9a'\xfbp\x05OMQ\xc10oT\x96\
+}0\x8d\xbc\xd1\xfe\xdc\x9eS\xc6\xf3\xa4\xc0\xbe\x1b\xcd\
+=\xed=m{\x86\x0a\xc6>\xf3\xb8\x16\xb0\xb3\x8c\xb1\
+%m\x0a\xab\x5cqZ\xcaX\x16\xad\xba8zr\xd0\
+\xdd\xe0<GkS\xb5\x04\x84KS|(\x0c\xfa\x8a\
+KX\x9b\xa5)\xaaG\x0b\x00A\xaf\xd7\x5c`X\xac\
+\xee2\xdf\xcd\xcd\xd2Rl\x92,D\x07+\x96\x1f\x0c\
+@;0\xdf\xb7}\xfbR\xb3\xe6?\xff;\xe8\xfe\xce\
+\xc9\x19`X\xea\xc6\x0c\xc8C(\x19\xefk\x04\x96\xdd\
+\xc5}\x1b\xe4\xde\x9b\xfa\x94 \x1e\xcec\xa7\x82*\x85\
+c\xe9\xc7\x10\xef\x8bif+\xc1\xbcj\xb6:\xc2s\
+\x9f\x11Ti\xf6G\x18\x97\x06\x90U\x0dS\xe7\x99\xea\
+1\xf3\xbf^c\x0c$,:O\x8bW\x1d\xa7F\x0e\
+U\xcb\x5cj\xb0\xae\xa0g\xadV\x07rm\xe8C\x82\
+\x14\xf5\xa8\xc50P@\x1e\xad\xc8PU\xd4 \x17C\
+\xd2\xb6\x5c%4\xd9%I+|\xdfX\xb4\xcd\xb3\x16\
+\xd6\xce\x0cDV\x07\xecA\xa0?u\xf4\x81\xb2\xa2k\
+\xa189\xe9\xac\x00\xea\x94\xf4\xf9\x0d\xfe\x01\xd8rk\
+ia\xa3\xd9\x95\x89S\xc64\xd30\xaf86\xd2\xd8\
+\xde\xad\xac)]l\xbb\xb3QI\xbe/r\x95S\x96\
+=\xf5\x94\xc5\xe0\x80\xc3~\xff\xb0*Zc\x1f\xe1r\
+\xec\xab\xf3\x0b\xcbb\xbe\x0e\xc9\xe9\xa9\xa4a \x05\xbc\
+\xec\xbc\xd9mq\xa7~^\x99\xb4\xfc\xecn1\x0a\xc5\
+#\x07\xa5q\xd9\xdf\x22\xf3\x1c\x80\xb7d\x5c\xae\x83\xe8\
+e\x82jM\xaf*\xe6\x069\xa9V\xc0\xd2}\xe5\xc5\
+\x0a\xbc\x98\x1b\xf8\xd7\x19\xb4\x9a3)\xb8d\xcdX\xf8\
+\xac+6J\x85\xda2\xdf\x14\xbd\x0aj\xd2\xa0\x91\x87\
+\xaf-\x00XK\x89\xd8\xa5G$\x064G\xfd0\x12\
+\xb9\x03\xf3}\xdb\xb7/\xf5\xf6\xe2c\xe8\xc3_\xe0\xe4\
+,\xad\xde\x08\xea\x80\xb8\x81NVw\xee\x5c1\x86m\
+y5\xdb-\x8ce-QJ\x13!R\xd4d\x0e\xd8\
+\xeaMV\xf7\x15Hpi\xf4 \x1a1\xc95\xea\xd6\
+\x96\x00g\xa0\xcf\x91\xf9_,L\x86u\xcbF\x1ab\
+\xeeF\xe3\x96\xbb\xe4g*m\xf4\xc0\xbf\xd1\xa0~\xda\
+\xf6.\x97\xa7\xc2-X\xe2Xx\xa9\xad\xf3^}\xb6\
+\xfb(nHp\x99I+\xfb\xd0/Rg\xf3\xd9\x1f\
+\xe8\xd2\xc9\x01\xff\xc7a\x11W\xd6\xae\xc1\x85E\xeab\
+c\x82\xf8\xee\xf4!\xae\xf9\xeb?\x08S\x0eF\x0f\x14\
+\x03\x90{<\xab[\xa6w-\x8fQ\x9a\x223\xe8\xd5\
+]Y|\xabA$\x028\xa8\xf7U\x0e;\xc6}\xb0\
+c\xb7\xd43\xa3[wF\xfbC\xa5\xc3sE\x18Y\
+\xdd\x0fj\xdab\x98D\xd7\xec\x16e\x9b8\xbd0\xb0\
+;j\xb1\xaf(\x04\x10Oe\xde\xd9\xd0\xefEs\xa4\
+zb\xa6\xbb\x17\x98\xda\xa5O&9\xb9\xdf\xa3\x1fc\
+\x0e\xd2i3\x13M\x98\x93+`h\xe4b\x9e@\xb2\
+\x81>\x16Z+\x148\x0a\xaf\xb0\x85W3\xce\xaa\x8a\
+\x86\xd5\xde\xd5\x97w\xe8\x8e9\xbe\x8a#9\xeewR\
+h\xfa]\x15>R\xb9VgMgrQp\xba\x8e\
+;0\xdf\xb7}\xfbRo\x82~\xf1\xf7\xd0\xf1\xde\x80\
+gO7JE\xf2\xa2\xb6\xe8^\x9dAC\xa1\xd9N\
+\xdb@\xaej\x0e\xd4\xc8T]\x03\x92\xf3\x15@\xbak\
+\x1c\x8d\xa6\xca\x03\xa68k\x93\x19X\xa7\x0d\xad\x88F\
+\x0fc%\xc0u\xcev\xdd\x03\xcd-}y\xb8\xc6g\
+\xa087>\xeb<\x00W\xc6R\x91\x1e\x1e\x89\xe5G\
+{Ut\xdbJ\xc5\xba2G\xfb/\xc32\xd6R\x15\
+\xb2>\x03\x95s\xf1\x80Xl\xee\x14\x1dx\xf1\x8ct\
+\x82\x8eU\xb7+&\xee\xe7\x8b\x965\x9e\xc6n\xfa]\
+\xb3\xe5\xa7P!5\x8b\xc4K\x12\xdf\xe1\xff\xc2\xef\xcb\
+\x22\xb1\x06\xc0(t\xf36U\x80)\x9c\xa72V\x14\
+\x8cM!\xa3}\x9d-Pr\x0e\xba\x12CI\xe7\xb0\
+\xe7\x87\x91\x92\xadk\x03\x8e\x8c.\x1bAp$\xc6J\
+\xadnS@\x94\x0e\xda\xf7\xb2\xfag\xf6\xb3\xc5\xa2.\
+\xa0a\x87\x99\xdd\xb1{6\x85g\x94e\x96{\xba\xeb\
+\x9fq\xdcJ\x80\xdd\xa4x2\xb2\xc9\xc1[<X\xe9\
+\x0a\xa5\x01\x8a/0\x16\xe7\xaa>\xbe\x15\xeeg\xf94\
+X##:\x1dFe;\x8a\xb4R\x11\xd3_)\x0b\
+\xd4\xbb\xbb\x0f\x83L\x89A\xda\xd4\x1aq\xc5l\x09\xaf\
+.\x99\xaa\x0c\x84D\xa5\xb9\x9b\xe5\x04\xeb\xbd\xff\xe9&\
+\x1e\xdf5\xbc\x03\xf3}\xdb\xb7/;4\x7f\xfa>\xf4\
+\xd1\xafO\x012+s.\xcb\xd4\x1a\xed\xb9\x90%-\
+\x96\xdd\x0d,O\x96\xc7\x8cX\xf2\xe8\x15\x80T\x1c\x0c\
+\xd9d\x05\xd0\xaa\x01\x80\xd6\x88\xd97\xb1\xea\x99P>\
+K\x01+\xf0\xf4V\x02\xb4\xc6\x9e\x8f(W!\x03\x7f\
+\x15\xcdN\x16\xd4\x0ee,Y\x9c\xbb\xed\xab\xaes\xda\
+r\x22\x5c\xc2m\xfey }qz\xf3\x91J$\xca\
+\xe7\xe5\xb9N\x05\xe7\x14\x955\xa1\xfd\x1c\xdf0\xac\x8d\
+\x1a\xa6\xb8\x04\x1e\xdf\xc9\x16I\x19p\xf5\x87\xf5\x80a\
+\x1f\xa4\xc0\x12^9\xcd\x028$\xe6\xbe,.jw\
+\x9cU\x8e\xa4yM)]\x92J\x17m99\xe1;\
+\xd3\xef\xf0\x98\xbf\xf8\x83\xcd5\xed\xb8\x83m\x9d\xe34\
+YxJ:\xd6\xd42\xb3Vv\xc5t1\x19k5\
+\xf5\xf4\xc7$\x97)\x02\x18W\xbbE\x86\xc9\xc0\xae\xe7\
+%\xcf *\xf5\xb0\xb6=\xa7\xfc\xfc\x18\x01\x96\x0c\x90\
+\xa4\x1aK.7\xe6F~Ef\xdcG\xdb\xd3\xe6\xe4\
+\xa1\xb22\xb0>\xe6\xb1\x17\xa2\xbb\xc3\xd8\xf1e\x03\xe3\
+\xe4\x8e=\xcd\xbda\xee\xa0\xea\xee#\xca\x87\xd2\xb5B\
+\xadXb\xd0 \xcdUM\x9bR%;W\xab\x180\
+\xac\xbf\xbc\x8el\xbd^4g\x9b\xaay\x04\xf6DQ\
+\xb1\xcf\xda\xb4\xfd\x0c\xa1*\xe1\x16\xe9\xe1\xee\x07\xcf\xd4\
+C\xd9\x95\x85A\xcf\xb6\x03\xf3}\xdb\xb7\xaf\x028\xff\
+\xc5\xdfA\xc7\xa3\xd7m\x98\xe8q\x15L\xba\x97\xb4,\
+\xb1\xc3\x95\xc6\xbc\xa2\xcc\x14\x1fO\x1e\x84fO\x8cZ\
+\x0b\x1d\xa1\xf1\xc0\xea\xc5'\x0b\xbaF\xd7\x0e\x02\xbd\x9f\
+\xdc\x88\x19\xf7\xe2\x129\xb6\x82c\xb9\xcb\xc0\xb7\xbb\x9f\
+`\x8cE\xeb\xe1W\x1c\x02|?\xf3\x17}o\x1b!\
+D\x15\xf3\xac\xc4\x1c\xbb+6\xf2\xec\x86\xc9\xb7\x81\x0a\
++\xc2\x02`\xe3\x1c\xfb\xbe\xdd\x16\xaa\xe2\xdcU\xcd\xb7\
+\xc3E\x9f\x0d\xd8\xbe\xb2\xdcD!\x8e\x19i\xe8\x99\xed\
+\x11\x19\xf6\xa5\xc7\xd331\xef\x9e5\xefZ\xd85\x86\
+\xbd\xb92\xa4\x13\xa8\xee~\x01\xc3\x98\xcf\xcb\xd7sg\
+\xe2/@|\x87\xff\x80\x93\x8c\xed\x0f\x84\xca\xb1:s\
+\xe4+\xdf\x9bg}\xd0<\x1d\x10*$\x18\xac\x1ba\
+i\x80T\xc3\xb5\xa4\xf1\xf8\x0e\xe9\xc4\x85\xc4\xe4\xd40\
+h\xfbb\x22 d\xca\x02\xa6I\xdb\x1d\x15\xa2L\xde\
+@\xcc\xc5\x84\x99K(\xa6Ws\x91%\xa9L\x8d,\
+\x1a\xc5\xb5\xfe\x8dg\xfe[L\xbc|\xa9\xb8~'2\
+\x98\x84.\x96}*\x05X=\xa9\x94\x0fa\xf2\xcdD\
+P\xf9\x8e\xaf@\xd7Y{\xf7\x9f+\x04*\xb5\xd6N\
+e\xe0\x1a\xc3\x9b\x80Ht0\xd6W\x81\xb1W\x97\x9d\
+\xb4\xd5\x85\xfe,\xf4\xd7\x1fYL\xa4\xa8\x0cb\x98[\
+\xfd$\x90\x1d@;\xc8gE\xc0\x18-\xfd\x0e\xcc\xf7\
+m\xdf\xbe\x0a\xc0\xfc\x93\xf7\xa0\xdf\xfd\xca\x07\x0e\x19?\
+\xea(s\x91\xb5RT\x04\x9cc\x97\xe7\xcd\xa8\x18\x07\
+\xd8\x1f\x1av\x8f\xe1''v9\xea\xd2\x1d\x18\x1eu\
+6\xca\xc1q\x96\x02\xc9W1X\x1c\x01@U\xfcW\
+Y\xe4\xd4\xcep\x83\x8a M\xfc\x82\xb5\x0f\xe4\x96F\
+e\x04\xdeU\xb3\xe5\x8a\x0f\x97\xa2\x87@\xa5\x1f\xf2h\
+5A\x8e=\xaf\x00h\xe9\x82,\xff\x13\x1f\xd0\xb1\xcd\
+\x98\x97\x96\x97#\x89J\xfa\x9e\xa5\xa4$3\xc6tl\
+\x99\x03\xe0k!\xa0\xf8z\xa2v\xa7+\xa4S\xb0\x00\
+\xb8KZ\xd6\xa6O\x808L\x13\xbe5}\x82\xc7\xfc\
+\xe9\x1fp\x921\xac1\x11\x98S& \xbb\x12\x99\x12\
+\x06\x22~s\x0b3S\xb4kl\xbb\xec5QO9\
+\xb6\x16\xe8\xb2\x818v\x1fV=~l\x1ed\x13\x02\
+g;rX\xfb={\x13\xb0\x01\xc88v\xd5+\xd9\
+\xd2\x05OV\x1fa\xe5`Ljq\xcf\xbeG\xd0I\
+\x1ff\xe3ee\x0e\xdey\x8dv\xcc\x07X\xec&\x89\
+qF\x05#S^9K\xc1\xceCJ\x8eT\xbd`\
+\x08\xc4\x01\xb3\xe3\x92\x8c\xe6\xbc\xeeM\xca\xcd\xa2\xfd\x0e\
+\xcb,zP\xeew\x80n\xb3\x03P1\xf9\xac#\xc3\
+X\x93 \xd5\xfc*\x86\x84j\xf4>-\xda\x95\x01G\
+ t\x22e\x07\xe6\xfb\xb6o_\x0dh\x0e\xfd\xfc\xef\
+\x80\xf9\xe8\x02\x87\x86\xfan\x17\x1ac\xa6c\x8d\x5c[\
+T\xa7\xd5\x08\x19\xd4\x0dt\xe2\x9d9\xdfNl<k\
+\x1e\xa2\xda2\xb1\x96\xe7 \xb5\x8eU8Vz\xa0\xe5\
+\xa2\xb6\xfd\xc0\x1f\xcc\x15;\x068\xc7\x09i\x04\xa0\xe3\
+bB\xe8\x15\x88\xcc\xb3\x1e\xd4\xad;\xdai\x8d\xe8\xa0\
+\x90\xec\x19^*m\xf2\xd9\x15NGa\xf1)\xd5\xe0\
+?\x81\xf0\x07ze&)\xc9\xe0\xfcVL9\xcf\x93\
+\xfei\xdcsX\x7frP<\xd0\xd9!\xae\x0f}-\
+\x12\x16\xad\xdatL\xa0\x80\xef\xf2\x87\xe0\x1f\x8a-O\
+\xf7\x00[\xdcy\xa7(\x07\xc7\xbb\x80\xb3\x91\x05\xa8g\
+\xda\xe9\xa5?\xf4\xfe+>\xce\xdd\xcb\x12\xe8zB|\
+!I\xaa\x88\xb9\xea\xfe\xe3I\xae\xc1\xa5(\xa0\xd7\xd5\
+hx\x88l\xc11,\xe0lK\x80\xb4\x85:\x8b\xfb\
+\xcc9\xa10\xc8 \xe0\x0b\x95x6\x15d\xd1\x0e\xfa\
+\xc9\xe1\xf7\xd5\xc5\xc5\xfe\xad\xbd^N\xbe\x97\x8at\x96\
+\x9e\xff\x12\x8b\xfe\xd2A\xb0\xd4\xe6$\xc4AZ'[\
+3\xa7\xcc5a\xc1@H\x86\xf9\xb7\x12&#\x07\x8a\
+\xe7\xdf\xf5I\x84\x06S\x9d\x99\xefU4z6\x9d{\
+L\x05\x95\xc9\x0dqs5\xdb\xb5\xd8\x81\xf9\xbe\xed\xdb\
+W\x8a5\xff5\xa4\x196\x99D\x92\xd3\xd9\xa2\x02\xb2\
+\xcaxL\xc6\xb3\xcd5Gj\xccx'D\xa8\x81\xcc\
+@^f3~\xaf\xad|\xd0\xb1'\xfa9\xdc\x9c\x1a\
+D\x1f\x0a\xae3\x1a6\x9f\xf7\x904\xd4\x95\x15a\x00\
+\xb0\xdb\xfe\x89z\x90\xff\xf9\x03\xbaJ\x1f`\xd3\xa8\xe1\
+\x7fU\x1c\xd4C\xa2\xa2\xfcJ\xcd\xd6gb\xa3\x88\xc9\
+\xf0\xd9\x22\xbb\xccbo6\x97\xae`*\x5c\x5c\xa6\x03\
+\xb7\xbe\x0f\x0c\x80\xbd\xf0'7\xa1?\xce\x1eQ\xaaC\
+\xd5U\xa4\xdc\x06\xbf\xf2y>\xfd\xd3\xdc?\xf7;\xd3\
+\xc7x\xc2\x1f\xfd\x91(\x00c\xfe\x99\xa2\xc8}\xa8\xd9\
+\xe9<h\xf1\x8e\xe6\xb8\xc2Ue\xaf9\x084k\xcc\
+5\x03;\x1b\xf4\xd2\x06\xec\x9e\xac\xfe|2ds\x05\
+\x09=$\xcd\x81\xc3i\xdc\x83&<\xf8`\xf6\xc5\xbc\
+:\x18\xa79t\xb0\x7f\x86+J\xa2Ca\x00\xdaM\
+\x22\xc3\x93\xc6\xdb\x07*\xd3\xad\x18\xc8\x14z\xab3\x89\
+\x18]Sl?\x87o\xd6es&\x895\x17\x07\xd3\
+\x08W\xb3\x18/\xedX\xd27\xab\xd4\xd7\xd8\xd7a?\
+\xc8\x19\x03\xb4K\xbe\x80rZ\x89\xd4\xe2+OS\xf8\
+\x0c\xe6yg\x12\xbf\x00`\x8a.\x99\xd4\xe5\x9bz+\
+\x9f6\xe2\xeb\xe2\x0e\xcdB\xb3}_H\x9e\xba\xb4\x87\
+\xfd\x9a\x04\xa5\xba\x96&\xe8\x1d\x98\xef\xdb\xbe}\x95X\
+\xf3_\xfc=\xa0\xfb\xde\x08\xaa\xd0\xd0\x18YUe0\
+\xad\xcd\xa6;e\xf6=\x00\xc8\xd4\x06:\xf4\xb6VI\
+\xc8\xf7\x7f\xb5\x85\x89>\xfb\xe9\x19\xb3\xcd\x83I\xbd\xfb\
+\xc0\xc3=\xf0\xean\xd5s\xa0\xdc\x80\x97\x82I\xca\xab\
+\x0e\xde\xdbe\x13\xf8J\xdb\xcd\xb9#\xeb\xca )\x89\
+\x80T\x0f\x04\xf3\x9dYR\x00\x9d%\xb2z\xa5\x8b\xc8\
+R\xc8\x99K\x11%\x10\xae\xcdf\xcc\xa6\x15\xb7\xce2\
+\x86\xa5]\x81\xbbsW\xd9\xb0\xd9g\xb2\xae\x0c\xee$\
+\xb6\xae\x11K\xbd\xf2\xca\x88\xae@onN,+\x98\
+\x9cp9\x01\xdf\xe3\xdf\xfeQ\xd8\xf2\xb3!\xb3\x89=\
+\xef\x8d{\xe9V\xa1gx+\xaf\x9c\xec\x18\xc2\xed\x81\
+`,\x17\x1d\xde\x8b+I\xecm\xa1\x8eb\x86\x91Z\
+$kj\xb6\xe0\x1a?o\xb2[\x09\x16\x0eA\xbd\x07\
+\xc6\xcf\x9d\x94\x1bv\x814_@\xa3\x0af\x80\x86)\
+\x8e\x1aj+\xeb`\xe1<\x92\x8a\x1e\x05\xc0\xae\x16b\
+\xe4\x0b\x1f\x9asf\xc3\x94\xd8|\x5cr#\xb7!g\
+\x88\xa2)8\xe8\xde\x81\xd2\xf9\xa4\xbb\xc8D[M\xff\
+I6\x8d\xb5\xfb\xd4#5\xabv]>Ji#M\
+\xa0T|\xaf\x8d.\xa2\xbeJ\xd1TG\x81\xaeY\x9b\
+>\xd7\xa2Iq\xa5d)\xba\xb0\xfb\x98\xef\xdb\xbe}\
+\xb5\xa0\xf9\xc7\xbf\x81>\xfau\x0b\x1c\x8a\x92\x16\x19\x00\
+\xa5\x90l\x86M\x16\xdd\xfc\x9b\xbcE\x00\x00 \x00I\
+DATs\xecU\xe4\xbc4\x02\x9a,\xb1\x98\xce!\
+-\xa0.&\xce\x9d\x03\xe5zCF\xee'=P\xc9\
+\xb1\xce\xd2\x8aE\x8cg\xc9K\xc2?\xa7]\xc06\xe4\
+\xa2\xc0\x9aL3\x7fpqP\xf5\xf6\x1b\x8c\xb5\x02\x97\
+\xafH\x9c\xc7\xf0$\x0d\xfc\xe75H\xf8T\xea\xb1u\
+ \x9a\xe7X\xfc\x9a\xc9.C\xa8\xd2\x83\xba\x00\xc6\x81\
+\x91+u\xe4*\x12\x06\x15Z\xe96\x97]XK]\
+\x0cS\x9e\x9a?#`)dAR^\xc5\x99eC\
+\x85NO\xfc\x89\xc4\xbf\x9a\xde\xc3\xa3?\xa0\x13K\xda\
+\xf5\x05\x98V\xb1-D\x96rX'\x0f\x15\xa4\xb9\xc4\
+a\x11\x90\x19U\xd3\xc4ge\x1f\x11\x8c\xc5\x11E\xf8\
+\x04\xce\xd8\x0b:\xb2\xf8a\x9e\xe7\x98\x18hm,\x22\
+Y\x1a\x95i\x9f\x14*\x009\x97\xd6\x5c\x1d\xac\xf3:\
+\x83\x8d\xa3\xc4\xfa`8\xac]\x86\x9cBk\xd4wd\
+o\xd0~+\xf4\xd7\xab\xa8\xbb\x9a\x96\x9a\xc9\xf3\xbe\x83\
+\xd9Jf\xd2\x8b'\xb7\xa6\xa8\x98\x9d;\xb2e\x0c\xb7\
+X0\x97\x17\x8d\xbc$\xb9,\xd1\xf4g\xf5\xfb\xb3Y\
+q\x8a\xa5\x15\xbf\x82\xf9\x8a\x9a\xdfMhk^\xc6-\
+\xd3~\xf5ns\xee\xc9\x9f\xfb\xb6o_=\xd6|\xfe\
+\xe9\x7f\x07\x8e\xb7\x05(\xdff\xb0\x95\xbc]\xa3C\x88\
+\x5c\x82\xa8\xd7\xaa#h\xfd\x94\xdf\xc7\xc5\x8a\x0f\x1e`\
+gYl\xf9\x84H\xf7\xb3\x1a\xa4W_?\x80T\xaf\
+\xd9\x9f\xad\xd7\xd9\xc3\xd4\x99\x83\x19\xfa\xa8\x9b\xd4V\x8c\
+\x13F\xb5\x01lS\xa2f,Z\xec\x93\x95E!2\
+\xda\xcf\x81\x92\x85\xf1:T\xfb5\xb0K|@gj\
+\x1e\x22\xd6\x9a\xf3!^\xfb\xf6pY\xb0\xbb\x88\x0f\xe7\
+\xfe<\x1fFw\x9b\xc2\xc7I\x14\xec2\xbcP\xc8W\
+\x06i\xac\xcd\x85E\x8d!_\xc1\xf9<wm\xf9c\
+\xce\xf86\xff;>\xc7\xba\xd1\xe7\x99Z\xfaJ\x0e\x07\
+\xa8/\x15cr\xb6\x889E5\xa7S\xae.:\xa3\
+{\xa8G\xc6\xd3\x01I(7\xee\xb9\xcf)\xd8\xf8$\
+oZ\x0b+\x8d\xda\x9aY4\xbe\xaej*%\x1d=\
+\xadl>\xa0\xd6\xd5\xf2\xb1,\x18\xa0\x12Y\x93E\x90\
+\x8f\xc2 \x95\x15\xb1W\xde\xdblLw\xedU\xc4\xbe\
+b\xa0\x9eZ\xda\xce\xb1\x98-\x00i-\x0e\xd5\x98\xf7\
+\xee\xac\x13\x0b\x0c6\x87\xa2\xc2\x93\xd2\x14\xd7y\xb2\xb1\
+N=4\x85\x99\xb9\x1b\xfbq\xd6>\xbdKq\x93\x8b\
+\xa4f\xda\x12=\xeb\x97@\x22\xd1\xcf+l\x1e\xe9\xdc\
+x \xc4.(:\xa2\xcbj\xf1\xd7\x86\xef\x1d\x98\xef\
+\xdb\xbe}\xd5\xb6\xa7\xefC\xef\xfd\xf8$g1:s\
+\xc8\xfb\x9b\xcb\x00m\xa7\xe7t\xf4]\x07\xda\x95\x12\xc1\
+-\xd3U\xb6\x87\xce\xbdp\x044\xab\x94\xd2\x01\xc8\xa6\
+_r\xb6n\xc2d\x04\xe2[\xddz\xde\x89%\x9e\x8f\
+\x1c\x15\xca\xc0\x1d\x8f\xc0\xe0\xc3\x8b\x83\xd4\x97?j\x1a\
+\xdc8-\x1a~ q.\x11\xa9\xd4\xf7\xab\x5c;\xb1\
+\xcfyX\x17\x97\xcc\xbb\xc7s\xef\xae\xd06\x00\xd7\x06\
+\x22T\xc5Y\x97Fo\xfei\xbb\xc1\xb4\xd3\x01\xe2\xed\
+\xe2\xc9\x19\xcb)0lFOn\xda\x09\xcdkY\xeb\
+\xd8\x95\x99\xe3\xc8\x96\xaf\xfar\xe2\xc4\x96\xff9\x7f\x8e\
+K\xbc\xff\xc7\xae\xfdQE\xf6v\xa1C\xb4gQ\xd2\
+\x1f\x07n4\xe0\xcaE/NUa\x95&2\xbe.\
+\x9d\x13\xa3IS\x91\xd2h\xc5\xb5\x02]\x9f\xdf@\xe3\
+\x9c\x92\xdb\x19e$\x09\xbd_\xc4\xf6\x16X\xbdSk\
+1\x0d\xce3\x94\xa5\x98\x95\x9c\x5cbs\xa0cc\x93\
+#,\xfd\xdd\xea\xc8\xf4:Z^\xee\xe8\x18\xee\xa1\xd5\
++]\x8d\xb5\xee U\xb9\x1e\xb3\xf2\xbe\x22\xbf\x80#\
+\xd0\x1aoH\x99F\xdc\xaa\x10F\x96\xd8t\xb3\x9bp\
+$\x0c4~98\x82\xb5\xbc\x1d\x87\xcdc\x98\xa6\x91\
+V-\xad\x15\xb1\xf4\x0c\xb2!\xb7\xaef\x0cZ\xc8\xee\
+\x90\x93\x1chV\x22\x9f\xbb\x94e\xdf\xf6\xed+\xb9\xcd\
+?\xfb\x01p\xf3<\x83s\xe3\xfd-)<D+/\
+i\x95v\x89\x1b\xd6!\x06\xf4\xa9\xe8\xe8Wzp\xe7\
+\x07\xcdFC\xe4 \x04\xa7r\xa0\xa9\xf7\x8a\xe7\xf1\xae\
+\xaasP,Wk\x0c4\x22\x5c\xa8\x9aL\xeb\x90\xcf\
+\x02\xe6\x16\xf2\x13\xa8>^)|.\xc6\x0cq<\xc6\
+\xf4\xdbXPl\x98\xad$&?\xe8\xc2\x15\x9a\x02\x93\
+\xbcI\x9e\xb1\x8c\x0f\xfd-m3\xcf\xfd<\xc9W\xf2\
+\x99\x98\xd8\xbd\xa5\xc3\x81\x14\x92\x98\x98c\x22\xc7^F\
+\xad\xb9R-h\x93`m\xd2\xa7<8_A\xf9|\
+b\xcb\xdf\xe6-\xbe>\xfd\xb7?\xda\x9c\xc28\xd0\x12\
+x\x92ir\xf5,\xf0f\x93u\x00M.\x0a(\xf4\
+;\x90\xd9e\xc4\xde\xd9T\x18g\xea\x89\xa0\x96\xcd\xf7\
+\x84B\xd0\xcc\xd0d:\x14\xe8\xbf\xb9v\x90\xae\x08\xad\
+b\xd8\xe8\x96\x0a|\xba\xa3\xd6\xf7P.Y\xbb\x94\x84\
+i\xe8\x10Q\x93\xaf\xb6\xc2\xe0l\x11\x0d\x9b]\x85\xe0\
+J*\xef+\x11N3\xef\xce7\x83\x11\xa3\xd1S+\
+\xf4\x04\x90\xd1\xa3\x1b\xb0\xb0\xbd\xea_\xe2:\xd7rT\
+\x07\xd2\xf9d\x8e\xccr\xd7U\x01\xb9e\x850\xcf\xc4\
+\xf3b\xe7$Z\xfb\xcd\x0e\xa2Y\x149\xb67\xc5\xcd\
+\xa74aL4\xd6\xa7\x1c[\xdd\xae\xc7\xb2\x03\xf3}\
+\xdb\xb7\xaf\xe2v\xfb\x0c\xf3\xaf\xfe\xd7\xb2&\xbe\xfcs\
+:\x0b\x85\x5c\x1c\x19\x92XA\x0e1\xb0Oa\x01\xba\
+\x92]_\xa5\x7f(\x18\xf40\xc3\xaa\xf04\x7f8\x9d\
+'T*h\xab\xadWz\x0a\x8e\xdfi\xf3\x87\x0a\xe1\
+MV\x902\x90\xd7`\x08\xc8\x0b0]\x9e>mH\
+\xb7\x95\xe5)\x1b\xce.\x80\xef'\xc0\x80-\x8f\x00\xde\
+\xa7\x9c\x9e/\xa0XG\x83fM\xf2\xa8[\x0d\xdcf\
+\xd8U\xbf\x8e`\xf9\x04LmzI\x9f\xee\xa3r\xac\
+\x8e<\xb2\xf3T\x08\x19\xd2\x03\xf6\xdf\x01\xf2\x0e^\xe6\
+\xc6\x96\xb3;\xb1\xe8\x14&\xf4\xfd\xe9\x7f\xe0\x80g\x7f\
+T\xa2\x9c\xb6\xe8\x0a\x09\x9b=\x00\x0cE\x9fE\xcd\x9b\
+v\xc7\x0b\xcfy7er\x90\x09H=\xd2^6f\
+\xddx\x85\xd3E\xbc+\x5c\xec\xb8\x0c\xc2b\x0c\xfap\
+\xa7^$\xcaI\x1a\x22\xa4\x0c\x11\xa7\x0d8\x92\xa3\x06\
+\xf6\xac\xbboM\xc7\x1c\xf9\xe8wK\xc6\xb8:H\xb2\
+d\xc7\xa3\xf3\xad\xc5\x9d*\x1a8\x9cc\x8dK\x13e\
+\xcdF,\x9a\xed\xe6<\x03\xc5\xca\xaa\xb2\x83\xefP<\
+\xb8\xaf\xd4qS6\x7f\xcd\xacf:\xb9Yq,p\
+U\x8e\x99\x0f\xd4\xaf3\xc2zh\xe8\x93qJqV\
+\xec\xca\xb6\xec)\xcd\x1a\x1bI\xd2k\x1b\xc5\x0e\xcc\xf7\
+m\xdf\xbe\xa2\x9b~\xf5?\xa1\xe7\x1fu\xceW\xe6\xbf\
+\xcd\xcf\x5c\x01\x04\xfb$4\xeb\xd4\xe2u\xe6\xd1YD\
+CRV\x19\x81l=\xaa= 5T[dG\xa4\
+\xc1\xcf\x82\x8e]*\xe45#<\xb9\xc9\xa4\xa3\xf4H\
+.9s\x8d\xa9\xdc.\x1d\xf2r\x99\xd1\xe7\xc6`\xa1\
+\xea\x19\xe4@\xadI\xb1;\x07\xca\xab\xbdW(\xc2*\
+\xafq\x05\xe6{D\xca\xcb4\xa0r\x10\x0f\xe4\xa5\xb7\
+\xacOwX\xf9\x1e\xd7%\xca@?\x8e\xd3TC\x85\
+v\xd0\xc2\x8d#Y%*3\xe7\xfe{\x87>:\xdd\
+YJX\xc2\xbf\x198\xce\xc0<\x0b\x9cO\x12\x96\xef\
+N\x1f\xe0-\xfe\xcf?\xfe\x9c\xd2\xc0.\xc3\xb8\x92\x8b\
+\xfa\xf45I\xed\x01\xeed\x07\xc5\x0d\xd3\xc0\xb9\x14\xd8\
+V\xd3xjs\x19\x96k\xd9\x04\x02\xeb\xbel0\xf5\
+I\xc6\xb7\x5cL\x97\x02\xa9h\x15\xdb\x99]w\x88+\
+K\xcaX\x10c\xe0=\x8e\xe0i\xed\xc5u\xd1\xc2&\
+\x05\xfe8\xd3\x9f\xc2.pe\x94\xc9\xc1\xfd\xc9PD\
+\xb2\x936\xab\x9e\xdd\xa5\xb8\xae\xba\xf1|\x7f\xb4FN\
+\x1b\xb4d\x01/CQjS9\xb72\xdf\xd6\x99c\
+\x0d\xdbj\x8d\x9b,\xeei#o[\xf5\xfe\xf26\x99\
+v\xac\x90\xfd\xfc\xb7\x02*\x16=\x8aW\x22\xa6\xfc\xae\
+2\x16\x1b\xf3\x0a\xff\x0cM\xf5\xb8\x86\xb8|u]\xdc\
+\x81\xf9\xbe\xed\xdbWu\x9b\xef\xa1\x9f\xfc\x00\x9a\xef:\
+cn\x1b\x0bm\x12h\x91\x0e\xeaX]\xd5Lod\
+\xcbmT\xbd4\xf0 w\xcc\xbc\x17\xb7l\xcaK\xcc\
+\xbfd7x\xce\x8f\xfc\x1c\x18\xddb\xc7\x0bf6\xf3\
+\xf9\xccd\xb1\x1e\xb63\xdb\xbb]5N\x0d\x80\xfeC\
+\x0e9\x9e\xb6j\xb5\x805\xb5_J\x9a6Xu\x09\
+\xae1j(5z\xf0\xaa\xc2\xb8\xd2\x89R\x15\x16@\
+\xbf*\x07\xad9\x82\xf5\x90Na\xe5\x1b6\x89\x13\x0a\
+\xb9\xec\xb9c\x8b\xf6\x9b\xae\xe1sM\xf9<\x95\x03\x8f\
+8\xe3{\xd3_\x01\x7f\x8c0\xa1\x02N\xca\x01Tz\
+t\xa5\x0c:\xb4\xb8\x888\xdd4\x17\xc0$\x07\xfb\x02\
+xR\xee+1\xf81\xb1\xf7\x0c%\x9d\xac\xe3\x0b\x0b\
+m\xfc\x12\xf6\x12\x1b*\x83\x7fx?D9\x06\x94V\
+{\xb3:\x998\x03\xec\xda\xae\xaf]\x7f\x1a\x16\xbap\
+\xab\xf1\x8d\xb1r+\x06n\x0cY\x96\x02\x05s\xb1\x8e\
+\xe7l\x8a\x82\xb6\xc2A\x7f#\xa5}^\x82z\xc8\x91\
+f\xdd\x17l\x9e4\xae\xac\x01\xb3\xe5\xa3\xfd\x86\xe9\xfd\
+\x83\xc5\xaf\x950\x12\xae\xc18>\x9f\xa8zVm\x09\
+\x9df\xc2\xa6\xc6\x12\x1fonn\x8a8\x85T\xdfE\
+\xa2\xb4&\x00+^\x13v\x09SlaX?{\x07\
+\xe6\xfb\xb6o_e\xd6\xfc\xc3\x9f\x01\xef\xff\xec\x14:\
+\xa4\xb9\x08\x1f\x82sm\xf1\x0fG\xd5,:\xa2\xfc!\
+gm\x8e\x80\x9f\xa2\xf5\x9e\xd7\xd3<\x08\xac&\x90\xa6\
+\xcf\xe7P\xb1\x1d\xb0Y\xf9\xb4o\xf0\xdaz\x00\xf8\xdf\
+\xea{t\xf2\x95\xe0\x8d\xac\x87\xc5\xf9\x0c\x93I+P\
+\x8e\x0a\xa8G\x06\xff\x15\xa2\x8c\xc2r\xb9-R\xc8\xf3\
+`\xd56K\xe6(\xec1\xeb_\xf4\xb0\xd6\x80Z\x19\
+\xbcW\x96iI\xebnYq!\x03w\xc3\xa4C\xf9\
+\xe7\x91-T`\xccg\xe3\xc0r\x02\xe5'm\xf9\x04\
+\xe2/\xa6\x7f\xfc\xe37|\xb6#Yt\xe4\x91\x01W\
+<\x89J\x98fe\x0b\xd5\xd2\x0f\x17\xeb\xba\xd5B.\
+\x81\xfc\xa2\xb7\xa0\xc5\xda\x07\xa5\xb2\xac;\xc9h@\xe6\
+\xdf\x91\x18\xbas\x8a\xb5\xdb\x91\xa2\x97\xa0\x10z!\x98\
+@-\x8b\x1b\x88\x1bv\x91nl\xae\x92\x8b\xf5\xbc\x9a\
+\x84S\x16\xda\xed\xe8JH\x95-\xacm.\xcb\x8cu\
+\xb1\xeca\xfa\x85R\x10Ts\xc8\xc97\xb8\xe4eO\
+\x1d\xff\xaf \xb8\x8f\x15\x1a\xcbCYE\xd0:&h\
+\xb4\xfd\xf1\xe3\xa8\xca\x91r)\x00\xe5?\x7f)\xd8\xe5\
+42\xbd\x1c\xaf\xdb\xe6MQ\x16}\x11\x9a\xedc\x5c\
+*Q\xbf\xf6\xa1\xf0S\xaa\x00m\xfd\xb8\xdb%\xee\xdb\
+\xbe}\xd5\xa19\xe6\x1f\xff\x17\xf0\xe5\xd3\x06\xca\x1b\x10\
+\x97\x97\xb8\xf4\x06\xb4\xce\x9c\xbb\xaf\x13--\x87\x80\xb4\
+E=KIC^b`\xc7\x8a\xd7\xc06\xbb\x88\x13\
+\xa3\xc6\xd5\x8a\xf8ND\xb8\xa5Z\xaa@\x0fl\xb8\xb1\
+ \xfbP\xd7\xbcw\xfd\xa2\xed~8\x22'#z \
+T\xa6#\xaab\x9b\xd2#\xb3(\x1c\x94\x0b\x08e\x12\
+.\xb2\xe2\x0e\xb4\x14M\xbdH\x7f{\x1eh\xbb\xbf\x19\
+\xac@\xd4\x8d\xa2\xdd7\xb9?n\xa3f\xd4yO\x14\
+<:\xda\x127\xb7\x9cr\xcc\x12{\xf2\x89\xb1\xd2\x8a\
+RsU\x87j\xad\xe0|e\xcb\xbf9}\x8aw\xf9\
+\x83\xd7f.\x91\x09\xe4\xa1\xea\xb4[8x\x13\xce\x07\
+CSlc\xc6C\xd4\xa4\xd1\x14( \xca\xc2\xab%\
+\xe0'n\x1e\x81\xbf\xccKpN\x0c\x1fs\xbe\xe76\
+@\x80\xa9\x22#a\xd8\xe4\x1a\xd4\xa9\x5cvd\xe1\xd5\
+\x1e\xa6V\xd7/\xba2\xb39m\x98\x0d\x84\xfa\x9fq\
+\xd1\xe2G\x1e\xbf'y\xe6\x9e\x8c\x06\x8a\x99\xe8\xdc\x06\
+4s\xdb\xa4\x9c\xf4\xc4\x17\x0br_e^\x9c\xe1\x9d\
+\xac^\x1d\xa5S\xcbp\xceP\xdcg?\x1eZB\xaa\
+\x8a=X\x9f\x87d\xdd,\x1b\x87\x1c\xfb\xaa\x06S\xaa\
+\xa9J\x82\xbd\x15|\xa1I\xdf\x16a\xa7\x18\xb1}\xdb\
+\xb7}\xfbjo\xb7\xcf1\xff\xf4\xbf\x01:\xb6\xf5\xf2\
+\xcc\x9c+\xc9Z\x1c\x08S\x01\x0a\x81\xd4$\xaa\x88V\
+Q\xb8\xad(\xb3\xeb5\xfe2\x0d\xa95\xb9\xea>\xd7\
+\xb2@U\x04\xbc\x97\xc0\xd4!\xf4\xa3\xffUT\xb7\xce\
+\xe9\x9d-+}\xce\x1dP\xc8!N\x95\xef\xb7{\xf9\
+\xa0\xe9\x92\xe1\xb1\xad\xc8tm[>:&\x0c:\xff\
+\xc2\xc0DW\xfb\x14\xa1\x14\x07E\xdc\xbaw\x0c\xe4\xe9\
+Y\xa6\xde\x82\x0dy7\x08!\xba\xa8\x04R\xcb\x12b\
+\xc1\x8d%\x86\x07Uly\xe6\x09Y\x80T\x18Oh\
+8\x19\xc1\xaa+_]Xt\x048\x03\xd7\x14\xfe\x9c\
+\x7f\x03\xe2\xf6\xf5\x99K\xa8\xae\xd9\xad\x00L\x93ux\
+\xa4km\xe2\x22\xa3i\xfd\xaf\xdb\xc0[^\xef\x9c\xb6\
+G\x09\xab\x8c\x5c\xf0H\x9d\xa5H\xc3v\xa6>4\xb2\
+R\x81\xa1o\x87\xaf\x9e\xce\xea\x92;\x8d-h\x15J\
+\xa5\xbc\xbe\x22\x86\xa5\x93v\x0e\x170M\xef\xf3\xd7\xe0\
+\xbd*h\xdc\xc72mp\x95\x09w\xea\xff]\xc6\x22\
+\xf3\x1c\xa9\x96\x96\x1b-We\x00\xad\x87\xdeQ\x87\xdd\
+\x84>k\x80\x92\x0akSw\x8cv\x0a\x91\xfbY\xff\
+l\x9d\x99bV\x0fr\xb3g-\x14):\x0b\xa44\
+ \xe7&E\x15^\xbftn\x97g\xf8\x04\x99k\x8e\
+\xe1\x04&\x14K<\xcb)\xdf\x81\xf9\xbe\xed\xdb\x9f\x02\
+o\xfe\xfe\x8f\xa1\x0f~\xb1\x00\xf2\xd9\x81q\x95\xe0\xdc\
+?`\xad\xfe<\xb2\xbf\x0a4\xab\x9b\xd6\x14\x03\x8d\xaa\
+\x8e\xa8\x8a\xbd\x8dM\x8f\xca\xdd\x9e\x11\xb4\x8f(\xf1*\
+\x0a\xb4\xdc\xb7W8\x9fI\xee\x98}\xbc#(\x1f\xea\
+\xd9\x9d%\x5c\xb6\x92|\x88z\xdc\xa7\xacj\xe3UA\
+F\x11Xu\x0d\x99\xf7\xccx\xbb\xc2\x8d\xb9\xc1\xb4l\
+\xf5\x8c\xd1\x80\xe1\x05\xb4l!\xb2$E\xe7j\x85(\
+e\xc5\x88q\x97\xfb\xbc\xe6k\x8dA\xa8\x90Y\xc9\x1e\
+\xa6}V\x8d\x12\xc1\x22\xb1\xf9\x95\xe3\xc4\x8eC\xdd\x89\
+e\x160\x1fOl\xf9\x84\x09\xdf\x9f~\x84k\xfe\xfc\
+\xb5\x9aGz\xf0\xa6\x9awy\x07h\xcc=\x01\xb4L\
+e(\xcfh\xec\x0d1\x88\xc3\x0d\xbf!9\xb6L]\
+\x8a\x06\xa9\xe0s\x87\xb6\x9b\xd6\x15D\x06\x023\xad\x1a\
+E\xaft'oo\xd784:\x92\xb9\xaf\x95\xfd\xa8\
+\xa2\xcc\x186\xd4\xc71\xf6j\xab3e\xa2.\x91\x1b\
+l\xdbN.\x05 \x83\xf5b\xcc\x90w\x84H\xcc\x97\
+_!.s|+V'\x19\x85\xf7\xb0\xfb\x94Sb\
+\xd7\xf7O2\x9b\xd2'\x9f\xddrpP\x9536[\
+\x8a\xa6\x18\xeb\xce?\xab\xdch-\xfc\x5c]&EJ\
+|p\x8e`$9E\xd3rXuP\xf0TO\xc1\
+R0\xee\x8c\xd8}\xcc\xf7m\xdf\xfeD\x90\xb9\xa0\x1f\
+\xff5p\xf3l\xd1\x9b\xeb\x04\xd0\x8d\xd6\xdc\xb2,\xfe\
+g\xf2\xee\x07\x8a.-U\x13\xe8\x96,\x228\x83\x0b\
+\x88\x09i(0\xb6\xb6\xd8\xdaQ\xc3\xa56\x7f\xb5\xdd\
+p\x1a\x91\xc1P\xb2\x12\x9a\xd7\xa4MG\x96\x8c\xba5\
+n>-\xdeA\x83\xddK\xe0{P\x14d\xa9K8\
+O\xc61f\xa8\x8bWx\x00Z0\x94@47\xaa\
+\x1b\x16\xc1?,\xc1}z\xa7\x22\xec\x03g\x19\xf5\xbe\
+OV\xc3Nd\x8b\xbal\x91\x08#]\xe1\x99r\x89\
+\x0e\x8c\xa7br\xf9\xefl\x5cX\x8e\xc7\x93\xb6|\x02\
+\xf1\xcd\xe9\x13|\x9d\x7f\xf3\xfaM#\x0d=\x11[\xcb\
+@\xb4\x0d\x05\xaa\x82nd\xac\xeb\xe8\xa5\x13\xecq\xee\
+Q\xea\xa1\xd5/\xbb\xa0\xc4W2\x81U\x03\x22\xebb\
+\x98\xae_\xd1\xdb\xe7E\xeb\xf1\xe4\x89\x1d\xe6\x11.\xde\
+\xe4tXY\xf0\xfe5>\xc8\xad5L\xd2\x83Vo\
+Mi\xc6\x11\x19D!\xe1\xbcW\xab\x9b\x0b\x0b\xcd\xa2\
+q\xb1\xb3\xe3\xe1WQ\xc3\xe5*\x92\xd1\xc7\xb3.\xe4\
+\x087?\xaeI\xa2\x85\x1c\xdc4\x8c\xfb\x15(v\x03\
+\xf9r\x7f\x1b\xdb]>\x16T<\x13\xd4Ve\xfc\x1c\
+\xcar\xe2$\x95\xe4=4\x05g/T\xcd\xb55c\
+\x9e\xa1\x02k\xfb\xc5\xb8\xce\x80\xbd\xf9s\xdf\xf6\xedO\
+j\xbby\x0a\xfd\xf8oNn-\x9a\x83\x8cev\x80\
+\xdc\xcaBP\xda)\xda\xc9\xcf\xd3\x9b*\x10`b\xca\
+\x15\xd8\xaa\xcaQ`\x93\x18U\xd1r\xea\x95\xe7\x15^\
+?\x0b\xc4\xabP\x9d\x92\xb9\xaew|\x8b%\xcfi\xaa\
+\xdb<}j\xa8\x1d\xc8b\x88\xdc\xb4\x99\xf5\xfc\x83\xfd\
+\x1aH\x85\xca\x07\xd9\xa8\xfe\xe1Y(\x97^&\x9bN\
+\xaa\x8aQ\x7f\x08\xe0\xae\x97\xf4c\xe3Z\xa9\xfd6l\
+\x9de\xd6\x93\x879\xbbG9\x1dS*\xcf\xee[\xa0\
+\xa1\x01s\x0f6\xb6<\xa6|6\xcf\xf2\x99\xb8\xc6\x8c\
+?\xe7_\xbd^\x12\x96\xe2lZ-.\x8d%\xa6\xaa\
+\xfb\xba\x90E\xad\xabJ\xdd'\xba;\xbb\xc8\xb8\xd5d\
+\x8b\xcc-]X\xf2j\x5cl\xfe0,\x005(\xfd\
+4\xe8\xe4fY\x1e\xd3\xdb\xc2\x06\x98-u&>\xd6\
+\xa6,\xac\x11\xeb\x12\x1c\xc1i\xa6*\xce\xc3Z\xc1\xda\
+$\xdbl$m1\x0a\xa4\x8eIV\xe7e\xedT\xed\
+\x12\x9f\xa8\x08\x1aM\x22rN+\xd1\xc5\xc6\xcbb\x1c\
+SN\x19\x1dx/\xe0U\xae\x14p\xecanVI\
+b\xaf\x02\x0a\xa6;-\x08`L2\x88pcK\xec\
+gX\xee}\x94\xe3h\x19=\xef\xbd\xe3\xd0\x0e\xcc\xf7\
+m\xdf\xfe\x94\x88\xf3\xf7\x7f\x02\xfd\xe6\x1f\xbbCK@\
+\x9fN\xde\x22\x1b\x92\x13\x1bA=xv\x92\x17\x93.\
+\xea%/J\x9a\xefRc\x1e\xa5&E\xf8\x90g\xee\
+\x1f\x18A\x14\xfd\xd1\x11X\xf0\xd6\xf0\x9a\xd3HG\xb0\
+~`*Sp\xdc\xd9\xa0wT$X\xa7\x1c\xe7\xbb\
+\xedN\xb99\xf2-\xcf\xf1\xc2-&\xcaW\xceB\xea\
+\x888\xe5\x1b\xf88b\xcb\xccSP\x0a\xd2\xce\xc0\x94\
+\xd7\x9f\x15\xa1\x12K-\xb8\x93\xc1b\x1c\x1cT\xc3\xcc\
+`\x9f\xb8\xb0\xf0\x8d04\xd2\x82\xf6\xb5\xf5$w\xd7\
+\x8d\xd9\xde#\x04\x09\xd9\xeb\xbb\xa6{\x1e\x9b\xb6|\x95\
+\xb0\xfc#\xae\xf8\xab\xd7u\x06q\x19\x07\xd1\x0a~\xa4\
+\x13\x1e\xdf\x1f\xf4\xf7\xa3\x03U\x99\xb1v\xd6\x86*\x91\
+X\x1e\x00\xcd\xddE\xa1KO\x868\xf6\xad\x91\xc2 \
+6\x86\x03\xa9\x05\xba]\xa0\x8c\xcb\x87\xa0\xaa<t\xa3\
+Oa\xd46f9-U\xf5A)\x85\xeeS\x16\xf7\
+\x90\x9d\xefh\xc3/Y&\xd7\xf6\xc3Wk\xc0\xf4\xcb\
+iJ\xdcx\xcb\x17\x92\x17a{L\xea\x1dt\xa4:\
+<\xaa\x9d\xc3\xb0\xea\xd2\xce\xa3\xedS\x88K\x80\x0b8\
+\x8f\xe4\x09\xcd\xe0l\xa09\xdaa\x86\xb9\x86\x1a\x94\xfb\
+\xcc\x0d\xbc2^\xf9\x14\xf3\x1c\x19\xf7\x97\xf6\x1e\x0a\x13\
+\xa9\xb1\xb6\xdc\x81\xf9\xbe\xed\xdb\x9f\x164\x87~\xf27\
+\xd0\xa7\xbf\x85\x16p\xae\xa5\x19\xd46\x84\xfa\xf6Ie\
+\xb2WJ\xe1\x1c2\xcd\x9a\x09|\xc6\xd7\xc5\xb4PE\
+f\xbe\xd6@\x17]F\x1e\x1d+\x00`\xeb\xf2b\xde\
+\x95\x8e\x09\xd66\x8a\xaf\xc0\xb8|\x810\xfak\x0c^\
+3\xf2LW\xb0!\x91\x22!ddF\xa3  u\
+\xa6.\x01~+\xccO\xbd\xb8\x0a\xf1\xe20\x85\x193\
+\xe3.\xc3\xd6C\x81\x1dF\x15\xb28\x0a\x03\xcc\xd7V\
+\x99\xa5\x1c\xa4*\x95\xef\xc3\x81%\xe2\xe8=\xa9\x9cn\
+H\xe7\x00\xc8\xe29N\x87\xf5\xc6\xee\x1a4j-\xb5\
+\x9f\xad\xcd\x9e\xf3qi\xf8\x14\xf1-~\x88w_C\
+\x09\x8b'\xfb:w\x19e\x05\xe4\x1a\x0f\x1fl\xf2\x1a\
+3\x1b\x18\xe55}\x93>9\xd5\x9e/\x05\x96\xdd\xe4\
+\xc0{\x106\xbc\x17\xedj\x93a(\x8d&\x9c\xc1\xcf\
+\xaey\x96+\xb9\xdeg_nsh\x11b\x07G>\
+\xc4zCn\x8d\xafS\xd0'w\x94:\xc9\x93Q\xaf\
+oB}r\x05\x94\xed\x22O\x818&\x103\xc7\x98\
+\xba>\x5c\xb7\xbf\xc9\xc5ee\x88\xab\xf5D\xba\xb1\x92\
+\x8a\x8fa\x08\x1b\x07\x96\xb5\x1c4\xa4[m\xbf\xfc\x18\
+\x0a+\xbel\xfd0\xf6wa\x95\x84y\xf6dK\xb4\
+-\x5c\x80\x5c\xf2/\xcd\xebi\x17\x87\xcd\x90]\xce\x8b\
+\x98Md\xb4\x07\x0c\xed\xdb\xbe\xfdin\xf3=\xf4O\
+\xff/p\xf7bqi\x99\x1d\xd0v\x89\xa0\xf2\x0f\xb7\
+f\xb9X\xf9\x9c\xdb\xef\x22PF\x15\xfd\x1e\xd8r\xd5\
+\xe0\xab\x92\xaf\x08\xe3~\xd0(?\x19Y%\xe6\xfd~\
+\x80\xbcD\xeeY\xb0\xcd4\x17V\x86C7\xc9\x01\x83\
+M\x8c{\xdd\xea\xcf\xf4\xc7\x92N\xa9a\xd0\x12(\x1f\
+!1G\x0f\x15\xbf\xaa\xd2?\xfd\xc1e\xe0\x0dmZ\
+L\xf3\x81\x8c\xf7\x08\x10\xbb\x84?T\xb4\xaeg\xcc\xdd\
+?1\xb9\xb8\xf0\x9c\x8d\x8d\x91\xb4T\x09\x9f\xebCX\
+3\x1bc>\x0b8\xce\xc2<\x038\x12Op\x8f?\
+\x9b\xfe3\x88\xfb\xd7\xb8\xaeg\x03/\xa2\x81\x9e\x8a\xf6\
+\x95\x95\xe4\xcd\xd8\xd5\xb5\xf3\x9b\xab\xb1\x0e\xeaNz\xf1\
+\xe4\x15?\x00\xcdj\x09\xa3J\xc0\xb1\x15\x85\x0c\x03\x95\
+u\x88\x94V\xe9\x07\xeb\x0e\xe8*TK\x88\x85u=\
+UDI\x86[\xb5q\xcd\x9e\xa3\xb1^\xf5Vte\
+\xbc\xdc\xfd\xd8\xc1q\x9c\xc3h\x92\x9aT\xec\xa1\x0c\xd7\
+\xdd\x8a\x12)\xb1#\xfd^\x8b\x85\xc48\xf5a\x95\x88\
+\xd5\xad+U\xc3(\xcd\xb8\x0aE\x9f\xd4\x5co\xe8\xfa\
+\x04\x18E4]\xba\xb6\xea\xde\xed\xbdn\xbb\xbeC\xaf\
+@\xdd\xcfb>\xaf\xd4\xdeg\xe5\xbdL\x18U\x0bX\
+\x8as\x0dw\x1f\xf3}\xdb\xb7?\xcd\xed\xf9G\xc0O\
+\xfe+\xa4\xa3a\x96g\x07\xca;[\xae\xc6\xb6\xa6\xc7\
+\xa8\xd5\xa9W\xb6\x89@\x02\xe7\xce\xd7\x19\x1a\xb0\xeb#\
+\xd4\x8d\x9c\x13\xaa\xec\xa7\xfe\xca\x91C\x85\x8d^\x94\x90\
+h\x040\xdd\xa3d,w\xc9\xf4\xb5\xc6\x89D\xaau\
+\xed\xa5[\x8a;\xcf\xd5/c\xc7\xc0\xc3\x19|\xbb\xfc\
+\xac\xfc\x96)\xe4\xc5\xed\x7f\xa5\xca7\x9e\xcc\xa5\x8f\xf9\
+\xab\xa4\x83\x8e\xc2P6\xfe\xb6t]\x91\x97\xd5\xb0\x00\
+\xec\x00\xbc\xfb\x822\xb3\x97\x98\xf3b\x88\xb6@\xa1\x99\
+\x98\x8f'\xb6\x1cG\xe0\x02\xc4_L?xM\x82\x84\
+\xb6\xaa \xb9\xaeH\x16\xac\xa5T\xf9\x5c\xa3\x5c\x0dQ\
+\x0c_jo\xad\x8d\xa1\xc0\x16BS\xbd\x13\xd7\xe2!\
+\xdd\x9d\x05p\x1cX\xa2\x13>K!\x0e\xf0\xe4\xee\xa2\
+n\xaf)U\xe4s\xf4\xf2V\x00\xd8Lu\xb0\xd5Y\
+\xf7\xdd\xafD\xd0\x8b\xf4jiB\xa4a\xdeW\x168\
+\x81`\xfa{\xdb\x86;5\x0e\xd9\xbe\xc7`\xd5R\x11\
+\xfa\x16\xf7Z\xcd\x88+\x01\xd3L\x96{?t7\xbb\
+\x15\x96\x8a,\xfa\x9azQ\xe2\x03\x91\xd858nJ\
+^\x1bS\xed\xf4$\xb7\x07\x08\xc1zj\xefg\xc3\x92\
+d\xbd\xf8#\xc3\xce\xc5\xbf^\xe3im\x07\xe6\xfb\xb6\
+o\x7f\xa2\x9b\xde\xfb\x11\xf0/?Z\xc0\xf9\xec\xc0\xb9\
+\x14\xfe\xc1k\xcd\xa5\xa0%o\x93\x9b\x8c\xd4E\x1el\
+\x17\x5c\x8a\x06H\xd1\xb3\xdaQ\xfa2\xa0\x9f\xa5\xb1{\
+\x880\x88\xad\xce\x1a\xed! \x1f\xa0D\xe7\xc6\xb2\xd5\
+]*m\xfb\xbb\x17\xcc\x91=\x1b*2J\xa2%e\
+\xad\x06\xe1y\xd7\x99\xba\x8e\x0a\xfc\x9e\xb6\xa5(\x05\x9f\
+4\x04g\xc3\xcf\xe7\x00\xc0yP\xe0\xbd*\xb2#\x8c\
+\x8d\x80\xd7\x06+o\x83\x81\x9c\xe9\x82\x06\xe0\x22\x05\x1a\
+\x11\xae\xd3\xcb2\xe7\xe6\xf3eX\xf3UW~\x5c<\
+\xcb1\x13\x7f6\xfd\x12o\xf2\xef_\xfb9\xa3iv\
+\x15\xb1\x91\x9cl\x85\xd1\xbd\xc2\xaeV$\x00\x8c\xa4q\
+\xa2\x19\x0bJ<\xeexe\xa9\xa5\xbd\x9b\x9dY\xa3\xd1\
+)\x9d\x1d\xa3\xa3\xd1a9\xdbz\x18\xab\xf9h;Y\
+N\x10\xc9{\xf6\x949m\xc1IH\x98\x9a\x06W \
+h\xcf\x17\xd7\xe4IEq\x91\x01\xffN\xe6b\xcfM\
+\x90\xd9\xc4T\xa3\x84\x91\xd7\x95\x89\xd08\xe9\x1b0R\
+\x01_\xcdF\x8a\x01N\xb4\xc05\x06\x12u\xebC\x85\
+y\xa2\x89\xaa*\x1bI\xd4\x0eY]\x8a\x17,[\xc5\
+.\xcf\xa3\xfd\xb1:\xa3\xee\xaax\xfaI)ZIj\
+\x147\xa5\xe4\x16$S\xee\xee\xc0|\xdf\xf6\xedO\x17\
+\x9aC?\xf9k\xe0\xd3\x0f\xba\xbf\xb9K\xde\xcc\x1e'\
+\xb2\xf6~\x0a)\xa2\xf2\xa2\x93\xe4\xcc\xa2\x9c\x00\xea\xec\
+\xfa*\xa6<q :\xab\x08\xef\xb1\xd9\xa6\x91\x95A\
+7\x0d\x19\xcdu\xd0\xa1n\xe7\x84\xf6\x07\xa4\xc6i\xa7\
+N9\xaa\x070\xe8\x16\xb7\x17n6\xb5\x92b\xec\xc3\
+^\x15<\xa5$F\xa3d\xd0ZuR{\x93\x07[\
+@\xbb\xef\x1a\x15I\x03\xd0\xb7\x09\xf2\xb9\x09\xa0\x12P\
+\x0cn*\xeeS\x0a\x17\xa0J\xd2\x12\xf7\x97\xd6)D\
+\x1b\xc5\x9a\x09\xa2\xb1\xacy\x07\xe5\xc2|\x140\x13\xef\
+\xf29\xbe\xc5\xff\x84\xcf\xb0\xce\xf3\xc7\x982\x1ac\x9c\
+t\xc5F\xc6\xe3\xc6B\x13`W\x96}\xa6\xac\x222\
+{Y\xf4z\xaa\xb8\x8e\x1aE\xa9\xaf\xab}\x1c\x8c\xb0\
+\xa1\xeb\xa3\xc0\x82\xf3^\x91?]>=]q\x10k\
+\xcc\xd5\xebZ)^\xb4\xdf\x5cn7,\x03\xeb\xd0a\
+\xd7\x92\xc7\xc5\x1bJC\x96\xba7\xe4\x1a\xbd\x85\xec\xfb\
+\xc5\x06U\x13H\x14\xf6qm\xc5\xac\x0e\xb4\x95\xc8\x0a\
+\xce%EO\xf4j%)\x86\xa2\x84\xbe\xf0\xa1c\xc8\
+\xe9,\x0e\xed\xf1\xaal\xd7D-\xb1\xd1\xf8D\xadO\
+\x182\x83\xf8.\x02\x0f\x89\xb6b\xd3\xa5W\x89[\x1a\
+\xf4\xc1\x84\xb6\x02C\x0c\xedR\x96}\xdb\xb7?\xed\xed\
+x\x07\xfd\xd3\x7f\x06n_\x9c\x1a@\xb1\x18+G \
+\x1e\x99s\x13\x0cbu\x95\xbe\xc9\xb3rf\xc1`I\
+03\xe5-\xd4\xa8\x04\xf3c?\x96\xb2\x7fp\xa0\x87\
+\xdf\xa6oC\xec\xbcYA\xd8\x92\xa3;RP*\x02\
+}P\x80\xb8\xc8\xc5)0\xb0\x05{L\x8eA\xb9y\
+\xa5F~\x88\xc1[Z\x83\x939:c\x922\xd3I\
+KT\xd1-qG\xf8\xcfq\xc5\xe1\xb9\xcc\xaa\xb9r\
+h_9\x80\xf9\xf2\x0f\xea\x04\xc2\xe1\x9b\x0f\xab\x90\xa1\
+JyCkK\x22K\x9e\xadZro\x8b\xb8\x82\xf3\
+\xf9\x1e\xc0\xf1d\x8d\xf8\xaf\xa7\xff\x0f\x13\x9e\x7fIJ\
+y[\xc80\x5c\x1b5\x89\x09]\xb8\xd0\x02t\x94\xd1\
+Pkn\x8e\x09\x9b\x0e\x84)0\xd6\xc67?\xe9\x86\
+\x98XRv\xb7?\xf7\xb3<\x1f\x18`\xcc\x15H3\
+\x80c\x18\x1d;\x9d\xaf\xb9e\xf3[\x82\xa6iV(\
+\xd9y2\xb5F\xb259F\x10\xc7v\x8e\xad\xdb\x88\
+\xcbx*\xaahrc\xa5\xa0(.\xdbQ\xd0y*\
+.\x18\xb4\xb0\xbeYn\x18V\xd5\xfbr\x0fPE1\
+M\x86\xc6I;\x97l\xcc\xecT`\xd2\xb3\xf3\x0b\xcf\
+\xad\x85h\x0d\xc4\xaa<\xdc}q\xb1\x8ee){\xce\
+{\xb2\x86~\xac\xae\xfe\xf14\xc5\xce\xf2\xd94\xee=\
+\xd5\x83a\x07\xe6\xfb\xb6o\x7f\xea\xdb\xf3\x8f\xa0\x9f\xfe\
+\xb75vp\x01\xdfF\xda\x12l\x14m\xa3\xd3<d\
+\x9fQ\x84\xd4d\x9bCEC\xed\x81L\xc4O\xf4\x91\
+\xce\xb5\xa9-\x03\x04u\x16i\x14dtE*m\xbc\
+Mr\x91\xd9\xd8\x0d\x07\xf2[\xdc\xb6<s>`\xf2\
+\xec\xea\x82JP\x1e\x96\xacU[2\xf6\xf3\x9b\xad\xdc\
+\xa4\xc1\x9e'\x1fh\x95\xefk\x8b\xa1\xf2\xd1\xa8\x22\xe9\
+Q\xa6\xacQ\x11Y\xa2\xc2q:$k\xb2`\xc1\xab\
+\x5c\x95^<\xc0\xd9!\xa6\xb4\xd0\xc8\x006\xcf\xf2\xbc\
+J\x90\x1a\x8f-S.`\x9e\x85\xe3\x118..,\
+\x93\x88\xbf\xe0\xdf\xe2\x1a?\xfb\xd2L\x15\xb4\x80\xcdi\
+jc\xee\x90J\xd6\xd6\xfbZ\xa3\x04&\xb45\x0e\x05\
+9\xe7p\x17\x8d\x99\x09h\xf3zw\xaf\xd1;\xa9\xc8\
+\xc4\xac\x8b\xb9\xfal\xda\xe9\x80\x19\xfb\x8aIf`\xa9\
+\x0e\xce\xd6\xd5\x96v\x7f\x0f\xd9\x83<\xe8V\xdf\xf1\xa6\
+\x920'\xca9\x07\x99TJ\x87\x89CZ\xa5\xc0\xb2\
+\xc0V\xacR\x1c\xc4\xac\xf4\xf5\xc1B1\xdc\x83\x8a\xb6\
+K\xb6\x04(\x02\x94J\x99\x89\xba-&\xc3\xfc@\x93\
+\xd6\xe9\xfc]ba\xe0@<\xc7\xab\x99T.\x18\xd8\
+\x9d\x80\xec\xfaoo\x18-\xacd\x96B\xcd\xda,\xb6\
+s.?\xda\xadS\x17\xd7\x07\x0c\xc3e\xd8\x03\x86\xf6\
+m\xdf\xf6\x0d\x00\xf0\xde?\x01\xef\xfd\xf8\x84\x18V\x97\
+\x16\xf9\x98B\x85FO\x97x\xdf\xbc\xaa\xbd\xfe<[\
+'*\xbb\xa1H\xc151\x02\xed\xf8wr~\xe3>\
+8\xc2\xef\x87\xf3<\x97\x1c\xe8\x8d\x9f+\x15M\x9e\x0f\
+\x00\xf7N\xae2\x94\xe1\x18\x06]\xe3\x18M\x0d\xd3>\
+\xb7\xc1\xbe\x0c(w\xdau\x8d^\x17\x18l\x8d\x92G\
+\x07\xac\x8e6\x95\x1c\x86\xc5\x0a\xc0_C\x9e\xb2?\xc6\
+\xcd\xe7*1\xdd\x1c4\x98E}2j\xe0o\xbc\x82\
+\x19\x00~e\xb1H{\xb0\xca`\x92\x96%WoD\
+m\xc3a^\x9cX\xe6\x138?\x1eOl9g\xe2\
+\xcf\xf9\x13\xbc\xc5\xff\xfe\xa5\x9a&V\xd9D\xe5X\xe2\
+\xeew\xf9\x15\x88U\x87_\xb9j\xc8\xb2\xbd0Mt\
+\xf2=\x00m\x84(\x1b\x99\xab\xe1\xaa\x15<\x1255\
+_\x1d\x0fr\xa3e\xf3\xd9/zcX\xb0\xd0J\x8b\
+2\xfdW\x1c%U\x06\xa0\xdd@\xac\x91\xdeY\xa9\x07\
+Q6U\xd3Z\xf1\x956\x83\xde\xa3\xc4\x22x\x15\x13\
+U_\xbdPy7\xc30\xe7n-C'\x86X\xb1\
+\xc16 \xf3\x9e\x92\x1a\xe7\x91E\x12\x12W%\xdd{\
+1\xf5}r\x9d\xcb\x99\xd7\xe4\xd6\xb1\xa4*\x80H!\
+\x8e`]\x00Y\x96X\x18\x8b\xa5\x11\x91\xbf\x8eIw\
+K\xa8\x5c\x9d\xf0\xcc~\x94X\xa2\xad\x22\xec\xc0|\xdf\
+\xf6m\xdfN\x93\xde\x8f\xff\x0a\xf8\xe4\xb7\x8b\x94en\
+!D\x0a\xe0<Z*\x02^\xd3\xed\x18a#\x87\x89\
+\x81D>\xc9\xb2\xf2\x09G\x01tk\xdeG\xaa{?\
++P\xbf\x9d\x09Zr+H\x22\x1b{\x1e\x86\xd6p\
+\x89\x9e\x1e\x02\xd2Q\x83\xa9\xa2%_*\x06F\x94\xfc\
+\xe8g\xb5 \xfe\xa1\xf9\xa3\x89=\xad\x1cQR\x10T\
+N\x11\xe2\xb9e\x08u\xa0\x12\xf3\xf9X\xac>\xa0j\
+4\x1d\x16Ul\xcd\xa1\x0c\xde\xd3D5<\x98\x1b@\
+\xd5\xb9E\xf8\xfa\xd5\xc9W\x9a5\xe2\xbc\x80\xf2#\x80\
+#\xf1-~\x80o\xf0?\xe2K\xa1+\xaf1\xa5c\
+e\x1bB\x5c\x9b\x1f\x1dHZbt\x9a\x9e\xc4\xba\x81\
+\xa0\x811\x14\x0civ \xb1h\xce\x8f!\x96\xd2\x04\
+\x86\x0b[\x0c5\xc2\xe9\x9b\x1dU\xed\xb2a\xd8\xfb1\
+\x93u\xa8\x95\x99\xd0\x00\xc1>\x86U4y\x88\xf4\xda\
+\xf1\xf5\xd8\xa5\xb4j\xc4\x81\xf5w{_\x0el\x06C\
+\x94\xfcz\xf2\xd9t\xe7E\x1dC\xa5\xe5\x82.\xd7&\
+X\xdd\xf0E\xf0\x13\xc7\x22\xfe\x06\xfe-\x98e\x92\xd1\
+\x0c\x0a?dB<\x8f\x17\x99w\xcd\x17]^l\xb7\
+\x90&\x5c\x5cl\xe2\xbaN\x18G\xea\x09\xc0\xfe\xe2x\
+@\xee\x86\x1d\xab\x15`\xa6\xb0\xa3\xdd\x95e\xdf\xf6m\
+\xdf\xfa6\xdfA?\xfc\x0f\xc0\x8b\x8fS3\xa8e\xc2\
+\x11|\xce\x9d\xb9\xa2\xbc\x8bv\xd7\xa8\x07+D\x0b\xd0\
+\xd3\x84\xab\x02\x1a\xabV\xbb$\xd0\x1fS6\x1f\xca\x03\
+V\x9fX\x10\xe1*_> \xd7}\xe0\x916\xa3\xc4\
+\xab\xe6L\x0d4\xe6\xfeo\xe4,\x11\xeb\xb7\xef+\x1c\
+\x1c2e\xfeA\xef\x9d`4\x04\xfc\xda<\x95<\x07\
+\xf00\x92\xd0\xf8oJ/r\x85\x87\x7f\x18\x02\xf4\x8f\
+\xc7\xf4y\x84\x07\xe7\x18$:\xc6\x04Ow|\xf2\x9f\
+!y\x07\x16\xd7\xf0y\x0f\xe8^x\x1b\xcf\xf1=\xfe\
+\xdf \xee\xbe|\x80\xdc\x007m6wd\xe0Z5\
+a\x1aK\xe9\x81u^!\xd7Z\x9cA\xe4\xe2\xe4\x17\
+Mx\xf3\x1f\xf7\x9f\xe0B\x8f*\xdd\x8cAx\x8dq\
+\x0fE\x99\x1a\xc4\xe3\xf8\xe6\x8d\xb2\x04\xf4\x80.\xb2v\
+\xdc\x07\x0b]\x0e\xd7\xb4R\xdfH\xb9\xfeN\xca\x05r\
+\xb7=\x1c\x04\x06\x15\x87]M\xaaTo\x02M\x8e\xf0\
+\xd1\xdd*|\xbe?vcM\xa8\xbc\xbaB\xaeI\xa9\
+F\x0a\xa5\xed\x842\xc2\x17\x0c)\x855*\x8c\x8a\xfe\
+\x02;9\xa5Bf\xdd\xa7\xa2\x99\xdc\xad\xde\xd8\x9aP\
+&\x89\xd55\xbeZ\xbf\xff\xeaV1\xbd\x04\xb4\xf3\xcc\
+\xde\xfc\xb9o\xfb\xb6ov\xbb}\x06\xfd\xe3\x7f\x06\xee\
+^,:\xf3\xb97\x83&\xfbD\x0b\xde\x0a[E \
+Y/\xa2\x88\x91\xf7\xd2\x14ek\xc3\xc4}+KQ\
+\x10\xa5*\xde9F\xa5\x94e\xfco\xb3\xab\xb4|\xde\
+\xf9&\xd8u\xa7\xb6\xdc\x13a\x8b\x95\xc8\xca\x07\x99\xb8\
+\xfb\xf8\xb4\x04\xac\xfc\xfb1?8~\x81\xb6\x1ft\x91\
+\x8a\xd6Vg(z\xa4vr \x88\xc2\xec\xa8\xf9.\
+\x0e<\xcan*{\xc4\x92t\x07\x1a\x03F\xab%\xaf\
+\xf6\xb7\x00\xe19\x9c\x89Y_\x1c\xc7Lk\xcf\xa0\x03\
+\xe5\xf3=\xf0HG\xfc\xeb\xe9?\xe0\x80O\xbe\x94\xd3\
+\x83,D\xa1#\xc0\xbb\xf5!K\xa4\x8e*\xafge\
+H\xa5\xda\xd2\xb3\xfb\xc9\x07\xbb\xbd\x229k\x8dD'\
+\x95=\x94duG\x86\xc9\x94\x9aww\x04\x8d\x8aw\
+\x16\x8dP\xacr\x93\xb1\x00\xcc\xf6<\xd4\xd6\xe3\xe1\x0f\
+\xe8-\x09\xa5\xc1\xf8[\xd9\xee\xc0\x1ccmX\xad\x01\
+h\x14z\xcb\x04\x8d)\xe5\x95z\x0b\xd1\xc8>\xd7\xd7\
+\xc9X V\x81s\x09g\xf7^\x80\x94\xcdC\xa3\xd3\
+v\xcc\xb2R\xf2\xa8=u5\xf1!o\x9f\x89\x82\x00\
+_\xff\xbfI\xf7U\xcaU$n\x16\xab\xc9C\xd4^\
+/\xa9\x9cC\xfd\x1c\xb8\x8e\xdf\x9d1\xdf\xb7}\xdb\xb7\
+\xb8=\xfd-\xf0\xcf\x7f\x0d\x1co\x17)\xcb\xdc\x12?\
+\x1d\x83\x1e\xddZ\x1a\x98\xf1 [\x01<F\xb9K\x0c\
+\x1b\xd2\x00\xd4\xab\x08\xf6y5H\x01\xfc\xff\xec\xbd\xe9\
+\xb3eey>|\xdd\xfbL}\xfa\xd0M\xcf\x03\xd8\
+\xf4,\xa3@\xf9\xc6\x16Dq\xa2\x0cjDI\xa2\xc4\
+h\xca\x14I\xf9\xc1\xc4$\x15S\x95\x0f\xc9\x97\xe4?\
+H\xac\xd2$\xa6\xac2\x95\xd2$\xc6\xf2E_Q\xa2\
+\xc8O\x85\x1f\x0e\x04\x94\xb1'z\x84\x9e\xa1\xe7\xd3g\
+\xda\xeb~b\x0a\xff9\x00\x00 \x00IDAT?\
+\xec\xb5\x9e\xe7\x9e\xd6>\x07h\xa0\x85\xe7N\x19\xeds\
+\xf6\xd9{M{\xad\xeb\xbe\x9e\xeb\xbe\xae\xd8\x08\x9d_\
+\xc4\xbbX4\x96\x07\xe2\x98\xb95\xe1S\xee\xb7}\x15\
+\xc7x#\xc832z\xfb@\x17\xefImB\xc0\x0f\
+\xb9\x99\xcb6\x90o%\x1e\x91\x22\x86Z\xf0?f\x7f\
+\x9c\xc5\xab \xe1\xcfckF\xc7\xbe\x1b\xf0\xcd\x06\xfc\
+\x13g\x1b;\x0a\x0e\x98\x93\xb6h\xbeX5Gas\
+W\x01U-a\x99\xe9\x02\xd5\x0cc\xb8\xeab]\xe7\
+A\x0c\xe3\xd9_\xef\xfb\x83t\x99\xb0\xda\xe4  \x86\
+ \xed\x0f\x8d\x18\xad\x96\xb1\x90\x85|d\xadC\xb5\x1a\
+[5~\x86\xa1\x94\xe7M\xaa\xb7\xa9\xf1\xee\x13\x93\x0f\
+i\xae\x80\xad[\x8cl\x08\xc8|\x11\x85+Ltk\
+\x09\xbf\xf7\x1c\xac\x00q\xd8\xfbf\x07+\xdf\xc9d\xab\
+l\xe3\xe4_\xeb\xa8=\xa8\xa4$\x9f\xe7\xa8\xe9a/\
+\xb7\xd0\x143\xbb\xf3N-\xce$\xd4G.\xe4\x88\xfc\
+t\xaf$\x9f\xef\xc9y8\x92\xa3\xee<\xb8a$[\
+M1C\x22\xa2<\x83\xe5H\x12\xf3!BZ\x95\xbc\
+\xd4\xe1\x02\xacZ\xd7E\x93t\x8b\x8c\xd0N\xcar\xe4\
+\xccEN\xa2\xa5\x10\xa8\x17\x8dy\xa9R\xa5\xa2zn\
+\x0f\xb0\xffq\x80gzk\xf1\x9c\xc19K\x80.4\
+\xe6\xea\xff\xea\x7fW69\x94Y\x80w\x8e\xa5*\xd1\
+\x8d\xd41\xeb\xf9\xa6\xcafX\x94\x99_d\xf4g\xa0\
+%7\xff\x07\x04v\x89\xb2\x19A\xb0\xfd\x1cy\xa5\xcf\
+\x82\xfc\x11\xe8\xd4\xdb\xe40\xd4\xa7Wax\x1d|(\
+\x07\x82\xf2q'\x8ev\x81[\x89tE\x96\xce\xa6}\
+G\xff\xed\xa5 \xcd\x93\xf4\x84\x94\x03\xe1\x99\xd5\x0a\x9e\
+\x9fLA\x5c\x8c\xa1:\x0ds\xc5Lq\x07#Ys\
+\xf3YV[^U\x84\x99.\xa3\x9a\x06\x06*\xc6:\
+\xfa_\xcc\xc3\xce_\xff{\x83\xb4\xf7$\xd6\xd7_\x00\
+\x0e\x93r\xb8q\xb4Q\xfak\x0eY\xdb|\xce\xc8\x0c\
+\x81S\x0cf\x04\xd8ba#\xd8\x8b\xa4\xb7\x0d'y\
+\x0e\x98\x02\x19\x1aIb\xc1\xd9\xb3\x18\x7fj\xd2l\xb7\
+\xcdS\xb2@\x97#/$\x0bt9@\xb3\xc6\x8b\x1c\
+\x82yOh\xcf\x7f\xc9\xfa\xd9\x072\xcb\x01R\x01\xf6\
+\xe5\x10-e\xd9\x96\xd5\xd756\x8a\x1c\xd1\xd1\xdcb\
+M\xd9D\xd2\x93\x1d\x15\xcd\x0d\x11\xb78\x9e\x22H]\
+m\xa4cy\xa8U\x10\x18\xa1\xb4J\xf6\xfaz%\x81\
+\xc9\xb3\xdcy\x9e\xc6\xacJ\x90\xf0{\xb7\xf7\xe1\xe4\x16\
+cs,89\xcf\xb0_f\x04\x130X\x10H\xa9\
+R\xa5\xc2:\xf0$08\x0c\xbe\xe4Js\xcf\xe9\xa4\
+%l\x1277\x92:\xe6\x9au!i_\xd6\xa4\xaa\
+\x91fG8\xb1_,\xd2\xe0 X)\x9b\xce&\x97\
+\x92\x8d\x1d\x19k\x1f\xe1>\x9c.\x94\xbb\x97\xcd\xf1\x98\
++\xf0\x85\x95\x94\xe87\x0a\x81z\x0b9l[\x10\xfb\
+\x00v\x84Q0?\xc9\xcc\x00\xd1\x5cp\xbf\x7f\xb3\xb6\
+\xd7\xb5>\x11=\xab\xce\xfd\x0e\x98|]\x1bx'\x04\
+\xf1\xab\x961\xe7x\xde\xcc`D\x09\x0c8\xf0Bg\
+m+\xe4\xd9\xddL\xdb\x06`F\x0c\xec\x89\xd5\x1c\xae\
+j\x9f\xf2\x0a\xe8v\x19\xddi\x80\xba\x15.\xa3G1\
+\x1fO\xbe\xa6n\x0f\xec\x06\xd7\xb2\x7f;\x19\xa4\xc2\xb5\
+\x9d\xa0]V\xe1F\xa2\x00\xd6\x00\xb3\xf9^\x93\xfc\x96\
+Kv\x94\xb5\xdb}\xfa\xbe\xe98u\xaa\xb5\xf0\x0d8\
+wc\x8b\xd2\xe5\x83\xf2;6\xf2\x1aM\x0e\xe7k\x8f\
+\x03\xc6\x9e\x88B\x0e<\x1b\xa2Z\xb7\xed\xfc\x1d&\xd2\
+L\xb6T\xb4\xfb\xbbB\x1e\xd8$\x05gk\xd7\x92\xbc\
+\x81\xe28\x06\xf3\x9fM;D\xea\x1d\x92\x9c\x83E@\
+\x12\xb8S\xa7Uf6\xdao\xb7\xb9\x0f\xaa\xd9~\x0a\
+B{|\xb0T\xcfA\x85\x1c\xf7ln0\xa2O!\
+!\xed!\xff\xf9\x94\x8f\xbc\xba=\xb3`\xd9\xe1\xbd\xd9\
+\x9b\xeb.\xbd\x95\xb2\xd6$\xf1>\xf9ZH\xc7CY\
+\xbcS>\x86\xc1\xe3\xa4-\x14\xa9\x00\xf3R\xa5J\xb5\
+\xc3\xb8\xfd\xbf\x04u\x06\x80U\x97\x8b\xdbJ\x85<D\
+\xd8\xd1\xf7L\x12\x11\xdc\x0d8\x87\xb1Wc\x83\x8e\x05\
+\x13\xda\xa0+\x0a\xcd\xaa \xbd\xd5L\xd2\x1ac\xf6Q\
+\xc3 \xa9\x10\x8e\xc8\x12\x0f-\x19\x03\xed\xdcs\x01\x05\
+\x19\xe4\x90\xe7,[\xa2@\xb5\xf7V\x86\x88\xaa\xe6~\
+{\xd2g\xeeR7\x05\xb3E)i[C\xe5J\xd0\
+\x1aL\x14\x10\x96\xfdD\xee\xeeu\x84~\xe9E\xf9\xfc\
+\xb3\x7f.Kas\xd8\x14\xb0\x8ahg\xcb\xbc\x86\xf2\
+\x18vC\xae\xe2\x9d\xdc\x82\x0a\x81P\xe9Y\xe8\x1e \
+g\x02\xd7~\xe533\x00f\x805\xb4\x15\x0b\xf0\x08\
+~]\x1dX\xc2\xeb\xafa\x02m\xa7]\x07\x0f\xb1p\
+\xee\x90\x03\xa3\xde-\xd1\xf8M\x93f\xa4\x1bD\x14\x85\
+K5@\xd8\xc9V\xb8\x095\x22\xcdXSp\x9b`\
+\x0d\x9b\x15\xc7\xdc\x80D{\x8f\x09\x07U\x0d3K\xfe\
+x\xc5\xbf\x88\xfbh&\xad\xdbV3\x825\x02\xa4\xec\
+\xf5X\x03I\xd2\xfb\x9a\x0e\x0a'\x07\x18\xb5\x19\x0d\xfb\
+\x1b\x00l&\xff\x9d\x82\xb9_P\xa0[\x97\x00\x95\x90\
+m\x15Iy\x80Sx?t\x0d\x88\xc6\xc0\x02\x1d\x8b\
+}\xa9Ay`t\x99\x00\xb8\xea\xf7\xe4\xf9h|\xc7\
+\xc9Z\xaeR\x22\x97\xe4\xa1d\x91\xe0j\x93fY\xf6\
+\x02!\xe9\xe15\xfc\xc4AcV\xff\xef\x02\xccK\x95\
+*\xd5\x8f\x16\x03\xf6>\x0c\xea\x0c\xa0Z\xb1\xb1\xbe\xbd\
+tz\xff!\xf4(B\xaa\x97\xfe\x89\xf4\xf3I\xe0 \
+R\xc8]pGj\x94?3\x1b,\x96`C\xddD\
+\x04\xd2ZR\xdc\x22\xb7\x806\xaa\xd6\xf0|\xe6\xf3\xfc\
+R\xac\x05\xe3\xfd\xac\xcf\xdb\x1cG\xd4\xeb\x19\xb3\x038\
+\xee\x07\xd4\xc9\x81\xf2\xb9\x01{+\x19h{f\xb60\
+\xd9j\xf5\x9a\xe6\xb0\xa1\x142Hn\xe3\x84F\x9c\xd0\
+\x92\xa0\xde&!\x82e\xf3\xc8XtJ\xf6[\xe3+\
+m\xf2C\xda\xb6\x93\xb5\x073\xd7`\xbc\xd1\x96w+\
+`f\x9a\x81i\xc6\xa5\xd8\x81\x8b\xf1\xb3\xd7\x14(O\
+L \xb1\x03u\x86|v?\xe30\xadV\xcaS4\
+\xdb*\xa5\x09\x14}W\xed\xe7\x10\x04\x83\xea\xd9a\xbf\
+j&\xc6\x1c\x0d\xaary\x06d[r\x93NK\x14\
+|a\xf4+\xf56S\xd8\xb1\xa7U\x02\xc32\x1bl\
+j\xb2\xdcI\xd8\x19\xb2\x1b\xdb\xa46\xef\xc1zU\xd3\
+\x1d\x97\xe4$\x13\x9c\xf7\xa8\x9b\x10=@>\x1f\x94\x98\
+i\xbd\x0dM\xf3\x16\xf9\xcd7g\xa3e\xed\xa1\xcd\xfe\
+T=lX\xb7}\xc1qT\x9e\xf1\x92\x01\xa7\x0c\xc0\
+\xe5\xb1\x89|j4%\x10\x05\x0f\x91\xd2\xad\xc7\xfd\x88\
+\xdd\xb6\xde\xfb\x17`^\xaaT\xa9Y\x80`\x05\xde\xfd\
+\x0bPg\x00\xbcl\x9d\xf8E\xc700ZJI0\
+6\xc7\x0d\xd3\x22\xfc\x86\x93\x8fn8\xb5\x1e\xb0\xaa\xf5\
+\x8d\x8c9\x1a6\x8a\x9c9\xd81\xb5\xd2:X\xf8t\
+yvk\x8e\xa9\xa1s\xc9!\x8a\xb4\xe5s\x02\xcf\x96\
+f\xe1\x16\xd96\xc3\xb5\x13\xad\xe6+\x1c\x90U\xdc>\
+\xf4\xa9\xdf?\xd8\x08%k\xe20i\x93\xd5{\xd2\x1c\
+\xfa\x8f<`\x17)m#\xfc\x9d\x93\xf78i\x99\x95\
+\xe4\x96\xb3\xd4\x22\xe9\xe8\xd3g\xe9\x03\xe4>\xc3\xb2\xf4\
+b\xc8S\x84\xe4\xf6\x86=\xa7{\xb6\x88\x97\xf0N,\
+\xfe5\xf6*\x9f\x05\x99\xd7\xa0\x9c\x1c-L-k\xf5\
+\x99e\x17\xfc\xaf\xd2\x7f\x8b\xa0\x16\xd2+ZdiE\
+h\xefsu\x9d\x88\xf0\x9b\xfc]7i\x99\xf2{)\
+|\xcc\xc94r\x88@k\xd2\x91\xfbu4\x0f\xf0\xf3\
+\xe7\x10\x91b\xa3\xa5\x0cOn7\xd8\xb3\xe4\x1a\x18\x87\
+w\xbat\x1d\xdb\x95\x04\x10\xb5\x93\xd3\xb6\xef\x10{\x02\
+b'?b-\x1aW\xcd\x81\x1e\xc0D\xf2U\xd7c\
+\xe7\xd4zOS\x9fO\x14\xda\xad\x12E\xdb\x9ao0\
+\xe4\xb4$\xde\xec2\x1fc\xce\xcf\x83\xe4?\xdf0\xe5\
+\xda\x1aS\xdbz\x12|\x94Q^\xc9Pm\x81\xb8\x8e\
+}\x13\xd9\xb6\x22R\x80y\xa9R\xa5\xe6\x08\xce\xb1\xeb\
+g\xbd\x07\xc3\xf2\xb5b\xd5\x8f\x00\xee\x04\x00\x8a\xf3\xcd\
+\x95H\x03\xe4\xf4\xbc\xcba\x0e\xf2\x06\x99X\x13b\xe1\
+hf\x1c1\xa2\x98k\x97\x88\x17\xfb\x06\xdb4\xc9\xd9\
+l\x11\xe5m\x9d\xdb\x1e\x88\x1e\x89\xb7\xcaG\xda\x80%\
+\xcf\x82\xce-\xe3\xce\x91\x94f6\xb0\xcfs\xdbN\xcf\
+\x09q;q\xd5\x06`\xa1\x1f\xba\xdc\xaf;p\xc7\xc5\
+\xb3\xd8\xfd\xf6\x8b\x1ch\x8f\x17\xe19h0T\xf3\x11\
+\x0c\xc6\xe6\xc6BH\x8c\x04(\xaf\xaa\x1c 4=\xcd\
+\xe0i\xc6\xaajG\x0d\xca\xab\xd7 (W\xf4\xb4\x1a\
+\xd8\xf3\x02Z\x82\xca\xfb\xa4\xc0r\x88H\x85\x0d5\xe7\
+\x89 \xd8L\xe9jQ\xb3\xad\x8eQ\xa6F\x86%@\
+\xa5\xfc(\xd7\x18\xc8\xf7\x0b\x89[\x91\xfcJY?\x9c\
+\xe4\x13\xa4\xc1\x16g\x9b\xc5\x0c\xd0\xf3r]\xd6\x1a\x8b\
+\xb5\x1f\xca\xf2\x08r\xabHR\x1f\xc1&{\x93\x82\xd3\
+\x92\x0f\xa2\xea'\xc4L\x8em\x8c\xc8H\xf2\xd4\xa9u\
+'\x93\xc40#\x9c\xfe\xc2\x02\xcf\xa4Zg\xdf\xadq\
+\xe0\xf6\x12 {q\x0c;h_\xf7@\xfe\xfc\xe0\xfe\
+\x99\x84J\x86\x99\xce\x84\x04\x89\x95\x13\x16~\xf0\xec\x9b\
+\x1a9\x5ce=\xe6\xd9'\x07\xa7U\x07\xd7y\x88\xf6\
+O\xfa\xb8\xd7\xd7n\x01\xe6\xa5J\x95\x9a[U]`\
+\xd7\x83\xbd\xbbJb\xce;\x00\xaa\x1e+\xd0\xe9 \x98\
+;\xb2I\xd7\x0ahI\x1do\xba!\x12`c\xbd\xd3\
+\x03\xd7\xb0\x0d\xf9\x01\xd3\xc6R\xc7\xd3\xf8\x16p\x12\xec\
+6\xc5\xe0<\xbe\xc1\xf2lxX-i\xb2\xd1d\xb4\
+\xf6\x17\xca\xcd \x1a\xce\xe4\xbe,9\xb5\xb2\xf2\xf1\xc3\
+\xbd\x15\xfc\xb2\x08\xe4\xb6C\x97\xfd\x9a#ng\xb8C\
+\x0d{\x04\xf0\xa3\xe5\x08V\x01|0\x87B$/\xf6\
+\xd3\x95\x07\x99T\x9c\xf9+\xe6\xecLcr\xb5\xc0\x15\
+%\xef\xfeJ\xfa\x95\xcf0\xaai\xc6\xcaj'\x96\xbc\
+VA\xb9dt)\x90\x1b$\x0c'\xbf],\xbe\xce\
+\xa4\x85)\x94\xc1*\x0b\x86V\x03D\x01he\xf2\xa2\
+\xc1\xaeM\xc7\x1f\x8dMJ\xe0\x17}\x9b\xc8\xd9\xa8\x08\
+\x86S\xa9k\xf2p%\x99tL\x92\xd7\x1f\xe9\x85\x81\
+\xac\xbd\xf7z\xe6h8Qi\xe4\xa5\xd3\x08%\xe7w\
+\x04c\xa9\x99\xe1\xb6\x0d\x0brS\x92a\xb6\x88\xb8'\
+2\xf7\x00\xedb#\x9d\xc5\x9bA^\xab\xa7f\x12 \
+]~QYR\x1b\x14\x12\x05\xf9\xbeo)ts\xad\
+\xc8\xcfQ\xf43\x9bs\x84\xd6\xe42\xc3O\xbbU\x1d\
+}\xad\xfagG\xdb\x0c\x91Z\x89\x85 \x97\xa4%%\
+\xe9k\xb2\xd1\xca\x93h\x5c\x0bc^\xaaT\xa9\x17\xcc\
+\x9c\xd3\xae\x9f\xf6\x9c(\x96\xaf\xaf\xd9\xa3\x0e@\x1d\xa0\
+\xaajO\xd7fI\xd0\x803\x12w>\xa7'\x11\xf6\
+Q,\x9f\x8c\x92\xdb\xe1\x90qph\xd1#g\xf5\xe0\
+4\x9cI\xbe!GlpH\xbb\xce\x89\x9cn'\xbf\
+9\xb8\xc1\xb3\x07\xcd\xcc\x1ab3\xcf\xf5\x03|\xcf\xc0\
+\x96\xf9\x8a\xac\x17\xa3\xc0!\xf9\xa8\xb3\xae`\x81#L\
+|\x9e\xda\x1b\x99\x08\xc4\x83}\x10l\xffa\xd4~\xe0\
+\x5cKiH=\xc7\x85\xac\x05\x19\xdc5\x92'\xb6\x17\
+\x84\xf1*\xaf\xaa\x9e\xb6\xbc\x01\xe5\xdd\xa9\x0a+\xbbO\
+c\x09\xfd\xe4\xb5\x0b\xca\x13;\xe9\xc5\x09Y\xc1@\x0a\
+\xd8\x90E\xd9R\x1e\xd1\xe0\xe5\x861v\xbat\x03~\
+Sc[7O\x84h\x0b\x12\xb0\x95\xffn\xe4Kj\
+n%\xe9\xe2\xe4MB\xbf\x9f\x9cmm4\xd3\x12\xe1\
+\x93b\xec\xe1\xa7\x16\x83\xd9\x1a\x92;d\xd8Yy\x9b\
+\x0cE\xfc\xe4T\xebj\x18V\xdf\x0aI.\x17xY\
+\x18\xf7c\xe0\xe1V\x17\xa4\x15\xa5V\x1c\xe6\xef\xbe\x22\
+\x88\x8d\xe5\xa9\x1d\xc2$+L\x17\x9cxc\x8dKb\
+\x10Vy\xac\xbb\xf71\x83\xb9\xac?T\xadz&\xf7\
+\x1a\xcd\xe4\xbbY\x07\xe8%\x91fX\xd4\xb5~I\x82\
+\x15L)\xb5\x1a\x14P\x1e\xa06\xd7E\x01\xe6\xa5J\
+\x95z\xe1\xe0|\xf7\xcfz7\xaa\x15\x1b\xb4F\x92\xe3\
+h\x04\x85\xc7C\xd26\x0b\xc7\x13$R\x812\xac\x1e\
+6\x04\xbd\xb0iu\xd6\xeayk\xd9\xa0\x16v\x97\x94\
+\xa9\x19\xab\x98\xf5\xb90\xea\x11Kn\x7f\xc0\xfa\x09\x9e\
+<s\x95\x0fr\xa4\xa7\x080t;km\x1b\x006\
+\xc8\xa1\x8f\x14\xa5\x0d7\xb3aG\xd9\x7f\xbee\xd5]\
+ocl\x17\xa9\xaf\x8cf\xb6\x01\xd8\xf6q\xac\x00^\
+\xc4\xcc9\x22\xc6\x5c\xfe,\x99\x1a'\x1dy\x02\xe7\xdd\
+z\xd0\xb3\xdbK\xf5\xecN2Vvwb\xf1k\x1d\
+\x94K0\xd8\xc8\xd0\xc84\xdfr\x8e\x84\xb4\x95\xa9\x0a\
+\xa7\x11ss\xe9\xef\x04\xea#q\xfd\x92d\xbb\xe5\x80\
+\x9f\xbd\x8f\x08\xe9\x82d\xdbY\xdd\x07\xd8\x8d\xf3Y0\
+'\x1d^\xa4\xf6<t\x0bI_\xad\xec \xc3\xd46\
+\xe0\xac\xc5\x18\xcd},\xb1\xaaVYG\x01\x90o\xd8\
+\xfaD\xcb7\x8d{\xd6L\xab\x9b\x90H\xfe\xf4\xf3\xb5\
+\xcd\xca\x87\x09r2\xf2\x1c5\xdbc\xad*\xcd\x806\
+\x82c#\xc1\xbc\xec\xd3\xb2\xbb\x8b\xe0\xf1\xc9\xf2\xf4\xf9\
+;\xdfk\xe0\xfc\x9a\x08\xb3\xe9sd\x93(\x1b\x10+\
+\xef!=\x9e\x9bW6#w\x1d\x0a>{\x167z\
+\xb9Z\xa04-yxZI\x8f\xea\xe7P\x01\xe6\xa5\
+J\x95zq\xe0|\xcf\xcfA\x5c\x81WlJ\xfe\xe6\
+\xd2J1\xe5\x97\x91\x05\x89\x94\x19r;\xf4\xc9:\x12\
+\x1a`1kD\x0a\xe0:W`\xe3\xa5\x9c\xef\x8b\xf1\
+$\xbdK\x0e4\xee+\x0c3\xdd/A\xaa\x19\x80b\
+\xe3\x97\x1d\xdf\xa3e8\x87\x06\xdc\xfd\xd8k\xc6l@\
+\x17\xad`\x9b\x8dH\xbd5\x8d\xb4\xedM\xb8\xbd\xe1\xf0\
+\xdb\xc0}\xa4)\xed\x0f.\xd5\x9b8\xe9\x8aXQq\
+\xc7\x84\xbd\xac\x85%\x01Jq\x93\xc0VS\xae\x97K\
+R\xb8R\x0a\x11\xa2\xe4U^5\xbar\xee\xb9\xafT\
+]\xf4\x98\xf2j+\x16\xd1\xff}\x1d\x80r\xe4\x95\x14\
+)=H\xcd1%\xab?\x22\x9f\xd6\xc9\x81T\xc4Y\
+\xfc\x99\xe6\xb3\x01\xba\xce\xce\x10\xc2o\xda\xe8\xa3\xf5\xf4\
+\x05i\xd0\xcd\xb6_\x13\x0d8i\x22\x81\x03\x99\x1c;\
+\xba\xbf\xb96Y\xb9?\xea>R\x1a\xec\xc90\xa2z\
+\x9b\x5cT\x03)\x99\x8f\x04\x86\xaaC\xb0\xf7\x04j\xf9\
+\x8e\xa5\xf9\x1dr\x03\x94l,)\xe5\xc0\xacw\xdci\
+,\x04[\xe6w\xc8\xfa\xd5Pj\xd4r:\xa6i\xee\
+\xc9r\xff\x90\xa3D\x8a\xb2\xe8\x1dK\x0a5\xe6p\x96\
+\x85\x14l\xb3\x96\xc0P\xd8@\x91\xca\xe9\x88\xf6/Z\
+U!s\x0dI\xe5~\xb6X$eaIA\xf3\xc2\
+\x5c4\xe6\xa5J\x95z\x09\xe0\x1c{\x1f\x02U\x15\xb0\
+r3\xd0A\xf25\xef\xdd\xb2*\xc8\xb4\xba\xbc\xdc(\
+\x12:\xe5\x00Lk\xb0\x8f\xb7I\x09S\xd3\x98\xf4\xa0\
+b\xa4\x13\x947S\xd6\xf7\xf5\x98}\xe6\xbc\x1al\xc0\
+\x9d~>r\xbd\xcc\xcb}\x00\xf9\x1cx\xe1>\xc4\xee\
+\xac\x0a\x11\xf7\x0f\xcd\x94s\xbf\xf7\xf2\xb4!\xdc\xda@\
+_}yn\x95\xb8o\xda\xa7y0\xa2M'.\x9a\
+\xa0\x00\xe4'\xf0\x02\xef\xcf\xe9d/\x9cu\xe3\xe0\x96\
+AO\x8e\x0f\x9f\xd4\x987\xb6\x88U\x03\xc8g\x18\xdd\
+I\xc6\xaa\xee\x93X\x88\x07\xf1\x9at_\xe9\xfb\xfd\xa7\
+\xc8lZHY\xda\x02\xc8\xb2l\xc5\x87\xdeP\x90\x04\
+\xe9\x07${\x92\x12\xed[\xc2DIn\xe0\xdc\xb2\xeb\
+\xedd\xc3\x80'\xbfj6\x22\x13\xce\xf7\x18\xd9\x08(\
+SU#\x1cN\xd0;\xf2\x06\x0f\xc2i\xe4\x17 K\
+oX\xed\x87\x1d\xd0d\xa3\xb7VdDj\xbe\xc9\xc8\
+E\xb2\xc3\x11\xec\xca\xa5\x80\xfcm\xf7\x06\x12\xb2D\x99\
+Qam\x18#\xb7HJ\xf7E\xc4\xe2\xec\xe0W\xd9\
+\x87>7(\xean\x16\xa8L\xb4\x14Hkf\x9am\
+v\xab\x1c\xc9%,\x03t\x16\xf7\xa8\x08\xb4\xb3\xee\xc7\
+\xd4\xfd\xd5vd,N>\x99\x86\xb4\xd5]\xb30\xe6\
+\xa5J\x95:/\xe0|\xdf\xff\xa233\x85\xea\xd2\xab\
+\x00\x1a\xaco5\x9d\x10WR\xc0\x5c\x83\xc4\xb0\x9e\xf3\
+8\xf7S\xf0*9\x92\xe4R\x22k\xf7[6\xcb\xd8\
+\xc1\xf0\x0d\x1c\xc8\xa4V\x868b\xd7=\xc7\xd7\x7f \
+r\x16#\x19\xcca\x96\xb2\xe5<D\x0e\xec\x040c\
+\xce\xa2x\xc7p\xf3\x1c\xd9ov\xafo\x1f\xee\xf4\xcd\
+K<\xa4\xaa\xed\x12\xdb\xb7\x95\x04\xf86\x0fo\xc9\x88\
+Z\xad\xabe\xfd\x85\x07<*8\xcf\xf2\x1e(\xaf\xd9\
+\xf2$_\xa9\xb0\xaa\xfb\x18\x16\xe0\xe7\xaf;P\xae\x5c\
+CH\xafq!Jm\xb4\xa0\x5c6\xa1Br\xe2V\
+:H2\x92\xe4\x06\x005\xa0\x94\x9a\x0a\x8d\x8a\xb3\x14\
+\x86\x02ol\xcfe\xa7\x80#\x18\x10\xab\x92iI\x01\
+,\x88aJ\xd7\x9b\x12\x05\x8c6\x89\x94M\xad\xbfO\
+\x03\xc8 \xa31\xcfKt\xd9\xf5\xca\xc8\xd5\x8c\xdc\xa2\
+\xb1\x84$\xd1-e\xd9;\xab\x94S\xc8\xc6\x22\xc9`\
+(\xee\xf9%{,\x07L\x05z\x96\x8c5\x98b/\
+zx\xabD\xaa\x8f1\x05\x01<\xa9=1t\xber\
+\xc4\x11\x83\xa8,\xad\xb0(j\xfb\x02\x02G\x0d\x81\xea\
+g\x12E\xcd\x05\xc7L\xbe\x0a\xdb\x83\x08]b1\x8f\
+\xe0)\xa3\x02\xccK\x95*\xf5\x92\xd19\xf8\xc0c\xe8\
+\xccL\x82\xd7\x5c\x0f\x1e\x18\xaa\xd9\xf2\x8e\xbfy9G\
+\x06s\x93g\x13<R\xdfl\x9d\x0d\x9fX\x12\x8c\xa2\
+\xe0Sl\xb4yh\x13\x07\xb0\x5c\xce\xa9\xb2\x96\xb8\xf4\
+\x8bMvir}\xfc\xc8\xa9\x0f\xb8l\x0b#\x22\x8a\
+`}\xe4j\xa0\x93~\xd8\x00\xf2~n+\xda%\xc7\
+3\xe5\x04\xbc\xe0\xa1S\x05\x90\xc5\xa6h\x9fsmK\
+\xe3\xed\x14\xf3k$\x90no\x12\x84\xbe\xbd\x85\xb1'\
+\x16\x0d`\xf4Z!k\xe9IWrpPb\xc9\xeb\
+DO\x9e\x9c\xc1%\xddG0\xf6\x1aK\xf4|\xe1\xe8\
+\x5c\xd3\x87Y~\x10\xfaV8\x00\x9c\x00[\x14\xb8C\
+^\xe3\x9d\xbew\xd2f\x91\x9c\xf8\xcd\xa9\x0dX\xf5\x0f\
+\x96\x09MQ/\x86\xb94N,\xca\xa2\xd5\xcb\xe1\x1a\
+0\xcdv_H2\xfc\xec\x929\x95HG\x0e\xe1D\
+v\xaf\xd2\xc5&r\x9f\xa1X~\x93Xhs\x06\xf2\
+j\x86am\x1b\xb6Z4'\xfa\xdb\xad\xdd\x5c\xb2\xad\
+e\xabg\x09B\xda\x18z\x86\x00h\x9a\x052\xae4\
+\xfa\x99`)s\xd2\x1d\x9ei|\x10\x902\xa2i1\
+\xb0\x9cT#\xa9]\x5c\xa8eH%{\xdb\x93\xed\xbb\
+\x9c\x0a]\x0d\xdc\xb2\xde\xc7f\xaf\x0a0/U\xaa\xd4\
+\xf9\x01\xe7G\xb6\x81f\xa6A\xeb~\x03\xd5\xc00\x80\
+\x0aL\x1d\x83\xa7}\xc2$Q\x96\xb5h\xffX\x16\xa1\
+@V\xef\x9d}\x8a\xd5\x92\xa1J|\x13!FnV\
+L0^\x1ch\xc8\xedm\xb7E?\xde_Sn\x08\
+eg\x91\x18\xc7\xc1q0\xfc\xaaX&\xf6\x0fIk\
+M7'\x86<\x04\xeb\xda2\xa6\x9f,%\xaf\x5c\x04\
+R\x9d\x96\xa6#\x8b\x8d\xfc\x0b\x88}XR?\xf9\x8c\
+\x0b.b=s\xc0\xa1T\x854;\x0e\xcd\x8eK\xdd\
+93j;\xc4\x0c\xca\xbb3@gr\x12\xab\xba\xf7\
+c\x04;_\xc7\xdfv(k@y\x8eHI3\xc4\
+\xb5BM\xf0SF\x7f\xcdk\x99\x83\xa8\xfb~\xdf-\
+\x92\xf7\x09\x0d\xca\x89\xa4\xff\x86I<\xf3\x88\xa9\xd5\xdf\
+\x9c\xd5K\x8d\xda\x9b\xda2\xd8IH)\xf4=$\xdd\
+\xec,p$nmz\xb4\xfe\x9bR\x22'\x1b\x17\x1b\
+\xb2\xf7E\x81F\xf3\xd0\xa6\x01\xd1\x1c\xf6VZ\xd3\xed\
+\xc648I|H\xe5\xc97\x8d\x8bH\xd4\xd4\xc2i\
+\x13Fe\x99wa\x11\x19e\xcd\x89/}f\xe6I\
+\xa7\x8c\x22p\xe9Q\xa64\x04c\x16\x96\x1b!q\xfe\
+\xbdB^\xaf\xc8F\x01\xd2L\xac\x88\x122+\xb4r\
+s\xd9t@\x81\xc2\xbe\x00\xf3R\xa5J\x9d\xc7\x07\xf6\
+\xf3\xbb@Sg\xd1\xd9p#\xaa\x91\x8bz\xc3\xa1\xd4\
+\x11wa;\x10J*\xe4\x9a\x0dxO\xba\xcb\xc8f\
+\xd1\xd8)\xda47\xc5>\xcb\x87\x01i\xa6\xb9}\x98\
+I4\x1d\xdcJ\x19\x86@<\xa4\xa6\x1d(\xd7\x80\x98\
+\xfb g\xee\xab\xe7h\xb7R\xec\xe7\xd8\x12\xb9\xb5\xd8\
+\xd7\xb4\xda\x14\xb69\xb1\xf0,\xe0\xbf\x8f\xaf8l\x93\
+\xc4^\xf8o\xb7\xc7\x81y\xf1\xfev\xc8Si\xcb%\
+@cvi\x9e=@\xce)\xcd\xb3\xdb\x05\xba\xd3\x8c\
+\xa1\xc9SXY\xdd\x87A\x1cz\xdd~\xc7u\xca\xa6\
+o\x1d\x01\x97\x97('\x10\x94<#\xb2[\xec\xdd%\
+\x1a\xbdu\x1b\x09+\x06\x19\xd5\xc6h\xcf\x15}]\x09\
+\xd0h@\xa2\xfb\x08r\xc8\xdc'c*\xe6\x18\x82Y\
+v\xd3\xa7\xb2\xadv{\x1c1\xdc9\x9a^\xef\x07+\
+v\x98\x150\xb5\xdfk\xb2jo\xb2^\xea\xd9\xde\x90\
+\xc2\xa6\x0bQK\x12\xe7C$\xe9\x19\x85\x89\xa8m\xbe\
+%)\xe4\x87({\xb9\xbb\xc6\xc7\xce\xa5\x90\x18\xfa\x85\
+\xda\x93X\x8e\x12[<&\xb9\x1b\xc59\x11\xd1{&\
+\x89\x91\x10\x8a\xaby\x17\xf2z}\x99\x96\xea\xb3j\xe5\
+,A\xde\xb6N\x81\x12\xa5J\x95:\xaf\xe0\xfc\xcca\
+\xf0S\xdfG\xe7\xd4a\x103\x88+\x10W\xf5}\xa8\
+\xd2f\xd0IR\x10\x99E#\x0d\xec)\xaf:\x09F\
+\xe5[\x18 \x9d>\xa2fh\xd3\xff\x05\xc9\x95=\xe9\
+\x02k\x9c\xa67E\xff\xbb\xd9\xb6\xc6\xdc\xd0\xeeS\xde\
+\x92t\xfbM\xaff!\xae\xad\xff\xa6\x15w3\xfak\
+\xc2\xfb\x00\xf2\x90\xedfV\xa0Z\x1f{\xcfv\xf3,\
+\x9f\xe9$\xec\x01{\xea(H\xa0o\x1bD5\xa8&\
+\xfb\xea\xc0\xaf\xdc\xfb\x9d\x93\xf1\xccnk\x10\xa0,\x11\
+Y\x80\xf2\x04\xce+BU\x11ff\x80\xee40:\
+y\x04\xab\xab\xff\xefu\x0d\xcaS#K\x94\x83\xc1\xe4\
+5C.9\xc0\x93\xd4\xa4=\xf4\x99\xa4\xf6:\xbf+\
+\x1b\xcbD\x18\x17\x172L8\xa7k'\xf0\xe8'\xdf\
+\x00\xe8\xeb\x95\xfa\xccQpx\x8d\xe6\x0fD\x92\xcd\xd9\
+DK\xc5\xf4Fr\x1d\xb9\xf1\xb2\xbf\xad=\xb1\x99\xb8\
+eDD\xce\xddX\x08,d9\xc2\xe2\xd0\x85\x02\xb9\
+\x95I\xc0\xcd\xc3\xb0\x9d\x18h\x9f\xfb\x89\xa4\x22f>\
+7\xe8\xef)i\xaemO\xc4m\xa09\xb2\x9f!x\
+\x99\x09\xebk\xca%\x12\xe7\xf0Us_k\xac\x14k\
+\x9fq)\xdfO\x0d\x03y7\x19\xd2\x93N\xaa9\xe2\
+\xe0L\xa5\xc3\xc8\xf6R)\xc0\xbcT\xa9R/CM\
+\x9f\x05\xef\xb8\x0f\x9d#;z\xae-5@\xd7\x80(\
+\xfa\x0f\x9c\x9d`\x03\x98\xd5\xdf%\x96Y\x03c\x09\xc6\
+\x13#\xe1\x12\x1c\x9b\xd7z\xc7p\xc7\xbc\xa2\x0f\x13\x9c\
+\x80i\xe4\xc4\xc2Z\xf3l\xec\xd4\x1a&\xc5>\x0f\x14\
+s\xdb\x02\x8e\x9d\x02\x83g\x01\xf2\x8c\x96!\xd0\xc0\x06\
+\xc7\xe2\x0a'\x07\xe1v\xb4\xcb\x9e\xfd\xf6?\xcf\xd1\xa7\
+d\xc1v\xab>\x9c\x11g\xa6\x07\x01M\x92\xe5d\xc1\
+\xc2\xd9\x070\x0b\xd0!\xac\x11\x138o\x98\xf2\x19\x06\
+OUX<\xb1\x0d+\xaa\xef\xa0\x83\xd3\xe5\xbb\xcdM\
+\x98\x14;@\xd9\xb8\x99@\xe4Sf \xdbc\x07\x99\
+\xc9;Q$\x9bJ\xc36\x129\x80\x93.U\x07\xd0\
+\xea\xf7G\xb4\x92S\xfbF[\xb3p\xb9\x98E0\x80\
+\x8a\x0c\xba\x94_\x93\xda\xfc\x8eI\xcb\xe68\xb2h%\
+\x05\xe6\xd90\xbdr\x08\xc3^\xcf$d\x12\x16\xf02\
+{\x90/%-\xda\x8e\x15\xb5$&\xb8\x07\x90\xd4N\
+{\xe9\x1c\x05\xcdM#cK\x12\x0ea1\xcb*\xb1\
+Yw\xf0\x914\xa5'#b5\x98B,\x03\x80\xf4\
+\xfe\xfb\xab\xab\x1e\xcen\x9e\x09\x8ex\x91.7\xb6\xc3\
+\x84\xd7\xf0\xc8\x19\x1d\x22\xed\xa6\xaa\x97\x13\xa0V=\xd2\
+>\x92\xba\x22=C\xe1UU\xf6\xd6V\xa4,\xa5J\
+\x95zy\xaa\x9aA\xb5\xef\xe7\xa0\xf1\xe3\xa05\xd7\xa3\
+\x1a\x18\x01\xa1\xaao\x90\x9d\x80je\xf9\xd4\xd1\xcc\x0c\
+\xfb\x01\xcf\xde\xfdN<\x8a\x82p\x222)nl\x19\
+[\xce\x7f\xeb\x81&+\xcbE\x17s\x1f\xb1\xc9\xb3\x00\
+\x9a~\x84\x5c_)8\xb74\x04~B4o'\xb7\
+,!s\xdbP\xe8\x5c\xfc\x18\xad\x17\xbbN\xd9\x8cY\
+\xea >\xdb$}\x86\xfb\xcf\xd0\x83\xbf\x01C\x1e\x1d\
+G9\xcc*\xfb\x11\xd9W\x90j\xd4\x1a\xa6\x5c$y\
+\xd6zr\x9a\x9a\xc4\x8a\xa9\x9fa\x1e?\x85\xd7\xed\x90\
+gP6p+\x0c\x0acv\xe1^D\x8e\xaa\x8e\x07\
+\xbb\xe5\xa5\x161\xb2\x81c\x88\x02\xd2\xace\x1b\x8ey\
+\x0d\xb4\x1bR\x97\xde0\xd5MPR\x93\xac\x99\xa1*\
+#\x1a\xd0\xf4\x81a\xe2\xfa'\xefH\xca\x81\xecZ\xcd\
+S4\x83\x99\xd2\xe5\xa4\xb1w$\xff9br&\xb8\
+\xfd\x90\x91~\xb7\x01r\xc0\x85\xe9\xb0\xe4\x9e\xe5\xfe\xf8\
+4fg\xf5-\xef\x11jE\xcd\xc8d\x92rM\xcc\
+\x0e\x98t\xcft\x8eH;\xc9\x90t~\x895I>\
+|H\xb9\xb8\xe4\xb5\x06\x96\xcf\x16\xf2mJ\x90\x15\x9a\
+q\xbe\xf7d4\xcd\x12\xe0\x03\xf1\x84\xbc\xa8~q\x01\
+\xe6\xa5J\x95zY\xe95>\xb6\x1d4\xfe<:\xeb\
+o\x04\x8f.\xaa\x7fZ\xa1]\xd0\xc0\xfd\x1f\xdc\xd2z\
+\xcb\xc4\xbf\xb1q|\xb1K\xb4r\xe8\xd3\xfem\xa83\
+g\xc5{h\xeb\xc5>\xda\xc9\xbe\x92pj\xc3\xc0\x06\
+\xc0\xb6\xda\x9f\xeb\xd7\xb1\x89\xb1\xd6\x7fcA\xb19\x8c\
+\xdc\xfe\xd6\xee5\xac\x0d\x90u\x03\xd0\xbe\xe3\xa4\x1eD\
+}Z\x9b\x88\x88g\x85x\x82\x81O\x0f\xd63a\x98\
+\x87\x0b-\x18\x97\xa0\xbc\xaa\xff]\xd5\xf2\x95n\x97\xd1\
+\x9d\x06F&\x8fa\xc9\xf4\xff\xc1\x00\x8e\x96\xafqt\
+\xaa|&\x90n~)\xb6\x1e%\xc18\xdb\xd8t2\
+\x17d[\xbe\x81d\xdd3\xfe\x97\xf2\x98\xc0\xcb\x5c\xb0\
+\xc3l4\xbd\xfa\xcd\xa5\xc4\x5c\x87\xf2\xb0\xb8W\xa4 \
+%h\xbfl\xf2\xc94\xb5+\x0bT\xb2\xa9Dt\xae\
+\xf9h\xdc\x92\x98\xd5>\xea\xbcP\xaf\x99f\x22p\xc4\
+LC&\xa6\xca\x06\xaa\xbeo\xba9\x1b\xfd\x05cx\
+O\x1demIz\x10\xd8\xea\xccY,\x9fIhk\
+\x87\xb9\xd5}\xdb\x12\xdc,\xf2ZM(\x13\x8b{a\
+~/\xe9\xb3\xcfhY,0\xfc\x86p\xa1\xe10J\
+H\xdd\xd7\x84\xe8?5q\xa4N\xa6N\x93\xf6\x9a}\
+\xe7\xe0\xd8b6\x5c\xaaT\xa9R\xe7\xfbA>~\x0c\
+\xbc\xed\xfb\xa0\xe7\xf6\xa1\xc3U\xad=\x17\xa8\x88#m\
+y s\x11\x9at\x16\xdap\xc7\xfa\x0a\x0d\xb8\x05\x14\
+\xa1\xcc\x84\xa5\x12}\x16i\xb7\xd4\x96\xcb%\xdc\x08m\
+\x1b]\xb7\xdeD\xd6v\x8eN\xeb\xcefY:\x96\xfb\
+H\xab\xc7V\xef\xc5h\xe62\xd2\x5c\x07\x1f\xa7\x18r\
+\xc9\x94\x8b\xbf\xa1\x08XK\xed7\xb7Hc\xb8\xe5g\
+\x11\xd8\xb6\x0b\xf1!\x18\xd7\xaa\x9d\x9c\xe0\x99\xff\xc3f\
+\xd0\xb3\x91\xad\xf4\x98rF5Ua\xe1\xc46,\x9b\
+\xbe\xab\x80\xf2\xbe_\xea\xccj*s\xb9H2\x01\xad\
+\xaf%eQDBSL\xee;l\x17\xb3\xd2`\x9e\
+\x22\xadY\x83%F\xfc}l\xe0\x91\x02\x84\xb5\xb4\x8a\
+\x156\xaf\xed\x18)t-\xe4F\x82\xe1.GVz\
+y\x0f\x1c\xa9\x051\xfb\xefd\x06\xc3\x94\x9a\x1c&y\
+_\xd0\x1f\xae\xd8z\xd7\xccP\xa8\xcd\xce\x0e\xa1\xbay\
+\xcf.0d\x02\x99\xe0\xbf\xf0\x12\xd4\x8a[T\x14\x9c\
+\x13y\xbc7\x12\x1b\x97C\xc4r8\x92\xad\x9f\x93\x06\
+\xc9I\xe3\xa2\xf5\xdf*\xfc\xad\x8d\x07\x22\xf6k\xb7\xdc\
+\x9c\xe3\xa0)\xa4\x0c\xb8al$\xad\xef<\x89\x80:\
+\x09\xd3\xd3\x8a\x03\xc5\xe2\xc0\x02\xccK\x95*\xf5\xca\xd4\
+\xcc\x04x\xcf\x8f\x81g~\x85\xce\xcct\x0f\x9c\x0b\x04\
+\xc8\xea\xbfa\xa6.5(\x17O\xee\x0c\xaa\xed\xa0(\
+\xd0\x02\xde-H\xb7i\x90r\x9b\xa0@\xb2\xc2\xa7,\
+\x80:C\x01\xebf\xdb\xd8\x01x\xa84\xc1\xb4\xbf\x8e\
+x\xb4\xfb\x1c\x93\xcbv\x00\xd6M\xb6q\x80\x01x\x16\
+or;45\x8b\xd3\x0a\x09\x9f\xf2V\xe6\xbba\xad\
+\xfb\xbc'\xf5\x03\xdd\x09\xe0\x93\x07\xfd\x916\x1e\xed\x0d\
+@\xcf\xcf\x9c\x92\xfbJ%B\x83hr\x12K\xcf=\
+\x80\x853\xf7\x810U\xbe\xb3}\x8a\xc4w\x90\xa4?\
+u\x03I\x02\xe0\x9a\x17\x9b<\x17IA\x83\xe7\xc2}\
+$\x08\x95\xaeD\xd0\x96{\xa4\xad\xc2\x15\xe0\xb2+m\
+\xc9~\xcfI\x10Xu\x9f,\x07\x1eY\x8e\xec\xb1\x92\
+\xeaP\xdb\xaa\x90Zi3\xc8\xb8\x91UXE\x1d\xc1\
+\xa9\xc0\xf2x'\xb5\xaf\x16\x05\xe7*\xb7?\xa4\x9a\x12\
+R\xc9\x95\xe2-j\xe1\x7fn\x98ts\xc3\xc1J\x5c\
+sT\xa8\xc5Z6J\xdflRu\xcd\x22BMx\
+\x93v\xef\x12\x06\xf8zt%\x1f[\x12@\x9b\x85K\
+\x8e?<$\x1cQ\x08\xf1\xedK\x10 dY\x8d\xe8\
+\x98\x04\xe1s,EFbh9\xdd7\xfdpj\x91\
+\xb2\x94*U\xea\x15d\xd9\x18|\xf81\xd0\xd9c\xe8\
+\x5c\xf6VT\xf3\x16\xf4nX\xd4\xd138\xd2)\x0b\
+f)\x95l\x04\xb2\x18\x0e\x946[2\xb0\x83D\x90\
+\x85\xbd\x05\x13K\x18j\x96R\xb3|B\xa6I\x86 \
+4\xc6\xadb\xd7\xdb\xfd\x07\xd9>\x8c\xcd\x1b\xd9\xf4;\
+\xeb\xb3\xdb\x06\xac\xdd\xf6\xce\xba\x91\x96}\xe4Y-\x13\
+#\xb6\xcfS\xf3\xda\xd38\x02\xdd<[\x13\xc00\x83\
+}\xa4\x80\xa1l\x902\x90\xf7\xf2\x95\xe4M.\x99\xf2\
+i`x\xf2\x18\x16M\xdd\x87\x01.,\xf9\x5cP\xb9\
+\x0c\x86\x91\xd9=R\x07\xdc\x9c\xa6\x8e\xe8y\x9d\x95a\
+\xc3\xe8\x02*\xb4Fjs\x1b\xe6Z)\x14$\xa8\xb7\
+\x81B\xf5{F9\xb3\xfak&u\xd6\xce|\x5c;\
+\xa4\xab\xf0\x1f= j}\xf6\xc9Z&\xaa\xef\xb2\xd4\
+\x87g\xa6\x95Cmr\xe0\xf0A\xf9\xda'\xeb\x01\x98\
+\x9a\x09\xd2wM\xf6\xce\xeei\xa5Cx\x9c\xb3\xd9\x17\
+\x22/\xbd\x00Q\xcb\xcd*\xfb\xc8\xbb,\xb8,\xf6\x0f\
+U\x8aN\x96.\x93b\x89\xc2\x86P\x1eG\xcb\xab\xa7\
+\xf7cI\x0a\x90\x00\xd8\x1d\xe4\xd4\xd7H\xca\x93SY\
+!\xc2\xa5\xa4\x8b&\x99\x83\xd9{\x9f [V\xbe\xb7\
+\xf1\xcb\xb7:\xf5\xa6\x0ac^\xaaT\xa9W\x1e\x9f\x9f\
+9\x88j\xfb\xf7\xd0yno-m\xa9jk\xaa\x1e\
+r\xe2JJ;\x9a\x1b1\x1b\x89\x0b\x9c\x97!+\xc6\
+\x1b\x1a\x95%\x87\x17\xc3k\xb0f\xcb\x99\xb5\x07\xa3d\
+=8ptaf\xa7\xba\x09Ck,Y\xc6\xb3\x1b\
+\x9d@\xb2\xd1f\x90\xd1\xc9:B7\x16\x9fr\xe7;\
+\x81\x96m\xe0\xd8\x11\xb9m\x1b\x133\xc7-\x5c\xb8p\
+\xd4\xb1^\xbf\x86\x1cl=n$\x02\x80\xf29j@\
+9\xa9\xb0\xa1\xe8\x1cX\xe9J\xd5\x05\xbaS\x15\x16\x8c\
+o\xc5\x92\xc9\xff\xb7\x80\xf2\xb9\xe2r\x96C\x89\xec]\
+\xa0M\xc8\xa5\x9c\xfdH\xc8Z]j,\x02ml\xfc\
+\x96\x0e|Q\x9a\xe7$]\xf0\xe0\xb4\x8d\x05\xb7\xdb\x9a\
+/'\x8a\xbe>y\xae\xc4\xa0-\x86\x0f#\xeb\xbd\x94\
+\x1d\xcb\x9f\xa5\x166\xd2\x9d\x1d\x01 A\xae\xf63\xd7\
+\xdcC\x88\xe4\x91\xe5Z\x8a\x87%\xb3ba\x88\x00\x1f\
+\x9a\x99W \xd8\xad\xa0\x19\x82C\xea\xe2S\x16\x85i\
+\xba\xc93\x042R'\xbae\x90<\xe1P\x1cJb\
+\xd4\xfdj\x8a\x96\xf8\xe5K\xae\xf1\xc5'5\xb3D\xb2\
+\xb1\x8b\x86p\x8c\xfb\x0d#\xee\xe1\x92\x84)z\x0ba\
+\xfbK\xb6\xbf!\x9b\x86\x8c\xe2c^\xaaT\xa9W\xb1\
+f&P\xed\xfd\x09\xb0\xe7A\x0cL\x8e\x83*N\xf2\
+\x16b\x06\x05\xfas\xb2\x88\xd6\xda\x152\x0bB\xd6\xf8\
+\x0e\x0a\xa4\xcd6X\xc6=d[R\xea,E<{\
+V\xbc\xd8\x96@\xaa=\x0bC\x8c~\xa46\xc7.\x88\
+z\x7f\xa1\x197\x17\xb0\x13\x88\xb2\x83tO\xe6\x88\x1f\
+\x0bp\x81\x05\xe8\x1c\xb0\xe6\x1c\xb3\xdb\x1c,\xc9St\
+<\xd4:u\xecWnYr\x19\x1c\x94\xa5+\x04L\
+\x9c\xc3\x92\xb3?\xc2E3?,\xd2\x95\x17\xd6ZC\
+\x9a\xd7YV\x97A\x91\xcb`o\x08\xd2\xc8\x00\x94\xb9\
+\x0a\x1b\xa7\x8b\xc6\x86.\xd2mS,N`d\xdd\xb8\
+\xdf\xae\x06\xe0\xb1\x8fc\xa4\x16ph]\xd1\xc9\x02\xbe\
+\xe0;`t\xcb)\x80\xa6\xb1\xe5\xb4\xe1Gl\x19s\
+\xf2\xe9\x99\xea\xeb-\x85\x13\xf9\xbb\xdb\xe8\xfb\xfd\xe0k\
+\xfa \xdf8\x07V\xae\xcd\xbd\x96\x94\xc6\x9etw\x10\
+Y\x986\x9b\xcd\xc1<\x08\x89c\xc9\xe6\xb6@~\x9b\
+\x92|\x86U\xaei\xddtA\x8d\xf0&\x8f\xf6\x84v\
+\xa3\xe3\xe5\xfb\x99\xa4\x17'\xb3\xcd$\x88\x1e\x8a'\xe4\
+\x9d\xfc<H,f\xf9\x19\xf6<2\xc1-\x0d\xd7\xaf\
+)R\x96R\xa5J\xbd\xaa\x0fx>\xfe4\xf8\xcca\
+t\xde\xf0\x16\xf0\xc2KQu:h&cH\x05D\
+3\xa4\x93\x96[\x07\x15\x0f4\x15AMv *?\
+\x90u4\xbc\x5c\xaed\x0fD%E#W&\x15K\
+\xc8.Y\xb4Q1&&\x90\xdb-\x0cu\x86\xb3_\
+Z\x861\xeb\x0a\x01\xbdI\xf4\x94\xccc\xf6_6 \
+\xbf\xa5\x13\x10\xc6\x0d\xed\x0dD\xbf\x86\xc26\x01}\x82\
+\x7f\xda@8!\x06\xed\xd6\x81E{\x98\xe7\x9fq\xc5\
+\xc2u\xa5\x07\xca\xab\x99\x0a\xa3\xe7\xf6\xe2\xa2\xa9\x07\xd0\
+\xc1\xc9\xf25|\x11\xb0<Ag\xce@\x5c\x82D\x9d\
+\xda\xc9Z\xe2\xe2\xdeK\xca\x0c\x02\x18\xe4\xc4\xe1\xc2\xfa\
+\x8f(|/)!H*t\x22\x83\xbaY7\x8f6\
+\x11\xb4\xb9\xcf8kRgn\x08\xc9\xc7G\xb9\xa6\xd2\
+\xb6Q\xba\xb8\xb6\x89B2\x98n\x97\xc58/\x95t\
+k\x93\xc9\x99\xf26\x18yy\x9biM2\xbf\xaa\xf5\
+\xdf\xaclS(\xdf\xee\xb2\x22'o\xb6K\x84\xe5\xb4\
+\x02@&y5\x81l\x22\xdf\x97\xa4\xaf4\xe5\xe1\xc9\
+f\x15AD:\xcb\xbb53\xbc\x95$\x93?C\xa5\
+\x14\x98G\x00\x00 \x00IDATi\xd1\x8d}/\
+\xc4V\x0c\xa4\x9b&\x8en\xc3r\x92\xd3tE\x14\x8e\
+C7N.:\xe1\x94\x98\x0b0/U\xaa\xd4\x05P\
+\xd3gP\xed\xfe?\xa0E\xeb\xd1Yu\x1dx\xde\x82\
+L\x86\xcbt>\xeb\xd5'\x1e\xc4\xd93Lpg\x8d\
+\x0f\xb0\xf0\x22\xb6\xac\x86zr\xb1\x1etb\xc3\x1c\xe7\
+\x87\x09\x89\x910j\x05\xa6\x19T\x1a\xd6\xaf\x9f\x19:\
+\xf7\xe7\xde\x03D\xdd\x82\x9cXm\x03\x99\x07\x91;|\
+\xc1\x07\x92!\x15\xdb\x81w\xfc\xefPF\x03!o0\
+zs+\xedQdR\x1f\xf7\x16i\x9b\xc8\xca\x9b\x5c\
+\x80\xf2n\xcf\x9f\xbc3y\x1a\x8b\xce\xfd\x1c\xc3\xd56\
+\x14o\xf2\x17_D\x9c\x99`\xff[\x01r\xc4\xc5'\
+\xbf\x8f\xd2\xed\x83\xa3\xc4(a\xcd\xa9\x9cA\xa4] \
+)\xccL\xe2{\x1fZ\x0a:\x18\x9c[\xe6f\xa0\xd4\
+\xca\xac(\xf0S\xa7z\xd5'\xc9\xa6\x99\x94\x94\xc3\xc5\
+\xac\xa7&7\xdb,J-\xbd\xbf\xdb\x18;\xbe\xe0~\
+\xc7\xa1\xfe;\xdb&\x92\x97\xcc\x07\x1e\xe7\xac\x07\x04\x1c\
+\x98\xe5\xac\xff\x07\x89\xf9\x1bm#\xa9\xee\xb9\xe6\x13\xdd\
+\xedJ\xcb\xeb\xc5Y\xb0\xb7HN\x12\x14\xbd\xe2Aq\
+\xe3!\xaeK?\xc3\x109\xd9d\x9d\x11\xc1/\x09\xa6\
+\xe7\x85\xb3\x93d=\xef\x94)&d\x0f|}l\x1a\
+\xed\xb9\xee\xfd\xeakF&AS\x09\x18*U\xaa\xd4\
+\x05\xc6\xc3\xf1\x89]\xc0\xe9gA+\xae\x03-\xdb\x84\
+j`\x10@\xc7\x0c\xc1\xdb\xe1#\x0f\xca\xed\x90hZ\
+Z\x8f\x0cr-\xa3\xce\x9e\xc3\xf2\xf8\x93\x0d\xf2\x9e\x83\
+\x9f\xf9,N(-qK\xb3\xff\xedl\xaf\xe1l?\
+\xa6\x1c\xd5f\x01\xd5\x11{\xcd\xa6\xe1\x98\x0d\xb0\xb3m\
+~\x98\xcd\xcf\xd1\xdfM\x82\xd5*|+@\xb7\xba\xfe\
+\xa4~\xaa(\xdb Nw1\xff\xdc\x0e\xcc\x9fz\x10\
+\x84\xf1\xf2u{I\xa8\xbc^\xf9\xa1v+\xba\x9e\xdd\
+\x1c9\xa3\xe6pn\xc1\x01H\x12 \xcb\x03\xb5\xc4P\
+\x1a \x96\xdd/8\x04\xc6\xe9\xb3\xa4L\x85L\xdfl\
+\x1b\x80\xc6c\xdd4\xbd$\x22\xd5U<;I\xf0\x0a\
+\xc5\xd2\xfbu0\x1fJ\xd4{\xbf\x0e\xa4\xec\x83\xd4j\
+\x81\xd0G\x87\xc7\x9e\x9c\xfaB\xab\xaa\xb5\xf7z\xef\xd8\
+\xb4\x04\xe3$\xce\x22\x03\xf4\x1c\xee\xc3i@4\x03V\
+\xe8\x8085\xe8iZ\x03e\x83\xdaHlD\x10\x13\
+Qz\x7fw\x87%\xd9\x9ae+I\xe2\x06\x1c\xc3\x05\
+\x01E\x19S\xcd\xe7\xa6\xbf\x15\xc7Y/\xae\x98\xf5\x8c\
+\xe4\x89o\xeeUM \x1d\xc9\xfeCz\xbd\xebv\x85\
+\x05I!?\xaf\x00\xf3R\xa5J]X\xd5\x9d\x04\x1f\
+\xfc9p|\x17:\x97\xfc\x06x\xc1\xf2\xfaA\xd5\xe9\
+\x8fO\xd3C\x90\xd5\xc3!\xa7\xe5\x09\xb6\xc5y\xf7\x06\
+\x0b\xca\x91\x89m+\x18\xe6>\xaf\x93H\x98\xfaa\x9d\
+\x04 f\xc5\xe1s\x04\xea*\xad\xb4-m\x93\xe7\xf0\
+\xde\x1c\xf9\x12\xb7\x01r\x96\x88\xc3L\x9d\x89\x00\x17\xf6\
+AI\xee\xefZ$,d\x07g\xad79\x03U\xc5\
+\xa8*B\xd5e\x0cN\x1c\xc2\xd8\xb9\x9fb\xb0:\x80\
+\xc2\x92\x9f\x8f\x1e:7\xc2DQ\xa4\x8d\xcc\x88\xd4\x12\
+\x88\x9eou\x1bp4\xe0\x85\xb3\xae\xd8\xbd^\xea(\
+\xac\xa6\x82\x05\xa8\xb7\xeci\xe0\x87\x9f>\x8b\x8cq\x9e\
+\x08$r\xf9_r\x08U\xd0\xe9,\x814\xf9c\x12\
+\x1eK\x05Qk-~B\x85-\x00<\x02\xd3\x0ad\
+\xda_\xea\xf4\xcd\xb4E&\x7f\x87\xdc\xb6\xb1\x0bDB\
+\xd0^\x91u]L7\x9a\x8ep\x7f\x81Kk\xcd\xcc\
+4t\xc2\xa9\xe8\xa4\xdcj\x89pS1\xbc\xbc\x03\xf1\
+\xfaZ\x813\xb9Lm\x8a\x0b4rF2\x9a\x9d\x97\
+\xa7\x8529@\xb0\xa0\x9dS\x82\xb1\xb4\xf1D\xd2\xb5\
+\xb3\x9e'(\xc9\x9f\xa5J\x95\xba`k\xe2\x18x\xf7\
+=\xa0\xc5\x97\xa3\xb3\xf2\x1aT\xc3c:\xe2\xdb\xdd\x81\
+)\x16C\xab\x89\x1fy\x93d\xcd\xd0Y\x13\xe5H\x0b\
+\x1e\x02x\xcc\x81\xden\xa1\x85Yj`iN\x89\x9d\
+/\x04\xacS\xe0\xefm\xc1x\xab\x1db\x9f\xcd\xb6\xbf\
+\x97:\xf0\xb4d\xaf\xe2K\x85\xbdal\xd9 ,\x0f\
+5@\xd7l\xb9\xb0\xac\xab4X\xb7\xae+\xdd\x8a\xd0\
+\x99:\x85\x05g\x1f\xc6\xf0\xcc\x93\xc8\x7fP\xea< \
+\xf3l5\x172\xd1\x825\x0e\x1b`\xa9A \xa5M\
+\x87`\x0f\x13.d\xef\xe4\xd2\xac\x02\xb1\xf3\x0e\x17\xd7\
+\x99SgP\x1eL\xb6\xf2\x17\xc8tL\x12A3\xe6\
+Z\x153{\x1e\x09\xf6o\xe6\xd9\x04\x19%0\xae6\
+_\x7f?\xc8}o\x8c-\xa2\xbbU\x08v\x1b\xdav\
+\x92\x1c\xa0\x17\xa9\xabfw\xd8\x82\xe7\xa8+'\x0dd\
+e\x93\xa4\xd3B5\x18V`\xbb!M\x02fZ\xbb\
+\xf0\xe8\xcfu\xc6\x84,c\x88\xa0\xac<s\x7f\xc3\xda\
+\x82\x86\xac%\xaf\xf9l\x8b\xccYL-\x10\x0b\x1bH\
+}\x13d!waI\x95\xbba\xd7\xac+\x97\x1f^\
+\x80y\xa9R\xa5.\xe0\xe7?\x83\x9f\xdf\x0a>\xb9\x07\
+\xb4\xe2zt\x96mD\xd5\x19R\x1aE\x0e\xd79\x85\
+8T.\xe4\x92XNf\xc1\xa0D.\x03vA\x5c\
+\x0eI\xc9eOn\xddt\x1f\x18\xe2\x9e\xe5\xec\xc0A\
+\x88\x9e\xdds\xdf\xee\x1b\xf5\x07\xe8b\x93\xad\xfcd\xce\
+=E\x9f\x7f\xb3\x00Bd\x81\x98\x1aZ\xa5\xcc\x94\xcb\
+aM\xf17\x1e\xa0C;\xcd\xc8\xc1N\xce\xff\xee1\
+\xe4=P\xce\xd3\x93\x98\x7f\xee)\x8cL>\x04\xe2\x89\
+\xf2=z9\x8a\xb4\x03\x9e\x966\x05\x8d.\xf20\xa5\
+NU\x94\x13wZ\xc7\x9b\xbc\xaa9\xa04!\x92B\
+%\xe5I\xc2(\xd0\xb0\xb3\xa9]\x14\xafg\xe7#n\
+\xf8W\x96\xac\xbf\x06\xc3n\xf5\x0d\xd9\xff_}5)\
+\x0f9\xb2cn\xfd\x8a\x81F\x86\x96$\xd0r0\x92\
+\x14\xac\x18P'{kR\xce/2\x14\xca\x10\x0ej\
+\x80T\x03\xf4t\x149\xf8;q\x5c\xd9\xc1fJ+\
++d\xf7: \xf7%\xd9\xc2f\xa4\x16\xbe\xa7Pg\
+\x8d\x1d\xcdm\x08\x1a3y\xdb\xf8\xf1\x13\xd9\xc9\xd5\xbc\
+\xc2\x90\x13`9`\xf8\xcds\xc0\xcdC\xc4w~u\
+\x92\xcc\x01(\xc0\xbcT\xa9R\x17~u'\xc0\x07\x7f\
+\x0a<\xbf\x1d\x9d\xd5\xff\x0fx\xe1*0\x0d(\xb6\xcc\
+Y\x9a\xb9'\x9eN#\x94\x0a\x0bb\xf9\x00\xc8\xbf \
+\xa7\xfb\xb0\x11r\xfd\x182\x0eYw\x867\x84\x90K\
+\xff\x98\x0d(\xcb_\xb0\x90\xed\xa8\x15\x83v\xb6\x9d\xb9\
+e\x8b\xfai\xc6[~\xa64\xe46\xa5\xb3y\x80\xab\
+\x17SZ\xfa\x8fR\x0b\xd3P\xad\xb1\x97S\xc2\xf8\xda\
+\xa79\xfd\xef\x0a\x09\x94\xf3L\x17\xc3\x13\xfb1\xef\xdc\
+\xffE\xa7z\xbe|o^N\x5c.\x82|\x9c\x88 \
+\xf0\xadn\xd8\xda\x04\xcf(L\xdf\xa9\xdf\xcf\xc6|2\
+`4\xd5\x8d6\x9b\x8c941\xc7=:\xb4#\x8a\
+\xc6nl$)\x06\xccY\xb9Az\x0f\xef\xb7\x91\x9d\
+W4\xab\xcd\x89\x18`\x1f\xb4\xd30\xb1\xc4\xf9\xf8\x08\
+\x87(\xb2Z\x8b\xd4\xc7\x18\xdb\xca\xc6R6\xfd^\x1a\
+\xa9s\xfa,\xeb>\xd3\x0c-J\xc3\x94f\xa8\xb5\xd1\
+\xb2grX8O\xa9\xfb$i\xe6\xdb\x1e\xaeF\xf6\
+d\xfd\xbck\x00L$d@\x94S\x91\x15('q\
+-\x10EP7p\xc4Q\x9eXp\xfe\x8c\x92\xdd\x97\
+\xc9\xa2\xc49\x1c) 9\xc2{\xbeZ\xfd!\xd54\
+p\xe4]\xc0\xb1'O\x01\xe6\xa5J\x95\xfa\xb5)\x9e\
+|\x1e\xbc\xe7\x07\xa0\x8b\xde\x00Zq\x0dhl\x05\xb8\
+C\x99\xd1 9\xf8\xc5i@Msf\xcd}_3\
+8dAE\xc8\x86\xb7h\xc9\xdd\xd2\xb0\xb0j3\xa1\
+:\xd4\x8f\x88\x0e5:\xd0\xe6\x09mH\x9b\x8dt\xc4\
+0\x99\xd6\xfe+\x03\x00\x0d\xac\xc8\xb1\xe8\xc1\x13\xd6\xca\
+\x05\x82\xc3\xe3\x83NmS\xe3\xddl\xd8\xfe\xde\x85\x04\
+\x91\xf2&\xaf\xaa\x9e\x1db\xb7b\x0c\x9d;\x80y\xe3\
+\x0fa\xa0\xbb\xbf|Q^1dN\xe9\x7f\xca\xe95\
+R\xae!\xb2\x11\xce\x1d\x19\xc7\xc2\x05\xf1~\x0d`D\
+\x92\xcd\xe8Y\xefFo,\xc0\xb9\x02\xc0\xdaM1I\
+_\x90\x9b\xc0|\x09\xd6\xa0\x96\xa4w:i\xb6\xdc\x05\
+\x16\x05lg\xe3\xd8BZWl\x1bVw(\x030\
+'\xf8Y\xbf6\xa6fD\xf4P\xac\xce\xfe\xb1\xdb\xde\
+h\xfc\x8d\xce\x9b\xbc+Iv\xcf1\xf7G\xe4\xf3\xa1\
+w\x9f\xd5e\x91\x17,\xa5\x98&\x18\xa4D\xb4\xee\xc7\
+\xa9\x89\xc9\xab&\x12\xd9\x92\x9e]p\x7fO\xa2\xf9\xd2\
+r+\xbd\x0e\xda;\xd7\x1c\x81|g\xf5)\xf7\x92\x03\
+\x9d\xb9h\xa6\xfc\xccsN\x18\xb5\xce,\x92`)\xc0\
+\xbcT\xa9R\xbf\xa6\xf0\x1c|f?p\xe6\x19\x01\xd0\
+\x97\x83;\x03\x829\xb6\xb8Y\xdb\xa7\xa5i\x7f\xf9\xa0\
+\x16l\x89\xa6q\xa9\x05\x9ag6\x87\x83\xe1H\xbf\x08\
+,S\xdeZ\x18\x97\xf0\x83\xda\x82\x9b\x11\x08B\xd9\xfd\
+}\xc8&\xd9\xf7\x16\xc7A'\xd1E\x83\xab4\x0b8\
+\xcfOAn\xf16\x97\xc3s\x98\xc5\x0e\x91\x19@U\
+oy\xa5Ay\xd5\xad\xd0\x99|\x1e\x17\x9d}\x08\x83\
+3O\xa3\xe8\xc8_\xc1oaJ\xe4%\x9ff\xa9\x00\
+R\x1e\x86c\xc9\xdeZ+\xce\x86Me\xe3\xcc\x02\x83\
+]\x129\xcc*\xa1R\xea\x99\x13\x03\x1b\xb6\xde>\xe6\
+\x1dBZ#\x07\x14\xd3{89\xb7w\x84\xc9\xd76\
+\xab\xe8v\xc5\xa66 \x9a\x8d^\x9dIm\x83bg\
+)\xeb\xcc)h\x02 \xf3\x1d\x90\x19\xec\xc8\x1e\xd0i\
+\xac%\xa06\xf8\x90\x9b\xd5\x07\xebt%\xcf1{)\
+\x8fL{%\xb7b\x22\xaf\x8f,=\xcao\xa3%&\
+\xcd@\x80\x0f\xac\xcaM\x08\x09\x07\x18&\xadX\xd1\xaa\
+\xfcL<\xc8\x0d\x92\xc3\xb2\xde\x11\x9f\xdc\x0c/\xd5\xc7\
+\x86\xd9&\xc9rh7\x9f\x1f+\x14\xea\xd9S\x13+\
+\x1a\x89\x02\xccK\x95*\xf5\xda\x00\xe8\xcb\xaf\x06.Z\
+\x01t\x06\x10\xf2\xce\x91\xdf\xb1\xb8\xf9\xa2b\xc5\xee\xc8\
+[\xba~X\xfaa(\xa5\xadE\xac,\x9c\xd5/Q\
+y\x18\xc6\x9a\x11=P\xd5\x1e\xd6\xd3\x0e\xf2c\xe0\xcf\
+\x0aT\x90\x1a\xd2\xd2\xdb\x94C\x8b`\x03\x8f\xd8\x0c\xa7\
+1Z-\x14uh\x90\x90\xd2\x18\xd6\x9cC\xc7\x15F\
+5\xc3\x18\x98<\x8cy\xe3\x8fcpz{\x01\xe4\xaf\
+xQ\xf21'\xf2\xf8L-\xd5G\xb3\x9fb\xea\x8e\
+e\xfe\xba\xf5\xa4N\x11\xef\x84h\x8eBDfi\xe0\
+\x9e,\xf8\xc8\xfc\x99Y]\x22\xdb,j\x0b\x0eN2\
+\x0e-\xf3\xf0\xcbJ\xc1\xb79\x1c~\xcd\xc3\xd1\xdaA\
+\x9450\x95\x1c\x81D\x9b\xe6C<\x03\x1b\xbb\x95\xa7\
+\xfbT \xd7'\xf1=Wzu\x11N\xc6\x14\x13\x08\
+$\x9cv\xf4~\xe6\xc1G=\xc8\xdb4e\x91\xcdc\
+ J\xe9\x9b\xce\xeaY\xf3\xf4\xfe\x14\xf0\xf0\xa4WB\
+l\xe3\xa8o\x8a$\x1a<\xbd\x8fr\x95\x22I\x90\xd4\
+\xf9\xa0\x80\x90\x81h \xb5'z^\x1c\xe2\xb4\xf2T\
+\x80y\xa9R\xa5^\x1b\x00\xfd\xec3\xa0\xd1\xd5\xa0\x15\
+o\x02\x16\xac\x04h@Y\xb4\xb1r\x0c`\x08\xd5e\
+\xf6\xe3U\xfaT\x010\xe1c.2\xc0\xd0:VV\
+\xd6i\x82ck1\x8diwl\xf1\xc9\x9f\xf2\xc1\xe9\
+\xf4\x97\xb3\x01q\xf3\x9e\xce\x837B\xd0\x11\x88\xe7\xe0\
+\x0d\xddgS{\x12\xa8c\xca\x8d\xe6\xdc2\xe7Uf\
+\xc8\xd1\x9d\xc1\xc0\xb9\xfd\x18\x1d\xff%:3\x07\x0a \
+\x7f5\xbfs\xf2\x1a\xb2\xa1.B\x7fN\xae\xad\x15~\
+\xcf\x0e8\x8a\x00\x9e\x04\x82\xb26\x99[\xde/}]\
+!-\x03#onB{\x80.\x19\xc0\xca\xc2\xfe\x8f\
+\x82Dz\x0a1~\xcb(\xa7n\xab\x89\xa3\xbd\xf7\x87\
+\x92mkO\xda-\x84\xd9\x1f\x93\x14\x94&\xddl\xc8\
+bfo\xfdH>\x1dT\xf5K.\xe52\xf4XA\
+Nq\x0d\xb4\xd9\xe9X\xea\x0dhK\x81P\xeb\x9cb\
+x\xb4\xcd\x03\xbf\x91\xbc\xd8\xed\xca#+Y\xbaB\x8e\
+2\xe1\xd0\xdd'\xfb\x08\x90\x1b\xe4\xf5I\xaa\x8d\xf3\x8b\
+f\xdb\xd5\x9c(\xec\xca\x0b\x0b[\xd0\xdeO\x0a0/\
+U\xaa\xd4k\x04+0x\xfc\x00\xb0\xe7 0\xba\x02\
+\xb4\xecj`\xe1\xa5\xe0\x81A\xf74\xa2\xf4\xc0Wp\
+!\x00\xe0\xdac8\xdf\xc4\xc9#Z\x16\xef\xa4\x969\
+9\xcf/\x86\x0cs?^\x12qd\xbdc\xb4\xf5\x03\
+%/\x99K\xa6\x86\xbc\x03B\x90R\xda:\xfc)\xc0\
+3\x91O\xe9\x94\xfa\xcfh\xb0\xd3\xee\x87\x0b\x0c2\xa0\
+\xbc\x91\xadT\x15\x80\x99\x09\x0c\x8d\xef\xc2\xd0\xb9_\x82\
+\xba\xcf\x95k\xfd\xc2\xc0\xe6\x8a\x03\xb4^C*%R\
+2\x84D\xad\xebP,XCE\x9c\xba\xf6\x93\x1c\x0f\
+\x19)\x97-\xe0b\x83\x94\xaco\xb9\x94\xe5\xb0\x00\xba\
+\xe9\xe7R\xb9\xc5\x1c\x8b\xccT\xfa0\x1chn,\x13\
+\xd9\x80yb#\x9d\x93\xdb\xd9x`[\x11\xb4\x17D\
+\xdb\x18\x87\xe0\x9e\xe2\x93v\x1a\xf9\x9a\xf5\xecfe\x89\
+\xc9\xb9Aa\x1b~\x144m\xd1\xf0'Zfe\x88\
+Z \xab\x8e\x1d&\xb2mJD^\x04\x1e\xeb\x80r\
+w\xd1Yu\x94\xaf9\x0eRf)\xdf\xcf\xb3v\x9d\
+\xd2\x8a\x88\xbc\xf6t\xf3a\xaf#I\xf0DnE\xf9\
+3\x0a0/U\xaa\xd4k\x0f1\x9c;\x0c\xde\x7f\x18\
+\x18Y\x0cZr\x05\xe8\xe2\xcbP\x0d\xcd7\xb2\xe8\xd0\
+\xba%?\xce\xa3!\x9d\xe6\xe1\xc0r\xc4\x14*L\x85\
+\xd5\xbbD\x0fE#m\xd1q\x81}@P\x00\xda#\
+Z\xbaa\xd2e@\x07\xc7\x00{V\xabE\xf6\xc3Y\
+\xb9\xc9`\xad\xc7oc\xca\xdb\x12D%\xa8\xaf\xf2\x7f\
+7\xf2\x95\xaab\xd0\xf4i\x0c\x9f\xdd\x8e\x81\x89\xc7@\
+\xd5\x99ri_P\xd5H<\x1a$\x18\xc8Fj\x87\
+\x15\xbd:\xa3\xbd\xca\x9b\x9f%\xc9\x0aY`G.0\
+'\x85\xcbp-d\xa1\xd8\xe7\xbb\xc7\xc0\x93bT\xb9\
+\x91\xa6\x04s\x1bDq\xaa\xa3\xfc\x9a\xc2\xdd\x12\xac\x13\
+\x92\xf8|\x90Y\xa2\xd2\x9a{\x0bfA\xc1\xdb2y\
+\xc6\x9a\xedZ\x99\xb1\xe0\x83\x91\xa5@\x13\x10\x1a\xdf\xe7\
+\x10%\xe5\xef\xee\x14}\xa4\x98_r\xac\xb9\xdd\x96`\
+\xfe\x80,\xf9!\xf6\x9e\xc9\x03Zj\xe47$3\x9c\
+|\xe3\xa3\xae\x0f\x0b\x9as:-#\xd87\xb9~j\
+\x13V\xc97\x18\xaa\x81p\xc3\xba\x08)\x1e\xf9@\x09\
+\xc3\x9f\x844\xa6$\x7f\x96*U\xea\xb5]\x93\xc7\xc1\
+\x07\x1f\x04\x1f~\x08\xb4p\x03\xb0x\x130\x7f\x19\xb8\
+3\x10\xdcP\xb5\xb6\x9aTT\xb6wc\x911\xf7Q\
+\x94\x86~\x18z\xc9\xb5\xbd1\xab\xff\x06\x0c--\xa9\
+C=p\xd9\xfa\xdc0\xff`i\x97\x06\xfd\x80\x9f\xad\
+\x09hM\x0aU\x00=\x0f\xde\xf5\x03\xe8\x1c\xc8UX\
+\x00r\xeeV\xe8L=\x87\x91\xb3O``r+\xc0\
+\xd3\xe5:\xbeP\x1b` \xa0A-0\xd4\xb0\x8d\xa5\
+u\xa1\x1a\xaa\xcc\xd2/e\x01\xaeR)}\xca\xa8e\
+\xadY6\xd6A\xe3\xa9d\x09\x0e\xcf\xb3\xfetr_\
+7\xf5\xdd\x91\x8d\xb8I-R\xab\x05i\x85.\xb9\x9c\
+\xf8\x16\x9b\x9cG:\xd4\x82\x18\xb3\xd4f{\xb7\x15\x16\
+\xa4\x81j\xf4\x03\xe0HfD\x91\xc5\x7f\x93\x18\xf4d\
+fD\xae\xdc2M\xd3G@\xd8%5\xbfJ\xc9\x11\
+\xcd@\x92\x10\xc9MN\xaf\x892'A\xcaID\xc7\
+\xa4\x09\x12\xcaC\xa8\xb2\xb3\x8aV\x11\xea\x86\x0d\x12\xfc\
+K\x9bK\xfbz1\x9c\x1a\xad\xd5\xf4^c,1\x9b\
+\xa64\x08\xaa\xcd\x89\xb1\x851/U\xaa\xd4\xeb\xa5\xaa\
+i\xf0\x89m\xc0\x89m\xc0\xc82\xd0\xe2\xcbA\x8b\xd6\
+\x80\x87\xe6\x0b_\xe5\xcc\x04)g\x129\xc6\x9f\x86D\
+\x0dK\xd5\x12Q-]\x1a\x00\x9b\x889\xdb6s;\
+:\x96\xda\xf5>\xefg\xddb\x94\x97/\x1b\x7f\xf6>\
+\xe0\x9c[C\x868mO\x12\x0fX6\xbde\x983\
+\xff\xbb\xd6qN\x9dAg\xe2\x19\x0c\x9c\xdb\x8e\xce\xf4\
+3(\xfa\xf1\x0b\xbb\xb2'v\xc4\x17\x92\x16\xb6\x84V\
+\x15\xd6\x86NwpD\xa4\xe0b\x92\x8a\x91\x01\xd9\x09\
+$J0$\x86S\x05\xd2M`]X1J\xcdv\
+\xe4\x19.\xe3\xe1\xa5\xcc\x81\x04\xcbm\x9b\x8f\xa4\xedN\
+\xa1>u4\xbd\x08?j\x06\x07\x89D\xd2\xad\x10P\
+\xb3\x04\xf3RJ\x134\x08\xd69\x04\xec\x83\x8c\x92T\
+\x83\xcd\x00\xbb\xcch\x12\x906\xcfIf\x1d\x89M(\
+&\xf6L{r\xe0!\x0a7U\x02\xdb\x0c\xc0Y\x9c\
+7s\xa3\x11.2L\xc1@\xa5I-\x05\x8b;\xae\
+\xf5\xb9\x87p\xbe!;\xbe\x0fg\xff\xd8\xd8g\xea&\
+\x87\x14\xf3\xced[\xc3p\xec\x16\x8d\x8c+\x0f\xd9\xea\
+\xfbhb\xccQ\x18\xf3R\xa5J\xbd\xdej\xf2\x18\xf8\
+\xd01\xf0\x91a\xd0\x82\xf5\xa0E\xeb\x81\xf9\xcb\xc1\x83\
+\xc3h!\xf9\xcc\x1ae\xe4D\x1e\xbb\x93\xb3\xf0-&\
+\x91*D6\x10\xa9M}\x19\x11\xf6\xd0\xa0XJh\
+2\xf8\xd7\xb89D\xec\xf2\xb3\xa3\xa0\x8b~\xa9\xa0\x11\
+\x0b\x8e\xd8\xfe0\xe9S\x99\x1c \xa7\x99\x09t\xce=\
+\x8b\xce\xf86t\xa6\xf7\x17v\xfc\xd7\xae\x04\xf8\xb5\xfa\
+g\x86\x08oq.\xd3z\xe5\x06r\x9e\xd1\x02\xca \
+N]~\xbfH\xb2\xbc\xf2{C:\x832\xf5\xa3\xc1\
+\x00\xa6\xfcN\xca\x00\xc8f\xc83\xb9s@)V\xac\
+C\xb7n1$`\x96\x83\xe4\x94B:\xa3\xc3\xe6\x98\
+\xf7\x94-@\xde\x096\xc8\x5c\xf0pS\x0f\xb1;\x0b\
+@\xa5\xa1\xd1\x0c\xb9\xd3\x85\x0b\xfd{\xde&/&O\
+?g\xe33.2\x13HGvf7\x93@.$\
+\xb3\x18\xe4}\x87r\xf7\xa2\x8e\x19!J\x8b%\xe7\x17\
+.\xb7\x99 \xec$\xa5c\x0e!H\x91\xa64\x90\x9c\
+\xb4\xe1\xa4\x9b\x81&\x95Xz\xcc\xf7\x06O\x83\xcd \
+\xed\xf4[\x80y\xa9R\xa5^\x9fUM\x81On\x03\
+Nn\x03\x06\xe7\x83\x16l\x00\x16\xbe\x01\x98\xbf\x1c\x18\
+\x186i\xf2\xe6\xc6\x1c,\xdd;\x90\xcd\xa4\xa3\xc1\xd9\
+.k+x\x13\x83}6>\xe2\x04oCn\x1e\x19\
+\x8c\xc8M\xa5\x9fd\x85\xcdC\x15\xe8\x17\x1c\x84V\xbd\
+:\x8cD\x85U\x82'3\x83+\x02u'00q\
+\x18\x9d\xf1\x9d\xe8L\xee\x04x\xaa\x5c\x8b\xbf\x8e\x90\x5c\
+\xa6G9\xe9\x02%\xb6\x95@p\x06\xdd\x91\x0b\x9ee\
+L\x95W\x9ftl\x89\x00\x8d\xd1\xa5\x13\x1b%\x87L\
+\xb7m|\xa3\xc9\xd8s\x93j\x9e\xa5+L\xc6\xfa\xf6\
+{\xe8m\x01\x9b.\xbc}%\xcb:?I=\xb5\x19\
+\xa4eRM\x00\xa2\xdb\x0e\x91\x9f\x05\x91.$\xb0@\
+\xdf\xc6\xe5\x88\x01\xcf\xc8\x81\xc5l\xa7<D\xa4\x06=\
+\x85\xfc\xa75\xf5\xb8\x01\xc0\xe4\xe5)6\x8c*l6\
+\x02*\x83\x02\xcd\xba\x00\xe5y\xb38\xa5\xc5\xa6\x06M\
+\xb9\xcc\xc4+\x09\x08U\xf4\xac%7\x11\xd0'B \
+\xd3\x17\x03\xb4\xe6\x83(\xdf\xeb\x0b0/U\xaaT\xa9\
+\x99q\xf0\xf1\xc7\x81\xe3\x8f\x03\x03\xf3\x81\xb15\xa0\x85\
+\x97\xf5\x92E\x87F\x00t\x04\x80\x96C^\xc8\xf6d\
+\xd0\xec\x88\x14_\xa6\xf4O\xa1\xa3\xd4t\x11\xdaSF\
+\x83\x14R\x92\x00Z\xbe\xba\xd5&1f\xc4\xe3\xbf\xcd\
+`\xda\x05\x08\xcd\x19\x947\x8cQ\xfd>\xdd)t&\
+\x0e\xa33\xfe4:\x93O\x03\xd5x\xb9\xe6~\xed\x91\
+y\x83i$/\xadCc\xd48\xb4b\x98I\x84\xba\
+4zf\xa9\x91\x96\xd7*#\x22S\xb3\xac\x9b\x9d\x13\
+F\xd6\xa5\x93\xd7\xa0\x13\xa5\xf7lX`5hH6\
+\x18G~\xd7\xd85\xb5\xd1\x90\xa5D\xb9\x16\xe3\xea\xe6\
+B\xbb\xa9d|\xabW\xe0\xa4\xb5+\x89\xc6\x99\x89\x82\
+p\x1c\xb1*\xa0\xd8p\xca\xd6\x93\xd0\x89\x0b\xc9\xda\xb2\
+Ix\xa2\xc8SQ\x03p/\xcb\x93\xaf\xf5\x0d\x85b\
+\xbfMRl\x0e\x0c\xeam\x039f^\xb2\xcf\xcdq\
+\xb4{\x91\x0fpj\x97\xc8\xec\xa3H\x82\x96\xe7M\xf4\
+\x7fZ*%\xff\x0e\xec\x1a\x14n\xa1=\xa4\xcd\xa7\x1d\
+\xd3\x8f\x026(Y\xfa\xf6\xf6\xbd\x00\xf3R\xa5J\x95\
+\x92\xd5\x1d\x07Nm\x03\x9f\xda\x06t\x86@c\x97\x01\
+\x0b.\x03\xc6V\x02C\xa3\x00\x0dh2\xa8Y6\x17\
+(\x95\xc5CP\x0fFZ\xad\xa8\xd1yG\x00]x\
+\xe3\x86\xe0\xbd\x1f+\xee@8\x8b\x07ML\xe29\xc4\
+\xcdf\xf8\x14\x10K\xb8B7\xde\xfc)\x03\xa8\xa6A\
+\xd3g@\x13G\xd0\x99\xd8\x8f\xce\xd4\xde\x02\xc6_\xb3\
+\x00\x9d\x9d\xcf\xb7*\xc1\x8e*\xb0,\x81\x99\xa0yY\
+I\xbf\xf2\xb5\xdd\xc8\x00\xd2@\x1f\x9b\x88z\xd7s\x8a\
+0\x1b\xf5\xf5\xe0<\xb8IV}\xe3#\xd2\xd5`\xaa\
+\x94\xe6\xd4N4\xccQ\x92\xa8\x88>\x92#*5\xbb\
+\xab\x93I\xe5\x9fei\x90b\x81\xa5\x13\x8a\xd9\xcb@\
+\xfd\x02\x96\x16\x8f\x81\xbc\xce\xca?\x9a#\xcf\xadZi\
+9\x18J\xee'\xd2{^\x1e>\xb1\x9e\xa0\xa9|\x22\
+5\xd0\x9b\x874\xf59I\xa0\x5cQ\xf9\xa2\xc9\x90\xfe\
+'d\x1a)\xb7\xd2\x19\x0dyJ\xd0\x9e%(\xa4~\
+.\x98n\xdfJd\x96]e\x19Q=zC\x81=\
+-\xbb%\x90^\xb3\x92\xf7\xb1\x00\xf3R\xa5J\x95j\
+\xabj\x1a|\xfai\xe0\xf4\xd3\xbd\xc0\xa2\xe1\xa5\xc0\xfc\
+\xd5\xe8\x8c\xad\x00\xe6/\x05\x0f\xce\x07\xd3\x80\x10Y\x93\
+\xcc\x14\xcf\x0fAe!\xd6\x06\xa2\xd9\x11r\x8a\xf5\x9a\
+%8T>\xe43\x98\x08)\x1a\xe36C}\xf5\xe3\
+\xf6\x81\xa20{\xb29d\xd0\xccY\xd0\xe4\x11\xd0\xb9\
+\x03\xa0\xc9}\xa0\xeeq\xf4\xdf\xe8R\xaf\x8d\xa20e\
+7\xbb\x9a\x04\xe6\xf9\x92!7\xd7z\x94! \x01(\
+\x93\x07H\x9a\xb5\xce\xa2\xae\xb6y\x11\xeb\x80\xa2\xf1[\
+\xf4\xd9:\x98,\xd4t\x1bCm\x05_e\x18\x11$\
+\xc0\x97\xc3\xe2\x94\x93&}2R\x8e\x9e\x97\xbb\xc4\xa4\
+;d\xca \x91\x83(\xb1\xb4B\xc0y0U\x05\xe0\
+\xd8\xe3b\xb6\x0db\xf5\x83\x19J\x02\xe3\x8eYb\xf2\
+\xf5J\x02\x99q\x80\xac\xe1F|\xce\x955\x0e\x19\xc7\
+\x1a\xe1\xef\xae\x9a?\xc7S'7\x1eR\x1d\x1d\x89\x06\
+\x00)\xb4M\xb6(\xd9E\xa6\x85\x1fO\x0e+\xb21\
+\xe1815\xba\xceX\xb6\xac\xbd}*\xc0\xbcT\xa9\
+R\xa5\xe6\xc4\x0cv\x81\xc9#\xc0\xe4\x11\xf0q\xf4\x80\
+\xfa\xd0\xc5\xa0\xf9o\x00\xe6\xaf\x04\xe6/\x01\x06G\xc1\
+\x9dA\xf1\x9c\x94\x8fg\xcf\xb7\xb8\x07\x90\xc5\xc3l\xff\
+\x07\xdc\xfb\xc8!:\xb6\x0fF\xf3\x09\xad\xcc\xb8m\x16\
+\x18\xe2\x01Cj\x88\xb3\x17\xc3\xd9\xad\x81\xf8s\xa0\x89\
+#\xa0\xc9gz\xc1?<S\xae\x93\xd7\x15$7\x88\
+T\x80\xb1\xe4\xd3C\x91m!k\xdbBd\xfb9\xa9\
+\xdd&\xe5\x15\x82\xec\xd1-\x5cV\xe0\x5c6\x8c\xf0$\
+2+\xaf\xafc\x22\xed\xcd\xdd\xc6\xfegp\xa6A\xab\
+\xb2\xe5#\xaf\xff\x8e\x066\x89`\xe26\xcd\xfe7\xaf\
+3M\x83\x1bb5\x92\x0b\xeb2B\x81\xd7\x9f\x1c\xbc\
+\xd4\xb2p2\xcdO\xb3\x1b\x94W\xeb\x1a4\xce\x91\x19\
+,\xfc\x14\xab\xd1\xb7\xcb\x0c\x04\xaf\x94\xb1g\x5c:\xe9\
+p\xa0\x9d\xd7\xf7\xb9V\x9d\xb9\x0c\xb3\x12\x03\xbeD\xa4\
+-\xab\x94\xb6\xde\xbf\x8f\x9d{P\xc3\xf5\x04-\xea\xd1\
+n\x9b\xee\x0e\x9f\xaf7\xb2J\xa1\xe2c^\xaaT\xa9\
+R/\x19\xa8O=\xdf\xfb\xcf\x89\xfaF;8\x06\x1a\
+^\x0a\xcc[\x02\x1aY\x02\x1e\xb9\x18\x18\x1a\x03\x0d\x0c\
+\x03\xd4\xf1\xfc\xb1I\xe7\xd4\xcf\xf5v\xb9\x89\xe6\x86\x02\
+\xeb\x15\xee\xcf\xc8\xbbX:;\xe5&\xde\x83g&A\
+3g\xd1\x99:\x01\x9az\x0e4u\x144}\x14\xa8\
+\xce\xa20\xe2\xaf\xf3\xaf\x80\xf5\xf9&\x19a\x13\x01]\
+c\xf1\xe9\x98C\x18'\x93\xa0A\xb5\xd1\x9c\xa2\xf9U\
+f\x86r\xf6C~\xdd\xcc\xbc\x85\x1e\x8e\xa4\xec*\xe2\
+@\x9e\x89\x9fD\x1e\xda\x94+T~\xf0\xd2\xef\x0b)\
+9C\xcfJ11\xde\x8d\x94\xc2\xe9\xe5\x8de\xa3\x9a\
+C\xe5\xc07;;\x87\x90t\x82\xc9\xb8Y\x9c7\xf6\
+\xc04S\xef\x86\x19\x97w\x14?H\xaa~\x1b$\xa9\
+j\x07\x1d\xa3\xaf\xb7+\x16,\x15,\xacb\xeb\xb3T\
+\x10-\xce?\xcae\xde\x00`\xdd\x1c0\xb74E\xc8\
+y\x15\xa9u\x10\x0d\x139Z\x05y\x88T0\xe1P\
++&:\x85\xd4\x1eQ\xe2\x02\xccK\x95*U\xea|\
+\xc1\x14`\xe6L\xef?\xe3{\xf3C\xa83\x04\x0c.\
+\x00F\x96\x82F\x96\x82\x87\x16\x00C\xf3\x81\xc1Q`\
+`\x1e\x98\x06@\x1d\xea=\x9c\x93\x05b\x0ei\xd1d\
+\xb9\x01\x13\x1c\x98\x07 \x00\xd9N\xae\x22\x10y\xc5\x00\
+wA\xdd)\xf0\xcc8:3g\x81\x99\xb3\xa0\x99S\
+\xc0\xe4\x91\x9e$\xa5\x9a( \xbcT\x8c\xcc\x95\x15\x1c\
+\xb5\x08A\xf4z\x10\x13\xb9\xe18\x00\xc6\x7fZ\x02\x17\
+\x09\xad\xac\xfe\x9a\xb3\x06X:pd\x88\x9eYm\x16\
+\x9fCf`\x15\xd9\xb1\xa5\xf1\x01'\xd9$\xcb\xb0\x9d\
+p\xa2\x11.\xcd\x14DA<=9[\xc7|\x0c!\
+<\xde\xb5\xa6\xbb\x01\xf3d:\x06\x0e\xc60\x1b\xf6\x9d\
+Y$\xa9B\xda\xb7\xb2\x90\x85d\x1d>E&\xf1\x80\
+\x1a47\x06,\x1ep\x1bP\x1d\xc0\xf5\xc4\x0e\xdb9\
+\x02\x1f\x1f\x95\x9b?\xab\xe3O\xef1\x17\xf7\x1b9\xc3\
+\xc0B\x06D6\x1d\xb9\xd6\x86\x93\x09Ym\x8e\x95M\
+\xb7M\xd2\xc5\xba\x99b\x80:P\x0eEQ\xbb\x90\xaf\
+\xf5\xa6q%\xb5jP\x80y\xa9R\xa5J\xbd\x9c`\
+\xbd\x9a\x02\xa6\x9e\xeb\xfd\xe7\xb4Q|\xd2\x10hp>\
+0\xb8\x10\x18Z\x00\x0c]\x04\x1e\x98\x0f\xea\x0c\x014\
+\x04\x0c\x0c\x014\x08t\x86\xc0\x9d\x81\x9e|\xa6v\x88\
+\x89\x9eAiH\x8d+\x10w\xc1U\x17TM\x03\xdd\
+\xe9\xde\x7f\xf3\x14PM\x03\xdd)P5\x0eL\x9f\x06\
+\xcd\x9c\x04\xbagj\x0f\xf1\x12\xeaSj\xee\x95\xed\xf2\
+\xacG\x10\x12\xd0\xeb%V\xc2\xb0\xb9\xcd\x80\x9d\x8d\xac\
+g\xad#7\xb2\x11\x9f\xb3(\xd1[\xf6&wnA\
+\xce\x00\x84\x1d\xc8\x12\xf8:\x0c\xb2i\xb4\xce\x86\x97\x87\
+\xde:\xa136\xb2\x1b\xb5\x01\xac\x87 \xb5\x03\xba\x11\
+u\x10\xb7\xca\xe5\xf3[\x92=X&1\xd5\xdc,H\
+\xb2\xec:0\x08\xc9\xceP\x7fH\xe3\xe6\xa2\x83v8\
+\xfby\x9b&'\xc0\xbe\x22\xafMj\xbd)\xce\x8c\x10\
+\xe4C\xa0\xfc\x01\xc34\x85\x10\xb6\x97\x88\x1ca\xf2P\
+\x00\x87Ma\xb4\x07y\xfb\xd96\x99\x22D\x8a\xec \
+\xa7\xb0\x09\xa5p\x88\x16\xfaw20\xaeHYJ\x95\
+*U\xeaU\x04\xed<\x05LO\x01\xd3'\x80s\xf1\
+\x837-yR\xa7\x07\xd210\x87\xf7\x9d\xe9Im\
+\x0a\xd0.\xf5\xf2^\xc1\x19\x8e\x12; \xa8\xbd\x9e\x8d\
+5 \xd9`\x16\xf9*\x83\xc2\xa4x\xcb\x80\xaa\x06\x88\
+;_\xe9d\xff'\xdf&\xeb \x98\xfd\xac\xa7\xe2\x9e\
+\x85l\x86\xa8\xe13I1\xd7jh\x92IE\xc37\
+\xfb\x1f\xd9#r\xc3\xbeZ\xd1\x8c\x0d\xf9\x91+^\xa2\
+\xa9P\xcdA\xe4\xd8\xd2\x0cv\xa6\x0d0\xb0\xd34C\
+\x8a\xef\x0e\xed\x1c9`\xb8\x85\xc0\x86\xfa\xf1\xd6z\x7f\
+\x1aKDeK)\xfd\xf0m6r}\xac\xd8\xfa\xa3\
+\xcb&\xcc\x00\xe04\xd4\x1a\x00\xf0|\x96\xc9Y\xb53\
+\xb3\xfb}\xf2\xafg;/\xa1-p\xd1\xd6\xe89\xef\
+x\xa8\xeb\x96d\xe3P\xbfU\x01\xe6\xa5J\x95*\xf5\
+k\x01\xe2\xbb5\xd8.U\xea\x02)\x09\x16\x99d\x8e\
+V\x827\xcc\x94\x80\xadcnk+\xd0\xeck\xdd\xe6\
+\xc9\x22Xv\xb6L\xa7\x17Kd{C+\x99`\xe5\
+\xa6\xa2#\xd8\xed\xbeI]8%\x1dv\xf2\x08\x07D\
+\x92(\xfb!Kfs\x0c\xc4\xe7J\xafv90\x9b\
+\x90~\xdc\x98\xa0\xb1\xfb\x8b\x002\x9b\x84\xe1\xc6\x88\x90\
+\x18*\x0fX\x9a\xd6\xc8\xc1\xcf\xa4\xaf\x97\xcdAd\x9b\
+c\xd1g8\xed(\x9a\x0c\xf36,VY(\x12y\
+Pv\xa0\xb1:=7\xcc\xcajxUe\xc0Q\xfb\
+\xc9\x8dD&R\x96b\x07@\xf5\x84\xb0\xce\x9e`\x8a\
+\xbe\x12\xe2\xff\xb7\x5cd\xcaFR4\xb8@\xb8&Z\
+\xaaT\xa9R\xa5J\x95*5{\xbf\xd8\x80\xaa\xe4\x84\
+M\x06x\x18\xf61\x0f\xf0\x91\x00\x86Z\xa0\xd0\xe8\xc6\
+\xdd\x5cC[\xa4:Y\xa5x\x06[\xa4lKS.\
+iN\xa8\x0c\xc0?\x05.HY\x82\xd1\x84\xdb\xd4\xda\
+g\xa1\x8c\xce\x1f\x93\xc3\x85$\xbb\x1e\x1c\xba$\xdb\xe1\
+\xe6\xe80\xb5\xa0\xbd\xde\xef$\xa3-\x93+I\x1c\xfb\
+\xf4\x095\x93Lb\xcf\x99\xa5\x8f\xbc\x0dE\x92\xd03\
+>\xf6\xf6\xd0\x90\x0a\xec\x11\xc7\x99\x1b\xa6[h\xce\xc5\
+\xaeqp1Q\xd31\x90\x1fdm\x8e\x95\x9b\xb9i\
+\x96K\xc4\x00'\x09\x09\x0d3\x07\xf35\xc2JV\x86\
+E\xa9P,\xd3\xeaq\x1e\x04\xf5\x03\xf7\x14\xb8\xb0\xc8\
+\xf7\x8d\x5c\xb8D_c\x8es\x01\xe6\xa5J\x95*U\
+\xaaT\xa9\x17\x8d\xce\x13P\x85\x9eVf\xd2\x89T\x09\
+\xf0\x89\x80*K\xb6f\xfd9\xe0\x18\xdb\x06\x83\xa9\x18\
+\xdc4\xb2\x17`%v\x09\x90\x8d\x94$\x0c\xdaJ\xc0\
+\xcfz\x7f\xcb4-\x1d\xb1\xe3\xc0\xbb\x90%\x10\xb2s\
+\x88\xde?!A\x11\xef\xd4\xc8\x1e`\x18\xf8&\xf5\x92\
+\xa1\x83\xc6\x9aAE\x97\x05\x06(\x80\x9f\xff$\x9f\x07\
+n\xf4\xfc6C\x98[\xd4\xeci`\x17\x01\xc8\x94\xee\
+R\xfa3)\xdb\x9f\x0b{K\x82\xedVXXRr\
+\xe4@%\x8e'\x9b\x806\x06)\x7f{\x16\xbat\x22\
+R\xc7\xa89Q\xa4\xb4HFR\x22\xafc\xa3w\x97\
+\xc7\x86\xc4\x8e\xba\xc5\x02@\xa5\xcb\xfa\x0bY\x1e-\xb9\
+\x1dT\x80y\xa9R\xa5J\x95*U\xeaE\x16Q\x1a\
+\xa4\xf4#\xa0\x14\x86\xcf$X\xcbd\x9c;sZ\xa5\
+e\xb3)1\xbd\xc1\x08\xa8\xf5\xf9n~\xa6\xc2g\x04\
+0\xe6\x16\x87\xa1\x04\xc6\xb8\xde>\xceV\xffL\xc25\
+&\xf1\xeeB\x16\xe1Y\xfe\x86\xcc\xcd2\x88\xe6c\xb2\
+Gwjh\x22Ll\x99^7\xc4J\x22\x86@\xef\
+\x7fv?a7\xd4\xd84%\xdc\x00x\xe8\xf0a\xfb\
+\xd9)\x8f\x81Z\x8e[\xea\x01X\xed*\xe56\x03\x1e\
+\xce\xb3>.lB\x9b\xd8\xa6?P\xd6\x80GyD\
+\xdc\xb2M-!S\xccl\xe4S\x94\xbd\xcf%s.\
+\x8e'7 \xdf\x00oja\xd0U\x9a\xac\xdd\xd0H\
+\xa6S\x1f\x97\x02\xccK\x95*U\xaaT\xa9R/\x0e\
+\x97s\x0es\x97\x18\xbc\x01W\xd48p\x08&43\
+\x8a\x9eun\x00\xa3\x0c\xce\x02!\x90\x17\x08\xc0.,\
+\x12\xd9\x020j`\xbea\xd9\x85O\xb7\x8d\xff\xca/\
+\x92\xc9\x9c\xec\xdc\x1b\xa5dF\x0e\x0d\xda\xc6\x85\x1d3\
+\xdf\x0c\x90R\xbb\xdbJ\x02\xfa\x10\x00\xd2R\xed,\xde\
+\x8fMl}\x0d\xa4\x89BhLm=Ss\xbcL\
+\x88O\x92\x80\xb8\x86\x09\x82\x0a'\xefpI\x9c\xb7O\
+\x1eV\x96\x91\xab\x12\xca#m\x98:\x95\xc4A\xb3\x22\
+\x80q\xcb\xef9@\xedD\x81\x22\x8aL\x92\x90l\x00\
+\xeb\xff\xed\xbc\xc7\x93\x83\x10\xa5\xed\x93\x86\x9ed\xfcv\
+\xf2\xbb\x90\xa4\xd3\xd5\x01\xe3\xc2\x98\x97*U\xaaT\xa9\
+R\xa5^j\xb1a8\xb3[G\xb6\x07Lrc\xca\
+\x8e*Vb\xd0\xd8\xf8I\xc6<\xe9\xbb%\xc81\xea\
+\x826\xbb;$\xb8C\x1a\xcf\xda\xd4G\x05\xa1\x0c`\
+$)-f\x9f\xc4K\xda\xcd[w\x1f\xb1\xfe:\xe9\
+\xc6\xcd\xf67\xa0Mz\xbf\x13k\xb6\x9a-\xcad9\
+\x83I\x09\xc7S\xd0n\xe8\xf3c\xf4\xf7v\xd7d#\
+EB\x96\x22~\xa7\x82\xa5X3\xe0LY\x9b\xcd\x81\
+\x9c\x83]\xf6\x02\x1b\xa7\x1c\x0d\xab\x89\xbc\x89\xa5\xdbC\
+\x11\x96\x94t\xf7A\xe0\x9a\x95\x9e\xf7\xb0='\x0f{\
+\xaddI\xf47\xdc\xa2\x01\x8b\x80)y)\xb0hJ\
+\xc2\x5c\xe7\xdc\x846-Is\x9c\x0b0/U\xaaT\
+\xa9R\xa5J\xbd8@. \xa9]\xd2Ov}\x06\
+\x84\xe8A=#\x9a\xae\xc1\xbc\xd2N7\xa0\x9dt\xf8\
+\x16\x04a\xac\xb1/'m/\xb1\x86\xd9Y\xc7\x5c;\
+\x9c\xb8aF\xe1\xf1m\xb6\x8b\xc4\xfb\xc25\x0e\x06F\
+\xb2\xb0\xd23\xd0;3\xc3\x14\x1cKN\xf2\x98\xacw\
+715\xecu\x1b*\xc0\xa9i\x22j\xb0\xe9\xfa\x08\
+\xeb\xd2b\xdcp\xc8D\xa6J[Hj\x01\xf9\x0c;\
+\xe4*\xc2\xd2X'c\xb2\x1c\xf4\x8c\xfcw(h(\
+X^7\xc27\x9e\x00=\xda@f\xb0\x96\xb5\xa9;\
+\x82\xe6C8\x1e\xb6\x9d\x93f\xd5&P\xcc@\xce\x14\
+@\x0c?\xe7\xfd\xb6s\x17,\x1aF\xd3\x96\x94\xe1\xcf\
+R\xa5J\x95*U\xaa\xd4K\x06\xe8\x94#\xd3%j\
+!\x81|\x84!\x9e\x00H\xc6\x85DO0\xaa\xff\xd9\
+\x1bh\xd4\x03\x90\x194\xd5\xec\xbc\xf4\xadN\x0e\x1cF\
+\x7f\xde\xa0u\xe2@\xff\x9d\x1dc\xf4vII\xb0\x01\
+\x94$Sx\xc5 $\x13\x02\xc8\xae\x94\xd7\x0c6\x12\
+\x1fa\x1cH\xe2\x95,=\x0em\x93\xd3k2\x14+\
+M\x06\xd2\xb3\xd6\xd9s@\xfc7\xe1B21\xd4\xe2\
+b4\xc3\x97B\xb2D\xacm(\x1d\xea\x954r\xca\
+\xe5\xa1@e\x93\xc3\x8d\xb8e\x0e \xe9\xf2\x9b\xcb\xa0\
+Y]\x88\xccz\x98E\xdai\xf4{\xa1\xa8A\xef\xfa\
+jX\xf3X\x19NZ\xccC\xbeA\xd5?\x0e\x844\
+bi\x87[\xac:\x0b0/U\xaaT\xa9R\xa5J\
+\xbd\xa4j@\x8d\x9dWL\xc0G\x00f\x16\x8c,+\
+\xd8\x83$\xc5 \xc3f'~\x952\xea\x949\x99\xe9\
+\xef\xcd0#\x83e\x1e}\xc6\x87\xac}\xd3\x1d8\xb7\
+R\x87\x9a\xa5\xd7\x03\xae\xd9\xc1CJ\xbe%=L\xa9\
+%1\x816\x9c\x03m\xb4f\x9d\x95\xa6\x5c)\x90\x1b\
+`,\x87,\x85\x96\x9bL_S\xdb\x98 \xcae%\
+\xdf\xfb\xa0\xa1\xd9\xa9y\x7f\xb6\x1c1\xd3]G\xe8\x00\
+\x00 \x00IDAT\x89\xc4KV\xc7\x99\x0269\
+AY\x16\xdb\xc0y`\xd6\xcd\x0444?\xcb\xd1Z\
+\x0d\xda\x85NE\x1ccF41+WG\x108P\
+jmN\x1e\xf0\x94\xa1\xb4\xd0\xfd_8 \x9b-\xe9\
+{?\xa8D\xc3\xc6Li\x00Y\x9e2\xae\xbf\x1c\xac\
+.\x9a\xde~\x14`^\xaaT\xa9R\xa5J\x95zq\
+\x80<\x81\xa6\x18\x98I9\x83\x82YRCLy\xf0\
+\xada_\xb3\xac@3\xe8\xd2\xca<\x1b[\xb0G\x9c\
+\xc8\x8e#\xc4\x16\x98R\xfe\xbb\x04@\xa5\xbf\xb9fR\
+\x11m\xb7\x90\x99(y\x0d\xb4\xbc\xc7\x1c\x08\x07\x9a)\
+\xd8tN\x80X\x83L\x12\xcd\x88k2Xn\x9f\x06\
+\x93\xcd6;kDb#\x03A\x9e\x0a%r^\xe7\
+$\xbd\x0fm\x00S\x00\xfe\xf3~z\x97\x1d\xaeQ9\
+9\xcd~\xbdZA\xf9\xb8:\xa0\x0f\x1dL\xa4\x1b\xac\
+\xc0\x9a\xd0\xec\xa3^X\x08\xb6\x99)i\xd4\xfd\xaa\x01\
+i3\x15J\x91V:\xcd3\xf5\x82\x5c\x877\x91I\
+\xa0\xf5\x9c|##*\xc0\xbcT\xa9R\xa5J\x95*\
+\xf5\xa2J\xf9L\x9bh\xf1\x8c\x8b\xa4\x8f\xb9\x04f\xd6\
+\x22\xdc,\xfd{$\xef\xfd\xb6\x85V\x9daYv\xce\
+\x92\x01\x8a\x84\xc5\x8d\x0c\x82 \xc3\xe0e\x80\x90E\xbc\
+\x5c\xfb\x83[\xa67\xfbvg\x10\xcaR\xf3m0\xa3\
+f\xe5\xcd~\x13\xbc\x03\x08\xd9\x11V\xd9\xd80\x5c\x1e\
+\x13\x0b\xf9I\xbd\xfdb\x9c\x14y\xc8\x94\xd5\xc0*A\
+;\xe2\x908\xfe\xecCV\xc5\xf9%\xedS/\xaf\x0f\
+\xf6\xa0\x9dHt@d>\xaff\x93\x1d\x9b\x0f\x04\x03\
+\x98\x0ce\x0c\xd3\xe2\xdfCfx\x96\x11\x0c\x80\xaa\x9e\
++\xef\x13E\xa1\xa6\xea\x14p\x92RQp\x01\x93\x1b\
+T\xae-;\x89\xdd\x90+\xa3HYJ\x95*U\xaa\
+T\xa9R/\x19\x9cg}\xb6U\x150\xfb@\x19\xe1\
+\x9b\xa7\x13C\xc9\x22:\x95,\xe4?\xd0\xba\xe4\x91\xd4\
+\xb4\x93\x0b\xe4Q\x1f\x0f\xce\x80-{\x1f\x8aP\x1c\xfb\
+\xf9\xcd0a\xc0\x0d\x0b\xffk\xe3\x19\x19\x82\xecf[\
+){:f \xc8\x805\x00O\xde\xdeLj\xd0\xb1\
+\xd9\xe5\x90\xe1'\x01T\xd9\xe1v\x10\xb1\x16\xf3\xd4h\
+U\xbb\xc8\xd8\xe3\x03\xb7\x1f\xac4\xefy\xd5\x81\x82\xc1\
+\xd5\x0c\xe5\x0585r\x92\xd4\x1c\x91\xe9\xf1\x82\xb7\x92\
+\x92\x7f\xe1\xf5\xa3?\x8d\xa1\xd8wb\x9b8+>\x84\
+8\xa7\xc5\xb2\xbe\xf4\x12 g{\x1d5\x0d\x99|\x1f\
+h;\x1b\xa3[O\xb3\xc5\xec\x1b\x96\x02\xccK\x95*\
+U\xaaT\xa9R/\xa12\xf3\xdc\x032\x06\x1c\xd7\xba\
+h\x0eXk\xb6h\x87\xbd\x09\x1e{\xb4Y\x0f\x9a\x06\
+\xae\x1dJ\xda =\xbfI\xb8\x99Pf\xab\xd94\x04\
+\x0d\xffK\x1c\x86\xc3\xe4\xa0\x9b }\xd4`\xbd&\x92\
+\x9e\x85f[\xe3\xe0<\xec(At\xad\xf2\xee\xc9\x83\
+d\xaa\xa7\x19\xa6\x85\xe9a\xdcvq\x8b\xc8\x838\xc9\
+\x82\xd8\xb0\xff\x8aeW\x7f\x15\xd8\x9a\xd4\xab$\xc49\
+y\x95I\x9d]\xa3\xaf\x96\xbe\xeb\xd9\x03\x5c\x7f\x1a\xa1\
+\xcf\xda@\xa8\x17W\xbas5\x9c\xab\xa5R\x88\x1a\x13\
+\x0e\x06\x19 u\xe3\xf938\x0a4\xe2\xd8\xcd\xa5\x91\
+\x18%\xa7\xc5\xc0\xca\xbe\xd1\xb9\xb3\x18\x8b\xe6\xe2\xcaR\
+\xaaT\xa9R\xa5J\x95zi\xc5)*=\xb3\xdf\xd6\
+\x82\x8f\x84\x05!%\x22\x91\x1a\xffh\xcb(\x93\x86\xfd\
+\x09\x1c\x81[\xcc\xca[,2\x1a\xdd:\xb1\x00h\xec\
+0'y\xc4\x94\xe1\xa5\x04\xd2\xe0:\x18H\xe8\xaaY\
+0\xacl\xdcW\xb8\x91\xd3\xf8<\xfb\x9c\x18j\xa8q\
+\xca,;9\x99\xba\x94\xdd\x88_Q|XR\xca\xa7\
+\x04\x99LJ\x7fN.\xb3\xde\x0cw*\xc8,$K\
+\xa4\xd9d\x0a\x12[\x1b\xb0N\x9cC\xa6\xb2/}s\
+|\xa5\x8f\x09\x9b\xc3d\xdb\xb4\xdaN\x93c\xffCV\
+\xa6\xee\x02\xe8[\xa9\x0bY\xad\xbc\xbd\xc6H{\xd0s\
+f\xc5\xdd5\xc8\xcd\x5c\x00\x05\xe7\xbf97\xfa\x187\
+\x0d)\xb1X%\xa9\x7f_\x80y\xa9R\xa5J\x95*\
+U\xea\xa5A\xf3\x86=\x85\xa7\x06\x99\x85\xfd\x9d\x08k\
+AJM$\xe3\xe6B\x9a\xce\x06i\xf4it\xc6Z\
+\x8e\xc1)\x1e>\xff\x92\xc0\x06\xce6\xe17l\xd9\xf5\
+\x84&9\xa1\xca4l*\x1a\x8e\xcc\xb4Z\xb0\x95\x7f\
+\xa7\x935\xbd+J#\xfdi\x05\xd4Q\xf3A\xd9\xb5\
+EJ\xb7\xa9\xcf\x00&5R\x0a\x8a\xde\x9d\x85\x16F\
+l\x1b\x91j\x1ez\xcd\x05)\x1fq\xd5b(\xf6\x9b\
+u\x87%\xcf\x1bI\xf6\x1b\xce\xea0)\x948w;\
+Y\xb9\xd3\xdb\x7f\x8a,\x10\x9b\xbf\xb1$<I\xb3{\
+\xc2\xac^\x85\xc2\x03\x9em\x92\xaa3\xb4tg4>\
+\x03\x02\xb8\xb3\xd2\x9ds\xe0\xbeY\xa4,\xa5J\x95*\
+U\xaaT\xa9\x97X\x8d\x05\x5c\xe3\x5c\xa1p\x9f$\x97\
+\xcd\x04h\x0aHt\xef\xd7\xd8\xc9Ip\xc4\x9a\x91\x14\
+\xac\xae4\x17T\x22\x08\xce2\x0a\x1dDT\x07\xa7\xd7\
+\xb4=\x09\xcf\xc2\x04\xb1LxMr\xd9\x90\x16)\x06\
+\x81\xb1Y-H\xdaq\x0eF\x12)\x00\xd3\x0a\xacs\
+\x08\xd7\x95`G\xca\xc3a\x8f\x97<\x07\xe4\xe4\xe1\xcd\
+\xeb\xb5\xff<\xa9O\xe1Z\xbc\xde\xf8{\xa7\xf4S\xad\
+\xd9\x11\x00\x14N\xf3A\xc4\xbe\xbfP`\xd6[\x1c\xe6\
+\xed#\xe5V\x93m\x13\xd9\xcb\xdd\xad\x8b\x8c\x01\xda\xaa\
+\x11I\x8dAK\x1bD\xd9y\x87\xc5\x9b1\xb7\x80o\
+b\xe5\xc6\xc2\xeahR6\xbb\x11gV\x85$\x89#\
+P\x80y\xa9R\xa5J\x95*U\xea%\x15K\xc0\xe5\
+\xe6\x1c\xc9\xbb\xaaH\xf0\xab@\xa9\xfc\x1fZ\xe5M$\
+\xdc<\x88kM{\xa3#n\x08n;1H\xb5\x96\
+8\xb0\xa8\x13f\xe0JK\x9c\xa0\xb1\x913\xc8T\xce\
+\x10\x9d\xe9yQ}|(H\xf4\x91Bw\x01N\xd9\
+x\x95+\xa0I\x08\x89\xefzh\x91b\xd8\x08n\xdc\
+bR3C\x09\x14\xca\x9f' \xc9z\xdfY\x9e\x03\
+\xcb\x19\x0b\x9d\x8c\xcee\xca\xe1O\xe1n\xa7}\x0c\xe2\
+|\x08\xe1\x90-)\xdeZoBNy\xcd.9,\
+/\xbfln\x0f\xd9I0\x02@\x0f\x93\xd3\xaa\xc7\x15\
+`:/\xe5\xa0\x99u\xf7\xd0C\xb1\x08Vfd\xbb\
+U\xff\xbb\x00\xf3R\xa5J\x95*U\xaa\xd4K,J\
+:^2f\x1e\xcdP\x22\x87N#H\xc4\xa9\xcc\x14\
+\xe2f8P\x06\x13\xd5\x92\x00\xe2\xc8\x1aD\x85\xb1\xab\
+\x94N\x06\xe2\xf8\x1b;\xec'\xc1R\xe3\x98\x12)\x1e\
+(b\xb4I\xdb+*\xcc\xcc2D\xde\x013\xd3\xc2\
+\x087\x0f\xcf\xca\x93\xa4\x80\x0d2ee\x9d\x22\x80\xb2\
+}O\xb5\x1f\x94W\x00\xa0\xe5\x1b\x8eMn$4B\
+/\x9e?\x8fr\xfa\xab\xb2\x9e\x170\xd7\x99\xa0H\xc4\
+\xcc\xf6t\x86.()\x00U\xc5\xda\x8b\x10\x1ff\x0d\
+\xda)ul-\x01HB\x96\xc4\xb91\xcb\xae<\x01\
+\xdb\xcf\xfa\x98\x928\x96y\x08V\xe8\x9f({c\xba\
+\xa1V\xb9\x7fT\x80y\xa9R\xa5J\x95*U\xea\xbc\
+\xc0\xf2ZC\xeb\x92\x193\xbfIm\xc0O\x07`\x0a\
+\xa0\x03\xb8\xfc\x99\x14\x0e\x14\xcb (\xc0\x80\x8eE\x16\
+v\x83LQ\xfc;k\xb3k5\x02Y3\xda\x11\xdd\
+_\x03M\xfbv\xc2\x0dQ\x0d\xb2&\xbbHa\x81(\
+A!g\x13p\xbd\xff\x82\xf9\x956\x91\x9a\xadn>\
+\x9b\xcckE\xf3R\xef\x9b\x92\xb9\x88Q\x00\xb2o\xd8\
+\xc8Y\xa8\x09TbsVH\xb8\xc6\xb0\xff;\xe7q\
+\xcez`\x96U\x17\x11\x9c\x97\xdc4A\x0c\x12\xb3t\
+\x84!-\xf1\x91~\xf7\x14f\x09\xd5#\xabl6D\
+\xa4L\xc9A\xdf^\xc3\xc82\xfc4\x85U\xc9\x90-\
+\xe5\xb7\xcfm\xa2\xa4,I\x92\xf2\x97\x02\xccK\x95*\
+U\xaaT\xa9R/\xa9\x1a\xa7\x0b\xaa\x81\x9b\x8cLI\
+\x8b\xf8\xe4\xa5\x0b\x91\xc7H#\xfbh\x86\xf9d\xd2'\
+\x00\x11\xf6c\xc0w\x8b7\xb4\x9b\xd3$i\xba(\x06\
+)\xc3\x8eC'Mr6\xe96\x03\xaa2[38\
+8D\xde\x8b\x9d\xb5\xfeX\x02g\xb2\x11\x92Q\x1bb\
+\x1a\x10V\x93\x84fH\xd5\x85hj\xc0\xeeL\x0b\xeb\
+\xe6\xc3\x0f@6{\xaas\xeb\x93\xf3\x0a\x91\xd2zk\
+9\xbeg\xcd\x1b\xb7\x1a%\x81\x229\x1c\xec\xfa\x924\
+8\x99\xa7m\xc5\xaf\x99\xc4v\xe7\xbf\xe1\xd0\xcc\xbe9\
+\xc5\xb5,\xca\xd8of\xd1On6\x88\xf2`2\x05\
+!\xa3r\x9e@\xa9\xd1\xb9\x09\xaeb\xdf\xb3\xd4\x12-\
+*R\x96R\xa5J\x95*U\xaa\xd4y-\x82J\x93\
+$\x81A\x09\xe4\x19]5Jh\xfc\xae\x0ds*\xc6\
+\xeb\xc4_\x09\x00\xc8\xb1d\x85\xa8\x85]\xaf\xd9rj\
+\x0b\xe7\xa9\xd9o\xed\xde\xd7\x0c\x91\xeaAO\x19\x0e\xd4\
+6\xb8\xc9\x01m+\xb7\xd7)'8\xf8\x1bb\x07F\
+32\x86\x91ld\x87\x1ab\x8b \xd9\x1co\x0e\x22\
+W{\x8d\x16#D\xa0\xb57\xbd\xc4\xd2\xd6\xb1\xa6~\
+U\xab\xc3%\x09\xffuR\xfb\x22\x07>\x9d\x7f\xb8\x05\
+\xf2\xe6\x90\x10\x99\xae\x0d\xe4\x9a(\xdd\xcd\xf8U\x0ew\
+l\xc50qZa\x08\xc2dI4\x14\xcaC\x9eD\
+\xa8\x91\x9d\xc1`y\xae\x0a0/U\xaaT\xa9R\xa5\
+J\x9d\x8f\x12\xe0\x84\x85\xa3\x85u<q\xf87\xc3@\
+!E\xa1\x14\xf2C\xdaL:[\x18\x06)\x90D\x1e\
+\xfc'dH\xc6K\xbav+\x01s\x18\xdc\x93\xed\xfd\
+\x84\xdc\xc61\xd9yh\x92E\xd3\xc06\xd1\xb1\x9eN\
+d\x03\x18\xc9\x22K\x91\xa6I\x82\xd9\xb7\xa9\xa7I\x1d\
+\xa2@4\xf2\xaa\x05d\x0e<\xd5\xac\xac\x94UP\xb2\
+\x7fL\x92!\xeb\x9eCy\xa8R\x1d\x14\x16\xde\xf4N\
+ \xd3\xc8g\xacf\x9c\x9c\xc2%\xb9\xf2\x90ie\xa8\
+\x06\xa9,\xd8t\xf5g!\xed\xad\xe6\x1a\x88\xc8\x9f\x7f\
+\xb4]|,\x84\xe3\x06\xe0\xa7\x93\xae\xaf\x9b\x84\xd7\xed\
+\xd0\x84\x94j1\x9bm\xb6\x07\x80\xf2\x10\xae\xd0\xc5\x17\
+`^\xaaT\xa9R\xa5J\x95:\x0fE9\xcdR\x11\
+\xa0\xc2K:\xc2\xf3)\xe9^j\x8ek\xa65\xd0\xe8\
+j\x10l\x90\x16s;\x99\x1c}\xb6J\xa04R\x06\
+\xca\x98\x8e\x89\x1d>\x16\xe8\x0c&\xdc\xde\xe8\xaf\x1b\xbe\
+\x9c\x8c\xcb\x8c\x90\xfd\x90\x12\x8ck\xd9\x8bD\x8b\xf5\xa0\
+#\xc1\xa7\x93\xca0!G3s\xde\x12\x05\xb0\xa9\xb6\
+\xb7$m/\x98\xffcD\xdb\xa4\xad1\x83\xa4\x1d\xa8\
+\xd0 \xbb\x82`\xae\x81f\xd5B5m\xc9:]0\
+\xdd\xac\xff\xc8J\xc8\xf39`5\x22\x90\xf02S\xe8\
+\x0e\x03\xd6\x8e<\x90\xad\x96\x98%P\xe7\x9d2\x90\x0e\
+z\x96\xf4F\xb29 \xb5\x8dzG-\x5c/\xc0\xbc\
+T\xa9R\xa5J\x95*u\x1e\x8a%<\xd2?\xce9\
+\x8f\x90n\xd5:\xb1R\xe8\xb7E\x98\x0d\x0ck\xcb\x06\
+\x88\xdb\xdfp\x80\xfc\x9b\xd0\x229h\xd9\x00C5\x9c\
+h\xb00\x11#\xb0\x9a6\x93\x86\x08\x104\xb9\xedM\
+f\x8b\xc2\x17]z\x9d[\x89C\x0e\xa4\x91\xe15\xac\
+B\x93|\xa0=g'\x14\xd6L<\x9b!\xdbt>\
+\xa2\xae\xa5q\x19Io\xe5\x03\x92\xa8\x95\xb9\xa6\x9c\x0e\
+\x8a\xac\xcbg2\xefCr`7\x08lR\x02v\xdd\
+M\xf5\xb4\xe4\x9c\xf5\xe3I\x0eB\xc9\x08\xc5\xc3_\xaf\
+=\xcf\x00\x9aTcD\x8d\xfd$\xe5#\xab\xff\x8c\xbd\
+\x9f;\xf2j\x11\x07\xcda\xba\x06u\x0bg>\xbb\x00\
+\xf3R\xa5J\x95*U\xaa\xd4\xf9*\xca\xac5\x1b(\
+\xd3\x0c~f7\x0b\x16\xae+\xdac1\xa9\x07('\
+O\xa6\xdf\x09\x86\xddBS\x86\x01\xa5\xe9\xa7\xf5\x7fH\
+\xb3\xd9\xd9\xc2.\xd2\xc6hS>\xddgDh\x1d9\
+a2\x02\xad\x1c\xb8\x8c3\x1b\x1b\x11(\x10\x9e\xf1\xaa\
+\x0c-\x22oJC\x0d\x83\x8e|\xbc\x8c\x099%\xf5\
+\x7f\xd4\xe5\x98A\xca\xdaK\x1d\x895\xd6\xafWm\x8c\
+u\x14$\x9b\xd8\x99)l/\x97'c\x0e\xee\x07:\
+\xe5Pm\xd3\xabq\xbd\x7f\x94\x9a$\x91\xfcZ\xeb\xd2\
+\x037w\xe5I\x9eOA\x96\x01\xa5O4\x92\x1b\xfd\
+z\x12\x9f\x1d\xf9\x7frZ\xe9Q\xc7\xad>Gr\x00\
+\xba\xe1\xf1\xa5Z\xab\x00\xf3R\xa5J\x95*U\xaa\xd4\
+y\x00\xe550\x8a2\xc9!R>)P\x9a\x13\x19\
+l^\xcb<\x92\x04\xc1j|\xc93\xa9\x12\xf8\x98\xa4\
+K!\xd8\x0e$\x22\x8d\xfc\xc2\xcaO\xb4w\x8b\xdd%\
+r\xa0\xad\x0e\xe5Q\xce4\xf2\xb7\x9c\xc2\x91\x22\xc8(\
+7\x8eI\xd8,J\xb9\xb8hh\x88t\xc3\x920\xbe\
+M\x05\xb2\x1fi\x814[\xfd\x8a<l\x99=6\x07\
+-J\xe2\x11\xd6\x94\xa4g\x0b\xe4\x00\xae\xf8/R\xc0\
+\xdf\xafX\xa8N\x0cf\x863;Tj,O\xaeu\
+\xc8:z\xbbd`\xdeW\xab\x89(2\xf9QF\xe6\
+\xb67KC\xc5\xd1\xf5\x97z,=\x84\xcc\xa4=A\
+\x0b0/U\xaaT\xa9R\xa5J\xbd\xf4J\xaa\x0br\
+\xa2\x12\x15\xa8\x22\x7f%\x93'\x9d\x06A\xba\x85\xf8t\
+H\xa68IQ\x01g\x01fS\xaa\xbc\x04I,\xdc\
+]\x1cpg33\xcaq3\x22\x81\xb7\xc3\xfc\x22\x91\
+\x93\xbc\xcc\x05\x16hJ0\x9b6\x8d\x0d\xfe\xa5\x16\x9b\
+\x13\x09\xaf\xa3\x90\xa1\x1cz\xe3\xd6\x13(\x03j\x05\x8b\
+\x99\x03Y\x06\xa7\xcdb\x97~\xc9\xb1\x94\xa3I\x015\
+\x16\x87\xec\x95\x1c\xfaZ\xa2\x9cx\xea\x1b\x03\xcdls\
+ ;IgF\x00x\x0ee;r\x00\x93\xf3\xb1g\
+!\x0d\x82\x06\xf4L\x80\xf5L\x94\x03\xb5ve\xc4~\
+\x86\xbb\x90\xea\xcf\x1c,w\x92R\xa5\xe6VCCC\
+X\xbe|9.\xbe\xf8b\xcc\x9b7\x0fCCC\x18\
+\x18\x18\xc0\xcc\xcc\x0c\xa6\xa7\xa71==\x8d3g\xce\
+\xe0\xf0\xe1\xc3\x98\x98\x98(\x07\xecU\xaa%K\x96`\
+\xc9\x92%\xb8\xe8\xa2\x8b088\x88\xa1\xa1!TU\
+\x95\xce\xd1\xb9s\xe7\xf0\xdcs\xcf\xe1\xf8\xf1\xe3\xe5`\
+\x95*u^K\xb3\xa2$l\xe3\x92\x1a\x97\xa1@\x92\
+L\x05\xb2\x8a\xdd\x1e\xc6\x97\xa3\x93\x0a\x02\xd5xG\xeb\
+\xd4e\xe0\xbczC\xce\x80\x96\xe5\xc7\xd6\x89\x95\xe0\x08\
+#e\x8fu\x19\x03\x9f\x08{\x8e\x98dN\xdb\x9c>\
+\x8f\xf3\x82\x00\x093I\xc9\xf0Z[B\xd9\x0b\xf4X\
+Xo*\x99-S\xf2\xd6\x05\x117\x19\x94\x0b\x91\xb9\
+\x87\xae\xe6x!{\xac\xeb\xe3%px\x0a\x81\x221\
+\x14\xda\xe8\xf2\xf3\xb1\x90!:$\x1dm(\xbb\xc6\x10\
+\xb1Z\x19H\xafo\xce'\x91\xc0\xea\xac\x93A\xedv\
+\xa5\xf3\xcf\x92*\x0f\x8fs\xf3\xb3t\xfd\xc9\xc6\xcd1\
+\xf9\xa4\x81|\xa3qO\xd7\x16\xe7F\xc5\x0c@\xe7`\
+,\xb9z\x10mw\x01\xe6\xa5J\xf5\xad\x8d\x1b7\xe2\
+\x8a+\xae\xc0\xd5W_\x8dK.\xb9\x04ccc\x18\
+\x1d\x1d\xc5\xf0\xf00:\x9d\x0e:\x9d\x0e\xaa\xaaB\xb7\
+\xdb\xc5\xcc\xcc\x0c&''q\xf6\xecY\x1c?~\x1c\
+\xbbv\xed\xc2\xa3\x8f>\x8a\x9d;w\xe2\xd4\xa9S\x17\
+\xec>~\xe4#\x1f\xc1\xdb\xdf\xfe\xf6v\x12\x8c\x19\xf7\
+\xdcs\x0f~\xf0\x83\x1f\x5c\x90\xdb\xbft\xe9R\x5cy\
+\xe5\x95\xb8\xfa\xea\xab\xb1q\xe3F,\x5c\xb8\x10\xa3\xa3\
+\xa3\x18\x19\x19\xc1\xc0\xc0\x00\x06\x06\x06\xc0\xcc\xe8v\xbb\
+\xe8v\xbb\x98\x9a\x9a\xc2\xf8\xf88N\x9f>\x8dg\x9f\
+}\x16\x8f>\xfa(\xb6o\xdf\x8eg\x9f}\xf6\xbcl\
+\xcb\x9f\xfe\xe9\x9f\xe2\xe2\x8b/\x9e\x1d\xc2\x10\xe1\xdb\xdf\
+\xfe6~\xf8\xc3\x1f\xbej\xc7\xee\x8e;\xee\xc0\x0d7\
+\xdc\xd0\x9a\xb0'k\xdb\xb6m\xf8\xe7\x7f\xfe\xe7\xf0w\
+\x7f\xfd\xd7\x7f\x8d\xe5\xcb\x97\xcf\xfa\x1e\x13\x13\x13\xf8\xd2\
+\x97\xbe\x84\xbd{\xf7\xf6}\xdd\xbau\xeb\xf0\xc7\x7f\xfc\
+\xc7\x987o\xde\x05y\xcd\x1d?~\x1c_\xf8\xc2\x17\
+Rs\xd7\xe9t\xf07\x7f\xf37s:\xefg\xcf\x9e\
+\xc5\xe7?\xffy\x1c;v\xece\xdd\xc6K.\xb9\x04\
+\x9f\xfd\xecg144\xd4\xf7u?\xfe\xf1\x8f\xf1\xad\
+o}\xeb<}*\x87\xd4\xe7\x92\xa5\xcb\xf0W\x7f\xf5\
+W\x18\x1c\x9c\x1drt\xbb]|\xfe\xf3\x9f\xc7\xc1\x83\
+\x07\x15\x1c\xf2V\xd7\x9c\xbeG\x125\x12\xe7\xdf\x93n\
+\x09\xb23\x8aE\x99\x8do\xb6\xb1\xd5ca\x0d\x08\x83\
+\xd5\x88)%=\x92\xf8\xff\xbd\xdf5\xfe\xe3\xd9\xda\xb1\
+\x01\xac\xcc$\x9d\xfd\xc4&\x080\xaf\xc0\xb9\xb0\x8d\xb4\
+G\x96`t\xdb\xb2!1\x0d\x00\xeb!\xd26\xca=\
+-\x5c\xc4\x90T}61;\xe0\x99\x01u\x0d\xec\x85\
+\xbd\xa3jfT\xd3\xa6\xbd\xce\xc94H\xd9\xd21K\
+\x84\xc8\xa0w\x86l\x00\xc8\xcf\xd3R\x1eK&\xd9%\
+\xb0i\xbe(\x18\xdb%\x18\xd9T>\xbf\x94\xce\xb39\
+g>\x024{\xbd\xa7\x8d\x8b\xd2b\xa9\x00\xf3R\xa5\
+l\xcd\x9f?\x1f7\xddt\x13\xde\xfe\xf6\xb7c\xed\xda\
+\xb5X\xb8pa\xdf\xd77\x00}hh\x08\xa3\xa3\xa3\
+X\xb4h\x11.\xbd\xf4R\x5cs\xcd5\xb8\xf5\xd6[\
+q\xec\xd81<\xf4\xd0C\xb8\xef\xbe\xfbf\x05$\xaf\
+tu:\x1d\x5cw\xddu\xd8\xb0aC\xdf\xd7]{\
+\xed\xb5\x17\x1c0\x7f\xd3\x9b\xde\x84w\xbf\xfb\xdd\xb8\xea\
+\xaa\xab\xb0l\xd92t:\x9d\xbe xpp\x10\x83\
+\x83\x83\x18\x19\x19\xc1\x82\x05\x0b\xb0r\xe5Jl\xda\xb4\
+\x09\xefx\xc7;p\xe2\xc4\x09\xec\xdc\xb9\x13?\xf8\xc1\
+\x0f\xf0\xc8#\x8f\xa0\xdb\xed\xbeh\xc0\xb6p\xe1B\xac\
+[\xb7nN\xaf\x7f\xf3\x9b\xdf\xfc\xaa\x02\xf3\xeb\xaf\xbf\
+\x1ek\xd7\xae\x9d\xd3k\x9f|\xf2\xc9\xd6\xdf\xadY\xb3\
+\x06\x97\x5cr\xc9\xac\xef1>>>'\xb0=::\
+\x8au\xeb\xd6a\xfe\xfc\xf9\x17\xe4=\xe2\xd8\xb1c\x0a\
+\xf0VU\x85\xf9\xf3\xe7\xcf\xfa=j^\xbbf\xcd\x9a\
+\x97\x1d\x98o\xde\xbc\x19\x1b7n\x9c\x15\x0c\x1f=z\
+\xf4<\x02\xf3\x00\xa8\x83p\xed\xb5\xd7b\xe3\xc6\x8d\x18\
+\x18\x18\x98\xf5/N\x9e<\x893g\xce(\xb8\xe7\xfb\
+\xc6<\x5c\xd9\xc8*\x14\x9c\x22df^\xe8\xa1\xc9\x98\
+|(\x06\xb6F\xcb\xce{\x84,@\x8f\xa4\x08\x86\x01\
+\x95\xb4:\x89\xeda\x03\xa0-\x04gk\x94\xeeW\x1b\
+r\x03\x22\xd9y\xa8\x95\x08\xae\x7fO\xee\x90q\x02\xae\
+d$8\xdaI[(\xaf\x8d<\x89d\xa0P\x92m\
+h\xef\x98\xe68q\x1d\xc6\xa3/\x07\x11\xdaD@?\
+J K\xb9-p\x17i\xb1\x94\xe7m{\xe7\xb6N\
+-%\xaf\xff\xce\x9a|\xaf['u\xf2E\xd3\x90&\
+\x8d\xd9t\x0b\xf9=(\x98u\xc8\xb6\x8d\xa4d\x5cT\
+\x9f(&\xdbp\xe4\xed,\xc0\xbcT\xa9\xba\x06\x06\x06\
+\xf0\xde\xf7\xbe\x17\xef{\xdf\xfb\xb0v\xed\xda9=D\
+f\xab\xe1\xe1a\x5cr\xc9%\xb8\xed\xb6\xdb\xf0\x8ew\
+\xbc\x03\x0f>\xf8 \xbe\xfe\xf5\xaf\xe3\xe4\xc9\x93\x17\xc4\
+>/Z\xb4\x08\xabV\xad\x9a\xf5us\x05o\xafD\
+]q\xc5\x15\xf8\xc8G>\x82k\xae\xb9\xe6\xbc\x00\xb7\
+N\xa7\x83%K\x96`\xcb\x96-\xb8\xee\xba\xeb\xb0m\
+\xdb6\xfc\xe7\x7f\xfe'\x9ez\xea\xa9\x17\xfc^UU\
+a\xdf\xbe}X\xbf~\xfd\x9c^\xbff\xcd\x9a\xb4\xea\
+\xf2J\xd7\xd2\xa5K\xe7\xc4r7\xfb\xb5}\xfb\xf6r\
+\x93\xe8S{\xf7\xee\xc5\xe5\x97_>\xa7\xeb\xed\xca+\
+\xaf\xc4#\x8f<\xf2\xb2n\xcf\xa5\x97^:\xa7{\xd8\
+\xb2e\xcb0\x7f\xfe|\x8c\x8f\x8f\x9f\x9f\x0f\xa6\x0c\x1a\
+\x1b\xb4\xb1a\xc3\x86\xbe\x8d\xb3\xacC\x87\x0ear2\
+K\x01Y\x85\xbex\xd6W\xbbi@\xc9\x05\xd80\xe9\
+I\xe6b@\xa6\x930( \xcf)N=s\xf0\xe4\
+\x18\xe1\x04\x17\x85/\xb8\xdc\x00\xc9~\xfbC\xc6\xb5\xce\
+[\x84'\x01\x82u\x97@P\xf8\xa2K\xf0\x99\xf4\xd3\
+l~\xa6\xfd\xc49\xe0\xc2\xe5P)EM\x01{\xa7\
+\x14\x08\xcf\xf0\xac\xad\xce\xef\xe7\xe4\xd7IB\xc3\x1e\xfc\
+\xca\x7f\x99\x95\x11-\xcb\x97R\x1eJ)\x9c\xea\xcf\x1a\
+M\xbcw2\xd4\xad\x14k\x8b\x18V\xda\xef\xa6\xe9\xeb\
+h\x17\x17\xd2r+bv\xc7\x8d\xd36\xd4C\xb3R\
+>$\xc3\x9e`WMj)\x0cq\x01\xe6\xa5J\x01\
+\xbd\xa5\xf3\xdf\xff\xfd\xdf\xc7u\xd7]\xd7w\xe9wz\
+z\x1a\x93\x93\x93\x98\x9a\x9aBUU\xa8\xaaJ1\xe6\
+###\x18\x1e\x1e\x0e\xffv\xf1\xe2\xc5x\xff\xfb\xdf\
+\x8f+\xae\xb8\x02\xff\xfe\xef\xff\x8e_\xfe\xf2\x97\xaf\xfa\
+~/[\xb6\x0cK\x96,\x99\xf5uK\x96,\xc1\xea\
+\xd5\xabq\xf0\xe0\xc1Wm[\xe7\xcf\x9f\x8f\xdbo\xbf\
+\x1d\xb7\xdcrK_\xc9@UU\x98\x98\x98\xc0\xd4\xd4\
+\x14fffPU\x15\x88\x08\x9dN\x07\x83\x83\x83\x18\
+\x1e\x1e\xc6\xc8\xc8H\x08\x14FFFp\xed\xb5\xd7b\
+\xed\xda\xb5\xf8\xeew\xbf\x8bo~\xf3\x9b\x98\x9e\x9e~\
+A\xdb\xf9\xd4SO\xe1\x9d\xef|\xe7\x9c\x1b\xa3\xf5\xeb\
+\xd7\xe3\xe9\xa7\x9f~\xc5\x8f\xe7\x86\x0d\x1b0666\
+\xa7\xd7\x9e9s\x06\xcf<\xf3L\xb9Q\xf4\xa9={\
+\xf6`fffNr\x8d\xb96n/\xa5\xd9\x5c\xbd\
+zu\xe0~\x12\x7f\xb7\xe7\xcd\x9bw\xfe\x809C\xf1\
+\xaf\x03\x03\x03\xb8\xec\xb2\xcb\xe6\xb4-\x00\xf0\xcc\xb3\xcf\
+bjjZ!\xb3\xec\x80N\x06\xce5\xe0\x8ab\xbc\
+\x08\x01\xac;\x10\x03\x95\x86\xb1&1gJ\x92\xf0\xcc\
+2\x17k\xca\xa8YV\xca\xc9\x99)}\xd3\x1e\x16\x01\
+\xca9\xcb\x5c\x94\xc4B\x85\xf9H\x18M\x90\xd889\
+\x7f\xa8\x16!\xfa,\xaf\xcf\xa7\xc6\xed&\x12\xcdD\xe7\
+\x882\xd8\xd4A\xf3\x9c\x1b\x11;8\x99,1I\xc9\
+l2\x8e\xcf\xfb\xcb\x1dc\x9b\x18\x01i\xce ]\x0a\
+\x93d\xb3\xa6\x16\x1a\xc45@\xea\x9c\x92~3\xdb\xd4\
+h~[\xd8eR\x02\xe8\xb2Q\x90\xcc?\xec\xe7#\
+\x0f\xba\xaa\x060]\x92\xac\x1a\x1e\x12\xb4z\x01\xe6\xa5\
+^\xf7u\xd3M7\xe1\x0f\xfe\xe0\x0f\xb0b\xc5\x8a\xf0\
+\xf7\xa7N\x9d\xc2\xfe\xfd\xfb\xb1u\xebV\xec\xd9\xb3\x07\
+G\x8e\x1c\xc1\xb1c\xc70>>\x8e\xc9\xc9I\xcc\x9b\
+7\x0f\xa3\xa3\xa3X\xbcx1\x96/_\x8eU\xabV\
+\xe1\xca+\xaf\xc4\xfa\xf5\xeb\xb1d\xc9\x12\xc5Z\x11\x11\
+6l\xd8\x80?\xfb\xb3?\xc3W\xbe\xf2\x15\xfc\xe8G\
+?zU\xf7\xfd\xca+\xafT\x8d\xc8\xe9\xd3\xa7\xf1\xf5\
+\xaf\x7f\x1d\xf3\xe6\xcd\xc3\x87?\xfc\xe1\x04\xdcFFF\
+p\xe5\x95W\xbej\xc0\xfc\xd2K/\xc5\x9dw\xde\x89\
+\xeb\xae\xbb.\x04\xd4\x93\x93\x938t\xe8\x10v\xec\xd8\
+\x81\xed\xdb\xb7\xe3\xc8\x91#8|\xf80N\x9f>\x8d\
+\xf1\xf1q\x0c\x0c\x0c`ll\x0c\x0b\x16,\xc0\xf2\xe5\
+\xcb\xb1|\xf9rl\xde\xbc\x19\x9b7o\xc6\xca\x95+\
+\x9d\xbc\xe2\xe2\x8b/\xc6\xef\xfe\xee\xefb\xe9\xd2\xa5\xf8\
+\xf2\x97\xbf\x8c\xc9\xc9\xc9\x17\xc4\x9c\x9e={V\x81\xde\
+\x87\x1f~\x18G\x8e\x1c\xc1\xc8\xc8\x08n\xb8\xe1\x06\x8c\
+\x8e\x8e\x02\x00\xc6\xc6\xc6\xb0n\xdd\xbaW\x05\x98\xaf_\
+\xbf\x1e###\xea:\xff\xe9O\x7f\x8a\xaa\xaa\xb0~\
+\xfdz\xc5\xfe\x9e8q\x02\xfb\xf7\xef\x9f\xf3{\xdfs\
+\xcf=x\xe6\x99g066\x86\xdbn\xbb\xed%\xaf\
+lTU\x85o}\xeb[x\xee\xb9\xe7^\x95\xebo\
+\xe3\xc6\x8d\xb8\xf9\xe6\x9b\xfb\xb2\xbe\xdb\xb6m\xc3\xd4\xd4\
+\x94\x02\xe6w\xdf}7\x0e\x1e<\x88\xcb/\xbf\x1c7\
+\xddtS\x02>\xabV\xad\xc2\xc5\x17_\xfc\xb2\xad\x9c\
+\x11\x11V\xae\x5c\xa9~\xb6u\xebV<\xf0\xc0\x03X\
+\xb5j\x15n\xbd\xf5\xd6t_Z\xb8p!\x16/^\
+\x8c\xe7\x9f\x7f\xfe<n@\x83\x9b\x19\xc3\xc3\xc3jU\
+\xae\xaa\xaa$\xeb\x1b\x1e\x1e\xc6\xc7>\xf6\xb1DfT\
+U\x85]\xbbv\x19\xa0\xc91\xfaGN\xa0\xcc\xc3t\
+\xa4H\xf5\x04Y)3\xe2\xbd\x94Ir\xe0\x9c\x84\x9d\
+c\x969t\x1c\xc3\x0b\xc3r&)\x8d\xb4\x0c\x14^\
+\xdf\xa0,Qa6`8%H\xb2\x90\x80\xb3fU\
+\xa5\xfa\xc2\x80\xbe\xbc\xd7B{\x9dHvrl4\x93\
+nm\x944\xa6azIC\xec:~\xd5\xc9\x85\xe4\
+\x82\x80\x94r\x08\x91\x09\xacj\x9e\x14\x00\x16\xfd\x89h\
+\xa0\xa4\x0e_\x1cD\x03\xca\x03\x06\xdc\x1c\xfff_\xb5\
+\x99Kn\xb4\xd2\x90\xaa\xd0\xe4\xa7\x96\x8bI4)Z\
+\xf7\x94\xae7!;\x22\xa35\xa2\xa4\xf1\x8f\xacAY\
+\xc9\xab\xb2\xfdz\xf6\xc1/\xc0\xbc\xd4\xeb\xb6:\x9d\x0e\
+>\xf0\x81\x0f\xe0\xf7~\xef\xf7\x1cp`f\x1c>|\
+\x18\x0f<\xf0\x00\x1e|\xf0A\xec\xda\xb5\xab\xf5}&\
+&&011\x91\x06>\x01\xe0\xae\xbb\xee\xc2\xc2\x85\
+\x0bq\xd3M7\xe1\xe6\x9bovZ\xcfE\x8b\x16\xe1\
+\xce;\xef\x04\x80W\x15\x9co\xde\xbcY\xfd{\xff\xfe\
+\xfd\xb8\xfb\xee\xbb1::\x8a\x1bo\xbc11{\x83\
+\x83\x83\xd8\xb8q\xe3\xab\xa2\x87\xde\xb4i\x13\xfe\xe4O\
+\xfe$\x94\xd3\x9c9s\x06\xbf\xfa\xd5\xaf\xf0\xa3\x1f\xfd\
+\xa8\xaf6\xbc\xdb\xed\xe2\xd4\xa9S8u\xeaT\x1a\xf2\
+\xfc\xfe\xf7\xbf\x8fN\xa7\x83\xeb\xaf\xbf\x1e\xef|\xe7;\
+\xf1\xe67\xbfY\x81\xe9\xc1\xc1A\xbc\xf7\xbd\xef\xc5\xc0\
+\xc0\x00\xbe\xf8\xc5/\xceYw\xbe\x7f\xff~\x9c8q\
+B\xbd\xd7\xe1\xc3\x87\xf1\xa5/}\x09###\xd8\xb4\
+i\x13\xd6\xacY\x93\xae\xc1\xcd\x9b7\xe3\xde{\xef}\
+U\xc0\xa6\xac}\xfb\xf6\xe1\x9f\xfe\xe9\x9f\x00\x00\x7f\xfb\
+\xb7\x7f\xeb\xf6\xe9\x85\xac\x1cl\xdf\xbe\x1d\xf7\xddw\x1f\
+\xd6\xae]\x8b\x0f~\xf0\x83/y[\xab\xaa\xc2\xaf~\
+\xf5+\xfc\xeaW\xbfzU\xbe'\x1f\xfa\xd0\x87p\xf3\
+\xcd7\xcf\xda\x90\x9d:uJ\xddK&''\xf1\x9d\
+\xef|\x07G\x8f\x1e\xc5\x96-[\x12\x00]\xbat)\
+\x96,Y\xf2\xb2\x01\xf3\xc1\xc1A,]\xbaT\xdd\xcf\
+\x9ez\xea)|\xe7;\xdf\xc1\xea\xd5\xab\xd3u\xdd\x5c\
+\x83\x1b7n<\xbf\xcda\xc2;\x84\xd5\x97\x5c\xa2V\
+\xb8\xaa\xaa\xc2\xf7\xbe\xf7=\xec\xde\xbd\x0b[\xb6\xbcU\
+\x11\x17333x\xf2\x89'\xa4\x18\x22\xb3\x96\x02\xc4\
+\x91tq\xd1X\xbc\xf6\x80\x96S\x91b0\x93\x03k\
+E\xc7\xb0\xeb\xee\x82\x05\xa6\x0b\xe7%\x99\x92\xac$\xff\
+\xdb\x1c\x08\xca\xd1\xf3jhP\xca\x1fL2\xa7\xf4Y\
+\xc9\x03\x8b:\x9d'\xbb\x81\xc8\x00\xa7\x1a\xf8\xba\x84\x1d\
+N\xab\x00\xa4?$\xbf\x97D\xc3\xa2y\xd1#\xae\x99\
+\xf4\xef\x81\x5c62\x13\xd1\xea\x10\xeb\xe3\xa6N\xa4\x9c\
+\xd6\xcd\xcb\x19\xacRC;i\xf5\x81\x03b:\xbf'\
+\xab\xf7\xcdL{vs1\xeb\x0d\xfe\x9d\xa4/yd\
+N\xeeV\x15D|+\xd9!c\xb8aQ}||\
+\x8a\xab\xfc\xff\x05\x98\x97z]\x83\xf2\x8f\x7f\xfc\xe3\x89\
+\xbd\x94\xac\xf1}\xf7\xdd\x87o\x7f\xfb\xdb\x89\xa1\x9b7\
+o^\x1a\xa6Z\xb3f\x0d\x96/_\x8ey\xf3\xe6a\
+``\x00SSS\x98\x98\x98\xc0s\xcf=\x87]\xbb\
+va\xf7\xee\xdd\xd8\xbe};N\x9d:\x85\xef~\xf7\
+\xbb\xf8\xe1\x0f\x7f\x88[o\xbd\x15\x1f\xfa\xd0\x87\x94l\
+d\xc1\x82\x05\xf8\xc4'>\x81g\x9ey\xe6UaL\
+\xc7\xc6\xc6p\xe9\xa5\x97\xaa\x9f\xed\xde\xbd\x1bUU\xe1\
+\xec\xd9\xb38p\xe0\x80Zr\x7f5t\xe6\x1b7n\
+\xc4g?\xfb\xd9\x04d\xe5\x03\xfc\xf1\xc7\x1f\xc77\xbe\
+\xf1\x0d<\xf1\xc4\x13\xe9\xe7\xeb\xd6\xad\xc3\x86\x0d\x1b\xb0\
+i\xd3&\xacX\xb1\x02ccc\x18\x1e\x1eF\xb7\xdb\
+\xc5\xc4\xc4DZ\xfd\xd8\xbd{7\xb6n\xdd\x8aS\xa7\
+N\xe1\xe1\x87\x1f\xc6\xc3\x0f?\x8c\xeb\xaf\xbf\x1e\x1f\xfd\
+\xe8Gq\xf9\xe5\x97'f\xb4\xd3\xe9\xe0\xe6\x9bo\xc6\
+\xa1C\x87\xf0\xdf\xff\xfd\xdfs\xda\xe6\xf1\xf1q<\xfb\
+\xec\xb3\xea\xd86C\x81\x93\x93\x93x\xf6\xd9g\xd5\xfe\
+\xbc\xdc\xb2\x86\xa8\x86\x86\x86\xdc\xb9o\x9a\xcay\xf3\xe6\
+\xb9A\xcem\xdb\xb6\xbd\xae\xef\x17sq\xad\xa9\xaa\x0a\
+\xcf>\xfb\xacb\x87\x9b\xef\xcc\x13O<\x81\x89\x89\x89\
+\x04\xcc\xe7\xcd\x9b\x87\x8d\x1b7b\xf7\xee\xdd/\xcb\xf6\
+^r\xc9%\x8elh>\xeb\xd8\xb1c8}\xfat\
+Z%\x22\x22\x5cv\xd9e\xe7\x93\xafG#\x03 \x22\
+\x5c}\xd5U\x0a|\x1f?~\x1cG\x8f\x1e\x05\x98\xb0\
+y\xf3f\xb5\x0aq\xfc\xf8q<\x7f\xfc\xb8\x07_i\
+\xa0O\xce\xe7\xc94I\x82\xb42\xcc\xda\xdf\xd8\xd3\xda\
+EP\x0av\xd7jPd\xc0&9\x86V\xb2\xabF\
+On\x18y5\xf8\xe9$+\x86\xe17\xddC\xd8\x13\
+4\xcc/\x19\x0665\x1a\x0d{k\x99r\xd2xR\
+\x80R\xf59\xa9\xcf`c\x93(m\x0eY0\xc7v\
+h\x95\xb3g9\x8c\xa2=\xa9I2@e\xd2\xac6\
+S\x96\x8f$\xf6\x1b\xb1\xa9f\xf3\xf7\xa4m{`v\
+E\xacF\x04\xde\xe4m\xdd\xa5\xb2\x00\xd5\x92\xa2,_\
+b\xe5\x85\x9e\xf7\x1fz\xa8\x98\xb2<)\xba\xa6\x9a\xdf\
+\x14`^\xeauY7\xdcp\x03\xee\xb8\xe3\x0e\x07\xca\
+\xf7\xee\xdd\x8b\xaf|\xe5+I\xff\xbd|\xf9r\xbc\xe7\
+=\xef\xc1[\xdf\xfaV\xac\x5c\xb9\xd2\xbd\xde\xd6{\xde\
+\xf3\x1e\x8c\x8f\x8f\xe3\xc0\x81\x03\xb8\xff\xfe\xfbq\xef\xbd\
+\xf7\xe2\xec\xd9\xb3\xb8\xeb\xae\xbb\xb0m\xdb6|\xfa\xd3\
+\x9fV\x8e\x1d\xcb\x96-\xc3\x1f\xfd\xd1\x1f\xe1\xef\xff\xfe\
+\xef_q\xef\xf3\xc5\x8b\x17c\xd9\xb2e\x0a\xec\xca\x95\
+\x81\xed\xdb\xb7\xe3\xa6\x9bnr\x0f\xfb\xf3\xa6E\x9d\xa5\
+\x96.]\x8aO\x7f\xfa\xd3\x0e\x94\x9f9s\x06\xdf\xfa\
+\xd6\xb7p\xd7]wazz\x1aCCCx\xdb\xdb\
+\xde\x86w\xbe\xf3\x9dX\xbf~=\x16.\x5c8\xab\x9e\
+uff\x06G\x8f\x1e\xc5\xa3\x8f>\x8a{\xee\xb9\x07\
+{\xf6\xec\xc1/\x7f\xf9K<\xfd\xf4\xd3\xb8\xf3\xce;\
+\xf1\xf6\xb7\xbf=\x81\x89\xc1\xc1A|\xe8C\x1f\xc2\xce\
+\x9d;\xe7<\x17\xb0c\xc7\x0el\xd9\xb2%\xfd{\xc5\
+\x8a\x15X\xbe|9\x8e\x1e=\x8a\x1d;v\xe0\x86\x1b\
+nP\xd7\xc0\xca\x95+q\xf8\xf0\xe1W\xec\xdco\xd8\
+\xb0A\xb9\x0du\xbb]\xec\xd8\xb1\x03@o\x85B\xfe\
+\xee\xdc\xb9s\xd8\xb3g\xcf\x05\xf3\xdd\xfd\xe0\x07?\x88\
+\xf7\xbd\xef}\xaf\xe8g\x8e\x8e\x8e\xceI#\xbdg\xcf\
+\x1e\xbc\xf9\xcdo\x0e%+\x87\x0f\x1fV\xc7\xf5\xf2\xcb\
+/\x7f\xd9\x9c\x8e6l\xd8\xa0\xc0\xf0\xf4\xf4t:\x87\
+UU\xe1\xe8\xd1\xa3j\xf0w\xf5\xea\xd5\xe7q\x08\x99\
+\x93\x8bG\x87:X\xb7n\x9d\x02\xdf\x87\x0e\x1d\xc2\xe4\
+\xc4$\x06\x06;N{~\xe8\xd0\xa1\xfa>\xe8YI\
+6@\x96TD#\x9c\x97\xb9\xca*\x22\x1f\x22d\x87\
+\xff\x14h\xa4\x08\xc4kI\x0b+pI\xce:E\x01\
+7hG\x91\x04\x0c\xc9\xc1K\xc7\xcc\xa7\xc1L\xce\x80\
+\x0f\xc6_=\x0f\xb5\x0a\xde\xb5f\xe8{M\x0d\x19\x1d\
+\xb5Xuh\xec\x11\x93\xbd\xa2?\x98\x8c\xccb\xabv\
+#9\xbd\xb8QF\x05\xb8s\xdb$\xcf\x90\xd4\xd8\x0b\
+\xf6\xdd2\xfe\xf6\xad\xed9\xa3\x16\x8f{\xf2N3$\
+\xd8l\x16\xe2s\xebQ\xef\xf8\xef\xb4\x9a\xc1>m\xd6\
+4i\x90\x83\xbb\xe9\xf7>\xd5\x95\x04hW\x96\x8a(\
+\xae,\xa5^\x87u\xd9e\x97\xe1S\x9f\xfa\x94\x1b|\
+{\xfc\xf1\xc7\xf1\xc5/~\x11\x07\x0f\x1e\xc4\xd0\xd0\x10\
+\xde\xff\xfe\xf7\xe3\xd6[o\x9d\x93k\x89\xac\xf9\xf3\xe7\
+c\xd3\xa6M\xd8\xb0a\x03n\xbe\xf9f|\xedk_\
+\xc3\xff\xfe\xef\xffb\xeb\xd6\xad\xf8\x87\x7f\xf8\x07|\xee\
+s\x9f\xc3\x1b\xde\xf0\x86\xf4\xfa\xcd\x9b7\xe37\x7f\xf3\
+7q\xd7]w\xbd\xa2\xc7a\xc3\x86\x0dn\xd9]\xb2\
+\xcf[\xb7n\xc5\xd4\xd4Tb\xf9FGGq\xc5\x15\
+W\xe0\xe1\x87\x1f~E\x18\xdd;\xef\xbc\xd3Im\x8e\
+\x1f?\x8e/\x7f\xf9\xcbx\xe0\x81\x07\x00\xf4,\x13\x1b\
+\x96{6\xbffY\x83\x83\x83X\xbdz5V\xaf^\
+\x8d-[\xb6\xe0\xfb\xdf\xff>\xbe\xf9\xcdo\xe2\xf4\xe9\
+\xd3\xf8\xc2\x17\xbe\x00fV\x9a\xe2\x05\x0b\x16\xe0\xf6\xdb\
+o\xc7\x13O<1'I\xc7\xd3O?\x8d\xc9\xc9\xc9\
+\xa4\xe1\x1e\x1b\x1b\xc3\xc6\x8d\x1bq\xf4\xe8Q\xec\xda\xb5\
+\x0b\x13\x13\x13\x89\xb1\xbc\xe8\xa2\x8b\xb0a\xc3\x86W\x14\
+\x98_v\xd9e\xea\xdc\x9f9s&I|\xd6\xae]\
+\xab\x1a\xd0\x93'O\xbe }\xf9\xcb]K\x96,q\
+\xcd\xda\x85R\xbbw\xef\xc6\xf4\xf4t\xfa\xce4aW\
+'O\x9e\xc4\xde\xbd{\xd5\xf5\xbcf\xcd\x1a\x8c\x8c\x8c\
+\xbc\xa0\xf9\x85\x17\xc2\x98K`~\xf2\xe4I\x9c={\
+65a\x87\x0e\x1d\xc2UW]\xa5\x9a\xe0\xb1\xb11\
+\x9c>}\xfa\xfcl@\x8d\xcd\x07\x06;\xea^\xc7\xcc\
+\xd8\xbf\x7f?\xa6\xa6\xa70oT\xaf\xcc03\xf6\xee\
+\xdb\x8b\xaa;\x03\xcb=f?pv\x80\xd5;m\x93\
+\x90f 0\x0co\x08U\xad\x9af\xe1\x9a!A6\
+\x1b\x82\x9e\xc8\xb0\xc6\x0d\x8bJz4R\x9am[\x0e\
+\x9c\xd8\xb3\xe1,d/\x01\xc2\x15\x8d\x84\x19Cmt\
+\xebd\x82\x96\x04\xe8\x95\xf8\x8fL\x0fA\x06H\xc6\x8a\
+\x1d\x0eW\x1fH0\xed\xd2MF\x0e\xa8\xfa\xfcU\xf3\
+\x06B\xd3\xcf\xce\xb9\x05:|G\xcay\xa2\x14O%\
+\xcd!\xdd\x9cH\xae\xba\xd6\x88\x93\x19\xb4\xe5d\x0b\xc9\
+F\xcd\x92\xf5N\x14\x11\xeb\xe9$!h\x1a\x80(\xce\
+\x89[\x8e83\xa1\x83R\xa5^G544\x84O\
+~\xf2\x93\xce&\xee\xc9'\x9f\xc4?\xfe\xe3?\xe2\xe0\
+\xc1\x83X\xb2d\x09\xfe\xe2/\xfe\x02\x9f\xfc\xe4'_\
+0(\x97\xd5\xe9t\xd2\xa0\xe7m\xb7\xdd\x96\x18\xf9\x7f\
+\xf9\x97\x7fQ\x0f\xc0\x81\x81\x01\xdcz\xeb\xad\xb3\xfa\xa5\
+\x9f\xef\xba\xf2\xca+\x15[u\xf4\xe8Q\xe5\xad\xfc\xdc\
+s\xcf\xa9\x81\xb0\xe1\xe1al\xda\xb4\xe9\x15\xd9\xb6[\
+n\xb9\x05oy\xcb[\x10\xceY\x18\x00\x00 \x00I\
+DAT\xd4\xcfN\x9e<\x89/}\xe9Kx\xe0\x81\
+\x07000\x80\xdbo\xbf\x1d\x9f\xfb\xdc\xe7p\xcd5\
+\xd7\xbc Pnk\xf1\xe2\xc5\xf8\x9d\xdf\xf9\x1d\xfc\xf9\
+\x9f\xff9\xc6\xc6\xc60==\x8d\x7f\xfd\xd7\x7fUM\
+\x0a\xd0\xb3i\x9cMg\xdc\xd4\xbe}\xfbT\xa8\xd4\xf0\
+\xf0p\x92\xb3\xd8\xdf\x0d\x0d\x0d9\xbd\xf7\xcb]\x91\x84\
+`\xdf\xbe}\xe9w\xf2\xba8|\xf8\xf0\x05c\xefy\
+\xa1\xd7\x13O<\xa1\x80\xf6\xbcy\xf3\xd2wf\xf7\xee\
+\xddjNa\xf9\xf2\xe5X\xb4h\xd1y\xdf\x86\xc8\x91\
+\xe5\xf9\xe7\x9fW+]\x07\x0e\x1cP\xec\xf8\xe2\xc5\x8b\
+\xcf{\x98\x13\x83122O\x0d\xa123v\xee\xdc\
+\x01\x22`\xf1\xa2%J\xda\xc7\xcc\xd8\xb1}\x87\x08`\
+\x91`Z0\xb9\x0e\x889\x17s!c\xb0\x96\x80$\
+Bd\x8csJ\xcd\x0cs\xfd\x7f\x11~\xd4\x96\x1c\x02\
+`\x19\xa9\x13\x93\x900\xb8\xe4\xf5\xda{<\xc5\xd3\xb3\
+\x86k\x1c\xb4\x1b\xe2\xb3\xac\xac*cuv\xce1\xc4\
+\xb9\x09P\xe9\x9b5S\xce\x16\x00s\xb6\x86\x0c\xd0n\
+=8\xab>!\xd8N\xf8\xa0!6;\xd4$\x18\xa9\
+\x08XyN\xc8\xb5_\xc9K\xdd\xf6&\x84\xc4\x8e7\
+\x1f\xd4\xa4oj\xb3\x17N\x1d#1\xe7\xa4Q5\x0c\
+K\xa9\x99c#\xcbi\x03\xdf\x09\xb7\x0b\xd3I\xd1J\
+\xe4^\xd0\xa5e\xa1^\x09\x22\xe7\xe8R\x80y\xa9\xd7\
+U\xbd\xfb\xdd\xef\xc6\xf5\xd7_\xaf~v\xe0\xc0\x01|\
+\xe1\x0b_\xc0\xb1c\xc7\xb0|\xf9r\xfc\xe5_\xfe%\
+n\xbc\xf1\xc6\xd0\xf6\xec\xcc\x993\xd8\xbbw/~\xf1\
+\x8b_\xe0\xde{\xef\xc5=\xf7\xdc\x83\x1f\xff\xf8\xc7x\
+\xec\xb1\xc7p\xf4\xe8Q\xcc\xcc\xcc\xb8\xbfY\xb0`\x01\
+\xee\xb8\xe3\x0e\xdcz\xeb\xad\xa9\x09\xb8\xfb\xee\xbb\xd5\x83\
+q\xf9\xf2\xe5\xb8\xe5\x96[^\xd1\x06\xc5j\xc6\xf7\xed\
+\xdb\xa7\xb6\xe9\xc4\x89\x138t\xe8\x90x\x00\xd0\x9c\x02\
+T^j\xad\x5c\xb9\x12\xb7\xddv\x9b:\xfe\x93\x93\x93\
+\xf8\xaf\xff\xfa/\xfc\xf4\xa7?\xc5\xc0\xc0\x00>\xf1\x89\
+O\xe0\x8e;\xee\x08\x9b\x99\xc9\xc9I\x1c>|\x18\x8f\
+=\xf6\x18~\xf4\xa3\x1f\xe1{\xdf\xfb\x1e~\xf8\xc3\x1f\
+\xe2\x17\xbf\xf8\x05\xf6\xef\xdf\x1fJq\x06\x06\x06\xb0e\
+\xcb\x16|\xe63\x9fI\xd6q_\xfd\xeaWq\xe2\xc4\
+\x09u\xcc\xde\xfd\xeew\xcfi\x1f\x9e\x7f\xfey\xc7\x80\
+7\x00\xed\xf8\xf1\xe3\xad\xbf{\xa5\xca\x06 \xc9so\
+\xaf\x8b\x9d;w\x96\x1b\x87\xc5V-\xb2\x96\x93'O\
+\xf6\xf4\xd3\xa2\xde\xf8\xc67\x02\xc8+PM]|\xf1\
+\xc5\xce9\xe5|m\x9bu\x98:r\xe4\x88j\x18\xf6\
+\xee\xdd\xab\x9a\x84\xb1\xb1\xb1\xf3\xbe-D\xc0\xe67n\
+V\xab/SSS\xd8\xbau\x1b\xc0\x84k\xae\xb9Z\
+}\xc7'&&\xb0}\xc7\x0eagh\xc09\xc1\x00\
+F\x0d:\xf5\x04'G\x90J\x90\x9f\xe4$\x09\xd4\xf8\
+N\x13\xb9\xf3\xcb\x8a\xe7\xb4\xbf\xa9\x85\x1alf\xfd8\
+\x7f\x8c\xde\x08J\x00\x98\x8c.\x9aM\xe8\x8f\xe6s\x05\
+0T\x0dE\x12\xb2\xb4\x9c\x88\x0c\x13\x15d$\xcf\xe5\
+S\xcd\xf2R\x98s\xcf\xe2\xf8\x89m\xa4\xc6V\xd0\x1e\
+\x19r2\xfat*\xb9\xd6\x9f\x93mh\xb2\x04\x85a\
+}\xc7\x116A\x0dR\xcfR\x1c!\x1a\xe2\xecY/\
+\xb5\xfc\x0c=O\xa0>K0\xec\xb6\xd1p\xcd\x82i\
+\xea`Z\xc4\xdc\x10\xb1\xd1YA\x9f\xb3\xe4\x22\xd4\xfb\
+\xfc\x22e)\xf5\xba\xa9\xb1\xb11\xbc\xff\xfd\xefW\x0f\
+\x83s\xe7\xce\xe1\xdf\xfe\xed\xdfp\xe0\xc0\x01,X\xb0\
+\x00\x9f\xf9\xccg\xd4\x12oS\xc7\x8e\x1d\xc3O~\xf2\
+\x13\xfc\xecg?k\x0dZY\xb0`\x01~\xe37~\
+\x03\xb7\xdcr\x0b\xde\xf8\xc67\xaa\xa5\xe4\xd1\xd1Q|\
+\xecc\x1f\xc3\xae]\xbb\xb0}\xfbv\xdc}\xf7\xdd\xb8\
+\xe1\x86\x1b\x12\x08\xeat:\xb8\xf1\xc6\x1b\xf1\xedo\x7f\
+\xfb\x05\xfbf\xbfX\x96X>\xbc\x1b\x9b2\xa0gM\
+8::\x8a\x9d;wb\xf7\xee\xdd\xaa\x91y\xc3\x1b\
+\xde\xf0\xb2\x07\xe2|\xe0\x03\x1fp,\xdb\xfd\xf7\xdf\x8f\
+\xef~\xf7\xbb\x00\x80\xdbo\xbf\x1d\x1f\xfc\xe0\x07\x1dK\
+>11\x81G\x1ey\x04?\xfe\xf1\x8f\xf1\xf8\xe3\x8f\
+\xa7\xa5{\xcb&^}\xf5\xd5x\xd7\xbb\xde\x85\xb7\xbe\
+\xf5\xadJ\xce\xd1\xe9t\xb0e\xcb\x16\xfc\xf6o\xff6\
+\xbe\xfa\xd5\xafb\xdb\xb6m\xb8\xff\xfe\xfb\xf1[\xbf\xf5\
+[\xe95\xeb\xd7\xaf\xc7\xf5\xd7_?'\xad\xf9\xce\x9d\
+;q\xcd5\xd7\xa4\x7fK\x8d\xfe\xd3O?\x8d7\xbd\
+\xe9M\xe9w\xabV\xad\xc2\xd8\xd8X\xb8\xcd/G\xe3\
+#\x1d;\x00$}\xf9\xda\xb5k\xb1x\xf1\xe2\xf4\xf3\
+\x99\x99\x99\x0b\x1e\x98\xef\xd9\xb3\x07\xdf\xfb\xde\xf7\xe6\xec\
+\x93}>\xea\xdc\xb9s\xad\xab\x08\xfb\xf6\xedS\x0d\xec\
+\x9a5k044\x84\xbd{\xf7\xe2\xc4\x89\x13\x09\xa8\
+v:\x1d\x5cu\xd5Ux\xf4\xd1G\xcf{\xd3m\x1d\
+Y\x1a\x99\x92\xbc6\x9b\xf9\x8c\x06\xcco\xdc\xb8\x11\x8f\
+?\xfe\xf8\xf9c\xcc\x19\xb8\xfc\x8d\x97\xab\x95\x99\xa3G\
+\x8f\xd6\xa9\x9e\xecB\x87\x8e\x1e=\x8a\xb3g\xcez'\
+\x0fH_q\x93\x8cI&\x81\xd2\xfdMc#\xd8\x03\
+h\xc9\x8a\x0fZb\x90\xa4$,e3\xb61\x10C\
+}\x92y\x97\xf6\x86N/L\xda\xc5Q4\x12L\x81\
+\xff\xb6\xdc!#\xb5\x81H\x8d\xccQ\xee\x0aK\xea\x81\
+N\x91\xb0\x19\x81v\x9f\xfe\x095p\xd9\xa4\x8aZ{\
+G\x93Y\xa4;11\xd1\x98\xbc\x5cH\xa2N\x12a\
+Lz\xf0\xb5\xcd\xbf\xdd6\x19\xaca\x7f\xf6\x8c'\xeb\
+\xe8.\x929\xed\x1c\x02\x19?qy\x15\x08\xd9\x90\xfc\
+]\x1a?u\x0d\x9dn|\xac\x15b\x1eJ\x95\xfbK\
+b\x95\x83\x5clV\x01\xe6\xa5^7\xf5\xaew\xbdK\
+iS\x99\x19\x0f<\xf0\x00\x1ez\xe8!t:\x1d|\
+\xfc\xe3\x1f\xc7\xb5\xd7^\xab\xfefzz\x1a\x0f=\xf4\
+\x10\xfe\xe3?\xfecV\x9dm\xe3\xe6\xf2\xe0\x83\x0f\xe2\
+\xa3\x1f\xfd(>\xf0\x81\x0f(\x9f\xe8E\x8b\x16\xe1\x93\
+\x9f\xfc$\xfe\xee\xef\xfe\x0e\xa7O\x9f\xc6\xbd\xf7\xde\x8b\
+?\xfc\xc3?L\x0f\xa75k\xd6\xe0\xf2\xcb/?\xaf\
+\x0f\xc7\xb6Z\xb5j\x95ZF\xef1Y[\x01\xf4|\
+\xdd'&&\xb0s\xe7N<\xf1\xc4\x13\xf8\xf0\x87?\
+\x9c\xb6q\xf1\xe2\xc5X\xbbv\xed\xcb\xea&\xf1\xb6\xb7\
+\xbdM\xfd\xec\xe0\xc1\x83\xf8\xda\xd7\xbe\x06\x00x\xcb[\
+\xde\x82\x0f\x7f\xf8\xc3\x0a\x9433\xf6\xed\xdb\x87o|\
+\xe3\x1b\xb8\xff\xfe\xfb\xfb\xbe\x7fUUx\xec\xb1\xc7\xf0\
+\xd8c\x8f\xe1\xe7?\xff9>\xf5\xa9O)\xb9\xd2\xc0\
+\xc0\x00\xde\xf7\xbe\xf7\xe1\xe1\x87\x1f\xc6\xd6\xad[q\xcf\
+=\xf7\xe0mo{[Zr\x1f\x1d\x1d\xc5\x96-[\
+\xe6\x04\xcc\xb7o\xdf\x8en\xb7\x9b\x1a\xb4\x8b.\xba\x08\
+\x9b6m\xc2\xa3\x8f>\x8a\x1d;v\xa80\x9a\x05\x0b\
+\x16`\xd3\xa6M\xaf\x88\x1d\xe0\xfa\xf5\xebq\xd1E\x17\
+\xa5\x7f\x8f\x8f\x8fc\xef\xde\xbd\x89I\x97\xcd\xca\xa9S\
+\xa7.\xf8`\xa1\xd3\xa7O\xe3\x7f\xfe\xe7\x7f.\xa8F\
+\xa1\x09\x1e\x03r\x88\xd7\xe1\xc3\x87q\xe0\xc0\x01\xac^\
+\xbdZ\x9d\x8b\xf3]\x97]v\x99\x93\xa5X\xbb\xd7\xf1\
+\xf1q\x1c?~<\x9dk\x22RZ\xf0\xf3Q\x9dN\
+\x07k\xd7\xae\xfd\xff\xd9\xfb\xf2\xe8\xc8\xaar\xfb}\xaa\
+R\xa9\xa42w\xa6N\xd2Ig\xea)\xc1\xd7\xd2@\
+3\xfa@\x10\x14\x17\x0e\x80\x88\xac\xa5\x0bAD\x11P\
+\x17\x82\xef\xad\xe5\x9f\xcf\xf5\xdeS\x7f\x8a\x0aJ\xfb\xb4\
+AFA\x11AEd\x90f\x90n\x06i\x91\xa1\xbb\
+\xd3C\xe6\xa13'\x9d\xb1R\xa9{~\x7f\xa4\xce\xb9\
+\xdfw\xce\xa9&\xdd]i\x86\xaeo-\xde\xb3S\xa9\
+\xaa{\xcf\xbdU\xd9\xdf>\xfb\xdb\xdb\x1a\xfc\x9c\x99\x9d\
+A(3\x84\xea\xeaj\xd6L\xf5\xf6\xf6bn.\xea\
+pQ!\xd8\xcd\x1c\xbe\x934\x0c\x1e&,K\x00\xb2\
+\x84e\x9e \xac\xb7\xb6\xfa\xb3\xdf\xc5\xf7\xa06R5\
+\xb5\x97\xa1=\x99\xa9]O\x84\x8bIu\x01}\xf8\x00\
+\x9b8\xba(\xe7\x19\xea\xa2\xe2k\xdc}0.\xd9p\
+)\xf1\xd3\xa6Z\xf2\x845\xa3v\xa9\xb1\x8e\xdb\xe6\x81\
+Y:j\xe2xt\x83`\x0d\xb9\xd2\xd7\xf2\x7f\x97B\
+\xeb\x85F\xc8\xd7\xe3\x0b\x97\x86[H\xc3\xee\x91\xfa\xd2\
+\xc3:>_\x02\x03\xc6\x80\xeb\x14P\xd75S\x00\x9e\
+Zp\x0a\xfb\xb5DB\xae#\x85\x01\xfe\x01_.#\
+\xa5\x93\x13\xb7vS$\x09\x8d\x02\x916Q7\x1f\xba\
+\x06\xc4o?-eI\xd71Q\xe1p\x18g\x9cq\
+\x06\xfb#166\x86\xdf\xff\xfe\xf7\xf0<\x0f\x1b6\
+l\xc0Yg\x9d\xc5>\xd8\xb1X\x0c\x7f\xfe\xf3\x9f\xf1\
+\xc3\x1f\xfe\xf0\x90\x86\xdffggq\xef\xbd\xf7\xe2\x0f\
+\x7f\xf8\x83%mY\xb3f\x0d\xce8\xe3\x0c\x00\xc0\xd6\
+\xad[\x99\x86;\x14\x0a\xe1\xc4\x13O<*\xeb\xd1\xdc\
+\xdc\xcc\xd6b||\x5c[6\xae^\xbdZ3~}\
+}}\x96Vz\xed\xda\xb5Kv\x5c\xa7\x9dv\x1ac\
+\xfb\xe2\xf18\x9e|\xf2I\x8c\x8c\x8c ??\x1f\x9f\
+\xfd\xecg\xd9\xd0\xae\x94\x12\xbbv\xed\xc2w\xbf\xfb\xdd\
+\xb7\x05\xe5f\xbd\xf4\xd2KZ\xc2D+??\x1f\x9f\
+\xf8\xc4'\x00\x00===\x96\xd6\xbc\xb9\xb9yQQ\
+\xe7\xdd\xdd\xddl\xed\x22\x91\x88\x96\x90tuu\xb19\
+\x83\xec\xeclK^\xb2TU__\xcf\x1a\x9b\x03\x07\
+\x0eh}\xb9\xe9\xb7?<<l\xb1\xad\xe9:x\xed\
+\xd9\xb3\xc7\x92\xac\xa8\xdd\xa9\xb6\xb66\xa6\x11\xae\xa8\xa8\
+H\xf9lI]]\x1d\xbb?ggg\xf55T\x89\
+\xb7\xf1x\x1c\x03\x03\x03\xecy\xe5\xe5\xe5G4\xab\xe1\
+b\xee\xcd\xe1\xce\xf6\xf6vxq\x0f\xa1\xcc\xb0\x15:\
+\xd4\xde\xde\x0e\xe9y\xe0\x13vJ\xc2\x22|\x17\x11\x86\
+/\xa5\x06:B\xda\xd2c\xed/.\x8d!O\x83\xd9\
+g\x8c\xac\x80\x11\x04D\xfc\xc1\x85\x12AH\x0b\xe3J\
+[|\xa1\xc1\x9e\x0f\xea\xe8\xa3\x12\xa6\xa1\x1f\x1f\xb0\xe4\
+\xc2l)\x5c\x16{J\x16\xa3\x1a\x00\x1en\xa4\xdfC\
+P\x04\x0b\xdf\x22\xde\xe6\xbd\x13\x9au>\xd0\xeaZ+\
+i\x88\xcb\xfd\xf4R\xd2\x00\x11ota@Y)\xfc\
+]\x03\xa3\xcf\xd1\xde\xf5\xd2\xd7\xcc\x90\xb5\xe6\xfe\xf2>\
+\x9b\xef\x9f\xa3d)\xa3\x8e\xe6K7a\x82\x89\xe3%\
+]<i\xbf\x8b\x9e\x1b\xd5\xa8^\xf0\x1cTijv\
+|.]X&@T\x03\xcfe6i`\x9e\xaec\
+\xa2\x1a\x1a\x1a\x18;%\xa5\xc4\x8b/\xbe\x88\xc1\xc1A\
+\x84\xc3a\x5ct\xd1E\x8ce\xf2<\x0f\x8f=\xf6\x18\
+\xee\xbd\xf7\xde\xc3\x92mx\x9e\x87?\xfc\xe1\x0fx\xe5\
+\x95W\xac?Vg\x9f}6\x82\xc1 \xc6\xc6\xc6\xb0\
+c\xc7\x0e\xf2\x85(\xd0dx\xfe.E\xa9\xa1TZ\
+===\x88\xc7\xe3(**BEE\x05jjj\
+\x10\x08\x04022\xc24\xb3\xc1`p\xc9|\xb7#\
+\x91\x08N>\xf9d\xf6\xb3\xfd\xfb\xf7\xe3\xf1\xc7\x1f\x07\
+\x00\x9cw\xdey\xd6{\xef\xdb\xb7\x0f?\xfe\xf1\x8f\x0f\
+;\x11\xf2\xcd7\xdf\xc4\xef~\xf7;\x06\xa4\x00\xe0\xb8\
+\xe3\x8e\xd3\x03\x99[\xb7ne\x0dVqq\xb1S\xee\
+\xe4\x02\xe6\xe6q)\xbdqww\xb7\x95\xb4h:\xd0\
+,%0\xa7\xd5\xdf\xdf\xaf\x1b\x08s\x08U1\xe9\xe9\
+Z|\xed\xdd\xbb7!\xd7\xf0?3\xaa\x99mmm\
+eR\xb5\xe2\xe2b&\x1dJEUTT\xb0\xef\x90\
+\xb1\xb11=Wq\xdai\xa7!??\x1f\x9e\xe7\xb1\
+\xf9\x11u,og\x07{(UPP\xc0\xecX=\
+\xcf\xd3\xbbr\xd5+V //\x8f=\xb6s\xe7\xce\
+\xc4w\xb3\xf0A\xaeF\xa3\xd2\x14\x02\x83q\xbb\x09I\
+\x82\x95\x1f$\xfc\xf4M*\x18f\x91\xf6&\xfb\xcb|\
+\xb9%\x07\xf3\x92\x87\xc1SL\xe8k\x99\xa9\x92[j\
+M\xb6K\x02\xa2\x07]\xa5\xe4pM:\xd2\x22%\xa3\
+\x879p\xa7\x83\x91\xe63%\xe984y\xac4\xf1\
+\x09\xf8\xce\x06N}\xb0\xcf_G\xe9\xb8\xa5\x0f\xe0\x01\
+[?/\xec\xf5_\xd8\xa50}t\xfc\xee\xc0\x05\xb2\
+\x85\x85\xc8\x05\x85\xb3\xac9b\x83\x9c\xa6n_J\xd2\
+8\xa8\x06Kp\x0frW\x99;\x0c\x9a\xf8\xe7\x17Q\
+\xd2\xc6\xc7\xecs\x88\x94E&y\x0bu|\xb4EK\
+\x03\xf3t\x1d\x13u\xf2\xc9'36hvv\x16O\
+=\xf5\x14<\xcf\xc3\x09'\x9c`\x0d\xdf\xed\xde\xbd\x1b\
+\xf7\xdf\x7f\xff\x11i\xa9c\xb1\x18~\xfb\xdb\xdfZZ\
+\xd4\xc6\xc6F\xd4\xd4\xd4\xc0\xf3<l\xdf\xbe\x9d\xbd\x87\
+\xd2\x1a/e\xe5\xe5\xe5\xb1\xedt)\xa5\x96\xa6({\
+\xb7\xd2\xd2R\x14\x17\x17#\x1a\x8dj6U\xd5R1\
+\xbb\xd5\xd5\xd5\x16\xc3\xf6\xf2\xcb/cvv\x16EE\
+EV$\xfa\xc4\xc4\x04\xee\xbe\xfbnk\xd8\xeeP\xeb\
+\xe9\xa7\x9f\xb6X\xf1\xbc\xbc<\x9cz\xea\xa9\x9a\x01\xa5\
+\x00;;;{\xd1\xcd\x89\xe9\xff\xad\x1a\x9e\xb7{l\
+\xa9\xca\x15\x1e\xa44\xe4\xe6\xdc\x81\x94\xf2\x98\x0f\x16:\
+\xdc\xcf}oo\xafE\x0c\x00\xb6kKvvvJ\
+\x07\xaa]\x8e,\xc3\xc3\xc3\x98\x9e\x9eF \x10\xc0\x86\
+\x0d\x1b\xf4\x8e\x94j\xc6U\x15\x16\x16\xa6\x14\x9877\
+7\xb3\xef\xdc\xa9\xa9)\xdd\xe8555Y\x9f\xe5\xee\
+\xeen\x1eaOb\xd2\x15\x88\x95\xbev\x84\x01$\xc5\
+4\xbb\xc6\x0c\xa8F\x98 \xb3\x05\xffm)80\xa3\
+\xf2\x08\xf6\x1e\x04tK\xd3\xceO\xf8\xb8W\x82\x84\xea\
+\x88\x84\x1c\x84\xca\x17\xc8\xfb\x90\xd0$\xd7\x81K\xa3\x01\
+\x90\xe4\xd7\xa44\x86\x1c\x19\x985\x0e-1\x9ciz\
+\xa3\xb3!N\xb2C\xb1\x109\xcf\x9b\x1f\xb5\x82>\xd8\
+\x96\xf6\x22K\x09\x13eSG\x19\xd3\xe8ea0\x13\
+l\xd0W3\xe9\x8e\x18!3-\xd5\x92\xe1\xf8\x17\x8e\
+\xf5+\xcc\x8e\x86\x0c\xb2\x0a\x10{L\x08\xdb9FY\
+a\x1a@{Aj\xc3\xedv\xf4\xde\x08s\x88\xf1;\
+\x13I\xb6s\xf8\xcb\xd9\xf7l\x9a1O\xd71Q\xe1\
+p\xd8\xb2\x06lkkCww7\x82\xc1 \xce<\
+\xf3L\xb6}?==\x8d\xdf\xfc\xe67)\x09\xfc\xe9\
+\xea\xea\xb2|\xbf\xc3\xe1\xb0\xb6\x02\xdc\xb9s'c\xd7\
+\xb2\xb2\xb2\xd8\xc0\xe0RTqq1\x93\x8b\xc4b1\
+=\xfc\xb7z\xf5j\x84\xc3adff\xa2\xb9\xb9\x19\
+\x004\xcb\xa5\xaa\xbc\xbc\x9cEl\xa7\xaa\xd6\xaf_\xcf\
+\x80\xc1\xf4\xf44\xb6m\xdb\x06\x00\xf8\xe0\x07?h\x81\
+\xf6\xe7\x9f\x7f\x1eo\xbc\xf1\xc6\x11\xbfo<\x1e\xc7_\
+\xff\xfaW\x8b5W\xc3\x99###Lg-\x84X\
+\xb4\x8b\xca\xae]\xbb\x98t\xa1\xa0\xa0@\x83z\xd7c\
+K\xedz\xd3\xd0\xd0\xc0\xa4\x13\xf3\xf3\xf3Z\xc2\xd4\xd0\
+\xd0\xc0\xb4\xe7SSS\xef*\xff\xf2\xf7R\x99M\xd7\
+\xf2\xe5\xcb\x91\x97\x97\x87\xa9\xa9)\xcb\x91'\x95\xd2\xb0\
+d\x8e,\xb1X\x0cB\x08TUU%\xb5o\x0c\x87\
+\xc3)M\x00mhh`\xe0{``\x00333\
+N\xedy\x7f\x7f\xbf\xff}k\x1anS\xa4\xa4\xcd\xb7\
+)8&\xb1\xf1N\xd2R\x1a\x9e\xd1>\xc8\x93\x82\x9b\
+\x9d\xd3\xd0\x22\x01[d\xe1\x9b\xaa\x08\xce\xdeK\xdfy\
+\x83\x81\x5c\xe20b\x09\xe0\xa5\x1b\x90\x9bV\x91\xdc\x80\
+\x85\x0c`Ji\xbc\xbf[z!\x13)\x9a\x96b[\
+rv[\x92\x13\xa4\x0d\x09\xf3[O\xe0Qa/2\
+M\xef\xf1\x9f#}\xb0o\xea\xd2us@^K\xeb\
+\xe1\xa5\x9f\xf1\xc9NS\x1f\x80p\xae\x19?\x0f\xba\x06\
+\xe0[\x16\x14\x1a\x0b\xe26\xc3\xceG&\x1cj\xdc\xa0\
+\x9a\xdd\x81\xba\x89$\xb3\x02\xa4\x11\xf05\xff\xb6\xdb\x90\
+-\x81I\x03\xf3t\x1d\x03\x15\x89D,=\xe3\x8e\x1d\
+;\x10\x8b\xc5PXX\x885k\xd6\xb0\xdf\xdf\xb9s\
+'\x93\x98\x1cIy\x9e\x87\xa7\x9ez\x8am_\x07\x02\
+\x01\xac]\xbb\x16\x81@\x00SSSGM*\xa2j\
+\xcd\x9a5l(uffF3\xc6j-B\xa1\x90\
+\x06\x89\xfb\xf6\xed\xc3\xcc\xcc\x0c\xfb\x03\xbe\x14\xcd\x83\x92\
+y\xa8\xda\xbf\x7f\xbffsO=\xf5TK\x13\xff\x97\
+\xbf\xfc%e\xef\xfd\xfa\xeb\xaf[C\x8e\xe5\xe5\xe5\x1a\
+\xa8\x98\xc3sf\x9c\xfd\xc1\x1a3\xdax\xe5\xe4\xe4\xe8\
+\xeb\xdb\xd5\xd5\xc5\x5cXrrr,\xab\xc2TWM\
+M\x0dk~&&&4\xf8\xae\xab\xabc\xf7\xc5\xf8\
+\xf8\xb8\xb5[\x92\xae\xc5\x03sS\xb2RXX\x08\xcf\
+\xf3\xac5U\xae-\xa9\x22!Lopu}\xb3\xb2\
+\xb2P\x5c\x5c\xac\xef\xe9\x8e\x8e\x0eF>\x08!R\xf6\
+\xdd\x13\x0c\x06\xad\xe1\xce\x9e\x9e\x1e\xcc\xce\xce\x22##\
+\xc3\xfa\xfctww#J\x1bci\x06\xb3\x18\xba\x01\
+\xe9\x98@\xe4f-\x94h%\x8c\xb7`\x84\xa8\x90\xb0\
+\x86G\xb5\x17\xb60-\x00\x85/K1\xbc\xb4%a\
+X9\xee\x22\xb1\xf2\x86\x9cA*\x0d\xb6\xd9\x5c\x119\
+\x86\x90\xae\xdcJ\xe1\xfb\xa4\x83\x06\xc6\xbb$0~\xec\
+\xbd\x9d\xc4\xc3\x045\x06\xd8\x96>\xd3l\xac\x99:y\
+\xee\xc8\xe2'YJG\x08\x92\xaf\xcb6q\xb1\xb4\x1c\
+.M9\x8dp4\x1b\xbc\xdb!\xcf\x93\xfc\xd8$[\
+U?$H\x9d\xb5\x0f\x8a\x93\x9aM\xfa>\xe3\xecv\
+\xe4zz\xd6lh\x87\x18a-\xb5\x90\xae\x80&i\
+\xcd'\xa4\x81y\xba\xde\xf7\xd5\xd8\xd8\xc8\xc0\x88\xe7y\
+\xda\xfd\xe2\x83\x1f\xfc c\x09\xe7\xe7\xe7\xf1\xdcs\xcf\
+1&\xe9H\xab\xb3\xb3\x13}}}\x16\x83\x16\x0c\x06\
+1==\xcd\x1e\x13B\xa0\xbc\xbc|I%\x0d.\x00\
+<33\x83H$\xc2\xfe`\xaa?\xd2###l\
+@\x92\x86\xe5\xa4\xaa\xf2\xf3\xf3-\xa6O\x81\xe1\xd2\xd2\
+R\x8b\xc9\xdb\xb9s\xa7%\x178\x92\x8aF\xa3V3\
+\x96\x9d\x9d\xad\xdfw\xdf\xbe}\xec\x9e(((X\xd4\
+\xd0^gg'\xf3B\x0f\x04\x02ZK\xae\xec\xf3\xe8\
+c\xe6\xb5Iu\x99\xe1A###z0\xd0\xd4\xb8\
+www\xa7d\xd7\xe8X\xac\x1d;v\xb0\x1d\x98H\
+$\xa2\x9b.W\xd0P\xaat\xe6\x0d\x0d\x0d\xac\xb9\x92\
+R\xb2\x1d\x91p8\x8c\x8a\x8a\x0a\x04\x02\x01D\xa3Q\
+&\xd1R\x8cz**\x14\x0a1\xb9\x9c\xe7y\x0b\x83\
+\xaf\x90\xc8\xc9\xc9\xb1\xadZ\xf7\xed\xe3\x02\x85\x84\xd4A\
+\xda\xe9<>X\x82\x01\x96D\x12\xc6\x98\x80O\x8b\xc9\
+\x85\xb0]`\x04\x98K\x87\xcd\x8fRU\x84/\xadQ\
+\x8e$t\x17L;\x99X\x0c<}M\x93\xcb&z\
+rcXP1\xe5f\x1b!\x12\xf2\x1fS\xcb\xad\x9e\
+%d\x12_x\xe9r\xe5V\x80X0\xc0H\xdb\x17\
+\x8b\xec\xa7\x89B0OI\x90 %\xc97A`\xc8\
+M(\xd0WZ\x13a\xf6\x0bB\xf7@\x0a\xec3\xf7\
+\x1c\xe14\x87L4\x01\x82\x85\x11)\xcd\xbct#r\
+\xff\x0e\x10\xe4:k\xd7\x9e$\x1e\xf5\xb0A\xbc\xa4\x89\
+\xa4\xe6\x15\x95\xca=H\xa4\x81y\xba\x8e\x9d\xaa\xab\xab\
+c`drrR\xb3V\xeb\xd6\xad\xb3\x9cZR\x1d\
+9?55emm\x17\x16\x16j\xbb\xc2\xfd\xfb\xf7\
+\xb3/\xf3\xd2\xd2\xd2%\xf3d\x8eD\x22\x96-Z[\
+[\x1b<\xcfCaa!\xfb\x83YYY\x89p8\
+\x8c\x03\x07\x0eX\x8dE\xaaY\xfd\xa2\xa2\x22&\x8f\x89\
+\xc7\xe3z\xcd***\x18\x0b8??\x9f\xf2k\x04\
+\x00o\xbc\xf1\x06\x1b\xf2\xa4\xe0\xc2LN\x0c\x87\xc3\x8b\
+\x021\xd1h\xd4\x92\x83(\x8d~4\x1a\xb5X\xfa\xa5\
+vf1\x19y\xa5\xf9\x0d\x85B\xd6\xf9(yS\xba\
+\x0e\xbd\x06\x06\x06,\xd0\xab$+f\xd0\x90\xf9\xb9;\
+\xd2\xebK\x07?\xa7\xa6\xa6\xb4\xfbJmm-\x82\xc1\
+ \x8a\x8b\x8b\x91\x93\x93\x03)\xa5\xe5\xccRVV\xc6\
+\x80\xfd\xe1VUU\x15\xfb<{\x9e\x87\xb7v\xbc\x05\
+!\x05\xd6\xacY\xc3\x06\xed\xe7\xe7\xe7\xb1c\xe7Np\
+\xbeZhorS\xe7\xcce\x1c\x1c\x04\x0a7.$\
+j\x15\x87\x9f!\x5c\xa1E\xf0\x81\x92\x84\x0d\xed\x85\x0d\
+\x9a\x15\xd0c\xdf\xddR\x8fW&b\xe2}\x14\x97\xf4\
+\x1b^;\xc3\xf8\xac\xbaz\x06\xf5\x05\xe7\x03\x8e \x16\
+\x8f\x8es\x14D\xceB\xc0\xb3p\x04l2\xd8(9\
+`\xd4b\x0di'\x90\xaa!Sa4\x14\xda\xbf\x84\
+Y\x22\x92\xeb\xa1]V\xa4\x89\xa3\xa9\xaf\x0d\xbf@4\
+\xbd\x13>\xcb\xae-%!\xad\x99N\x7fd\x81\xf8\xde\
+p\xd3\x17\xab?\x93*8\x89hn|\xc5\x8e\xb0\xe4\
+<\x0b\x0d\x90t&\xd7\xfa\x98\xde\x0e\xc2\x92\x06\xf5\x9e\
+\x06\xe6\xe9z\xdfWqq\xb1\x15?>77g\xb1\
+:\xc0\x82\x97\xeeR\xb0\x84\xfb\xf6\xedc_d\x19\x19\
+\x19\x9a\x1d5Aoaa\xe1\x921\xe6\xd4\xbaM\xfd\
+QT\x83\x9f555l\xf7 \x12\x89`\xdd\xbau\
+\x00\xec\xf4\xc7\x15+V\xa4\xd4=&\x12\x89\xb0]\x8d\
+X,\xa6]#\xea\xea\xea\xec\x84\xc0$!OGR\
+\xbd\xbd\xbd\xcc\xdeP\xad\x89\xbag\xa8\x9c'33\x93\
+9N\x1c\xac\xccc---\xd5\xf7\x9d\x09~KJ\
+J\xac{2UUUUe1\xb3j\xb8\xd3\xd4\x9e\
+G\xa3QK\xbe\x93\xaeC+\xb3!\xab\xa9\xa9A0\
+\x18D{{;\x1b\x08\x0f\x06\x83\xfasv\xa4UY\
+Yi9\xb2\xa8\xfb\xb6\xaa\xaa\x0a\xc1`\x10EEE\
+\xc8\xce\xce\x86\xe7y\xe8\xeb\xebc\xdfK\xcb\x96-c\
+>\xf6\x87[\xa6\xbb\xd4\xe8\xe8(\x86\x06\x06!\xb1\xb0\
+\x83I\xbf\xdfFFF02:\xc2\xa1\xa6\xa4\xf2\x0a\
+\xc1\x88i\x1a\xca\xc2\xe4\x0f\x92\x02J\x133\x0b_\x01\
+\xc3\xc0\x9e`\x00\x0d\xf6\xcc)\x0c+\xeb\x85dP\xe3\
+A{\xc0T\x01F\xc9Y_!\x18\xb8T\xfffQ\
+\xf7\x0a\xe0\x09>\xd0\xaay^)a\xf6&\x1ax\x0a\
+?\x8e\x9e5\x1a\x92\x00BA%\x16dj\xd5\x84\xe5\
+\xd2\xecT\x08\xcet\xa0Y-\x22\x91\xc2\xa9\xf1\xd7\xad\
+\x950\x1f\x85\xa3\xa1`f\x8f\xec\xbaI\xe6\x19\xc9\xae\
+\xa2\xbe?\xe8P\xa5\xe2\xbd]\xde\xe8\xd6\x02Z\xe0<\
+I\x03\xa5\xb4\xfe\xb6r\x89'\x88\x9a\xfd\x11\xedT@\
+\x1b\x0f\xc1h\xff40O\xd7\xfb\xba\x02\x81\x00\x0b\xd2\
+\x01\x16\xb4\xb3\xf3\xf3\xf3\xc8\xcc\xccd@E\x05\xd5\xa4\
+R\xc6B\xd9G\xfa\x070\x10\x08h\x86\xb2\xa7\xa7\x87\
+=\x96\x93\x93\xb3d\x96\x89+W\xaed\xe0{nn\
+N\x07\x1a5551\xb6'\x14\x0aiy\xc3\xce\x9d\
+;\x19\x9b\x9c\x9b\x9b\x9bR\xd9\xc5\xb2e\xcb\x18\xf8\x9e\
+\x9f\x9f\xd7Cr\xa6\x8b\xc8\xd8\xd8\xd8\x92\x0c%\x0e\x0c\
+\x0c0=\xb8b\x10\x15\xb0\xa0\x0d[(\x14b\xebx\
+\xb0jkkc\xcf\xa5:s\xf3\xb1\xdc\xdc\xdc%c\
+\xcdkkk\x93\x0ew\xba\x82\x85\xd2\x83\x9fGV*\
+h\x88\xdeK\x85\x85\x85\x88\xc7\xe3I][\x8e\xf4\xbb\
+\xcel\xea\x86\x87\x87155\x85@ \xa0\xe7l\xe8\
+\xccMww\xb7%\xd1J\x85+Tmm\xad1\xdc\
+\xb9 \x97\xcb\xc8\x08b\xe5\xca\x95\xec{\xa6\xaf\xaf\x0f\
+\xd1\x99(\x81cH\xa4V\x12K;\x975\x9f\xb4\xc1\
+\xa1\xf4u0\x1cU'\xec\xf4\x04\x19P\xa4\xf3\x8a.\
+\xe6\xd8O\x03\x05\x97/0\x04F\x18[\xe6\xfa\xc1u\
+\x1a\x0b\xbe\xe8\xc2\x8f\x93\xd7\xae/\xf0S>\x9d\xdd\x80\
+tX\xa3Si\x88\x1b0Zc\xab\x89\x81I!\xb8\
+\xa6[\x0a\x1b\x91\xfa\xc1\xa1\xceqR\xd6\xd6Xk\xaf\
+SV\x01\xe7\x94\x804\x9f+\xf86\x87i\xf6\x22a\
+YP\xaa\x16H\x92NK\x92\x97\x12\xf6\x9c\xa9\x7f}\
+\xcc!\xd8D\x93%\xd5 \xac4\xfb9\xa9\xe52\xd2\
+h\xb9\x04\xf3\xc1T]\x9d\xd0\xf7\x8d\xb4\xb4>\xfe\x81\
+Z\x9b\x06\x9270i`\x9e\xae\xf7u\x09!\x90\x99\
+\x99\xc9~6==\x0d)%222\xac\xb0\x1a3\
+l&U522\xc2\x00X \x10\xd0>\xbe\x13\x13\
+\x13lP,\x14\x0a1\xe9F*\xcb\x04\xdf\xc3\xc3\xc3\
+\xe8\xef\xefG0\x18\xb4d\x0e\x81@@\x03\xc8\x81\x81\
+\x01\xa6\x87\xce\xcc\xccL)07An<\x1e\xd7R\
+\x00\x93\xe5M\x16\x85~\xa4\x15\x8b\xc5\xac\xd7V\xf7\x87\
+\xe7ylP\xd3u\x5c\xc9\xaa\xb3\xb3\x93\xbdn(\x14\
+\xd2@\xac\xa3\xa3\x83\xb1\xf4\xa1Ph\xd1\x8e/\x87Z\
+fx\x10\x0d\x162\xb5\xe7\xa6\x14#]\x87^\xa6g\
+\xf9\xb2e\xcb\xb4\x1bR{{;k\xc6\x95k\xcb\x91\
+~\xd7\x99\x92\x98\xfd\xfb\xf7\xc3\xf3<\x04\x83A\xfd\x18\
+u\x15\xda\xb3g\x0f\x03\xe6t\xe8\xfbp+\x14\x0aY\
+\x09\xcb]]\xdd\x98\x8b\xcd#\x94a\x87\x0euvv\
+\x22\xee\xc5\xc1]\xc0\xa5\xd6_\x0b\x031*\x10#L\
+&WyS3\xc8M\xdc=\x84\xad[\xd0\xbf\xeb`\
+\x9f\x99/7K\x0a%.\x1eL0\xedp\x0aaZ\
+t\x13\x18r\xd7\x0e\x0e\xa6\xa9\x16\xdb\x1e\xda\x14B:\
+\xbd\x11\xa5\xf0\x93&\xb97zB\x96!\x0dGm\xa9\
+v\x1fl\xebA\xdfI\xc5\xc5\x19kwr\x0e:%\
+\xcb\xfd4z\x1d\xe9h\x04\xa4\xef\xa7.`\x80c\xdf\
+)\x87'p\x92\xd5\x12\x82\xb9\xb6\xd0\xc1T)\xa5\xe3\
+xm\x05\x92j\x5c\xa4cvv\xa1\x9fq$W\x81\
+\x0f\x0d\xeb\x17\x13\xd2\xef\xb3\x1c\x0d\x0f\xe9\xf1\xd85\xa0\
+\xfe\xf2i`\x9e\xae\xf7}\x05\x02\x01\xcb\xf1`nn\
+NGf\x9b\x83R4\x8d1\x95\x15\x8dF-6V\
+\x81\xd1\xf9\xf9y\x0b\xb4\xa7JsJ\xcb\x05\xbe;;\
+;\xb5\xbe\x9c:\xd7\xa8\xa2AC\xd4\xe6\xcd\x15Rt\
+$eF\x88{\x9e\xa7\xfd\x9eMoe\xaa\xf5Nu\
+\x99\x8dYVV\x96\xbeG\xcc\xebg\xee\xc4$\xab\xf1\
+\xf1q+\xccE\x01\xa3\xd1\xd1Q\xcb>/\x15\xec\xa9\
+\xab\x5c\xa1Rj-M\x96>-c9\xf2\xda\xb9s\
+'\x93?edd$\x0d\x1a*))Y\xf4\xfd\x94\
+\xac\x0a\x0a\x0a\x98\xae[\x81^\xd5D*\xa9\x12\x1d\xf2\
+t\xed\x12\x1d\xe9\x8eMVV\x16\xca\xcb\xcb\xd9q(\
+\xc9V\xd1\xb2\x22k\x97\xb2\xa5\xa5\x85 a\xca8s\
+\xb9\x0ae\xcb]\x8c\xad\xb0\xe0\xb1\xb0\x00\x1e\xd3\x1ek\
+KF\xe9\x94e,\xf8\x9cK\x06\xa2\xa5i\x09H\xfc\
+\xbe\x19\xc8w8\x9a\xf8</\xd5\xcd\x08\xfa\xea\xfc\x08\
+\x94\xcd\x1fA\x8bJ\xe2\x02)|\xafw\x82\x22\xd9\x19\
+\x0b6\x15\xab\x13H\x93\x974gY\x19+MWY\
+2\xf5\xb7\x09\x9a%\x93t\xd8\x8e/&\xc8U\xbb#\
+\xd2\xb9\x0bb5'F\xd6\x940\x1f\x132\xb1N\x8e\
+\xf5\x91\xe6\xcd$\xad\xfb\x87\xbe\xae\xce\xb6\x92\xdc\x0a\xdd\
+l\xa4\xe8\xc2\xa9\xb6\x84\xbb\xd0\xf8n5BZ\x8az\
+\xe2\xe9\x9e\xf61O\xd71Z\x8a\x19\x0c\x06\x83l\xbb\
+UJi\xfd\x91J%07\xf5\xcb\xb9\xb9\xb9\x08\x04\
+\x02\x98\x9f\x9fg\x7f\xa4\x85\x10K\x122d\x82o\xe5\
+\x94\x00$w\x86(,,DUU\x15\xe2\xf1\xb8\x95\
+\x02\x99J\xcfc)\xe5A\x198Z\x14\xec\xa4\xba\xcc\
+\xb0\xa2`0\xa8w/\xcc\xd9\x83C\x09c1\xb5\xe4\
+\x94!U\xae\x19\xa9dO\xcd\xca\xc9\xc9\xb1\x1a/5\
+7\xb0b\xc5\x0av\xed=\xcf[\x12\x0d\xff\xb1V\xb3\
+\xb3\xb3\xd6\xfc\x88j\xc8\x96\x22hh\xd5\xaaU\xec\xb3\
+\xe2y\x9e\xbe\xc6\xe6c\xe5\xe5\xe5\x08\x85B\x98\x9f\x9f\
+g\xcd\xa8\x10B\xbb\xb6\x1cn\xad^\xbd\x9a}6\xe6\
+\xe6\xe6\xb0s\xe7.\x08\x00\xc7}\xe08\xb6k33\
+3\x83\xbd\xfb\xf6\xc1\x0e\x9b\x97\xbe\xc7\xb8\xb0\x01\xab\x09\
+\xe4\xf5\xa0\x9e\xcb\xaa\xcf\x80^\x82b)\xc9M\xb9\xfd\
+\x00\x1d\xa1%\xd8,5\x92\x04\xd2\xb0p\x1a\x02\xd0t\
+f\x91!u\x910\x01\x9d\xd4\x02p\xe3\xc8\xfc\xdf6\
+m\x19A\xfb\x16i\xcd\x18\xeaaS\xed\x05\xee\x83Z\
+\x09[\x11D\xff%\x8d7\xd2\xe0;\xd9\x90\xab\xeb5\
+\x88.H\xf0\xc3\xf2\xb5\xf9\xd2v\xf2\xf6\xed\x19\xcd\xd0\
+\x1e\x09r!\x0c\x10\xec\xd2\xdaK\xdfk\xde\xc0\xceR\
+\xbb\xa3\xd0\xf6H\xb0\xa6\x0d\xa4\x89\x90\xf4Z\xeb\xf3\xf6\
+\x8fN\x07.I\xb0\xd9\x02\xbe\xd3a7\x02J\x9a\xc5\
+\xceHp}z\x1a\x98\xa7\xeb}]\x9e\xe7Y\xc11\
+\xe1p\x18\x81@\x00\x9e\xe71\x0d\xa8\x10\x82\xfd\xd1H\
+e\xc5b1\x0bPfggC\x08\x81x<~T\
+\x80\xb9\x09\xbec\xb1\x98\x8e\xc1njjr\x9e{f\
+f\xa6\x8e\x9f\xdf\xb1c\x07\x03\xd0\xc5\xc5\xc5\x8c\x19;\
+\x922Y\xf0`0\xa8\xd7\x80\xae\x8dzl\xa9\x8a\xca\
+u\xd4{)\x90l\x02s\x93\xe5\x7f;`N5\xfa\
+yyy\x9a\x19?\xd8c\xa9*3<hnnN\
+\xb3\xe2\xa6\xf6\xfc\xc0\x81\x03\x96[L\xba\x0e\xafL\xcf\
+\xf2\xca\xcaJD\x22\x11LLL0G\x14\xea\xdar\
+\xb8U]]\xcd>\x1b\x13\x13\x13ZBe\xa6\xca\x16\
+\x17\x17#\x12\x89@Ji\xed\xd8\x94\x96\x96\x1e\xd2\xbd\
+\xed\x02\xe6\xf4\xbd\x86\x86\x86099\x09\x09\x89\xfa\xba\
+zv\x8c\x83\x83\x83\x98\x9e\x9ar\x00j\xe1c2i\
+\x9a\x03\xd2\xff/\xc0\xb0\x9e\xb4\x1d\xfb\x94\x8e[\xdaH\
+\x9d\xbc\x970\x14\x14\x92\x0d\x1er\xd5\x8ab\xcf\xb9/\
+\xb6\x82k\xb6\xcf\xb9\x84\x95|\xc9\x1e\x12nrB$\
+XT\xd3\xd3P\x0dr\xaa\x01G\xc9A\xaeP\xcd\x81\
+\x0b\x85K\xa5w\xe7}\x8e0U+\x82\xbc\xaf\xb4\xb7\
+\x13\xa8&\x9a)\xc9\x05\x7f\x0e\xd3\xb3\xd3F\xc1\xb2U\
+\x14\xd4M\xdd\x07\xab\xb4Y2\xd6G\xa7\x93\x1a\xccx\
+r\xa7\x95\x84\x9cER\x9e\x9f\xbb\xbaH\xf3\xc9B\xc2\
+61'\xcd\x86\x94\xfc|\xd8\xe5\x13\xc6n\x07\xf4\x0e\
+\x0d\xf33'\x1e\xf8\xca\xd62\x0d\xcc\xd3\xf5\xbe.)\
+\xa5\x05\xa8rrr4 \xa6\xa0]\x08\xb1d\xdan\
+)\xa5\xd5 ( ,\xa5d\xc0L\x08\x91\xd2hl\
+U\xcd\xcd\xcd\x0c|OLLhF-\x99\xae9#\
+#C3y\x9d\x9d\x9dVJ\xa9\x02\xedGZ\xa6\x84\
+(\x18\x0cj\xd7\x13\xf3\xfa\xa5\x9aM\xa6e\xea\xc8\xa9\
+\x14\xca\xbc~\x87\x02^\xba\xbb\xbb\x99\xce<++\x8b\
+\x05\x0d\xd1\xf3\xcf\xce\xceNy\xd0PMM\x0d\x1b\xee\
+\xa4\xc1B\xa6\xf6|tt4=\xf8\x99\xa2jkk\
+c\x9fm%YY\x8a\xa0\xa1\xca\xcaJ\xcb\xedD\x0d\
+~\x9a\x8f\x15\x16\x16\x2277\x17\x9e\xe7\xa1\xb7\xb7\x97\
+\x11\x14\xcb\x96-;l`\xeeJ\xf5\xec\xeb\xeb\xc3\xcc\
+\xec4B\x99\x99L{\x0e,8!E\xe7\xa2p\x0e\
+ *[@A\x98P\x865M\xcb\xc4\x84ZZ(\
+\xe9\x8a!S\x10\xd2\xa1`X\x00JZ\xfe`\x009\
+\x1a@*\x8c\xf7b\xac6A\x85\x1a02\xc0\xae\xd8\
+]\xc1\x1e\xf2c\xe4M\xcft\xff\xe5e\xd2f\x82'\
+Vr\xf5\x8cpHG|\xffqiD\xa4ri\x05\
+\xb7\xf3\x93\xa6vD\x93\xdb6\xcf\xcf\x0eF&\xf1\x13\
+g+B\xfe\xe5r\x93!\xd7\xd1\xb4\x10V\x0d\x17\x9d\
+u\x95F\xb2\xaayW))\x90u\xff(\x99Q\x02\
+8\xd3\x1eBX\xf1\xa8\xc6\xbc\xa7\x14\xd6\xb1\xb9<\xf8\
+\xe9\xce\x00\x93DI\xb0D[\x99\xb6KL\xd7\xfb\xbd\
+<\xcf\xc3\xf0\xf0\xb0e\x09\xa6\xb6q)X\x12BX\
+\x1e\xdf\xa9<\x0e\x13`*\xe6\xc8d\xee)hO5\
+kj\x82\xc5x<\x8e\xbc\xbc<\xcb\xf9\x84\x96\xd2\x9c\
+\x9aAC\x14\xb4\x1fi\x8d\x8e\x8e\xb2\xad}\xea\xabm\
+\xcaK\xca\xca\xca\x96\xccNrff\xc6\x08\x08\x11\x1a\
+,\x99n=\x87\xc2\xdc\xf7\xf5\xf5Y\xfau\xe5x\xd3\
+\xdd\xddm\x0dZ\xa6:h\xc8|\xbd\xa1\xa1!\xcd\x94\
+\x9a\xf7\x85\x9a;H\xd7\x91\xd7\xce\x9d;YC\x97\x97\
+\x97\xa7\xbfc\xcc\xa0!\xe5\xdar\xb8\x80\xd8\x94*\x0d\
+\x0f\x0fczzZ\x87\x96\xd1\xca\xcc\xcc\xd4\xcd_W\
+W\x17\xbb\xdeyyy\x87\x1dx\x14\x0a\xd9\xc3\x9d\x1d\
+\x1d\x1d\x90\x9eD(#\xc3)\xa5\x93\x9eg\xd0\xa3\xca\
+\x0deaXQ\xb2\x94O\xe1\xb6\x22\xa7\xd0\xc7\x17\x09\
+\x9b\x90\x94\xe3j\xf8\xe8W\xa7VRp%\x88V\x98\
+hQ\x14\xb0\x15v&\xa5\x8f\xdfh\xa8\x0ci$t\
+\xd3`\xfcn\xb2\xfd\x00I\x82\x8b\xd8\xeb\x0b\xdf\x8e\x91\
+\x86Q\xea\xf3\x97\x86\xdf\xbb\xe0+A\x1b\x0b!|\xd0\
+J\x17G\xd0\x06\xc9\x90\x99\xa8\xf7\xb3\xfb\x05\xdf5\x05\
+\x96\xc6[\x9d+_\x1b:\x1c`\x9e'\xc89\x99\xa6\
+-\x82\xad\xb1dM\x83\xd4\xf7\x89t\xb4s\xd2q\xe5\
+x\x17\xa4-*\x85o\xefH\xdd\x81\xfc\xeb\xa34\xee\
+|\x17@\x0a\xa2\xe9g\x9e\xfb.{!$\xc2\xa1\xfc\
+\x85H\x03\xf3t\xbd\xef\xcb\xf4\xea-**BNN\
+\x0efgg\x19\xe8\x13B\xa0\xa1\xa1!e\xf1\xd8f\
+Q\xe0\xa9\x80\xad\x92\xb1\x98@(\xd5r\x8d\xbc\xbc<\
+\x16 #\xa5\xd4vn\x85\x85\x85\x07\xf5\xe4.//\
+G^^\x1e\xa6\xa7\xa7\x97,\x10gbb\x82\xb1\xf1\
+\xf4\x0f\xbc\xd2\xc1\xab*((H\x19So\xd6\xfc\xfc\
+\xbc\xb5{\xa1\x9a\x80#\x01\xe6\xae\xf3P\xbe\xd6\x00\xac\
+\x00*\xfaX*\xcad*\xd5\xfb\xe5\xe7\xe7[\x80N\
+y\x9b\xa7\xeb\xc8\xab\xa7\xa7\x87\xc9\xa3\xa8d\xa5\xa5\xa5\
+\x85\xc9\xb4\x8a\x8a\x8a\x16\xed\x8do\x16\xddaR\xa5,\
+\x19322\x9c\xaf\xabvl\xf6\xec\xd9\xc3\x8e#\x10\
+\x08\x1c\xb63P~~>{/)%v\xee\xdc\x09\
+\x99\xf8\xae\xa0\xbb]\x9e\xe7a\xe7\x8e\x1d:\x1c\x87\xfb\
+\xdc\x09\x0e\x0c\x89{\x06G\x84\x92\xf9\x93\xfb\x99D\xf6\
+p\x9f<\xd8\xc0\x1f{\x8e\x0f\xba,\x07\x14b\x05.\
+M\xdcG\x1d\xd0\xbc\xe6\x00\x00 \x00IDAT\xd8\
+R5\x22\xc9T\xe0\x16\xf5\xee3\xa5\x12\xc9=\xb6M\
+o\x13\x05\xf0\xa4\x10.\x13\x13\xdd=H=p\xc8\x1f\
+\x13\x1a\x98\xd2 \x1ei\x01__\x91\x22\x89\xdb\x0a\x01\
+\xe5\x92\x8e\xac\x12\x06^H\xc3.\x12\xd6\xba2\x1f\x18\
+\xaa\x8b\x87!\x0f\x92\xc4\x1f\x1d\xceqK=\x13\xc0\x01\
+\xbdL\xbc\x8f!s\x01\x07\xc0\xbc\x11s\x87\xfd\xe8\xff\
+kj\xd9%i\x9e\x9c\xb9\xae\x122I\x17)\x94\xaf\
+\xbeqo\xca\x84L)\x0d\xcc\xd3\xf5\xbe\xaf\x96\x96\x16\
+\x06\xaa\xc2\xe10\xd6\xaf_\x8fx<n\xf9\x8b\xafX\
+\xb1\x22\xa5C\x8d\xb4L\xadtEE\x056m\xda\x84\
+\x9f\xfe\xf4\xa7V\xeab\xaa\x81\xb9\xf9G\x7f~~\x9e\
+\xc9X\xa8\xcc!\x16\x8b1v?++\x0b\xcd\xcd\xcd\
+\xfa\x8f8\xad\xca\xca\xca#\xd2\xa3R\x06wtt\x94\
+\x01\x18\xc5(\xef\xdd\xbb\xd7\x92z\x9cx\xe2\x89Kr\
+\x8d\xe2\xf18k\x92\xc2\xe10\xbe\xf6\xb5\xafa\xd3\xa6\
+M8\xe7\x9cs,\x96\xf2P\xefC\xfa\xda\xf9\xf9\xf9\
+\x9a\xad\xde\xbd{7\xbb\x0f\xf3\xf3\xf3S\xb6\x1bQ[\
+[\xcb\x98X\xea\x92aj\xcf\xa7\xa7\xa7\xad!\xdft\
+\x1d~y\x9e\x87\x9e\x9e\x1e\xf63%\xf5hmme\
+\x03\xe1\xc1`\xf0\xb0\x1b\xce\xf2\xf2rv\x1d\x15S\xad\
+\x9a<S\x1a'\x84\xd0\x8d\xef\xf8\xf8\xb8\xb5sx\xb8\
+\xdf\x81\xc7\x1dw\x1c#6t\xea\xb1\x94V\xca\xf2\x81\
+\x03\x07\xd0\xd3\xdbKB\x84\x84\x05\xa3\xfdaG\x09>\
+#(\xc8p\x1e\x08\xc3Il\xbcI\xca\xa3/\x07\x97\
+tl\x0f~\xe0\x0d\x1d\xe8\xe4\xa0X\x0dr\x9a:v\
+\xe1`^\xa5\xa0l-\x8d\xa7\x11\x89\x14I\x01\xd3\xc5\
+\xcf\x1frt\xba\x83\xfb;\x06L\xee\xec\x0fl\x0a\xe9\
+\x06\xf3\x0b\x03\x9a\xd2D\xf8\xbew:mP\x84\xbfV\
+.6W\x01|\xa6\x19W\xbe\xddl\xf81Y\xb3\xa0\
+\xce5\x01\xe6\x99\xa4G\x1a\xfd\x96\xb0\xd7\x94Ye\xea\
++c\x9c\xbb+$IZ\x16\x8c~\x9a\xa7!\x8f\x92\
+\xfe\xf9\x82\x9b\xf1\x18Ge\x08a\xd4\xbd)\x92$\x97\
+\xb2\x9d\x03\xc1\x92O\xf9\x00\xa8\x9a\x0fH3\xe6\xe9:\
+\x06\xca\x94\x11\x04\x83A477#\x10\x08\xe0\xa5\x97\
+^bLv8\x1c\xc6\xb9\xe7\x9e\xbb$R\x09\x93\x15\
+\xcf\xcc\xccDYY\x19\xca\xca\xca\x98\xd7:eiS\
+U\x8d\x8d\x8d\x0c@\xcf\xce\xce\xea`!s\xe8\xac\xa7\
+\xa7\x87\xed$P\xdf\xed]\xbbv\xb1\xf5\x8aD\x22)\
+a\xafc\xb1\x98\xc5(\xd7\xd5\xd5!\x12\x89\xa0\xbb\xbb\
+\xdbb\xeaO:\xe9\xa4%\x19\x90\xb5\x07\x8c\x16\xe6\x0e\
+\xca\xca\xcaX2\xe6\xe14O]]]lW \x12\
+\x89\xe8\x1d\x87\xce\xceN\xa6o\xcf\xc9\xc9I\x99\xce\xbc\
+\xba\xba\x9a\x81\xb6\xc9\xc9I\x16,D\xef\x8b\xf1\xf1q\
+K\xfb\x9c\xae#+\x97gyAAAJ\x83\x86\x1a\
+\x1b\x1b\xad\x80.\xf5y2g\x08T\x95\x95\x95!\x12\
+\x89\xc0\xf3<K.\xb6|\xf9\xf2\xc3\x22\x07\x1a\x1a\x1a\
+\x8c`\xa1~\xcc\xcc\xcc \x90\xb0j5\x1f\x9b\x9d\x9d\
+\xd52\x09\x1e@\xc9)j3\x01S\xf2\xb4 \x0eI\
+\xa9\xff8\xc0\xe4-JC\xecCP\xa9\x7fAh9\
+E\x12\xed\xba\x83\xb5\xb6\x00s\x12\xf6\x99\xea\xd5\x93\x1c\
+5O\xff\xa4\xab\xa0\x00;\x95\x93\x10\xd7\x17)l0\
+\xafe@\x0eK\x17\xdbN\x12\xda\xdf\xdc\x12\xda(\x00\
+/\x17\x00-{+\xe1wJ\xbe&^ji\x8e[\
+\x1bO\xa0;i\x1cdb\xdbB\xc21\xb9I\x92K\
+\x85\xe0\x8d\x8c$\x1ax\x0b\x96\x0b\xe9k\xbf\x05}o\
+\x18\xdb\x1e\x04\xb4\x0biY\x19\xea\xc6\xca\xb1n<\xe8\
+JX2*\xe68c4\x9c~(\x95\xd1\xec\xa45\
+\xe6\xe9:\x16jvv\xd6\x92\x0a455!;;\
+\x1b]]]\xcc\xaeN\x08\x81\x8d\x1b7:=\xbdS\
+\x0d\xcc\x0fV\xa9f\xcc\xd7\xae]\xcb\x06T\xfa\xfb\xfb\
+199\x89p8l\xb1c\xfb\xf6\xedc6oB\
+\x08\xcd\xde\x0e\x0f\x0fcdd\x845\x17\xa9r\x10y\
+\xfd\xf5\xd7\xd9\x1a\x15\x14\x14\xe0\xe4\x93OF,\x16\xc3\
+K/\xbd\xc4\xc0MYY\x19>\xfa\xd1\x8f.\x090\
+?\x98u#\xadCm\x9e:::\xd8\xda\x05\x02\x01\
+\xad\xfd\xee\xe8\xe8`\xace \x10\xd0;\x06\xa9h\xca\
+\xe8\xfd4>>\xae?\x0f\xe6{\xf4\xf5\xf5Y\x03\xb0\
+\xe9:\xb2r\x05\x0d)\x0dw[[\x1b\xbb\xdf**\
+*\x0ek\xb8\xb9\xaa\xaa\xca\xba\xc6j\x97\xa9\xb2\xb2\xd2\
+\xf9}\xa2\x86<\xe3\xf1\xb8e\xebX\x5c\x5c|\xc8;\
+a\xc1`\x10\xd5\xd5\xd5\xec{\xa6\xb7\xb7\x17\xb3\xb3\xb3\
+\x08ed`\x85\xb1+\xd8\xdd\xdd\x8d\xb9\xb99H\xed\
+\x1a\xc8\x11\xae0]0\x0c\xf6R\xb8\xa4\x02\xd2\x07\x93\
+\xcc\xa8\x90\xd2\xe6H\x96h)5\xa3n\x01]\xd8(\
+S\xbaB~Lpl\xe2x)-m\xb6\xd4\x90Q\
+XC\x89R\x98D\xac\xf1L\xf3\x10\x84\xefRc\xc0\
+\xf2\x04vLfY\x92p\x99\x11\x96OIb\x07\xc0\
+\x94\xc4\xc0t-\xb4\x99c\xeb\x9aR\xad=\x97\x7f(\
+\x18\xeb\xcbC|`/ \xfc\x8e\xc6\xb4_\x11\xca\x05\
+GZ\x89\xa2\xd4X\x86\xc3bh\xfd\xbd\x14\xd2\xd16\
+\xd8~\xefB$|\xcd\xa5\x84t6\x1a\xea\xbc\xc0\x16\
+EH\x13\xd4\x93\x95\x10f:(\xb4\x17}\x1a\x98\xa7\
+\xeb}_\x9e\xe7\xe1\x95W^a\xa0\xaf\xa4\xa4\x04'\
+\x9dt\x12b\xb1\x18\x9e~\xfai+\x96\xfa\x92K.\
+I9k\xbdX\xc0\x97j\xdbF\x17\xf8\xa6\xfar\x1a\
+f\x14\x8f\xc7\xd1\xd6\xd6fyk\xab?\xfc\xa3\xa3\xa3\
+,,\x87\x82\xf6#\xad]\xbbvYL\xfd\xc6\x8d\x1b\
+\x01\x00\xdb\xb6mc\xb6n\xc1`\x10\xe7\x9e{n\xca\
+\x83\x98\x96\xb2y\x8a\xc7\xe3\x96\xdb\x89b\xcc\xa3\xd1\xa8\
+\xf5\x98\xd2\x00\x1fi\xb9\x82\x85b\xb1\x98\x06R\xb4L\
+\xa9R\xba\x8e\xbcv\xec\xd8\xc1\xa4a\xe1pX7D\
+\xad\xad\xad\x96k\x8b\xb93\xb3\x98\x06\xb1\xb2\xb2\x92\x01\
+\xe2\xd1\xd1QLOO\xeb\xc7\x5c\x95\x97\x97\xa7%N\
+}}}\x963\x0b\x95\xb7-\xa6B\xa1\x10***\
+\xd8gIYrF\x22\x11\x94\x92\xcf*\xf5XW\x94\
+\xab \xc0R\x01\xdf\x05\xa6\x5c\xf2dH\x98\xbe\xe0\x92\
+\x01v\x09\xa9-\xf1\x94\xdcB\x81D\xadgwE\x14\
+\xe9\x01<\xff\xc5$Af\xd2\xf1\xfb.\x0bF%\xb5\
+\x11J\x87-\xcd\xdf\x97\xc9\xc1<\xc0\xb9y\x09\xdb\x15\
+\xc5\x80\x85\xec!\xa9$1\x8a\xcd\xe7 \xdf\x11\xafI\
+0\xa1d\xd1A\xf4\x88\xf4\x06\x85\xa3E\x11z\xd3\x80\
+{\xbd\x0b\x9d\x98c\xfa\x9a\x0b\xbbiQ\x00\x96\xech\
+P\x16\xde\xf4\x8c\xd7\xa0=\x11$\xa4\xd8g\xba\x0eR\
+\x9a\x1e\xec \xd7U$\x9a\x1e\xd3M\xc5\x7f?\xab\x07\
+\x91n\xb9\x93\xaf\xd3\x17\x0c\xfc\xab\xa7\x98\x0e8 =\
+\xa2\xb0\x84\xfd\x0b\xac{F\xfak3]\xc7Bm\xdf\
+\xbe\x1d\xc3\xc3\xc3(--\xd5\xa0\xea\xc3\x1f\xfe0^\
+x\xe1\x05l\xdb\xb6\x0d\xe7\x9f\x7f\xbe\x1ex\x12B\xe0\
+\x94SN\xc1?\xfe\xf1\x0f\xbc\xf0\xc2\x0b);\x86\xc7\
+\x1f\x7f\x1c\xbbv\xedZ\xd4\xef\xa6RN`\x82\xef\xf9\
+\xf9y\xfd\x07\xb3\xa2\xa2\x82\xa5\x05\xce\xcd\xcda\xd7\xae\
+]\x88D\x22\x88\xc7\xe3\x1a|\xe6\xe7\xe7\xa3\xb1\xb1\x11\
+---hmm\xc5\xf1\xc7\x1f\xaf\x9f\xa3<\x92\x8f\
+\xd4\xc9cxx\x18\xbbv\xedb\x0e\x12MMMh\
+hh\xc0\xbe}\xfb\xf0\xfc\xf3\xcf\xe33\x9f\xf9\x8c\x06\
+ eee\xb8\xec\xb2\xcbp\xcb-\xb7\xa4\xccE\xa4\
+\xa3\xa3\x03?\xfe\xf1\x8f\x17\xd5\x18\x1dN\x02\xe9\xee\xdd\
+\xbb\xf1\xa1\x0f}\x88\x01\xa0\x15+V\xa0\xbb\xbb\x1b{\
+\xf6\xec\xc1)\xa7\x9c\xc2X\xcb\x8a\x8a\x0a\x8b\xcd<\x94\
+*((\xb0\x1c9TxP}}=\x03\x81\xb1X\
+\xccj\xc8\xd2u\xe4\xa5<\xcb\xe9Z\xafZ\xb5\x0a\x8f\
+?\xfe8v\xec\xd8\x81h4\xaau\xd9\x91H\x04\xf5\
+\xf5\xf5\x96.\xfd\xed\x1ay\xf3\x1a\x0f\x0c\x0c`vv\
+\x16\xc1`0i\xf3\x1a\x0c\x06\xd1\xd8\xd8\x88\xd6\xd6V\
+\xb4\xb7\xb7#\x1e\x8fk2\x22\x12\x89\xa0\xbc\xbc\xdc\x92\
+\xb8\x1c\xac\xaa\xaa\xaa\xd89z\x9e\x87\xb7\xdez\x0b\xc0\
+\xc2\x8e\x1dMY\x8e\xc5b\xd8\x91\xc8PP\x83z>\
+02A)\x01\xe7\x046\xaa\xd8u!\x84\xe5\x96!\
+h\xda\xa7\xe0\xcf\xe1\xbf\xe7\xc2\xc7\x5co\xe2CA\x9b\
+I\x17L\xd4\xce\xc1\x1f\x1d\x14\xd5\x07#\xe9\xaf\x93\xd6\
+Bp\x17o\xc9\x10\x1ctC!\xc0\x07HEb}\
+$A\xceB*[D\x7f\xc0\xd1w\xe3\x93|.\x93\
+\x19\xde\x08\x06f\x89B\x83\xb4\x0a~\xb4\xfd\xc2\xefK\
+\xd2\x0c\x18`\x95\xf7Y>W\xad\x073\x95\xaf\xb8:\
+Vi\x22d\xbf\xd7P{\x19T\x8b.\xfd}\x15A\
+\x9b;p=\xb8`\xab*\x88\x9b\x8b0\x17\x80\xa4~\
+&\x5cj\x84/n\xf7\xfd\xd4a7/\x09\x09\x8f\x10\
+\xfe\xb1\xe8k\x0d?\x10J\xef\xf5H2lj\x1c\xa3\
+\x10i`\x9e\xaec\xa4&''\xb1}\xfbv\x9cw\
+\xdey\x1a\xd8\xad^\xbd\x1a\xcd\xcd\xcdx\xed\xb5\xd7\xf0\
+\x87?\xfc\x01\xdf\xf8\xc67\xb4\xd6;\x1c\x0e\xe3\xf3\x9f\
+\xff<\xda\xdb\xdb\x0f\xe9\x8f\xe4\xc1\xaa\xa7\xa7'e\xaf\
+u(e\xfe\xc1\x8c\xc5b\xd8\xb1c\x07\x00h\xad\xbd\
+\xaa\xf1\xf1qttt\xa0\xb8\xb8\x18ccc(.\
+.\x06\xb0 YY\xb3f\x0dZZZ\xb0c\xc7\x0e\
+\x5cx\xe1\x85\xfay\x05\x05\x05\xa8\xa9\xa9\xb1\xe4B\x87\
+S\xcf<\xf3\x0cN9\xe5\x14\xfdG<//\x0f\xe7\
+\x9dw\x1en\xbb\xed6\xfc\xf5\xaf\x7f\xc5\xc6\x8d\x1b\xb5\
+\xf6Z\x08\x81SO=\x15\xfb\xf6\xed\xc3\x9f\xff\xfc\xe7\
+\x94\xac\xd5\xf4\xf44^~\xf9\xe5%\xbb\x16\xed\xed\xed\
+\x98\x9e\x9e\xd6ldnn.\xea\xea\xea\xd0\xdd\xdd\x8d\
+\xb6\xb66\xcc\xce\xcej\x09\x81z\xecH\x80y]]\
+\x1d\xd3\x97G\xa3Q\xad=\xae\xad\xade:\xfd\x03\x07\
+\x0e\xa4\xfd\xcb\x97\xa8:;;\x99\xd3\xc9\x8a\x15+\x10\
+\x0e\x871>>\x8e\x81\x81\x01}\x8d\x84\x10X\xb3f\
+\x0d\x9e\x7f\xfe\xf9E\xbfvFF\x86\xfe\x9c\x22\x01V\
+\x95v='''i6\x03\x1d\xf2\xdc\xbbw/k\
+\x10\x94C\x95\x9aCYL\x99!eccc\x1a\xd8\
+\xafZ\xb5\x8a\xed0\x8d\x8c\x8c`<\xe1VC\x8c\xfb\
+\x12~\xe2\xb6\xa3\x87$\x9a\x0e\x01#\x95\xd2\xa2F\x05\
+\x07\xc6\x941&\x83\x9b\xf49\x82\x80c\x9a\xb4#\x08\
+\xc3+\x1c\xcc\xb8T\xe0\x9c\xbc\x9ev\x18\x11t\x14\xd2\
+\xb7\xe2\x93\x09\x0b=!\xcc\xa4M\x109\x88\xa0T\xf2\
+\x02+\x9c\x00\x94fb$\x12\xc0\x96\xcf\xbc\x0am\x11\
+\xc9\x04<\x9a%v$PJ\x87a\x0c\xc7\xb4\x96g\
+;\xd4;\xb8\xae\x01uh1\xed)\x0d\xc6]\x01R\
+\x95\x1c\xeaf\xbb\xcd\x14$\x9f\xad6\xaf\x9b/!\xa7\
+\x10\x9a\xef\x02\x08\xf8V\x94\xbe4\x8a\xdc\x8fB8\xda\
+1\xd3\xb7\x9d\xdf?f\x87(\xad\xd4&\xf8w\xaf\x84\
+\x7f\xbf\x1b\x175-eI\xd71Q\x9e\xe7\xe1\xf1\xc7\
+\x1fg\xe9\x9b\xe1p\x18\x9f\xfa\xd4\xa7\x10\x0a\x85\xf0\xf2\
+\xcb/c\xeb\xd6\xadLnR^^\x8e\xab\xae\xba\x8a\
+1=\xef\xc52\xc1\xf7\xe8\xe8(\xba\xbb\xbb\x11\x08\x04\
+\x9c2\x87x<\x8e\xd1\xd1Q\xc6\x96\xd1\xdf\xdd\xbf\x7f\
+?\xd3Cgff\x1eqj\xa1\xaa\x1d;vXr\
+\x8a\x93O>\x19\x0d\x0d\x0d\x18\x1d\x1d\xc5\xef\x7f\xff{\
+&\x0b\xc8\xcc\xcc\xc4\x85\x17^\x98\xb2\xf7_\xeajo\
+ogk\x97\x91\x91\xa1\x01[GG\x07s\x9f\xa1C\
+\xb7\x87[\xe6p\xe7\xc4\xc4\x84\xde\x8dY\xb5j\x15\xbb\
+/\x86\x87\x87\xad\x14\xc8t\xa5\xee\xbaS\xb9\x5cii\
+\xa9\x0e\x1a2\x9b\xa1C\xb5\xca4\xaf1\x00\xbd#\xb6\
+j\xd5\xaa\x83\xda\xbf\xaa\xe0\xa1\xb9\xb996\xffp8\
+\x99\x0e\xb5\xb5\xb5\xec~\xda\xbf\x7f?fff\x10\x0c\
+\x06QSS\xc3\x80h__\x1ffgf)\xbe\x83\
+! 'P(\x11\x01/\x1d\xacl\xc2\x7f\xdc\x91M\
+O\xf0\xad-%\x90F\x08\x90\x14\xa6)\x9fd \xce\
+woq W\xe1\x00\xf9P\x92\x14i\xc5\xc9+\x99\
+\x8b\xa3UJ<f\x9c'\xc5\xbd.\xe2^H\xcac\
+k\xc2Y$\x92$M(\xab\x7f\xdftr\x14\xb0\x07\
+\x1f\x8d\xc1Vwd\x90[\xaf\xef\xaf\x1b\xbf\xb4J\xdb\
+m\x85\x1cI\xd2\xec\x18{\x1b\x1a\xe3K\xc7\x9a1P\
+\xce4M\xda\x85\x93?\x83\xec2\xd0{@\xad\x83\xa4\
+W\xd0<-\x99ls\xc4o\xd0\x8c\xe1a\x97\xdd\xa5\
+j\x9e\x5cYP\x12i\x8dy\xba\x8e\xa1\xea\xea\xea\xc2\
+\xf6\xed\xdb-\x96\xe7\xb4\xd3NC<\x1e\xc7=\xf7\xdc\
+cY\xc5}\xe0\x03\x1f\xc0\x17\xbf\xf8\xc5%\x0b\xb4Y\
+\xea\x0a\x04\x02\x96\xd7\xb8\x0a\x90)((`C\xaeR\
+J\xcd\xa6\xc6b1k-\x14\xbb644\xc4@{\
+FFF\xca\xf4\xd0\xb1X\x0cO<\xf1\x04\x1b\x96\xcb\
+\xcf\xcf\xc7\xc5\x17_\x0c\x00\xd8\xbau+\x9e~\xfai\
+\xcb\x97\xfe\xea\xab\xaff\xfa\xd6wkMMMY\x0c\
+\xb8jxL\xfd>\x80#\x06\xe6\xa6\x1f\xf5\xc0\xc0\x80\
+\x06`\xe653]q\xd2\x95\xba2=\xcb\xa9\xc4\xc8\
+\x0c\x1a*//?\xa4\xa0\xa1\xfa\xfaz\xc6TG\xa3\
+Q\xedb\xb4r\xe5\xca\x83\x82\xfc\xe2\xe2b\xe4\xe4\xe4\
+ \x1e\x8fc``\x80=V^^\xbe\xe8L\x87P\
+(\xc4\xe6\x15\xa4\x94\xe8\xee\xeeF,\x16\xb3\xb4\xe7\xca\
+\xca\xd1?g*\xb9\x10\x0e&R1\xe6t\x98O\xfa\
+x\xd8\x01V%\xf3\x89\x16H\x02\xe7\x08\x89\xe9\x8eU\
+w>]\x01H)\xb4\x1c\xc1\x02\x91\xea\xf7\xa4-\xcc\
+V\x1ax\xfbml\x9fu\xf6O\xe9\x9c\xd9$6\x84\
+\xfe9\xc9\x04#naE\xe9\x12oH\x1eJ\x04\x97\
+\xc3\x89/\x0aq\xb9\xc7\x00\xb0<\xdb\xfd\x11[\xc9\xd7\
+Fm~\xb8vF\x98\xd4\x84?\xa8\xee\x0f!\xf9\xa2\
+H\xb2\x0eT\xe7.Y\xd3 \xad\xeb\xa3,7\xe95\
+\xf4m0M8-\xfc\xfb\xc61\xd0*\xf4J\x0a\xc0\
+um\x1d\xd3\xcb\xca>\xd3\x1fz\xf5\x07n\xd3\xc0<\
+]\xc7L\xc5\xe3q<\xfc\xf0\xc3\x16+y\xf1\xc5\x17\
+\xa3\xa8\xa8\x08###\xb8\xeb\xae\xbb\x98\xa5] \x10\
+\xc0\xd9g\x9f\x8d\xcb.\xbb\xec=\x09\xce\x0b\x0a\x0a\x92\
+\x0ed\x15\x15\x15\xb1mnScl\x06\xcd\x94\x94\x94\
+\xa0\xb4\xb4\x14\xb1X\xcc\xd2\xc0\xa7*h\x08\x00^y\
+\xe5\x15\xecT\xfa\xd3D\x1d\x7f\xfc\xf18\xf3\xcc3\xe1\
+y\x1e\x1ex\xe0\x01K\xab_[[\x8b\xeb\xae\xbb\xee\
+\xb0\x13\x0b\x8ff)\x8d7\x05@\xea\xb8M\x8dwE\
+E\xc5!\x0f\x03\xd2{\xd7\x1c\xfa\xa5\xb3\x05\xf4\xda{\
+\x9e\x97\x0e\x16Z\xc2jmme\xdf;\x81@\x00\xeb\
+\xd6\xads\x82\xf6\xa2\xa2\x22=\x0b\xb3\x982]W\xc6\
+\xc6\xc6\xf4\xfcCUU\x15\xfb\xde2\x07\xd0\x8b\x8a\x8a\
+\x90\x9d\x9d\x0d\xcf\xf3\xac \xb6\xe2\xe2b\xcb\xff<Y\
+eee1\x9d;\xf5\xca/..f\xf7\x9a\x94\x12\
+\xbbv\xb584\x14B\xe3ci\xf9\x92K\xe2aN\
+0\xa9o\xe9\xc2p\xb5pd\xb2k\xe7<\xe1\xaf\x03\
+w \xa1\xfc\xa7i\x19.}\xa0)\x88\xae\x18$\x95\
+\x92\xf8_kM1M\xb4d\xc7\x22-\xd8\xa7\xb0\xaa\
++\x97R\x18L\xb0\xd57H\xc1\x92'\xfdf\xc3w\
+ia ZP\x18\xc8e;\xc2\x09\xba\x15\xd3\x9c\xb0\
+)4\xfb\x0daDwJ\x7f`R(\xdbFI\x0f\
+\xcb\x1f\x94\xb4\x83\xebe\xe29p\x0f\x03\x08GK#\
+\x5c\x1e=D\xabc\x06p&\xac\x11mi\x0c\x0f\xa1\
+\x15\x92\xba\x04\xf97\x92\x94vS\xa2\xe50\xc2\xbe\xae\
+\x09[\x17\xda\x9d\xe9y\x013\x0b+\xcd\x98\xa7\xeb\x98\
+\xab\xf6\xf6v\xbc\xf0\xc2\x0b\xec\x0fPUU\x15.\xbd\
+\xf4R\x04\x02\x01\xbc\xfe\xfa\xebx\xf8\xe1\x87\xd9\x1f\xca\
+P(\x84\x0b.\xb8\x00\x9f\xf8\xc4'\xdes\xe7\xbbl\
+\xd92\xa6?\x8d\xc5b\x1a\x18\xae[\xb7\x8e\xc9tf\
+gg\xb5\xf6\x5c1yt\xc01\x1c\x0e\xeb\xa0!\x13\
+\x18\x97\x97\x97\x1f6\x804+\x1a\x8d\xe2\x91G\x1e\xb1\
+\xde\xfb\xa2\x8b.\xc2\xb2e\xcb011\x81;\xee\xb8\
+\xc3\x92]\xac]\xbb\x16\xd7\x5cs\xcd\x92\xf8\x9b\xa7\xb2\
+\xf6\xee\xddk\xc5\xb4+\xd6|\xef\xde\xbd\xcc\xa5#7\
+7\xf7\xb0]o\xea\xea\xea\xd8`\xaf\xe7y\x1a,\xd5\
+\xd6\xd62\xed\xf9\xd4\xd4TZ_\xbe\xc4\xa4\x809_\
+\xa2\xaekkk+#\x03222\x16-\xcd\x0a\x04\
+\x02\xd6N\xd1\xc8\xc8\x08&''\x11\x0c\x06-\xdb\xd7\
+\xe1\xe1av\x7fE\x22\x11\xfd;===l\x88\xba\
+\xb0\xb0p\xd1\xc0|\xd5\xaaU\xecw\xd5\x109\xb0\x10\
+:D\x19\xfd\xe9\xe9i\xb4\xee\xdb\xc7\x81\xb3$0\xd1\
+\x94$\x03\x5c\x87k\xb0\xa9\xc2\xb7\xe8\xe0@Rry\
+\x87\xce\xe9I\xc8E\xfc\xe1<\xe13\xc2R\x0d$\x0a\
+\x0dW)\x80\xb5@\xab\xf4C\x84\x840\x7fn$\x92\
+\xea\xb7\xf2\x1b\x10\xea{\xeeCcW^d\xc2\xb3\xdb\
+AV+\x87\x11\xb7g8g\xac5(\xd4bj\xc9\
+L\x1a\x05\xf3E'v\x8c\x92\xbc\x8f\x81}\xd5\xba0\
+;FJ\xefSW\x1d\xf8r\x16\xff\xf5\xa5\xd9\xb5p\
+\xb7\x1bf\x05.\x1d\x9b\x1b\x09\xaeZ\xb8\x86{\x93\xd9\
+e\x12p\xec\xa6\xff\xb5{\xbdq+:]V\xf8\x8f\
+\x1c\xcf\x91\xd2m\xdd(\x1c\x9dc\x1a\x98\xa7\xebX+\
+\xcf\xf3\xf0\xe0\x83\x0fZ>\xddg\x9ey&>\xf4\xa1\
+\x0f\xc1\xf3<<\xf2\xc8#x\xfc\xf1\xc7\xad\xb4\xd0\xcf\
+~\xf6\xb3\xf8\xd4\xa7>\xf5\x9e:\xdf\xa6\xa6&+\x89\
+O1\xa3\xa6\x87u\x7f\x7f?\xf3\xb0\x1e\x19\x19a\xc1\
+L\xa1P\x88\x81\x09\x0a\x9ci:h*\xea_\xff\xfa\
+\x97\xe5\x88\xb3b\xc5\x0a-+\xda\xbbw/6o\xde\
+l%\x16n\xd8\xb0\x01\xd7_\x7f\xfdayA\x1f\xad\
+\xea\xea\xeab\x89\x8f\xe1pX\xafkgg'\x03i\
+\xd9\xd9\xd9\x87\x1d4TSS\xc3\x9a\x94\x89\x89\x09-\
+qhhh`\xf7\xc5\xd8\xd8X:Xh\x89\xcb\x94\
+\x86-_\xbe\x1c\xf9\xf9\xf9N\xd0nJ\x90\x92\x95\x10\
+\xc2r]\xe9\xef\xefG,\x16C \x10\xb0\x98\xf7\x96\
+\x96\x16\xd6\x14\xaa!O`a\xb7\xc6\xfc\xce[l\x02\
+\xe8\x9a5k\x183?44\xa4\xef\xf1\xfa\xfaz\xc6\
+\xe8\x0f\x0c\x0c`zf\xda\x0e\xa0\x11\xd2\x85u )\
+\xb7*\xb8\x88\xc0\x97\x10p\x1fk=\xb4i\x8a\xb9\xa9\
+\xee!\x014%\xc1\x91\xcak\x5c\x08\x937'<\xb6\
+\x19&D\xbd\xf5\x8c \x19\x08i\x05\x16\xe9\xa1Lw\
+\x8a\xbb\x7f\xbe&:\x15\x827-\xf0\xc1\xb0\xb6e\x94\
+\xce\x9b\x04\x5c\x7fm\xb0\xd1\x14H\xaaAL\xe9\xeb\xea\
+y\xd3 \x1c\xe1\xf34\xb6\x9e[=B\xcb\x90\x0c\xa1\
+\x8e\xb617\xe2\xecI\xb3@w(\x164\xf0\x09\xc1\
+\x8e\x90\x0eOs\xde8ii\x88f\xf2\xfd\xa6\xcb\x1a\
+\x225\xb73\xa8\xed\xa1\xe0\xbbL\xfaZ;\x5c'\xa5\
+\xa0\x92\x14\xc3o]5\x8e\xd2>n\xf5\x5cz\x9f\xa4\
+\x81y\xba\x8e\xb9\x1a\x19\x19\xc1C\x0f=\xc4\xfe@\x85\
+\xc3a\x5cv\xd9e\xa8\xab\xabC<\x1e\xc7\xbd\xf7\xde\
+\x8b\xbf\xff\xfd\xef\xecC\x99\x9d\x9d\x8dK/\xbd\x14\x17\
+]t\xd1{\xe6\x5cM\xf0\xad<\xac#\x91\x885\xdc\
+\xd5\xd1\xd1\xc1\x18\xb3\x89\x89\x09K\xf3\xact\xc9\xc3\xc3\
+\xc3\x18\x1e\x1ev\x82\xf6T5P\x0f=\xf4\x10\x03,\
+*\xfcI5G\xff\xf8\xc7?p\xd7]w\xb1\x06!\
+\x10\x08\xe0\xa4\x93N\xc2\xf5\xd7_\x9f2\x06?\xd55\
+88h\xd9\xd0\xa9\xeb\xd4\xdd\xdd\xcd\xd6\x15\x80\x0e!\
+:\xd4jlld`illL\x83CS\xbb\xde\
+\xd5\xd5\xc5v\x89\xd2\x95\xfajkkck\x5c\x5c\x5c\
+\x8c\x82\x82\x02x\x9eg9\x1aUVV.j\xe7'\
+''\x87\xc9\xb7\xa4\x94\xfa3S^^\xcevE\xa4\
+\x94hmm\xb5\x9aY\xf5=\xd0\xd3\xd3\xc3>K\x8b\
+\xcd(P\x92)\xd7\xe0g(\x14\xb2\xbegzz{\
+\x10\x9d\x9b\x03H\xd6$(\x8e2Xf\xed&\xe2\x1b\
+\xec10/ \xcc\x9f\xfa\x00N&\xb1\xff\xd6\xf6\x83\
+DW\x9dx-\x0dNa\x02WAQ\x1f\xc7\xbep\
+\x81\xae\x83\x04\xcch\xa92\x1d\x0e\x95\xfa\xfc\xb9\xd5\xa0\
+$,\xb3M\xd4\xfa\x96\x90\x1c\xb5\x0bb\xe1\xce\xbb \
+\xa9-\x10-\xf1\x87\xa1\xd56\xad\x06M\xffq68\
+\xe9\xf4F\xf75\xdc\xdc\xcd\xc4\xd7bK\xe3\x84\x04i\
+\x10\xa8e\x22\xa4o\xaf\xc8Yo\x02\x86\x05O\xda\xd4\
+zxS\xb2\x22\xc9\xb3\x944E\xd2)T\xe9\xa7\x8d\
+\x1a\xe9\xa9\x826 L\xd2#\xec\xc0 }-\xe8\x04\
+\x85\x19/\xa5\x0c\x1f\xd3\x8cy\xba\x8e\xf1z\xf6\xd9g\
+-IKYY\x19\xae\xb9\xe6\x1a,[\xb6\x0c\xd1h\
+\x14\xb7\xdf~;^~\xf9e\xf6;YYY\xb8\xe4\
+\x92K\xb4\xf4\xe5\xdd\x5c999\xa82\xd2\xf6\xda\xda\
+\xdat\xb0\x10e\xd3T\xb0\x90Y~\x08\x88\x0f\x18\xc2\
+\xe10&&&X\x9cx*\x83\x86(\xf3w\xff\xfd\
+\xf7;]XN?\xfdt}\x1d\x1fx\xe0\x01\xe6\xb6\
+#\x84\xc0\x09'\x9c\x80o~\xf3\x9bI\xad\xe2\xde\xe9\
+r\x058)Y\x91\x09\xd2\x0e\xd5\xa5C\x95y=\xba\
+\xbb\xbb\xe1y\x1errr,\xf9\x83\xa9{OW\xea\
+\xeb\xad\xb7\xdeB4\x1ae\x8d>\xdd\x81\xa2\xa0\xbd\xa4\
+\xa4\x84\xc9\x90\x0e\xd6|\xd1\x9d\x0f)\xa5\xbe\xb7V\xad\
+Z\xc5$$J\xf7\x9dl\xc83\x16\x8b\xb1\x1d2!\
+D\xd2p\x22Z\xa1P\x88}\xcf\xa8\xe1N\xcf\xf3\x9c\
+\xa1C\xedm\xed\xf0\xe2\x9e\x0ff(Lq\x84\xf0\xa8\
+\x81:i\x98\xdf\xf9\xbf/m9\x04\xa8\xfd\xa0!p\
+\x10\xca\xc9E8\x1cH\x5c`^\xfa \xcfEs\x13\
+9\x8c\x09\xe2%\xf1\x16g\xa8\x9c\xda5\x0a7\xb9j\
+\xbf\x85H\xf8\xb6\xdb\x22s\xe9\x90\xacPox&\xae\
+Ph\x9dvA\x92\xc3D+aG\xbfO\xd2\xa8\xd3\
+\xc4\x0e\x85\x9f\xde\xb9\xb0\xc4\xd4\xf5D\x1a#\x93\x92\x80\
+V\xe3\x5c\xa5b\xb9\xedc`\x96\x85t\xc0W\x83}\
+~]}\xbfp\x18;&\xfe\x7fB\xc02]\xf7\xb5\
+\xf3\xf6\x08(\xe0\xd8\xec\x90I\x9c\x5c\xe8[\x0a\xde\x89\
+\x08\xf3b\xc940O\xd71\x5c\x8a\x157APC\
+C\x03\xae\xb9\xe6\x1adeeabb\x02?\xff\xf9\
+\xcf\xf1\xe2\x8b/2p\x1e\x0e\x87q\xe1\x85\x17\xe2K\
+_\xfa\xd2a\x01\xa6\xa3U\x05\x05\x05l\x9b\x9b\x0ew\
+\xd6\xd4\xd406\x8djBi\xed\xdc\xb9\x93moG\
+\x22\x11=\xb4f\x82v3\x16<\x15\xb5m\xdb6<\
+\xf5\xd4S\x8c\xc9\xcf\xcd\xcd\xc5\xe5\x97_\x8e\xb5k\xd7\
+\xc2\xf3<<\xfa\xe8\xa3\xf8\xcdo~c\x81\xf3\xf5\xeb\
+\xd7\xe3\xdb\xdf\xfe\xb6\xd5\x9c\xbc\x1b\xaa\xa5\xa5\x85\xadk\
+~~\xbe\x06i---\xec~\xa3\x8f-\xb6\x8a\x8b\
+\x8bQRR\xe2\x04\xdf\x8d\x8d\x8dL\xea3;;\x9b\
+\x12\x0f\xfat\x1d\xbcFGG\xd9n\x88\xf2,w\x81\
+\xf6\x9c\x9c\x9cE\x0dT\xaf\x5c\xb9\xd2\xd2o+\xe0\xbd\
+b\xc5\x0a\xf6y\x9c\x9c\x9c\xc4\xc0\xc0\x80\xe5\x0aT\x5c\
+\x5c\x8cH$\x02)\xa55\xb7QVV\xf6\xb6v\xb1\
+\xf9\xf9\xf9\x96\x8f\xba\x1a\xde6}\xf4\xfd\xd0!{\xa8\
+N\xcb2\x98\xef\xb71\xc8I\x930AF\x17Y\xf2\
+\xa2\x0fH\xb9k6\x99(U\x03\x9d\xc6\x14\xa3\xa4\xec\
+\xa7tNY&\xa5\xe0\xa5L\x22:\xb6\x5cc|f\
+\xd6\xb2z\xf4M\xb4\xedV\xc3e\x95\xa8\xdfC\xd8'\
+\x01\x7f\xbd\xfc5\xf3]\xe0%e\xc1\x1d\x03\x95&8\
+\x17\x09\xd7\x16!\xb9\x03\x8b\x10\xdc\xddE\x0f\xee&\xd6\
+Y\xabJ$o\x8e\xd4\xb1J\xd86\x83\xc2\xf0S\xa1\
+\xc7`&m\xd2\x85\x96\x0ev\x9e\x90\xed\xceaO?\
+\x9dT\x1a\xce4\x89\xe33d8\xb4\x11d\x10[\x0f\
+0\x1b\xce,\x82\xe8\xf7\xc9\xe0+i\xf9\xac\xf3L\x03\
+\xf3t\x1d\xb3522\x82_\xfc\xe2\x17\xd6\x1f\xcb\xe3\
+\x8f?\x1eW^y%\x02\x81\x00&&&\xb0i\xd3\
+&l\xdd\xba\x95\x81\xc3\xcc\xccL\x9c{\xee\xb9\xb8\xfe\
+\xfa\xeb\x0f9\xba\xfahU}}=;\xb6h4\xaa\
+\x03C\x9a\x9a\x9a\x98\xaf\xf0\xf8\xf8\xb8Sc<88\
+\x88\xd1\xd1Q\xc6\x8e)\xfd\xeb\x8e\x1d;\xd8 Y^\
+^\xde\xa2\xb5\xb1\x8b-\xcf\xf3p\xff\xfd\xf7\xe3\xd5W\
+_e?/))\xc1W\xbf\xfaUTTT\xc0\xf3\
+<\xfc\xe5/\x7f\xc1=\xf7\xdccm\xc5\xaf^\xbd\x1a\
+\xdf\xfe\xf6\xb7\x0f[\x0e\xb2T\xd5\xdd\xdd\xcd\x5c:\x22\
+\x91\x88\x06b\x9d\x9d\x9dL\xeb\x9f\x93\x93s\xc8:s\
+s\xb8sffF\xcbXV\xae\x5c\xc9\x06\xf5\x0e\x1c\
+8`\xe9\x9f\xd3\x95\xfary\x96WWW#\x18\x0c\
+bll\xccb\xab\x173\x00ZQQa\xc9\x95\xa6\
+\xa6\xa6\x10\x08\x04PYY\xc9>\xe3###\x98\x9a\
+\x9aBoo/k\x0a\x0b\x0b\x0b\x91\x93\x93\xa3\x9dY\
+\xe8\xf7\x5cqq\xb1\xe5\x91n\xd6q\xc7\x1d\xa7\x83\xd9\
+\x80\x859\x16\xd5\xe8\xad]\xbb\xd6\x0a0\xdb\xbf\xbf\x9f\
+\xa0\x12aJ\xb6)\x0a\x03\xc3\xdc\xd4yC\xf8\xe0I\
+\xb2\xd4G\xc3\xf2\xcfzQJ\x87\x82K\xaf%\xc7\xdf\
+p\x85Q\x9a\xcf\x01\x91^\x18 [\xe9\xc1\x99`G\
+\xfa@0\x19\xb3J\xdb\x0b\x1bB\x0a\xa7\x9b\x22\xdbg\
+\x10V7ai\xed%I\xa8\x94\xc6\x892SAA\
+\x7f\xe2\x9f\x09\x05\xe7\x92\xcd{\x0a\x02XMM\x12\x19\
+\x945\x98\xeb\x85\x81N\xfblM\x89\x0c\x8dL2\xfb\
+\x19!l\xb6|\xe1\xbd|\xd0\xcd\xac\x1e\xb5\xdc\x9c8\
+\xa9\x08\xfen\xdam\xc5h\xd2TC\xc5w\x22\x12\xaf\
+\xe7\xd8\xee\xd0;CB:\x8e\x1e\xd4_3\x0d\xcc\xd3\
+\x95\xae\xdd\xbbw\xe3\xd7\xbf\xfe\xb5\xa5S>\xeb\xac\xb3\
+\xf4\xa0\xa1\x02\xe7\xcf=\xf7\x1c\xfb\x83\x96\x91\x91\x813\
+\xce8\x037\xdcp\xc3\xbb\xd2\xa6\xcf\x04\xdf\x03\x03\x03\
+\x18\x1f\x1fG0\x18\xb4\xd8\xb8\xee\xeenvn\xaa\x86\
+\x87\x87\x93\x06\x0d\x0d\x0d\x0d1\xd0\x1e\x0e\x875\x03\x98\
+\xca\x9a\x9e\x9e\xc6\xe6\xcd\x9b-\x86\xbe\xa6\xa6\x06\xdf\xfc\
+\xe67Q^^\xae\x03\xa4\xee\xbc\xf3N\x06x\x15\xf8\
+\xb9\xe1\x86\x1bp\xc2\x09'\xbck\xaeMWW\x97\x15\
+\xe8\xa2\x9a\x87\x8e\x8e\x0e\xa6\x03\x0e\x04\x02\x87\xdcX\xd4\
+\xd5\xd51\xa6sbbB\x83%s\xee\xc0\x0c\x8cz\
+\xaf\x95L\xe6?\xfd.\xac\xf6\xf6v\x06|\xcb\xca\xca\
+\xb0l\xd92x\x9eg5\xc6o\xe7A\x9e\xcc\x91e\
+jj\xca9\x14:44\x84\x99\x99\x19+\xec(3\
+3S\x7f\x1ftuu\xb1\xe3+((x\xdbA\xea\
+\xfa\xfaz\x06\xbe\x07\x06\x060==\xad3\x14l\xed\
+\xf94\x1d\xafKj\xcf\xc7 5\x99\xd7\xa3\x00N\x10\
+\xb8He\xc2\x8c\x94\x15\x0e\xe7\x0d\xc2V+=3\x1f\
+N\x94\x16C\xedK,\xc0\xe6\x06\xed\x9f\x1b\x80U\xd0\
+aB.9\x11zs\xc0\x81\xb6-\x8fE\xe93\xbf\
+\x06\xb8\xf3-\xc1\xa5{%\xfd\xf4\x1e\x1fXK\xe9;\
+:Z)@\x82\xb8\xc6\xf0\xc4J\xe5\x91.\x1c\xee#\
+H$\x8b\x0a\x13\x18\x0b[2\xa3\x1cj\x88\xab\xa4\x05\
+\xcbE\xd2m\x02\xeeg\xae\xad3\xa5\xf4\xd9v\x22\xa1\
+Q)\x9f>Q/\xb5\x9aHJ\x7f@\xd4\xca\xb8\xd2\
+\x9e\xf0\xc2\xbe\x7f\x00\xa7\xad\xa5\x94T#\xcf\xaf\x95\xa0\
+\x0d\x96u\xbd\xfdU\xc8HC\xb3t\x1d\xeb\xb5m\xdb\
+6\x94\x97\x97\xe3\xd2K/\xd5z\xcd\x8c\x8c\x0c|\xec\
+c\x1fC \x10\xc0\x1dw\xdc\x81\xa9\xa9)\xfc\xe2\x17\
+\xbf\xc0\xe4\xe4$>\xfa\xd1\x8f\xea\xdf\x0b\x04\x028\xfe\
+\xf8\xe3q\xd3M7\xe1g?\xfb\x99\xe5\xae\xf0NU\
+(\x14\xb2\x1c\x15\x94\xee\xb3\xb8\xb8\xd8\xf2\x1cN\x16.\
+\x13\x8f\xc7\xd1\xd9\xd9\xa9\xe5+\x0a\xe8*\xd0\xde\xdf\xdf\
+\xaf\xb5\xea\x81@ eACf\x0d\x0c\x0c\xe0\x97\xbf\
+\xfc%n\xbc\xf1F\xa6\x8d_\xb5j\x15\xbe\xf5\xado\
+\xe1\xe6\x9boF__\x1f\x9e|\xf2ILNN\xe2\
+\xca+\xafd\xdb\xebeee\xb8\xf6\xdakq\xf7\xdd\
+wc\xcb\x96-\xef\x0a\xf6\xb4\xa3\xa3\x83IT\x148\
+\x8aF\xa3\xe8\xea\xeab\x12\x9cC\xf5\x897w.\xf6\
+\xef\xdf\x8f\x03\x07\x0e8\xbd\xcdM\xbd\xfb{\xad\xd6\xac\
+Y\x83\xcd\x9b7\xa7\x0c\xe4\x7f\xef{\xdf\xb3\xd2gS\
+U{\xf7\xeeE,\x16\xd3M\x93\xca\x12\x18\x1c\x1cD\
+{{;\xce8\xe3\x0c\x0dd\xcb\xcb\xcbQPP\xc0\
+\x1a8\x06\x02\x84\xb0\x5cW\xf6\xef\xdf\x8fx<\x8eH\
+$bI\x99z{{u\x8eA4\x1ae,w}\
+}=\xb6n\xdd\x8a\xbd{\xf7\x22\x1e\x8fkyL0\
+\x18DCC\x83v\xf31+\x18\x0c\xa2\xba\xba\x9a\x11\
+\x00===\x98\x9d\x9dE8\x1c\xb6\xb4\xe7\xdd\xdd\xdd\
+\x88\xcd\xc7|v\xd9\xc0]BE\xc9'$\x0eL\xf6\
+\xabd\x06\x82\xf3\xa8\x82H\xb6\xb9L@\xd0\x99E\xcb\
+-O\xa8AF)L\x93s\x9f\x99\xe5\xb9=|(\
+\x93\x92\xca\xdafP\xd0\x87\x08\x00\x14N\xa0\xef\x1f;\
+\xd7\x9b+\xebF\x15\x94\xa4\x09Ua\xbe\xaf\xeeV|\
+\xb0,\x15#\xee\x1f\xb5f\x99\x055\x08\xa4\x8c\xb4\x01\
+\x8d%\x9b\xc2\xb4\x00\xb8H\x16\xda\xa4b\xe65J\x07\
+\x97\x9d\x08\x12\xc7#\x03\x89fC\xc0\xca{\x22f\x95\
+R\x1a\xf2o\xa1|\xce%\x19\x08\x06c\xbc\x05[\x03\
+_\xeb\xae\xce\x9f\xe6J\xf9\x17\xc37\xa1\xf7\xd7R\xf2\
+PQc\xb8\x16\x89\x90 A\xeeI!\x84?\xa8*\
+L\x03\x17*\x22\x12\x16\xa8W\x8f\xa7\x19\xf3t\x1d\xf3\
+\xa5,\x12\xff\xf6\xb7\xbfY\x8c\xf8y\xe7\x9d\xa7\xb5\xe4\
+\xd1h\x14w\xdey\xa7\x15\x0b\xaf\xb6\x9do\xba\xe9&\
+l\xd8\xb0\xe1]qN\x85\x85\x85\x0c|\xc7\xe3q\x1d\
+.SZZ\xca\x18~3X\xc8,S{^TT\
+\x84\x95+W:\xdd$\x0e\xd7\xdao1\xb5g\xcf\x1e\
+\xdcq\xc7\x1d\xccjP\x81\xd0\x1bn\xb8A\x0f\xaam\
+\xdb\xb6\x0d\xb7\xdcr\x8b\xa5\xa5-,,\xc4\x95W^\
+\x89\xcf}\xees\xef\x8a\xd9\x00\xd7\xba*\x00n\x02\xc3\
+\x92\x92\x92E\x0d\xe2\xa9\xa6\xcct\xc2P\xd7\xbe\xb6\xb6\
+\x96\xa5J\xce\xcf\xcf[;\x11\xef\xb5\x0a\x87\xc3(*\
+*J\xd9\x7f\x14\xb0\xa6\xbaZZZ\xd8\xee\x5cFF\
+F\xd2\xa0!3\x83\xc0\xac\xb2\xb22\xc6fK)5\
+\xeb^__\xcfvLh\xf3\x1d\x8dF-\xf9\x9e\xba\
+\xb7FFF\xd8\xe7K\x08q\xd0\xcft(\x14b\xf7\
+\xa5\xe7y\xfa}\x22\x91\x08c\xed\xa5\x94\x0b\xf7\x1aI\
+A\x14F\xf2\x8b$\x1a_\xe1\x0a\x92\x81\xcf\x983p\
+\xa5m\xf68\x8c\x14:!T\xc0\xa6\xe7\x85\xef\xd8G\
+\x99e\xc6dS\x96W\xf3\xc5\x06knOoR\xa5\
+\x8ca0b\x0f\x96\x0a\x83J&\xa1@\xcc\x1e\xd1\x94\
+\xca\x93AY\xea\xe6\xc2\x81*\xd7\xe9\x08\xe9\x86\xd9\xd4\
+\xaaR\xd0cu\xa4\xcc3)\x86d\x5c1t\x8a\xa5\
+$\x07D\xaf\x03s&\xa1,\xb2-\xa8\x11\x22\xd1H\
+8\xa4!\xd4:\x93\xb3\xf3\x09\xabGs\xdd\x0c\xbf|\
+i\xaa\xd0u\x9f(\xc8\xb9\xd3\xe0+\xe9H\x97\xa5\xcd\
+#\x7f=s\x10VZ\xcc\xb8\x83\x14\xf0\xd3\x88\xd2\xc0\
+<]\xe9R\xc0\xf5\xce;\xeft\x82\xf3\x8f|\xe4#\
+\xf8\xda\xd7\xbe\x86\xac\xac,\xc4\xe3q<\xf8\xe0\x83\xb8\
+\xfb\xee\xbb-\xc9DMM\x0d\xbe\xfe\xf5\xaf\xe3#\x1f\
+\xf9\xc8;~>f\xacw,\x16\xd3\xe1A\xcd\xcd\xcd\
+l`lvv61\x90\xe5\xae\xf6\xf6v\x06&2\
+33\xb5\xfeu\xe7\xce\x9dLJPRRbm\xa1\
+\xa7\xb2^|\xf1El\xde\xbc\xd9\x02\xe7\x0d\x0d\x0d\xb8\
+\xf1\xc6\x1b5S\xfc\xfa\xeb\xaf\xe3G?\xfa\x91\x05:\
+srrp\xd1E\x17\xe1\xdak\xaf}\xc7g\x03L\
+\xcfr\xaa%okkc\xcd_nn\xee\xa2Y\xf3\
+\xba\xba:f\x15I\xc1\xf7\xca\x95+-o\xf3t\xb0\
+\xd0\xd1\xabh4\xca\xdc\x8c\xd4\xbd\xab\xd8t3h\x88\
+\xeeT\x99\xd5\xd0\xd0\xc0>\xc74\xd5\xb7\xb6\xb6\x965\
+\x9f\xb1XL?\xe6\x1a\xf2,--E$\x12\xc1\xfc\
+\xfc<\x93\xae)\xd0\x9e\xcc\x81\xaa\xaa\xaa\x8a\xddk\xfe\
+p\xe7B\x80\x19mrb\xb1\x18K\xf4\xf5\x03\x5c\x0c\
+\xffq\x85\x86\x0d\x89\x92\x10<\xe2\x85\x0d\xde)\xafl\
++\xe1\x91\x00\x1e\x07\x1e\x92\xd6\xff\xe0D13a\x11\
+R\x1b\xdbIa\x0a\x15\xfcAA\xf3\xf5\xf5\xa8\xa0\xf4\
+\x89h\xfe\x0b|\x07@R\x84-\xf9\x10\xa9$v\x85\
+\x14\xb4/\x84&9$!T+\x9f\xcc\xea\xdc\x00\x96\
+L\x9a\xa3@\xabp\xa0Hi6A|\xcd\xa9\xe4H\
+5\x11\xd2G\xd6>\xb8\xa5\xf3\x01\xc9\x8c\xec\x1d\x07\xed\
+\xccTR:si\xca\xa0\x04\xd1\xb8K\xdb\x0b^\xcb\
+z\xa4\xf5\xfe\xf4\xf8\xccu\x13\x024)J\x9f\xabn\
+t,}Nr\xd9\x9dP\xcd\x80L3\xe6\xe9J\x17\
+\xfb\xa3y\xc7\x1dw\xe0\xe9\xa7\x9f\xb6\xc0\xf9\x99g\x9e\
+\x89\x1bo\xbc\x11\xc5\xc5\xc5\xf0<\x0f\x8f=\xf6\x18~\
+\xfe\xf3\x9f\xb3\x81-`\xc1\xa1\xe0\x8b_\xfc\x22.\xba\
+\xe8\xa2w\xd4N\xb1\xb9\xb9\xd9\x8a\xe9Vl\x9aK\xe6\
+@\x1dM\xcc2\x83\x86222\xb4\x04\xa3\xab\xab\x8b\
+5(\xe1p\x18MMMKzn\xcf?\xff\xbc~\
+\x03\x813\x00\x00 \x00IDAT\x13\x9c\xd7\xd6\xd6\
+\xe2\xc6\x1bo\xc4\xc6\x8d\x1b\x01,H4\xfe\xdf\xff\xfb\
+\x7f\xd8\xbe};k\x1e222\xf0\xef\xff\xfe\xef\xf8\
+\xc67\xbe\xb1(K\xba\xa5*SK\x1e\x0c\x06\xb5\xfe\
+\xbb\xa3\xa3\x83\xadkFF\x86\xe5=\x9e\xacjjj\
+X\xd3199\xa9\xc1\xf7\xaaU\xab\xd8}922\
+\x92T\xa6\x90\xae\xa5k\xc8hUVV\x22\x12\x89\x1c\
+r\xd0Puu5\x03\xe6\x93\x93\x93Z\xf6RYY\
+\xc9>\xff\xe3\xe3\xe3\x1a\xf4{\x9e\x87\xfd\xfb\xf7\xb3\xcf\
+\xc4\xb2e\xcb4\xf1`\x82\xf6\x92\x92\x92\xa4\x03\xa0M\
+MM\xec\x18\xc6\xc6\xc6\xb4+\xcc\xaaU\xab\xd81\x0c\
+\x0f\x0f/\xdc\xef\x82\xc1Y\xcb^\xdaO/78T\
+\x82t\x18\x13M\xb4\xdb\xc2\xc8\x14\xa2>\xdcRJ\x03\
+\x80\x12Z\x5c\xb8\xd2\x1a\x93\xb8\xa2\xb8@\x1c\xb5\x117\
+\x9eH\xd3'\x85\xe1fB\xd1\xb5\xc9\x8c3i\x8e\x80\
+q\xdefs\xb2 \x09\x91\xce\xa1U\xdfs[\x08#\
+\x9bG\xd9IJid\xf6H\xfd\x5ck'Bi\xf2\
+]!;\x00\x01\xbf\xe6\xe4\xac\xd4\x1e\xe0L\x12\xc2\x04\
+\xea\x06.\x960\xe5\xdf\xe4|\x1dq\xf6\xd2\xd0\xef\x93\
+x*\x91\xb8O$\xdc\xf2\x1c>\xf8I\x0f\xdb\xb5\xdd\
+A\x1cg\x04q\xc3O\xd8\xd6\x08\x97\xd5#kD\x5c\
+]\xa2\x7f/\xa65\xe6\xe9J\x97\x01\xceo\xbf\xfdv\
+\x00\xc0\xd9g\x9f\xad\xff\xb0(-\xf9\x7f\xfc\xc7\x7f`\
+\xd3\xa6Mhmm\xc5K/\xbd\x84\xb1\xb11|\xf5\
+\xab_e\xdb\xbd\x91H\x04\x97\x5cr\x09\xf2\xf3\xf3q\
+\xd7]w\xb1a\xaa\xa3Qt@SUWW\x17\xa4\
+\x94\xc8\xcb\xcb\xb3\x06\xc6\xcc`!\xb3\x94g9\xd5&\
++\xf6vhh\x08CCC\x9a5\x0b\x85B\xa8\xab\
+\xab\xc33\xcf<\xb3\xe4\xe0\x1c\x00\xbe\xf4\xa5/1\xc6\
+\xae\xac\xac\x0c_\xfb\xda\xd7P\x5c\x5c\x8c\xc7\x1e{\x0c\
+\x03\x03\x03\xf8\xc9O~\x82+\xaf\xbc\x12g\x9cq\x06\
+\xbb\x9e'\x9ex\x22n\xba\xe9&\xdcr\xcb-\x16\x18\
+9\x1a5;;\x8b\x9e\x9e\x1e\xa6\xc3U\xd7mtt\
+\x14\xfb\xf7\xefg\x1a\xe2\xc5\x02s\x17\xf8V\xc0\xdc\x9c\
+\x01x/\xda$\xbe\xf4\xd2K\x8cY>\x92\x92R\xe2\
+3\x9f\xf9\xccQ\xdd=ikk\xc3\xfc\xfc\xbc\x06\xb4\
+%%%(,,Doo/\xda\xdb\xdb\xf1o\xff\
+\xf6o\x16h\xa7;V\xaa***\x98\xb6{tt\
+\x949\xb2\x98\xcd5}\x8d\xae\xae.\xa6%\xcf\xcb\xcb\
+Caa!FFF\xd0\xd3\xd3\x03\xcf\xf3\xf4=\xa4\
+@\xbb\xeb\x18\xcc\xe1\xce\xfe\xfe~\xcc\xcc\xcc \x18\x0c\
+\xa2\xa6\xa6\x86\x1d___\xdf\xc2.\x10\xf1\xb9\xe6\x88\
+\x17\x8ep\x1d\xf2\xb8aW\xe8\xff\x9e0\xadA\x88\xe5\
+\xa0/;\x11R\xd8\xf0\x91$[\x1a!\xa4\x06S\xea\
+\xf8_T\x1bmX\x0eJ\xe1\x07\xd3\xb0xx\xda\x00\
+(po2\xfaL\x06\x02[\x97\xce\xf11\x01\xed\xfe\
+\xd0\xa9\x10F\x03\x22\xc8\x1a\xd1\xb0Mu\x1a,)\x93\
+\x00\xd5\xc4:2\x13\x1b\xa9\xe4%\xf4BJH\x11\xd0\
+\xba}A\xf4\xd5z=\x9dg\x01\x7f\xa8\xd5\xb1FB\
+(\x8d\xb9%Z!\x83\xb4\x0e@/`Y\xd4\xa8\xc6\
+N\xd0\xf5\x10\xbc\x8d`\x83\xaa.\xf0L\xac\x0f\xed\xab\
+\xeb\xdboJ%/rn\xd5$\xce\xc9:n\x7f\x16\
+ \x0d\xcc\xd3\x95\xae$\xe0<\x1a\x8d\xe2\xbc\xf3\xce\xd3\
+\xdb\xb1B\x08466\xe2\xa6\x9bn\xc2=\xf7\xdc\x83\
+\x17^x\x01---\xf8\xc1\x0f~\x80k\xae\xb9\x86\
+E\xd2\x87\xc3a|\xfc\xe3\x1fGVV\x166o\xde\
+|TS\x15sss\x9d\xbaOW\xb0\xd0\xfc\xfc|\
+\xd2\xc1OZ\xad\xad\xad8\xe5\x94S\xf4\xbf\xcb\xcb\xcb\
+\x91\x97\x97\xa7c\xdei#\xb0T\x03\xa0.p>?\
+?\x8f+\xae\xb8\x82\x0d\xba\xe5\xe7\xe7\xe3\x0b_\xf8\x02\
+***p\xdf}\xf7i?\xfa\xb1\xb11\x9c\x7f\xfe\
+\xf9\xecz655\xe1\xc6\x1bo\xc4O~\xf2\x93w\
+\x849\xde\xbd{\xb7f\xf8UcQZZ\x8a\xc1\xc1\
+A\xec\xdb\xb7\x0f\x1f\xf8\xc0\x07\x18\x10\xcb\xcf\xcf\xb7v\
+\x0a\x5c`\xc9l\xbc\x80\x05\xb9\x02\xbd\xf6R\xca\xf7d\
+\xb0\xd0\xee\xdd\xbbSz\xdc*I\xf6h\xd5\xce\x9d;\
+177\xa7Aqnn.\xaa\xab\xab\xd1\xdb\xdb\xab\
+\xd3A\xd5pyii)\x0a\x0a\x0a,P\x1c\x08\x04\
+\xb0|\xf9r\xf63\xe5\xba\xe2\x1a\x0a\xed\xef\xefg>\
+\xe9\xfb\xf6\xed\xb3\x86<W\xadZ\x85\xd6\xd6Vtt\
+t \x1e\x8fk\xc0\x9d\x97\x97\x87\xa2\xa2\x22k\x085\
+\x14\x0a\xe9Apu?\xa9\x04\xd9\xac\xac,F\x00\xa8\
+\xd0!\xba\x13)%\x07.\xc2\xa2e\xe9\xe4&\x98c\
+\x86\xe4H\x96\x81I{`S\x05\xf3P\xf0\x03cH\
+P\xda\xac\xadT\x00\x8b\x0e\x18\xfa\xb6w\x801\xac(\
+\x93\x01:5\xec(\x1cM\x87\xf0\x19\x7f\xc9\x93E\xb5\
+\xc0\xc5`\x98\x95TB\x18\xe4\xb3\xcb\xda[2\xb9\x85\
+`\xf0\x0f4\xccH0\xd4i\x00c\xff\xb8\x99T[\
+h\xb1\xbb\x06\xa1\xfek\xf3IU\x96g$x{$\
+\xa5t\xdb\x8b\xabsu5Ft\xbd\x8c\x1d\x85\x85\xe5\
+\xf1\xb5\xe4&?.\x8d\x04N\xe9\x8b\xf6\x13\xc3\xa1\xc2\
+If+\xe7\x1a!\x04c\xf4\x85\xb1\xd5\xa1m(%\
+\xb9w\xe8\x04k\xa2\xb1\xe1\x83\xb7\xa4\x89B\x9a1O\
+W\xba\x92\x82\xf3;\xef\xbc\x13###\x16\xa3V^\
+^\x8ek\xae\xb9\x06\xf5\xf5\xf5\xb8\xff\xfe\xfb\xd1\xdb\xdb\
+\x8b\x1f\xfd\xe8G\xb8\xea\xaa\xabp\xf2\xc9'\xeb?h\
+\x19\x19\x198\xe7\x9cs\x10\x0e\x87\xb1i\xd3&\xf6\x87\
+q)k\xd9\xb2e\x0c\xa8\xce\xcf\xcf\xb3p\x19\xba-\
+m\xea>\x0f\x06&(\xcb\x97\x95\x95\x85\xe6\xe6f\xbc\
+\xf8\xe2\x8bhii\xc1\xbf\xff\xfb\xbf3\x96/\x1c\x0e\
+\x1f\x95\xf3\xdd\xb6m\x1b\xc6\xc6\xc6p\xf5\xd5W\xb3]\
+\x8b\xac\xac,|\xfc\xe3\x1fGuu5~\xf5\xab_\
+\xa1\xa7\xa7\x07w\xdf}7FGGq\xc9%\x970\
+\x9d\xb5\xd2\xa7\xdfr\xcb-G\xdd\xa1D9d\xa8A\
+\xbd\xdc\xdc\x5c\xd4\xd5\xd5app\x10{\xf7\xeeek\
+\x9e\x97\x97\x87\xfa\xfaz\xbc\xf6\xdakI_\xaf\xbc\xbc\
+\xdc\x1a\x18T\x83\xa4f\xd8\xcb\xd4\xd4\x94\xd3\xbb\xfe\xdd\
+^MMM\x8cU>\xd2\xa2\xc9\x99G\xa3\xfa\xfa\xfa\
+066\xa6\xbfS\x84\x10X\xb7n\x1d^z\xe9%\
+\xec\xd8\xb1\x03sss\xfa\x98rssQSSc\
+\x0d2\x07\x83A\xeb:+\x0f\xf2\xe2\xe2b6_\xa2\
+\x003\xad\xfd\xfb\xf7cjjJ\xdfwB\x08\xbd#\
+\xa6\x9cc\xa8\xf3Tcc\xa3\xf5\xd9\xc8\xca\xca\xb2\xdc\
+\x9d\xd4,CII\x09\x1b0\xa7\xa1C\x8c\xf4d\x96\
+)\xb0\xd8M8\xd8l\x0d\xa8\x89\xcb\x88\xe1\x16n@\
+v\x7f\xc0R8d\x0c\xc2\x00\xbe\xdaBQPoj\
+\x9b\xbc\x97\xe4\xb8\xfd\xd1G\xc5\xc2\xb2\xa8\x22=$(\
+\xc0OW\xeb\xb9\x13`\x93\x1e\x9f\x02uZ\xa9Cv\
+\x18\x84Tzd\xe1Nx\x97\xbe{\x89\xd1\xe6\xd8\x16\
+\x84\x09=\xb80(za\xeclPx\xcc\xd8`\xe6\
+\xde\xe23\xe6\x82\x04%\xf9\xe7-}v\x99t[R\
+;\xa0$\x9b\xda\xb4Hg\xd0\xa1W\xcdZ\x93\xcd\x06\
+!\xb8g\x8b\xed\x14\xc3\x8f\x01\xb4a\xa1}\x8a6Y\
+\x91|%\xf9|+Y'\xb2\xd2\x8a\x9c'\x9ax\x09\
+\xa9\x9b+\x7f\xbbB\x90\xd3M3\xe6\xe9JW\xd2\x8a\
+\xc7\xe3x\xf8\xe1\x87122\x82\xcb/\xbf\x9c\xfd\xa1\
+\x89D\x22\xf8\xe4'?\x89\x9a\x9a\x1a\xdcz\xeb\xad\x18\
+\x1d\x1d\xc5\xcf~\xf63\x1c8p\x00\xe7\x9cs\x0ec\
+\xa2>\xf4\xa1\x0f!33\x13?\xfb\xd9\xcf\x9c\xdb\xc1\
+\xa9\xae5k\xd6\xb0\xa1\xab\xe9\xe9i=\xf8\xb9n\xdd\
+:\xb6\xcd966\xb6(\xa6xpp\x10ccc\
+\x1a\xf0\x87B!444\xe0\xc5\x17_\xc4\x9e={\
+\x18\xb8\xcc\xc9\xc9\xc1\xbau\xeb\x0e\x0a S\xcd@\xfe\
+\xf0\x87?\xc4\xd5W_\x8d\xe6\xe6f}~\x81@\x00\
+\xeb\xd7\xaf\xc7w\xbe\xf3\x1dl\xde\xbc\x19\xaf\xbe\xfa*\
+\xfe\xf8\xc7?bll\xcc\xba\x9e555\xb8\xe1\x86\
+\x1bp\xeb\xad\xb7.\xaaQIU)\x9d\xb9\x1a\x98\xcd\
+\xcc\xccD}}=^~\xf9e=\x1c\xaa@VV\
+V\x16jkk\x0f\xba\xae+W\xaed\xe0{zz\
+Z\x83\xb2\xfa\xfazv_\xbcW\x83\x85N8\xe1\x04\
+\x5cx\xe1\x85\xef\xd9\xef\x15\x154Dw\xb5V\xae\x5c\
+\x89@ \x80\xe1\xe1a\x0c\x0d\x0d\xe9\xc6\x91\x82vZ\
+\xe6\x1c\x01udY\xb3f\x0d\xd3}S\xc0L\x9b\xf5\
+\xc1\xc1A,[\xb6L\xffl\xf9\xf2\xe5\x08\x06\x83\x98\
+\x9e\x9e\xc6\xe8\xe8(k\x1cL\x8bM`A2E\x83\
+\xaah\x93\x7f\xdcq\xc7\xb1c\x98\x9a\x9aJ\xb23g\
+\x9a\xde%`\x1deyM\x05\x83f\x1d\x0d\xa4&\xe8\
+`\x9f0@\xb4\xb0\x11;\x05R\x86\xfc\xc3\xc0^\x09\
+\xecd\xe8\xddM\xf9\x04}\x900\xf7\xda\xcd\xc5\xa6\xcb\
+5\xf3mF\x11\x09\x05\xea\x08\xd8w65\xc2\xd6\xfe\
+(M\xb9\xb0\xf1\xb7C6c\xc9\xa6\xb9\xc5\xa0\xbfG\
+\xc0Yf\xbd>\xd2\xbdI\x9087s\xccR\xed\x5c\
+0@j4\x22\xa6D\xc4O\xfa\x94\xc6\x8e\x880v\
+@H#\xa2X\xed\xc4}\xc2\xe4D\xfa\xe9.\x89\x89\
+/qR\x0d\x9b\xb1a\xe37O\xd6\x8e\x03\xe0\xbc\x81\
+\x5c\xb7]b\x0d\x94\xc5\xa6\xa0\xfdc\xda\x95%]\xe9\
+z\xfbz\xee\xb9\xe7p\xf3\xcd7[z\xdc`0\x88\
+\x0d\x1b6\xe0\xc6\x1boDEE\x05\xa6\xa7\xa7q\xfb\
+\xed\xb7\xe3\x91G\x1ealq \x10\xc0\xc9'\x9f\x8c\
+\xeb\xae\xbb\xeemS\xf4RQ\xabW\xaff\x7fdz\
+{{177\x87p8\xcc\xb6\x9e\x81\xe4\xc1Bf\
+\x99ACB\x08-_\x19\x1e\x1ef\xdb\xdc4\x1d\xf4\
+hUww7~\xf8\xc3\x1f\xe2\xb9\xe7\x9eci\xa4\
+\x0ap\x5cs\xcd5\xf8\xd0\x87>\xa4\xaf\xe7\xad\xb7\xde\
+j\xe9\xca+**p\xfd\xf5\xd7/IHR\xb2\x1a\
+\x1d\x1d\xb5\x8eC\xad]ww7\xb3\xb5S`\xe8`\
+e\x82\xef\xf1\xf1q\x0d\x88\xcck\xd2\xdd\xdd\xcd\x9c_\
+\xd2u\xf4\xaa\xbd\xbd\x9d\x0d_\x96\x95\x95\xa1\xa0\xa0\xc0\
+\x99\x0e\xaa@\xbby\x9d\xe9`%\xb5CUi\xa2\xb4\
+9\xdb\xbf\x7f\xbfE:\xb8\x86<\xd5\x10*\xfd\xacS\
+\xd0n~\xcf\xd0\xe3\x1a\x1a\x1a\xd22\xab\xba\xba:\xf6\
+\xfb*t\x88c\x17\xc1\x98Zf\x9e'\x93\xf8\x0bJ\
+\xb0\xd8w\xfa\xb8\xd3\x8f\x9b5\x00~\xcc\xbb\x0f\x88\x93\
+\x814\xf0\xb8x\xe52\x92p\xfd\x10B\x10\xcd:\x85\
+\x9eD\x0a!\xfc\xb0\x22!|\xf6\x9c\xc9\xb8\xa5\xcf\x8a\
+Kb)\xa8\x8fYHm\xf5()3,9\xf8\x93\
+f\xab\xe3H\x22\x95\xc9\xb4\xd3D\xdb.\x1c\xdd\x86\x1e\
+\xdb\x94\x02.\xb7Ei\x04\xf3P;G\xc1\xa09\xd1\
+\xc0\x1b\xc7!\x12\xc3\xb9B\x0f\xce\x12\x91\x90\xa0k\x0b\
+#\xb5Uh\x8fra\xe8\xc9\xa5e\xc1\xa8_1\xe1\
+\x1ac_;\xe5\xa6\x224h\xd6K\xa3n\x1b\x9e\xfb\
+\xa4\xff-\xf9\xadJ\x93M\xa5tX]\xfa~\xef\xe6\
+\xad,\xd3\xae,\xe9J\xd7\xe2\xea\xcd7\xdf\xc4\xff\xfc\
+\xcf\xff\xe0\x85\x17^`\xc0O\x08\x81\xe6\xe6f|\xfb\
+\xdb\xdf\xc6\xaaU\xab\x10\x8b\xc5\xf0\x9b\xdf\xfc\x06\x0f<\
+\xf0\x00s:\x09\x04\x02\xd8\xb8q#\xae\xbd\xf6Z\xe6\
+/\x9c\xea\xca\xca\xca\xb2\xc0\xb7J\x1b,((\xb0|\
+\x85\x17;\xfc\x17\x8f\xc7-v\xb5\xaa\xaa\x0a\xc1`\x10\
+\xa3\xa3\xa3l\xab\xdd5|z4j||\x1c?\xff\
+\xf9\xcfq\xef\xbd\xf7Z:\xece\xcb\x96\xe1\xcb_\xfe\
+\xb2\xd6\x13\xff\xf3\x9f\xff\xc4O~\xf2\x13\x0b\x04-_\
+\xbe\x1c\xd7_\x7f\xfd\xa2\x07-SQ\xa6D\xa0\xaa\xaa\
+J\xb3\x95\xe6\x9a\xd7\xd4\xd4\x1c\xd4\x83\xdd<\xee\xfd\xfb\
+\xf7czz\x1aYYY\xd6@\xe0R\x85\xe8\xa4k\
+q\xd7\x9c\xce\x9d\x14\x17\x17\xeb\x1d\x1c3\x1dT\x05\x0d\
+\xd1r\xb9\xae\xa8{\xde\xb47\x1c\x1d\x1du\xee\xd4\xa9\
+\xc0!UEEE\xc8\xca\xca\x82\xe7y\x96t\xc6t\
+f\x09\x04\x02V\xc3\xd0\xd7\xd7\x87\x99\x99\x19K{\x0e\
+\xf8\xa1C\x1c\x08)\xf1\x87\xd0L%\x7fT&q\xca\
+\x13~8\x10,T\xe3\xffCH\x0b\xd7k\x84%}\
+]\xbb\x952j\x82?\xa5TW,\xbe\xd3\xf7\xd0\x07\
+\xc5`\xd9IR\xbbm\x08\xaa\x99\xa7\xbf\xaf\xe0\xa2\xb4\
+,e|\xe0\x0e\xdaH\x90\xf1C\xc98\x5c\xff\x90\xa5\
+\xd4\xc7\xa2OW)s\x84\xb1\xaa\x8a\x19v\xae\x84e\
+\xe6\xce\xdeG\xfb~S\xa7\x16\xe2]\xee\xf6\xec\x96\xcc\
+\xc2Q\xb7\x18\x09\x17\x1a~|\xc2\x8f\xb97\x1a\x10!\
+\x17\xbc\xce-9\x0f\xc8p\xa6p\xb4\x22\x89[C@\
+\x1a\xd6\x9a\x12\xc9{;\xa2\xfbw\xc4\xd5JC\xfe\xe3\
+\x1f#\xbd\xd3\xfdk\xe0_C\xe9\x88\xabE\x1a\x98\xa7\
++]\x8b\xad\xc1\xc1A\xdcz\xeb\xadx\xe0\x81\x07,\
+\x0f\xf3\x95+W\xe2[\xdf\xfa\x16\xd6\xaf_\x0f\xcf\xf3\
+\xf0\xc7?\xfe\x11\xbf\xfe\xf5\xaf\x99{D \x10\xc0)\
+\xa7\x9c\x82\xaf|\xe5+K\x16pc\x82\xef\xf9\xf9y\
+\x0d\xfc*++\xd9\x1f\xf8X,vH\xe0\xcc\x94x\
+\xe4\xe5\xe5i\x16\xd6\xdc\xa66\x03n\x8eV\xc5b1\
+<\xf2\xc8#\xb8\xf9\xe6\x9b\xadc\xca\xcd\xcd\xc5\xe7>\
+\xf79|\xfe\xf3\x9fG \x10\xc0\xae]\xbbp\xf3\xcd\
+7[\xdb\xfc\x95\x95\x95\xf8\xfa\xd7\xbf\xbe\xa4aI\xb4\
+v\xef\xde\xcd\x9a\xbd\xbc\xbc<\x0d\xb0[ZZ\x18\xb3\
+\x9a\x9f\x9f\x9f\xb4i8\x18\xf8nlld\xee5\xd1\
+hT3\xac\xef\xf5\x9a\x9e\x9eFwwwJ\xfe\xeb\
+\xe9\xe99\xa8uh\xaaj\xe7\xce\x9d\x0c\xa8fff\
+\xea\x9d\x9a\xdd\xbbw[\xa0\x9dJN\x94\xeb\x8a\xcb\x91\
+%\x18\x0cZC\xa1\xc3\xc3\xc3\x98\x9a\x9a\xb2\x8e\xa1\xb3\
+\xb3\x93\x01\xf3H$\xa2\x076{zz\xd8N\x9a\x02\
+\xed\xaaB\xa1\x90\x95\xea\xa9\xdc\x9dB\xa1\x10;\x06\x1a\
+:\xe4\x023\x06\xf5h\x81Ca\xc4\x9bSP\xcc\xc0\
+'|E\xb7\xa4\xaf/\xb8\xbc\x81\x05\xcaH\x02\xf2(\
+s\xcf\x84\xd1v\xf0\xba\xc2\xd7\xd2h\x10\x84ik\xa8\
+\x137\x158N\xc4\xbbK\xc7\xa9\x0b\xc9>\xeb\x0c\xc9\
+\x11\xbaV\x12w\x1a)\xec\x8eB\xf3\xb0\x96'\xb8\xf2\
+\x1d\x14\x8e\xb5\xa7r\x19\x1e\x98$\xa82]p{A\
+n\xb3(\x18\xb0\x95p\x01f\xc1\xcdu\xccl&\x22\
+G\xa1\xad\x8b\x8b\x01\x97\xa0\x03\xc4\xfc\xae\x91\xe4\xff\x08\
+i\xfa\xc1\xf8\xa9\x9c\xc9}\xc5\xa5\x1d\xa4\xa45\xf2\x86\
+\x04\x07\xdc\x12\xd3z\x15\xa1]\x14\xf5\xebI:\xf3 \
+\xec]\x8a\xb4\xc6<]\xe9:\x84\x8aF\xa3\xf8\xfd\xef\
+\x7f\x8f\xd6\xd6V\x5cu\xd5U\xccy\xa0\xac\xac\x0c\xd7\
+]w\x1d6m\xda\x84W_}\x15O>\xf9$\xe6\
+\xe7\xe7\xf1\xc5/~Q'\xf4)\xcd\xf9\xec\xec,~\
+\xf5\xab_\xa5\xdcJ\xd1\xd4\x18G\xa3Q\xbc\xf9\xe6\x9b\
+\x00\x16\xbc\xcd)\xc3533sHz\xea\xce\xceN\
+LMMi\xfdk8\x1c\xc6\x9a5k\xd0\xd2\xd2\x82\
+\xb7\xdez\x0b\x17^x!\xb3X[\xb9r\xe5;\xa6\
+a\xfe\xd7\xbf\xfe\x85\xff\xfd\xdf\xff\xc5\x15W\x5c\x81\x8d\
+\x1b7\xea\xe3\x0a\x87\xc3\xb8\xe0\x82\x0b\x90\x91\x91\x81\xbb\
+\xee\xba\x0b\xed\xed\xed\xf8\xe9O\x7f\x8a\xaf\x7f\xfd\xebL\
+\xeaQ]]\x8d\xeb\xaf\xbf\x1e\xdf\xff\xfe\xf7\xb5/\xf3\
+R\x95\xf2\x82W\x8ci$\x12\xc1\xca\x95+\xf1\xc6\x1b\
+o\xa0\xa3\xa3\x03SSS\xfa\x9a\xaa\x10\x22\x97+\x89\
+\x19,DCeLM\xf2\xc4\xc4\xc4{r\xf0\xd3U\
+\xad\xad\xad\xf8\xde\xf7\xbe\x97\xb2f7UV\x8c\x07\xab\
+\x99\x99\x19\xf4\xf7\xf7\xb3\xeb\xa5\xee\xbf\x96\x96\x166\x98\
+\x19\x0a\x85\xb0n\xdd:\xdd`\x0b!\xd8\xd0\xa5\x22\x0d\
+fgg\x11\x0a\x85\xd8\xe0\xb7\x8b\x19\xa7\x0da,\x16\
+\xd3Zp!\x04\x1a\x1a\x1a\xf0\xfa\xeb\xaf\xa3\xb5\xb5\x15\
+\x9e\xe7\xe95\x8dD\x22\xa8\xac\xac\xd4\xd2\xaa\xfc\xfc|\
+6|J\x87;\xeb\xeb\xeb\xd9p5\x0d\x1dr\xb1\x90\
+t(\xcfD6\xfe\xb0\xa0a\xd9G\x80\x1ec9\x09\
+h\x17\x1c\xf1\x91aM\x97\x94\xc3\xb4C\x84/\x8f\x90\
+t\xc84\x01\x16\xcd\x81P\x80\x0f\x15&\xb1LQ~\
+\xda\xfc\xf5\xa0e\x19B\xc0\xe17c$\xddH2o\
+\x99\xb0i\x14\xe0Z\x0b\xe9\x9c\x08\xf5\x9b\x12=t\xab\
+\x80#\x19\x18\x85\x1e\xdc\xe4 W\x07\xf1\x08_n$\
+\x5c\xefA\x1a\x0d\xce\xf1\x93\xc1H\xb7\x13!\xe0\x1a\xb2\
+d\x8b+\xd9\xfd\x22D\x92\xfc!\xe2\x05\xe9\xcf\x10\x18\
+kj\xcc)\x08\x06\xe8\x85\xf6#\xa7\xb3\x06~\xea\xac\
+\x04\x1f$\xb5\x8fX\xdd\x8fT\xba#\xc8\x16\x86\xa0\xfb\
+*\xc6\x92\xa4\x19\xf3t\xa5\xeb0\xea\x9f\xff\xfc'\xbe\
+\xff\xfd\xef[\x00\xa9\xb8\xb8\x18\xd7^{-N>\xf9\
+d\x00\xc0\x96-[p\xd7]w1\xc6*\x18\x0c\xe2\
+\xec\xb3\xcf\xc6'>\xf1\x89\x94\x1fWSS\x93\xa5\xfb\
+\x1c\x1e\x1eF \x10\xb0l\x0c\x95\xe7\xf0bkdd\
+\x84i\x9e\xe9k\xf6\xf7\xf7cll\xcc\xc9\x00\xbeS\
+588\x88\x9f\xfe\xf4\xa7x\xfc\xf1\xc7\x19\x03\x99\x99\
+\x99\x89\xf3\xcf?\x1f_\xfa\xd2\x97\x10\x0c\x06\xd1\xdd\xdd\
+\x8d[n\xb9\xc5b\xce\xeb\xeb\xeb\xf1\x95\xaf|e\xc9\
+=\xae{zz\xac\xa0*\xb5vf\x08Q \x10H\
+\xaa3w\x81o%\xd5Y\xbdz5\xfb\xdd\x81\x81\x01\
+K\xbf\xfe^-)%\xa6\xa6\xa6p\xe0\xc0\x81\x94\xfc\
+w4r\x07<\xcf\xb3\x9a\xd6\x15+V\xe8\x90\x1f3\
+\x1d\x946\x8dYYYlpY\x81o\xd7=p0\
+\xb9\xda\xc4\xc4\x04\xfb\xcc\x0a!\xf4NWgg'\xfb\
+n\xa03%\xaa\xc9\xa7n6SSS\xfa|\xd6\xae\
+]k\x85\x9b\x1d\xb4\xb9\xd5V{\xd2qm\x15\xebI\
+~&\x84\x95Li\xd2\xa5f\x92\xbc\xd6x\xbb\xd4\x1a\
+\xd2g_\xad\xf4wA}\xbeM\x10Gd\x14v\x02\
+\x8f\xcf\x80\xb3\x08J\xc1\xf5\xc7&kn\xc5\xdfp\xfe\
+\x9d)J\xa4#0\x88\xb0\xeb6\x11+\xb9\xf9\x07\x09\
+7R\xb6\x84\x9a\xcd\x16F8\x90\x80s\xcaQ\x89\x91\
+\xa4p\xa8\xb9%3\x93\xb4\x9e\xe5\xba\xe6\xcc\xa5\xc6\xd1\
+\x5c\xa8aI\xaa\xd5\x16\xd2?Dz\xae\x0b\xd7N\x85\
+NI\xa6\xd1\xf7\x9b>\x8b\xac\x86\xd2\xf6K\x22Y!\
+#\xb9\x09\xabCW\xe0\x90\xd1\xc9H\xc2\xa7\x1b\x1e\xfc\
+~\xe4Q\x02\xf8\x1b\x82\xf740OW\xba\x0e\xb3:\
+::\xf0\x83\x1f\xfc\x00\xaf\xbe\xfa*\xdb\x82,,,\
+\xc4\xd5W_\x8d\x0f~\xf0\x83\x0c\x9c\x9b\xb1\xf6\x17_\
+|\xb1\x06\xf0\xa9\xa8`0\xe8\xf4\xb0V\xfa\xf2C\x0d\
+\x16r\xfd!7\x01\x83\x92{\xa8\xa0!U4\x1d\xf4\
+\x9d\xac\xd9\xd9Y\xdc~\xfb\xed\xf8\xdd\xef~\xc7\xa4\x03\
+\xa1P\x08\xe7\x9e{.\xbe\xf0\x85/h\xd6\xfa\x96[\
+n\xb1\xb6\xdc\xd7\xaf_\x8f\xcb/\xbf|\xc9S\x5cM\
+\xf0TSS\x83@ \x80h4j\xb9\xe6\x98\xd7X\
+\x959\xf4;<<\xac\xb5\xc2\xa6,\xe7\xfd\x22cy\
+/W{{;\x93\x8b(\xcfr\xcf\xf3\xac\xfb\x81\xce\
+\x1d466\xb29\x15)\xa5\xbeo]C\xa1\xc9,\
+@]C\x9e\xe5\xe5\xe5\x08\x85B\x88\xc5b\xacq\x13\
+B0\xdd\xb8\xf9>\x03\x03\x03:\xdc\xc8\xd4\x9e\xbf]\
+\xb2\xb0\x1a\xf4t\x03R\xdb\x01\x05Zv\xe2Nq\x14\
+\x86\xcc\xc0\x97\xf1Jjjh5\x06Z\x04c\x80v\
+\xa1\x06\x0c\xad\x03\xe7\x00\x96\xbb\x9b\x08\xcd\x90J#\xe5\
+R\xb2\x84\x1f$\x01\xb3\xee\xe6\x05\x8e\xe0\xa5\x85aF\
+\x09\xd3 \xc5!]\xe6\xfa\x11\xd7$'\x16<\xb6\x99\
+\x8d\xa0\x9ea\x14fR\x10\x03\xa4te\x05\x05\x9f\x92\
+\x9bGj'\x13\x0afAt\xe6\x8ek$@wO\
+\xccK$\x88\x83\x8c)2QM\x07\xed\xae\xcc\xd7\xe1\
+k'\x5c\x0d\x11\x88g\x8e\xd9\xa4\x09\xbaH\xfe\xeb\xeb\
+\xa3\x13\x04\xa4[)\xaf\x92\xdf\xdf2\x0d\xcc\xd3\x95\xae\
+#\xae\xe1\xe1a\xdcr\xcb-\xf8\xfb\xdf\xffn\x0dR\
+]s\xcd5X\xb3f\x0d<\xcf\xc3\xdf\xfe\xf67<\
+\xf8\xe0\x83\x8c\xb9\xcd\xcd\xcd\xc5\x15W\x5c\x912\x00[\
+PP\xc0\xb4\x9d\xf1x\x5c\xff\xc1.**b[\xcf\
+\xf3\xf3\xf3\x87\x05\xceLV\xb9\xa4\xa4\x04eee\x88\
+\xc5b\x16\x03\x98\x0c@\x1e\xed\x8a\xc7\xe3x\xe8\xa1\x87\
+p\xf7\xddw3\x99BFF\x06>\xf6\xb1\x8f\xe1\xd2\
+K/\xd5\xe0\xfc\xb6\xdbncn\x15\x81@\x00g\x9e\
+y&>\xfd\xe9O/\xe91\xee\xda\xb5\xcbj\xee\xd4\
+n\x84\xb9+SRR\xc2\xf4\xbd\x14\xcc\xbb\xc0~m\
+m-\xf3\xb5\xf6<\xef=\x19,\xf4~\xab\x96\x96\x16\
+\xf6}\x90\x9f\x9f\xaf\x9bg\x95\x0ej\x82vu\x9d)\
+(\x9e\x9b\x9b\xd3\xb2$5\x90\xadj||\x9c\xed\xb8\
+\xd0r\x0dy\x16\x17\x17kg\x16\x93\xe5.++C\
+(\x14r\xa6z\xaa\xe1N\x97\xf6\xbc\xbb\xbb\xfb\xa0\x01\
+k\x94}\xa6\xc0G\x10\xf7g\x16\xb5NA\x9e9\x94\
+H\xb5\xe3\x86\x09\x89\xa0\xf8V\x98\xe0\x9b\xc8\xca\x99V\
+\x86\xc8\x0d\x88(]7\x00\xd2\xd9i\xe8\xff\xa4\x01d\
+}\xf5{\x12\xea>\xc9\xcf]\xac\xb4P\xf6\x90\x92\x0f\
+$\xb2({\xe5\x99m\xac\x99\x0e\xe9\xb1\xa09\x15\xae\
+\xf3E\x12\xc2\xe5\x02#\xb5\xc3\x8d M\x11s\xa7$\
+\x98X\xb2\xa1L\xba\x0e\x8ef\xc2\x98OM\x9a\xdf\xa4\
+|\xdd\xa5\xd1d\xa8\xdd\x0a!\x8d@*\xff\xf5\x85T\
+\x9e\xe2\xc6m$\xddF=\xeaX(\xc6\x97d[F\
+8z+m\x93I\x0e\x926\x04\x22\xe1\xf8C\xb1{\
+\x1a\x98\xa7+]GX\x07\x0e\x1c\xc0/~\xf1\x0b<\
+\xfd\xf4\xd3\x0c\x9c\x97\x96\x96\xe2\xba\xeb\xaeCuu5\
+<\xcf\xc3\x9f\xfe\xf4'<\xfe\xf8\xe3\xecw\xca\xca\xca\
+p\xe5\x95W\xa6\xc4F\xb1\xb4\xb4\x94\x0d\x89\xcd\xcf\xcf\
+k\xff\xf2\xb5k\xd72\x1b\xbdX,\xa6\x1f;\x94R\
+AC\xaa\xc2\xe10\x9a\x9a\x9a4\xb84\xd97\xa5\xad\
+\x7f\xa7\xcb\xf3<<\xf6\xd8c\xd8\xbcy3\x1b\xdc\xcd\
+\xcc\xcc\xc4\xa7>\xf5)\x5cp\xc1\x05\xba\xf1\xd8\xbcy\
+3suQ\xbf\xb3~\xfd\xfa%;\xbe\xae\xae.\xd6\
+4(-\xb9\x02i\x94\xed\xcf\xcd\xcd\xb5\x18\xf0\xaa\xaa\
+*K\xf3\xab\xc0wMM\x0d\x9b;Pi\xad\xe9z\
+g\xab\xbd\xbd\x9d\xddg\x81@\x00\xeb\xd6\xad\x03\x00\xbc\
+\xf5\xd6[\x98\x9b\x9bc\xd7\x5c\x01^\xd3\x91ell\
+L\xb3\xd5UUU\x0c0\x8f\x8c\x8c\x1c4;\xa1\xb7\
+\xb7\x97\xb1\xf6\x85\x85\x85\xc8\xc9\xc9\xd1\xa0\x9d6\x8b\xc5\
+\xc5\xc5\xc8\xce\xceF(\x14bC\xc6\x94\xb1\x8fD\x22\
+\x96\xf3\xd3\xdb\x0d\x983E\xb1\xf4\x99GI\x9dB\x14\
+\x0b-\x89\x10B\x98\xb1\xf5R\x93\xcaB\x08?|\x86\
+H\xb4\xa59l\xc7\x86\xf1\x1c\xb8\xef ~\xdd\x92\x1d\
+9\x18\xc8Tv\x85\x02\xc2aA.\xec($aB\
+s6e\xe9\x83H\xf2s\x99\xd0/K}\xfc6\xd7\
++\xacp&i\x90\xbb\x92\xab\x81\x14\x905\xa6J\xd9\
+\xbf\x88\xe4G\xb0\x83\xe6\x167B\xc0\xbf\x7f\x8c\xa9M\
+j\xbfh\x8f\xd6\x0a>\xe4J\x11\xb3>^\xdb\x15\x85\
+1\xd3lyi\xcb@W\xc2\xf4@$\xd7@\xdd{\
+\xd2\xf6\xaa\xf1m\x15\xcd\xa6\x22\x89\x13\x10IE\x95\x8e\
+TXi\xeet =\xfc\x99\xaet\xa5\xa4\x94\x87\xb9\
+\x10\x02\x1f\xfe\xf0\x87\xf5VnUU\x15\xbe\xfa\xd5\xaf\
+\xe2\xbf\xff\xfb\xbf155\x85\xfb\xee\xbb\x0f\xc5\xc5\xc5\
+8\xf5\xd4S\xf5s\xd7\xae]\x8bK/\xbd\x14w\xdf\
+}\xf7\x11\xe9[\x9b\x9b\x9bY\xa8\xc7\xf8\xf8\xb8fM\
+M\xbdwVV\x16\xbe\xfb\xdd\xef\x1e\xf2{\x08!\x18\
+(\x08\x85B\xa8\xab\xab\xc33\xcf<\x83\xb6\xb66L\
+OO\xeb-\xf7\xac\xac,455Y\xe1(\xefd\
+=\xfb\xec\xb3\x10B\xe0\x8a+\xae\xd0MCVV\x16\
+>\xf3\x99\xcf\xa0\xb7\xb7\x17\xdb\xb7o\xc7?\xfe\xf1\x0f\
+\xdc\x7f\xff\xfd\xb8\xfc\xf2\xcb\xb5d //\x0f\x9f\xff\
+\xfc\xe7\xd1\xd6\xd6fY1\xa6\xa2:::066\
+\xa6\x8fIi\xc9\x9f~\xfaittt`bbB\
+7o\x19\x19\x19hll\xc4\xd6\xad[\xf5\xf3M\xf0\
+=55\xa5\xf5\xe5\xabV\xadb\xd7ltt\xf4}\
+3\xf8\xf9^\xaex<\x8e\x9e\x9e\x1e\x06d\xd5\xee\x99\
+\x9a\x0dQ\x9f\xa5@ \x80\xa6\xa6&l\xdf\xbe\xdd\x92\
+\xa4\x8d\x8e\x8ebrr\x12B\x08\xf6Z\xc0\x82\xc4\xe4\
+`^\xf5JN\xa3\xee\x0f\xf5y\xee\xed\xedEWW\
+\x17\xe2\xf1\xb8\xfeN)**Bvv6JKK\
+\xd9\xd0j<\x1e\xd7\xc3\x9dMMM\x16\x01`6\xec\
+\xc9\xc0\xf9\x02@6\x13(\xa5\x8e\x85\xa7s\x9b\xfe\x9c\
+\xa7e\x14\xc8\x02\x83X\xec9\xb1,T\x83\xa0\x0a\xb8\
+J&F\xe7t)\x95\xb2K\xea\xa5-\x93\xfc\x7f\x80\
+i\xc6\x95\xbd#\x04=>#\x06\xd4\x9c\x89t\x0c\xb4\
+:\x5c\xfa\x08\xb0\x14f\xbc\xa7\x06\xb2|8\xd4\x07\xdf\
+B\xaf\xb7\xc1\xcf\x1b\x1ao\x1a\xb2$I\xd0\xa7y\xea\
+\xe6N\x844\xcd\xe6\x05a\xd3\xa5\xf5\xea\xce\xd32\xbb\
+\x1a:\xa2K\xc3\x85T\xe8\x94\xe5\x9c(\xa1\xef\x1f\xdf\
+\x8dG\x18!Fd\xe8\x95\xad?\xd1\x86\xd3\xfd\x19i\
+7T\xfa\xdeq\xd9hJ>\x9c+\xd9p\xad\xa4{\
+\x18\xfa\x88\xd2\x8cy\xba\xd2\x95\xa2\x9a\x9d\x9d\xc5\xe6\xcd\
+\x9b\xf1\xec\xb3\xcf2\xa6i\xcd\x9a5\xb8\xea\xaa\xab\x10\
+\x08\x04\xb4\xe6\x99\xfag\x07\x02\x01\x9cs\xce9\x9a-\
+;\xdc2m\xf4TxP$\x12\xb1\xa4\x0fB\x08\xe4\
+\xe5\xe5\x1d\xf2\x7f\xb9\xb9\xb9<!\x0f\xd0\x92\x0b\x95Z\
+H\x99\xe6\xa3\xe9\x07\xbe\xd8z\xe6\x99g\xf0\xeb_\xff\
+\x9a\x0d\xe4\xe6\xe7\xe7\xe3\xca+\xaf\xd4\xeb\xf4\xc4\x13O\
+\xe0\x99g\x9ea\xd7\xb1\xae\xae\x0e\x17]t\xd1\x92\x1c\
+S,\x16\xb3<\xd5\x15Hs\x85\x10\x99\xeb\xda\xd0\xd0\
+\xc0\x9a2\x9a\xeai\x0e\xfd\x9a6y\xe9zgYs\
+z\x8f\x95\x97\x97#???i\xd0P0\x18t\x82\
+\xefX,\x86H$\xc2v\xcc\x94\x8c\xe4`\xb5o\xdf\
+>\x16\x86&\x84\xd0\x12\xb4\xbd{\xf726=33\
+\x13+W\xaeDSS\x13\xbb\xd7\xc6\xc6\xc6\xb4V\xbd\
+\xb1\xb1\x915\x81\x83\x83\x83\x8bkd\x19yI&\xfb\
+\xe0\xb6\x12t\xfd/\x9f.\xa7\xd8J\xda\x09\x9d\x92\xc6\
+\xb5S\xf9\xafH\xb0\xd0\xc2}\x80\x0e3\x11\x0a\xfa\x91\
+\xc4\x13]\x10P\xaa!\xaf\x90\x0e$K\x13J\xdd\xbe\
+\xe1\x86,[\xcfo*\xc7\x14\xcd\xd8JC\xf8cX\
+/\xea\x84L\xebX\xd9L\xa8\xd14\xc1\xe9\x1foY\
+\x7fK\xcacK+L\x88\x0d\xbf\x0aW\x00\x90\x92\xed\
+\x98\x0b\x90\x08\x06\x12\xc2j\xca$\xa5\xf1M\x1bvI\
+\xaf\x01i\xfc\x84 \xc3\xa6\xc2AsK\xe7\x9d&E\
+\xa2\xd9a\xfa\x19\xc1\x9a !yG'\xc96\x850\
+\xec\xdd\xa9\xe2]\xd9v\xa6\x81y\xba\xd2\x95bp~\
+\xfb\xed\xb7c\xfb\xf6\xed\x0cx\x9f~\xfa\xe9:F|\
+xx\x18\xf7\xddw\x1f\x1b\x88\xca\xcd\xcd\xc5\xa5\x97^\
+z\xd8\x96oyyy\x96\xb6\xb3\xad\xad\x0d\x9e\xe7\xa1\
+\xb0\xb0\x10\xa5\xa5\xa5Kv\xceUUU\x08\x87\xc3\xd6\
+p\xa8\xe9\xe4\xf0n\xaa-[\xb6\xe0\xc1\x07\x1fdr\
+\x81\xca\xcaJ\x5c}\xf5\xd5:d\xe5\xb7\xbf\xfd-\x1b\
+\x06\x0d\x04\x028\xeb\xac\xb3\xb0v\xed\xda%9\xa6\x96\
+\x96\x16\xf6\xef\x92\x92\x12m\x8bgj\xfb\x97/_\xce\
+<\xe9]MY4\x1a\xc5\xb2e\xcb, \x97\x0e\x16\
+z\xf7Tkk+\x93\x86\x15\x17\x17\xeby\x00\xf5\xf9\
+\xa5\xd7|\xc5\x8a\x15\x8c\xadV\xd7Z\x81b\xea\x94\xe2\
+\xbao\x5c\x0d!M\xed\x15Bh\x99\xca\xc0\xc0\x00\x93\
+W\xa9\xcf\xb39\xdc\xd9\xdf\xdf\x8f\xe9\xe9i\xa7\xf6\x5c\
+\x85\x0e\xbd-.\x97\x5c\x12\x22\xa9p 1\x80)\x5c\
+\xce\x1f\x82'b\xfa\x0et\xc2Nc$@H\xb1\xea\
+T\x9e\xc1\xa5)T\xc6!\xec\xd7\x91\xacw\xf0\x99X\
+K\x07MXr\xf8n(2\x01\xc2\xa5#%\x89K\
+Y|}\xbb\x94\x0e\xe5\xb7\xf4\x87c\x95[\x0d\x93\xc7\
+\xc3p\x90a\xcf\x15\xd6\xf8\xacd\xda\x94\x83{|\xb3\
+\x9f\x08\xe2dB\xa1\xad\xa0\x92\x1b7\xa8w\xea\x88\x12\
+M\x06\x1f(\x95\xbe\xd8\x5c\x18\x83\x98\x89s\x17J\xd7\
+o^'\x05\x9ci\xe3\x958X!\x14 \xa6=\x80\
+\x9f&j&\xbc\x0a=k l\xcfL%\xcf\x11\xb4\
+\x93\x22\xed\x80p\xde\x1e\xbaIP\x92\xa440OW\
+\xbaR\x5cSSS\xf8\xbf\xff\xfb?\xe6\x86\x90\x91\x91\
+\x81\x0b.\xb8@\xdb\xd6\xbd\xf2\xca+\xd8\xb2e\x8b\xc5\
+\xac\x9fu\xd6Y\x87\xf5\x9e\xf9\xf9\xf9\xcc\xbf\x98\x86\x07\
+\xd5\xd4\xd40_\xe1TWvv\xb6f\xfbM P\
+UU\xb5\xe4\x8e&\x87[\x7f\xfa\xd3\x9f\xf0\xc4\x13O\
+0V\xb0\xb9\xb9\x19\x17_|1\x80\x05\xa6\xfa\xbe\xfb\
+\xee\xb3\x98\xf5\xa5\x1a\x04moo\xb7\x9a5\xd5\xd8\xec\
+\xdd\xbb\xd7\x0a!RLxNN\x8e\x15*\xa3\xae}\
+]]\x1d\xd3\xf9OOO\xbfc\xde\xf2\xe9\xb2k\xc7\
+\x8e\x1d\x8c\xb1\xce\xca\xca\xd2M\xd6\x9e={\xac\xa0!\
+\xd3\xa6PJ\xa9\xbfgjkk\x19\x93=33c\
+\xb9(\x99\x15\x8f\xc7\xad\xdd\x98\xb2\xb22deea\
+~~\x9e\xed\x80\x09!PUUe\xa5z\xaa\xe1N\
+\x97\xf6|\xf1\xceO2\x01N$\x03\xc3\x84\xe2M\x80\
+;C\x9f\xedHpd\x88Y\xba\xfc^\xa4S&\xa1\
+^R\x18zmm\x9b'\x93\x1d\xb9\xd4d5\x1dz\
+\xe4\x1e\xd9\x82\x01;\x9f\xe96\x00\xb0\xb2\xdf\x96\xc6\x0f\
+\xd4\xb1Iy\x10\xb7\x15\x0e\xc8}P\xebHU\x15F\
+\xa0\x12mP\x12\x09\xa4\xd2N\xcbYx\xad$S\x91\
+\xc2\x90\x1b\xe9u (\x9d{\x9c\xc0\x02\xc4\xcc\xda&\
+!4R\xc0\x98\x87\x09)y\x10\xef\x90\x0e\xea\xef\x93\
+\x98;\x10\xd6p\xa6\x80\x99\xc9$\x99VGZ.0\
+~\xba*\x5c\xadF\xe2\xb0\xec\x84Wi\xbe\x1e\x99\x17\
+\x10\x04\xb9\xa75\xe6\xe9z\xdf\xd7b\x81a*\xb7\xf7\
+\x07\x07\x07\xb1i\xd3&\xfc\xe7\x7f\xfe\xa7\x1e\xca+(\
+(\xc0\x17\xbe\xf0\x05|\xf7\xbb\xdf\xd5AE\xc7\x1dw\
+\x9cv\xd3\x08\x85B8\xff\xfc\xf3\xf1\xdcs\xcf\x1d\xd4\
+\xc5\xc0U\xabW\xafFvv\xb6\xfe\xf7\xec\xec\xac\xd6\
+}\xbe\xf5\xd6[\xf8\xcew\xbe\xb3d\xebK\xb7\xcc\xd5\
+p\xa8\x02\x08\xf9\xf9\xf9hll|[\x17\x90w\xe2\
+\x1ay\x9e\x87{\xef\xbd\x17\xe5\xe5\xe58\xe9\xa4\x93\xf4\
+q\x9c{\xee\xb9\xf8\xd7\xbf\xfe\x857\xdf|\x13\xdb\xb7\
+o\xc7\xb3\xcf>\x8b\x8f\x7f\xfc\xe3\xfay\x1f\xf8\xc0\x07\
+\xb0a\xc3\x06\xb6+\x92*`~\xe0\xc0\x01}\x1dC\
+\xa1\x10\x1a\x1a\x1a\xb0m\xdb6tvvbrrR\
+\xb3\xa9YYY\xa8\xad\xad\xc5k\xaf\xbd\x86\xfa\xfaz\
+\x06\xbe\xa3\xd1\xa8f\xfa\xeb\xea\xea\x98\xb5\xde\x81\x03\x07\
+\x9c)\x8c\xe9zgj||\x1c\x83\x83\x83z>@\
+\x08\x81\xd5\xabWc\xcb\x96-hii\xc1\xf4\xf4\xb4\
+\xbe~\x99\x99\x99\xd8\xb0a\x03\xdbUSAE\x00P\
+QQ\xc1>G*\x0d\xf4\xed>\x03j\xc8S\x01\xae\
+e\xcb\x96!\x12\x89`ll\x0c\xfd\xfd\xfdl>e\
+\xf9\xf2\xe5,\xdc\xc8\xf3<\xdd\x04\x96\x96\x962\xf7\x1f\
+\x1a:\xb4\x08X\xce\x80(\x0d\xf0\xf1\xe5\xc1f\xe2\xa2\
+\xe4.t\xd2\x97(p\xbfp\x13\xa4QHj'\xcc\
+Ha*\x98)cK\xdf\x10\xdc\xc6Ep0/\x08\
+\x18\x13ZT\x9dxee\xb5(ERM4\xcb\xda\
+\x81\xbf\x16\x82\xf8\xeb\xf93\x97*\x0cG\xb20&\x82\
+\x06\x89\xfe\xda\x1c\x92\xb4\x1dX\xa4\x14Nkv\xff\xd8\
+\x89@\x85\x89\xaf\x05\x81\xa2B\xcb\x86\x1c\x9e\x97\xec\xb9\
+\xd2rA\x91Z\xae\xe2\x9f\x9b\x83n\x96\xfc\xd8\xcc\x9f\
+\xf1\xfbK\xbab\x8b\xd8\xf3\x04\xedt\xc89\xf93\x02\
+\x92]w\xc1\x12b\x03Pr\x14\xc7-a\x0d\xd0\xb2\
+\x19\x03\xf0<\xaa40O\xd7\xfb\xba\xbe\xf9\xcdob\
+\xc3\x86\x0d\x8b\x02iw\xdey'\xb6l\xd9\x92\xb2\xf7\
+\xde\xb7o\x1f\x1ez\xe8!\x5cq\xc5\x15\x1a\xa8\xae]\
+\xbb\x16\x9f\xfe\xf4\xa7\xf1\xc0\x03\x0f`tt\x14\x8f>\
+\xfa(\xae\xbe\xfaj\xfd\xc7\xb6\xba\xba\x1a\xa7\x9dv\x1a\
+\x9e}\xf6\xd9Cz\xaf\xb5k\xd7&\xddB\x9e\x98\x98\
+\xb0d\x12KUCCC\x18\x19\x19\xd1\xf2\x89p8\
+\x8c\xd5\xabW\x1f\x14\x98o\xdc\xb8\x11\xd7]w\xdd\xa2\
+^\xff\x8d7\xde\xc0\x0f~\xf0\x83\x94\x1do4\x1a\xc5\
+=\xf7\xdc\x83\xea\xeaj\xcd:\xe7\xe7\xe7\xe3\xb2\xcb.\
+\xc3\x7f\xfd\xd7\x7favv\x16\x8f>\xfa(N<\xf1\
+D}N\xd9\xd9\xd98\xe7\x9csR\x0e\xcc\x95\x14\x88\
+\x02\x1f\xc5\x9evwwcxx\x98\x01\x1f\x05\x98\xaa\
+\xab\xab\xad`!\xc5\x8a\x9baD\xfb\xf7\xef\x7f[\xb0\
+\x96\xae\xa3WJKN\xe7\x00\xaa\xab\xab\xb5\x97xo\
+o/\x0b\x13Z\xbbv-\x03\xdf\xd4\x91\xc5\x1c\x0a\x1d\
+\x1e\x1e^\xd4\xb5\xee\xe9\xe9aC\x9eyyy(,\
+,\xc4\xc8\xc8\x88N\x0dU\xef\xb9b\xc5\x8a\xa4\xc3\x9d\
+\xc7\x1dw\x1cc\xec'''\x0fqwFr\xa6\xd6\
+\x1a\xae$\xff0\xe6'\xa5\x90\x9a\x15U\x8c\xa5\xfau\
+\x13\xaaJ\x92@d\x19\xb4\x08?-\xa2sjC\x00\
+\x00 \x00IDATR\x083\xcd\xd2\x1fF\xf5\xe5\
+2\x829qpY\x88\xd0 Z\x9aX\x1e\xe4\xfd\xa5\
+9l*H\x12\xa7\xf9<a\xe3N\xc9\xe5*\x16\xa1\
+-,\x957s\xc1\x91\xc2\xc50;\xd2I\x13\xaf\xc5\
+\xa4%\x09F[\x0ai\x8cd\x92\xb4O)\x99\x8d\xa0\
+\xfa\x0d\x8a\xe5\x93\xa8\xfa\x8daNI\x06u\x1d\xc3\x97\
+\xf4*Xk\xa7\x9c~\x84C?\x9f\xc4\xf6\x92y\x1f\
+\xaaF\x89\xd8E\x92\xe1M\x0a\xbb}P.\x9c\xcd\xa7\
+$\xaf\xe1\xff\x8e\x9fl*!\xd2\xc0<]\xef\xef\xca\
+\xca\xcabn\x15\x07\xfb\x03I\x19\xe7T\xd5SO=\
+\x85\xa6\xa6&\x9c~\xfa\xe9\x00\x16B\x80\xce;\xef<\
+<\xff\xfc\xf3\xe8\xed\xed\xc5\xd6\xad[\xf1\xd1\x8f~T\
+K\x16B\xa1\x10\xce:\xeb,<\xff\xfc\xf3\x8bf\x87\
+\xc3\xe1\xb0\xd3\xc3\xda\xf3<\xe4\xe4\xe4\xe0\x93\x9f\xfc$\
+cM\x97\xa2\xa6\xa7\xa7\xf1\xe0\x83\x0fbxx\x18\x03\
+\x03\x03\x1a\xc4\x06\x02\x81\xb7\xd5\x99\x07\x02\x81E]#\
+\x00K\x22\xc9\xe9\xea\xea\xc2\x83\x0f>\x88/\x7f\xf9\xcb\
+z\x9dV\xaf^\x8d\x8f}\xeccx\xf8\xe1\x87\xd1\xd7\
+\xd7\x87\x17^xA\xcf\x08\x00\x0b\xee\x13uuu)\
+g\x9f\xf7\xed\xdb\x87\xe3\x8f?^\xff\xbb\xb2\xb2\x12y\
+yy\x98\x98\x98@{{;\xd3\x92\xafX\xb1\x02\x81\
+@\xc0J\xf5\x1c\x1c\x1c\xc4\xf0\xf00\xc2\xe1\xb0Nr\
+T\x95\xd6\x97\xbf\xfb\xaa\xbd\xbd\x1dg\x9cq\x86\x06\xbf\
+eee(,,\xc4\xe0\xe0 :;;\xd1\xdc\xdc\
+\xcc\xbe\xcfL\xf0\x9d\xcc\x91\xa5\xaf\xaf\x8f\xc9\xb4\x92\x95\
+\x1a\xf2T\xa0:\x18\x0cb\xd5\xaaUhmm\xd5\x83\
+\xc2\xea\xd8\xcc\xef\x91\xa1\xa1!m?ZWWg\x85\
+\x0e\x1d\xcc\xaa\xd1\xc2A\x92\x0c\xc2\x09\x87^\x5c\x107\
+j\xc1A\xacK\xab\xed\x0f\xf5\xb9\x9c2\xfc\xe7Q\x00\
+.\xa4\xe55\xc2\x80\x9ap\xbe\x0fe^\x09\xf8\xd3\xb2\
+c\x0e\xa5%}1i[\xbahpk\xb8\xac(\xe6\
+]\x0f?\x1aH_\xe8\x034Xc\xdd\x1cH\x02,\
+\x09\xe3Nv\x09\x98\xef\x89\x83y\x16Z2\xe2\x1f\xa3\
+4\xfc\xb8\xe9 /I\xa0O\xb0\xce\xee\x16\xc1g\xe8\
+}\x9d\x0fS\xaa\x08\xf3\x8aPw\x13\x82\xeeU#&\
+\xfc\xd7c\xf6\x94\x9a\xcdN\xc8Z(g.l\xb6]\
+\xb3\xf5\xaa\xb9c\x0a+2P\xe0\xca\x8a\xd2\xefM\xdc\
+c\x04iT\xa4m\xc3\xb3p\xeci\xc6<]\xc7\x00\
+#\xb5\xd8:\xdc\xc1\xcb\x83U,\x16\xc3\x03\x0f<\x80\
+\xe6\xe6f\xcdv\x16\x16\x16\xe2\xd3\x9f\xfe46m\xda\
+\x84\xa9\xa9)<\xfb\xec\xb3\xa8\xab\xab\xd3\xddscc\
+#\xca\xcb\xcb\xad\xf0\x8fd\x95\x9f\x9f\xcf\xfe(\xd3\xf0\
+\xa0\xda\xdaZ\x5c|\xf1\xc5K\xae\xf3\x9e\x99\x99\xc1\xab\
+\xaf\xbe\x8a}\xfb\xf6\xa1\xad\xad\x0d\xc7\x1dw\x9c~\xcc\
+\xf4\xdc6k1\xe0\x81\x82\xf8\xa5\xa8g\x9ey\x06\xa7\
+\x9cr\x0aN<\xf1D}/\x9c{\xee\xb9x\xfa\xe9\
+\xa7q\xe0\xc0\x01l\xd9\xb2\x05g\x9du\x96f/\xf3\
+\xf3\xf3q\xc2\x09'\xa4\x1c\x98+]\xb1\xd2\x11\xe7\xe6\
+\xe6\xa2\xa1\xa1\x01\xaf\xbd\xf6\x1av\xef\xde\x8d\xb3\xcf>\
+[\xdf'\x05\x05\x05hll\xb4\x9a2*c\xa1\x83\
+\x82\xb1X,i\x0ad\xba\xde\xb9R\xd7\x5c\x81\xde\xc2\
+\xc2B\x14\x17\x17cppP\x0f\x87R&\x9aV\x7f\
+\x7f?\xe2\xf1\xb8n\xe0|\xfc!\x17m\x89\xd9\xd7\xd7\
+\x87\xa9\xa9)\xfd\xfe4\xe5s\xcf\x9e=\x07}\x7f\xb5\
+\x03\x13\x0a\x85\xac&P\x85\x0e\x1dR\x09\x7f(\xd3\x07\
+\x9e\xd2\x08r\xe1\xbf/Y\xe2\x0b\x15\x9fH\xae\x18`\
+\xcf\x95\xc4\xfb\xda\x08\x98I<\x81Z\xf3\xa9\x9fi\xeb\
+Aa\xe1|\x0dzM\x08\xae\xe4*\xf4\x9c\x14\x5c\x93\
+\x06\xf1\xcb\x1c\x14\x13\xf2\x22j\x93H\xed\x0a\xcd\x1e\x84\
+\xe2|\xa6\xf6P\xf6\x88\x16\x10\x04\x98i\xa1f\xdb\x15\
+\xd2\xb7\x15\xea~c$|i\x8f +%\xfc\x03\xf2\
+\xdf\x8e\x8a\x87L\x83K\xc9\xc2\x90\x84y!\x1c\xfd\x91\
+\xba\x90\x82_0\x1b\xbd+\xcbC\x90AMi\xa7\x7f\
+\xb2\x85\xa7\xc7(\xf9\xe0\xaf\xb050\xc4DQ\xd8\xd4\
+xb\xf1M@\xcfB\x9e\x92\xfd\x9dK\x7f-\xa6+\
+\x0d\xcc\x97\x0e\x98\x03\x0b!\x1e\xcf?\xff\xbc\x1e\xf4\x14\
+B\xe0\xa4\x93N\xd2\xd2\x89\x17_|\x11ccc\xfa\
+\xf7\xb3\xb3\xb3\x99\xcf\xf9\xdbUUU\x15s\xe8\x98\x9b\
+\x9b\xc3\x9bo\xbe\x09`a\x98\xf1h\x0c_fff\
+ji\xc5\x8e\x1d;\xd8PkII\xc9A]a\xde\
+\x0d\xc0\x5c\x05@\xd1\xad\xff\xf2\xf2r|\xe4#\x1f\x01\
+\xb0 %\xa1r !\x04N8\xe1\x84\x94\x1fGg\
+g'\xb3\x97\xcb\xce\xce\xd6\xf6u\x9d\x9d\x9d\xec\xf8r\
+rr\xb0~\xfdz&u\xa0\x9a\xdf\x95+WZ\x12\
+\x17\xd3\x82/]\xef|\xed\xde\xbd\x9b]\xd7\x8c\x8c\x0c\
+\x1d\xdae\x06\x0d10H\xc0\xf7\xaaU\xab\x18x\xf6\
+<o\xd1M\x989\xe4\x09,h\xc9\x83\xc1 &'\
+'\xd9w\x93\xf9\xfej\xb83\x14\x0a\xb1\x01d\xcf\xf3\
+\x0e9Y\xd8go\x85c P\x10\x1b?\xc9p\xfc\
+\x82\xab\x06\xb4\xf3\x87\xff\x19%\xe41\x8b\xfdL\xbc\x9e\
+\xb4C\x83\x18\xd3n\x8a\xbb\x95DB\xb2\xe9L\xcd\xbc\
+J\x07sO\xc7+-\xd5\x8c\xb2\x13$\xe1<Z$\
+\xa2;\x09{8Rr\x1c\xe97#\xc4\x05\xc4t]\
+\x142\x89^\x04d\x8d\x0c\xb3G\xe9\xbb\xbc\x1b\xe7\xe4\
+\xcf\x01Hc\xa8U\xe7\x9a\x1a\xd6\x85J~\x22\xa4i\
+A(\x98K\x0e[+\xe17W\xd6\xa2J\xf5\x98\xd1\
+`\x90\x84Q\x983\x01d\xe7\xc4\x1a.\xa6L?{\
+\xab\x84\xcbK\x12G\xc5\x83\xf9\xd7\x08\xe6#\xc9\x13?\
+\xa5s\xfeA\xeaY\x8940O\xd7\xfb\xba\xa8\x93\x05\
+\x00l\xdf\xbe\x1d\x9b6m\xc2/\x7f\xf9K+rz\
+\xa9\x80\xb9\xe7yx\xf4\xd1G1<<\xac\x7f\x96\x97\
+\x97\x87s\xce9\x07\xc0\xc2v4u3\x09\x04\x02X\
+\xb3f\xcd\xa2A\xa8\x09\xbe\x95\x9c\x04\xc0Q\xf3\x11\x0f\
+\x06\x83Z\xb2\xd2\xd3\xd3\xc3\xd25\xb3\xb2\xb2\x0e\xea\xd1\
+n\x0e\xba\x8e\x8e\x8e\xe2\xb6\xdbn\xc3m\xb7\xdd\x86\x97\
+_~\xf9\xa8\x5c#`A\xbf\xfe\xdak\xaf\xb1\xebp\
+\xfa\xe9\xa7\xeb\xf7|\xf9\xe5\x97Y\xa3W^^n\xe9\
+z\x8f\xb4\xfa\xfb\xfb\xb5'\xb4*%Uioog\
+\xf1\xeaB\x08\x1c\x7f\xfc\xf1L\xde399\xa9\xc1\xf7\
+\xea\xd5\xab\x99\xceqhhh\xd1\xbb0\xe9:z\x15\
+\x8f\xc7-\xf7\x14\xf5Y\x1a\x18\x18`v\x86&0V\
+\xe0{\xc5\x8a\x15\xec\xb3q\xe0\xc0\x01\x8c\x8e\x8e.\x0e\
+\x10Ki9\xb3\x94\x96\x96\x22\x12\x89`~~\xde\xba\
+\x1f\xe9\xf3\xd4pgCC\x03\xbb\x0f=\xcf\xd3\xc3\xe7\
+\x8b.a\x98\x0bJ\x1b\x10J+A\xd2\xff\xb7\x10\x1c\
+HJ+\xc4\x86\xa0)\xfd;\x1c\xa0\x89\x84\xa4C$\
+|\xd3%\x01p\x22!3\x10\xa6\xe5\x8a\xa4\xe1?2\
+\xe9\xb9\x99\xd3\x94\x0bv\x89J\x9fMA\xa3\xefL\xe3\
+Z\x07\x91h\x0c\x84 \x00O\xfa\xcfU\xbau\x0a\x18\
+\xa5p[G\x0a@{gK\x0b\xad';\x17\xdf\xd5\
+\xc6\xd2kK\xd5l\x08rM\xa5/\x18\xf1=\x14\x0d\
+0\xaa|\xe4\xf9kI\xdda\x19\xce;z\xa7\xc3\xe9\
+-\xe3+z\x5c\xde\xe6R\xc0\xed\x9e\x9e\x00\xd9\xd6C\
+\x82{\xaf\xb3\xd7\x93~\xc3h\xfa\xa7\x1b7(\xf3\x83\
+\xd7Kl\xa7\xabJ\x91\xd6\x98\xa7\xeb}^&\xdb4\
+22\x82'\x9ex\x02YYY\x9a\x0d\xa5\xac\xefR\
+\xd5\xd0\xd0\x10^{\xed5\xfd\x9e\x81@\x00\x1b6l\
+\xc0\xfd\xf7\xdf\x8fX,\x86\x9d;w\xe2\xc4\x13O\xd4\
+@\xaa\xa6\xa6\x06\xc1`\xf0m\x19\xff@ \xe0\x0c\x90\
+\x89\xc7\xe3\xc8\xcf\xcf\xb7l\xf4\x86\x87\x87S\x16\xc7^\
+RR\xc2\xbc\xd3\x95dehh\x08CCCZF\
+\x11\x0a\x85P__\x8f\xe7\x9e{.i\xf3D\xd3\x07\
+\xe7\xe7\xe7\xf1\xe4\x93Oj\xf0\xbbq\xe3F\xc6&.\
+em\xd9\xb2\x05'\x9ex\xa2\xde\xd6\xaf\xac\xac\xc4\xff\
+g\xefM\x83\xec\xba\xae\xb2\xe1g\xdd\xa1o\xcf\xa3Z\
+Rkn\xb5dY\x92e\xc9\xb3C\x88\x07\x1cg\x00\
+\x07\x9c\xe9\x0bI(\x92TA\x85\x8f\xe2+\x0a^(\
+\x8a\xaf\xe0'PEQ\x84\xf7\x0byy\xa1R\x10\xa0\
+ \x18B\x92\x17B\xb0q\xec$x\x8a-\x0frl\
+\x0dn\x0d-\xb5\x86\x9e\xd4\xf3x\xfb\xde{\xd6\xf7\xe3\
+\x9c\xbd\xcfZ{\x9fnM\xb7e\xb5}VUbu\
+\xf7\xbd\xe7\xec\xb3\xcf\xf4\xac\xb5\x9f\xf5<\xb7\xddv\x1b\
+^~\xf9e\xeb\xfai(I\x0d\x0d\x0d\xe8\xe9\xe9\xa9\
+:\xd8=}\xfa\xb4\xd2J\xdf\xbcy3\xb2\xd9,\x8a\
+\xc5\x22\xce\x9d;\xa7\xe6\xdcu\xf5\x9c\x98\x98\xb0\x0dw\
+.\x85\xc8\xb8\xc0\xa6qcE\x10\x048s\xe6\x8c\xa2\
+\x7fm\xd8\xb0\x01\x0d\x0d\x0d\xd6\xc1\xd5\xa5\x89\x98$l\
+ll\x0c\x99L\x06\x1b6lPI\xd8\xd8\xd8\xd8e\
+7\xf9\x06A\xe05y\xb6\xb5\xb5\xa1\xb6\xb6\x16\xd3\xd3\
+\xd3\x18\x1c\x1c\xc4\xbe}\xfb\xbc\xef\xcd\xce\xce*ga\
+\xd7]\xd6\xad\xc2_:C\x90\x95W\xf6*\xd9\x04\xad\
+^\xc1\x94\xa0+\xe2\xc8 \x86\xdce\xf6*\xa2R\x94\
+Qs\xa4\x85\x12H\xc2\xf0\xe2}8\xca(R\x7f|\
+\xb9\x83\xd3\x9c\x06\x01\xfa\xc81F\x12\xc7Lj\xefb\
+\x1c\xc9r\x8f\xd6m\xd4\xd9\xbdjQ\x95J&B\xca\
+\xd0;*\xa3\xd6\xe3\x1e3i\xf5\x15!\xc7\xad\x14i\
+\xe0\xf8\xb8Z&;\xb9\xf4\x18\xe5\xab\xea\x81h\xf9y\
+\xb3\x8fXM\x85=*\x92i\xd4$\xf2\x85\xd5)i\
+.\xe1\xb0\xa1\x5c\xc1\x1e\x82\xe5\xc1\x87\x8d\xc6d\xc7\x16\
+7\x05\x0b\x07W&O\xae\xd2c\x119\xf6\xa9r\xc6\
+R`\x9e\xc6;:\x8a\xc5\xa2\x92\x02\x93\x95eI\xa1\
+ \x22\xb5\xec\xbf\x12/\xdf\xe7\x9f\x7f\x1e\x0f>\xf8\xa0\
+}\x81\xad_\xbf\x1e\xdb\xb6m\xc3\xf1\xe3\xc7\xf1\xc6\x1b\
+o \x08\x02\xfb\xb7\x96\x96\x16\xdb\x00\xb6\x5c477\
+\xab\xaam\x10\x04\x96c\xdc\xd2\xd2\xe2QH\x0e\x1e<\
+\x88\xbf\xfa\xab\xbf\xaa\xca1\xbd\xff\xfd\xef\xc7\xaf\xfe\xea\
+\xaf\xda\x9f\xd7\xae]\x8b\x96\x96\x16LNN\xe2\xec\xd9\
+\xb3\xaa\xe9\xd3M\x1e\x5c`^.\x97\xed\xb1\xcbs\xe4\
+\xaex\xb8\xcdo\xd5\x8ec\xc7\x8eaxx\xd8rl\
+\x0b\x85\x02n\xbd\xf5V\xbc\xfc\xf2\xcb8{\xf6,\xc6\
+\xc7\xc7-0\xcf\xe7\xf3U\xaf\x98\x03\xa1\xd1\xd0\x07>\
+\xf0\x01;\x0f\xcd\xcd\xcd\xe8\xe9\xe9Aoo/\x8e\x1f\
+?\x8e{\xee\xb9\xc7~\xd6]A06\xea\x9b6m\
+R.\x90A\x10\x5c7e\x9e4\xae<\xfa\xfa\xfa\x14\
+\x97{\xcd\x9a5hii\xb1\xe0\xf7\x9e{\xee\xf1V\
+\xd0\xc6\xc7\xc7177\x07\x22RJ>@\xd8\x00|\
+%\x8d\x97n\x93g}}=\xba\xba\xba022\xe2\
+\x81v\x13\xc3\xc3\xc3\x98\x9f\x9fG&\x93\xf1L\x87\x06\
+\x07\x07/\xcbX\x08H\xc4a\x02\xb1\x09\xd8f\x01,\
+\xfbb\x86\x86\xf6@\xae\x8e5;\xa6\xe7\x92W,\xf5\
+\xc7\x1d\xa0(y\xdb\x10t\x15\xc3\x19\xb6*\x1f\xa2*\
+\x1f\xf1i\x18\x1a\xfcY\xfe\xb6\x83\xdb\xc96*\xc2\x93\
+\x1bd\x96\xd5i-\xbeM\x90r\x85\xb2\xc32n\xf2\
+LR0\xb7\xd6\xf4\x0e\xd07`S\x82V\x0b\x93I\
+\x8a\xc68.\xa2dhG\xbeD\xa3\xa2#1\xeb\xca\
+\xb6$\xc0\x8b\x0c\x8b\x81\x04\xcd\x19]m&v[s\
+\x13\x1a{\x8d\x99\x10\xe2\x84C\xaa\xfaXGX\xe7\x8b\
+\x09\xad\x0a\xf15\xa4\xaeE\x99\xa8H\x95\x1d!}(\
+V`\xe0\xa5\x00\xb1+\xadq\xbauM\xa3R*K\
+\x1a\xefx`.\xc3\xbc\xf8\x98\xf9\xba\x02s\xf3\xf2\x95\
+\xcb\xd2\xf9|\x1e\xfb\xf7\xef\xb7\x95NI\xff\xc8f\xb3\
+\x97l\x9a4\x95-\xa3\x93\x0e\xc0V\xdf\x81\x90\xca \
+U\x14\xca\xe5rU\x9b\xffN\x9d:\xa5\x9a\xbb\x0a\x85\
+\x82\xad\xfa\xb9\xf2\x88\x1b6lXR\x19\xa6R\xa9\xa8\
+s\x91\xcdf\xedK\xde\x05\xe6+\xa1\x9c#cnn\
+\xce\xe3\xc6\x1a\xc9\xc1 \x08\xbcD\xc9]\x91\xa8F\xf4\
+\xf7\xf7\xabk\xa1\xa1\xa1\xc1^\x0b\xee\x9c\xbb!\xf9\xe5\
+R\xe9\xc6T^\xd3\xb81\xc3\xe5\x92\xcbs\xee\x1a\x0d\
+\x990U\xf1|>\xaf\x9e\x01@H'\xbb\x92\xe8\xed\
+\xedU\xfb \x22K\x83\xeb\xeb\xebK\xec\x03\xb9p\xe1\
+\x02\xe6\xe6\xe6\xbc\xc6Of\xc6\xd9\xb3g\xaf\xd8\x8bA\
+\xa1l\xebd)a\x0e[\xa0J\xack\xd4\xb2\x0a\xae\
+\x0dz\x0c\x95\xc2u\xd9\x14\x10\x94\xb4\xf1M\x5c/'\
+HL\xcc\x16\x8c\x1a\x8a\x05\xc7@\x8e\xe3\x91\xf8\xe2\x84\
+\x22\xe9H\xb2\xa4a)\xd8\xee\x7f\x89\xbd\x22\xb2Y\x05\
+H\x00\x97\x11\x8d\x84\x84d\xa1\x04|1/\x9a\x04\x86\
+\x15&>\xaa\x92\xccQQ\x8b}\xd7N\xa2h?\x09\
+Z\xec\x02\x9a2t\xd2c\xe8\xda\xf11\x1b\xe0+\xea\
+\xc5\x1e\x7f\x1f\xb25@\x00[\xbb\x03\xeb\x8a\x0a\x05\xe3\
+9\xde\xa1\x86\xf7\xb1\xec\xa4v\x0e\x0a\x15o\xc0\x1eo\
+\x9cLs/\xb3\xb7\x9ac\xd5c\x94k\xaaJ\xa3\xac\
+\xa6;D\x92gs\x93\x04y\xcb\x14\x98\xa7\xf1\x8e\x8e\
+\xb9\xb99u\xa3\xd7\xd6\xd6\x22\x93\xc9 \x08\x02\x8f\xe6\
+R__\xbf\xa2\x8d\x92\x0b\x0b\x0bjyWj\x0f\x97\
+J%\xb5\xf4LD\xaa\xa9o\xa9p\x9d\x00\xa7\xa7\xa7\
+-_}\xd7\xae]j\x09pqq\x11o\xbc\xf1F\
+\xd5\x8egttT%\x1a555\xb62~\xfc\xf8\
+q\x95\x14544,ie\xbf\xb8\xb8\xa8\xceE6\
+\x9b\xb5\xa0\xd2\xad\xfa\xe5r9\xcf\x92\xbc\xda\xe1R>\
+:::l\xa5\xde\xe5\xfb\xca\xa6\xdbj\xc5\x993g\
+\x14?XJ\x22\x9e9sF\x81v\xf7\xfa2\xcd\x80\
+;v\xecP\xb4\x9f\xc9\xc9\xc9\xd4\xf1\xf3\x06\x8e\x91\x91\
+\x11um\x11\x91\xed\xcb8v\xecXb\xf5y``\
+\x00A\x10\xa0\xbb\xbb[\xad$1\xf3\x157^NM\
+My\xfd\x0b\x06l\x9f<y\xd2+p0\xb3]\x99\
+\xab\xaf\xafW+s\xcc|\xd5\xb2\x9c\xd2\x00'\xd6%\
+\x8f\xa5\xe6\x8c\xc6\xb8\xfc=\x1b\xa0g\xab\xa3\xac\xc1\x0e\
+Q\x82\xf6_\xac\xfe\xa2\x1b\x05YU\xe0\x0d\xf2\xf2l\
+\xee\xadC\xa6\xfc\x1b'\xba\x90\xb2\xa8\xb0K\x8e;\xbb\
+0\xd6\xa1]\x18h\xed\xe16\xcfq2\x01\x08&\xf0\
+\xc3-=\x86\xdd\x84\x82\x13\x99\xf1Jw\xdb\x98\xe9(\
+\x94\x1f\xab\xaf\xf0\x12I\x86K\xadg\x22a\xf3\xe3\xef\
+0\xe6\x94\xcb1\x18\xfa\x8c\x86\xcc\xb1\x02\x8d\xd1Sw\
+\xa7\x83\x14%\xdcu8\xf5Fa$\x1dY\x9e~\xb6\
+\xc9KL\x11\x22gN\xc55\xe8j\xce\xb0\x5c\xb7\x88\
+\xc7\xad\x9c@\x13\xe6!\x05\xe6i\xbc\xa3\xc3U\x14(\
+\x14\x0a \x22T*\x15\x8f\x83YWW\xb7\xa4\xddp\
+5\xa2X,z\xa0\xaa\xa5\xa5\x05\x99L\x06\x95JE\
+\x81S\x22\xba,\xda\xc6\xce\x9d;\xd5\x98\x8dYH\xa1\
+P\xf0\xac\xb3GFF\xae\x9c\xf7\xb9LLNNb\
+ppP\xfd\xce\x00\xf3\xd1\xd1Q\xd5\xecZSS\xb3\
+d#j\xb1X\xf4\x8e\xdd\x80o\xb7B\x9d\xc9dV\
+\x04\x0c\xcbp\x9b\x82kjjlE\xd2\x05H+\xd1\
+\x97\x10\x04\x81'ug\x94Y\xc6\xc7\xc7\xbdF=\x99\
+\x94\x99\xa4\xc2\x9d\xeb\xab\xae`\xa6q]\x22\x08\x02\xaf\
+\xf7c\xcb\x96-\xc8d2X\x5c\x5c\xf4\xfa\x18\x8c\x22\
+\x0a\x106\x8a\xca$\xacX,^\xb6T\xa2\xdc\xbf{\
+\xaf\xad[\xb7\x0e\xf9|\x1e\x8b\x8b\x8b^BZ\xa9T\
+ls\xe7\x9e={\xd4}\xb0\xb8\xb8hM\x87\xae4\
+8.)\xc6UZ\xa5\xec!\xd5J\x5c\x1fz\xb6\x15\
+Tw\xae\xb4#\xa5\xca\x024\x15E\x00O\x12UZ\
+\xcdl\xa0X}\x0f\x9a\xe7\x1eb3\x17\x18;\xce\xa1\
+2IP\xbcwWrO\x8f\xc7\x1d\xb7\xa2\x84h\x88\
+\x1f\x1f\x03\x5c\x90\x1a5Lz\xb6\x9e\x02\x023''\
+K\x94\x84yM\xb3\xa7\x83\x8a\x89\x9d\xd1\xb0\x1a\x13\x91\
+\xa3\x8aBB\xac\xddK;\x1c\xfa\x8bZ\x93\xa0X\xf3\
+\xdd\x83\xdf:\x05\x904\x15c\x12ER\xdeF4\x11\
+\xc7R\xfa:\x91b]\x9aW\xf4\x9b\xb8aX\xee?\
+\xaa\xb2\x1b\xfdt\xc794\xb9\xc96UeI\xe3\x1d\
+\x1eccc\xea!Y__\x8f\x5c.\x87 \x08T\
+\x85\x08\x08\x95RV\xba\xb9\xd0\x05G555\xa1V\
+-\xb3j\xf4$\xa2K\x8e\xa5\xbe\xbe^5\x02\x9a*\
+V\x10\x04hii\xf1\x0cG\x8c\xe9P5\xc3\xad.\
+o\xdc\xb8\x11\xd9l\x16\xe3\xe3\xe3\x0a\xb4/g44\
+77\xa7\xe8\x19\xd9l\xd6\xf2\xb8gff\xd4\x9c\xe5\
+r9\xacY\xb3f\xc5\xcf\x91^N\x8d\x93$\x97Z\
+\xb3R+,.\x1f\xbc\xa3\xa3\xc3\x9e\xeb\xa5\xe8H\x83\
+\x83\x83\x98\x98\x98@kk\xab\xc79N\x8d\x85n\xfc\
+p\xefOc4d\x9aC]`l\xaa\xe2\x1b6l\
+\xf0\x1a\x80gff\xaeh\xdf\x95J\xc5K\xb2;:\
+:P__\x8fJ\xa5\xe2\x81\xf6\x89\x89\x09\x9b\xc0\xee\
+\xd8\xb1C\xed\x7fdd\xe4\x8a\xf7\xef i\x05\xb0\xd9\
+\xe1$[\xb7O\xd6@\xd6\xb2{]S\x1c\xd2\x8d\x8f\
+.\xb3\x81\x0d8b\xad\x87\xc7\xe4\xff^\xe8\x8b8[\
+\x13\xb2{,x\xc8\x12n\x93\x904T\xea\x1e\x82\xa3\
+\xcd\x1a\xca\xc6z)\xa4\xf4a\xe0\xe2Pv\xaa\xe6\x1e\
+\xf8\x16J7.\x10\xb4+\x0c>\x19\xc4\xc1\xc2n\xae\
+\x11\x8e\xcf\xe1\xe8K\xea\x89\xb2\xbcG\xec\x04\xca\xee\x8e\
+\x04 '\xc7\xfcH\x0e\xc1l\x8f\xdd\xdc\x85u\x7f\x02\
+\xa9\xf9f}\x1d\xb1\xe9\x0f`\xed\x22*\xd3\xbd$\xa9\
+\xca$\xc6\x11\xc7|qf\x87\xa6\xa2\x92(}\x04\xe0\
+\xf8*J\x92\xd9L\x81y\x1a\xef\xe8\x18\x1e\x1eV \
+\xab\xb1\xb1\xd1\xbeD\xa6\xa6\xa6\xd4\xdf\x9a\x9b\x9bWT\
+\x8e/\x93\xc9xU\xf0J\xa5b\x9bS\xe5\xbe\x99\xf9\
+\x92\x15N\x17|\x97\xcbeKc\xe9\xea\xeaR\x95e\
+\xf9\x22\xaff\x1c=zT\x81\x89\xa6\xa6&\xcb\xc9v\
+\x01\xa4[\xc171??\xbf$0_XXP\xcb\
+\xe8\xd7\x03\x98'\xad\x9c\x18@.iCI@\xbdZ\
+\xd1\xdf\xdf\xafh<\x8d\x8d\x8d\xb6j~\xe2\xc4\x89\xc4\
+\xfd\x1aj\xc1\xb6m\xdb\x94\xd9\xcc\xc2\xc2B\xaa\xc8\xb2\
+\x0a\xe2\xc4\x89\x13\xea\x9e\xef\xe8\xe8\xb0t6\xd3\x1cj\
+bjj\x0aSSS\x8a\x0egbtt\xf4\x8a\x1a\
+?M\x98&O\x13\xad\xad\xadhhh@\x10\x04\x18\
+\x18\x18P\xcfJ\xe3\xeaiza\xe4\xfd200p\
+U\x8d\x9f^\x90C\xbb0\x9a\xdf,+\xa6\x1a\x90\xba\
+`\xcd\x82vfW)1\xfe\x06\xb3\xa4\x88\xeb\x04\x01\
+\xae)\x8f\x00\x8f\x0c\x1f`\x0aYB\xa6e\xb0\xb3\xeb\
+~)\x00\x9c\xcb\x1a\x8f\x15>\xe2\x0d\xc5\xd5|\x06\x12\
+\x14l\xdc\xaa\xae\x8b\xa9I\x12\xf1\xe5?9t\x16\xd5\
+\x8b\x07\x8e \xa1#tB\xde\x98I\x0c#\xe6\xaf\xeb\
+i2\xa0\xd4#\xeaD\x15f\xf7TD\xb4\x19I5\
+\x11[d\xa9\x07\x0fW\xdd\x90\xd4wl\xbfi\xa4\xda\
+\xa2\xf31\xf6\x92\x97\xf8\xb8\x9dU\x17\xbd\xa0\xa1(\xe6\
+\xacr\x00r\xc6J\xaa\xe8C\xec\xf3\xccS`\x9e\xc6\
+;:fff\xd4K\xa2\xa1\xa1\xc1\x02\xe0\x91\x91\x11\
+\xf5\xb2ijj\xba,^\xf7\xd5F6\x9b\xf5\x1a \
+\x0d\x85#\x93\xc9x\x15\xf2\xa5\x8cELl\xdf\xbe]\
+i\x07/,,,i,T*\x95p\xe4\xc8\x91\xaa\
+\x1f\xd3\xe0\xe0\xa02\xc4)\x14\x0a\x16\x98\x1f=zT\
+5\x8d\xb5\xb7\xb7'\x82sw\xf5\x22\x97\xcbY`>\
+;;\xab\xce_.\x97[\x91\x86K\x19.\x87=\x08\
+\x02;\x06\xf7\xfc\xad\x140\xef\xeb\xeb\xf3\xe6d\xc7\x8e\
+\x1d\x00B\x9e\xb9[\x91,\x97\xcb\xb6*\xbem\xdb6\
+\x95\x00NOOW\xdd\xa14\x8d\xea\xc7\xb1c\xc7T\
+\x82\x9a\xcf\xe7\xadi\xd7\xe1\xc3\x87\x15h\x1f\x1f\x1f\xc7\
+\xec\xecl\xa2\x22\xcb\xd0\xd0\xd0U\xd1\x96\xdc&\xcf|\
+>o\x93\xc1s\xe7\xce)\xd0n\xa8Q\xae2\x914\
+\x1d\xbaFTn\xa5\x02=\x13\x17#WGZ\xd4P\
+\x09\x16\xb2\x06B,\xc0t\x92I#y\xee1Rm\
+\x03K\xa8 \xb2\xaf\xe2\xc1\xd2\xdd\x13\xa0\x04\xb0\x9aH\
+x\x16`P\xff\x99,\x95\x83\x1cp\x177\xc7B\x97\
+q#\xaaF\x929\x90\xaa\xba\x13\xf9I\x0dI\xc0\xaf\
+\xf3\x062\xd4\x18\xd2R\x88\x863\x9dToO4\xee\
+$\xd2`\xd6c\xdb;2\x872\xa1 r\x87\x1d\x9b\
+\xff\x10%K\x94\x0b\xadt\xe7\xd2p\xfd?m\xa9\x9d\
+\xdd\x93j\x8f[\x1b\x19\xe9\xf9\xb3\x13\x95\xe0\xfe\xca\xca\
+\x1c\xca~\x87\x9d$\x82S`\x9e\xc6\xbb \xca\xe5\xb2\
+\x028uuu\x96/|\xf2\xe4I\xf5\x02\xc9f\xb3\
+\xb6\xc9n%\x22\x9f\xcf{\xca/\xd3\xd3\xd3\xd69O\
+*\x8e0\xf3%u\x88w\xef\xde\xad*UCCC\
+\x98\x99\x99I\xa4\x8dLLL\xacH\xd5\xd4\xe5\x92\xcb\
+}\x0f\x0d\x0d)\x8e\x7f\xa1PX\xb2\x01T\xf2\xba3\
+\x99\x8c\xad\x8a\x8f\x8e\x8e*\xe0\x0f Q\xd3\xb9\x9a\xe1\
+&g\xa5R\xc9\x1e\xa3\x0b\xda\xabR\x19L\x88\xb9\xb9\
+9OY\xc3\xf0\xc6\xcf\x9d;\xa7\xe6\xdc$\xa0\x86\xa3\
+\xec^\xc3\x83\x83\x83\x1em+\x8d\x1b/\x16\x16\x16<\
+:\x89Ir\x87\x86\x86\x14\xcf\xfb\xe2\xc5\x8b\x98\x9b\x9b\
+CKK\x8bZ\x19\x93n\xa0W\x1an\x93'\x11\xd9\
+\x9e\x91\x13'NX\xd0\x1e\x04\x81]\x99\xeb\xec\xec\xb4\
+I\xb4\xd9\xbfQ\x85\xba\x06Ln%\x11\x11U5\x0d\
+(\x94\x9c_\xb0\x0b\x9cb\xe0\x9e\xd8\x1c)\xcb\xb0\x8e\
+\xf2\x07\x0b\x0bz\x0f4{\xff\x12`\x9d\xfc\xd6If\
+X`\xc9.\x01\xc5\xe3^;\xc0\xcen\x96%\x5c\x16\
+\x1b'\x05\xe6\x8d$\xa0'3\x09\xb86Ej<\xae\
+\x03\xa765\xf2\xb3\x1762(\x8e\xe9R\x08Bc\
+\x8fP95\x86F\xa2\xa9D\xc6M\x13\x96\xc2\x89%\
+\x15\xe3\xd9\x03\xd9\x9e\x01\x90\xcd\x0c\xc8\xc5\xceqrg\
+t\x10\x9d\x86`\xa3_o\xb5\xee\x11\x9bD\x85c\x8b\
+u\xed%\xa2\xa7\xc4V\x06\xd1\xcc\x99\xe0i$\xbbD\
+\xf5\x15%x\xf0\x14\xd3\xb0R`\x9e\xc6;:J\xa5\
+\x92\x02\x87\x128\xba\xa0O\xaa_\xacD\xd4\xd5\xd5y\
+\xea\x05F}\xc3\x05\xe6I\xcdX.\xc8\xdf\xb2e\x8b\
+\xfa\x9d\xe1\xa8655yU\xe5\xb3g\xcf&v\xea\
+W\x03L\xb8\x00\xd2\x8ckxxX5\x9b\xe6r\xb9\
+%\xf5\xcc]@\xb2a\xc3\x06\x00\xc9\xdc\xd7M\x9b6\
+\xad\xa8z\x8e+S9==mA\x89\x0b\xcc\x97\xb2\
++\xafF\xb8\x92\x93\xeb\xd7\xaf\xb7I\x83\xcb9\x1e\x1f\
+\x1f\xc7\x993g\x90\xcdf\xbdU\x89\x95\xa00\xa5Q\
+\xfdHj\xfa\xdd\xb8q#jkk\xc1\xcc\xaa9\xd4\
+8\x85\xee\xdc\xb9S\xd1\xab\xaeE\x11\xc5m\xf2$\x22\
+\xdb\xd7`\xa4\x11\xcd3\xd54w\xder\xcb-j\xa5\
+ozz\xfa\xaa\x13\x03\x07\xafX\x1e0\x94\xf6\xb6\xa8\
+\x8b\x93n\x034\x1az10\x8e%\x12)\xe2\xf8\xc6\
+\x8a&\xda\x84(\x96:\xd4\x8d\x86d\x15]X\xd3;\
+\x5c\xc7J\xe7\x00X\xe5\x0a\x02\x96\xb2P\xfdfV@\
+\x9c\x14j\x93\xb2\x85d\xcfm\x12}\x99\x95\x9e`l\
+\x86\x93\xe8\x15O\xac\xc6\xabs\x1c\xa9H\xce\xbe^\xa0\
+r8\xb5\x9b\x13\xee\xa4\xec@kV\xc9\x86\xfc\x0e\x04\
+\xe8U\xd2\x96R\x1fQ\x99BEUt\xe1I\xe2%\
+_\x86\xae\xc4\xf2,\xb1\xaf\x89\xe8\xa4-\xfa\xac\xc6\xf7\
+\x91\xd5\x8f\xe1\x844\x8f\x96H\xdd\x96\x18\x1bE\xfa\xf7\
+D~\xb2e\x1a\x86\xe5hR`\x9e\xc6;\x1e\x98\xbb\
+\xd5X\x03\xbc\xe6\xe7\xe7\x95\xda\x01\x11a\xfb\xf6\xed\x1e\
+\x8f\xb8Z\xb1m\xdb6E=\xa9T*\xf6e\xbbv\
+\xedZE?H\x02\xa42\x5cW\xcfr\xb9l\x01\x98\
+\xabm\x1e\x04\x01N\x9d:U\xf5\xc6O\x13.\x10X\
+\xb3f\x0d:;;Q\xa9T<\x00\xb9\x1407\xc6\
+8&\xe4\xf2\xbc\xdb\x08\xd9\xda\xda\x8a={\xf6\xac\xc8\
+\xb1444xI\x8d\xb9~jjjTu\x10\xc0\
+\x92v\xe9\xd5\x88S\xa7N\xa9\x0afSS\x93\x9d\xbf\
+\xb7\xdezK\xbd0\x0c\x18\xda\xbe}\xbbJ\x1e$\xc5\
+%\x8d\x1b?N\x9f>\xad\xe8Q\xc6h\xc8\x18\x87\x05\
+A\xa0\xa4\x0a\x8dC\xb0\x04\xc6\xeej\xca\xe5F\xa5R\
+\xf1\x14\x7f:;;Q[[\x8bJ\xa5b\x93\xec\x8b\
+\x17/\xda\x82Fww\xb7\xda\xbf\xe1\x9eW#,&\
+\x16\xba\xe2\x06\x13Y\xe9\xbc$\xbbz\xcfm\xd2\x80Z\
+Q\x89%?\x13H\xe2b\xeb&T\xf2?@\x8c\xa4\
+\xcan\x8cU]\x0bI\xd1\x88(\xf0/K\x80\x9dP\
+q%iM\xaa\x00y\x04\xfc\x9c\xfd\x92UQ\xd1v\
+<v6\xe54\xd8\x82\xb2\xa9 ke\x15\xb3\xd1X\
+\xf7\xdd]E \xad\x8d\xce\x22\xe11\x5crv=E\
+\xa36N2\x00^W\x9c])J\x962\x94\xcc>\
+\xbb\x88b:\x12%$z\x96)\xc4\x84\x04\xe4\xec^\
+yj\x8e)\x91\xc7\xc4*\xb1\x92\xdf\x8c\x9bl\xc5\xef\
+\x0c\xf8fN\x12\x8fQK\x01\x9c\x02\xf34\xde\x0d!\
+9\x8fD\x84\xad[\xb7\x22\x9b\xcd\xa2T*\xe1\xe4\xc9\
+\x93\x0a\xe0l\xde\xbc\xd9Vk\xab\x1dw\xdcq\x87\xc7\
+\xfb6\x95\xa7\x9e\x9e\x1eEK\x99\x9c\x9c\x5c\x96&\xb1\
+v\xedZE\xb9(\x95J\x96_~\xf3\xcd7+\xf9\
+\xb2R\xa9\xb4\xa2\xae\x8f\xbd\xbd\xbd\x8a\x0f_[[k\
+5\x98\xdde\xedu\xeb\xd6\xa9\xe4\xc4\x84|\xd9\x9b\xe4\
+\xc2T~{{{\xd5\x5c\xd4\xd6\xd6\xe2\xb6\xdbn[\
+\x91c\xd9\xb1c\x87g\xd6b@PWW\x97j\xaa\
+t\x93\xbe\x95\xb8n\xa5\xbcf\xa1P\xb0\xc0\xbc\xbf\xbf\
+_Q\x9dLu}\xeb\xd6\xadj~gff\xae\xbd\
+\x82\x99\xc6u\x8b\xa3G\x8f*`.\x9d}\x8f\x1f?\
+\x8er\xb9\x8cR\xa9d\xcd\xa26l\xd8\xa0\x9e)\x86\
+{~5\x11\x04\x01\x06\x07\x07\xd5\xf3\xb0\xbd\xbd\xdd*\
+\xb3\x98k}hh\xc8\x1a\x0b\xb9\xab3\xe7\xcf\x9f_\
+\xd6\x00\xebJ\xc24\xceYC\x1d\x05\x96\x0c\xce\xd6M\
+\x98\x96>\xe1)\xbaH\xac\x94@D\xa6d\xd7I\xd1\
+Z\x08\xbf\xa0M\xb62\x9d\xd4\x88\xba\x94V7|\xf3\
+M\x01\x16\xa5\x0b\xa6\x06\xa5\xe4\x82|&\xf8j\xe1\xac\
+s\x06;?\xae\xa4\x88n(e\x99,\x98\xcf\x19\xcd\
+x5?,\x00\xb7>(\xbb\x1a!\x04\xc5\xad\x99\x10\
+%\xd0U(\xc1\xfbG@}NL\xd6H\x16\xd2\xe3\
+S!\xc5s\x5c#'\x8a\xbdL]r8\x8b\x0e\x04\
+fI;\x22g%\xc0\xd9\x1e/\x01\xd79\xe68\x91\
+\xfbM\xb3\xa2CI\x07@\xf6\x1a#N\xe5\x12\xd3x\
+\x97\xbc\xecd\xb5\xd8,\x0f\x03\xa1E\xbd|\x11\x16\x0a\
+\x05<\xf0\xc0\x03U\x1fC[[\x1bn\xbf\xfdv\xf5\
+\xbb\x81\x81\x01[qu\x81\xf9\xc8\xc8H\xa2\xdb\x9e\x89\
+[n\xb9\xc5{!\x9b\xea\xbf\xabm>77w\xed\
+\xbc\xcfebllL\x19\xe2\xe4\xf3yK\x17:s\
+\xe6\x8c\x02\x0auuu\xd8\xbbw\xaf\xb7\x0d\xd7\xac\xa8\
+\xb6\xb6\xd6\xf2\xd1\xfb\xfb\xfb\xbd\x95\x8d\xdbn\xbbmE\
+V6\xee\xbf\xff~\xb5r1??oA\xef\x86\x0d\
+\x1b<\xb5\x13W_\xba\x9a1::\xeaU0\x0d\xd5\
+\xea\xf4\xe9\xd36\x91\x99\x9b\x9b\xb3@m\xe7\xce\x9d\xea\
+\xba\x18\x1b\x1b\xf3\xf4\xb1\xd3\xb8q\xe3\xec\xd9\xb3\x1e\xf5\
+\xce\xdc/G\x8f\x1e\xc5\xfc\xfc<&''1==\
+\x8dL&\xe3\xad\xee\x5c\xbcx\xf1\xaa\x819\xe07y\
+655\xd9\x8a\xbd14:s\xe6\x0c*\x95\x0a\xf2\
+\xf9\xbc\xda\xbfY\x99\xabn$8\xc4p\x0c\xa2\xfc\x86\
+\xcf\x18tBT\xdcee\x93\x5c\xc4\xae\x90);\xb4\
+\x0c\x8e\x1b\x04I\xd0W8\x06u\x1cwL\xfa\x08\xdc\
+C\x96\x06\xf4J\x9bz\xf3'S;\xe6\x84o\x9a\xe6\
+\xc2$\xf6\xbc\xe0\x9b;c0\xab\x0b\xca\xc2>\xc6\xc5\
+~\xe5\xd6\x80|\xe2\xe8{Za\xc5\xda\xd9\x93\xc3\xa9\
+\xa1H\xcdE\xce\xbf7\x1f\x09\x9cq\x93<\xb8\xc0\x9d\
+\xd4\x99\x14s\x10%]\x9c0l\x97\xead\xbe\xc5p\
+\xae\x91\x04\xd5\x9a\xc8\xe1\xd4M\xc9\xec~\xd5<\x91\xe5\
+\xc9\xb3w\x06E\xca#i+\x8a\xf2\xe3_\xdb$\x84\
+1\xd3\x8ay\x1a\xef\x8ap\x9b\x10[ZZ\xb0o\xdf\
+>[\x0d5|M\x03\xfa\xee\xbd\xf7^\x05\xc0\xaa\x05\
+\xf8\xa4\xcc\x1f3\xe3\xc8\x91#(\x95JhjjR\
+\xbcfci\xbd\x14\xf5$\x93\xc9x@\xdep\xc8k\
+kk\xbd*\xd6\xb9s\xe7V\xd4\x5cf||\xdc\xab\
+\x1c\x9b\xca\xee\xc8\xc8\x88g4\x94\xa4g^,\x16\x15\
+\x80\xcc\xe5r\xf6\x1c-,,x\x8e\xa5\x1b7n\xc4\
+\xfb\xde\xf7\xbe\xaa\x1e\xc7\xd6\xad[\xb1\x7f\xff~\xf5\xbb\
+\x91\x91\x11k\xa4\xb2w\xef^\x8f6\xb0\xd2n\x9a.\
+\xd0\xd9\xb4i\x13\x0a\x85\x02\x8a\xc5\xa2\x05\xe3Ru\xc5\
+\xa8h\x98H\xdd>WW0\xb3\xd7\xb3\xd1\xdd\xdd\xad\
+\x8c\x86LU<\x9b\xcd\xaa\x9e\x15\x00\xeaYv5!\
+\x9b<\x01\xdd\x10\xdf\xdf\xdf\x8fr\xb9l\x93\xfc\x1d;\
+v\xa8fvi:T\xad \xb8\x9a\xd4\x12\x80\x91\xef\
+\xd6i\x9b\xf7\xd8\xf5Jw*\x97\xf0\x80=+\x95\x17\
+J\x00\x89\xc95q+w\x9e\x90T09`\x8c\xe3\
+\xdf{\x92\x80\xca2>\x89X\x93\xa0\x03i\x80\x22\xc5\
+L\x09\xf7{\x14\xd1$\xc8\x1f\xb9R\xbd\x89\x91\xb2!\
+\xad8\x22\x88\xae\xbd\xbde\xbc\x90\xe8\xadT^\x9d6\
+\xa9\xb1\x8d\xbbK\xe6.\xce\x04\xb2n\xb8T\xc7Bl\
+\x13\x18\x7fzhI\x0e\xb7U\xa2aQu7\xc9\x04\
+Q\xc2J@|\x1c\x94@G\x22\x8fr\xc4\x96\xd2C\
+\x89\xe6O\xfe\xf5\xabW,\xc8\xaa\xe9\xa4\xc0<\x8dw\
+|\xcc\xcd\xcd)\xb9\xb8\x5c.\x87\xbb\xee\xba\x0b\x99L\
+\x06sssx\xe9\xa5\x97\x14\x08\xee\xec\xec\xc4\xc7>\
+\xf6\xb1\xaa5\x18vww\xe3\x91G\x1eQ\xdb\x9b\x9f\
+\x9f\xc7\x0f\x7f\xf8C\x00!/XV\x9e*\x95\xca\xb2\
+\x15\xee\xc6\xc6FE\xb7\x91\x1c\xf2\x96\x96\x16\xaf\xc1\xd4\
+pSW*\x92\x0cP\xba\xba\xba\x90\xcf\xe71;;\
+\xab\x80\x86\xe1\xf1'\xc5\xa1C\x87\xd42\xfa\xae]\xbb\
+\xec\x8b\xff\x99g\x9eQ\xb4\x8e|>\x8f\x0f\x7f\xf8\xc3\
+\x89\xb4\x98\xab\x89|>\x8fO\x7f\xfa\xd3\x9e\x22\xcb\xab\
+\xaf\xbe\x8aR\xa9\x84\xfa\xfaz\xaf\xd2\xef\xca\xcb\xadD\
+\x1c?~\x5c\xed\xa3\xb9\xb9\xd9&=\x86;~\xe1\xc2\
+\x05\xcc\xce\xce\xa2\xab\xab\xcbK\xfeV\x92\xc2\x94\xc6\xca\
+\xdcK\xa7O\x9fV\xf7\xc1\xbau\xeb\xd0\xd8\xd8h\xef\
+\xb3\xa1\xa1!\x14\x8bEl\xda\xb4I\x01cf\xbef\
+\xe5\xa5\x81\x81\x01Uq'\x22\xdb\xcc\xdd\xdb\xdb\x8b\xc9\
+\xc9I{\xaf\xef\xda\xb5K%\xaa\xe3\xe3\xe3W\xcdo\
+_2Q\xb1<\xecd\xea\x80\xa4\x0d\xe8\x04'\x92\xcf\
+\xe3\xa5@\x11\xab.>\x96\xffGI\x09S\x5c\x11u\
+\xc1\xac\xa9\x22\x93\x03.]\x8fJ\xf9\x07\x8a\x1aT\x93\
+\xa4\x04\xc9(\x810{[biR\x83X\xda\x908\
+\xae\x8c;9\x80uSef?\x05`W\x05&\xbe\
+\x96\x5c\x13N\xc5\xea`\xf2\x15f\xa2\xef\xb0\x9c\x1d\x82\
+JBx\x09>>\x81\x14\x15\xc54\xca\x82\xe0\x00X\
+\xb2UvZb]A\x1f!\xe2\xbeP\xd2J\xe2\xb6\
+\x82-\xf2\x14\x109+/\x0ex\x16\x09\x00\xcbU\x12\
+Wq\xd1V\xd9\x05w^\x9e?\xd6k\x0b\xee\xf5\x91\
+\x02\xf34\xde\xf1a\x80\xae\x04\xa7\xfb\xf6\xed\xb3U\xf1\
+\xef}\xef{\x8a\x8a\x91\xc9d\xf0S?\xf5S^\xf5\
+\xf4j\xa2\xb9\xb9\x19_\xf8\xc2\x17\xd0\xde\xde\xae~\xff\
+\xe6\x9bo\xa2\xaf\xaf\x0f\x99L\x06\xf7\xddw\x9fR6\
+\x98\x99\x99\xc1\xa1C\x87\x96\xdcfKK\x8b\x02`\xe5\
+r\xd9\x02\xb0M\x9b6\xa9j\xbf4\x1dZ\xc98z\
+\xf4\xa8g\xe4d\xa8(\xee\xfe\x97RU9q\xe2\x84\
+\x92\xf5kkk\xb3U\xf1\xd3\xa7O\xe3\xc7?\xfe\xb1\
+\x97\xf0|\xfa\xd3\x9f\xbe\xe6\xb1g2\x19|\xf4\xa3\x1f\
+\xf5\xa8Fcccx\xea\xa9\xa7\x00\x84\xd5r\xa9\xd7\
+\x1c\x04A\xd5\xab\x83I\xe1\xf2\xcc\xeb\xeb\xebmU\xbc\
+\xaf\xaf\x0f\xc5b\xd1\x1a9m\xdd\xba\x15\x8d\x8d\x8d*\
+!M\xf9\xe5\xab/N\x9d:\xa5\xe8u\xd2h\xe8\xd4\
+\xa9S\xb6\xc8\xd0\xd3\xd3\xa3\x9e\x1b\xa5R\xe9\x9a\xf5\xea\
+K\xa5\x92RR2\x89A6\x9b\xc5\xc4\xc4\x04\x8e\x1d\
+;\x86\xd9\xd9Y\xdbD/\xef\xe3\xc1\xc1\xc1\xea\xca\x87\
+\x92\xa0\x8c\xb0W#\x85\xe7\xe8\xa8\x101%\x1aV\xc2\
+r\xd6m\x0dW\xff\x95\xa5\x13\xa8\xf9\x1d-S\x157\
+\x80\x94\x1c\x03x\x01\xe4(i\x1f\xb0\x14\x06\x09\xbf\xd9\
+s#\xd2\x1cgJ\x9a\x01\xa9\x96\xe2\x14\xfa\xed\xafX\
+\x83N\xb3B \xb4\xfa\x14\xbe4\x18\xd5\xf3AR\xe0\
+Y\xef\x8c\x8d\x8a\x8d\xa0\x1a\x09\x8bT\xab`\x03\xcf9\
+\x93\xadA\x90\xa4\x9b\x90p+%\xd7\xdd(\xb2\xb9w\
+\x04\xee\x13\xd7\x15\x9c\xecJI\x5cZ\x17Y\xcfXH\
+\xcf\xbb\xa9o\x93l\xb8e\xa9\xed.\x0f\x89cS&\
+\x03\xc0\x9d\x95\x81X\xdd\x86\xfc\xf1!\x05\xe6i\xbcK\
+\xe2\xc5\x17_T/\x8d\xf6\xf6v<\xf8\xe0\x83\x00B\
+\xba\xc2\xd3O?\xedq+\x7f\xf9\x97\x7fyI\xdd\xed\
+\xcb\x89u\xeb\xd6\xe1\xb7\x7f\xfb\xb7\xbdJ\xeb\xcc\xcc\x0c\
+\xbe\xfd\xedo#\x08\x02\xac_\xbf\xdekd<v\xec\
+\xd8\xb2/\xb8\xdd\xbbw\x8f\xf8:\xfb\x00\x00 \x00I\
+DAT+\xa3\x9b\x99\x99\x19\x0b\xcc]c\xa1$\x1a\
+\xc8J\xc4\xb9s\xe7\x94\xe9MMM\x8d5\xc49z\
+\xf4\xa8\xa2\xd2477[Mn\xb7Z'+~\xb9\
+\x5c\xce\x02\xf3 \x08\xf0o\xff\xf6o\x9e\xbc\xe5C\x0f\
+=\x84O|\xe2\x13W\xbd\xba\x91\xcf\xe7\xf1\xd9\xcf~\
+\x16\x1f\xfd\xe8G\x15\xc8\x09\x82\x00\xcf<\xf3\x8c\xad\xf6\
+\xbf\xff\xfd\xefW\x0d\xb5\x13\x13\x13x\xf5\xd5WW|\
+^\xcf\x9e=\xebI\xd8I\x9e\xf9\xc5\x8b\x17-\xdde\
+\xc7\x8e\x1d\x8aw?55\x95:~\xae\xc28|\xf8\
+\xb0j\xa0,\x14\x0a\xf6^:|\xf8\xb0M\xda7n\
+\xdc\xa8*\xd6\x86{~-\xc1\xccK*\xb3\x94\xcbe\
+|\xff\xfb\xdf\xb7\x8d\x9fFJ\xd1|\xcf\x98\x0eU-\
+\x84\x8c\x9f\xf5n\x81V\xdf\xf6[\x1e}\x90\xe3\x824\
+b^\x92\x02\xceR2\x91$\xd0\x22\xc4\xb5[\xb7q\
+4\x1a\xdf\x12r\x86p\x9d3I\x02[\xff\x184\x01\
+Dh \x22\xc6\x8e\xecw\x0fF\xaa1\x8eI\x91A\
+\xd8\xa4\x01$\xcb\xa6Yr\x9b\x1b\xc9S\x16\xd1\x1f\x93\
+l\xe8\xb8\x22L\xe2\x1f\xe4\x0f/\xfe\xb4\xda\x95X\xb9\
+\xa0d\xa9\x14\xa2\xa4\x93(U-u\xb3i2*\xd7\
+\x0d\xb0\xa4\xe4(\xc5gHW\xc2\xbd\xe4Nk;:\
+\x05s_O\x9f(A\xf1\x87\xd4lx\xd7i\xca1\
+O\xe3]\x13\xc3\xc3\xc3jY\xdf\x80:S]\xfe\xce\
+w\xbe\xe3Uv\xd7\xaf_\x8f\xdf\xfa\xad\xdf\xc2\x07>\
+\xf0\x81+j4,\x14\x0a\xf8\xf0\x87?\x8c\xdf\xfb\xbd\
+\xdf\xc3\x9e={\x14\x17<\x08\x02<\xf9\xe4\x93\xe8\xed\
+\xedE&\x93\xc1#\x8f<\xa2\x0cB\xca\xe52\x9e\x7f\
+\xfe\xf9e\xa9'7\xddt\x93\xda\xe6\xf9\xf3\xe7Q*\
+\x95\x90\xc9d<\x8e\xf1\xd0\xd0\xd05\xbf\xac/'\xc6\
+\xc6\xc6\x964\x1a\x1a\x19\x19Q\xe0\xb2P($\xea\xc5\
+\x07A\xe0\x1d{OO\x8f\x05\xe7\xc7\x8f\x1f\xc7\x93O\
+>\xa9\xfe^(\x14\xf0\x89O|\x02\xbf\xf2+\xbf\xe2\
+\xadJ,\x17\xa6\xa9\xeew~\xe7w\xf0\x91\x8f|\xc4\
+s\xf4<u\xea\x14\xbe\xf9\xcdo\x02\x00n\xbf\xfdv\
+/\xb9:v\xec\xd8\x8a*\xb2\xc8p\xc1\xb5\xe9G\x18\
+\x1f\x1f\xc7[o\xbde\xb9\xe6n\xb2s\xe1\xc2\x85\xaa\
+)d\xac\x86\xc8f\xb3\xd7\xed\x7f+\xa9\xa3?33\
+\xa3<\x0cd2v\xe1\xc2\x05\x9c>}\x1a\x99L\x06\
+\x1b6lP\xcf\x81kQd\x91\xf7\xa0i\xf24\xd1\
+\xd6\xd6f\x95Y\xcc\xaaUCC\x83G\x99[\x11Y\
+N)\x9c\xcdIUn\x8e\xc1\xb6G+\x88\xa5\x13I\
+i[CU3\x15^\x22\xa7\x14\xed|\x80=g\x19\
+\x12\x9a\xebb\x03\x02x\x1bmB\xe5m$L\x88\x5c\
+$I\x94\x00\x96\xcdq\x92\xa7B\xee\x80F\xc7~>\
+\xb2\xb1W\xb4\x0a\xe7\xb3\xcc\xe4Un\xf54\xb0\x92u\
+4\xe9\x04\x09S$\xfbi\xa2\xa5\xe5\x00\xa3\xe4%\xee\
+\xdd\x94:8\x09\xe5~[`\xa6%<\x88|3$\
+\x16\x7fK\xc2\xf9\xc42\xfd\x11\xf3A.\xf1H'S\
+f%\xc0MbY^\x93\x8a\x17O\xb1F\xbbTp\
+\x91^GD\xc9\x80\x1e\x8c\x5c\x0a\xd9\xd2x7D\xa5\
+R\xc1\xb3\xcf>\x8b\xfd\xfb\xf7\xdb*SWW\x17\x1e\
+}\xf4Q\xfc\xc3?\xfc\x03\xa6\xa7\xa7\xf1\xb5\xaf}\x0d\
+\xbf\xfd\xdb\xbf\xadx\xc6\xed\xed\xed\xf8\xa5_\xfa%\xdc\
+\x7f\xff\xfd\xf8\xd1\x8f~\x84\xe7\x9f\x7f\x1e333j\
+\xa99\x93\xc9 \x9b\xcd\xa2\xa7\xa7\x07\xb7\xdf~;n\
+\xbd\xf5Vl\xdd\xbaUU`\xcd\x8d\xfc\xca+\xaf\xe0\
+\x9f\xff\xf9\x9f\x11\x04\x01n\xbd\xf5V\xdcw\xdf}\xea\
+\xe5\xda\xdf\xdf\x8f\x83\x07\x0f.y\x1cns\xa7\xe1\x95\
+\x06A\x80\xb6\xb66O\xa5\xc1\xfcm\xa5cvv\x16\
+\x03\x03\x03*10\xe34\xcd\xa1F\x9b<\x9b\xcd.\
+\xc93\x7f\xed\xb5\xd70<<l\x8f\xa3P(\xe0#\
+\x1f\xf9\x08^y\xe5\x15\xcc\xcd\xcd\xe1\xdb\xdf\xfe6\xba\
+\xbb\xbb\x15\xed\xa4\xa6\xa6\x06\x0f=\xf4\x10\xf6\xed\xdb\x87\
+\x97^z\x09\xcf>\xfb,\xfa\xfb\xfb\x11\x04\x81=\xf6\
+L&\x83L&\x83\xf6\xf6v\xdcq\xc7\x1d\xd8\xb7o\
+\x1f\xf6\xee\xdd\xeb9\xb1\x9aD\xe2\xab_\xfd*\xa6\xa7\
+\xa7\xd1\xd0\xd0\x80O~\xf2\x93\xeas\xf3\xf3\xf3x\xfa\
+\xe9\xa7\xaf\xdb\xb5\xdb\xdb\xdb\x8b\x07\x1f|\xd0^'\xed\
+\xed\xed\xd8\xbau+\xce\x9c9\x83'\x9ex\x02\x03\x03\
+\x03hjjRT\x1b\x00\xef\x1a~\xf9\xa6M\x9b\xf0\
+\xfb\xbf\xff\xfb\xea>Z\xe9\x98\x98\x98\xc0\xd7\xbe\xf65\
+\xcf\x95\xb6\x1aa\xb8\xe4\xf2\x1e\xd9\xbcy3\xf2\xf9\xbc\
+\xadH\x13\x11\xd6\xae]\xeb\x15\x1f\xa4\xee\xfd\xd5\x86\xb9\
+wL\xf2Q__\x8f\xae\xae.\x8c\x8c\x8c\xd8\xfbi\
+\xcf\x9e=j\x05\xa9X,Z\xe9\xd7j\x87\xe1[s\
+$S\xe7:|\x92Q8q\xc4BL\xf5\x9blg\
+\xa4\xa8<\x1bGJ\xa6\xd8\x8cH\xe0[\x8a\xc0t\xbc\
+M\x8eUSH\xd2F\xa2FI\x92\xda\xdb\xe4J\x80\
+\xfb\xd7&%\x00|\x92\x9f\x87\xfe\xc1T\xaa\x99c}\
+\xf7\x84R\xb2\xe5P\x0bS\xa6\x98OM\xba\xd2\x1c\x01\
+ic\xa2#\xc7\xc8v\x95\x22\x06\xf02\xb5!\x0b~\
+\x1dS\x1d\x86P\x82\xa1DP,\xe7NQ\x87H'\
+W\xa6\x89\xd2\xaeX(C\xa9\xa8\xcd\x92\xb4\xc2\x8dJ\
+1H'h \x8e\xcew\x94\xb0PBRc\x8fO\
+$Xd\x92\x15J\xa0\x0aI\xd5\x1e\xa7\x95\x97\x1d\x07\
+T+\xb9\x19\x9fSrx\xea\x06\xe6\xa7\xc0<\x8dw\
+M\xbc\xf4\xd2K\xf8\xe9\x9f\xfei\xbb,\x9c\xc9d\xf0\
+\xf0\xc3\x0f\xe3\x8d7\xde\xc0\xa1C\x87p\xec\xd81|\
+\xf5\xab_\xc5\x17\xbf\xf8Ee\xd2\x92\xcb\xe5\xb0{\xf7\
+n\xdct\xd3M\xf8\xf9\x9f\xffy\x8c\x8d\x8daff\
+\x06\x8b\x8b\x8b\xa8\xa9\xa9A}}=\xea\xeb\xeb\xd1\xdc\
+\xdc\x8c\x5c.\x97\x08\x10\x82 \xc0\xa1C\x87\xf0\xe7\x7f\
+\xfe\xe7(\x16\x8b\xe8\xe8\xe8\xc0\xe7>\xf79\x05\xf8\xca\
+\xe52\x9ez\xea\xa9e_\xae\xcd\xcd\xcd\xea\x85\x5c\xa9\
+Tl\xa5\xbf\xbd\xbd]ip\x97\xcbe\xcb?\xbe\x1e\
+q\xf2\xe4I\xbc\xe7=\xef\xb1?wtt`\xc3\x86\
+\x0d\xb8p\xe1\x02\xfa\xfa\xfa\xac\xca\x8a\xac\xfa\xba1:\
+:\x8a\xe7\x9e{\x0e\x1f\xff\xf8\xc7\xed\xef\xb6o\xdf\x8e\
+\xcf|\xe63\xf8\xeaW\xbf\x8a\xd9\xd9Y\xfc\xe5_\xfe\
+%~\xe37~C\xd1\x8c\x88\x08\xeb\xd6\xad\xc3#\x8f\
+<\x82\x0f~\xf0\x83\x98\x9a\x9a\xc2\xc4\xc4\x04\x16\x16\x16\
+@D\xea\x1c\x15\x0a\x85%+\x9e\xc3\xc3\xc3\xf8\x8b\xbf\
+\xf8\x0b\xbb\xa2\xf1\xe9O\x7f\xda\xda\xa2\xcbj\xf9\xf5\xa0\
+\xb1H\xa04;;k\xf9\xe3\x8d\x8d\x8d\xd8\xb2e\x0b\
+\xce\x9c9c\xab\x94\xdd\xdd\xdd\xaa\xb7\xa0X,^3\
+\xdfx\xb5D[[\x9b\xd7\xb4\xbb\xd2q\xf1\xe2E\xd4\
+\xd6\xd6\xae\x080\x07`%\x09M\x11\xa1\xb3\xb3\x13\xad\
+\xad\xad\xb6\x92^[[\xeb\xe9\xedWK\x16\xb3\xb7\xb7\
+\x17\xe5r\xd9\x16\x16\x88\x08===\xaa\xc7c\xc7\x8e\
+\x1d\x8aF322r\xcd\xd5\xfa%\x8b\xe6\x0a\xd0%\
+T\xc6)\x06\xac\x0a\x91\x19\xb3!b\x07\xd0#\xe2A\
+\xb3\x06Fn\xe1V`-\xdb\xb8H>\x97\xdb\xee*\
+\x02\xbf\xe4\x18\xff\xc4\xea\x88\xa4\x8a\xcaVY\x86b\xd0\
+\xa6\xd9+\xa4\xcb\xd4\xf2\xcb\x89B\xe8P\xce\x98j\x8a\
+\xc4\xcaA\x8c\xe9\xe3\xe4\xc3\x13O\xb7N\xa7\xe4\xf39\
+\xc8I8\xe4\xf7\x0c\xf8\xf5\xb6'\xfaE\x05@f9\
+\xe9\xde\xe1\xc4\x89\x91\x9f\x0c!V\xe5\xb1+\x12\xa2\xf6\
+\xee\xc8QJ\xee\xba\x05\xe7b\x87\x14g\x03\x91\xd6\xb8\
+\xf0,\x95+0LK-\xcc$_\xbbB\xcf\xdc\xfd\
+`\x9c\xf4H\x85\x9c\xf0\xd3)\x95%\x8dwM\xcc\xcd\
+\xcd\xe1\xf1\xc7\x1fW\xd5\xee\xc6\xc6F|\xe1\x0b_\xb0\
+\xd5\xdd\x17^x\x01_\xfe\xf2\x97q\xe1\xc2\x05\xcf\x8a\
+7\x9b\xcd\xa2\xae\xae\x0e\x1b7n\xc4\xae]\xbb\xb0o\
+\xdf>\xec\xda\xb5\x0b\x9b7oFGG\x07\xf2\xf9|\
+\x22(_XX\xc0\xe3\x8f?\x8e?\xfd\xd3?\xc5\xf4\
+\xf44\x9a\x9a\x9a\xf0\xab\xbf\xfa\xab\x1e\xed\xa4\xb7\xb7\xf7\
+\x92\x95\xd8\xcd\x9b7{\x00\xcc\x18\x0b\xed\xde\xbd\xdbk\
+\x06\xbb\x1e\xfcrY\xa1u5\xe1\x0dx>r\xe4\x88\
+\x9a\xcf\xce\xceN\x0fX\x98x\xf2\xc9'\x95\xeb\xa9i\
+\xc6\xfd\xd0\x87>dA\xc0\x97\xbe\xf4%\xbc\xf4\xd2K\
+\x9e*\x0a\x11\xa1\xa6\xa6\x06k\xd6\xac\xc1\x8e\x1d;p\
+\xcb-\xb7`\xef\xde\xbd\xe8\xee\xee\xc6\xbau\xebPW\
+W\x97\x08\xca\x83 \xc0\x91#G\xf0\xc7\x7f\xfc\xc7x\
+\xfd\xf5\xd7\x01\x00\x8f>\xfa(\x1ez\xe8!\xf5\xf9\xe9\
+\xe9i|\xeb[\xdf\xba\xae\xd7m__\x9fj\x8a\x95\
+\x12v2\xd1\xa9\xab\xabS\xe3L\x1b?Wo\xb8\xf7\
+Rkk\xabj\xf8\xde\xb9s\xa7\xaaX3s\xd5\x9a\
+\xbc\xa7\xa6\xa6\xd4\xf5FD\xd8\xb4i\x93\xba\xfe\xb6l\
+\xd9\xa2\x9eu\x03\x03\x03\xd5m\xfcL\xa8\x9b3yL\
+r\x05F\xb5b\x09Y\xa5\x8fD#\x1fb\x85\xa8\xbd\
+\x9a\xb3c\x98\xc9\x11\xc2&1\x0e\x05\xb0(\xd6:O\
+\x12\x82\xb1\xd6\xee$\x1b6c\xb4\xa9\xfa\x00\xad\xe47\
+\xc3e\x99h\x0e5)\xbe\xbd\x9f%\xc4\x7fb\x877\
+\x1fg:\xe6\x1cs\x82\xb4\xbb\x14=\xd4\xfc\x14\x96\x98\
+\xd2\x17\x05\xf7\x86\x04\x91\x14\x84\x95\xf0\x04\xe1IW\xef\
+\xd1\xb2\x80\x9c\xc4I\xcd+'\xea\xf2X\xf5\x16f%\
+\xa0Hr \x0a2\x93\xfa/I}Ni\x00\x04\x7f\
+\x8cv\x7f\xf2\xe4\xc1\x1d\xb2\xbfz\xc0V\xb7\x9e\x1c)\
+\xd0T.1\x8dwY<\xf7\xdcs\x16\xc8J\xb0\xfb\
+\xeb\xbf\xfe\xeb\x16\x9c\xbf\xf2\xca+\xf8\x83?\xf8\x03<\
+\xf3\xcc3\xd7\xf4\xb2)\x95J8|\xf80\xfe\xe4O\
+\xfe\x04\x7f\xf37\x7f\x83\xb9\xb99ttt\xe07\x7f\
+\xf37q\xe0\xc0\x01\xf5b\x9b\x9e\x9e\xc6\xd7\xbf\xfe\xf5\
+K.E\xbb\xc6BCCC\xb6j\xe7\x1a\x0b%\x19\
+\xd4\xacd\x8c\x8c\x8c(\xbd\xf8\x5c.g\xa5\xfd.\x5c\
+\xb8\xa0\xaa\x8b\x85B\x01{\xf6\xecI\xdc\xce\xf0\xf0\xb0\
+\x97@\xd5\xd6\xd6\xe2\xb3\x9f\xfd,\x1e~\xf8ad2\
+\x19\x8c\x8c\x8c\xe0\xcf\xfe\xec\xcf\xf0\x8f\xff\xf8\x8f\x18\x1e\
+\x1e\xf6\x92\xa8\xcb\x0d\xe3v\xf8\xf5\xaf\x7f\x1d\x7f\xf8\x87\
+\x7f\x88S\xa7N!\x9f\xcf\xe3S\x9f\xfa\x14>\xf9\xc9\
+O*\xeey\x10\x04x\xfa\xe9\xa7\xbd\xebg\xa5Cj\
+\x96\x9bp\xa9@.P\x1f\x19\x19Q<\xe54VW\
+\x9c:uJ\xf5\x86d\xb3Y\xd5\xe7\xe0R\xe5\xe6\xe7\
+\xe7U2{-Q.\x97\xbdkg\xdd\xbau\xb6\xcf\
+&\x97\xcb)\xb9VI\xa7[\xb9\x88\x01V\x92N5\
+\xab\xceBI2\xe0d\xa1q\xc1\xf3\xf5`\x93\xb4\x11\
+%\x87\xfbm\xa1\xb8\x03\xe5\x995\x8es\xc0m\x082\
+e\xeb\xea\x12`S\x82Rv\x8e\x95\xe2\xd5\x03\x90\xe3\
+\x83$\x14C\xd85.\xb2\x15l\x8e\x0d\x82\x04\x86\xb4\
+\xee\x9cI\x902\xc9\x9dS\xea\x85'z(\x91\x95N\
+T\xfa\xe4\xc6\x81\xd3\x01\xc5\xe6\x1cq\xc2~b\xe0\x1f\
+\x01\xf7\x04\x83%N\xce\xd6\xec\xf8\xa4:\xbd\xbc:\x22\
+MM5\x86\xb0\x9ao\x12\x0fNH6\x92\x5cLa\
+\xa52Y\x89O\x8aM\xb3\xcf\x85'\x8a\x95h\xc8\xf9\
+BJeI\xe3]\x15\xc5b\x11\x7f\xff\xf7\x7f\x8f\xad\
+[\xb7\xaa\xe5\xef\xed\xdb\xb7\xe3w\x7f\xf7w\xf1\xb5\xaf\
+}\x0d/\xbf\xfc2\x06\x06\x06\xf0\xe5/\x7f\x197\xdd\
+t\x13\x1e|\xf0A\xec\xdd\xbb\x17\x9d\x9d\x9d\xc8d2\
+a\x03\x0e%5\x820*\x95\x0aFFFp\xfc\xf8\
+q\xfc\xf7\x7f\xff7\x8e\x1c9\x82b\xb1\x88L&\x83\
+;\xef\xbc\x13\xbf\xf0\x0b\xbf\x80\xcd\x9b7\xab\xef\x97J\
+%|\xf3\x9b\xdf\xbc\xa4\xfc^6\x9bM4\x90\xa9T\
+*\xa8\xaf\xafW*\x09\xf2o\xd7+FGG12\
+2\xa2*{\xd2h\xe8\xe2\xc5\x8b\xb6\xd1\xb5\xa6\xa6\x06\
+\xdd\xdd\xddx\xe6\x99g\x12\xb7\xf5\xc4\x13O`\xef\xde\
+\xbd\xb8\xeb\xae\xbb\xec\xef\x1a\x1a\x1a\xf0\x85/|\x01]\
+]]x\xec\xb1\xc7\xb0\xb0\xb0\x80o}\xeb[x\xf6\
+\xd9g\xf1\xc0\x03\x0f\xe0\x8e;\xee\xc0\x96-[PS\
+S\xb3\xec9bfk\xca\xf3\xea\xab\xaf\xe2\xd9g\x9f\
+\xb5\x15\xc2\xb5k\xd7\xe2\x17\x7f\xf1\x17q\xf7\xddw{\
+=\x02\xaf\xbf\xfe:\x1e{\xec\xb1\xb7\xe5\xba\xed\xed\xed\
+\xc5\xbd\xf7\xdek\x7f^\xbbv-:::0::\
+\x8aL&c\xb5\xa6M\xbc\x93i,\xa7N\x9d\xc2\x8b\
+/\xbex\xd5\xc9\xd8\xd5D{{\xbb\x97\xf8\xaedT\
+*\x15\x5c\xb8pA\xddK2\x19\xdb\xb0a\x83J\xd0\
+'&&\xaaF%\xa9T*\x18\x1c\x1c\xc4-\xb7\xdc\
+b\x7f\xd7\xd1\xd1\x81\xba\xba:\x94J%\xac_\xbf\x1e\
+\xad\xad\xad\xea\xbeZIga\xb9\x1f\xc5\xc5F\x0cj\
+\x18q\xd5\xdc\x03\xd9\x04\xe1J\xe9\x16j\x8dc\xa5C\
+3\x90\xb4\x18[5g\x81\xf3\x13\xf8\xc6\x8c\x84m\x09\
+\xe7G\xaf\x87Q\x13\x1d\xa0x\xe3\xe6\x98\x11W\xe39\
+v\x07\xa5\x04\xde\xba\xe6\xa6C\xa9\xca\x08\xe6\x8a7\x0e\
+;f\xcd\x17Q*+F\xb7\x9b\xc4\xa43\xc7.\xa0\
+.\xec\x14m\xb7\x89`\xd4\xf2\xf0\xdd\x81\x99U\x02\x87\
+\x9a\x02\xc0RP\xdc\x8cf9\xbfU\x9bt8\x14(\
+B\x0c\xc2I]_P\x9c|N\xf2D\x92\x13-\x17\
+^\x04\xaf\xde9j\xcb\xa3W\xe7,r\x10%\xf2\xc7\
+\x9e\x02\xf34\xdeu\xd1\xd7\xd7\x87\x7f\xfa\xa7\x7f\xc2\xe7\
+?\xffy\xb5\xfc\xbf~\xfdz\xfc\xfa\xaf\xff:^|\
+\xf1E|\xe3\x1b\xdf\xc0\xe0\xe0 \x8e\x1e=\x8a\xb7\xde\
+z\xcb\xaa\x10\xec\xde\xbd\xdbR\x22jkk\x11\x04\x01\
+\x8a\xc5\x22&''\xad\xf2\x8bQG\x08\x82\xc06:\
+>\xfa\xe8\xa3\xb8\xf3\xce;\x95\xdd\xbby\x09~\xef{\
+\xdf\xc3w\xbe\xf3\x9dK\x8e\xbb\xb9\xb9\xd93\x222\x00\
+\xcc5\x16Z\x19{\xecK\xbf\xd0\xfb\xfb\xfb\xb1{\xf7\
+n\xfb\xbb\xae\xae.\xd4\xd6\xd6baa\x01\xe7\xce\x9d\
+S\xca!K5\x80\x9a\x04\xeao\xff\xf6o\xb1n\xdd\
+:\x05:kkk\xf1\x91\x8f|\x04{\xf7\xee\xc5\xbf\
+\xfe\xeb\xbf\xe2\xb5\xd7^\xc3\xc8\xc8\x08\xfe\xe5_\xfe\x05\
+\xff\xfe\xef\xff\x8e\xd6\xd6V\xec\xdc\xb9\x13\xdb\xb6mC\
+CC\x03jkk\x91\xcdf\xb1\xb8\xb8\x88\xd9\xd9Y\
+\x5c\xbcx\x11}}}\xe8\xef\xef\xc7\xdc\xdc\x9cU\xb3\
+iii\xc1\x07>\xf0\x01<\xfc\xf0\xc3\xe8\xe8\xe8\xf0\
+^z'O\x9e\xc4_\xfd\xd5_\xbdm*'\xa7O\
+\x9f\xc6\xc2\xc2\x82\xbd~\x1a\x1b\x1b\xd1\xdd\xdd\x8d\xd1\xd1\
+Qtww+e\x9f \x08VF!\xe3\x06\x89\xe7\
+\x9e{\x0e\xcf=\xf7\xdcu\xdd\xe7#\x8f<\x82\x1d;\
+v\x5c7`n\x1a@o\xbd\xf5Vu/544\
+`~~\xdek\xf45}/\xd5\x8a\xf3\xe7\xcf\xab\x06\
+\xd0\xd6\xd6V444`jj\xcas\xc0\x9d\x9a\x9a\
+\xf2VtV$\xe2~\xc6\x04\x90+8+\x12$Q\
+\x5c\xcd\x8eA\xee\xd2\xea-\x19S\x85e\x16UaR\
+EUN\x10\x0d\x8f\xe9\xd8\xec\xb2\x9d\xc5\xc8D\x85\xd6\
+\xa1\xe5\x90S\x9d\x8f\x0b\xcd\xa4\xb6\xa9\xa0\xa3;\x0f\xd6\
+\xc8\xc7G\xe8\x09uz\xf5%\x16\x0d\xac\xba\x196\xde\
+W\xac\x16#\xf8\xe0,\xa4\x18\x11\x03x\xa5\x9b\x1e}\
+\xc7\xf2\xdb\x1d\x09H\x09\xca\xa1\x1a-e\x92\xb0DV\
+a\xf9\xfb\xec\xc1t\xd5\x8c\x9a KI\x90\xa5j\xd9\
+V\xca\x89Uq8\xce\xac\xa4,a\x09\xb4Dr`\
+\x0e\xdceUYP.\x92\x1f\xa4\xc0<\x8dws<\
+\xf5\xd4Shll\xc4\xa7>\xf5)\xc5\xd5\xac\xab\xab\
+\xc3\xfd\xf7\xdf\x8f\xdbo\xbf\x1do\xbc\xf1\x06\x9e}\xf6\
+Y\xbc\xf9\xe6\x9b\x98\x9b\x9b\xc3\xa9S\xa7.\x09v3\
+\x99\x0c\xf2\xf9<Z[[q\xef\xbd\xf7\xe2\xf6\xdbo\
+\xc7\xcd7\xdf\x8c\xba\xba:\xef\xa5^.\x97\xf1\xc4\x13\
+O\xe0\xef\xfe\xee\xef.\xab\xb2\xdd\xd1\xd1\xa1x\xd9\x95\
+J\x05\xc5b\x11\x07\x0e\x1c\xf0\xcceJ\xa5\x12\x8e\x1c\
+9r\xdd\xe7\xf5\xd8\xb1c\xf8\xe0\x07?h\x7f\xae\xaf\
+\xaf\xc7C\x0f=\x84\xf3\xe7\xcf+\x9a\x8b\xa9\xfaI\xa5\
+\x097.\x5c\xb8\x80\xaf|\xe5+\xf8\x8d\xdf\xf8\x0d\x95\
+\x90d\xb3Y\xec\xdc\xb9\x13\xbf\xf9\x9b\xbf\x89S\xa7N\
+\xe1\x85\x17^\xc0\x8f~\xf4#LLL`xx\x18\
+\x83\x83\x83KV\xe2\xe56jkk\xb1\x7f\xff~\xdc\
+}\xf7\xdd8p\xe0\x00\xda\xdb\xdb\x13\xf9\xe7\xbd\xbd\xbd\
+\xf8\xf2\x97\xbf|]iAI\xc9\xe4\xd4\xd4\x94\x05\xe6\
+\x85B\x01;w\xee\xc4\xd1\xa3G\xd1\xdd\xdd\xad\xce\xfd\
+\xcc\xcc\xcc\xdb\xce/_\xb7n\x1d\x0e\x1c8\x80\xb6\xb6\
+\xb6\xaaH\x0b\x1a\x9e\xf3\xf5T^\x91!+\xd7\xd7\xf3\
+\x9c\xcb&\xcc5k\xd6\xe0\x8e;\xee\xc0\xcc\xcc\x8c\xa7\
+\xbe488X\xd5\xd5\xb1\xd3\xa7O\xa3R\xa9\xd8s\
+\x97\xcf\xe7q\xef\xbd\xf7\xa2\xaf\xaf\x0f{\xf6\xecQ\xc0\
+|xxx\x85\xf9\xe5\xba\xc2h\x013\x93\xd7\x9bG\
+\x02\xe8\xb1(F\x13\x12\xaa\xd1\x0e\x90#Ez\x88\xb9\
+\xe3\xaa\xfa\xccN%\xde\xca\x1eR\xacT\x02\x0d@Y\
+\x80[\xbf#R\x03\x7f\x83;\x15Q\xc6\xe5\xc8\xc4\x08\
+7\x81\x82C\xb1!\x93\xeb\x8ei\xdcAY\xf3S,\
+\xf1'\x02\xe5z\xd5!V(\xb1\xee\xa7\x0e\x9e&\xb7\
+\x9a\xcdq\x05Z\xaeb(\xdfQou \x06\xa7\xe4\
+\x98\x1e\x99\x9d\xc7\x95}\xc0-3+\xc0\xef$kI\
+\xd5{\x88\x86\x5c\x97\xea\x22\xc8\xf3\x09\x0d\xc5\xa4\xddK\
+\xe3\xf2z\x82\x99\x90\xdc\x1d\x89\xb9JX\xd9pr\x81\
+\x14\x98\xa7\xf1\xae\x0ccXS*\x95\xf0\xc9O~R\
+5T\x12\x11\x9a\x9b\x9b\xf1\xde\xf7\xbe\x17\xf7\xdcs\x0f\
+\xa6\xa7\xa7q\xf6\xecY\x0c\x0f\x0fcxx\x18\x13\x13\
+\x13\x98\x9f\x9fG\xb1X\xb4\x00\xaf\xa9\xa9\x09\xed\xed\xed\
+\xe8\xec\xecDWW\x17\xd6\xae]\x8b\xba\xba:\xf5\x02\
+\x93a\x9a\x08\xff\xe3?\xfe\xe3\xb2M9\xdcJUM\
+M\x0d~\xf9\x97\x7f\xd9\x8eY\x82\x96\xa9\xa9\xa9\xeb^\
+1\x07`+\xd1Fm\xa6P(\xe0\xf3\x9f\xff\xbc'\
+\xc7e\xaa\xbe\xbbw\xef\xf6\x1c=e\x1c?~\x1c_\
+\xfa\xd2\x97\xf0\xc5/~\xd1\xab\xb0\xd7\xd4\xd4\xe0\xe6\x9b\
+o\xc6M7\xdd\x84O}\xeaS\x18\x18\x18\xc0\x85\x0b\
+\x17022\x82\xd1\xd1Q\xcc\xcd\xcda~~\x1e\xcc\
+\x8cB\xa1\x80\xba\xba:ttt\xa0\xbd\xbd\x1d]]\
+]X\xbf~=ZZZ\x90\xcdf\x13\x01_\xb9\x5c\
+\xc6\xc1\x83\x07\xf1\xd7\x7f\xfd\xd7U\xb7\x1a\xbf\xd2\x98\x9c\
+\x9c\xc4\xe0\xe0\xa0R\xe4\xf9\xd8\xc7>\x86\x9f\xfb\xb9\x9f\
+\xb3R\x90&&&&\xacm\xfa\xdb\x15\x1f\xff\xf8\xc7\
+\xed\xd2\xb0K\x09\xba\x9a\xc8f\xb3\xf8\xdc\xe7>\xf7\xb6\
+\x1d\x0f\x11\xad\xa8vyR\x1c>|\x18\x8b\x8b\x8bv\
+\xfe\x1a\x1a\x1a\xf0k\xbf\xf6kv>b\xcc\xc2U\xaf\
+X\x9f:u\x0a\x8b\x8b\x8b\x96W\x9e\xc9d\xf0\x99\xcf\
+|\x06\xcc\xec\xcd\xc3\xf9\xf3\xe7\xaf\xd3J\x92tnt\
+\x04J\xa4\x83&\xf9\x00\x8d#9>\x09J\x0dl3\
+5i\x05\x8eH\x08$\x92/\xc1G\x0a\x84i\xb9\xc0\
+x?\xba\x83\xd4@`\xa2\x04p\x9eT\xcf\xa6x{\
+n\x03\xa4r\x0e%mS$<\x99\x92\xe0ab/\
+,\x92\xc0\xab3\x16O\x17\x5c\x16\xb1\xc9\xd7\x1c!-\
+)\xe3\xdcO:\xa9\xd1\xe7)\xaa\xc2K\x00.WK\
+\xe0S\x8f\x92\xd9@\x22\x89KR}!\xa7\xf2\xedl\
+\xcc\xaeX(\xe3\xa8x\x1d\xc3W\xc6a\xaf:\x1f\xe7\
+dq&\xe7\xa4=\x9a\x1a\x13}.\x05\xe6i\xbck\
+\xa3R\xa9\xe0\xbb\xdf\xfd..\x5c\xb8\x80_\xf8\x85_\
+\xc0\x96-[\xbc\x97N.\x97SrlA\x10\x08\xbb\
+]V\xa08\x89\xd7\x9c\xb4\xcf\xb7\xdez\x0b\x8f=\xf6\
+\x18\x0e\x1f>|E\x0dSI\x1c\xd7\xa5@\xcf\xd9\xb3\
+g\xaf+\xbf\xdc\xc4\xe8\xe8(FGG\x95\x0c\xe4R\
+\xc9IMM\x8d'\xc3\xb6\x148\xff\xa3?\xfa#|\
+\xfe\xf3\x9f\xc7]w\xdd\xa5V8\x0ch\xa8\xaf\xafG\
+OO\x0fzzz\xc0\xccv^\xe59\xba\x5c\x80\xc5\
+\xcc\xb8x\xf1\x22\xbe\xfb\xdd\xef\xe2\xbb\xdf\xfdnu\xdd\
+\x0c\xaf!N\x9e<\xa9\xa8\x0d\xc6\xec&)9\xba\x1e\
+\xda\xf5\x97\x02\xd2\xd5\x8ej\x00\xfc\xd5\x14\xa3\xa3\xa3\xb8\
+x\xf1\xa2\xa2r%\xcdA5\x15YL,,,`\
+tt\x14\x0d\x0d\x0d\xcb\x9e\xd3 \x08\xae\xab$\xab\xe4\
+[{\xdc\x00\xc4z\xe5\x9aS\xcen\x19:\x86X$\
+t\xab%`g\xab\xc2\x17Wp\x15\x1d\x9c\xad\x81\x0c\
+\x91\x03\xa4\xed\xb6\x9c\x01R\xc2w$\xac\xb3\x14\x12!\
+\x9f\x08]\x8dv\x0f\xd7P(|!>V\xab\x0ar\
+|1w\x9c\x9c1\x90:n\xeb\x1a\xca\x82\xda\x93\x84\
+\xe8\xa3\xedQ\xc2\x1fy\x09\xc0\xaf@9\x8bI\x97\x1c\
+m/wq'[\x9e,$\xafH8:\xec\xfa\xbc\
+2<\x13XOI\x86=\x00.\x18<\x96_\x9f\x89\
+@v(\xb3\xc8N\xc5_P\x8f\xbc\xddpl\xe2$\
+\x12\xac\x14\x98\xa7\xf1\xae\x8e \x08\xf0\xea\xab\xaf\xe2\xf8\
+\xf1\xe3x\xe4\x91G\xf0S?\xf5S\xcb.\xbf_m\
+\xd5\xac\x5c.\xa3\xbf\xbf\x1fO=\xf5\x14\xbe\xff\xfd\xef\
+_q\x85\xa9\xa1\xa1A)!\x5c\x0aX\xf6\xf5\xf5\xbd\
+-\xe0ljj\x0a\x83\x83\x83\xca\x04i\xa9\x90\xee\xa0\
+\x97\x03R\xfe\xec\xcf\xfe\x0cw\xdf}7\x1e}\xf4Q\
+tww/\x09\xd4\x88\xe8\xaa\x80a\x10\x04\x18\x1f\x1f\
+\xc7\xc1\x83\x07\xf1\xedo\x7f\xfb\xba9{^n\x1c?\
+~\x5cQ\x1b\x96\x8a\xde\xde\xde\xf4\xc6~\x87<\x9b\xce\
+\x9d;\xe75\xf6\xba133\xa3\x9cu\xabU\xb4\x18\
+\x19\x19\xb9\xe4\xbe+\x95\xca\xf5\xa5\xcc\xb1^\xf7W:\
+\xe3\xaaR\xedbb\x8a\x0d\x89\x1ct\xee\xfel%\x0a\
+9\xae\x96\xbb\xf8\xd6\xd7\x86\x81\xad`K\x09=r8\
+\xd21^\x8bE\xcb]\x81E\xf2]lD2\x00\x0b\
+\x90C9E\x8a\x1aA\xa1\xa0\x1e%4\x92\x12\xb3f\
+`\x08j\xb3l\xcc\xb4\xda\xef\xb2\xc2n\x0d\x97\xc8\xa7\
+j\x08-q\x97\xcbM\xe2o:u@L7\x12\xe7\
+\xd0\x12K\xbc&\x82\xb8\x8a\xce\x09\xc9\x01\x89K#\xf1\
+$\xcb\xc4Mu\x0f\xcb\x8a5\x8bs&\xa4-\xd5\x19\
+\x89\xa9BI-\x9e\x0c\xd9C\xa0\xb3G\xb2\xcd\xa6I\
++$z\xf0)0O#\x0d\xc4r\x85\x8f?\xfe8\
+\xee\xbb\xef>\xdcs\xcf=\xd8\xb2e\x0bjkk\xaf\
+\x0a\x8c\x9b\xaa\xed\xe8\xe8(\x8e\x1f?\x8e\xe7\x9f\x7f\x1e\
+\xaf\xbf\xfe:\xe6\xe6\xe6\xaej|\x8d\x8d\x8dhoo\
+W\x12\x82KE\xa9Tz[\xc1\xd9\xc9\x93'q\xdb\
+m\xb7]\xba\xf8Et\xd9\xc9\x86\x01\x01/\xbc\xf0\x02\
+^{\xed5\xec\xdb\xb7\x0f\x0f<\xf0\x00v\xed\xda\x85\
+\x96\x96\x16\xab\x96s\xa5\xe7\x88\x99177\x87\xd3\xa7\
+O\xe3\xd0\xa1C\xf8\xc1\x0f~\x80\x89\x89\x89\xb7\xbd\xe2\
+\x9c\x14\xfd\xfd\xfd\x98\x98\x98P\x8a\x18n\xcc\xcf\xcf\xbf\
+-4\x96J\xa5rY\xd7f\xa5R\xb9,5\x15\xa3\
+pt9\xdb|;\xe2z\x8d\xab\xaf\xaf\x0fw\xddu\
+\xd7\xb2\xd7\xb6\xa1mU;)8\x7f\xfe<\xf6\xef\xdf\
+\xbf\xec\xe7.^\xbcX\xf5\xa4`\xd9g\x06\xb4\x16\xb8\
+\x12\xc7`\x12\x80X\x02>\x01*\xb1\x0c&\x02{\x8e\
+\x9c\xa48\xea1\xe0\xd6\xe5b\xc71\xd3\xaa\xa6h\xb0\
+l\xab\xb4\x91J\x07II>{<N\x95\x9b\xe3\xb1\
+\xcbA\xb0\xb4\xb8\x07<C\x1f\xb5i\xc7\xbc\xd3m\xf2\
+\x94\x19\x0eK@\xc9R\x11\x85c]q\x95\xf4h=\
+x\xf2r\x0a\xa9F\x22\x8ct\x1c\xd3\x1e}\x1e\xa1\x8e\
+\xd1\x9ew\x96`\xdf1\xfb1\x9bNJ\x10\x22\xf0m\
+(?j\xf1\xc3r\xd7%\x00\x17\x12\x99\xe6\x9a\x22A\
+X\x924\x1c&\x95\xdc\xc8fW\xd7\xb0\x89\x95?\x14\
+y\xd7\xb5U\xf5a\x06}\xf4\xa3\x1fe\xa4\x91F\x1a\
+*\x0a\x85\x02ZZZ\xb0\x7f\xff~\xdct\xd3MX\
+\xb3f\x0d\xda\xda\xda\xd0\xd8\xd8\x88|>\x8f|>\x8f\
+l6\x8b \x08P\xa9TP*\x95077\x87\xa9\
+\xa9)\x8c\x8d\x8d\xa1\xbf\xbf\x1f\xc7\x8e\x1d\xc3\xa9S\xa7\
+\xacB\xcb\xb5D&\x93Y\x16\x90\xb9\xf1v\x82\xcbB\
+\xa1\xa0\x96\xc0/\x05\xd4\xa4\x99\xc9\x95D6\x9bEC\
+C\x03v\xec\xd8\x81[o\xbd\x15]]]hkk\
+CKK\x0b\x0a\x85\x02r\xb9\x9cub-\x97\xcb(\
+\x97\xcbXXX\xc0\xf4\xf44&''q\xfe\xfcy\
+\x9c<y\x12G\x8e\x1c\xc1\xc4\xc4\xc4\x0dCYY.\
+Z[[\x97M\x14\x99\x19\x93\x93\x93\xd7\xfd\xdc\x1b\xae\
+\xfe\xe5\x00\xee\xcb\x19_6\x9bEss\xf3\xdb\xd6\xec\
+y9\xc0ujjj\xc5\xe79\x9f\xcf\xab\xfe\x97\xa5\
+\x92\x84\x95p \xbd\x9c\xfbx\xa5\xf6\xbd<87\xd2\
+}!\xa8\x92\xc0\x99DC\xa8TF\x89\xdd!\x13\xaa\
+\xa0\xe4\x00[!\xe3Gp\xcb\xca\x02p:\x05XU\
+\xb5M\x90`T\x03\xf5\xa8\x1f\xb1\xfa\x0a\xa4+\xa5\xc4\
+\xe8\x09\x12\x89d\xcdo\x12\xf2\x0d\xaf\xc1Q\xd0^(\
+a{\x86\x09\x94\xa0\xed.\x9bg\xfd\xa3\x22\x95\xdc\x90\
+;n9\x97\x8e\xba\x8c\x82\xd1\xa4\x8b6\x9e4\xa1\x18\
+Cb\x9b\xa7\xa4\xea\x88$F3\xeb\xb5\xdb\xab\x22\x02\
+\xb9&\xa6\xc6!\xd6\x00p\x12\x90ZHf\xea\xf3l\
+\xf6A\x09b+1/}\xc9\xa30+\x15)0O\
+#\x8d\xcb\x03\x81\x06\xec\x19\x9e2EV\xd0\x86wn\
+*|\xa5R\xe9\x86\xac\xb8\xbe\xd3#\x93\xc9\xa0\xa6\xa6\
+\xc6:\xb0\xca\xa6Ns\x9e\x82 @\xa9TB\xa9T\
+z[8\xf8i\xa4\x91\xc6\xb5\xc1r\xd9\xd4\x17\xd3,\
+\xdc?\x93\xabh\xe8bn\xe8j1'T1#\xd0\
+\x9b\xd4\xe7\x87X&\xd0\xaf\x80\xba\xea\x1c\x0e?Y9\
+_:\xed\x92\xc4pY\xe3R:P\x82=\xb9-O\
+'\x9b\x1c\x99F\xef\xd8<\x14\x0bMB\x87\xa2\xc3\xc4\
+t\x9e\xf0\x9d\xe7\x02i\xd8\xbfi\xb9\xc6X^R'\
+*qr\xc3.<\xf7\x01\xb8\x05\xe7\xaa\x03\xd4\x01\xe9\
+\xf2D\xeb3B\xb2s\x95)\xd9\x14I\xbc'\x88\xf4\
+9Y\x02?;T\x97$\x1d|Jj\x0a\xf0\x8e\xd1\
+\xf9'\xc0)\x95%\x8d4.+*\x95J\xd5\x97\x8b\
+\xd3\xa8n\x04A\x80\x85\x85\x85\xb7Mk<\x8d4\xd2\
+X\xe9\x88\x9b\xf1,}\xc5\x05\xe0\x06\xbc%\xeb\xd6)\
+S\x19\x18\xe0'\x0ct\xe4\x7f\xb5\xf1\x0di\x08k\xe5\
+\x039a\x8c\xb6$\xedkhSb\xaa d\xf8\xf4\
+\xbeXp;\x88\xa4\xe1\x11\x84{\xa5\xc7\x9d\x89\xf4\xb8\
+\xdd\xe4 vE%JV#1\xa0\x97E5\x98\xa5\
+B\x0c|\xe3\x9dX;^\xa3L;G\x12_\x8b\x95\
+\x01S\x91\xa6\x04\xee:\x19\x91\x05\xe3\x82J\xacz\x00\
+\xc8\xd7,T\x87\x1aSG\x9c\x9e\x03G\x0d&v\x02\
+M0\xa5C\xcc\xbb\x97\xbb\xd2\xab.K5\xb7\xba\x89\
+a\xe4Ek\x92F\xe8\xbeWy\x14\x99\xf4FO#\
+\x8d4\xd2H#\x8d4V\x0b67\xea'q\xc1W\
+8l29\xf6\xf1\x12\x04\x91\xa22\xc8\xbf\xc6\xf2~\
+\xaez\x06\xc7UR\xd6`\x99I@.\x17'F \
+Z\xf70\xc6NG\x8c$\xb2B\x82\xe5\xbb\xc0\xdd\x0a\
+\xd8\x0b\xddr$\xba\x8a\xc2\xca\x0b&\x1e\x19\xdb\x89\x8c\
+G\x22@/\xb1\xe7\xc1$\xe4H\xe4\xdc\x92J:\xd8\
+\xa5\xdf+\xfa\x868\x00\xc3Kw4\xe7%\xb2\xb5R\
+\x90\x14\x9fv\x93\x8c1\x08K\xca;\xb2\x0b\xf2a\x9b\
+Y\xed\x0a\x83\xf3Q\x92'X\xc1i\x8a\xddN\x1d\xf4\
+m\xf4\xdf\xfd\x8e\x033`6p\x5c\x98I\xc5\xbf!\
+\xf7\xfa\x8c\xf6\x93\x02\xf34\xd2H#\x8d4\xd2Hc\
+U\x84\xe2\x00{ 1\x06\xd2\x89\x08\x8d} \x95D\
+\x03'\xd9\xe8\xe9\x96>\x85\x14H\xdc\x1cJ\x0e`\x16\
+\xcd\x8b,\x8d\x89b\xc0\xac$I\xcc\xbf\x22p\x98D\
+\xaa\xb1\x9a\xd7\x09\xc7J\x9c\xa0\xdd\xaeL\x84\x5c\xb2\x8d\
+\xa1\xbf@\xb9V\x0a\x0d\xc9\xa8\x08N:\xe9\x01+\x89\
+F\x8bz!e&\xd9\x82\xd2\xf8\xbf\x94\x8c\xdaI&\
+\x15\x1a\xf8.\xad\xaa.\x1c3\x93\xae\x0d\x0aW1H\
+\xdb4\x89F\xd6\x84\xd9\xb5\x09]\xc2\xdfH4\xef\xba\
+\x0a:\xbc\x8c\x0a\xba\xbd\x90\x08\xda\x09+>'\xec\xe7\
+_\x00S\x0a\xcc\xd3H#\x8d4\xd2H#\x8d\xd5\x11\
+J)\x04\x12\xa5k\xa0\xe5\xbaK\x92\xa8~\x92\x92\xff\
+ k(\xe4\xe1\xdb\x08U\xb3\xa2\x86h\x09\x11\x03\xc4\
+<\xb5!\x8a*\xaa\x80\xa2\xbb\xb0\xac \x0b\xa0m\x80\
+2\xbb\x85[f-\xae\xeeTn\x13$\xda\x0d\x8av\
+s\x05(}q\xd2\xe3\xd1_%\x91\xf8\x08\xb6\xb6u\
+\xaftJ\xbd\xb2z\x1dU\xc0YhYr4\x17\xbe\
+6\xa5\xf8\x8f\xa0x@\x02\xf5\x04\x00\xce\x89\x5c\x1a\xe1\
+\xc7$m6\x9d\xeb\x82\x08~\xa5:\xba(\x98\xdc\xe4\
+@dU\x86z\x93\xb0W\xb2\x95q\xf1Q!O\xc9\
+\xea\xb2\x89\xd3\x10u]\xd8\xf1\xa5\x15\xf34\xd2H#\
+\x8d4\xd2Hc\xb5\x05\x09\xe3\x19\x07,\xb1'|\x07\
+\xc4B\x85\xb0J\x1b\x1a\xc4\xc6\xc6q\xba\xb0\x1b\x9b\x93\
+\xc1\xdf\x9d\xd5\xb4&\x07(\x1a\xfa\x84\x01\xfd\x02\xafk\
+T\xad\xf8\xdb\xd1/\x13\xb5\xc2\xb5\xe3\xa7\xacn\xfb\xd0\
+\x5c\xf2\xb3)\xa6\xe1p\x82\xcb&\xb3C4\xe1\x98\x0f\
+\xed\xae\x14p4w.\xba\x8d\x00\xac\xe7@j\xc6\xeb\
+.l\x88.\x5cs\xe8I9Q\x08\x84I\x97\xbc\xc5\
+\x06\x1c\xd8\x1d')$\xbe\xab7\x17\xaddD\x09\x97\
+M\x96\xa2\xeb\x81\x93\xd3\x9c\xb8\x97\x81=\xcaP\x92\xa6\
+\xbd\x84\xdb&\xbf\xf1V\x18\xe4\xf9`\x9d\x87\xa5\xc0<\
+\x8d4\xd2H#\x8d4\xd2XU\xa8\x5c\x18S&V\
+\x8cY\xd2\x19lq\x9c\xac\x8b\xa5Kw\x91\x1ct\x9f\
+\xaf\x1dU\xc4\xd9G\x90\x8c\xd8\x193\xc9u\xc8\x05\x9d\
+,\x98\x0d\x8a\xa6\xcd\x1a\xa7'\x81C#g\x18c:\
+V\x0e\xa6\xacQ\xaf\xb0\x83w\x993q\x13m\xac\xfd\
+-\x8f6L8\x92\x98\xf8!\xd0\x0e\x1b6UE\x9b\
+D\x02\xc4\xb4D&%V\x1e8N\xa3\xe2\xe3p\xcd\
+\x96\xe2\xb1sB\xb2B\xac\x933]\xc1\x86\x9f\x0dp\
+\xac\x19\x0eI&\x89*\xd5\x04^\x8a\xb5\x8e\x04F\xbe\
+\xe5\x9eK)Iu\x85\xb2\xb9\xde\x84#\xa8\x94\xcb'\
+\xd6\xf9R\x14)0O#\x8d4\xd2H#\x8d4V\
+\x11.\x8f\xb8\xe2\x8c\xc4\x16@\x03\x8a\xe2\x12\xb3P6\
+\xb1 \xcd\x91,\xb4\xcdz>\x22\x8b\xa9\x1f\xc2\xe0\xc7\
+\x001\x8au\xbc\x99\x9c\xbf!\xa1\xa0\xcd\xfe/%\xa4\
+f\xd1\xb8\x99\x04Ra\x1b\x19}\xb4\x9f\xa4@n(\
+)\x9e-\x12\xeb\xf9\x22v;f\xe3\x83Q\xd5\xde(\
+10N\x9c\x16\x94\xb2\xc7\x1e\xd2\xa6\x9b\xa6\x87\xd2K\
+`bz\x91\xcbZ\xb1\x8e\xa4\xd0\x15n\xd9\x8cIK\
+T\xad!\xe8\xdd\xb1\x8e\x8aHP\x1c=MC\x85g\
+8\x06H\xd0\x8e\xae\xaa\xd9\xd5I\x0c\xf4\xa1G@\x9f\
+(nT%1\x9fL\x96\xef\xee\x8e>\x05\xe6i\xa4\
+\x91F\x1ai\xa4\x91\xc6\xea\x09\xc3\xa6p\x1b.\x15\xa0\
+\x83\x902\x89!\x95ijd\xf8M\xa0\x1c}>\xa9\
+\xe0\xcb\x9eA\x8c\x8b\xdc\x93\xc8\x1fK\xb6/\xda\xa6M\
+N\x02\x96\xecV\x95c*\x06%\xd6\xd3Y\x01kY\
+\xfff\xa1TCn\x96`\x9dE\xe1\xa9\xc1\xb0\xa3$\
+b\xc1|\x94\xdc0\x93\xce3\xc4\xfe\xf4\x9cD\xa0W\
+Pf\xd8\x95\x11\xb4\x95tJ\xe8\xd7\x8d\x92,r\x9a\
+T\xa5\xfd+3|\xd5J^\xa21\x93\x94z\x8f\xc7\
+\x90I\x90\xc0\x8c\xf3;\xf2A\xb8c\xfd\xc9~\xbf\xb1\
+R\xc8\xb1_\xa3\x90cN\x0c/\xb5L\x81y\x1ai\
+\xa4\x91F\x1ai\xa4\xb1\xba\xb0\xb9\xe1\x82K)oh\
+p\xcaV}D+N\xdbjfR%[iU\xc7\
+\xe8\xcb6\xf8\xb1\xdf=H\xe4\x17\xe0%\xa2c\x07\xbe\
+\x92\xd0,O\xe2W[\xcaM\xb42\xa0r\x00RP\
+]}\xc7\x94}\x89\x13,\xdf\xd5\x01j\xce5\x91+\
+\xa7\x18r\xea\xad\xeex\x02\xbd\x9e(\xd6R\xf7=L\
+\x914\x89B\x0e\x9c\xc1\x09\x1fIL:\xa2\xa6Lx\
+Ul\x88\x06O}N\xd8\x95X\x94cg\x7f\xa5\xc2\
+C\xd2L\x09'\xd3i\x05\x90\xd9\xa0\xa48\x89\xb1:\
+\xa7N%F\xb6\xef\x97\xfc1\xa4\xc0<\x8d4\xd2H\
+#\x8d4\xd2X\x9d\x00\xdd\xa2c\x0d\xa4L\xc3#9\
+t\x06G;\xc3\xa9\xa8\xb3\x03\xbc\xd8\xa1\x9d,\xa5\x9b\
+m\xc8%\xb1>\xb9\xf9)\xaeD\x8b\xb4\x81b\xdby\
+5^\x09\x0eI\xb8\x84:4\x13WU\xc4\x82]\x22\
+A\xd3p\x12\x0b\xcbmw:\x0d\xa3$\xc7b\x5c\xf6\
+f6q\xce\x8d2\x8b{\x1cR\xa4\x85\xdd\x0a8\xb3\
+\xd0/\x87Sv\xd6&>\x80\xab\xb0\xa3\xd1=\xcb\x84\
+\x04\xa2\x1a\xcd\xe2'\x96\x92\x96I\xa0?\xa9y\x96\x96\
+\x82\xec1\x15\x86\x9d\x84I\x5cJR:\x93\x12\x133\
+\xd2\x1b\xb3UxN\x81y\x1ai\xa4\x91F\x1ai\xa4\
+\xb1\xba\xc3w\xc8\x14U[A\x07aO\xc9\xdb\x93\x12\
+W@\xcfm\xc5\x8c\x9b-\x05(\x13\x86CL\xec\x8c\
+\x07\x8a\xfa\xc2\xae\x88\x09b\xa7L\xa9yn\x00c<\
+4R\x16\xf7v\x7f\xc2U3TYQ\x03\xf2a&\
+#1\xb9\xb0G\xe9\xb8U2\xbb\x14}\xbdQ\x92.\
+\xa2j\xd3\x1cK\x16\x82\x13-\xed}\xc8\x1f\x19\xff\x98\
+\x95\x0dJ\x93\xd78v\x00\x00 \x00IDAT0\
+z\xe2%\xc4Y\x98\x05w\x9b\x15}&\x96\x96\xa4\xe4\
+\xe3v\xe7]\x00x\xf2\xd69\xe2c\xb3\x89\x8e\xe2N\
+i\x13*\xe8\xd3\xa9\xae\x0b\x06\x94\xdcfx\x18\x94\x02\
+\xf34\xd2H#\x8d4\xd2Hc\xf5Cs\x92\x8e\x9c\
+d\xd5\xc3\xe1\xc2S\x07\x96\x87\x94\x0f\x0fH\x99\xbfq\
+,)h\x90\xb9\xcbm\x17\xff\x8d\xcdf\x04\x98\x97\xe8\
+\xdf\xe5\x87[WN\xe1\xcdi\xd1\x1b'2A\x18\xbe\
+\xd6w\xbc#\x09\xc3\xc9\xe7\xdd\xdb\xe2p\x02\xdc\xb4(\
+S;\x92\x92\x945Lr\xffa\xd2\xf5eg\x09\x80\
+\xdc\xaa\xb2\xc5\xd1\xd2t\x87\xd5w\x92U](Q1\
+%N\x9d(R\x91q\xe4[\x5c3$\xd9\x04*\x92\
+\x0a-\xab\x187\xb3\xba\xfbd\xdbS,4p8\x9e\
++\xa6\xd8\xc5T+\xee\x18mwi\xd6$\xc1\xbe\x1c\
+Q\x0a\xcc\xd3H#\x8d4\xd2H#\x8dU\x0a\xcaY\
+\xd0E\x0c\xe0\xb3xR\x02vG\xd3\x9a\x04\xd8\x02\xfc\
+\x8a;\xc8\xd1&\x8f\xc8\xe0l\x88\xd9\x1e\x7f\x83\x05\xe6\
+%E\x09\x11&\xec\xcax&\xc9\x01R\xa2N_\xff\
+[\xdb\xd8\xd8*+\xc9}\x85\xf4\x17\xdf\xe6\x1e1\xb5\
+\x87\xa5\xe2\x8a\x84\xa6\x1a\x14K\xf3\x1d\xaf94:X\
+f\xa9\x80\xa3\xa6\xc3\xd2> u\xd7\x05?\x85\xa5\xd2\
+\x8d\x99b\xa6\x84U\x0c\x164\x1c\xd6\xf4\xee\xf8\xa4\xc1\
+\xef\x0cpUnd\x1a\x11\xab\xe9P\x82Y\x91j\xea\
+t\xa5v@\xb6qW\xb9\xc4\x8a&Trey\xd8\
+\x1c\x1f{\xf5{\x16.\xa1\x94\x02\xf34\xd2H#\x8d\
+4\xd2Hcu\x86\xe0H3)=p\xf6\xcc\x84<\
+\xfdA\xa5u\xeeJ\xdd1\xc7\xa0U\xa1@\xd2\xb4\x16\
+/Mp\xaa\xe9\x92\xe2N\x11\x10'\xb0\xf3\x19_\xc1\
+\x9c9n\xd9$\xad\xe1\x17\x83\xfaDmovZ<\
+\xa1\x07d\x81\xaf\xdf\xd8\xe8V\x96\xe3d@\xca)\xba\
+\x9b\xe4e\xd3\xa6\x90\xaa\xa3\xcd\x9c\x98\x1c\xf0*\x93(\
+b'yq\x12\x8b\xc4\x8cE\x18K\x91\x0b\xe8c%\
+\x18\x8fl\xc4\xba\x8a\xed\xee\xcf\xf6\x81\x92H\xe7\x8c\x16\
+:ql:\xe5n\xc0s\x10\x15c\xf4\x84\xf2\xe3\x12\
+;\xa5\x15\xf34\xd2H#\x8d4\xd2Hc\xb5\x07\xc9\
+\xc6\xbf\x04\x9bs$\x00U\xb6\xd5\xf5H\x01\x85Io\
+\x8fT\xed]\x81M2\xb6\xf5NuY\xa9\xb78\xda\
+)V\xbf[\x82b\xa1\x9dnM\x8a\x04^##\x11\
+(-\xee\xed\xdf\xc9Y\x11pA%'x\xa2&}\
+:\x02\x85D\x82s-\x8eK\x10\xd0=\xa7U\xb14\
+\xc1\x0a\xa4;\xf4\x1f$\x7f\x8f)!\xb9ax\xa6G\
+\x86\x0aB\xb2\x89\xd7Y\xf6  Y\x87\xde\x98C!\
+A(\x9d\x9c\xdc\xc2\xc1\xe8\xb1\xc1)\xb9\x07\xec4v\
+\xfaI\xdd\x92\xaa4\x92J\xc4\xee\xce\xc3m\xa7\xc0<\
+\x8d4\xd2H#\x8d4\xd2X\xc5\xc1\xb1\xa3\xa4\x90\xeb\
+\x8b\x19\x02q\xb3\xa4\xfc\x0eIW\x1c)s'\x0dm\
+\xdcFJ\xa6\x98\x93M\xec\xe0MY\x93%\xf5=\xc0\
+\xa1\xcd\xd8}\x91%s\xb3T_aI\x17q\x06b\
+A\xa8q$u1/\x81\x12\xad\x97\xf4xd\xd2b\
+\xe6\x87\x9d\xe32r\x8e\xcc\xac\xf5\xbd\x15V%'\x89\
+1\x0d\xb3Rj\xd1m\xbe\x0d\x13\x1b\xf2\x9c;c\x95\
+\x187y0\x80\x9c=\xad\xf1\xf8<\xfa\x12\x98\x11E\
+$\x11$\xc7\xac\xa4dwQ\xa9'\x1f\x97\xf9\x8d\xfb\
+\xaa\x95\xa6d$v5\xc0M<\xdc\x06\x5crs&\
+N\xa9,i\xa4\x91F\x1ai\xa4\x91\xc6j\x87\xe5I\
+Z\xdc\xe4\xb88&\x98\xd7\x90\xa8\x8c\xb3O1pU\
+;b\xc7KG\x89Da/\xb2\xe65\xeawJV\
+\x84\x04\x08\xe4\xd8\xc9s\xa9\x8d\x92\xff;\xa3\xe8\x12r\
+\xe1\x9d&\xcbH\xfb\x9b\x92\xf5Ob\xf0m,\xe1E\
+;$\x12\x5c*\xe3\xc2\xb8\x94m\x91\xd8\x92\xe3\xb9V\
+\xf3\x1dm\xd7\xca\xaa\xb0N\x8a\x22\xe0\xee\xc2p\x22\x0f\
+\xc9\x0a#R\xb2\xe5rY\xd9f9\x0e8\xb4\x1c\xb2\
+k\x16\xf0\x0cN\x11\x1f\xae\xce\xb3\xa4\x81\x92H\x808\
+6\x5c\xb2N\xa1\xe4\xb6\xcd\xc2\xb1\x19up\xb8\xb80\
+\xfd\xefp\x0a\xcc\xd3H#\x8d4\xd2H#\x8dU\x0e\
+\xce\x0d`Z\x8e:!\x80\x19\xb9 \xde\xa3\xa1\xc7-\
+\x9bp\xa4\xf1\x14\xc5B\x01j\x03\x04\xe1h\x86\xcbj\
+\xbe\xcfi\x87\x91[d\xd2t\x0b\x8d\xe4\xe06\xb0\xda\
+\x03J*\x1e\xb3\x84\xe2n\x90H\x09\xc4g(\xe2\xa8\
+3\x9c\x86\xce\x18\xe2\xb3\xeb2d\x12\x18v\x93\x0b\xa3\
+n\x13s\xeb%)>.\x94\xbb3\x11&6\xcc\xe4\
+M\xabI:\xc8\x1b\x95\x04\xc2\x0cG\xba^\x9ci\xa3\
+\x0b\x0f__\x9d\xbc_\x0a\x15\x1bR\xfa\xe4l\xe9,\
+\xc9+$1m\xdcWu\x89\x93'\xa8m\xc8$(\
+\x05\xe6i\xa4\x91F\x1ai\xa4\x91\xc6\xea\x07\xe7B\x93\
+\x8f\x95}z$\xa7G1\x1d#\xae\x0d3\xe2\xfa\xab\
+\x03\x8a)\xb9\x88\xed3\x8e5\x0a\xb4\xb4lY\xd5\xe5\
+\x18\xa0\xbb\xcd\x9c\x06\x17R\x82B\x0c+\xc7\x9e\xa4\x06\
+P\xf2\x98\xce1u\x86<\x0aIL\xe1 \x05\xdeE\
+-;\x06\xd8\x1e\xe7\x85\xb4\xe9\x0f+\xe1@\xf8Z\xe7\
+.\x08wFO\x02\x98\xba\xc6NI)\x05CKc\
+J{O&\xa5\xc3\x0e\x16\x8d\xb8L g\xa4Ij\
+\x9aL\x09M\xae\xe4lW\x0c\x96\x05\x17\x9e\x9d\x03\xe3\
+\xd8b\xca\xf5l\xf2\xd4u\xa0\x14\x81\x80\xdc\xaa\xbb\xf3\
+\xb2\xb5\xc0\xfa\xdd\xe1\x11\x8c\x9d\x06\xe6'\xcc\x1f\x00T\
+\xd2'S\x1ai\xa4\xf7K\x1ai\xa4\xb1Td2@\
+\x10\xac\xae\xe7\xc7e\x8fC\x82\xb1\x04\xce\xb3#\x8d\xc7\
+\x1a5[\xfdoR\xea.\xb1\xab&\x19.\xb80.\
+JR91\x94\x17f\x12`;\xa2\x5c\x98F\xc6\x04\
+V\xb6m*u\x0e\xdf~R\xe8\x8d\xcb\x83p\x13\x85\
+X[;j\xda\x84X!P\xb2\x81\xa4\xab\xbd\xc2J\
+\x9e\x9c\x09\x8b\x7f\x96`\x92\x14\x0a\x0f\xb9\xe1l\x93\x08\
+F\xc6\x08|\xab\xbd\xd9\xef(+{?\xd1!\xf8\xdf\
+\xd3\xab\x15\x1c'\x0b\xaa\x8f\xc0\x17\xc8T\xfa\xe4\xa42\
+\xb3\xf84z\xf3\xe5&`\xfa/$\xbe\xc7\x22\xe9\xd1\
+\x84\xf6\x84\xf3I\x82f\x15\xb7\x18D\xd7\xc7j\x02\xe6\
+\x0dk\x80=\x0f\x03\x9d[A\xb9|\x9cuL\x0e\x01\
+c\x03\xa0M\xbb\xc1\xa3\xfd\xc0\xc1\xc7\xf4\xf7\x9a6\x00\
+\xcd\x9d@\xf4\x1c\xa2\x5c\x0e|\xee\x10\xc0\xceC\xa5\xae\
+\x15\xd4\xb1\x0d\x5c\x5c\x00\xc6\xcf\x00\xe5\xf9\xe5\xc7S\xdf\
+\x09\xdc\xfa!P\xdb\x06p\xff\xeb\xc0\xe1\xc7\x97\xff|\
+\xeb&\xd0\x81\x8f\x00\xf5M@\xae\xe0g\x8e\x8b\x0b\xc0\
+\x89\x97\x80\x13?\x5c\xd9m\xacT\x5c\xe9|\x5c\xde\xd3\
+8~\xe8R\xd6?gn\xf4\xfc$\xb0u?P\xd7\
+\x0cp\x00L\x8f\x02\x17\xde\x022y`j\x10\x18:\
+\xb2rs\xda\xb2\x19\xd8\xb0\x17\xa8k\x04UJ\xe0\x5c\
+\x0dP*\x02\x85\x06\xa0P\x0f*\xce\x82K\x0b\xa0\x5c\
+-\xf8\xdc\x9b\xc0\xe0\x9b7\xe6\xfd\xe2Fm\x1bp\xe0\
+\x11P\xfb\x06 \xa8\x84\xc741\x04\x9e\x18\x00:\xb7\
+\x01\x952\xf0\xe6\x7f\x8a\x17e\x15\xaf\x8f|#p\xc7\
+G\x81\xc6vP\xa1\x1el\xae\x01\xf3d\xa5,\x10\x94\
+\x80R\x1147\x09>\xfc\x140\xd1_\xfdm\xdc\x08\
+\xe76W\x03\xda\xffs\xe0\xb5\xdd\xa0|x\x9dr\xc0\
+ \x04\x00e\xa2\x9f+\xa0L\x16<7\x09\x0c\xf6\x01\
+#'\x81\xe1\xa37\xde=\xf7N~\x06\xbd]\xef\x86\
+\xcdw\x80z\xee\x06\xea\x9b\xc0\xb9<\x08\x190W\x80\
+\x13\xaf\x02o\xfd\x17\xb0\xe7C\xc0\xdan\xa0\xae\x19\x94\
+\xcd\x81\xb9\x02Z,\x02\xc3}\xe0\xd7\xbeY\xbd\xe7G\
+\xb5\xaf\xd3+\x1cG\x8c\xc9\xc9RI,\x00\x16\xcd~\
+!\x1d\x82\x9c\xd2\xad\x03\x82\x01p\xae\x01\xc1\xed\x8f\x82\
+\x1b\xda\x96}~P\xa9\x08\x9a\x9fB\xe6\xd8\xf7A\x93\
+\xe7B\xb0\x9c\xa0R\xc2\x8d\x1bQ\xd9\xf1\x1e\x04\xad\xeb\
+\x81\x9aZ `df\xc7\x91=\xf9#\xd0\xc8\xd1\x18\
+\x84&\x88\x9b\x98\xda{\xd0\xb8\x11\x95\xed\xf7\xa0\x22\xb7\
+17\x8e\xfc\xa9\x17\x91\x199\x86\xd8\x933\xf6\xae\xe4\
+\xa6\xf5(\xee\xf9\x10\xb8\xb6\x11\x9cp\x8d\xa1TD\xe1\
+\xf4+\xc8\x9d}Q\xab\xdaP<K\xc5\x9e\x07QZ\
+\xb7\x03\x9c+\x80\x91\x01e3\xa0\xd2\x02j\xfb\x0e\x82\
+\x16\xa7\xb1\xb8\xf9\x0e\x94\x9b\xda\x91Y\x98\x03\xb29p\
+6\x8f\xcc\xec\x18\xea\x8f\xfd\x17h!z?dsX\
+\xd8\xf1~\x14\xdb\xb7\x00\xf2\xfa\xa0\x00\x96\xc0\x11T\x80\
+L\x16\xd9\xf9)\xd4\x8c\xf6#7\xd9\x8f\xdc\xf8i\x81\
+\x82\x01\xce\xd5a\xee\xa6\x87Q\xaeo\x05\xe7\xeb\x10P\
+\x16\xc4\x958\x8d\xa2,\x88K\xc8\x94\x16\x91[\x98F\
+\xc3\x99\x17\x90\x99\x1dRH\x9bM\xc3*\x93 \xf4\x88\
+\x95\x0a\x8a\x95t\xac\xec\xa3CZa+\xb9\xe8\x1b)\
+%Cr\xd9\xe4+t\xf2\x89D.I\xab\x04\x98\xaf\
+\xd9\x01\xdc\xf3\x09P6\xef/1\xb4\xae\x07Z\xd7\x87\
+?\xaf\xdb\xa9\x1f\x9e\xf9F\xd0{?\x1b^\xbc\xf2k\
+;\xdf\x03~\xfe\xef\x81\x85\xc9\xf0\x17\x1bo\x03\x0e|\
+\x08\xc8\xe6\xe2i,\xce\x81_\xf8'`\xea|\xe2\x90\
+\xe8\x8eG\x81\xb6p\xbf\xd4s\x17\xb00\x05>\xf9\xfc\
+2@\xa9\x13\xdc\xd4\x16>0\x11\x80\x5c\x16QP\x01\
+J\x0b\x97\x00[U\xd8\xc6\x0a\xc5\x15\xcf\xc7\x96\xbb@\
+{\x1e\x88\xcfMP\x01\x9f~\x1dx\xf3?\x80\x8e\x1e\
+\xe0\x8e\x9f\x05\xd56:\x0f\x8fE\xf0\x1bO\x02\xe7^\
+\xf5\xf7\x7f\xd7\xa7\x80\xae\x9b\xf4/\xdb\xba\xc2\xff\x99\xed\
+\xffp\x14\x98\x1eZ\x999\xbd\xebc\xa0\xfa\xe6\xa4{\
+\xd3\xff\xdd\xban\xe0`\xe5*@\xd3\x0a\xdf/n4\
+o\x04\xee\xfd\xbf\xf4y\xa8\xa9\x03\x1aZA\x1bw\xc5\
+\x8f\x9a\x99;\x81\xa3\xdf\xab\xee\xf5\x01\x00k\xb6\x82\xd6\
+ns\xe6\xcfydej\x80\x5c\x0dP\xd7\x04\x1c\xf8\
+\x19\xe0\x07\x7fQ\xfdm\x5c\xeb\xb9\xddr7\xe8\x96\x07\
+\xc1\x94\x01J\x8b\xa0r1|\x02\xd75\x80)\x07*\
+-\x80\x17\xa6\x81\xe1S\xc0\xe9\x97\xe3\xe7\x92\x8c\xce]\
+\xc0\xc6\x9bu\xbd)C\x11p4\xb81<.jh\
+\x05o\xdb\x07\xb4\xad\x03\xe6&\x80\x99\x81\x1b\xeb\x9e{\
+\x87>\x83\xde\xd6w\xc3\xae\xf7\x02\xf5-\xeaZ$\xca\
+\x02;\xee\x04\x9f}\x05X\xd7\x03jh\x15\x8f\x82,\
+P\xa8\x07\xd6m\xaf\xee\xf3\xa3\x1a\xd7\xe9\xb5\x8eCT\
+\xb2\x89\xe22,[:C\xb2\x89\x8d\xadUK\xbc\xbe\
+fK\x98\x14\x5c\xc6\xf3\x83\xeb\x9aP\xb9\xe5C\xc8=\
+\xf7U\x05\xee\x0c<\x0b\xb6\xdc\x85\xf2\xae\xfb\xec\xf1\x9b\
+\xbc/h\xeeDe\xff#\xc8\xf5oB\xb6\xf7\xc9\xb8\
+\x8a*\xab\xb3Q%=\xd8|\x07\x16oz\x9f\xbf\x8d\
+\xa6N,\xec\xfb\x19\xd4\x9c\xdd\x84\xdc\xf1\xa7\x14\x11\x84\
+\x19\xe0\xba5\xa84\xb4EI\x8a\x7f\x8dQP\x01\x97\
+\x8b\xaa\xdan\xe9=D@\xae\x16\xc5M\xb7\x802Y\
+\x0dL\xf3\xb5\x98\xbf\xe9}\xfar\x8d\xaeC\x00\x08\x0a\
+\x8d`\xe4,\x00-\xb7lCq\xddN\xbdo\xe7\xfa\
+@tl\x95\xfa\x16\xcc\x17v#\xdf\xdc\x89\xfa\x85i\
+d\x16F\xed\x8e\x83\xe6.,\xb6o^\xf2\xb9\x1e\xfe\
+\x5c\x83 [\x83\xc5\xdaF\x04\xb9\xfb\xd1\xf2\xe3\x7f\xb6\
+\x7f\xb3\x94\x15r\x009\xc5\x8eC\xb2\x07\xc14\xaf&\
+_7Q\xc5<\x92\x93\xf4\xcc\x8a\xac\x8a\x8cC\x13\x8a\
+\xf8\xfaD\x92p\x15\xfe~u\x00\xf3\x9d\xef\xb57'\
+/\xce\x03\xa3g\xc3\x0aWC[\xf8\x120\x17K\xa5\
+\x14V\x09L\x14\x9a\x90Hljl\x03m\xb8\x15|\
+\xea\x19\xe0\xee\xcf\x80\xd6\xf7\xf8U\x8a\xa0\x02T\x8aK\
+\x0e\x89\xcb\x8bz\xa9c\xe3^`\xb9\x87\xef\xf9\xd7\x80\
+\xf3?\x06\xa3\x02\xaai\x00?\xf0EPm\x03\xf8\xdc\
+Q\xa0\xf79`n\xe8\xd2\xcb\x8b\xd5\xd8\xc6\x0a\xc5\x15\
+\xcfGC\x1b8\x9f\x8f\xbf\x93\xc9\x82\xbao\x03_8\
+\x0cj\xdd\x00\xaei\xd0\xdb/\x15A\xf33@\xa5\xe4\
+\xdf\x14=\xef\xf3\x01\x827@\x06f.\xae\xdc\x9c\xbe\
+\xf9$x\xed\x0e`\xd3\x1eP.\x0f\xae\x94\x81\xc9a\
+`q\x1e\xc4\x01\xb8\x5c\x02\xd5\xd4\x01k\xb7\x85\x0f\xd5\
+\xcd\xb7\x80W\x0a\x98_\xed\xfd\xe2T\xfd\xe8\xeeO\x02\
+.0I\x8a\xd9\xc9\xea_\x1f\x00\xb0f[\xf4\xdd\x12\
+\xe8\xf5\xc7\xc1CG\x80[~\x06\xb4\xe5\x16`\xe4\x0c\
+\xf8\xe5\x7f\x06\x1a\xd7\x01\x07~\x1a\xd4\xb4\x06T^\xf4\
+\xef\xf6jl\xe3Z\xcf\xed\xec\x08xv\x0ahn\x03\
+\xd5\xd6\x03\xa8\x07\x8as\xc0\xdc4\xa8\xa9\x03\xa8m\x00\
+\xd56\x84@c\xe3\x1e\xe0\x99\xbf\x06/\xce\xea1\x0c\
+\x1d\x06^\xab\x01\xb7\xac\x03\x9a\xd7\x86\x00\xa3}\xa3}\
+Qr\xa5\x0c\x9a\x9d\x00\xce\xbe\x09\xae\x94\x80\xa1\xe3\xc0\
+\xfc\xe8\x8dy\xcf\xbd\x03\x9fAo\xfb\xbb\xe1\xd0w\xc1\
+;\xde\x03\xea\xdc\x1a\x83\x8d\x80\x81c\xff\x0d\xcc\x8c\x00\
+O\xff/\xf0\xfb\x7f\x0dT\x17%\x98\xe5Ep\xdfk\
+\xc0\xe9\x97\xaa\xfb\xfc\xa8\xc6uz\x0d\xe3\xb0.\x96\x92\
+\xab\xe0\x14\xc6c\x9a\x85\xa8g\x12k m0qG\
+\xfc\xfc\xc8\xfe\xf8\x09\xe0\xe2[\xe0\xdd\x1f\x02o\xde\x0b\
+\x1a\xe9G\xe6\xd07\x80\x86u\xa8\xec\xfb \xd0\xb4\x06\
+\xe4\x5c\x1b\x14UG\x83\xad\xf7\xa2\xbc\xe7\xbe\x10\x10O\
+]D\xee\xfc\x11p]3P^@e\xcb~PM\
+\x1d*\xdbn\x03M\x0e\x22;\xf4\xa6L\x13lT\xb6\
+\xdc\x85\xd2\xcd\xef\x03!\x03\x9a\xba\x88\xfc\x85\xa3\x08\xa2\
+m\x947\xdf\x0a\xaa\xa9Ci\xeb\x01d&\x87\x90\x19\
+~\xd3V\xbc\xc1\x8c\xcc\xf0a\xd4?},\xac*\xe7\
+\xeb0\x7f\xef\xe7\xc0\x85z\xe4\x07\xdeB\xae\xef 2\
+\xc5\x11Ov\x9bd\x03cy\x1e\x0d\xaf\xfd\x1f\x94\xb6\
+\xdc\x86R\xfbf\x0b\x9e\xb3\x93\x83\xa89}\x10\xa8\xa9\
+Gq\xfb{\x10\x14\xea\xc3[\xa98\x8b\xda\xfeW\x91\
+\x1bx\x1d\xe0\xc0V\xf0\xb3\xe3'\xd1p\xec{\xa84\
+t\xa2\xd2\xb8\x06\x00c\xb1\xa5\xcb^\x1f\xa8\x94\x91\x9b\
+\x9fBa\xf0\x18\x10\x94\x91\x9f8\x0d,NY\xbb{\
+3\x1f\xa5\x96M\xd1\xe7Kh\xee\xfd\x01r\x93}\x98\
+\xdfv\x1f\xe6\xd7\xdf\x8c\xc2\xd89\xd4\xf7>\x8e\xa0\xae\
+\x1d\xb3;\x1e@\xb9\xa1\x1d\x99\xa0\x9c\xb08B\x8a\x9a\
+C\x1c\x9bQ\x91k\x07*)>\xf2;1\xd4\x8f\xb8\
+\xe9I\xa2\x91\xae\xca\x0c%\xd2\x89$\x0f\xfd\xc6\x07\xe6\
+\xb9\x9ap\x19\xdd\xc4\xd8\x80]\xb6b \xacl\xbc\xe7\
+\xd3\xa0\x0c\x81\xd9yx\xcd\x0c\x80\xff\xebO\x81]\x0f\
+\x83v\xde\xad\x1f\x9e\xb5\xe1\x05\x84\xde\x17\x00\x07\x98\xf3\
+\xf1\x97\x80\xa3O,?\xaeLV\xdf\x80\xb5M\xcb\xf8\
+_\xd9[+z\xc8\xcc\x02\xb3\x13@m\x03\xb0\xb8\xe0\
+W\x0aV|\x1b+\x10W:\x1fG\xff\x0bx\xeb{\
+\xe0[\x7f.\x04I\xa6\x12\xd2s\x0f\xf8\xe0c\xc0\xf0\
+I\xf0\xfa\x9b\x81\x9dw\x87K\x98\xbd\xcf\x83O>\x9b\
+\xbc\xad\xee\xdb\xc4K\xee-\xf0\xab\xff\x0a\xaa\xa9\x03\xef\
+\xff\xd98\xe9\x9a\x19[f\x19\xba\x0as:x$\xfc\
+\xdf\xfa\x1e \x97\x07\xce\xfc8\xac\xbc\xc1\xb1\x0fx\xef\
+\x17\x80\x8eM\xf6\xc1vC\xdd/2n{$\x5cZ\
+\x07\xc0\xb3\x13\xc0\xf1\x1f\x816\xdd\x02n\xee\x08_\x96\
+r\xfc\xe3\xe7\xab\x7f}\x00\xa05[\xc3\x7f\x8c\x9c\x01\
+\x9f?\x14\x95J\xc21\xf3\xfctXE\x1c?\x03\x0c\
+\x9c\x00\x9a\xd6\x00\xc5\x99\x15\xd9\xc65\x9f\xdb\xd1>\xe0\
+\x87\x7f\x01l\xb9\x138\xf0\xe1\xf0\xf3\xaf?\x11S^\
+\xf2\x8d\xc0M\xf7\x01\x1bw\x85U\xcd\x03?\x0b\xbc\xf4\
+u\xa7j\x1a\x84\x95\xcf\xb3\xe2\x81\x7f\xff\xff\x0d\xb4\xac\
+\x09\x7fq\xe2%\xf0[O-?\xa17\xd4=\xf7\x0e\
+{\x06\xbd\xdd\xef\x86\x8b'\xc2\xff\xed|\x00\xbc\xeb'\
+\xa3*d\x00\x0c\x9f\x04\xd6\xed\x06\x16\xa6@\x858\xd1\
+\xe07\x9f\x06\xfa\x0fV\xff\xf9Q\x8d\xeb\xf4\x9a\xc6\xc1\
+J\x93[\xcbE\xb3\xe7\xeb\xa2(.\x92\xb6`\xbe\xd1\
+\x11>?2\x17\xfbA\x03?\x06\x08\x08\xcc5]\x9c\
+\x0e\x13\x85\x89~\xd0\xd0Ip\xd3\x1a\x90y~P\xbc\
+\x0f\xcafP\xd9yO\x08\xca\x17\xe7\x91\x7f\xe9\x1f\x80\
+\xf2\x02(\x93\x0b+\xd5\xd9,\x82\xee\xbb\xc2\xfd\xb5m\
+\x02\x0f\xbe\x01Ks0C\xc9dP\xe9\xb9\xdbn\xa3\
+\xe6\x95\x7f\x02\xca\x0b\xc8Q6\x04\xbe\x99,J\xddw\
+\x86\xa7\xa0m\x032CoZ\xb2\xb9\x9d\x0f*\x87\x07\
+[\x9eGfn\x02\x95B=\xa8TDfaD\x83\
+FYw&az3\xd5\x8f\xda7\xfb\xc1\xb7\xff<\
+\xca-\xebA\xa5\x05\xd4\xbf\xf6\xcf\x008\xa4\xd7\xe4\xeb\
+\xc2\xc6\xc5\x89A\xd4\x1e\xfdOd\x16\xa75\x0e\x8d\x14\
+Z\xb2CG\x91\xa3\xb8p\x11\xdc\xf6\x19T\x9a:\xc2\
+z\xd0\xd9\xd7Ps\xf6G\x88\xa1\xb3\xa3\x1e\x13m\xaf\
+\xd4\x1a\x02\xf3\xc2\xd89dG\x8f\xab\xe7zfq\x06\
+TYDvv\x10\x85\xd1\xd3!0_\x8c\xcfKh\
+V\x145\xe1:\x8cv\xcb\xd7O\xe2\xf2\x8b\x84.\x86\
+\xd5\xe6$/\xb5\x96\x0a\xcb\xbdW\xd4\x15\x85\xf69\xa6\
+\xcd\x98G\xc8\x0d\x0f\xcc\x832\xd8,\xe31\xfb\xd5\xb9\
+\xd1\x93\xa0\xb9\x90\xbfd8m\xee\x83\x02\xc3'\xfc\xdf\
+\xb7DK\x8d\x8d-\x09\x15\xc0\xf1K<x3@S\
+\xbb\xfe]\xa1>\xe4U^6\xbe.\xc6\xd4\x80\xab\x8d\
+jl\xa3*/\xc4\xab\x9c\x8f \x00\x06\x8f\xc7\xe76\
+z0!W\x03L_\x00\x8e?\x0d,L\xab\xbf{\
+\xd1\xba\xc9.\xe1bf\x1c\xfc\xda7\x00\xae\x80\x8b3\
+\xc0\xab\xdf\x08W>\x00pq\xee\xfa\xcc\xe9\xcc\x98\xad\
+H\xd9\xd8\xfe^\xe0\xb6\x8f\x87\xcb\x9d\xa3\x11\x7f\xb9\xbe\
+\xf5\xc6\xbc_\x00 _\x0b\xb4v\x89*\xd8)\xa0\xff\
+ \xf8\xa5\x7f\x00^\xf9\xb7p\xb9_>w\x16\xa7V\
+\xe6\xfa\xa8\x0d\x13\x03\xcc\x89c0\xcb\xf1\xf2\x09W\xdb\
+\x10W\xd5Vb\x1b\xd5:\xb7\xb3\xa3\xf1\xf7%\x0f\xbd\
+4\x03\x1c\xfe.p.\xe2c\xaf\xdf\x01\xb4\xef\xb8\xe4\
+\xa9\xa6B|\x8dRc\xfbe^\x1f7\xe0=\xb7\xda\
+\x9fA7\xd0\xbb\x81\x8f\xff\x004\xf0VxMd\xb2\
+\xc0}\x9f\x0bA\xe0\xae\xfbl\xc2\xc0\x93\xc3\xc9\xa0\xbc\
+Z\xcf\x8f\xaa\x5c\xa7W?\x0e\xa9\x0e\x1d\xf9zz2\
+\x88\xa6\xd1\xce\x93\xffv\xab\xecf\xc5pn2\xb6\x96\
+\xafo\x83\x82\xfb\x84\xb0\xdf\x04\x00\xbc\xe7\x07\x83\x9b\xb7\
+\x82\xf3\xe1\x1cd/\xbc\x05\x94\x17\xa2\x22}\x19L\x8c\
+l\xef\xd3\xc8\xbf\xf8/\xe1a\xaf\xdf\x09\xca\x15@\xc6\
+\xd2\xdd0Y\x9a\xb7\xd8m\xe4\x06\xde\x02\x95\xa2\xfdD\
+\xbc\xea\xec\x89\x1f\xa2p\xf0\x1b\xe1\xe3e\xfd\xce\xb8W\
+\x81\x04%E^\xc2\x95\xf0\x19\x16\xe4kc\xde=\xbb\
+r\x7f\xc9\xb6\xf7\xa8\x84\xd5g*\xcd[C\xa4\xe2\xce\
+0\x19\xa4\xc5y\xd4\x1e\xf9\x0fd\x8a\xd3\x02\xb0\xc6\x8f\
+\xdb\xb89T\x9c)q\x9dW\xeaZ%\x92\x0fuT\
+(\x1e\x8ei\xba\xadD\xf3\x9d-N\x87\x0d\xb9\xc4\xa8\
+\xd4\xb5\xc4\x00;\x02\xe0AMT\xc1/\x15\xe5\xa9\x8f\
+$\x1c\xa5\xfb\xaa>\xd0\xc4[\xdd\x82y\xf6\xcd\x8a8\
+N<(A\xber\x19\xd8\xee\xc9:\xae\x12`\x1e\x80\
+\xc6/\xa8\x11\x93\xbb\xc4\xd8\xff\x06xr\x18\xdc\x7f8\
+y\x1b\xee\xb20\x00D\x15snX\xe3\xff-K\xcb\
+\x8fi\xed\x9ep\xe9\x1a\xce\xba\xcf\xda]\x97}X\x96\
+\xe3u\x99\x0f\xb7\x95\xdaFU\xe2Z\xe6c>J\x82\
+\xc6\x07\xc0\xc3\xa7\xc3\xa5\xfe]\x1f\x88\xff^.-\xf1\
+\xc0\x8bb\xfd\xee\xf8:8sH/\xf9\x96\x17c@\
+\xd6\xb11|\xd9\xae\xf4\x9cNE\xd5\x07\xc1\x09\xa5\x9b\
+\xde\x03\xda\xbc\x07\xe8\xda\x07\x9c}\x1d\x5c\xa9\x80\xa3\x07\
+\xc6\x0dy\xbfl\xb9\x0b\x94\x15\x9cP\xd3tU^\x04\
+FzA\x13\x17\xf4\xf6\xda\xbb\xab\x7f}P\x16\xc8G\
+\xe7\xab\xa9-\xfe}\xc4\xf5\xb6c\x02\x003\x97\xed\x1b\
+\xab\xbf\x8dj\x9e\xdb\xda\xd6\xe8\xa1\xbf\x04\xc0\xcb\x89^\
+\x98\x5cv\xf99m\xddd\x93\x89+\x8e\x1b\xec\x9e[\
+\xf5\xcf\xa0\x1b\xec\xdd\xc0\xa5\x98\x82I\x99,\xd0\xb5\x1b\
+\xdc\xb9-\xfe\xc0\x99\xd7V\xf6\xf9Q\x8d\xeb\xf4\x9a\xc7\
+\x11\xf1\xc9Y\x9b\xe58\xa5N\xe8\x82';~0\xf1\
+\xf3\x83\x1b\xdbb]\x8f\xba(\xd9\xcf\xe5#\xb4I\xf6\
+\xf9\x11\xb4m\x10\xfa\xe2\xd1\xa1t\xddl\xcfK\xe6\xe4\
+s\x0a\xaf\x91i<\x1c\xef\x03\xe6\xa7\xc15\xb5\x08:\
+\xb6[\x03\x1a\xc3}\x0e\xd6E\xb4\xb1R\x11\x99S?\
+\x82\xdfV\xc8\xa0\xc93\xc0\xc2\x0c8_\x8b\xa0}\x9b\
+.\xcaB\x15\xbf\xe3Jt\xbe\x10~\x9746%\xf6\
+\x91\xa4\x99\xb2 \x02\xc5\x99\xc5\x05\x80\x18\xa5\xcd\xf7\xa0\
+\x1c\x15:k\xcf\x1c\x04\x99\xea4\xebg\x9dU\xfc&\
+c\xb6D\x08\x1a\xd6Z\xfa\x8bJf\xc8\xd7\xa07\xed\
+\xac\xa0L\xd8\x80\x0f\xa0\x5c\xd7\x12V\xc0\x99P1I\
+T6g\x0f&\xc8\x87\xcf\xd4\xc5\xe6\xf5\x90\x16D\xec\
+HO\xb2\x9c\x17\xe2D\xa5\x1a#\xc9\x18;\x84\xf2\x12\
+(;\xaa\xc8\xbb.\x9f\xf6z\x94j@\x09R\x8aX\
+%\xaa,|\xf4i\xa0\xb5\x0bT\xd7\x04\xea\xbe\x0d\xd8\
+\xb47\xbci\x17\xa6\x81\x91\xd3\xe0\x13?\x5c\xbec\xbd\
+\xec7\xceP]s8\x0f\x0dm\x09\x9f//? \
+\xc1\xad\xe4\x89aP\xeb\xda\xf0\x87\xcem\x97\xad\xc8\xc0\
+\x99l\x98\xb9\x95\xe6/c\x99s\xe5\xb6Q\x95\xb8\x96\
+\xf9(-F\xdf\x1b\x00\xce\xfd\x18\xbc\xf6s\xe1\x0b\xdd\
+\x9c\xa7\xa8\xfa\x86\x99\xe1\xe4\xefG@\x8a\xe7\xa7\x81\xa4\
+e\xe6\x13\x07\xc1\x07\x1e\x06\xe6\xa7\x81\xa0\xbc\xf2sZ\
+\x5c\x88\xab\xb2\xb5m@\xdb\x96\xb0\x02\x0d\x00\x99\x1c0\
+{\x11x\xe9\x1b\xc9\xc9\xe2\x0dr\xbf\xd0\xd6\xfd\xa2r\
+P\x01\x0e}[o\x7f\xf6\x22P)\xc7\x0dH-k\
+\x81\x81*_\x1f\x5c\x09\xb9\xba\xb9\x9a\xf0\xdc\x99jd\
+\xf4\xf0\xe5\xac\x00|\xc6\xe4!\x9bw\x0acU\xd8F\
+5\xcfm4\x06\xca\x17\xc07=\x04:\xf3\x228W\
+\x1f.\x89\xf7\xfc\x04\xb0)z\x81W\xca\xc0X\xdf%\
+\x12\xc0\xa1\x90\xaf\x1b\x9d\x03.^\xc1\xf5t\x83\xdds\
+\xab\xfe\x19t\x83\xbd\x1b\xe8\xad\xa7\xc1u\xcd\xa0ua\
+\xc2L\xdb\xef\x88\xff89\x9c\xcc+\xaf\xe6\xfb\xb6J\
+\xd7\xe9U\x8fCjcK;uA\xfc%+4.\
+\x1c8\xd9\x01\xeeT\xb6\xcf\x0fZ\x98\x0e9\xc8\x19\x02\
+\xd76\x86\x1f\xc9\xd6\xc4\xd4\x07\xf3\xfc\xc8\xe5c\xe9;\
+\x03\xbc\x22:\x0c\x11\x85\xabc\x0e\xd8%\x0e\x93v\xf3\
+\xec\xe1\x5c]dg\x13\xdb\x8eV\xc462\xa5\xe9\xd8\
+LG\xd2\xa0\x0b\x91\xe2\x0e`\xab\xebrN$g\x9d\
+\xa3\xd5\x93Li>\xfc\xbdB\xee\x11\xef\xd9\xca\x11F\
+\x00\x9b\x00P\x06\x95\xfa\x96\xb0\x995[\x83R\xf7\xfd\
+X\xd8| d\xdb\xccM\x22w\xfe\x90^\x85H\xa8\
+\x1cK!C\x9a\x1b\x0b+\xf0\xa6!xq\xceg\x90\
+D\xf3\x1bK'V\xc2\x8a\x7f\xb6\x06\xd9\xe2\xac=\xa1\
+\x95(q\x0b\xe4s=\xaa\x19p6\x97 \xba\x18\xaf\
+x(Z\x0aKm{\xb8\xdd\x9c\xd1q\xf9&P$\
+\xcc\xa6\xf4\xe9q4\xd9Y(\x05\xb9\xe2\xf3\xd1NW\
+G\xf3\xe7\xcc\x08\xf0\xec\xd7\xc07?\x04l\xb8\x09\x94\
+\xaf\x01\x8c\xd2\xc2\x96}\xc0\xcd\xef\x03\xde\xfc\x1e0\xb4\
+D3]\xadOWa\xa2\xf0%-\xd4\x16\xe2\x8a\xf9\
+%\xaaUM\x9d1h\xe9\x7f\x0dh\xfd`8\xaf\xf5\
+\xad\x97\xff 5\xd2Q\xb3\x13W?/\xd5\xd8F5\
+\xe2Z\xe6\xc3T\xd4r\x05`\xe2\x1ch|\x08\xdc\xbc\
+\x06hZ\x17\xaa9\x98f\x9a\xec\x12\xd5\xa3\xc66\x05\
+z\xbc\xe8\x7f\x09\x18\xe9\x05\x8aS\x97\xd7\xc4Y\xa59\
+\xa5m\x07\x80m\x07\xf4\xef\xa6G\xc2\xf9\x18\xe9\xbd\xa1\
+\xef\x17.\xd4\x87\x8f\x90\xa0\x02\x8c\x0f\xfa\x1f\x988\x07\
+\x1c{\x16\xbc\xed@X\xd5\xbbpdE\xae\x0f\x9a\x1a\
+\x0d\xabS}\x07\xe3*\x1aW\x00\xe4@\xb9B\xfc\xdd\
+\xa3?\x00\xb7t\x02\x17\xcf\xae\xc86\xaavnE\x15\
+\x9cn\xfe\x09\xe0\xe6\x9fHVx\x19>\x0d\x96t\x99\
+\xc4\x8ab\x09\x98\x1e\x03\x0c\xf0\xbb\x12\x04w\xa3\xdds\
+\xab\xfd\x19t\x83\xbd\x1b\xb88\x03\x1c|,l\xf6t\
+\x9a\xb7\xf9\xfc\xd1\x15\x7f~T\xed:\xbd\xdaq\x88b\
+%qr\xf9W\x02(Rh\x1dB\x1b\x9b\x90\x99\x1e\
+\x05\xd76\x81N\xbf\x1cb\xa6\x80\xc5\xf3\xa3\xc6n+\
+\xd3\xfbCT\x9a;\x81\xb1s\xba\xd0\xca@P\x17\x02\
+y,.(@\x18\xdb\xd5S\xc8-\x8f\xd4\x81\x82\xb6\
+\x8d\xc8^xUi\x8c\xcbmpd\x96\xe4\x0a\x84p\
+\xcb&pT(\x08Z7 {\xfe\x90\x00\x8d1(\
+&\x22{\x8d\xd1\xdc$b\x87K=M\xf6\xb30*\
+&\xe1os\xb3\xe3\xa84v h\xea@\xb1\xa9\xc3\
+~%;;\x86X\x85D\x18\x12\xa9\xedJ\xa7L\x06\
+q\x19\xd9\xb9qT\xa2\xfb\xc62\xcb\x99\x9dSF\xea\
+x\xf33\xe3\x08j\x1bQ3\xf8c;\x1f\x19\xae \
+@\x0e\x10\xc0\xbc\xae\xffE\x94\x1b;P3y\xc1\xd3\
+!\x8f\x95V\x12\xc6\x99D1W\x17\x97\x18\x8f\xe1\xd1\
+GUrb\xffo\xe6$\x84\x7f#\xc3\x8aq\xd7\x09\
+\xec/W\x8f\xf3\xe7\xfc\x04\xf0\xda\xbf\x02O\xfdop\
+\xdfk\xe0\xd1\xf3\xc0\xd4pX\xb9kh\x05\xdd\xf3\x09\
+`\xc7}\xc9\xdf-\xf8Ki\x94\xcd\x03=\x0f$\x03\
+\xf3\xa6\xb5\xcb?7\x0dG\xb5X\x04]8\x1csN\
+\xcd\x12\xd7e={\xa3\x97t]\xc2\xfe3\x19\xa0\xfb\
+=@c\xd7\x8ao\xa3\x1aq-\xf3A\x86\x0bW\x0e\
+\x97_yr8<7\xb7\xfe\x8c\xaaf\xb9\x0dU\xea\
+8\x97\x8a\xfa\xce\xf0\x7f\xf9:\xa0\xae\xfd\xfa\x9c\x97\x5c\
+Ne\xf9\x8c\x18\x98\xb0#\xdby\xa3\xde/\xa6B\xc8\
+s\x93\xc0s\x7f\x9d\xbc\xfd\x93\xcf\x00\xdf\xff\x0a\xf0\xc4\
+\x97\x80\xa9\x81\x15\xb9>\xf8\xd9\xaf\x82\x9f\xfa\x9fj\xfb\
+\xbc\x18V\xad9/h(3\x03\xc0\xf7\xfe?\xe0\xd0\
+\xb7Vd\x1bU;\xb7\xf5\x1d\x97\xb1\xe22\x07~\xe3\
+2\xf5\xb7\xe5x\x92\xfahV\xc9=\xb7\xea\x9fA7\
+\xe0\xbb\x01A\x098\xf9\xb2\xbe\x17f\xc6\x80S/\xac\
+\xfc\xfb\xb6J\xd7\xe95\x8f\x83\x04m!\xf1\x01C\x0a\
+hY\xf7H60\x89A\xcf\xff\x0d\xe8\x07\x7f\x0eL\
+\x0f\x85UN\x02\xb0\x18]'\x11\x15\x8e\x00\xd0\xcc\x10\
+r?\xfc\x0a2o\xfc[\x82\x0bd\xf8\x9c\xa0\xd9Q\
+\x08g\x22\xc4.\xa0\x8c\xcc\xc0QP\xd4\xc3\xc2\xcd\xeb\
+\xa2\x02|d\x98\xc3\xce6\x22\xb4G\xac\xfd>3C\
+\xc7\x90\x89\xb6\x114\xaf\xd3z\xe4vN\xa2\xe3\x8c\xae\
+\xb1\xa0V\x5cc\xa62L\x19T6\xde\x06\xae\xef\x8c\
+\xa8(l\xc7\xca\xa6`\x93\x10\x8b\x1d\xdbP\xe9\xd8\xe9\
+\xaf\x5cP\xc2\xbcG\x89\x05G\xd5l{\xa9\x8c\x9d\x01\
+\x13[GM\x05Z\xc5\x92F\xc3\x1b\xff\x82\xe6\x97\xff\
+\x16\x99\xb9\xd18\xb1\x88\xee\xd3@P\x143\xc5Q\xb4\
+\xbc\xfa\xf7\xa8?\xf5}\xa7\xbc\xed,\x918tz\xdb\
+<\xcc\xb4D6\x99\xe0 *\x93\x1f\xf6\x97\x0c\xc8(\
+\xdc$\xcd\x89\xb9\x1c\x22`\xbf:*\xe6[\xee\x04&\
+\x06BM\xf1\x85q\xe0\x8d\xef\xc4\xf3\xd0\xb5\x17t\xe7\
+G\xc3\x8b\xaa\xe7.\xe0\xf4A\xdf\x1c(\xb3\xc4a\xde\
+tO\xc8Cuc9*K\xd3z\xcb;\xa3r\x11\
+\xbc8\x0b\x9a\xba\x08\xb4o\x00\x9a:@\xed\xdb\xc1c\
+\xa7.]\xd5\xc8\x84\x9a\xe9\xd4\xe0WRh\xfb}\xc0\
+\x9e\xf7\x81\xe7\xa7\x80'\xff\xe7\x8an\xe3\xda+U\xd7\
+6\x1ff\xd9\x16\xd1R\x1d\x06\x8e\x01\xdb\xf6\x03m\x1b\
+\x80\xbaVpq\x1a\xcb1\xfei\xb1\x08\xd4\xd4\x87\x8a\
+\x10\xf2\x0fkw\x01w\x7f2R'\x88\xf6U)\x01\
+C}\xc0\xcb\x8f\xad\xdc\x9cF\xd5D\x1e\x1f\x00\xbd\xf4\
+O@\xdb6\xe0\xee\x8fF\x7f\xeb\x8c\x9e>u@P\
+\x5c\xb9j\xe25\xde/\x5cZ\x00\x15\xeaA\xb5\x8d!\
+\x97o\xa9\xeam\x10\x84M\x8a\xe5\xf9%\xf5\xfe\xaf\xf9\
+~q\xe7\xc84\xd1]Ica5\xb6Q\x85sk\
+\x1f5\xcc\xe0C\xff\x09\x0c\x1e\x06\xd6\xf4\x80n~\xc0\
+6\x0c\xf2\x8f\x1f\x0f\xcf\xd9\xe5\x008\xc9\xdd\x9d\x1e\xb9\
+\xfc\x8a\xea\x0dv\xcf\xad\xf6g\xd0\x8d\xf8n\x08\x93\xe7\
+\xe7\x81\x9d\xf7\xc4M\xa4\xaf\xfe\x9f\x10\xb0\xaf\xf4\xfb\xb6\
+J\xd7\xe95\x8f\x83ITD5`\x87\x05\xbe\xa4+\
+\xa9\x82\x1bl))F\xc5\xc9\x80+\xe3wR\x9cW\
+`\x8e\xa2m1\xe9&R*\x15C\x95\x19\xdbCB\
+\x1a$\x83C\xa9\xcc\x89Apc{L\xff\xe2\x98\xce\
+b\xb6a\xa8sZ\xf7\xdaD\x0549\x084\xb6\xc7\
+\x0d\xd8\xd0f8d\xaa\xbd\x11&bY\x98\x8c\xe8\x19\
+\xe5\xcd\xf7\xa2\xb8\xf3=\xa0\x85i\xd4?\xff\xd5x\xc2\
+\x12\x00%#@n&\xac\xa0S\x86P\xdcz'\xb2\
+\xa3'\xec\xbc\x1b\x89C\xd7\x85S\xe4%\xaa'\x87\xe6\
+\xc7u\xcf\xa8\xbb?\x8ey\x22lM\xef\xa3-F\x00\
+?#{AX\x1c\x1a\x09\x1dr\xcbt\xd2\x92\x85\xfa\
+2a\xdb\xf0K\x94\xecIj8\xe7\xeeP-K\x9d\
+ce\x1b\x86\xe3$\xeb\x9cA\xa3\xaf\x0e^\x0d\x15\xf3\
+\x96\x8d\xa0[?\x00\xba\xfdgC[^7\x06\x0e\x83\
+O\x84\x95\x01*\xd4\x83\xb6\xdey\xe9\x17\xb3}Q\xe6\
+\xecK\x84_\x7f\x02\x5c\x892\xc1\xd22\x0f\x9a\xb5q\
+F\xc8\xb5\x8d\xc0\xbd\x9f\x8d\x0d5\x88\xc0k\xbb/\xf3\
+\xed\x18\xdd8\xad\xeb\x81\x1e)\xd0\x9f\x05G\x9c@\xaa\
+k\x06\xeaZWv\x1b\xd7\x1a\xd7:\x1f\x86\xe3o\x96\
+\xc7Gz\x81\xa9\xd1\xb0\xc3{\xd3\x01`\xd2<\xc8\x97\
+\xb8T\xa3\x86<\xafb9=\xe4=\xa8)\x9b\x07\xd5\
+6\xad\xe8y\xa1|\xf8\x90\xa1J\xa4R1q6\xee\
+\xf4\xc8\xd5\x005M\xa0\x87\x7f\x0dx\xe8\xffY\xbe\xf2\
+\xf8v\xde/\xd12'r5\xc0\xa6;\x92\xf7\xb3\xfb\
+\x83\xc0\x07\xfe\x07\xe8'?\x0d\xba\xfd\x91\x95\xbf_\xe0\
+T \x16\xaf\xc1H\xeb*\xb7q\xad\xe7\x96\xe7\xa6\xa3\
+\x02Z\x198\xfbJ\xd8D:p\x18\xfc\x86\x90f5\
+\xe0\xf0r\x1e!Eq}\x97\xaf\x80c~\xa3\xdds\
+\xab\xfd\x19t#\xbe\x1b\x22\xa0\xc6\x11\x15\x8d\x17\xe7B\
+\x0a\xda\xf5x~T\xe3:\xad\xc28\xb4\xfa\x07+W\
+G\xc3\xff&\xd3hh\xcb\xb7\xb1l\x22[e\x12\x97\
+O\x1c\xc1b\xc7\xf4\x89m\xd3\xa2h.d\x80\x22\xca\
+W\xa5\xb9\x13AmK\xdc\x10\xc9\x82{L\x19\x04k\
+B\xc3\x1c\x9a\xbe\xa8\xaa\xd8L\x1co\xa3\xa9\x13(\xb4\
+\x88\x06E\x88N\xc2,\x82\x8ep\x1b\xd9(\x01\xf2\x14\
+i,\xe5\x22\xbc\xc6\xca\xcd\xebP\xd9|\xb7\xa0\xe0\xe7\
+\xb0\xb8\xe5@t\x0d7\x81\x0bM\x16\xd0\x1bI?\x16\
++G5C'P\xff\xca?\x86\xa6i\x00*\xcdk\
+Q\xee\xda\xa7\xab\xf4\x16\xa6\xba\xbf\x89\x1a-\xc5s\x98\
+*\x0b\xf1lRR\xf7){J;\xec\x9c\x97\x8c\xdb\
+S\x18%\x07d\xdd`\xe5\x9a\x85V\xe1\xf1(\xf1\xcc\
+\xf0d6\xc57A\xbe\xaa\x8aJ@\x1c\x0a\x8fm.\
+f!\xff(d[\x8c2\xd0*\x00\xe6\x1b\xc2e\x97\
+\xe65\xa1\xd6oR\xf4\xbd\x18OE\xd2\x92aE\x88\
+\xcb\x97\x8a\xe0\xe9\x04\xd3\x8b\xa0\x12\x03\x92\xfc\xd2\xd2V\
+\xb4\xe1\xe6\xf8\xdf\xb9<h\xedv\xdd\x1cP\xb9\xccf\
+'\xf3\x9dl&\xd49\x16\x0fSL\x08j@\xa1m\
+e\xb7q\x8dq\xcd\xf3a\x1e*\x19X0\xc3\xd1\xd8\
+y\xdb~\xd0\xce{\xc2\xbf7w&\x7f_J\x83I\
+I\xb2\xf9\x09\xe0{\xff\x0b|6\xe6?\xf3\x89\x17\xc1\
+\xcf\xff\xf5\x8a\x9e\x17.\xd4\xda\xaa3\x00`a\x12|\
+\xf2%\xf0\xe89\xe0\xc4\xb3@\xcf=a\xd5\xa3\xd0t\
+\xc3\xde/4%\x9a\xdc\x9a\x13T\x8b\xd6\xef\x01\xb6\xde\
+\x12\x99\xe5\x00\xcc\x99\x95\xbf_\x9c\xeb\x85\x0a\xd7\xa0j\
+s\x95\xdb\xb8\xe6s\x1b\xf1})\x9b\xd7j%\x17O\
+\x00\x0b\x11`\x89\xd4\x0d.\xeb\xdeS\x15\xff\xec\x15\x1f\
+\xff\x0ds\xcf\xad\xf6g\xd0\x8d\xf8n\xb0\xabC\xd9+\
+KB\xab\xf1\xbe\xad\xc6uZ\x85q\xc4\xcd{\x09\xa5\
+\xd7\xe8\x03\xa2\x00\xeb\x80(Y\xd5v\x1c\x8a\xcc\xf5\xe2\
+\xa8\xef\x18\x19>\xd7U\x86&\x87m!\x90w\xde\xef\
+\xd4\xb9# \xdfu\x8b\x95v\xcd\x8c\xf5\x8bK3\x1c\
+Kf*\xdeFy\xc7\xfbl\xc5XRu\x82\xf5{\
+\xc0v\x1bg\xad\x02\x88\xe2\x8d3l\xd5\xdc\x5cc\x99\
+\x89~A\xbd(#;)\xfa\x8a\x0a-\xd1\x22B\xd4\
+\x0c\xca\xb0\x12\x84\x00\x90\x1f:\x01\xe6\x0aj\x8f>e\
+\xe7e\xbe\xfb=\xe0\x9aF\xb7\xdf\xd6\xaf)S\xb8b\
+\x91UjG\xa2!\x93U:%\xb6\x15*\xbbxM\
+\xa6\xd1\xfe\x83|\xbd\xd6;\x94t\x1c\x86W\x19g\xa5\
+g\xc8\x0e\xfc\x8e\xab\xdc\xa2eU\xec\xd3\x1c\x0b\xbc%\
+\x19\xbb\xf8\xc2\xda\xa8\x88\x944\xa3\x96h4M\xb67\
+>0\x97\x0f\xa6M{\x92\xa9'\x97\xaa2I\x95\x84\
+R\x114v\xc1\xffL.\x07,F\x0f\x90\xa5\x9a|\
+\xea:\xc0mk\xed\x12\x0eO\x0c\x03\xd3cJ\x9e\x0a\
+k{.\xef\xb8\xa2\x9b\x9a\xa6\xc6u%\xa3a\x0d\xd0\
+)\x8e\x87\x82\x95\xdd\xc6\xb5D\x15\xe7\x83(\x0bP\x04\
+V\x8e\xfd\x00\x1cT\xc2\xaa\x90\xe1l.\x91,\xf1\xd8\
+\xe9\xf0\x8a\xce\xd5\x00\xbb\x1e\xd2\x7f,\xcf\x83\x04\xbf\x91\
+\xa6G/M\x1f\xb9\x969\xa5l\xe8J'_\x88\x00\
+p\xe4\xbf\x80\xe7\xfe&\xac&vE\xb2i\x8bs\x16\
++\xccx\x00\x00 \x00IDAT+Ce\xa9\xc6\
+\xfd\x22\xee\x0f\xdav\x00\xf4\xc8\xff\x1b\xaa\x90t\xed\x05\
+>\xf8?@w>\x0a\x92\xcb\x8fsc+\x7f\xbf\xd8\
+i\x8f\xaa\x89\xd9\xab\x97\xe1\xbb\xaamT\xe3\xdcV\x04\
+7\xd3\xe1\x9b\x9b\xaa\x22\xb5\xae\x03j.3i\xcb\x8b\
+J\xe2\x9a\x9e+\x9f\x87\x1b\xe5\x9e[\xe5\xcf\xa0\x1b\xf2\
+\xdd \x12\x84+J\x0a\xaa\xf1\xfc\xa8\xc6uZ\xa5q\
+hf\xb2\xae\xa1\x93D\x5c\xfa\x83\x16X\xc5n\xa0\xb1\
+\xd4^\xc6<?\x1c)P&\x12\xdb\x15\xdc\xe2\xf3?\
+\xb6?W6\xedB\xb0\xe5n\xb8\xbc\xe5`\xe3\xde\xe8\
+\xfe)\x82\x86\xde\xd2\xa0\x8d\x81\xcc\x857b\xaa\xc9\xc6\
+]\xa8l\xba3jX\x8c\xab\xc0\x95\x8d{\x22l]\
+Dv\xa4WK\xf19\x89\x9f\xd1\x0e\xcf\xceL\x00\xd3\
+\x83\xb6\x82\xcd\xb5m(wl\x16`1\x88*\xc3\x11\
+\xa2\xackU\x09\xc9\xe2\xd6\xdb\xc3\xed\x5c<\x8e\xdc\xc5\
+3\xd1\xf5[\x8b\x85=?\x8dJ\xd7\x81\x10hZ\xde\
+~R\xe2\xc4\x08\x84,h\xa5e\xb3N\x9aXh\xb0\
+{+\x04\x02\xde\x12\xa2\xa6\x5c 0n\xb1\xd6AJ\
+\xc3z\xb8\x95jCg\xb1j)\xa4*\xd8II\x85\
+\xad\xdd\x13+\xb3*\x09\xf4c\x1d\x19\x7f-\xc7\x1c\x15\
+\xbbIc\xb4\xc3\x1b\x1f\x98\xcf^\x0cy\x8a\x00\xa8\xae\
+\x09\xb8\xfb\xd3!\x8f\xd3D\xfb\x0e\xd0\x9e\x07\xe3\x9f\xa7\
+\x12$\xad\x1a;\xc4RI\xc9\xefv_\x5c\x00\xce\xbe\
+\x16u(#Q^\x11\x00h\xe3\xbeXcv\xe4\x1c\
+\xf0\xdf\x7f\x09\xfe\xfeW\x80\xff\xfcc\xe0|TEj\
+[\x0f*,ocN\x85\xc6X\xeb6_\xd0Ku\
+[\xef\x8ce\xe8\x00`~j\xc5\xb6q\xcd\x95\xaaj\
+\xcc\x87\x5c\x0e4\xea\x07\x0b\xe3\xbe\x1aHn\x89\xe6\xba\
+\xf9\x09`| \x02\x91\xfb\x81f\xa1C]\xd7\x0a^\
+\x13?\xbc\xf9\x12V\xda\xd7<\xa7]{c\xd0\xd6\xb6\
+.|\x88\xe5j\xc2*Qm\x1bp\xcbO[\x83\x0d\
+*\xce\xde\xb0\xf7\x0b\xf7=\xa7\xef\x91L\x16\xd8|k\
+\xe8HXZP\xc0\x94\x8b\xb3\xe07\xfekE\xef\x97\
+\xf8\x1a\xa8\xb1/C\x0a*WG\x05\xba\xdamT\xe3\
+\xdc\xae\xd9\x12\xff{\xe3\xad\xbajn@_6\x07t\
+\xed\xb9\x04pk\x0a\xf9\xca\xd2\x1c\xed\x96\x87\x80\x8d\x07\
+4\x08Z\x05\xf7\xdc;\xe2\x19t\x83\xbd\x1b\xccy@\
+\xeb&\xb0\x11>hl\x03\xb6\xdc\x95L\x0b\xa9\xf6\xfb\
+\xb6\x1a\xd7i\x95\xc6a0\xb5\xa1\x8fP\xc2BI\x5c\
+\xea\xd6eRV\x82\xe7d\x9f\x1f\xc1R\xcf\x0fCM\
+aS\xcd\x8d\x88\x12\xd3\x17@c\xe7\xa2\xadd\x10\xf4\
+\xdc\x0dn\xef\x09\xbf[hE\xb0\xe7\xc31\x05\xe5\xdc\
+\x91\xb0GE\xd2\x1b\x88\x91\x99\x1e@f<\xdeFe\
+\xfb]\xe0\xd6np\x86@5\xcd\xa8\xdc\xfcAT\xda\
+\xa3m\x9c?\x02\x0e\x8a\xe2\x90\x1ch\x98\xaf\xb7\xea-\
+\x9c\xab\x01Q\x0dLm\xba\xbca\xbfr.\xb6N\xa6\
+Q\xb5\xbc\xbc\xe96]k\xa8m\xb1\xe4\xfb\xc2\xb9C\
+q~\xde\xda\x85Rg\x8f\x82\xc3\xecV\x88\xb3\x0d\x08\
+\x9a7\xa2\x5c\x1f_\x1fs=?\x89r\xe7\xae\x90\x93\
+\xcfQ\xcb'\x93_Qw\x1a_\x91\xc9#\xf8\xff\xdb\
+\xbb\xd6\x1e\xbb\xce\xb3\xba\xd693c\x8f/\xb1\xe3\xc4\
+q\x9d@\xea\xb6I\x1a7E-m\x89\xda*-\x0d\
+\xa2\x17\x90*(\xa8\x08\x0a\x88o\x88\x0f $~\x01\
+\x7f\x85/\xfc\x00$D\xb9\xb6\xa2\xb4\xdc\x926\x05\x1a\
+\xe7\xd6\x5c\xec$\x8e\x1d\xc7\x89\xef\xf6\xdc\x1e>\xec\xf7\
+\xf2\x5c\xde\x93\x06eJ]\xcf\xb3\xa2\xc8\xf6\xcc\xec}\
+\xf6~\xf7>g\xd6\xf3\xec\xf5\xac5\xb3\xd7\x85\x8aY\
+\xd7\x9f\x9e4\xdcS\x91!\xda\xb2\xa6TT2x\xe4\
+B\xd33\xf7\x82\x1c*Y\x94=\xcc\xaaA\xa7Q\x95\
+w\xf7\x15\xf6\xadM\xe7_\xf0\xd30\xfcy\xf8\xc1\xe9\
+\xd1o=\xf0#\xef\x83\xfc\xea\x9f\x01\x9b[\xc0\xe6\x1a\
+\xb8\xbc\xda\x1f\xfd\x9d{\x19x\xf9\xbbv\xfb\xf7|\x08\
+\xfc\xe0#})w\xef\xeb\x96K\xed\x97\xc7\x1a\xf0\xe0\
+\xe7!\x07\xee\x9a\xde\xa3w\x1f\x9fR\xeb^\xfa\xf7\xd6\
+\xed\xe1\x07>\x03\xb9\xffa\xf5\xb4Ku+\x96V\xa7\
+\xa8\xf2Bb\xe4S\xbf\x0f\x9c\xf9!\xf0\xdcw\xbao\
+\xe9\xf2>\xe0\xa1\xcf\x83\x07\xdf\x03\xac\xee\xeb7\xff\xea\
+>\xe0\x8b\x7f\x0a\xae\xafM\xe7\xa1\x06edc\xcd\x0e\
+\x82m\xc7>\xb6\xeb\x17\xe2\xbb]\x0f\x008\xf0\xb3\xc0\
+\x91\xdeA\xe1\xc7\x7f\x03\xf2\xc2\xf7\x80\xf3\xcf\x01/~\
+\xd7x\x09\xbf\x9d\xcd\x96\x9c\xf8&\xf8\xe9\xdf\x01\x96W\
+\xc0G~\x0f\xf2\xda\xf3\xd3S\x92#\xf7\xd9T\xb8\x95\
+\xc1/\xc5\xedX\xd3\xfdw\x03\xef\xfd(pw\x0f\x11\
+\xe1\xca\x1e\xe0\xf3\x7f\xb2\xf8\x98\x7f\x94\x1d\xdeO\xea\xfd\
+\x02L\xf7\xfc\xb3\xff\x06|\xf4K}?\xc7?\x0b\x1c\
+\x1f<R~\xea_\x86\xf7\xd7\xb6\xdc\x1f\x00p\xe8\x18\
+\xf8\xe0\xa3\xc0\xc1\xc3\x90\xa5\xe5N~\x0e\x1d\x05\x1e\xfd\
+c\xf0\xc6\x95\xe9\xc3\xf6\xd4\x7f-\xf6g~7\xfb\xd8\
+\x8ek{\xf8\x01\xe0\x81GL\xc48\xef\x7f\x18\xf2\xfe\
+\x8f\x01/~\x1f|\xee\x9f!\xab\xfd\xde\xe4\xdd\x1f\x84\
+\x5c>\x07\xbc\xf1C\xd5a?\x0c|\xe4W\x80\x03G\
+\xc0\xa2\xed6\xbf\xae\xf6\xdc\x06|\xfc\xcb\x00\xbe<\xf9\
+\xa0\xbf\xf2\x14\xf0\xc4_\xa1F\xbd\xdfT\xef\xb9[\xec\
+3\xe8\xa6\xf8\xdd\xd0\xba\xc8\xef\x03>\xfe\xeb\xc1&\x91\
+\xf3\xe5\xe9\xfd\xfc\xd0/\x01\xe7NB\x9e\xfd\xd6Xs\
+\xfen??\xb6\xeb>\xdd\x8e\xcf1\xb8!\xc9\x81u\
+\x22\xc1bg.\xa1)\xda\xe4\x09\x07\xef\x85<\xf8(\
+\xe4\xc0\x9d\xe6\xf3Cn?\x8a\xcd\xcf\xfe\x11x\xfd\x0a\
+dF\xcc^\xfe\x1f\xf0\xe4c}(\x10J\x95t\xe2\
+\x9f\xb0\xfe\xc9\xaf\x81K\xcb\x90\xdd{\xb1\xf1\xf0W\xe3\
+\xb1\xca&f'\x1f+)\x97\x85\xdc\xd7\xf8x\x00\xf3\
+\xa7\xbe\x89\xcd\x87\x7f\xbb\xedc\xed\x17~s\xb0\x8f-\
+\xccO}\xb7[\x16V\xad\xce|\x0f\xd6\x1f\xf8El\
+\x1d82\x15k\xd5W~\xf7>\x5c\xfd\xec\x1f\x82\x1b\
+\xd3=&\xda\xc1nc\x0d\x5c\xbb\x80\xaa\x05_\xbf\xff\
+\x97\xb1v\xcf\x87\xed\xeb\xedZ\xc5\xb5\x8f\xfe\x16v\xbd\
+\xf8\x1fX\xbb\xf7c\xf6\xe1\xd9\xdeCX\xbb\xf7S\x98\
+\x9f\x7f\x11\xb3\xcb\xa7'\xef\xf3]\x87p\xfd\x81\xcfa\
+c\xff]-@K/\xfb\xd6\xea~\x5c9\xfe\x85\xf6\
+\x94g\xd7\xd9g\xb1\xfb\xd9o\x00\xd8j\xd7\x8f\xb5S\
+\xbd\xef(\xae\x1d\xfb4\xd6\xf7\x1d\xc2\x96\xba.\xeb\x07\
+\x8e\xe0\xc2\xcf\xff.\xe6kW!$v\x9dy\x0a+\
+g\x7f\xe0\x9e\x99\xd0\xcb\xbf[qE\xd5.\x17Q\xbd\
+\xef\xea\xaa\xa2&S\xbb]~)\xc2\xc8\xd8\x98g\xdf\
+G\xf3\xce\x17M\xee\xd5\xeb\x95\xaf\xcd\x8f\x1f?\xfe\xe7\
+73/\xe7\xf1G\x83\xce\x95 8\x9bMo\xdc\xea\
+\xb3y\xe5\x02\xf0\xed\xbf\xb0S\xe7\xab\x07\x81G\xfe\xc0\
+F\x02\xcf\x97\xc0=\xd6\xd7\x9c\xcb\xbb\xc0\xdb\x8f\x82\xb5\
+\xfa]Y\x05\x8f\xbc\x7f\x1a\xb28\xf34p\xfc\x0b\xe0\
+\x83\x8f\x98n\x05\xf7\x1e\x9c>\x84^;\x01~\xe2\xab\
+\xe0\x1d?\xa3\xba\x1e{\xa6\x7fon\x02o\xbcX:\
+n\xc7\xc1\xe3\x9f\x99\xe2\x99\xe7\xb6\x1e\xe2\xac$\x8c\xf9\
+\x94\xbc\xf3\xaf\x00\xa7T\xfc\xf9v\xecc;\xb0\x0d\xeb\
+\xc1\xfb?\x07~\xe2\xd7\xc0\x03G\xfa~o\xbb\x13\xb8\
+\xf7!\xe0\xda\x0d\xe0\xe5\xc7\xc1\xa3\x0fM\xe7\x0a\x00\xa7\
+\x9f\x01\xde<\xb9\xa0\x83\xf7&p\xdbQp\xff\x1d\xc0\
+l\x0e\xdev'x\xfb\xdd\xed\x17C\x7f\x14|\xb0\xfb\
+Yo\xe7\x9a\xbe\xff\x93\xe0}\x0f7_\xdbwt_\
+_\xbb\x08\x9cz\xe2\xe6z\xbfh\x5cxu\xfa]y\
+\xf0\xa8\xed\xd2\xe9\xcf\xb0W\x9e\x02N\xfc\xfd\x8f\xe5\xfe\
+h\xdf{\xe8\x8b\xc0\x91\xf7\x01\xb3\xa5\xd8]X\xd9\x0d\
+\xac\xee\x9f\x02H\x8e\xdc\x07\xccV\x80s\xd1\xf5\xe2]\
+\xedc;\xae\xed\xa7\xbe\x06\x1e\xb8+\x04Up6\x03\
+\x0f\xdd\x0d\xb9s\xea\x9e\xb5\xd7\xd8{\x10\xbc\xf7\xe7\x80\
+\xbdG\x80\xd3O\xf6n\xe9\xb1\x8f,\xbc\x16~\xbf\xd8\
+s\x00X[\x03.\xbc\xa2\x8a\x81\x9b\xe4=w+}\
+\x06\xdd,\xbf\x1b*>\xf8\xa8y\xbd\x80\xf9\x1c\xd8\x7f\
+\x08\xbc\xfd\x1e\xe0\xc5\xc7\xb7\xff\xf3c\x1b\xee\xd3m\xfd\
+\x1cCS\xfcZB\xe6R\x80j\xe2\xa3\xf6\x0eo\x84\
+\xecC_\x00\x8e\x1c\x1b~~`y\xfa\xfc\xc0\xee\xfd\
+\x90\xbb>\x00p\x05|\xe3\x85\xa9\xc1\xa7\xdf\xefk\x97\
+1_[\xc3\xd6]\xc7\xfa,\x9bi\x0ena\xf9\xf9\
+\xc71;{\xa2\x93U\xbas_\xbb\x84\xd9\xda\x1a\xb6\
+\x0e\xbfw\xe1>V^|\x1c\xb3\xb3O\xf5\xad\xea\xb0\
+\xe3\xe1\xfb\xb0~\xff\xa7'\x07\x14\x7fmf\xf3\xe9\xfe\
+r\xf7\xd8\xfc\xc2i,\xbd\xf6\xe4D\x16Wn\xc3\xf5\
+\x0f\x7fi\x18\xb6#\xab\xfb\xb1~\xf4Al9^\x85\
+\xf926n\xbf\x07\xebG\xee\xc7\xee\x93\x8f\x01$\xd6\
+\xdf\xf3\xe1\x89\xdc\xbf\x83\xfb\x03\xb3\x196Wo\xc3\xd2\
+\xdau\xcc/\x9f\xb5mi\x12\xd7\x8f}\x06kw\xdc\
+;\xbc.\xb2\xbc\x0b\x9b\xbb\xf7ak\xd7>\xac\xddq\
+\x0c3\xcc\xb0t\xf1\xe5~\x07p|\x9fT)K]\
+7\xed\xfaB=\xb8I\xda\xeb\xc4\xbe\xde\xf1\x91\x8d\xba\
+\xa7H\xddR\x9f\xfeM\x86\xeb}\xd3\x13s\xac]\x03\
+V\xf6NU\xf1\xf3\x8f\x01W/\x81\xeb\xd7\xa7\x0e\x93\
+\xc8\x14^\xf0\xd2\x13\xc0\xf7\xff\x1a\xd8p\xf6g\x1b\xd7\
+\xc1=\x87\x80\xd5\x03\xc0|\x09\x82\xadi\xe1\xaf\xbc\x05\
+\x9c\xfc>\xb0\xff0x\xe6\x05\xc8\xf5+\xe0^uS\
+mmB\xae^\x9c\xaa\xf9\x0b\xafN\xd5\xf3\xbe;\xa6\
+}\xcc\xe7\xa5z\xda\x04\xdex\x158\xfb\x0c8\xdb5\
+Yk\xcd\xe6\x93\xf3\xc2\xdaUpcc\x8a>\xbe\xf2\
+Fy4z\x05\xb8\xfd\x1e\xe0\xfa\x15\xf0\xc2\x99I\x16\
+p\xe3\x0ad}\x0d\xb8~\x11\xbc|\x1e\xf2\xd6\x19\xe0\
+\xfci\xe0\x8dS\xc0\x0b\x8f\x03O\xfe\x83-\xe7\xb6c\
+\x1f\xdb\x81\xedX\x8f]\x07\xc0#\xc7 \x9b\x9bS\xb5\
+^\xdf\xa87\xae\x02\xaf\x9e\x98\xc2%\xce<\x07\x1e\xfd\
+\x10\xe4\xdc)\xe0\xc9\xbf\xb1\x03\x1d\x1e\xaf\xfe\x00X\xdf\
+\x9c>\xe8\xe7\xcb\xd3\x87\xbe\x08\xe4\xca\x9b\xd3\x5c\x01\x01\
+<\xffx\xfc\xc5\xba-\xd7\xe5\x1ax\xe7{!K\xbb\
+LEO\xdd2)\x1d\x08\xb9v\x09<w\x0ar\xe2\
+\x1f\x81\x1b\x97o\xae\xf7\x8b\xc7\xf9\x97\x80W\x9f\x01\xf7\
+\xde\x01Y\xdd\xdf\x0b\xd7\xab\x17\x80g\xbe\x0d\xfc\xe0o\
+\x7f|\xf7G;\x86W\x81\xf9\x0a8_\x81,\xef\x06\
+ek\x8ad\xde\x5c\x9f\xc2\x826\xd6!\x17\xceN]\
+\xc8g\xbf=%\xc2\x85\xf3x\x17\xfb\xd8\x8ek;[\
+\x99\x02f\xd6oL\xe7:\x9bO\xe7\xbe\xb5\x09\xbc|\
+\x02\xf8\xcf\xbf\x04\xce\x9d\x04\x8f>\x08\xd4.\xe1\xc6\x8d\
+\xe9~\xad\xfe\xeb\x97\xce\x00\xf3\xd5i`u \x03\x90\
+-\x01\xae^\x98~\xa1l\xac\x01O|\x1dx\xc5E\
+\xaf\xdf,\xef\xb9[\xe93\xe8f\xf9\xdd\xd0:\xf4{\
+\x80\xdb\xef1\xe4\xd5\xb5T!\xeb\xd7\xc0\xa7\xbf3\xce\
+\x1fx\xb7\x9f\x1f\xdbq\x9fn\xf7\xe7\x98!H\xa2\x18\
+\x96%^\x91X\x15\x9b\xbc7O\x83\xf3\x15\xa0~~\
+ ~~\xe0\xe2\xeb\xe0\xd9\xe71{\xfe_\xc1\xad\xb5\
+\x16;O\xadq\xbex\x1a\xf3\xb3/\x01+{&\x8d\
+w\xb1,\xe4\xa5sX\xfa\xef\xafc\xd6\xd6\xa1\x84\xd0\
+h\xcf\xed\xfa\xd7\xcb\xa71\x7f\xfd$de\xcf\xe4\x8a\
+\xa4\xf6\xb1\xf2\x83\xbf\xeb\xa1B\x9a(\x8a\x80kW\xb1\
+u\xdbQ\xf0\xc6\x15\xcc/\xbe\x8e\xd9\xd5\x0b\xe0\xdaU\
+pc\x0d\xbcq\x09\xb3+ob~\xf1u\xcc\xdfz\
+\x0d\xf3\xf3\xaf`\xe5\xd4\x13X\xf9\xe1\xb7\x80\xc2\x99\xb8\
+y\x03\xd8s\x18\x9b{\x0f\xda\x82c\xfd\x06\x96.\xbc\
+\x86\x95W\x9f\x9c\x92jw\xef\xef\x92\xbf\xcd\x0d\xcc\xae\
+_\xc2\xca\xe9\xa7\xb1\xf4\xd6\xc9i\xa8\xf1\xda9\x90\xbb\
+\x80\x95U\xc8\xf2\xae\xe1\xfd1\xbfvq\xe2\xad\x1b\xeb\
+\xd8\xf7\xf47\xb0|\xee\xa92\xf0i\xf9\xf4\xd2\xc5\xd7\
+0\xe3\x120_\xc6\xe6\xd2n\xcc\xcau\xc1\xd6\x06\xb0\
+\xb9\x89\xd9\xe6\x06\x96.\x9f\xc3\xae\xf3/a\xd7+\xdf\
+\x03K\xf1Fe\xa5b\xd2@\x0bo\xee\xdc_k\xcd\
+\xd9\x5cbt\x11W\x8b\x84\xe9\xb6\xa2\x19(v\xb7^\
+\x93F\xd1i\xca\xcdu\xae\x5c\xfd+_\xf9\x8a \xa1\
+J\x95\xdd\x80\xac\xfd\xff%\xd6%Zu|\xcb\xae\xf9\
+l6}\x80\xfe\xb8\xe4+\x89\x9f\xbek\xbbz\x10X\
+\xbf:\xdenie\xfa\xe5\xb2\xe8\xfd\xb0\xff\x08p\xe5\
+\xf5w\xff~\xb9\x95\xdfs;}=j\x11\xfd\x93<\
+\x9f\xed\xbaO\xb7\xebi\xa2\xea\x84W\x7fm@\xb9\xb2\
+H']\xce\x7f\x03V\xdb\xe2\xf6\xcb\xe8\xd4\xdd\xb4\xd5\
+\xa6c\xda\xbb\xbd\x81\xa0\xa9}Y\xd7k\xff:\xaa\x22\
+\x84\x22\x8a\xcd\x8e/\xeeu\x92UW/n\xc5\xf4)\
+\xdd\xb6o\xd4\xe9\x15M\x86E\xf5\x94\xeb\xb9\x89Y\xa5\
+\xf2\xe15\x15d\x9bW{l\xbdn9\xabe\x94\xd5\
+;\xc0\xeb\xe7\xd5\xa9T\xb9\x07Lg\xbc\xca?(\xf6\
+\x1a\xb0\x16?n\xb5X\xb6\x9b\x0a#+)\xb2\x0cx\
+\xc15\xa8G\xe2\x0d\xf0\xd5\xb1\xc0<\x7f\xe9\x8e\xe4B\
+w<\xfavr\x8c\xbd5y\xd4\xddP\x7ft)?\
+\x8d\x1d6\xaf\xe7\x1a\xfc$p+\x13\x84\xad-`+\
+Iy^[\x85ko\x13\xb7\xfe\xa3H\xfe\xa53\xf9\
+\x9e\xcb\xcf\xa0\x9b\xff\x5c\xb6\xeb>\xdd\x0eR\xaeB>\
+\xe9R\x1f'\xe92\x1d\xd9T\x14\xb8v5\x1d)\x83\
+\xb2\xf4\x83\xf4n;\x15\x89\xa3\xf7\xfaC%\xa0P\xdd\
+\xd5Nz\xab]\xde(\x0e^dd\xffXT\xd3\x95\
+\xf4\x8a\xf5\xe5\xa6\xd9\xa7\x8e\xb5\xaf\xd6\x81\xa2\xeci\xd4\
+~C\x96\x90\x89)j\x84\xbc\xeb\xf3\xcb\xebc\x03\xb2\
+~\xc5\x142t\xe7)\x22 \x09^{\xa3\x13a\xe9\
+\x9an\xba\x09]\x96?\xfb\x92h\x13C\xb4\xfd\x99\xaf\
+\x16\x87\x95\xe6\xf7\xaeIq}\x8a cI\x8b\x90=\
+\x88\xc9,w?\x96\xbaf\xa2)5\x8dh\x05j\x99\
+\xcb=(\xb1\x1c\x13U\xa2\xa9\xc3\x99\xe5\xa7q\x22\x91\
+H$\x12\x89[\x15\x22P\x9dh\x84\x9cG\xa9\x06\xd3\
+Q\xa9\x04\x1dI\x8f@\xaaJ\xe2'e\x10g\xc4\xe0\
+\xc4\xd8\xb6\x13g\xdf\xa7\xfe\xce\x01)g`\xcb\xea\xd5\
+(\x96\xb53\xc4\xe0\xd8\x82\xc0\x15%\xb0\x19:\xe6h\
+Z\xbeN\xb0+\x11\xc5\xbdi\xb2\xe9[G\x5c:\xa1\
+\xae\xde\x80\xf5\x09\x82\xcem\x12S(\xc0\xae\x18\xf5S\
+\x07\xfb:\x22\xb6\xe2aX\xcf\xfe\x1da\xb4[\x14J\
+qwq\x0b-\xd2~\x9e.YH\xb4\xd5\xa1qU\
+\xd1\xe7$f\xbdz\x1dHs\x8c\xa2\xaeG\x1d\xf0\xad\
+k\x9e\xc4<\x91H$\x12\x89\xc4\xadO\xd0YI\xb1\
+\x0c\xc8;\x07\xc1\xec\x9aH/\x92=h\xd2\xd5\xbf^\
+\xa5#\xda\x84\xcf\xf4S\xed\xe4\xa0!\xa2\xe2\x02\xecE\
+\x17\x18\x22\x03\x8am_'\xb2\xfaQ\xce}\xb7\xf1\x13\
+ZI\x0c|!\xc0\xb8\x8et\xc4_\xf7\xac\xeb\x5c\xa3\
+n\x7fO\xb39S!\xc1\xd1r\xb2_\x87X4t\
+\xf2\x1a*.\xea\x02\x8a\xb1\xb0\x18\x9dB\xeb\xf0\xc7\x0e\
+\xf6T\xdb\xa8\x80 \xe7}\xdeK\xae\xc1\x86\xe82\x18\
+qu\x82\xf67\xf7\xd6\x8b5\xbc\xa9.K\x12\xf3D\
+\x22\x91H$\x12;\x80\x99+\x82\xebz\xd9\xdd\xadZ\
+\xc2\x8co\x8b\x80w\xedoQ\x1e\xe8\xa6\x0b,l\x1d\
+]\xe9?\xd2^\xb3w\xee\xfd\x0e\x15\xa3\x94\x11\xa1\x84\
+!\xfbt\xe7\xd4t#\x868R\xd1e\xc1\xb8K\xef\
+\xf43T\xc4W\xa7X\x9a\xcd\xaa\xe1\xbb\xa0/O\xb1\
+\x8a\xac\x96\x80b\x17\xcb\x93U_ \x09\xc7D\xba\xbb\
+\x9a\x88\xa5\xb4\xecI\x9a\xe2\x13\x95\xa8\x8e\x0f\xe3\x9aC\
+(\xc3%i\xd7U\xbc\x8f\xbaR\xf6\xcb\xf0\x19C\x93\
+\x13\x85g\x22\xa2B\x8f\xdc>\x85\xf6iH\x12\xf3D\
+\x22\x91H$\x12\xb78h4\xca\xa1;Ni]\xdf\
+\xd0;n.\x1e\x12\xc3\x88D\x0dl\x0e\xcc\xb1\xfb\xab\
+\xb6\x18\xd1\xc2\xbdE\xc914\xf3e\x1b \x0c\x05B\
+\xf5\xc1\xf6\xf6\x80\x86\xae;Z[:\xec\xd4\x9dvM\
+\xfa\xd9\x5c\xb8]R|\xb1\x0d\xac\xb3\xa2\x8e\x9d6u\
+\xb5[F)\xda\x17:fJ\xddIo\x9dp\xe5\x8e\
+#\xd31raQ%.\xf4\xc9-\x9b\xc8 \xa0S\
+\x8f\x87\x9ag\x0f\xad~\xa9\xa48dt\x8a\xbaC\xfc\
+%\x97qi\xa1\xd4,\xedID\xbc\x0b\xc7\xb2(\xad\
+_Ob\x9eH$\x12\x89D\xe2\x16\x87(\x22(\x91\
+T\x95N/D\xd4OZ\x02H\xd6~\xb7XB/\
+\x86\xd1v)t\x93EK\x14\xbb\x18B\xab\xb5\xe1b\
+<\xb4\xeda\xd0\xb6\xe6\xed\x1e[\xe7;6s\xd5\x19\
+)\x87\x16\xf12\x17Z\x02)\xe6\x09\x83\x22\xa4\xa5;\
+/\x82\x05\xce&\xec\x0b\xa6\xea\x0e\xa9/\xead>\xa2\
+\x841\xd2\xfe\xb3\x85Q\xb3~\x0c+\xd3e)\x9a\x18\
+{\xea,\x0c\x15D?e\xcf\x95\x9b\x1e\xbe'u\xfa\
+\xb5\x96V\xe1\xc4\xeb!&\xf5\xd3\xaem\xbf\x0e\xae\x8c\
+\x92~\xfeI\xcc\x13\x89D\x22\x91H\xec\x08rN\xe3\
+)-Nk\x10\x18Z'O\xec\xb2\x06\xd3\xb7\xf5\xa4\
+S\xb9\xae\xd4\xf8\xf7n9\x02\xdb\x95\x16v\xd2\xeb\xba\
+\xf7\xad\x87+\x0b\x06D\x1d}5\x84\x96\x03\xf2\xae\x0a\
+\x08Q\xee+F\xc7-v\x88\xb5\x91\xc6\xe6\x18)\xce\
+\xbf%\x1684Gc\xe65\xfbwL\x0ak9W\
+\xda\x07\x0e\xf4\x9dq\xc1\x82W\xec\x1do\x9a\xf5\xb3'\
+\xc0\x05\xe5\x8c\x88\x1d\x98\xad\x05\x03\xa5\x1f\x93W\xc3\x08\
+\xa5\x87\x10\x0d\xf57\x04|y\xe7\x87\x05H\x88\x19/\
+.aC9\xfc\x99H$\x12\x89Db\xc7Ps\xed\
+\xb0\xa1:\xa3\x9a\xd31\x0cJ*\x0d\xb7v\x10\x09.\
+.\x12\x85\xd2b\x09\x98\xde\x90\x14\xd5<\x17\x04^9\
+\x90Y\x98$\xd3\xc1 k\x97\x87\xc7\x89MQ\x16\x86\
+\x91y\xd3\x04\xec\xc0\xecG\xc6\xf2\xf3\xfa\x17\xb1\x94\xb9\
+\xc5\xd3k\xcbH]\xe1PoBS\xe0\xd0\xc5\xd3\xfb\
+\xed b\xb6i\xdc\xbc\x92s\xa5\xed\xd7\xa4~\x9c\x95\
+\x16\x16B\xd7LE\xb2\x1f\xfd\xe9\xfb\xa1S\x15d0\
+\xb2\x9dP\xc0\x85B\xc2=m(\xee:\x82\x94\xb2$\
+\x12\x89D\x22\x91\xd8!\xa0b\xda#\x83\x16Q\x1d\xf5\
+\xd8t\x8e.*\x08\xfc\xd6\x0b\x90\xc5\x85\xf5\xf4-D\
+\xd8\xdc\x0e\xe1\xdc:4q\xa5\xf7\x01i\x9e\xdf\xa3^\
+u\xe7\xb1\xb6\xab.\xdd\xbeP\x0f\x1b\x8ab\xc5\x82\xd0\
+\xa5g%\xbb2\x0eQ\xea\x89\xa9t\x5cY:q\xd5\
+k)\x82\xa89q\x16\x8f2Xk\x11m\x07\xa3\x9e\
+F\xf4\x02\x82Mf4P\xe1sL\x94\xab\x8f\xba8\
+9\x92\xf6\x99\xa7\x1b\x12\xa5\xf4b\x8am\xee\xc0\xd9P\
+\xb6\xc1XW8\xd5V\xbbH\x93M\xe9\xa5 \xb3c\
+\x9eH$\x12\x89Db\x87\xc0\xf8\x99\x8b\x92\x8ch[\
+\xbc2\x98(\xf4N\xe0EaN\xefp2H\x0a\xf5\
+\x99=2\xb0#\xd46\x80\x03\xb7\x8e\x89\xdb\x0d\xf4\xeb\
+2J.RdT\xfa\x90\xa7\xd7\xb6\xb3u\xf1\x11\xb4\
+\xd8\xfd\x10m\xf7\xb8\x11}\xd1>\xed\xba\x10\x91v\x9c\
+4r\x1b\xdd\xbb\xb6\x03\xae]\x84/\xe3\xf3\xae\x15\xcb\
+\xc8\xfc\xa4]\x09{\xfe\xa6\x99.\xbe\x84\x90\x05v\xf4\
+\xd1\xc5\xa6\xcb\x91zG\x5ch\x1b\xe3\xcd\xe3\x9dJ\xc6\
+$\xbe4\xe1\xe0\x09\x84\x92\xc8\x90\xa1\xecJ\x8dy\x22\
+\x91H$\x12\x89\x9dE\xcekt=\x95\x93\xb5\xd8n\
+\xf0B\x87\x96\xca\xf1\xc4\x92\xbe\xd6\xa7\x15\x81\xfb\x16\x82\
+\x9e\xdd\xc7\xd5k\xae\xea(\xa2O\xa9o\xdf#\x0d\x1d\
+7e\x02\xc5\xc8;\x22y\xad\x05F\xf4\x8f!#O\
+n\xf6\x87\xaa\xb4\xd1\x5c\xbb'v\xaa\xfe\xbc\xfa\xb7T\
+\x82KG\x87\xdb\x80\xec\xa8\x8fME\xd0=\x8d\x9e\x06\
+XG\x94\xba\xdb\xc8(\x89M\x19\xfc\xac\xa1B#\x8d\
+z\x1b?5R\x18e\xcb\x88\x81,\xa7\xbe\xae >\
+-\x19\x16Wq\x09CA\x96\x1a\xf3D\x22\x91H$\
+\x12;\x8b\x99\xf7\xc1J\x89>+\xd6gC\xa2\xa7\xb6\
+\x0e\xd3\x11\xbf_r\x18@)]\xf8\xa0\xe21;!\
+\x1e\xc9\x1eD\xa8:\xb1\xf4\xa7\x00\xdd%\x8f\xfagi\
+\xe9\x94Q\xf0R\xbb\xe9\xe2\xf3Om\x11\x10\x0a\x89A\
+\x0f\xd8\x0d\xb3\xd2\x0f\x96r*\x14\xe8D\xf9\xd2:\xed\
+\xbd\xc8\x08\xd7H\xdcp%\xe2R\xb8\x9e\xb9\xe2\xbdj\
+~@D\xc7\xbf\x86\x14P\x1d\x14\x15Y5l\xaa\xa7\
+\xe7\xd7\xca:\xde\x0bh\x9a\xd4\xc8\x146vI\xc5\xa5\
+\x8bf\xc0P\x22\x91H$\x12\x89\x9d\xc9\xcf\x0b\x15\x8a\
+\xce\x1c\xd2\x1a\xd8\xe2\xba\xdaM\xea\xcc\xb1TA\xb5\x8f\
+\x1d!V\xfb4\xecMl\x9e\xa4X\xc5\xb5\x1e8\xf5\
+G\xdf:\xd1\x88\x0e\x81\x22\x8b\x0a\x84\xde\x15\xf6\xc3\x93\
+\xf6q\x80\x1d\xf8dY\xa7\xe1,'\xed\x90d\xf0\x1a\
+\xaf\xc7\x22\xd1\xa5\xa4\x15%f\x1b\xa79o]g-\
+AZ\x94\xee\xd9I8=\xe3\xd5\x05C\xb8Nl\xc9\
+\xa4\x9d~o9\xca\x1f\x13VkjjK6Ue\
+\x9d\x14\xb2^\xfd\xd9eX\xaei\x9b\xc7\xe9u\x92\x98\
+'\x12\x89D\x22\x91\xd8q\x98\xa4\x1b=\xfd\xd2\xfb\x9a\
+\xb7\xd4K\x13\xb1\xaeI\xa6\xefvR3\x5c\xe3\x9e\xa7\
+\xe8\x9aM\x8d\x14{\x1c\xc2\xe8\xd8h\xe5%\xe3\x9cy\
+\x8e\xca\x8e*i\xf1\xee&pA7\xde\xc6\xd1ux\
+\xa7\xd3\x15X\xdfB\x9dxJ\xd7\xed7\xa3\xa1\xad{\
+?\x92z\xf4,\xd4X\xcct\xa9\x91\xa8\xe9\xda\xae\xe9\
+n\x83\x99\x8e$\xa3>\x03\xd1\x97Gz\x81\xc1VM\
+\x88\xba\x06b\xb4\xe3\xbd<kJ\x98\xf1JK-\x1a\
+\xd8\x8b\xbc\xf0\xfc\x82\xca\x8d\xa7\xdf\x1b\xf5i@{\xa2\
+P\xaeM\x12\xf3D\x22\x91H$\x12;\x0eU\xff\x5c\
+\x9b\xbdtn$5\x19\x92\xc5=\x05\x86hK'\x80\
+m\x7f\xae\xbb\xad\x1cHz7\x97#n\x17\x9cY\xcc\
+kI\xf5\x1b\x89j\xf3\xe6\x982h\x9ds0Wi\
+\x07G\xadF^\x9d9H\x86\xa1X\x02#\xfa\xdc\xeb\
+\x95\x81\xcda=f\xdd\x91\xb7KY\xf4\xe2C\xbb\x14\
+\xd5\xdc\x06\x07\xedq\xf7\x0cB0\xb8\x1etrni\
+2\x99x&h$Z\xbb\x90\x8b\x9d\x0b\x1eoW\xba\
+\xdd\x1c\xa4z\xca`\x90 F\x13\xf5k\x98\xc4<\x91\
+H$\x12\x89\xc4\x0e\x04[\x82%hY\x95\x14bZ\
+\xc9\xad\xd0\x12\xf6\xd6\x9buD\xdb\x07\xceh'\x0f\xeb\
+\xe5\x22\x0bJ\x85\xd1\x97:\xc5\x14G\xfc\xbb-a\x0c\
+H\x92Rl\xc8\xe0\x95\xa5\xc8C\x82\xe3v%\xc9b\
+\xbdf\x00k<\x22\xae\xad\xcf\xf2M\x0e\x18/\xab-\
+`\xe9\xc43\xe8nt\x1a(\x9c\x9d\xa2\xb4\xaey\x97\
+\xcb\x94`\xa6j9\xa8;\xf6e\x08\x93D\xb4\x99\xac\
+'\xc1\xfa\xc4`\xec>3\x15b\xb4\xdf\xd1k.#\
+:?R\xeb\xc3&\xc0\x0e-f\xa4\xb8\xbf\xf4\xfb(\
+\x89y\x22\x91H$\x12\x89\x1d\x0812\x06C\x9d\x94\
+<\x01\xca\x91\xa3\xe9\x91\xd9\x13+c\x87\xb8\xcb\x1b\xe8\
+\xa9x\x1d\xa0\x94\x01Qc\xb79\x0c~#\xc5k\x9b\
+\xc2a\xb7vr\x1d\x19\x0c/6:\xdf\xbb\xb5M\xd7\
+]\x92&\xfdDcW\xea\xc8\xb8n\x18X\xb7Hu\
+zAw@\xd1\x5c\xb8\x91v\xfa\xae6\xa2\xb6~8\
+_J\x1f\x01\xd4$)\x86dK\xaf<\xc4\xfb\xb3W\
+\xb3Ga\x1ct\x1d\x91j\xf4\xd4\xd6&S\x22\xad2\
+\xa5\x95k:\xad\xb5\x95pF[\xdf\xec\xd0\xc5%\xca\
+\xbasMb\x9eH$\x12\x89Db\xe7\xd2s\xf6h\
+\x1aJ\xe4\x86=\x96^\x1c\xfd\xae\x8cr\x9c\x0e\xd9\xbf\
+GG|e\xc1\xd0\xa6\x98\xec\x1fk\x0d#\x8d\x0f\xd3\
+\x87\x8b\x06\xf3n}\x9cR\x82\x8c\xba\x0bJt\xebs\
+\x14\x95\x95D\xd3\xc8>\x02\x85\xd5\x05\x84J+\x0d\xfe\
+\xe9\xa2\x08\xa8hY\x8b\xa5\xb5ve\xf4\x82\xca\xb0\x8e\
+\x11c\x87\x18\x096\xd5Z1\xd0p\xea\x5c\xa5\xc1%\
+S?\xaf\x9fH\xa89\x83\xa0\xfb7\xeb\xe6=\xdcE\
+\xb97v6.\x12\x07J\x93\x98'\x12\x89D\x22\x91\
+\xd8\xc9\xd4<\xd06q\xc46\xe4\xff\x88\x0e\x99\x11\xab\
+\x9fV\xd99\x114\xb1\xf1A\xbb\xae\x9dB\x18\xd9\xa8\
+\x97\x8atgo\x19\x0c\x80\xa2\xd9\x156\xb2\xa8\x9d\x1a\
+E\x06\xdd_\x98\xc1N\x1d\xc8\xe4WG\x0fd\xd6\xaf\
+\xb2>\x81(\x92\x8f\xae\x00)\x83\x9c\x0b\xd2V\xebS\
+\x01\x8a\x0fo*k\xd6\xab\x9aaq`\x9fT\xe8\xaa\
+C\x9c\x17z?~\x96\xf5\x8c\xce:\xf5\xdaFG\x9c\
+>{\x80\xf1v\x84\x92\x14\x8d\x86b\xc5\x87\xa8\xaat\
+TIb\x9eH$\x12\x89Dbg\x83\xdeS:r\
+\xdbB|9\xd4\x17\x9b\x18vX^)\x8c\xa4\xb6v\
+d9\xaa\x06\x0a\x91$hC\x8c\xa4\xdb\xef\x899V\
+Q\xca\x92\x81\xe7y+\x02$\xea&T \x92\x0c\xe5\
+#\xe58\xdcvMW?prl\xaap\x96\xff]\
+\xf7\x9e\xfa)\x80\x19\x5c\xd5\xc2v\xda\xb54\xa6\xe8#\
+\xbf\xf7~\xee\x0c\x84\xd7T9Nt$n-\xfd\x1a\
+\x14\xefy\x1a\xfa\x0c\xd3\xeeF\x94\xfb\x18\x87\xfb\x81\x8d\
+$GJ&u\x0eI\xcc\x13\x89D\x22\x91H\xecX\
+H%uPa1\xa6\xf1\xaa\xe4\x1c\x1c[\x03\x8e\xdc\
+J\x1a\xbd\x14\xe7D\xa2M:d\xc0\xef\xca`#\xe9\
+{\xc7,\x1au\x98\xc0\x1e\x09f0f\x0b\xfb<\xc0\
+\xb4\xc7\xbbz\x9b\xb28\xd6\xd2\x7f\xaf\x91x\x86\xd1\xd1\
+\xbeb\x22\xad\x900u@\x1d\xe2\x1c$\x9dvEN\
+$\xbcR\xddM\x8a\x96'\xea\xd1\xc5\x7f\xa1_[t\
+7\x16\x0e\xcb*.\x1c\xce$$\x04\xb4\xa2]SF\
+\xbf\xf8\xfa\xd4c\xa1\xeb\x0b\x8ad)\xce'\xd4\xab\x9d\
+\xc4<\x91H$\x12\x89\xc4\x8e\x05UTP%\xa1V\
+\xb6L\xd5\xc1F\xe8\x826\xfdv \xa1l\xb2\x05\x0e\
+\x0a\x81\xa6\x87\xf0>\xd9\x0c\xdcX1v(\xc2\xeb\x8d\
+\xcc\x8b4\xc5\xbb\x8d\x08\x95\xb6]\xa2\xe8E\xde\xc6'\
+F\xfa\xc0\xa3\xe9\x14;\xe7\x14\x0cJ\x15V\xf7\x93\x81\
+\xb3\x89\xfd\x92\x8a\xef\x912\xd4\xe9\x5cQ\xa6\x0e\xbc\xbd\
+fv\x9f\x8a\x5c\x0fO\x84\xd1:R\x13\xe5\x01\xa9\xef\
+J\x94.\xe8\x11Wu\xd1\xe4\x8d\xa2=\x05\xa0?N\
+](\x91\xb1FB\xd7\xfe'1O$\x12\x89D\x22\
+\xb1c\xd1\xe4\x0c\x95\xdc\x05\xb9\x84\xa5\xb3\xe28\xb4v\
+\x0d\xd1\xf3\x97Tm\xf8\x18\xe6\xde\x1d@F\x03\xa3f\
+_\x039\xcc\xe0Kj\x1b\x09\xe9\xa2\x9d\xf6y?p\
+6y\x0ceLj{\x03\x9b\xc3\x9e\xb2\x1b\xf54\x0e\
+(\xedY\x82X\xd2nK\x195\xbc\xca\xc6\xa3\xa1\xc5\
+\xd8R;\xd4\x83B\xa0\x1f\x894\xdbA/9\xea\xf6\
+\x89\x12\xd4<\xa3\xa2\x84\xc6\xc1\x86\xb1\xc1\xafcG\x19\
+\x9d\xca{\xfe\xd4(\xf3\xb3XGv\xdd\x8b*\xe6\x92\
+\x98'\x12\x89D\x22\x91\xd8\xe1 \xbb\x93\x87h\x96\x04\
+\x1bc\xd3s%\xc5\x11\xaaj\xe1\x07\x0c\x9a\xb9\x03\x09\
+\x85\xb5F\x0cR\x10\xa0\x07\xef\x8cC5\x83\x0b\x8b\x1e\
+\xd4\x5c\xd4\xa9fK\xc1\xd1\xb6 \xb5\xad\xcf\x81&^\
+\x91\xec\x01q'\xbb\xe3H\xa0\x9f\xc2V\xd2\x98\xa1\xd3\
+ \x0c\xb1mcQQ\x9d\xa1\x1b]u\xdf\x12\xd7S\
+T\xd1\xd1\x9f\x1a\xa8\xd9\x80\xfa=\x09u\x90\xef\x87\x17\
+=\xbc[\x93\x91\xdcG\xa5\x8dj\xb3E\xd6\xebZ}\
+\xd6\xf5\x99\x16\xebHJ\xf1c7\x9as&1O$\
+\x12\x89D\x22\xb1\xb3Q\x07\x08\xdb\x9f\xca\xb7Pw\xc8\
+k\xe7\x96\x9a@\x8b%\x99\xde\xbd\x85\x8a\xe8[\x07o\
+\xa7\x10q\x84O\xaa\xe3\x8bg\xfb\xa5\xdb*\x84\x1d:\
+\x05\xacw\xb6\xb3q\xa4\x1a\x9e\xf4}z\x16F\x1cy\
+\xb9\xb4\xe2b\xb2\x95\x1c\x1c(\xc6\xd2\x0c\x0ej\x89\xf6\
+o\xea\xad\xa2v\x87\xa2}f\xa2t\x88\xee\xe2\xd0\x0c\
+\x8e\xc2\x0e\xe0\xb6s\xe0P\xd2B=X[\x8a\x8f\xda\
+\xd1o+%\xce1\x07\xea~\x11\xb1\xb6\x95z\xe5\xc8\
+\xf6\xc4\x22\xaa\xc9\xeb\xb7\xd5\x96L\x8dy\x22\x91H$\
+\x12\x89D\x1b\xf4\xeb\x0dR\xab\x85\xee\xe4\xcf\xfa\x93\x8b\
+\xd6_H\xcc\x9bl\xcdZF1Hu\xfd\x18J%\
+j\x7f\xdey\x897Onq\xdb\x98\x9dHK\xb4\x11\
+C4C\x90};\x1d\xf1v\xe8\xa6J\xa8\x1e\xddN\
+~!\xae\xabM\xeb\xa2\x0e\x15\x88\xa4\x9d\x1eY\x02\x93\
+\xec#\x011\xc7\x13\xc9\xbe\xea\xb4k\xc3yQ\xf6\x8f\
+\xa1pPk3\xf0y\xef\xd7\xb6\xa7\x81\x06_\xf3R\
+ U\xa9O+\x17\xd41\xb8\xd0U%o\xb2I\xb1\
+\xce\xde\x06\xf6\x09\x80\xa4+K\x22\x91H$\x12\x89D\
+\xa5L:\x5c\x86j\x10\xb3\xdbS\xd3\x12\xc3\xbee#\
+\xb7\x22>\x9e\xa8HdDk\xcb55\xefN$\x02\
+\x1b-_\x18`pa\xe1\x82\xf4L\xe3\xceR\x8e\x9f\
+\x8c\x13\x86\xe2\xddF\xea\x80(i\xc9\xae)K\xd8<\
+\xdd\x03U\x96\xfeD\x80:pG\xed\x88\xae\xf2\xe8C\
+\x9e\x03\x9b\xc7\xa2\xa3\x17#i\xe9\x84\xbf\xd9FJ\xac\
+h\xa2\xfd\xa3\x0bz\x12M\xc7{\xa9\xd3\x82\x988\x0a\
+9b<\x0e\xadU\x1a\x0c\x9dR\xb9\xf9\x18WHU\
+pL\xc3\xaeE\x02U\x8e'\x89y\x22\x91H$\x12\
+\x89\x84&U\xae\x9b\xab\xad\x08=\xe1\xb2\xec~\x1c\xc6\
+\xa3\x824\x113\xe7\x8b\xebK-\x06\xcaf\x8d\x97\x8b\
+\xeds\xeb\xb9B1\xfe,\xa3\xe0\x1f\xb1d\x9aV\x03\
+mD0\xcd\x9b\x5c\xba\xcf\xba\xa1\xae\xea|\xe8\x8a\x92\
+R\x98\xe8\xb5\xa9Z\x0d\xb23Sq[\xf9Q\xd1\xbe\
+\xfe*\xb8il\x17\x83\xa1\x91z#\xe25\xe9\xd4L\
+\xe3\x96\xa5\xe9&\x88J\x15>\x1d;\x89\xa0}\x17\xb6\
+u\x1c\xa8\xe2\xfbs\x88:k\xd06c/Hhu\
+\xf5\xe2WVUWI\xcc\x13\x89D\x22\x91H$\xd0\
+y^\xed|\x8b\xe9M\xd3\x90l\xf8nn\x17\x0d\x0f\
+\x5c>\x04\xc6\xf5[\xb5O\xc5X\xaax\x15\xba\x97_\
+p0\x0b*\x81\xf0\xebmIo\xf7\xcd\xe6\x07\x13\x02\
+19u\xb2\x879E\x8d\xc0.h*\xa3\x0f\x91B\
+\x152b|\xdb%\x94-\xd3\xd0\xadD)\x88tR\
+k:\xef\x9daw\x07\x14\x0c\x0e\x88\xa5\xd0Q\x1a\x9d\
+\xf6\xb3\xa3(W\xbd\xa9\xc4\x9bB\xe7,qp\xe3H\
+\xb3\xc0\xd4U\x1b\x9btG)\x90\xec\x9a\xf5\xc8T\xe4\
+\xf0g\x22\x91H$\x12\x89\x84\xe6t\xca&\xc3F\xb6\
+{\xfb?\x82\xbe\xeb\x5c\xdc6\x16\x9a\x9bT\x02j'\
+ \xa7\xed\xb8\xc0\xa5\x84\x9aL\xeb\xfd\xd5\x80\x1b\x17\x91\
+S\x89\x9e\x10\xe3H\x9dB\xb0\x95$fK\x9d{\xeb\
+\x1fK\xb4\x84!\xa5i\xae\xc5\x17\x11\xa2u\xf9\x8e\xc2\
+R\x0dC\x8a[N\xa9\xe7\x82a\xd0O\x95\x99\xf4\x87\
+\x09\xdd\xcaD\x87\x90\xda66\xb5\x05\x8a\xdbY)\x9e\
+X\xae\xb5K\xf5\x94x\x15\xd0m&%\xbcX\xeb\xa3\
+7I\x0a\xec\xcf)\x89O\xbb\x83\xc4\x0e\xee\x8aJ\x95\
+Mb\x9eH$\x12\x89D\x22\x01E\xfcZ\xe7\x97\xce\
+&P\xf5\xbd\x07\xb2\x94I6-\xadk.N\xfaA\
+\x1f7\xdf\x5c`\xa0\x04\xd3n\x9fU\x8b\x0c;+I\
+8]\xba6&\x11m\xed\x08\x1fe\xda\x85\x1c.\x10\
+\xa7q\xe5\xea|\x22V\xcd.\xad\xb8\xa0s/\x87m\
+\xcb\x9b\xf5\x92\xa2\x8e\x91\xe6\xcc\xe8\xe79[\x8e\x91 \
+\x86\xee\xc8(\xe0\xb3\x0f\xb7B\x94\xe3\x0c\xc4~\x9f\xf1\
+\xea\xd2XE\x0e\xaea=\x1e\xa7\xe4oF\x94\xf4\xc7\
+\xa8\x9fft=~\x98\xe6\xd5\x9e\x91\xc4\xa0:A\x12\
+\xf3D\x22\x91H$\x12\x89\x11=\xaf\x04O\x18-\xf6\
+\xaaa\xdfHbN\xa9\xe6\x84\xc5\x0b[\x13JM\xe8\
+h\xadMzr\xa5\x8c\x8e\xc4\xf8\xa27:\xae;\xef\
+\x03it%\xc4~rQ\x0aQ\x8c\xb5\x87{}\x8a\
+\xf2F\xef\xa5\x85h-\xb9\xf3\x19\x1f\x91\xdd\xe9x\xf4\
+0\xad\x97\x8e\x88\xc9@\x82\xe3\xf8!\x18HT!\xd2\
+\xb4\xe6v\xe3\xea\x86#B_\x97t\xd9\x91\x9f\x09\xa8\
+\x85\x8a\x0c3R\xbb\xa4f\xe0\x01Y\x0b\x0fY<\x80\
+\x00\xdd\xc1\x17\xbd\xc6\xca\xf0'\x89y\x22\x91H$\x12\
+\x89\x04\x06,[\xf7\x85E\x11T\x8a%\xd6FA^\
+m\x0aGI\x99]\x0ea:\xb2T\xac{\xa4\x99V\
+[C\x1fU\x0b\xb2\x19\xb8\x01z\x0d<}j\xa94\
+\xffnji\xb4:\x1eQZlk.hU)\xa6\
+di^\xe1N\x0d/\xd5\x07\xde\x12w\xa1O\x5c\xa5\
+\xd9\xac\x9d\xafXYx\x1d\xe4\x04i\xa4.\xfa09\
+,\x11,\xe9\x1fJg\xd0e=\x08\xbb\xad\xa1A2\
+( \xd4\xf5\x1b\x15s\xa2\xf7/a[I\x1f\xf3D\
+\x22\x91H$\x12\x89\x08VfZ\xba\xce\x91\xf7Ff\
+\xda\xdcR\xaa\xde\x98#\xc52\x87F\x22\x95\xd0Y\xed\
+1\x1a\x09\x1ey\xa4;\x8e\x8b!\xc3l\xc5\x82\x96q\
+\x14{@C\x90\xf5y\x97s\x18u\xbeK\x5ce\xd3\
+\xa0\x8f\x12{\x94\xa5\xa1>\x98\xba\xa6F\xb1\x22\xa2\xea\
+ \x17\xa6$~y\xdc\x1eE\x9a\xccgx\xfe\xaa\x88\
+\x08\x8b\xa6\x07N\xc5i\xe9\x01\xd51\x97\xc1\x92K\xd4\
+\xb5\xebz\xc8\xd8@\xda[\xc0\xce \xc4\x1fHb\x9e\
+H$\x12\x89D\x221\xe2X*|\x92\xa1#\xab\xbb\
+\xa2t\xc4\x0c\xae\x85\xadv$\xa2t\xdcv\x9f1~\
+H\xf3F\xdbkn\x14\xbe\xda\xf81\x86\xfc\xb4\x9fo\
+\x16\x81>\x9dR\xe0\xfc\xfa\x5c\xb0g}2\x10\xbci\
+\xa0_rA\x8d1 \xccz!\xa3\x01\xce{\x93\x00\
+\x00\x04rIDAT\x93\x8a\xe8\x8e\xf9H\x1fN{\
+\xac\x93\xf9J\xcfa\xf5\xe7\xad\x0d\x11-\x91\x96\xe8\xf9\
+\xaeV\xa0\x0f\x95\xea\xb1M{\xa9kG\xdd\xce\xc8\x96\
+\x9f\xa7\x0c\x12]\xa5\xf9\xe4\xf7D\xd7\x88$\xe6\x89D\
+\x22\x91H$\x12\x03\x82\x09\xe9\xe13\x81\xb6\xd6N\xba\
+\xc4\xd0\xc9\xa9\x99\xce\xe2\xf0\x12\x87\x08}\xc0\x8f%|\
+\x88\x8e'\x85\xd0\xda\x90\x9aNHA\xb6b d\xe4\
+\xb0\x93Z\xeb\xb4R\xed\x14\x8bGw\x14\xd2+2\xcf\
+\x81\x05\xe4h\xc1\xd0\x1cV8\xb2Gd\xef\xdcGG\
+\xef~\x8e\xe2\xab\x14\xd6\x0e\xbc\x0d#j]\xf3\xd6\x8d\
+\x8f\x87\xd3\xa5C\x882!\x97Tj\xe6W\xab\xb3\xe5\
+\xc0;\xb2\xcaN8\x94\xd4\x8b\x91\xbc\x1bZ/J\xd2\
+2\x1a\x1eN\x8dy\x22\x91H$\x12\x89\xc4\x18T\xfd\
+Vz:J\x84\xf1@\xeb\x1ebz\xb5\x86\x80j2\
+\xb7P\xd5`\xe6\x0c\x15\xfboBe\xd5\xe5\x96\x1e\x8e\
+\xd3\x06:u\xb8Q\x91\x9e\x8c\x9a\xb458G\x13Y\
+*\xa2HW&\x98\xc0K\xf4aT\xef4\x22\x22C\
+\xc9\x0e\xabG|\x8bJE;\x87&\xb7\xa9\xf3\xaa\xae\
+\xe2\x99\x14=\xde)G\xbd\xaa\xb7u\x09\xb6\x94v\xa9\
+\xb9\xa0\xb6P\xa7\x11\xc2\x96\xbc\xbf\xbc\x10\xe1\x5ckg\
+\xbf\x16mf\xd8\xb5\xcd*\xc8\xa8\x84Hb\x9eH$\
+\x12\x89D\x221\x82\x1f\x84\x94\xa0\x7f.\xdd\xea\xfa\x03\
+\x8e\x80\xb7\xce\xb9\xa3\xb6\xd2\x98m\x88\xf9\xe92\x8a\xa0\
+\xf8\x88=fM-\xa9|\xb6{\xba\xa7\xa5\xd3\xa2\x12\
+D\xfd\x1e\xbb\x9b\x1f\xad\x89\x9f(\x22,\xfa\xf5t\xf1\
+2\xe8\xa8\x97\xc1L\xdf\xfc\x16\xefLC\xc7\x94\xabw\
+\x22|!!\xbd\x93>H9\xe2(%T\xfa7\xa4\
+\xa5\x89\xd2J\x84D9\xce\x0c]Z8\x0e1*:\
+}\xd8\xccV{!\x07V3\xf5\x9e\x10S\xc4\xf4\xcd\
+\x92\x98'\x12\x89D\x22\x91H\xbc-;\xafT\x9b\xca\
+\xff\xba[\xfd\xf9\xf0\x1cj^\xa6E\x12\xf5\xfbu@\
+\x14\xd1\xce\xafJ_(.\x9c\xc7LBj\x97t\xc3\
+!\xfb\xbf\x0c\xab\xa5\x22\xd3\x12NM(M\xe6b=\
+\xcd\xd5\xd7\xaaG\xbb:\x9a\xd6\xa5\xafV\x81\xba\x93,\
+\x12\x8b\x06U\xe8T?t#\xc1wz\xf7\xd1\x00e\
+_\xe6ES\xaf\x0c2\x16\x13\xf6\xc3 \xfe\x86\x1bG\
+\x8d>-2\x9e\xf3d\xb5>\xa4\x18\xf9M\x9d\x09\x08\
+\x85\xc5\xc0br\x92\xfd\xa4\x8fy\x22\x91H$\x12\x89\
+\xc4;\x00\x0do\x14\xda,\xd0\x1e\xcaci\x9ef\xdb\
+~F\xd4X]\xeb\xb0\x1cC\x89\xb5\x87\xb8su\x91\
+\xe98\x08\xc7\xbd\xa5\x96\x01\xbe\xdd\xde\x89\xfa@\x05\xa2\
+\x5cDl\xc2hW\x9bT'\x11\xdd\xfde\xd3\xb4w\
+\xfd;c\xe4|{m\xbe#\xb2\xdb9tOJ\x12\
+U\xd04K\xc5p\x22\xe6\xd1\x86uei\xff\x0f\x12\
+A\xf50'i\x02\x97\xd4\x02\x8d){\xa9\x86\xda,\
+\x81\x1f\x1ch_(\xd6\x9b\xed\x94j\xa2\x12\xe0+\x93\
+$\xe6\x89D\x22\x91H$\x12\x0b!]\xbf\x5c\xc2g\
+4\xabl\xee\x1d\xac$r\xec*\x22CoE\xed\xaa\
+\xe2\x89\x1fm\xc7]\x11\xf7\xde\xa9\xf71\x99\x95$K\
+\xefu\xb7\xd7\xd1\xde\xeb\xf6\xb5Z\xde\x0e]/Zu\
+\x9b\xa3\x9c\xa3\xcax\xca+Q\x0fu\xea\xe1Y\xb6\x0e\
+r\xe3\xc4\xba\x92\xc0H\x83\xa2+\x88\xdey\x16#\x9f\
+\x89\xeb\x1b\x87l\xedi\x08\x15\x09n\xd3\x9dj\x0b\x91\
+\x91\x0bf\xd7\xfcG#\x99\xb26\xf5\xfca$6\xd2\
+cV]\xc8\x91\xf4\xa2\xc6\xed1\x89y\x22\x91H$\
+\x12\x89\xc4\x8f\xa2\xe7:QsDo\xc5yfk\x02\
+*1\x05\xd4t\xe1u\x17\xbam\xec\xf4\xc7\xf4t\x90\
+1Y\xb4\x10p\xaa\x9f\x0aC\xa6\xd5eE\xb4\xd6\x5c\
+Z\x87\x99\x954\x06\x1e\xee\x9cO\xea\x00*\xd1\x9dk\
+\x5c\xc7\x98n\xa4\x94\xe6\xef\x82\xce\x93\x89\xa1z~4\
+\xacZ\x87GA\xcb\xed\x03\xc5\xf5]\xee\xd2\xf5\x8f\x96\
+5v;\xc10\xd5u*B8p\xcc\x81\xf3c\xa4\
+\xdd{9V\x0e\x9e\xa4\xf4\xfa\xa4\x17{I\xcc\x13\x89\
+D\x22\x91H$\xfe\xafD}D\x04]\x8bVZh\
+\x10\xdb\x0ce \xca\xce\xf5\xa3\x935?h\xd9G8\
+\xdb\xf0#\xc5\x0c\xa8\x1a\xd7\x11\x918AZ\x131\x8b\
+CK\xed\xa8k\x8b\xc2\xaaUg0\x22\xafr\x0d\x09\
+C\xb1\xf5\xf8(\x1c\x98\x9b\x8b\x92\xa0hs\xc2\xc5\x0b\
+*\xbd\x9e\x89\x01FJ\x87\xdeN\x91#O\x19\xb8\x02\
+C\x857\xa9\xa5\x194\xad\x95\x1bL\xf4_\xa4z\x0a\
+a\xe7rG>\xf1\xe8\xf3\x00\xc5\xd2R\x18g\x0a\x9a\
+\x14\x08\xc0\xff\x02\xefL\xa5t\xec\xd3Mi\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00x\xc3\
+\x00r\
+\x00e\x00s\
+\x00\x08\
+\x0b\xb2XG\
+\x00r\
+\x00e\x00d\x00o\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x05\xa2\x93'\
+\x00b\
+\x00o\x00o\x00k\x00m\x00a\x00r\x00k\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x06\x98O\xa7\
+\x00r\
+\x00e\x00p\x00o\x00r\x00t\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x08\xc8Xg\
+\x00s\
+\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0e\x18q'\
+\x00d\
+\x00o\x00w\x00n\x00-\x00g\x00r\x00e\x00y\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0b\xdf!G\
+\x00s\
+\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x08\xdf\xd3\x87\
+\x00f\
+\x00i\x00l\x00e\x00_\x00s\x00e\x00n\x00d\x00-\x001\x002\x008\x00.\x00p\x00n\x00g\
+\
+\x00\x0e\
+\x07v\xae\xa7\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00g\x00r\x00e\x00y\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x09\xc7\xa6\xc7\
+\x00r\
+\x00e\x00s\x00e\x00t\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0b\xcc`g\
+\x00S\
+\x00e\x00n\x00d\x00T\x00o\x005\x001\x002\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x04\xb2X\xc7\
+\x00u\
+\x00n\x00d\x00o\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x0b\xfb\x8eg\
+\x00h\
+\x00o\x00u\x00s\x00e\x00_\x002\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x06|Z\x07\
+\x00c\
+\x00o\x00p\x00y\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x08/B\x9f\
+\x00b\
+\x00a\x00l\x00l\x00.\x00i\x00c\x00o\
+\x00\x0f\
+\x03\xa8&g\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00r\x00o\x00u\x00n\x00d\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0f\xe9\xd9'\
+\x00l\
+\x00e\x00f\x00t\x00-\x00r\x00o\x00u\x00n\x00d\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0a\xa8\xbaG\
+\x00p\
+\x00a\x00s\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x07\x8f\xd3\xe7\
+\x00S\
+\x00V\x00w\x00e\x00l\x00c\x00o\x00m\x00e\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x12\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x01\x0ef\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x010\x00\x00\x00\x00\x00\x01\x00\x00\x9a\xbc\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x06\xe2\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01b\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xf2\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x0f3\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00K\xc8\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01\xec\x00\x00\x00\x00\x00\x01\x00\x01#\x06\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01x\x00\x00\x00\x00\x00\x01\x00\x00\xa8\x91\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00Z\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xdb\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00D\x22\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00j\x04\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01\xd4\x00\x00\x00\x00\x00\x01\x00\x01\x1e|\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x00t\xa6\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00B-\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01F\x00\x00\x00\x00\x00\x01\x00\x00j\x04\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00#\x19\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+\x00\x00\x01\xb2\x00\x00\x00\x00\x00\x01\x00\x01\x16l\
+\x00\x00\x01\x9f\x94\x9a\x1d\xe0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -6,12 +6,14 @@ import logging
 import numbers
 import os
 import re
+import struct
 import sys
 import types
 import urllib.parse
 import warnings
 import webbrowser
-from io import BytesIO
+import zipfile
+from io import BytesIO, TextIOWrapper
 
 import numpy
 import numpy as np
@@ -37,7 +39,7 @@ from sas.qtgui.MainWindow.DataState import DataState
 from sas.qtgui.Plotting import DataTransform
 from sas.qtgui.Plotting.ConvertUnits import convertUnit
 from sas.qtgui.Plotting.Plottables import Chisq, Plottable, PlottableFit1D, PlottableTheory1D, Text, View
-from sas.qtgui.Plotting.PlotterData import Data1D, Data2D, DataRole
+from sas.qtgui.Plotting.PlotterData import Data1D, Data2D, DataRole, savedState
 from sas.qtgui.Utilities.BackgroundColor import BG_DEFAULT, BG_WARNING
 from sas.sascalc.fit.AbstractFitEngine import FitData1D, FitData2D, FResult
 from sas.system import HELP_SYSTEM
@@ -53,6 +55,11 @@ warnings.simplefilter("ignore")
 # case of a product model; the identifier for this is held in square brackets, as in the example above.
 theory_plot_ID_pattern = re.compile(r"^([0-9]+)\s+(\[(.*)\]\s+)?(.*)$")
 
+# Name of the JSON member of project archives. The arrays referred to by the
+# JSON are stored next to it as .npy members.
+PROJECT_ARCHIVE_DATA = 'project.json'
+PROJECT_ARCHIVE_EXTENSION = '.zip'
+
 logger = logging.getLogger(__name__)
 
 
@@ -1108,9 +1115,13 @@ def checkModel(path):
 
     return result
 
-def saveData(fp, data):
+def saveData(fp, data, arrays=None):
     """
     save content of data to fp (a .write()-supporting file-like object)
+
+    If *arrays* is a list, numeric ndarrays are appended to it rather than
+    written out as lists, and the JSON refers to them by member name
+    in the project archive, see :func:`saveProjectArchive`.
     """
 
     def add_type(dict, type):
@@ -1134,7 +1145,7 @@ def saveData(fp, data):
             return add_type(o.__dict__, type(o))
 
         if isinstance(o, (Plottable, View)):
-            return add_type(o.__dict__, type(o))
+            return add_type(savedState(o), type(o))
 
         # SasviewModel - unique
         if isinstance(o, SasviewModel):
@@ -1150,7 +1161,11 @@ def saveData(fp, data):
 
         # ndarray
         if isinstance(o, np.ndarray):
-            content = {'data':o.tolist()}
+            if arrays is not None and not o.dtype.hasobject:
+                content = {'member': 'arrays/%d.npy' % len(arrays)}
+                arrays.append(o)
+            else:
+                content = {'data':o.tolist()}
             return add_type(content, type(o))
 
         if isinstance(o, types.FunctionType):
@@ -1173,10 +1188,13 @@ def saveData(fp, data):
 
     json.dump(data, fp, indent=2, sort_keys=True, default=jdefault)
 
-def readDataFromFile(fp):
+def readDataFromFile(fp, read_array=None):
     '''
     Reads in Data1D/Data2 datasets from the file.
     Datasets are stored in the JSON format.
+
+    *read_array* returns the array stored under a member name
+    of a project archive, see :func:`readProjectArchive`.
     '''
     supported = [
         tuple, set, types.FunctionType,
@@ -1230,6 +1248,9 @@ def readDataFromFile(fp):
 
         # ndarray
         if cls == np.ndarray:
+            if 'member' in data:
+                # project archive - binary ndarray in its own member
+                return read_array(data['member'])
             o = data['data']
             if isinstance(o, list):
                 # new format - ndarray as ascii list
@@ -1280,6 +1301,108 @@ def readDataFromFile(fp):
 
     return new_stored_data
 
+def saveProjectArchive(filename, data):
+    """
+    Save *data* to a project archive: a zip file holding the JSON of
+    :func:`saveData` and the numeric arrays as uncompressed .npy members,
+    so arrays are written and read as raw binary.
+    """
+    # Written next to the target and moved over it, so that arrays mapped
+    # from an archive being saved over keep reading the old file
+    partial_filename = filename + '.part'
+    arrays = []
+    try:
+        with zipfile.ZipFile(partial_filename, 'w', compression=zipfile.ZIP_STORED) as archive:
+            with archive.open(PROJECT_ARCHIVE_DATA, 'w') as member:
+                with TextIOWrapper(member, encoding='utf-8') as fp:
+                    saveData(fp, data, arrays)
+            for index, array in enumerate(arrays):
+                with archive.open('arrays/%d.npy' % index, 'w', force_zip64=True) as member:
+                    np.lib.format.write_array(member, array, allow_pickle=False)
+        os.replace(partial_filename, filename)
+    except BaseException:
+        if os.path.exists(partial_filename):
+            os.remove(partial_filename)
+        raise
+
+def _mapArchiveMember(filename, info):
+    """
+    Memory map the array in the uncompressed .npy member *info* of the
+    zip file *filename*, or return None if it cannot be mapped.
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    with open(filename, 'rb') as fp:
+        # The member data follows its local header, whose name and extra
+        # field lengths can differ from those in the central directory
+        fp.seek(info.header_offset)
+        header = fp.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack('<2H', header[26:30])
+        fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        version = np.lib.format.read_magic(fp)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+        offset = fp.tell()
+    if dtype.hasobject or 0 in shape:
+        return None
+    array = np.memmap(filename, dtype=dtype, mode='c', offset=offset, shape=shape,
+                      order='F' if fortran_order else 'C')
+    # A plain array viewing the mapping, so results of arithmetic on it are
+    # not memmaps pointing at the file
+    return np.asarray(array)
+
+def readProjectArchive(filename):
+    """
+    Read a project archive written by :func:`saveProjectArchive`.
+    The arrays are memory mapped copy-on-write from their uncompressed
+    members, so their pages are only read from the file when used. Where
+    a mapped file cannot be replaced (Windows) or a member is compressed,
+    each array is read from its member when the JSON referring to it is
+    converted.
+    """
+    with zipfile.ZipFile(filename) as archive:
+        def read_array(name):
+            if os.name != 'nt':
+                array = _mapArchiveMember(filename, archive.getinfo(name))
+                if array is not None:
+                    return array
+            with archive.open(name) as member:
+                return np.lib.format.read_array(member, allow_pickle=False)
+
+        with archive.open(PROJECT_ARCHIVE_DATA) as member:
+            return readDataFromFile(TextIOWrapper(member, encoding='utf-8'), read_array)
+
+def isProjectArchive(filename):
+    """
+    Check if *filename* is a project archive rather than a JSON project file.
+    """
+    if not zipfile.is_zipfile(filename):
+        return False
+    with zipfile.ZipFile(filename) as archive:
+        return PROJECT_ARCHIVE_DATA in archive.namelist()
+
+def saveProjectFile(filename, data):
+    """
+    Save *data* to *filename*, as a project archive if the file has the
+    archive extension and as JSON otherwise.
+    """
+    if os.path.splitext(filename)[1].lower() == PROJECT_ARCHIVE_EXTENSION:
+        saveProjectArchive(filename, data)
+    else:
+        with open(filename, 'w') as outfile:
+            saveData(outfile, data)
+
+def readProjectFile(filename):
+    """
+    Read a project or analysis file saved by :func:`saveProjectFile`.
+    """
+    if isProjectArchive(filename):
+        return readProjectArchive(filename)
+    with open(filename) as infile:
+        return readDataFromFile(infile)
+
 def getConstraints(fit_project):
     """
     Extracts constraints from *fir_project* dict and returns a dict where keys
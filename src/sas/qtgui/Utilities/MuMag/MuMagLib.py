@@ -1,10 +1,10 @@
+import itertools
 import logging
 import os
 import os.path
 from datetime import datetime
 
 import numpy as np
-import scipy.optimize
 from PySide6.QtWidgets import QFileDialog
 
 from sasdata.dataloader.loader import Loader
@@ -29,6 +29,9 @@ class MuMagLib:
 
     mu_0 = 4 * np.pi * 1e-7
 
+    # Number of exchange stiffness values fitted together in a sweep
+    sweep_block_size = 256
+
     @staticmethod
     def directory_popup():
         directory = QFileDialog.getExistingDirectory()
@@ -141,17 +144,18 @@ class MuMagLib:
             parameters.exchange_A_n) * 1e-12  # From pJ/m to J/m
 
         if parameters.experiment_geometry == ExperimentGeometry.PERPENDICULAR:
-            least_squared_fits = [MuMagLib.least_squares_perpendicular(data, a) for a in a_values]
+            least_squares_function = MuMagLib.least_squares_perpendicular
 
         elif parameters.experiment_geometry == ExperimentGeometry.PARALLEL:
-            least_squared_fits = [MuMagLib.least_squares_parallel(data, a) for a in a_values]
+            least_squares_function = MuMagLib.least_squares_parallel
 
         else:
             raise ValueError(f"Unknown ExperimentGeometry value: {parameters.experiment_geometry}")
 
-        optimal_fit = min(least_squared_fits, key=lambda x: x.exchange_A_chi_sq)
+        chi_sq = MuMagLib.exchange_A_chi_sq(data, a_values, parameters.experiment_geometry)
 
-        chi_sq = np.array([fit.exchange_A_chi_sq for fit in least_squared_fits])
+        # Only the best fit is needed in full
+        optimal_fit = least_squares_function(data, a_values[np.argmin(chi_sq)])
 
         return SweepOutput(
             exchange_A_checked=a_values,
@@ -159,22 +163,32 @@ class MuMagLib:
             optimal=optimal_fit)
 
     @staticmethod
-    def least_squares_perpendicular(data: list[ExperimentalData], A) -> LeastSquaresOutputPerpendicular:
-        """ Least squares fitting for a given exchange stiffness, A, perpendicular case
+    def exchange_A_chi_sq(data: list[ExperimentalData], exchange_A: np.ndarray, geometry: ExperimentGeometry):
+        """ Chi squared of the least squares fits for each of the given exchange stiffnesses
 
-            We are fitting the equation:
+        The fits for all values of A and q are solved together, in blocks of
+        sweep_block_size values of A to bound the memory used.
 
-              I_sim = I_res + response_H * S_H + response_M * S_M
-                    = (I_res, S_H, S_M) . (1, response_H, response_M)
-                    = (I_res, S_H, S_M) . least_squares_x
+        :return: array of chi squared values, one for each value of A
+        """
 
-            finding I_res, S_H, and S_M for each q value
+        exchange_A = np.atleast_1d(np.asarray(exchange_A, dtype=float))
+        chi_sq = np.empty(len(exchange_A))
+        for start in range(0, len(exchange_A), MuMagLib.sweep_block_size):
+            block = slice(start, start + MuMagLib.sweep_block_size)
+            *_, s_q = MuMagLib._least_squares(data, exchange_A[block], geometry)
+            chi_sq[block] = np.mean(s_q, axis=1)
 
+        return chi_sq
 
-        """
+    @staticmethod
+    def _response_functions(data: list[ExperimentalData], exchange_A: np.ndarray, geometry: ExperimentGeometry):
+        """ Basis functions of the micromagnetic model for each exchange stiffness
 
-        # Get matrices from the input data
-        n_data = len(data)
+        :return: q, I and I_stdev with shape (n_data, n_q), and the basis functions
+            (1, response_H) for the parallel case or (1, response_H, response_M) for the
+            perpendicular case, with shape (n_A, n_data, n_q, n_basis)
+        """
 
         #  Factor of (1e-3 / mu_0) converts from mT to A/m
         applied_field = np.array([datum.applied_field for datum in data]) * (1e-3 / MuMagLib.mu_0)
@@ -195,9 +209,8 @@ class MuMagLib:
         I = np.array([datum.scattering_curve.y for datum in data])
         I_stdev = np.array([datum.scattering_curve.dy for datum in data])
 
-        n_q = q.shape[1]
-
-        # Micromagnetic Model
+        # Micromagnetic Model, with A along the first axis
+        A = np.asarray(exchange_A, dtype=float).reshape(-1, 1, 1)
         internal_field = (applied_field - demagnetising_field).reshape(-1, 1)
         magnetic_scattering_length = np.sqrt(
             (2 * A) / (MuMagLib.mu_0 * saturation_magnetisation.reshape(-1, 1) * internal_field))
@@ -205,60 +218,123 @@ class MuMagLib:
 
         # Calculate the response functions
         p = saturation_magnetisation.reshape(-1, 1) / effective_field
-        response_H = (p ** 2) / 4 * (2 + 1 / np.sqrt(1 + p))
-        response_M = (np.sqrt(1 + p) - 1) / 2
 
-        # print("Input", q.shape, q[0,10])
-        # sys.exit()
+        match geometry:
+            case ExperimentGeometry.PARALLEL:
+                response_H = (p ** 2) / 2
+                basis = (np.ones_like(p), response_H)
+            case ExperimentGeometry.PERPENDICULAR:
+                response_H = (p ** 2) / 4 * (2 + 1 / np.sqrt(1 + p))
+                response_M = (np.sqrt(1 + p) - 1) / 2
+                basis = (np.ones_like(p), response_H, response_M)
+            case _:
+                raise ValueError(f"Unknown experimental geometry: {geometry}")
+
+        return q, I, I_stdev, np.stack(basis, axis=-1)
+
+    @staticmethod
+    def _least_squares(data: list[ExperimentalData], exchange_A: np.ndarray, geometry: ExperimentGeometry):
+        """ Least squares fits of the basis functions to the data for each exchange stiffness and q
+
+        :return: q with shape (n_data, n_q), simulated intensities with shape (n_A, n_data, n_q),
+            fitted coefficients with shape (n_A, n_q, n_basis), the normal matrices of the fits
+            with shape (n_A, n_q, n_basis, n_basis) and the mean squared weighted residuals
+            with shape (n_A, n_q)
+        """
+
+        q, I, I_stdev, basis = MuMagLib._response_functions(data, exchange_A, geometry)
 
-        # Lists for output of calculation
-        I_residual = []
-        S_H = []
-        S_M = []
+        # Weighted least squares for each A and q, with shape (n_A, n_q, n_data, n_basis)
+        least_squares_x = np.swapaxes(basis / I_stdev[..., np.newaxis], 1, 2)
+        least_squares_y = (I / I_stdev).T
 
-        I_residual_error_weight = []
-        S_M_error_weight = []
-        S_H_error_weight = []
+        least_squares_x_squared = np.swapaxes(least_squares_x, -1, -2) @ least_squares_x
+        least_squares_xy = (np.swapaxes(least_squares_x, -1, -2) @ least_squares_y[..., np.newaxis])[..., 0]
 
-        for nu in range(n_q):
+        finite = (np.all(np.isfinite(least_squares_x_squared), axis=(1, 2, 3))
+                  & np.all(np.isfinite(least_squares_xy), axis=(1, 2)))
+        if not np.all(finite):
+            A = np.atleast_1d(exchange_A)[np.argmin(finite)]
+            raise FitFailure(f"A = {A} (least squares matrix is not finite)")
 
-            # non-negative linear least squares
-            least_squares_x = (np.array([np.ones((n_data,)), response_H[:, nu], response_M[:, nu]]) / I_stdev[:, nu]).T
-            least_squares_y = I[:, nu] / I_stdev[:, nu]
+        try:
+            coefficients = MuMagLib._nnls(least_squares_x_squared, least_squares_xy)
+
+        except np.linalg.LinAlgError as lae:
+            raise FitFailure(f"A = {exchange_A} ({repr(lae)})")
+
+        I_sim = np.einsum("adqi,aqi->adq", basis, coefficients)
+
+        s_q = np.mean(((I - I_sim) / I_stdev) ** 2, axis=1)
+
+        return q, I_sim, coefficients, least_squares_x_squared, s_q
+
+    @staticmethod
+    def _nnls(matrix: np.ndarray, vector: np.ndarray):
+        """ Non-negative least squares for stacks of small square systems
+
+        Minimises |matrix . x - vector| with x >= 0, as scipy.optimize.nnls does for
+        a single system. Where the solution of matrix . x = vector is negative, the
+        constrained solution is the least squares solution restricted to a subset
+        of the components of x; the normal equations of every subset are solved
+        and the non-negative solution with the smallest residual kept.
+
+        :param matrix: array with shape (..., n, n)
+        :param vector: array with shape (..., n)
+        :return: solutions with shape (..., n)
+        """
+
+        n = matrix.shape[-1]
+        solution = np.linalg.solve(matrix, vector[..., np.newaxis])[..., 0]
+
+        constrained = np.any(solution < 0, axis=-1)
+        if not np.any(constrained):
+            return solution
+
+        matrix, vector = matrix[constrained], vector[constrained]
+        best = np.zeros(vector.shape)
+        residual = np.sum(vector ** 2, axis=-1)
+
+        for size in range(1, n):
+            for subset in itertools.combinations(range(n), size):
+                columns = matrix[..., list(subset)]
+                columns_t = np.swapaxes(columns, -1, -2)
+                x = np.linalg.solve(columns_t @ columns, columns_t @ vector[..., np.newaxis])[..., 0]
 
-            least_squares_x_squared = np.dot(least_squares_x.T, least_squares_x)
+                candidate = np.zeros(vector.shape)
+                candidate[..., list(subset)] = x
+                candidate_residual = np.sum(((matrix @ candidate[..., np.newaxis])[..., 0] - vector) ** 2, axis=-1)
 
-            # Non-negative least squares
-            try:
-                fit_result = scipy.optimize.nnls(
-                    least_squares_x_squared,
-                    np.matmul(least_squares_x.T, least_squares_y))
+                better = np.all(x >= 0, axis=-1) & (candidate_residual < residual)
+                best[better] = candidate[better]
+                residual[better] = candidate_residual[better]
 
-            except ValueError as ve:
-                raise FitFailure(f"A = {A} ({repr(ve)})")
+        solution[constrained] = best
+        return solution
 
-            I_residual.append(fit_result[0][0])
-            S_H.append(fit_result[0][1])
-            S_M.append(fit_result[0][2])
+    @staticmethod
+    def least_squares_perpendicular(data: list[ExperimentalData], A) -> LeastSquaresOutputPerpendicular:
+        """ Least squares fitting for a given exchange stiffness, A, perpendicular case
+
+            We are fitting the equation:
+
+              I_sim = I_res + response_H * S_H + response_M * S_M
+                    = (I_res, S_H, S_M) . (1, response_H, response_M)
+                    = (I_res, S_H, S_M) . least_squares_x
 
-            errors = np.linalg.inv(np.dot(least_squares_x_squared.T, least_squares_x_squared))
+            finding I_res, S_H, and S_M for each q value
 
-            I_residual_error_weight.append(errors[0, 0])
-            S_H_error_weight.append(errors[1, 1])
-            S_M_error_weight.append(errors[2, 2])
 
-        # Arrayise
-        S_H = np.array(S_H)
-        S_M = np.array(S_M)
-        I_residual = np.array(I_residual)
+        """
 
-        I_sim = I_residual + response_H * S_H + response_M * S_M
+        q, I_sim, coefficients, least_squares_x_squared, s_q = MuMagLib._least_squares(
+            data, A, ExperimentGeometry.PERPENDICULAR)
 
-        s_q = np.mean(((I - I_sim) / I_stdev) ** 2, axis=0)
+        I_residual, S_H, S_M = coefficients[0].T
 
-        sigma_I_res = np.sqrt(np.abs(np.array(I_residual_error_weight) * s_q))
-        sigma_S_H = np.sqrt(np.abs(np.array(S_H_error_weight) * s_q))
-        sigma_S_M = np.sqrt(np.abs(np.array(S_M_error_weight) * s_q))
+        errors = np.linalg.inv(np.einsum("qji,qjk->qik", least_squares_x_squared[0], least_squares_x_squared[0]))
+        error_weights = np.diagonal(errors, axis1=1, axis2=2)
+        sigma_I_res, sigma_S_H, sigma_S_M = np.sqrt(np.abs(error_weights * s_q[0, :, np.newaxis])).T
 
         chi_sq = float(np.mean(s_q))
 
@@ -269,7 +345,7 @@ class MuMagLib:
             exchange_A_chi_sq=chi_sq,
             q=output_q_values,
             I_residual=I_residual,
-            I_simulated=I_sim,
+            I_simulated=I_sim[0],
             S_H=S_H,
             S_M=S_M,
             I_residual_stdev=sigma_I_res,
@@ -293,82 +369,14 @@ class MuMagLib:
 
             """
 
-        # Get matrices from the input data
-        n_data = len(data)
+        q, I_sim, coefficients, least_squares_x_squared, s_q = MuMagLib._least_squares(
+            data, A, ExperimentGeometry.PARALLEL)
 
-        #  Factor of (1e-3 / mu_0) converts from mT to A/m
-        applied_field = np.array([datum.applied_field for datum in data]) * (1e-3 / MuMagLib.mu_0)
-        demagnetising_field = np.array([datum.demagnetising_field for datum in data]) * (1e-3 / MuMagLib.mu_0)
-        saturation_magnetisation = np.array([datum.saturation_magnetisation for datum in data]) * (1e-3 / MuMagLib.mu_0)
-
-        # TODO: The following is how things should be done in the future, rather than hard-coding
-        #  a scaling factor...
-        # def data_nanometers(data: Data1D):
-        #     raw_data = data.x
-        #     units = data.x_unit
-        #     converter = Converter(units)
-        #     return converter.scale("1/m", raw_data)
-        #
-        # q = np.array([data_nanometers(datum.scattering_curve) for datum in data])
-
-        q = np.array([datum.scattering_curve.x for datum in data]) * 1e9
-        I = np.array([datum.scattering_curve.y for datum in data])
-        I_stdev = np.array([datum.scattering_curve.dy for datum in data])
-
-        n_q = q.shape[1]
+        I_residual, S_H = coefficients[0].T
 
-        # Micromagnetic Model
-        internal_field = (applied_field - demagnetising_field).reshape(-1, 1)
-        magnetic_scattering_length = np.sqrt(
-            (2 * A) / (MuMagLib.mu_0 * saturation_magnetisation.reshape(-1, 1) * internal_field))
-        effective_field = internal_field * (1 + (magnetic_scattering_length ** 2) * (q ** 2))
-
-        # Calculate the response functions
-        p = saturation_magnetisation.reshape(-1, 1) / effective_field
-        response_H = (p ** 2) / 2
-
-        # Lists for output of calculation
-        I_residual = []
-        S_H = []
-
-        I_residual_error_weight = []
-        S_H_error_weight = []
-
-        for nu in range(n_q):
-
-            # non-negative linear least squares
-            least_squares_x = (np.array([np.ones((n_data,)), response_H[:, nu]]) / I_stdev[:, nu]).T
-            least_squares_y = I[:, nu] / I_stdev[:, nu]
-
-            least_squares_x_squared = np.dot(least_squares_x.T, least_squares_x)
-
-            # Non-negative least squares
-            try:
-                fit_result = scipy.optimize.nnls(
-                    least_squares_x_squared,
-                    np.matmul(least_squares_x.T, least_squares_y))
-
-            except ValueError as ve:
-                raise FitFailure(f"A = {A} ({repr(ve)})")
-
-            I_residual.append(fit_result[0][0])
-            S_H.append(fit_result[0][1])
-
-            errors = np.linalg.inv(np.dot(least_squares_x_squared.T, least_squares_x_squared))
-
-            I_residual_error_weight.append(errors[0, 0])
-            S_H_error_weight.append(errors[1, 1])
-
-        # Arrayise
-        S_H = np.array(S_H)
-        I_residual = np.array(I_residual)
-
-        I_sim = I_residual + response_H * S_H
-
-        s_q = np.mean(((I - I_sim) / I_stdev) ** 2, axis=0)
-
-        sigma_I_res = np.sqrt(np.abs(np.array(I_residual_error_weight) * s_q))
-        sigma_S_H = np.sqrt(np.abs(np.array(S_H_error_weight) * s_q))
+        errors = np.linalg.inv(np.einsum("qji,qjk->qik", least_squares_x_squared[0], least_squares_x_squared[0]))
+        error_weights = np.diagonal(errors, axis1=1, axis2=2)
+        sigma_I_res, sigma_S_H = np.sqrt(np.abs(error_weights * s_q[0, :, np.newaxis])).T
 
         chi_sq = float(np.mean(s_q))
 
@@ -379,7 +387,7 @@ class MuMagLib:
             exchange_A_chi_sq=chi_sq,
             q=output_q_values,
             I_residual=I_residual,
-            I_simulated=I_sim,
+            I_simulated=I_sim[0],
             S_H=S_H,
             I_residual_stdev=sigma_I_res,
             S_H_stdev=sigma_S_H)
@@ -440,14 +448,6 @@ class MuMagLib:
 
         # Estimate variance from second order derivative of chi-square function via Finite Differences
 
-        match geometry:
-            case ExperimentGeometry.PARALLEL:
-                least_squares_function = MuMagLib.least_squares_parallel
-            case ExperimentGeometry.PERPENDICULAR:
-                least_squares_function = MuMagLib.least_squares_perpendicular
-            case _:
-                raise ValueError(f"Unknown experimental geometry: {geometry}")
-
         p = 0.001  # fractional gap size for finite differences
         dA = A_opt * p
         A1 = A_opt - 2 * dA
@@ -456,11 +456,7 @@ class MuMagLib:
         A4 = A_opt + 1 * dA
         A5 = A_opt + 2 * dA
 
-        chi1 = least_squares_function(data, A1).exchange_A_chi_sq
-        chi2 = least_squares_function(data, A2).exchange_A_chi_sq
-        chi3 = least_squares_function(data, A3).exchange_A_chi_sq
-        chi4 = least_squares_function(data, A4).exchange_A_chi_sq
-        chi5 = least_squares_function(data, A5).exchange_A_chi_sq
+        chi1, chi2, chi3, chi4, chi5 = MuMagLib.exchange_A_chi_sq(data, [A1, A2, A3, A4, A5], geometry)
 
         d2chi_dA2 = (-chi1 + 16 * chi2 - 30 * chi3 + 16 * chi4 - chi5) / (12 * dA ** 2)
 
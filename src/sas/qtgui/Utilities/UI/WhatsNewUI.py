@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'WhatsNewUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QGridLayout,
+    QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QWidget)
+
+class Ui_WhatsNewUI(object):
+    def setupUi(self, WhatsNewUI):
+        if not WhatsNewUI.objectName():
+            WhatsNewUI.setObjectName(u"WhatsNewUI")
+        WhatsNewUI.resize(822, 558)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(WhatsNewUI.sizePolicy().hasHeightForWidth())
+        WhatsNewUI.setSizePolicy(sizePolicy)
+        WhatsNewUI.setModal(False)
+        self.gridLayout = QGridLayout(WhatsNewUI)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.groupBox = QGroupBox(WhatsNewUI)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setEnabled(True)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy1)
+
+        self.gridLayout.addWidget(self.groupBox, 0, 0, 1, 1)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.closeButton = QPushButton(WhatsNewUI)
+        self.closeButton.setObjectName(u"closeButton")
+
+        self.horizontalLayout.addWidget(self.closeButton)
+
+        self.showAgain = QCheckBox(WhatsNewUI)
+        self.showAgain.setObjectName(u"showAgain")
+
+        self.horizontalLayout.addWidget(self.showAgain)
+
+        self.horizontalSpacer = QSpacerItem(268, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.prevButton = QPushButton(WhatsNewUI)
+        self.prevButton.setObjectName(u"prevButton")
+
+        self.horizontalLayout.addWidget(self.prevButton)
+
+        self.lblPage = QLabel(WhatsNewUI)
+        self.lblPage.setObjectName(u"lblPage")
+        self.lblPage.setMinimumSize(QSize(80, 0))
+        self.lblPage.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.horizontalLayout.addWidget(self.lblPage)
+
+        self.nextButton = QPushButton(WhatsNewUI)
+        self.nextButton.setObjectName(u"nextButton")
+
+        self.horizontalLayout.addWidget(self.nextButton)
+
+
+        self.gridLayout.addLayout(self.horizontalLayout, 1, 0, 1, 1)
+
+
+        self.retranslateUi(WhatsNewUI)
+
+        QMetaObject.connectSlotsByName(WhatsNewUI)
+    # setupUi
+
+    def retranslateUi(self, WhatsNewUI):
+        WhatsNewUI.setWindowTitle(QCoreApplication.translate("WhatsNewUI", u"Dialog", None))
+        self.groupBox.setTitle("")
+        self.closeButton.setText(QCoreApplication.translate("WhatsNewUI", u"Close", None))
+        self.showAgain.setText(QCoreApplication.translate("WhatsNewUI", u"Show on startup", None))
+        self.prevButton.setText(QCoreApplication.translate("WhatsNewUI", u"\u2039", None))
+        self.lblPage.setText(QCoreApplication.translate("WhatsNewUI", u"TextLabel", None))
+        self.nextButton.setText(QCoreApplication.translate("WhatsNewUI", u"\u203a", None))
+    # retranslateUi
+
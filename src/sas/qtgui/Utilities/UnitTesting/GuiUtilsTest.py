@@ -2,6 +2,7 @@ import logging
 import os
 import webbrowser
 
+import numpy as np
 import pytest
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -415,6 +416,49 @@ class GuiUtilsTest:
         os.remove(name_full)
         assert not os.path.isfile(name_full)
 
+    @pytest.mark.parametrize("extension", [".json", ".zip"])
+    def testProjectFile(self, tmp_path, extension):
+        """ Projects are read back from JSON files and archives """
+        qx, qy = np.linspace(-0.1, 0.1, 12), np.linspace(-0.2, 0.2, 12)
+        data = Data2D(image=np.arange(12.).reshape(3, 4), err_image=np.ones((3, 4)),
+                      qx_data=qx, qy_data=qy, q_data=np.sqrt(qx**2 + qy**2))
+        data.title = "test"
+        project = {'1': {'fit_data': [data, {'fitpage': ['M1', (1, 2)]}]}, 'is_batch': 'False'}
+        file_name = str(tmp_path / ("project" + extension))
+
+        GuiUtils.saveProjectFile(file_name, project)
+        assert GuiUtils.isProjectArchive(file_name) == (extension == ".zip")
+        loaded = GuiUtils.readProjectFile(file_name)
+
+        assert loaded['is_batch'] == 'False'
+        loaded_data, page = loaded['1']['fit_data']
+        assert page == {'fitpage': ['M1', [1, 2]]}
+        assert isinstance(loaded_data, Data2D)
+        assert loaded_data.title == "test"
+        for name in ('data', 'err_data', 'qx_data', 'qy_data', 'q_data', 'mask'):
+            np.testing.assert_array_equal(getattr(loaded_data, name), getattr(data, name))
+
+    @pytest.mark.skipif(os.name == 'nt', reason="archive arrays are not mapped on Windows")
+    def testProjectArchiveMapped(self, tmp_path):
+        """ Archive arrays are mapped from the file, and saving over it leaves them intact """
+        data = Data1D(x=np.linspace(0.01, 0.3, 50), y=np.linspace(10., 1., 50), dy=np.ones(50))
+        file_name = str(tmp_path / "project.zip")
+        GuiUtils.saveProjectFile(file_name, {'1': {'fit_data': [data, {}]}})
+
+        loaded_data = GuiUtils.readProjectFile(file_name)['1']['fit_data'][0]
+        assert isinstance(loaded_data.y.base, np.memmap)
+        np.testing.assert_array_equal(loaded_data.y, data.y)
+
+        # Changes to the loaded arrays are not written back to the archive
+        loaded_data.y[0] = -1.0
+        loaded_data.y = loaded_data.y * 2
+        GuiUtils.saveProjectFile(file_name, {'1': {'fit_data': [loaded_data, {}]}})
+        assert not os.path.exists(file_name + '.part')
+
+        np.testing.assert_array_equal(loaded_data.x, data.x)
+        reloaded = GuiUtils.readProjectFile(file_name)['1']['fit_data'][0]
+        np.testing.assert_array_equal(reloaded.y, np.concatenate([[-2.0], data.y[1:]*2]))
+
     def testXYTransform(self, qapp):
         """ Assure the unit/legend transformation is correct"""
         data = Data1D(x=[1.0, 2.0, 3.0], y=[10.0, 11.0, 12.0],
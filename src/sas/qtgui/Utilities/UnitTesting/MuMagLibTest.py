@@ -0,0 +1,50 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import scipy.optimize
+
+from sas.qtgui.Utilities.MuMag.datastructures import ExperimentGeometry, FitParameters
+from sas.qtgui.Utilities.MuMag.MuMagLib import MuMagLib
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "MuMag", "SANSData", "FeNiB_perpendicular_Bersweiler_et_al")
+
+
+class MuMagLibTest:
+    """ Test the MuMag least squares fitting """
+
+    @pytest.fixture
+    def data(self):
+        data = MuMagLib.import_data(DATA_PATH)
+        return [datum.restrict_by_index(40) for datum in data if datum.applied_field >= 75]
+
+    def testNNLS(self):
+        """ The stacked solver matches scipy for each system """
+        rng = np.random.default_rng(3)
+        x = rng.normal(size=(200, 3, 3))
+        matrix = np.swapaxes(x, -1, -2) @ x
+        vector = rng.normal(size=(200, 3))
+
+        solution = MuMagLib._nnls(matrix, vector)
+
+        expected = [scipy.optimize.nnls(m, v)[0] for m, v in zip(matrix, vector)]
+        np.testing.assert_allclose(solution, expected, atol=1e-10)
+
+    @pytest.mark.parametrize("geometry", [ExperimentGeometry.PERPENDICULAR, ExperimentGeometry.PARALLEL])
+    def testSweep(self, data, geometry):
+        """ The sweep gives the chi squared of the fit for each A """
+        parameters = FitParameters(q_max=0.6, min_applied_field=75, exchange_A_min=5, exchange_A_max=20,
+                                   exchange_A_n=7, experiment_geometry=geometry)
+        least_squares_function = {
+            ExperimentGeometry.PERPENDICULAR: MuMagLib.least_squares_perpendicular,
+            ExperimentGeometry.PARALLEL: MuMagLib.least_squares_parallel}[geometry]
+
+        # Several blocks of A values
+        with patch.object(MuMagLib, "sweep_block_size", 3):
+            sweep = MuMagLib.sweep_exchange_A(parameters, data)
+
+        expected = [least_squares_function(data, a).exchange_A_chi_sq for a in sweep.exchange_A_checked]
+        np.testing.assert_allclose(sweep.exchange_A_chi_sq, expected, rtol=1e-12)
+        assert sweep.optimal.exchange_A == sweep.exchange_A_checked[np.argmin(expected)]
+        assert np.all(sweep.optimal.S_H >= 0)
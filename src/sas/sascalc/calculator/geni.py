@@ -3,7 +3,9 @@ Compute scattering from a set of points.
 For 1-D scattering use *Iq(q, x, y, z, sld, vol, is_avg)*
 """
 import logging
+import math
 import os
+from typing import NamedTuple
 
 import numpy as np
 import periodictable
@@ -29,72 +31,143 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def Iq(q, x, y, z, sld, vol, is_avg=False):
+# Largest number of cells in the zero-padded grid used by the histogram Debye
+# engine; 2**25 cells needs roughly 1 GB of working memory.
+GRID_CELL_LIMIT = 2**25
+
+def Iq(q, x, y, z, sld, vol, is_avg=False, grid_spacing=None):
     """
     Computes 1D isotropic.
     Isotropic: Assumes all slds are real (no magnetic)
     Also assumes there is no polarization: No dependency on spin.
     All values must be numpy vectors of the correct size.
+    If *grid_spacing* is given, the Debye sum is evaluated from a histogram
+    of pair distances on a grid with that spacing (see :func:`_calc_Iq_grid`)
+    instead of the exact double sum.
     Returns *I(q)*
     """
     coords = np.vstack((x, y, z))
     index = (sld != 0.)
     if not index.all():
-        coords, sld, vol = (v[index] for v in (sld, coords, vol))
+        coords, sld, vol = coords[:, index], sld[index], vol[index]
     q, coords, sld, vol = [np.asarray(v, dtype='d') for v in (q, coords, sld, vol)]
     w = sld * vol
 
     if is_avg:
         r = np.linalg.norm(coords, axis=0)
         I_out = _calc_Iq_avg(q, r, w)
+    elif grid_spacing is not None:
+        I_out = _calc_Iq_grid(q, coords, w, grid_spacing)
     else:
         from sas.sascalc.calculator.ausaxs.ausaxs_sans_debye import evaluate_sans_debye
         I_out = evaluate_sans_debye(q, coords, w)
     return I_out * (1.0E+8/np.sum(vol))
 
-def Iqxy(qx, qy, x, y, z, sld, vol, mx, my, mz, in_spin, out_spin, s_theta, s_phi, elements=None, is_elements=False):
+def Iqxy(qx, qy, x, y, z, sld, vol, mx, my, mz, in_spin, out_spin, s_theta, s_phi, elements=None, is_elements=False,
+         geometry=None):
     """
     Computes 2D anisotropic.
     *in_spin* and *out_spin* indicate portion of polarizer and analyzer
     transmission that are spin up.  *s_theta* and *s_phi* are the polarization direction angles.
+    For element data, *geometry* may give the :func:`element_geometry` of the
+    elements, so that it is not recomputed on each call.
     All other values must be numpy vectors of the correct size.
     Returns *I(qx, qy)*
     """
     qx, qy = np.broadcast_arrays(qx, qy)
+    channels = Iqxy_channels(qx, qy, x, y, z, sld, vol, mx, my, mz, s_theta, s_phi,
+                             elements, is_elements, geometry)
+    if channels is not None:
+        return weight_spin_channels(channels, in_spin, out_spin)
+    index = (sld != 0.)
+    if is_elements:
+        if geometry is None:
+            geometry = element_geometry(x, y, z, elements)
+        if not index.all():
+            sld, vol = sld[index], vol[index]
+            geometry = ElementGeometry(*(v[index] for v in geometry))
+        I_out = _calc_Iqxy_elements(sld, geometry, vol, qx.flatten(), qy.flatten())
+        I_out = I_out.reshape(qx.shape)
+    else:
+        if not index.all():
+            x, y, sld, vol = (v[index] for v in (x, y, sld, vol))
+        I_out = _calc_Iqxy(sld*vol, x, y, qx.flatten(), qy.flatten())
+        I_out = I_out.reshape(qx.shape)
+    return I_out * (1.0E+8/np.sum(vol))
+
+def Iqxy_channels(qx, qy, x, y, z, sld, vol, mx, my, mz, s_theta, s_phi, elements=None, is_elements=False,
+                  geometry=None):
+    """
+    Computes the 2D intensity of each spin cross section for magnetic data.
+    The intensity measured with polarizer and analyzer fractions *in_spin*
+    and *out_spin* is then :func:`weight_spin_channels` of these, so the
+    fractions can be changed without a new calculation.
+    Arguments are as for :func:`Iqxy`.
+    Returns an array of *I(qx, qy)* for the (dd, du, ud, uu) cross sections,
+    or None if the data is not magnetic.
+    """
+    qx, qy = np.broadcast_arrays(qx, qy)
     # if the mx provided to SasGen is None then _vec(mx) will be [nan]
+    if mx is None or my is None or mz is None:
+        return None
+    magnetic_index = (mx != 0.) | (my != 0.) | (mz != 0.)
+    if not magnetic_index.any():
+        return None
+    index = (sld != 0.) | magnetic_index
+    if is_elements:
+        if geometry is None:
+            geometry = element_geometry(x, y, z, elements)
+        if not index.all():
+            mx, my, mz, sld, vol = (v[index] for v in (mx, my, mz, sld, vol))
+            geometry = ElementGeometry(*(v[index] for v in geometry))
+        channels = _calc_Iqxy_magnetic_elements_channels(
+            qx, qy, geometry, sld, (mx, my, mz), vol, s_theta, s_phi)
+    else:
+        if not index.all():
+            x, y, mx, my, mz, sld, vol \
+                = (v[index] for v in (x, y, mx, my, mz, sld, vol))
+        channels = _calc_Iqxy_magnetic_channels(
+            qx, qy, x, y, sld, vol, (mx, my, mz), s_theta, s_phi)
+    return channels * (1.0E+8/np.sum(vol))
+
+def weight_spin_channels(channels, in_spin, out_spin):
+    """
+    Intensity for polarizer and analyzer fractions *in_spin* and *out_spin*
+    from the intensities of the (dd, du, ud, uu) spin cross sections.
+    """
+    return np.tensordot(_spin_weights(in_spin, out_spin), channels, axes=1)
+
+def Fqxy_channels(qx, qy, x, y, sld, vol, mx, my, mz, s_theta, s_phi):
+    r"""
+    Scattering amplitudes at (*qx*, *qy*) of the (dd, du, ud, uu) spin cross
+    sections for a set of points, before normalizing by their volume.
+    Without magnetism the dd and uu amplitudes are the nuclear amplitude and
+    the spin flip amplitudes are zero.
+
+    Amplitudes of separate sets of points add, so a sample can be summed in
+    parts and :func:`Iqxy` recovered as the :func:`weight_spin_channels` of
+    \|F\|^2 (or \|F_dd\|^2 without magnetism) times 1e8 over the volume
+    of the points with nonzero sld or magnetism.
+
+    Returns *(F, is_magnetic)* where *F* is a complex array of shape
+    (4,) + qx.shape.
+    """
+    qx, qy = np.broadcast_arrays(qx, qy)
+    shape = qx.shape
+    qx, qy = _vec_1d(qx), _vec_1d(qy)
     if mx is not None and my is not None and mz is not None:
-        magnetic_index = (mx != 0.) | (my != 0.) | (mz != 0.)
-        is_magnetic = magnetic_index.any()
+        is_magnetic = bool(((mx != 0.) | (my != 0.) | (mz != 0.)).any())
     else:
         is_magnetic = False
     if is_magnetic:
-        index = (sld != 0.) | magnetic_index
-        if is_elements:
-            if not index.all():
-                mx, my, mz, sld, elements, vol = (v[index] for v in (mx, my, mz, sld, elements, vol))
-            I_out = _calc_Iqxy_magnetic_elements(
-                qx, qy, x, y, z, sld, mx, my, mz, elements, vol,
-                in_spin, out_spin, s_theta, s_phi)
-        else:
-            if not index.all():
-                x, y, mx, my, mz, sld, vol \
-                    = (v[index] for v in (x, y, mx, my, mz, sld, vol))
-            I_out = _calc_Iqxy_magnetic(
-                qx, qy, x, y, sld, vol, (mx, my, mz),
-                in_spin, out_spin, s_theta, s_phi)
+        F = _calc_Fqxy_magnetic(qx, qy, x, y, sld, vol, (mx, my, mz), s_theta, s_phi)
     else:
-        index = (sld != 0.)
-        if is_elements:
-            if not index.all():
-                sld, elements, vol = (v[index] for v in (sld, elements, vol))
-            I_out = _calc_Iqxy_elements(sld, x, y, z, elements, vol, qx.flatten(), qy.flatten())
-            I_out = I_out.reshape(qx.shape)
-        else:
-            if not index.all():
-                x, y, sld, vol = (v[index] for v in (x, y, sld, vol))
-            I_out = _calc_Iqxy(sld*vol, x, y, qx.flatten(), qy.flatten())
-            I_out = I_out.reshape(qx.shape)
-    return I_out * (1.0E+8/np.sum(vol))
+        F = np.zeros((4, len(qx)), dtype=complex)
+        F[0] = F[3] = _calc_Fqxy(*(_vec_1d(v) for v in (sld*vol, x, y)), qx, qy)
+    return F.reshape((4,) + shape), is_magnetic
+
+def _vec_1d(v):
+    return np.ascontiguousarray(np.ravel(v), 'd')
 
 @njit('(f8[:], f8[:], f8[:])')
 def _calc_Iq_avg(q, r, w):
@@ -134,6 +207,121 @@ def _calc_Iq_numba(Iq, q, coords, sld, vol):
             # Accumulate terms I(j,j), I(j, k+1..n) and by symmetry I(k+1..n, j)
             Iq[i] += 2*np.sum(I_jk) - I_jk[0] # don't double-count the diagonal
 
+def lattice_spacing(coords, rtol=1e-6):
+    """
+    Return the lattice step along each axis if all points in *coords*
+    (3 x n) lie on a regular rectangular lattice, as they do for OMF and SLD
+    voxel data, or None otherwise.  Axes with a single coordinate value get
+    a step of 1.
+    """
+    spacing = np.ones(3)
+    for axis, values in enumerate(coords):
+        u = np.unique(values)
+        if len(u) < 2:
+            continue
+        step = np.min(np.diff(u))
+        if step <= rtol * (u[-1] - u[0]):
+            return None
+        offset = (u - u[0]) / step
+        if np.any(np.abs(offset - np.rint(offset)) > 1e-4):
+            return None
+        spacing[axis] = step
+    return spacing
+
+def grid_spacing_for_limit(coords, limit=GRID_CELL_LIMIT):
+    """
+    Return the smallest isotropic grid spacing for which the zero-padded
+    histogram grid over the extent of *coords* (3 x n) fits in *limit* cells.
+    """
+    import scipy.fft
+
+    extent = np.ptp(coords, axis=1)
+    if not (extent > 0).any():
+        return np.ones(3)
+    # Start from prod(2*extent/h) = limit and grow h until the padded grid,
+    # including the FFT-friendly size rounding, fits.
+    h = (np.prod(2*extent[extent > 0]) / limit)**(1/np.sum(extent > 0))
+    def padded_cells(h):
+        return np.prod([scipy.fft.next_fast_len(2*int(np.rint(e/h)) + 1, real=True)
+                        for e in extent], dtype='d')
+    while padded_cells(h) > limit:
+        h *= 1.05
+    return np.full(3, h)
+
+def _calc_Iq_grid(q, coords, w, spacing, worksize=1000000):
+    """
+    Compute the Debye sum from a histogram of pair distances on a grid.
+
+    The weights *w* at positions *coords* (3 x n) are accumulated onto a
+    regular grid with the given *spacing* (scalar or one value per axis).
+    The autocorrelation of the grid, computed with an FFT, gives the summed
+    weight products w_j w_k for every lattice displacement, and these are
+    histogrammed by the distinct displacement lengths.  The cost is
+    O(n + M log M + nr*nq) for M grid cells and nr distinct lattice distances
+    (at most 3*max(shape)**2 for an isotropic grid) rather than O(n^2 nq) for
+    the exact sum.
+
+    When the points lie on the grid, as for OMF and SLD voxel data, the
+    result agrees with the exact sum to rounding error.  Otherwise each point
+    is moved by at most sqrt(3)/2*max(spacing) onto the grid.
+
+    *worksize* bounds the size of the (q x distances) block of sinc terms.
+    """
+    import scipy.fft
+
+    spacing = np.broadcast_to(np.asarray(spacing, 'd'), (3,))
+
+    # Cell-list binning of the weights onto the grid.
+    origin = coords.min(axis=1)
+    cell = np.rint((coords - origin[:, None]) / spacing[:, None]).astype(np.intp)
+    shape = tuple(cell.max(axis=1) + 1)
+    padded = tuple(scipy.fft.next_fast_len(2*n - 1, real=True) for n in shape)
+    if np.prod(padded, dtype='d') > GRID_CELL_LIMIT:
+        raise ValueError(
+            "Grid spacing %s is too fine for a model of extent %s; the"
+            " histogram grid would need %d cells"
+            % (spacing, np.ptp(coords, axis=1), np.prod(padded, dtype='d')))
+    grid = np.bincount(np.ravel_multi_index(cell, shape), weights=w,
+                       minlength=np.prod(shape)).reshape(shape)
+
+    # Autocorrelation: acorr[d] = sum_{j,k: cell_k - cell_j = d} w_j w_k,
+    # with negative displacements wrapped to the end of each padded axis.
+    F = scipy.fft.rfftn(grid, s=padded)
+    acorr = scipy.fft.irfftn(F.real**2 + F.imag**2, s=padded).ravel()
+    del F
+
+    # Squared length of each lattice displacement.  For an isotropic grid
+    # this is an integer multiple of spacing**2, otherwise the distinct
+    # lengths are found by sorting.
+    isotropic = np.all(spacing == spacing[0])
+    scale = spacing / spacing[0] if isotropic else spacing
+    r2 = np.zeros(padded, dtype=np.intp if isotropic else 'd')
+    for axis, (n, m) in enumerate(zip(shape, padded)):
+        k = np.arange(m)
+        d = np.where(k < n, k, k - m)
+        d2 = d**2 if isotropic else (d*scale[axis])**2
+        r2 += d2.reshape([-1 if i == axis else 1 for i in range(3)])
+    r2 = r2.ravel()
+    if isotropic:
+        hist = np.bincount(r2, weights=acorr)
+        r2_distinct = np.arange(len(hist)) * spacing[0]**2
+    else:
+        r2_distinct, index = np.unique(np.round(r2, 8), return_inverse=True)
+        hist = np.bincount(index, weights=acorr)
+    del r2, acorr
+
+    # Evaluate sum_k hist[k] sinc(q r_k) over the occupied distances.
+    occupied = np.nonzero(hist)[0]
+    r = np.sqrt(r2_distinct[occupied])
+    hist = hist[occupied]
+    q_pi = q / np.pi  # np.sinc = sin(pi x)/(pi x)
+    Iq = np.empty_like(q)
+    batch_size = max(1, worksize // max(1, len(r)))
+    for start in range(0, len(q), batch_size):
+        block = q_pi[start:start+batch_size]
+        Iq[start:start+batch_size] = np.sinc(block[:, None]*r[None, :]) @ hist
+    return Iq
+
 if USE_NUMBA:
     sig = "f8[:](f8[:],f8[:],f8[:],f8[:],f8[:])"
     @njit(sig, parallel=True, fastmath=True)
@@ -149,6 +337,24 @@ else:
         Iq = [abs(np.sum(scale*np.exp(1j*(qx_k*x + qy_k*y))))**2
               for qx_k, qy_k in zip(qx.flat, qy.flat)]
         return np.asarray(Iq).reshape(qx.shape)
+if USE_NUMBA:
+    @njit("c16[:](f8[:],f8[:],f8[:],f8[:],f8[:])", parallel=True, fastmath=True)
+    def _calc_Fqxy(scale, x, y, qx, qy):
+        Fq = np.empty(len(qx), dtype=np.complex128)
+        for j in prange(len(Fq)):
+            Fq[j] = np.sum(scale * np.exp(1j*(qx[j]*x + qy[j]*y)))
+        return Fq
+else:
+    def _calc_Fqxy(scale, x, y, qx, qy):
+        Fq = np.empty(len(qx), dtype=complex)
+        block = max(1, 2**21 // max(1, len(x)))
+        for start in range(0, len(qx), block):
+            part = slice(start, start+block)
+            Fq[part] = np.exp(1j*(qx[part, None]*x + qy[part, None]*y)) @ scale
+        return Fq
+_calc_Fqxy.__doc__ = """
+    Scattering amplitude sum V(r) rho(r) e^(1j q.r) for a set of points (x, y).
+    """
 _calc_Iqxy.__doc__ = r"""
     Compute I(q) for a set of points (x, y).
 
@@ -156,9 +362,31 @@ _calc_Iqxy.__doc__ = r"""
     Since qz is zero for SAS, only need 2D vectors q = (qx, qy) and r = (x, y).
     """
 
-def _calc_Iqxy_elements(sld, x, y, z, elements, vol, qx, qy):
+class ElementGeometry(NamedTuple):
     """
-    Compute I(q) for a set of elements, without magnetism.
+    Geometry of a mesh of polyhedral elements for the element transform,
+    with elements along the first axis of each array, then faces, then the
+    edges around each face.
+    """
+    #: outward unit normal of each face (elements x faces x 3)
+    normals: np.ndarray
+    #: distance of the plane of each face from the origin (elements x faces)
+    rn_norm: np.ndarray
+    #: vector along each edge (elements x faces x edges x 3)
+    edges: np.ndarray
+    #: midpoint of each edge (elements x faces x edges x 3)
+    midpoints: np.ndarray
+    #: outward normal of each edge in the plane of its face (elements x faces x edges x 3)
+    edge_normals: np.ndarray
+    #: unit vector along the first edge of each face (elements x faces x 3)
+    first_edges: np.ndarray
+
+
+def element_geometry(x, y, z, elements):
+    """
+    Precompute the :class:`ElementGeometry` of the *elements* (elements x
+    faces x vertices indices into the points *x*, *y*, *z*), which does not
+    depend on Q.
     """
     # create the geometry as an array (elements x faces x vertices x coordinates)
     geometry = np.column_stack((x, y, z))[np.concatenate((elements, elements[:,:,:1]), axis=2)]
@@ -166,13 +394,123 @@ def _calc_Iqxy_elements(sld, x, y, z, elements, vol, qx, qy):
     normals, geometry = _get_normal_vec(geometry)
     # extract the normal component of the displacement of the plane using the first point (elements x faces)
     rn_norm = np.sum(geometry[:,:,0] * normals, axis=-1)
-    temp = element_transform(geometry, normals, rn_norm, vol, 0.5, 0)
-    #temp = element_transform(geometry, normals, rn_norm, vol, 6.29259, -6.29259)
-    #temp2 = np.sum(sld*temp)
-    #temp3 = abs(temp2)**2*1e8/8
-    Iq = [abs(np.sum(sld*element_transform(geometry, normals, rn_norm, vol, qx_k, qy_k)))**2
-            for qx_k, qy_k in zip(qx.flat, qy.flat)]
-    return np.asarray(Iq).reshape(qx.shape)
+    edges = geometry[:,:,1:] - geometry[:,:,:-1]
+    midpoints = (geometry[:,:,1:] + geometry[:,:,:-1]) / 2
+    edge_normals = np.cross(edges, normals[:,:,None,:])
+    first_edges = edges[:,:,0] / np.linalg.norm(edges[:,:,0], axis=-1)[..., None]
+    return ElementGeometry(*(np.ascontiguousarray(v, dtype='d') for v in
+                             (normals, rn_norm, edges, midpoints, edge_normals, first_edges)))
+
+
+def _calc_Iqxy_elements(sld, geometry, vol, qx, qy):
+    """
+    Compute I(q) for a set of elements, without magnetism.
+    """
+    sld, vol, qx, qy = (np.ascontiguousarray(v, dtype='d') for v in (sld, vol, qx, qy))
+    if USE_NUMBA:
+        return _calc_Iqxy_elements_kernel(sld, vol, *geometry, qx, qy)
+    Iq = np.empty_like(qx)
+    # Transform blocks of Q points at once, keeping the work arrays to a few million values
+    block = max(1, 2**21 // geometry.edges[..., 0].size)
+    for start in range(0, len(qx), block):
+        transform = element_transform_block(geometry, vol, qx[start:start+block], qy[start:start+block])
+        Iq[start:start+block] = np.abs(transform @ sld)**2
+    return Iq
+
+
+def element_transform_block(geometry, volumes, qx, qy):
+    """
+    Fourier transform of each element at each of the Q points *qx*, *qy*.
+
+    This is :func:`element_transform` evaluated for a block of Q points at
+    once from the precomputed :class:`ElementGeometry` of the elements.
+
+    :return: A 2D complex array of the transforms (Q points x elements)
+    """
+    eps = 1e-5
+    normals = geometry.normals
+    qx, qy = np.asarray(qx, 'd')[:, None, None], np.asarray(qy, 'd')[:, None, None]
+    # Qn_comp is the component of Q along each face normal (Q x elements x faces)
+    Qn_comp = normals[..., 0] * qx + normals[..., 1] * qy
+    # Qp is the component of Q in the plane of each face (Q x elements x faces x 3)
+    Qp = -Qn_comp[..., None] * normals
+    Qp[..., 0] += qx
+    Qp[..., 1] += qy
+    # where Qp is the zero vector on a face, move Q by epsilon along the
+    # first edge of that face for the whole element, as element_transform does
+    flat = np.all(np.abs(Qp) < eps, axis=-1)
+    problem = np.any(flat, axis=-1)
+    first_edges = geometry.first_edges[np.arange(normals.shape[0]), np.argmax(flat, axis=-1)]
+    shift = np.where(problem[..., None], eps * first_edges, 0.0)
+    Qp += shift[:, :, None, :]
+    QQ = (qx[..., 0] + shift[..., 0])**2 + (qy[..., 0] + shift[..., 1])**2 + shift[..., 2]**2
+    prefactor = (1j * Qn_comp * np.exp(1j * Qn_comp * geometry.rn_norm)) / QQ[..., None]
+    # sum over the edges of each face, as in eq (14) of the reference
+    term = np.einsum('qefc,efic->qefi', Qp, geometry.edge_normals) / np.sum(Qp * Qp, axis=-1)[..., None]
+    dot_diff = np.einsum('qefc,efic->qefi', Qp, geometry.edges) / 2.0
+    dot_sum = np.einsum('qefc,efic->qefi', Qp, geometry.midpoints)
+    sub_sum = np.sum(term * 1j * np.sinc(dot_diff/np.pi) * np.exp(1j * dot_sum), axis=-1)
+    transform = np.sum(prefactor * sub_sum, axis=-1)
+    # If Q is the zero vector then the fourier transform is just the volume of the subelements
+    zero = (np.abs(qx[:, 0, 0]) < eps) & (np.abs(qy[:, 0, 0]) < eps)
+    transform[zero] = volumes
+    return transform
+
+
+@njit(parallel=True, fastmath=True)
+def _calc_Iqxy_elements_kernel(sld, vol, normals, rn_norm, edges, midpoints, edge_normals, first_edges, qx, qy):
+    """
+    Compiled :func:`_calc_Iqxy_elements`, with the Q points shared among
+    threads.
+    """
+    Iq = np.empty_like(qx)
+    for k in prange(len(qx)):
+        total = 0j
+        for e in range(len(sld)):
+            total += sld[e] * _element_transform_kernel(
+                e, qx[k], qy[k], vol, normals, rn_norm, edges, midpoints, edge_normals, first_edges)
+        Iq[k] = total.real**2 + total.imag**2
+    return Iq
+
+
+@njit(fastmath=True)
+def _element_transform_kernel(e, qxk, qyk, vol, normals, rn_norm, edges, midpoints, edge_normals, first_edges):
+    """
+    Fourier transform of element *e* at (*qxk*, *qyk*), as in :func:`element_transform`.
+    """
+    eps = 1e-5
+    n_faces, n_edges = edges.shape[1], edges.shape[2]
+    # If Q is the zero vector then the fourier transform is just the volume
+    if abs(qxk) < eps and abs(qyk) < eps:
+        return complex(vol[e], 0.0)
+    # move Q off any face to which it is normal, as element_transform does
+    sx, sy, sz = 0.0, 0.0, 0.0
+    for f in range(n_faces):
+        qn = normals[e, f, 0]*qxk + normals[e, f, 1]*qyk
+        if (abs(qxk - qn*normals[e, f, 0]) < eps and abs(qyk - qn*normals[e, f, 1]) < eps
+                and abs(qn*normals[e, f, 2]) < eps):
+            sx, sy, sz = eps*first_edges[e, f, 0], eps*first_edges[e, f, 1], eps*first_edges[e, f, 2]
+            break
+    QQ = (qxk + sx)**2 + (qyk + sy)**2 + sz**2
+    transform = 0j
+    for f in range(n_faces):
+        qn = normals[e, f, 0]*qxk + normals[e, f, 1]*qyk
+        px = qxk - qn*normals[e, f, 0] + sx
+        py = qyk - qn*normals[e, f, 1] + sy
+        pz = -qn*normals[e, f, 2] + sz
+        pp = px*px + py*py + pz*pz
+        sub_sum = 0j
+        for i in range(n_edges):
+            term = (px*edge_normals[e, f, i, 0] + py*edge_normals[e, f, i, 1]
+                    + pz*edge_normals[e, f, i, 2]) / pp
+            dot_diff = (px*edges[e, f, i, 0] + py*edges[e, f, i, 1] + pz*edges[e, f, i, 2]) / 2.0
+            dot_sum = px*midpoints[e, f, i, 0] + py*midpoints[e, f, i, 1] + pz*midpoints[e, f, i, 2]
+            sinc = math.sin(dot_diff)/dot_diff if dot_diff != 0.0 else 1.0
+            # 1j * exp(1j * dot_sum)
+            sub_sum += term * sinc * complex(-math.sin(dot_sum), math.cos(dot_sum))
+        phase = qn * rn_norm[e, f]
+        transform += 1j * qn * complex(math.cos(phase), math.sin(phase)) / QQ * sub_sum
+    return transform
 
 def _calc_Iqxy_magnetic(
         qx, qy, x, y, rho, vol, rho_m,
@@ -187,77 +525,121 @@ def _calc_Iqxy_magnetic(
     will both be 0.5.
     Since qz is zero for SAS, only need 2D vectors q = (qx, qy) and r = (x, y).
     """
-    # Determine contribution from each cross section
-    dd, du, ud, uu = _spin_weights(up_frac_i, up_frac_f)
+    channels = _calc_Iqxy_magnetic_channels(qx, qy, x, y, rho, vol, rho_m, up_theta, up_phi)
+    return weight_spin_channels(channels, up_frac_i, up_frac_f)
 
-    # Precompute helper values
-    up_theta = np.radians(up_theta)
+def _polarization_axes(up_theta, up_phi):
+    """
+    Polarization direction *p_hat* for angles *up_theta*, *up_phi* in degrees,
+    and two unit vectors spanning the plane perpendicular to it for spin flip
+    scattering.
+    """
+    up_theta, up_phi = np.radians(up_theta), np.radians(up_phi)
     cos_spin, sin_spin = np.cos(up_theta), np.sin(up_theta)
-
-    up_phi = np.radians(up_phi)
     cos_phi, sin_phi = np.cos(up_phi), np.sin(up_phi)
-    mx, my, mz = rho_m
+    p_hat = np.array([sin_spin * cos_phi, sin_spin * sin_phi, cos_spin])
+    perpy_hat = np.array([-sin_phi, cos_phi, 0])
+    perpz_hat = np.array([-cos_spin * cos_phi, -cos_spin * sin_phi, sin_spin])
+    return p_hat, perpy_hat, perpz_hat
+
+def _q_hat(qx, qy):
+    """
+    Unit vectors along the 2D vectors (*qx*, *qy*).
+    """
+    norm = np.sqrt(qx**2 + qy**2)
+    zero = (np.abs(qx) <= 1.e-16) & (np.abs(qy) <= 1.e-16)
+    # For homogeneously magnetised disc Mperp can be associated to the
+    # magnetsation corrected for demag factorfield q->0, i.e. M-Nij M
+    # with Nij the demagnetisation tensor (Belleggia JMMM 263, L1, 2003).
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(zero, np.sqrt(0.5), qx/norm), np.where(zero, np.sqrt(0.5), qy/norm)
+
+def _calc_Iqxy_magnetic_channels(qx, qy, x, y, rho, vol, rho_m, up_theta=0., up_phi=0.):
+    """
+    Compute I(q) of each spin cross section (dd, du, ud, uu) for a set of
+    points (x, y), with magnetism on each point.
+
+    Returns an array of shape (4,) + qx.shape.
+    """
+    amplitudes = _calc_Fqxy_magnetic(np.ravel(qx), np.ravel(qy), x, y, rho, vol, rho_m, up_theta, up_phi)
+    return (amplitudes.real**2 + amplitudes.imag**2).reshape((4,) + np.shape(qx))
+
+def _calc_Fqxy_magnetic(qx, qy, x, y, rho, vol, rho_m, up_theta=0., up_phi=0.):
+    """
+    Scattering amplitude of each spin cross section (dd, du, ud, uu) for a
+    set of points (x, y), with magnetism on each point, at the Q points in
+    the vectors *qx*, *qy*.
+
+    Returns a complex array of shape (4, len(qx)).
+    """
     ## NOTE: sasview calculator uses the opposite sign for mx, my, mz.
     ## Uncomment the following to match its output.
-    #mx, my, mz = -mx, -my, -mz
-
-    # Flatten arrays so everything is 1D
-    shape = qx.shape
-    qx, qy = (np.asarray(v, 'd').flatten() for v in (qx, qy))
-    Iq = np.zeros(shape=qx.shape, dtype='d')
-    M = np.array([mx, my, mz])
-    #print("mag", [v.shape for v in (x, y, rho, vol, mx, my, mz)])
-    _calc_Iqxy_magnetic_helper(
-        Iq, qx, qy, x, y, rho, vol, M,
-        cos_spin, sin_spin, cos_phi, sin_phi, dd, du, ud, uu)
-    return Iq.reshape(shape)
-
-@njit
-def orth(A, b): # A = 3 x n, and b_hat unit vector
-    return A - np.outer(b, b)@A
-
-
-@njit("(" + "f8[:], "*7 + "f8[:,::1], "+ "f8, "*8 + ")")
-def _calc_Iqxy_magnetic_helper(
-        Iq, qx, qy, x, y, rho, vol, M, cos_spin, sin_spin, cos_phi, sin_phi,
-        dd, du, ud, uu):
-    # Process each qx, qy
-    # Note: enumerating a pair is slower than direct indexing in numba
-
-    p_hat = np.array([sin_spin * cos_phi, sin_spin * sin_phi, cos_spin ])
-    #two unit vectors spanning up the plane perpendicular to polarisation for SF scattering
-    perpy_hat = np.array([-sin_phi, cos_phi, 0 ])
-    perpz_hat = np.array([-cos_spin * cos_phi, -cos_spin * sin_phi, sin_spin ])
-
-    for k in range(len(qx)):
-        qxk, qyk = qx[k], qy[k]
-
-        if abs(qxk) > 1.e-16 or abs(qyk) > 1.e-16:
-            norm = 1/np.sqrt(qxk**2 + qyk**2)
-            q_hat = np.array([qxk, qyk, 0]) * norm
-        else:
-            # For homogeneously magnetised disc Mperp can be associated to the
-            # magnetsation corrected for demag factorfield q->0, i.e. M-Nij M
-            # with Nij the demagnetisation tensor (Belleggia JMMM 263, L1, 2003).
-            q_hat = np.sqrt(np.array([0.5, 0.5, 0]))
-
-        M_perp = orth(M, q_hat)
-
-        perpx = p_hat @ M_perp
-        # einsum is faster than sumsq in numpy but not supported in numba
-        #perpy = np.sqrt(np.einsum('ji,ji->i', M_perpP_perpQ, M_perpP_perpQ))
-        perpy = perpy_hat @ M_perp
-        perpz = perpz_hat @ M_perp
-
-        ephase = vol * np.exp(1j * (qxk * x + qyk * y))
-        if dd > 1e-10:
-            Iq[k] += dd * abs(np.sum((rho - perpx) * ephase))**2
-        if uu > 1e-10:
-            Iq[k] += uu * abs(np.sum((rho + perpx) * ephase))**2
-        if du > 1e-10:
-            Iq[k] += du * abs(np.sum((perpy - 1j * perpz) * ephase))**2
-        if ud > 1e-10:
-            Iq[k] += ud * abs(np.sum((perpy + 1j * perpz) * ephase))**2
+    #rho_m = [-m for m in rho_m]
+    p_hat, perpy_hat, perpz_hat = _polarization_axes(up_theta, up_phi)
+    qx, qy, x, y, rho, vol = (np.ascontiguousarray(v, 'd') for v in (qx, qy, x, y, rho, vol))
+    M = np.array(rho_m, 'd')
+    # Project M onto the polarization axes once; the projection of
+    # M_perp = M - q_hat (q_hat . M) then needs only q_hat . M at each q
+    axes = np.array([p_hat, perpy_hat, perpz_hat])
+    M_axes = np.ascontiguousarray(axes @ M)
+    q_hat = np.array(_q_hat(qx, qy))
+    q_axes = np.ascontiguousarray(axes[:, :2] @ q_hat)
+    if USE_NUMBA:
+        return _calc_Fqxy_magnetic_kernel(qx, qy, x, y, rho, vol, M[0], M[1], M_axes, q_hat, q_axes)
+    amplitudes = np.empty((4, len(qx)), dtype=complex)
+    # Keep the (Q points x points) work arrays to a few million values
+    block = max(1, 2**21 // max(1, len(x)))
+    for start in range(0, len(qx), block):
+        part = slice(start, start+block)
+        q_M = q_hat[0, part, None]*M[0] + q_hat[1, part, None]*M[1]
+        perpx, perpy, perpz = (M_axes[i] - q_axes[i, part, None]*q_M for i in range(3))
+        ephase = vol * np.exp(1j * (qx[part, None] * x + qy[part, None] * y))
+        amplitudes[0, part] = np.sum((rho - perpx) * ephase, axis=1)
+        amplitudes[1, part] = np.sum((perpy - 1j * perpz) * ephase, axis=1)
+        amplitudes[2, part] = np.sum((perpy + 1j * perpz) * ephase, axis=1)
+        amplitudes[3, part] = np.sum((rho + perpx) * ephase, axis=1)
+    return amplitudes
+
+# Number of Q points given to each thread, and of points summed for a
+# Q point before moving to the next, so that the points stay in cache
+MAGNETIC_Q_BLOCK = 64
+MAGNETIC_POINT_BLOCK = 2048
+
+@njit(parallel=True, fastmath=True)
+def _calc_Fqxy_magnetic_kernel(qx, qy, x, y, rho, vol, mx, my, M_axes, q_hat, q_axes):
+    """
+    Compiled spin cross section amplitudes for :func:`_calc_Fqxy_magnetic`,
+    with blocks of Q points shared among threads.
+    """
+    nq, npoints = len(qx), len(x)
+    amplitudes = np.zeros((4, nq), dtype=np.complex128)
+    n_blocks = (nq + MAGNETIC_Q_BLOCK - 1) // MAGNETIC_Q_BLOCK
+    for b in prange(n_blocks):
+        start = b * MAGNETIC_Q_BLOCK
+        stop = min(start + MAGNETIC_Q_BLOCK, nq)
+        for j_start in range(0, npoints, MAGNETIC_POINT_BLOCK):
+            j_stop = min(j_start + MAGNETIC_POINT_BLOCK, npoints)
+            for k in range(start, stop):
+                qxk, qyk = qx[k], qy[k]
+                hx, hy = q_hat[0, k], q_hat[1, k]
+                px, py, pz = q_axes[0, k], q_axes[1, k], q_axes[2, k]
+                dd, du, ud, uu = 0j, 0j, 0j, 0j
+                for j in range(j_start, j_stop):
+                    q_M = hx*mx[j] + hy*my[j]
+                    perpx = M_axes[0, j] - px*q_M
+                    perpy = M_axes[1, j] - py*q_M
+                    perpz = M_axes[2, j] - pz*q_M
+                    phase = qxk*x[j] + qyk*y[j]
+                    ephase = vol[j] * complex(math.cos(phase), math.sin(phase))
+                    dd += (rho[j] - perpx) * ephase
+                    du += complex(perpy, -perpz) * ephase
+                    ud += complex(perpy, perpz) * ephase
+                    uu += (rho[j] + perpx) * ephase
+                amplitudes[0, k] += dd
+                amplitudes[1, k] += du
+                amplitudes[2, k] += ud
+                amplitudes[3, k] += uu
+    return amplitudes
 
 def _get_normal_vec(geometry):
     """return array of normal vectors of elements
@@ -295,74 +677,91 @@ def _calc_Iqxy_magnetic_elements(
     """
     Compute I(q) for a set of elements, with magnetism.
     """
-    # Determine contribution from each cross section
-    dd, du, ud, uu = _spin_weights(up_frac_i, up_frac_f)
+    geometry = element_geometry(x, y, z, elements)
+    channels = _calc_Iqxy_magnetic_elements_channels(qx, qy, geometry, sld, (mx, my, mz), vol, up_angle, up_phi)
+    return weight_spin_channels(channels, up_frac_i, up_frac_f)
 
-    # Precompute helper values
-    up_angle = np.radians(up_angle)
-    cos_spin, sin_spin = np.cos(up_angle), np.sin(up_angle)
+def _calc_Iqxy_magnetic_elements_channels(qx, qy, geometry, rho, rho_m, vol, up_angle=0., up_phi=0.):
+    """
+    Compute I(q) of each spin cross section (dd, du, ud, uu) for a set of
+    elements with precomputed :class:`ElementGeometry`, with magnetism.
 
-    up_phi = np.radians(up_phi)
-    cos_phi, sin_phi = np.cos(up_phi), np.sin(up_phi)
+    Returns an array of shape (4,) + qx.shape.
+    """
     ## NOTE: sasview calculator uses the opposite sign for mx, my, mz.
     ## Uncomment the following to match its output.
-    #mx, my, mz = -mx, -my, -mz
-    # create the geometry as an array (elements x faces x vertices x coordinates)
-    geometry = np.column_stack((x, y, z))[np.concatenate((elements, elements[:,:,:1]), axis=2)]
-    # create normal vectors (elements x faces x normal_vector_coords)
-    normals, geometry = _get_normal_vec(geometry)
-    # extract the normal component of the displacement of the plane using the first point (elements x faces)
-    rn_norm = np.sum(geometry[:,:,0] * normals, axis=-1)
+    #rho_m = [-m for m in rho_m]
+    p_hat, _, _ = _polarization_axes(up_angle, up_phi)
     # Flatten arrays so everything is 1D
     shape = qx.shape
     qx, qy = (np.asarray(v, 'd').flatten() for v in (qx, qy))
-    Iq = np.zeros(shape=qx.shape, dtype='d')
-    M = np.array([mx, my, mz])
-    #print("mag", [v.shape for v in (x, y, rho, vol, mx, my, mz)])
-    _calc_Iqxy_magnetic_elements_helper(
-        Iq, qx, qy, geometry, normals, rn_norm, sld, M, vol,
-        cos_spin, sin_spin, cos_phi, sin_phi, dd, du, ud, uu)
-    return Iq.reshape(shape)
-
-# TODO: currently doesn't use numba
-def _calc_Iqxy_magnetic_elements_helper(
-        Iq, qx, qy, geometry, normals, rn_norm, rho, M, vol,
-        cos_spin, sin_spin, cos_phi, sin_phi, dd, du, ud, uu):
-    # Process each qx, qy
-    # Note: enumerating a pair is slower than direct indexing in numba
-    for k in range(len(qx)):
-        qxk, qyk = qx[k], qy[k]
-
-        if abs(qxk) > 1.e-16 or abs(qyk) > 1.e-16:
-            norm = 1/np.sqrt(qxk**2 + qyk**2)
-            q_hat = np.array([qxk, qyk, 0]) * norm
-        else:
-            # For homogeneously magnetised disc Mperp can be associated to the
-            # magnetsation corrected for demag factorfield q->0, i.e. M-Nij M
-            # with Nij the demagnetisation tensor (Belleggia JMMM 263, L1, 2003).
-            q_hat = np.sqrt(np.array([0.5, 0.5, 0]))
-
-        p_hat = np.array([sin_spin * cos_phi, sin_spin * sin_phi, cos_spin ])
-
-        M_perp = orth(M, q_hat)
-        M_perpP = orth(M_perp, p_hat)
-        M_perpP_perpQ = orth(M_perpP, q_hat)
-
-        perpx = p_hat @ M_perp
-        # einsum is faster than sumsq in numpy but not supported in numba
-        #perpy = np.sqrt(np.einsum('ji,ji->i', M_perpP_perpQ, M_perpP_perpQ))
-        perpy = np.sqrt(np.sum(M_perpP_perpQ**2, axis=0))
-        perpz = q_hat @ M_perpP
-
-        ephase = element_transform(geometry, normals, rn_norm, vol, qxk, qyk)
-        if dd > 1e-10:
-            Iq[k] += dd * abs(np.sum((rho - perpx) * ephase))**2
-        if uu > 1e-10:
-            Iq[k] += uu * abs(np.sum((rho + perpx) * ephase))**2
-        if du > 1e-10:
-            Iq[k] += du * abs(np.sum((perpy - 1j * perpz) * ephase))**2
-        if ud > 1e-10:
-            Iq[k] += ud * abs(np.sum((perpy + 1j * perpz) * ephase))**2
+    rho, vol = (np.ascontiguousarray(v, 'd') for v in (rho, vol))
+    M = np.array(rho_m, 'd')
+    q_hat = np.array(_q_hat(qx, qy))
+    p_M = np.ascontiguousarray(p_hat @ M)
+    M_sq = np.sum(M**2, axis=0)
+    q_p = np.ascontiguousarray(p_hat[:2] @ q_hat)
+    if USE_NUMBA:
+        channels = _calc_Iqxy_magnetic_elements_kernel(
+            rho, vol, *geometry, qx, qy, M[0], M[1], p_M, M_sq, q_hat, q_p)
+    else:
+        channels = np.empty((4, len(qx)))
+        block = max(1, 2**21 // geometry.edges[..., 0].size)
+        for start in range(0, len(qx), block):
+            part = slice(start, start+block)
+            q_M = q_hat[0, part, None]*M[0] + q_hat[1, part, None]*M[1]
+            perpx, perpy, perpz = _element_perp(q_M, p_M, M_sq, q_p[part, None])
+            ephase = element_transform_block(geometry, vol, qx[part], qy[part])
+            channels[:, part] = np.abs([
+                np.sum((rho - perpx) * ephase, axis=1),
+                np.sum((perpy - 1j * perpz) * ephase, axis=1),
+                np.sum((perpy + 1j * perpz) * ephase, axis=1),
+                np.sum((rho + perpx) * ephase, axis=1),
+            ])**2
+    return channels.reshape((4,) + shape)
+
+def _element_perp(q_M, p_M, M_sq, q_p):
+    """
+    Components of the magnetisation used for the spin cross sections of
+    elements, given q_hat . M, p_hat . M, \\|M\\|^2 and q_hat . p_hat.
+
+    With M_perp = M - q_hat (q_hat . M) and M_perpP the part of M_perp
+    perpendicular to p_hat, these are p_hat . M_perp, the length of the part
+    of M_perpP perpendicular to q_hat, and q_hat . M_perpP.
+    """
+    perpx = p_M - q_p * q_M
+    perpz = -q_p * perpx
+    perpy = np.sqrt(np.maximum(M_sq - q_M**2 - perpx**2 - perpz**2, 0.0))
+    return perpx, perpy, perpz
+
+@njit(parallel=True, fastmath=True)
+def _calc_Iqxy_magnetic_elements_kernel(
+        rho, vol, normals, rn_norm, edges, midpoints, edge_normals, first_edges, qx, qy,
+        mx, my, p_M, M_sq, q_hat, q_p):
+    """
+    Compiled spin cross sections for :func:`_calc_Iqxy_magnetic_elements_channels`,
+    with the Q points shared among threads.
+    """
+    channels = np.empty((4, len(qx)))
+    for k in prange(len(qx)):
+        dd, du, ud, uu = 0j, 0j, 0j, 0j
+        for e in range(len(rho)):
+            transform = _element_transform_kernel(
+                e, qx[k], qy[k], vol, normals, rn_norm, edges, midpoints, edge_normals, first_edges)
+            # as _element_perp
+            q_M = q_hat[0, k]*mx[e] + q_hat[1, k]*my[e]
+            perpx = p_M[e] - q_p[k] * q_M
+            perpz = -q_p[k] * perpx
+            perpy = math.sqrt(max(M_sq[e] - q_M**2 - perpx**2 - perpz**2, 0.0))
+            dd += (rho[e] - perpx) * transform
+            du += complex(perpy, -perpz) * transform
+            ud += complex(perpy, perpz) * transform
+            uu += (rho[e] + perpx) * transform
+        channels[0, k] = dd.real**2 + dd.imag**2
+        channels[1, k] = du.real**2 + du.imag**2
+        channels[2, k] = ud.real**2 + ud.imag**2
+        channels[3, k] = uu.real**2 + uu.imag**2
+    return channels
 
 def element_transform(geometry, normals, rn_norm, volumes, qx, qy):
     """carries out fourier transform on elements
@@ -37,6 +37,8 @@ class ResolutionCalculator:
         # 2d image of the resolution
         self.image = []
         self.image_lam = []
+        # q range and qx, qy values of the image pixels
+        self._image_grid = None
         # resolutions
         # lamda in r-direction
         self.sigma_lamd = 0
@@ -190,6 +192,41 @@ class ResolutionCalculator:
         # plot image
         return self.plot_image(self.image)
 
+    def compute_map(self, qx_value, qy_value, wavelengths=None,
+                    wavelength_spreads=None):
+        """
+        Compute the resolution at every point of the given q arrays, e.g.
+        all the pixels of a detector
+
+        : qx_value: array of x components of q
+        : qy_value: array of y components of q
+        : wavelengths: list of wavelengths; defaults to the wave list
+        : wavelength_spreads: list of wavelength spreads matching wavelengths
+
+        : return: sigma_1, sigma_2, sigma_r and sigma_1d arrays with the
+            shape of qx_value, averaged over the wavelengths weighted by
+            their intensities as in compute_and_plot
+        """
+        self.get_all_instrument_params()
+        if wavelengths is None:
+            wavelengths, wavelength_spreads = self.get_wave_list()
+        qx_value, qy_value = np.broadcast_arrays(np.asarray(qx_value, dtype=float),
+                                                 np.asarray(qy_value, dtype=float))
+        tof = len(wavelengths) > 1
+        # sums of the variances weighted by intensity
+        variances = np.zeros((4,) + qx_value.shape)
+        total_intensity = 0
+        for lam, dlam in zip(wavelengths, wavelength_spreads):
+            intens = self.setup_tof(lam, dlam)
+            sigmas = self.compute(lam, dlam, qx_value, qy_value, tof=tof)[2:]
+            for variance, sigma in zip(variances, sigmas):
+                variance += sigma * sigma * intens
+            total_intensity += intens
+        if total_intensity != 0:
+            variances /= total_intensity
+        sigma_1, sigma_2, sigma_r, sigma1d = np.sqrt(variances)
+        return sigma_1, sigma_2, sigma_r, sigma1d
+
     def setup_tof(self, wavelength, wavelength_spread):
         """
         Setup all parameters in instrument
@@ -211,8 +248,8 @@ class ResolutionCalculator:
                 coord='cartesian', tof=False):
         """
         Compute the Q resoltuion in || and + direction of 2D
-        : qx_value: x component of q
-        : qy_value: y component of q
+        : qx_value: x component of q; a number or an array
+        : qy_value: y component of q; a number or an array
         """
         coord = 'cartesian'
         lamb = wavelength
@@ -230,11 +267,8 @@ class ResolutionCalculator:
         # vacuum wave transfer
         knot = 2*pi/lamb
         # scattering angle theta; always true for plane detector
-        # aligned vertically to the ko direction
-        if qr_value > knot:
-            theta = pi/2
-        else:
-            theta = math.asin(qr_value/knot)
+        # aligned vertically to the ko direction; pi/2 for qr_value > knot
+        theta = np.arcsin(np.minimum(qr_value/knot, 1.0))
         # source aperture size
         rone = self.source_aperture_size
         # sample aperture size
@@ -256,7 +290,7 @@ class ResolutionCalculator:
         l1_cor = (l_ssa * l_two) / (l_sas + l_two)
         lp_cor = (l_ssa * l_two) / (l_one + l_two)
         # the radial distance to the pixel from the center of the detector
-        radius = math.tan(theta) * l_two
+        radius = np.tan(theta) * l_two
         #Lp = l_one*l_two/(l_one+l_two)
         # default polar coordinate
         comp1 = 'radial'
@@ -293,7 +327,7 @@ class ResolutionCalculator:
         #sigma_1 += sigma_wave_1
         # normalize
         sigma_1 = knot * sqrt(sigma_1 / 12)
-        sigma_r = knot * sqrt(sigma_wave_1 / (tof_factor *12))
+        sigma_r = knot * np.sqrt(sigma_wave_1 / (tof_factor *12))
         # sigma in the phi/y direction
         # for source apperture
         sigma_2 = self.get_variance(rone, l1_cor, phi, comp2)
@@ -325,7 +359,7 @@ class ResolutionCalculator:
         #sigma_2 += sigma_wave_2
         # normalize
         sigma_2 = knot * sqrt(sigma_2 / 12)
-        sigma1d = sqrt(variance_1d_1 + variance_1d_2)
+        sigma1d = np.sqrt(variance_1d_1 + variance_1d_2)
         # set sigmas
         self.sigma_1 = sigma_1
         self.sigma_lamd = sigma_r
@@ -389,11 +423,7 @@ class ResolutionCalculator:
             return None
 
         # Make an empty graph in the detector scale
-        dx_size = (self.qx_max - self.qx_min) / (1000 - 1)
-        dy_size = (self.qy_max - self.qy_min) / (1000 - 1)
-        x_val = np.arange(self.qx_min, self.qx_max, dx_size)
-        y_val = np.arange(self.qy_max, self.qy_min, -dy_size)
-        q_1, q_2 = np.meshgrid(x_val, y_val)
+        q_1, q_2 = self._get_image_grid()
         #q_phi = numpy.arctan(q_1,q_2)
         # check whether polar or cartesian
         if coord == 'polar':
@@ -429,6 +459,22 @@ class ResolutionCalculator:
 
         return self.image_lam
 
+    def _get_image_grid(self):
+        """
+        Get the qx, qy values of the image pixels over the current q range.
+
+        The grid is kept while the q range is unchanged, as it usually is
+        between the wavelengths of a calculation.
+        """
+        q_range = (self.qx_min, self.qx_max, self.qy_min, self.qy_max)
+        if self._image_grid is None or self._image_grid[0] != q_range:
+            dx_size = (self.qx_max - self.qx_min) / (1000 - 1)
+            dy_size = (self.qy_max - self.qy_min) / (1000 - 1)
+            x_val = np.arange(self.qx_min, self.qx_max, dx_size)
+            y_val = np.arange(self.qy_max, self.qy_min, -dy_size)
+            self._image_grid = (q_range, np.meshgrid(x_val, y_val))
+        return self._image_grid[1]
+
     def plot_image(self, image):
         """
         Plot image using pyplot
@@ -474,11 +520,11 @@ class ResolutionCalculator:
 
         # define sigma component direction
         if comp == 'radial':
-            phi_x = math.cos(phi)
-            phi_y = math.sin(phi)
+            phi_x = np.cos(phi)
+            phi_y = np.sin(phi)
         elif comp == 'phi':
-            phi_x = math.sin(phi)
-            phi_y = math.cos(phi)
+            phi_x = np.sin(phi)
+            phi_y = np.cos(phi)
         elif comp == 'x':
             phi_x = 1
             phi_y = 0
@@ -513,7 +559,8 @@ class ResolutionCalculator:
         """
         Get the variance when the wavelength spread is given
 
-        : radius: the radial distance from the beam center to the pix of q
+        : radius: the radial distance from the beam center to the pix of q;
+            a number or an array, as is phi
         : distance: sample to detector distance
         : spread: wavelength spread (ratio)
         : comp: direction of the sigma; can be 'phi', 'y', 'x', and 'radial'
@@ -527,27 +574,27 @@ class ResolutionCalculator:
             return 0, 0
         else:
             # calculate sigma^2 for 1d
-            sigma1d = 2 * math.pow(radius/distance*spread, 2)
+            sigma1d = 2 * (radius/distance*spread)**2
             if comp == 'x':
-                sigma1d *= (math.cos(phi)*math.cos(phi))
+                sigma1d *= (np.cos(phi)*np.cos(phi))
             elif comp == 'y':
-                sigma1d *= (math.sin(phi)*math.sin(phi))
+                sigma1d *= (np.sin(phi)*np.sin(phi))
             else:
                 sigma1d *= 1
             # sigma^2 for 2d
             # shift the coordinate due to the gravitational shift
-            rad_x = radius * math.cos(phi)
-            rad_y = A_value - radius * math.sin(phi)
-            radius = math.sqrt(rad_x * rad_x + rad_y * rad_y)
+            rad_x = radius * np.cos(phi)
+            rad_y = A_value - radius * np.sin(phi)
+            radius = np.sqrt(rad_x * rad_x + rad_y * rad_y)
             # new phi
-            phi = math.atan2(-rad_y, rad_x)
+            phi = np.arctan2(-rad_y, rad_x)
             self.gravity_phi = phi
             # calculate sigma^2
-            sigma = 2 * math.pow(radius/distance*spread, 2)
+            sigma = 2 * (radius/distance*spread)**2
             if comp == 'x':
-                sigma *= (math.cos(phi)*math.cos(phi))
+                sigma *= (np.cos(phi)*np.cos(phi))
             elif comp == 'y':
-                sigma *= (math.sin(phi)*math.sin(phi))
+                sigma *= (np.sin(phi)*np.sin(phi))
             else:
                 sigma *= 1
 
@@ -967,7 +1014,7 @@ class ResolutionCalculator:
 
         : return phi: the azimuthal angle of q on x-y plane
         """
-        phi = math.atan2(qy_value, qx_value)
+        phi = np.arctan2(qy_value, qx_value)
         return phi
 
     def _get_detector_qxqy_pixels(self):
@@ -1039,17 +1086,8 @@ class ResolutionCalculator:
         detector_ind_x = detector_ind_x * pix_x_size
         detector_ind_y = detector_ind_y * pix_y_size
 
-        qx_value = np.zeros(len(detector_ind_x))
-        qy_value = np.zeros(len(detector_ind_y))
-        i = 0
-
-        for indx in detector_ind_x:
-            qx_value[i] = self._get_qx(indx, sample2detector_distance, wavelength)
-            i += 1
-        i = 0
-        for indy in detector_ind_y:
-            qy_value[i] = self._get_qx(indy, sample2detector_distance, wavelength)
-            i += 1
+        qx_value = self._get_qx(detector_ind_x, sample2detector_distance, wavelength)
+        qy_value = self._get_qx(detector_ind_y, sample2detector_distance, wavelength)
 
         # qx_value and qy_value values in array
         qx_value = qx_value.repeat(detector_pix_nums_y)
@@ -1116,7 +1154,7 @@ class ResolutionCalculator:
         : return qr_value, phi
         """
         # find |q| on detector plane
-        qr_value = sqrt(qx_value*qx_value + qy_value*qy_value)
+        qr_value = np.sqrt(qx_value*qx_value + qy_value*qy_value)
         # find angle phi
         phi = self._atan_phi(qy_value, qx_value)
 
@@ -0,0 +1,162 @@
+"""
+Disk cache for the results of expensive calculations.
+
+Results are numpy arrays stored under the SasView cache directory, one file
+per result, named by a hash of everything the result depends on. Files are
+used in least-recently-used order: reading a result touches its file, and
+when the cache grows past its size limit the files that have gone longest
+without use are deleted.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from sas.system.user import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(*parts):
+    """
+    Hash of *parts*, which may be arrays, scalars, strings, None, or
+    sequences of these. Arrays are hashed by type, shape and content.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+
+    def update(part):
+        if isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part)
+            digest.update(("%s%s" % (part.dtype.str, part.shape)).encode())
+            digest.update(part.data if part.dtype != object else pickle.dumps(part))
+        elif isinstance(part, (list, tuple)):
+            digest.update(b"(%d" % len(part))
+            for item in part:
+                update(item)
+            digest.update(b")")
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b";")
+
+    for part in parts:
+        update(part)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache of arrays in *name* under the SasView cache directory, keyed by
+    :func:`content_hash`, holding at most *max_bytes* of results.
+
+    The cache may be shared by threads and by several SasView processes.
+    *hits* and *misses* count the lookups made through this object.
+    """
+    def __init__(self, name, max_bytes=512*2**20, directory=None):
+        self.directory = Path(directory) if directory is not None else get_cache_dir() / name
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return self.directory / (key + ".npy")
+
+    def get(self, key):
+        """
+        Result stored for *key*, or None if there is none.
+        """
+        path = self._path(key)
+        try:
+            result = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            # Mark the result as recently used
+            os.utime(path)
+        except OSError:
+            # A read-only cache still gives results, in the order they were stored
+            pass
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Store *result* for *key*, evicting old results to stay in the size
+        limit. Results larger than the whole cache are not stored.
+        """
+        result = np.asarray(result)
+        if result.nbytes > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file so other readers never see part of a result
+            handle, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(handle, "wb") as file:
+                np.save(file, result, allow_pickle=False)
+            os.replace(temp, self._path(key))
+        except OSError as exc:
+            logger.warning("Could not cache result in %s: %s", self.directory, exc)
+            return
+        self._evict()
+
+    def _entries(self):
+        """
+        (last use, size, path) of each result in the cache.
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(".npy"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """
+        Delete all results in the cache.
+        """
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        """
+        Dict of the *hits* and *misses* of this object and the number of
+        *entries* and *bytes* in the cache.
+        """
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
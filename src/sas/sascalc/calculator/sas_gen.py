@@ -6,6 +6,8 @@ Calculation checked by sampling from an ellipsoid and comparing Iq with the
 1D, 2D oriented and 2D oriented magnetic analytical model from sasmodels.
 """
 
+import io
+import itertools
 import logging
 import os
 import sys
@@ -26,6 +28,8 @@ MFACTOR_MT = 2.3128E-9
 METER2ANG = 1.0E+10
 # Avogadro constant [1/mol]
 NA = 6.02214129e+23
+# Number of points in each part of a file given by the read_chunks methods
+CHUNK_SIZE = 2**18
 
 def _vec(v):
     return np.ascontiguousarray(v, 'd') if v is not None else None
@@ -60,6 +64,10 @@ class ComputationType(Enum):
     SANS_1D_BETA = 2
     SAXS = 3
 
+class DebyeEngine(Enum):
+    EXACT = 0
+    HISTOGRAM = 1
+
 class GenSAS:
     """
     Generic SAS computation Model based on sld (n & m) arrays
@@ -83,6 +91,8 @@ class GenSAS:
         self.is_avg = False
         self.is_elements = False
         self.type = ComputationType.SANS_2D
+        self.debye_engine = DebyeEngine.EXACT
+        self.grid_spacing = None
         ## Name of the model
         self.name = "GenSAS"
         ## Define parameters
@@ -98,8 +108,14 @@ class GenSAS:
         self.uvw_to_UVW=Rotation.from_rotvec([0,0,0])
         self.xyz_to_UVW=Rotation.from_rotvec([0,0,0])
         self.transformed_positions = None
+        self.transformed_element_geometry = None
         self.transformed_magnetic_slds = None
         self.transformed_angles = None
+        ## Optional ResultCache for the unscaled intensity
+        self.cache = None
+        self._data_hash = None
+        ## Key and intensities of the last spin cross sections computed
+        self._spin_channels = None
         self.description = 'GenSAS'
         ## Parameter details [units, min, max]
         self.details = {}
@@ -120,6 +136,39 @@ class GenSAS:
         """
         self.type = computation_type
 
+    def set_debye_engine(self, engine: DebyeEngine, grid_spacing=None):
+        """
+        Set the engine used for the 1D Debye calculation.
+
+        DebyeEngine.HISTOGRAM histograms the pair distances on a grid with
+        *grid_spacing* [A] rather than evaluating the full double sum.  If
+        *grid_spacing* is None the lattice step is used for voxel data, for
+        which the histogram is exact up to distance binning; other data uses
+        the finest isotropic grid that fits in memory.
+        """
+        self.debye_engine = engine
+        self.grid_spacing = grid_spacing
+
+    def get_grid_spacing(self):
+        """
+        Get the grid spacing [A] used by the histogram Debye engine for the
+        current data, or None if the exact engine is selected.
+        """
+        from .geni import grid_spacing_for_limit, lattice_spacing
+        if self.debye_engine is not DebyeEngine.HISTOGRAM:
+            return None
+        if self.grid_spacing is not None:
+            return self.grid_spacing
+        # Pair distances do not depend on the sample orientation, so the
+        # lattice is detected on the untransformed positions.
+        coords = np.vstack((self.data_x, self.data_y, self.data_z))
+        spacing = lattice_spacing(coords)
+        if spacing is None:
+            spacing = grid_spacing_for_limit(coords)
+            logger.info("Debye histogram grid spacing %g A; pair distances"
+                        " are accurate to %g A", spacing[0], np.sqrt(3)*spacing[0])
+        return spacing
+
     def set_pixel_volumes(self, volume):
         """
         Set the volume of a pixel in (A^3) unit
@@ -128,6 +177,7 @@ class GenSAS:
         if self.data_vol is None:
             raise TypeError("data_vol is missing")
         self.data_vol = volume
+        self._data_hash = None
 
     def set_is_avg(self, is_avg=False):
         """
@@ -139,8 +189,10 @@ class GenSAS:
         """Set previous transformations as invalid
         """
         self.transformed_positions = None
+        self.transformed_element_geometry = None
         self.transformed_magnetic_slds = None
         self.transformed_angles = None
+        self._data_hash = None
 
     def transform_positions(self):
         """Transform position data"""
@@ -150,6 +202,14 @@ class GenSAS:
         self.transformed_positions = np.transpose(self.xyz_to_UVW.apply(position_data))
         return self.transformed_positions
 
+    def transform_element_geometry(self):
+        """Geometry of the elements in beamline coords, for the element transform"""
+        from .geni import element_geometry
+        if self.transformed_element_geometry is None:
+            x, y, z = self.transform_positions()
+            self.transformed_element_geometry = element_geometry(x, y, z, self.data_elements)
+        return self.transformed_element_geometry
+
     def transform_magnetic_slds(self):
         if self.transformed_magnetic_slds is not None:
             return self.transformed_magnetic_slds
@@ -182,14 +242,69 @@ class GenSAS:
         self.transformed_angles = (s_theta, s_phi)
         return self.transformed_angles
 
-    def calculate_Iq(self, qx, qy=None):
+    def cache_key(self, qx, qy=None, spin_fractions=True):
+        """
+        Hash of the inputs to the intensity calculation at *qx*, *qy*, that
+        is, everything but the scale, background and total volume.
+        With *spin_fractions* False, the polarizer and analyzer fractions are
+        left out, giving the key for the spin cross sections of a 2D
+        calculation.
+        """
+        from .result_cache import content_hash
+        if self._data_hash is None:
+            elements = self.data_elements if self.is_elements else None
+            self._data_hash = content_hash(
+                self.data_x, self.data_y, self.data_z, self.data_sldn,
+                self.data_mx, self.data_my, self.data_mz, self.data_vol, elements)
+        if self.type is ComputationType.SANS_2D:
+            # The spin state only matters for 2D calculations
+            names = ('Up_frac_in', 'Up_frac_out', 'Up_theta', 'Up_phi') if spin_fractions else ('Up_theta', 'Up_phi')
+            spin = [self.params[name] for name in names]
+            spin.append(self.uvw_to_UVW.as_matrix())
+        else:
+            spin = [self.is_avg, self.debye_engine.name, self.grid_spacing]
+        qy = None if qy is None else _vec(qy)
+        return content_hash(self.type.name, self._data_hash, self.params['solvent_SLD'],
+                            self.xyz_to_UVW.as_matrix(), spin, _vec(qx), qy)
+
+    def calculate_Iq(self, qx, qy=None, chunks=None):
         """
         Evaluate the function
         :Param x: array of x-values
         :Param y: array of y-values
+        :Param chunks: optional iterable of MagSLD parts of a sample, such as
+            the read_chunks method of the readers gives, to compute the 2D
+            intensity of instead of the data from set_sld_data. The parts
+            are summed one at a time, so the whole sample is never in memory.
         :return: function value
         """
-        from .geni import Iq, Iqxy
+        if chunks is not None:
+            # The total volume is taken to be that of the whole sample, as
+            # set_sld_data gives
+            I_out = self._calculate_chunked_Iq(qx, qy, chunks)
+            return self.params['scale'] * I_out + self.params['background']
+
+        # Only the unscaled intensity is cached, so that changing the scale
+        # or background does not need a new calculation
+        I_out = None
+        if self.cache is not None and self.type is not ComputationType.SAXS:
+            key = self.cache_key(qx, qy)
+            I_out = self.cache.get(key)
+        if I_out is None:
+            I_out = self._calculate_unscaled_Iq(qx, qy)
+            if self.cache is not None:
+                self.cache.put(key, I_out)
+
+        vol_correction = self.data_total_volume / self.params['total_volume']
+        result = ((self.params['scale'] * vol_correction) * I_out
+                  + self.params['background'])
+        return result
+
+    def _calculate_unscaled_Iq(self, qx, qy=None):
+        """
+        Intensity before scaling to the total volume and adding background.
+        """
+        from .geni import Iq, Iqxy, Iqxy_channels, weight_spin_channels
         # transform position data from sample to beamline coords
         x, y, z = self.transform_positions()
         sld = self.data_sldn - self.params['solvent_SLD']
@@ -210,30 +325,79 @@ class GenSAS:
                 s_theta, s_phi = self.transform_angles()
 
                 if self.is_elements:
-                    I_out = Iqxy(
-                        qx, qy, x, y, z, sld, vol, mx, my, mz,
-                        in_spin, out_spin, s_theta, s_phi,
-                        self.data_elements, self.is_elements)
+                    elements, geometry = self.data_elements, self.transform_element_geometry()
+                else:
+                    elements, geometry = None, None
+                # The spin cross sections do not depend on the polarizer and
+                # analyzer fractions, so keep them to reweight when only those change
+                key = self.cache_key(qx, qy, spin_fractions=False)
+                if self._spin_channels is None or self._spin_channels[0] != key:
+                    channels = Iqxy_channels(
+                        qx, qy, x, y, z, sld, vol, mx, my, mz, s_theta, s_phi,
+                        elements, self.is_elements, geometry)
+                    self._spin_channels = (key, channels)
+                channels = self._spin_channels[1]
+                if channels is not None:
+                    I_out = weight_spin_channels(channels, in_spin, out_spin)
                 else:
                     I_out = Iqxy(
                         qx, qy, x, y, z, sld, vol, mx, my, mz,
                         in_spin, out_spin, s_theta, s_phi,
-                        )
+                        elements, self.is_elements, geometry)
 
             case ComputationType.SANS_1D | ComputationType.SANS_1D_BETA:
                 # 1-D calculation
                 q = _vec(qx)
+                grid_spacing = None
                 if self.is_avg:
                     x, y, z = transform_center(x, y, z)
-                I_out = Iq(q, x, y, z, sld, vol, is_avg=self.is_avg)
+                else:
+                    grid_spacing = self.get_grid_spacing()
+                    if grid_spacing is not None:
+                        x, y, z = self.data_x, self.data_y, self.data_z
+                I_out = Iq(q, x, y, z, sld, vol, is_avg=self.is_avg,
+                           grid_spacing=grid_spacing)
 
             case ComputationType.SAXS:
                 raise RuntimeError("SAXS calculations can only be performed through a plugin model! Please click the \"plugin model\" button instead.")
 
-        vol_correction = self.data_total_volume / self.params['total_volume']
-        result = ((self.params['scale'] * vol_correction) * I_out
-                  + self.params['background'])
-        return result
+        return I_out
+
+    def _calculate_chunked_Iq(self, qx, qy, chunks):
+        """
+        Unscaled 2D intensity of the sample in *chunks*, found from the sum of
+        the scattering amplitudes of each part.
+        """
+        from .geni import Fqxy_channels, weight_spin_channels
+        if self.type is not ComputationType.SANS_2D or qy is None:
+            raise ValueError("Only SANS_2D intensities can be computed from chunks of the data")
+        qx, qy = _vec(qx), _vec(qy)
+        s_theta, s_phi = self.transform_angles()
+        amplitudes = 0
+        is_magnetic = False
+        # volume of the points with sld, and with sld or magnetism
+        nuclear_volume = magnetic_volume = 0.0
+        for chunk in chunks:
+            x, y, _ = self.xyz_to_UVW.apply(np.column_stack((chunk.pos_x, chunk.pos_y, chunk.pos_z))).T
+            sld = _vec(chunk.sld_n) - self.params['solvent_SLD']
+            vol = _vec(chunk.vol_pix)
+            if chunk.sld_mx is not None and chunk.sld_my is not None and chunk.sld_mz is not None:
+                M = np.column_stack([_vec(m) for m in (chunk.sld_mx, chunk.sld_my, chunk.sld_mz)])
+                mx, my, mz = self.xyz_to_UVW.apply(M).T
+                magnetic_index = (mx != 0.) | (my != 0.) | (mz != 0.)
+            else:
+                mx = my = mz = None
+                magnetic_index = False
+            F, chunk_is_magnetic = Fqxy_channels(qx, qy, x, y, sld, vol, mx, my, mz, s_theta, s_phi)
+            amplitudes = amplitudes + F
+            is_magnetic |= chunk_is_magnetic
+            nuclear_volume += np.sum(vol[sld != 0.])
+            magnetic_volume += np.sum(vol[(sld != 0.) | magnetic_index])
+        intensities = amplitudes.real**2 + amplitudes.imag**2
+        if is_magnetic:
+            I_out = weight_spin_channels(intensities, self.params['Up_frac_in'], self.params['Up_frac_out'])
+            return I_out * (1.0E+8/magnetic_volume)
+        return intensities[0] * (1.0E+8/nuclear_volume)
 
     def set_rotations(self, uvw_to_UVW=Rotation.from_rotvec([0,0,0]), xyz_to_UVW=Rotation.from_rotvec([0,0,0])):
         """Set the rotations for the coordinate systems
@@ -1043,133 +1207,27 @@ class OMFReader:
     ## List of allowed extensions
     ext = ['.omf', '.OMF']
 
+    ## Header entries that are kept, matched anywhere in the key
+    _header_keys = ('title', 'meshtype', 'xbase', 'ybase', 'zbase',
+                    'xstepsize', 'ystepsize', 'zstepsize', 'xnodes', 'ynodes', 'znodes',
+                    'xmin', 'ymin', 'zmin', 'xmax', 'ymax', 'zmax', 'valuemultiplier')
+    ## Check values at the start of OVF binary data, by bytes per value
+    _binary_check = {4: 1234567.0, 8: 123456789012345.0}
+
     def read(self, path):
         """
         Load data file
         :param path: file path
         :return: x, y, z, sld_n, sld_mx, sld_my, sld_mz
         """
-        desc = ""
-        mx = []
-        my = []
-        mz = []
         try:
-            input_f = open(path, 'rb')
-            buff = decode(input_f.read())
-            lines = buff.split('\n')
-            input_f.close()
-            output = OMFData()
-            valueunit = None
-            for line in lines:
-                line = line.strip()
-                # Read data
-                if line and not line.startswith('#'):
-                    try:
-                        toks = line.split()
-                        _mx = float(toks[0])
-                        _my = float(toks[1])
-                        _mz = float(toks[2])
-                        _mx = mag2sld(_mx, valueunit)
-                        _my = mag2sld(_my, valueunit)
-                        _mz = mag2sld(_mz, valueunit)
-                        mx.append(_mx)
-                        my.append(_my)
-                        mz.append(_mz)
-                    except Exception as exc:
-                        # Skip non-data lines
-                        logger.error(str(exc)+" when processing %r"%line)
-                elif line:
-                # Reading Header; Segment count ignored
-                    s_line = line.split(":", 1)
-                    if s_line[0].lower().count("oommf") > 0:
-                        if len(s_line) < 2:
-                            s_line = line.split(" ",1)
-                        oommf = s_line[1].strip()
-
-                    if s_line[0].lower().count("title") > 0:
-                        title = s_line[1].strip()
-                    if s_line[0].lower().count("desc") > 0:
-                        desc += s_line[1].strip()
-                        desc += '\n'
-                    if s_line[0].lower().count("meshtype") > 0:
-                        meshtype = s_line[1].strip()
-                    if s_line[0].lower().count("meshunit") > 0:
-                        meshunit = s_line[1].strip()
-                        if meshunit.count("m") < 1:
-                            msg = "Error: \n"
-                            msg += "We accept only m as meshunit"
-                            logger.error(msg)
-                            return None
-                    if s_line[0].lower().count("xbase") > 0:
-                        xbase = s_line[1].strip()
-                    if s_line[0].lower().count("ybase") > 0:
-                        ybase = s_line[1].strip()
-                    if s_line[0].lower().count("zbase") > 0:
-                        zbase = s_line[1].strip()
-                    if s_line[0].lower().count("xstepsize") > 0:
-                        xstepsize = s_line[1].strip()
-                    if s_line[0].lower().count("ystepsize") > 0:
-                        ystepsize = s_line[1].strip()
-                    if s_line[0].lower().count("zstepsize") > 0:
-                        zstepsize = s_line[1].strip()
-                    if s_line[0].lower().count("xnodes") > 0:
-                        xnodes = s_line[1].strip()
-                    if s_line[0].lower().count("ynodes") > 0:
-                        ynodes = s_line[1].strip()
-                    if s_line[0].lower().count("znodes") > 0:
-                        znodes = s_line[1].strip()
-                    if s_line[0].lower().count("xmin") > 0:
-                        xmin = s_line[1].strip()
-                    if s_line[0].lower().count("ymin") > 0:
-                        ymin = s_line[1].strip()
-                    if s_line[0].lower().count("zmin") > 0:
-                        zmin = s_line[1].strip()
-                    if s_line[0].lower().count("xmax") > 0:
-                        xmax = s_line[1].strip()
-                    if s_line[0].lower().count("ymax") > 0:
-                        ymax = s_line[1].strip()
-                    if s_line[0].lower().count("zmax") > 0:
-                        zmax = s_line[1].strip()
-                    if s_line[0].lower().count("valueunit") > 0:
-                        valueunit = s_line[1].strip()
-                        if valueunit.count("mT") < 1 and valueunit.count("A/m") < 1:
-                            msg = "Error: \n"
-                            msg += "We accept only mT or A/m as valueunit"
-                            logger.error(msg)
-                            return None
-                        elif "mT" in valueunit or "A/m" in valueunit:
-                            valueunit = valueunit.split(" ", 1)
-                            valueunit = valueunit[0].strip()
-                    if s_line[0].lower().count("valuemultiplier") > 0:
-                        valuemultiplier = s_line[1].strip()
-                    else:
-                        valuemultiplier = 1
-                    if s_line[0].lower().count("end") > 0:
-                        output.filename = os.path.basename(path)
-                        output.oommf = oommf
-                        output.title = title
-                        output.desc = desc
-                        output.meshtype = meshtype
-                        output.xbase = float(xbase) * METER2ANG
-                        output.ybase = float(ybase) * METER2ANG
-                        output.zbase = float(zbase) * METER2ANG
-                        output.xstepsize = float(xstepsize) * METER2ANG
-                        output.ystepsize = float(ystepsize) * METER2ANG
-                        output.zstepsize = float(zstepsize) * METER2ANG
-                        output.xnodes = float(xnodes)
-                        output.ynodes = float(ynodes)
-                        output.znodes = float(znodes)
-                        output.xmin = float(xmin) * METER2ANG
-                        output.ymin = float(ymin) * METER2ANG
-                        output.zmin = float(zmin) * METER2ANG
-                        output.xmax = float(xmax) * METER2ANG
-                        output.ymax = float(ymax) * METER2ANG
-                        output.zmax = float(zmax) * METER2ANG
-                        output.valuemultiplier = valuemultiplier
-            mx = np.reshape(mx, (len(mx),))
-            my = np.reshape(my, (len(my),))
-            mz = np.reshape(mz, (len(mz),))
-            output.set_m(mx, my, mz)
+            with open(path, 'rb') as input_f:
+                output, data_format = self._read_header(input_f, path)
+                if output is None:
+                    return None
+                count = int(output.xnodes * output.ynodes * output.znodes)
+                m = next(self._value_blocks(input_f, data_format, output, count))
+            output.set_m(*mag2sld(m.T, output.valueunit))
             omf2sld = OMF2SLD()
             omf2sld.set_data(output)
             output = omf2sld.get_output()
@@ -1180,6 +1238,150 @@ class OMFReader:
             logger.warning(msg)
             return None
 
+    def read_chunks(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Load a data file in parts of at most *chunk_size* points, for files
+        too large to hold in memory at once. Text data is parsed a block of
+        lines at a time, and binary data is memory mapped.
+
+        :param path: file path
+        :return: iterator of MagSLD
+        :raise ValueError: when the file can't be read
+        """
+        with open(path, 'rb') as input_f:
+            output, data_format = self._read_header(input_f, path)
+            if output is None:
+                raise ValueError("%s is not supported" % path)
+            nodes = np.array([output.xnodes, output.ynodes, output.znodes], dtype=int)
+            start = np.array([output.xmin, output.ymin, output.zmin])
+            step = np.array([output.xstepsize, output.ystepsize, output.zstepsize])
+            # Pixels have the volume MagSLD.set_stepsize gives them, which
+            # keeps the default step of 6 A along an axis with a single node
+            vol = np.prod(np.where(nodes > 1, step, 6.0))
+            first = 0
+            for m in self._value_blocks(input_f, data_format, output, np.prod(nodes), chunk_size):
+                index = np.arange(first, first + len(m))
+                first += len(m)
+                # x varies fastest, then y, then z
+                ix, iy, iz = index % nodes[0], index // nodes[0] % nodes[1], index // (nodes[0] * nodes[1])
+                mx, my, mz = mag2sld(m.T, output.valueunit)
+                chunk = MagSLD(start[0] + ix * step[0], start[1] + iy * step[1], start[2] + iz * step[2],
+                               np.zeros(len(m)), mx, my, mz, np.full(len(m), vol))
+                chunk.set_pix_type('pixel')
+                chunk.filename = output.filename
+                yield chunk
+
+    def _read_header(self, input_f, path):
+        """
+        Read the header of the OMF file *input_f*, leaving it at the start
+        of the data.
+
+        :return: OMFData for the header, with the value unit of the data in
+            its *valueunit*, and the data format, one of 'text', 'binary 4'
+            or 'binary 8'; or (None, None) if the units are not supported
+        """
+        header = {}
+        desc = ""
+        oommf = ""
+        valueunit = None
+        data_format = None
+        for raw in input_f:
+            line = decode(raw).strip()
+            if not line:
+                continue
+            # Reading Header; Segment count ignored
+            s_line = line.split(":", 1)
+            key = s_line[0].lower()
+            if key.count("oommf") > 0:
+                if len(s_line) < 2:
+                    s_line = line.split(" ", 1)
+                oommf = s_line[1].strip()
+            elif key.count("begin") > 0 and s_line[1].strip().lower().startswith("data"):
+                data_format = " ".join(s_line[1].lower().split()[1:])
+                break
+            elif key.count("desc") > 0:
+                desc += s_line[1].strip()
+                desc += '\n'
+            elif key.count("meshunit") > 0:
+                meshunit = s_line[1].strip()
+                if meshunit.count("m") < 1:
+                    msg = "Error: \n"
+                    msg += "We accept only m as meshunit"
+                    logger.error(msg)
+                    return None, None
+            elif key.count("valueunit") > 0:
+                valueunit = s_line[1].strip()
+                if valueunit.count("mT") < 1 and valueunit.count("A/m") < 1:
+                    msg = "Error: \n"
+                    msg += "We accept only mT or A/m as valueunit"
+                    logger.error(msg)
+                    return None, None
+                valueunit = valueunit.split(" ", 1)[0].strip()
+            else:
+                for name in self._header_keys:
+                    if key.count(name) > 0:
+                        header[name] = s_line[1].strip()
+        if data_format not in ('text', 'binary 4', 'binary 8'):
+            raise ValueError("no supported data segment in %s" % path)
+
+        output = OMFData()
+        output.filename = os.path.basename(path)
+        output.oommf = oommf
+        output.title = header.get('title', '')
+        output.desc = desc
+        output.meshtype = header.get('meshtype', '')
+        for name in ('xbase', 'ybase', 'zbase', 'xstepsize', 'ystepsize', 'zstepsize',
+                     'xmin', 'ymin', 'zmin', 'xmax', 'ymax', 'zmax'):
+            setattr(output, name, float(header[name]) * METER2ANG)
+        for name in ('xnodes', 'ynodes', 'znodes'):
+            setattr(output, name, float(header[name]))
+        output.valuemultiplier = header.get('valuemultiplier', 1)
+        output.valueunit = valueunit
+        return output, data_format
+
+    def _value_blocks(self, input_f, data_format, output, count, chunk_size=None):
+        """
+        Read *count* rows of (mx, my, mz) from the data of *input_f*, in
+        blocks of *chunk_size* rows, or all at once if *chunk_size* is None.
+        """
+        chunk_size = chunk_size or count
+        if data_format == 'text':
+            text = io.TextIOWrapper(input_f, encoding='latin-1')
+            for first in range(0, count, chunk_size):
+                rows = min(chunk_size, count - first)
+                block = np.loadtxt(text, comments='#', usecols=(0, 1, 2), max_rows=rows, ndmin=2)
+                if len(block) != rows:
+                    raise ValueError("Error: Inconsistent data length.")
+                yield block
+        else:
+            size = int(data_format.split()[1])
+            # OVF 2.0 binary data is little endian, and OVF 1.0 big endian
+            dtype = np.dtype(('<' if '2.0' in output.oommf else '>') + 'f%d' % size)
+            check = np.fromfile(input_f, dtype=dtype, count=1)
+            if len(check) != 1 or check[0] != self._binary_check[size]:
+                raise ValueError("Error: Bad binary check value.")
+            values = np.memmap(input_f, dtype=dtype, mode='r', offset=input_f.tell(), shape=(count, 3))
+            for first in range(0, count, chunk_size):
+                yield np.asarray(values[first:first+chunk_size], dtype='d')
+
+def _pdb_atom_name(field):
+    """
+    Element symbol for the atom name *field*, columns 13-16 of a PDB ATOM line.
+    """
+    atom_name = field.strip()
+    try:
+        float(field[0])
+        atom_name = atom_name[1].upper()
+    except Exception:
+        if len(atom_name) == 4:
+            atom_name = atom_name[0].upper()
+        elif field[0] != ' ':
+            atom_name = atom_name[0].upper() + \
+                    atom_name[1].lower()
+        else:
+            atom_name = atom_name[0].upper()
+    return atom_name
+
 class PDBReader:
     """
     PDB reader class: limited for reading the lines starting with 'ATOM'
@@ -1201,19 +1403,9 @@ class PDBReader:
         :return: MagSLD
         :raise RuntimeError: when the file can't be opened
         """
-        pos_x = []
-        pos_y = []
-        pos_z = []
-        sld_n = []
-        sld_mx = []
-        sld_my = []
-        sld_mz = []
-        vol_pix = []
-        pix_symbol = []
+        atom_lines = []
         connected_pairs = set()
 
-        atom_value_dict = {}
-
         try:
             input_f = open(path, 'rb')
             buff = decode(input_f.read())
@@ -1223,48 +1415,7 @@ class PDBReader:
                 try:
                     # check if line starts with "ATOM"
                     if line[0:6] in ('ATM   ', 'ATOM  '):
-                        # define fields of interest
-                        atom_name = line[12:16].strip()
-                        try:
-                            float(line[12])
-                            atom_name = atom_name[1].upper()
-                        except Exception:
-                            if len(atom_name) == 4:
-                                atom_name = atom_name[0].upper()
-                            elif line[12] != ' ':
-                                atom_name = atom_name[0].upper() + \
-                                        atom_name[1].lower()
-                            else:
-                                atom_name = atom_name[0].upper()
-                        _pos_x = float(line[30:38].strip())
-                        _pos_y = float(line[38:46].strip())
-                        _pos_z = float(line[46:54].strip())
-                        pos_x.append(_pos_x)
-                        pos_y.append(_pos_y)
-                        pos_z.append(_pos_z)
-                        try:
-                            if atom_name in atom_value_dict:
-                                sld_n.append(atom_value_dict[atom_name][0])
-                                vol_pix.append(atom_value_dict[atom_name][1])
-                            else:
-                                val = nsf.neutron_sld(atom_name)[0]
-                                # sld in Ang^-2 unit
-                                val *= 1.0e-6
-                                sld_n.append(val)
-                                atom = formula(atom_name)
-                                # # cm to A units
-                                vol = 1.0e+24 * atom.mass / atom.density / NA
-                                vol_pix.append(vol)
-                                atom_value_dict[atom_name] = [val, vol]
-
-                        except Exception:
-                            self.logger.warning("Warning: set the sld of %s to zero"% atom_name)
-                            sld_n.append(0.0)
-
-                        sld_mx.append(0)
-                        sld_my.append(0)
-                        sld_mz.append(0)
-                        pix_symbol.append(atom_name)
+                        atom_lines.append(line)
 
                     elif line[0:6] == 'CONECT':
                         # Interpret the bonding section of the PDB
@@ -1297,41 +1448,86 @@ class PDBReader:
                     self.logger.error(f"Aborting reading of file {path}.")
                     return None
 
-            # Reshape stuff for file
-
-            pos_x = np.reshape(pos_x, (-1, ))
-            pos_y = np.reshape(pos_y, (-1, ))
-            pos_z = np.reshape(pos_z, (-1, ))
+            output = self._read_atoms(atom_lines, path)
+            if output is None:
+                return None
 
-            n_atoms = len(pos_x)
+            n_atoms = output.data_length
+            pos_x, pos_y, pos_z = output.pos_x, output.pos_y, output.pos_z
             ordered_pairs = sorted([(a, b) for a, b in connected_pairs if a < n_atoms and b < n_atoms])  # Why *not* sort
             x_lines = [(pos_x[a], pos_x[b]) for a, b in ordered_pairs]
             y_lines = [(pos_y[a], pos_y[b]) for a, b in ordered_pairs]
             z_lines = [(pos_z[a], pos_z[b]) for a, b in ordered_pairs]
-
-            sld_n = np.reshape(sld_n, (-1, ))
-
-            sld_mx = np.reshape(sld_mx, (-1, ))
-            sld_my = np.reshape(sld_my, (-1, ))
-            sld_mz = np.reshape(sld_mz, (-1, ))
-
-            vol_pix = np.reshape(vol_pix, (-1, ))
-            pix_symbol = np.reshape(pix_symbol, (-1, ))
-
-            output = MagSLD(pos_x, pos_y, pos_z, sld_n, sld_mx, sld_my, sld_mz)
             output.set_conect_lines(x_lines, y_lines, z_lines)
-            output.filename = os.path.basename(path)
-            output.set_pix_type('atom')
-            output.set_pixel_symbols(pix_symbol)
-            output.set_nodes()
-            output.set_pixel_volumes(vol_pix)
-            output.sld_unit = '1/A^(2)'
             return output
 
         except Exception as e:
             self.logger.exception(e)
             return None
 
+    def read_chunks(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Load the atoms of a data file in parts of at most *chunk_size* atoms,
+        for files too large to hold in memory at once. Bonds are not read.
+
+        :param path: file path
+        :return: iterator of MagSLD
+        :raise ValueError: when the file can't be read
+        """
+        with open(path, errors='replace') as input_f:
+            atom_lines = (line for line in input_f if line[0:6] in ('ATM   ', 'ATOM  '))
+            while lines := list(itertools.islice(atom_lines, chunk_size)):
+                output = self._read_atoms(lines, path)
+                if output is None:
+                    raise ValueError("Failed to read the atoms in %s" % path)
+                yield output
+
+    def _read_atoms(self, lines, path):
+        """
+        MagSLD for the atoms in the ATOM *lines* of the file at *path*, with
+        the coordinate columns of all lines parsed at once.
+        """
+        try:
+            names = {}
+            pix_symbol = np.array([names[field] if field in names else names.setdefault(field, _pdb_atom_name(field))
+                                   for field in (line[12:16] for line in lines)], dtype=str)
+            pos = np.array([(line[30:38], line[38:46], line[46:54]) for line in lines], dtype=str)
+            pos_x, pos_y, pos_z = pos.reshape(-1, 3).astype(float).T
+        except Exception as exc:
+            self.logger.error(f"Failed to read the atoms in {path}: {exc}")
+            return None
+
+        # sld in Ang^-2 unit, and volume in Ang^3, of each element in the file
+        symbols, index = np.unique(pix_symbol, return_inverse=True)
+        values = np.array([self._atom_values(symbol) for symbol in symbols]).reshape(-1, 2)
+        sld_n, vol_pix = values[index.ravel()].T
+        zeros = np.zeros(len(pos_x))
+
+        output = MagSLD(pos_x, pos_y, pos_z, sld_n, zeros, zeros, zeros, vol_pix)
+        output.filename = os.path.basename(path)
+        output.set_pix_type('atom')
+        output.set_pixel_symbols(pix_symbol)
+        output.set_nodes()
+        output.sld_unit = '1/A^(2)'
+        return output
+
+    def _atom_values(self, atom_name):
+        """
+        Neutron sld and volume of the element *atom_name*, or zero for both
+        if it is not known.
+        """
+        try:
+            val = nsf.neutron_sld(atom_name)[0]
+            # sld in Ang^-2 unit
+            val *= 1.0e-6
+            atom = formula(atom_name)
+            # # cm to A units
+            vol = 1.0e+24 * atom.mass / atom.density / NA
+            return val, vol
+        except Exception:
+            self.logger.warning("Warning: set the sld of %s to zero"% atom_name)
+            return 0.0, 0.0
+
     def write(self, path, data):
         """
         Write
@@ -1376,6 +1572,40 @@ class SLDReader:
         if data is None or data.shape[0] not in (4, 6, 7, 8):
             logger.error("%r is not an sld file" % path)
             return None
+        output = self._magsld(data)
+        output.filename = os.path.basename(path)
+        output.set_pixel_symbols('pixel')
+        return output
+
+    def read_chunks(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Load a data file in parts of at most *chunk_size* points, for files
+        too large to hold in memory at once. Without a volume column, the
+        pixel volume is found from the step sizes in the first part.
+
+        :param path: file path
+        :return: iterator of MagSLD
+        :raise ValueError: when the file can't be loaded
+        """
+        vol = None
+        with open(path) as input_f:
+            input_f.readline()
+            while lines := list(itertools.islice(input_f, chunk_size)):
+                data = np.loadtxt(lines, dtype='float', ndmin=2, unpack=True)
+                if data.size == 0:
+                    continue
+                if data.shape[0] not in (4, 6, 7, 8):
+                    raise ValueError("%r is not an sld file" % path)
+                chunk = self._magsld(data, vol)
+                vol = chunk.vol_pix[0]
+                chunk.filename = os.path.basename(path)
+                yield chunk
+
+    def _magsld(self, data, vol=None):
+        """
+        MagSLD for the columns of *data*, with pixel volume *vol* if the
+        columns do not give one.
+        """
         if data.shape[0] == 4:
             x, y, z, sld = data[:4]
             mx = np.zeros_like(sld)
@@ -1386,11 +1616,12 @@ class SLDReader:
             sld = np.zeros_like(mx)
         else:
             x, y, z, sld, mx, my, mz = data[:7]
-        vol = data[7] if data.shape[0] > 7 else None
+        if data.shape[0] > 7:
+            vol = data[7]
+        elif vol is not None:
+            vol = np.full(len(x), vol)
         output = MagSLD(x, y, z, sld, mx, my, mz, vol)
-        output.filename = os.path.basename(path)
         output.set_pix_type('pixel')
-        output.set_pixel_symbols('pixel')
         return output
 
     def write(self, path, data):
@@ -7,7 +7,7 @@ from collections.abc import Callable
 
 import numpy as np
 import scipy.optimize
-from scipy.fftpack import dct
+from scipy.fft import dct
 from scipy.integrate import cumulative_trapezoid, trapezoid
 from scipy.interpolate import interp1d
 from scipy.signal import argrelextrema
@@ -34,8 +34,27 @@ class CalculationError(Exception):
         self.msg = msg
         super().__init__(msg)
 
+def _same_input(a, b) -> bool:
+    """ Whether a step input is unchanged: arrays and derived objects by identity, values by equality """
+    if a is b:
+        return True
+    return type(a) is type(b) and not isinstance(a, np.ndarray) and bool(a == b)
+
+
 class CorfuncCalculator:
 
+    # Calculation steps in the order they run, with the derived quantities each one sets
+    _steps = {
+        "background": (),
+        "background_subtracted": ("_background_subtracted",),
+        "porod": (),
+        "guinier": (),
+        "extrapolation_function": ("_extrapolation_function",),
+        "extrapolation_data": ("_extrapolation_data",),
+        "transforms": ("_transformed_data",),
+        "parameters": ("_lamellar_parameters", "_supplementary_parameters"),
+    }
+
     def __init__(self,
                  data: Data1D | None = None,
                  extrapolation_parameters: SettableExtrapolationParameters | None = None,
@@ -70,6 +89,9 @@ class CorfuncCalculator:
         self._lamellar_parameters: LamellarParameters | None = None
         self._supplementary_parameters: SupplementaryParameters | None = None
 
+        # Inputs each calculation step last completed with
+        self._step_inputs: dict[str, tuple] = {}
+
     def reset_calculated_values(self):
 
         """ Resets the calculated values, but does not clear the data or reset the user specified parameters """
@@ -87,7 +109,7 @@ class CorfuncCalculator:
         self._lamellar_parameters: LamellarParameters | None = None
         self._supplementary_parameters: SupplementaryParameters | None = None
 
-
+        self._step_inputs = {}
 
     #
     # Getters and setters
@@ -141,6 +163,8 @@ class CorfuncCalculator:
     @background.setter
     def background(self, value: float | None):
         self._background.data = value
+        # A value set by hand replaces the fitted one, so fit again if asked
+        self._step_inputs.pop("background", None)
 
     @property
     def guinier(self):
@@ -152,6 +176,8 @@ class CorfuncCalculator:
     @guinier.setter
     def guinier(self, value: GuinierData | None):
         self._guinier.data = value
+        # A value set by hand replaces the fitted one, so fit again if asked
+        self._step_inputs.pop("guinier", None)
 
     @property
     def porod(self):
@@ -163,6 +189,8 @@ class CorfuncCalculator:
     @porod.setter
     def porod(self, value: PorodData | None):
         self._porod.data = value
+        # A value set by hand replaces the fitted one, so fit again if asked
+        self._step_inputs.pop("porod", None)
 
     @property
     def transformed(self):
@@ -221,15 +249,61 @@ class CorfuncCalculator:
 
 
     def run(self):
-        """ Execute the calculation"""
-        self._calculate_background()
-        self._calculate_background_subtracted()
-        self._calculate_porod_parameters()
-        self._calculate_guinier_parameters()
-        self._calculate_extrapolation_function()
-        self._calculate_extrapolation_data()
-        self._calculate_transforms()
-        self._calculate_parameters()
+        """
+        Execute the calculation
+
+        Steps whose inputs are unchanged since they last ran are skipped, so
+        moving the Guinier limit does not refit the Porod region, and changing
+        the tangent method only repeats the parameter extraction.
+        """
+        if self._data is None:
+            raise ValueError("Data not set")
+
+        if self._extrapolation_parameters is None:
+            raise ValueError("Extrapolation settings not specified")
+
+        data = self._data
+        point_1 = self._extrapolation_parameters.point_1
+        point_2 = self._extrapolation_parameters.point_2
+        point_3 = self._extrapolation_parameters.point_3
+
+        self._run_step("background", self._calculate_background,
+                       data, point_2, point_3, self._background.allow_fit)
+        self._run_step("background_subtracted", self._calculate_background_subtracted,
+                       data, self._background.data)
+        self._run_step("porod", self._calculate_porod_parameters,
+                       data, point_2, point_3, self._porod.allow_fit)
+        self._run_step("guinier", self._calculate_guinier_parameters,
+                       data, point_1, self._background_subtracted, self._guinier.allow_fit)
+        self._run_step("extrapolation_function", self._calculate_extrapolation_function,
+                       data, point_1, point_2, point_3,
+                       self._background.data, self._porod.data, self._guinier.data)
+        self._run_step("extrapolation_data", self._calculate_extrapolation_data,
+                       data, self._extrapolation_function)
+        self._run_step("transforms", self._calculate_transforms,
+                       data, self._extrapolation_data, self._background.data)
+        self._run_step("parameters", self._calculate_parameters,
+                       data, self._transformed_data, self.tangent_method, self.long_period_method)
+
+    def _run_step(self, name: str, step: Callable[[], None], *inputs):
+        """ Run a calculation step, unless it last completed with the same inputs """
+        previous = self._step_inputs.get(name)
+        if previous is not None and all(map(_same_input, previous, inputs)):
+            return
+
+        try:
+            step()
+        except Exception:
+            # Forget this step and the ones after it, so that none of their
+            # results are left over from earlier inputs
+            steps = list(self._steps)
+            for later in steps[steps.index(name):]:
+                self._step_inputs.pop(later, None)
+                for attribute in self._steps[later]:
+                    setattr(self, attribute, None)
+            raise
+
+        self._step_inputs[name] = inputs
 
 
 
@@ -402,8 +476,14 @@ class CorfuncCalculator:
 
         xs = np.pi * np.arange(len(qs), dtype=np.float32) / (q[1] - q[0]) / len(qs)
 
+        # The 1D correlation function and the interface distribution function
+        # are transformed together, as the two rows of one DCT call
+        iqs_subtracted = iqs - background
+        q2 = qs ** 2
+        gamma1, idf = dct(np.vstack((iqs_subtracted * q2, -(q2 * q2) * iqs_subtracted)),
+                          axis=-1, overwrite_x=True)
+
         # 1D Correlation Function
-        gamma1 = dct((iqs - background) * (qs ** 2))
         Q = np.max(gamma1)
         gamma1 /= Q
 
@@ -416,15 +496,13 @@ class CorfuncCalculator:
         gamma3 = np.hstack((1.0, gamma3))  # gamma3(0) is defined as 1
 
         # Interface Distribution function
-        idf = dct(-qs ** 4 * (iqs - background))
-
         # Manually calculate IDF(0.0), since scipy DCT tends to give us a
         # very large negative value.
 
         #    IDF(x) = int_0^inf q^4 * I(q) * cos(q*x) * dq
         # => IDF(0) = int_0^inf q^4 * I(q) * dq
 
-        idf[0] = trapezoid(-qs ** 4 * (iqs - background), qs)
+        idf[0] = trapezoid(-(q2 * q2) * iqs_subtracted, qs)
         idf /= Q  # Normalise using scattering invariant
 
         transform1d = Data1D(xs, gamma1)
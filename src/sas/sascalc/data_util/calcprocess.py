@@ -0,0 +1,291 @@
+"""
+Calculation threads whose work runs in a pool of worker processes.
+
+:class:`CalcProcess` has the interface of
+:class:`~sas.sascalc.data_util.calcthread.CalcThread`, but each work unit is
+sent to a worker process, so CPU bound calculations from several perspectives
+can run at the same time without holding the GIL of the GUI process. A thread
+in the calling process waits for the work unit, forwarding the update() and
+complete() calls of the worker to updatefn and completefn, and forwarding
+stop() and interrupt() to the isquit() checks of the worker.
+"""
+import itertools
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+
+from sas.sascalc.data_util.calcthread import CalcThread
+
+logger = logging.getLogger(__name__)
+
+#: Number of work units that can run in the pool at the same time
+MAX_JOBS = 64
+
+#: Message sent by a worker after its last update or complete call
+_END = 'end'
+
+#: Abort flags and message queue of the pool, set in each worker process
+_abort_flags = None
+_messages = None
+
+#: Id of the work unit running in this worker process
+_running_job = None
+
+#: Worker pool shared by all calculations, the inbox of each running job
+#: by job id, and the abort flag slots held by work units not yet finished
+_pool = None
+_pool_size = 0
+_pool_flags = None
+_pool_messages = None
+_inboxes = {}
+_used_slots = set()
+_pool_lock = threading.Lock()
+_slot_free = threading.Condition(_pool_lock)
+_job_ids = itertools.count()
+
+
+def _init_worker(abort_flags, messages):
+    """
+    Store the abort flags and message queue of the pool in the worker process.
+    """
+    global _abort_flags, _messages
+    _abort_flags = abort_flags
+    _messages = messages
+
+
+def _listen(messages, inboxes):
+    """
+    Pass the messages from the workers to the inbox of their job.
+    """
+    while True:
+        message = messages.get()
+        if message is None:
+            return
+        job, kind, payload = message
+        inbox = inboxes.get(job)
+        if inbox is not None:
+            inbox.put((kind, payload))
+
+
+def _start_job(max_workers):
+    """
+    Get the worker pool, starting it if needed, a free abort flag slot
+    and an id for the job, and the inbox for its messages. Waits for a
+    work unit to finish if all MAX_JOBS slots are taken.
+    """
+    global _pool, _pool_size, _pool_flags, _pool_messages
+    with _pool_lock:
+        while len(_used_slots) >= MAX_JOBS:
+            _slot_free.wait()
+        if _pool is None or _pool_size != max_workers:
+            _shutdown_pool()
+            # Spawn rather than fork, since the calling process is threaded
+            context = multiprocessing.get_context('spawn')
+            _pool_flags = context.Array('b', MAX_JOBS, lock=False)
+            _pool_messages = context.Queue()
+            _pool = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=context,
+                                        initializer=_init_worker,
+                                        initargs=(_pool_flags, _pool_messages))
+            _pool_size = max_workers
+            threading.Thread(target=_listen, args=(_pool_messages, _inboxes), daemon=True).start()
+        slot = min(set(range(MAX_JOBS)) - _used_slots)
+        _used_slots.add(slot)
+        _pool_flags[slot] = 0
+        job = next(_job_ids)
+        _inboxes[job] = queue.Queue()
+        return _pool, _pool_flags, slot, job, _inboxes[job]
+
+
+def _end_job(job, slot, future):
+    """
+    Drop the inbox of a finished job, and release its slot once its work
+    unit is no longer running, so a late worker never sees the abort flag
+    of another job.
+    """
+    with _pool_lock:
+        _inboxes.pop(job, None)
+    if future is None:
+        _release_slot(slot)
+    else:
+        future.add_done_callback(lambda future: _release_slot(slot))
+
+
+def _release_slot(slot):
+    """
+    Make the abort flag slot available to a new job.
+    """
+    with _pool_lock:
+        _used_slots.discard(slot)
+        _slot_free.notify()
+
+
+def _shutdown_pool():
+    """
+    Stop the current pool and its listener. Called with the pool lock held.
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool_messages.put(None)
+        _pool = None
+
+
+def _reset_pool(pool):
+    """
+    Drop *pool* after a worker has died, so the next job starts a new one.
+    """
+    with _pool_lock:
+        if _pool is pool:
+            _shutdown_pool()
+
+
+def _compute_in_worker(data, slot, job):
+    """
+    Run a pickled work unit in a worker process.
+    """
+    global _running_job
+    _running_job = job
+    try:
+        calc, args, kwargs = pickle.loads(data)
+        calc._slot = slot
+        calc.compute(*args, **kwargs)
+    finally:
+        _messages.put((job, _END, None))
+
+
+class CalcProcess(CalcThread):
+    """Calculation class whose compute() method runs in a worker process.
+
+    Use it as :class:`CalcThread`: subclasses implement compute() with the
+    same isquit(), update() and complete() calls, and users call queue(),
+    stop(), ready() and so on. The calculation object, including its
+    arguments, is pickled with the *dumps* function and sent to a worker
+    process, so it must not refer to GUI objects. The callbacks completefn,
+    updatefn and exception_handler stay in the calling process, as do the
+    further callable attributes named in *parent_callbacks*; calls to any
+    of them from compute() are forwarded to the calling process.
+
+    update() calls are sent at most every *update_interval* seconds, and
+    the calling process drops them until ready() is called as usual.
+    Results of compute() other than those passed to update() and complete()
+    are not sent back to the calling process.
+
+    All calculations share one pool of *max_workers* processes, which is
+    kept once started; None uses one process per CPU.
+    """
+
+    #: Names of further callable attributes called in the calling process
+    parent_callbacks = ()
+
+    #: Shortest time between update() calls sent from the worker, in seconds
+    update_interval = 0.1
+
+    #: Size of the worker pool
+    max_workers = None
+
+    #: Function pickling the calculation; sas.sascalc.fit.batch.dumps
+    #: also handles SasView models
+    dumps = staticmethod(pickle.dumps)
+
+    # Abort flag slot of the work unit when running in a worker process
+    _slot = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('completefn', 'updatefn', 'exception_handler') + tuple(self.parent_callbacks):
+            if state.get(name) is not None:
+                state[name] = _ForwardedCallback(name, self.dumps)
+        state['_lock'] = None
+        state['_next_update'] = 0.
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def isquit(self):
+        """Check for interrupts; see :meth:`CalcThread.isquit`."""
+        if self._slot is None:
+            return CalcThread.isquit(self)
+        if _abort_flags[self._slot]:
+            raise KeyboardInterrupt("Calculation interrupted")
+
+    def update(self, **kwargs):
+        """Update GUI with the lastest results from the current work unit."""
+        if self._slot is None:
+            return CalcThread.update(self, **kwargs)
+        if self.updatefn is not None and perf_counter() > self._next_update:
+            self._next_update = perf_counter() + self.update_interval
+            self.updatefn(**kwargs)
+        self.isquit()
+
+    def complete(self, **kwargs):
+        """Update the GUI with the completed results from a work unit."""
+        if self._slot is None:
+            return CalcThread.complete(self, **kwargs)
+        if self.completefn is not None:
+            self.completefn(**kwargs)
+
+    def _execute(self, args, kwargs):
+        """Run one work unit in the worker pool and wait for it."""
+        pool, flags, slot, job, inbox = _start_job(self.max_workers)
+        future = None
+        try:
+            future = pool.submit(_compute_in_worker, self.dumps((self, args, kwargs)), slot, job)
+            finished = None
+            while True:
+                if self._interrupting:
+                    flags[slot] = 1
+                try:
+                    kind, payload = inbox.get(timeout=0.05)
+                except queue.Empty:
+                    # The end message follows the work unit, unless the
+                    # worker died or the pool was shut down
+                    if future.cancelled():
+                        break
+                    if future.done():
+                        if isinstance(future.exception(), BrokenProcessPool):
+                            _reset_pool(pool)
+                            break
+                        if finished is None:
+                            finished = perf_counter()
+                        elif perf_counter() > finished + 1.:
+                            break
+                    continue
+                if kind == _END:
+                    break
+                self._forward(kind, *pickle.loads(payload))
+            # Raise any exception from compute(), including KeyboardInterrupt
+            future.result()
+        except BaseException:
+            # Stop the worker if a callback failed
+            flags[slot] = 1
+            raise
+        finally:
+            _end_job(job, slot, future)
+
+    def _forward(self, name, args, kwargs):
+        """Make a callback call sent from the worker process."""
+        if name == 'updatefn':
+            self._call_updatefn(kwargs)
+        else:
+            getattr(self, name)(*args, **kwargs)
+
+
+class _ForwardedCallback:
+    """
+    Stand-in for a callback of a :class:`CalcProcess` in the worker process,
+    sending its calls to the calling process.
+    """
+    def __init__(self, name, dumps):
+        self.name = name
+        self.dumps = dumps
+
+    def __call__(self, *args, **kwargs):
+        _messages.put((_running_job, self.name, self.dumps((args, kwargs))))
@@ -196,14 +196,7 @@ class CalcThread:
 
     def update(self, **kwargs):
         """Update GUI with the lastest results from the current work unit."""
-        if self.updatefn is not None and perf_counter() > self._time_for_update:
-            self._lock.acquire()
-            self._time_for_update = perf_counter() + self._delay
-            self._lock.release()
-            self._time_for_update += 1e6  # No more updates
-
-            self.updatefn(**kwargs)
-
+        if self._call_updatefn(kwargs):
             sleep(self.yieldtime)
 
             if self._interrupting:
@@ -212,6 +205,19 @@ class CalcThread:
             self.isquit()
         return
 
+    def _call_updatefn(self, kwargs):
+        """Call the update function if an update has been requested.
+        Returns True if it was called."""
+        if self.updatefn is None or perf_counter() <= self._time_for_update:
+            return False
+        self._lock.acquire()
+        self._time_for_update = perf_counter() + self._delay
+        self._lock.release()
+        self._time_for_update += 1e6  # No more updates
+
+        self.updatefn(**kwargs)
+        return True
+
     def complete(self, **kwargs):
         """Update the GUI with the completed results from a work unit."""
         if self.completefn is not None:
@@ -224,6 +230,10 @@ class CalcThread:
         the arguments."""
         raise NotImplementedError("Calculation thread needs compute method")
 
+    def _execute(self, args, kwargs):
+        """Run one work unit from the queue."""
+        self.compute(*args, **kwargs)
+
     def exception(self):
         """
         An exception occurred during computation, so call the exception handler
@@ -266,7 +276,7 @@ class CalcThread:
             self._lock.release()
 
             try:
-                self.compute(*args, **kwargs)
+                self._execute(args, kwargs)
 
             except KeyboardInterrupt as exc:
                 logger.error(exc, exc_info=True)
@@ -183,6 +183,7 @@ class FitData1D(Data1D):
         self.idx = (self.x >= self.qmin) & (self.x <= self.qmax)
         self.idx_unsmeared = (self.x >= self._qmin_unsmeared) \
                             & (self.x <= self._qmax_unsmeared)
+        self._set_fit_arrays()
 
     def set_fit_range(self, qmin=None, qmax=None):
         """ to set the fit range"""
@@ -214,6 +215,17 @@ class FitData1D(Data1D):
         self.idx = self.idx & (self.dy != 0)
         self.idx_unsmeared = (self.x >= self._qmin_unsmeared) \
                             & (self.x <= self._qmax_unsmeared)
+        self._set_fit_arrays()
+
+    def _set_fit_arrays(self):
+        """
+            Store the points of the fit range contiguously for residuals(),
+            and the theory buffer, which stays zero outside idx_unsmeared.
+        """
+        self._x_unsmeared = self.x[self.idx_unsmeared]
+        self._y_fit = self.y[self.idx]
+        self._dy_fit = self.dy[self.idx]
+        self._fx = np.zeros(len(self.x))
 
     def get_fit_range(self):
         """
@@ -239,8 +251,8 @@ class FitData1D(Data1D):
             :return: residuals
         """
         # Compute theory data f(x)
-        fx = np.zeros(len(self.x))
-        fx[self.idx_unsmeared] = fn(self.x[self.idx_unsmeared])
+        fx = self._fx
+        fx[self.idx_unsmeared] = fn(self._x_unsmeared)
 
         ## Smear theory data
         if self.smearer is not None:
@@ -251,7 +263,10 @@ class FitData1D(Data1D):
             msg = "FitData1D: invalid error array "
             msg += "%d <> %d" % (np.shape(self.dy), np.size(fx))
             raise RuntimeError(msg)
-        return (self.y[self.idx] - fx[self.idx]) / self.dy[self.idx], fx[self.idx]
+        theory = fx[self.idx]
+        res = self._y_fit - theory
+        res /= self._dy_fit
+        return res, theory
 
     def residuals_deriv(self, model, pars=[]):
         """
@@ -313,6 +328,7 @@ class FitData2D(Data2D):
         self.idx = (self.idx) & (self.mask)
         self.idx = (self.idx) & (np.isfinite(self.data))
         self.num_points = np.sum(self.idx)
+        self._set_fit_arrays()
 
     def set_smearer(self, smearer):
         """
@@ -340,6 +356,16 @@ class FitData2D(Data2D):
         self.idx = (self.idx) & (self.mask)
         self.idx = (self.idx) & (np.isfinite(self.data))
         self.idx = (self.idx) & (self.res_err_data != 0)
+        self._set_fit_arrays()
+
+    def _set_fit_arrays(self):
+        """
+            Store the points of the fit range contiguously for residuals()
+        """
+        self._qx_fit = self.qx_data[self.idx]
+        self._qy_fit = self.qy_data[self.idx]
+        self._data_fit = self.data[self.idx]
+        self._err_fit = self.res_err_data[self.idx]
 
     def get_fit_range(self):
         """
@@ -361,10 +387,10 @@ class FitData2D(Data2D):
             fn.set_index(self.idx)
             gn = fn.get_value()
         else:
-            gn = fn([self.qx_data[self.idx],
-                     self.qy_data[self.idx]])
+            gn = fn([self._qx_fit, self._qy_fit])
         # use only the data point within ROI range
-        res = (self.data[self.idx] - gn) / self.res_err_data[self.idx]
+        res = self._data_fit - gn
+        res /= self._err_fit
 
         return res, gn
 
@@ -2,8 +2,10 @@
 BumpsFitting module runs the bumps optimizer.
 """
 import logging
+import multiprocessing
 import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta
 
@@ -31,7 +33,9 @@ from bumps.fitproblem import FitProblem
 from bumps.mapper import MPMapper, SerialMapper
 
 from sas.sascalc.fit.AbstractFitEngine import FitEngine, FResult
+from sas.sascalc.fit.batch import dumps, loads
 from sas.sascalc.fit.expression import compile_constraints
+from sas.sascalc.fit.jacobian import ParallelMPFit
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +123,9 @@ class SasFitness:
         self.name = model.name
         self.model = model.model
         self.data = data
+        # Parameter values last set on the model by update()
+        self._model_values = {}
+        self._dirty = True
         if self.data.smearer is not None:
             self.data.smearer.model = self.model
         self._define_pars()
@@ -185,16 +192,22 @@ class SasFitness:
         return self._pars
 
     def update(self):
+        # Only set the values changed since the last update, and keep the
+        # theory if none of them changed
         for k, v in self._pars.items():
-            #print "updating",k,v,v.value
-            self.model.setParam(k, v.value)
-        self._dirty = True
+            value = v.value
+            if k not in self._model_values or self._model_values[k] != value:
+                self.model.setParam(k, value)
+                self._model_values[k] = value
+                self._dirty = True
 
     def _recalculate(self):
         if self._dirty:
-            self._residuals, self._theory \
-                = self.data.residuals(self.model.evalDistribution)
-            self._dirty = False
+            self._set_results(*self.data.residuals(self.model.evalDistribution))
+
+    def _set_results(self, residuals, theory):
+        self._residuals, self._theory = residuals, theory
+        self._dirty = False
 
     def numpoints(self):
         return np.sum(self.data.idx) # number of fitted points
@@ -241,10 +254,98 @@ class ParameterExpressions:
         self.models = state
         self._setup()
 
+#: Fit problem of the model pool, set in each worker process
+_problem = None
+
+
+def _init_model_worker(data):
+    """
+    Store the fit problem of the model pool in the worker process.
+    """
+    global _problem
+    _problem = loads(data)
+
+
+def _model_in_worker(point, index):
+    """
+    Residuals and theory of model *index* of the fit problem at *point*.
+    """
+    _problem.setp(point)
+    fitness = _problem._models[index]
+    return fitness.residuals(), fitness.theory()
+
+
+class SasFitProblem(FitProblem):
+    """
+    Fit problem computing the theory of its models in *model_workers*
+    processes.
+
+    After the parameter expressions are applied the models are independent,
+    so the models whose parameters changed since their last evaluation are
+    sent to a pool of worker processes, one model per task. The problem is
+    sent to each worker once, when the pool starts, and each task only sends
+    the parameter values. Call close() to stop the pool at the end of the
+    fit. Copies of the problem evaluate their models in turn.
+    """
+    def __init__(self, models, weights=None, model_workers=1):
+        self.model_workers = model_workers
+        self._model_pool = None
+        FitProblem.__init__(self, models, weights=weights)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['model_workers'] = 1
+        state['_model_pool'] = None
+        return state
+
+    def _update_models(self):
+        """
+        Compute the theory of the changed models in the worker pool.
+        """
+        changed = [k for k, f in enumerate(self._models) if isinstance(f, SasFitness) and f._dirty]
+        if self.model_workers < 2 or len(changed) < 2:
+            return
+        if self._model_pool is None:
+            # Spawn rather than fork, since the calling process is threaded
+            context = multiprocessing.get_context('spawn')
+            self._model_pool = ProcessPoolExecutor(max_workers=self.model_workers,
+                                                   mp_context=context,
+                                                   initializer=_init_model_worker,
+                                                   initargs=(dumps(self),))
+        point = self.getp()
+        results = self._model_pool.map(_model_in_worker, [point]*len(changed), changed)
+        for k, (residuals, theory) in zip(changed, results):
+            self._models[k]._set_results(residuals, theory)
+
+    def close(self):
+        """
+        Stop the worker pool.
+        """
+        if self._model_pool is not None:
+            self._model_pool.shutdown(wait=False, cancel_futures=True)
+            self._model_pool = None
+
+    def model_nllf(self):
+        self._update_models()
+        return FitProblem.model_nllf(self)
+
+    def residuals(self):
+        self._update_models()
+        return FitProblem.residuals(self)
+
+
 class BumpsFit(FitEngine):
     """
     Fit a model using bumps.
     """
+    #: Number of worker processes evaluating the Jacobian of
+    #: Levenberg-Marquardt fits; 1 evaluates it in the fitting thread
+    jacobian_workers = 1
+
+    #: Number of worker processes computing the theory of the datasets of
+    #: simultaneous fits; 1 computes them in the fitting thread
+    model_workers = 1
+
     def __init__(self):
         """
         Creates a dictionary (self.fit_arrange_dict={})of FitArrange elements
@@ -266,7 +367,7 @@ class BumpsFit(FitEngine):
                 weights.append(self.get_weight_increase(tab_id))
         if len(models) == 0:
             raise RuntimeError("Nothing to fit")
-        problem = FitProblem(models, weights=weights)
+        problem = SasFitProblem(models, weights=weights, model_workers=self.model_workers)
 
         # TODO: need better handling of parameter expressions and bounds constraints
         # so that they are applied during polydispersity calculations.  This
@@ -276,7 +377,11 @@ class BumpsFit(FitEngine):
         problem.setp_hook = ParameterExpressions(models)
 
         # Run the fit
-        result = run_bumps(problem, handler, curr_thread)
+        try:
+            result = run_bumps(problem, handler, curr_thread,
+                               jacobian_workers=self.jacobian_workers)
+        finally:
+            problem.close()
         if handler is not None:
             if result['errors']:
                 handler.error(result['errors'])
@@ -377,7 +482,7 @@ class BumpsFit(FitEngine):
         else:
             return all_results
 
-def run_bumps(problem, handler, curr_thread):
+def run_bumps(problem, handler, curr_thread, jacobian_workers=1):
     def abort_test():
         if curr_thread is None:
             return False
@@ -391,6 +496,9 @@ def run_bumps(problem, handler, curr_thread):
 
     errors = []
     fitclass, options = get_fitter()
+    if fitclass is fitters.MPFit and jacobian_workers > 1:
+        fitclass = ParallelMPFit
+        options = dict(options, jacobian_workers=jacobian_workers)
     steps = options.get('steps', 0)
     if steps == 0:
         pop = options.get('pop', 0)*len(problem._parameters)
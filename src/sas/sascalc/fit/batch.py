@@ -0,0 +1,257 @@
+"""
+Run independent fits in a pool of worker processes.
+
+Each fitter is sent to a worker with :func:`dumps` and its results come back
+the same way. SasView models are classes built at run time by sasmodels, so
+they can not be pickled by name. Instead the model class is pickled as a
+recipe for rebuilding it from its model info: the name of a standard model,
+the file of a plugin model, or the parts of a product or mixture model. In the
+process that sent the fitters, the recipe maps back to the original class.
+"""
+import io
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from bumps.options import FIT_CONFIG
+
+from sasmodels import core, mixture, modelinfo, product
+from sasmodels.custom import load_custom_kernel_module
+from sasmodels.sasview_model import SasviewModel, make_model_from_info
+
+logger = logging.getLogger(__name__)
+
+#: Model classes by recipe, so that rebuilt models share one class
+_MODEL_CLASSES = {}
+
+#: Number of batches that can run in the pool at the same time
+MAX_BATCHES = 64
+
+#: Abort flags, one slot per running batch, set in each worker process
+_abort_flags = None
+
+#: Worker pool kept between batches, since starting workers takes seconds
+_pool = None
+_pool_size = 0
+_pool_flags = None
+_pool_lock = threading.Lock()
+_next_batch = 0
+
+def _info_recipe(model_info):
+    """
+    Recipe for rebuilding *model_info* in another process.
+    """
+    if model_info.composition is not None:
+        kind, parts = model_info.composition
+        parts = tuple(_info_recipe(part) for part in parts)
+        if kind == 'mixture':
+            return ('mixture', parts, model_info.operation)
+        return (kind, parts)
+    if model_info.id in core.list_models():
+        return ('standard', model_info.id)
+    if model_info.filename:
+        return ('custom', model_info.filename)
+    raise pickle.PicklingError("Can't rebuild model %r in a worker process" % model_info.id)
+
+
+def _info_from_recipe(recipe):
+    """
+    Rebuild the model info described by *recipe*.
+    """
+    kind = recipe[0]
+    if kind == 'mixture':
+        return mixture.make_mixture_info([_info_from_recipe(part) for part in recipe[1]],
+                                         operation=recipe[2])
+    if kind == 'product':
+        return product.make_product_info(*[_info_from_recipe(part) for part in recipe[1]])
+    if kind == 'standard':
+        return core.load_model_info(recipe[1])
+    return modelinfo.make_model_info(load_custom_kernel_module(recipe[1]))
+
+
+def _model_class(recipe):
+    """
+    Model class for *recipe*, built on first use.
+    """
+    if recipe not in _MODEL_CLASSES:
+        _MODEL_CLASSES[recipe] = make_model_from_info(_info_from_recipe(recipe))
+    return _MODEL_CLASSES[recipe]
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler that sends SasView model classes as rebuild recipes.
+    """
+    def reducer_override(self, obj):
+        if isinstance(obj, type) and issubclass(obj, SasviewModel) and obj is not SasviewModel:
+            recipe = _info_recipe(obj._model_info)
+            _MODEL_CLASSES.setdefault(recipe, obj)
+            return _model_class, (recipe,)
+        return NotImplemented
+
+
+def dumps(obj):
+    """
+    Pickle *obj*, including any SasView models it refers to.
+    """
+    buffer = io.BytesIO()
+    _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def loads(data):
+    """
+    Unpickle data from :func:`dumps`.
+    """
+    return pickle.loads(data)
+
+
+def _init_worker(abort_flags):
+    """
+    Store the abort flags of the pool in the worker process.
+    """
+    global _abort_flags
+    _abort_flags = abort_flags
+
+
+class _WorkerQuit:
+    """
+    Stand-in for the fit thread inside a worker process, so that the fit
+    engine can poll for cancellation of the batch.
+    """
+    def __init__(self, batch):
+        self.batch = batch
+
+    def isquit(self):
+        """
+        :raise KeyboardInterrupt: when the batch has been cancelled
+        """
+        if _abort_flags is not None and _abort_flags[self.batch]:
+            raise KeyboardInterrupt("Fitting: terminated by the user.")
+
+
+def _fit_config():
+    """
+    Optimizer selected in this process and its settings.
+    """
+    values = {key: value for key, value in FIT_CONFIG.selected_values.items() if key != 'monitors'}
+    return FIT_CONFIG.selected_id, values
+
+
+def _fit_in_worker(data, reset_flag, batch, fit_config):
+    """
+    Run one pickled fitter in a worker process and return its pickled results.
+    """
+    fitter = loads(data)
+    # Use the optimizer selected in the sending process
+    fit_id, values = fit_config
+    FIT_CONFIG.selected_id = fit_id
+    FIT_CONFIG.values[fit_id].update(values)
+    return dumps(fitter.fit(None, None, None, _WorkerQuit(batch), reset_flag=reset_flag))
+
+
+def _start_batch(max_workers):
+    """
+    Get the worker pool, starting it if needed, and a slot for the batch.
+    """
+    global _pool, _pool_size, _pool_flags, _next_batch
+    with _pool_lock:
+        if _pool is None or _pool_size != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # Spawn rather than fork, since the calling process is threaded
+            context = multiprocessing.get_context('spawn')
+            _pool_flags = context.Array('b', MAX_BATCHES, lock=False)
+            _pool = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=context,
+                                        initializer=_init_worker,
+                                        initargs=(_pool_flags,))
+            _pool_size = max_workers
+        batch = _next_batch
+        _next_batch = (_next_batch + 1) % MAX_BATCHES
+        _pool_flags[batch] = 0
+        return _pool, _pool_flags, batch
+
+
+def _reset_pool(pool):
+    """
+    Drop *pool* after a worker has died, so the next batch starts a new one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def iter_fit_batch(fitters, max_workers, reset_flag=False, isquit=None):
+    """
+    Run the fits of *fitters* in a pool of *max_workers* processes, yielding
+    *(index, results)* for each fit as it completes, with *results* set to
+    None if the fit failed.
+
+    *fitters* may be any iterable; only a few fitters per worker are taken
+    from it ahead of the running fits, so long batches can be loaded as
+    they go. The pool is kept for later batches, so only the first batch
+    waits for the workers to start.
+
+    The fits use the optimizer selected in this process. The fit handler
+    and the fit thread live in this process, so the fits run without a
+    handler. *isquit* is polled while waiting and should
+    raise KeyboardInterrupt to cancel the batch. Fits still queued are then
+    dropped and the running fits are told to stop.
+    """
+    pool, flags, batch = _start_batch(max_workers)
+    fit_config = _fit_config()
+    fitters = enumerate(fitters)
+    pending = {}
+
+    def submit():
+        for index, fitter in fitters:
+            pending[pool.submit(_fit_in_worker, dumps(fitter), reset_flag, batch, fit_config)] = index
+            if len(pending) >= 2*max_workers:
+                break
+
+    try:
+        submit()
+        while pending:
+            if isquit is not None:
+                isquit()
+            done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = loads(future.result())
+                except BrokenProcessPool:
+                    _reset_pool(pool)
+                    raise
+                except Exception:
+                    logger.exception("Fitting failed")
+                    result = None
+                yield index, result
+            submit()
+    except BaseException:
+        # Stop the fits that are running and drop the ones still queued
+        flags[batch] = 1
+        for future in pending:
+            future.cancel()
+        raise
+
+
+def fit_batch(fitters, max_workers, reset_flag=False, isquit=None, completefn=None):
+    """
+    Run the fits of *fitters* in a pool of *max_workers* processes, as
+    :func:`iter_fit_batch` does, calling *completefn(index, results)* as
+    each fit completes.
+
+    :return: list with the results of each fitter, in order
+    """
+    results = {}
+    for index, result in iter_fit_batch(fitters, max_workers, reset_flag=reset_flag, isquit=isquit):
+        results[index] = result
+        if completefn is not None:
+            completefn(index, result)
+    return [results[index] for index in range(len(results))]
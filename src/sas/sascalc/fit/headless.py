@@ -0,0 +1,501 @@
+"""
+Fit many data files with the model of a saved fit page, without the GUI.
+
+This is the ``sasview fit`` command::
+
+    sasview fit page.fitv "data/*.xml" --output results.jsonl --workers 8
+
+The model, starting values, fitted parameters, limits, polydispersity,
+weighting and Q range come from a fit page saved by SasView: an analysis
+file (.fitv), a SasView 4 project (.svs) or a project file (.json). Each
+dataset is fitted on its own, starting from the saved values.
+
+One record is written for each dataset as soon as its fit completes, as a
+line of JSON or a row of CSV depending on the extension of the output file.
+Records are not in file order when fitting in parallel. With ``--resume``
+the datasets already recorded in the output are skipped, so a run that was
+stopped carries on where it left off.
+
+Custom pinhole and slit smearing, magnetism and constraints are not read
+from the fit page. Data with resolution information is smeared with it
+unless the page has smearing turned off.
+"""
+import argparse
+import copy
+import csv
+import glob
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+from bumps.options import FIT_CONFIG
+from lxml import etree
+
+from sasdata.dataloader.data_info import Data1D
+from sasdata.dataloader.loader import Loader
+from sasmodels.sasview_model import MultiplicationModel
+from sasmodels.weights import MODELS as POLYDISPERSITY_MODELS
+
+from sas.sascalc.fit.batch import iter_fit_batch
+from sas.sascalc.fit.BumpsFitting import BumpsFit
+from sas.sascalc.fit.models import ModelManager
+from sas.sascalc.fit.pagestate import CANSAS_NS, FITTING_NODE_NAME, PageState
+from sas.sascalc.fit.qsmearing import smear_selection
+
+logger = logging.getLogger(__name__)
+
+#: Columns written before the parameters of each record
+RECORD_FIELDS = ['file', 'index', 'name', 'model', 'success', 'chisq', 'npts']
+
+
+@dataclass
+class FitSpec:
+    """
+    Model and fit settings read from a saved fit page.
+    """
+    model: str
+    structure: str | None = None
+    multiplicity: int | None = None
+    #: Parameter values, including polydispersity npts and nsigmas
+    values: dict[str, float] = field(default_factory=dict)
+    #: Fit limits of each parameter
+    limits: dict[str, tuple[float, float]] = field(default_factory=dict)
+    #: Distribution name for each polydisperse parameter
+    dispersion: dict[str, str] = field(default_factory=dict)
+    fitted: list[str] = field(default_factory=list)
+    qmin: float | None = None
+    qmax: float | None = None
+    smearing: bool = True
+    #: Weighting flag of the fit page: 0 none, 1 dI, 2 sqrt(I), 3 I
+    weighting: int = 1
+
+    @property
+    def model_name(self):
+        if self.structure is None:
+            return self.model
+        return "%s*%s" % (self.model, self.structure)
+
+
+def _number(text):
+    """
+    Float from the text of a fit page entry, or None if it is empty.
+    """
+    if text is None or str(text).strip() in ('', 'None'):
+        return None
+    return float(text)
+
+
+def spec_from_params(params):
+    """
+    Fit settings from the parameters of a fit page, in the layout of project
+    files: lists of strings keyed by parameter or setting name.
+    """
+    if 'model_name' not in params:
+        raise ValueError("The fit page has no model")
+    structure = params.get('fitpage_structure', [None])[0]
+    spec = FitSpec(model=params['model_name'][0],
+                   structure=None if structure in (None, '', 'None') else structure)
+    if 'multiplicity' in params:
+        spec.multiplicity = int(params['multiplicity'][0], 0)
+    spec.qmin = _number(params.get('q_range_min', [None])[0])
+    spec.qmax = _number(params.get('q_range_max', [None])[0])
+    if 'smearing' in params:
+        spec.smearing = params['smearing'][0] != '0'
+    if 'q_weighting' in params:
+        spec.weighting = int(params['q_weighting'][0])
+    polydisperse = params.get('polydisperse_params', ['False'])[0] == 'True'
+
+    for name, entry in params.items():
+        # Settings of the page have a single entry
+        if len(entry) <= 3:
+            continue
+        if name.endswith('.width'):
+            if not polydisperse:
+                continue
+            # [checked, value, (error), min, max, npts, nsigmas, function]
+            offset = 1 if len(entry) > 7 else 0
+            lower, upper, npts, nsigmas, function = entry[2+offset:7+offset]
+            base = name[:-len('.width')]
+            spec.values[base + '.npts'] = int(float(npts))
+            spec.values[base + '.nsigmas'] = float(nsigmas)
+            spec.dispersion[base] = function
+        else:
+            # [checked, value, (error), min, max, constraint]
+            offset = 1 if len(entry) > 5 else 0
+            lower, upper = entry[2+offset:4+offset]
+        try:
+            spec.values[name] = float(entry[1])
+        except ValueError:
+            logger.warning("Ignoring %s = %r from the fit page", name, entry[1])
+            continue
+        spec.limits[name] = (_number(lower), _number(upper))
+        if entry[0] == 'True':
+            spec.fitted.append(name)
+    return spec
+
+
+def _state_params(state):
+    """
+    Parameters of a SasView 4 fit page state in the layout of project files.
+    """
+    params = {
+        'model_name': [state.formfactorcombobox],
+        'fitpage_structure': [str(state.structurecombobox)],
+        'polydisperse_params': [str(state.enable_disp)],
+        'q_range_min': [str(state.qmin)],
+        'q_range_max': [str(state.qmax)],
+        'smearing': ['1' if state.enable_smearer else '0'],
+    }
+    if state.multi_factor is not None:
+        params['multiplicity'] = [str(int(state.multi_factor))]
+    main = state.parameters + (state.orientation_params if state.is_2D else [])
+    for p in main:
+        params[p[1]] = [str(p[0]), str(p[2]), str(p[5][1]), str(p[6][1]), '']
+    if state.enable_disp:
+        settings = {p[1]: p[2] for p in state.fixed_param + state.orientation_params_disp}
+        for p in state.fittable_param:
+            name = p[1]
+            base = name[:-len('.width')]
+            function = state.disp_obj_dict.get(name, state.disp_obj_dict.get(base, 'gaussian'))
+            params[name] = [str(p[0]), str(p[2]), '0', 'inf',
+                            settings.get(base + '.npts', '35'),
+                            settings.get(base + '.nsigmas', '3'), function]
+    return params
+
+
+def read_fit_pages(path):
+    """
+    Fit pages saved in *path*, as a list of *(name, params)* pairs with the
+    parameters in the layout of project files.
+    """
+    if os.path.splitext(path)[1].lower() == '.json':
+        with open(path) as infile:
+            project = json.load(infile)
+        pages = []
+        for value in project.values():
+            if not isinstance(value, dict) or 'fit_params' not in value:
+                continue
+            params = value['fit_params']
+            for page in params if isinstance(params, list) else [params]:
+                if 'model_name' in page:
+                    pages.append((page.get('tab_name', [''])[0], page))
+        return pages
+
+    # Only the fit page state is needed, not the data saved with it
+    tree = etree.parse(path, parser=etree.ETCompatXMLParser())
+    pages = []
+    for entry in tree.getroot().xpath('ns:SASentry', namespaces=CANSAS_NS):
+        for node in entry.xpath('ns:%s' % FITTING_NODE_NAME, namespaces=CANSAS_NS):
+            state = PageState()
+            state.from_xml(node=node)
+            pages.append((state.data_name, _state_params(state)))
+    return pages
+
+
+def load_spec(path, page=None):
+    """
+    Fit settings of the fit page in *path*, choosing the page with tab or
+    data name *page* if there are several.
+    """
+    pages = read_fit_pages(path)
+    if page is not None:
+        pages = [(name, params) for name, params in pages if name == page]
+    if not pages:
+        raise ValueError("No fit page %sfound in %s" % ("%r " % page if page else "", path))
+    if len(pages) > 1:
+        logger.warning("%s has %d fit pages, using %r", path, len(pages), pages[0][0])
+    return spec_from_params(pages[0][1])
+
+
+def _has_param(model, name):
+    """
+    True if *name* is a parameter of *model*, or a polydispersity setting.
+    """
+    base, _, setting = name.partition('.')
+    return name in model.params or (setting in ('width', 'npts', 'nsigmas') and base in model.dispersion)
+
+
+def make_model(spec, models=None):
+    """
+    SasView model for *spec*, set to the values of the fit page.
+
+    *models* is the model dictionary of :class:`ModelManager`, looked up
+    on each call if it is not given.
+    """
+    if models is None:
+        models = ModelManager().get_model_dictionary()
+    for name in (spec.model, spec.structure):
+        if name is not None and name not in models:
+            raise ValueError("Unknown model %r" % name)
+    model = models[spec.model](multiplicity=spec.multiplicity)
+    if spec.structure is not None:
+        model = MultiplicationModel(model, models[spec.structure]())
+    for name, function in spec.dispersion.items():
+        if function not in POLYDISPERSITY_MODELS or function == 'array':
+            raise ValueError("Can't use a %r distribution for %s" % (function, name))
+        if name in model.dispersion:
+            model.set_dispersion(name, POLYDISPERSITY_MODELS[function]())
+    for name, value in spec.values.items():
+        if _has_param(model, name):
+            model.setParam(name, value)
+    for name, (lower, upper) in spec.limits.items():
+        if name in model.details:
+            model.details[name][1:3] = [lower, upper]
+    return model
+
+
+def _weighted(data, flag):
+    """
+    Copy of *data* with its uncertainty replaced by the fit page weighting,
+    or *data* itself for the dI weighting.
+    """
+    if flag == 1:
+        return data
+    data = copy.deepcopy(data)
+    is1d = isinstance(data, Data1D)
+    y = data.y if is1d else data.data
+    dy = data.dy if is1d else data.err_data
+    weight = {0: np.ones_like(y), 2: np.sqrt(np.abs(y)), 3: np.abs(y)}.get(flag, dy)
+    if flag in (2, 3):
+        # Points with no intensity would have no uncertainty, as in the fit page
+        weight[weight == 0] = 1
+    if is1d:
+        data.dy = weight
+    else:
+        data.err_data = weight
+    return data
+
+
+def make_fitter(spec, data, models=None):
+    """
+    BumpsFit for fitting *spec* to *data*.
+    """
+    model = make_model(spec, models)
+    missing = [name for name in spec.fitted if not _has_param(model, name)]
+    if missing:
+        raise ValueError("%s has no parameters %s" % (spec.model_name, ", ".join(missing)))
+    if not spec.fitted:
+        raise ValueError("Fitting requires at least one parameter to optimize.")
+    data = _weighted(data, spec.weighting)
+    smearer = smear_selection(data, model) if spec.smearing else None
+    fitter = BumpsFit()
+    fitter.set_model(model, 0, spec.fitted, data=data)
+    fitter.set_data(data, 0, smearer=smearer, qmin=spec.qmin, qmax=spec.qmax)
+    fitter.select_problem_for_fit(0, 1)
+    fitter.set_weight_increase(0, 1)
+    fitter.fitter_id = [0]
+    return fitter
+
+
+def _message(text):
+    """
+    First line of each of the fit messages, as one line.
+    """
+    if not text:
+        return ''
+    if not isinstance(text, (list, tuple)):
+        text = [text]
+    return "; ".join(str(item).strip().splitlines()[0] for item in text if str(item).strip())
+
+
+def make_record(spec, key, result):
+    """
+    Record for the fit of the dataset *key* = *(file, index, name)*, with
+    *result* the list of fit results, or the exception that stopped the fit.
+    *index* is None if the file could not be loaded.
+    """
+    record = dict(zip(RECORD_FIELDS, (*key, spec.model_name, False, None, None)))
+    for name in spec.fitted:
+        record[name] = record[name + '.stderr'] = None
+    if isinstance(result, BaseException) or not result:
+        record['message'] = _message(str(result) if result else "Fitting failed")
+        return record
+    fit = result[0]
+    record['success'] = bool(fit.success)
+    record['chisq'] = None if not np.isfinite(fit.fitness) else float(fit.fitness)
+    record['npts'] = len(fit.residuals)
+    for name, value, error in zip(fit.param_list, fit.pvec, fit.stderr):
+        if name in record:
+            record[name] = float(value)
+            record[name + '.stderr'] = None if not np.isfinite(error) else float(error)
+    record['message'] = _message(fit.mesg)
+    return record
+
+
+class RecordWriter:
+    """
+    Write fit records to *path* as JSON lines, or as CSV if the file name
+    ends with .csv, flushing each record as it is written.
+
+    With *resume*, records already in the file are kept, after dropping a
+    last line that was cut short, and :attr:`done` holds their datasets.
+    Files that failed to load are not in :attr:`done`, so they are tried
+    again.
+    Otherwise the file must not exist.
+    """
+    def __init__(self, path, fields, resume=False):
+        self.path = path
+        self.fields = fields
+        self.is_csv = path.lower().endswith('.csv')
+        self.done = set()
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists and not resume:
+            raise FileExistsError("%s already exists; use --resume to add to it" % path)
+        if exists:
+            self._read_done()
+        self.file = open(path, 'a', newline='')
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=fields)
+            if not exists:
+                self.writer.writeheader()
+                self.file.flush()
+
+    def _read_done(self):
+        # Drop the last record if the run stopped while it was being written
+        with open(self.path, 'rb+') as file:
+            content = file.read()
+            end = content.rfind(b'\n') + 1
+            if end < len(content):
+                file.truncate(end)
+        with open(self.path, newline='') as file:
+            if self.is_csv:
+                reader = csv.DictReader(file)
+                if reader.fieldnames != self.fields:
+                    raise ValueError("%s has different columns from this fit" % self.path)
+                records = list(reader)
+            else:
+                records = [json.loads(line) for line in file if line.strip()]
+        # Files that failed to load have no dataset index
+        self.done = {self.key(record) for record in records if record['index'] not in (None, '')}
+
+    @staticmethod
+    def key(record):
+        """Dataset of *record*, as compared when resuming"""
+        return os.path.abspath(record['file']), int(record['index'])
+
+    def write(self, record):
+        if self.is_csv:
+            self.writer.writerow({name: '' if value is None else value
+                                  for name, value in record.items()})
+        else:
+            self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def find_files(patterns):
+    """
+    Data files matching the glob *patterns*, in sorted order.
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            logger.warning("No data files match %s", pattern)
+        files.extend(match for match in matches if os.path.isfile(match))
+    return files
+
+
+def run_fits(spec, files, writer, max_workers=1):
+    """
+    Fit *spec* to each dataset of *files*, skipping those in *writer.done*,
+    and write a record for each as its fit completes.
+
+    :return: number of records written
+    """
+    models = ModelManager().get_model_dictionary()
+    loader = Loader()
+    keys = []
+    count = 0
+
+    def write(record):
+        nonlocal count
+        writer.write(record)
+        count += 1
+        logger.info("%s[%s]: %s", record['file'], record['index'],
+                    "chisq=%s" % record['chisq'] if record['success'] else record['message'])
+
+    def fitters():
+        # Datasets are loaded as the fits need them, so failures to load or
+        # set up a fit are written as they are found
+        for path in files:
+            try:
+                datasets = loader.load(path)
+            except Exception as exc:
+                # The failure is for the whole file, so it is retried on resume
+                write(make_record(spec, (path, None, ''), exc))
+                continue
+            for index, data in enumerate(datasets):
+                key = (path, index, getattr(data, 'title', '') or os.path.basename(path))
+                if (os.path.abspath(path), index) in writer.done:
+                    continue
+                try:
+                    fitter = make_fitter(spec, data, models)
+                except Exception as exc:
+                    write(make_record(spec, key, exc))
+                    continue
+                keys.append(key)
+                yield fitter
+
+    if max_workers > 1:
+        for index, result in iter_fit_batch(fitters(), max_workers):
+            write(make_record(spec, keys[index], result))
+    else:
+        for index, fitter in enumerate(fitters()):
+            try:
+                result = fitter.fit()
+            except Exception as exc:
+                result = exc
+            write(make_record(spec, keys[index], result))
+    return count
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="sasview fit",
+        description="Fit each data file with the model of a saved fit page.")
+    parser.add_argument("page_file",
+        help="Fit page (.fitv), SasView 4 project (.svs) or project (.json)")
+    parser.add_argument("data", nargs="+",
+        help="Data files or glob patterns, such as 'runs/*.xml'")
+    parser.add_argument("--output", required=True,
+        help="Result file, written as CSV if it ends with .csv or as JSON lines otherwise")
+    parser.add_argument("-p", "--page", type=str,
+        help="Tab or data name of the fit page to use if the file has several")
+    parser.add_argument("-w", "--workers", type=int, default=0,
+        help="Number of fits to run in parallel (default: one per CPU core)")
+    parser.add_argument("-r", "--resume", action='store_true',
+        help="Add to an existing result file, skipping the datasets it has")
+    parser.add_argument("--optimizer", type=str, choices=FIT_CONFIG.ids,
+        help="Bumps optimizer (default: %s)" % FIT_CONFIG.selected_id)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run ``sasview fit`` with the arguments *argv*.
+
+    :return: exit status
+    """
+    opts = parse_args(sys.argv[1:] if argv is None else argv)
+    if opts.optimizer is not None:
+        FIT_CONFIG.selected_id = opts.optimizer
+    spec = load_spec(opts.page_file, page=opts.page)
+    files = find_files(opts.data)
+    fields = RECORD_FIELDS + [name + suffix for name in spec.fitted for suffix in ('', '.stderr')]
+    fields.append('message')
+    writer = RecordWriter(opts.output, fields, resume=opts.resume)
+    if writer.done:
+        logger.info("Resuming with %d datasets already fitted", len(writer.done))
+    workers = opts.workers if opts.workers > 0 else (os.cpu_count() or 1)
+    try:
+        count = run_fits(spec, files, writer, max_workers=workers)
+    finally:
+        writer.close()
+    logger.info("Wrote %d records to %s", count, opts.output)
+    return 0
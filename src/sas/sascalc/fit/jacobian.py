@@ -0,0 +1,194 @@
+"""
+Levenberg-Marquardt fits with the Jacobian evaluated in worker processes.
+
+The finite difference Jacobian of a Levenberg-Marquardt step needs one
+evaluation of the residuals for each fitted parameter. :class:`ParallelMPFit`
+is the bumps MPFit optimizer with these evaluations spread over a pool of
+worker processes. The fit problem is sent to each worker once, when the pool
+starts, and each evaluation only sends the parameter values. Processes are
+used rather than threads since the OpenCL kernels of sasmodels can not be
+called from several threads at once.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from bumps import fitters
+from bumps.mpfit import mpfit
+
+from sas.sascalc.fit.batch import dumps, loads
+
+#: Fit problem of the pool, set in each worker process
+_problem = None
+
+
+def _init_worker(data):
+    """
+    Store the fit problem of the pool in the worker process.
+    """
+    global _problem
+    _problem = fitters.MPFit(loads(data))
+
+
+def _residuals_in_worker(point):
+    """
+    Residuals of the fit problem at *point*, as seen by the optimizer.
+    """
+    return _problem._residuals(point)[1]
+
+
+class JacobianPool:
+    """
+    Pool of *max_workers* processes evaluating the residuals of *problem*.
+    """
+    def __init__(self, problem, max_workers):
+        # Spawn rather than fork, since the calling process is threaded
+        context = multiprocessing.get_context('spawn')
+        self._pool = ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=context,
+                                         initializer=_init_worker,
+                                         initargs=(dumps(problem),))
+
+    def __call__(self, points):
+        """
+        Residuals at each of *points*, in order.
+        """
+        return list(self._pool.map(_residuals_in_worker, points))
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _JacobianMPFit(mpfit):
+    """
+    mpfit with the finite differences of the Jacobian evaluated by
+    *jacobian_map*, which takes a list of points and returns the residuals
+    at each of them.
+    """
+    def __init__(self, fcn, jacobian_map=None, **kw):
+        self.jacobian_map = jacobian_map
+        mpfit.__init__(self, fcn, **kw)
+
+    def fdjac2(self, fcn, x, fvec, step=None, ulimited=None, ulimit=None,
+               dside=None, epsfcn=None, autoderivative=1, functkw=None,
+               xall=None, ifree=None, dstep=None):
+        # Step sizes as chosen by mpfit.fdjac2
+        machep = self.machar.machep
+        if epsfcn is None:
+            epsfcn = machep
+        if xall is None:
+            xall = x
+        if ifree is None:
+            ifree = np.arange(len(xall))
+        if step is None:
+            step = x * 0.0
+        eps = np.sqrt(max([epsfcn, machep]))
+        n = len(x)
+
+        h = eps * abs(x)
+        stepi = np.take(step, ifree)
+        (wh,) = np.nonzero(stepi > 0)
+        if len(wh) > 0:
+            np.put(h, wh, np.take(stepi, wh))
+        if len(dstep) > 0:
+            dstepi = np.take(dstep, ifree)
+            (wh,) = np.nonzero(dstepi > 0)
+            if len(wh) > 0:
+                np.put(h, wh, abs(np.take(dstepi, wh) * np.take(x, wh)))
+        (wh,) = np.nonzero(h == 0)
+        if len(wh) > 0:
+            np.put(h, wh, eps)
+        mask = dside == -1
+        if len(ulimited) > 0 and len(ulimit) > 0:
+            mask = mask | (ulimited & (x > ulimit - h))
+            (wh,) = np.nonzero(mask)
+            if len(wh) > 0:
+                np.put(h, wh, -np.take(h, wh))
+
+        # Evaluate the residuals at all the steps at once
+        points = []
+        for j in range(n):
+            xp = xall.copy()
+            xp[ifree[j]] = xp[ifree[j]] + h[j]
+            points.append(xp)
+            if abs(dside[j]) > 1:
+                xm = xall.copy()
+                xm[ifree[j]] = xall[ifree[j]] - h[j]
+                points.append(xm)
+        self.nfev = self.nfev + len(points)
+        values = iter(self.jacobian_map(points))
+
+        fjac = np.zeros([len(fvec), n], np.float64)
+        for j in range(n):
+            fp = next(values)
+            if self.damp > 0:
+                fp = np.tanh(fp / self.damp)
+            if abs(dside[j]) <= 1:
+                fjac[0:, j] = (fp - fvec) / h[j]
+            else:
+                fm = next(values)
+                if self.damp > 0:
+                    fm = np.tanh(fm / self.damp)
+                fjac[0:, j] = (fp - fm) / (2 * h[j])
+        return fjac
+
+
+class ParallelMPFit(fitters.MPFit):
+    """
+    MPFit optimizer evaluating the Jacobian in *jacobian_workers* processes.
+    """
+    name = "Levenberg-Marquardt (parallel Jacobian)"
+    id = "lm_parallel"
+    settings = fitters.MPFit.settings + [("jacobian_workers", 2)]
+
+    def solve(self, monitors=None, mapper=None, **options):
+        # As MPFit.solve, but with the Jacobian from the worker pool
+        options = fitters._fill_defaults(options, self.settings)
+        self._low, self._high = self.problem.bounds()
+        self._stopping = monitors.stopping
+        x0 = self.problem.getp()
+        parinfo = []
+        for low, high in zip(*self.problem.bounds()):
+            parinfo.append({"limited": (np.isfinite(low), np.isfinite(high)),
+                            "limits": (low, high)})
+
+        def update(fcn, p, k, fnorm, functkw=None, parinfo=None, quiet=0, dof=None, **extra):
+            # The mpfit residuals are set up so that fnorm = sumsq residuals = 2*nllf.
+            monitors(step=k, point=p, value=fnorm / 2)
+            if monitors.stopping():
+                return -1
+
+        pool = JacobianPool(self.problem, options["jacobian_workers"])
+        try:
+            result = _JacobianMPFit(
+                fcn=self._residuals,
+                jacobian_map=pool,
+                xall=x0,
+                parinfo=parinfo,
+                autoderivative=True,
+                fastnorm=True,
+                double=0,
+                ftol=options["ftol"],
+                xtol=options["xtol"],
+                maxiter=options["steps"],
+                iterfunct=update,
+                nprint=1,
+                quiet=True,
+                nocovar=True,
+            )
+        finally:
+            pool.close()
+        if result.status > 0 or result.status == -1:
+            x = result.params
+            if not (self.problem.getp() == x).all():
+                self.problem.setp(x)
+            fx = self.problem.nllf()
+        else:
+            x, fx = None, None
+
+        return x, fx
+
+
+# Available as fitters.fit(problem, method="lm_parallel"), but not listed
+# as a separate optimizer
+fitters.register(ParallelMPFit, active=False)
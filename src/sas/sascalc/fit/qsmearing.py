@@ -161,6 +161,10 @@ class PySmear2D:
         self.index = None
         self.coords = 'polar'
         self.smearer = True
+        # Resolution operator from the last call to get_value, and the
+        # inputs it was built from
+        self._resolution = None
+        self._resolution_key = None
 
     def set_accuracy(self, accuracy='Low'):
         """
@@ -203,15 +207,37 @@ class PySmear2D:
         """
         self.index = index
 
+    def get_resolution(self):
+        """
+        Return the Pinhole2D resolution for the current data and index.
+
+        The oversampled q points and Gaussian weights only depend on the
+        data, index, accuracy, limit and coords, so the resolution is kept
+        and reused until one of them changes, as it does not during a fit.
+        """
+        data = self.data
+        # The data and its q arrays are compared by identity, the index by value
+        key = (data, data.qx_data, data.qy_data, data.dqx_data, data.dqy_data,
+               self.accuracy, self.limit, self.coords)
+        cached = self._resolution_key
+        if (cached is None
+                or any(a is not b for a, b in zip(key[:5], cached[0][:5]))
+                or key[5:] != cached[0][5:]
+                or not _same_index(self.index, cached[1])):
+            self._resolution = Pinhole2D(data=data, index=self.index,
+                                         nsigma=self.limit, accuracy=self.accuracy,
+                                         coords=self.coords)
+            index = self.index if self.index is None else np.array(self.index, copy=True)
+            self._resolution_key = (key, index)
+        return self._resolution
+
     def get_value(self):
         """
         Over sampling of r_nbins times phi_nbins, calculate Gaussian weights,
         then find smeared intensity
         """
         if self.smearer:
-            res = Pinhole2D(data=self.data, index=self.index,
-                            nsigma=3.0, accuracy=self.accuracy,
-                            coords=self.coords)
+            res = self.get_resolution()
             val = self.model.evalDistribution(res.q_calc)
             return res.apply(val)
         else:
@@ -222,3 +248,11 @@ class PySmear2D:
             val = self.model.evalDistribution(q_calc)
             return val
 
+
+def _same_index(index, other):
+    """
+    Check whether two PySmear2D indices select the same points
+    """
+    if index is None or other is None:
+        return index is other
+    return np.array_equal(index, other)
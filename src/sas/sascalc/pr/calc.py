@@ -124,6 +124,28 @@ def ortho_transformed(q, d_max, n):
     qd = q * (d_max/pi)
     return ( 8.0 * d_max**2 * n * (-1.0)**(n+1) ) * np.sinc(qd) / (n**2 - qd**2)
 
+@njit('f8[:,:](f8[:], f8, i8, i8)')
+def ortho_transformed_matrix(q, d_max, n_min, n_max):
+    """
+    Fourier transforms of the orthogonal functions n_min to n_max-1,
+    sharing the sinc(q*d_max) term between them.
+
+    :param q: q (vector).
+    :param d_max: d_max.
+    :param n_min: first n.
+    :param n_max: one past the last n.
+
+    :return: matrix with one column per orthogonal function across all q.
+    """
+    qd = q * (d_max/pi)
+    sinc_qd = np.sinc(qd)
+    qd_sq = qd**2
+    total = np.empty((len(q), n_max - n_min), dtype=np.float64)
+    for j in range(n_max - n_min):
+        n = n_min + j
+        total[:, j] = ( 8.0 * d_max**2 * n * (-1.0)**(n+1) ) * sinc_qd / (n**2 - qd_sq)
+    return total
+
 @njit('f8[:](f8[:], f8, i8, f8, f8, u8)')
 def ortho_transformed_smeared(q, d_max, n, height, width, npts):
     """
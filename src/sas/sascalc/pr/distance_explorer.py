@@ -15,6 +15,11 @@ of D_max value. User picks a number of points and a range of
 distances, then get a series of outputs as a function of D_max
 over that range.
 """
+from bisect import bisect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+
+import numpy as np
 
 
 class Results:
@@ -39,6 +44,21 @@ class Results:
         ## List of errors found during the last exploration
         self.errors = []
 
+    def insert(self, d_max, bck, chi2, iq0, rg, pos, pos_err, osc):
+        """
+        Add the outputs for one D_max value, keeping all
+        the arrays sorted by D_max.
+        """
+        index = bisect(self.d_max, d_max)
+        self.d_max.insert(index, d_max)
+        self.bck.insert(index, bck)
+        self.chi2.insert(index, chi2)
+        self.iq0.insert(index, iq0)
+        self.rg.insert(index, rg)
+        self.pos.insert(index, pos)
+        self.pos_err.insert(index, pos_err)
+        self.osc.insert(index, osc)
+
 
 class DistExplorer:
     """
@@ -53,16 +73,59 @@ class DistExplorer:
 
         """
         self.pr_state = pr_state
-        self._default_min = 0.8 * self.pr_state.d_max
-        self._default_max = 1.2 * self.pr_state.d_max
+        self._default_min = 0.8 * self.pr_state.dmax
+        self._default_max = 1.2 * self.pr_state.dmax
 
-    def __call__(self, dmin=None, dmax=None, npts=10):
+    def _scan_state(self):
+        """
+        Copy of the P(r) state with its own copy of the data, so the scan
+        does not change the data of the calculator while it runs, and with
+        the rows of the problem that do not depend on D_max shared by the
+        inversions of the scan.
+        """
+        pr = self.pr_state.clone()
+        data = self.pr_state.logic.data
+        y = np.array(data.y, dtype=float)
+        # Subtract a fixed background once for the whole scan
+        if not pr.est_bck:
+            y -= pr.background
+        pr.logic = SimpleNamespace(data=SimpleNamespace(x=np.array(data.x, dtype=float), y=y,
+                                                        dy=np.array(data.dy, dtype=float)))
+        pr._fixed_rows = {}
+        return pr
+
+    def _invert(self, scan, d):
+        """
+        Invert a copy of the scan state at D_max = d and
+        return the outputs stored in Results.
+        """
+        pr = scan.clone()
+        pr.dmax = d
+        # The background, if fixed, has already been subtracted from the
+        # scan data, so call lstsq() directly rather than invert()
+        out, cov = pr.lstsq(pr.nfunc)
+        return (pr.dmax, pr.background, pr.chi2, pr.iq0(out), pr.rg(out),
+                pr.get_positive(out), pr.get_pos_err(out, cov),
+                pr.oscillations(out))
+
+    def __call__(self, dmin=None, dmax=None, npts=10, max_workers=None,
+                 updatefn=None, isquit=None):
         """
         Compute the outputs as a function of D_max.
 
+        The inversions for the D_max values are independent, so they are
+        spread over a pool of *max_workers* threads; the least squares and
+        compiled P(r) routines release the GIL while they run. They work on
+        a copy of the data, and only the rows of the least squares problem
+        that depend on D_max are computed for each inversion.
+
         :param dmin: minimum value for D_max
         :param dmax: maximum value for D_max
         :param npts: number of points for D_max
+        :param max_workers: number of threads, or None for the executor default
+        :param updatefn: called with the Results object each time an
+            inversion finishes, for progressive plotting
+        :param isquit: called between inversions; raises to stop the scan
 
         """
         # Take care of the defaults if needed
@@ -75,32 +138,27 @@ class DistExplorer:
         # Results object to store the computation outputs.
         results = Results()
 
-        # Loop over d_max values
-        for i in range(npts):
-            d = dmin + i * (dmax - dmin) / (npts - 1.0)
-            self.pr_state.d_max = d
+        d_values = [dmin + i * (dmax - dmin) / (npts - 1.0) for i in range(npts)]
+
+        scan = self._scan_state()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._invert, scan, d): d for d in d_values}
             try:
-                out, cov = self.pr_state.invert(self.pr_state.nfunc)
-
-                # Store results
-                iq0 = self.pr_state.iq0(out)
-                rg = self.pr_state.rg(out)
-                pos = self.pr_state.get_positive(out)
-                pos_err = self.pr_state.get_pos_err(out, cov)
-                osc = self.pr_state.oscillations(out)
-
-                results.d_max.append(self.pr_state.d_max)
-                results.bck.append(self.pr_state.background)
-                results.chi2.append(self.pr_state.chi2)
-                results.iq0.append(iq0)
-                results.rg.append(rg)
-                results.pos.append(pos)
-                results.pos_err.append(pos_err)
-                results.osc.append(osc)
-            except Exception as exc:
-                # This inversion failed, skip this D_max value
-                msg = "ExploreDialog: inversion failed for "
-                msg += "D_max=%s\n %s" % (str(d), exc)
-                results.errors.append(msg)
+                for future in as_completed(futures):
+                    try:
+                        results.insert(*future.result())
+                    except Exception as exc:
+                        # This inversion failed, skip this D_max value
+                        msg = "ExploreDialog: inversion failed for "
+                        msg += "D_max=%s\n %s" % (str(futures[future]), exc)
+                        results.errors.append(msg)
+                    if updatefn is not None:
+                        updatefn(results)
+                    if isquit is not None:
+                        isquit()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
         return results
@@ -59,6 +59,10 @@ class Invertor:
 
         self.logic = logic
 
+        # Rows of the least squares problem that do not depend on D_max,
+        # shared by the copies of a D_max scan; None computes them each time
+        self._fixed_rows: dict | None = None
+
     @property
     def x(self) -> npt.NDArray[np.float64]:
         """Returns the x values of the data to be inverted."""
@@ -479,11 +483,17 @@ class Invertor:
             logger.warning("Invertor.estimate_numterms: %s" % exc)
             return self.nfunc, best_alpha, "Could not estimate number of terms"
 
-    def estimate_alpha(self, nfunc: int) -> tuple[float, str | None, float]:
+    def estimate_alpha(
+        self, nfunc: int, path: "RegularizationPath | None" = None
+    ) -> tuple[float, str | None, float]:
         """
         Returns a reasonable guess for the regularization constant, alpha.
 
+        All the trial values of alpha are solved from a single
+        :class:`RegularizationPath`, so this costs about one inversion.
+
         :param nfunc: number of terms to use in the expansion.
+        :param path: regularization path for nfunc terms, if already computed.
 
         :return: alpha, message, elapsed
             where, alpha is the estimate for alpha,
@@ -494,46 +504,40 @@ class Invertor:
         elapsed: float = 0.0
 
         try:
-            pr = self.clone()
-
             # T_0 for computation time
             starttime = time.time()
 
-            # If the current alpha is zero, try another value
-            if pr.alpha <= 0:
-                pr.alpha = 0.0001
-
-            # Perform inversion to find the largest alpha
-            out, _ = pr.invert(nfunc)
+            if path is None:
+                path = self.regularization_path(nfunc)
 
             elapsed = time.time() - starttime
-            initial_alpha = pr.alpha
-            initial_peaks = pr.get_peaks(out)
 
-            # Try the inversion with the estimated alpha
-            pr.alpha = pr.suggested_alpha
-            out, _ = pr.invert(nfunc)
+            # If the current alpha is zero, try another value
+            initial_alpha = self.alpha if self.alpha > 0 else 0.0001
+            suggested_alpha = path.suggested_alpha(initial_alpha)
+
+            # Peaks at the initial alpha, the suggested alpha and then
+            # successively smaller values
+            alphas = np.hstack(
+                (initial_alpha, suggested_alpha, suggested_alpha * 0.33 ** np.arange(1, 11))
+            )
+            peaks = path.scan(alphas)["peaks"]
+            initial_peaks, npeaks = peaks[0], peaks[1]
 
-            npeaks = pr.get_peaks(out)
             # if more than one peak to start with, just return the estimate
             if npeaks > 1:
-                return pr.suggested_alpha, message, elapsed
+                return suggested_alpha, message, elapsed
             else:
                 # Look at smaller values
                 # We assume that for the suggested alpha, we have 1 peak
                 # if not, send a message to change parameters
-                alpha = pr.suggested_alpha
-                best_alpha = pr.suggested_alpha
+                best_alpha = suggested_alpha
                 found = False
-                for i in range(10):
-                    pr.alpha = (0.33) ** (i + 1) * alpha
-                    out, _ = pr.invert(nfunc)
-
-                    peaks = pr.get_peaks(out)
-                    if peaks > 1:
+                for alpha, peak in zip(alphas[2:], peaks[2:]):
+                    if peak > 1:
                         found = True
                         break
-                    best_alpha = pr.alpha
+                    best_alpha = alpha
 
                 # If we didn't find a turning point for alpha and
                 # the initial alpha already had only one peak, just return that
@@ -541,16 +545,37 @@ class Invertor:
                     best_alpha = initial_alpha
 
                 # Check whether the size makes sense
-                if found and (best_alpha >= 0.5 * pr.suggested_alpha):
+                if found and (best_alpha >= 0.5 * suggested_alpha):
                     # best alpha is too big, return a reasonable value
                     message = "The estimated alpha for your system is too large."
                     message += "Try increasing your maximum distance."
 
-                return best_alpha, message, elapsed
+                return float(best_alpha), message, elapsed
         except Exception as exc:
             message = "Invertor.estimate_alpha: %s" % exc
             return 0, message, elapsed
 
+    def regularization_path(self, nfunc: int = 10, nr: int = 20) -> "RegularizationPath":
+        """
+        Decompose the inversion problem so that it can be solved for
+        any alpha, see :class:`RegularizationPath`.
+
+        Like :meth:`invert`, this handles temporary background subtraction
+        when ``est_bck`` is disabled.
+
+        :param nfunc: number of base functions to use.
+        :param nr: number of r points to evaluate the 2nd derivative at for the reg. term.
+
+        :return: the regularization path.
+        """
+        if not self.est_bck:
+            self.logic.data.y -= self.background
+        try:
+            return RegularizationPath(self, nfunc, nr=nr)
+        finally:
+            if not self.est_bck:
+                self.logic.data.y += self.background
+
     def _get_matrix(self, nfunc: int, nr: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
         Returns A matrix and b vector for least square problem.
@@ -564,17 +589,22 @@ class Invertor:
 
         nfunc = int(nfunc)
         nr = int(nr)
-        a_obj = np.zeros([self.npoints + nr, nfunc])
-        b_obj = np.zeros(self.npoints + nr)
-
-        sqrt_alpha = np.sqrt(math.fabs(self.alpha))
-        pi = np.pi
-        offset: int = 0 if self.est_bck else 1
 
         if self.check_for_zero(self.err):
             logger.error("Pinvertor.get_matrix: Some I(Q) points have no error.")
             return np.zeros((nfunc, nfunc)), np.zeros(nfunc)
 
+        key = (nfunc, nr)
+        fixed_rows = self._fixed_rows.get(key) if self._fixed_rows is not None else None
+        if fixed_rows is None:
+            fixed_rows = self._get_fixed_rows(nfunc, nr)
+            if self._fixed_rows is not None:
+                self._fixed_rows[key] = fixed_rows
+        q_accept_x, inv_err, reg_rows, b_obj = fixed_rows
+
+        a_obj = np.zeros([self.npoints + nr, nfunc])
+        offset: int = 0 if self.est_bck else 1
+
         # Compute A
         # Whether or not to use ortho_transformed_smeared.
         smeared = False
@@ -582,49 +612,69 @@ class Invertor:
             smeared = True
 
         npts: int = 21
-        # Get accept_q vector across all q.
-        q_accept_x = self.accept_q(self.x)
-
-        if isinstance(q_accept_x, bool):
-            # In the case of q_min and q_max <= 0, so returns scalar, and returns True
-            q_accept_x = np.ones(self.npoints, dtype=bool)
         # The x and a that will be used for the first part of 'a' calculation, given to ortho_transformed
         x_use = self.x[q_accept_x]
         a_use = a_obj[0 : self.npoints, :]
+        # The first column holds the background term, if it is being fitted
+        first: int = 1 if self.est_bck else 0
 
-        for j in range(nfunc):
-            if self.est_bck and j == 0:
-                a_use[q_accept_x, j] = 1.0 / self.err[q_accept_x]
-            elif smeared:
+        if self.est_bck:
+            a_use[q_accept_x, 0] = inv_err
+        if smeared:
+            for j in range(first, nfunc):
                 a_use[q_accept_x, j] = (
                     calc.ortho_transformed_smeared(
                         x_use, self.dmax, j + offset, self.slit_height, self.slit_width, npts
                     )
-                    / self.err[q_accept_x]
+                    * inv_err
                 )
-            else:
-                a_use[q_accept_x, j] = calc.ortho_transformed(x_use, self.dmax, j + offset) / self.err[q_accept_x]
+        else:
+            # All base functions at once, in a single pass over q
+            a_use[q_accept_x, first:] = (
+                calc.ortho_transformed_matrix(x_use, self.dmax, first + offset, nfunc + offset) * inv_err[:, None]
+            )
 
-        a_obj[0 : self.npoints, :] = a_use
+        a_obj[self.npoints : self.npoints + nr, :] = reg_rows
 
-        for j in range(nfunc):
-            i_r = np.arange(nr, dtype=np.float64)
+        return a_obj, b_obj
 
-            # Implementing second stage A as a python vector operation with shape = [nr]
-            r = (self.dmax / nr) * i_r
-            tmp = pi * (j + offset) / self.dmax
-            res = (2.0 * sqrt_alpha * self.dmax / nr * tmp) * (2.0 * np.cos(tmp * r) + tmp * r * np.sin(tmp * r))
-            # Res should now be np vector size i_r.
-            a_obj[self.npoints : self.npoints + nr, j] = res
+    def _get_fixed_rows(
+        self, nfunc: int, nr: int
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Returns the parts of the least squares problem that do not depend on D_max.
+
+        :param nfunc: number of base functions.
+        :param nr: number of r-points used when evaluating reg term.
+
+        :return: accepted q mask, inverse errors of the accepted points,
+            regularization rows of A and the b vector.
+        """
+        sqrt_alpha = np.sqrt(math.fabs(self.alpha))
+        pi = np.pi
+        offset: int = 0 if self.est_bck else 1
+
+        # Get accept_q vector across all q.
+        q_accept_x = self.accept_q(self.x)
+
+        if isinstance(q_accept_x, bool):
+            # In the case of q_min and q_max <= 0, so returns scalar, and returns True
+            q_accept_x = np.ones(self.npoints, dtype=bool)
+        inv_err = 1.0 / self.err[q_accept_x]
+
+        # The regularization rows sample the second derivative at r = D_max*i/nr,
+        # and the D_max of the base functions and of r cancel
+        reg_rows = np.zeros([nr, nfunc])
+        i_r = np.arange(nr, dtype=np.float64)
+        for j in range(nfunc):
+            tmp_r = pi * (j + offset) * i_r / nr
+            reg_rows[:, j] = (2.0 * sqrt_alpha * pi * (j + offset) / nr) * (2.0 * np.cos(tmp_r) + tmp_r * np.sin(tmp_r))
 
         # Compute B
-        x_accept_index = self.accept_q(self.x)
-        # The part of b used for the vector operations, of the accepted q values.
-        b_used = b_obj[0 : self.npoints]
-        b_used[x_accept_index] = self.y[x_accept_index] / self.err[x_accept_index]
-        b_obj[0 : self.npoints] = b_used
+        b_obj = np.zeros(self.npoints + nr)
+        b_obj[0 : self.npoints][q_accept_x] = self.y[q_accept_x] / self.err[q_accept_x]
 
-        return a_obj, b_obj
+        return q_accept_x, inv_err, reg_rows, b_obj
 
     def _get_invcov_matrix(self, nfunc: int, nr: int, a_obj: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """
@@ -672,3 +722,205 @@ class Invertor:
         sum_reg = np.sum(a_obj[self.npoints : self.npoints + nr, :] ** 2)
 
         return sum_sig, sum_reg
+
+
+class RegularizationPath:
+    """
+    Solution of the regularized least squares problem of
+    :meth:`Invertor.lstsq` along a path of regularization constants.
+
+    The matrix of :meth:`Invertor.lstsq` stacks the data block A over the
+    regularization block sqrt(alpha)*L, so for each alpha the coefficients
+    solve ::
+
+        (A^T A + alpha L^T L) c = A^T b
+
+    A generalized SVD of the pair (A, L), from a QR decomposition of the
+    stacked matrix [A; L] = [Q_A; Q_L] R and an SVD Q_A = U C W^T, gives
+    A = U C X^-1 and L^T L = X^-T (I - C^2) X^-1 with X = R^-1 W. With
+    beta = U^T b and s^2 = 1 - c^2, the solution and chi2 are ::
+
+        c(alpha) = X (c beta / (c^2 + alpha s^2))
+        chi2(alpha) = |b - U beta|^2 + sum(alpha s^2 beta^2 / (c^2 + alpha s^2))
+
+    so after one decomposition each alpha costs O(nfunc^2) instead of a
+    new matrix and least squares solve. This holds even when A alone is
+    rank deficient, as it often is for many terms.
+    """
+
+    def __init__(self, invertor: Invertor, nfunc: int, nr: int = 20):
+        """
+        :param invertor: invertor holding the data and settings; any fixed
+            background must already be subtracted from the data.
+        :param nfunc: number of base functions to use.
+        :param nr: number of r points to evaluate the 2nd derivative at for the reg. term.
+        """
+        self.invertor = invertor
+        self.nfunc = nfunc
+        self.nr = nr
+        self.npts = invertor.npoints
+        # The background term, if fitted, is an extra column of the matrix
+        self.ncols = nfunc + 1 if invertor.est_bck else nfunc
+
+        # Build the matrix with alpha = 1 to get the regularization block L
+        pr = invertor.clone()
+        pr.alpha = 1.0
+        a, b = pr._get_matrix(self.ncols, nr)
+        if a.shape[0] != self.npts + nr:
+            raise ValueError("Invertor: could not build the inversion matrix")
+        data_a, reg_a, b = a[: self.npts], a[self.npts :], b[: self.npts]
+
+        # Signal and regularization sizes for the suggested alpha
+        self.sum_sig, self.sum_reg = pr._get_reg_size(self.ncols, nr, a)
+
+        # Rank tolerance used by lstsq
+        self.rcond = np.finfo(float).eps * max(a.shape)
+        self.stacked = (data_a, reg_a, b)
+        q, r = np.linalg.qr(a)
+        diag = np.abs(np.diag(r))
+        # If even the stacked matrix is rank deficient, fall back to
+        # solving it for each alpha as lstsq does
+        self.gsvd = diag.min() > diag.max() * self.rcond
+        if self.gsvd:
+            u, c, wt = np.linalg.svd(q[: self.npts], full_matrices=False)
+            self.c_sq = c**2
+            self.s_sq = np.clip(1.0 - self.c_sq, 0.0, None)
+            self.c = c
+            self.transform = np.linalg.solve(r, wt.T)
+            self.beta = u.T @ b
+            self.chi2_perp = float(np.sum((b - u @ self.beta) ** 2))
+
+        # P(r) of each coefficient on the r grid used for the figures of merit
+        nslice = 100
+        dx = invertor.dmax / nslice
+        self.r = np.linspace(0.0, invertor.dmax - dx, nslice)
+        offset = 0 if invertor.est_bck else 1
+        self.pr_basis = np.zeros((nslice, self.ncols))
+        for j in range(1 if invertor.est_bck else 0, self.ncols):
+            self.pr_basis[:, j] = 2.0 * self.r * np.sin((np.pi * (j + offset) / invertor.dmax) * self.r)
+
+    def _lstsq(self, alpha: float) -> tuple[npt.NDArray[np.float64], float, npt.NDArray[np.float64]]:
+        """
+        Solve the stacked problem for one alpha, as :meth:`Invertor.lstsq` does.
+
+        :return: coefficients, chi2 and covariance matrix.
+        """
+        data_a, reg_a, b = self.stacked
+        a = np.vstack((data_a, math.sqrt(math.fabs(alpha)) * reg_a))
+        c, residuals, _, _ = lstsq(a, np.hstack((b, np.zeros(len(reg_a)))), rcond=None)
+        chi2 = residuals[0] if residuals.shape == (1,) else -1.0
+        return c, chi2, np.linalg.pinv(a.T @ a)
+
+    def _direct(self, alphas: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """
+        Alphas that need a direct solve: all of them without the GSVD, and
+        alpha = 0 when A alone is rank deficient, where lstsq returns its
+        own truncated solution.
+        """
+        if not self.gsvd:
+            return np.ones(alphas.shape, dtype=bool)
+        return (alphas == 0) & (self.c[-1] <= self.c[0] * self.rcond)
+
+    def suggested_alpha(self, alpha: float) -> float:
+        """
+        Alpha that makes the reg term the same size as the signal, as
+        :meth:`Invertor.lstsq` computes it for the given alpha.
+        """
+        return self.sum_sig / self.sum_reg if alpha > 0 and self.sum_reg > 0 else 0.0
+
+    def coefficients(self, alphas: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Solutions, including any background term first, with one row per alpha.
+        """
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        direct = self._direct(alphas)
+        if direct.all():
+            return np.array([self._lstsq(alpha)[0] for alpha in alphas])
+        denom = self.c_sq + alphas[:, None] * self.s_sq
+        filt = np.divide(self.c * self.beta, denom, out=np.zeros_like(denom), where=denom > 0)
+        coeffs = filt @ self.transform.T
+        for k in np.flatnonzero(direct):
+            coeffs[k] = self._lstsq(alphas[k])[0]
+        return coeffs
+
+    def chi2(self, alphas: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Residual sum of squares, including the reg term, for each alpha.
+        """
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        direct = self._direct(alphas)
+        if direct.all():
+            return np.array([self._lstsq(alpha)[1] for alpha in alphas])
+        reg = alphas[:, None] * self.s_sq
+        denom = self.c_sq + reg
+        # Components outside the range of A are left entirely in the residual
+        terms = np.divide(reg * self.beta**2, denom, out=np.ones_like(denom) * self.beta**2, where=denom > 0)
+        chi2 = self.chi2_perp + np.sum(terms, axis=1)
+        for k in np.flatnonzero(direct):
+            chi2[k] = self._lstsq(alphas[k])[1]
+        return chi2
+
+    def scan(self, alphas: npt.ArrayLike) -> dict[str, npt.NDArray]:
+        """
+        Evaluate chi2, the number of P(r) peaks and the positive fraction of
+        P(r) for each alpha, as :meth:`Invertor.get_peaks` and
+        :meth:`Invertor.get_positive` would for the solution at that alpha.
+
+        :param alphas: regularization constants.
+
+        :return: dictionary with arrays chi2, peaks and positive.
+        """
+        values = self.coefficients(alphas) @ self.pr_basis.T
+
+        # Build an index array with True for ascending and false for flat or descending
+        pos = values[:, :-1] < values[:, 1:]
+        # Count the number of slope changes
+        peaks = np.sum((pos[:, :-1] != pos[:, 1:]) & pos[:, :-1], axis=1)
+        # Check if starting descending or ending ascending
+        peaks += 1 - pos[:, 0] + pos[:, -1]
+
+        total = np.sum(np.fabs(values), axis=1)
+        total_pos = np.sum(np.where(values > 0.0, values, 0.0), axis=1)
+        positive = np.divide(total_pos, total, out=np.zeros_like(total), where=total != 0)
+
+        return {"chi2": self.chi2(alphas), "peaks": peaks, "positive": positive}
+
+    def invert(self, alpha: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Set the invertor to the solution for the given alpha, exactly as
+        :meth:`Invertor.lstsq` would.
+
+        :param alpha: regularization constant.
+
+        :return: c_out, c_cov - the coefficients with covariance matrix
+        """
+        pr = self.invertor
+        pr.alpha = alpha
+        pr.nfunc = self.nfunc
+        c = self.coefficients(alpha)[0]
+        pr.chi2 = chi2 = float(self.chi2(alpha)[0])
+        pr.suggested_alpha = self.suggested_alpha(alpha)
+
+        # Covariance matrix, the inverse of a_transposed * a
+        if self._direct(np.array([alpha]))[0]:
+            cov = self._lstsq(alpha)[2]
+        else:
+            denom = self.c_sq + alpha * self.s_sq
+            inv_denom = np.divide(1.0, denom, out=np.zeros_like(denom), where=denom > 0)
+            cov = (self.transform * inv_denom) @ self.transform.T
+        err = math.fabs(chi2 / (self.npts - self.ncols)) * cov
+
+        if not pr.est_bck:
+            pr.out = c
+            pr.cov = err
+        else:
+            # background is the first term, rest are the coefficients
+            pr.background = c[0]
+            c_0 = np.zeros(self.ncols)
+            err_0 = np.zeros((self.ncols, self.ncols))
+            c_0[:-1] = c[1:]
+            err_0[:-1, :-1] = err[1:, 1:]
+            pr.out = c_0
+            pr.cov = err_0
+
+        return pr.out, pr.cov
@@ -70,9 +70,10 @@ class NTermEstimator:
         for k in range(self.nterm_min, self.nterm_max, 1):
             if self.isquit_func is not None:
                 self.isquit_func()
-            best_alpha, message, _ = inver.estimate_alpha(k)
-            inver.alpha = best_alpha
-            inver.out, inver.cov = inver.lstsq(k)
+            # One decomposition serves both the alpha search and the inversion
+            path = inver.regularization_path(k)
+            best_alpha, message, _ = inver.estimate_alpha(k, path=path)
+            inver.out, inver.cov = path.invert(best_alpha)
             osc = inver.oscillations(inver.out)
             err = inver.get_pos_err(inver.out, inver.cov)
             if osc > 10.0:
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 import numpy as np
+from scipy.spatial import ConvexHull, QhullError
+from scipy.spatial.distance import cdist
 
 from sas.sascalc.shape2sas.HelperFunctions import sinc
 from sas.sascalc.shape2sas.Models import ModelSystem, SimulationParameters
@@ -32,11 +34,13 @@ class WeightedPairDistribution:
     def __init__(self, x: np.ndarray,
                        y: np.ndarray,
                        z: np.ndarray,
-                       p: np.ndarray):
+                       p: np.ndarray,
+                       tile_size: int = 1024):
         self.x = x
         self.y = y
         self.z = z
         self.p = p #contrast
+        self.tile_size = tile_size #points per side of a tile of point pairs
 
     @staticmethod
     def calc_dist(x: np.ndarray) -> np.ndarray:
@@ -81,6 +85,75 @@ class WeightedPairDistribution:
         contrast = contrast.astype('float32')
         return contrast
 
+    def pair_tiles(self):
+        """
+        iterate over tiles of point pairs, so that only tile_size**2
+        distances are held in memory at a time instead of N**2
+
+        only tiles in the upper triangle are visited, and within diagonal
+        tiles only the upper triangle including the self-terms is kept.
+        Off-diagonal contrast products are doubled, so that sums over all
+        tiles equal sums over all N**2 ordered pairs
+
+        output (per tile)
+        dist     : pairwise distances
+        contrast : pairwise contrast products
+        """
+        xyz = np.column_stack((self.x, self.y, self.z))
+        p = np.asarray(self.p, dtype=float)
+        N, T = len(xyz), self.tile_size
+        for i in range(0, N, T):
+            xyz_i, p_i = xyz[i:i+T], p[i:i+T]
+            for j in range(i, N, T):
+                dist = cdist(xyz_i, xyz[j:j+T])
+                contrast = 2 * np.outer(p_i, p[j:j+T])
+                if i == j:
+                    upper = np.triu_indices(len(xyz_i))
+                    contrast[np.diag_indices(len(xyz_i))] /= 2
+                    yield dist[upper], contrast[upper]
+                else:
+                    yield dist.reshape(-1), contrast.reshape(-1)
+
+    def calc_dmax(self) -> float:
+        """
+        calculate the maximum pairwise distance
+
+        the most distant pair of points are both vertices of the convex
+        hull, so only the distances between hull vertices are searched,
+        one tile at a time
+        """
+        xyz = np.column_stack((self.x, self.y, self.z))
+        try:
+            xyz = xyz[ConvexHull(xyz).vertices]
+        except (QhullError, ValueError):
+            # too few points, or all points in a plane: search all pairs
+            pass
+        N, T = len(xyz), self.tile_size
+        return max(np.amax(cdist(xyz[i:i+T], xyz[j:j+T]))
+                   for i in range(0, N, T) for j in range(i, N, T))
+
+    @staticmethod
+    def polydispersity_weights(polydispersity: float) -> list[tuple[float, float]]:
+        """
+        scale factors for the distances and the corresponding weights,
+        for a normal distribution of relative sizes
+
+        input
+        polydispersity: relative polydispersity, float
+
+        output
+        list of (factor_d, weight)
+        """
+        N_poly_integral = 10
+        factor_range = 1 + np.linspace(-3, 3, N_poly_integral) * polydispersity
+        weights = []
+        for factor_d in factor_range:
+            res = (1.0 - factor_d) / polydispersity
+            w = np.exp(-res**2 / 2.0) # weight: normal distribution
+            vol = factor_d**3 # weight: relative volume, because larger particles scatter more
+            weights.append((factor_d, w * vol**2))
+        return weights
+
     @staticmethod
     def generate_histogram(dist: np.ndarray, contrast: np.ndarray, r_max: float, Nbins: int) -> Vector2D:
         """
@@ -142,21 +215,16 @@ class WeightedPairDistribution:
             Dmax = np.amax(dist) * (1 + 3 * polydispersity)
             r_max = Dmax * ratio_rmax_dmax
             r, hr_1 = self.generate_histogram(dist, contrast, r_max, Nbins)
-            N_poly_integral = 10
-            factor_range = 1 + np.linspace(-3, 3, N_poly_integral) * polydispersity
             hr, norm = 0, 0
-            for factor_d in factor_range:
+            for factor_d, w in self.polydispersity_weights(polydispersity):
                 if factor_d == 1.0:
                     hr += hr_1
                     norm += 1
                 else:
                     _, dhr = self.generate_histogram(dist * factor_d, contrast, r_max, Nbins)
                     #dhr = histogram1d(dist * factor_d, bins=Nbins, weights=contrast, range=(0,r_max))
-                    res = (1.0 - factor_d) / polydispersity
-                    w = np.exp(-res**2 / 2.0) # weight: normal distribution
-                    vol = factor_d**3 # weight: relative volume, because larger particles scatter more
-                    hr += dhr * w * vol**2
-                    norm += w * vol**2
+                    hr += dhr * w
+                    norm += w
             hr /= norm
         else:
             Dmax = np.amax(dist)
@@ -168,6 +236,52 @@ class WeightedPairDistribution:
 
         return r, hr
 
+    def calc_hr_tiled(self,
+                      Nbins: int,
+                      polydispersity: float,
+                      include_self: bool = False) -> Vector2D:
+        """
+        calculate h(r) as calc_hr() does, but accumulate the histogram
+        over tiles of point pairs from pair_tiles(), so that peak memory
+        is set by tile_size and not by the number of points
+
+        input:
+        Nbins         : number of bins in h(r)
+        polydispersity: relative polydispersity, float
+        include_self  : include pairs at zero distance (self-terms)
+
+        output:
+        hr        : pair distance distribution function
+        """
+
+        ## make r range in h(r) histogram slightly larger than Dmax
+        ratio_rmax_dmax = 1.05
+
+        Dmax = self.calc_dmax()
+        if polydispersity > 0.0:
+            Dmax *= 1 + 3 * polydispersity
+            weights = self.polydispersity_weights(polydispersity)
+        else:
+            weights = [(1.0, 1.0)]
+        r_max = Dmax * ratio_rmax_dmax
+
+        hr = np.zeros(Nbins)
+        for dist, contrast in self.pair_tiles():
+            if not include_self:
+                idx_nonzero = np.where(dist > 0.0) #  nonzero elements
+                dist, contrast = dist[idx_nonzero], contrast[idx_nonzero]
+            for factor_d, w in weights:
+                _, dhr = self.generate_histogram(dist * factor_d, contrast, r_max, Nbins)
+                hr += dhr * w
+        hr /= sum(w for _, w in weights)
+        dr = r_max / Nbins
+        r = np.arange(Nbins) * dr + dr / 2
+
+        # print Dmax
+        print(f"        Dmax: {Dmax:.3e} A")
+
+        return r, hr
+
     def calc_pr(self, Nbins: int, polydispersity: float) -> Vector3D:
         """
         calculate p(r)
@@ -181,12 +295,8 @@ class WeightedPairDistribution:
         output:
         pr        : pair distance distribution function
         """
-        dist = self.calc_all_dist()
-        contrast = self.calc_all_contrasts()
-
-        ## calculate pr
-        idx_nonzero = np.where(dist > 0.0) #  nonzero elements
-        r, pr = self.calc_hr(dist[idx_nonzero], Nbins, contrast[idx_nonzero], polydispersity)
+        ## calculate pr, accumulated over tiles of point pairs
+        r, pr = self.calc_hr_tiled(Nbins, polydispersity)
 
         ## normalize so pr_max = 1
         pr_norm = pr / np.amax(pr)
@@ -7,6 +7,7 @@ size distribution.
 """
 
 import logging
+from collections import OrderedDict
 
 import numpy as np
 import numpy.typing as npt
@@ -20,6 +21,10 @@ from sas.sascalc.size_distribution.maxEnt_method import maxEntMethod
 
 logger = logging.getLogger(__name__)
 
+# Number of model matrices kept for reuse between fits
+MODEL_MATRIX_CACHE_SIZE = 8
+_model_matrix_cache: OrderedDict[tuple, tuple[npt.NDArray, npt.NDArray]] = OrderedDict()
+
 
 def add_gaussian_noise(x: npt.ArrayLike, dx: npt.ArrayLike, seed: int | None = None) -> npt.NDArray:
     """
@@ -471,41 +476,53 @@ class sizeDistribution:
         Generate a matrix of intensities from a specific sasmodels model;
         probably should be generalized to a class to use maxent on any parameter of interest w/in the model.
         For now, the pars are fixed.
+
+        The matrix is cached on (model, q, bins, aspect ratio, contrast), so
+        re-running with different weights or background reuses it.
+
         :param moddata: Data1D object that has the data trimmed depending on background
             subtraction or power law subtracted from the data. Also self.qMin and self.qMax.
         """
+        q = np.asarray(moddata.x, dtype=float)
+        key = (self.model, q.tobytes(), self.bins.tobytes(), float(self.aspectRatio), float(self.contrast))
+        if key in _model_matrix_cache:
+            _model_matrix_cache.move_to_end(key)
+        else:
+            _model_matrix_cache[key] = self._calc_model_matrix(q)
+            if len(_model_matrix_cache) > MODEL_MATRIX_CACHE_SIZE:
+                _model_matrix_cache.popitem(last=False)
+        self.model_matrix, self.volumes = _model_matrix_cache[key]
+
+    def _calc_model_matrix(self, q: npt.NDArray) -> tuple[npt.NDArray, npt.NDArray]:
+        """
+        Intensity of each bin at each q, with one column per bin, and the bin volumes.
+
+        All lengths of the shape scale with the bin radius R, so with a fixed
+        aspect ratio F(q; R) = R^3 F(qR; 1) and V(R) = R^3 V(1). Every bin is
+        then computed in a single kernel call for the unit shape on the q*R
+        grid, rather than one call per bin.
+        """
         pars = {
             "sld": self.contrast,
             "sld_solvent": 0.0,
             "background": 0.0,
             "scale": 1.0,
+            "radius_equatorial": 1.0,
+            "radius_polar": self.aspectRatio,
         }
 
-        intensities = []
-        volumes = []
-
-        # Build a single Kernel to compute both intensity and volume per bin
         model_obj = load_model(self.model)
-        calculator = model_obj.make_kernel((moddata.x,))
-
-        for bin in self.bins:
-            p = pars.copy()
-            p["radius_equatorial"] = bin
-            p["radius_polar"] = bin * self.aspectRatio
-
-            _, Fsq, _, volume, volume_ratio = call_Fq(calculator, p)
-
-            # Compute intensity using kernel convention: combined_scale = scale / shell_volume
-            scale_val = p.get("scale", 1.0)
-            background_val = p.get("background", 0.0)
-            combined_scale = scale_val / volume
-
-            intensity = combined_scale * Fsq + background_val
-            intensities.append(intensity)
-            volumes.append(volume)
-
-        self.model_matrix = np.vstack(intensities).T
-        self.volumes = np.array(volumes)
+        calculator = model_obj.make_kernel((np.outer(q, self.bins).ravel(),))
+        _, Fsq, _, volume, _ = call_Fq(calculator, pars)
+        calculator.release()
+
+        scale = self.bins**3
+        volumes = volume * scale
+        # Compute intensity using kernel convention: combined_scale = scale / shell_volume
+        model_matrix = Fsq.reshape(len(q), len(self.bins)) * (scale**2 / volumes)
+        model_matrix.flags.writeable = False
+        volumes.flags.writeable = False
+        return model_matrix, volumes
 
     def calc_volume_weighted_dist(self, binmag: np.ndarray) -> None:
         """
@@ -603,33 +620,33 @@ class sizeDistribution:
         :param sigma: array of weights for the MaxEnt fit
         :return: list of convergence information for each MaxEnt fit
         """
+        # Run MaxEnt on all the intensities together; noise replicates of a
+        # full fit share everything except the intensity itself
+        MethodCall = maxEntMethod()
+        chisq, bin_magnitude, icalc, converged, conv_iter = MethodCall.MaxEnt_SB_batch(
+            np.asarray(intensities), sigma, self.model_matrix, BinsBack, self.iterMax, report=False
+        )
+
         ChiSq = []
         BinMag = []
         IMaxEnt = []
         convergence = []
-
-        # Run MaxEnt
-        for intensity in intensities:
-            MethodCall = maxEntMethod()
-            try:
-                chisq, bin_magnitude, icalc, converged, conv_iter = MethodCall.MaxEnt_SB(
-                    intensity, sigma, self.model_matrix, BinsBack, self.iterMax, report=False
-                )
-            except ZeroDivisionError:
+        for k in range(len(intensities)):
+            if not np.isfinite(chisq[k]):
                 logger.error(
                     "Divide by Zero Error occurred in maximum entropy fitting. "
                     "Try increasing the weight factor to increase the error weighting"
                 )
-            else:
-                ChiSq.append(chisq)
-                BinMag.append(bin_magnitude)
-                IMaxEnt.append(icalc)
-                convergence.append((converged, conv_iter))
-                if not converged:
-                    logger.warning(
-                        "Maximum Entropy did not converge. Try increasing the weight factor "
-                        "to increase the weighting effect."
-                    )
+                continue
+            ChiSq.append(chisq[k])
+            BinMag.append(bin_magnitude[k])
+            IMaxEnt.append(icalc[k])
+            convergence.append((bool(converged[k]), int(conv_iter[k])))
+            if not converged[k]:
+                logger.warning(
+                    "Maximum Entropy did not converge. Try increasing the weight factor "
+                    "to increase the weighting effect."
+                )
 
         # If all bin magnitudes are NaN, raise an error and let the caller handle it
         if np.isnan(BinMag).all():
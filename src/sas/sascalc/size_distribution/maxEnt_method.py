@@ -127,6 +127,64 @@ class decision_helper:
 
         return beta
 
+    # The *_batch methods below repeat the steps above for a stack of
+    # independent problems, one per row, with the same arithmetic.
+    def Dist_batch(self, s2, beta):
+        '''Measure the distance of each possible solution in a stack'''
+        return -np.einsum('mk,mkl,ml->m', beta, s2, beta)
+
+    def ChiNow_batch(self, ax, c1, c2, s1, s2):
+        '''
+        ChiNow for a stack of problems with one ``ax`` each
+
+        :returns tuple: (ChiNow computation of ``w``, beta) with one row per problem
+        '''
+        bx = 1 - ax
+        a =   bx[:, None, None] * c2  -  ax[:, None, None] * s2
+        b = -(bx[:, None] * c1  -  ax[:, None] * s1)
+
+        beta = self.ChoSol_batch(a, b)
+        w = 1.0 + np.sum(beta * (c1 + 0.5 * np.einsum('mkl,ml->mk', c2, beta)), axis=1)
+        return w, beta
+
+    def ChoSol_batch(self, a, b):
+        '''
+        ChoSol for a stack of 3x3 problems
+
+        :returns: new vectors beta, one row per problem
+        '''
+        m, n = b.shape
+        fl = np.zeros((m, n, n))
+        bl = np.zeros_like(b)
+
+        if np.any(a[:, 0, 0] <= 0):
+            msg = "ChoSol: a[0][0] = "
+            msg += str(a[:, 0, 0].min())
+            msg += '  Value must be positive'
+            raise self.MaxEntException(msg)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fl[:, 0, 0] = np.sqrt(a[:, 0, 0])
+            for i in (1, 2):
+                fl[:, i, 0] = a[:, i, 0] / fl[:, 0, 0]
+                for j in range(1, i+1):
+                    z = a[:, i, j] - np.sum(fl[:, i, :j] * fl[:, j, :j], axis=1)
+                    if j == i:
+                        fl[:, i, j] = np.sqrt(np.maximum(0., z))
+                    else:
+                        fl[:, i, j] = z / fl[:, j, j]
+
+            bl[:, 0] = b[:, 0] / fl[:, 0, 0]
+            for i in (1, 2):
+                bl[:, i] = (b[:, i] - np.sum(fl[:, i, :i] * bl[:, :i], axis=1)) / fl[:, i, i]
+
+            beta = np.empty((m, n))
+            beta[:, -1] = bl[:, -1] / fl[:, -1, -1]
+            for i in (1, 0):
+                beta[:, i] = (bl[:, i] - np.sum(fl[:, i+1:, i] * beta[:, i+1:], axis=1)) / fl[:, i, i]
+
+        return beta
+
 class maxEntMethod:
     def MaxEntMove(self,fSum, blank, chisq, chizer, c1, c2, s1, s2):
         r'''
@@ -324,3 +382,190 @@ class maxEntMethod:
         print (' No convergence! Try increasing Error multiplier.')
         return chisq/chizer, f, np.dot(f, Gqr.transpose()), converged, iter             # no solution after IterMax iterations
 
+    def MaxEntMove_batch(self, fSum, blank, chisq, chizer, c1, c2, s1, s2):
+        r'''
+        MaxEntMove for a stack of problems, bisecting for all of them at once.
+        Problems whose alpha chop has converged are left as they are while
+        the others carry on.
+        '''
+        helper = decision_helper()
+        m = len(chisq)
+        a_lower, a_upper = np.zeros(m), np.ones(m)    # bracket  "a"
+        cmin, beta = helper.ChiNow_batch(a_lower, c1, c2, s1, s2)
+        ctarg = np.where(cmin*chisq > chizer, (1.0 + cmin)/2, chizer/chisq)
+        f_lower = cmin - ctarg
+        c_upper, beta = helper.ChiNow_batch(a_upper, c1, c2, s1, s2)
+        f_upper = c_upper - ctarg
+
+        a_new = np.zeros(m)
+        fx = np.full(m, 2*MOVE_PASSES)     # just to start off
+        loop = np.ones(m, dtype=int)
+        while True:
+            active = (np.abs(fx) >= MOVE_PASSES) & (loop <= MAX_MOVE_LOOPS)
+            if not active.any():
+                break
+            a_new[active] = (a_lower[active] + a_upper[active]) * 0.5   # search by bisection
+            c_new, beta[active] = helper.ChiNow_batch(
+                a_new[active], c1[active], c2[active], s1[active], s2[active])
+            fx[active] = c_new - ctarg[active]
+            # tighten the search range for the next pass
+            lower = active & (f_lower*fx > 0)
+            a_lower[lower], f_lower[lower] = a_new[lower], fx[lower]
+            upper = active & (f_upper*fx > 0)
+            a_upper[upper], f_upper[upper] = a_new[upper], fx[upper]
+            loop[active] += 1
+
+        if np.any((np.abs(fx) >= MOVE_PASSES) | (loop > MAX_MOVE_LOOPS)):
+            msg = "MaxEntMove: Loop counter = "
+            msg += str(MAX_MOVE_LOOPS)
+            msg += '  No convergence in alpha chop'
+            raise helper.MaxEntException(msg)
+
+        w = helper.Dist_batch(s2, beta)
+        # invoke the distance penalty, SB eq. 17
+        penalty = w > DISTANCE_LIMIT_FACTOR*fSum/blank
+        beta[penalty] *= np.sqrt(fSum[penalty]/(blank*w[penalty]))[:, None]
+        chtarg = ctarg * chisq
+        return w, chtarg, loop, a_new, fx, beta
+
+    def MaxEnt_SB_batch(self,Iq,sigma,Gqr,first_bins,IterMax=5000,report=True):
+        r'''
+        Run :meth:`MaxEnt_SB` on a stack of intensities at once, such as the
+        noise replicates of a full fit. All the replicates share sigma, the
+        transformation matrix and the initial guess, so each iteration
+        advances every unconverged replicate with a few batched matrix
+        products. Replicates drop out of the batch as they converge, or if
+        their solution becomes non-finite.
+
+        :param float[][] Iq: background-subtracted intensities, one row per replicate
+        :param float sigma: normalization factor obtained using scale, weights,
+               and weight factors
+        :param float[][] G: transformation matrix
+        :param float first_bins[]: initial guess for distribution
+        :param int IterMax: maximum iterations allowed
+        :param boolean report: print report if True; do not print if False
+
+        :returns tuple: (chisq/chizer, :math:`f(r) dr`, calculated intensity,
+            converged, iterations) with one entry or row per replicate.
+            Replicates that failed numerically have NaN results and are not
+            marked converged.
+        '''
+        Iq = np.atleast_2d(np.asarray(Iq, dtype=float))
+        nreps, npt = Iq.shape
+        n = len(first_bins)
+
+        blank = sum(first_bins) / len(first_bins)            # average of initial bins before optimization
+        chizer = npt*1.0
+        sigma_sq = sigma * sigma
+
+        # Results, one row per replicate
+        chisq_out = np.full(nreps, np.nan)
+        f_out = np.full((nreps, n), np.nan)
+        icalc_out = np.full((nreps, npt), np.nan)
+        converged = np.zeros(nreps, dtype=bool)
+        iters = np.full(nreps, IterMax - 1)
+
+        # State of the replicates still being solved
+        idx = np.arange(nreps)
+        f = np.tile(first_bins * 1.0, (nreps, 1))            # starting distribution is the same as the inital distribution
+        fSum = f.sum(axis=1)
+        icalc = f @ Gqr.T
+        z = (Iq - icalc) / sigma                             # standardized residuals
+        chisq = np.sum(z*z, axis=1)                          # Chi^2
+
+        def finish(done, done_converged, iteration):
+            chisq_out[idx[done]] = chisq[done] / chizer
+            f_out[idx[done]] = f[done]
+            icalc_out[idx[done]] = icalc[done]
+            converged[idx[done]] = done_converged
+            iters[idx[done]] = iteration
+
+        for iter in range(IterMax):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ox = -2 * z / sigma
+                cgrad = ox @ Gqr                                            # del(C)/del(f[i]), SB eq. 8
+                sgrad = -np.log(f/first_bins) / (blank*math.exp (1.0))     # del(S)/del(f[i])
+                snorm = np.sqrt(np.sum(f * sgrad*sgrad, axis=1))            # entropy, SB eq. 22
+                cnorm = np.sqrt(np.sum(f * cgrad*cgrad, axis=1))            # Chi^2, SB eq. 22
+                tnorm = np.sum(f * sgrad * cgrad, axis=1)                   # norm of gradient
+
+                a = np.ones(len(idx))
+                b = 1.0 / cnorm
+                if iter == 0:
+                    test = np.zeros(len(idx))   # mismatch between entropy and ChiSquared gradients
+                else:
+                    test = np.sqrt( ( 1.0 - tnorm/(snorm*cnorm) )/2 )      # SB eq. 37?
+                    a = 0.5 / (snorm * test)
+                    b *= 0.5 / test
+                xi = np.empty((len(idx), SEARCH_DIRECTIONS, n))
+                xi[:, 0] = f * cgrad / cnorm[:, None]
+                xi[:, 1] = f * (a[:, None] * sgrad - b[:, None] * cgrad)
+
+                eta = np.empty((len(idx), SEARCH_DIRECTIONS, npt))
+                eta[:, :2] = xi[:, :2] @ Gqr.T                             # solution --> data
+                xi[:, 2] = (eta[:, 1] / sigma_sq) @ Gqr                    # data --> solution
+                a = 1.0 / np.sqrt(np.sum(f * xi[:, 2]*xi[:, 2], axis=1))
+                xi[:, 2] *= f * a[:, None]
+                eta[:, 2] = xi[:, 2] @ Gqr.T                               # solution --> data
+
+                # prepare the search directions for the conjugate gradient technique
+                c1 = np.einsum('mkn,mn->mk', xi, cgrad) / chisq[:, None]   # C_mu, SB eq. 24
+                s1 = np.einsum('mkn,mn->mk', xi, sgrad)                    # S_mu, SB eq. 24
+                c2 = 2 * np.einsum('mkp,mlp->mkl', eta, eta / sigma_sq) / chisq[:, None, None]   # M_(mu,nu)
+                s2 = -np.einsum('mkn,mln->mkl', xi, xi / f[:, None, :]) / blank                  # g_(mu,nu)
+
+            # Replicates that have gone non-finite can not be moved further
+            failed = ~(np.isfinite(c1).all(axis=1) & np.isfinite(c2).all(axis=(1, 2))
+                       & np.isfinite(s1).all(axis=1) & np.isfinite(s2).all(axis=(1, 2)))
+            if failed.any():
+                keep = ~failed
+                idx, f, fSum, z, chisq, icalc, test, xi = (
+                    idx[keep], f[keep], fSum[keep], z[keep], chisq[keep], icalc[keep], test[keep], xi[keep])
+                c1, c2, s1, s2 = c1[keep], c2[keep], s1[keep], s2[keep]
+                if not len(idx):
+                    break
+
+            beta = np.zeros((len(idx), SEARCH_DIRECTIONS))
+            beta[:, 0] = -0.5 * c1[:, 0] / c2[:, 0, 0]
+            if (iter > 0):
+                w, chtarg, loop, a_new, fx, beta = self.MaxEntMove_batch(fSum, blank, chisq, chizer, c1, c2, s1, s2)
+
+            f_old = f.copy()                                   # preserve the last solution
+            f += np.einsum('mkn,mk->mn', xi, beta)             # move the solution towards the solution, SB eq. 25
+
+            # As mentioned at the top of p.119,
+            # need to protect against stray negative values.
+            # In this case, set them to RESET_STRAYS * base[i]
+            f = np.where(f <= 0.0, RESET_STRAYS * first_bins, f)
+            df = f - f_old
+            fSum = f.sum(axis=1)
+            fChange = df.sum(axis=1)
+
+            icalc = f @ Gqr.T
+            z = (Iq[idx] - icalc) / sigma                      # standardized residuals
+            chisq = np.sum(z*z, axis=1)                        # report this ChiSq
+
+            if report:
+                # calculate the normalized entropy
+                fn = f / fSum[:, None]
+                S = np.sum(fn * np.log(fn), axis=1)            # normalized entropy, S&B eq. 1
+                print (" MaxEnt trial/max: %3d/%3d, %d replicates" % ((iter+1), IterMax, len(idx)))
+                print (" Residual: %5.2lf%% Entropy: %8lg" % (100*np.max(test), np.min(S)))
+                print (" Function sum: %.6lg Change from last: %.2lf%%\n"
+                       % (np.mean(fSum), 100*np.max(np.abs(fChange/fSum))))
+
+            # See if we have finished our task.
+            # do the hardest test first
+            done = (np.abs(chisq/chizer-1.0) < CHI_SQR_LIMIT) & (test < TEST_LIMIT)
+            if done.any():
+                finish(done, True, iter)
+                keep = ~done
+                idx, f, fSum, z, chisq, icalc = idx[keep], f[keep], fSum[keep], z[keep], chisq[keep], icalc[keep]
+                if not len(idx):
+                    break
+        else:
+            finish(np.ones(len(idx), dtype=bool), False, IterMax - 1)
+
+        if report:
+            print (' Convergence achieved for %d of %d replicates.' % (converged.sum(), nreps))
+        return chisq_out, f_out, icalc_out, converged, iters
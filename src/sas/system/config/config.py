@@ -207,6 +207,29 @@ class Config(ConfigBase, metaclass=ConfigMeta):
         # Default fitting optimizer
         self.FITTING_DEFAULT_OPTIMIZER = 'lm'
 
+        # Number of worker processes for batch fits: 0 uses one per CPU core,
+        # 1 runs the fits one after another in the fitting thread
+        self.FITTING_BATCH_WORKERS = 0
+
+        # Number of worker processes evaluating the Jacobian of single
+        # Levenberg-Marquardt fits: 0 uses one per CPU core, 1 evaluates it
+        # in the fitting thread
+        self.FITTING_JACOBIAN_WORKERS = 1
+
+        # Number of worker processes computing the theory of the datasets of
+        # simultaneous fits: 0 uses one per CPU core, 1 computes them in the
+        # fitting thread
+        self.FITTING_MODEL_WORKERS = 1
+
+        # Size in MB of the disk cache of Generic Scattering Calculator
+        # intensities, or 0 to compute them every time
+        self.GENSAS_CACHE_SIZE = 512
+
+        # Size in MB of the arrays of loaded data kept in memory. The arrays
+        # of data not used recently are read back from their file when
+        # next used. 0 keeps all of them in memory.
+        self.DATA_ARRAY_CACHE_SIZE = 1024
+
         # What's New variables
         self.LAST_WHATS_NEW_HIDDEN_VERSION = "6.0.1"
 
@@ -1,4 +1,5 @@
 import json
+import os
 from logging import getLogger
 
 import numpy as np
@@ -19,7 +20,9 @@ from sasmodels.data import empty_data1D, load_data
 from sasmodels.direct_model import DirectModel
 
 #TODO categoryinstallers should belong in SasView.System rather than in QTGUI
+from sas import config
 from sas.qtgui.Utilities.CategoryInstaller import CategoryInstaller
+from sas.sascalc.fit.jacobian import ParallelMPFit
 from sas.sascalc.fit.models import ModelManager
 
 from .models import (
@@ -140,10 +143,14 @@ def start_fit(fit_db):
         M = Experiment(data = test_data, model=model)
         #TODO be able to do multiple experiments
         problem = FitProblem(M)
-        if fit_db.optimizer:
-            fitted = fitters.fit(problem, method=fit_db.optimizer)
-        else:
-            fitted = fitters.fit(problem)
+        method = fit_db.optimizer if fit_db.optimizer else fitters.FIT_DEFAULT_ID
+        options = {}
+        # Evaluate the Jacobian of Levenberg-Marquardt fits in worker processes
+        jacobian_workers = config.FITTING_JACOBIAN_WORKERS or os.cpu_count() or 1
+        if method == fitters.MPFit.id and jacobian_workers > 1:
+            method = ParallelMPFit.id
+            options['jacobian_workers'] = jacobian_workers
+        fitted = fitters.fit(problem, method=method, **options)
         #TODO results to be formatted differently later
         result = M.__getstate__()
         result['_data'] = test_data.__str__()
@@ -10,8 +10,9 @@ import numpy as np
 
 from sasdata.dataloader.data_info import Data1D
 
+from sas.sascalc.corfunc.calculation_data import TangentMethod
 from sas.sascalc.corfunc.corfunc_calculator import CorfuncCalculator, extract_lamellar_parameters
-from sas.sascalc.util import SettableExtrapolationParameters
+from sas.sascalc.util import ExtrapolationParameters, SettableExtrapolationParameters
 
 
 def find(filename):
@@ -62,6 +63,38 @@ class TestCalculator(unittest.TestCase):
             self.assertAlmostEqual(calculator.transformed.gamma_1.y[0], 1)
             self.assertAlmostEqual(calculator.transformed.gamma_1.y[-1], 0, 5)
 
+    def test_incremental(self):
+        """ Running again only repeats the steps whose inputs changed """
+
+        calculator = CorfuncCalculator(self.data, self.parameters)
+        calculator.run()
+        porod, extrapolated = calculator.porod, calculator.extrapolated
+
+        calculator.tangent_method = TangentMethod.HALF_MIN
+        calculator.run()
+        self.assertIs(calculator.extrapolated, extrapolated)
+
+        # Moving the Guinier limit keeps the Porod fit
+        calculator.extrapolation_parameters = ExtrapolationParameters(
+            None, 0, 0.014, self.parameters.point_2, self.parameters.point_3, 1, None)
+        calculator.run()
+        self.assertIs(calculator.porod, porod)
+        self.assertIsNot(calculator.extrapolated, extrapolated)
+
+        # ... and gives the same results as a new calculation
+        fresh = CorfuncCalculator(self.data, SettableExtrapolationParameters(
+            0.014, self.parameters.point_2, self.parameters.point_3),
+            tangent_method=TangentMethod.HALF_MIN)
+        fresh.run()
+        np.testing.assert_array_equal(calculator.transformed.gamma_1.y, fresh.transformed.gamma_1.y)
+        self.assertEqual(calculator.lamellar_parameters, fresh.lamellar_parameters)
+
+        # A background set by hand replaces the fitted one
+        calculator.fit_background = False
+        calculator.background = 0.5
+        calculator.run()
+        self.assertAlmostEqual(calculator.extrapolated.y[-1], 0.5)
+
     def test_extract(self):
         params = extract_lamellar_parameters(
                     self.data,
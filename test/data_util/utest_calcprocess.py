@@ -0,0 +1,142 @@
+"""
+    Unit tests for calculations in worker processes
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from sas.sascalc.data_util import calcprocess
+from sas.sascalc.data_util.calcprocess import CalcProcess
+
+
+class CalcSum(CalcProcess):
+    """Sum of range(n), with an update for each step"""
+    parent_callbacks = ('log',)
+
+    def __init__(self, log=None, **kwargs):
+        CalcProcess.__init__(self, **kwargs)
+        self.log = log
+
+    def compute(self, n, step_time=0.):
+        if n < 0:
+            raise ValueError("negative n")
+        total = 0
+        for i in range(n):
+            self.update(i=i)
+            total += i
+            time.sleep(step_time)
+        if self.log is not None:
+            self.log("summed in %d" % os.getpid())
+        self.complete(total=total, pid=os.getpid())
+
+
+class CalcProcessTest(unittest.TestCase):
+
+    def setUp(self):
+        self.done = threading.Event()
+        self.results = []
+        self.updates = []
+        self.errors = []
+
+    def complete(self, **kwargs):
+        self.results.append(kwargs)
+        self.done.set()
+
+    def handle_exception(self, *exc_info):
+        self.errors.append(exc_info[0])
+        self.done.set()
+
+    def wait_until_stopped(self, calc):
+        deadline = time.time() + 30
+        while calc.isrunning() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(calc.isrunning())
+
+    def test_complete(self):
+        """
+            Updates and results of the worker reach the callbacks
+        """
+        logged = []
+        calc = CalcSum(log=logged.append, completefn=self.complete, updatefn=lambda i: self.updates.append(i),
+                       exception_handler=self.handle_exception)
+        calc.queue(1000)
+        calc.ready(0)
+        self.assertTrue(self.done.wait(60))
+        self.assertEqual(self.results[0]['total'], sum(range(1000)))
+        self.assertNotEqual(self.results[0]['pid'], os.getpid())
+        self.assertEqual(logged, ["summed in %d" % self.results[0]['pid']])
+        # One update until ready() is called again
+        self.assertEqual(len(self.updates), 1)
+
+    def test_stop(self):
+        """
+            stop() interrupts the work unit in the worker
+        """
+        started = threading.Event()
+        calc = CalcSum(completefn=self.complete, updatefn=lambda i: started.set(),
+                       exception_handler=self.handle_exception)
+        calc.queue(100000, 0.001)
+        calc.ready(0)
+        self.assertTrue(started.wait(60))
+        calc.stop()
+        self.wait_until_stopped(calc)
+        self.assertEqual(self.results, [])
+        self.assertEqual(self.errors, [])
+
+    def test_exception(self):
+        """
+            Exceptions in the worker reach the exception handler
+        """
+        calc = CalcSum(completefn=self.complete, exception_handler=self.handle_exception)
+        calc.queue(-1)
+        self.assertTrue(self.done.wait(60))
+        self.assertEqual(self.errors, [ValueError])
+        self.assertEqual(self.results, [])
+
+    def test_slots_not_reused_while_running(self):
+        """
+            A job running while more than MAX_JOBS others start and end
+            keeps its updates and can still be stopped
+        """
+        updates = []
+        started = threading.Event()
+
+        def update(i):
+            updates.append(i)
+            started.set()
+
+        with mock.patch.object(calcprocess, 'MAX_JOBS', 3):
+            calc = CalcSum(completefn=self.complete, updatefn=update, exception_handler=self.handle_exception)
+            calc.max_workers = 2
+            calc.queue(100000, 0.001)
+            calc.ready(0)
+            self.assertTrue(started.wait(60))
+
+            for _ in range(5):
+                done = threading.Event()
+                totals = []
+                short = CalcSum(completefn=lambda total, pid: (totals.append(total), done.set()))
+                short.max_workers = 2
+                short.queue(10)
+                self.assertTrue(done.wait(60))
+                self.assertEqual(totals, [45])
+
+            self.assertTrue(calc.isrunning())
+            n_updates = len(updates)
+            calc.ready(0)
+            deadline = time.time() + 30
+            while len(updates) == n_updates and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertGreater(len(updates), n_updates)
+
+            calc.stop()
+            self.wait_until_stopped(calc)
+        self.assertEqual(self.results, [])
+        self.assertEqual(self.errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
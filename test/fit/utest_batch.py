@@ -0,0 +1,92 @@
+"""
+    Unit tests for fitting in worker processes
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data1D
+from sasmodels.sasview_model import MultiplicationModel, _make_standard_model
+
+from sas.sascalc.fit import batch
+from sas.sascalc.fit.BumpsFitting import BumpsFit
+
+
+def make_fitter(model, radius, npts=200):
+    """Fitter for the radius and scale of *model* on data simulated at *radius*"""
+    q = np.linspace(0.005, 0.3, npts)
+    truth = _make_standard_model('sphere')()
+    truth.setParam('radius', radius)
+    y = truth.evalDistribution(q)
+    data = Data1D(q, y, dy=0.02*y + 1e-3)
+    fitter = BumpsFit()
+    fitter.set_model(model, 0, ['radius', 'scale'])
+    fitter.set_data(data, 0, qmin=q[0], qmax=q[-1])
+    fitter.select_problem_for_fit(0, 1)
+    fitter.set_weight_increase(0, 1)
+    fitter.fitter_id = [0]
+    return fitter
+
+
+class TestPickling(unittest.TestCase):
+
+    def test_standard_model(self):
+        model = _make_standard_model('sphere')()
+        model.setParam('radius', 12.5)
+        copy = batch.loads(batch.dumps(model))
+        # In the sending process the class maps back to the original one
+        self.assertIs(type(copy), type(model))
+        self.assertEqual(copy.getParam('radius'), 12.5)
+
+    def test_rebuilt_model(self):
+        model = MultiplicationModel(_make_standard_model('sphere')(), _make_standard_model('hardsphere')())
+        recipe = batch._info_recipe(model._model_info)
+        self.assertEqual(recipe, ('product', (('standard', 'sphere'), ('standard', 'hardsphere'))))
+        # A new process builds an equivalent class from the recipe
+        rebuilt = batch._model_class(('mixture', recipe[1], '+'))
+        self.assertEqual(rebuilt._model_info.id, 'sphere+hardsphere')
+
+
+class TestFitBatch(unittest.TestCase):
+
+    def test_matches_serial(self):
+        """
+            Fits in the pool give the same results as fitting in turn
+        """
+        radii = [44.0, 48.0, 52.0]
+        model = _make_standard_model('sphere')()
+        completed = []
+        results = batch.fit_batch([make_fitter(model, r) for r in radii], 2,
+                                  completefn=lambda index, result: completed.append(index))
+        self.assertEqual(sorted(completed), [0, 1, 2])
+        for radius, result in zip(radii, results):
+            model = _make_standard_model('sphere')()
+            expected = make_fitter(model, radius).fit()
+            np.testing.assert_allclose(result[0].pvec, expected[0].pvec, rtol=1e-6)
+            self.assertAlmostEqual(result[0].pvec[0], radius, places=3)
+
+    def test_cancel(self):
+        """
+            Cancelling drops the queued fits and stops the running ones
+        """
+        model = _make_standard_model('sphere')()
+        model.setParam('radius.width', 0.2)
+        model.setParam('radius.npts', 200)
+        fitters = [make_fitter(model, 48.0, npts=5000) for _ in range(20)]
+        start = time.time()
+
+        def isquit():
+            if time.time() - start > 0.5:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            batch.fit_batch(fitters, 2, isquit=isquit)
+        # The pool is still usable afterwards
+        results = batch.fit_batch([make_fitter(_make_standard_model('sphere')(), 48.0)]*2, 2)
+        self.assertAlmostEqual(results[1][0].pvec[0], 48.0, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+    Unit tests for the residuals of the fit data and fitness wrappers
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data2D
+from sasmodels.sasview_model import _make_standard_model
+
+from sas.sascalc.fit.AbstractFitEngine import FitData1D, FitData2D, Model
+from sas.sascalc.fit.BumpsFitting import SasFitness
+
+
+def make_data2d(n=30):
+    qx, qy = [v.flatten() for v in np.meshgrid(np.linspace(-0.2, 0.2, n), np.linspace(-0.2, 0.2, n))]
+    q = np.sqrt(qx**2 + qy**2)
+    data = 1/(1 + (40*q)**2)
+    mask = np.ones_like(q, dtype=bool)
+    mask[:n] = False
+    return Data2D(data=data, err_data=0.1*data, qx_data=qx, qy_data=qy, q_data=q, mask=mask,
+                  xmin=-0.2, xmax=0.2, ymin=-0.2, ymax=0.2)
+
+
+class FitDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = _make_standard_model('sphere')()
+
+    def test_residuals_1d(self):
+        """
+            Residuals are those of the fit range, whatever the range before
+        """
+        x = np.linspace(0.001, 0.3, 100)
+        y = 1/(1 + (40*x)**2)
+        dy = 0.1*y
+        dy[10] = 0.
+        fitdata = FitData1D(x=x, y=y, dy=dy)
+        fitdata.residuals(self.model.evalDistribution)
+        fitdata.set_fit_range(0.01, 0.2)
+
+        for radius in (20., 40.):
+            self.model.setParam('radius', radius)
+            res, theory = fitdata.residuals(self.model.evalDistribution)
+            idx = (x >= 0.01) & (x <= 0.2) & (dy != 0)
+            expected = self.model.evalDistribution(x[idx])
+            np.testing.assert_allclose(theory, expected, rtol=1e-14)
+            np.testing.assert_allclose(res, (y[idx] - expected)/dy[idx], rtol=1e-14)
+        # Each call returns new arrays
+        self.assertIsNot(fitdata.residuals(self.model.evalDistribution)[0], res)
+
+    def test_residuals_2d(self):
+        """
+            Residuals are those of the unmasked points in the fit range
+        """
+        data = make_data2d()
+        fitdata = FitData2D(sas_data2d=data, data=data.data, err_data=data.err_data)
+        fitdata.set_fit_range(0.05, 0.15)
+
+        res, theory = fitdata.residuals(self.model.evalDistribution)
+        idx = (data.q_data >= 0.05) & (data.q_data <= 0.15) & data.mask
+        expected = self.model.evalDistribution([data.qx_data[idx], data.qy_data[idx]])
+        np.testing.assert_allclose(theory, expected, rtol=1e-14)
+        np.testing.assert_allclose(res, (data.data[idx] - expected)/data.err_data[idx], rtol=1e-14)
+
+
+class SasFitnessTest(unittest.TestCase):
+
+    def test_update_changed(self):
+        """
+            Only the changed parameter values are set on the model
+        """
+        model = Model(_make_standard_model('sphere')())
+        x = np.linspace(0.001, 0.3, 50)
+        fitdata = FitData1D(x=x, y=np.ones_like(x))
+        fitness = SasFitness(model=model, data=fitdata, fitted=['radius', 'scale'])
+        theory = fitness.theory()
+
+        with mock.patch.object(model.model, 'setParam', wraps=model.model.setParam) as set_param:
+            fitness.update()
+            set_param.assert_not_called()
+            fitness.parameters()['radius'].value = 40.
+            fitness.update()
+            set_param.assert_called_once_with('radius', 40.)
+        self.assertFalse(np.array_equal(fitness.theory(), theory))
+        np.testing.assert_allclose(fitness.theory(), model.model.evalDistribution(x), rtol=1e-14)
+
+
+if __name__ == '__main__':
+    unittest.main()
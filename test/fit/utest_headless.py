@@ -0,0 +1,180 @@
+"""
+    Unit tests for the sasview fit command
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data1D
+from sasmodels.sasview_model import _make_standard_model
+
+from sas.sascalc.fit import headless
+
+# Fit page as saved in a project file, fitting the radius and scale
+PAGE = {
+    'model_name': ['sphere'],
+    'fitpage_structure': ['None'],
+    'polydisperse_params': ['False'],
+    'q_range_min': ['0.005'],
+    'q_range_max': ['0.3'],
+    'smearing': ['0'],
+    'q_weighting': ['1'],
+    'tab_name': ['M1'],
+    'scale': ['True', '1.0', None, '0.0', 'inf', []],
+    'background': ['False', '0.001', None, '-inf', 'inf', []],
+    'sld': ['False', '1', None, '-inf', 'inf', []],
+    'sld_solvent': ['False', '6', None, '-inf', 'inf', []],
+    'radius': ['True', '50', None, '0.0', 'inf', []],
+    'radius.width': ['False', '0.1', None, '0.0', '1.0', '80', '8', 'lognormal'],
+}
+
+
+class TestFitSpec(unittest.TestCase):
+
+    def test_project_page(self):
+        spec = headless.spec_from_params(PAGE)
+        self.assertEqual(spec.model_name, 'sphere')
+        self.assertEqual(spec.fitted, ['scale', 'radius'])
+        self.assertEqual(spec.limits['radius'], (0.0, np.inf))
+        self.assertEqual((spec.qmin, spec.qmax, spec.smearing), (0.005, 0.3, False))
+        # Polydispersity is off on the page
+        self.assertNotIn('radius.width', spec.values)
+
+    def test_polydispersity(self):
+        page = dict(PAGE, polydisperse_params=['True'])
+        # Pages saved without the error column
+        page['radius'] = ['True', '50', '0.0', 'inf', []]
+        page['radius.width'] = ['True', '0.1', '0.0', '1.0', '80', '8', 'lognormal']
+        spec = headless.spec_from_params(page)
+        self.assertEqual(spec.fitted, ['scale', 'radius', 'radius.width'])
+        self.assertEqual(spec.limits['radius.width'], (0.0, 1.0))
+        model = headless.make_model(spec)
+        self.assertEqual(model.dispersion['radius'],
+                         {'type': 'lognormal', 'npts': 80, 'width': 0.1, 'nsigmas': 8.0})
+
+    def test_weighting(self):
+        """
+            Weighting gives a copy of the data with nonzero uncertainties
+        """
+        data = Data1D(np.array([0.01, 0.02, 0.03]), np.array([4.0, 0.0, 1.0]),
+                      dy=np.array([0.1, 0.1, 0.1]))
+        weighted = headless._weighted(data, 2)
+        np.testing.assert_array_equal(weighted.dy, [2.0, 1.0, 1.0])
+        np.testing.assert_array_equal(data.dy, [0.1, 0.1, 0.1])
+        self.assertIs(headless._weighted(data, 1), data)
+
+    def test_structure_factor(self):
+        spec = headless.spec_from_params(dict(PAGE, fitpage_structure=['hardsphere']))
+        model = headless.make_model(spec)
+        self.assertEqual(spec.model_name, 'sphere*hardsphere')
+        self.assertIn('radius_effective', model.params)
+
+
+class TestFitCommand(unittest.TestCase):
+
+    radii = [44.0, 48.0, 52.0]
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        with open(self.path('project.json'), 'w') as file:
+            json.dump({'data1': {'fit_params': [PAGE]}}, file)
+        q = np.linspace(0.005, 0.3, 200)
+        truth = _make_standard_model('sphere')()
+        for radius in self.radii:
+            truth.setParam('radius', radius)
+            y = truth.evalDistribution(q)
+            np.savetxt(self.path('sphere_%d.txt' % radius), np.column_stack((q, y, 0.02*y + 1e-3)))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def run_fit(self, output, *args):
+        return headless.main([self.path('project.json'), self.path('sphere_*.txt'),
+                              '--output', self.path(output), *args])
+
+    def check_radii(self, records):
+        fitted = sorted((os.path.basename(r['file']), float(r['radius'])) for r in records)
+        self.assertEqual([name for name, _ in fitted],
+                         ['sphere_%d.txt' % radius for radius in self.radii])
+        np.testing.assert_allclose([radius for _, radius in fitted], self.radii, rtol=1e-4)
+
+    def test_resume(self):
+        """
+            A resumed run fits only the datasets missing from the output
+        """
+        self.assertEqual(self.run_fit('fits.jsonl', '--workers', '1'), 0)
+        with open(self.path('fits.jsonl')) as file:
+            lines = file.readlines()
+        records = [json.loads(line) for line in lines]
+        self.assertTrue(all(r['success'] for r in records))
+        self.check_radii(records)
+
+        # Drop the last record, leaving it half written as when a run is killed
+        with open(self.path('fits.jsonl'), 'w') as file:
+            file.writelines(lines[:-1])
+            file.write(lines[-1][:20])
+        with self.assertRaises(FileExistsError):
+            self.run_fit('fits.jsonl', '--workers', '1')
+        self.run_fit('fits.jsonl', '--workers', '1', '--resume')
+        with open(self.path('fits.jsonl')) as file:
+            resumed = [json.loads(line) for line in file]
+        self.assertEqual(resumed[:-1], records[:-1])
+        self.check_radii(resumed)
+
+    def test_resume_failed_load(self):
+        """
+            Files that failed to load are tried again on resume
+        """
+        load = headless.Loader.load
+
+        def fail_first(loader, path):
+            if path.endswith('sphere_44.txt'):
+                raise OSError("unreadable")
+            return load(loader, path)
+
+        with mock.patch.object(headless.Loader, 'load', fail_first):
+            self.run_fit('fits.jsonl', '--workers', '1')
+        self.run_fit('fits.jsonl', '--workers', '1', '--resume')
+        with open(self.path('fits.jsonl')) as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual([r['index'] for r in records if not r['success']], [None])
+        self.check_radii([r for r in records if r['success']])
+
+    def test_csv_in_pool(self):
+        """
+            Fits in worker processes are written as CSV rows
+        """
+        self.run_fit('fits.csv', '--workers', '2')
+        with open(self.path('fits.csv'), newline='') as file:
+            reader = csv.DictReader(file)
+            records = list(reader)
+        self.assertEqual(reader.fieldnames, headless.RECORD_FIELDS + [
+            'scale', 'scale.stderr', 'radius', 'radius.stderr', 'message'])
+        self.check_radii(records)
+
+    def test_bad_file(self):
+        """
+            Files that fail to load are recorded as failed fits
+        """
+        with open(self.path('sphere_bad.txt'), 'w') as file:
+            file.write("not data\n")
+        self.run_fit('fits.jsonl', '--workers', '1')
+        with open(self.path('fits.jsonl')) as file:
+            records = [json.loads(line) for line in file]
+        failed = [r for r in records if not r['success']]
+        self.assertEqual([os.path.basename(r['file']) for r in failed], ['sphere_bad.txt'])
+        self.assertTrue(failed[0]['message'])
+
+
+if __name__ == '__main__':
+    unittest.main()
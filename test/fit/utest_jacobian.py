@@ -0,0 +1,60 @@
+"""
+    Unit tests for Levenberg-Marquardt fits with the Jacobian in worker processes
+"""
+
+import unittest
+
+import numpy as np
+from bumps import fitters
+from bumps.fitproblem import FitProblem
+
+from sasmodels.bumps_model import Experiment, Model
+from sasmodels.core import load_model
+from sasmodels.data import empty_data1D
+from sasmodels.sasview_model import _make_standard_model
+
+from sas.sascalc.fit.jacobian import ParallelMPFit
+
+from .utest_batch import make_fitter
+
+
+class TestParallelJacobian(unittest.TestCase):
+
+    def test_matches_serial(self):
+        """
+            The fit takes the same steps as with the Jacobian computed in turn
+        """
+        model = _make_standard_model('sphere')()
+        expected = make_fitter(model, 48.0).fit()
+
+        model = _make_standard_model('sphere')()
+        fitter = make_fitter(model, 48.0)
+        fitter.jacobian_workers = 2
+        result = fitter.fit()
+
+        np.testing.assert_array_equal(result[0].pvec, expected[0].pvec)
+        np.testing.assert_array_equal(result[0].stderr, expected[0].stderr)
+        self.assertAlmostEqual(result[0].pvec[0], 48.0, places=3)
+
+    def test_bumps_problem(self):
+        """
+            The fitter is available to bumps under its own id
+        """
+        q = np.linspace(0.005, 0.3, 100)
+        data = empty_data1D(q)
+        truth = Model(load_model('sphere'), radius=48.0)
+        data.y = Experiment(data=data, model=truth).theory()
+        data.dy = 0.02*data.y
+
+        results = []
+        for method, options in [(fitters.MPFit.id, {}), (ParallelMPFit.id, {'jacobian_workers': 2})]:
+            model = Model(load_model('sphere'), radius=45.0)
+            model.radius.range(30, 60)
+            problem = FitProblem(Experiment(data=data, model=model))
+            results.append(fitters.fit(problem, method=method, **options).x)
+        np.testing.assert_array_equal(results[1], results[0])
+        self.assertNotEqual(results[1][0], 45.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
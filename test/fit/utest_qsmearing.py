@@ -0,0 +1,60 @@
+"""
+    Unit tests for 2D pinhole smearing
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data2D
+from sasmodels.resolution2d import Pinhole2D
+from sasmodels.sasview_model import _make_standard_model
+
+from sas.sascalc.fit import qsmearing
+from sas.sascalc.fit.qsmearing import PySmear2D
+
+
+def make_data(n=20):
+    qx, qy = [v.flatten() for v in np.meshgrid(np.linspace(-0.1, 0.1, n), np.linspace(-0.1, 0.1, n))]
+    q = np.sqrt(qx**2 + qy**2)
+    return Data2D(data=np.ones_like(q), err_data=np.ones_like(q), qx_data=qx, qy_data=qy, q_data=q,
+                  mask=np.ones_like(q, dtype=bool), dqx_data=0.05*q + 1e-3, dqy_data=0.02*q + 1e-3)
+
+
+class PySmear2DTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = make_data()
+        self.model = _make_standard_model('sphere')()
+        self.smearer = PySmear2D(self.data, self.model)
+        self.smearer.set_index(self.data.q_data < 0.09)
+
+    def test_resolution_reused(self):
+        """
+            The resolution is only rebuilt when its inputs change
+        """
+        with mock.patch.object(qsmearing, 'Pinhole2D', wraps=Pinhole2D) as pinhole:
+            first = self.smearer.get_value()
+            self.model.setParam('radius', 40.0)
+            self.smearer.set_index(self.data.q_data < 0.09)
+            self.smearer.get_value()
+            self.assertEqual(pinhole.call_count, 1)
+
+            self.smearer.set_accuracy('High')
+            self.smearer.get_value()
+            self.smearer.set_index(self.data.q_data < 0.08)
+            self.smearer.get_value()
+            self.smearer.set_data(make_data())
+            self.smearer.get_value()
+            self.assertEqual(pinhole.call_count, 4)
+
+        # Same values as a resolution built for the call
+        self.model.setParam('radius', 50.0)
+        index = self.data.q_data < 0.09
+        res = Pinhole2D(data=self.data, index=index, nsigma=3.0, accuracy='Low')
+        np.testing.assert_array_equal(first, res.apply(self.model.evalDistribution(res.q_calc)))
+
+
+if __name__ == '__main__':
+    unittest.main()
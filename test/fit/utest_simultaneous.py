@@ -0,0 +1,75 @@
+"""
+    Unit tests for simultaneous fits with the datasets computed in worker processes
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data1D
+from sasmodels.sasview_model import _make_standard_model
+
+from sas.sascalc.fit.BumpsFitting import BumpsFit, SasFitness, SasFitProblem
+
+
+def make_fitter(radii, npts=100):
+    """Simultaneous fitter for the radius of a sphere on data simulated at each of *radii*"""
+    q = np.linspace(0.005, 0.3, npts)
+    fitter = BumpsFit()
+    for k, radius in enumerate(radii):
+        truth = _make_standard_model('sphere')()
+        truth.setParam('radius', radius)
+        y = truth.evalDistribution(q)
+        model = _make_standard_model('sphere')()
+        model.name = 'M%d' % k
+        fitter.set_model(model, k, ['radius'])
+        fitter.set_data(Data1D(q, y, dy=0.02*y + 1e-3), k, qmin=q[0], qmax=q[-1])
+        fitter.select_problem_for_fit(k, 1)
+        fitter.set_weight_increase(k, 1)
+    fitter.fitter_id = [0]
+    return fitter
+
+
+class TestSasFitProblem(unittest.TestCase):
+
+    def test_matches_serial(self):
+        """
+            The fit gives the same results as computing the datasets in turn
+        """
+        radii = [44.0, 48.0, 52.0]
+        expected = make_fitter(radii).fit()
+
+        fitter = make_fitter(radii)
+        fitter.model_workers = 2
+        result = fitter.fit()
+
+        for r, e, radius in zip(result, expected, radii):
+            np.testing.assert_array_equal(r.pvec, e.pvec)
+            np.testing.assert_array_equal(r.theory, e.theory)
+            self.assertAlmostEqual(r.pvec[0], radius, places=3)
+
+    def test_unchanged_models(self):
+        """
+            Only the datasets whose parameters changed are computed again
+        """
+        fitter = make_fitter([44.0, 48.0])
+        models = [SasFitness(model=a.get_model(), data=a.get_data(), fitted=a.pars)
+                  for a in fitter.fit_arrange_dict.values()]
+        problem = SasFitProblem(models)
+        problem.nllf()
+
+        patches = [mock.patch.object(fitness.data, 'residuals', wraps=fitness.data.residuals)
+                   for fitness in models]
+        mocks = [p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+        point = problem.getp()
+        point[1] += 5.
+        problem.setp(point)
+        problem.nllf()
+        self.assertEqual([m.call_count for m in mocks], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
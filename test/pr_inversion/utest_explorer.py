@@ -4,37 +4,37 @@
 
 import os.path
 import unittest
+from types import SimpleNamespace
 
-import pytest
+import numpy as np
 
 from sas.sascalc.pr.distance_explorer import DistExplorer
 from sas.sascalc.pr.invertor import Invertor
 
-pytest.skip(reason="Refactored invertor doesn't support this test", allow_module_level=True)
-
-try:
-    from utest_invertor import load
-except ImportError:
-    from .utest_invertor import load
 
 def find(filename):
     return os.path.join(os.path.dirname(__file__), 'data', filename)
 
 
+def load(path):
+    """Load x, y and a simulated error from a two column data file"""
+    x, y = np.loadtxt(path, skiprows=1, unpack=True)
+    err = 0.15 * np.sqrt(y[0]) * np.sqrt(y)
+    return x, y, err
+
+
 class TestExplorer(unittest.TestCase):
 
     def setUp(self):
-        self.invertor = Invertor()
         x, y, err = load(find('sphere_80.txt'))
+        # The invertor only needs the data from its logic object
+        logic = SimpleNamespace(data=SimpleNamespace(x=x, y=y, dy=err))
+        self.invertor = Invertor(logic)
 
         # Choose the right d_max...
-        self.invertor.d_max = 160.0
+        self.invertor.dmax = 160.0
         # Set a small alpha
         self.invertor.alpha = .0007
-        # Set data
-        self.invertor.x   = x
-        self.invertor.y   = y
-        self.invertor.err = err
         self.invertor.nfunc = 15
 
         self.explo = DistExplorer(self.invertor)
@@ -43,6 +43,41 @@ class TestExplorer(unittest.TestCase):
         results = self.explo(120, 200, 25)
         self.assertEqual(len(results.errors), 0)
         self.assertEqual(len(results.chi2), 25)
+        np.testing.assert_allclose(results.d_max, np.linspace(120, 200, 25))
+
+    def test_matches_serial(self):
+        """
+            The threaded scan gives the same outputs as inverting
+            at each D_max in turn
+        """
+        updates = []
+        results = self.explo(120, 200, 5, max_workers=3,
+                             updatefn=lambda res: updates.append(len(res.d_max)))
+        self.assertEqual(updates, [1, 2, 3, 4, 5])
+        for d, chi2, rg in zip(results.d_max, results.chi2, results.rg):
+            self.invertor.dmax = d
+            out, _ = self.invertor.invert(self.invertor.nfunc)
+            self.assertAlmostEqual(self.invertor.chi2 / chi2, 1.0)
+            self.assertAlmostEqual(self.invertor.rg(out), rg)
+
+    def test_fixed_background(self):
+        """
+            With a fixed background the data of the invertor is left
+            unchanged while the scan runs, and the outputs match
+            inverting at each D_max in turn
+        """
+        self.invertor.est_bck = False
+        self.invertor.background = 1e5
+        y = self.invertor.y.copy()
+        unchanged = []
+        results = self.explo(120, 200, 5, max_workers=3,
+                             updatefn=lambda res: unchanged.append(np.array_equal(self.invertor.y, y)))
+        self.assertEqual(len(results.chi2), 5)
+        self.assertEqual(unchanged, [True]*5)
+        for d, chi2 in zip(results.d_max, results.chi2):
+            self.invertor.dmax = d
+            self.invertor.invert(self.invertor.nfunc)
+            self.assertAlmostEqual(self.invertor.chi2 / chi2, 1.0)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+"""
+    Unit tests for RegularizationPath class
+"""
+
+import os.path
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from sas.sascalc.pr.invertor import Invertor
+
+
+def find(filename):
+    return os.path.join(os.path.dirname(__file__), 'data', filename)
+
+
+def load(path):
+    """Load x, y and a simulated error from a two column data file"""
+    x, y = np.loadtxt(path, skiprows=1, unpack=True)
+    err = 0.15 * np.sqrt(y[0]) * np.sqrt(y)
+    return x, y, err
+
+
+class TestRegularizationPath(unittest.TestCase):
+
+    def setUp(self):
+        x, y, err = load(find('sphere_80.txt'))
+        logic = SimpleNamespace(data=SimpleNamespace(x=x, y=y, dy=err))
+        self.invertor = Invertor(logic)
+        self.invertor.dmax = 160.0
+        self.invertor.background = 1e4
+
+    def check_invert(self):
+        path = self.invertor.regularization_path(15)
+        for alpha in (0.0, 1e-4, 0.1, 10.0):
+            self.invertor.alpha = alpha
+            out, cov = self.invertor.invert(15)
+            chi2, background = self.invertor.chi2, self.invertor.background
+            peaks, positive = self.invertor.get_peaks(out), self.invertor.get_positive(out)
+
+            scan = path.scan([alpha])
+            self.assertEqual(scan["peaks"][0], peaks)
+            self.assertAlmostEqual(scan["positive"][0], positive)
+
+            path_out, path_cov = path.invert(alpha)
+            self.assertAlmostEqual(self.invertor.chi2 / chi2, 1.0)
+            self.assertAlmostEqual(self.invertor.background / background, 1.0)
+            np.testing.assert_allclose(path_out, out, rtol=1e-8, atol=1e-12 * np.max(np.abs(out)))
+            # lstsq inverts the normal matrix, which squares its condition number
+            np.testing.assert_allclose(path_cov, cov, rtol=1e-6, atol=1e-6 * np.max(np.abs(cov)))
+
+    def test_invert(self):
+        """
+            The path solution agrees with lstsq at each alpha
+        """
+        self.check_invert()
+
+    def test_invert_fixed_background(self):
+        self.invertor.est_bck = False
+        self.check_invert()
+
+    def test_estimate_alpha(self):
+        self.invertor.alpha = 0.0007
+        alpha, message, _ = self.invertor.estimate_alpha(15)
+        self.assertIsNone(message)
+        # The estimate gives a single peak with a smooth P(r)
+        self.invertor.alpha = alpha
+        out, _ = self.invertor.invert(15)
+        self.assertEqual(self.invertor.get_peaks(out), 1)
+        self.assertAlmostEqual(self.invertor.get_positive(out), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@
 
 import unittest
 
+import numpy as np
+
 from sas.sascalc.calculator.resolution_calculator import ResolutionCalculator as calculator
 
 
@@ -33,6 +35,31 @@ class resolution_calculator(unittest.TestCase):
         # The value "0.000213283" was obtained by manual calculation.
         self.assertAlmostEqual(sigma_1d,   0.000213283, 5)
 
+    def test_compute_map(self):
+        """
+            The resolution map matches compute at each point
+        """
+        self.cal.set_wave_list([4.0, 6.0], [0.1, 0.2])
+        self.cal.set_source_aperture_size([2])
+        self.cal.set_sample_aperture_size([1])
+        self.cal.set_detector_pix_size([1])
+        self.cal.set_source2sample_distance([1500])
+        self.cal.set_sample2detector_distance([1500])
+        qx, qy = np.meshgrid(np.linspace(-0.2, 0.2, 5), np.linspace(-0.1, 0.3, 4))
+        sigmas = self.cal.compute_map(qx, qy)
+
+        expected = np.zeros((4,) + qx.shape)
+        intensities = []
+        for lam, dlam in zip(*self.cal.get_wave_list()):
+            intensities.append(self.cal.setup_tof(lam, dlam))
+            for index in np.ndindex(qx.shape):
+                values = self.cal.compute(lam, dlam, qx[index], qy[index], tof=True)[2:]
+                expected[(slice(None),) + index] += np.square(values) * intensities[-1]
+        expected = np.sqrt(expected / sum(intensities))
+        for sigma, value in zip(sigmas, expected):
+            self.assertEqual(sigma.shape, qx.shape)
+            np.testing.assert_allclose(sigma, value, rtol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
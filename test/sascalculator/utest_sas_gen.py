@@ -4,14 +4,19 @@ Unit tests for the sas_gen
 
 import math
 import os.path
+import shutil
+import tempfile
+import time
 import unittest
 import warnings
+from unittest import mock
 
 import numpy as np
 import scipy.stats as stats
 from scipy.spatial.transform import Rotation
 
-from sas.sascalc.calculator import sas_gen
+from sas.sascalc.calculator import geni, sas_gen
+from sas.sascalc.calculator.result_cache import ResultCache
 
 warnings.simplefilter("ignore")
 
@@ -278,6 +283,106 @@ class sas_gen_test(unittest.TestCase):
             err_msg="Debye calculations do not agree for larger q-range"
         )
 
+    def test_debye_histogram(self):
+        """
+        Test that the histogram Debye engine agrees with the exact Debye sum.
+        """
+        from sas.sascalc.calculator.ausaxs import sasview_sans_debye
+        from sas.sascalc.calculator.geni import _calc_Iq_grid
+
+        # voxel data lies on the grid, so the histogram is exact
+        f = sas_gen.OMFData()
+        f.ystepsize = 3
+        omf2sld = sas_gen.OMF2SLD()
+        omf2sld.set_data(f)
+        sld = omf2sld.output
+        sld.set_sldn(0.1, False)
+        model = sas_gen.GenSAS()
+        model.set_sld_data(sld)
+        model.set_computation_type(sas_gen.ComputationType.SANS_1D)
+        q = np.linspace(0.001, 1, 50)
+        coords = np.vstack([model.data_x, model.data_y, model.data_z])
+        w = model.data_sldn * model.data_vol
+        exact = sasview_sans_debye.sasview_sans_debye(q, coords, w) * 1e8 / np.sum(model.data_vol)
+        model.set_debye_engine(sas_gen.DebyeEngine.HISTOGRAM)
+        np.testing.assert_array_equal(model.get_grid_spacing(), [6, 3, 6])
+        np.testing.assert_allclose(model.calculate_Iq(q), exact, rtol=1e-10)
+
+        # atomic data is snapped to the grid, so only approximately equal
+        rng = np.random.default_rng(1984)
+        f = self.pdbloader.read(os.path.join(os.path.dirname(__file__), "data/debye_test_files/SASDPP4.pdb"))
+        coords = np.vstack([f.pos_x, f.pos_y, f.pos_z])
+        q = np.linspace(0.001, 0.5, 50)
+        w = rng.random(coords.shape[1])
+        exact = sasview_sans_debye.sasview_sans_debye(q, coords, w)
+        np.testing.assert_allclose(_calc_Iq_grid(q, coords, w, 0.5), exact, rtol=2e-2)
+
+    def test_read_chunks(self):
+        """
+        Test that files read in chunks give the same data as read whole.
+        """
+        fields = ('pos_x', 'pos_y', 'pos_z', 'sld_n', 'sld_mx', 'sld_my', 'sld_mz', 'vol_pix')
+        for loader, filename in ((self.omfloader, "isolated_skyrmion_V2.omf"),
+                                 (self.sldloader, "sld_file.sld"),
+                                 (self.pdbloader, "c60.pdb")):
+            whole = loader.read(find(filename))
+            chunks = list(loader.read_chunks(find(filename), chunk_size=1000))
+            self.assertEqual([len(c.pos_x) for c in chunks[:-1]], [1000]*(len(chunks)-1))
+            for field in fields:
+                np.testing.assert_allclose(np.concatenate([getattr(c, field) for c in chunks]),
+                                           getattr(whole, field), rtol=1e-12, err_msg=filename)
+
+    def test_omfreader_binary(self):
+        """
+        Test that OVF binary data is read as the same data in text
+        """
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        for filename, size in (("isolated_skyrmion_V1.omf", 4), ("isolated_skyrmion_V2.omf", 8)):
+            with open(find(filename)) as file:
+                lines = file.read().split('\n')
+            start = lines.index("# Begin: Data Text")
+            m = np.loadtxt(lines[start:], comments='#')
+            # OVF 1.0 binary data is big endian and OVF 2.0 little endian
+            dtype = ('>f%d' if size == 4 else '<f%d') % size
+            check = 1234567.0 if size == 4 else 123456789012345.0
+            path = os.path.join(folder, filename)
+            with open(path, 'wb') as file:
+                file.write(('\n'.join(lines[:start]) + '\n# Begin: Data Binary %d\n' % size).encode())
+                np.array([check], dtype).tofile(file)
+                m.astype(dtype).tofile(file)
+                file.write(('\n# End: Data Binary %d\n# End: Segment\n' % size).encode())
+            text, binary = self.omfloader.read(find(filename)), self.omfloader.read(path)
+            chunks = list(self.omfloader.read_chunks(path, chunk_size=1000))
+            for field in ('pos_x', 'sld_mx', 'sld_my', 'sld_mz'):
+                np.testing.assert_allclose(getattr(binary, field), getattr(text, field), rtol=1e-6)
+                np.testing.assert_array_equal(np.concatenate([getattr(c, field) for c in chunks]),
+                                              getattr(binary, field))
+
+    def test_calculator_chunks(self):
+        """
+        Test that the 2D intensity summed over chunks of the data matches the intensity of the whole data.
+        """
+        filename = find("isolated_skyrmion_V1.omf")
+        data = self.omfloader.read(filename)
+        data.set_sldn(1e-6, False)
+        model = sas_gen.GenSAS()
+        model.set_sld_data(data)
+        model.params.update(Up_frac_in=0.3, Up_frac_out=0.9, Up_theta=40.0, solvent_SLD=2e-7)
+        model.set_rotations(xyz_to_UVW=Rotation.from_euler('zy', [30, 10], degrees=True))
+        qx = np.array([0.0, 0.01, -0.03, 0.05])
+        qy = np.array([0.0, 0.02, 0.01, -0.04])
+
+        def chunks():
+            for chunk in self.omfloader.read_chunks(filename, chunk_size=1000):
+                chunk.set_sldn(1e-6, False)
+                yield chunk
+        np.testing.assert_allclose(model.calculate_Iq(qx, qy, chunks=chunks()), model.runXY([qx, qy]), rtol=1e-10)
+        # Only 2D intensities are sums of amplitudes
+        model.set_computation_type(sas_gen.ComputationType.SANS_1D)
+        with self.assertRaises(ValueError):
+            model.calculate_Iq(qx, chunks=chunks())
+
     def test_calculator_elements(self):
         """
         Test that the calculator correctly calculates scattering for element type data.
@@ -316,6 +421,28 @@ class sas_gen_test(unittest.TestCase):
         for val in np.abs(errs):
             self.assertLessEqual(val, 1e-3)
 
+    def test_element_transform_batched(self):
+        """
+        Test that the batched element transforms match element_transform at each q.
+        """
+        f = self.vtkloader.read(find("five_tetrahedra_cube.vtk"))
+        elements = np.asarray(f.elements)
+        sld, vol = np.asarray(f.sld_n, 'd'), np.asarray(f.vol_pix, 'd')
+        # the origin, q normal to some faces (for which q is moved off the face), and a general q
+        qx = np.array([0.0, 1.57, 0.0, 1, -0.3])
+        qy = np.array([0.0, 0.0, 1.2, 1, 0.7])
+        geometry = np.column_stack((f.pos_x, f.pos_y, f.pos_z))[np.concatenate((elements, elements[:,:,:1]), axis=2)]
+        normals, geometry = geni._get_normal_vec(geometry)
+        rn_norm = np.sum(geometry[:,:,0] * normals, axis=-1)
+        expected = [abs(np.sum(sld*geni.element_transform(geometry, normals, rn_norm, vol, qx_k, qy_k)))**2
+                    for qx_k, qy_k in zip(qx, qy)]
+
+        element_geometry = geni.element_geometry(f.pos_x, f.pos_y, f.pos_z, elements)
+        output = np.abs(geni.element_transform_block(element_geometry, vol, qx, qy) @ sld)**2
+        np.testing.assert_allclose(output, expected, rtol=1e-10)
+        output = geni._calc_Iqxy_elements(sld, element_geometry, vol, qx, qy)
+        np.testing.assert_allclose(output, expected, rtol=1e-10)
+
     def test_euler_angle_consistency(self):
         """
         Test that the euler angle implementation in Models.py is consistent with the scipy Rotation module
@@ -345,6 +472,102 @@ class sas_gen_test(unittest.TestCase):
             self.assertTrue(np.allclose(R_s2s, R_scipy_XYZ))
             self.assertTrue(np.allclose(R_sasview, R_scipy_zyz))
 
+class GenSASCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        omf2sld = sas_gen.OMF2SLD()
+        omf2sld.set_data(sas_gen.OMFData())
+        self.sld = omf2sld.output
+        self.sld.set_sldn(0.1, False)
+        self.sld.set_sldms(0.02, 0.0, 0.01)
+        self.q = [np.linspace(-0.05, 0.05, 40), np.linspace(0.02, -0.02, 40)]
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def make_model(self, cache=None):
+        model = sas_gen.GenSAS()
+        model.set_sld_data(self.sld)
+        model.params['Up_theta'] = 30.0
+        model.cache = cache
+        return model
+
+    def test_cached_intensity(self):
+        """
+        Repeated calculations are read from the cache, with the scale and
+        background applied to the cached intensity
+        """
+        expected = self.make_model().runXY(self.q)
+        cache = ResultCache("gensas", directory=self.folder)
+        model = self.make_model(cache)
+        np.testing.assert_allclose(model.runXY(self.q), expected)
+        np.testing.assert_allclose(model.runXY(self.q), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        model.params['scale'] = 2.0
+        model.params['background'] = 0.5
+        np.testing.assert_allclose(model.runXY(self.q), 2*expected + 0.5)
+        self.assertEqual(cache.hits, 2)
+
+        # A new model for the same sample uses the stored result
+        self.assertIsNotNone(cache.get(self.make_model().cache_key(*self.q)))
+
+        # Changing the spin state, the orientation or the data needs a new calculation
+        model.params['Up_theta'] = 45.0
+        model.runXY(self.q)
+        model.set_rotations(xyz_to_UVW=Rotation.from_euler('z', 30, degrees=True))
+        model.runXY(self.q)
+        self.sld.set_sldn(0.2, False)
+        model.set_sld_data(self.sld)
+        model.runXY(self.q)
+        self.assertEqual(cache.stats(), {'hits': 3, 'misses': 4, 'entries': 4,
+                                         'bytes': cache.stats()['bytes']})
+
+    def test_spin_channels(self):
+        """
+        Changing only the polarizer and analyzer fractions reweights the
+        stored spin cross sections
+        """
+        model = self.make_model()
+        model.runXY(self.q)
+        for up_in, up_out in ((0.0, 0.0), (0.3, 0.8), (1.0, 0.5)):
+            fresh = self.make_model()
+            fresh.params.update(Up_frac_in=up_in, Up_frac_out=up_out)
+            expected = fresh.runXY(self.q)
+            model.params.update(Up_frac_in=up_in, Up_frac_out=up_out)
+            with mock.patch.object(geni, 'Iqxy_channels') as channels:
+                np.testing.assert_allclose(model.runXY(self.q), expected, rtol=1e-12)
+            channels.assert_not_called()
+
+        # The polarization direction changes the cross sections themselves
+        model.params['Up_theta'] = 45.0
+        with mock.patch.object(geni, 'Iqxy_channels', wraps=geni.Iqxy_channels) as channels:
+            model.runXY(self.q)
+        channels.assert_called_once()
+
+    def test_eviction(self):
+        """
+        The least recently used results are evicted first
+        """
+        size = np.zeros(1000).nbytes + 128
+        cache = ResultCache("gensas", max_bytes=3*size, directory=self.folder)
+        # Set the last use of each result explicitly, since file times may
+        # only be stored to the second
+        for age, key in enumerate("abc"):
+            cache.put(key, np.zeros(1000))
+            last_use = time.time() - 100 + 10*age
+            os.utime(os.path.join(self.folder, key + ".npy"), (last_use, last_use))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("d", np.zeros(1000))
+        self.assertIsNone(cache.get("b"))
+        for key in "acd":
+            self.assertIsNotNone(cache.get(key))
+        self.assertEqual(cache.stats()['entries'], 3)
+        cache.clear()
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,69 @@
+"""
+Unit tests for the Shape2SAS pair distance distribution
+"""
+
+import unittest
+
+import numpy as np
+from scipy.spatial.distance import pdist
+
+from sas.sascalc.shape2sas.TheoreticalScattering import WeightedPairDistribution
+
+
+class WeightedPairDistributionTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        # 50 points do not fill a whole number of tiles of 7
+        self.N = 50
+        self.x, self.y, self.z = rng.uniform(-30, 30, size=(3, self.N))
+        self.p = rng.choice([1.0, -0.5, 2.0], size=self.N)
+
+    def distribution(self, tile_size=7, z=None):
+        return WeightedPairDistribution(self.x, self.y, self.z if z is None else z,
+                                        self.p, tile_size=tile_size)
+
+    def test_pair_tiles(self):
+        """
+            The tiles hold each pair once, and their contrasts sum to the
+            sum over all N**2 ordered pairs
+        """
+        tiles = list(self.distribution().pair_tiles())
+        dist = np.concatenate([dist for dist, _ in tiles])
+        contrast = np.concatenate([contrast for _, contrast in tiles])
+        self.assertEqual(len(dist), self.N * (self.N + 1) // 2)
+        np.testing.assert_allclose(np.sort(dist[dist > 0]),
+                                   np.sort(pdist(np.column_stack((self.x, self.y, self.z)))))
+        self.assertAlmostEqual(contrast.sum(), self.p.sum()**2)
+
+    def test_dmax(self):
+        xyz = np.column_stack((self.x, self.y, self.z))
+        self.assertAlmostEqual(self.distribution().calc_dmax(), pdist(xyz).max())
+        # Points in a plane have no convex hull in 3D
+        flat = np.zeros(self.N)
+        xyz[:, 2] = 0
+        self.assertAlmostEqual(self.distribution(z=flat).calc_dmax(), pdist(xyz).max())
+
+    def test_tiled_matches_dense(self):
+        """
+            h(r) accumulated over tiles matches h(r) from all pairs at once
+        """
+        for polydispersity in (0.0, 0.1):
+            for tile_size in (7, 1024):
+                with self.subTest(polydispersity=polydispersity, tile_size=tile_size):
+                    pairs = self.distribution(tile_size)
+                    dist, contrast = pairs.calc_all_dist(), pairs.calc_all_contrasts()
+                    r, hr = pairs.calc_hr(dist, 40, contrast, polydispersity)
+                    r_tiled, hr_tiled = pairs.calc_hr_tiled(40, polydispersity, include_self=True)
+                    np.testing.assert_allclose(r_tiled, r, rtol=1e-5)
+                    np.testing.assert_allclose(hr_tiled, hr, rtol=1e-4, atol=1e-4 * abs(hr).max())
+
+                    # Without the self-terms, as used for p(r)
+                    nonzero = dist > 0
+                    _, hr = pairs.calc_hr(dist[nonzero], 40, contrast[nonzero], polydispersity)
+                    _, hr_tiled = pairs.calc_hr_tiled(40, polydispersity)
+                    np.testing.assert_allclose(hr_tiled, hr, rtol=1e-4, atol=1e-4 * abs(hr).max())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,11 @@ import pytest
 
 from sasdata.dataloader.data_info import Data1D
 from sasdata.dataloader.loader import Loader
+from sasmodels.core import load_model
+from sasmodels.direct_model import call_Fq
 
-from sas.sascalc.size_distribution.SizeDistribution import sizeDistribution
+from sas.sascalc.size_distribution.maxEnt_method import maxEntMethod
+from sas.sascalc.size_distribution.SizeDistribution import add_gaussian_noise, sizeDistribution
 
 
 def find(filename):
@@ -71,3 +74,39 @@ def test_noRes(data1):
     assert data1.MaxEnt_statistics['volume'] == pytest.approx(4.84, abs=0.02)
     assert data1.BinMagnitude_maxEnt == pytest.approx(answerMags, abs=1e-3)
 
+def test_batch_matches_serial(data1):
+    # The batched solver gives the same solution as solving each noise replicate in turn
+    x = data1.data.x
+    data_to_subtract = Data1D(x, 2.5508e-7 * x ** -4 + 0.121176, dy=0)
+    trim_data, _, init_binsBack, sigma = data1.prep_maxEnt(data_to_subtract)
+    intensities = np.array([add_gaussian_noise(trim_data.y, trim_data.dy, seed=seed) for seed in range(5)])
+
+    method = maxEntMethod()
+    chisq, mags, icalc, converged, iters = method.MaxEnt_SB_batch(
+        intensities, sigma, data1.model_matrix, init_binsBack, data1.iterMax, report=False)
+    for k, intensity in enumerate(intensities):
+        expected = method.MaxEnt_SB(intensity, sigma, data1.model_matrix, init_binsBack, data1.iterMax, report=False)
+        assert chisq[k] == pytest.approx(expected[0], rel=1e-9)
+        assert mags[k] == pytest.approx(expected[1], rel=1e-8, abs=1e-12)
+        assert icalc[k] == pytest.approx(expected[2], rel=1e-8)
+        assert (converged[k], iters[k]) == (expected[3], expected[4])
+
+@pytest.mark.parametrize("aspect_ratio", [1.0, 0.3, 3.0])
+def test_model_matrix(data1, aspect_ratio):
+    # The single kernel call matches calling the model for each bin
+    data1.aspectRatio = aspect_ratio
+    data1.generate_model_matrix(data1.data)
+
+    calculator = load_model("ellipsoid").make_kernel((data1.data.x,))
+    for k, radius in enumerate(data1.bins[::10]):
+        pars = {"sld": data1.contrast, "sld_solvent": 0.0, "background": 0.0, "scale": 1.0,
+                "radius_equatorial": radius, "radius_polar": radius * aspect_ratio}
+        _, Fsq, _, volume, _ = call_Fq(calculator, pars)
+        assert data1.model_matrix[:, 10 * k] == pytest.approx(Fsq / volume, rel=1e-12)
+        assert data1.volumes[10 * k] == pytest.approx(volume, rel=1e-12)
+
+    # Changing only the weights reuses the cached matrix
+    model_matrix = data1.model_matrix
+    data1.weightFactor = 2.0
+    data1.generate_model_matrix(data1.data)
+    assert data1.model_matrix is model_matrix
@@ -0,0 +1,38 @@
+"""
+    Unit tests for the command line parser
+"""
+
+import unittest
+
+from sas.cli import parse_cli
+
+
+class TestParseCli(unittest.TestCase):
+
+    def test_fit_command(self):
+        opts = parse_cli(['sasview', 'fit', 'p.json', 'd.txt', '--output', 'o.jsonl'])
+        self.assertEqual(opts.args, ['fit', 'p.json', 'd.txt', '--output', 'o.jsonl'])
+
+    def test_fit_after_options(self):
+        """
+            Options before fit are parsed by sasview, including their values
+        """
+        for flags in (['-q'], ['-l', 'development'], ['--loglevel', 'debug'], ['-ldebug']):
+            opts = parse_cli(['sasview', *flags, 'fit', 'p.json', 'd.txt', '--output', 'o.jsonl'])
+            self.assertEqual(opts.args, ['fit', 'p.json', 'd.txt', '--output', 'o.jsonl'])
+        self.assertEqual(opts.loglevel, 'debug')
+
+    def test_fit_as_argument(self):
+        """
+            fit is only the command when it is the first positional argument
+        """
+        opts = parse_cli(['sasview', 'script.py', 'fit'])
+        self.assertEqual(opts.args, ['script.py', 'fit'])
+        opts = parse_cli(['sasview', '-m', 'fit', 'x'])
+        self.assertEqual((opts.module, opts.args), ('fit', ['x']))
+        opts = parse_cli(['sasview', '-l', 'fit'])
+        self.assertEqual((opts.loglevel, opts.args), ('fit', []))
+
+
+if __name__ == '__main__':
+    unittest.main()